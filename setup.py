@@ -22,7 +22,11 @@ setup(
             "pandas>=2.2.0, <=2.2.2",
             "pytest>=8.0.0, <9.0.0",
             "pylint>=3.0.0, <4.0.0",
-        ]
+        ],
+        "columnar": [
+            "numpy>=1.22.0, <3.0.0",
+            "pandas>=2.2.0, <=2.2.2",
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
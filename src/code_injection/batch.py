@@ -0,0 +1,405 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Bulk executors of the generated create_many, get_many, delete_many and invoke_many methods."""
+import asyncio
+import inspect
+import logging
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from src.code_injection.waiter import (
+    backoff_delays,
+    is_retryable_error,
+    is_throttling_error,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of one item of a batch, either a result or an error.
+
+    The asyncio create_many keeps a created resource whose describe failed as the result
+    along with the error.
+
+    The latency is the number of seconds from the first call for the item to its
+    outcome, retries included.
+    """
+
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    latency: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _AdaptiveLimit:
+    """The concurrency limit of the adaptive limiters, the caller holds their lock."""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+
+    def _release(self, throttled: bool) -> None:
+        self._in_flight -= 1
+        if throttled:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            logger.debug(f"Throttled, concurrency limit lowered to {self.limit}")
+        elif self.limit < self.max_concurrency:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+
+
+class AdaptiveConcurrencyLimiter(_AdaptiveLimit):
+    """
+    Bounds the number of concurrent calls, adapting to throttling.
+
+    The limit is halved on every throttled call and grows back by one after a
+    limit's worth of successful calls, up to max_concurrency.
+    """
+
+    def __init__(self, max_concurrency: int):
+        super().__init__(max_concurrency)
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._condition:
+            self._release(throttled)
+            self._condition.notify_all()
+
+
+class AsyncAdaptiveConcurrencyLimiter(_AdaptiveLimit):
+    """
+    The asyncio counterpart of AdaptiveConcurrencyLimiter.
+
+    Create it from a coroutine, its condition is bound to the running event loop.
+    """
+
+    def __init__(self, max_concurrency: int):
+        super().__init__(max_concurrency)
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            while self._in_flight >= self.limit:
+                await self._condition.wait()
+            self._in_flight += 1
+
+    async def release(self, throttled: bool = False) -> None:
+        async with self._condition:
+            self._release(throttled)
+            self._condition.notify_all()
+
+
+def _call(function: Callable, item):
+    result = function(item)
+    if inspect.isawaitable(result):
+        if inspect.iscoroutine(result):
+            result.close()
+        raise TypeError(
+            "The function returned an awaitable, use async_stream_batch to await it "
+            "on the running event loop"
+        )
+    return result
+
+
+def call_with_retry(
+    function: Callable,
+    item,
+    limiter: AdaptiveConcurrencyLimiter,
+    max_attempts: int = 5,
+    poll: float = 1,
+    max_delay: float = 20,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+):
+    """
+    Calls function(item), retrying throttled and transient errors with backoff.
+
+    Args:
+        function (Callable): The function to call.
+        item: The argument of the function.
+        limiter (AdaptiveConcurrencyLimiter): The limiter bounding the concurrency.
+        max_attempts (int): The maximum number of calls.
+        poll (float): The base delay before a retry in seconds.
+        max_delay (float): The maximum delay before a retry in seconds.
+        retryable (Callable): Returns whether a failed call is retried, defaults to
+            throttling and transient errors.
+
+    Returns:
+        The result of the function.
+    """
+    delays = backoff_delays(poll, max_delay)
+    for attempt in range(1, max_attempts + 1):
+        limiter.acquire()
+        try:
+            result = _call(function, item)
+        except Exception as error:
+            limiter.release(throttled=is_throttling_error(error))
+            if attempt == max_attempts or not retryable(error):
+                raise
+            logger.debug(f"Retrying after {error!r}, attempt {attempt}")
+            time.sleep(next(delays))
+        else:
+            limiter.release()
+            return result
+
+
+def run_batch(
+    function: Callable,
+    items: Iterable,
+    max_workers: int = 8,
+    max_attempts: int = 5,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+) -> List[BatchResult]:
+    """
+    Calls function on every item on a bounded thread pool.
+
+    The concurrency starts at max_workers and adapts to throttling. A failed item does
+    not stop the batch.
+
+    Args:
+        function (Callable): The function to call on each item.
+        items (Iterable): The items.
+        max_workers (int): The maximum number of concurrent calls.
+        max_attempts (int): The maximum number of calls per item.
+        retryable (Callable): Returns whether a failed call is retried, defaults to
+            throttling and transient errors.
+
+    Returns:
+        List[BatchResult]: The results, in the order of the items.
+    """
+    items = list(items)
+    limiter = AdaptiveConcurrencyLimiter(max_workers)
+
+    def run(item) -> BatchResult:
+        return _run_item(function, item, limiter, max_attempts, retryable)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sagemaker-batch"
+    ) as executor:
+        return list(executor.map(run, items))
+
+
+def _run_item(
+    function: Callable,
+    item,
+    limiter: AdaptiveConcurrencyLimiter,
+    max_attempts: int,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+) -> BatchResult:
+    start = time.perf_counter()
+    try:
+        result = call_with_retry(
+            function, item, limiter, max_attempts, retryable=retryable
+        )
+    except Exception as error:
+        return BatchResult(item, error=error, latency=time.perf_counter() - start)
+    return BatchResult(item, result=result, latency=time.perf_counter() - start)
+
+
+def stream_batch(
+    function: Callable,
+    items: Iterable,
+    max_workers: int = 8,
+    max_attempts: int = 5,
+    ordered: bool = True,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+) -> Iterator[BatchResult]:
+    """
+    Calls function on every item on a bounded thread pool, yielding the results.
+
+    Unlike run_batch, the items are consumed as results are yielded: at most twice
+    max_workers items are pulled from the iterable ahead of the results, so it can be a
+    generator of any length. The concurrency starts at max_workers and adapts to
+    throttling. A failed item does not stop the batch.
+
+    Args:
+        function (Callable): The function to call on each item.
+        items (Iterable): The items.
+        max_workers (int): The maximum number of concurrent calls.
+        max_attempts (int): The maximum number of calls per item.
+        ordered (bool): Whether to yield the results in the order of the items, or as
+            they complete.
+        retryable (Callable): Returns whether a failed call is retried, defaults to
+            throttling and transient errors.
+
+    Yields:
+        BatchResult: The result of every item.
+    """
+    items = iter(items)
+    limiter = AdaptiveConcurrencyLimiter(max_workers)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sagemaker-batch"
+    )
+    pending = deque() if ordered else set()
+    submit = pending.append if ordered else pending.add
+
+    def submit_next() -> None:
+        for item in items:
+            submit(
+                executor.submit(
+                    _run_item, function, item, limiter, max_attempts, retryable
+                )
+            )
+            return
+
+    try:
+        for _ in range(2 * max_workers):
+            submit_next()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+            for future in done:
+                result = future.result()
+                submit_next()
+                yield result
+    finally:
+        # the items not started yet when the results stop being consumed are skipped
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def _async_items(items: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _async_run_item(
+    function: Callable[[Any], Awaitable],
+    item,
+    limiter: AsyncAdaptiveConcurrencyLimiter,
+    max_attempts: int,
+    poll: float = 1,
+    max_delay: float = 20,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+) -> BatchResult:
+    start = time.perf_counter()
+    delays = backoff_delays(poll, max_delay)
+    for attempt in range(1, max_attempts + 1):
+        await limiter.acquire()
+        try:
+            result = await function(item)
+        except Exception as error:
+            await limiter.release(throttled=is_throttling_error(error))
+            if attempt == max_attempts or not retryable(error):
+                return BatchResult(
+                    item, error=error, latency=time.perf_counter() - start
+                )
+            logger.debug(f"Retrying after {error!r}, attempt {attempt}")
+            await asyncio.sleep(next(delays))
+        else:
+            await limiter.release()
+            return BatchResult(item, result=result, latency=time.perf_counter() - start)
+
+
+async def async_stream_batch(
+    function: Callable[[Any], Awaitable],
+    items: Union[Iterable, AsyncIterable],
+    max_concurrency: int = 8,
+    max_attempts: int = 5,
+    ordered: bool = True,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+) -> AsyncIterator[BatchResult]:
+    """
+    The asyncio counterpart of stream_batch, function returns an awaitable.
+
+    At most max_concurrency items are in flight, the next item is pulled from the
+    iterable, or async iterable, when one completes. The concurrency of the calls
+    starts at max_concurrency and adapts to throttling.
+
+    Args:
+        function (Callable): The function to call on each item.
+        items (Iterable): The items, an iterable or an async iterable.
+        max_concurrency (int): The maximum number of concurrent calls.
+        max_attempts (int): The maximum number of calls per item.
+        ordered (bool): Whether to yield the results in the order of the items, or as
+            they complete.
+        retryable (Callable): Returns whether a failed call is retried, defaults to
+            throttling and transient errors.
+
+    Yields:
+        BatchResult: The result of every item.
+    """
+    items = _async_items(items)
+    limiter = AsyncAdaptiveConcurrencyLimiter(max_concurrency)
+    pending = deque() if ordered else set()
+    submit = pending.append if ordered else pending.add
+
+    async def submit_next() -> None:
+        async for item in items:
+            submit(
+                asyncio.ensure_future(
+                    _async_run_item(
+                        function, item, limiter, max_attempts, retryable=retryable
+                    )
+                )
+            )
+            return
+
+    try:
+        for _ in range(max_concurrency):
+            await submit_next()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+                await done[0]
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                pending.difference_update(done)
+            for task in done:
+                await submit_next()
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -13,8 +13,10 @@
 import logging
 
 from dataclasses import asdict
+from functools import lru_cache
 
-from src.code_injection.shape_dag import SHAPE_DAG
+from src.code_injection.name_map import PASCAL_TO_SNAKE, SNAKE_TO_PASCAL
+from src.code_injection.shape_dag import SHAPE_DAG, ENUM_VALUES
 from src.code_injection.constants import (
     BASIC_TYPES,
     STRUCTURE_TYPE,
@@ -23,19 +25,31 @@ from src.code_injection.constants import (
 )
 
 
+@lru_cache(maxsize=1024)
+def _convert_pascal_to_snake(pascal_str):
+    """Converts a PascalCase string missing from the name table to snake_case."""
+    return "".join(["_" + i.lower() if i.isupper() else i for i in pascal_str]).lstrip(
+        "_"
+    )
+
+
 def pascal_to_snake(pascal_str):
     """
     Converts a PascalCase string to snake_case.
 
+    Member names of the service model are looked up in the generated name table,
+    any other string is converted once and memoized.
+
     Args:
         pascal_str (str): The PascalCase string to be converted.
 
     Returns:
         str: The converted snake_case string.
     """
-    return "".join(["_" + i.lower() if i.isupper() else i for i in pascal_str]).lstrip(
-        "_"
-    )
+    snake_str = PASCAL_TO_SNAKE.get(pascal_str)
+    if snake_str is None:
+        return _convert_pascal_to_snake(pascal_str)
+    return snake_str
 
 
 def deserialize(data, cls) -> object:
@@ -64,10 +78,20 @@ def deserialize(data, cls) -> object:
     return instance
 
 
+@lru_cache(maxsize=1024)
+def _convert_snake_to_pascal(snake_str):
+    """Converts a snake_case string missing from the name table to PascalCase."""
+    components = snake_str.split("_")
+    return "".join(x.title() for x in components[0:])
+
+
 def snake_to_pascal(snake_str):
     """
     Convert a snake_case string to PascalCase.
 
+    Attribute names of the service model are looked up in the generated name table,
+    any other string is converted once and memoized.
+
     Args:
         snake_str (str): The snake_case string to be converted.
 
@@ -75,8 +99,10 @@ def snake_to_pascal(snake_str):
         str: The PascalCase string.
 
     """
-    components = snake_str.split("_")
-    return "".join(x.title() for x in components[0:])
+    pascal_str = SNAKE_TO_PASCAL.get(snake_str)
+    if pascal_str is None:
+        return _convert_snake_to_pascal(snake_str)
+    return pascal_str
 
 
 def serialize(data) -> object:
@@ -98,150 +124,834 @@ def serialize(data) -> object:
     return data_dict
 
 
-def _evaluate_list_type(raw_list, shape) -> list:
+DEFAULT_INTERN_POOL_SIZE = 65536
+# string members repeating the same few values across resources, ie. a role used by
+# every training job
+DEFAULT_INTERNED_MEMBERS = frozenset(
+    [
+        "role_arn",
+        "execution_role_arn",
+        "image",
+        "training_image",
+        "image_uri",
+        "kms_key_id",
+        "volume_kms_key_id",
+        "security_group_ids",
+        "subnets",
+    ]
+)
+
+# the canonical copy of every enum value of the service model
+_ENUM_STRINGS = {value: value for values in ENUM_VALUES.values() for value in values}
+
+
+def _intern_enum(value):
+    """Returns the canonical copy of an enum value, or the value if it is not known."""
+    return _ENUM_STRINGS.get(value, value)
+
+
+class InternPool:
+    """
+    A bounded pool of canonical strings.
+
+    Equal strings passed to the pool are replaced by the first one seen, so they are
+    stored once. Unlike sys.intern, the pool is emptied when it holds max_size strings,
+    which bounds its memory and keeps it following the strings currently decoded.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_INTERN_POOL_SIZE):
+        self.max_size = max_size
+        self._strings = {}
+
+    def __call__(self, string):
+        canonical = self._strings.get(string)
+        if canonical is None:
+            if len(self._strings) >= self.max_size:
+                self._strings.clear()
+            canonical = self._strings.setdefault(string, string)
+        return canonical
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+_INTERN_POOL = InternPool()
+_INTERNED_MEMBERS = DEFAULT_INTERNED_MEMBERS
+
+
+def configure_interning(members=None, max_size=DEFAULT_INTERN_POOL_SIZE) -> None:
     """
-    Evaluates a list type based on the given shape.
+    Configures the string members interned in a bounded pool when decoded.
+
+    The values of enum members are always replaced by the canonical enum values of the
+    service model, whatever the configuration.
 
     Args:
-        raw_list (list): The raw list to be evaluated.
-        shape (dict): The shape of the list.
+        members (Iterable[str]): The snake cased attribute names of the members, ie.
+            role_arn, defaults to DEFAULT_INTERNED_MEMBERS. Empty to disable the pool.
+        max_size (int): The maximum number of strings in the pool.
+    """
+    global _INTERN_POOL, _INTERNED_MEMBERS
+    _INTERNED_MEMBERS = (
+        DEFAULT_INTERNED_MEMBERS if members is None else frozenset(members)
+    )
+    _INTERN_POOL = InternPool(max_size)
+    # the deserializers were compiled for the previous configuration
+    for cache in (_DESERIALIZERS, _CONSTRUCTORS, _TRUSTED_DESERIALIZERS, _VIEWS):
+        cache.clear()
+    _structure_members.cache_clear()
+    _basic_members.cache_clear()
+
+
+def string_interner(attribute_name, shape):
+    """
+    Returns the function interning the values of a string member, if they are interned.
+
+    Args:
+        attribute_name (str): The snake cased attribute name of the member, None for the
+            items of nested lists and maps.
+        shape (str): The shape name of the member.
 
     Returns:
-        list: The evaluated list based on the shape.
+        function: The canonical enum values lookup, the intern pool, or None.
+    """
+    if shape in ENUM_VALUES:
+        return _intern_enum
+    if attribute_name in _INTERNED_MEMBERS:
+        return _INTERN_POOL
+    return None
+
+
+def _intern_expression(attribute_name, shape, value_name):
+    """Builds the source expression interning a string value, if it is interned."""
+    interner = string_interner(attribute_name, shape)
+    if interner is _intern_enum:
+        return f"_enum_strings.get({value_name}, {value_name})"
+    if interner is not None:
+        return f"_intern_pool({value_name})"
+    return None
+
+
+def _unhandled(message):
+    """
+    Raises a ValueError for a shape construct the deserializers do not support.
+
+    Args:
+        message (str): The error message.
 
     Raises:
-        ValueError: If an unhandled list member type is encountered.
+        ValueError: Always.
+    """
+    raise ValueError(message)
 
+
+def _unhandled_expression(message) -> str:
+    """Builds the source expression raising a ValueError with the given message."""
+    return f"_unhandled({message!r})"
+
+
+def _list_expression(shape, value_name, depth, attribute_name=None) -> str:
+    """
+    Builds the source expression that evaluates a list value of the given shape.
+
+    Args:
+        shape (dict): The DAG node of the list shape.
+        value_name (str): The name of the variable holding the raw list.
+        depth (int): The nesting depth, used to keep comprehension variables unique.
+        attribute_name (str): The attribute name of the structure member holding the
+            list, None for nested lists. (Optional)
+
+    Returns:
+        str: The python expression evaluating the list.
     """
     _shape_member_type = shape["member_type"]
     _shape_member_shape = shape["member_shape"]
+    item_name = f"item{depth}"
     if _shape_member_type in BASIC_TYPES:
-        # if basic types directly assign list value.
-        _evaluated_list = raw_list
+        item_expression = _shape_member_type == "string" and _intern_expression(
+            attribute_name, _shape_member_shape, item_name
+        )
+        if not item_expression:
+            # if basic types copy the list value, the response may be shared by the
+            # describe cache or coalesced calls
+            return f"list({value_name})"
     elif _shape_member_type == STRUCTURE_TYPE:
-        # if structure type transform each list item and assign value.
-        _evaluated_list = []
-        # traverse through response list and evaluate item
-        for item in raw_list:
-            _evaluated_item = transform(item, _shape_member_shape)
-            _evaluated_list.append(_evaluated_item)
+        item_expression = f"_deserializers[{_shape_member_shape!r}]({item_name})"
+    elif _shape_member_type == LIST_TYPE:
+        item_expression = _list_expression(
+            SHAPE_DAG[_shape_member_shape], item_name, depth + 1
+        )
+    elif _shape_member_type == MAP_TYPE:
+        item_expression = _map_expression(
+            SHAPE_DAG[_shape_member_shape], item_name, depth + 1
+        )
     else:
-        raise ValueError(
-            f"Unhandled List member type "
-            f"[{_shape_member_type}] encountered. "
+        return _unhandled_expression(
+            f"Unhandled List member type [{_shape_member_type}] encountered. "
             "Needs additional logic for support"
         )
-    return _evaluated_list
+    return f"[{item_expression} for {item_name} in {value_name}]"
 
 
-def _evaluate_map_type(raw_map, shape) -> dict:
+def _map_expression(shape, value_name, depth) -> str:
     """
-    Evaluates a map type based on the given shape.
+    Builds the source expression that evaluates a map value of the given shape.
 
     Args:
-        raw_map (dict): The raw map to be evaluated.
-        shape (dict): The shape of the map.
+        shape (dict): The DAG node of the map shape.
+        value_name (str): The name of the variable holding the raw map.
+        depth (int): The nesting depth, used to keep comprehension variables unique.
 
     Returns:
-        dict: The evaluated map.
-
-    Raises:
-        ValueError: If an unhandled map key type or list member type is encountered.
+        str: The python expression evaluating the map.
     """
     _shape_key_type = shape["key_type"]
     _shape_value_type = shape["value_type"]
     _shape_value_shape = shape["value_shape"]
     if _shape_key_type != "string":
-        raise ValueError(
-            f"Unhandled Map key type "
-            f"[{_shape_key_type}] encountered. "
+        return _unhandled_expression(
+            f"Unhandled Map key type [{_shape_key_type}] encountered. "
             "Needs additional logic for support"
         )
 
-    _evaluated_map = {}
+    key_name, item_name = f"k{depth}", f"v{depth}"
     if _shape_value_type in BASIC_TYPES:
-        # if basic types directly assign value.
-        # Ex. response["map_member"] = {"key":"value"}
-        _evaluated_map = raw_map
+        value_expression = _shape_value_type == "string" and _intern_expression(
+            None, _shape_value_shape, item_name
+        )
+        if not value_expression:
+            # if basic types copy the map value, the response may be shared by the
+            # describe cache or coalesced calls
+            # Ex. response["map_member"] = {"key":"value"}
+            return f"dict({value_name})"
     elif _shape_value_type == STRUCTURE_TYPE:
-        # if structure type loop through and evaluate values
-        for k, v in raw_map.items():
-            _evaluated_value = transform(v, _shape_value_shape)
-            _evaluated_map[k] = _evaluated_value
+        value_expression = f"_deserializers[{_shape_value_shape!r}]({item_name})"
     elif _shape_value_type == LIST_TYPE:
-        for k, v in raw_map.items():
-            _list_type_shape = SHAPE_DAG[_shape_value_shape]
-            evaluated_values = _evaluate_list_type(v, _list_type_shape)
-            _evaluated_map[k] = evaluated_values
+        value_expression = _list_expression(
+            SHAPE_DAG[_shape_value_shape], item_name, depth + 1
+        )
     elif _shape_value_type == MAP_TYPE:
-        for k, v in raw_map.items():
-            _map_type_shape = SHAPE_DAG[_shape_value_shape]
-            evaluated_values = _evaluate_map_type(v, _map_type_shape)
-            _evaluated_map[k] = evaluated_values
+        value_expression = _map_expression(
+            SHAPE_DAG[_shape_value_shape], item_name, depth + 1
+        )
     else:
-        raise ValueError(
-            f"Unhandled List member type "
-            f"[{_shape_value_type}] encountered. "
+        return _unhandled_expression(
+            f"Unhandled List member type [{_shape_value_type}] encountered. "
             "Needs additional logic for support"
         )
+    return (
+        f"{{{key_name}: {value_expression} "
+        f"for {key_name}, {item_name} in {value_name}.items()}}"
+    )
+
+
+def _child_shapes(shape):
+    """Returns the names of the structure, list and map shapes directly nested in a shape."""
+    _shape = SHAPE_DAG[shape]
+    if _shape["type"] == STRUCTURE_TYPE:
+        children = [(member["shape"], member["type"]) for member in _shape["members"]]
+    elif _shape["type"] == LIST_TYPE:
+        children = [(_shape["member_shape"], _shape["member_type"])]
+    else:
+        children = [(_shape["value_shape"], _shape["value_type"])]
+    return [
+        child_shape
+        for child_shape, child_type in children
+        if child_type in (STRUCTURE_TYPE, LIST_TYPE, MAP_TYPE)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _is_recursive(shape):
+    """Returns whether a shape is nested in itself, e.g. SearchExpression."""
+    visited = set()
+    pending = _child_shapes(shape)
+    while pending:
+        child = pending.pop()
+        if child == shape:
+            return True
+        if child not in visited:
+            visited.add(child)
+            pending.extend(_child_shapes(child))
+    return False
+
+
+@lru_cache(maxsize=None)
+def _structure_members(shape):
+    """
+    Returns the (member name, attribute name, member shape, is basic, interner) of the
+    members of a structure.
+    """
+    members = []
+    for member in SHAPE_DAG[shape]["members"]:
+        attribute_name = pascal_to_snake(member["name"])
+        interner = None
+        if member["type"] == "string":
+            interner = string_interner(attribute_name, member["shape"])
+        members.append(
+            (
+                member["name"],
+                attribute_name,
+                member["shape"],
+                member["type"] in BASIC_TYPES,
+                interner,
+            )
+        )
+    return tuple(members)
+
+
+@lru_cache(maxsize=None)
+def _model_constructor(shape):
+    """Returns the model_construct of the generated class of a shape, if any."""
+    from src.generated import shapes
 
-    return _evaluated_map
+    model = getattr(shapes, shape, None)
+    return model.model_construct if model else None
 
 
-def transform(data, shape, object_instance=None) -> dict:
+@lru_cache(maxsize=None)
+def _view_class(shape):
+    """Returns the generated view class of a shape, if any."""
+    from src.generated import views
+
+    return getattr(views, f"{shape}View", None)
+
+
+def _decode_iteratively(data, shape, constructor_of=None) -> dict:
     """
-    Transforms the given data based on the given shape.
+    Transforms the data of a structure shape with an explicit stack instead of recursion.
+
+    Every task on the stack is a raw value with its shape, and the container and key the
+    evaluated value is assigned to. Containers are allocated at their final size before
+    their items are evaluated, lists as [None] * n and maps with dict.fromkeys. Used for
+    the recursive shapes, whose nesting depth is only bounded by the data.
 
     Args:
         data (dict): The data to be transformed.
-        shape (str): The shape of the data.
-        object_instance (object): The object to be transformed. (Optional)
+        shape (str): The name of the structure shape.
+        constructor_of (function): Returns the constructor of the nested structures of
+            a shape, ie. the model_construct of its shape class. (Optional)
 
     Returns:
-        dict: The transformed data.
+        dict: The snake cased and evaluated members of the structure.
 
     Raises:
         ValueError: If an unhandled shape type is encountered.
     """
-    result = {}
-    _shape = SHAPE_DAG[shape]
+    root = [None]
+    # a task with a None shape builds the model of an evaluated structure, it is pushed
+    # before the members of the structure so it runs after all of them
+    stack = [(data, shape, root, 0)]
+    while stack:
+        value, _shape_name, container, key = stack.pop()
+        if _shape_name is None:
+            container[key] = value(**container[key])
+            continue
 
-    if _shape["type"] in BASIC_TYPES:
+        _shape = SHAPE_DAG[_shape_name]
+        _shape_type = _shape["type"]
+        if _shape_type == STRUCTURE_TYPE:
+            result = {}
+            container[key] = result
+            if constructor_of and container is not root:
+                constructor = constructor_of(_shape_name)
+                if constructor:
+                    stack.append((constructor, None, container, key))
+            for (
+                member_name,
+                attribute_name,
+                member_shape,
+                is_basic,
+                interner,
+            ) in _structure_members(_shape_name):
+                member_value = value.get(member_name)
+                if member_value is None:
+                    continue
+                if interner:
+                    result[attribute_name] = interner(member_value)
+                elif is_basic:
+                    result[attribute_name] = member_value
+                else:
+                    stack.append((member_value, member_shape, result, attribute_name))
+        elif _shape_type == LIST_TYPE:
+            _shape_member_type = _shape["member_type"]
+            if _shape_member_type in BASIC_TYPES:
+                interner = _shape_member_type == "string" and string_interner(
+                    None, _shape["member_shape"]
+                )
+                container[key] = (
+                    [interner(item) for item in value] if interner else list(value)
+                )
+                continue
+            if _shape_member_type not in (STRUCTURE_TYPE, LIST_TYPE, MAP_TYPE):
+                _unhandled(
+                    f"Unhandled List member type [{_shape_member_type}] encountered. "
+                    "Needs additional logic for support"
+                )
+            items = [None] * len(value)
+            container[key] = items
+            _member_shape = _shape["member_shape"]
+            for index, item in enumerate(value):
+                if item is not None:
+                    stack.append((item, _member_shape, items, index))
+        elif _shape_type == MAP_TYPE:
+            _shape_key_type = _shape["key_type"]
+            _shape_value_type = _shape["value_type"]
+            if _shape_key_type != "string":
+                _unhandled(
+                    f"Unhandled Map key type [{_shape_key_type}] encountered. "
+                    "Needs additional logic for support"
+                )
+            if _shape_value_type in BASIC_TYPES:
+                interner = _shape_value_type == "string" and string_interner(
+                    None, _shape["value_shape"]
+                )
+                container[key] = (
+                    {item_key: interner(item) for item_key, item in value.items()}
+                    if interner
+                    else dict(value)
+                )
+                continue
+            if _shape_value_type not in (STRUCTURE_TYPE, LIST_TYPE, MAP_TYPE):
+                _unhandled(
+                    f"Unhandled List member type [{_shape_value_type}] encountered. "
+                    "Needs additional logic for support"
+                )
+            items = dict.fromkeys(value)
+            container[key] = items
+            _value_shape = _shape["value_shape"]
+            for item_key, item in value.items():
+                if item is not None:
+                    stack.append((item, _value_shape, items, item_key))
+        else:
+            _unhandled(f"Unexpected member type encountered: {_shape_type}")
+    return root[0]
+
+
+def _compile_deserializer(shape, deserializers=None, constructor=None):
+    """
+    Generates a deserializer function specialized for the given structure shape.
+
+    The member names, attribute names and member types are resolved once while
+    generating the function source, so the returned function only does the work
+    that depends on the data itself.
+
+    Args:
+        shape (str): The name of the structure shape.
+        deserializers (dict): The deserializers of the nested structure shapes,
+            defaults to the deserializers returning dicts.
+        constructor (function): Builds the result from the members, ie. the
+            model_construct of the shape class. (Optional)
+
+    Returns:
+        function: A function taking the raw response dict and returning the
+            snake cased and evaluated members.
+
+    Raises:
+        ValueError: If the shape is not a structure shape.
+    """
+    _shape = SHAPE_DAG[shape]
+    if _shape["type"] != STRUCTURE_TYPE:
         raise ValueError("Unexpected low-level operation model shape")
 
+    if _is_recursive(shape):
+        # the nesting depth of recursive shapes is only bounded by the data, so they are
+        # transformed with an explicit stack instead of nested calls
+        logging.debug(f"Using the iterative deserializer for recursive shape: {shape}")
+        constructor_of = (
+            _DESERIALIZERS if deserializers is None else deserializers
+        ).constructor_of
+
+        def deserialize(data):
+            result = _decode_iteratively(data, shape, constructor_of=constructor_of)
+            return constructor(**result) if constructor else result
+
+        return deserialize
+
+    lines = ["def deserialize(data):", "    result = {}"]
     for member in _shape["members"]:
         _member_name = member["name"]
         _member_shape = member["shape"]
         _member_type = member["type"]
-        logging.debug(f"Evaluating member: {member}")
-        if data.get(_member_name) is None:
-            logging.debug(f"Member {member} not set, continuing...")
-            continue
-        # 1. set snake case attribute name
-        attribute_name = pascal_to_snake(_member_name)
+        _attribute_name = pascal_to_snake(_member_name)
         if _member_type in BASIC_TYPES:
-            logging.debug(f"Basic type encountered, evaluating member: {member}")
-            # 2. assign response value
-            evaluated_value = data[_member_name]
+            evaluated_value = (
+                _member_type == "string"
+                and _intern_expression(_attribute_name, _member_shape, "value")
+                or "value"
+            )
         elif _member_type == STRUCTURE_TYPE:
-            logging.debug(f"Structure type encountered, evaluating member: {member}")
-            # 2. assign response value
-            evaluated_value = transform(data[_member_name], _member_shape)
+            evaluated_value = f"_deserializers[{_member_shape!r}](value)"
         elif _member_type == LIST_TYPE:
-            logging.debug(f"List type encountered, evaluating member: {member}")
-            _list_type_shape = SHAPE_DAG[_member_shape]
-            # 2. assign response value
-            evaluated_value = _evaluate_list_type(data[_member_name], _list_type_shape)
+            evaluated_value = _list_expression(
+                SHAPE_DAG[_member_shape], "value", 0, _attribute_name
+            )
         elif _member_type == MAP_TYPE:
-            logging.debug(f"Map type encountered, evaluating member: {member}")
-            _map_type_shape = SHAPE_DAG[_member_shape]
-            # 2. assign response value
-            evaluated_value = _evaluate_map_type(data[_member_name], _map_type_shape)
+            evaluated_value = _map_expression(SHAPE_DAG[_member_shape], "value", 0)
         else:
-            raise ValueError(f"Unexpected member type encountered: {_member_type}")
+            evaluated_value = _unhandled_expression(
+                f"Unexpected member type encountered: {_member_type}"
+            )
+        lines.append(f"    value = data.get({_member_name!r})")
+        lines.append("    if value is not None:")
+        lines.append(f"        result[{_attribute_name!r}] = {evaluated_value}")
+    lines.append(
+        "    return _constructor(**result)" if constructor else "    return result"
+    )
 
-        result[attribute_name] = evaluated_value
-        if object_instance:
-            setattr(object_instance, attribute_name, evaluated_value)
+    logging.debug(f"Compiling deserializer for shape: {shape}")
+    namespace = {
+        "_deserializers": _DESERIALIZERS if deserializers is None else deserializers,
+        "_unhandled": _unhandled,
+        "_constructor": constructor,
+        "_enum_strings": _ENUM_STRINGS,
+        "_intern_pool": _INTERN_POOL,
+    }
+    exec(compile("\n".join(lines), f"<deserializer {shape}>", "exec"), namespace)
+    return namespace["deserialize"]
+
+
+class _DeserializerCache(dict):
+    """Compiles the deserializer of a shape on first use and caches it."""
+
+    constructor_of = None
+
+    def __missing__(self, shape):
+        deserializer = _compile_deserializer(shape)
+        self[shape] = deserializer
+        return deserializer
+
+
+class _ConstructorCache(dict):
+    """
+    Compiles the trusted deserializer of a shape on first use and caches it.
+
+    Nested structures are built as instances of the generated shape classes with
+    model_construct, which skips validation. Only responses of the service, already
+    parsed by botocore against the same service model, are decoded this way.
+    """
+
+    constructor_of = staticmethod(_model_constructor)
+
+    def __missing__(self, shape):
+        deserializer = _compile_deserializer(
+            shape, deserializers=self, constructor=_model_constructor(shape)
+        )
+        self[shape] = deserializer
+        return deserializer
+
+
+class _TrustedDeserializerCache(dict):
+    """Compiles the trusted deserializer of a top level shape, returning a dict of members."""
 
+    def __missing__(self, shape):
+        deserializer = _compile_deserializer(shape, deserializers=_CONSTRUCTORS)
+        self[shape] = deserializer
+        return deserializer
+
+
+class _ViewCache(dict):
+    """
+    Compiles the view deserializer of a shape on first use and caches it.
+
+    The shape and its nested structures are built as instances of the generated view
+    classes, see transform_view.
+    """
+
+    constructor_of = staticmethod(_view_class)
+
+    def __missing__(self, shape):
+        deserializer = _compile_deserializer(
+            shape, deserializers=self, constructor=_view_class(shape)
+        )
+        self[shape] = deserializer
+        return deserializer
+
+
+_DESERIALIZERS = _DeserializerCache()
+_CONSTRUCTORS = _ConstructorCache()
+_TRUSTED_DESERIALIZERS = _TrustedDeserializerCache()
+_VIEWS = _ViewCache()
+
+
+def transform(data, shape, object_instance=None, trusted=False) -> dict:
+    """
+    Transforms the given data based on the given shape.
+
+    Args:
+        data (dict): The data to be transformed.
+        shape (str): The shape of the data.
+        object_instance (object): The object to be transformed. (Optional)
+        trusted (bool): Whether the data is a service response. Nested structures
+            are then built as shape instances without validation.
+
+    Returns:
+        dict: The transformed data.
+
+    Raises:
+        ValueError: If an unhandled shape type is encountered.
+    """
+    result = (_TRUSTED_DESERIALIZERS if trusted else _DESERIALIZERS)[shape](data)
+    if object_instance:
+        for attribute_name, evaluated_value in result.items():
+            setattr(object_instance, attribute_name, evaluated_value)
     return result
+
+
+def transform_view(data, shape):
+    """
+    Transforms the given data into a read-only view of the shape.
+
+    The nested structures are views too, see ShapeView. The data must be a response of
+    the service, it is not validated.
+
+    Args:
+        data (dict): The data to be transformed.
+        shape (str): The shape of the data.
+
+    Returns:
+        ShapeView: The view of the data, or a dict of members if the shape has no view
+            class.
+
+    Raises:
+        ValueError: If an unhandled shape type is encountered.
+    """
+    return _VIEWS[shape](data)
+
+
+@lru_cache(maxsize=None)
+def _basic_members(shape):
+    """Returns the (member name, attribute name, interner) of the basic members of a shape."""
+    return tuple(
+        (member_name, attribute_name, interner)
+        for member_name, attribute_name, _, is_basic, interner in _structure_members(
+            shape
+        )
+        if is_basic
+    )
+
+
+def transform_lazily(data, shape):
+    """
+    Transforms only the basic members of the given data, keeping the others raw.
+
+    The raw members can be transformed later, one at a time, with
+    transform({member_name: raw_value}, shape).
+
+    Args:
+        data (dict): The data to be transformed.
+        shape (str): The shape of the data.
+
+    Returns:
+        tuple: The transformed basic members, and the raw other members as a dict of
+            attribute name to (member name, raw value).
+    """
+    result = {}
+    remaining = dict(data)
+    for member_name, attribute_name, interner in _basic_members(shape):
+        if (value := remaining.pop(member_name, None)) is not None:
+            result[attribute_name] = interner(value) if interner else value
+    raw_members = {
+        pascal_to_snake(member_name): (member_name, raw_value)
+        for member_name, raw_value in remaining.items()
+    }
+    return result, raw_members
+
+
+@lru_cache(maxsize=None)
+def _member_names(shape):
+    """Returns the mapping of attribute name to member name of a structure shape."""
+    return {
+        pascal_to_snake(member["name"]): member["name"]
+        for member in SHAPE_DAG[shape]["members"]
+    }
+
+
+def transform_fields(data, shape, fields, trusted=False):
+    """
+    Transforms only the given attributes of the data, keeping the other members raw.
+
+    The members of the given attributes are transformed with their whole subtree, the
+    raw members can be transformed later like the ones returned by transform_lazily.
+
+    Args:
+        data (dict): The data to be transformed.
+        shape (str): The shape of the data.
+        fields (list): The snake cased names of the attributes to transform.
+        trusted (bool): Whether the data is a service response. Nested structures
+            are then built as shape instances without validation.
+
+    Returns:
+        tuple: The transformed members of the fields, and the raw other members as a dict
+            of attribute name to (member name, raw value).
+
+    Raises:
+        ValueError: If a field is not an attribute of the shape.
+    """
+    member_names = _member_names(shape)
+    unknown_fields = [field for field in fields if field not in member_names]
+    if unknown_fields:
+        raise ValueError(f"Unknown fields for shape {shape}: {unknown_fields}")
+    selected_members = {member_names[field] for field in fields}
+
+    selected_data = {}
+    raw_members = {}
+    for member_name, raw_value in data.items():
+        if member_name in selected_members:
+            selected_data[member_name] = raw_value
+        else:
+            raw_members[pascal_to_snake(member_name)] = (member_name, raw_value)
+    return transform(selected_data, shape, trusted=trusted), raw_members
+
+
+def _serialize_any(value):
+    """
+    Serializes a value of a shape the compiled serializers do not cover.
+
+    Args:
+        value: The value to be serialized.
+
+    Returns:
+        The serialized value.
+    """
+    if isinstance(value, list):
+        return [_serialize_any(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _serialize_any(item) for key, item in value.items()}
+    if hasattr(value, "serialize"):
+        return value.serialize()
+    return value
+
+
+def _serialize_expression(member_type, member_shape, value_name, depth) -> str:
+    """
+    Builds the source expression that serializes a value of the given member type.
+
+    Args:
+        member_type (str): The type of the member.
+        member_shape (str): The name of the shape of the member.
+        value_name (str): The name of the variable holding the value.
+        depth (int): The nesting depth, used to keep comprehension variables unique.
+
+    Returns:
+        str: The python expression evaluating the serialized value.
+    """
+    if member_type in BASIC_TYPES:
+        return value_name
+    if member_type == STRUCTURE_TYPE:
+        return f"_serializers[{member_shape!r}]({value_name})"
+    if member_type == LIST_TYPE:
+        _shape = SHAPE_DAG[member_shape]
+        if _shape["member_type"] in BASIC_TYPES:
+            return value_name
+        if _shape["member_type"] == STRUCTURE_TYPE:
+            item_name = f"item{depth}"
+            item_expression = _serialize_expression(
+                STRUCTURE_TYPE, _shape["member_shape"], item_name, depth + 1
+            )
+            return f"[{item_expression} for {item_name} in {value_name}]"
+    if member_type == MAP_TYPE:
+        _shape = SHAPE_DAG[member_shape]
+        if _shape["value_type"] in BASIC_TYPES:
+            return value_name
+        if _shape["value_type"] == STRUCTURE_TYPE:
+            key_name, item_name = f"k{depth}", f"v{depth}"
+            item_expression = _serialize_expression(
+                STRUCTURE_TYPE, _shape["value_shape"], item_name, depth + 1
+            )
+            return (
+                f"{{{key_name}: {item_expression} "
+                f"for {key_name}, {item_name} in {value_name}.items()}}"
+            )
+    return f"_serialize_any({value_name})"
+
+
+def _compile_serializer(shape, from_request=False):
+    """
+    Generates a serializer function specialized for the given structure shape.
+
+    The wire names, attribute names and member types are resolved once while
+    generating the function source. Unassigned and None members are skipped.
+
+    Args:
+        shape (str): The name of the structure shape.
+        from_request (bool): Whether the function takes a dict keyed by the wire
+            names of the members instead of an instance of the shape class.
+
+    Returns:
+        function: A function returning the request dict of the shape.
+    """
+    from src.generated import shapes, utils
+
+    lines = ["def serialize(data):"]
+    if from_request:
+        lines.append("    members = data")
+    else:
+        # dicts passed in place of a shape instance are already serialized
+        lines.append("    members = getattr(data, '__dict__', None)")
+        lines.append("    if members is None:")
+        lines.append("        return data")
+    lines.append("    result = {}")
+    for member in SHAPE_DAG[shape]["members"]:
+        _member_name = member["name"]
+        key = _member_name if from_request else pascal_to_snake(_member_name)
+        serialized_value = _serialize_expression(
+            member["type"], member["shape"], "value", 0
+        )
+        lines.append(f"    value = members.get({key!r})")
+        lines.append("    if value is not None and value.__class__ not in _unassigned:")
+        lines.append(f"        result[{_member_name!r}] = {serialized_value}")
+    lines.append("    return result")
+
+    logging.debug(f"Compiling serializer for shape: {shape}")
+    namespace = {
+        "_serializers": _SERIALIZERS,
+        "_serialize_any": _serialize_any,
+        "_unassigned": frozenset([shapes.Unassigned, utils.Unassigned]),
+    }
+    exec(compile("\n".join(lines), f"<serializer {shape}>", "exec"), namespace)
+    return namespace["serialize"]
+
+
+class _SerializerCache(dict):
+    """Compiles the serializer of a shape on first use and caches it."""
+
+    def __init__(self, from_request=False):
+        super().__init__()
+        self.from_request = from_request
+
+    def __missing__(self, shape):
+        serializer = _compile_serializer(shape, from_request=self.from_request)
+        self[shape] = serializer
+        return serializer
+
+
+_SERIALIZERS = _SerializerCache()
+_REQUEST_SERIALIZERS = _SerializerCache(from_request=True)
+
+
+def serialize_shape(instance) -> dict:
+    """
+    Serializes an instance of a generated shape class into its request dict.
+
+    Args:
+        instance (object): The shape instance.
+
+    Returns:
+        dict: The serialized data, keyed by the wire names of the members.
+    """
+    return _SERIALIZERS[instance.__class__.__name__](instance)
+
+
+def serialize_request(data, shape) -> dict:
+    """
+    Serializes the input arguments of an operation.
+
+    Args:
+        data (dict): The input arguments, keyed by the wire names of the members.
+        shape (str): The input shape of the operation.
+
+    Returns:
+        dict: The serialized request, without the unassigned members.
+    """
+    return _REQUEST_SERIALIZERS[shape](data)
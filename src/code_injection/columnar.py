@@ -0,0 +1,229 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Columnar decoding of the summaries of list and search results.
+
+Pages of raw summaries are decoded member by member into one column per member of the
+summary shape, without building a dict or an object per row. Columns are NumPy arrays
+when NumPy is installed, it is imported on first use: int64 and float64 for numbers, bool for booleans,
+datetime64[us] in UTC for timestamps and object arrays otherwise, where enum values and
+the members configured with codec.configure_interning are interned.
+Every column has a validity mask telling which rows have a value. Nested members are
+kept as returned by the service.
+"""
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from src.code_injection.codec import pascal_to_snake, string_interner
+from src.code_injection.shape_dag import SHAPE_DAG
+from src.code_injection.constants import STRUCTURE_TYPE
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INTEGER_TYPES = ("integer", "long")
+FLOAT_TYPES = ("float", "double")
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Imports NumPy, or returns None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:  # numpy is optional, the columns are then python lists
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def _columns_of(shape):
+    """Returns the (member name, attribute name, member type, member shape) of a structure."""
+    _shape = SHAPE_DAG[shape]
+    if _shape["type"] != STRUCTURE_TYPE:
+        raise ValueError(f"Columns can only be decoded from structure shapes: {shape}")
+    return tuple(
+        (
+            member["name"],
+            pascal_to_snake(member["name"]),
+            member["type"],
+            member["shape"],
+        )
+        for member in _shape["members"]
+    )
+
+
+def _timestamp(value):
+    # botocore parses timestamps into timezone aware datetimes
+    return value.timestamp()
+
+
+class ColumnTable:
+    """
+    The summaries of a list or search result, decoded into columns.
+
+    Pages are appended with append_page as they are received, the columns are built
+    by to_columns or to_pandas.
+    """
+
+    def __init__(self, shape: str, fields: Optional[List[str]] = None):
+        """
+        Initializes a ColumnTable.
+
+        Args:
+            shape (str): The shape name of a summary, ie. TrainingJobSummary.
+            fields (List[str]): The snake cased attributes to decode, all by default.
+
+        Raises:
+            ValueError: If the shape is not a structure or a field is not one of its
+                attributes.
+        """
+        columns = _columns_of(shape)
+        if fields is not None:
+            attributes = {column[1] for column in columns}
+            unknown_fields = [field for field in fields if field not in attributes]
+            if unknown_fields:
+                raise ValueError(f"Unknown fields for shape {shape}: {unknown_fields}")
+            columns = tuple(column for column in columns if column[1] in fields)
+        self.shape = shape
+        self.num_rows = 0
+        self._columns = [column[:3] for column in columns]
+        self._interners = {
+            attribute: string_interner(attribute, member_shape)
+            for _, attribute, member_type, member_shape in columns
+            if member_type == "string"
+        }
+        self._values: Dict[str, list] = {column[1]: [] for column in columns}
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def append_page(self, summaries: Iterable[dict]) -> None:
+        """
+        Decodes a page of raw summaries, as returned by the service.
+
+        Args:
+            summaries (Iterable[dict]): The raw summaries.
+        """
+        summaries = summaries if isinstance(summaries, list) else list(summaries)
+        for member_name, attribute, member_type in self._columns:
+            values = [summary.get(member_name) for summary in summaries]
+            intern = self._interners.get(attribute)
+            if intern:
+                # the enum members repeat in every row, interning keeps one copy of each
+                values = [None if value is None else intern(value) for value in values]
+            elif member_type == "timestamp":
+                values = [
+                    None if value is None else _timestamp(value) for value in values
+                ]
+            self._values[attribute].extend(values)
+        self.num_rows += len(summaries)
+
+    def masks(self) -> Dict[str, "np.ndarray"]:
+        """
+        Returns the validity masks of the columns, True where a row has a value.
+
+        Returns:
+            dict: The mask of every column, a NumPy bool array, or a list of bool
+                without NumPy.
+        """
+        masks = {
+            attribute: [value is not None for value in values]
+            for attribute, values in self._values.items()
+        }
+        np = _numpy()
+        if np is None:
+            return masks
+        return {
+            attribute: np.fromiter(mask, dtype=bool, count=self.num_rows)
+            for attribute, mask in masks.items()
+        }
+
+    def to_columns(self) -> Dict[str, "np.ndarray"]:
+        """
+        Builds the columns.
+
+        Missing values are 0 in integer columns, False in bool columns, NaN in float
+        columns, NaT in timestamp columns and None in object columns, see masks for
+        telling them apart from actual values.
+
+        Returns:
+            dict: The column of every attribute, a NumPy array, or a list without
+                NumPy where timestamps are seconds since the epoch.
+        """
+        np = _numpy()
+        if np is None:
+            return {
+                attribute: list(values) for attribute, values in self._values.items()
+            }
+        return {
+            attribute: self._to_array(self._values[attribute], member_type)
+            for _, attribute, member_type in self._columns
+        }
+
+    def _to_array(self, values: list, member_type: str) -> "np.ndarray":
+        np = _numpy()
+        if member_type in INTEGER_TYPES:
+            return np.fromiter(
+                (0 if value is None else value for value in values),
+                dtype=np.int64,
+                count=len(values),
+            )
+        if member_type == "boolean":
+            return np.fromiter(
+                (bool(value) for value in values), dtype=bool, count=len(values)
+            )
+        if member_type in FLOAT_TYPES or member_type == "timestamp":
+            array = np.fromiter(
+                (np.nan if value is None else value for value in values),
+                dtype=np.float64,
+                count=len(values),
+            )
+            if member_type in FLOAT_TYPES:
+                return array
+            missing = np.isnan(array)
+            microseconds = np.rint(np.where(missing, 0, array) * 1e6).astype(np.int64)
+            timestamps = microseconds.view("datetime64[us]")
+            timestamps[missing] = np.datetime64("NaT")
+            return timestamps
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    def to_pandas(self):
+        """
+        Builds a pandas DataFrame of the columns.
+
+        Integer and bool columns with missing values use the nullable pandas dtypes,
+        timestamps are timezone aware in UTC.
+
+        Returns:
+            pandas.DataFrame: One row per summary and one column per attribute.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        import pandas as pd
+
+        columns = self.to_columns()
+        masks = self.masks()
+        data = {}
+        for _, attribute, member_type in self._columns:
+            column, mask = columns[attribute], masks[attribute]
+            if member_type in INTEGER_TYPES and not mask.all():
+                column = pd.arrays.IntegerArray(column, ~mask)
+            elif member_type == "boolean" and not mask.all():
+                column = pd.arrays.BooleanArray(column, ~mask)
+            elif member_type == "timestamp":
+                column = pd.DatetimeIndex(column).tz_localize("UTC")
+            data[attribute] = column
+        return pd.DataFrame(data, columns=list(data))
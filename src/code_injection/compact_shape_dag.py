@@ -0,0 +1,131 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Compact encoding of the shape DAG.
+
+Every string of the DAG is stored once in a string table and shapes are flat tuples of
+indexes into that table. A tuple of constants is a single constant of the compiled module,
+so importing the generated shape_dag module loads it from the .pyc with marshal instead of
+executing the code building thousands of dicts. Shapes are materialized to the dict nodes
+returned by ShapesExtractor.get_shapes_dag on first lookup.
+"""
+from collections.abc import Mapping
+from typing import Dict, List, Tuple
+
+from src.code_injection.constants import STRUCTURE_TYPE, LIST_TYPE, MAP_TYPE
+
+_LIST_KEYS = ("member_shape", "member_type")
+_MAP_KEYS = ("key_shape", "key_type", "value_shape", "value_type")
+
+
+def encode_shape_dag(shape_dag: Dict[str, dict]) -> Tuple[Tuple[str, ...], tuple]:
+    """
+    Encodes a shape DAG into a string table and a tuple of shape records.
+
+    The shape names come first in the string table, sorted, so the string index of a
+    shape name is also the index of its record. A record is the type index followed by
+    (name, shape, type) indexes per member for a structure, (member_shape, member_type)
+    indexes for a list and (key_shape, key_type, value_shape, value_type) for a map.
+
+    Args:
+        shape_dag (dict): The shape DAG, as returned by ShapesExtractor.get_shapes_dag.
+
+    Returns:
+        tuple: The string table and the shape records.
+    """
+    strings: List[str] = sorted(shape_dag)
+    string_ids = {string: index for index, string in enumerate(strings)}
+
+    def intern(string: str) -> int:
+        if string not in string_ids:
+            string_ids[string] = len(strings)
+            strings.append(string)
+        return string_ids[string]
+
+    records = []
+    for shape_name in sorted(shape_dag):
+        shape = shape_dag[shape_name]
+        record = [intern(shape["type"])]
+        if shape["type"] == STRUCTURE_TYPE:
+            for member in shape["members"]:
+                record += [
+                    intern(member["name"]),
+                    intern(member["shape"]),
+                    intern(member["type"]),
+                ]
+        elif shape["type"] == LIST_TYPE:
+            record += [intern(shape[key]) for key in _LIST_KEYS]
+        elif shape["type"] == MAP_TYPE:
+            record += [intern(shape[key]) for key in _MAP_KEYS]
+        else:
+            raise ValueError(f"Unexpected shape type in the DAG: {shape['type']}")
+        records.append(tuple(record))
+    return tuple(strings), tuple(records)
+
+
+class CompactShapeDag(Mapping):
+    """
+    Read-only mapping of shape name to DAG node, backed by the compact encoding.
+
+    Nodes are built on first lookup and cached, later lookups return the same dict.
+    """
+
+    def __init__(self, strings: Tuple[str, ...], records: tuple):
+        self._strings = strings
+        self._records = records
+        self._index = None
+        self._nodes = {}
+
+    def _shape_index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {
+                self._strings[index]: index for index in range(len(self._records))
+            }
+        return self._index
+
+    def _materialize(self, index: int) -> dict:
+        strings = self._strings
+        shape_type, *values = self._records[index]
+        shape_type = strings[shape_type]
+        if shape_type == STRUCTURE_TYPE:
+            return {
+                "members": [
+                    {
+                        "name": strings[values[offset]],
+                        "shape": strings[values[offset + 1]],
+                        "type": strings[values[offset + 2]],
+                    }
+                    for offset in range(0, len(values), 3)
+                ],
+                "type": shape_type,
+            }
+        keys = _LIST_KEYS if shape_type == LIST_TYPE else _MAP_KEYS
+        node = {key: strings[value] for key, value in zip(keys, values)}
+        node["type"] = shape_type
+        return node
+
+    def __getitem__(self, shape_name: str) -> dict:
+        node = self._nodes.get(shape_name)
+        if node is None:
+            node = self._materialize(self._shape_index()[shape_name])
+            self._nodes[shape_name] = node
+        return node
+
+    def __contains__(self, shape_name) -> bool:
+        return shape_name in self._shape_index()
+
+    def __iter__(self):
+        return iter(self._strings[: len(self._records)])
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,271 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Micro-batching of the records sent to an endpoint by concurrent callers.
+
+The records submitted within a short window are packed into one request body by a
+payload codec, sent with one invocation, and the response is split back into one
+result per record.
+"""
+import asyncio
+import csv
+import io
+import json
+import logging
+import queue
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadCodec:
+    """
+    Packs records into a request body and splits a response body into results.
+
+    Subclass it to support another content type.
+    """
+
+    content_type: str = ""
+    accept: str = ""
+
+    def encode(self, records: List[Any]) -> bytes:
+        """Returns the request body of a batch of records."""
+        raise NotImplementedError
+
+    def decode(self, body: bytes, count: int) -> List[Any]:
+        """Returns the results of a batch of count records, in the order of the records."""
+        raise NotImplementedError
+
+
+class JsonLinesCodec(PayloadCodec):
+    """One JSON document per line, for records and results."""
+
+    content_type = "application/jsonlines"
+    accept = "application/jsonlines"
+
+    def encode(self, records: List[Any]) -> bytes:
+        return "\n".join(json.dumps(record) for record in records).encode("utf-8")
+
+    def decode(self, body: bytes, count: int) -> List[Any]:
+        return [json.loads(line) for line in body.decode("utf-8").splitlines() if line]
+
+
+class CsvCodec(PayloadCodec):
+    """
+    One CSV row per line, for records and results.
+
+    Records are sequences of values, results are lists of strings.
+    """
+
+    content_type = "text/csv"
+    accept = "text/csv"
+
+    def encode(self, records: List[Any]) -> bytes:
+        body = io.StringIO()
+        csv.writer(body, lineterminator="\n").writerows(records)
+        return body.getvalue().encode("utf-8")
+
+    def decode(self, body: bytes, count: int) -> List[Any]:
+        return [row for row in csv.reader(io.StringIO(body.decode("utf-8"))) if row]
+
+
+class NpyCodec(PayloadCodec):
+    """
+    NumPy arrays in the NPY format, records are stacked along a new first axis.
+
+    Requires the optional numpy dependency.
+    """
+
+    content_type = "application/x-npy"
+    accept = "application/x-npy"
+
+    def __init__(self):
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError(
+                "NpyCodec requires numpy, install it with `pip install numpy`"
+            ) from e
+        self._np = numpy
+
+    def encode(self, records: List[Any]) -> bytes:
+        body = io.BytesIO()
+        self._np.save(body, self._np.stack(records), allow_pickle=False)
+        return body.getvalue()
+
+    def decode(self, body: bytes, count: int) -> List[Any]:
+        return list(self._np.load(io.BytesIO(body), allow_pickle=False))
+
+
+class MicroBatcherStats(NamedTuple):
+    """The counters of a MicroBatcher."""
+
+    records: int
+    batches: int
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.records / self.batches if self.batches else 0.0
+
+
+_CLOSE = object()
+
+
+class MicroBatcher:
+    """
+    Collects the records of concurrent callers into batched invocations.
+
+    A batch is sent once it has max_batch_size records, or max_wait seconds after its
+    first record. While max_concurrency batches are in flight, the records keep
+    queueing so the next batch is sent as full as possible. A failed invocation fails
+    the futures of all the records of its batch.
+    """
+
+    def __init__(
+        self,
+        invoke: Callable[[bytes], bytes],
+        codec: Optional[PayloadCodec] = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        max_concurrency: int = 4,
+    ):
+        """
+        Initializes a MicroBatcher and starts its collecting thread.
+
+        Args:
+            invoke (Callable): Sends a request body and returns the response body.
+            codec (PayloadCodec): Packs the records and splits the results. Defaults to
+                JSON lines.
+            max_batch_size (int): The maximum number of records per invocation.
+            max_wait (float): The maximum number of seconds a record waits for others.
+            max_concurrency (int): The maximum number of invocations in flight.
+        """
+        self.codec = codec or JsonLinesCodec()
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._invoke = invoke
+        self._queue = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="sagemaker-micro-batch"
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        self._records = self._batches = 0
+        self._thread = threading.Thread(
+            target=self._collect, name="sagemaker-micro-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, record) -> Future:
+        """
+        Queues a record for the next batch.
+
+        Returns:
+            Future: The future of the result of the record.
+
+        Raises:
+            RuntimeError: If the batcher is closed.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The micro batcher is closed")
+            self._queue.put((record, future))
+        return future
+
+    def invoke(self, record, timeout: Optional[float] = None):
+        """Returns the result of a record, blocking until its batch returns."""
+        return self.submit(record).result(timeout)
+
+    async def async_invoke(self, record):
+        """The asyncio counterpart of invoke."""
+        return await asyncio.wrap_future(self.submit(record))
+
+    def _collect(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is _CLOSE:
+                return
+            # the records keep queueing while all the invocations are in flight
+            self._slots.acquire()
+            batch = [entry]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    entry = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is _CLOSE:
+                    self._executor.submit(self._invoke_batch, batch)
+                    return
+                batch.append(entry)
+            self._executor.submit(self._invoke_batch, batch)
+
+    def _invoke_batch(self, batch: list) -> None:
+        try:
+            # the records of cancelled futures are not sent
+            batch = [
+                (record, future)
+                for record, future in batch
+                if future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                return
+            with self._lock:
+                self._records += len(batch)
+                self._batches += 1
+            try:
+                records = [record for record, _ in batch]
+                results = self.codec.decode(
+                    self._invoke(self.codec.encode(records)), len(records)
+                )
+                if len(results) != len(records):
+                    raise ValueError(
+                        f"The endpoint returned {len(results)} results for "
+                        f"{len(records)} records"
+                    )
+            except BaseException as error:
+                logger.debug(f"Batch of {len(batch)} records failed", exc_info=True)
+                for _, future in batch:
+                    future.set_exception(error)
+                return
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        finally:
+            self._slots.release()
+
+    def stats(self) -> MicroBatcherStats:
+        """Returns a snapshot of the counters of the sent batches."""
+        with self._lock:
+            return MicroBatcherStats(records=self._records, batches=self._batches)
+
+    def close(self) -> None:
+        """Sends the queued records and waits for all the batches to return."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,1478 @@
+"""Generated PascalCase <-> snake_case member name tables."""
+
+from types import MappingProxyType
+
+PASCAL_TO_SNAKE = MappingProxyType(
+    {
+        "Accelerator": "accelerator",
+        "AcceleratorType": "accelerator_type",
+        "AcceleratorTypes": "accelerator_types",
+        "Accept": "accept",
+        "AcceptEula": "accept_eula",
+        "AccessStatus": "access_status",
+        "ActionArn": "action_arn",
+        "ActionName": "action_name",
+        "ActionSummaries": "action_summaries",
+        "ActionType": "action_type",
+        "Actions": "actions",
+        "ActiveDeviceCount": "active_device_count",
+        "AdditionalCodeRepositories": "additional_code_repositories",
+        "AdditionalCodeRepositoryEquals": "additional_code_repository_equals",
+        "AdditionalInferenceSpecifications": "additional_inference_specifications",
+        "AdditionalInferenceSpecificationsToAdd": "additional_inference_specifications_to_add",
+        "AdditionalS3DataSource": "additional_s3_data_source",
+        "AgentCount": "agent_count",
+        "AgentVersion": "agent_version",
+        "AgentVersions": "agent_versions",
+        "Aggregation": "aggregation",
+        "AlarmName": "alarm_name",
+        "Alarms": "alarms",
+        "AlertStatus": "alert_status",
+        "AlgorithmArn": "algorithm_arn",
+        "AlgorithmDescription": "algorithm_description",
+        "AlgorithmName": "algorithm_name",
+        "AlgorithmSpecification": "algorithm_specification",
+        "AlgorithmStatus": "algorithm_status",
+        "AlgorithmStatusDetails": "algorithm_status_details",
+        "AlgorithmSummaryList": "algorithm_summary_list",
+        "AlgorithmsConfig": "algorithms_config",
+        "Alias": "alias",
+        "Aliases": "aliases",
+        "AliasesToAdd": "aliases_to_add",
+        "AliasesToDelete": "aliases_to_delete",
+        "AllocationStrategy": "allocation_strategy",
+        "AmazonBedrockRoleArn": "amazon_bedrock_role_arn",
+        "AmazonForecastRoleArn": "amazon_forecast_role_arn",
+        "AmountInUsd": "amount_in_usd",
+        "AnnotationConsolidationConfig": "annotation_consolidation_config",
+        "AnnotationConsolidationLambdaArn": "annotation_consolidation_lambda_arn",
+        "AppArn": "app_arn",
+        "AppImageConfigArn": "app_image_config_arn",
+        "AppImageConfigName": "app_image_config_name",
+        "AppImageConfigs": "app_image_configs",
+        "AppManaged": "app_managed",
+        "AppName": "app_name",
+        "AppNetworkAccessType": "app_network_access_type",
+        "AppSecurityGroupManagement": "app_security_group_management",
+        "AppSpecification": "app_specification",
+        "AppType": "app_type",
+        "AppTypeEquals": "app_type_equals",
+        "ApprovalDescription": "approval_description",
+        "Apps": "apps",
+        "Arch": "arch",
+        "Arn": "arn",
+        "Artifact": "artifact",
+        "ArtifactArn": "artifact_arn",
+        "ArtifactDigest": "artifact_digest",
+        "ArtifactName": "artifact_name",
+        "ArtifactSummaries": "artifact_summaries",
+        "ArtifactType": "artifact_type",
+        "ArtifactUrl": "artifact_url",
+        "AssembleWith": "assemble_with",
+        "AssociationSummaries": "association_summaries",
+        "AssociationType": "association_type",
+        "AsyncInferenceConfig": "async_inference_config",
+        "AthenaDatasetDefinition": "athena_dataset_definition",
+        "AttemptCount": "attempt_count",
+        "AttributeNames": "attribute_names",
+        "AuthMode": "auth_mode",
+        "AuthorizationEndpoint": "authorization_endpoint",
+        "AuthorizedUrl": "authorized_url",
+        "AutoGenerateEndpointName": "auto_generate_endpoint_name",
+        "AutoMLAlgorithms": "auto_m_l_algorithms",
+        "AutoMLJob": "auto_m_l_job",
+        "AutoMLJobArn": "auto_m_l_job_arn",
+        "AutoMLJobArtifacts": "auto_m_l_job_artifacts",
+        "AutoMLJobConfig": "auto_m_l_job_config",
+        "AutoMLJobInputDataConfig": "auto_m_l_job_input_data_config",
+        "AutoMLJobName": "auto_m_l_job_name",
+        "AutoMLJobObjective": "auto_m_l_job_objective",
+        "AutoMLJobSecondaryStatus": "auto_m_l_job_secondary_status",
+        "AutoMLJobStatus": "auto_m_l_job_status",
+        "AutoMLJobSummaries": "auto_m_l_job_summaries",
+        "AutoMLProblemTypeConfig": "auto_m_l_problem_type_config",
+        "AutoMLProblemTypeConfigName": "auto_m_l_problem_type_config_name",
+        "AutoMLProblemTypeResolvedAttributes": "auto_m_l_problem_type_resolved_attributes",
+        "AutoParameters": "auto_parameters",
+        "AutoRollbackConfiguration": "auto_rollback_configuration",
+        "Autotune": "autotune",
+        "Avg": "avg",
+        "AwsManagedHumanLoopRequestSource": "aws_managed_human_loop_request_source",
+        "BacktestResults": "backtest_results",
+        "BaseImage": "base_image",
+        "BaseModelName": "base_model_name",
+        "BaselineConfig": "baseline_config",
+        "BaselineUsedForDriftCheckConstraints": "baseline_used_for_drift_check_constraints",
+        "BaselineUsedForDriftCheckStatistics": "baseline_used_for_drift_check_statistics",
+        "BaseliningJobName": "baselining_job_name",
+        "BatchDescribeModelPackageErrorMap": "batch_describe_model_package_error_map",
+        "BatchStrategy": "batch_strategy",
+        "BatchTransformInput": "batch_transform_input",
+        "BestCandidate": "best_candidate",
+        "BestObjectiveNotImproving": "best_objective_not_improving",
+        "BestTrainingJob": "best_training_job",
+        "Bias": "bias",
+        "BillableTimeInSeconds": "billable_time_in_seconds",
+        "BlockedReason": "blocked_reason",
+        "BlueGreenUpdatePolicy": "blue_green_update_policy",
+        "Body": "body",
+        "Branch": "branch",
+        "Bucket": "bucket",
+        "Bytes": "bytes",
+        "CacheHitResult": "cache_hit_result",
+        "CalculatedBaselineConstraints": "calculated_baseline_constraints",
+        "CalculatedBaselineStatistics": "calculated_baseline_statistics",
+        "Callback": "callback",
+        "CallbackToken": "callback_token",
+        "CanarySize": "canary_size",
+        "CandidateArtifactLocations": "candidate_artifact_locations",
+        "CandidateDefinitionNotebookLocation": "candidate_definition_notebook_location",
+        "CandidateGenerationConfig": "candidate_generation_config",
+        "CandidateMetrics": "candidate_metrics",
+        "CandidateName": "candidate_name",
+        "CandidateNameEquals": "candidate_name_equals",
+        "CandidateProperties": "candidate_properties",
+        "CandidateStatus": "candidate_status",
+        "CandidateStepArn": "candidate_step_arn",
+        "CandidateStepName": "candidate_step_name",
+        "CandidateStepType": "candidate_step_type",
+        "CandidateSteps": "candidate_steps",
+        "Candidates": "candidates",
+        "CanvasAppSettings": "canvas_app_settings",
+        "CaptureContentTypeHeader": "capture_content_type_header",
+        "CaptureMode": "capture_mode",
+        "CaptureOptions": "capture_options",
+        "CaptureStatus": "capture_status",
+        "Catalog": "catalog",
+        "CategoricalParameterRangeSpecification": "categorical_parameter_range_specification",
+        "CategoricalParameterRanges": "categorical_parameter_ranges",
+        "Cents": "cents",
+        "CertifyForMarketplace": "certify_for_marketplace",
+        "ChannelName": "channel_name",
+        "ChannelType": "channel_type",
+        "CheckJobArn": "check_job_arn",
+        "CheckType": "check_type",
+        "CheckpointConfig": "checkpoint_config",
+        "Cidrs": "cidrs",
+        "ClarifyCheck": "clarify_check",
+        "ClarifyExplainerConfig": "clarify_explainer_config",
+        "ClientConfig": "client_config",
+        "ClientId": "client_id",
+        "ClientRequestToken": "client_request_token",
+        "ClientSecret": "client_secret",
+        "ClientToken": "client_token",
+        "ClusterArn": "cluster_arn",
+        "ClusterConfig": "cluster_config",
+        "ClusterId": "cluster_id",
+        "ClusterName": "cluster_name",
+        "ClusterNodeSummaries": "cluster_node_summaries",
+        "ClusterRoleArn": "cluster_role_arn",
+        "ClusterStatus": "cluster_status",
+        "ClusterSummaries": "cluster_summaries",
+        "Code": "code",
+        "CodeEditorAppSettings": "code_editor_app_settings",
+        "CodeRepositories": "code_repositories",
+        "CodeRepositoryArn": "code_repository_arn",
+        "CodeRepositoryName": "code_repository_name",
+        "CodeRepositorySummaryList": "code_repository_summary_list",
+        "CognitoConfig": "cognito_config",
+        "CognitoMemberDefinition": "cognito_member_definition",
+        "CollectionConfig": "collection_config",
+        "CollectionConfigurations": "collection_configurations",
+        "CollectionName": "collection_name",
+        "CollectionParameters": "collection_parameters",
+        "CollectionType": "collection_type",
+        "CommitId": "commit_id",
+        "CompilationEndTime": "compilation_end_time",
+        "CompilationJobArn": "compilation_job_arn",
+        "CompilationJobName": "compilation_job_name",
+        "CompilationJobStatus": "compilation_job_status",
+        "CompilationJobSummaries": "compilation_job_summaries",
+        "CompilationStartTime": "compilation_start_time",
+        "CompilationTargetDevice": "compilation_target_device",
+        "CompilationTargetPlatformAccelerator": "compilation_target_platform_accelerator",
+        "CompilationTargetPlatformArch": "compilation_target_platform_arch",
+        "CompilationTargetPlatformOs": "compilation_target_platform_os",
+        "CompiledOutputConfig": "compiled_output_config",
+        "CompilerOptions": "compiler_options",
+        "CompleteOnConvergence": "complete_on_convergence",
+        "Completed": "completed",
+        "CompletionCriteria": "completion_criteria",
+        "CompletionTime": "completion_time",
+        "CompressionType": "compression_type",
+        "ComputeResourceRequirements": "compute_resource_requirements",
+        "Condition": "condition",
+        "ConfigFile": "config_file",
+        "ConfigUri": "config_uri",
+        "ConnectedDeviceCount": "connected_device_count",
+        "Constraints": "constraints",
+        "ConstraintsResource": "constraints_resource",
+        "ConsumedResources": "consumed_resources",
+        "Container": "container",
+        "ContainerArguments": "container_arguments",
+        "ContainerConfig": "container_config",
+        "ContainerEntrypoint": "container_entrypoint",
+        "ContainerEnvironmentVariables": "container_environment_variables",
+        "ContainerHostname": "container_hostname",
+        "ContainerImage": "container_image",
+        "ContainerStartupHealthCheckTimeoutInSeconds": "container_startup_health_check_timeout_in_seconds",
+        "Containers": "containers",
+        "Content": "content",
+        "ContentClassifiers": "content_classifiers",
+        "ContentColumn": "content_column",
+        "ContentDigest": "content_digest",
+        "ContentSha256": "content_sha256",
+        "ContentTemplate": "content_template",
+        "ContentType": "content_type",
+        "ContextArn": "context_arn",
+        "ContextName": "context_name",
+        "ContextSummaries": "context_summaries",
+        "ContextType": "context_type",
+        "ContinuousParameterRangeSpecification": "continuous_parameter_range_specification",
+        "ContinuousParameterRanges": "continuous_parameter_ranges",
+        "ConvergenceDetected": "convergence_detected",
+        "ConvergenceDetectedTime": "convergence_detected_time",
+        "CopyCount": "copy_count",
+        "CoreDumpConfig": "core_dump_config",
+        "CostPerHour": "cost_per_hour",
+        "CostPerInference": "cost_per_inference",
+        "Count": "count",
+        "CountryCode": "country_code",
+        "CpuUtilization": "cpu_utilization",
+        "CreateDate": "create_date",
+        "CreatedAfter": "created_after",
+        "CreatedAt": "created_at",
+        "CreatedBefore": "created_before",
+        "CreatedBy": "created_by",
+        "CreationTime": "creation_time",
+        "CreationTimeAfter": "creation_time_after",
+        "CreationTimeBefore": "creation_time_before",
+        "CrossAccountFilterOption": "cross_account_filter_option",
+        "CrossAccountModelRegisterRoleArn": "cross_account_model_register_role_arn",
+        "Csv": "csv",
+        "CsvContentTypes": "csv_content_types",
+        "CurrentCopyCount": "current_copy_count",
+        "CurrentCount": "current_count",
+        "CurrentInstanceCount": "current_instance_count",
+        "CurrentSamplingPercentage": "current_sampling_percentage",
+        "CurrentServerlessConfig": "current_serverless_config",
+        "CurrentWeight": "current_weight",
+        "CustomAttributes": "custom_attributes",
+        "CustomFileSystemConfigs": "custom_file_system_configs",
+        "CustomFileSystems": "custom_file_systems",
+        "CustomImages": "custom_images",
+        "CustomPosixUserConfig": "custom_posix_user_config",
+        "CustomerMetadataProperties": "customer_metadata_properties",
+        "CustomerMetadataPropertiesToRemove": "customer_metadata_properties_to_remove",
+        "Customized": "customized",
+        "DataAnalysisEndTime": "data_analysis_end_time",
+        "DataAnalysisStartTime": "data_analysis_start_time",
+        "DataAttributes": "data_attributes",
+        "DataCaptureConfig": "data_capture_config",
+        "DataCapturedDestinationS3Uri": "data_captured_destination_s3_uri",
+        "DataCatalogConfig": "data_catalog_config",
+        "DataDistributionType": "data_distribution_type",
+        "DataExplorationNotebookLocation": "data_exploration_notebook_location",
+        "DataInputConfig": "data_input_config",
+        "DataProcessing": "data_processing",
+        "DataQualityAppSpecification": "data_quality_app_specification",
+        "DataQualityBaselineConfig": "data_quality_baseline_config",
+        "DataQualityJobInput": "data_quality_job_input",
+        "DataQualityJobOutputConfig": "data_quality_job_output_config",
+        "DataSource": "data_source",
+        "DataSourceName": "data_source_name",
+        "DataSplitConfig": "data_split_config",
+        "DataStorageConfig": "data_storage_config",
+        "Database": "database",
+        "DatapointsToAlert": "datapoints_to_alert",
+        "DatasetDefinition": "dataset_definition",
+        "DatasetFormat": "dataset_format",
+        "DbUser": "db_user",
+        "DebugHookConfig": "debug_hook_config",
+        "DebugRuleConfigurations": "debug_rule_configurations",
+        "DebugRuleEvaluationStatuses": "debug_rule_evaluation_statuses",
+        "DefaultCodeRepository": "default_code_repository",
+        "DefaultCodeRepositoryContains": "default_code_repository_contains",
+        "DefaultEbsStorageSettings": "default_ebs_storage_settings",
+        "DefaultEbsVolumeSizeInGb": "default_ebs_volume_size_in_gb",
+        "DefaultGid": "default_gid",
+        "DefaultLandingUri": "default_landing_uri",
+        "DefaultResourceSpec": "default_resource_spec",
+        "DefaultSpaceSettings": "default_space_settings",
+        "DefaultUid": "default_uid",
+        "DefaultUserSettings": "default_user_settings",
+        "DefaultValue": "default_value",
+        "DefinitionName": "definition_name",
+        "DeleteProperties": "delete_properties",
+        "DependencyCopyPath": "dependency_copy_path",
+        "DependencyOriginPath": "dependency_origin_path",
+        "DeployedImage": "deployed_image",
+        "DeployedImages": "deployed_images",
+        "DeployedStageName": "deployed_stage_name",
+        "DeploymentConfig": "deployment_config",
+        "DeploymentRecommendation": "deployment_recommendation",
+        "DeploymentStartTime": "deployment_start_time",
+        "DeploymentStatus": "deployment_status",
+        "DerivedDataInputConfig": "derived_data_input_config",
+        "DerivedInformation": "derived_information",
+        "Description": "description",
+        "DesiredCopyCount": "desired_copy_count",
+        "DesiredInstanceCount": "desired_instance_count",
+        "DesiredModelVariants": "desired_model_variants",
+        "DesiredRuntimeConfig": "desired_runtime_config",
+        "DesiredServerlessConfig": "desired_serverless_config",
+        "DesiredState": "desired_state",
+        "DesiredWeight": "desired_weight",
+        "DesiredWeightsAndCapacities": "desired_weights_and_capacities",
+        "Destination": "destination",
+        "DestinationArn": "destination_arn",
+        "DestinationName": "destination_name",
+        "DestinationS3Uri": "destination_s3_uri",
+        "DestinationType": "destination_type",
+        "DeviceArn": "device_arn",
+        "DeviceDeploymentStatus": "device_deployment_status",
+        "DeviceDeploymentStatusMessage": "device_deployment_status_message",
+        "DeviceDeploymentSummaries": "device_deployment_summaries",
+        "DeviceFleetArn": "device_fleet_arn",
+        "DeviceFleetName": "device_fleet_name",
+        "DeviceFleetNameContains": "device_fleet_name_contains",
+        "DeviceFleetSummaries": "device_fleet_summaries",
+        "DeviceName": "device_name",
+        "DeviceNameContains": "device_name_contains",
+        "DeviceNames": "device_names",
+        "DeviceSelectionConfig": "device_selection_config",
+        "DeviceStats": "device_stats",
+        "DeviceSubsetType": "device_subset_type",
+        "DeviceSummaries": "device_summaries",
+        "Devices": "devices",
+        "Dimension": "dimension",
+        "DirectDeploySettings": "direct_deploy_settings",
+        "DirectInternetAccess": "direct_internet_access",
+        "Direction": "direction",
+        "DirectoryPath": "directory_path",
+        "DisableGlueTableCreation": "disable_glue_table_creation",
+        "DisableProfiler": "disable_profiler",
+        "DisassociateAcceleratorTypes": "disassociate_accelerator_types",
+        "DisassociateAdditionalCodeRepositories": "disassociate_additional_code_repositories",
+        "DisassociateDefaultCodeRepository": "disassociate_default_code_repository",
+        "DisassociateLifecycleConfig": "disassociate_lifecycle_config",
+        "DisplayName": "display_name",
+        "DockerSettings": "docker_settings",
+        "DocumentSchemaVersion": "document_schema_version",
+        "Dollars": "dollars",
+        "Domain": "domain",
+        "DomainArn": "domain_arn",
+        "DomainExecutionRoleArn": "domain_execution_role_arn",
+        "DomainId": "domain_id",
+        "DomainIdEquals": "domain_id_equals",
+        "DomainName": "domain_name",
+        "DomainSettings": "domain_settings",
+        "DomainSettingsForUpdate": "domain_settings_for_update",
+        "Domains": "domains",
+        "DriftCheckBaselines": "drift_check_baselines",
+        "DurationInSeconds": "duration_in_seconds",
+        "DynamicScalingConfiguration": "dynamic_scaling_configuration",
+        "EFSFileSystem": "e_f_s_file_system",
+        "EFSFileSystemConfig": "e_f_s_file_system_config",
+        "EMR": "e_m_r",
+        "EbsStorageSettings": "ebs_storage_settings",
+        "EbsVolumeSizeInGb": "ebs_volume_size_in_gb",
+        "EdgeDeploymentFailed": "edge_deployment_failed",
+        "EdgeDeploymentFailedInStage": "edge_deployment_failed_in_stage",
+        "EdgeDeploymentPending": "edge_deployment_pending",
+        "EdgeDeploymentPendingInStage": "edge_deployment_pending_in_stage",
+        "EdgeDeploymentPlanArn": "edge_deployment_plan_arn",
+        "EdgeDeploymentPlanName": "edge_deployment_plan_name",
+        "EdgeDeploymentPlanSummaries": "edge_deployment_plan_summaries",
+        "EdgeDeploymentStageStartTime": "edge_deployment_stage_start_time",
+        "EdgeDeploymentStatusMessage": "edge_deployment_status_message",
+        "EdgeDeploymentSuccess": "edge_deployment_success",
+        "EdgeDeploymentSuccessInStage": "edge_deployment_success_in_stage",
+        "EdgePackagingJobArn": "edge_packaging_job_arn",
+        "EdgePackagingJobName": "edge_packaging_job_name",
+        "EdgePackagingJobStatus": "edge_packaging_job_status",
+        "EdgePackagingJobStatusMessage": "edge_packaging_job_status_message",
+        "EdgePackagingJobSummaries": "edge_packaging_job_summaries",
+        "Edges": "edges",
+        "EnableCapture": "enable_capture",
+        "EnableDockerAccess": "enable_docker_access",
+        "EnableExplanations": "enable_explanations",
+        "EnableInfraCheck": "enable_infra_check",
+        "EnableInterContainerTrafficEncryption": "enable_inter_container_traffic_encryption",
+        "EnableIotRoleAlias": "enable_iot_role_alias",
+        "EnableManagedSpotTraining": "enable_managed_spot_training",
+        "EnableNetworkIsolation": "enable_network_isolation",
+        "EnableOnlineStore": "enable_online_store",
+        "EnableRemoteDebug": "enable_remote_debug",
+        "EnableSSMAccess": "enable_s_s_m_access",
+        "EnableSageMakerMetricsTimeSeries": "enable_sage_maker_metrics_time_series",
+        "Enabled": "enabled",
+        "EndTime": "end_time",
+        "EndTimeOffset": "end_time_offset",
+        "Endpoint": "endpoint",
+        "EndpointArn": "endpoint_arn",
+        "EndpointConfigArn": "endpoint_config_arn",
+        "EndpointConfigName": "endpoint_config_name",
+        "EndpointConfigs": "endpoint_configs",
+        "EndpointConfiguration": "endpoint_configuration",
+        "EndpointConfigurations": "endpoint_configurations",
+        "EndpointInfo": "endpoint_info",
+        "EndpointInput": "endpoint_input",
+        "EndpointMetadata": "endpoint_metadata",
+        "EndpointMetrics": "endpoint_metrics",
+        "EndpointName": "endpoint_name",
+        "EndpointNameEquals": "endpoint_name_equals",
+        "EndpointPerformances": "endpoint_performances",
+        "EndpointStatus": "endpoint_status",
+        "Endpoints": "endpoints",
+        "Environment": "environment",
+        "EnvironmentParameterRanges": "environment_parameter_ranges",
+        "EnvironmentParameters": "environment_parameters",
+        "ErrorCode": "error_code",
+        "ErrorMessage": "error_message",
+        "ErrorResponse": "error_response",
+        "ErrorTopic": "error_topic",
+        "Errors": "errors",
+        "EvaluationPeriod": "evaluation_period",
+        "EventTimeFeatureName": "event_time_feature_name",
+        "ExcludeDevicesDeployedInOtherStage": "exclude_devices_deployed_in_other_stage",
+        "ExcludeFeaturesAttribute": "exclude_features_attribute",
+        "ExcludeRetainedVariantProperties": "exclude_retained_variant_properties",
+        "ExecutionRole": "execution_role",
+        "ExecutionRoleArn": "execution_role_arn",
+        "ExecutionRoleIdentityConfig": "execution_role_identity_config",
+        "ExitMessage": "exit_message",
+        "Experiment": "experiment",
+        "ExperimentArn": "experiment_arn",
+        "ExperimentConfig": "experiment_config",
+        "ExperimentName": "experiment_name",
+        "ExperimentSource": "experiment_source",
+        "ExperimentSummaries": "experiment_summaries",
+        "ExpiresInSeconds": "expires_in_seconds",
+        "Explainability": "explainability",
+        "ExplainerConfig": "explainer_config",
+        "ExportArtifacts": "export_artifacts",
+        "Fail": "fail",
+        "Failed": "failed",
+        "FailedNonRetryableError": "failed_non_retryable_error",
+        "FailureHandlingPolicy": "failure_handling_policy",
+        "FailureLocation": "failure_location",
+        "FailureMessage": "failure_message",
+        "FailureReason": "failure_reason",
+        "FeatureAdditions": "feature_additions",
+        "FeatureDefinitions": "feature_definitions",
+        "FeatureGroup": "feature_group",
+        "FeatureGroupArn": "feature_group_arn",
+        "FeatureGroupName": "feature_group_name",
+        "FeatureGroupStatus": "feature_group_status",
+        "FeatureGroupStatusEquals": "feature_group_status_equals",
+        "FeatureGroupSummaries": "feature_group_summaries",
+        "FeatureHeaders": "feature_headers",
+        "FeatureMetadata": "feature_metadata",
+        "FeatureName": "feature_name",
+        "FeatureSpecificationS3Uri": "feature_specification_s3_uri",
+        "FeatureStoreOutput": "feature_store_output",
+        "FeatureType": "feature_type",
+        "FeatureTypes": "feature_types",
+        "FeaturesAttribute": "features_attribute",
+        "FileSystemAccessMode": "file_system_access_mode",
+        "FileSystemConfig": "file_system_config",
+        "FileSystemDataSource": "file_system_data_source",
+        "FileSystemId": "file_system_id",
+        "FileSystemPath": "file_system_path",
+        "FileSystemType": "file_system_type",
+        "Filling": "filling",
+        "Filters": "filters",
+        "FinalActiveLearningModelArn": "final_active_learning_model_arn",
+        "FinalAutoMLJobObjectiveMetric": "final_auto_m_l_job_objective_metric",
+        "FinalHyperParameterTuningJobObjectiveMetric": "final_hyper_parameter_tuning_job_objective_metric",
+        "FinalMetricDataList": "final_metric_data_list",
+        "FlatInvocations": "flat_invocations",
+        "FlowDefinitionArn": "flow_definition_arn",
+        "FlowDefinitionName": "flow_definition_name",
+        "FlowDefinitionStatus": "flow_definition_status",
+        "FlowDefinitionSummaries": "flow_definition_summaries",
+        "ForecastFrequency": "forecast_frequency",
+        "ForecastHorizon": "forecast_horizon",
+        "ForecastQuantiles": "forecast_quantiles",
+        "Framework": "framework",
+        "FrameworkVersion": "framework_version",
+        "GenerateCandidateDefinitionsOnly": "generate_candidate_definitions_only",
+        "GenerateInferenceId": "generate_inference_id",
+        "GeneratedBy": "generated_by",
+        "GenerativeAiSettings": "generative_ai_settings",
+        "Gid": "gid",
+        "GitConfig": "git_config",
+        "Granularity": "granularity",
+        "GroundTruthS3Input": "ground_truth_s3_input",
+        "GroupingAttributeNames": "grouping_attribute_names",
+        "Groups": "groups",
+        "Header": "header",
+        "HolidayConfig": "holiday_config",
+        "HomeEfsFileSystem": "home_efs_file_system",
+        "HomeEfsFileSystemId": "home_efs_file_system_id",
+        "HomeEfsFileSystemKmsKeyId": "home_efs_file_system_kms_key_id",
+        "HomeEfsFileSystemUid": "home_efs_file_system_uid",
+        "HookParameters": "hook_parameters",
+        "Horovod": "horovod",
+        "HubArn": "hub_arn",
+        "HubContentArn": "hub_content_arn",
+        "HubContentDependencies": "hub_content_dependencies",
+        "HubContentDescription": "hub_content_description",
+        "HubContentDisplayName": "hub_content_display_name",
+        "HubContentDocument": "hub_content_document",
+        "HubContentMarkdown": "hub_content_markdown",
+        "HubContentName": "hub_content_name",
+        "HubContentSearchKeywords": "hub_content_search_keywords",
+        "HubContentStatus": "hub_content_status",
+        "HubContentSummaries": "hub_content_summaries",
+        "HubContentType": "hub_content_type",
+        "HubContentVersion": "hub_content_version",
+        "HubDescription": "hub_description",
+        "HubDisplayName": "hub_display_name",
+        "HubName": "hub_name",
+        "HubSearchKeywords": "hub_search_keywords",
+        "HubStatus": "hub_status",
+        "HubSummaries": "hub_summaries",
+        "HumanLabeled": "human_labeled",
+        "HumanLoopActivationConditions": "human_loop_activation_conditions",
+        "HumanLoopActivationConditionsConfig": "human_loop_activation_conditions_config",
+        "HumanLoopActivationConfig": "human_loop_activation_config",
+        "HumanLoopConfig": "human_loop_config",
+        "HumanLoopRequestSource": "human_loop_request_source",
+        "HumanTaskConfig": "human_task_config",
+        "HumanTaskUiArn": "human_task_ui_arn",
+        "HumanTaskUiName": "human_task_ui_name",
+        "HumanTaskUiStatus": "human_task_ui_status",
+        "HumanTaskUiSummaries": "human_task_ui_summaries",
+        "HyperParameterRanges": "hyper_parameter_ranges",
+        "HyperParameterTuningEndTime": "hyper_parameter_tuning_end_time",
+        "HyperParameterTuningJob": "hyper_parameter_tuning_job",
+        "HyperParameterTuningJobArn": "hyper_parameter_tuning_job_arn",
+        "HyperParameterTuningJobConfig": "hyper_parameter_tuning_job_config",
+        "HyperParameterTuningJobName": "hyper_parameter_tuning_job_name",
+        "HyperParameterTuningJobObjective": "hyper_parameter_tuning_job_objective",
+        "HyperParameterTuningJobStatus": "hyper_parameter_tuning_job_status",
+        "HyperParameterTuningJobSummaries": "hyper_parameter_tuning_job_summaries",
+        "HyperParameterTuningResourceConfig": "hyper_parameter_tuning_resource_config",
+        "HyperParameters": "hyper_parameters",
+        "HyperbandStrategyConfig": "hyperband_strategy_config",
+        "IamIdentity": "iam_identity",
+        "IdentityProviderOAuthSettings": "identity_provider_o_auth_settings",
+        "Image": "image",
+        "ImageArn": "image_arn",
+        "ImageClassificationJobConfig": "image_classification_job_config",
+        "ImageConfig": "image_config",
+        "ImageDigest": "image_digest",
+        "ImageName": "image_name",
+        "ImageScanStatuses": "image_scan_statuses",
+        "ImageStatus": "image_status",
+        "ImageUri": "image_uri",
+        "ImageVersionArn": "image_version_arn",
+        "ImageVersionNumber": "image_version_number",
+        "ImageVersionStatus": "image_version_status",
+        "ImageVersions": "image_versions",
+        "Images": "images",
+        "InProgress": "in_progress",
+        "IncludeEdges": "include_edges",
+        "IncludeInferenceResponseIn": "include_inference_response_in",
+        "InferenceAttribute": "inference_attribute",
+        "InferenceBenchmark": "inference_benchmark",
+        "InferenceComponentArn": "inference_component_arn",
+        "InferenceComponentName": "inference_component_name",
+        "InferenceComponentStatus": "inference_component_status",
+        "InferenceComponents": "inference_components",
+        "InferenceConfig": "inference_config",
+        "InferenceContainerDefinitions": "inference_container_definitions",
+        "InferenceContainers": "inference_containers",
+        "InferenceExecutionConfig": "inference_execution_config",
+        "InferenceExperimentArn": "inference_experiment_arn",
+        "InferenceExperiments": "inference_experiments",
+        "InferenceId": "inference_id",
+        "InferenceImage": "inference_image",
+        "InferenceRecommendations": "inference_recommendations",
+        "InferenceRecommendationsJobName": "inference_recommendations_job_name",
+        "InferenceRecommendationsJobs": "inference_recommendations_jobs",
+        "InferenceSpecification": "inference_specification",
+        "InferenceSpecificationName": "inference_specification_name",
+        "InfraCheckConfig": "infra_check_config",
+        "InfrastructureConfig": "infrastructure_config",
+        "InfrastructureType": "infrastructure_type",
+        "InitialActiveLearningModelArn": "initial_active_learning_model_arn",
+        "InitialInstanceCount": "initial_instance_count",
+        "InitialNumberOfUsers": "initial_number_of_users",
+        "InitialSamplingPercentage": "initial_sampling_percentage",
+        "InitialVariantWeight": "initial_variant_weight",
+        "Input": "input",
+        "InputArtifacts": "input_artifacts",
+        "InputArtifactsToRemove": "input_artifacts_to_remove",
+        "InputConfig": "input_config",
+        "InputDataConfig": "input_data_config",
+        "InputFilter": "input_filter",
+        "InputLocation": "input_location",
+        "InputMode": "input_mode",
+        "InputName": "input_name",
+        "InstanceConfigs": "instance_configs",
+        "InstanceCount": "instance_count",
+        "InstanceGroupName": "instance_group_name",
+        "InstanceGroupNameContains": "instance_group_name_contains",
+        "InstanceGroupNames": "instance_group_names",
+        "InstanceGroups": "instance_groups",
+        "InstanceId": "instance_id",
+        "InstanceMetadataServiceConfiguration": "instance_metadata_service_configuration",
+        "InstanceStatus": "instance_status",
+        "InstanceType": "instance_type",
+        "IntegerParameterRangeSpecification": "integer_parameter_range_specification",
+        "IntegerParameterRanges": "integer_parameter_ranges",
+        "InternalStreamFailure": "internal_stream_failure",
+        "InvocationEndTime": "invocation_end_time",
+        "InvocationStartTime": "invocation_start_time",
+        "InvocationTimeoutSeconds": "invocation_timeout_seconds",
+        "InvocationsMaxRetries": "invocations_max_retries",
+        "InvocationsPerInstance": "invocations_per_instance",
+        "InvocationsTimeoutInSeconds": "invocations_timeout_in_seconds",
+        "InvokedProductionVariant": "invoked_production_variant",
+        "IotRoleAlias": "iot_role_alias",
+        "IotThingName": "iot_thing_name",
+        "IsRequired": "is_required",
+        "IsTunable": "is_tunable",
+        "Issuer": "issuer",
+        "ItemIdentifierAttributeName": "item_identifier_attribute_name",
+        "JobArn": "job_arn",
+        "JobDefinitionArn": "job_definition_arn",
+        "JobDefinitionName": "job_definition_name",
+        "JobDefinitionSummaries": "job_definition_summaries",
+        "JobDescription": "job_description",
+        "JobDurationInSeconds": "job_duration_in_seconds",
+        "JobName": "job_name",
+        "JobReferenceCode": "job_reference_code",
+        "JobReferenceCodeContains": "job_reference_code_contains",
+        "JobResources": "job_resources",
+        "JobType": "job_type",
+        "JoinSource": "join_source",
+        "Json": "json",
+        "JsonContentTypes": "json_content_types",
+        "JupyterLabAppImageConfig": "jupyter_lab_app_image_config",
+        "JupyterLabAppSettings": "jupyter_lab_app_settings",
+        "JupyterServerAppSettings": "jupyter_server_app_settings",
+        "JwksUri": "jwks_uri",
+        "KeepAlivePeriodInSeconds": "keep_alive_period_in_seconds",
+        "KendraSettings": "kendra_settings",
+        "KernelGatewayAppSettings": "kernel_gateway_app_settings",
+        "KernelGatewayImageConfig": "kernel_gateway_image_config",
+        "KernelSpecs": "kernel_specs",
+        "Key": "key",
+        "KmsKey": "kms_key",
+        "KmsKeyId": "kms_key_id",
+        "LabelAttribute": "label_attribute",
+        "LabelAttributeName": "label_attribute_name",
+        "LabelCategoryConfigS3Uri": "label_category_config_s3_uri",
+        "LabelCounters": "label_counters",
+        "LabelHeaders": "label_headers",
+        "LabelIndex": "label_index",
+        "LabelingJobAlgorithmSpecificationArn": "labeling_job_algorithm_specification_arn",
+        "LabelingJobAlgorithmsConfig": "labeling_job_algorithms_config",
+        "LabelingJobArn": "labeling_job_arn",
+        "LabelingJobName": "labeling_job_name",
+        "LabelingJobOutput": "labeling_job_output",
+        "LabelingJobResourceConfig": "labeling_job_resource_config",
+        "LabelingJobStatus": "labeling_job_status",
+        "LabelingJobSummaryList": "labeling_job_summary_list",
+        "Lambda": "lambda",
+        "LandingUri": "landing_uri",
+        "Language": "language",
+        "Last": "last",
+        "LastBatchTransformJob": "last_batch_transform_job",
+        "LastDeploymentConfig": "last_deployment_config",
+        "LastExecutionTime": "last_execution_time",
+        "LastHealthCheckTimestamp": "last_health_check_timestamp",
+        "LastModifiedAt": "last_modified_at",
+        "LastModifiedBy": "last_modified_by",
+        "LastModifiedTime": "last_modified_time",
+        "LastModifiedTimeAfter": "last_modified_time_after",
+        "LastModifiedTimeBefore": "last_modified_time_before",
+        "LastMonitoringExecutionSummary": "last_monitoring_execution_summary",
+        "LastRunTime": "last_run_time",
+        "LastUpdateStatus": "last_update_status",
+        "LastUpdatedDate": "last_updated_date",
+        "LastUserActivityTimestamp": "last_user_activity_timestamp",
+        "LatestHeartbeat": "latest_heartbeat",
+        "LatestHeartbeatAfter": "latest_heartbeat_after",
+        "LatestInference": "latest_inference",
+        "LatestSampleTime": "latest_sample_time",
+        "LaunchTime": "launch_time",
+        "LifeCycleConfig": "life_cycle_config",
+        "LifecycleConfigArn": "lifecycle_config_arn",
+        "LifecycleConfigArns": "lifecycle_config_arns",
+        "LifecycleConfigName": "lifecycle_config_name",
+        "Line": "line",
+        "LineageGroupArn": "lineage_group_arn",
+        "LineageGroupName": "lineage_group_name",
+        "LineageGroupSummaries": "lineage_group_summaries",
+        "LineageType": "lineage_type",
+        "LineageTypes": "lineage_types",
+        "LinearStepSize": "linear_step_size",
+        "ListingId": "listing_id",
+        "LocalPath": "local_path",
+        "LogFilePath": "log_file_path",
+        "LogStreamArn": "log_stream_arn",
+        "LogoutEndpoint": "logout_endpoint",
+        "MLFramework": "m_l_framework",
+        "MachineLabeled": "machine_labeled",
+        "ManagedInstanceScaling": "managed_instance_scaling",
+        "ManifestS3Uri": "manifest_s3_uri",
+        "MarketplaceDescription": "marketplace_description",
+        "MarketplaceTitle": "marketplace_title",
+        "Max": "max",
+        "MaxAutoMLJobRuntimeInSeconds": "max_auto_m_l_job_runtime_in_seconds",
+        "MaxCandidates": "max_candidates",
+        "MaxCapacity": "max_capacity",
+        "MaxConcurrency": "max_concurrency",
+        "MaxConcurrentInvocationsPerInstance": "max_concurrent_invocations_per_instance",
+        "MaxConcurrentTaskCount": "max_concurrent_task_count",
+        "MaxConcurrentTransforms": "max_concurrent_transforms",
+        "MaxDepth": "max_depth",
+        "MaxHumanLabeledObjectCount": "max_human_labeled_object_count",
+        "MaxInstanceCount": "max_instance_count",
+        "MaxInvocations": "max_invocations",
+        "MaxInvocationsPerMinute": "max_invocations_per_minute",
+        "MaxMemoryRequiredInMb": "max_memory_required_in_mb",
+        "MaxModels": "max_models",
+        "MaxNumberOfTests": "max_number_of_tests",
+        "MaxNumberOfTrainingJobs": "max_number_of_training_jobs",
+        "MaxNumberOfTrainingJobsNotImproving": "max_number_of_training_jobs_not_improving",
+        "MaxParallelExecutionSteps": "max_parallel_execution_steps",
+        "MaxParallelOfTests": "max_parallel_of_tests",
+        "MaxParallelTrainingJobs": "max_parallel_training_jobs",
+        "MaxPayloadInMB": "max_payload_in_m_b",
+        "MaxPendingTimeInSeconds": "max_pending_time_in_seconds",
+        "MaxPercentageOfInputDatasetLabeled": "max_percentage_of_input_dataset_labeled",
+        "MaxRecordCount": "max_record_count",
+        "MaxResource": "max_resource",
+        "MaxResults": "max_results",
+        "MaxRuntimeInSeconds": "max_runtime_in_seconds",
+        "MaxRuntimePerTrainingJobInSeconds": "max_runtime_per_training_job_in_seconds",
+        "MaxSchemaVersion": "max_schema_version",
+        "MaxValue": "max_value",
+        "MaxWaitTimeInSeconds": "max_wait_time_in_seconds",
+        "MaximumBatchSize": "maximum_batch_size",
+        "MaximumEbsVolumeSizeInGb": "maximum_ebs_volume_size_in_gb",
+        "MaximumExecutionTimeoutInSeconds": "maximum_execution_timeout_in_seconds",
+        "MaximumRetryAttempts": "maximum_retry_attempts",
+        "MediaType": "media_type",
+        "MemberDefinitions": "member_definitions",
+        "MemorySizeInMB": "memory_size_in_m_b",
+        "MemoryUtilization": "memory_utilization",
+        "Message": "message",
+        "Metadata": "metadata",
+        "MetadataProperties": "metadata_properties",
+        "Metric": "metric",
+        "MetricDefinitions": "metric_definitions",
+        "MetricName": "metric_name",
+        "MetricSpecification": "metric_specification",
+        "Metrics": "metrics",
+        "MimeType": "mime_type",
+        "Min": "min",
+        "MinCapacity": "min_capacity",
+        "MinInstanceCount": "min_instance_count",
+        "MinInvocationsPerMinute": "min_invocations_per_minute",
+        "MinMemoryRequiredInMb": "min_memory_required_in_mb",
+        "MinResource": "min_resource",
+        "MinValue": "min_value",
+        "MinVersion": "min_version",
+        "MinimumInstanceMetadataServiceVersion": "minimum_instance_metadata_service_version",
+        "Mode": "mode",
+        "Model": "model",
+        "ModelAccessConfig": "model_access_config",
+        "ModelApprovalStatus": "model_approval_status",
+        "ModelArn": "model_arn",
+        "ModelArtifact": "model_artifact",
+        "ModelArtifacts": "model_artifacts",
+        "ModelBiasAppSpecification": "model_bias_app_specification",
+        "ModelBiasBaselineConfig": "model_bias_baseline_config",
+        "ModelBiasJobInput": "model_bias_job_input",
+        "ModelBiasJobOutputConfig": "model_bias_job_output_config",
+        "ModelCacheSetting": "model_cache_setting",
+        "ModelCard": "model_card",
+        "ModelCardArn": "model_card_arn",
+        "ModelCardExportJobArn": "model_card_export_job_arn",
+        "ModelCardExportJobName": "model_card_export_job_name",
+        "ModelCardExportJobNameContains": "model_card_export_job_name_contains",
+        "ModelCardExportJobSummaries": "model_card_export_job_summaries",
+        "ModelCardName": "model_card_name",
+        "ModelCardProcessingStatus": "model_card_processing_status",
+        "ModelCardStatus": "model_card_status",
+        "ModelCardSummaries": "model_card_summaries",
+        "ModelCardVersion": "model_card_version",
+        "ModelCardVersionSummaryList": "model_card_version_summary_list",
+        "ModelClientConfig": "model_client_config",
+        "ModelConfigs": "model_configs",
+        "ModelConfiguration": "model_configuration",
+        "ModelDashboardIndicator": "model_dashboard_indicator",
+        "ModelDataDownloadTimeoutInSeconds": "model_data_download_timeout_in_seconds",
+        "ModelDataQuality": "model_data_quality",
+        "ModelDataSource": "model_data_source",
+        "ModelDataUrl": "model_data_url",
+        "ModelDeployConfig": "model_deploy_config",
+        "ModelDeployResult": "model_deploy_result",
+        "ModelDigests": "model_digests",
+        "ModelExplainabilityAppSpecification": "model_explainability_app_specification",
+        "ModelExplainabilityBaselineConfig": "model_explainability_baseline_config",
+        "ModelExplainabilityJobInput": "model_explainability_job_input",
+        "ModelExplainabilityJobOutputConfig": "model_explainability_job_output_config",
+        "ModelHandle": "model_handle",
+        "ModelId": "model_id",
+        "ModelInput": "model_input",
+        "ModelInsights": "model_insights",
+        "ModelLatency": "model_latency",
+        "ModelLatencyThresholds": "model_latency_thresholds",
+        "ModelMetadataSummaries": "model_metadata_summaries",
+        "ModelMetrics": "model_metrics",
+        "ModelName": "model_name",
+        "ModelNameContains": "model_name_contains",
+        "ModelNameEquals": "model_name_equals",
+        "ModelPackage": "model_package",
+        "ModelPackageArn": "model_package_arn",
+        "ModelPackageArnList": "model_package_arn_list",
+        "ModelPackageDescription": "model_package_description",
+        "ModelPackageGroup": "model_package_group",
+        "ModelPackageGroupArn": "model_package_group_arn",
+        "ModelPackageGroupDescription": "model_package_group_description",
+        "ModelPackageGroupName": "model_package_group_name",
+        "ModelPackageGroupStatus": "model_package_group_status",
+        "ModelPackageGroupSummaryList": "model_package_group_summary_list",
+        "ModelPackageName": "model_package_name",
+        "ModelPackageStatus": "model_package_status",
+        "ModelPackageStatusDetails": "model_package_status_details",
+        "ModelPackageSummaries": "model_package_summaries",
+        "ModelPackageSummaryList": "model_package_summary_list",
+        "ModelPackageType": "model_package_type",
+        "ModelPackageVersion": "model_package_version",
+        "ModelPackageVersionArn": "model_package_version_arn",
+        "ModelPackageVersionArnEquals": "model_package_version_arn_equals",
+        "ModelQuality": "model_quality",
+        "ModelQualityAppSpecification": "model_quality_app_specification",
+        "ModelQualityBaselineConfig": "model_quality_baseline_config",
+        "ModelQualityJobInput": "model_quality_job_input",
+        "ModelQualityJobOutputConfig": "model_quality_job_output_config",
+        "ModelRegisterSettings": "model_register_settings",
+        "ModelSetupTime": "model_setup_time",
+        "ModelSignature": "model_signature",
+        "ModelStats": "model_stats",
+        "ModelStreamError": "model_stream_error",
+        "ModelVariantActions": "model_variant_actions",
+        "ModelVariants": "model_variants",
+        "ModelVersion": "model_version",
+        "Models": "models",
+        "ModifiedAfter": "modified_after",
+        "ModifiedBefore": "modified_before",
+        "ModifiedTimeAfter": "modified_time_after",
+        "ModifiedTimeBefore": "modified_time_before",
+        "MonitoringAlertHistory": "monitoring_alert_history",
+        "MonitoringAlertName": "monitoring_alert_name",
+        "MonitoringAlertSummaries": "monitoring_alert_summaries",
+        "MonitoringAppSpecification": "monitoring_app_specification",
+        "MonitoringExecutionStatus": "monitoring_execution_status",
+        "MonitoringExecutionSummaries": "monitoring_execution_summaries",
+        "MonitoringInputs": "monitoring_inputs",
+        "MonitoringJobDefinition": "monitoring_job_definition",
+        "MonitoringJobDefinitionArn": "monitoring_job_definition_arn",
+        "MonitoringJobDefinitionName": "monitoring_job_definition_name",
+        "MonitoringOutputConfig": "monitoring_output_config",
+        "MonitoringOutputs": "monitoring_outputs",
+        "MonitoringResources": "monitoring_resources",
+        "MonitoringScheduleArn": "monitoring_schedule_arn",
+        "MonitoringScheduleConfig": "monitoring_schedule_config",
+        "MonitoringScheduleName": "monitoring_schedule_name",
+        "MonitoringScheduleStatus": "monitoring_schedule_status",
+        "MonitoringScheduleSummaries": "monitoring_schedule_summaries",
+        "MonitoringSchedules": "monitoring_schedules",
+        "MonitoringType": "monitoring_type",
+        "MonitoringTypeEquals": "monitoring_type_equals",
+        "MountPath": "mount_path",
+        "MultiModelConfig": "multi_model_config",
+        "Name": "name",
+        "NameContains": "name_contains",
+        "Namespace": "namespace",
+        "NearestModelName": "nearest_model_name",
+        "NestedFilters": "nested_filters",
+        "NestedPropertyName": "nested_property_name",
+        "NetworkConfig": "network_config",
+        "NetworkInterfaceId": "network_interface_id",
+        "NextToken": "next_token",
+        "NodeDetails": "node_details",
+        "NodeId": "node_id",
+        "NonRetryableError": "non_retryable_error",
+        "NotebookInstanceArn": "notebook_instance_arn",
+        "NotebookInstanceLifecycleConfigArn": "notebook_instance_lifecycle_config_arn",
+        "NotebookInstanceLifecycleConfigName": "notebook_instance_lifecycle_config_name",
+        "NotebookInstanceLifecycleConfigNameContains": "notebook_instance_lifecycle_config_name_contains",
+        "NotebookInstanceLifecycleConfigs": "notebook_instance_lifecycle_configs",
+        "NotebookInstanceName": "notebook_instance_name",
+        "NotebookInstanceStatus": "notebook_instance_status",
+        "NotebookInstances": "notebook_instances",
+        "NotebookOutputOption": "notebook_output_option",
+        "NotificationConfig": "notification_config",
+        "NotificationConfiguration": "notification_configuration",
+        "NotificationTopicArn": "notification_topic_arn",
+        "NumberOfAcceleratorDevicesRequired": "number_of_accelerator_devices_required",
+        "NumberOfCpuCoresRequired": "number_of_cpu_cores_required",
+        "NumberOfHumanWorkersPerDataObject": "number_of_human_workers_per_data_object",
+        "NumberOfSamples": "number_of_samples",
+        "NumberOfSteps": "number_of_steps",
+        "NumberOfTrainingJobsObjectiveNotImproving": "number_of_training_jobs_objective_not_improving",
+        "NumberValue": "number_value",
+        "ObjectKey": "object_key",
+        "ObjectiveStatus": "objective_status",
+        "ObjectiveStatusCounters": "objective_status_counters",
+        "OfflineDeviceCount": "offline_device_count",
+        "OfflineStoreConfig": "offline_store_config",
+        "OfflineStoreStatus": "offline_store_status",
+        "OfflineStoreStatusEquals": "offline_store_status_equals",
+        "OidcConfig": "oidc_config",
+        "OidcMemberDefinition": "oidc_member_definition",
+        "OnCreate": "on_create",
+        "OnStart": "on_start",
+        "OnlineStoreConfig": "online_store_config",
+        "OnlineStoreTotalSizeBytes": "online_store_total_size_bytes",
+        "Operator": "operator",
+        "OriginalMessage": "original_message",
+        "OriginalStatusCode": "original_status_code",
+        "Os": "os",
+        "Outcome": "outcome",
+        "OutputArtifacts": "output_artifacts",
+        "OutputArtifactsToRemove": "output_artifacts_to_remove",
+        "OutputCompression": "output_compression",
+        "OutputConfig": "output_config",
+        "OutputDataConfig": "output_data_config",
+        "OutputDatasetS3Uri": "output_dataset_s3_uri",
+        "OutputFilter": "output_filter",
+        "OutputFormat": "output_format",
+        "OutputLocation": "output_location",
+        "OutputName": "output_name",
+        "OutputParameters": "output_parameters",
+        "OutputS3Uri": "output_s3_uri",
+        "Outputs": "outputs",
+        "OverallBestTrainingJob": "overall_best_training_job",
+        "OwnerUserProfileName": "owner_user_profile_name",
+        "OwnershipSettings": "ownership_settings",
+        "OwnershipSettingsSummary": "ownership_settings_summary",
+        "ParallelismConfiguration": "parallelism_configuration",
+        "ParameterAdditions": "parameter_additions",
+        "ParameterRanges": "parameter_ranges",
+        "ParameterRemovals": "parameter_removals",
+        "Parameters": "parameters",
+        "ParametersToRemove": "parameters_to_remove",
+        "ParentHyperParameterTuningJobs": "parent_hyper_parameter_tuning_jobs",
+        "Parents": "parents",
+        "Parquet": "parquet",
+        "PartialFailureMessage": "partial_failure_message",
+        "PartialFailureReasons": "partial_failure_reasons",
+        "PathId": "path_id",
+        "PayloadConfig": "payload_config",
+        "PayloadPart": "payload_part",
+        "Pending": "pending",
+        "PendingDeploymentSummary": "pending_deployment_summary",
+        "PendingHuman": "pending_human",
+        "Percentage": "percentage",
+        "Percentile": "percentile",
+        "Phases": "phases",
+        "Pipeline": "pipeline",
+        "PipelineArn": "pipeline_arn",
+        "PipelineDefinition": "pipeline_definition",
+        "PipelineDefinitionS3Location": "pipeline_definition_s3_location",
+        "PipelineDescription": "pipeline_description",
+        "PipelineDisplayName": "pipeline_display_name",
+        "PipelineExecution": "pipeline_execution",
+        "PipelineExecutionArn": "pipeline_execution_arn",
+        "PipelineExecutionDescription": "pipeline_execution_description",
+        "PipelineExecutionDisplayName": "pipeline_execution_display_name",
+        "PipelineExecutionFailureReason": "pipeline_execution_failure_reason",
+        "PipelineExecutionStatus": "pipeline_execution_status",
+        "PipelineExecutionSteps": "pipeline_execution_steps",
+        "PipelineExecutionSummaries": "pipeline_execution_summaries",
+        "PipelineExperimentConfig": "pipeline_experiment_config",
+        "PipelineName": "pipeline_name",
+        "PipelineNamePrefix": "pipeline_name_prefix",
+        "PipelineParameters": "pipeline_parameters",
+        "PipelineStatus": "pipeline_status",
+        "PipelineSummaries": "pipeline_summaries",
+        "PlatformIdentifier": "platform_identifier",
+        "PostAnalyticsProcessorSourceUri": "post_analytics_processor_source_uri",
+        "PostTrainingConstraints": "post_training_constraints",
+        "PostTrainingReport": "post_training_report",
+        "PreHumanTaskLambdaArn": "pre_human_task_lambda_arn",
+        "PreTrainingConstraints": "pre_training_constraints",
+        "PreTrainingReport": "pre_training_report",
+        "Predefined": "predefined",
+        "PredefinedMetricType": "predefined_metric_type",
+        "PresetDeploymentConfig": "preset_deployment_config",
+        "PresetDeploymentOutput": "preset_deployment_output",
+        "PresetDeploymentType": "preset_deployment_type",
+        "PrimaryContainer": "primary_container",
+        "PrimaryStatus": "primary_status",
+        "PrincipalId": "principal_id",
+        "ProbabilityAttribute": "probability_attribute",
+        "ProbabilityIndex": "probability_index",
+        "ProbabilityThresholdAttribute": "probability_threshold_attribute",
+        "ProblemType": "problem_type",
+        "ProcessingEndTime": "processing_end_time",
+        "ProcessingInputs": "processing_inputs",
+        "ProcessingJob": "processing_job",
+        "ProcessingJobArn": "processing_job_arn",
+        "ProcessingJobName": "processing_job_name",
+        "ProcessingJobStatus": "processing_job_status",
+        "ProcessingJobSummaries": "processing_job_summaries",
+        "ProcessingOutputConfig": "processing_output_config",
+        "ProcessingResources": "processing_resources",
+        "ProcessingStartTime": "processing_start_time",
+        "Processor": "processor",
+        "ProductId": "product_id",
+        "ProductListingIds": "product_listing_ids",
+        "ProductionVariants": "production_variants",
+        "ProfileName": "profile_name",
+        "ProfilerConfig": "profiler_config",
+        "ProfilerRuleConfigurations": "profiler_rule_configurations",
+        "ProfilerRuleEvaluationStatuses": "profiler_rule_evaluation_statuses",
+        "ProfilingIntervalInMilliseconds": "profiling_interval_in_milliseconds",
+        "ProfilingParameters": "profiling_parameters",
+        "ProfilingStatus": "profiling_status",
+        "ProgrammingLang": "programming_lang",
+        "Project": "project",
+        "ProjectArn": "project_arn",
+        "ProjectDescription": "project_description",
+        "ProjectId": "project_id",
+        "ProjectName": "project_name",
+        "ProjectStatus": "project_status",
+        "ProjectSummaryList": "project_summary_list",
+        "Properties": "properties",
+        "PropertiesToRemove": "properties_to_remove",
+        "PropertyName": "property_name",
+        "PropertyNameHint": "property_name_hint",
+        "PropertyNameQuery": "property_name_query",
+        "PropertyNameSuggestions": "property_name_suggestions",
+        "ProvisionedConcurrency": "provisioned_concurrency",
+        "ProvisionedProductId": "provisioned_product_id",
+        "ProvisionedProductStatusMessage": "provisioned_product_status_message",
+        "ProvisionedReadCapacityUnits": "provisioned_read_capacity_units",
+        "ProvisionedWriteCapacityUnits": "provisioned_write_capacity_units",
+        "ProvisioningArtifactId": "provisioning_artifact_id",
+        "ProvisioningParameters": "provisioning_parameters",
+        "PublicWorkforceTaskPrice": "public_workforce_task_price",
+        "QualityCheck": "quality_check",
+        "QueryString": "query_string",
+        "RSessionAppSettings": "r_session_app_settings",
+        "RStudioConnectUrl": "r_studio_connect_url",
+        "RStudioPackageManagerUrl": "r_studio_package_manager_url",
+        "RStudioServerProAppSettings": "r_studio_server_pro_app_settings",
+        "RStudioServerProDomainSettings": "r_studio_server_pro_domain_settings",
+        "RStudioServerProDomainSettingsForUpdate": "r_studio_server_pro_domain_settings_for_update",
+        "RandomSeed": "random_seed",
+        "Range": "range",
+        "RealTimeInferenceConfig": "real_time_inference_config",
+        "RealTimeInferenceRecommendations": "real_time_inference_recommendations",
+        "Reason": "reason",
+        "RecommendationId": "recommendation_id",
+        "RecommendationStatus": "recommendation_status",
+        "RecordIdentifierFeatureName": "record_identifier_feature_name",
+        "RecordPreprocessorSourceUri": "record_preprocessor_source_uri",
+        "RecordWrapperType": "record_wrapper_type",
+        "RedshiftDatasetDefinition": "redshift_dataset_definition",
+        "Regex": "regex",
+        "RegisterModel": "register_model",
+        "RegisterNewBaseline": "register_new_baseline",
+        "RegisteredDeviceCount": "registered_device_count",
+        "RegistrationTime": "registration_time",
+        "ReleaseNotes": "release_notes",
+        "RemoteDebugConfig": "remote_debug_config",
+        "RenderedContent": "rendered_content",
+        "Report": "report",
+        "ReportGenerated": "report_generated",
+        "Repository": "repository",
+        "RepositoryAccessMode": "repository_access_mode",
+        "RepositoryAuthConfig": "repository_auth_config",
+        "RepositoryCredentialsProviderArn": "repository_credentials_provider_arn",
+        "RepositoryUrl": "repository_url",
+        "RequestTTLSeconds": "request_t_t_l_seconds",
+        "ResolutionTime": "resolution_time",
+        "ResolvedAttributes": "resolved_attributes",
+        "ResolvedImage": "resolved_image",
+        "ResolvedOutputS3Uri": "resolved_output_s3_uri",
+        "Resource": "resource",
+        "ResourceArn": "resource_arn",
+        "ResourceCatalogArn": "resource_catalog_arn",
+        "ResourceCatalogName": "resource_catalog_name",
+        "ResourceCatalogs": "resource_catalogs",
+        "ResourceConfig": "resource_config",
+        "ResourceKey": "resource_key",
+        "ResourceLimit": "resource_limit",
+        "ResourceLimits": "resource_limits",
+        "ResourcePolicy": "resource_policy",
+        "ResourceRetainedBillableTimeInSeconds": "resource_retained_billable_time_in_seconds",
+        "ResourceSpec": "resource_spec",
+        "Results": "results",
+        "RetainAllVariantProperties": "retain_all_variant_properties",
+        "RetainDeploymentConfig": "retain_deployment_config",
+        "RetentionPolicy": "retention_policy",
+        "RetryStrategy": "retry_strategy",
+        "RetryableError": "retryable_error",
+        "ReusedByJob": "reused_by_job",
+        "RiskRating": "risk_rating",
+        "RoleArn": "role_arn",
+        "RollbackMaximumBatchSize": "rollback_maximum_batch_size",
+        "RollingUpdatePolicy": "rolling_update_policy",
+        "RootAccess": "root_access",
+        "RoutingConfig": "routing_config",
+        "RoutingStrategy": "routing_strategy",
+        "RuleConfigurationName": "rule_configuration_name",
+        "RuleEvaluationJobArn": "rule_evaluation_job_arn",
+        "RuleEvaluationStatus": "rule_evaluation_status",
+        "RuleEvaluatorImage": "rule_evaluator_image",
+        "RuleParameters": "rule_parameters",
+        "RunName": "run_name",
+        "RuntimeConfig": "runtime_config",
+        "RuntimeInSeconds": "runtime_in_seconds",
+        "S3ArtifactPath": "s3_artifact_path",
+        "S3CompressionType": "s3_compression_type",
+        "S3DataDistributionType": "s3_data_distribution_type",
+        "S3DataSource": "s3_data_source",
+        "S3DataType": "s3_data_type",
+        "S3ExportArtifacts": "s3_export_artifacts",
+        "S3FailurePath": "s3_failure_path",
+        "S3Input": "s3_input",
+        "S3InputMode": "s3_input_mode",
+        "S3KmsKeyId": "s3_kms_key_id",
+        "S3ModelArtifacts": "s3_model_artifacts",
+        "S3Output": "s3_output",
+        "S3OutputLocation": "s3_output_location",
+        "S3OutputPath": "s3_output_path",
+        "S3OutputUri": "s3_output_uri",
+        "S3StorageConfig": "s3_storage_config",
+        "S3UploadMode": "s3_upload_mode",
+        "S3Uri": "s3_uri",
+        "SageMakerImageArn": "sage_maker_image_arn",
+        "SageMakerImageVersionAlias": "sage_maker_image_version_alias",
+        "SageMakerImageVersionAliases": "sage_maker_image_version_aliases",
+        "SageMakerImageVersionArn": "sage_maker_image_version_arn",
+        "SamplePayloadUrl": "sample_payload_url",
+        "SampleWeightAttributeName": "sample_weight_attribute_name",
+        "SamplingDeviceCount": "sampling_device_count",
+        "SamplingPercentage": "sampling_percentage",
+        "ScaleInCooldown": "scale_in_cooldown",
+        "ScaleOutCooldown": "scale_out_cooldown",
+        "ScalingPolicies": "scaling_policies",
+        "ScalingPolicyObjective": "scaling_policy_objective",
+        "ScalingType": "scaling_type",
+        "Schedule": "schedule",
+        "ScheduleConfig": "schedule_config",
+        "ScheduleExpression": "schedule_expression",
+        "ScheduledTime": "scheduled_time",
+        "ScheduledTimeAfter": "scheduled_time_after",
+        "ScheduledTimeBefore": "scheduled_time_before",
+        "SearchExpression": "search_expression",
+        "SecondaryStatus": "secondary_status",
+        "SecondaryStatusTransitions": "secondary_status_transitions",
+        "SecretArn": "secret_arn",
+        "SecurityConfig": "security_config",
+        "SecurityGroupIdForDomainBoundary": "security_group_id_for_domain_boundary",
+        "SecurityGroupIds": "security_group_ids",
+        "SecurityGroups": "security_groups",
+        "Seed": "seed",
+        "SelectedSteps": "selected_steps",
+        "SelectiveExecutionConfig": "selective_execution_config",
+        "SelectiveExecutionResult": "selective_execution_result",
+        "SellerName": "seller_name",
+        "ServerlessConfig": "serverless_config",
+        "ServerlessUpdateConfig": "serverless_update_config",
+        "ServiceCatalogProvisionedProductDetails": "service_catalog_provisioned_product_details",
+        "ServiceCatalogProvisioningDetails": "service_catalog_provisioning_details",
+        "ServiceCatalogProvisioningUpdateDetails": "service_catalog_provisioning_update_details",
+        "SessionExpirationDurationInSeconds": "session_expiration_duration_in_seconds",
+        "Set": "set",
+        "ShadowModeConfig": "shadow_mode_config",
+        "ShadowModelVariantName": "shadow_model_variant_name",
+        "ShadowModelVariants": "shadow_model_variants",
+        "ShadowProductionVariants": "shadow_production_variants",
+        "ShapBaseline": "shap_baseline",
+        "ShapBaselineConfig": "shap_baseline_config",
+        "ShapBaselineUri": "shap_baseline_uri",
+        "ShapConfig": "shap_config",
+        "SharingSettings": "sharing_settings",
+        "SharingType": "sharing_type",
+        "ShuffleConfig": "shuffle_config",
+        "SingleSignOnApplicationArn": "single_sign_on_application_arn",
+        "SingleSignOnManagedApplicationInstanceId": "single_sign_on_managed_application_instance_id",
+        "SingleSignOnUserIdentifier": "single_sign_on_user_identifier",
+        "SingleSignOnUserValue": "single_sign_on_user_value",
+        "SkipCheck": "skip_check",
+        "SkipModelValidation": "skip_model_validation",
+        "SnsDataSource": "sns_data_source",
+        "SnsTopicArn": "sns_topic_arn",
+        "SortBy": "sort_by",
+        "SortOrder": "sort_order",
+        "Source": "source",
+        "SourceAlgorithmSpecification": "source_algorithm_specification",
+        "SourceAlgorithms": "source_algorithms",
+        "SourceArn": "source_arn",
+        "SourceDetail": "source_detail",
+        "SourceId": "source_id",
+        "SourceIdType": "source_id_type",
+        "SourceIdentity": "source_identity",
+        "SourceIpConfig": "source_ip_config",
+        "SourceModelVariantName": "source_model_variant_name",
+        "SourceName": "source_name",
+        "SourcePipelineExecutionArn": "source_pipeline_execution_arn",
+        "SourceS3Uri": "source_s3_uri",
+        "SourceType": "source_type",
+        "SourceTypes": "source_types",
+        "SourceUri": "source_uri",
+        "Sources": "sources",
+        "SpaceArn": "space_arn",
+        "SpaceDisplayName": "space_display_name",
+        "SpaceName": "space_name",
+        "SpaceNameContains": "space_name_contains",
+        "SpaceNameEquals": "space_name_equals",
+        "SpaceSettings": "space_settings",
+        "SpaceSettingsSummary": "space_settings_summary",
+        "SpaceSharingSettings": "space_sharing_settings",
+        "SpaceSharingSettingsSummary": "space_sharing_settings_summary",
+        "SpaceStorageSettings": "space_storage_settings",
+        "Spaces": "spaces",
+        "SpawnRate": "spawn_rate",
+        "Specification": "specification",
+        "SpecifiedImage": "specified_image",
+        "SplitType": "split_type",
+        "SqsQueueUrl": "sqs_queue_url",
+        "StageName": "stage_name",
+        "StageStatus": "stage_status",
+        "Stages": "stages",
+        "Stairs": "stairs",
+        "StandardMetricName": "standard_metric_name",
+        "StartArns": "start_arns",
+        "StartTime": "start_time",
+        "StartTimeOffset": "start_time_offset",
+        "StartupParameters": "startup_parameters",
+        "StaticHyperParameters": "static_hyper_parameters",
+        "Statistic": "statistic",
+        "Statistics": "statistics",
+        "StatisticsResource": "statistics_resource",
+        "Status": "status",
+        "StatusDetails": "status_details",
+        "StatusEquals": "status_equals",
+        "StatusMessage": "status_message",
+        "StatusReason": "status_reason",
+        "StdDev": "std_dev",
+        "StepDescription": "step_description",
+        "StepDisplayName": "step_display_name",
+        "StepId": "step_id",
+        "StepName": "step_name",
+        "StepStatus": "step_status",
+        "StepType": "step_type",
+        "Steps": "steps",
+        "Stopped": "stopped",
+        "StoppingCondition": "stopping_condition",
+        "StoppingConditions": "stopping_conditions",
+        "StorageType": "storage_type",
+        "Strategy": "strategy",
+        "StrategyConfig": "strategy_config",
+        "StringValue": "string_value",
+        "StudioLifecycleConfigAppType": "studio_lifecycle_config_app_type",
+        "StudioLifecycleConfigArn": "studio_lifecycle_config_arn",
+        "StudioLifecycleConfigContent": "studio_lifecycle_config_content",
+        "StudioLifecycleConfigName": "studio_lifecycle_config_name",
+        "StudioLifecycleConfigs": "studio_lifecycle_configs",
+        "StudioWebPortal": "studio_web_portal",
+        "SubDomain": "sub_domain",
+        "SubExpressions": "sub_expressions",
+        "SubnetId": "subnet_id",
+        "SubnetIds": "subnet_ids",
+        "Subnets": "subnets",
+        "SubscribedWorkteam": "subscribed_workteam",
+        "SubscribedWorkteams": "subscribed_workteams",
+        "Succeeded": "succeeded",
+        "Success": "success",
+        "SuccessTopic": "success_topic",
+        "SuggestionQuery": "suggestion_query",
+        "SupportedCompressionTypes": "supported_compression_types",
+        "SupportedContentTypes": "supported_content_types",
+        "SupportedEndpointType": "supported_endpoint_type",
+        "SupportedHyperParameters": "supported_hyper_parameters",
+        "SupportedInputModes": "supported_input_modes",
+        "SupportedInstanceTypes": "supported_instance_types",
+        "SupportedRealtimeInferenceInstanceTypes": "supported_realtime_inference_instance_types",
+        "SupportedResponseMIMETypes": "supported_response_m_i_m_e_types",
+        "SupportedTrainingInstanceTypes": "supported_training_instance_types",
+        "SupportedTransformInstanceTypes": "supported_transform_instance_types",
+        "SupportedTuningJobObjectiveMetrics": "supported_tuning_job_objective_metrics",
+        "SupportsDistributedTraining": "supports_distributed_training",
+        "TableFormat": "table_format",
+        "TableName": "table_name",
+        "TabularJobConfig": "tabular_job_config",
+        "TabularResolvedAttributes": "tabular_resolved_attributes",
+        "TagKeys": "tag_keys",
+        "Tags": "tags",
+        "TargetAttributeName": "target_attribute_name",
+        "TargetContainerHostname": "target_container_hostname",
+        "TargetCount": "target_count",
+        "TargetCpuUtilizationPerCore": "target_cpu_utilization_per_core",
+        "TargetDevice": "target_device",
+        "TargetLabelColumn": "target_label_column",
+        "TargetModel": "target_model",
+        "TargetObjectiveMetricValue": "target_objective_metric_value",
+        "TargetPlatform": "target_platform",
+        "TargetTracking": "target_tracking",
+        "TargetValue": "target_value",
+        "TargetVariant": "target_variant",
+        "Task": "task",
+        "TaskAvailabilityLifetimeInSeconds": "task_availability_lifetime_in_seconds",
+        "TaskCount": "task_count",
+        "TaskDescription": "task_description",
+        "TaskKeywords": "task_keywords",
+        "TaskTimeLimitInSeconds": "task_time_limit_in_seconds",
+        "TaskTitle": "task_title",
+        "TensorBoardAppSettings": "tensor_board_app_settings",
+        "TensorBoardOutputConfig": "tensor_board_output_config",
+        "TenthFractionsOfACent": "tenth_fractions_of_a_cent",
+        "TerminationWaitInSeconds": "termination_wait_in_seconds",
+        "TextClassificationJobConfig": "text_classification_job_config",
+        "TextConfig": "text_config",
+        "TextGenerationHyperParameters": "text_generation_hyper_parameters",
+        "TextGenerationJobConfig": "text_generation_job_config",
+        "TextGenerationResolvedAttributes": "text_generation_resolved_attributes",
+        "ThreadsPerCore": "threads_per_core",
+        "ThroughputConfig": "throughput_config",
+        "ThroughputMode": "throughput_mode",
+        "TimeSeriesConfig": "time_series_config",
+        "TimeSeriesForecastingJobConfig": "time_series_forecasting_job_config",
+        "TimeSeriesForecastingSettings": "time_series_forecasting_settings",
+        "TimeStamp": "time_stamp",
+        "Timestamp": "timestamp",
+        "TimestampAttributeName": "timestamp_attribute_name",
+        "TokenEndpoint": "token_endpoint",
+        "Total": "total",
+        "TotalLabeled": "total_labeled",
+        "TrafficPattern": "traffic_pattern",
+        "TrafficRoutingConfiguration": "traffic_routing_configuration",
+        "TrafficType": "traffic_type",
+        "TrainingChannels": "training_channels",
+        "TrainingEndTime": "training_end_time",
+        "TrainingImage": "training_image",
+        "TrainingImageConfig": "training_image_config",
+        "TrainingImageDigest": "training_image_digest",
+        "TrainingInputMode": "training_input_mode",
+        "TrainingJob": "training_job",
+        "TrainingJobArn": "training_job_arn",
+        "TrainingJobDefinition": "training_job_definition",
+        "TrainingJobDefinitionName": "training_job_definition_name",
+        "TrainingJobDefinitions": "training_job_definitions",
+        "TrainingJobEarlyStoppingType": "training_job_early_stopping_type",
+        "TrainingJobName": "training_job_name",
+        "TrainingJobStatus": "training_job_status",
+        "TrainingJobStatusCounters": "training_job_status_counters",
+        "TrainingJobSummaries": "training_job_summaries",
+        "TrainingRepositoryAccessMode": "training_repository_access_mode",
+        "TrainingRepositoryAuthConfig": "training_repository_auth_config",
+        "TrainingRepositoryCredentialsProviderArn": "training_repository_credentials_provider_arn",
+        "TrainingSpecification": "training_specification",
+        "TrainingStartTime": "training_start_time",
+        "TrainingTimeInSeconds": "training_time_in_seconds",
+        "TransformEndTime": "transform_end_time",
+        "TransformInput": "transform_input",
+        "TransformJob": "transform_job",
+        "TransformJobArn": "transform_job_arn",
+        "TransformJobDefinition": "transform_job_definition",
+        "TransformJobName": "transform_job_name",
+        "TransformJobStatus": "transform_job_status",
+        "TransformJobSummaries": "transform_job_summaries",
+        "TransformOutput": "transform_output",
+        "TransformResources": "transform_resources",
+        "TransformStartTime": "transform_start_time",
+        "Transformations": "transformations",
+        "Trial": "trial",
+        "TrialArn": "trial_arn",
+        "TrialComponent": "trial_component",
+        "TrialComponentArn": "trial_component_arn",
+        "TrialComponentDisplayName": "trial_component_display_name",
+        "TrialComponentName": "trial_component_name",
+        "TrialComponentSource": "trial_component_source",
+        "TrialComponentSummaries": "trial_component_summaries",
+        "TrialName": "trial_name",
+        "TrialSource": "trial_source",
+        "TrialSummaries": "trial_summaries",
+        "TtlDuration": "ttl_duration",
+        "TunedHyperParameters": "tuned_hyper_parameters",
+        "TuningJob": "tuning_job",
+        "TuningJobArn": "tuning_job_arn",
+        "TuningJobCompletionCriteria": "tuning_job_completion_criteria",
+        "TuningJobCompletionDetails": "tuning_job_completion_details",
+        "TuningJobName": "tuning_job_name",
+        "TuningObjective": "tuning_objective",
+        "Type": "type",
+        "Types": "types",
+        "UiConfig": "ui_config",
+        "UiTemplate": "ui_template",
+        "UiTemplateS3Uri": "ui_template_s3_uri",
+        "Uid": "uid",
+        "Unit": "unit",
+        "Unlabeled": "unlabeled",
+        "Url": "url",
+        "UseLogit": "use_logit",
+        "UserGroup": "user_group",
+        "UserInfoEndpoint": "user_info_endpoint",
+        "UserPool": "user_pool",
+        "UserProfileArn": "user_profile_arn",
+        "UserProfileName": "user_profile_name",
+        "UserProfileNameContains": "user_profile_name_contains",
+        "UserProfileNameEquals": "user_profile_name_equals",
+        "UserProfiles": "user_profiles",
+        "UserSettings": "user_settings",
+        "UsersPerStep": "users_per_step",
+        "ValidationFraction": "validation_fraction",
+        "ValidationProfiles": "validation_profiles",
+        "ValidationRole": "validation_role",
+        "ValidationSpecification": "validation_specification",
+        "ValidationStatuses": "validation_statuses",
+        "Value": "value",
+        "ValueHint": "value_hint",
+        "ValueInMilliseconds": "value_in_milliseconds",
+        "ValueType": "value_type",
+        "Values": "values",
+        "VariantName": "variant_name",
+        "VariantNameEquals": "variant_name_equals",
+        "VariantPropertyType": "variant_property_type",
+        "VariantStatus": "variant_status",
+        "VectorConfig": "vector_config",
+        "VendorGuidance": "vendor_guidance",
+        "Version": "version",
+        "VersionId": "version_id",
+        "Vertices": "vertices",
+        "ViolationReport": "violation_report",
+        "VisibilityConditions": "visibility_conditions",
+        "VolumeKmsKeyId": "volume_kms_key_id",
+        "VolumeSizeInGB": "volume_size_in_g_b",
+        "VpcConfig": "vpc_config",
+        "VpcEndpointId": "vpc_endpoint_id",
+        "VpcId": "vpc_id",
+        "VpcOnlyTrustedAccounts": "vpc_only_trusted_accounts",
+        "WaitIntervalInSeconds": "wait_interval_in_seconds",
+        "WarmPoolStatus": "warm_pool_status",
+        "WarmPoolStatusEquals": "warm_pool_status_equals",
+        "WarmStartConfig": "warm_start_config",
+        "WarmStartType": "warm_start_type",
+        "WorkGroup": "work_group",
+        "WorkRequesterAccountId": "work_requester_account_id",
+        "Workforce": "workforce",
+        "WorkforceArn": "workforce_arn",
+        "WorkforceName": "workforce_name",
+        "WorkforceVpcConfig": "workforce_vpc_config",
+        "Workforces": "workforces",
+        "WorkspaceSettings": "workspace_settings",
+        "Workteam": "workteam",
+        "WorkteamArn": "workteam_arn",
+        "WorkteamName": "workteam_name",
+        "Workteams": "workteams",
+    }
+)
+SNAKE_TO_PASCAL = MappingProxyType(
+    {snake: pascal for pascal, snake in PASCAL_TO_SNAKE.items()}
+)
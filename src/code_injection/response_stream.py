@@ -0,0 +1,313 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Incremental decoding of the response streams of invoke_endpoint_with_response_stream.
+
+The bytes of the PayloadPart events are appended to one buffer, and the records they
+complete are decoded and removed from its front, so a record is parsed once, as soon
+as its last byte is received.
+"""
+import asyncio
+import codecs
+import json
+import re
+import time
+
+from typing import Any, Iterator, List, Optional, Union
+
+FRAMINGS = ("jsonlines", "sse", "raw")
+
+
+class ResponseStreamError(Exception):
+    """Raised when the response stream carries an error event instead of a payload."""
+
+    def __init__(self, message: str, error_name: str, error_code: Optional[str]):
+        super().__init__(message)
+        self.error_name = error_name
+        self.error_code = error_code
+
+
+class StreamFraming:
+    """
+    Splits the bytes of a response stream into records.
+
+    Subclass it to support another framing.
+    """
+
+    def decode(self, buffer: bytearray) -> List[Any]:
+        """Removes the complete records from the front of the buffer and returns them."""
+        raise NotImplementedError
+
+    def finish(self, buffer: bytearray) -> List[Any]:
+        """Returns the records of the bytes left in the buffer once the stream ends."""
+        records = self.decode(buffer)
+        buffer.clear()
+        return records
+
+
+class JsonLinesFraming(StreamFraming):
+    """One JSON document per line."""
+
+    def __init__(self):
+        # the bytes of the buffer already searched for a newline
+        self._scanned = 0
+
+    def decode(self, buffer: bytearray) -> List[Any]:
+        end = buffer.rfind(b"\n", self._scanned)
+        if end < 0:
+            self._scanned = len(buffer)
+            return []
+        records = [
+            json.loads(line) for line in buffer[:end].split(b"\n") if line.strip()
+        ]
+        del buffer[: end + 1]
+        self._scanned = 0
+        return records
+
+    def finish(self, buffer: bytearray) -> List[Any]:
+        records = [json.loads(line) for line in buffer.split(b"\n") if line.strip()]
+        buffer.clear()
+        return records
+
+
+_SSE_EVENT_END = re.compile(rb"\r?\n\r?\n")
+
+
+class SseFraming(StreamFraming):
+    """
+    Server-sent events, one record per event with data.
+
+    The records are the data of the events, decoded as JSON if json_data. The [DONE]
+    event ending OpenAI compatible streams is skipped.
+    """
+
+    def __init__(self, json_data: bool = True):
+        self.json_data = json_data
+        self._scanned = 0
+
+    def decode(self, buffer: bytearray) -> List[Any]:
+        records = []
+        start = 0
+        # an event end spans up to 4 bytes, some may have been received already
+        match = _SSE_EVENT_END.search(buffer, max(0, self._scanned - 3))
+        while match is not None:
+            record = self._event_data(buffer[start : match.start()])
+            if record is not None:
+                records.append(record)
+            start = match.end()
+            match = _SSE_EVENT_END.search(buffer, start)
+        del buffer[:start]
+        self._scanned = len(buffer)
+        return records
+
+    def finish(self, buffer: bytearray) -> List[Any]:
+        record = self._event_data(buffer)
+        buffer.clear()
+        return [] if record is None else [record]
+
+    def _event_data(self, event: bytearray):
+        data = [
+            line[6:] if line.startswith(b"data: ") else line[5:]
+            for line in event.splitlines()
+            if line.startswith(b"data:")
+        ]
+        if not data:
+            return None
+        data = b"\n".join(data).decode("utf-8")
+        if data == "[DONE]":
+            return None
+        return json.loads(data) if self.json_data else data
+
+
+class RawFraming(StreamFraming):
+    """
+    The payloads as they are received, as text unless text is False.
+
+    Multi-byte characters split across payloads are decoded once complete.
+    """
+
+    def __init__(self, text: bool = True):
+        self.text = text
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def decode(self, buffer: bytearray) -> List[Any]:
+        if not self.text:
+            chunk = bytes(buffer)
+        else:
+            chunk = self._decoder.decode(buffer)
+        buffer.clear()
+        return [chunk] if chunk else []
+
+    def finish(self, buffer: bytearray) -> List[Any]:
+        if not self.text:
+            return self.decode(buffer)
+        chunk = self._decoder.decode(buffer, final=True)
+        buffer.clear()
+        return [chunk] if chunk else []
+
+
+def get_framing(framing: Union[str, StreamFraming]) -> StreamFraming:
+    """
+    Returns the framing of a name, one of jsonlines, sse or raw, or the framing itself.
+
+    Raises:
+        ValueError: If the name is not one of a framing.
+    """
+    if isinstance(framing, StreamFraming):
+        return framing
+    if framing == "jsonlines":
+        return JsonLinesFraming()
+    if framing == "sse":
+        return SseFraming()
+    if framing == "raw":
+        return RawFraming()
+    raise ValueError(f"Unknown framing {framing!r}, expected one of {FRAMINGS}")
+
+
+class StreamMetrics:
+    """
+    The latencies of a response stream, in seconds since the request was sent.
+
+    The inter-token latencies are the delays between the payloads completing
+    consecutive records, the records of one payload arriving together.
+    """
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.first_byte_at: Optional[float] = None
+        self.record_times: List[float] = []
+        self.bytes = 0
+
+    @property
+    def records(self) -> int:
+        return len(self.record_times)
+
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        if self.first_byte_at is None:
+            return None
+        return self.first_byte_at - self.started_at
+
+    @property
+    def time_to_first_record(self) -> Optional[float]:
+        if not self.record_times:
+            return None
+        return self.record_times[0] - self.started_at
+
+    @property
+    def inter_token_latencies(self) -> List[float]:
+        return [
+            later - earlier
+            for earlier, later in zip(self.record_times, self.record_times[1:])
+        ]
+
+    @property
+    def mean_inter_token_latency(self) -> Optional[float]:
+        if len(self.record_times) < 2:
+            return None
+        return (self.record_times[-1] - self.record_times[0]) / (
+            len(self.record_times) - 1
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamMetrics(records={self.records}, bytes={self.bytes}, "
+            f"time_to_first_byte={self.time_to_first_byte}, "
+            f"mean_inter_token_latency={self.mean_inter_token_latency})"
+        )
+
+
+_END = object()
+
+
+class ResponseStreamReader:
+    """
+    Yields the records of a response stream as soon as they are complete.
+
+    Iterate it with for, or with async for in asyncio code, where a blocking botocore
+    event stream is read on the default executor and an aiobotocore one is awaited.
+    The metrics are updated as the records are yielded.
+    """
+
+    def __init__(
+        self,
+        event_stream,
+        framing: Union[str, StreamFraming] = "jsonlines",
+        started_at: Optional[float] = None,
+    ):
+        """
+        Initializes a ResponseStreamReader.
+
+        Args:
+            event_stream: The Body of an invoke_endpoint_with_response_stream response.
+            framing (Union[str, StreamFraming]): jsonlines, sse, raw or a StreamFraming.
+            started_at (float): The time.perf_counter() when the request was sent,
+                defaults to now.
+        """
+        self.framing = get_framing(framing)
+        self.metrics = StreamMetrics(
+            time.perf_counter() if started_at is None else started_at
+        )
+        self._event_stream = event_stream
+        self._buffer = bytearray()
+
+    def _decode_event(self, event: dict) -> List[Any]:
+        if "PayloadPart" not in event:
+            for error_name, error in event.items():
+                raise ResponseStreamError(
+                    error.get("Message", error_name), error_name, error.get("ErrorCode")
+                )
+            return []
+        payload = event["PayloadPart"].get("Bytes", b"")
+        now = time.perf_counter()
+        if self.metrics.first_byte_at is None and payload:
+            self.metrics.first_byte_at = now
+        self.metrics.bytes += len(payload)
+        self._buffer += payload
+        records = self.framing.decode(self._buffer)
+        self.metrics.record_times.extend([now] * len(records))
+        return records
+
+    def _finish(self) -> List[Any]:
+        records = self.framing.finish(self._buffer)
+        self.metrics.record_times.extend([time.perf_counter()] * len(records))
+        return records
+
+    def __iter__(self) -> Iterator[Any]:
+        for event in self._event_stream:
+            yield from self._decode_event(event)
+        yield from self._finish()
+
+    def __aiter__(self):
+        return self._async_iter()
+
+    async def _async_iter(self):
+        if hasattr(self._event_stream, "__aiter__"):
+            async for event in self._event_stream:
+                for record in self._decode_event(event):
+                    yield record
+        else:
+            loop = asyncio.get_running_loop()
+            events = iter(self._event_stream)
+            while (
+                event := await loop.run_in_executor(None, next, events, _END)
+            ) is not _END:
+                for record in self._decode_event(event):
+                    yield record
+        for record in self._finish():
+            yield record
+
+    def close(self) -> None:
+        """Closes the underlying event stream, dropping the records not read yet."""
+        if hasattr(self._event_stream, "close"):
+            self._event_stream.close()
@@ -1,19032 +1,4708 @@
-SHAPE_DAG = {
-    "ActionSource": {
-        "members": [
-            {"name": "SourceUri", "shape": "SourceUri", "type": "string"},
-            {"name": "SourceType", "shape": "String256", "type": "string"},
-            {"name": "SourceId", "shape": "String256", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ActionSummaries": {
-        "member_shape": "ActionSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ActionSummary": {
-        "members": [
-            {"name": "ActionArn", "shape": "ActionArn", "type": "string"},
-            {"name": "ActionName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "ActionSource", "type": "structure"},
-            {"name": "ActionType", "shape": "String64", "type": "string"},
-            {"name": "Status", "shape": "ActionStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "AddAssociationRequest": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-            {
-                "name": "AssociationType",
-                "shape": "AssociationEdgeType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "AddAssociationResponse": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "AddTagsInput": {
-        "members": [
-            {"name": "ResourceArn", "shape": "ResourceArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "AddTagsOutput": {
-        "members": [{"name": "Tags", "shape": "TagList", "type": "list"}],
-        "type": "structure",
-    },
-    "AdditionalCodeRepositoryNamesOrUrls": {
-        "member_shape": "CodeRepositoryNameOrUrl",
-        "member_type": "string",
-        "type": "list",
-    },
-    "AdditionalInferenceSpecificationDefinition": {
-        "members": [
-            {"name": "Name", "shape": "EntityName", "type": "string"},
-            {"name": "Description", "shape": "EntityDescription", "type": "string"},
-            {
-                "name": "Containers",
-                "shape": "ModelPackageContainerDefinitionList",
-                "type": "list",
-            },
-            {
-                "name": "SupportedTransformInstanceTypes",
-                "shape": "TransformInstanceTypes",
-                "type": "list",
-            },
-            {
-                "name": "SupportedRealtimeInferenceInstanceTypes",
-                "shape": "RealtimeInferenceInstanceTypes",
-                "type": "list",
-            },
-            {"name": "SupportedContentTypes", "shape": "ContentTypes", "type": "list"},
-            {
-                "name": "SupportedResponseMIMETypes",
-                "shape": "ResponseMIMETypes",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "AdditionalInferenceSpecifications": {
-        "member_shape": "AdditionalInferenceSpecificationDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AdditionalS3DataSource": {
-        "members": [
-            {
-                "name": "S3DataType",
-                "shape": "AdditionalS3DataSourceDataType",
-                "type": "string",
-            },
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "CompressionType", "shape": "CompressionType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AgentVersion": {
-        "members": [
-            {"name": "Version", "shape": "EdgeVersion", "type": "string"},
-            {"name": "AgentCount", "shape": "Long", "type": "long"},
-        ],
-        "type": "structure",
-    },
-    "AgentVersions": {
-        "member_shape": "AgentVersion",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AggregationTransformations": {
-        "key_shape": "TransformationAttributeName",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "AggregationTransformationValue",
-        "value_type": "string",
-    },
-    "Alarm": {
-        "members": [{"name": "AlarmName", "shape": "AlarmName", "type": "string"}],
-        "type": "structure",
-    },
-    "AlarmList": {"member_shape": "Alarm", "member_type": "structure", "type": "list"},
-    "AlgorithmSpecification": {
-        "members": [
-            {"name": "TrainingImage", "shape": "AlgorithmImage", "type": "string"},
-            {"name": "AlgorithmName", "shape": "ArnOrName", "type": "string"},
-            {
-                "name": "TrainingInputMode",
-                "shape": "TrainingInputMode",
-                "type": "string",
-            },
-            {
-                "name": "MetricDefinitions",
-                "shape": "MetricDefinitionList",
-                "type": "list",
-            },
-            {
-                "name": "EnableSageMakerMetricsTimeSeries",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "ContainerEntrypoint",
-                "shape": "TrainingContainerEntrypoint",
-                "type": "list",
-            },
-            {
-                "name": "ContainerArguments",
-                "shape": "TrainingContainerArguments",
-                "type": "list",
-            },
-            {
-                "name": "TrainingImageConfig",
-                "shape": "TrainingImageConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AlgorithmStatusDetails": {
-        "members": [
-            {
-                "name": "ValidationStatuses",
-                "shape": "AlgorithmStatusItemList",
-                "type": "list",
-            },
-            {
-                "name": "ImageScanStatuses",
-                "shape": "AlgorithmStatusItemList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "AlgorithmStatusItem": {
-        "members": [
-            {"name": "Name", "shape": "EntityName", "type": "string"},
-            {"name": "Status", "shape": "DetailedAlgorithmStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AlgorithmStatusItemList": {
-        "member_shape": "AlgorithmStatusItem",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AlgorithmSummary": {
-        "members": [
-            {"name": "AlgorithmName", "shape": "EntityName", "type": "string"},
-            {"name": "AlgorithmArn", "shape": "AlgorithmArn", "type": "string"},
-            {
-                "name": "AlgorithmDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "AlgorithmStatus", "shape": "AlgorithmStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AlgorithmSummaryList": {
-        "member_shape": "AlgorithmSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AlgorithmValidationProfile": {
-        "members": [
-            {"name": "ProfileName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "TrainingJobDefinition",
-                "shape": "TrainingJobDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "TransformJobDefinition",
-                "shape": "TransformJobDefinition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AlgorithmValidationProfiles": {
-        "member_shape": "AlgorithmValidationProfile",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AlgorithmValidationSpecification": {
-        "members": [
-            {"name": "ValidationRole", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ValidationProfiles",
-                "shape": "AlgorithmValidationProfiles",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "AnnotationConsolidationConfig": {
-        "members": [
-            {
-                "name": "AnnotationConsolidationLambdaArn",
-                "shape": "LambdaFunctionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "AppDetails": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {"name": "AppName", "shape": "AppName", "type": "string"},
-            {"name": "Status", "shape": "AppStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "ResourceSpec", "shape": "ResourceSpec", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "AppImageConfigDetails": {
-        "members": [
-            {
-                "name": "AppImageConfigArn",
-                "shape": "AppImageConfigArn",
-                "type": "string",
-            },
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "KernelGatewayImageConfig",
-                "shape": "KernelGatewayImageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterLabAppImageConfig",
-                "shape": "JupyterLabAppImageConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AppImageConfigList": {
-        "member_shape": "AppImageConfigDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AppList": {
-        "member_shape": "AppDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AppSpecification": {
-        "members": [
-            {"name": "ImageUri", "shape": "ImageUri", "type": "string"},
-            {
-                "name": "ContainerEntrypoint",
-                "shape": "ContainerEntrypoint",
-                "type": "list",
-            },
-            {
-                "name": "ContainerArguments",
-                "shape": "ContainerArguments",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ArtifactProperties": {
-        "key_shape": "StringParameterValue",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ArtifactPropertyValue",
-        "value_type": "string",
-    },
-    "ArtifactSource": {
-        "members": [
-            {"name": "SourceUri", "shape": "SourceUri", "type": "string"},
-            {"name": "SourceTypes", "shape": "ArtifactSourceTypes", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ArtifactSourceType": {
-        "members": [
-            {"name": "SourceIdType", "shape": "ArtifactSourceIdType", "type": "string"},
-            {"name": "Value", "shape": "String256", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ArtifactSourceTypes": {
-        "member_shape": "ArtifactSourceType",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ArtifactSummaries": {
-        "member_shape": "ArtifactSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ArtifactSummary": {
-        "members": [
-            {"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"},
-            {"name": "ArtifactName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "ArtifactSource", "type": "structure"},
-            {"name": "ArtifactType", "shape": "String256", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "AssociateTrialComponentRequest": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AssociateTrialComponentResponse": {
-        "members": [
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            },
-            {"name": "TrialArn", "shape": "TrialArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AssociationSummaries": {
-        "member_shape": "AssociationSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AssociationSummary": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-            {"name": "SourceType", "shape": "String256", "type": "string"},
-            {"name": "DestinationType", "shape": "String256", "type": "string"},
-            {
-                "name": "AssociationType",
-                "shape": "AssociationEdgeType",
-                "type": "string",
-            },
-            {"name": "SourceName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "DestinationName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "AsyncInferenceClientConfig": {
-        "members": [
-            {
-                "name": "MaxConcurrentInvocationsPerInstance",
-                "shape": "MaxConcurrentInvocationsPerInstance",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "AsyncInferenceConfig": {
-        "members": [
-            {
-                "name": "ClientConfig",
-                "shape": "AsyncInferenceClientConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OutputConfig",
-                "shape": "AsyncInferenceOutputConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AsyncInferenceNotificationConfig": {
-        "members": [
-            {"name": "SuccessTopic", "shape": "SnsTopicArn", "type": "string"},
-            {"name": "ErrorTopic", "shape": "SnsTopicArn", "type": "string"},
-            {
-                "name": "IncludeInferenceResponseIn",
-                "shape": "AsyncNotificationTopicTypeList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "AsyncInferenceOutputConfig": {
-        "members": [
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "S3OutputPath", "shape": "DestinationS3Uri", "type": "string"},
-            {
-                "name": "NotificationConfig",
-                "shape": "AsyncInferenceNotificationConfig",
-                "type": "structure",
-            },
-            {"name": "S3FailurePath", "shape": "DestinationS3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AsyncNotificationTopicTypeList": {
-        "member_shape": "AsyncNotificationTopicTypes",
-        "member_type": "string",
-        "type": "list",
-    },
-    "AthenaDatasetDefinition": {
-        "members": [
-            {"name": "Catalog", "shape": "AthenaCatalog", "type": "string"},
-            {"name": "Database", "shape": "AthenaDatabase", "type": "string"},
-            {"name": "QueryString", "shape": "AthenaQueryString", "type": "string"},
-            {"name": "WorkGroup", "shape": "AthenaWorkGroup", "type": "string"},
-            {"name": "OutputS3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "OutputFormat", "shape": "AthenaResultFormat", "type": "string"},
-            {
-                "name": "OutputCompression",
-                "shape": "AthenaResultCompressionType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "AttributeNames": {
-        "member_shape": "AttributeName",
-        "member_type": "string",
-        "type": "list",
-    },
-    "AutoMLAlgorithmConfig": {
-        "members": [
-            {"name": "AutoMLAlgorithms", "shape": "AutoMLAlgorithms", "type": "list"}
-        ],
-        "type": "structure",
-    },
-    "AutoMLAlgorithms": {
-        "member_shape": "AutoMLAlgorithm",
-        "member_type": "string",
-        "type": "list",
-    },
-    "AutoMLAlgorithmsConfig": {
-        "member_shape": "AutoMLAlgorithmConfig",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLCandidate": {
-        "members": [
-            {"name": "CandidateName", "shape": "CandidateName", "type": "string"},
-            {
-                "name": "FinalAutoMLJobObjectiveMetric",
-                "shape": "FinalAutoMLJobObjectiveMetric",
-                "type": "structure",
-            },
-            {"name": "ObjectiveStatus", "shape": "ObjectiveStatus", "type": "string"},
-            {"name": "CandidateSteps", "shape": "CandidateSteps", "type": "list"},
-            {"name": "CandidateStatus", "shape": "CandidateStatus", "type": "string"},
-            {
-                "name": "InferenceContainers",
-                "shape": "AutoMLContainerDefinitions",
-                "type": "list",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "AutoMLFailureReason", "type": "string"},
-            {
-                "name": "CandidateProperties",
-                "shape": "CandidateProperties",
-                "type": "structure",
-            },
-            {
-                "name": "InferenceContainerDefinitions",
-                "shape": "AutoMLInferenceContainerDefinitions",
-                "type": "map",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLCandidateGenerationConfig": {
-        "members": [
-            {"name": "FeatureSpecificationS3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "AlgorithmsConfig",
-                "shape": "AutoMLAlgorithmsConfig",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLCandidateStep": {
-        "members": [
-            {
-                "name": "CandidateStepType",
-                "shape": "CandidateStepType",
-                "type": "string",
-            },
-            {"name": "CandidateStepArn", "shape": "CandidateStepArn", "type": "string"},
-            {
-                "name": "CandidateStepName",
-                "shape": "CandidateStepName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLCandidates": {
-        "member_shape": "AutoMLCandidate",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLChannel": {
-        "members": [
-            {"name": "DataSource", "shape": "AutoMLDataSource", "type": "structure"},
-            {"name": "CompressionType", "shape": "CompressionType", "type": "string"},
-            {
-                "name": "TargetAttributeName",
-                "shape": "TargetAttributeName",
-                "type": "string",
-            },
-            {"name": "ContentType", "shape": "ContentType", "type": "string"},
-            {"name": "ChannelType", "shape": "AutoMLChannelType", "type": "string"},
-            {
-                "name": "SampleWeightAttributeName",
-                "shape": "SampleWeightAttributeName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLContainerDefinition": {
-        "members": [
-            {"name": "Image", "shape": "ContainerImage", "type": "string"},
-            {"name": "ModelDataUrl", "shape": "Url", "type": "string"},
-            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "AutoMLContainerDefinitions": {
-        "member_shape": "AutoMLContainerDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLDataSource": {
-        "members": [
-            {"name": "S3DataSource", "shape": "AutoMLS3DataSource", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "AutoMLDataSplitConfig": {
-        "members": [
-            {
-                "name": "ValidationFraction",
-                "shape": "ValidationFraction",
-                "type": "float",
-            }
-        ],
-        "type": "structure",
-    },
-    "AutoMLInferenceContainerDefinitions": {
-        "key_shape": "AutoMLProcessingUnit",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "AutoMLContainerDefinitions",
-        "value_type": "list",
-    },
-    "AutoMLInputDataConfig": {
-        "member_shape": "AutoMLChannel",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLJobArtifacts": {
-        "members": [
-            {
-                "name": "CandidateDefinitionNotebookLocation",
-                "shape": "CandidateDefinitionNotebookLocation",
-                "type": "string",
-            },
-            {
-                "name": "DataExplorationNotebookLocation",
-                "shape": "DataExplorationNotebookLocation",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLJobChannel": {
-        "members": [
-            {"name": "ChannelType", "shape": "AutoMLChannelType", "type": "string"},
-            {"name": "ContentType", "shape": "ContentType", "type": "string"},
-            {"name": "CompressionType", "shape": "CompressionType", "type": "string"},
-            {"name": "DataSource", "shape": "AutoMLDataSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "AutoMLJobCompletionCriteria": {
-        "members": [
-            {"name": "MaxCandidates", "shape": "MaxCandidates", "type": "integer"},
-            {
-                "name": "MaxRuntimePerTrainingJobInSeconds",
-                "shape": "MaxRuntimePerTrainingJobInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "MaxAutoMLJobRuntimeInSeconds",
-                "shape": "MaxAutoMLJobRuntimeInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLJobConfig": {
-        "members": [
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-            {
-                "name": "SecurityConfig",
-                "shape": "AutoMLSecurityConfig",
-                "type": "structure",
-            },
-            {
-                "name": "CandidateGenerationConfig",
-                "shape": "AutoMLCandidateGenerationConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DataSplitConfig",
-                "shape": "AutoMLDataSplitConfig",
-                "type": "structure",
-            },
-            {"name": "Mode", "shape": "AutoMLMode", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AutoMLJobInputDataConfig": {
-        "member_shape": "AutoMLJobChannel",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLJobObjective": {
-        "members": [
-            {"name": "MetricName", "shape": "AutoMLMetricEnum", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "AutoMLJobStepMetadata": {
-        "members": [{"name": "Arn", "shape": "AutoMLJobArn", "type": "string"}],
-        "type": "structure",
-    },
-    "AutoMLJobSummaries": {
-        "member_shape": "AutoMLJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLJobSummary": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "AutoMLJobStatus", "shape": "AutoMLJobStatus", "type": "string"},
-            {
-                "name": "AutoMLJobSecondaryStatus",
-                "shape": "AutoMLJobSecondaryStatus",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "AutoMLFailureReason", "type": "string"},
-            {
-                "name": "PartialFailureReasons",
-                "shape": "AutoMLPartialFailureReasons",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLOutputDataConfig": {
-        "members": [
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AutoMLPartialFailureReason": {
-        "members": [
-            {
-                "name": "PartialFailureMessage",
-                "shape": "AutoMLFailureReason",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "AutoMLPartialFailureReasons": {
-        "member_shape": "AutoMLPartialFailureReason",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoMLProblemTypeConfig": {
-        "members": [
-            {
-                "name": "ImageClassificationJobConfig",
-                "shape": "ImageClassificationJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TextClassificationJobConfig",
-                "shape": "TextClassificationJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TimeSeriesForecastingJobConfig",
-                "shape": "TimeSeriesForecastingJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TabularJobConfig",
-                "shape": "TabularJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TextGenerationJobConfig",
-                "shape": "TextGenerationJobConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLProblemTypeResolvedAttributes": {
-        "members": [
-            {
-                "name": "TabularResolvedAttributes",
-                "shape": "TabularResolvedAttributes",
-                "type": "structure",
-            },
-            {
-                "name": "TextGenerationResolvedAttributes",
-                "shape": "TextGenerationResolvedAttributes",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLResolvedAttributes": {
-        "members": [
-            {
-                "name": "AutoMLJobObjective",
-                "shape": "AutoMLJobObjective",
-                "type": "structure",
-            },
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-            {
-                "name": "AutoMLProblemTypeResolvedAttributes",
-                "shape": "AutoMLProblemTypeResolvedAttributes",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "AutoMLS3DataSource": {
-        "members": [
-            {"name": "S3DataType", "shape": "AutoMLS3DataType", "type": "string"},
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AutoMLSecurityConfig": {
-        "members": [
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "AutoParameter": {
-        "members": [
-            {"name": "Name", "shape": "ParameterKey", "type": "string"},
-            {"name": "ValueHint", "shape": "ParameterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "AutoParameters": {
-        "member_shape": "AutoParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "AutoRollbackConfig": {
-        "members": [{"name": "Alarms", "shape": "AlarmList", "type": "list"}],
-        "type": "structure",
-    },
-    "Autotune": {
-        "members": [{"name": "Mode", "shape": "AutotuneMode", "type": "string"}],
-        "type": "structure",
-    },
-    "BatchDataCaptureConfig": {
-        "members": [
-            {"name": "DestinationS3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "GenerateInferenceId", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "BatchDescribeModelPackageError": {
-        "members": [
-            {"name": "ErrorCode", "shape": "String", "type": "string"},
-            {"name": "ErrorResponse", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "BatchDescribeModelPackageErrorMap": {
-        "key_shape": "ModelPackageArn",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "BatchDescribeModelPackageError",
-        "value_type": "structure",
-    },
-    "BatchDescribeModelPackageInput": {
-        "members": [
-            {
-                "name": "ModelPackageArnList",
-                "shape": "ModelPackageArnList",
-                "type": "list",
-            }
-        ],
-        "type": "structure",
-    },
-    "BatchDescribeModelPackageOutput": {
-        "members": [
-            {
-                "name": "ModelPackageSummaries",
-                "shape": "ModelPackageSummaries",
-                "type": "map",
-            },
-            {
-                "name": "BatchDescribeModelPackageErrorMap",
-                "shape": "BatchDescribeModelPackageErrorMap",
-                "type": "map",
-            },
-        ],
-        "type": "structure",
-    },
-    "BatchDescribeModelPackageSummary": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageVersion",
-                "shape": "ModelPackageVersion",
-                "type": "integer",
-            },
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"},
-            {
-                "name": "ModelPackageDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelPackageStatus",
-                "shape": "ModelPackageStatus",
-                "type": "string",
-            },
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "BatchTransformInput": {
-        "members": [
-            {
-                "name": "DataCapturedDestinationS3Uri",
-                "shape": "DestinationS3Uri",
-                "type": "string",
-            },
-            {
-                "name": "DatasetFormat",
-                "shape": "MonitoringDatasetFormat",
-                "type": "structure",
-            },
-            {"name": "LocalPath", "shape": "ProcessingLocalPath", "type": "string"},
-            {"name": "S3InputMode", "shape": "ProcessingS3InputMode", "type": "string"},
-            {
-                "name": "S3DataDistributionType",
-                "shape": "ProcessingS3DataDistributionType",
-                "type": "string",
-            },
-            {"name": "FeaturesAttribute", "shape": "String", "type": "string"},
-            {"name": "InferenceAttribute", "shape": "String", "type": "string"},
-            {"name": "ProbabilityAttribute", "shape": "String", "type": "string"},
-            {
-                "name": "ProbabilityThresholdAttribute",
-                "shape": "ProbabilityThresholdAttribute",
-                "type": "double",
-            },
-            {
-                "name": "StartTimeOffset",
-                "shape": "MonitoringTimeOffsetString",
-                "type": "string",
-            },
-            {
-                "name": "EndTimeOffset",
-                "shape": "MonitoringTimeOffsetString",
-                "type": "string",
-            },
-            {
-                "name": "ExcludeFeaturesAttribute",
-                "shape": "ExcludeFeaturesAttribute",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "BestObjectiveNotImproving": {
-        "members": [
-            {
-                "name": "MaxNumberOfTrainingJobsNotImproving",
-                "shape": "MaxNumberOfTrainingJobsNotImproving",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "Bias": {
-        "members": [
-            {"name": "Report", "shape": "MetricsSource", "type": "structure"},
-            {
-                "name": "PreTrainingReport",
-                "shape": "MetricsSource",
-                "type": "structure",
-            },
-            {
-                "name": "PostTrainingReport",
-                "shape": "MetricsSource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "BlueGreenUpdatePolicy": {
-        "members": [
-            {
-                "name": "TrafficRoutingConfiguration",
-                "shape": "TrafficRoutingConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TerminationWaitInSeconds",
-                "shape": "TerminationWaitInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "MaximumExecutionTimeoutInSeconds",
-                "shape": "MaximumExecutionTimeoutInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "CacheHitResult": {
-        "members": [
-            {
-                "name": "SourcePipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CallbackStepMetadata": {
-        "members": [
-            {"name": "CallbackToken", "shape": "CallbackToken", "type": "string"},
-            {"name": "SqsQueueUrl", "shape": "String256", "type": "string"},
-            {
-                "name": "OutputParameters",
-                "shape": "OutputParameterList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "CandidateArtifactLocations": {
-        "members": [
-            {
-                "name": "Explainability",
-                "shape": "ExplainabilityLocation",
-                "type": "string",
-            },
-            {
-                "name": "ModelInsights",
-                "shape": "ModelInsightsLocation",
-                "type": "string",
-            },
-            {
-                "name": "BacktestResults",
-                "shape": "BacktestResultsLocation",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "CandidateGenerationConfig": {
-        "members": [
-            {
-                "name": "AlgorithmsConfig",
-                "shape": "AutoMLAlgorithmsConfig",
-                "type": "list",
-            }
-        ],
-        "type": "structure",
-    },
-    "CandidateProperties": {
-        "members": [
-            {
-                "name": "CandidateArtifactLocations",
-                "shape": "CandidateArtifactLocations",
-                "type": "structure",
-            },
-            {"name": "CandidateMetrics", "shape": "MetricDataList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CandidateSteps": {
-        "member_shape": "AutoMLCandidateStep",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CanvasAppSettings": {
-        "members": [
-            {
-                "name": "TimeSeriesForecastingSettings",
-                "shape": "TimeSeriesForecastingSettings",
-                "type": "structure",
-            },
-            {
-                "name": "ModelRegisterSettings",
-                "shape": "ModelRegisterSettings",
-                "type": "structure",
-            },
-            {
-                "name": "WorkspaceSettings",
-                "shape": "WorkspaceSettings",
-                "type": "structure",
-            },
-            {
-                "name": "IdentityProviderOAuthSettings",
-                "shape": "IdentityProviderOAuthSettings",
-                "type": "list",
-            },
-            {
-                "name": "DirectDeploySettings",
-                "shape": "DirectDeploySettings",
-                "type": "structure",
-            },
-            {"name": "KendraSettings", "shape": "KendraSettings", "type": "structure"},
-            {
-                "name": "GenerativeAiSettings",
-                "shape": "GenerativeAiSettings",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CapacitySize": {
-        "members": [
-            {"name": "Type", "shape": "CapacitySizeType", "type": "string"},
-            {"name": "Value", "shape": "CapacitySizeValue", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "CaptureContentTypeHeader": {
-        "members": [
-            {"name": "CsvContentTypes", "shape": "CsvContentTypes", "type": "list"},
-            {"name": "JsonContentTypes", "shape": "JsonContentTypes", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CaptureOption": {
-        "members": [{"name": "CaptureMode", "shape": "CaptureMode", "type": "string"}],
-        "type": "structure",
-    },
-    "CaptureOptionList": {
-        "member_shape": "CaptureOption",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CategoricalParameter": {
-        "members": [
-            {"name": "Name", "shape": "String64", "type": "string"},
-            {
-                "name": "Value",
-                "shape": "CategoricalParameterRangeValues",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "CategoricalParameterRange": {
-        "members": [
-            {"name": "Name", "shape": "ParameterKey", "type": "string"},
-            {"name": "Values", "shape": "ParameterValues", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CategoricalParameterRangeSpecification": {
-        "members": [{"name": "Values", "shape": "ParameterValues", "type": "list"}],
-        "type": "structure",
-    },
-    "CategoricalParameterRangeValues": {
-        "member_shape": "String128",
-        "member_type": "string",
-        "type": "list",
-    },
-    "CategoricalParameterRanges": {
-        "member_shape": "CategoricalParameterRange",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CategoricalParameters": {
-        "member_shape": "CategoricalParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Channel": {
-        "members": [
-            {"name": "ChannelName", "shape": "ChannelName", "type": "string"},
-            {"name": "DataSource", "shape": "DataSource", "type": "structure"},
-            {"name": "ContentType", "shape": "ContentType", "type": "string"},
-            {"name": "CompressionType", "shape": "CompressionType", "type": "string"},
-            {"name": "RecordWrapperType", "shape": "RecordWrapper", "type": "string"},
-            {"name": "InputMode", "shape": "TrainingInputMode", "type": "string"},
-            {"name": "ShuffleConfig", "shape": "ShuffleConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ChannelSpecification": {
-        "members": [
-            {"name": "Name", "shape": "ChannelName", "type": "string"},
-            {"name": "Description", "shape": "EntityDescription", "type": "string"},
-            {"name": "IsRequired", "shape": "Boolean", "type": "boolean"},
-            {"name": "SupportedContentTypes", "shape": "ContentTypes", "type": "list"},
-            {
-                "name": "SupportedCompressionTypes",
-                "shape": "CompressionTypes",
-                "type": "list",
-            },
-            {"name": "SupportedInputModes", "shape": "InputModes", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ChannelSpecifications": {
-        "member_shape": "ChannelSpecification",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CheckpointConfig": {
-        "members": [
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "LocalPath", "shape": "DirectoryPath", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Cidrs": {"member_shape": "Cidr", "member_type": "string", "type": "list"},
-    "ClarifyCheckStepMetadata": {
-        "members": [
-            {"name": "CheckType", "shape": "String256", "type": "string"},
-            {
-                "name": "BaselineUsedForDriftCheckConstraints",
-                "shape": "String1024",
-                "type": "string",
-            },
-            {
-                "name": "CalculatedBaselineConstraints",
-                "shape": "String1024",
-                "type": "string",
-            },
-            {"name": "ModelPackageGroupName", "shape": "String256", "type": "string"},
-            {"name": "ViolationReport", "shape": "String1024", "type": "string"},
-            {"name": "CheckJobArn", "shape": "String256", "type": "string"},
-            {"name": "SkipCheck", "shape": "Boolean", "type": "boolean"},
-            {"name": "RegisterNewBaseline", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "ClarifyExplainerConfig": {
-        "members": [
-            {
-                "name": "EnableExplanations",
-                "shape": "ClarifyEnableExplanations",
-                "type": "string",
-            },
-            {
-                "name": "InferenceConfig",
-                "shape": "ClarifyInferenceConfig",
-                "type": "structure",
-            },
-            {"name": "ShapConfig", "shape": "ClarifyShapConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ClarifyFeatureHeaders": {
-        "member_shape": "ClarifyHeader",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ClarifyFeatureTypes": {
-        "member_shape": "ClarifyFeatureType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ClarifyInferenceConfig": {
-        "members": [
-            {
-                "name": "FeaturesAttribute",
-                "shape": "ClarifyFeaturesAttribute",
-                "type": "string",
-            },
-            {
-                "name": "ContentTemplate",
-                "shape": "ClarifyContentTemplate",
-                "type": "string",
-            },
-            {
-                "name": "MaxRecordCount",
-                "shape": "ClarifyMaxRecordCount",
-                "type": "integer",
-            },
-            {
-                "name": "MaxPayloadInMB",
-                "shape": "ClarifyMaxPayloadInMB",
-                "type": "integer",
-            },
-            {
-                "name": "ProbabilityIndex",
-                "shape": "ClarifyProbabilityIndex",
-                "type": "integer",
-            },
-            {"name": "LabelIndex", "shape": "ClarifyLabelIndex", "type": "integer"},
-            {
-                "name": "ProbabilityAttribute",
-                "shape": "ClarifyProbabilityAttribute",
-                "type": "string",
-            },
-            {
-                "name": "LabelAttribute",
-                "shape": "ClarifyLabelAttribute",
-                "type": "string",
-            },
-            {"name": "LabelHeaders", "shape": "ClarifyLabelHeaders", "type": "list"},
-            {
-                "name": "FeatureHeaders",
-                "shape": "ClarifyFeatureHeaders",
-                "type": "list",
-            },
-            {"name": "FeatureTypes", "shape": "ClarifyFeatureTypes", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ClarifyLabelHeaders": {
-        "member_shape": "ClarifyHeader",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ClarifyShapBaselineConfig": {
-        "members": [
-            {"name": "MimeType", "shape": "ClarifyMimeType", "type": "string"},
-            {"name": "ShapBaseline", "shape": "ClarifyShapBaseline", "type": "string"},
-            {"name": "ShapBaselineUri", "shape": "Url", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ClarifyShapConfig": {
-        "members": [
-            {
-                "name": "ShapBaselineConfig",
-                "shape": "ClarifyShapBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "NumberOfSamples",
-                "shape": "ClarifyShapNumberOfSamples",
-                "type": "integer",
-            },
-            {"name": "UseLogit", "shape": "ClarifyShapUseLogit", "type": "boolean"},
-            {"name": "Seed", "shape": "ClarifyShapSeed", "type": "integer"},
-            {"name": "TextConfig", "shape": "ClarifyTextConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ClarifyTextConfig": {
-        "members": [
-            {"name": "Language", "shape": "ClarifyTextLanguage", "type": "string"},
-            {
-                "name": "Granularity",
-                "shape": "ClarifyTextGranularity",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ClusterInstanceGroupDetails": {
-        "members": [
-            {
-                "name": "CurrentCount",
-                "shape": "ClusterNonNegativeInstanceCount",
-                "type": "integer",
-            },
-            {"name": "TargetCount", "shape": "ClusterInstanceCount", "type": "integer"},
-            {
-                "name": "InstanceGroupName",
-                "shape": "ClusterInstanceGroupName",
-                "type": "string",
-            },
-            {"name": "InstanceType", "shape": "ClusterInstanceType", "type": "string"},
-            {
-                "name": "LifeCycleConfig",
-                "shape": "ClusterLifeCycleConfig",
-                "type": "structure",
-            },
-            {"name": "ExecutionRole", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ThreadsPerCore",
-                "shape": "ClusterThreadsPerCore",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ClusterInstanceGroupDetailsList": {
-        "member_shape": "ClusterInstanceGroupDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ClusterInstanceGroupSpecification": {
-        "members": [
-            {
-                "name": "InstanceCount",
-                "shape": "ClusterInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "InstanceGroupName",
-                "shape": "ClusterInstanceGroupName",
-                "type": "string",
-            },
-            {"name": "InstanceType", "shape": "ClusterInstanceType", "type": "string"},
-            {
-                "name": "LifeCycleConfig",
-                "shape": "ClusterLifeCycleConfig",
-                "type": "structure",
-            },
-            {"name": "ExecutionRole", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ThreadsPerCore",
-                "shape": "ClusterThreadsPerCore",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ClusterInstanceGroupSpecifications": {
-        "member_shape": "ClusterInstanceGroupSpecification",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ClusterInstanceStatusDetails": {
-        "members": [
-            {"name": "Status", "shape": "ClusterInstanceStatus", "type": "string"},
-            {"name": "Message", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ClusterLifeCycleConfig": {
-        "members": [
-            {"name": "SourceS3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "OnCreate",
-                "shape": "ClusterLifeCycleConfigFileName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ClusterNodeDetails": {
-        "members": [
-            {
-                "name": "InstanceGroupName",
-                "shape": "ClusterInstanceGroupName",
-                "type": "string",
-            },
-            {"name": "InstanceId", "shape": "String", "type": "string"},
-            {
-                "name": "InstanceStatus",
-                "shape": "ClusterInstanceStatusDetails",
-                "type": "structure",
-            },
-            {"name": "InstanceType", "shape": "ClusterInstanceType", "type": "string"},
-            {"name": "LaunchTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LifeCycleConfig",
-                "shape": "ClusterLifeCycleConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ThreadsPerCore",
-                "shape": "ClusterThreadsPerCore",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ClusterNodeSummaries": {
-        "member_shape": "ClusterNodeSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ClusterNodeSummary": {
-        "members": [
-            {
-                "name": "InstanceGroupName",
-                "shape": "ClusterInstanceGroupName",
-                "type": "string",
-            },
-            {"name": "InstanceId", "shape": "String", "type": "string"},
-            {"name": "InstanceType", "shape": "ClusterInstanceType", "type": "string"},
-            {"name": "LaunchTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "InstanceStatus",
-                "shape": "ClusterInstanceStatusDetails",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ClusterSummaries": {
-        "member_shape": "ClusterSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ClusterSummary": {
-        "members": [
-            {"name": "ClusterArn", "shape": "ClusterArn", "type": "string"},
-            {"name": "ClusterName", "shape": "ClusterName", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ClusterStatus", "shape": "ClusterStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CodeEditorAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {
-                "name": "LifecycleConfigArns",
-                "shape": "LifecycleConfigArns",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "CodeRepositories": {
-        "member_shape": "CodeRepository",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CodeRepository": {
-        "members": [
-            {"name": "RepositoryUrl", "shape": "RepositoryUrl", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CodeRepositorySummary": {
-        "members": [
-            {"name": "CodeRepositoryName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "CodeRepositoryArn",
-                "shape": "CodeRepositoryArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "GitConfig", "shape": "GitConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "CodeRepositorySummaryList": {
-        "member_shape": "CodeRepositorySummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CognitoConfig": {
-        "members": [
-            {"name": "UserPool", "shape": "CognitoUserPool", "type": "string"},
-            {"name": "ClientId", "shape": "ClientId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CognitoMemberDefinition": {
-        "members": [
-            {"name": "UserPool", "shape": "CognitoUserPool", "type": "string"},
-            {"name": "UserGroup", "shape": "CognitoUserGroup", "type": "string"},
-            {"name": "ClientId", "shape": "ClientId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CollectionConfig": {
-        "members": [
-            {"name": "VectorConfig", "shape": "VectorConfig", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "CollectionConfiguration": {
-        "members": [
-            {"name": "CollectionName", "shape": "CollectionName", "type": "string"},
-            {
-                "name": "CollectionParameters",
-                "shape": "CollectionParameters",
-                "type": "map",
-            },
-        ],
-        "type": "structure",
-    },
-    "CollectionConfigurations": {
-        "member_shape": "CollectionConfiguration",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CollectionParameters": {
-        "key_shape": "ConfigKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ConfigValue",
-        "value_type": "string",
-    },
-    "CompilationJobSummaries": {
-        "member_shape": "CompilationJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CompilationJobSummary": {
-        "members": [
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "CompilationJobArn",
-                "shape": "CompilationJobArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "CompilationStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CompilationEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "CompilationTargetDevice",
-                "shape": "TargetDevice",
-                "type": "string",
-            },
-            {
-                "name": "CompilationTargetPlatformOs",
-                "shape": "TargetPlatformOs",
-                "type": "string",
-            },
-            {
-                "name": "CompilationTargetPlatformArch",
-                "shape": "TargetPlatformArch",
-                "type": "string",
-            },
-            {
-                "name": "CompilationTargetPlatformAccelerator",
-                "shape": "TargetPlatformAccelerator",
-                "type": "string",
-            },
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "CompilationJobStatus",
-                "shape": "CompilationJobStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "CompressionTypes": {
-        "member_shape": "CompressionType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ConditionStepMetadata": {
-        "members": [{"name": "Outcome", "shape": "ConditionOutcome", "type": "string"}],
-        "type": "structure",
-    },
-    "ConflictException": {
-        "members": [{"name": "Message", "shape": "FailureReason", "type": "string"}],
-        "type": "structure",
-    },
-    "ContainerArguments": {
-        "member_shape": "ContainerArgument",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ContainerConfig": {
-        "members": [
-            {
-                "name": "ContainerArguments",
-                "shape": "CustomImageContainerArguments",
-                "type": "list",
-            },
-            {
-                "name": "ContainerEntrypoint",
-                "shape": "CustomImageContainerEntrypoint",
-                "type": "list",
-            },
-            {
-                "name": "ContainerEnvironmentVariables",
-                "shape": "CustomImageContainerEnvironmentVariables",
-                "type": "map",
-            },
-        ],
-        "type": "structure",
-    },
-    "ContainerDefinition": {
-        "members": [
-            {
-                "name": "ContainerHostname",
-                "shape": "ContainerHostname",
-                "type": "string",
-            },
-            {"name": "Image", "shape": "ContainerImage", "type": "string"},
-            {"name": "ImageConfig", "shape": "ImageConfig", "type": "structure"},
-            {"name": "Mode", "shape": "ContainerMode", "type": "string"},
-            {"name": "ModelDataUrl", "shape": "Url", "type": "string"},
-            {
-                "name": "ModelDataSource",
-                "shape": "ModelDataSource",
-                "type": "structure",
-            },
-            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
-            {
-                "name": "ModelPackageName",
-                "shape": "VersionedArnOrName",
-                "type": "string",
-            },
-            {
-                "name": "InferenceSpecificationName",
-                "shape": "InferenceSpecificationName",
-                "type": "string",
-            },
-            {
-                "name": "MultiModelConfig",
-                "shape": "MultiModelConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ContainerDefinitionList": {
-        "member_shape": "ContainerDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ContainerEntrypoint": {
-        "member_shape": "ContainerEntrypointString",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ContentClassifiers": {
-        "member_shape": "ContentClassifier",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ContentTypes": {
-        "member_shape": "ContentType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ContextSource": {
-        "members": [
-            {"name": "SourceUri", "shape": "SourceUri", "type": "string"},
-            {"name": "SourceType", "shape": "String256", "type": "string"},
-            {"name": "SourceId", "shape": "String256", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ContextSummaries": {
-        "member_shape": "ContextSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ContextSummary": {
-        "members": [
-            {"name": "ContextArn", "shape": "ContextArn", "type": "string"},
-            {"name": "ContextName", "shape": "ContextName", "type": "string"},
-            {"name": "Source", "shape": "ContextSource", "type": "structure"},
-            {"name": "ContextType", "shape": "String256", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ContinuousParameterRange": {
-        "members": [
-            {"name": "Name", "shape": "ParameterKey", "type": "string"},
-            {"name": "MinValue", "shape": "ParameterValue", "type": "string"},
-            {"name": "MaxValue", "shape": "ParameterValue", "type": "string"},
-            {
-                "name": "ScalingType",
-                "shape": "HyperParameterScalingType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ContinuousParameterRangeSpecification": {
-        "members": [
-            {"name": "MinValue", "shape": "ParameterValue", "type": "string"},
-            {"name": "MaxValue", "shape": "ParameterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ContinuousParameterRanges": {
-        "member_shape": "ContinuousParameterRange",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ConvergenceDetected": {
-        "members": [
-            {
-                "name": "CompleteOnConvergence",
-                "shape": "CompleteOnConvergence",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateActionRequest": {
-        "members": [
-            {"name": "ActionName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "ActionSource", "type": "structure"},
-            {"name": "ActionType", "shape": "String256", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Status", "shape": "ActionStatus", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateActionResponse": {
-        "members": [{"name": "ActionArn", "shape": "ActionArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateAlgorithmInput": {
-        "members": [
-            {"name": "AlgorithmName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "AlgorithmDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {
-                "name": "TrainingSpecification",
-                "shape": "TrainingSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ValidationSpecification",
-                "shape": "AlgorithmValidationSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "CertifyForMarketplace",
-                "shape": "CertifyForMarketplace",
-                "type": "boolean",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateAlgorithmOutput": {
-        "members": [
-            {"name": "AlgorithmArn", "shape": "AlgorithmArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateAppImageConfigRequest": {
-        "members": [
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "KernelGatewayImageConfig",
-                "shape": "KernelGatewayImageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterLabAppImageConfig",
-                "shape": "JupyterLabAppImageConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateAppImageConfigResponse": {
-        "members": [
-            {
-                "name": "AppImageConfigArn",
-                "shape": "AppImageConfigArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateAppRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {"name": "AppName", "shape": "AppName", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "ResourceSpec", "shape": "ResourceSpec", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "CreateAppResponse": {
-        "members": [{"name": "AppArn", "shape": "AppArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateArtifactRequest": {
-        "members": [
-            {"name": "ArtifactName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "ArtifactSource", "type": "structure"},
-            {"name": "ArtifactType", "shape": "String256", "type": "string"},
-            {"name": "Properties", "shape": "ArtifactProperties", "type": "map"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateArtifactResponse": {
-        "members": [{"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateAutoMLJobRequest": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"},
-            {
-                "name": "InputDataConfig",
-                "shape": "AutoMLInputDataConfig",
-                "type": "list",
-            },
-            {
-                "name": "OutputDataConfig",
-                "shape": "AutoMLOutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "ProblemType", "shape": "ProblemType", "type": "string"},
-            {
-                "name": "AutoMLJobObjective",
-                "shape": "AutoMLJobObjective",
-                "type": "structure",
-            },
-            {
-                "name": "AutoMLJobConfig",
-                "shape": "AutoMLJobConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "GenerateCandidateDefinitionsOnly",
-                "shape": "GenerateCandidateDefinitionsOnly",
-                "type": "boolean",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "ModelDeployConfig",
-                "shape": "ModelDeployConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateAutoMLJobResponse": {
-        "members": [
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateAutoMLJobV2Request": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"},
-            {
-                "name": "AutoMLJobInputDataConfig",
-                "shape": "AutoMLJobInputDataConfig",
-                "type": "list",
-            },
-            {
-                "name": "OutputDataConfig",
-                "shape": "AutoMLOutputDataConfig",
-                "type": "structure",
-            },
-            {
-                "name": "AutoMLProblemTypeConfig",
-                "shape": "AutoMLProblemTypeConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "SecurityConfig",
-                "shape": "AutoMLSecurityConfig",
-                "type": "structure",
-            },
-            {
-                "name": "AutoMLJobObjective",
-                "shape": "AutoMLJobObjective",
-                "type": "structure",
-            },
-            {
-                "name": "ModelDeployConfig",
-                "shape": "ModelDeployConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DataSplitConfig",
-                "shape": "AutoMLDataSplitConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateAutoMLJobV2Response": {
-        "members": [
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateClusterRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterName", "type": "string"},
-            {
-                "name": "InstanceGroups",
-                "shape": "ClusterInstanceGroupSpecifications",
-                "type": "list",
-            },
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateClusterResponse": {
-        "members": [{"name": "ClusterArn", "shape": "ClusterArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateCodeRepositoryInput": {
-        "members": [
-            {"name": "CodeRepositoryName", "shape": "EntityName", "type": "string"},
-            {"name": "GitConfig", "shape": "GitConfig", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateCodeRepositoryOutput": {
-        "members": [
-            {
-                "name": "CodeRepositoryArn",
-                "shape": "CodeRepositoryArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateCompilationJobRequest": {
-        "members": [
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ModelPackageVersionArn",
-                "shape": "ModelPackageArn",
-                "type": "string",
-            },
-            {"name": "InputConfig", "shape": "InputConfig", "type": "structure"},
-            {"name": "OutputConfig", "shape": "OutputConfig", "type": "structure"},
-            {"name": "VpcConfig", "shape": "NeoVpcConfig", "type": "structure"},
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateCompilationJobResponse": {
-        "members": [
-            {
-                "name": "CompilationJobArn",
-                "shape": "CompilationJobArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateContextRequest": {
-        "members": [
-            {"name": "ContextName", "shape": "ContextName", "type": "string"},
-            {"name": "Source", "shape": "ContextSource", "type": "structure"},
-            {"name": "ContextType", "shape": "String256", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateContextResponse": {
-        "members": [{"name": "ContextArn", "shape": "ContextArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateDataQualityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "DataQualityBaselineConfig",
-                "shape": "DataQualityBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DataQualityAppSpecification",
-                "shape": "DataQualityAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "DataQualityJobInput",
-                "shape": "DataQualityJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "DataQualityJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateDataQualityJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateDeviceFleetRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "Description",
-                "shape": "DeviceFleetDescription",
-                "type": "string",
-            },
-            {"name": "OutputConfig", "shape": "EdgeOutputConfig", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "EnableIotRoleAlias",
-                "shape": "EnableIotRoleAlias",
-                "type": "boolean",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateDomainRequest": {
-        "members": [
-            {"name": "DomainName", "shape": "DomainName", "type": "string"},
-            {"name": "AuthMode", "shape": "AuthMode", "type": "string"},
-            {
-                "name": "DefaultUserSettings",
-                "shape": "UserSettings",
-                "type": "structure",
-            },
-            {"name": "DomainSettings", "shape": "DomainSettings", "type": "structure"},
-            {"name": "SubnetIds", "shape": "Subnets", "type": "list"},
-            {"name": "VpcId", "shape": "VpcId", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "AppNetworkAccessType",
-                "shape": "AppNetworkAccessType",
-                "type": "string",
-            },
-            {
-                "name": "HomeEfsFileSystemKmsKeyId",
-                "shape": "KmsKeyId",
-                "type": "string",
-            },
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "AppSecurityGroupManagement",
-                "shape": "AppSecurityGroupManagement",
-                "type": "string",
-            },
-            {
-                "name": "DefaultSpaceSettings",
-                "shape": "DefaultSpaceSettings",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateDomainResponse": {
-        "members": [
-            {"name": "DomainArn", "shape": "DomainArn", "type": "string"},
-            {"name": "Url", "shape": "String1024", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CreateEdgeDeploymentPlanRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelConfigs",
-                "shape": "EdgeDeploymentModelConfigs",
-                "type": "list",
-            },
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "Stages", "shape": "DeploymentStages", "type": "list"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateEdgeDeploymentPlanResponse": {
-        "members": [
-            {
-                "name": "EdgeDeploymentPlanArn",
-                "shape": "EdgeDeploymentPlanArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateEdgeDeploymentStageRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "Stages", "shape": "DeploymentStages", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateEdgePackagingJobRequest": {
-        "members": [
-            {"name": "EdgePackagingJobName", "shape": "EntityName", "type": "string"},
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelVersion", "shape": "EdgeVersion", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "OutputConfig", "shape": "EdgeOutputConfig", "type": "structure"},
-            {"name": "ResourceKey", "shape": "KmsKeyId", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateEndpointConfigInput": {
-        "members": [
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "ProductionVariants",
-                "shape": "ProductionVariantList",
-                "type": "list",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "DataCaptureConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "AsyncInferenceConfig",
-                "shape": "AsyncInferenceConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ExplainerConfig",
-                "shape": "ExplainerConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ShadowProductionVariants",
-                "shape": "ProductionVariantList",
-                "type": "list",
-            },
-            {"name": "ExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "CreateEndpointConfigOutput": {
-        "members": [
-            {
-                "name": "EndpointConfigArn",
-                "shape": "EndpointConfigArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateEndpointInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "DeploymentConfig",
-                "shape": "DeploymentConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateEndpointOutput": {
-        "members": [{"name": "EndpointArn", "shape": "EndpointArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateExperimentRequest": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateExperimentResponse": {
-        "members": [
-            {"name": "ExperimentArn", "shape": "ExperimentArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateFeatureGroupRequest": {
-        "members": [
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"},
-            {
-                "name": "RecordIdentifierFeatureName",
-                "shape": "FeatureName",
-                "type": "string",
-            },
-            {"name": "EventTimeFeatureName", "shape": "FeatureName", "type": "string"},
-            {
-                "name": "FeatureDefinitions",
-                "shape": "FeatureDefinitions",
-                "type": "list",
-            },
-            {
-                "name": "OnlineStoreConfig",
-                "shape": "OnlineStoreConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OfflineStoreConfig",
-                "shape": "OfflineStoreConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ThroughputConfig",
-                "shape": "ThroughputConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Description", "shape": "Description", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateFeatureGroupResponse": {
-        "members": [
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateFlowDefinitionRequest": {
-        "members": [
-            {
-                "name": "FlowDefinitionName",
-                "shape": "FlowDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "HumanLoopRequestSource",
-                "shape": "HumanLoopRequestSource",
-                "type": "structure",
-            },
-            {
-                "name": "HumanLoopActivationConfig",
-                "shape": "HumanLoopActivationConfig",
-                "type": "structure",
-            },
-            {
-                "name": "HumanLoopConfig",
-                "shape": "HumanLoopConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OutputConfig",
-                "shape": "FlowDefinitionOutputConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateFlowDefinitionResponse": {
-        "members": [
-            {
-                "name": "FlowDefinitionArn",
-                "shape": "FlowDefinitionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateHubRequest": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubDescription", "shape": "HubDescription", "type": "string"},
-            {"name": "HubDisplayName", "shape": "HubDisplayName", "type": "string"},
-            {
-                "name": "HubSearchKeywords",
-                "shape": "HubSearchKeywordList",
-                "type": "list",
-            },
-            {
-                "name": "S3StorageConfig",
-                "shape": "HubS3StorageConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateHubResponse": {
-        "members": [{"name": "HubArn", "shape": "HubArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateHumanTaskUiRequest": {
-        "members": [
-            {"name": "HumanTaskUiName", "shape": "HumanTaskUiName", "type": "string"},
-            {"name": "UiTemplate", "shape": "UiTemplate", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateHumanTaskUiResponse": {
-        "members": [
-            {"name": "HumanTaskUiArn", "shape": "HumanTaskUiArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateHyperParameterTuningJobRequest": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobConfig",
-                "shape": "HyperParameterTuningJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobDefinition",
-                "shape": "HyperParameterTrainingJobDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobDefinitions",
-                "shape": "HyperParameterTrainingJobDefinitions",
-                "type": "list",
-            },
-            {
-                "name": "WarmStartConfig",
-                "shape": "HyperParameterTuningJobWarmStartConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "Autotune", "shape": "Autotune", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "CreateHyperParameterTuningJobResponse": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobArn",
-                "shape": "HyperParameterTuningJobArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateImageRequest": {
-        "members": [
-            {"name": "Description", "shape": "ImageDescription", "type": "string"},
-            {"name": "DisplayName", "shape": "ImageDisplayName", "type": "string"},
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateImageResponse": {
-        "members": [{"name": "ImageArn", "shape": "ImageArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateImageVersionRequest": {
-        "members": [
-            {"name": "BaseImage", "shape": "ImageBaseImage", "type": "string"},
-            {"name": "ClientToken", "shape": "ClientToken", "type": "string"},
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {
-                "name": "Aliases",
-                "shape": "SageMakerImageVersionAliases",
-                "type": "list",
-            },
-            {"name": "VendorGuidance", "shape": "VendorGuidance", "type": "string"},
-            {"name": "JobType", "shape": "JobType", "type": "string"},
-            {"name": "MLFramework", "shape": "MLFramework", "type": "string"},
-            {"name": "ProgrammingLang", "shape": "ProgrammingLang", "type": "string"},
-            {"name": "Processor", "shape": "Processor", "type": "string"},
-            {"name": "Horovod", "shape": "Horovod", "type": "boolean"},
-            {"name": "ReleaseNotes", "shape": "ReleaseNotes", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CreateImageVersionResponse": {
-        "members": [
-            {"name": "ImageVersionArn", "shape": "ImageVersionArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateInferenceComponentInput": {
-        "members": [
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {
-                "name": "Specification",
-                "shape": "InferenceComponentSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "RuntimeConfig",
-                "shape": "InferenceComponentRuntimeConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateInferenceComponentOutput": {
-        "members": [
-            {
-                "name": "InferenceComponentArn",
-                "shape": "InferenceComponentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateInferenceExperimentRequest": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"},
-            {"name": "Type", "shape": "InferenceExperimentType", "type": "string"},
-            {
-                "name": "Schedule",
-                "shape": "InferenceExperimentSchedule",
-                "type": "structure",
-            },
-            {
-                "name": "Description",
-                "shape": "InferenceExperimentDescription",
-                "type": "string",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "ModelVariants",
-                "shape": "ModelVariantConfigList",
-                "type": "list",
-            },
-            {
-                "name": "DataStorageConfig",
-                "shape": "InferenceExperimentDataStorageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ShadowModeConfig",
-                "shape": "ShadowModeConfig",
-                "type": "structure",
-            },
-            {"name": "KmsKey", "shape": "KmsKeyId", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateInferenceExperimentResponse": {
-        "members": [
-            {
-                "name": "InferenceExperimentArn",
-                "shape": "InferenceExperimentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateInferenceRecommendationsJobRequest": {
-        "members": [
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"},
-            {"name": "JobType", "shape": "RecommendationJobType", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "InputConfig",
-                "shape": "RecommendationJobInputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobDescription",
-                "shape": "RecommendationJobDescription",
-                "type": "string",
-            },
-            {
-                "name": "StoppingConditions",
-                "shape": "RecommendationJobStoppingConditions",
-                "type": "structure",
-            },
-            {
-                "name": "OutputConfig",
-                "shape": "RecommendationJobOutputConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateInferenceRecommendationsJobResponse": {
-        "members": [
-            {"name": "JobArn", "shape": "RecommendationJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateLabelingJobRequest": {
-        "members": [
-            {"name": "LabelingJobName", "shape": "LabelingJobName", "type": "string"},
-            {
-                "name": "LabelAttributeName",
-                "shape": "LabelAttributeName",
-                "type": "string",
-            },
-            {
-                "name": "InputConfig",
-                "shape": "LabelingJobInputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OutputConfig",
-                "shape": "LabelingJobOutputConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "LabelCategoryConfigS3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "StoppingConditions",
-                "shape": "LabelingJobStoppingConditions",
-                "type": "structure",
-            },
-            {
-                "name": "LabelingJobAlgorithmsConfig",
-                "shape": "LabelingJobAlgorithmsConfig",
-                "type": "structure",
-            },
-            {
-                "name": "HumanTaskConfig",
-                "shape": "HumanTaskConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateLabelingJobResponse": {
-        "members": [
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateModelBiasJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "ModelBiasBaselineConfig",
-                "shape": "ModelBiasBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelBiasAppSpecification",
-                "shape": "ModelBiasAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelBiasJobInput",
-                "shape": "ModelBiasJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "ModelBiasJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelBiasJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateModelCardExportJobRequest": {
-        "members": [
-            {"name": "ModelCardName", "shape": "ModelCardNameOrArn", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "ModelCardExportJobName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "OutputConfig",
-                "shape": "ModelCardExportOutputConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateModelCardExportJobResponse": {
-        "members": [
-            {
-                "name": "ModelCardExportJobArn",
-                "shape": "ModelCardExportJobArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateModelCardRequest": {
-        "members": [
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "SecurityConfig",
-                "shape": "ModelCardSecurityConfig",
-                "type": "structure",
-            },
-            {"name": "Content", "shape": "ModelCardContent", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelCardResponse": {
-        "members": [
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateModelExplainabilityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "ModelExplainabilityBaselineConfig",
-                "shape": "ModelExplainabilityBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelExplainabilityAppSpecification",
-                "shape": "ModelExplainabilityAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelExplainabilityJobInput",
-                "shape": "ModelExplainabilityJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "ModelExplainabilityJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelExplainabilityJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateModelInput": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "PrimaryContainer",
-                "shape": "ContainerDefinition",
-                "type": "structure",
-            },
-            {"name": "Containers", "shape": "ContainerDefinitionList", "type": "list"},
-            {
-                "name": "InferenceExecutionConfig",
-                "shape": "InferenceExecutionConfig",
-                "type": "structure",
-            },
-            {"name": "ExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelOutput": {
-        "members": [{"name": "ModelArn", "shape": "ModelArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateModelPackageGroupInput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageGroupDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelPackageGroupOutput": {
-        "members": [
-            {
-                "name": "ModelPackageGroupArn",
-                "shape": "ModelPackageGroupArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateModelPackageInput": {
-        "members": [
-            {"name": "ModelPackageName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelPackageGroupName", "shape": "ArnOrName", "type": "string"},
-            {
-                "name": "ModelPackageDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ValidationSpecification",
-                "shape": "ModelPackageValidationSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "SourceAlgorithmSpecification",
-                "shape": "SourceAlgorithmSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "CertifyForMarketplace",
-                "shape": "CertifyForMarketplace",
-                "type": "boolean",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "ModelMetrics", "shape": "ModelMetrics", "type": "structure"},
-            {"name": "ClientToken", "shape": "ClientToken", "type": "string"},
-            {"name": "Domain", "shape": "String", "type": "string"},
-            {"name": "Task", "shape": "String", "type": "string"},
-            {"name": "SamplePayloadUrl", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "CustomerMetadataProperties",
-                "shape": "CustomerMetadataMap",
-                "type": "map",
-            },
-            {
-                "name": "DriftCheckBaselines",
-                "shape": "DriftCheckBaselines",
-                "type": "structure",
-            },
-            {
-                "name": "AdditionalInferenceSpecifications",
-                "shape": "AdditionalInferenceSpecifications",
-                "type": "list",
-            },
-            {
-                "name": "SkipModelValidation",
-                "shape": "SkipModelValidation",
-                "type": "string",
-            },
-            {"name": "SourceUri", "shape": "ModelPackageSourceUri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelPackageOutput": {
-        "members": [
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateModelQualityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "ModelQualityBaselineConfig",
-                "shape": "ModelQualityBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQualityAppSpecification",
-                "shape": "ModelQualityAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQualityJobInput",
-                "shape": "ModelQualityJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQualityJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateModelQualityJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateMonitoringScheduleRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleConfig",
-                "shape": "MonitoringScheduleConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateMonitoringScheduleResponse": {
-        "members": [
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateNotebookInstanceInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            },
-            {"name": "InstanceType", "shape": "InstanceType", "type": "string"},
-            {"name": "SubnetId", "shape": "SubnetId", "type": "string"},
-            {"name": "SecurityGroupIds", "shape": "SecurityGroupIds", "type": "list"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "LifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "DirectInternetAccess",
-                "shape": "DirectInternetAccess",
-                "type": "string",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "NotebookInstanceVolumeSizeInGB",
-                "type": "integer",
-            },
-            {
-                "name": "AcceleratorTypes",
-                "shape": "NotebookInstanceAcceleratorTypes",
-                "type": "list",
-            },
-            {
-                "name": "DefaultCodeRepository",
-                "shape": "CodeRepositoryNameOrUrl",
-                "type": "string",
-            },
-            {
-                "name": "AdditionalCodeRepositories",
-                "shape": "AdditionalCodeRepositoryNamesOrUrls",
-                "type": "list",
-            },
-            {"name": "RootAccess", "shape": "RootAccess", "type": "string"},
-            {
-                "name": "PlatformIdentifier",
-                "shape": "PlatformIdentifier",
-                "type": "string",
-            },
-            {
-                "name": "InstanceMetadataServiceConfiguration",
-                "shape": "InstanceMetadataServiceConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateNotebookInstanceLifecycleConfigInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "OnCreate",
-                "shape": "NotebookInstanceLifecycleConfigList",
-                "type": "list",
-            },
-            {
-                "name": "OnStart",
-                "shape": "NotebookInstanceLifecycleConfigList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateNotebookInstanceLifecycleConfigOutput": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigArn",
-                "shape": "NotebookInstanceLifecycleConfigArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateNotebookInstanceOutput": {
-        "members": [
-            {
-                "name": "NotebookInstanceArn",
-                "shape": "NotebookInstanceArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreatePipelineRequest": {
-        "members": [
-            {"name": "PipelineName", "shape": "PipelineName", "type": "string"},
-            {"name": "PipelineDisplayName", "shape": "PipelineName", "type": "string"},
-            {
-                "name": "PipelineDefinition",
-                "shape": "PipelineDefinition",
-                "type": "string",
-            },
-            {
-                "name": "PipelineDefinitionS3Location",
-                "shape": "PipelineDefinitionS3Location",
-                "type": "structure",
-            },
-            {
-                "name": "PipelineDescription",
-                "shape": "PipelineDescription",
-                "type": "string",
-            },
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreatePipelineResponse": {
-        "members": [{"name": "PipelineArn", "shape": "PipelineArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreatePresignedDomainUrlRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {
-                "name": "SessionExpirationDurationInSeconds",
-                "shape": "SessionExpirationDurationInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "ExpiresInSeconds",
-                "shape": "ExpiresInSeconds",
-                "type": "integer",
-            },
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "LandingUri", "shape": "LandingUri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CreatePresignedDomainUrlResponse": {
-        "members": [
-            {"name": "AuthorizedUrl", "shape": "PresignedDomainUrl", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreatePresignedNotebookInstanceUrlInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            },
-            {
-                "name": "SessionExpirationDurationInSeconds",
-                "shape": "SessionExpirationDurationInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreatePresignedNotebookInstanceUrlOutput": {
-        "members": [
-            {"name": "AuthorizedUrl", "shape": "NotebookInstanceUrl", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateProcessingJobRequest": {
-        "members": [
-            {"name": "ProcessingInputs", "shape": "ProcessingInputs", "type": "list"},
-            {
-                "name": "ProcessingOutputConfig",
-                "shape": "ProcessingOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ProcessingJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ProcessingResources",
-                "shape": "ProcessingResources",
-                "type": "structure",
-            },
-            {
-                "name": "StoppingCondition",
-                "shape": "ProcessingStoppingCondition",
-                "type": "structure",
-            },
-            {
-                "name": "AppSpecification",
-                "shape": "AppSpecification",
-                "type": "structure",
-            },
-            {"name": "Environment", "shape": "ProcessingEnvironmentMap", "type": "map"},
-            {"name": "NetworkConfig", "shape": "NetworkConfig", "type": "structure"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateProcessingJobResponse": {
-        "members": [
-            {"name": "ProcessingJobArn", "shape": "ProcessingJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateProjectInput": {
-        "members": [
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"},
-            {
-                "name": "ProjectDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {
-                "name": "ServiceCatalogProvisioningDetails",
-                "shape": "ServiceCatalogProvisioningDetails",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateProjectOutput": {
-        "members": [
-            {"name": "ProjectArn", "shape": "ProjectArn", "type": "string"},
-            {"name": "ProjectId", "shape": "ProjectId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CreateSpaceRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "SpaceSettings", "shape": "SpaceSettings", "type": "structure"},
-            {
-                "name": "OwnershipSettings",
-                "shape": "OwnershipSettings",
-                "type": "structure",
-            },
-            {
-                "name": "SpaceSharingSettings",
-                "shape": "SpaceSharingSettings",
-                "type": "structure",
-            },
-            {"name": "SpaceDisplayName", "shape": "NonEmptyString64", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "CreateSpaceResponse": {
-        "members": [{"name": "SpaceArn", "shape": "SpaceArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateStudioLifecycleConfigRequest": {
-        "members": [
-            {
-                "name": "StudioLifecycleConfigName",
-                "shape": "StudioLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "StudioLifecycleConfigContent",
-                "shape": "StudioLifecycleConfigContent",
-                "type": "string",
-            },
-            {
-                "name": "StudioLifecycleConfigAppType",
-                "shape": "StudioLifecycleConfigAppType",
-                "type": "string",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateStudioLifecycleConfigResponse": {
-        "members": [
-            {
-                "name": "StudioLifecycleConfigArn",
-                "shape": "StudioLifecycleConfigArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateTrainingJobRequest": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"},
-            {"name": "HyperParameters", "shape": "HyperParameters", "type": "map"},
-            {
-                "name": "AlgorithmSpecification",
-                "shape": "AlgorithmSpecification",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "InputDataConfig", "shape": "InputDataConfig", "type": "list"},
-            {
-                "name": "OutputDataConfig",
-                "shape": "OutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "ResourceConfig", "shape": "ResourceConfig", "type": "structure"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "EnableManagedSpotTraining",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "CheckpointConfig",
-                "shape": "CheckpointConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DebugHookConfig",
-                "shape": "DebugHookConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DebugRuleConfigurations",
-                "shape": "DebugRuleConfigurations",
-                "type": "list",
-            },
-            {
-                "name": "TensorBoardOutputConfig",
-                "shape": "TensorBoardOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-            {"name": "ProfilerConfig", "shape": "ProfilerConfig", "type": "structure"},
-            {
-                "name": "ProfilerRuleConfigurations",
-                "shape": "ProfilerRuleConfigurations",
-                "type": "list",
-            },
-            {"name": "Environment", "shape": "TrainingEnvironmentMap", "type": "map"},
-            {"name": "RetryStrategy", "shape": "RetryStrategy", "type": "structure"},
-            {
-                "name": "RemoteDebugConfig",
-                "shape": "RemoteDebugConfig",
-                "type": "structure",
-            },
-            {
-                "name": "InfraCheckConfig",
-                "shape": "InfraCheckConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateTrainingJobResponse": {
-        "members": [
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateTransformJobRequest": {
-        "members": [
-            {"name": "TransformJobName", "shape": "TransformJobName", "type": "string"},
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "MaxConcurrentTransforms",
-                "shape": "MaxConcurrentTransforms",
-                "type": "integer",
-            },
-            {
-                "name": "ModelClientConfig",
-                "shape": "ModelClientConfig",
-                "type": "structure",
-            },
-            {"name": "MaxPayloadInMB", "shape": "MaxPayloadInMB", "type": "integer"},
-            {"name": "BatchStrategy", "shape": "BatchStrategy", "type": "string"},
-            {"name": "Environment", "shape": "TransformEnvironmentMap", "type": "map"},
-            {"name": "TransformInput", "shape": "TransformInput", "type": "structure"},
-            {
-                "name": "TransformOutput",
-                "shape": "TransformOutput",
-                "type": "structure",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "BatchDataCaptureConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TransformResources",
-                "shape": "TransformResources",
-                "type": "structure",
-            },
-            {"name": "DataProcessing", "shape": "DataProcessing", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateTransformJobResponse": {
-        "members": [
-            {"name": "TransformJobArn", "shape": "TransformJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateTrialComponentRequest": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Status", "shape": "TrialComponentStatus", "type": "structure"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Parameters", "shape": "TrialComponentParameters", "type": "map"},
-            {
-                "name": "InputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "OutputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateTrialComponentResponse": {
-        "members": [
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "CreateTrialRequest": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateTrialResponse": {
-        "members": [{"name": "TrialArn", "shape": "TrialArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CreateUserProfileRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {
-                "name": "SingleSignOnUserIdentifier",
-                "shape": "SingleSignOnUserIdentifier",
-                "type": "string",
-            },
-            {"name": "SingleSignOnUserValue", "shape": "String256", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "UserSettings", "shape": "UserSettings", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "CreateUserProfileResponse": {
-        "members": [
-            {"name": "UserProfileArn", "shape": "UserProfileArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateWorkforceRequest": {
-        "members": [
-            {"name": "CognitoConfig", "shape": "CognitoConfig", "type": "structure"},
-            {"name": "OidcConfig", "shape": "OidcConfig", "type": "structure"},
-            {"name": "SourceIpConfig", "shape": "SourceIpConfig", "type": "structure"},
-            {"name": "WorkforceName", "shape": "WorkforceName", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "WorkforceVpcConfig",
-                "shape": "WorkforceVpcConfigRequest",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "CreateWorkforceResponse": {
-        "members": [
-            {"name": "WorkforceArn", "shape": "WorkforceArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "CreateWorkteamRequest": {
-        "members": [
-            {"name": "WorkteamName", "shape": "WorkteamName", "type": "string"},
-            {"name": "WorkforceName", "shape": "WorkforceName", "type": "string"},
-            {"name": "MemberDefinitions", "shape": "MemberDefinitions", "type": "list"},
-            {"name": "Description", "shape": "String200", "type": "string"},
-            {
-                "name": "NotificationConfiguration",
-                "shape": "NotificationConfiguration",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "CreateWorkteamResponse": {
-        "members": [{"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"}],
-        "type": "structure",
-    },
-    "CsvContentTypes": {
-        "member_shape": "CsvContentType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "CustomFileSystem": {
-        "members": [
-            {"name": "EFSFileSystem", "shape": "EFSFileSystem", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "CustomFileSystemConfig": {
-        "members": [
-            {
-                "name": "EFSFileSystemConfig",
-                "shape": "EFSFileSystemConfig",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "CustomFileSystemConfigs": {
-        "member_shape": "CustomFileSystemConfig",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CustomFileSystems": {
-        "member_shape": "CustomFileSystem",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CustomImage": {
-        "members": [
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {
-                "name": "ImageVersionNumber",
-                "shape": "ImageVersionNumber",
-                "type": "integer",
-            },
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "CustomImageContainerArguments": {
-        "member_shape": "NonEmptyString64",
-        "member_type": "string",
-        "type": "list",
-    },
-    "CustomImageContainerEntrypoint": {
-        "member_shape": "NonEmptyString256",
-        "member_type": "string",
-        "type": "list",
-    },
-    "CustomImageContainerEnvironmentVariables": {
-        "key_shape": "NonEmptyString256",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "String256",
-        "value_type": "string",
-    },
-    "CustomImages": {
-        "member_shape": "CustomImage",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "CustomPosixUserConfig": {
-        "members": [
-            {"name": "Uid", "shape": "Uid", "type": "long"},
-            {"name": "Gid", "shape": "Gid", "type": "long"},
-        ],
-        "type": "structure",
-    },
-    "CustomerMetadataKeyList": {
-        "member_shape": "CustomerMetadataKey",
-        "member_type": "string",
-        "type": "list",
-    },
-    "CustomerMetadataMap": {
-        "key_shape": "CustomerMetadataKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "CustomerMetadataValue",
-        "value_type": "string",
-    },
-    "CustomizedMetricSpecification": {
-        "members": [
-            {"name": "MetricName", "shape": "String", "type": "string"},
-            {"name": "Namespace", "shape": "String", "type": "string"},
-            {"name": "Statistic", "shape": "Statistic", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DataCaptureConfig": {
-        "members": [
-            {"name": "EnableCapture", "shape": "EnableCapture", "type": "boolean"},
-            {
-                "name": "InitialSamplingPercentage",
-                "shape": "SamplingPercentage",
-                "type": "integer",
-            },
-            {"name": "DestinationS3Uri", "shape": "DestinationS3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "CaptureOptions", "shape": "CaptureOptionList", "type": "list"},
-            {
-                "name": "CaptureContentTypeHeader",
-                "shape": "CaptureContentTypeHeader",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DataCaptureConfigSummary": {
-        "members": [
-            {"name": "EnableCapture", "shape": "EnableCapture", "type": "boolean"},
-            {"name": "CaptureStatus", "shape": "CaptureStatus", "type": "string"},
-            {
-                "name": "CurrentSamplingPercentage",
-                "shape": "SamplingPercentage",
-                "type": "integer",
-            },
-            {"name": "DestinationS3Uri", "shape": "DestinationS3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DataCatalogConfig": {
-        "members": [
-            {"name": "TableName", "shape": "TableName", "type": "string"},
-            {"name": "Catalog", "shape": "Catalog", "type": "string"},
-            {"name": "Database", "shape": "Database", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DataProcessing": {
-        "members": [
-            {"name": "InputFilter", "shape": "JsonPath", "type": "string"},
-            {"name": "OutputFilter", "shape": "JsonPath", "type": "string"},
-            {"name": "JoinSource", "shape": "JoinSource", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DataQualityAppSpecification": {
-        "members": [
-            {"name": "ImageUri", "shape": "ImageUri", "type": "string"},
-            {
-                "name": "ContainerEntrypoint",
-                "shape": "ContainerEntrypoint",
-                "type": "list",
-            },
-            {
-                "name": "ContainerArguments",
-                "shape": "MonitoringContainerArguments",
-                "type": "list",
-            },
-            {"name": "RecordPreprocessorSourceUri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "PostAnalyticsProcessorSourceUri",
-                "shape": "S3Uri",
-                "type": "string",
-            },
-            {"name": "Environment", "shape": "MonitoringEnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "DataQualityBaselineConfig": {
-        "members": [
-            {
-                "name": "BaseliningJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ConstraintsResource",
-                "shape": "MonitoringConstraintsResource",
-                "type": "structure",
-            },
-            {
-                "name": "StatisticsResource",
-                "shape": "MonitoringStatisticsResource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DataQualityJobInput": {
-        "members": [
-            {"name": "EndpointInput", "shape": "EndpointInput", "type": "structure"},
-            {
-                "name": "BatchTransformInput",
-                "shape": "BatchTransformInput",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DataSource": {
-        "members": [
-            {"name": "S3DataSource", "shape": "S3DataSource", "type": "structure"},
-            {
-                "name": "FileSystemDataSource",
-                "shape": "FileSystemDataSource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DatasetDefinition": {
-        "members": [
-            {
-                "name": "AthenaDatasetDefinition",
-                "shape": "AthenaDatasetDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "RedshiftDatasetDefinition",
-                "shape": "RedshiftDatasetDefinition",
-                "type": "structure",
-            },
-            {"name": "LocalPath", "shape": "ProcessingLocalPath", "type": "string"},
-            {
-                "name": "DataDistributionType",
-                "shape": "DataDistributionType",
-                "type": "string",
-            },
-            {"name": "InputMode", "shape": "InputMode", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DebugHookConfig": {
-        "members": [
-            {"name": "LocalPath", "shape": "DirectoryPath", "type": "string"},
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "HookParameters", "shape": "HookParameters", "type": "map"},
-            {
-                "name": "CollectionConfigurations",
-                "shape": "CollectionConfigurations",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "DebugRuleConfiguration": {
-        "members": [
-            {
-                "name": "RuleConfigurationName",
-                "shape": "RuleConfigurationName",
-                "type": "string",
-            },
-            {"name": "LocalPath", "shape": "DirectoryPath", "type": "string"},
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "RuleEvaluatorImage", "shape": "AlgorithmImage", "type": "string"},
-            {
-                "name": "InstanceType",
-                "shape": "ProcessingInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "OptionalVolumeSizeInGB",
-                "type": "integer",
-            },
-            {"name": "RuleParameters", "shape": "RuleParameters", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "DebugRuleConfigurations": {
-        "member_shape": "DebugRuleConfiguration",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DebugRuleEvaluationStatus": {
-        "members": [
-            {
-                "name": "RuleConfigurationName",
-                "shape": "RuleConfigurationName",
-                "type": "string",
-            },
-            {
-                "name": "RuleEvaluationJobArn",
-                "shape": "ProcessingJobArn",
-                "type": "string",
-            },
-            {
-                "name": "RuleEvaluationStatus",
-                "shape": "RuleEvaluationStatus",
-                "type": "string",
-            },
-            {"name": "StatusDetails", "shape": "StatusDetails", "type": "string"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DebugRuleEvaluationStatuses": {
-        "member_shape": "DebugRuleEvaluationStatus",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DefaultEbsStorageSettings": {
-        "members": [
-            {
-                "name": "DefaultEbsVolumeSizeInGb",
-                "shape": "SpaceEbsVolumeSizeInGb",
-                "type": "integer",
-            },
-            {
-                "name": "MaximumEbsVolumeSizeInGb",
-                "shape": "SpaceEbsVolumeSizeInGb",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "DefaultSpaceSettings": {
-        "members": [
-            {"name": "ExecutionRole", "shape": "RoleArn", "type": "string"},
-            {"name": "SecurityGroups", "shape": "SecurityGroupIds", "type": "list"},
-            {
-                "name": "JupyterServerAppSettings",
-                "shape": "JupyterServerAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "KernelGatewayAppSettings",
-                "shape": "KernelGatewayAppSettings",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DefaultSpaceStorageSettings": {
-        "members": [
-            {
-                "name": "DefaultEbsStorageSettings",
-                "shape": "DefaultEbsStorageSettings",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteActionRequest": {
-        "members": [
-            {"name": "ActionName", "shape": "ExperimentEntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteActionResponse": {
-        "members": [{"name": "ActionArn", "shape": "ActionArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteAlgorithmInput": {
-        "members": [{"name": "AlgorithmName", "shape": "EntityName", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteAppImageConfigRequest": {
-        "members": [
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteAppRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {"name": "AppName", "shape": "AppName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeleteArtifactRequest": {
-        "members": [
-            {"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"},
-            {"name": "Source", "shape": "ArtifactSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DeleteArtifactResponse": {
-        "members": [{"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteAssociationRequest": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeleteAssociationResponse": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeleteClusterRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterNameOrArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteClusterResponse": {
-        "members": [{"name": "ClusterArn", "shape": "ClusterArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteCodeRepositoryInput": {
-        "members": [
-            {"name": "CodeRepositoryName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteCompilationJobRequest": {
-        "members": [
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteContextRequest": {
-        "members": [{"name": "ContextName", "shape": "ContextName", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteContextResponse": {
-        "members": [{"name": "ContextArn", "shape": "ContextArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteDataQualityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteDeviceFleetRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteDomainRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {
-                "name": "RetentionPolicy",
-                "shape": "RetentionPolicy",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeleteEdgeDeploymentPlanRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteEdgeDeploymentStageRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeleteEndpointConfigInput": {
-        "members": [
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteEndpointInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteExperimentRequest": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteExperimentResponse": {
-        "members": [
-            {"name": "ExperimentArn", "shape": "ExperimentArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteFeatureGroupRequest": {
-        "members": [
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteFlowDefinitionRequest": {
-        "members": [
-            {
-                "name": "FlowDefinitionName",
-                "shape": "FlowDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteFlowDefinitionResponse": {"members": [], "type": "structure"},
-    "DeleteHubContentRequest": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {"name": "HubContentName", "shape": "HubContentName", "type": "string"},
-            {
-                "name": "HubContentVersion",
-                "shape": "HubContentVersion",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeleteHubRequest": {
-        "members": [{"name": "HubName", "shape": "HubName", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteHumanTaskUiRequest": {
-        "members": [
-            {"name": "HumanTaskUiName", "shape": "HumanTaskUiName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteHumanTaskUiResponse": {"members": [], "type": "structure"},
-    "DeleteHyperParameterTuningJobRequest": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteImageRequest": {
-        "members": [{"name": "ImageName", "shape": "ImageName", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteImageResponse": {"members": [], "type": "structure"},
-    "DeleteImageVersionRequest": {
-        "members": [
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "Version", "shape": "ImageVersionNumber", "type": "integer"},
-            {"name": "Alias", "shape": "SageMakerImageVersionAlias", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeleteImageVersionResponse": {"members": [], "type": "structure"},
-    "DeleteInferenceComponentInput": {
-        "members": [
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteInferenceExperimentRequest": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteInferenceExperimentResponse": {
-        "members": [
-            {
-                "name": "InferenceExperimentArn",
-                "shape": "InferenceExperimentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteModelBiasJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteModelCardRequest": {
-        "members": [{"name": "ModelCardName", "shape": "EntityName", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteModelExplainabilityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteModelInput": {
-        "members": [{"name": "ModelName", "shape": "ModelName", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteModelPackageGroupInput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "ArnOrName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteModelPackageGroupPolicyInput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteModelPackageInput": {
-        "members": [
-            {
-                "name": "ModelPackageName",
-                "shape": "VersionedArnOrName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteModelQualityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteMonitoringScheduleRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteNotebookInstanceInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteNotebookInstanceLifecycleConfigInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeletePipelineRequest": {
-        "members": [
-            {"name": "PipelineName", "shape": "PipelineName", "type": "string"},
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeletePipelineResponse": {
-        "members": [{"name": "PipelineArn", "shape": "PipelineArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteProjectInput": {
-        "members": [
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteSpaceRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeleteStudioLifecycleConfigRequest": {
-        "members": [
-            {
-                "name": "StudioLifecycleConfigName",
-                "shape": "StudioLifecycleConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteTagsInput": {
-        "members": [
-            {"name": "ResourceArn", "shape": "ResourceArn", "type": "string"},
-            {"name": "TagKeys", "shape": "TagKeyList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "DeleteTagsOutput": {"members": [], "type": "structure"},
-    "DeleteTrialComponentRequest": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteTrialComponentResponse": {
-        "members": [
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DeleteTrialRequest": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteTrialResponse": {
-        "members": [{"name": "TrialArn", "shape": "TrialArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DeleteUserProfileRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeleteWorkforceRequest": {
-        "members": [
-            {"name": "WorkforceName", "shape": "WorkforceName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteWorkforceResponse": {"members": [], "type": "structure"},
-    "DeleteWorkteamRequest": {
-        "members": [
-            {"name": "WorkteamName", "shape": "WorkteamName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DeleteWorkteamResponse": {
-        "members": [{"name": "Success", "shape": "Success", "type": "boolean"}],
-        "type": "structure",
-    },
-    "DeployedImage": {
-        "members": [
-            {"name": "SpecifiedImage", "shape": "ContainerImage", "type": "string"},
-            {"name": "ResolvedImage", "shape": "ContainerImage", "type": "string"},
-            {"name": "ResolutionTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DeployedImages": {
-        "member_shape": "DeployedImage",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DeploymentConfig": {
-        "members": [
-            {
-                "name": "BlueGreenUpdatePolicy",
-                "shape": "BlueGreenUpdatePolicy",
-                "type": "structure",
-            },
-            {
-                "name": "RollingUpdatePolicy",
-                "shape": "RollingUpdatePolicy",
-                "type": "structure",
-            },
-            {
-                "name": "AutoRollbackConfiguration",
-                "shape": "AutoRollbackConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeploymentRecommendation": {
-        "members": [
-            {
-                "name": "RecommendationStatus",
-                "shape": "RecommendationStatus",
-                "type": "string",
-            },
-            {
-                "name": "RealTimeInferenceRecommendations",
-                "shape": "RealTimeInferenceRecommendations",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeploymentStage": {
-        "members": [
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "DeviceSelectionConfig",
-                "shape": "DeviceSelectionConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DeploymentConfig",
-                "shape": "EdgeDeploymentConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeploymentStageStatusSummaries": {
-        "member_shape": "DeploymentStageStatusSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DeploymentStageStatusSummary": {
-        "members": [
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "DeviceSelectionConfig",
-                "shape": "DeviceSelectionConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DeploymentConfig",
-                "shape": "EdgeDeploymentConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DeploymentStatus",
-                "shape": "EdgeDeploymentStatus",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DeploymentStages": {
-        "member_shape": "DeploymentStage",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DeregisterDevicesRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceNames", "shape": "DeviceNames", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "DerivedInformation": {
-        "members": [
-            {
-                "name": "DerivedDataInputConfig",
-                "shape": "DataInputConfig",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeActionRequest": {
-        "members": [
-            {
-                "name": "ActionName",
-                "shape": "ExperimentEntityNameOrArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeActionResponse": {
-        "members": [
-            {
-                "name": "ActionName",
-                "shape": "ExperimentEntityNameOrArn",
-                "type": "string",
-            },
-            {"name": "ActionArn", "shape": "ActionArn", "type": "string"},
-            {"name": "Source", "shape": "ActionSource", "type": "structure"},
-            {"name": "ActionType", "shape": "String256", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Status", "shape": "ActionStatus", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeAlgorithmInput": {
-        "members": [{"name": "AlgorithmName", "shape": "ArnOrName", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeAlgorithmOutput": {
-        "members": [
-            {"name": "AlgorithmName", "shape": "EntityName", "type": "string"},
-            {"name": "AlgorithmArn", "shape": "AlgorithmArn", "type": "string"},
-            {
-                "name": "AlgorithmDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "TrainingSpecification",
-                "shape": "TrainingSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ValidationSpecification",
-                "shape": "AlgorithmValidationSpecification",
-                "type": "structure",
-            },
-            {"name": "AlgorithmStatus", "shape": "AlgorithmStatus", "type": "string"},
-            {
-                "name": "AlgorithmStatusDetails",
-                "shape": "AlgorithmStatusDetails",
-                "type": "structure",
-            },
-            {"name": "ProductId", "shape": "ProductId", "type": "string"},
-            {
-                "name": "CertifyForMarketplace",
-                "shape": "CertifyForMarketplace",
-                "type": "boolean",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeAppImageConfigRequest": {
-        "members": [
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeAppImageConfigResponse": {
-        "members": [
-            {
-                "name": "AppImageConfigArn",
-                "shape": "AppImageConfigArn",
-                "type": "string",
-            },
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "KernelGatewayImageConfig",
-                "shape": "KernelGatewayImageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterLabAppImageConfig",
-                "shape": "JupyterLabAppImageConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeAppRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {"name": "AppName", "shape": "AppName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeAppResponse": {
-        "members": [
-            {"name": "AppArn", "shape": "AppArn", "type": "string"},
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {"name": "AppName", "shape": "AppName", "type": "string"},
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "Status", "shape": "AppStatus", "type": "string"},
-            {
-                "name": "LastHealthCheckTimestamp",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastUserActivityTimestamp",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ResourceSpec", "shape": "ResourceSpec", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeArtifactRequest": {
-        "members": [{"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeArtifactResponse": {
-        "members": [
-            {
-                "name": "ArtifactName",
-                "shape": "ExperimentEntityNameOrArn",
-                "type": "string",
-            },
-            {"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"},
-            {"name": "Source", "shape": "ArtifactSource", "type": "structure"},
-            {"name": "ArtifactType", "shape": "String256", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeAutoMLJobRequest": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeAutoMLJobResponse": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {
-                "name": "InputDataConfig",
-                "shape": "AutoMLInputDataConfig",
-                "type": "list",
-            },
-            {
-                "name": "OutputDataConfig",
-                "shape": "AutoMLOutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "AutoMLJobObjective",
-                "shape": "AutoMLJobObjective",
-                "type": "structure",
-            },
-            {"name": "ProblemType", "shape": "ProblemType", "type": "string"},
-            {
-                "name": "AutoMLJobConfig",
-                "shape": "AutoMLJobConfig",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "AutoMLFailureReason", "type": "string"},
-            {
-                "name": "PartialFailureReasons",
-                "shape": "AutoMLPartialFailureReasons",
-                "type": "list",
-            },
-            {"name": "BestCandidate", "shape": "AutoMLCandidate", "type": "structure"},
-            {"name": "AutoMLJobStatus", "shape": "AutoMLJobStatus", "type": "string"},
-            {
-                "name": "AutoMLJobSecondaryStatus",
-                "shape": "AutoMLJobSecondaryStatus",
-                "type": "string",
-            },
-            {
-                "name": "GenerateCandidateDefinitionsOnly",
-                "shape": "GenerateCandidateDefinitionsOnly",
-                "type": "boolean",
-            },
-            {
-                "name": "AutoMLJobArtifacts",
-                "shape": "AutoMLJobArtifacts",
-                "type": "structure",
-            },
-            {
-                "name": "ResolvedAttributes",
-                "shape": "ResolvedAttributes",
-                "type": "structure",
-            },
-            {
-                "name": "ModelDeployConfig",
-                "shape": "ModelDeployConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelDeployResult",
-                "shape": "ModelDeployResult",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeAutoMLJobV2Request": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeAutoMLJobV2Response": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {
-                "name": "AutoMLJobInputDataConfig",
-                "shape": "AutoMLJobInputDataConfig",
-                "type": "list",
-            },
-            {
-                "name": "OutputDataConfig",
-                "shape": "AutoMLOutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "AutoMLJobObjective",
-                "shape": "AutoMLJobObjective",
-                "type": "structure",
-            },
-            {
-                "name": "AutoMLProblemTypeConfig",
-                "shape": "AutoMLProblemTypeConfig",
-                "type": "structure",
-            },
-            {
-                "name": "AutoMLProblemTypeConfigName",
-                "shape": "AutoMLProblemTypeConfigName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "AutoMLFailureReason", "type": "string"},
-            {
-                "name": "PartialFailureReasons",
-                "shape": "AutoMLPartialFailureReasons",
-                "type": "list",
-            },
-            {"name": "BestCandidate", "shape": "AutoMLCandidate", "type": "structure"},
-            {"name": "AutoMLJobStatus", "shape": "AutoMLJobStatus", "type": "string"},
-            {
-                "name": "AutoMLJobSecondaryStatus",
-                "shape": "AutoMLJobSecondaryStatus",
-                "type": "string",
-            },
-            {
-                "name": "AutoMLJobArtifacts",
-                "shape": "AutoMLJobArtifacts",
-                "type": "structure",
-            },
-            {
-                "name": "ResolvedAttributes",
-                "shape": "AutoMLResolvedAttributes",
-                "type": "structure",
-            },
-            {
-                "name": "ModelDeployConfig",
-                "shape": "ModelDeployConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelDeployResult",
-                "shape": "ModelDeployResult",
-                "type": "structure",
-            },
-            {
-                "name": "DataSplitConfig",
-                "shape": "AutoMLDataSplitConfig",
-                "type": "structure",
-            },
-            {
-                "name": "SecurityConfig",
-                "shape": "AutoMLSecurityConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeClusterNodeRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterNameOrArn", "type": "string"},
-            {"name": "NodeId", "shape": "ClusterNodeId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeClusterNodeResponse": {
-        "members": [
-            {"name": "NodeDetails", "shape": "ClusterNodeDetails", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "DescribeClusterRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterNameOrArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeClusterResponse": {
-        "members": [
-            {"name": "ClusterArn", "shape": "ClusterArn", "type": "string"},
-            {"name": "ClusterName", "shape": "ClusterName", "type": "string"},
-            {"name": "ClusterStatus", "shape": "ClusterStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureMessage", "shape": "String", "type": "string"},
-            {
-                "name": "InstanceGroups",
-                "shape": "ClusterInstanceGroupDetailsList",
-                "type": "list",
-            },
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeCodeRepositoryInput": {
-        "members": [
-            {"name": "CodeRepositoryName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeCodeRepositoryOutput": {
-        "members": [
-            {"name": "CodeRepositoryName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "CodeRepositoryArn",
-                "shape": "CodeRepositoryArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "GitConfig", "shape": "GitConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeCompilationJobRequest": {
-        "members": [
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeCompilationJobResponse": {
-        "members": [
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "CompilationJobArn",
-                "shape": "CompilationJobArn",
-                "type": "string",
-            },
-            {
-                "name": "CompilationJobStatus",
-                "shape": "CompilationJobStatus",
-                "type": "string",
-            },
-            {"name": "CompilationStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CompilationEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-            {"name": "InferenceImage", "shape": "InferenceImage", "type": "string"},
-            {
-                "name": "ModelPackageVersionArn",
-                "shape": "ModelPackageArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ModelArtifacts", "shape": "ModelArtifacts", "type": "structure"},
-            {"name": "ModelDigests", "shape": "ModelDigests", "type": "structure"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "InputConfig", "shape": "InputConfig", "type": "structure"},
-            {"name": "OutputConfig", "shape": "OutputConfig", "type": "structure"},
-            {"name": "VpcConfig", "shape": "NeoVpcConfig", "type": "structure"},
-            {
-                "name": "DerivedInformation",
-                "shape": "DerivedInformation",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeContextRequest": {
-        "members": [
-            {"name": "ContextName", "shape": "ContextNameOrArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeContextResponse": {
-        "members": [
-            {"name": "ContextName", "shape": "ContextName", "type": "string"},
-            {"name": "ContextArn", "shape": "ContextArn", "type": "string"},
-            {"name": "Source", "shape": "ContextSource", "type": "structure"},
-            {"name": "ContextType", "shape": "String256", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeDataQualityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeDataQualityJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            },
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "DataQualityBaselineConfig",
-                "shape": "DataQualityBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DataQualityAppSpecification",
-                "shape": "DataQualityAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "DataQualityJobInput",
-                "shape": "DataQualityJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "DataQualityJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeDeviceFleetRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeDeviceFleetResponse": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceFleetArn", "shape": "DeviceFleetArn", "type": "string"},
-            {"name": "OutputConfig", "shape": "EdgeOutputConfig", "type": "structure"},
-            {
-                "name": "Description",
-                "shape": "DeviceFleetDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "IotRoleAlias", "shape": "IotRoleAlias", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeDeviceRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "DeviceName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeDeviceResponse": {
-        "members": [
-            {"name": "DeviceArn", "shape": "DeviceArn", "type": "string"},
-            {"name": "DeviceName", "shape": "EntityName", "type": "string"},
-            {"name": "Description", "shape": "DeviceDescription", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "IotThingName", "shape": "ThingName", "type": "string"},
-            {"name": "RegistrationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LatestHeartbeat", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Models", "shape": "EdgeModels", "type": "list"},
-            {"name": "MaxModels", "shape": "Integer", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "AgentVersion", "shape": "EdgeVersion", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeDomainRequest": {
-        "members": [{"name": "DomainId", "shape": "DomainId", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeDomainResponse": {
-        "members": [
-            {"name": "DomainArn", "shape": "DomainArn", "type": "string"},
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "DomainName", "shape": "DomainName", "type": "string"},
-            {"name": "HomeEfsFileSystemId", "shape": "ResourceId", "type": "string"},
-            {
-                "name": "SingleSignOnManagedApplicationInstanceId",
-                "shape": "String256",
-                "type": "string",
-            },
-            {
-                "name": "SingleSignOnApplicationArn",
-                "shape": "SingleSignOnApplicationArn",
-                "type": "string",
-            },
-            {"name": "Status", "shape": "DomainStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "SecurityGroupIdForDomainBoundary",
-                "shape": "SecurityGroupId",
-                "type": "string",
-            },
-            {"name": "AuthMode", "shape": "AuthMode", "type": "string"},
-            {
-                "name": "DefaultUserSettings",
-                "shape": "UserSettings",
-                "type": "structure",
-            },
-            {"name": "DomainSettings", "shape": "DomainSettings", "type": "structure"},
-            {
-                "name": "AppNetworkAccessType",
-                "shape": "AppNetworkAccessType",
-                "type": "string",
-            },
-            {
-                "name": "HomeEfsFileSystemKmsKeyId",
-                "shape": "KmsKeyId",
-                "type": "string",
-            },
-            {"name": "SubnetIds", "shape": "Subnets", "type": "list"},
-            {"name": "Url", "shape": "String1024", "type": "string"},
-            {"name": "VpcId", "shape": "VpcId", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "AppSecurityGroupManagement",
-                "shape": "AppSecurityGroupManagement",
-                "type": "string",
-            },
-            {
-                "name": "DefaultSpaceSettings",
-                "shape": "DefaultSpaceSettings",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeEdgeDeploymentPlanRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "MaxResults",
-                "shape": "DeploymentStageMaxResults",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeEdgeDeploymentPlanResponse": {
-        "members": [
-            {
-                "name": "EdgeDeploymentPlanArn",
-                "shape": "EdgeDeploymentPlanArn",
-                "type": "string",
-            },
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelConfigs",
-                "shape": "EdgeDeploymentModelConfigs",
-                "type": "list",
-            },
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "EdgeDeploymentSuccess", "shape": "Integer", "type": "integer"},
-            {"name": "EdgeDeploymentPending", "shape": "Integer", "type": "integer"},
-            {"name": "EdgeDeploymentFailed", "shape": "Integer", "type": "integer"},
-            {
-                "name": "Stages",
-                "shape": "DeploymentStageStatusSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DescribeEdgePackagingJobRequest": {
-        "members": [
-            {"name": "EdgePackagingJobName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeEdgePackagingJobResponse": {
-        "members": [
-            {
-                "name": "EdgePackagingJobArn",
-                "shape": "EdgePackagingJobArn",
-                "type": "string",
-            },
-            {"name": "EdgePackagingJobName", "shape": "EntityName", "type": "string"},
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelVersion", "shape": "EdgeVersion", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "OutputConfig", "shape": "EdgeOutputConfig", "type": "structure"},
-            {"name": "ResourceKey", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "EdgePackagingJobStatus",
-                "shape": "EdgePackagingJobStatus",
-                "type": "string",
-            },
-            {
-                "name": "EdgePackagingJobStatusMessage",
-                "shape": "String",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModelArtifact", "shape": "S3Uri", "type": "string"},
-            {"name": "ModelSignature", "shape": "String", "type": "string"},
-            {
-                "name": "PresetDeploymentOutput",
-                "shape": "EdgePresetDeploymentOutput",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeEndpointConfigInput": {
-        "members": [
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeEndpointConfigOutput": {
-        "members": [
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "EndpointConfigArn",
-                "shape": "EndpointConfigArn",
-                "type": "string",
-            },
-            {
-                "name": "ProductionVariants",
-                "shape": "ProductionVariantList",
-                "type": "list",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "DataCaptureConfig",
-                "type": "structure",
-            },
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "AsyncInferenceConfig",
-                "shape": "AsyncInferenceConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ExplainerConfig",
-                "shape": "ExplainerConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ShadowProductionVariants",
-                "shape": "ProductionVariantList",
-                "type": "list",
-            },
-            {"name": "ExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "DescribeEndpointInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeEndpointOutput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "EndpointArn", "shape": "EndpointArn", "type": "string"},
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "ProductionVariants",
-                "shape": "ProductionVariantSummaryList",
-                "type": "list",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "DataCaptureConfigSummary",
-                "type": "structure",
-            },
-            {"name": "EndpointStatus", "shape": "EndpointStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastDeploymentConfig",
-                "shape": "DeploymentConfig",
-                "type": "structure",
-            },
-            {
-                "name": "AsyncInferenceConfig",
-                "shape": "AsyncInferenceConfig",
-                "type": "structure",
-            },
-            {
-                "name": "PendingDeploymentSummary",
-                "shape": "PendingDeploymentSummary",
-                "type": "structure",
-            },
-            {
-                "name": "ExplainerConfig",
-                "shape": "ExplainerConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ShadowProductionVariants",
-                "shape": "ProductionVariantSummaryList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeExperimentRequest": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeExperimentResponse": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "ExperimentArn", "shape": "ExperimentArn", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "ExperimentSource", "type": "structure"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeFeatureGroupRequest": {
-        "members": [
-            {
-                "name": "FeatureGroupName",
-                "shape": "FeatureGroupNameOrArn",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeFeatureGroupResponse": {
-        "members": [
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"},
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"},
-            {
-                "name": "RecordIdentifierFeatureName",
-                "shape": "FeatureName",
-                "type": "string",
-            },
-            {"name": "EventTimeFeatureName", "shape": "FeatureName", "type": "string"},
-            {
-                "name": "FeatureDefinitions",
-                "shape": "FeatureDefinitions",
-                "type": "list",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "OnlineStoreConfig",
-                "shape": "OnlineStoreConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OfflineStoreConfig",
-                "shape": "OfflineStoreConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ThroughputConfig",
-                "shape": "ThroughputConfigDescription",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "FeatureGroupStatus",
-                "shape": "FeatureGroupStatus",
-                "type": "string",
-            },
-            {
-                "name": "OfflineStoreStatus",
-                "shape": "OfflineStoreStatus",
-                "type": "structure",
-            },
-            {
-                "name": "LastUpdateStatus",
-                "shape": "LastUpdateStatus",
-                "type": "structure",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "Description", "shape": "Description", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "OnlineStoreTotalSizeBytes",
-                "shape": "OnlineStoreTotalSizeBytes",
-                "type": "long",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeFeatureMetadataRequest": {
-        "members": [
-            {
-                "name": "FeatureGroupName",
-                "shape": "FeatureGroupNameOrArn",
-                "type": "string",
-            },
-            {"name": "FeatureName", "shape": "FeatureName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeFeatureMetadataResponse": {
-        "members": [
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"},
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"},
-            {"name": "FeatureName", "shape": "FeatureName", "type": "string"},
-            {"name": "FeatureType", "shape": "FeatureType", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "Description", "shape": "FeatureDescription", "type": "string"},
-            {"name": "Parameters", "shape": "FeatureParameters", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "DescribeFlowDefinitionRequest": {
-        "members": [
-            {
-                "name": "FlowDefinitionName",
-                "shape": "FlowDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeFlowDefinitionResponse": {
-        "members": [
-            {
-                "name": "FlowDefinitionArn",
-                "shape": "FlowDefinitionArn",
-                "type": "string",
-            },
-            {
-                "name": "FlowDefinitionName",
-                "shape": "FlowDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "FlowDefinitionStatus",
-                "shape": "FlowDefinitionStatus",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "HumanLoopRequestSource",
-                "shape": "HumanLoopRequestSource",
-                "type": "structure",
-            },
-            {
-                "name": "HumanLoopActivationConfig",
-                "shape": "HumanLoopActivationConfig",
-                "type": "structure",
-            },
-            {
-                "name": "HumanLoopConfig",
-                "shape": "HumanLoopConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OutputConfig",
-                "shape": "FlowDefinitionOutputConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeHubContentRequest": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {"name": "HubContentName", "shape": "HubContentName", "type": "string"},
-            {
-                "name": "HubContentVersion",
-                "shape": "HubContentVersion",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeHubContentResponse": {
-        "members": [
-            {"name": "HubContentName", "shape": "HubContentName", "type": "string"},
-            {"name": "HubContentArn", "shape": "HubContentArn", "type": "string"},
-            {
-                "name": "HubContentVersion",
-                "shape": "HubContentVersion",
-                "type": "string",
-            },
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {
-                "name": "DocumentSchemaVersion",
-                "shape": "DocumentSchemaVersion",
-                "type": "string",
-            },
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubArn", "shape": "HubArn", "type": "string"},
-            {
-                "name": "HubContentDisplayName",
-                "shape": "HubContentDisplayName",
-                "type": "string",
-            },
-            {
-                "name": "HubContentDescription",
-                "shape": "HubContentDescription",
-                "type": "string",
-            },
-            {
-                "name": "HubContentMarkdown",
-                "shape": "HubContentMarkdown",
-                "type": "string",
-            },
-            {
-                "name": "HubContentDocument",
-                "shape": "HubContentDocument",
-                "type": "string",
-            },
-            {
-                "name": "HubContentSearchKeywords",
-                "shape": "HubContentSearchKeywordList",
-                "type": "list",
-            },
-            {
-                "name": "HubContentDependencies",
-                "shape": "HubContentDependencyList",
-                "type": "list",
-            },
-            {"name": "HubContentStatus", "shape": "HubContentStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DescribeHubRequest": {
-        "members": [{"name": "HubName", "shape": "HubName", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeHubResponse": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubArn", "shape": "HubArn", "type": "string"},
-            {"name": "HubDisplayName", "shape": "HubDisplayName", "type": "string"},
-            {"name": "HubDescription", "shape": "HubDescription", "type": "string"},
-            {
-                "name": "HubSearchKeywords",
-                "shape": "HubSearchKeywordList",
-                "type": "list",
-            },
-            {
-                "name": "S3StorageConfig",
-                "shape": "HubS3StorageConfig",
-                "type": "structure",
-            },
-            {"name": "HubStatus", "shape": "HubStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DescribeHumanTaskUiRequest": {
-        "members": [
-            {"name": "HumanTaskUiName", "shape": "HumanTaskUiName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeHumanTaskUiResponse": {
-        "members": [
-            {"name": "HumanTaskUiArn", "shape": "HumanTaskUiArn", "type": "string"},
-            {"name": "HumanTaskUiName", "shape": "HumanTaskUiName", "type": "string"},
-            {
-                "name": "HumanTaskUiStatus",
-                "shape": "HumanTaskUiStatus",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "UiTemplate", "shape": "UiTemplateInfo", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeHyperParameterTuningJobRequest": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeHyperParameterTuningJobResponse": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobArn",
-                "shape": "HyperParameterTuningJobArn",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobConfig",
-                "shape": "HyperParameterTuningJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobDefinition",
-                "shape": "HyperParameterTrainingJobDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobDefinitions",
-                "shape": "HyperParameterTrainingJobDefinitions",
-                "type": "list",
-            },
-            {
-                "name": "HyperParameterTuningJobStatus",
-                "shape": "HyperParameterTuningJobStatus",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "HyperParameterTuningEndTime",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "TrainingJobStatusCounters",
-                "shape": "TrainingJobStatusCounters",
-                "type": "structure",
-            },
-            {
-                "name": "ObjectiveStatusCounters",
-                "shape": "ObjectiveStatusCounters",
-                "type": "structure",
-            },
-            {
-                "name": "BestTrainingJob",
-                "shape": "HyperParameterTrainingJobSummary",
-                "type": "structure",
-            },
-            {
-                "name": "OverallBestTrainingJob",
-                "shape": "HyperParameterTrainingJobSummary",
-                "type": "structure",
-            },
-            {
-                "name": "WarmStartConfig",
-                "shape": "HyperParameterTuningJobWarmStartConfig",
-                "type": "structure",
-            },
-            {"name": "Autotune", "shape": "Autotune", "type": "structure"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "TuningJobCompletionDetails",
-                "shape": "HyperParameterTuningJobCompletionDetails",
-                "type": "structure",
-            },
-            {
-                "name": "ConsumedResources",
-                "shape": "HyperParameterTuningJobConsumedResources",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeImageRequest": {
-        "members": [{"name": "ImageName", "shape": "ImageName", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeImageResponse": {
-        "members": [
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Description", "shape": "ImageDescription", "type": "string"},
-            {"name": "DisplayName", "shape": "ImageDisplayName", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ImageArn", "shape": "ImageArn", "type": "string"},
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "ImageStatus", "shape": "ImageStatus", "type": "string"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeImageVersionRequest": {
-        "members": [
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "Version", "shape": "ImageVersionNumber", "type": "integer"},
-            {"name": "Alias", "shape": "SageMakerImageVersionAlias", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeImageVersionResponse": {
-        "members": [
-            {"name": "BaseImage", "shape": "ImageBaseImage", "type": "string"},
-            {
-                "name": "ContainerImage",
-                "shape": "ImageContainerImage",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ImageArn", "shape": "ImageArn", "type": "string"},
-            {"name": "ImageVersionArn", "shape": "ImageVersionArn", "type": "string"},
-            {
-                "name": "ImageVersionStatus",
-                "shape": "ImageVersionStatus",
-                "type": "string",
-            },
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Version", "shape": "ImageVersionNumber", "type": "integer"},
-            {"name": "VendorGuidance", "shape": "VendorGuidance", "type": "string"},
-            {"name": "JobType", "shape": "JobType", "type": "string"},
-            {"name": "MLFramework", "shape": "MLFramework", "type": "string"},
-            {"name": "ProgrammingLang", "shape": "ProgrammingLang", "type": "string"},
-            {"name": "Processor", "shape": "Processor", "type": "string"},
-            {"name": "Horovod", "shape": "Horovod", "type": "boolean"},
-            {"name": "ReleaseNotes", "shape": "ReleaseNotes", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeInferenceComponentInput": {
-        "members": [
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeInferenceComponentOutput": {
-        "members": [
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            },
-            {
-                "name": "InferenceComponentArn",
-                "shape": "InferenceComponentArn",
-                "type": "string",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "EndpointArn", "shape": "EndpointArn", "type": "string"},
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "Specification",
-                "shape": "InferenceComponentSpecificationSummary",
-                "type": "structure",
-            },
-            {
-                "name": "RuntimeConfig",
-                "shape": "InferenceComponentRuntimeConfigSummary",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "InferenceComponentStatus",
-                "shape": "InferenceComponentStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeInferenceExperimentRequest": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeInferenceExperimentResponse": {
-        "members": [
-            {"name": "Arn", "shape": "InferenceExperimentArn", "type": "string"},
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"},
-            {"name": "Type", "shape": "InferenceExperimentType", "type": "string"},
-            {
-                "name": "Schedule",
-                "shape": "InferenceExperimentSchedule",
-                "type": "structure",
-            },
-            {"name": "Status", "shape": "InferenceExperimentStatus", "type": "string"},
-            {
-                "name": "StatusReason",
-                "shape": "InferenceExperimentStatusReason",
-                "type": "string",
-            },
-            {
-                "name": "Description",
-                "shape": "InferenceExperimentDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CompletionTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "EndpointMetadata",
-                "shape": "EndpointMetadata",
-                "type": "structure",
-            },
-            {
-                "name": "ModelVariants",
-                "shape": "ModelVariantConfigSummaryList",
-                "type": "list",
-            },
-            {
-                "name": "DataStorageConfig",
-                "shape": "InferenceExperimentDataStorageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ShadowModeConfig",
-                "shape": "ShadowModeConfig",
-                "type": "structure",
-            },
-            {"name": "KmsKey", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeInferenceRecommendationsJobRequest": {
-        "members": [
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeInferenceRecommendationsJobResponse": {
-        "members": [
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"},
-            {
-                "name": "JobDescription",
-                "shape": "RecommendationJobDescription",
-                "type": "string",
-            },
-            {"name": "JobType", "shape": "RecommendationJobType", "type": "string"},
-            {"name": "JobArn", "shape": "RecommendationJobArn", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "Status", "shape": "RecommendationJobStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "CompletionTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "InputConfig",
-                "shape": "RecommendationJobInputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "StoppingConditions",
-                "shape": "RecommendationJobStoppingConditions",
-                "type": "structure",
-            },
-            {
-                "name": "InferenceRecommendations",
-                "shape": "InferenceRecommendations",
-                "type": "list",
-            },
-            {
-                "name": "EndpointPerformances",
-                "shape": "EndpointPerformances",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeLabelingJobRequest": {
-        "members": [
-            {"name": "LabelingJobName", "shape": "LabelingJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeLabelingJobResponse": {
-        "members": [
-            {
-                "name": "LabelingJobStatus",
-                "shape": "LabelingJobStatus",
-                "type": "string",
-            },
-            {"name": "LabelCounters", "shape": "LabelCounters", "type": "structure"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "JobReferenceCode", "shape": "JobReferenceCode", "type": "string"},
-            {"name": "LabelingJobName", "shape": "LabelingJobName", "type": "string"},
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"},
-            {
-                "name": "LabelAttributeName",
-                "shape": "LabelAttributeName",
-                "type": "string",
-            },
-            {
-                "name": "InputConfig",
-                "shape": "LabelingJobInputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OutputConfig",
-                "shape": "LabelingJobOutputConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "LabelCategoryConfigS3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "StoppingConditions",
-                "shape": "LabelingJobStoppingConditions",
-                "type": "structure",
-            },
-            {
-                "name": "LabelingJobAlgorithmsConfig",
-                "shape": "LabelingJobAlgorithmsConfig",
-                "type": "structure",
-            },
-            {
-                "name": "HumanTaskConfig",
-                "shape": "HumanTaskConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "LabelingJobOutput",
-                "shape": "LabelingJobOutput",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeLineageGroupRequest": {
-        "members": [
-            {
-                "name": "LineageGroupName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeLineageGroupResponse": {
-        "members": [
-            {
-                "name": "LineageGroupName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeModelBiasJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeModelBiasJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            },
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "ModelBiasBaselineConfig",
-                "shape": "ModelBiasBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelBiasAppSpecification",
-                "shape": "ModelBiasAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelBiasJobInput",
-                "shape": "ModelBiasJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "ModelBiasJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeModelCardExportJobRequest": {
-        "members": [
-            {
-                "name": "ModelCardExportJobArn",
-                "shape": "ModelCardExportJobArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeModelCardExportJobResponse": {
-        "members": [
-            {"name": "ModelCardExportJobName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelCardExportJobArn",
-                "shape": "ModelCardExportJobArn",
-                "type": "string",
-            },
-            {"name": "Status", "shape": "ModelCardExportJobStatus", "type": "string"},
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {
-                "name": "OutputConfig",
-                "shape": "ModelCardExportOutputConfig",
-                "type": "structure",
-            },
-            {"name": "CreatedAt", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedAt", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "ExportArtifacts",
-                "shape": "ModelCardExportArtifacts",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeModelCardRequest": {
-        "members": [
-            {"name": "ModelCardName", "shape": "ModelCardNameOrArn", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "DescribeModelCardResponse": {
-        "members": [
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"},
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "Content", "shape": "ModelCardContent", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {
-                "name": "SecurityConfig",
-                "shape": "ModelCardSecurityConfig",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ModelCardProcessingStatus",
-                "shape": "ModelCardProcessingStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeModelExplainabilityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeModelExplainabilityJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            },
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "ModelExplainabilityBaselineConfig",
-                "shape": "ModelExplainabilityBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelExplainabilityAppSpecification",
-                "shape": "ModelExplainabilityAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelExplainabilityJobInput",
-                "shape": "ModelExplainabilityJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "ModelExplainabilityJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeModelInput": {
-        "members": [{"name": "ModelName", "shape": "ModelName", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeModelOutput": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "PrimaryContainer",
-                "shape": "ContainerDefinition",
-                "type": "structure",
-            },
-            {"name": "Containers", "shape": "ContainerDefinitionList", "type": "list"},
-            {
-                "name": "InferenceExecutionConfig",
-                "shape": "InferenceExecutionConfig",
-                "type": "structure",
-            },
-            {"name": "ExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModelArn", "shape": "ModelArn", "type": "string"},
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {
-                "name": "DeploymentRecommendation",
-                "shape": "DeploymentRecommendation",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeModelPackageGroupInput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "ArnOrName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeModelPackageGroupOutput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageGroupArn",
-                "shape": "ModelPackageGroupArn",
-                "type": "string",
-            },
-            {
-                "name": "ModelPackageGroupDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ModelPackageGroupStatus",
-                "shape": "ModelPackageGroupStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeModelPackageInput": {
-        "members": [
-            {
-                "name": "ModelPackageName",
-                "shape": "VersionedArnOrName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeModelPackageOutput": {
-        "members": [
-            {"name": "ModelPackageName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageVersion",
-                "shape": "ModelPackageVersion",
-                "type": "integer",
-            },
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"},
-            {
-                "name": "ModelPackageDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "SourceAlgorithmSpecification",
-                "shape": "SourceAlgorithmSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ValidationSpecification",
-                "shape": "ModelPackageValidationSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelPackageStatus",
-                "shape": "ModelPackageStatus",
-                "type": "string",
-            },
-            {
-                "name": "ModelPackageStatusDetails",
-                "shape": "ModelPackageStatusDetails",
-                "type": "structure",
-            },
-            {
-                "name": "CertifyForMarketplace",
-                "shape": "CertifyForMarketplace",
-                "type": "boolean",
-            },
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "ModelMetrics", "shape": "ModelMetrics", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ApprovalDescription",
-                "shape": "ApprovalDescription",
-                "type": "string",
-            },
-            {"name": "Domain", "shape": "String", "type": "string"},
-            {"name": "Task", "shape": "String", "type": "string"},
-            {"name": "SamplePayloadUrl", "shape": "String", "type": "string"},
-            {
-                "name": "CustomerMetadataProperties",
-                "shape": "CustomerMetadataMap",
-                "type": "map",
-            },
-            {
-                "name": "DriftCheckBaselines",
-                "shape": "DriftCheckBaselines",
-                "type": "structure",
-            },
-            {
-                "name": "AdditionalInferenceSpecifications",
-                "shape": "AdditionalInferenceSpecifications",
-                "type": "list",
-            },
-            {
-                "name": "SkipModelValidation",
-                "shape": "SkipModelValidation",
-                "type": "string",
-            },
-            {"name": "SourceUri", "shape": "ModelPackageSourceUri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeModelQualityJobDefinitionRequest": {
-        "members": [
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeModelQualityJobDefinitionResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            },
-            {
-                "name": "JobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "ModelQualityBaselineConfig",
-                "shape": "ModelQualityBaselineConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQualityAppSpecification",
-                "shape": "ModelQualityAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQualityJobInput",
-                "shape": "ModelQualityJobInput",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQualityJobOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JobResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "NetworkConfig",
-                "shape": "MonitoringNetworkConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeMonitoringScheduleRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeMonitoringScheduleResponse": {
-        "members": [
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleStatus",
-                "shape": "ScheduleStatus",
-                "type": "string",
-            },
-            {"name": "MonitoringType", "shape": "MonitoringType", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringScheduleConfig",
-                "shape": "MonitoringScheduleConfig",
-                "type": "structure",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "LastMonitoringExecutionSummary",
-                "shape": "MonitoringExecutionSummary",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeNotebookInstanceInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeNotebookInstanceLifecycleConfigInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeNotebookInstanceLifecycleConfigOutput": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigArn",
-                "shape": "NotebookInstanceLifecycleConfigArn",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "OnCreate",
-                "shape": "NotebookInstanceLifecycleConfigList",
-                "type": "list",
-            },
-            {
-                "name": "OnStart",
-                "shape": "NotebookInstanceLifecycleConfigList",
-                "type": "list",
-            },
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DescribeNotebookInstanceOutput": {
-        "members": [
-            {
-                "name": "NotebookInstanceArn",
-                "shape": "NotebookInstanceArn",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceStatus",
-                "shape": "NotebookInstanceStatus",
-                "type": "string",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "Url", "shape": "NotebookInstanceUrl", "type": "string"},
-            {"name": "InstanceType", "shape": "InstanceType", "type": "string"},
-            {"name": "SubnetId", "shape": "SubnetId", "type": "string"},
-            {"name": "SecurityGroups", "shape": "SecurityGroupIds", "type": "list"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "NetworkInterfaceId",
-                "shape": "NetworkInterfaceId",
-                "type": "string",
-            },
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "DirectInternetAccess",
-                "shape": "DirectInternetAccess",
-                "type": "string",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "NotebookInstanceVolumeSizeInGB",
-                "type": "integer",
-            },
-            {
-                "name": "AcceleratorTypes",
-                "shape": "NotebookInstanceAcceleratorTypes",
-                "type": "list",
-            },
-            {
-                "name": "DefaultCodeRepository",
-                "shape": "CodeRepositoryNameOrUrl",
-                "type": "string",
-            },
-            {
-                "name": "AdditionalCodeRepositories",
-                "shape": "AdditionalCodeRepositoryNamesOrUrls",
-                "type": "list",
-            },
-            {"name": "RootAccess", "shape": "RootAccess", "type": "string"},
-            {
-                "name": "PlatformIdentifier",
-                "shape": "PlatformIdentifier",
-                "type": "string",
-            },
-            {
-                "name": "InstanceMetadataServiceConfiguration",
-                "shape": "InstanceMetadataServiceConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribePipelineDefinitionForExecutionRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribePipelineDefinitionForExecutionResponse": {
-        "members": [
-            {
-                "name": "PipelineDefinition",
-                "shape": "PipelineDefinition",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DescribePipelineExecutionRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribePipelineExecutionResponse": {
-        "members": [
-            {"name": "PipelineArn", "shape": "PipelineArn", "type": "string"},
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDisplayName",
-                "shape": "PipelineExecutionName",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionStatus",
-                "shape": "PipelineExecutionStatus",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDescription",
-                "shape": "PipelineExecutionDescription",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExperimentConfig",
-                "shape": "PipelineExperimentConfig",
-                "type": "structure",
-            },
-            {
-                "name": "FailureReason",
-                "shape": "PipelineExecutionFailureReason",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "SelectiveExecutionConfig",
-                "shape": "SelectiveExecutionConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribePipelineRequest": {
-        "members": [
-            {"name": "PipelineName", "shape": "PipelineNameOrArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribePipelineResponse": {
-        "members": [
-            {"name": "PipelineArn", "shape": "PipelineArn", "type": "string"},
-            {"name": "PipelineName", "shape": "PipelineName", "type": "string"},
-            {"name": "PipelineDisplayName", "shape": "PipelineName", "type": "string"},
-            {
-                "name": "PipelineDefinition",
-                "shape": "PipelineDefinition",
-                "type": "string",
-            },
-            {
-                "name": "PipelineDescription",
-                "shape": "PipelineDescription",
-                "type": "string",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "PipelineStatus", "shape": "PipelineStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastRunTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeProcessingJobRequest": {
-        "members": [
-            {
-                "name": "ProcessingJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeProcessingJobResponse": {
-        "members": [
-            {"name": "ProcessingInputs", "shape": "ProcessingInputs", "type": "list"},
-            {
-                "name": "ProcessingOutputConfig",
-                "shape": "ProcessingOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ProcessingJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ProcessingResources",
-                "shape": "ProcessingResources",
-                "type": "structure",
-            },
-            {
-                "name": "StoppingCondition",
-                "shape": "ProcessingStoppingCondition",
-                "type": "structure",
-            },
-            {
-                "name": "AppSpecification",
-                "shape": "AppSpecification",
-                "type": "structure",
-            },
-            {"name": "Environment", "shape": "ProcessingEnvironmentMap", "type": "map"},
-            {"name": "NetworkConfig", "shape": "NetworkConfig", "type": "structure"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-            {"name": "ProcessingJobArn", "shape": "ProcessingJobArn", "type": "string"},
-            {
-                "name": "ProcessingJobStatus",
-                "shape": "ProcessingJobStatus",
-                "type": "string",
-            },
-            {"name": "ExitMessage", "shape": "ExitMessage", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ProcessingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ProcessingStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeProjectInput": {
-        "members": [
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeProjectOutput": {
-        "members": [
-            {"name": "ProjectArn", "shape": "ProjectArn", "type": "string"},
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"},
-            {"name": "ProjectId", "shape": "ProjectId", "type": "string"},
-            {
-                "name": "ProjectDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {
-                "name": "ServiceCatalogProvisioningDetails",
-                "shape": "ServiceCatalogProvisioningDetails",
-                "type": "structure",
-            },
-            {
-                "name": "ServiceCatalogProvisionedProductDetails",
-                "shape": "ServiceCatalogProvisionedProductDetails",
-                "type": "structure",
-            },
-            {"name": "ProjectStatus", "shape": "ProjectStatus", "type": "string"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeSpaceRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeSpaceResponse": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceArn", "shape": "SpaceArn", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "HomeEfsFileSystemUid", "shape": "EfsUid", "type": "string"},
-            {"name": "Status", "shape": "SpaceStatus", "type": "string"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "SpaceSettings", "shape": "SpaceSettings", "type": "structure"},
-            {
-                "name": "OwnershipSettings",
-                "shape": "OwnershipSettings",
-                "type": "structure",
-            },
-            {
-                "name": "SpaceSharingSettings",
-                "shape": "SpaceSharingSettings",
-                "type": "structure",
-            },
-            {"name": "SpaceDisplayName", "shape": "NonEmptyString64", "type": "string"},
-            {"name": "Url", "shape": "String1024", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeStudioLifecycleConfigRequest": {
-        "members": [
-            {
-                "name": "StudioLifecycleConfigName",
-                "shape": "StudioLifecycleConfigName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeStudioLifecycleConfigResponse": {
-        "members": [
-            {
-                "name": "StudioLifecycleConfigArn",
-                "shape": "StudioLifecycleConfigArn",
-                "type": "string",
-            },
-            {
-                "name": "StudioLifecycleConfigName",
-                "shape": "StudioLifecycleConfigName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "StudioLifecycleConfigContent",
-                "shape": "StudioLifecycleConfigContent",
-                "type": "string",
-            },
-            {
-                "name": "StudioLifecycleConfigAppType",
-                "shape": "StudioLifecycleConfigAppType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeSubscribedWorkteamRequest": {
-        "members": [{"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"}],
-        "type": "structure",
-    },
-    "DescribeSubscribedWorkteamResponse": {
-        "members": [
-            {
-                "name": "SubscribedWorkteam",
-                "shape": "SubscribedWorkteam",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeTrainingJobRequest": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeTrainingJobResponse": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"},
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"},
-            {
-                "name": "TuningJobArn",
-                "shape": "HyperParameterTuningJobArn",
-                "type": "string",
-            },
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "ModelArtifacts", "shape": "ModelArtifacts", "type": "structure"},
-            {
-                "name": "TrainingJobStatus",
-                "shape": "TrainingJobStatus",
-                "type": "string",
-            },
-            {"name": "SecondaryStatus", "shape": "SecondaryStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "HyperParameters", "shape": "HyperParameters", "type": "map"},
-            {
-                "name": "AlgorithmSpecification",
-                "shape": "AlgorithmSpecification",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "InputDataConfig", "shape": "InputDataConfig", "type": "list"},
-            {
-                "name": "OutputDataConfig",
-                "shape": "OutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "ResourceConfig", "shape": "ResourceConfig", "type": "structure"},
-            {"name": "WarmPoolStatus", "shape": "WarmPoolStatus", "type": "structure"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "SecondaryStatusTransitions",
-                "shape": "SecondaryStatusTransitions",
-                "type": "list",
-            },
-            {
-                "name": "FinalMetricDataList",
-                "shape": "FinalMetricDataList",
-                "type": "list",
-            },
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "EnableManagedSpotTraining",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "CheckpointConfig",
-                "shape": "CheckpointConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingTimeInSeconds",
-                "shape": "TrainingTimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "BillableTimeInSeconds",
-                "shape": "BillableTimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "DebugHookConfig",
-                "shape": "DebugHookConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DebugRuleConfigurations",
-                "shape": "DebugRuleConfigurations",
-                "type": "list",
-            },
-            {
-                "name": "TensorBoardOutputConfig",
-                "shape": "TensorBoardOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DebugRuleEvaluationStatuses",
-                "shape": "DebugRuleEvaluationStatuses",
-                "type": "list",
-            },
-            {"name": "ProfilerConfig", "shape": "ProfilerConfig", "type": "structure"},
-            {
-                "name": "ProfilerRuleConfigurations",
-                "shape": "ProfilerRuleConfigurations",
-                "type": "list",
-            },
-            {
-                "name": "ProfilerRuleEvaluationStatuses",
-                "shape": "ProfilerRuleEvaluationStatuses",
-                "type": "list",
-            },
-            {"name": "ProfilingStatus", "shape": "ProfilingStatus", "type": "string"},
-            {"name": "Environment", "shape": "TrainingEnvironmentMap", "type": "map"},
-            {"name": "RetryStrategy", "shape": "RetryStrategy", "type": "structure"},
-            {
-                "name": "RemoteDebugConfig",
-                "shape": "RemoteDebugConfig",
-                "type": "structure",
-            },
-            {
-                "name": "InfraCheckConfig",
-                "shape": "InfraCheckConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeTransformJobRequest": {
-        "members": [
-            {"name": "TransformJobName", "shape": "TransformJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeTransformJobResponse": {
-        "members": [
-            {"name": "TransformJobName", "shape": "TransformJobName", "type": "string"},
-            {"name": "TransformJobArn", "shape": "TransformJobArn", "type": "string"},
-            {
-                "name": "TransformJobStatus",
-                "shape": "TransformJobStatus",
-                "type": "string",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "MaxConcurrentTransforms",
-                "shape": "MaxConcurrentTransforms",
-                "type": "integer",
-            },
-            {
-                "name": "ModelClientConfig",
-                "shape": "ModelClientConfig",
-                "type": "structure",
-            },
-            {"name": "MaxPayloadInMB", "shape": "MaxPayloadInMB", "type": "integer"},
-            {"name": "BatchStrategy", "shape": "BatchStrategy", "type": "string"},
-            {"name": "Environment", "shape": "TransformEnvironmentMap", "type": "map"},
-            {"name": "TransformInput", "shape": "TransformInput", "type": "structure"},
-            {
-                "name": "TransformOutput",
-                "shape": "TransformOutput",
-                "type": "structure",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "BatchDataCaptureConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TransformResources",
-                "shape": "TransformResources",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TransformStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TransformEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "DataProcessing", "shape": "DataProcessing", "type": "structure"},
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeTrialComponentRequest": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityNameOrArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "DescribeTrialComponentResponse": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "TrialComponentSource", "type": "structure"},
-            {"name": "Status", "shape": "TrialComponentStatus", "type": "structure"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "Parameters", "shape": "TrialComponentParameters", "type": "map"},
-            {
-                "name": "InputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "OutputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {
-                "name": "Metrics",
-                "shape": "TrialComponentMetricSummaries",
-                "type": "list",
-            },
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-            {"name": "Sources", "shape": "TrialComponentSources", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "DescribeTrialRequest": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeTrialResponse": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "TrialArn", "shape": "TrialArn", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "Source", "shape": "TrialSource", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DescribeUserProfileRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DescribeUserProfileResponse": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileArn", "shape": "UserProfileArn", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "HomeEfsFileSystemUid", "shape": "EfsUid", "type": "string"},
-            {"name": "Status", "shape": "UserProfileStatus", "type": "string"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "SingleSignOnUserIdentifier",
-                "shape": "SingleSignOnUserIdentifier",
-                "type": "string",
-            },
-            {"name": "SingleSignOnUserValue", "shape": "String256", "type": "string"},
-            {"name": "UserSettings", "shape": "UserSettings", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DescribeWorkforceRequest": {
-        "members": [
-            {"name": "WorkforceName", "shape": "WorkforceName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeWorkforceResponse": {
-        "members": [{"name": "Workforce", "shape": "Workforce", "type": "structure"}],
-        "type": "structure",
-    },
-    "DescribeWorkteamRequest": {
-        "members": [
-            {"name": "WorkteamName", "shape": "WorkteamName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "DescribeWorkteamResponse": {
-        "members": [{"name": "Workteam", "shape": "Workteam", "type": "structure"}],
-        "type": "structure",
-    },
-    "DesiredWeightAndCapacity": {
-        "members": [
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {"name": "DesiredWeight", "shape": "VariantWeight", "type": "float"},
-            {"name": "DesiredInstanceCount", "shape": "TaskCount", "type": "integer"},
-            {
-                "name": "ServerlessUpdateConfig",
-                "shape": "ProductionVariantServerlessUpdateConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DesiredWeightAndCapacityList": {
-        "member_shape": "DesiredWeightAndCapacity",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Device": {
-        "members": [
-            {"name": "DeviceName", "shape": "DeviceName", "type": "string"},
-            {"name": "Description", "shape": "DeviceDescription", "type": "string"},
-            {"name": "IotThingName", "shape": "ThingName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeviceDeploymentSummaries": {
-        "member_shape": "DeviceDeploymentSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DeviceDeploymentSummary": {
-        "members": [
-            {
-                "name": "EdgeDeploymentPlanArn",
-                "shape": "EdgeDeploymentPlanArn",
-                "type": "string",
-            },
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-            {"name": "DeployedStageName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceName", "shape": "DeviceName", "type": "string"},
-            {"name": "DeviceArn", "shape": "DeviceArn", "type": "string"},
-            {
-                "name": "DeviceDeploymentStatus",
-                "shape": "DeviceDeploymentStatus",
-                "type": "string",
-            },
-            {
-                "name": "DeviceDeploymentStatusMessage",
-                "shape": "String",
-                "type": "string",
-            },
-            {"name": "Description", "shape": "DeviceDescription", "type": "string"},
-            {"name": "DeploymentStartTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DeviceFleetSummaries": {
-        "member_shape": "DeviceFleetSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DeviceFleetSummary": {
-        "members": [
-            {"name": "DeviceFleetArn", "shape": "DeviceFleetArn", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "DeviceNames": {
-        "member_shape": "DeviceName",
-        "member_type": "string",
-        "type": "list",
-    },
-    "DeviceSelectionConfig": {
-        "members": [
-            {"name": "DeviceSubsetType", "shape": "DeviceSubsetType", "type": "string"},
-            {"name": "Percentage", "shape": "Percentage", "type": "integer"},
-            {"name": "DeviceNames", "shape": "DeviceNames", "type": "list"},
-            {"name": "DeviceNameContains", "shape": "DeviceName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DeviceStats": {
-        "members": [
-            {"name": "ConnectedDeviceCount", "shape": "Long", "type": "long"},
-            {"name": "RegisteredDeviceCount", "shape": "Long", "type": "long"},
-        ],
-        "type": "structure",
-    },
-    "DeviceSummaries": {
-        "member_shape": "DeviceSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DeviceSummary": {
-        "members": [
-            {"name": "DeviceName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceArn", "shape": "DeviceArn", "type": "string"},
-            {"name": "Description", "shape": "DeviceDescription", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "IotThingName", "shape": "ThingName", "type": "string"},
-            {"name": "RegistrationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LatestHeartbeat", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Models", "shape": "EdgeModelSummaries", "type": "list"},
-            {"name": "AgentVersion", "shape": "EdgeVersion", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Devices": {"member_shape": "Device", "member_type": "structure", "type": "list"},
-    "DirectDeploySettings": {
-        "members": [{"name": "Status", "shape": "FeatureStatus", "type": "string"}],
-        "type": "structure",
-    },
-    "DisableSagemakerServicecatalogPortfolioInput": {
-        "members": [],
-        "type": "structure",
-    },
-    "DisableSagemakerServicecatalogPortfolioOutput": {
-        "members": [],
-        "type": "structure",
-    },
-    "DisassociateTrialComponentRequest": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DisassociateTrialComponentResponse": {
-        "members": [
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            },
-            {"name": "TrialArn", "shape": "TrialArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DockerSettings": {
-        "members": [
-            {"name": "EnableDockerAccess", "shape": "FeatureStatus", "type": "string"},
-            {
-                "name": "VpcOnlyTrustedAccounts",
-                "shape": "VpcOnlyTrustedAccounts",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "DomainDetails": {
-        "members": [
-            {"name": "DomainArn", "shape": "DomainArn", "type": "string"},
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "DomainName", "shape": "DomainName", "type": "string"},
-            {"name": "Status", "shape": "DomainStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "Url", "shape": "String1024", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "DomainList": {
-        "member_shape": "DomainDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "DomainSecurityGroupIds": {
-        "member_shape": "SecurityGroupId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "DomainSettings": {
-        "members": [
-            {
-                "name": "SecurityGroupIds",
-                "shape": "DomainSecurityGroupIds",
-                "type": "list",
-            },
-            {
-                "name": "RStudioServerProDomainSettings",
-                "shape": "RStudioServerProDomainSettings",
-                "type": "structure",
-            },
-            {
-                "name": "ExecutionRoleIdentityConfig",
-                "shape": "ExecutionRoleIdentityConfig",
-                "type": "string",
-            },
-            {"name": "DockerSettings", "shape": "DockerSettings", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DomainSettingsForUpdate": {
-        "members": [
-            {
-                "name": "RStudioServerProDomainSettingsForUpdate",
-                "shape": "RStudioServerProDomainSettingsForUpdate",
-                "type": "structure",
-            },
-            {
-                "name": "ExecutionRoleIdentityConfig",
-                "shape": "ExecutionRoleIdentityConfig",
-                "type": "string",
-            },
-            {
-                "name": "SecurityGroupIds",
-                "shape": "DomainSecurityGroupIds",
-                "type": "list",
-            },
-            {"name": "DockerSettings", "shape": "DockerSettings", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DriftCheckBaselines": {
-        "members": [
-            {"name": "Bias", "shape": "DriftCheckBias", "type": "structure"},
-            {
-                "name": "Explainability",
-                "shape": "DriftCheckExplainability",
-                "type": "structure",
-            },
-            {
-                "name": "ModelQuality",
-                "shape": "DriftCheckModelQuality",
-                "type": "structure",
-            },
-            {
-                "name": "ModelDataQuality",
-                "shape": "DriftCheckModelDataQuality",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DriftCheckBias": {
-        "members": [
-            {"name": "ConfigFile", "shape": "FileSource", "type": "structure"},
-            {
-                "name": "PreTrainingConstraints",
-                "shape": "MetricsSource",
-                "type": "structure",
-            },
-            {
-                "name": "PostTrainingConstraints",
-                "shape": "MetricsSource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "DriftCheckExplainability": {
-        "members": [
-            {"name": "Constraints", "shape": "MetricsSource", "type": "structure"},
-            {"name": "ConfigFile", "shape": "FileSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DriftCheckModelDataQuality": {
-        "members": [
-            {"name": "Statistics", "shape": "MetricsSource", "type": "structure"},
-            {"name": "Constraints", "shape": "MetricsSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DriftCheckModelQuality": {
-        "members": [
-            {"name": "Statistics", "shape": "MetricsSource", "type": "structure"},
-            {"name": "Constraints", "shape": "MetricsSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "DynamicScalingConfiguration": {
-        "members": [
-            {"name": "MinCapacity", "shape": "Integer", "type": "integer"},
-            {"name": "MaxCapacity", "shape": "Integer", "type": "integer"},
-            {"name": "ScaleInCooldown", "shape": "Integer", "type": "integer"},
-            {"name": "ScaleOutCooldown", "shape": "Integer", "type": "integer"},
-            {"name": "ScalingPolicies", "shape": "ScalingPolicies", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "EFSFileSystem": {
-        "members": [
-            {"name": "FileSystemId", "shape": "FileSystemId", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "EFSFileSystemConfig": {
-        "members": [
-            {"name": "FileSystemId", "shape": "FileSystemId", "type": "string"},
-            {"name": "FileSystemPath", "shape": "FileSystemPath", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EMRStepMetadata": {
-        "members": [
-            {"name": "ClusterId", "shape": "String256", "type": "string"},
-            {"name": "StepId", "shape": "String256", "type": "string"},
-            {"name": "StepName", "shape": "String256", "type": "string"},
-            {"name": "LogFilePath", "shape": "String1024", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EbsStorageSettings": {
-        "members": [
-            {
-                "name": "EbsVolumeSizeInGb",
-                "shape": "SpaceEbsVolumeSizeInGb",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "Edge": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-            {
-                "name": "AssociationType",
-                "shape": "AssociationEdgeType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "EdgeDeploymentConfig": {
-        "members": [
-            {
-                "name": "FailureHandlingPolicy",
-                "shape": "FailureHandlingPolicy",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "EdgeDeploymentModelConfig": {
-        "members": [
-            {"name": "ModelHandle", "shape": "EntityName", "type": "string"},
-            {"name": "EdgePackagingJobName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EdgeDeploymentModelConfigs": {
-        "member_shape": "EdgeDeploymentModelConfig",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EdgeDeploymentPlanSummaries": {
-        "member_shape": "EdgeDeploymentPlanSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EdgeDeploymentPlanSummary": {
-        "members": [
-            {
-                "name": "EdgeDeploymentPlanArn",
-                "shape": "EdgeDeploymentPlanArn",
-                "type": "string",
-            },
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "EdgeDeploymentSuccess", "shape": "Integer", "type": "integer"},
-            {"name": "EdgeDeploymentPending", "shape": "Integer", "type": "integer"},
-            {"name": "EdgeDeploymentFailed", "shape": "Integer", "type": "integer"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "EdgeDeploymentStatus": {
-        "members": [
-            {"name": "StageStatus", "shape": "StageStatus", "type": "string"},
-            {
-                "name": "EdgeDeploymentSuccessInStage",
-                "shape": "Integer",
-                "type": "integer",
-            },
-            {
-                "name": "EdgeDeploymentPendingInStage",
-                "shape": "Integer",
-                "type": "integer",
-            },
-            {
-                "name": "EdgeDeploymentFailedInStage",
-                "shape": "Integer",
-                "type": "integer",
-            },
-            {
-                "name": "EdgeDeploymentStatusMessage",
-                "shape": "String",
-                "type": "string",
-            },
-            {
-                "name": "EdgeDeploymentStageStartTime",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "EdgeModel": {
-        "members": [
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelVersion", "shape": "EdgeVersion", "type": "string"},
-            {"name": "LatestSampleTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LatestInference", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "EdgeModelStat": {
-        "members": [
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelVersion", "shape": "EdgeVersion", "type": "string"},
-            {"name": "OfflineDeviceCount", "shape": "Long", "type": "long"},
-            {"name": "ConnectedDeviceCount", "shape": "Long", "type": "long"},
-            {"name": "ActiveDeviceCount", "shape": "Long", "type": "long"},
-            {"name": "SamplingDeviceCount", "shape": "Long", "type": "long"},
-        ],
-        "type": "structure",
-    },
-    "EdgeModelStats": {
-        "member_shape": "EdgeModelStat",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EdgeModelSummaries": {
-        "member_shape": "EdgeModelSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EdgeModelSummary": {
-        "members": [
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelVersion", "shape": "EdgeVersion", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EdgeModels": {
-        "member_shape": "EdgeModel",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EdgeOutputConfig": {
-        "members": [
-            {"name": "S3OutputLocation", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "PresetDeploymentType",
-                "shape": "EdgePresetDeploymentType",
-                "type": "string",
-            },
-            {"name": "PresetDeploymentConfig", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EdgePackagingJobSummaries": {
-        "member_shape": "EdgePackagingJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EdgePackagingJobSummary": {
-        "members": [
-            {
-                "name": "EdgePackagingJobArn",
-                "shape": "EdgePackagingJobArn",
-                "type": "string",
-            },
-            {"name": "EdgePackagingJobName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "EdgePackagingJobStatus",
-                "shape": "EdgePackagingJobStatus",
-                "type": "string",
-            },
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelVersion", "shape": "EdgeVersion", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "EdgePresetDeploymentOutput": {
-        "members": [
-            {"name": "Type", "shape": "EdgePresetDeploymentType", "type": "string"},
-            {
-                "name": "Artifact",
-                "shape": "EdgePresetDeploymentArtifact",
-                "type": "string",
-            },
-            {"name": "Status", "shape": "EdgePresetDeploymentStatus", "type": "string"},
-            {"name": "StatusMessage", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Edges": {"member_shape": "Edge", "member_type": "structure", "type": "list"},
-    "EnableSagemakerServicecatalogPortfolioInput": {"members": [], "type": "structure"},
-    "EnableSagemakerServicecatalogPortfolioOutput": {
-        "members": [],
-        "type": "structure",
-    },
-    "Endpoint": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "EndpointArn", "shape": "EndpointArn", "type": "string"},
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "ProductionVariants",
-                "shape": "ProductionVariantSummaryList",
-                "type": "list",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "DataCaptureConfigSummary",
-                "type": "structure",
-            },
-            {"name": "EndpointStatus", "shape": "EndpointStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringSchedules",
-                "shape": "MonitoringScheduleList",
-                "type": "list",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "ShadowProductionVariants",
-                "shape": "ProductionVariantSummaryList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "EndpointConfigSummary": {
-        "members": [
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "EndpointConfigArn",
-                "shape": "EndpointConfigArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "EndpointConfigSummaryList": {
-        "member_shape": "EndpointConfigSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EndpointInfo": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "EndpointInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "LocalPath", "shape": "ProcessingLocalPath", "type": "string"},
-            {"name": "S3InputMode", "shape": "ProcessingS3InputMode", "type": "string"},
-            {
-                "name": "S3DataDistributionType",
-                "shape": "ProcessingS3DataDistributionType",
-                "type": "string",
-            },
-            {"name": "FeaturesAttribute", "shape": "String", "type": "string"},
-            {"name": "InferenceAttribute", "shape": "String", "type": "string"},
-            {"name": "ProbabilityAttribute", "shape": "String", "type": "string"},
-            {
-                "name": "ProbabilityThresholdAttribute",
-                "shape": "ProbabilityThresholdAttribute",
-                "type": "double",
-            },
-            {
-                "name": "StartTimeOffset",
-                "shape": "MonitoringTimeOffsetString",
-                "type": "string",
-            },
-            {
-                "name": "EndTimeOffset",
-                "shape": "MonitoringTimeOffsetString",
-                "type": "string",
-            },
-            {
-                "name": "ExcludeFeaturesAttribute",
-                "shape": "ExcludeFeaturesAttribute",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "EndpointInputConfiguration": {
-        "members": [
-            {
-                "name": "InstanceType",
-                "shape": "ProductionVariantInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "ServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-            {
-                "name": "InferenceSpecificationName",
-                "shape": "InferenceSpecificationName",
-                "type": "string",
-            },
-            {
-                "name": "EnvironmentParameterRanges",
-                "shape": "EnvironmentParameterRanges",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "EndpointInputConfigurations": {
-        "member_shape": "EndpointInputConfiguration",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EndpointMetadata": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {"name": "EndpointStatus", "shape": "EndpointStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EndpointOutputConfiguration": {
-        "members": [
-            {"name": "EndpointName", "shape": "String", "type": "string"},
-            {"name": "VariantName", "shape": "String", "type": "string"},
-            {
-                "name": "InstanceType",
-                "shape": "ProductionVariantInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "InitialInstanceCount",
-                "shape": "InitialInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "ServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "EndpointPerformance": {
-        "members": [
-            {"name": "Metrics", "shape": "InferenceMetrics", "type": "structure"},
-            {"name": "EndpointInfo", "shape": "EndpointInfo", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "EndpointPerformances": {
-        "member_shape": "EndpointPerformance",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EndpointSummary": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "EndpointArn", "shape": "EndpointArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndpointStatus", "shape": "EndpointStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EndpointSummaryList": {
-        "member_shape": "EndpointSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Endpoints": {
-        "member_shape": "EndpointInfo",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "EnvironmentMap": {
-        "key_shape": "EnvironmentKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "EnvironmentValue",
-        "value_type": "string",
-    },
-    "EnvironmentParameter": {
-        "members": [
-            {"name": "Key", "shape": "String", "type": "string"},
-            {"name": "ValueType", "shape": "String", "type": "string"},
-            {"name": "Value", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "EnvironmentParameterRanges": {
-        "members": [
-            {
-                "name": "CategoricalParameterRanges",
-                "shape": "CategoricalParameters",
-                "type": "list",
-            }
-        ],
-        "type": "structure",
-    },
-    "EnvironmentParameters": {
-        "member_shape": "EnvironmentParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Experiment": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "ExperimentArn", "shape": "ExperimentArn", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Source", "shape": "ExperimentSource", "type": "structure"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ExperimentConfig": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "TrialComponentDisplayName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "RunName", "shape": "ExperimentEntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ExperimentSource": {
-        "members": [
-            {"name": "SourceArn", "shape": "ExperimentSourceArn", "type": "string"},
-            {"name": "SourceType", "shape": "SourceType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ExperimentSummaries": {
-        "member_shape": "ExperimentSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ExperimentSummary": {
-        "members": [
-            {"name": "ExperimentArn", "shape": "ExperimentArn", "type": "string"},
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "ExperimentSource",
-                "shape": "ExperimentSource",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "Explainability": {
-        "members": [{"name": "Report", "shape": "MetricsSource", "type": "structure"}],
-        "type": "structure",
-    },
-    "ExplainerConfig": {
-        "members": [
-            {
-                "name": "ClarifyExplainerConfig",
-                "shape": "ClarifyExplainerConfig",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "FailStepMetadata": {
-        "members": [{"name": "ErrorMessage", "shape": "String3072", "type": "string"}],
-        "type": "structure",
-    },
-    "FeatureAdditions": {
-        "member_shape": "FeatureDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FeatureDefinition": {
-        "members": [
-            {"name": "FeatureName", "shape": "FeatureName", "type": "string"},
-            {"name": "FeatureType", "shape": "FeatureType", "type": "string"},
-            {"name": "CollectionType", "shape": "CollectionType", "type": "string"},
-            {
-                "name": "CollectionConfig",
-                "shape": "CollectionConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "FeatureDefinitions": {
-        "member_shape": "FeatureDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FeatureGroup": {
-        "members": [
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"},
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"},
-            {
-                "name": "RecordIdentifierFeatureName",
-                "shape": "FeatureName",
-                "type": "string",
-            },
-            {"name": "EventTimeFeatureName", "shape": "FeatureName", "type": "string"},
-            {
-                "name": "FeatureDefinitions",
-                "shape": "FeatureDefinitions",
-                "type": "list",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "OnlineStoreConfig",
-                "shape": "OnlineStoreConfig",
-                "type": "structure",
-            },
-            {
-                "name": "OfflineStoreConfig",
-                "shape": "OfflineStoreConfig",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "FeatureGroupStatus",
-                "shape": "FeatureGroupStatus",
-                "type": "string",
-            },
-            {
-                "name": "OfflineStoreStatus",
-                "shape": "OfflineStoreStatus",
-                "type": "structure",
-            },
-            {
-                "name": "LastUpdateStatus",
-                "shape": "LastUpdateStatus",
-                "type": "structure",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "Description", "shape": "Description", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "FeatureGroupSummaries": {
-        "member_shape": "FeatureGroupSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FeatureGroupSummary": {
-        "members": [
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"},
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "FeatureGroupStatus",
-                "shape": "FeatureGroupStatus",
-                "type": "string",
-            },
-            {
-                "name": "OfflineStoreStatus",
-                "shape": "OfflineStoreStatus",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "FeatureMetadata": {
-        "members": [
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"},
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"},
-            {"name": "FeatureName", "shape": "FeatureName", "type": "string"},
-            {"name": "FeatureType", "shape": "FeatureType", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "Description", "shape": "FeatureDescription", "type": "string"},
-            {"name": "Parameters", "shape": "FeatureParameters", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "FeatureParameter": {
-        "members": [
-            {"name": "Key", "shape": "FeatureParameterKey", "type": "string"},
-            {"name": "Value", "shape": "FeatureParameterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "FeatureParameterAdditions": {
-        "member_shape": "FeatureParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FeatureParameterRemovals": {
-        "member_shape": "FeatureParameterKey",
-        "member_type": "string",
-        "type": "list",
-    },
-    "FeatureParameters": {
-        "member_shape": "FeatureParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FileSource": {
-        "members": [
-            {"name": "ContentType", "shape": "ContentType", "type": "string"},
-            {"name": "ContentDigest", "shape": "ContentDigest", "type": "string"},
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "FileSystemConfig": {
-        "members": [
-            {"name": "MountPath", "shape": "MountPath", "type": "string"},
-            {"name": "DefaultUid", "shape": "DefaultUid", "type": "integer"},
-            {"name": "DefaultGid", "shape": "DefaultGid", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "FileSystemDataSource": {
-        "members": [
-            {"name": "FileSystemId", "shape": "FileSystemId", "type": "string"},
-            {
-                "name": "FileSystemAccessMode",
-                "shape": "FileSystemAccessMode",
-                "type": "string",
-            },
-            {"name": "FileSystemType", "shape": "FileSystemType", "type": "string"},
-            {"name": "DirectoryPath", "shape": "DirectoryPath", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "FillingTransformationMap": {
-        "key_shape": "FillingType",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "FillingTransformationValue",
-        "value_type": "string",
-    },
-    "FillingTransformations": {
-        "key_shape": "TransformationAttributeName",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "FillingTransformationMap",
-        "value_type": "map",
-    },
-    "Filter": {
-        "members": [
-            {"name": "Name", "shape": "ResourcePropertyName", "type": "string"},
-            {"name": "Operator", "shape": "Operator", "type": "string"},
-            {"name": "Value", "shape": "FilterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "FilterList": {
-        "member_shape": "Filter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FinalAutoMLJobObjectiveMetric": {
-        "members": [
-            {"name": "Type", "shape": "AutoMLJobObjectiveType", "type": "string"},
-            {"name": "MetricName", "shape": "AutoMLMetricEnum", "type": "string"},
-            {"name": "Value", "shape": "MetricValue", "type": "float"},
-            {
-                "name": "StandardMetricName",
-                "shape": "AutoMLMetricEnum",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "FinalHyperParameterTuningJobObjectiveMetric": {
-        "members": [
-            {
-                "name": "Type",
-                "shape": "HyperParameterTuningJobObjectiveType",
-                "type": "string",
-            },
-            {"name": "MetricName", "shape": "MetricName", "type": "string"},
-            {"name": "Value", "shape": "MetricValue", "type": "float"},
-        ],
-        "type": "structure",
-    },
-    "FinalMetricDataList": {
-        "member_shape": "MetricData",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FlowDefinitionOutputConfig": {
-        "members": [
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "FlowDefinitionSummaries": {
-        "member_shape": "FlowDefinitionSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "FlowDefinitionSummary": {
-        "members": [
-            {
-                "name": "FlowDefinitionName",
-                "shape": "FlowDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "FlowDefinitionArn",
-                "shape": "FlowDefinitionArn",
-                "type": "string",
-            },
-            {
-                "name": "FlowDefinitionStatus",
-                "shape": "FlowDefinitionStatus",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "FlowDefinitionTaskKeywords": {
-        "member_shape": "FlowDefinitionTaskKeyword",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ForecastQuantiles": {
-        "member_shape": "ForecastQuantile",
-        "member_type": "string",
-        "type": "list",
-    },
-    "GenerativeAiSettings": {
-        "members": [
-            {"name": "AmazonBedrockRoleArn", "shape": "RoleArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "GetDeviceFleetReportRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "GetDeviceFleetReportResponse": {
-        "members": [
-            {"name": "DeviceFleetArn", "shape": "DeviceFleetArn", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "OutputConfig", "shape": "EdgeOutputConfig", "type": "structure"},
-            {
-                "name": "Description",
-                "shape": "DeviceFleetDescription",
-                "type": "string",
-            },
-            {"name": "ReportGenerated", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "DeviceStats", "shape": "DeviceStats", "type": "structure"},
-            {"name": "AgentVersions", "shape": "AgentVersions", "type": "list"},
-            {"name": "ModelStats", "shape": "EdgeModelStats", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "GetLineageGroupPolicyRequest": {
-        "members": [
-            {
-                "name": "LineageGroupName",
-                "shape": "LineageGroupNameOrArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "GetLineageGroupPolicyResponse": {
-        "members": [
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-            {
-                "name": "ResourcePolicy",
-                "shape": "ResourcePolicyString",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "GetModelPackageGroupPolicyInput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "GetModelPackageGroupPolicyOutput": {
-        "members": [
-            {"name": "ResourcePolicy", "shape": "PolicyString", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "GetSagemakerServicecatalogPortfolioStatusInput": {
-        "members": [],
-        "type": "structure",
-    },
-    "GetSagemakerServicecatalogPortfolioStatusOutput": {
-        "members": [
-            {
-                "name": "Status",
-                "shape": "SagemakerServicecatalogStatus",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "GetScalingConfigurationRecommendationRequest": {
-        "members": [
-            {
-                "name": "InferenceRecommendationsJobName",
-                "shape": "RecommendationJobName",
-                "type": "string",
-            },
-            {"name": "RecommendationId", "shape": "String", "type": "string"},
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "TargetCpuUtilizationPerCore",
-                "shape": "UtilizationPercentagePerCore",
-                "type": "integer",
-            },
-            {
-                "name": "ScalingPolicyObjective",
-                "shape": "ScalingPolicyObjective",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "GetScalingConfigurationRecommendationResponse": {
-        "members": [
-            {
-                "name": "InferenceRecommendationsJobName",
-                "shape": "RecommendationJobName",
-                "type": "string",
-            },
-            {"name": "RecommendationId", "shape": "String", "type": "string"},
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "TargetCpuUtilizationPerCore",
-                "shape": "UtilizationPercentagePerCore",
-                "type": "integer",
-            },
-            {
-                "name": "ScalingPolicyObjective",
-                "shape": "ScalingPolicyObjective",
-                "type": "structure",
-            },
-            {"name": "Metric", "shape": "ScalingPolicyMetric", "type": "structure"},
-            {
-                "name": "DynamicScalingConfiguration",
-                "shape": "DynamicScalingConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "GetSearchSuggestionsRequest": {
-        "members": [
-            {"name": "Resource", "shape": "ResourceType", "type": "string"},
-            {
-                "name": "SuggestionQuery",
-                "shape": "SuggestionQuery",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "GetSearchSuggestionsResponse": {
-        "members": [
-            {
-                "name": "PropertyNameSuggestions",
-                "shape": "PropertyNameSuggestionList",
-                "type": "list",
-            }
-        ],
-        "type": "structure",
-    },
-    "GitConfig": {
-        "members": [
-            {"name": "RepositoryUrl", "shape": "GitConfigUrl", "type": "string"},
-            {"name": "Branch", "shape": "Branch", "type": "string"},
-            {"name": "SecretArn", "shape": "SecretArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "GitConfigForUpdate": {
-        "members": [{"name": "SecretArn", "shape": "SecretArn", "type": "string"}],
-        "type": "structure",
-    },
-    "GroupingAttributeNames": {
-        "member_shape": "GroupingAttributeName",
-        "member_type": "string",
-        "type": "list",
-    },
-    "Groups": {"member_shape": "Group", "member_type": "string", "type": "list"},
-    "HolidayConfig": {
-        "member_shape": "HolidayConfigAttributes",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HolidayConfigAttributes": {
-        "members": [{"name": "CountryCode", "shape": "CountryCode", "type": "string"}],
-        "type": "structure",
-    },
-    "HookParameters": {
-        "key_shape": "ConfigKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ConfigValue",
-        "value_type": "string",
-    },
-    "HubContentDependency": {
-        "members": [
-            {
-                "name": "DependencyOriginPath",
-                "shape": "DependencyOriginPath",
-                "type": "string",
-            },
-            {
-                "name": "DependencyCopyPath",
-                "shape": "DependencyCopyPath",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "HubContentDependencyList": {
-        "member_shape": "HubContentDependency",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HubContentInfo": {
-        "members": [
-            {"name": "HubContentName", "shape": "HubContentName", "type": "string"},
-            {"name": "HubContentArn", "shape": "HubContentArn", "type": "string"},
-            {
-                "name": "HubContentVersion",
-                "shape": "HubContentVersion",
-                "type": "string",
-            },
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {
-                "name": "DocumentSchemaVersion",
-                "shape": "DocumentSchemaVersion",
-                "type": "string",
-            },
-            {
-                "name": "HubContentDisplayName",
-                "shape": "HubContentDisplayName",
-                "type": "string",
-            },
-            {
-                "name": "HubContentDescription",
-                "shape": "HubContentDescription",
-                "type": "string",
-            },
-            {
-                "name": "HubContentSearchKeywords",
-                "shape": "HubContentSearchKeywordList",
-                "type": "list",
-            },
-            {"name": "HubContentStatus", "shape": "HubContentStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "HubContentInfoList": {
-        "member_shape": "HubContentInfo",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HubContentSearchKeywordList": {
-        "member_shape": "HubSearchKeyword",
-        "member_type": "string",
-        "type": "list",
-    },
-    "HubInfo": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubArn", "shape": "HubArn", "type": "string"},
-            {"name": "HubDisplayName", "shape": "HubDisplayName", "type": "string"},
-            {"name": "HubDescription", "shape": "HubDescription", "type": "string"},
-            {
-                "name": "HubSearchKeywords",
-                "shape": "HubSearchKeywordList",
-                "type": "list",
-            },
-            {"name": "HubStatus", "shape": "HubStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "HubInfoList": {
-        "member_shape": "HubInfo",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HubS3StorageConfig": {
-        "members": [
-            {"name": "S3OutputPath", "shape": "S3OutputPath", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "HubSearchKeywordList": {
-        "member_shape": "HubSearchKeyword",
-        "member_type": "string",
-        "type": "list",
-    },
-    "HumanLoopActivationConditionsConfig": {
-        "members": [
-            {
-                "name": "HumanLoopActivationConditions",
-                "shape": "HumanLoopActivationConditions",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "HumanLoopActivationConfig": {
-        "members": [
-            {
-                "name": "HumanLoopActivationConditionsConfig",
-                "shape": "HumanLoopActivationConditionsConfig",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "HumanLoopConfig": {
-        "members": [
-            {"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"},
-            {"name": "HumanTaskUiArn", "shape": "HumanTaskUiArn", "type": "string"},
-            {"name": "TaskTitle", "shape": "FlowDefinitionTaskTitle", "type": "string"},
-            {
-                "name": "TaskDescription",
-                "shape": "FlowDefinitionTaskDescription",
-                "type": "string",
-            },
-            {
-                "name": "TaskCount",
-                "shape": "FlowDefinitionTaskCount",
-                "type": "integer",
-            },
-            {
-                "name": "TaskAvailabilityLifetimeInSeconds",
-                "shape": "FlowDefinitionTaskAvailabilityLifetimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "TaskTimeLimitInSeconds",
-                "shape": "FlowDefinitionTaskTimeLimitInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "TaskKeywords",
-                "shape": "FlowDefinitionTaskKeywords",
-                "type": "list",
-            },
-            {
-                "name": "PublicWorkforceTaskPrice",
-                "shape": "PublicWorkforceTaskPrice",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "HumanLoopRequestSource": {
-        "members": [
-            {
-                "name": "AwsManagedHumanLoopRequestSource",
-                "shape": "AwsManagedHumanLoopRequestSource",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "HumanTaskConfig": {
-        "members": [
-            {"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"},
-            {"name": "UiConfig", "shape": "UiConfig", "type": "structure"},
-            {
-                "name": "PreHumanTaskLambdaArn",
-                "shape": "LambdaFunctionArn",
-                "type": "string",
-            },
-            {"name": "TaskKeywords", "shape": "TaskKeywords", "type": "list"},
-            {"name": "TaskTitle", "shape": "TaskTitle", "type": "string"},
-            {"name": "TaskDescription", "shape": "TaskDescription", "type": "string"},
-            {
-                "name": "NumberOfHumanWorkersPerDataObject",
-                "shape": "NumberOfHumanWorkersPerDataObject",
-                "type": "integer",
-            },
-            {
-                "name": "TaskTimeLimitInSeconds",
-                "shape": "TaskTimeLimitInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "TaskAvailabilityLifetimeInSeconds",
-                "shape": "TaskAvailabilityLifetimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "MaxConcurrentTaskCount",
-                "shape": "MaxConcurrentTaskCount",
-                "type": "integer",
-            },
-            {
-                "name": "AnnotationConsolidationConfig",
-                "shape": "AnnotationConsolidationConfig",
-                "type": "structure",
-            },
-            {
-                "name": "PublicWorkforceTaskPrice",
-                "shape": "PublicWorkforceTaskPrice",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "HumanTaskUiSummaries": {
-        "member_shape": "HumanTaskUiSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HumanTaskUiSummary": {
-        "members": [
-            {"name": "HumanTaskUiName", "shape": "HumanTaskUiName", "type": "string"},
-            {"name": "HumanTaskUiArn", "shape": "HumanTaskUiArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterAlgorithmSpecification": {
-        "members": [
-            {"name": "TrainingImage", "shape": "AlgorithmImage", "type": "string"},
-            {
-                "name": "TrainingInputMode",
-                "shape": "TrainingInputMode",
-                "type": "string",
-            },
-            {"name": "AlgorithmName", "shape": "ArnOrName", "type": "string"},
-            {
-                "name": "MetricDefinitions",
-                "shape": "MetricDefinitionList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "HyperParameterSpecification": {
-        "members": [
-            {"name": "Name", "shape": "ParameterName", "type": "string"},
-            {"name": "Description", "shape": "EntityDescription", "type": "string"},
-            {"name": "Type", "shape": "ParameterType", "type": "string"},
-            {"name": "Range", "shape": "ParameterRange", "type": "structure"},
-            {"name": "IsTunable", "shape": "Boolean", "type": "boolean"},
-            {"name": "IsRequired", "shape": "Boolean", "type": "boolean"},
-            {"name": "DefaultValue", "shape": "HyperParameterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterSpecifications": {
-        "member_shape": "HyperParameterSpecification",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HyperParameterTrainingJobDefinition": {
-        "members": [
-            {
-                "name": "DefinitionName",
-                "shape": "HyperParameterTrainingJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "TuningObjective",
-                "shape": "HyperParameterTuningJobObjective",
-                "type": "structure",
-            },
-            {
-                "name": "HyperParameterRanges",
-                "shape": "ParameterRanges",
-                "type": "structure",
-            },
-            {
-                "name": "StaticHyperParameters",
-                "shape": "HyperParameters",
-                "type": "map",
-            },
-            {
-                "name": "AlgorithmSpecification",
-                "shape": "HyperParameterAlgorithmSpecification",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "InputDataConfig", "shape": "InputDataConfig", "type": "list"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {
-                "name": "OutputDataConfig",
-                "shape": "OutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "ResourceConfig", "shape": "ResourceConfig", "type": "structure"},
-            {
-                "name": "HyperParameterTuningResourceConfig",
-                "shape": "HyperParameterTuningResourceConfig",
-                "type": "structure",
-            },
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "EnableManagedSpotTraining",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "CheckpointConfig",
-                "shape": "CheckpointConfig",
-                "type": "structure",
-            },
-            {"name": "RetryStrategy", "shape": "RetryStrategy", "type": "structure"},
-            {
-                "name": "Environment",
-                "shape": "HyperParameterTrainingJobEnvironmentMap",
-                "type": "map",
-            },
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTrainingJobDefinitions": {
-        "member_shape": "HyperParameterTrainingJobDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HyperParameterTrainingJobEnvironmentMap": {
-        "key_shape": "HyperParameterTrainingJobEnvironmentKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "HyperParameterTrainingJobEnvironmentValue",
-        "value_type": "string",
-    },
-    "HyperParameterTrainingJobSummaries": {
-        "member_shape": "HyperParameterTrainingJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HyperParameterTrainingJobSummary": {
-        "members": [
-            {
-                "name": "TrainingJobDefinitionName",
-                "shape": "HyperParameterTrainingJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"},
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"},
-            {
-                "name": "TuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "TrainingJobStatus",
-                "shape": "TrainingJobStatus",
-                "type": "string",
-            },
-            {"name": "TunedHyperParameters", "shape": "HyperParameters", "type": "map"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "FinalHyperParameterTuningJobObjectiveMetric",
-                "shape": "FinalHyperParameterTuningJobObjectiveMetric",
-                "type": "structure",
-            },
-            {"name": "ObjectiveStatus", "shape": "ObjectiveStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningInstanceConfig": {
-        "members": [
-            {"name": "InstanceType", "shape": "TrainingInstanceType", "type": "string"},
-            {
-                "name": "InstanceCount",
-                "shape": "TrainingInstanceCount",
-                "type": "integer",
-            },
-            {"name": "VolumeSizeInGB", "shape": "VolumeSizeInGB", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningInstanceConfigs": {
-        "member_shape": "HyperParameterTuningInstanceConfig",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HyperParameterTuningJobCompletionDetails": {
-        "members": [
-            {
-                "name": "NumberOfTrainingJobsObjectiveNotImproving",
-                "shape": "Integer",
-                "type": "integer",
-            },
-            {
-                "name": "ConvergenceDetectedTime",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobConfig": {
-        "members": [
-            {
-                "name": "Strategy",
-                "shape": "HyperParameterTuningJobStrategyType",
-                "type": "string",
-            },
-            {
-                "name": "StrategyConfig",
-                "shape": "HyperParameterTuningJobStrategyConfig",
-                "type": "structure",
-            },
-            {
-                "name": "HyperParameterTuningJobObjective",
-                "shape": "HyperParameterTuningJobObjective",
-                "type": "structure",
-            },
-            {"name": "ResourceLimits", "shape": "ResourceLimits", "type": "structure"},
-            {
-                "name": "ParameterRanges",
-                "shape": "ParameterRanges",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobEarlyStoppingType",
-                "shape": "TrainingJobEarlyStoppingType",
-                "type": "string",
-            },
-            {
-                "name": "TuningJobCompletionCriteria",
-                "shape": "TuningJobCompletionCriteria",
-                "type": "structure",
-            },
-            {"name": "RandomSeed", "shape": "RandomSeed", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobConsumedResources": {
-        "members": [
-            {"name": "RuntimeInSeconds", "shape": "Integer", "type": "integer"}
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobObjective": {
-        "members": [
-            {
-                "name": "Type",
-                "shape": "HyperParameterTuningJobObjectiveType",
-                "type": "string",
-            },
-            {"name": "MetricName", "shape": "MetricName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobObjectives": {
-        "member_shape": "HyperParameterTuningJobObjective",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HyperParameterTuningJobSearchEntity": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobArn",
-                "shape": "HyperParameterTuningJobArn",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobConfig",
-                "shape": "HyperParameterTuningJobConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobDefinition",
-                "shape": "HyperParameterTrainingJobDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingJobDefinitions",
-                "shape": "HyperParameterTrainingJobDefinitions",
-                "type": "list",
-            },
-            {
-                "name": "HyperParameterTuningJobStatus",
-                "shape": "HyperParameterTuningJobStatus",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "HyperParameterTuningEndTime",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "TrainingJobStatusCounters",
-                "shape": "TrainingJobStatusCounters",
-                "type": "structure",
-            },
-            {
-                "name": "ObjectiveStatusCounters",
-                "shape": "ObjectiveStatusCounters",
-                "type": "structure",
-            },
-            {
-                "name": "BestTrainingJob",
-                "shape": "HyperParameterTrainingJobSummary",
-                "type": "structure",
-            },
-            {
-                "name": "OverallBestTrainingJob",
-                "shape": "HyperParameterTrainingJobSummary",
-                "type": "structure",
-            },
-            {
-                "name": "WarmStartConfig",
-                "shape": "HyperParameterTuningJobWarmStartConfig",
-                "type": "structure",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "TuningJobCompletionDetails",
-                "shape": "HyperParameterTuningJobCompletionDetails",
-                "type": "structure",
-            },
-            {
-                "name": "ConsumedResources",
-                "shape": "HyperParameterTuningJobConsumedResources",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobStrategyConfig": {
-        "members": [
-            {
-                "name": "HyperbandStrategyConfig",
-                "shape": "HyperbandStrategyConfig",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobSummaries": {
-        "member_shape": "HyperParameterTuningJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "HyperParameterTuningJobSummary": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobArn",
-                "shape": "HyperParameterTuningJobArn",
-                "type": "string",
-            },
-            {
-                "name": "HyperParameterTuningJobStatus",
-                "shape": "HyperParameterTuningJobStatus",
-                "type": "string",
-            },
-            {
-                "name": "Strategy",
-                "shape": "HyperParameterTuningJobStrategyType",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "HyperParameterTuningEndTime",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "TrainingJobStatusCounters",
-                "shape": "TrainingJobStatusCounters",
-                "type": "structure",
-            },
-            {
-                "name": "ObjectiveStatusCounters",
-                "shape": "ObjectiveStatusCounters",
-                "type": "structure",
-            },
-            {"name": "ResourceLimits", "shape": "ResourceLimits", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningJobWarmStartConfig": {
-        "members": [
-            {
-                "name": "ParentHyperParameterTuningJobs",
-                "shape": "ParentHyperParameterTuningJobs",
-                "type": "list",
-            },
-            {
-                "name": "WarmStartType",
-                "shape": "HyperParameterTuningJobWarmStartType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "HyperParameterTuningResourceConfig": {
-        "members": [
-            {"name": "InstanceType", "shape": "TrainingInstanceType", "type": "string"},
-            {
-                "name": "InstanceCount",
-                "shape": "TrainingInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "OptionalVolumeSizeInGB",
-                "type": "integer",
-            },
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "AllocationStrategy",
-                "shape": "HyperParameterTuningAllocationStrategy",
-                "type": "string",
-            },
-            {
-                "name": "InstanceConfigs",
-                "shape": "HyperParameterTuningInstanceConfigs",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "HyperParameters": {
-        "key_shape": "HyperParameterKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "HyperParameterValue",
-        "value_type": "string",
-    },
-    "HyperbandStrategyConfig": {
-        "members": [
-            {
-                "name": "MinResource",
-                "shape": "HyperbandStrategyMinResource",
-                "type": "integer",
-            },
-            {
-                "name": "MaxResource",
-                "shape": "HyperbandStrategyMaxResource",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "IamIdentity": {
-        "members": [
-            {"name": "Arn", "shape": "String", "type": "string"},
-            {"name": "PrincipalId", "shape": "String", "type": "string"},
-            {"name": "SourceIdentity", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "IdentityProviderOAuthSetting": {
-        "members": [
-            {"name": "DataSourceName", "shape": "DataSourceName", "type": "string"},
-            {"name": "Status", "shape": "FeatureStatus", "type": "string"},
-            {"name": "SecretArn", "shape": "SecretArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "IdentityProviderOAuthSettings": {
-        "member_shape": "IdentityProviderOAuthSetting",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Image": {
-        "members": [
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Description", "shape": "ImageDescription", "type": "string"},
-            {"name": "DisplayName", "shape": "ImageDisplayName", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ImageArn", "shape": "ImageArn", "type": "string"},
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "ImageStatus", "shape": "ImageStatus", "type": "string"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ImageClassificationJobConfig": {
-        "members": [
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "ImageConfig": {
-        "members": [
-            {
-                "name": "RepositoryAccessMode",
-                "shape": "RepositoryAccessMode",
-                "type": "string",
-            },
-            {
-                "name": "RepositoryAuthConfig",
-                "shape": "RepositoryAuthConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ImageDeletePropertyList": {
-        "member_shape": "ImageDeleteProperty",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ImageVersion": {
-        "members": [
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ImageArn", "shape": "ImageArn", "type": "string"},
-            {"name": "ImageVersionArn", "shape": "ImageVersionArn", "type": "string"},
-            {
-                "name": "ImageVersionStatus",
-                "shape": "ImageVersionStatus",
-                "type": "string",
-            },
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Version", "shape": "ImageVersionNumber", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ImageVersions": {
-        "member_shape": "ImageVersion",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Images": {"member_shape": "Image", "member_type": "structure", "type": "list"},
-    "ImportHubContentRequest": {
-        "members": [
-            {"name": "HubContentName", "shape": "HubContentName", "type": "string"},
-            {
-                "name": "HubContentVersion",
-                "shape": "HubContentVersion",
-                "type": "string",
-            },
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {
-                "name": "DocumentSchemaVersion",
-                "shape": "DocumentSchemaVersion",
-                "type": "string",
-            },
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {
-                "name": "HubContentDisplayName",
-                "shape": "HubContentDisplayName",
-                "type": "string",
-            },
-            {
-                "name": "HubContentDescription",
-                "shape": "HubContentDescription",
-                "type": "string",
-            },
-            {
-                "name": "HubContentMarkdown",
-                "shape": "HubContentMarkdown",
-                "type": "string",
-            },
-            {
-                "name": "HubContentDocument",
-                "shape": "HubContentDocument",
-                "type": "string",
-            },
-            {
-                "name": "HubContentSearchKeywords",
-                "shape": "HubContentSearchKeywordList",
-                "type": "list",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ImportHubContentResponse": {
-        "members": [
-            {"name": "HubArn", "shape": "HubArn", "type": "string"},
-            {"name": "HubContentArn", "shape": "HubContentArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentComputeResourceRequirements": {
-        "members": [
-            {
-                "name": "NumberOfCpuCoresRequired",
-                "shape": "NumberOfCpuCores",
-                "type": "float",
-            },
-            {
-                "name": "NumberOfAcceleratorDevicesRequired",
-                "shape": "NumberOfAcceleratorDevices",
-                "type": "float",
-            },
-            {"name": "MinMemoryRequiredInMb", "shape": "MemoryInMb", "type": "integer"},
-            {"name": "MaxMemoryRequiredInMb", "shape": "MemoryInMb", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentContainerSpecification": {
-        "members": [
-            {"name": "Image", "shape": "ContainerImage", "type": "string"},
-            {"name": "ArtifactUrl", "shape": "Url", "type": "string"},
-            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentContainerSpecificationSummary": {
-        "members": [
-            {"name": "DeployedImage", "shape": "DeployedImage", "type": "structure"},
-            {"name": "ArtifactUrl", "shape": "Url", "type": "string"},
-            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentRuntimeConfig": {
-        "members": [
-            {
-                "name": "CopyCount",
-                "shape": "InferenceComponentCopyCount",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentRuntimeConfigSummary": {
-        "members": [
-            {
-                "name": "DesiredCopyCount",
-                "shape": "InferenceComponentCopyCount",
-                "type": "integer",
-            },
-            {
-                "name": "CurrentCopyCount",
-                "shape": "InferenceComponentCopyCount",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentSpecification": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "Container",
-                "shape": "InferenceComponentContainerSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "StartupParameters",
-                "shape": "InferenceComponentStartupParameters",
-                "type": "structure",
-            },
-            {
-                "name": "ComputeResourceRequirements",
-                "shape": "InferenceComponentComputeResourceRequirements",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentSpecificationSummary": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "Container",
-                "shape": "InferenceComponentContainerSpecificationSummary",
-                "type": "structure",
-            },
-            {
-                "name": "StartupParameters",
-                "shape": "InferenceComponentStartupParameters",
-                "type": "structure",
-            },
-            {
-                "name": "ComputeResourceRequirements",
-                "shape": "InferenceComponentComputeResourceRequirements",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentStartupParameters": {
-        "members": [
-            {
-                "name": "ModelDataDownloadTimeoutInSeconds",
-                "shape": "ProductionVariantModelDataDownloadTimeoutInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "ContainerStartupHealthCheckTimeoutInSeconds",
-                "shape": "ProductionVariantContainerStartupHealthCheckTimeoutInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentSummary": {
-        "members": [
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "InferenceComponentArn",
-                "shape": "InferenceComponentArn",
-                "type": "string",
-            },
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            },
-            {"name": "EndpointArn", "shape": "EndpointArn", "type": "string"},
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {
-                "name": "InferenceComponentStatus",
-                "shape": "InferenceComponentStatus",
-                "type": "string",
-            },
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "InferenceComponentSummaryList": {
-        "member_shape": "InferenceComponentSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InferenceExecutionConfig": {
-        "members": [
-            {"name": "Mode", "shape": "InferenceExecutionMode", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "InferenceExperimentDataStorageConfig": {
-        "members": [
-            {"name": "Destination", "shape": "DestinationS3Uri", "type": "string"},
-            {"name": "KmsKey", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "ContentType",
-                "shape": "CaptureContentTypeHeader",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceExperimentList": {
-        "member_shape": "InferenceExperimentSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InferenceExperimentSchedule": {
-        "members": [
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "InferenceExperimentSummary": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"},
-            {"name": "Type", "shape": "InferenceExperimentType", "type": "string"},
-            {
-                "name": "Schedule",
-                "shape": "InferenceExperimentSchedule",
-                "type": "structure",
-            },
-            {"name": "Status", "shape": "InferenceExperimentStatus", "type": "string"},
-            {
-                "name": "StatusReason",
-                "shape": "InferenceExperimentStatusReason",
-                "type": "string",
-            },
-            {
-                "name": "Description",
-                "shape": "InferenceExperimentDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CompletionTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "InferenceMetrics": {
-        "members": [
-            {"name": "MaxInvocations", "shape": "Integer", "type": "integer"},
-            {"name": "ModelLatency", "shape": "Integer", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "InferenceRecommendation": {
-        "members": [
-            {"name": "RecommendationId", "shape": "String", "type": "string"},
-            {"name": "Metrics", "shape": "RecommendationMetrics", "type": "structure"},
-            {
-                "name": "EndpointConfiguration",
-                "shape": "EndpointOutputConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "ModelConfiguration",
-                "shape": "ModelConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "InvocationEndTime",
-                "shape": "InvocationEndTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "InvocationStartTime",
-                "shape": "InvocationStartTime",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceRecommendations": {
-        "member_shape": "InferenceRecommendation",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InferenceRecommendationsJob": {
-        "members": [
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"},
-            {
-                "name": "JobDescription",
-                "shape": "RecommendationJobDescription",
-                "type": "string",
-            },
-            {"name": "JobType", "shape": "RecommendationJobType", "type": "string"},
-            {"name": "JobArn", "shape": "RecommendationJobArn", "type": "string"},
-            {"name": "Status", "shape": "RecommendationJobStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "CompletionTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {"name": "SamplePayloadUrl", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "ModelPackageVersionArn",
-                "shape": "ModelPackageArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceRecommendationsJobStep": {
-        "members": [
-            {"name": "StepType", "shape": "RecommendationStepType", "type": "string"},
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"},
-            {"name": "Status", "shape": "RecommendationJobStatus", "type": "string"},
-            {
-                "name": "InferenceBenchmark",
-                "shape": "RecommendationJobInferenceBenchmark",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "InferenceRecommendationsJobSteps": {
-        "member_shape": "InferenceRecommendationsJobStep",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InferenceRecommendationsJobs": {
-        "member_shape": "InferenceRecommendationsJob",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InferenceSpecification": {
-        "members": [
-            {
-                "name": "Containers",
-                "shape": "ModelPackageContainerDefinitionList",
-                "type": "list",
-            },
-            {
-                "name": "SupportedTransformInstanceTypes",
-                "shape": "TransformInstanceTypes",
-                "type": "list",
-            },
-            {
-                "name": "SupportedRealtimeInferenceInstanceTypes",
-                "shape": "RealtimeInferenceInstanceTypes",
-                "type": "list",
-            },
-            {"name": "SupportedContentTypes", "shape": "ContentTypes", "type": "list"},
-            {
-                "name": "SupportedResponseMIMETypes",
-                "shape": "ResponseMIMETypes",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "InfraCheckConfig": {
-        "members": [
-            {"name": "EnableInfraCheck", "shape": "EnableInfraCheck", "type": "boolean"}
-        ],
-        "type": "structure",
-    },
-    "InputConfig": {
-        "members": [
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "DataInputConfig", "shape": "DataInputConfig", "type": "string"},
-            {"name": "Framework", "shape": "Framework", "type": "string"},
-            {"name": "FrameworkVersion", "shape": "FrameworkVersion", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "InputDataConfig": {
-        "member_shape": "Channel",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InputModes": {
-        "member_shape": "TrainingInputMode",
-        "member_type": "string",
-        "type": "list",
-    },
-    "InstanceGroup": {
-        "members": [
-            {"name": "InstanceType", "shape": "TrainingInstanceType", "type": "string"},
-            {
-                "name": "InstanceCount",
-                "shape": "TrainingInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "InstanceGroupName",
-                "shape": "InstanceGroupName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "InstanceGroupNames": {
-        "member_shape": "InstanceGroupName",
-        "member_type": "string",
-        "type": "list",
-    },
-    "InstanceGroups": {
-        "member_shape": "InstanceGroup",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InstanceMetadataServiceConfiguration": {
-        "members": [
-            {
-                "name": "MinimumInstanceMetadataServiceVersion",
-                "shape": "MinimumInstanceMetadataServiceVersion",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "IntegerParameterRange": {
-        "members": [
-            {"name": "Name", "shape": "ParameterKey", "type": "string"},
-            {"name": "MinValue", "shape": "ParameterValue", "type": "string"},
-            {"name": "MaxValue", "shape": "ParameterValue", "type": "string"},
-            {
-                "name": "ScalingType",
-                "shape": "HyperParameterScalingType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "IntegerParameterRangeSpecification": {
-        "members": [
-            {"name": "MinValue", "shape": "ParameterValue", "type": "string"},
-            {"name": "MaxValue", "shape": "ParameterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "IntegerParameterRanges": {
-        "member_shape": "IntegerParameterRange",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "InternalDependencyException": {
-        "members": [{"name": "Message", "shape": "Message", "type": "string"}],
-        "type": "structure",
-    },
-    "InternalFailure": {
-        "members": [{"name": "Message", "shape": "Message", "type": "string"}],
-        "type": "structure",
-    },
-    "InternalStreamFailure": {
-        "members": [{"name": "Message", "shape": "Message", "type": "string"}],
-        "type": "structure",
-    },
-    "InvokeEndpointAsyncInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "ContentType", "shape": "Header", "type": "string"},
-            {"name": "Accept", "shape": "Header", "type": "string"},
-            {
-                "name": "CustomAttributes",
-                "shape": "CustomAttributesHeader",
-                "type": "string",
-            },
-            {"name": "InferenceId", "shape": "InferenceId", "type": "string"},
-            {"name": "InputLocation", "shape": "InputLocationHeader", "type": "string"},
-            {
-                "name": "RequestTTLSeconds",
-                "shape": "RequestTTLSecondsHeader",
-                "type": "integer",
-            },
-            {
-                "name": "InvocationTimeoutSeconds",
-                "shape": "InvocationTimeoutSecondsHeader",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "InvokeEndpointAsyncOutput": {
-        "members": [
-            {"name": "InferenceId", "shape": "Header", "type": "string"},
-            {"name": "OutputLocation", "shape": "Header", "type": "string"},
-            {"name": "FailureLocation", "shape": "Header", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "InvokeEndpointInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "Body", "shape": "BodyBlob", "type": "blob"},
-            {"name": "ContentType", "shape": "Header", "type": "string"},
-            {"name": "Accept", "shape": "Header", "type": "string"},
-            {
-                "name": "CustomAttributes",
-                "shape": "CustomAttributesHeader",
-                "type": "string",
-            },
-            {"name": "TargetModel", "shape": "TargetModelHeader", "type": "string"},
-            {"name": "TargetVariant", "shape": "TargetVariantHeader", "type": "string"},
-            {
-                "name": "TargetContainerHostname",
-                "shape": "TargetContainerHostnameHeader",
-                "type": "string",
-            },
-            {"name": "InferenceId", "shape": "InferenceId", "type": "string"},
-            {
-                "name": "EnableExplanations",
-                "shape": "EnableExplanationsHeader",
-                "type": "string",
-            },
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentHeader",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "InvokeEndpointOutput": {
-        "members": [
-            {"name": "Body", "shape": "BodyBlob", "type": "blob"},
-            {"name": "ContentType", "shape": "Header", "type": "string"},
-            {"name": "InvokedProductionVariant", "shape": "Header", "type": "string"},
-            {
-                "name": "CustomAttributes",
-                "shape": "CustomAttributesHeader",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "InvokeEndpointWithResponseStreamInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "Body", "shape": "BodyBlob", "type": "blob"},
-            {"name": "ContentType", "shape": "Header", "type": "string"},
-            {"name": "Accept", "shape": "Header", "type": "string"},
-            {
-                "name": "CustomAttributes",
-                "shape": "CustomAttributesHeader",
-                "type": "string",
-            },
-            {"name": "TargetVariant", "shape": "TargetVariantHeader", "type": "string"},
-            {
-                "name": "TargetContainerHostname",
-                "shape": "TargetContainerHostnameHeader",
-                "type": "string",
-            },
-            {"name": "InferenceId", "shape": "InferenceId", "type": "string"},
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentHeader",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "InvokeEndpointWithResponseStreamOutput": {
-        "members": [
-            {"name": "Body", "shape": "ResponseStream", "type": "structure"},
-            {"name": "ContentType", "shape": "Header", "type": "string"},
-            {"name": "InvokedProductionVariant", "shape": "Header", "type": "string"},
-            {
-                "name": "CustomAttributes",
-                "shape": "CustomAttributesHeader",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "JsonContentTypes": {
-        "member_shape": "JsonContentType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "JupyterLabAppImageConfig": {
-        "members": [
-            {
-                "name": "FileSystemConfig",
-                "shape": "FileSystemConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ContainerConfig",
-                "shape": "ContainerConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "JupyterLabAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {"name": "CustomImages", "shape": "CustomImages", "type": "list"},
-            {
-                "name": "LifecycleConfigArns",
-                "shape": "LifecycleConfigArns",
-                "type": "list",
-            },
-            {"name": "CodeRepositories", "shape": "CodeRepositories", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "JupyterServerAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {
-                "name": "LifecycleConfigArns",
-                "shape": "LifecycleConfigArns",
-                "type": "list",
-            },
-            {"name": "CodeRepositories", "shape": "CodeRepositories", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "KendraSettings": {
-        "members": [{"name": "Status", "shape": "FeatureStatus", "type": "string"}],
-        "type": "structure",
-    },
-    "KernelGatewayAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {"name": "CustomImages", "shape": "CustomImages", "type": "list"},
-            {
-                "name": "LifecycleConfigArns",
-                "shape": "LifecycleConfigArns",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "KernelGatewayImageConfig": {
-        "members": [
-            {"name": "KernelSpecs", "shape": "KernelSpecs", "type": "list"},
-            {
-                "name": "FileSystemConfig",
-                "shape": "FileSystemConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "KernelSpec": {
-        "members": [
-            {"name": "Name", "shape": "KernelName", "type": "string"},
-            {"name": "DisplayName", "shape": "KernelDisplayName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "KernelSpecs": {
-        "member_shape": "KernelSpec",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "LabelCounters": {
-        "members": [
-            {"name": "TotalLabeled", "shape": "LabelCounter", "type": "integer"},
-            {"name": "HumanLabeled", "shape": "LabelCounter", "type": "integer"},
-            {"name": "MachineLabeled", "shape": "LabelCounter", "type": "integer"},
-            {
-                "name": "FailedNonRetryableError",
-                "shape": "LabelCounter",
-                "type": "integer",
-            },
-            {"name": "Unlabeled", "shape": "LabelCounter", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "LabelCountersForWorkteam": {
-        "members": [
-            {"name": "HumanLabeled", "shape": "LabelCounter", "type": "integer"},
-            {"name": "PendingHuman", "shape": "LabelCounter", "type": "integer"},
-            {"name": "Total", "shape": "LabelCounter", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "LabelingJobAlgorithmsConfig": {
-        "members": [
-            {
-                "name": "LabelingJobAlgorithmSpecificationArn",
-                "shape": "LabelingJobAlgorithmSpecificationArn",
-                "type": "string",
-            },
-            {
-                "name": "InitialActiveLearningModelArn",
-                "shape": "ModelArn",
-                "type": "string",
-            },
-            {
-                "name": "LabelingJobResourceConfig",
-                "shape": "LabelingJobResourceConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobDataAttributes": {
-        "members": [
-            {
-                "name": "ContentClassifiers",
-                "shape": "ContentClassifiers",
-                "type": "list",
-            }
-        ],
-        "type": "structure",
-    },
-    "LabelingJobDataSource": {
-        "members": [
-            {
-                "name": "S3DataSource",
-                "shape": "LabelingJobS3DataSource",
-                "type": "structure",
-            },
-            {
-                "name": "SnsDataSource",
-                "shape": "LabelingJobSnsDataSource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobForWorkteamSummary": {
-        "members": [
-            {"name": "LabelingJobName", "shape": "LabelingJobName", "type": "string"},
-            {"name": "JobReferenceCode", "shape": "JobReferenceCode", "type": "string"},
-            {"name": "WorkRequesterAccountId", "shape": "AccountId", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LabelCounters",
-                "shape": "LabelCountersForWorkteam",
-                "type": "structure",
-            },
-            {
-                "name": "NumberOfHumanWorkersPerDataObject",
-                "shape": "NumberOfHumanWorkersPerDataObject",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobForWorkteamSummaryList": {
-        "member_shape": "LabelingJobForWorkteamSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "LabelingJobInputConfig": {
-        "members": [
-            {
-                "name": "DataSource",
-                "shape": "LabelingJobDataSource",
-                "type": "structure",
-            },
-            {
-                "name": "DataAttributes",
-                "shape": "LabelingJobDataAttributes",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobOutput": {
-        "members": [
-            {"name": "OutputDatasetS3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "FinalActiveLearningModelArn",
-                "shape": "ModelArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobOutputConfig": {
-        "members": [
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "SnsTopicArn", "shape": "SnsTopicArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "LabelingJobResourceConfig": {
-        "members": [
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "LabelingJobS3DataSource": {
-        "members": [{"name": "ManifestS3Uri", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "LabelingJobSnsDataSource": {
-        "members": [{"name": "SnsTopicArn", "shape": "SnsTopicArn", "type": "string"}],
-        "type": "structure",
-    },
-    "LabelingJobStoppingConditions": {
-        "members": [
-            {
-                "name": "MaxHumanLabeledObjectCount",
-                "shape": "MaxHumanLabeledObjectCount",
-                "type": "integer",
-            },
-            {
-                "name": "MaxPercentageOfInputDatasetLabeled",
-                "shape": "MaxPercentageOfInputDatasetLabeled",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobSummary": {
-        "members": [
-            {"name": "LabelingJobName", "shape": "LabelingJobName", "type": "string"},
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LabelingJobStatus",
-                "shape": "LabelingJobStatus",
-                "type": "string",
-            },
-            {"name": "LabelCounters", "shape": "LabelCounters", "type": "structure"},
-            {"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"},
-            {
-                "name": "PreHumanTaskLambdaArn",
-                "shape": "LambdaFunctionArn",
-                "type": "string",
-            },
-            {
-                "name": "AnnotationConsolidationLambdaArn",
-                "shape": "LambdaFunctionArn",
-                "type": "string",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "LabelingJobOutput",
-                "shape": "LabelingJobOutput",
-                "type": "structure",
-            },
-            {
-                "name": "InputConfig",
-                "shape": "LabelingJobInputConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "LabelingJobSummaryList": {
-        "member_shape": "LabelingJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "LambdaStepMetadata": {
-        "members": [
-            {"name": "Arn", "shape": "String256", "type": "string"},
-            {
-                "name": "OutputParameters",
-                "shape": "OutputParameterList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "LastUpdateStatus": {
-        "members": [
-            {"name": "Status", "shape": "LastUpdateStatusValue", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "LifecycleConfigArns": {
-        "member_shape": "StudioLifecycleConfigArn",
-        "member_type": "string",
-        "type": "list",
-    },
-    "LineageEntityParameters": {
-        "key_shape": "StringParameterValue",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "StringParameterValue",
-        "value_type": "string",
-    },
-    "LineageGroupSummaries": {
-        "member_shape": "LineageGroupSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "LineageGroupSummary": {
-        "members": [
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-            {
-                "name": "LineageGroupName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListActionsRequest": {
-        "members": [
-            {"name": "SourceUri", "shape": "SourceUri", "type": "string"},
-            {"name": "ActionType", "shape": "String256", "type": "string"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortActionsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListActionsResponse": {
-        "members": [
-            {"name": "ActionSummaries", "shape": "ActionSummaries", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAlgorithmsInput": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "AlgorithmSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAlgorithmsOutput": {
-        "members": [
-            {
-                "name": "AlgorithmSummaryList",
-                "shape": "AlgorithmSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAliasesRequest": {
-        "members": [
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "Alias", "shape": "SageMakerImageVersionAlias", "type": "string"},
-            {"name": "Version", "shape": "ImageVersionNumber", "type": "integer"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAliasesResponse": {
-        "members": [
-            {
-                "name": "SageMakerImageVersionAliases",
-                "shape": "SageMakerImageVersionAliases",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAppImageConfigsRequest": {
-        "members": [
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "NameContains", "shape": "AppImageConfigName", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModifiedTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModifiedTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "AppImageConfigSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAppImageConfigsResponse": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "AppImageConfigs", "shape": "AppImageConfigList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ListAppsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "SortBy", "shape": "AppSortKey", "type": "string"},
-            {"name": "DomainIdEquals", "shape": "DomainId", "type": "string"},
-            {
-                "name": "UserProfileNameEquals",
-                "shape": "UserProfileName",
-                "type": "string",
-            },
-            {"name": "SpaceNameEquals", "shape": "SpaceName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAppsResponse": {
-        "members": [
-            {"name": "Apps", "shape": "AppList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListArtifactsRequest": {
-        "members": [
-            {"name": "SourceUri", "shape": "SourceUri", "type": "string"},
-            {"name": "ArtifactType", "shape": "String256", "type": "string"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortArtifactsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListArtifactsResponse": {
-        "members": [
-            {"name": "ArtifactSummaries", "shape": "ArtifactSummaries", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAssociationsRequest": {
-        "members": [
-            {"name": "SourceArn", "shape": "AssociationEntityArn", "type": "string"},
-            {
-                "name": "DestinationArn",
-                "shape": "AssociationEntityArn",
-                "type": "string",
-            },
-            {"name": "SourceType", "shape": "String256", "type": "string"},
-            {"name": "DestinationType", "shape": "String256", "type": "string"},
-            {
-                "name": "AssociationType",
-                "shape": "AssociationEdgeType",
-                "type": "string",
-            },
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortAssociationsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListAssociationsResponse": {
-        "members": [
-            {
-                "name": "AssociationSummaries",
-                "shape": "AssociationSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAutoMLJobsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "AutoMLNameContains", "type": "string"},
-            {"name": "StatusEquals", "shape": "AutoMLJobStatus", "type": "string"},
-            {"name": "SortOrder", "shape": "AutoMLSortOrder", "type": "string"},
-            {"name": "SortBy", "shape": "AutoMLSortBy", "type": "string"},
-            {"name": "MaxResults", "shape": "AutoMLMaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListAutoMLJobsResponse": {
-        "members": [
-            {
-                "name": "AutoMLJobSummaries",
-                "shape": "AutoMLJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListCandidatesForAutoMLJobRequest": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"},
-            {"name": "StatusEquals", "shape": "CandidateStatus", "type": "string"},
-            {"name": "CandidateNameEquals", "shape": "CandidateName", "type": "string"},
-            {"name": "SortOrder", "shape": "AutoMLSortOrder", "type": "string"},
-            {"name": "SortBy", "shape": "CandidateSortBy", "type": "string"},
-            {
-                "name": "MaxResults",
-                "shape": "AutoMLMaxResultsForTrials",
-                "type": "integer",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListCandidatesForAutoMLJobResponse": {
-        "members": [
-            {"name": "Candidates", "shape": "AutoMLCandidates", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListClusterNodesRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterNameOrArn", "type": "string"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "InstanceGroupNameContains",
-                "shape": "ClusterInstanceGroupName",
-                "type": "string",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ClusterSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListClusterNodesResponse": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "ClusterNodeSummaries",
-                "shape": "ClusterNodeSummaries",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListClustersRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ClusterSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListClustersResponse": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "ClusterSummaries", "shape": "ClusterSummaries", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ListCodeRepositoriesInput": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {
-                "name": "NameContains",
-                "shape": "CodeRepositoryNameContains",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "CodeRepositorySortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "CodeRepositorySortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListCodeRepositoriesOutput": {
-        "members": [
-            {
-                "name": "CodeRepositorySummaryList",
-                "shape": "CodeRepositorySummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListCompilationJobsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "StatusEquals", "shape": "CompilationJobStatus", "type": "string"},
-            {"name": "SortBy", "shape": "ListCompilationJobsSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListCompilationJobsResponse": {
-        "members": [
-            {
-                "name": "CompilationJobSummaries",
-                "shape": "CompilationJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListContextsRequest": {
-        "members": [
-            {"name": "SourceUri", "shape": "SourceUri", "type": "string"},
-            {"name": "ContextType", "shape": "String256", "type": "string"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortContextsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListContextsResponse": {
-        "members": [
-            {"name": "ContextSummaries", "shape": "ContextSummaries", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListDataQualityJobDefinitionsRequest": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "SortBy",
-                "shape": "MonitoringJobDefinitionSortKey",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListDataQualityJobDefinitionsResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionSummaries",
-                "shape": "MonitoringJobDefinitionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListDeviceFleetsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "ListMaxResults", "type": "integer"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "SortBy", "shape": "ListDeviceFleetsSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListDeviceFleetsResponse": {
-        "members": [
-            {
-                "name": "DeviceFleetSummaries",
-                "shape": "DeviceFleetSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListDevicesRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "ListMaxResults", "type": "integer"},
-            {"name": "LatestHeartbeatAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModelName", "shape": "EntityName", "type": "string"},
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListDevicesResponse": {
-        "members": [
-            {"name": "DeviceSummaries", "shape": "DeviceSummaries", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListDomainsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListDomainsResponse": {
-        "members": [
-            {"name": "Domains", "shape": "DomainList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEdgeDeploymentPlansRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "ListMaxResults", "type": "integer"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {
-                "name": "DeviceFleetNameContains",
-                "shape": "NameContains",
-                "type": "string",
-            },
-            {
-                "name": "SortBy",
-                "shape": "ListEdgeDeploymentPlansSortBy",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEdgeDeploymentPlansResponse": {
-        "members": [
-            {
-                "name": "EdgeDeploymentPlanSummaries",
-                "shape": "EdgeDeploymentPlanSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEdgePackagingJobsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "ListMaxResults", "type": "integer"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "ModelNameContains", "shape": "NameContains", "type": "string"},
-            {
-                "name": "StatusEquals",
-                "shape": "EdgePackagingJobStatus",
-                "type": "string",
-            },
-            {
-                "name": "SortBy",
-                "shape": "ListEdgePackagingJobsSortBy",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEdgePackagingJobsResponse": {
-        "members": [
-            {
-                "name": "EdgePackagingJobSummaries",
-                "shape": "EdgePackagingJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEndpointConfigsInput": {
-        "members": [
-            {"name": "SortBy", "shape": "EndpointConfigSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "OrderKey", "type": "string"},
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {
-                "name": "NameContains",
-                "shape": "EndpointConfigNameContains",
-                "type": "string",
-            },
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListEndpointConfigsOutput": {
-        "members": [
-            {
-                "name": "EndpointConfigs",
-                "shape": "EndpointConfigSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEndpointsInput": {
-        "members": [
-            {"name": "SortBy", "shape": "EndpointSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "OrderKey", "type": "string"},
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "EndpointNameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "StatusEquals", "shape": "EndpointStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListEndpointsOutput": {
-        "members": [
-            {"name": "Endpoints", "shape": "EndpointSummaryList", "type": "list"},
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListExperimentsRequest": {
-        "members": [
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortExperimentsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListExperimentsResponse": {
-        "members": [
-            {
-                "name": "ExperimentSummaries",
-                "shape": "ExperimentSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListFeatureGroupsRequest": {
-        "members": [
-            {
-                "name": "NameContains",
-                "shape": "FeatureGroupNameContains",
-                "type": "string",
-            },
-            {
-                "name": "FeatureGroupStatusEquals",
-                "shape": "FeatureGroupStatus",
-                "type": "string",
-            },
-            {
-                "name": "OfflineStoreStatusEquals",
-                "shape": "OfflineStoreStatusValue",
-                "type": "string",
-            },
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {"name": "SortOrder", "shape": "FeatureGroupSortOrder", "type": "string"},
-            {"name": "SortBy", "shape": "FeatureGroupSortBy", "type": "string"},
-            {
-                "name": "MaxResults",
-                "shape": "FeatureGroupMaxResults",
-                "type": "integer",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListFeatureGroupsResponse": {
-        "members": [
-            {
-                "name": "FeatureGroupSummaries",
-                "shape": "FeatureGroupSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListFlowDefinitionsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListFlowDefinitionsResponse": {
-        "members": [
-            {
-                "name": "FlowDefinitionSummaries",
-                "shape": "FlowDefinitionSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHubContentVersionsRequest": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {"name": "HubContentName", "shape": "HubContentName", "type": "string"},
-            {"name": "MinVersion", "shape": "HubContentVersion", "type": "string"},
-            {
-                "name": "MaxSchemaVersion",
-                "shape": "DocumentSchemaVersion",
-                "type": "string",
-            },
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "HubContentSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHubContentVersionsResponse": {
-        "members": [
-            {
-                "name": "HubContentSummaries",
-                "shape": "HubContentInfoList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHubContentsRequest": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubContentType", "shape": "HubContentType", "type": "string"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {
-                "name": "MaxSchemaVersion",
-                "shape": "DocumentSchemaVersion",
-                "type": "string",
-            },
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "HubContentSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHubContentsResponse": {
-        "members": [
-            {
-                "name": "HubContentSummaries",
-                "shape": "HubContentInfoList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHubsRequest": {
-        "members": [
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "SortBy", "shape": "HubSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHubsResponse": {
-        "members": [
-            {"name": "HubSummaries", "shape": "HubInfoList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHumanTaskUisRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListHumanTaskUisResponse": {
-        "members": [
-            {
-                "name": "HumanTaskUiSummaries",
-                "shape": "HumanTaskUiSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListHyperParameterTuningJobsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {
-                "name": "SortBy",
-                "shape": "HyperParameterTuningJobSortByOptions",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "StatusEquals",
-                "shape": "HyperParameterTuningJobStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListHyperParameterTuningJobsResponse": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobSummaries",
-                "shape": "HyperParameterTuningJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListImageVersionsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ImageVersionSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "ImageVersionSortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListImageVersionsResponse": {
-        "members": [
-            {"name": "ImageVersions", "shape": "ImageVersions", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListImagesRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "ImageNameContains", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ImageSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "ImageSortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListImagesResponse": {
-        "members": [
-            {"name": "Images", "shape": "Images", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceComponentsInput": {
-        "members": [
-            {"name": "SortBy", "shape": "InferenceComponentSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "OrderKey", "type": "string"},
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {
-                "name": "NameContains",
-                "shape": "InferenceComponentNameContains",
-                "type": "string",
-            },
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "StatusEquals",
-                "shape": "InferenceComponentStatus",
-                "type": "string",
-            },
-            {"name": "EndpointNameEquals", "shape": "EndpointName", "type": "string"},
-            {"name": "VariantNameEquals", "shape": "VariantName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceComponentsOutput": {
-        "members": [
-            {
-                "name": "InferenceComponents",
-                "shape": "InferenceComponentSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceExperimentsRequest": {
-        "members": [
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "Type", "shape": "InferenceExperimentType", "type": "string"},
-            {
-                "name": "StatusEquals",
-                "shape": "InferenceExperimentStatus",
-                "type": "string",
-            },
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "SortBy", "shape": "SortInferenceExperimentsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceExperimentsResponse": {
-        "members": [
-            {
-                "name": "InferenceExperiments",
-                "shape": "InferenceExperimentList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceRecommendationsJobStepsRequest": {
-        "members": [
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"},
-            {"name": "Status", "shape": "RecommendationJobStatus", "type": "string"},
-            {"name": "StepType", "shape": "RecommendationStepType", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceRecommendationsJobStepsResponse": {
-        "members": [
-            {
-                "name": "Steps",
-                "shape": "InferenceRecommendationsJobSteps",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListInferenceRecommendationsJobsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {
-                "name": "StatusEquals",
-                "shape": "RecommendationJobStatus",
-                "type": "string",
-            },
-            {
-                "name": "SortBy",
-                "shape": "ListInferenceRecommendationsJobsSortBy",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "ModelNameEquals", "shape": "ModelName", "type": "string"},
-            {
-                "name": "ModelPackageVersionArnEquals",
-                "shape": "ModelPackageArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListInferenceRecommendationsJobsResponse": {
-        "members": [
-            {
-                "name": "InferenceRecommendationsJobs",
-                "shape": "InferenceRecommendationsJobs",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListLabelingJobsForWorkteamRequest": {
-        "members": [
-            {"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "JobReferenceCodeContains",
-                "shape": "JobReferenceCodeContains",
-                "type": "string",
-            },
-            {
-                "name": "SortBy",
-                "shape": "ListLabelingJobsForWorkteamSortByOptions",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListLabelingJobsForWorkteamResponse": {
-        "members": [
-            {
-                "name": "LabelingJobSummaryList",
-                "shape": "LabelingJobForWorkteamSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListLabelingJobsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "SortBy", "shape": "SortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "StatusEquals", "shape": "LabelingJobStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListLabelingJobsResponse": {
-        "members": [
-            {
-                "name": "LabelingJobSummaryList",
-                "shape": "LabelingJobSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListLineageEntityParameterKey": {
-        "member_shape": "StringParameterValue",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ListLineageGroupsRequest": {
-        "members": [
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortLineageGroupsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListLineageGroupsResponse": {
-        "members": [
-            {
-                "name": "LineageGroupSummaries",
-                "shape": "LineageGroupSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelBiasJobDefinitionsRequest": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "SortBy",
-                "shape": "MonitoringJobDefinitionSortKey",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListModelBiasJobDefinitionsResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionSummaries",
-                "shape": "MonitoringJobDefinitionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelCardExportJobsRequest": {
-        "members": [
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "ModelCardExportJobNameContains",
-                "shape": "EntityName",
-                "type": "string",
-            },
-            {
-                "name": "StatusEquals",
-                "shape": "ModelCardExportJobStatus",
-                "type": "string",
-            },
-            {"name": "SortBy", "shape": "ModelCardExportJobSortBy", "type": "string"},
-            {
-                "name": "SortOrder",
-                "shape": "ModelCardExportJobSortOrder",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListModelCardExportJobsResponse": {
-        "members": [
-            {
-                "name": "ModelCardExportJobSummaries",
-                "shape": "ModelCardExportJobSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelCardVersionsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "ModelCardName", "shape": "ModelCardNameOrArn", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ModelCardVersionSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "ModelCardSortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelCardVersionsResponse": {
-        "members": [
-            {
-                "name": "ModelCardVersionSummaryList",
-                "shape": "ModelCardVersionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelCardsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ModelCardSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "ModelCardSortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelCardsResponse": {
-        "members": [
-            {
-                "name": "ModelCardSummaries",
-                "shape": "ModelCardSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelExplainabilityJobDefinitionsRequest": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "SortBy",
-                "shape": "MonitoringJobDefinitionSortKey",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListModelExplainabilityJobDefinitionsResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionSummaries",
-                "shape": "MonitoringJobDefinitionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelMetadataRequest": {
-        "members": [
-            {
-                "name": "SearchExpression",
-                "shape": "ModelMetadataSearchExpression",
-                "type": "structure",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListModelMetadataResponse": {
-        "members": [
-            {
-                "name": "ModelMetadataSummaries",
-                "shape": "ModelMetadataSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelPackageGroupsInput": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ModelPackageGroupSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelPackageGroupsOutput": {
-        "members": [
-            {
-                "name": "ModelPackageGroupSummaryList",
-                "shape": "ModelPackageGroupSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelPackagesInput": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-            {"name": "ModelPackageGroupName", "shape": "ArnOrName", "type": "string"},
-            {"name": "ModelPackageType", "shape": "ModelPackageType", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ModelPackageSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelPackagesOutput": {
-        "members": [
-            {
-                "name": "ModelPackageSummaryList",
-                "shape": "ModelPackageSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelQualityJobDefinitionsRequest": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "SortBy",
-                "shape": "MonitoringJobDefinitionSortKey",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListModelQualityJobDefinitionsResponse": {
-        "members": [
-            {
-                "name": "JobDefinitionSummaries",
-                "shape": "MonitoringJobDefinitionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListModelsInput": {
-        "members": [
-            {"name": "SortBy", "shape": "ModelSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "OrderKey", "type": "string"},
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "ModelNameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ListModelsOutput": {
-        "members": [
-            {"name": "Models", "shape": "ModelSummaryList", "type": "list"},
-            {"name": "NextToken", "shape": "PaginationToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringAlertHistoryRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringAlertName",
-                "shape": "MonitoringAlertName",
-                "type": "string",
-            },
-            {
-                "name": "SortBy",
-                "shape": "MonitoringAlertHistorySortKey",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "StatusEquals",
-                "shape": "MonitoringAlertStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringAlertHistoryResponse": {
-        "members": [
-            {
-                "name": "MonitoringAlertHistory",
-                "shape": "MonitoringAlertHistoryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringAlertsRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringAlertsResponse": {
-        "members": [
-            {
-                "name": "MonitoringAlertSummaries",
-                "shape": "MonitoringAlertSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringExecutionsRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "SortBy", "shape": "MonitoringExecutionSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "ScheduledTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ScheduledTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "StatusEquals", "shape": "ExecutionStatus", "type": "string"},
-            {
-                "name": "MonitoringJobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringTypeEquals",
-                "shape": "MonitoringType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringExecutionsResponse": {
-        "members": [
-            {
-                "name": "MonitoringExecutionSummaries",
-                "shape": "MonitoringExecutionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringSchedulesRequest": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "SortBy", "shape": "MonitoringScheduleSortKey", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "StatusEquals", "shape": "ScheduleStatus", "type": "string"},
-            {
-                "name": "MonitoringJobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringTypeEquals",
-                "shape": "MonitoringType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListMonitoringSchedulesResponse": {
-        "members": [
-            {
-                "name": "MonitoringScheduleSummaries",
-                "shape": "MonitoringScheduleSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListNotebookInstanceLifecycleConfigsInput": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {
-                "name": "SortBy",
-                "shape": "NotebookInstanceLifecycleConfigSortKey",
-                "type": "string",
-            },
-            {
-                "name": "SortOrder",
-                "shape": "NotebookInstanceLifecycleConfigSortOrder",
-                "type": "string",
-            },
-            {
-                "name": "NameContains",
-                "shape": "NotebookInstanceLifecycleConfigNameContains",
-                "type": "string",
-            },
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListNotebookInstanceLifecycleConfigsOutput": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "NotebookInstanceLifecycleConfigs",
-                "shape": "NotebookInstanceLifecycleConfigSummaryList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListNotebookInstancesInput": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "SortBy", "shape": "NotebookInstanceSortKey", "type": "string"},
-            {
-                "name": "SortOrder",
-                "shape": "NotebookInstanceSortOrder",
-                "type": "string",
-            },
-            {
-                "name": "NameContains",
-                "shape": "NotebookInstanceNameContains",
-                "type": "string",
-            },
-            {
-                "name": "CreationTimeBefore",
-                "shape": "CreationTime",
-                "type": "timestamp",
-            },
-            {"name": "CreationTimeAfter", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "StatusEquals",
-                "shape": "NotebookInstanceStatus",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceLifecycleConfigNameContains",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "DefaultCodeRepositoryContains",
-                "shape": "CodeRepositoryContains",
-                "type": "string",
-            },
-            {
-                "name": "AdditionalCodeRepositoryEquals",
-                "shape": "CodeRepositoryNameOrUrl",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListNotebookInstancesOutput": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "NotebookInstances",
-                "shape": "NotebookInstanceSummaryList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListPipelineExecutionStepsRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelineExecutionStepsResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionSteps",
-                "shape": "PipelineExecutionStepList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelineExecutionsRequest": {
-        "members": [
-            {"name": "PipelineName", "shape": "PipelineNameOrArn", "type": "string"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortPipelineExecutionsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelineExecutionsResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionSummaries",
-                "shape": "PipelineExecutionSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelineParametersForExecutionRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelineParametersForExecutionResponse": {
-        "members": [
-            {"name": "PipelineParameters", "shape": "ParameterList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelinesRequest": {
-        "members": [
-            {"name": "PipelineNamePrefix", "shape": "PipelineName", "type": "string"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortPipelinesBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListPipelinesResponse": {
-        "members": [
-            {
-                "name": "PipelineSummaries",
-                "shape": "PipelineSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListProcessingJobsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "String", "type": "string"},
-            {"name": "StatusEquals", "shape": "ProcessingJobStatus", "type": "string"},
-            {"name": "SortBy", "shape": "SortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListProcessingJobsResponse": {
-        "members": [
-            {
-                "name": "ProcessingJobSummaries",
-                "shape": "ProcessingJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListProjectsInput": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NameContains", "shape": "ProjectEntityName", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "SortBy", "shape": "ProjectSortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "ProjectSortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListProjectsOutput": {
-        "members": [
-            {
-                "name": "ProjectSummaryList",
-                "shape": "ProjectSummaryList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListResourceCatalogsRequest": {
-        "members": [
-            {"name": "NameContains", "shape": "ResourceCatalogName", "type": "string"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "SortOrder",
-                "shape": "ResourceCatalogSortOrder",
-                "type": "string",
-            },
-            {"name": "SortBy", "shape": "ResourceCatalogSortBy", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListResourceCatalogsResponse": {
-        "members": [
-            {
-                "name": "ResourceCatalogs",
-                "shape": "ResourceCatalogList",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListSpacesRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "SortBy", "shape": "SpaceSortKey", "type": "string"},
-            {"name": "DomainIdEquals", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceNameContains", "shape": "SpaceName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListSpacesResponse": {
-        "members": [
-            {"name": "Spaces", "shape": "SpaceList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListStageDevicesRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "ListMaxResults", "type": "integer"},
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ExcludeDevicesDeployedInOtherStage",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListStageDevicesResponse": {
-        "members": [
-            {
-                "name": "DeviceDeploymentSummaries",
-                "shape": "DeviceDeploymentSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListStudioLifecycleConfigsRequest": {
-        "members": [
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "NameContains",
-                "shape": "StudioLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "AppTypeEquals",
-                "shape": "StudioLifecycleConfigAppType",
-                "type": "string",
-            },
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModifiedTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModifiedTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "SortBy",
-                "shape": "StudioLifecycleConfigSortKey",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListStudioLifecycleConfigsResponse": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {
-                "name": "StudioLifecycleConfigs",
-                "shape": "StudioLifecycleConfigsList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListSubscribedWorkteamsRequest": {
-        "members": [
-            {"name": "NameContains", "shape": "WorkteamName", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListSubscribedWorkteamsResponse": {
-        "members": [
-            {
-                "name": "SubscribedWorkteams",
-                "shape": "SubscribedWorkteams",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTagsInput": {
-        "members": [
-            {"name": "ResourceArn", "shape": "ResourceArn", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "ListTagsMaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListTagsOutput": {
-        "members": [
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrainingJobsForHyperParameterTuningJobRequest": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "StatusEquals", "shape": "TrainingJobStatus", "type": "string"},
-            {"name": "SortBy", "shape": "TrainingJobSortByOptions", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrainingJobsForHyperParameterTuningJobResponse": {
-        "members": [
-            {
-                "name": "TrainingJobSummaries",
-                "shape": "HyperParameterTrainingJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrainingJobsRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "StatusEquals", "shape": "TrainingJobStatus", "type": "string"},
-            {"name": "SortBy", "shape": "SortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {
-                "name": "WarmPoolStatusEquals",
-                "shape": "WarmPoolResourceStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListTrainingJobsResponse": {
-        "members": [
-            {
-                "name": "TrainingJobSummaries",
-                "shape": "TrainingJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTransformJobsRequest": {
-        "members": [
-            {"name": "CreationTimeAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTimeBefore", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "LastModifiedTimeAfter",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {
-                "name": "LastModifiedTimeBefore",
-                "shape": "Timestamp",
-                "type": "timestamp",
-            },
-            {"name": "NameContains", "shape": "NameContains", "type": "string"},
-            {"name": "StatusEquals", "shape": "TransformJobStatus", "type": "string"},
-            {"name": "SortBy", "shape": "SortBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListTransformJobsResponse": {
-        "members": [
-            {
-                "name": "TransformJobSummaries",
-                "shape": "TransformJobSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrialComponentKey256": {
-        "member_shape": "TrialComponentKey256",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ListTrialComponentsRequest": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "SourceArn", "shape": "String256", "type": "string"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortTrialComponentsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrialComponentsResponse": {
-        "members": [
-            {
-                "name": "TrialComponentSummaries",
-                "shape": "TrialComponentSummaries",
-                "type": "list",
-            },
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrialsRequest": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SortBy", "shape": "SortTrialsBy", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListTrialsResponse": {
-        "members": [
-            {"name": "TrialSummaries", "shape": "TrialSummaries", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListUserProfilesRequest": {
-        "members": [
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "SortBy", "shape": "UserProfileSortKey", "type": "string"},
-            {"name": "DomainIdEquals", "shape": "DomainId", "type": "string"},
-            {
-                "name": "UserProfileNameContains",
-                "shape": "UserProfileName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ListUserProfilesResponse": {
-        "members": [
-            {"name": "UserProfiles", "shape": "UserProfileList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListWorkforcesRequest": {
-        "members": [
-            {
-                "name": "SortBy",
-                "shape": "ListWorkforcesSortByOptions",
-                "type": "string",
-            },
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NameContains", "shape": "WorkforceName", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListWorkforcesResponse": {
-        "members": [
-            {"name": "Workforces", "shape": "Workforces", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ListWorkteamsRequest": {
-        "members": [
-            {"name": "SortBy", "shape": "ListWorkteamsSortByOptions", "type": "string"},
-            {"name": "SortOrder", "shape": "SortOrder", "type": "string"},
-            {"name": "NameContains", "shape": "WorkteamName", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ListWorkteamsResponse": {
-        "members": [
-            {"name": "Workteams", "shape": "Workteams", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MemberDefinition": {
-        "members": [
-            {
-                "name": "CognitoMemberDefinition",
-                "shape": "CognitoMemberDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "OidcMemberDefinition",
-                "shape": "OidcMemberDefinition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "MemberDefinitions": {
-        "member_shape": "MemberDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MetadataProperties": {
-        "members": [
-            {"name": "CommitId", "shape": "MetadataPropertyValue", "type": "string"},
-            {"name": "Repository", "shape": "MetadataPropertyValue", "type": "string"},
-            {"name": "GeneratedBy", "shape": "MetadataPropertyValue", "type": "string"},
-            {"name": "ProjectId", "shape": "MetadataPropertyValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MetricData": {
-        "members": [
-            {"name": "MetricName", "shape": "MetricName", "type": "string"},
-            {"name": "Value", "shape": "Float", "type": "float"},
-            {"name": "Timestamp", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "MetricDataList": {
-        "member_shape": "MetricDatum",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MetricDatum": {
-        "members": [
-            {"name": "MetricName", "shape": "AutoMLMetricEnum", "type": "string"},
-            {"name": "Value", "shape": "Float", "type": "float"},
-            {"name": "Set", "shape": "MetricSetSource", "type": "string"},
-            {
-                "name": "StandardMetricName",
-                "shape": "AutoMLMetricExtendedEnum",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "MetricDefinition": {
-        "members": [
-            {"name": "Name", "shape": "MetricName", "type": "string"},
-            {"name": "Regex", "shape": "MetricRegex", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MetricDefinitionList": {
-        "member_shape": "MetricDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MetricSpecification": {
-        "members": [
-            {
-                "name": "Predefined",
-                "shape": "PredefinedMetricSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "Customized",
-                "shape": "CustomizedMetricSpecification",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "MetricsSource": {
-        "members": [
-            {"name": "ContentType", "shape": "ContentType", "type": "string"},
-            {"name": "ContentDigest", "shape": "ContentDigest", "type": "string"},
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Model": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "PrimaryContainer",
-                "shape": "ContainerDefinition",
-                "type": "structure",
-            },
-            {"name": "Containers", "shape": "ContainerDefinitionList", "type": "list"},
-            {
-                "name": "InferenceExecutionConfig",
-                "shape": "InferenceExecutionConfig",
-                "type": "structure",
-            },
-            {"name": "ExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModelArn", "shape": "ModelArn", "type": "string"},
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "DeploymentRecommendation",
-                "shape": "DeploymentRecommendation",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelAccessConfig": {
-        "members": [{"name": "AcceptEula", "shape": "AcceptEula", "type": "boolean"}],
-        "type": "structure",
-    },
-    "ModelArtifacts": {
-        "members": [{"name": "S3ModelArtifacts", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "ModelBiasAppSpecification": {
-        "members": [
-            {"name": "ImageUri", "shape": "ImageUri", "type": "string"},
-            {"name": "ConfigUri", "shape": "S3Uri", "type": "string"},
-            {"name": "Environment", "shape": "MonitoringEnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "ModelBiasBaselineConfig": {
-        "members": [
-            {
-                "name": "BaseliningJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ConstraintsResource",
-                "shape": "MonitoringConstraintsResource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelBiasJobInput": {
-        "members": [
-            {"name": "EndpointInput", "shape": "EndpointInput", "type": "structure"},
-            {
-                "name": "BatchTransformInput",
-                "shape": "BatchTransformInput",
-                "type": "structure",
-            },
-            {
-                "name": "GroundTruthS3Input",
-                "shape": "MonitoringGroundTruthS3Input",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelCard": {
-        "members": [
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"},
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "Content", "shape": "ModelCardContent", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {
-                "name": "SecurityConfig",
-                "shape": "ModelCardSecurityConfig",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "ModelId", "shape": "String", "type": "string"},
-            {"name": "RiskRating", "shape": "String", "type": "string"},
-            {"name": "ModelPackageGroupName", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelCardExportArtifacts": {
-        "members": [{"name": "S3ExportArtifacts", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "ModelCardExportJobSummary": {
-        "members": [
-            {"name": "ModelCardExportJobName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelCardExportJobArn",
-                "shape": "ModelCardExportJobArn",
-                "type": "string",
-            },
-            {"name": "Status", "shape": "ModelCardExportJobStatus", "type": "string"},
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "CreatedAt", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedAt", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ModelCardExportJobSummaryList": {
-        "member_shape": "ModelCardExportJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelCardExportOutputConfig": {
-        "members": [{"name": "S3OutputPath", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "ModelCardSecurityConfig": {
-        "members": [{"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"}],
-        "type": "structure",
-    },
-    "ModelCardSummary": {
-        "members": [
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ModelCardSummaryList": {
-        "member_shape": "ModelCardSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelCardVersionSummary": {
-        "members": [
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ModelCardVersionSummaryList": {
-        "member_shape": "ModelCardVersionSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelClientConfig": {
-        "members": [
-            {
-                "name": "InvocationsTimeoutInSeconds",
-                "shape": "InvocationsTimeoutInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "InvocationsMaxRetries",
-                "shape": "InvocationsMaxRetries",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelConfiguration": {
-        "members": [
-            {
-                "name": "InferenceSpecificationName",
-                "shape": "InferenceSpecificationName",
-                "type": "string",
-            },
-            {
-                "name": "EnvironmentParameters",
-                "shape": "EnvironmentParameters",
-                "type": "list",
-            },
-            {
-                "name": "CompilationJobName",
-                "shape": "RecommendationJobCompilationJobName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelDashboardEndpoint": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "EndpointArn", "shape": "EndpointArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndpointStatus", "shape": "EndpointStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelDashboardEndpoints": {
-        "member_shape": "ModelDashboardEndpoint",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelDashboardIndicatorAction": {
-        "members": [{"name": "Enabled", "shape": "Boolean", "type": "boolean"}],
-        "type": "structure",
-    },
-    "ModelDashboardModel": {
-        "members": [
-            {"name": "Model", "shape": "Model", "type": "structure"},
-            {"name": "Endpoints", "shape": "ModelDashboardEndpoints", "type": "list"},
-            {
-                "name": "LastBatchTransformJob",
-                "shape": "TransformJob",
-                "type": "structure",
-            },
-            {
-                "name": "MonitoringSchedules",
-                "shape": "ModelDashboardMonitoringSchedules",
-                "type": "list",
-            },
-            {
-                "name": "ModelCard",
-                "shape": "ModelDashboardModelCard",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelDashboardModelCard": {
-        "members": [
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"},
-            {"name": "ModelCardName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelCardVersion", "shape": "Integer", "type": "integer"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-            {
-                "name": "SecurityConfig",
-                "shape": "ModelCardSecurityConfig",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "ModelId", "shape": "String", "type": "string"},
-            {"name": "RiskRating", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelDashboardMonitoringSchedule": {
-        "members": [
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleStatus",
-                "shape": "ScheduleStatus",
-                "type": "string",
-            },
-            {"name": "MonitoringType", "shape": "MonitoringType", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringScheduleConfig",
-                "shape": "MonitoringScheduleConfig",
-                "type": "structure",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "MonitoringAlertSummaries",
-                "shape": "MonitoringAlertSummaryList",
-                "type": "list",
-            },
-            {
-                "name": "LastMonitoringExecutionSummary",
-                "shape": "MonitoringExecutionSummary",
-                "type": "structure",
-            },
-            {
-                "name": "BatchTransformInput",
-                "shape": "BatchTransformInput",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelDashboardMonitoringSchedules": {
-        "member_shape": "ModelDashboardMonitoringSchedule",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelDataQuality": {
-        "members": [
-            {"name": "Statistics", "shape": "MetricsSource", "type": "structure"},
-            {"name": "Constraints", "shape": "MetricsSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ModelDataSource": {
-        "members": [
-            {"name": "S3DataSource", "shape": "S3ModelDataSource", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "ModelDeployConfig": {
-        "members": [
-            {
-                "name": "AutoGenerateEndpointName",
-                "shape": "AutoGenerateEndpointName",
-                "type": "boolean",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelDeployResult": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ModelDigests": {
-        "members": [
-            {"name": "ArtifactDigest", "shape": "ArtifactDigest", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ModelError": {
-        "members": [
-            {"name": "Message", "shape": "Message", "type": "string"},
-            {"name": "OriginalStatusCode", "shape": "StatusCode", "type": "integer"},
-            {"name": "OriginalMessage", "shape": "Message", "type": "string"},
-            {"name": "LogStreamArn", "shape": "LogStreamArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelExplainabilityAppSpecification": {
-        "members": [
-            {"name": "ImageUri", "shape": "ImageUri", "type": "string"},
-            {"name": "ConfigUri", "shape": "S3Uri", "type": "string"},
-            {"name": "Environment", "shape": "MonitoringEnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "ModelExplainabilityBaselineConfig": {
-        "members": [
-            {
-                "name": "BaseliningJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ConstraintsResource",
-                "shape": "MonitoringConstraintsResource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelExplainabilityJobInput": {
-        "members": [
-            {"name": "EndpointInput", "shape": "EndpointInput", "type": "structure"},
-            {
-                "name": "BatchTransformInput",
-                "shape": "BatchTransformInput",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelInfrastructureConfig": {
-        "members": [
-            {
-                "name": "InfrastructureType",
-                "shape": "ModelInfrastructureType",
-                "type": "string",
-            },
-            {
-                "name": "RealTimeInferenceConfig",
-                "shape": "RealTimeInferenceConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelInput": {
-        "members": [
-            {"name": "DataInputConfig", "shape": "DataInputConfig", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ModelLatencyThreshold": {
-        "members": [
-            {"name": "Percentile", "shape": "String64", "type": "string"},
-            {"name": "ValueInMilliseconds", "shape": "Integer", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ModelLatencyThresholds": {
-        "member_shape": "ModelLatencyThreshold",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelMetadataFilter": {
-        "members": [
-            {"name": "Name", "shape": "ModelMetadataFilterType", "type": "string"},
-            {"name": "Value", "shape": "String256", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelMetadataFilters": {
-        "member_shape": "ModelMetadataFilter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelMetadataSearchExpression": {
-        "members": [
-            {"name": "Filters", "shape": "ModelMetadataFilters", "type": "list"}
-        ],
-        "type": "structure",
-    },
-    "ModelMetadataSummaries": {
-        "member_shape": "ModelMetadataSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelMetadataSummary": {
-        "members": [
-            {"name": "Domain", "shape": "String", "type": "string"},
-            {"name": "Framework", "shape": "String", "type": "string"},
-            {"name": "Task", "shape": "String", "type": "string"},
-            {"name": "Model", "shape": "String", "type": "string"},
-            {"name": "FrameworkVersion", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelMetrics": {
-        "members": [
-            {"name": "ModelQuality", "shape": "ModelQuality", "type": "structure"},
-            {
-                "name": "ModelDataQuality",
-                "shape": "ModelDataQuality",
-                "type": "structure",
-            },
-            {"name": "Bias", "shape": "Bias", "type": "structure"},
-            {"name": "Explainability", "shape": "Explainability", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ModelNotReadyException": {
-        "members": [{"name": "Message", "shape": "Message", "type": "string"}],
-        "type": "structure",
-    },
-    "ModelPackage": {
-        "members": [
-            {"name": "ModelPackageName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageVersion",
-                "shape": "ModelPackageVersion",
-                "type": "integer",
-            },
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"},
-            {
-                "name": "ModelPackageDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "SourceAlgorithmSpecification",
-                "shape": "SourceAlgorithmSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ValidationSpecification",
-                "shape": "ModelPackageValidationSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ModelPackageStatus",
-                "shape": "ModelPackageStatus",
-                "type": "string",
-            },
-            {
-                "name": "ModelPackageStatusDetails",
-                "shape": "ModelPackageStatusDetails",
-                "type": "structure",
-            },
-            {
-                "name": "CertifyForMarketplace",
-                "shape": "CertifyForMarketplace",
-                "type": "boolean",
-            },
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "ModelMetrics", "shape": "ModelMetrics", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ApprovalDescription",
-                "shape": "ApprovalDescription",
-                "type": "string",
-            },
-            {"name": "Domain", "shape": "String", "type": "string"},
-            {"name": "Task", "shape": "String", "type": "string"},
-            {"name": "SamplePayloadUrl", "shape": "String", "type": "string"},
-            {
-                "name": "AdditionalInferenceSpecifications",
-                "shape": "AdditionalInferenceSpecifications",
-                "type": "list",
-            },
-            {"name": "SourceUri", "shape": "ModelPackageSourceUri", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "CustomerMetadataProperties",
-                "shape": "CustomerMetadataMap",
-                "type": "map",
-            },
-            {
-                "name": "DriftCheckBaselines",
-                "shape": "DriftCheckBaselines",
-                "type": "structure",
-            },
-            {
-                "name": "SkipModelValidation",
-                "shape": "SkipModelValidation",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelPackageArnList": {
-        "member_shape": "ModelPackageArn",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ModelPackageContainerDefinition": {
-        "members": [
-            {
-                "name": "ContainerHostname",
-                "shape": "ContainerHostname",
-                "type": "string",
-            },
-            {"name": "Image", "shape": "ContainerImage", "type": "string"},
-            {"name": "ImageDigest", "shape": "ImageDigest", "type": "string"},
-            {"name": "ModelDataUrl", "shape": "Url", "type": "string"},
-            {
-                "name": "ModelDataSource",
-                "shape": "ModelDataSource",
-                "type": "structure",
-            },
-            {"name": "ProductId", "shape": "ProductId", "type": "string"},
-            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
-            {"name": "ModelInput", "shape": "ModelInput", "type": "structure"},
-            {"name": "Framework", "shape": "String", "type": "string"},
-            {
-                "name": "FrameworkVersion",
-                "shape": "ModelPackageFrameworkVersion",
-                "type": "string",
-            },
-            {"name": "NearestModelName", "shape": "String", "type": "string"},
-            {
-                "name": "AdditionalS3DataSource",
-                "shape": "AdditionalS3DataSource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelPackageContainerDefinitionList": {
-        "member_shape": "ModelPackageContainerDefinition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelPackageGroup": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageGroupArn",
-                "shape": "ModelPackageGroupArn",
-                "type": "string",
-            },
-            {
-                "name": "ModelPackageGroupDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ModelPackageGroupStatus",
-                "shape": "ModelPackageGroupStatus",
-                "type": "string",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ModelPackageGroupSummary": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageGroupArn",
-                "shape": "ModelPackageGroupArn",
-                "type": "string",
-            },
-            {
-                "name": "ModelPackageGroupDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "ModelPackageGroupStatus",
-                "shape": "ModelPackageGroupStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelPackageGroupSummaryList": {
-        "member_shape": "ModelPackageGroupSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelPackageStatusDetails": {
-        "members": [
-            {
-                "name": "ValidationStatuses",
-                "shape": "ModelPackageStatusItemList",
-                "type": "list",
-            },
-            {
-                "name": "ImageScanStatuses",
-                "shape": "ModelPackageStatusItemList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelPackageStatusItem": {
-        "members": [
-            {"name": "Name", "shape": "EntityName", "type": "string"},
-            {"name": "Status", "shape": "DetailedModelPackageStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelPackageStatusItemList": {
-        "member_shape": "ModelPackageStatusItem",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelPackageSummaries": {
-        "key_shape": "ModelPackageArn",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "BatchDescribeModelPackageSummary",
-        "value_type": "structure",
-    },
-    "ModelPackageSummary": {
-        "members": [
-            {"name": "ModelPackageName", "shape": "EntityName", "type": "string"},
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "ModelPackageVersion",
-                "shape": "ModelPackageVersion",
-                "type": "integer",
-            },
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"},
-            {
-                "name": "ModelPackageDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "ModelPackageStatus",
-                "shape": "ModelPackageStatus",
-                "type": "string",
-            },
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelPackageSummaryList": {
-        "member_shape": "ModelPackageSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelPackageValidationProfile": {
-        "members": [
-            {"name": "ProfileName", "shape": "EntityName", "type": "string"},
-            {
-                "name": "TransformJobDefinition",
-                "shape": "TransformJobDefinition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelPackageValidationProfiles": {
-        "member_shape": "ModelPackageValidationProfile",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelPackageValidationSpecification": {
-        "members": [
-            {"name": "ValidationRole", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ValidationProfiles",
-                "shape": "ModelPackageValidationProfiles",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelQuality": {
-        "members": [
-            {"name": "Statistics", "shape": "MetricsSource", "type": "structure"},
-            {"name": "Constraints", "shape": "MetricsSource", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ModelQualityAppSpecification": {
-        "members": [
-            {"name": "ImageUri", "shape": "ImageUri", "type": "string"},
-            {
-                "name": "ContainerEntrypoint",
-                "shape": "ContainerEntrypoint",
-                "type": "list",
-            },
-            {
-                "name": "ContainerArguments",
-                "shape": "MonitoringContainerArguments",
-                "type": "list",
-            },
-            {"name": "RecordPreprocessorSourceUri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "PostAnalyticsProcessorSourceUri",
-                "shape": "S3Uri",
-                "type": "string",
-            },
-            {"name": "ProblemType", "shape": "MonitoringProblemType", "type": "string"},
-            {"name": "Environment", "shape": "MonitoringEnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "ModelQualityBaselineConfig": {
-        "members": [
-            {
-                "name": "BaseliningJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ConstraintsResource",
-                "shape": "MonitoringConstraintsResource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelQualityJobInput": {
-        "members": [
-            {"name": "EndpointInput", "shape": "EndpointInput", "type": "structure"},
-            {
-                "name": "BatchTransformInput",
-                "shape": "BatchTransformInput",
-                "type": "structure",
-            },
-            {
-                "name": "GroundTruthS3Input",
-                "shape": "MonitoringGroundTruthS3Input",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelRegisterSettings": {
-        "members": [
-            {"name": "Status", "shape": "FeatureStatus", "type": "string"},
-            {
-                "name": "CrossAccountModelRegisterRoleArn",
-                "shape": "RoleArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelStepMetadata": {
-        "members": [{"name": "Arn", "shape": "String256", "type": "string"}],
-        "type": "structure",
-    },
-    "ModelStreamError": {
-        "members": [
-            {"name": "Message", "shape": "Message", "type": "string"},
-            {"name": "ErrorCode", "shape": "ErrorCode", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelSummary": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {"name": "ModelArn", "shape": "ModelArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ModelSummaryList": {
-        "member_shape": "ModelSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelVariantActionMap": {
-        "key_shape": "ModelVariantName",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ModelVariantAction",
-        "value_type": "string",
-    },
-    "ModelVariantConfig": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {"name": "VariantName", "shape": "ModelVariantName", "type": "string"},
-            {
-                "name": "InfrastructureConfig",
-                "shape": "ModelInfrastructureConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ModelVariantConfigList": {
-        "member_shape": "ModelVariantConfig",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ModelVariantConfigSummary": {
-        "members": [
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {"name": "VariantName", "shape": "ModelVariantName", "type": "string"},
-            {
-                "name": "InfrastructureConfig",
-                "shape": "ModelInfrastructureConfig",
-                "type": "structure",
-            },
-            {"name": "Status", "shape": "ModelVariantStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ModelVariantConfigSummaryList": {
-        "member_shape": "ModelVariantConfigSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringAlertActions": {
-        "members": [
-            {
-                "name": "ModelDashboardIndicator",
-                "shape": "ModelDashboardIndicatorAction",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "MonitoringAlertHistoryList": {
-        "member_shape": "MonitoringAlertHistorySummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringAlertHistorySummary": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringAlertName",
-                "shape": "MonitoringAlertName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "AlertStatus", "shape": "MonitoringAlertStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringAlertSummary": {
-        "members": [
-            {
-                "name": "MonitoringAlertName",
-                "shape": "MonitoringAlertName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "AlertStatus", "shape": "MonitoringAlertStatus", "type": "string"},
-            {
-                "name": "DatapointsToAlert",
-                "shape": "MonitoringDatapointsToAlert",
-                "type": "integer",
-            },
-            {
-                "name": "EvaluationPeriod",
-                "shape": "MonitoringEvaluationPeriod",
-                "type": "integer",
-            },
-            {"name": "Actions", "shape": "MonitoringAlertActions", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringAlertSummaryList": {
-        "member_shape": "MonitoringAlertSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringAppSpecification": {
-        "members": [
-            {"name": "ImageUri", "shape": "ImageUri", "type": "string"},
-            {
-                "name": "ContainerEntrypoint",
-                "shape": "ContainerEntrypoint",
-                "type": "list",
-            },
-            {
-                "name": "ContainerArguments",
-                "shape": "MonitoringContainerArguments",
-                "type": "list",
-            },
-            {"name": "RecordPreprocessorSourceUri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "PostAnalyticsProcessorSourceUri",
-                "shape": "S3Uri",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "MonitoringBaselineConfig": {
-        "members": [
-            {
-                "name": "BaseliningJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ConstraintsResource",
-                "shape": "MonitoringConstraintsResource",
-                "type": "structure",
-            },
-            {
-                "name": "StatisticsResource",
-                "shape": "MonitoringStatisticsResource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "MonitoringClusterConfig": {
-        "members": [
-            {
-                "name": "InstanceCount",
-                "shape": "ProcessingInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "InstanceType",
-                "shape": "ProcessingInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "ProcessingVolumeSizeInGB",
-                "type": "integer",
-            },
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringConstraintsResource": {
-        "members": [{"name": "S3Uri", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "MonitoringContainerArguments": {
-        "member_shape": "ContainerArgument",
-        "member_type": "string",
-        "type": "list",
-    },
-    "MonitoringCsvDatasetFormat": {
-        "members": [{"name": "Header", "shape": "Boolean", "type": "boolean"}],
-        "type": "structure",
-    },
-    "MonitoringDatasetFormat": {
-        "members": [
-            {"name": "Csv", "shape": "MonitoringCsvDatasetFormat", "type": "structure"},
-            {
-                "name": "Json",
-                "shape": "MonitoringJsonDatasetFormat",
-                "type": "structure",
-            },
-            {
-                "name": "Parquet",
-                "shape": "MonitoringParquetDatasetFormat",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "MonitoringEnvironmentMap": {
-        "key_shape": "ProcessingEnvironmentKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ProcessingEnvironmentValue",
-        "value_type": "string",
-    },
-    "MonitoringExecutionSummary": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {"name": "ScheduledTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringExecutionStatus",
-                "shape": "ExecutionStatus",
-                "type": "string",
-            },
-            {"name": "ProcessingJobArn", "shape": "ProcessingJobArn", "type": "string"},
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "MonitoringJobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "MonitoringType", "shape": "MonitoringType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringExecutionSummaryList": {
-        "member_shape": "MonitoringExecutionSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringGroundTruthS3Input": {
-        "members": [{"name": "S3Uri", "shape": "MonitoringS3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "MonitoringInput": {
-        "members": [
-            {"name": "EndpointInput", "shape": "EndpointInput", "type": "structure"},
-            {
-                "name": "BatchTransformInput",
-                "shape": "BatchTransformInput",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "MonitoringInputs": {
-        "member_shape": "MonitoringInput",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringJobDefinition": {
-        "members": [
-            {
-                "name": "BaselineConfig",
-                "shape": "MonitoringBaselineConfig",
-                "type": "structure",
-            },
-            {"name": "MonitoringInputs", "shape": "MonitoringInputs", "type": "list"},
-            {
-                "name": "MonitoringOutputConfig",
-                "shape": "MonitoringOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "MonitoringResources",
-                "shape": "MonitoringResources",
-                "type": "structure",
-            },
-            {
-                "name": "MonitoringAppSpecification",
-                "shape": "MonitoringAppSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "StoppingCondition",
-                "shape": "MonitoringStoppingCondition",
-                "type": "structure",
-            },
-            {"name": "Environment", "shape": "MonitoringEnvironmentMap", "type": "map"},
-            {"name": "NetworkConfig", "shape": "NetworkConfig", "type": "structure"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringJobDefinitionSummary": {
-        "members": [
-            {
-                "name": "MonitoringJobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringJobDefinitionArn",
-                "shape": "MonitoringJobDefinitionArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringJobDefinitionSummaryList": {
-        "member_shape": "MonitoringJobDefinitionSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringJsonDatasetFormat": {
-        "members": [{"name": "Line", "shape": "Boolean", "type": "boolean"}],
-        "type": "structure",
-    },
-    "MonitoringNetworkConfig": {
-        "members": [
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringOutput": {
-        "members": [
-            {"name": "S3Output", "shape": "MonitoringS3Output", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "MonitoringOutputConfig": {
-        "members": [
-            {"name": "MonitoringOutputs", "shape": "MonitoringOutputs", "type": "list"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringOutputs": {
-        "member_shape": "MonitoringOutput",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringParquetDatasetFormat": {"members": [], "type": "structure"},
-    "MonitoringResources": {
-        "members": [
-            {
-                "name": "ClusterConfig",
-                "shape": "MonitoringClusterConfig",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "MonitoringS3Output": {
-        "members": [
-            {"name": "S3Uri", "shape": "MonitoringS3Uri", "type": "string"},
-            {"name": "LocalPath", "shape": "ProcessingLocalPath", "type": "string"},
-            {
-                "name": "S3UploadMode",
-                "shape": "ProcessingS3UploadMode",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "MonitoringSchedule": {
-        "members": [
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleStatus",
-                "shape": "ScheduleStatus",
-                "type": "string",
-            },
-            {"name": "MonitoringType", "shape": "MonitoringType", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringScheduleConfig",
-                "shape": "MonitoringScheduleConfig",
-                "type": "structure",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "LastMonitoringExecutionSummary",
-                "shape": "MonitoringExecutionSummary",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringScheduleConfig": {
-        "members": [
-            {"name": "ScheduleConfig", "shape": "ScheduleConfig", "type": "structure"},
-            {
-                "name": "MonitoringJobDefinition",
-                "shape": "MonitoringJobDefinition",
-                "type": "structure",
-            },
-            {
-                "name": "MonitoringJobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "MonitoringType", "shape": "MonitoringType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringScheduleList": {
-        "member_shape": "MonitoringSchedule",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringScheduleSummary": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringScheduleStatus",
-                "shape": "ScheduleStatus",
-                "type": "string",
-            },
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "MonitoringJobDefinitionName",
-                "shape": "MonitoringJobDefinitionName",
-                "type": "string",
-            },
-            {"name": "MonitoringType", "shape": "MonitoringType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "MonitoringScheduleSummaryList": {
-        "member_shape": "MonitoringScheduleSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "MonitoringStatisticsResource": {
-        "members": [{"name": "S3Uri", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "MonitoringStoppingCondition": {
-        "members": [
-            {
-                "name": "MaxRuntimeInSeconds",
-                "shape": "MonitoringMaxRuntimeInSeconds",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "MultiModelConfig": {
-        "members": [
-            {
-                "name": "ModelCacheSetting",
-                "shape": "ModelCacheSetting",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "NeoVpcConfig": {
-        "members": [
-            {
-                "name": "SecurityGroupIds",
-                "shape": "NeoVpcSecurityGroupIds",
-                "type": "list",
-            },
-            {"name": "Subnets", "shape": "NeoVpcSubnets", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "NeoVpcSecurityGroupIds": {
-        "member_shape": "NeoVpcSecurityGroupId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "NeoVpcSubnets": {
-        "member_shape": "NeoVpcSubnetId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "NestedFilters": {
-        "members": [
-            {
-                "name": "NestedPropertyName",
-                "shape": "ResourcePropertyName",
-                "type": "string",
-            },
-            {"name": "Filters", "shape": "FilterList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "NestedFiltersList": {
-        "member_shape": "NestedFilters",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "NetworkConfig": {
-        "members": [
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "NotebookInstanceAcceleratorTypes": {
-        "member_shape": "NotebookInstanceAcceleratorType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "NotebookInstanceLifecycleConfigList": {
-        "member_shape": "NotebookInstanceLifecycleHook",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "NotebookInstanceLifecycleConfigSummary": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceLifecycleConfigArn",
-                "shape": "NotebookInstanceLifecycleConfigArn",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "NotebookInstanceLifecycleConfigSummaryList": {
-        "member_shape": "NotebookInstanceLifecycleConfigSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "NotebookInstanceLifecycleHook": {
-        "members": [
-            {
-                "name": "Content",
-                "shape": "NotebookInstanceLifecycleConfigContent",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "NotebookInstanceSummary": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceArn",
-                "shape": "NotebookInstanceArn",
-                "type": "string",
-            },
-            {
-                "name": "NotebookInstanceStatus",
-                "shape": "NotebookInstanceStatus",
-                "type": "string",
-            },
-            {"name": "Url", "shape": "NotebookInstanceUrl", "type": "string"},
-            {"name": "InstanceType", "shape": "InstanceType", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "DefaultCodeRepository",
-                "shape": "CodeRepositoryNameOrUrl",
-                "type": "string",
-            },
-            {
-                "name": "AdditionalCodeRepositories",
-                "shape": "AdditionalCodeRepositoryNamesOrUrls",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "NotebookInstanceSummaryList": {
-        "member_shape": "NotebookInstanceSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "NotificationConfiguration": {
-        "members": [
-            {
-                "name": "NotificationTopicArn",
-                "shape": "NotificationTopicArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "ObjectiveStatusCounters": {
-        "members": [
-            {"name": "Succeeded", "shape": "ObjectiveStatusCounter", "type": "integer"},
-            {"name": "Pending", "shape": "ObjectiveStatusCounter", "type": "integer"},
-            {"name": "Failed", "shape": "ObjectiveStatusCounter", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "OfflineStoreConfig": {
-        "members": [
-            {
-                "name": "S3StorageConfig",
-                "shape": "S3StorageConfig",
-                "type": "structure",
-            },
-            {"name": "DisableGlueTableCreation", "shape": "Boolean", "type": "boolean"},
-            {
-                "name": "DataCatalogConfig",
-                "shape": "DataCatalogConfig",
-                "type": "structure",
-            },
-            {"name": "TableFormat", "shape": "TableFormat", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OfflineStoreStatus": {
-        "members": [
-            {"name": "Status", "shape": "OfflineStoreStatusValue", "type": "string"},
-            {"name": "BlockedReason", "shape": "BlockedReason", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OidcConfig": {
-        "members": [
-            {"name": "ClientId", "shape": "ClientId", "type": "string"},
-            {"name": "ClientSecret", "shape": "ClientSecret", "type": "string"},
-            {"name": "Issuer", "shape": "OidcEndpoint", "type": "string"},
-            {
-                "name": "AuthorizationEndpoint",
-                "shape": "OidcEndpoint",
-                "type": "string",
-            },
-            {"name": "TokenEndpoint", "shape": "OidcEndpoint", "type": "string"},
-            {"name": "UserInfoEndpoint", "shape": "OidcEndpoint", "type": "string"},
-            {"name": "LogoutEndpoint", "shape": "OidcEndpoint", "type": "string"},
-            {"name": "JwksUri", "shape": "OidcEndpoint", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OidcConfigForResponse": {
-        "members": [
-            {"name": "ClientId", "shape": "ClientId", "type": "string"},
-            {"name": "Issuer", "shape": "OidcEndpoint", "type": "string"},
-            {
-                "name": "AuthorizationEndpoint",
-                "shape": "OidcEndpoint",
-                "type": "string",
-            },
-            {"name": "TokenEndpoint", "shape": "OidcEndpoint", "type": "string"},
-            {"name": "UserInfoEndpoint", "shape": "OidcEndpoint", "type": "string"},
-            {"name": "LogoutEndpoint", "shape": "OidcEndpoint", "type": "string"},
-            {"name": "JwksUri", "shape": "OidcEndpoint", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OidcMemberDefinition": {
-        "members": [{"name": "Groups", "shape": "Groups", "type": "list"}],
-        "type": "structure",
-    },
-    "OnlineStoreConfig": {
-        "members": [
-            {
-                "name": "SecurityConfig",
-                "shape": "OnlineStoreSecurityConfig",
-                "type": "structure",
-            },
-            {"name": "EnableOnlineStore", "shape": "Boolean", "type": "boolean"},
-            {"name": "TtlDuration", "shape": "TtlDuration", "type": "structure"},
-            {"name": "StorageType", "shape": "StorageType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OnlineStoreConfigUpdate": {
-        "members": [
-            {"name": "TtlDuration", "shape": "TtlDuration", "type": "structure"}
-        ],
-        "type": "structure",
-    },
-    "OnlineStoreSecurityConfig": {
-        "members": [{"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"}],
-        "type": "structure",
-    },
-    "OutputConfig": {
-        "members": [
-            {"name": "S3OutputLocation", "shape": "S3Uri", "type": "string"},
-            {"name": "TargetDevice", "shape": "TargetDevice", "type": "string"},
-            {"name": "TargetPlatform", "shape": "TargetPlatform", "type": "structure"},
-            {"name": "CompilerOptions", "shape": "CompilerOptions", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OutputDataConfig": {
-        "members": [
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "CompressionType",
-                "shape": "OutputCompressionType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "OutputParameter": {
-        "members": [
-            {"name": "Name", "shape": "String256", "type": "string"},
-            {"name": "Value", "shape": "String1024", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "OutputParameterList": {
-        "member_shape": "OutputParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "OwnershipSettings": {
-        "members": [
-            {
-                "name": "OwnerUserProfileName",
-                "shape": "UserProfileName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "OwnershipSettingsSummary": {
-        "members": [
-            {
-                "name": "OwnerUserProfileName",
-                "shape": "UserProfileName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "ParallelismConfiguration": {
-        "members": [
-            {
-                "name": "MaxParallelExecutionSteps",
-                "shape": "MaxParallelExecutionSteps",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "Parameter": {
-        "members": [
-            {"name": "Name", "shape": "PipelineParameterName", "type": "string"},
-            {"name": "Value", "shape": "String1024", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ParameterList": {
-        "member_shape": "Parameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ParameterRange": {
-        "members": [
-            {
-                "name": "IntegerParameterRangeSpecification",
-                "shape": "IntegerParameterRangeSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "ContinuousParameterRangeSpecification",
-                "shape": "ContinuousParameterRangeSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "CategoricalParameterRangeSpecification",
-                "shape": "CategoricalParameterRangeSpecification",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ParameterRanges": {
-        "members": [
-            {
-                "name": "IntegerParameterRanges",
-                "shape": "IntegerParameterRanges",
-                "type": "list",
-            },
-            {
-                "name": "ContinuousParameterRanges",
-                "shape": "ContinuousParameterRanges",
-                "type": "list",
-            },
-            {
-                "name": "CategoricalParameterRanges",
-                "shape": "CategoricalParameterRanges",
-                "type": "list",
-            },
-            {"name": "AutoParameters", "shape": "AutoParameters", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ParameterValues": {
-        "member_shape": "ParameterValue",
-        "member_type": "string",
-        "type": "list",
-    },
-    "Parent": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ParentHyperParameterTuningJob": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "ParentHyperParameterTuningJobs": {
-        "member_shape": "ParentHyperParameterTuningJob",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Parents": {"member_shape": "Parent", "member_type": "structure", "type": "list"},
-    "PayloadPart": {
-        "members": [{"name": "Bytes", "shape": "PartBlob", "type": "blob"}],
-        "type": "structure",
-    },
-    "PendingDeploymentSummary": {
-        "members": [
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "ProductionVariants",
-                "shape": "PendingProductionVariantSummaryList",
-                "type": "list",
-            },
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "ShadowProductionVariants",
-                "shape": "PendingProductionVariantSummaryList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "PendingProductionVariantSummary": {
-        "members": [
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {"name": "DeployedImages", "shape": "DeployedImages", "type": "list"},
-            {"name": "CurrentWeight", "shape": "VariantWeight", "type": "float"},
-            {"name": "DesiredWeight", "shape": "VariantWeight", "type": "float"},
-            {"name": "CurrentInstanceCount", "shape": "TaskCount", "type": "integer"},
-            {"name": "DesiredInstanceCount", "shape": "TaskCount", "type": "integer"},
-            {
-                "name": "InstanceType",
-                "shape": "ProductionVariantInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "AcceleratorType",
-                "shape": "ProductionVariantAcceleratorType",
-                "type": "string",
-            },
-            {
-                "name": "VariantStatus",
-                "shape": "ProductionVariantStatusList",
-                "type": "list",
-            },
-            {
-                "name": "CurrentServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DesiredServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ManagedInstanceScaling",
-                "shape": "ProductionVariantManagedInstanceScaling",
-                "type": "structure",
-            },
-            {
-                "name": "RoutingConfig",
-                "shape": "ProductionVariantRoutingConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "PendingProductionVariantSummaryList": {
-        "member_shape": "PendingProductionVariantSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Phase": {
-        "members": [
-            {
-                "name": "InitialNumberOfUsers",
-                "shape": "InitialNumberOfUsers",
-                "type": "integer",
-            },
-            {"name": "SpawnRate", "shape": "SpawnRate", "type": "integer"},
-            {
-                "name": "DurationInSeconds",
-                "shape": "TrafficDurationInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "Phases": {"member_shape": "Phase", "member_type": "structure", "type": "list"},
-    "Pipeline": {
-        "members": [
-            {"name": "PipelineArn", "shape": "PipelineArn", "type": "string"},
-            {"name": "PipelineName", "shape": "PipelineName", "type": "string"},
-            {"name": "PipelineDisplayName", "shape": "PipelineName", "type": "string"},
-            {
-                "name": "PipelineDescription",
-                "shape": "PipelineDescription",
-                "type": "string",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "PipelineStatus", "shape": "PipelineStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastRunTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "PipelineDefinitionS3Location": {
-        "members": [
-            {"name": "Bucket", "shape": "BucketName", "type": "string"},
-            {"name": "ObjectKey", "shape": "Key", "type": "string"},
-            {"name": "VersionId", "shape": "VersionId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "PipelineExecution": {
-        "members": [
-            {"name": "PipelineArn", "shape": "PipelineArn", "type": "string"},
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDisplayName",
-                "shape": "PipelineExecutionName",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionStatus",
-                "shape": "PipelineExecutionStatus",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDescription",
-                "shape": "PipelineExecutionDescription",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExperimentConfig",
-                "shape": "PipelineExperimentConfig",
-                "type": "structure",
-            },
-            {
-                "name": "FailureReason",
-                "shape": "PipelineExecutionFailureReason",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "SelectiveExecutionConfig",
-                "shape": "SelectiveExecutionConfig",
-                "type": "structure",
-            },
-            {"name": "PipelineParameters", "shape": "ParameterList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "PipelineExecutionStep": {
-        "members": [
-            {"name": "StepName", "shape": "StepName", "type": "string"},
-            {"name": "StepDisplayName", "shape": "StepDisplayName", "type": "string"},
-            {"name": "StepDescription", "shape": "StepDescription", "type": "string"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "StepStatus", "shape": "StepStatus", "type": "string"},
-            {"name": "CacheHitResult", "shape": "CacheHitResult", "type": "structure"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {
-                "name": "Metadata",
-                "shape": "PipelineExecutionStepMetadata",
-                "type": "structure",
-            },
-            {"name": "AttemptCount", "shape": "Integer", "type": "integer"},
-            {
-                "name": "SelectiveExecutionResult",
-                "shape": "SelectiveExecutionResult",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "PipelineExecutionStepList": {
-        "member_shape": "PipelineExecutionStep",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "PipelineExecutionStepMetadata": {
-        "members": [
-            {
-                "name": "TrainingJob",
-                "shape": "TrainingJobStepMetadata",
-                "type": "structure",
-            },
-            {
-                "name": "ProcessingJob",
-                "shape": "ProcessingJobStepMetadata",
-                "type": "structure",
-            },
-            {
-                "name": "TransformJob",
-                "shape": "TransformJobStepMetadata",
-                "type": "structure",
-            },
-            {
-                "name": "TuningJob",
-                "shape": "TuningJobStepMetaData",
-                "type": "structure",
-            },
-            {"name": "Model", "shape": "ModelStepMetadata", "type": "structure"},
-            {
-                "name": "RegisterModel",
-                "shape": "RegisterModelStepMetadata",
-                "type": "structure",
-            },
-            {
-                "name": "Condition",
-                "shape": "ConditionStepMetadata",
-                "type": "structure",
-            },
-            {"name": "Callback", "shape": "CallbackStepMetadata", "type": "structure"},
-            {"name": "Lambda", "shape": "LambdaStepMetadata", "type": "structure"},
-            {"name": "EMR", "shape": "EMRStepMetadata", "type": "structure"},
-            {
-                "name": "QualityCheck",
-                "shape": "QualityCheckStepMetadata",
-                "type": "structure",
-            },
-            {
-                "name": "ClarifyCheck",
-                "shape": "ClarifyCheckStepMetadata",
-                "type": "structure",
-            },
-            {"name": "Fail", "shape": "FailStepMetadata", "type": "structure"},
-            {
-                "name": "AutoMLJob",
-                "shape": "AutoMLJobStepMetadata",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "PipelineExecutionSummary": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "PipelineExecutionStatus",
-                "shape": "PipelineExecutionStatus",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDescription",
-                "shape": "PipelineExecutionDescription",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDisplayName",
-                "shape": "PipelineExecutionName",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionFailureReason",
-                "shape": "String3072",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "PipelineExecutionSummaryList": {
-        "member_shape": "PipelineExecutionSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "PipelineExperimentConfig": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "PipelineSummary": {
-        "members": [
-            {"name": "PipelineArn", "shape": "PipelineArn", "type": "string"},
-            {"name": "PipelineName", "shape": "PipelineName", "type": "string"},
-            {"name": "PipelineDisplayName", "shape": "PipelineName", "type": "string"},
-            {
-                "name": "PipelineDescription",
-                "shape": "PipelineDescription",
-                "type": "string",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastExecutionTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "PipelineSummaryList": {
-        "member_shape": "PipelineSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "PredefinedMetricSpecification": {
-        "members": [
-            {"name": "PredefinedMetricType", "shape": "String", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ProcessingClusterConfig": {
-        "members": [
-            {
-                "name": "InstanceCount",
-                "shape": "ProcessingInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "InstanceType",
-                "shape": "ProcessingInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "ProcessingVolumeSizeInGB",
-                "type": "integer",
-            },
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ProcessingEnvironmentMap": {
-        "key_shape": "ProcessingEnvironmentKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ProcessingEnvironmentValue",
-        "value_type": "string",
-    },
-    "ProcessingFeatureStoreOutput": {
-        "members": [
-            {"name": "FeatureGroupName", "shape": "FeatureGroupName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ProcessingInput": {
-        "members": [
-            {"name": "InputName", "shape": "String", "type": "string"},
-            {"name": "AppManaged", "shape": "AppManaged", "type": "boolean"},
-            {"name": "S3Input", "shape": "ProcessingS3Input", "type": "structure"},
-            {
-                "name": "DatasetDefinition",
-                "shape": "DatasetDefinition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProcessingInputs": {
-        "member_shape": "ProcessingInput",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProcessingJob": {
-        "members": [
-            {"name": "ProcessingInputs", "shape": "ProcessingInputs", "type": "list"},
-            {
-                "name": "ProcessingOutputConfig",
-                "shape": "ProcessingOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ProcessingJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {
-                "name": "ProcessingResources",
-                "shape": "ProcessingResources",
-                "type": "structure",
-            },
-            {
-                "name": "StoppingCondition",
-                "shape": "ProcessingStoppingCondition",
-                "type": "structure",
-            },
-            {
-                "name": "AppSpecification",
-                "shape": "AppSpecification",
-                "type": "structure",
-            },
-            {"name": "Environment", "shape": "ProcessingEnvironmentMap", "type": "map"},
-            {"name": "NetworkConfig", "shape": "NetworkConfig", "type": "structure"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-            {"name": "ProcessingJobArn", "shape": "ProcessingJobArn", "type": "string"},
-            {
-                "name": "ProcessingJobStatus",
-                "shape": "ProcessingJobStatus",
-                "type": "string",
-            },
-            {"name": "ExitMessage", "shape": "ExitMessage", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ProcessingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ProcessingStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ProcessingJobStepMetadata": {
-        "members": [{"name": "Arn", "shape": "ProcessingJobArn", "type": "string"}],
-        "type": "structure",
-    },
-    "ProcessingJobSummaries": {
-        "member_shape": "ProcessingJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProcessingJobSummary": {
-        "members": [
-            {
-                "name": "ProcessingJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            },
-            {"name": "ProcessingJobArn", "shape": "ProcessingJobArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ProcessingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "ProcessingJobStatus",
-                "shape": "ProcessingJobStatus",
-                "type": "string",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ExitMessage", "shape": "ExitMessage", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ProcessingOutput": {
-        "members": [
-            {"name": "OutputName", "shape": "String", "type": "string"},
-            {"name": "S3Output", "shape": "ProcessingS3Output", "type": "structure"},
-            {
-                "name": "FeatureStoreOutput",
-                "shape": "ProcessingFeatureStoreOutput",
-                "type": "structure",
-            },
-            {"name": "AppManaged", "shape": "AppManaged", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "ProcessingOutputConfig": {
-        "members": [
-            {"name": "Outputs", "shape": "ProcessingOutputs", "type": "list"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ProcessingOutputs": {
-        "member_shape": "ProcessingOutput",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProcessingResources": {
-        "members": [
-            {
-                "name": "ClusterConfig",
-                "shape": "ProcessingClusterConfig",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "ProcessingS3Input": {
-        "members": [
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "LocalPath", "shape": "ProcessingLocalPath", "type": "string"},
-            {"name": "S3DataType", "shape": "ProcessingS3DataType", "type": "string"},
-            {"name": "S3InputMode", "shape": "ProcessingS3InputMode", "type": "string"},
-            {
-                "name": "S3DataDistributionType",
-                "shape": "ProcessingS3DataDistributionType",
-                "type": "string",
-            },
-            {
-                "name": "S3CompressionType",
-                "shape": "ProcessingS3CompressionType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProcessingS3Output": {
-        "members": [
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "LocalPath", "shape": "ProcessingLocalPath", "type": "string"},
-            {
-                "name": "S3UploadMode",
-                "shape": "ProcessingS3UploadMode",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProcessingStoppingCondition": {
-        "members": [
-            {
-                "name": "MaxRuntimeInSeconds",
-                "shape": "ProcessingMaxRuntimeInSeconds",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "ProductListings": {
-        "member_shape": "String",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ProductionVariant": {
-        "members": [
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "InitialInstanceCount",
-                "shape": "InitialTaskCount",
-                "type": "integer",
-            },
-            {
-                "name": "InstanceType",
-                "shape": "ProductionVariantInstanceType",
-                "type": "string",
-            },
-            {"name": "InitialVariantWeight", "shape": "VariantWeight", "type": "float"},
-            {
-                "name": "AcceleratorType",
-                "shape": "ProductionVariantAcceleratorType",
-                "type": "string",
-            },
-            {
-                "name": "CoreDumpConfig",
-                "shape": "ProductionVariantCoreDumpConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "ProductionVariantVolumeSizeInGB",
-                "type": "integer",
-            },
-            {
-                "name": "ModelDataDownloadTimeoutInSeconds",
-                "shape": "ProductionVariantModelDataDownloadTimeoutInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "ContainerStartupHealthCheckTimeoutInSeconds",
-                "shape": "ProductionVariantContainerStartupHealthCheckTimeoutInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "EnableSSMAccess",
-                "shape": "ProductionVariantSSMAccess",
-                "type": "boolean",
-            },
-            {
-                "name": "ManagedInstanceScaling",
-                "shape": "ProductionVariantManagedInstanceScaling",
-                "type": "structure",
-            },
-            {
-                "name": "RoutingConfig",
-                "shape": "ProductionVariantRoutingConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantCoreDumpConfig": {
-        "members": [
-            {"name": "DestinationS3Uri", "shape": "DestinationS3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantList": {
-        "member_shape": "ProductionVariant",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProductionVariantManagedInstanceScaling": {
-        "members": [
-            {
-                "name": "Status",
-                "shape": "ManagedInstanceScalingStatus",
-                "type": "string",
-            },
-            {
-                "name": "MinInstanceCount",
-                "shape": "ManagedInstanceScalingMinInstanceCount",
-                "type": "integer",
-            },
-            {
-                "name": "MaxInstanceCount",
-                "shape": "ManagedInstanceScalingMaxInstanceCount",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantRoutingConfig": {
-        "members": [
-            {"name": "RoutingStrategy", "shape": "RoutingStrategy", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantServerlessConfig": {
-        "members": [
-            {
-                "name": "MemorySizeInMB",
-                "shape": "ServerlessMemorySizeInMB",
-                "type": "integer",
-            },
-            {
-                "name": "MaxConcurrency",
-                "shape": "ServerlessMaxConcurrency",
-                "type": "integer",
-            },
-            {
-                "name": "ProvisionedConcurrency",
-                "shape": "ServerlessProvisionedConcurrency",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantServerlessUpdateConfig": {
-        "members": [
-            {
-                "name": "MaxConcurrency",
-                "shape": "ServerlessMaxConcurrency",
-                "type": "integer",
-            },
-            {
-                "name": "ProvisionedConcurrency",
-                "shape": "ServerlessProvisionedConcurrency",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantStatus": {
-        "members": [
-            {"name": "Status", "shape": "VariantStatus", "type": "string"},
-            {
-                "name": "StatusMessage",
-                "shape": "VariantStatusMessage",
-                "type": "string",
-            },
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantStatusList": {
-        "member_shape": "ProductionVariantStatus",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProductionVariantSummary": {
-        "members": [
-            {"name": "VariantName", "shape": "VariantName", "type": "string"},
-            {"name": "DeployedImages", "shape": "DeployedImages", "type": "list"},
-            {"name": "CurrentWeight", "shape": "VariantWeight", "type": "float"},
-            {"name": "DesiredWeight", "shape": "VariantWeight", "type": "float"},
-            {"name": "CurrentInstanceCount", "shape": "TaskCount", "type": "integer"},
-            {"name": "DesiredInstanceCount", "shape": "TaskCount", "type": "integer"},
-            {
-                "name": "VariantStatus",
-                "shape": "ProductionVariantStatusList",
-                "type": "list",
-            },
-            {
-                "name": "CurrentServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DesiredServerlessConfig",
-                "shape": "ProductionVariantServerlessConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ManagedInstanceScaling",
-                "shape": "ProductionVariantManagedInstanceScaling",
-                "type": "structure",
-            },
-            {
-                "name": "RoutingConfig",
-                "shape": "ProductionVariantRoutingConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ProductionVariantSummaryList": {
-        "member_shape": "ProductionVariantSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProfilerConfig": {
-        "members": [
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "ProfilingIntervalInMilliseconds",
-                "shape": "ProfilingIntervalInMilliseconds",
-                "type": "long",
-            },
-            {
-                "name": "ProfilingParameters",
-                "shape": "ProfilingParameters",
-                "type": "map",
-            },
-            {"name": "DisableProfiler", "shape": "DisableProfiler", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "ProfilerConfigForUpdate": {
-        "members": [
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "ProfilingIntervalInMilliseconds",
-                "shape": "ProfilingIntervalInMilliseconds",
-                "type": "long",
-            },
-            {
-                "name": "ProfilingParameters",
-                "shape": "ProfilingParameters",
-                "type": "map",
-            },
-            {"name": "DisableProfiler", "shape": "DisableProfiler", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "ProfilerRuleConfiguration": {
-        "members": [
-            {
-                "name": "RuleConfigurationName",
-                "shape": "RuleConfigurationName",
-                "type": "string",
-            },
-            {"name": "LocalPath", "shape": "DirectoryPath", "type": "string"},
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "RuleEvaluatorImage", "shape": "AlgorithmImage", "type": "string"},
-            {
-                "name": "InstanceType",
-                "shape": "ProcessingInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "OptionalVolumeSizeInGB",
-                "type": "integer",
-            },
-            {"name": "RuleParameters", "shape": "RuleParameters", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "ProfilerRuleConfigurations": {
-        "member_shape": "ProfilerRuleConfiguration",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProfilerRuleEvaluationStatus": {
-        "members": [
-            {
-                "name": "RuleConfigurationName",
-                "shape": "RuleConfigurationName",
-                "type": "string",
-            },
-            {
-                "name": "RuleEvaluationJobArn",
-                "shape": "ProcessingJobArn",
-                "type": "string",
-            },
-            {
-                "name": "RuleEvaluationStatus",
-                "shape": "RuleEvaluationStatus",
-                "type": "string",
-            },
-            {"name": "StatusDetails", "shape": "StatusDetails", "type": "string"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ProfilerRuleEvaluationStatuses": {
-        "member_shape": "ProfilerRuleEvaluationStatus",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProfilingParameters": {
-        "key_shape": "ConfigKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ConfigValue",
-        "value_type": "string",
-    },
-    "Project": {
-        "members": [
-            {"name": "ProjectArn", "shape": "ProjectArn", "type": "string"},
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"},
-            {"name": "ProjectId", "shape": "ProjectId", "type": "string"},
-            {
-                "name": "ProjectDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {
-                "name": "ServiceCatalogProvisioningDetails",
-                "shape": "ServiceCatalogProvisioningDetails",
-                "type": "structure",
-            },
-            {
-                "name": "ServiceCatalogProvisionedProductDetails",
-                "shape": "ServiceCatalogProvisionedProductDetails",
-                "type": "structure",
-            },
-            {"name": "ProjectStatus", "shape": "ProjectStatus", "type": "string"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "ProjectSummary": {
-        "members": [
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"},
-            {
-                "name": "ProjectDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {"name": "ProjectArn", "shape": "ProjectArn", "type": "string"},
-            {"name": "ProjectId", "shape": "ProjectId", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ProjectStatus", "shape": "ProjectStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ProjectSummaryList": {
-        "member_shape": "ProjectSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "PropertyNameQuery": {
-        "members": [
-            {"name": "PropertyNameHint", "shape": "PropertyNameHint", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "PropertyNameSuggestion": {
-        "members": [
-            {"name": "PropertyName", "shape": "ResourcePropertyName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "PropertyNameSuggestionList": {
-        "member_shape": "PropertyNameSuggestion",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ProvisioningParameter": {
-        "members": [
-            {"name": "Key", "shape": "ProvisioningParameterKey", "type": "string"},
-            {"name": "Value", "shape": "ProvisioningParameterValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ProvisioningParameters": {
-        "member_shape": "ProvisioningParameter",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "PublicWorkforceTaskPrice": {
-        "members": [{"name": "AmountInUsd", "shape": "USD", "type": "structure"}],
-        "type": "structure",
-    },
-    "PutModelPackageGroupPolicyInput": {
-        "members": [
-            {"name": "ModelPackageGroupName", "shape": "EntityName", "type": "string"},
-            {"name": "ResourcePolicy", "shape": "PolicyString", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "PutModelPackageGroupPolicyOutput": {
-        "members": [
-            {
-                "name": "ModelPackageGroupArn",
-                "shape": "ModelPackageGroupArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "QualityCheckStepMetadata": {
-        "members": [
-            {"name": "CheckType", "shape": "String256", "type": "string"},
-            {
-                "name": "BaselineUsedForDriftCheckStatistics",
-                "shape": "String1024",
-                "type": "string",
-            },
-            {
-                "name": "BaselineUsedForDriftCheckConstraints",
-                "shape": "String1024",
-                "type": "string",
-            },
-            {
-                "name": "CalculatedBaselineStatistics",
-                "shape": "String1024",
-                "type": "string",
-            },
-            {
-                "name": "CalculatedBaselineConstraints",
-                "shape": "String1024",
-                "type": "string",
-            },
-            {"name": "ModelPackageGroupName", "shape": "String256", "type": "string"},
-            {"name": "ViolationReport", "shape": "String1024", "type": "string"},
-            {"name": "CheckJobArn", "shape": "String256", "type": "string"},
-            {"name": "SkipCheck", "shape": "Boolean", "type": "boolean"},
-            {"name": "RegisterNewBaseline", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "QueryFilters": {
-        "members": [
-            {"name": "Types", "shape": "QueryTypes", "type": "list"},
-            {"name": "LineageTypes", "shape": "QueryLineageTypes", "type": "list"},
-            {"name": "CreatedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModifiedBefore", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "ModifiedAfter", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Properties", "shape": "QueryProperties", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "QueryLineageRequest": {
-        "members": [
-            {"name": "StartArns", "shape": "QueryLineageStartArns", "type": "list"},
-            {"name": "Direction", "shape": "Direction", "type": "string"},
-            {"name": "IncludeEdges", "shape": "Boolean", "type": "boolean"},
-            {"name": "Filters", "shape": "QueryFilters", "type": "structure"},
-            {"name": "MaxDepth", "shape": "QueryLineageMaxDepth", "type": "integer"},
-            {
-                "name": "MaxResults",
-                "shape": "QueryLineageMaxResults",
-                "type": "integer",
-            },
-            {"name": "NextToken", "shape": "String8192", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "QueryLineageResponse": {
-        "members": [
-            {"name": "Vertices", "shape": "Vertices", "type": "list"},
-            {"name": "Edges", "shape": "Edges", "type": "list"},
-            {"name": "NextToken", "shape": "String8192", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "QueryLineageStartArns": {
-        "member_shape": "AssociationEntityArn",
-        "member_type": "string",
-        "type": "list",
-    },
-    "QueryLineageTypes": {
-        "member_shape": "LineageType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "QueryProperties": {
-        "key_shape": "String256",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "String256",
-        "value_type": "string",
-    },
-    "QueryTypes": {"member_shape": "String40", "member_type": "string", "type": "list"},
-    "RSessionAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {"name": "CustomImages", "shape": "CustomImages", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "RStudioServerProAppSettings": {
-        "members": [
-            {
-                "name": "AccessStatus",
-                "shape": "RStudioServerProAccessStatus",
-                "type": "string",
-            },
-            {
-                "name": "UserGroup",
-                "shape": "RStudioServerProUserGroup",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "RStudioServerProDomainSettings": {
-        "members": [
-            {"name": "DomainExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "RStudioConnectUrl", "shape": "String", "type": "string"},
-            {"name": "RStudioPackageManagerUrl", "shape": "String", "type": "string"},
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "RStudioServerProDomainSettingsForUpdate": {
-        "members": [
-            {"name": "DomainExecutionRoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {"name": "RStudioConnectUrl", "shape": "String", "type": "string"},
-            {"name": "RStudioPackageManagerUrl", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "RealTimeInferenceConfig": {
-        "members": [
-            {"name": "InstanceType", "shape": "InstanceType", "type": "string"},
-            {"name": "InstanceCount", "shape": "TaskCount", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "RealTimeInferenceRecommendation": {
-        "members": [
-            {"name": "RecommendationId", "shape": "String", "type": "string"},
-            {
-                "name": "InstanceType",
-                "shape": "ProductionVariantInstanceType",
-                "type": "string",
-            },
-            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
-        ],
-        "type": "structure",
-    },
-    "RealTimeInferenceRecommendations": {
-        "member_shape": "RealTimeInferenceRecommendation",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "RealtimeInferenceInstanceTypes": {
-        "member_shape": "ProductionVariantInstanceType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "RecommendationJobCompiledOutputConfig": {
-        "members": [{"name": "S3OutputUri", "shape": "S3Uri", "type": "string"}],
-        "type": "structure",
-    },
-    "RecommendationJobContainerConfig": {
-        "members": [
-            {"name": "Domain", "shape": "String", "type": "string"},
-            {"name": "Task", "shape": "String", "type": "string"},
-            {"name": "Framework", "shape": "String", "type": "string"},
-            {
-                "name": "FrameworkVersion",
-                "shape": "RecommendationJobFrameworkVersion",
-                "type": "string",
-            },
-            {
-                "name": "PayloadConfig",
-                "shape": "RecommendationJobPayloadConfig",
-                "type": "structure",
-            },
-            {"name": "NearestModelName", "shape": "String", "type": "string"},
-            {
-                "name": "SupportedInstanceTypes",
-                "shape": "RecommendationJobSupportedInstanceTypes",
-                "type": "list",
-            },
-            {
-                "name": "SupportedEndpointType",
-                "shape": "RecommendationJobSupportedEndpointType",
-                "type": "string",
-            },
-            {
-                "name": "DataInputConfig",
-                "shape": "RecommendationJobDataInputConfig",
-                "type": "string",
-            },
-            {
-                "name": "SupportedResponseMIMETypes",
-                "shape": "RecommendationJobSupportedResponseMIMETypes",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobInferenceBenchmark": {
-        "members": [
-            {"name": "Metrics", "shape": "RecommendationMetrics", "type": "structure"},
-            {
-                "name": "EndpointMetrics",
-                "shape": "InferenceMetrics",
-                "type": "structure",
-            },
-            {
-                "name": "EndpointConfiguration",
-                "shape": "EndpointOutputConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "ModelConfiguration",
-                "shape": "ModelConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "FailureReason",
-                "shape": "RecommendationFailureReason",
-                "type": "string",
-            },
-            {
-                "name": "InvocationEndTime",
-                "shape": "InvocationEndTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "InvocationStartTime",
-                "shape": "InvocationStartTime",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobInputConfig": {
-        "members": [
-            {
-                "name": "ModelPackageVersionArn",
-                "shape": "ModelPackageArn",
-                "type": "string",
-            },
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "JobDurationInSeconds",
-                "shape": "JobDurationInSeconds",
-                "type": "integer",
-            },
-            {"name": "TrafficPattern", "shape": "TrafficPattern", "type": "structure"},
-            {
-                "name": "ResourceLimit",
-                "shape": "RecommendationJobResourceLimit",
-                "type": "structure",
-            },
-            {
-                "name": "EndpointConfigurations",
-                "shape": "EndpointInputConfigurations",
-                "type": "list",
-            },
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "ContainerConfig",
-                "shape": "RecommendationJobContainerConfig",
-                "type": "structure",
-            },
-            {"name": "Endpoints", "shape": "Endpoints", "type": "list"},
-            {
-                "name": "VpcConfig",
-                "shape": "RecommendationJobVpcConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobOutputConfig": {
-        "members": [
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "CompiledOutputConfig",
-                "shape": "RecommendationJobCompiledOutputConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobPayloadConfig": {
-        "members": [
-            {"name": "SamplePayloadUrl", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "SupportedContentTypes",
-                "shape": "RecommendationJobSupportedContentTypes",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobResourceLimit": {
-        "members": [
-            {
-                "name": "MaxNumberOfTests",
-                "shape": "MaxNumberOfTests",
-                "type": "integer",
-            },
-            {
-                "name": "MaxParallelOfTests",
-                "shape": "MaxParallelOfTests",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobStoppingConditions": {
-        "members": [
-            {"name": "MaxInvocations", "shape": "Integer", "type": "integer"},
-            {
-                "name": "ModelLatencyThresholds",
-                "shape": "ModelLatencyThresholds",
-                "type": "list",
-            },
-            {"name": "FlatInvocations", "shape": "FlatInvocations", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobSupportedContentTypes": {
-        "member_shape": "RecommendationJobSupportedContentType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "RecommendationJobSupportedInstanceTypes": {
-        "member_shape": "String",
-        "member_type": "string",
-        "type": "list",
-    },
-    "RecommendationJobSupportedResponseMIMETypes": {
-        "member_shape": "RecommendationJobSupportedResponseMIMEType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "RecommendationJobVpcConfig": {
-        "members": [
-            {
-                "name": "SecurityGroupIds",
-                "shape": "RecommendationJobVpcSecurityGroupIds",
-                "type": "list",
-            },
-            {"name": "Subnets", "shape": "RecommendationJobVpcSubnets", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "RecommendationJobVpcSecurityGroupIds": {
-        "member_shape": "RecommendationJobVpcSecurityGroupId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "RecommendationJobVpcSubnets": {
-        "member_shape": "RecommendationJobVpcSubnetId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "RecommendationMetrics": {
-        "members": [
-            {"name": "CostPerHour", "shape": "Float", "type": "float"},
-            {"name": "CostPerInference", "shape": "Float", "type": "float"},
-            {"name": "MaxInvocations", "shape": "Integer", "type": "integer"},
-            {"name": "ModelLatency", "shape": "Integer", "type": "integer"},
-            {"name": "CpuUtilization", "shape": "UtilizationMetric", "type": "float"},
-            {
-                "name": "MemoryUtilization",
-                "shape": "UtilizationMetric",
-                "type": "float",
-            },
-            {"name": "ModelSetupTime", "shape": "ModelSetupTime", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "RedshiftDatasetDefinition": {
-        "members": [
-            {"name": "ClusterId", "shape": "RedshiftClusterId", "type": "string"},
-            {"name": "Database", "shape": "RedshiftDatabase", "type": "string"},
-            {"name": "DbUser", "shape": "RedshiftUserName", "type": "string"},
-            {"name": "QueryString", "shape": "RedshiftQueryString", "type": "string"},
-            {"name": "ClusterRoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "OutputS3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "OutputFormat", "shape": "RedshiftResultFormat", "type": "string"},
-            {
-                "name": "OutputCompression",
-                "shape": "RedshiftResultCompressionType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "RegisterDevicesRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "Devices", "shape": "Devices", "type": "list"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "RegisterModelStepMetadata": {
-        "members": [{"name": "Arn", "shape": "String256", "type": "string"}],
-        "type": "structure",
-    },
-    "RemoteDebugConfig": {
-        "members": [
-            {
-                "name": "EnableRemoteDebug",
-                "shape": "EnableRemoteDebug",
-                "type": "boolean",
-            }
-        ],
-        "type": "structure",
-    },
-    "RemoteDebugConfigForUpdate": {
-        "members": [
-            {
-                "name": "EnableRemoteDebug",
-                "shape": "EnableRemoteDebug",
-                "type": "boolean",
-            }
-        ],
-        "type": "structure",
-    },
-    "RenderUiTemplateRequest": {
-        "members": [
-            {"name": "UiTemplate", "shape": "UiTemplate", "type": "structure"},
-            {"name": "Task", "shape": "RenderableTask", "type": "structure"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "HumanTaskUiArn", "shape": "HumanTaskUiArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "RenderUiTemplateResponse": {
-        "members": [
-            {"name": "RenderedContent", "shape": "String", "type": "string"},
-            {"name": "Errors", "shape": "RenderingErrorList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "RenderableTask": {
-        "members": [{"name": "Input", "shape": "TaskInput", "type": "string"}],
-        "type": "structure",
-    },
-    "RenderingError": {
-        "members": [
-            {"name": "Code", "shape": "String", "type": "string"},
-            {"name": "Message", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "RenderingErrorList": {
-        "member_shape": "RenderingError",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "RepositoryAuthConfig": {
-        "members": [
-            {
-                "name": "RepositoryCredentialsProviderArn",
-                "shape": "RepositoryCredentialsProviderArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "ResolvedAttributes": {
-        "members": [
-            {
-                "name": "AutoMLJobObjective",
-                "shape": "AutoMLJobObjective",
-                "type": "structure",
-            },
-            {"name": "ProblemType", "shape": "ProblemType", "type": "string"},
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "ResourceCatalog": {
-        "members": [
-            {
-                "name": "ResourceCatalogArn",
-                "shape": "ResourceCatalogArn",
-                "type": "string",
-            },
-            {
-                "name": "ResourceCatalogName",
-                "shape": "ResourceCatalogName",
-                "type": "string",
-            },
-            {
-                "name": "Description",
-                "shape": "ResourceCatalogDescription",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "ResourceCatalogList": {
-        "member_shape": "ResourceCatalog",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ResourceConfig": {
-        "members": [
-            {"name": "InstanceType", "shape": "TrainingInstanceType", "type": "string"},
-            {
-                "name": "InstanceCount",
-                "shape": "TrainingInstanceCount",
-                "type": "integer",
-            },
-            {"name": "VolumeSizeInGB", "shape": "VolumeSizeInGB", "type": "integer"},
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {
-                "name": "KeepAlivePeriodInSeconds",
-                "shape": "KeepAlivePeriodInSeconds",
-                "type": "integer",
-            },
-            {"name": "InstanceGroups", "shape": "InstanceGroups", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "ResourceConfigForUpdate": {
-        "members": [
-            {
-                "name": "KeepAlivePeriodInSeconds",
-                "shape": "KeepAlivePeriodInSeconds",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "ResourceInUse": {
-        "members": [{"name": "Message", "shape": "FailureReason", "type": "string"}],
-        "type": "structure",
-    },
-    "ResourceLimitExceeded": {
-        "members": [{"name": "Message", "shape": "FailureReason", "type": "string"}],
-        "type": "structure",
-    },
-    "ResourceLimits": {
-        "members": [
-            {
-                "name": "MaxNumberOfTrainingJobs",
-                "shape": "MaxNumberOfTrainingJobs",
-                "type": "integer",
-            },
-            {
-                "name": "MaxParallelTrainingJobs",
-                "shape": "MaxParallelTrainingJobs",
-                "type": "integer",
-            },
-            {
-                "name": "MaxRuntimeInSeconds",
-                "shape": "HyperParameterTuningMaxRuntimeInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ResourceNotFound": {
-        "members": [{"name": "Message", "shape": "FailureReason", "type": "string"}],
-        "type": "structure",
-    },
-    "ResourceSpec": {
-        "members": [
-            {"name": "SageMakerImageArn", "shape": "ImageArn", "type": "string"},
-            {
-                "name": "SageMakerImageVersionArn",
-                "shape": "ImageVersionArn",
-                "type": "string",
-            },
-            {
-                "name": "SageMakerImageVersionAlias",
-                "shape": "ImageVersionAlias",
-                "type": "string",
-            },
-            {"name": "InstanceType", "shape": "AppInstanceType", "type": "string"},
-            {
-                "name": "LifecycleConfigArn",
-                "shape": "StudioLifecycleConfigArn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ResponseMIMETypes": {
-        "member_shape": "ResponseMIMEType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ResponseStream": {
-        "members": [
-            {"name": "PayloadPart", "shape": "PayloadPart", "type": "structure"},
-            {
-                "name": "ModelStreamError",
-                "shape": "ModelStreamError",
-                "type": "structure",
-            },
-            {
-                "name": "InternalStreamFailure",
-                "shape": "InternalStreamFailure",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "RetentionPolicy": {
-        "members": [
-            {"name": "HomeEfsFileSystem", "shape": "RetentionType", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "RetryPipelineExecutionRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "RetryPipelineExecutionResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "RetryStrategy": {
-        "members": [
-            {
-                "name": "MaximumRetryAttempts",
-                "shape": "MaximumRetryAttempts",
-                "type": "integer",
-            }
-        ],
-        "type": "structure",
-    },
-    "RollingUpdatePolicy": {
-        "members": [
-            {"name": "MaximumBatchSize", "shape": "CapacitySize", "type": "structure"},
-            {
-                "name": "WaitIntervalInSeconds",
-                "shape": "WaitIntervalInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "MaximumExecutionTimeoutInSeconds",
-                "shape": "MaximumExecutionTimeoutInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "RollbackMaximumBatchSize",
-                "shape": "CapacitySize",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "RuleParameters": {
-        "key_shape": "ConfigKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "ConfigValue",
-        "value_type": "string",
-    },
-    "S3DataSource": {
-        "members": [
-            {"name": "S3DataType", "shape": "S3DataType", "type": "string"},
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "S3DataDistributionType",
-                "shape": "S3DataDistribution",
-                "type": "string",
-            },
-            {"name": "AttributeNames", "shape": "AttributeNames", "type": "list"},
-            {
-                "name": "InstanceGroupNames",
-                "shape": "InstanceGroupNames",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "S3ModelDataSource": {
-        "members": [
-            {"name": "S3Uri", "shape": "S3ModelUri", "type": "string"},
-            {"name": "S3DataType", "shape": "S3ModelDataType", "type": "string"},
-            {
-                "name": "CompressionType",
-                "shape": "ModelCompressionType",
-                "type": "string",
-            },
-            {
-                "name": "ModelAccessConfig",
-                "shape": "ModelAccessConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "S3StorageConfig": {
-        "members": [
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-            {"name": "ResolvedOutputS3Uri", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SageMakerImageVersionAliases": {
-        "member_shape": "SageMakerImageVersionAlias",
-        "member_type": "string",
-        "type": "list",
-    },
-    "ScalingPolicies": {
-        "member_shape": "ScalingPolicy",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "ScalingPolicy": {
-        "members": [
-            {
-                "name": "TargetTracking",
-                "shape": "TargetTrackingScalingPolicyConfiguration",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "ScalingPolicyMetric": {
-        "members": [
-            {"name": "InvocationsPerInstance", "shape": "Integer", "type": "integer"},
-            {"name": "ModelLatency", "shape": "Integer", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ScalingPolicyObjective": {
-        "members": [
-            {"name": "MinInvocationsPerMinute", "shape": "Integer", "type": "integer"},
-            {"name": "MaxInvocationsPerMinute", "shape": "Integer", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ScheduleConfig": {
-        "members": [
-            {
-                "name": "ScheduleExpression",
-                "shape": "ScheduleExpression",
-                "type": "string",
-            },
-            {"name": "DataAnalysisStartTime", "shape": "String", "type": "string"},
-            {"name": "DataAnalysisEndTime", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SearchExpression": {
-        "members": [
-            {"name": "Filters", "shape": "FilterList", "type": "list"},
-            {"name": "NestedFilters", "shape": "NestedFiltersList", "type": "list"},
-            {"name": "SubExpressions", "shape": "SearchExpressionList", "type": "list"},
-            {"name": "Operator", "shape": "BooleanOperator", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SearchExpressionList": {
-        "member_shape": "SearchExpression",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SearchRecord": {
-        "members": [
-            {"name": "TrainingJob", "shape": "TrainingJob", "type": "structure"},
-            {"name": "Experiment", "shape": "Experiment", "type": "structure"},
-            {"name": "Trial", "shape": "Trial", "type": "structure"},
-            {"name": "TrialComponent", "shape": "TrialComponent", "type": "structure"},
-            {"name": "Endpoint", "shape": "Endpoint", "type": "structure"},
-            {"name": "ModelPackage", "shape": "ModelPackage", "type": "structure"},
-            {
-                "name": "ModelPackageGroup",
-                "shape": "ModelPackageGroup",
-                "type": "structure",
-            },
-            {"name": "Pipeline", "shape": "Pipeline", "type": "structure"},
-            {
-                "name": "PipelineExecution",
-                "shape": "PipelineExecution",
-                "type": "structure",
-            },
-            {"name": "FeatureGroup", "shape": "FeatureGroup", "type": "structure"},
-            {
-                "name": "FeatureMetadata",
-                "shape": "FeatureMetadata",
-                "type": "structure",
-            },
-            {"name": "Project", "shape": "Project", "type": "structure"},
-            {
-                "name": "HyperParameterTuningJob",
-                "shape": "HyperParameterTuningJobSearchEntity",
-                "type": "structure",
-            },
-            {"name": "ModelCard", "shape": "ModelCard", "type": "structure"},
-            {"name": "Model", "shape": "ModelDashboardModel", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "SearchRequest": {
-        "members": [
-            {"name": "Resource", "shape": "ResourceType", "type": "string"},
-            {
-                "name": "SearchExpression",
-                "shape": "SearchExpression",
-                "type": "structure",
-            },
-            {"name": "SortBy", "shape": "ResourcePropertyName", "type": "string"},
-            {"name": "SortOrder", "shape": "SearchSortOrder", "type": "string"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-            {"name": "MaxResults", "shape": "MaxResults", "type": "integer"},
-            {
-                "name": "CrossAccountFilterOption",
-                "shape": "CrossAccountFilterOption",
-                "type": "string",
-            },
-            {
-                "name": "VisibilityConditions",
-                "shape": "VisibilityConditionsList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "SearchResponse": {
-        "members": [
-            {"name": "Results", "shape": "SearchResultsList", "type": "list"},
-            {"name": "NextToken", "shape": "NextToken", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SearchResultsList": {
-        "member_shape": "SearchRecord",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SecondaryStatusTransition": {
-        "members": [
-            {"name": "Status", "shape": "SecondaryStatus", "type": "string"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "StatusMessage", "shape": "StatusMessage", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SecondaryStatusTransitions": {
-        "member_shape": "SecondaryStatusTransition",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SecurityGroupIds": {
-        "member_shape": "SecurityGroupId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "SelectedStep": {
-        "members": [{"name": "StepName", "shape": "String256", "type": "string"}],
-        "type": "structure",
-    },
-    "SelectedStepList": {
-        "member_shape": "SelectedStep",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SelectiveExecutionConfig": {
-        "members": [
-            {
-                "name": "SourcePipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {"name": "SelectedSteps", "shape": "SelectedStepList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "SelectiveExecutionResult": {
-        "members": [
-            {
-                "name": "SourcePipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "SendPipelineExecutionStepFailureRequest": {
-        "members": [
-            {"name": "CallbackToken", "shape": "CallbackToken", "type": "string"},
-            {"name": "FailureReason", "shape": "String256", "type": "string"},
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "SendPipelineExecutionStepFailureResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "SendPipelineExecutionStepSuccessRequest": {
-        "members": [
-            {"name": "CallbackToken", "shape": "CallbackToken", "type": "string"},
-            {
-                "name": "OutputParameters",
-                "shape": "OutputParameterList",
-                "type": "list",
-            },
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "SendPipelineExecutionStepSuccessResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "ServiceCatalogProvisionedProductDetails": {
-        "members": [
-            {
-                "name": "ProvisionedProductId",
-                "shape": "ServiceCatalogEntityId",
-                "type": "string",
-            },
-            {
-                "name": "ProvisionedProductStatusMessage",
-                "shape": "ProvisionedProductStatusMessage",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "ServiceCatalogProvisioningDetails": {
-        "members": [
-            {"name": "ProductId", "shape": "ServiceCatalogEntityId", "type": "string"},
-            {
-                "name": "ProvisioningArtifactId",
-                "shape": "ServiceCatalogEntityId",
-                "type": "string",
-            },
-            {"name": "PathId", "shape": "ServiceCatalogEntityId", "type": "string"},
-            {
-                "name": "ProvisioningParameters",
-                "shape": "ProvisioningParameters",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ServiceCatalogProvisioningUpdateDetails": {
-        "members": [
-            {
-                "name": "ProvisioningArtifactId",
-                "shape": "ServiceCatalogEntityId",
-                "type": "string",
-            },
-            {
-                "name": "ProvisioningParameters",
-                "shape": "ProvisioningParameters",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ServiceUnavailable": {
-        "members": [{"name": "Message", "shape": "Message", "type": "string"}],
-        "type": "structure",
-    },
-    "ShadowModeConfig": {
-        "members": [
-            {
-                "name": "SourceModelVariantName",
-                "shape": "ModelVariantName",
-                "type": "string",
-            },
-            {
-                "name": "ShadowModelVariants",
-                "shape": "ShadowModelVariantConfigList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ShadowModelVariantConfig": {
-        "members": [
-            {
-                "name": "ShadowModelVariantName",
-                "shape": "ModelVariantName",
-                "type": "string",
-            },
-            {"name": "SamplingPercentage", "shape": "Percentage", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "ShadowModelVariantConfigList": {
-        "member_shape": "ShadowModelVariantConfig",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SharingSettings": {
-        "members": [
-            {
-                "name": "NotebookOutputOption",
-                "shape": "NotebookOutputOption",
-                "type": "string",
-            },
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "S3KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "ShuffleConfig": {
-        "members": [{"name": "Seed", "shape": "Seed", "type": "long"}],
-        "type": "structure",
-    },
-    "SourceAlgorithm": {
-        "members": [
-            {"name": "ModelDataUrl", "shape": "Url", "type": "string"},
-            {
-                "name": "ModelDataSource",
-                "shape": "ModelDataSource",
-                "type": "structure",
-            },
-            {"name": "AlgorithmName", "shape": "ArnOrName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SourceAlgorithmList": {
-        "member_shape": "SourceAlgorithm",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SourceAlgorithmSpecification": {
-        "members": [
-            {"name": "SourceAlgorithms", "shape": "SourceAlgorithmList", "type": "list"}
-        ],
-        "type": "structure",
-    },
-    "SourceIpConfig": {
-        "members": [{"name": "Cidrs", "shape": "Cidrs", "type": "list"}],
-        "type": "structure",
-    },
-    "SpaceCodeEditorAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "SpaceDetails": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "Status", "shape": "SpaceStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-            {
-                "name": "SpaceSettingsSummary",
-                "shape": "SpaceSettingsSummary",
-                "type": "structure",
-            },
-            {
-                "name": "SpaceSharingSettingsSummary",
-                "shape": "SpaceSharingSettingsSummary",
-                "type": "structure",
-            },
-            {
-                "name": "OwnershipSettingsSummary",
-                "shape": "OwnershipSettingsSummary",
-                "type": "structure",
-            },
-            {"name": "SpaceDisplayName", "shape": "NonEmptyString64", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SpaceJupyterLabAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            },
-            {"name": "CodeRepositories", "shape": "CodeRepositories", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "SpaceList": {
-        "member_shape": "SpaceDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SpaceSettings": {
-        "members": [
-            {
-                "name": "JupyterServerAppSettings",
-                "shape": "JupyterServerAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "KernelGatewayAppSettings",
-                "shape": "KernelGatewayAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "CodeEditorAppSettings",
-                "shape": "SpaceCodeEditorAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterLabAppSettings",
-                "shape": "SpaceJupyterLabAppSettings",
-                "type": "structure",
-            },
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {
-                "name": "SpaceStorageSettings",
-                "shape": "SpaceStorageSettings",
-                "type": "structure",
-            },
-            {"name": "CustomFileSystems", "shape": "CustomFileSystems", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "SpaceSettingsSummary": {
-        "members": [
-            {"name": "AppType", "shape": "AppType", "type": "string"},
-            {
-                "name": "SpaceStorageSettings",
-                "shape": "SpaceStorageSettings",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "SpaceSharingSettings": {
-        "members": [{"name": "SharingType", "shape": "SharingType", "type": "string"}],
-        "type": "structure",
-    },
-    "SpaceSharingSettingsSummary": {
-        "members": [{"name": "SharingType", "shape": "SharingType", "type": "string"}],
-        "type": "structure",
-    },
-    "SpaceStorageSettings": {
-        "members": [
-            {
-                "name": "EbsStorageSettings",
-                "shape": "EbsStorageSettings",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "Stairs": {
-        "members": [
-            {
-                "name": "DurationInSeconds",
-                "shape": "TrafficDurationInSeconds",
-                "type": "integer",
-            },
-            {"name": "NumberOfSteps", "shape": "NumberOfSteps", "type": "integer"},
-            {"name": "UsersPerStep", "shape": "UsersPerStep", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "StartEdgeDeploymentStageRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "StartInferenceExperimentRequest": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StartInferenceExperimentResponse": {
-        "members": [
-            {
-                "name": "InferenceExperimentArn",
-                "shape": "InferenceExperimentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StartMonitoringScheduleRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StartNotebookInstanceInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StartPipelineExecutionRequest": {
-        "members": [
-            {"name": "PipelineName", "shape": "PipelineNameOrArn", "type": "string"},
-            {
-                "name": "PipelineExecutionDisplayName",
-                "shape": "PipelineExecutionName",
-                "type": "string",
-            },
-            {"name": "PipelineParameters", "shape": "ParameterList", "type": "list"},
-            {
-                "name": "PipelineExecutionDescription",
-                "shape": "PipelineExecutionDescription",
-                "type": "string",
-            },
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-            {
-                "name": "SelectiveExecutionConfig",
-                "shape": "SelectiveExecutionConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "StartPipelineExecutionResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopAutoMLJobRequest": {
-        "members": [
-            {"name": "AutoMLJobName", "shape": "AutoMLJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StopCompilationJobRequest": {
-        "members": [
-            {"name": "CompilationJobName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StopEdgeDeploymentStageRequest": {
-        "members": [
-            {"name": "EdgeDeploymentPlanName", "shape": "EntityName", "type": "string"},
-            {"name": "StageName", "shape": "EntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "StopEdgePackagingJobRequest": {
-        "members": [
-            {"name": "EdgePackagingJobName", "shape": "EntityName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StopHyperParameterTuningJobRequest": {
-        "members": [
-            {
-                "name": "HyperParameterTuningJobName",
-                "shape": "HyperParameterTuningJobName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopInferenceExperimentRequest": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"},
-            {
-                "name": "ModelVariantActions",
-                "shape": "ModelVariantActionMap",
-                "type": "map",
-            },
-            {
-                "name": "DesiredModelVariants",
-                "shape": "ModelVariantConfigList",
-                "type": "list",
-            },
-            {
-                "name": "DesiredState",
-                "shape": "InferenceExperimentStopDesiredState",
-                "type": "string",
-            },
-            {
-                "name": "Reason",
-                "shape": "InferenceExperimentStatusReason",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "StopInferenceExperimentResponse": {
-        "members": [
-            {
-                "name": "InferenceExperimentArn",
-                "shape": "InferenceExperimentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopInferenceRecommendationsJobRequest": {
-        "members": [
-            {"name": "JobName", "shape": "RecommendationJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StopLabelingJobRequest": {
-        "members": [
-            {"name": "LabelingJobName", "shape": "LabelingJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StopMonitoringScheduleRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopNotebookInstanceInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopPipelineExecutionRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {
-                "name": "ClientRequestToken",
-                "shape": "IdempotencyToken",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "StopPipelineExecutionResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopProcessingJobRequest": {
-        "members": [
-            {
-                "name": "ProcessingJobName",
-                "shape": "ProcessingJobName",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "StopTrainingJobRequest": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StopTransformJobRequest": {
-        "members": [
-            {"name": "TransformJobName", "shape": "TransformJobName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "StoppingCondition": {
-        "members": [
-            {
-                "name": "MaxRuntimeInSeconds",
-                "shape": "MaxRuntimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "MaxWaitTimeInSeconds",
-                "shape": "MaxWaitTimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "MaxPendingTimeInSeconds",
-                "shape": "MaxPendingTimeInSeconds",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "StudioLifecycleConfigDetails": {
-        "members": [
-            {
-                "name": "StudioLifecycleConfigArn",
-                "shape": "StudioLifecycleConfigArn",
-                "type": "string",
-            },
-            {
-                "name": "StudioLifecycleConfigName",
-                "shape": "StudioLifecycleConfigName",
-                "type": "string",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "StudioLifecycleConfigAppType",
-                "shape": "StudioLifecycleConfigAppType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "StudioLifecycleConfigsList": {
-        "member_shape": "StudioLifecycleConfigDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "Subnets": {"member_shape": "SubnetId", "member_type": "string", "type": "list"},
-    "SubscribedWorkteam": {
-        "members": [
-            {"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"},
-            {"name": "MarketplaceTitle", "shape": "String200", "type": "string"},
-            {"name": "SellerName", "shape": "String", "type": "string"},
-            {"name": "MarketplaceDescription", "shape": "String200", "type": "string"},
-            {"name": "ListingId", "shape": "String", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "SubscribedWorkteams": {
-        "member_shape": "SubscribedWorkteam",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "SuggestionQuery": {
-        "members": [
-            {
-                "name": "PropertyNameQuery",
-                "shape": "PropertyNameQuery",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "TabularJobConfig": {
-        "members": [
-            {
-                "name": "CandidateGenerationConfig",
-                "shape": "CandidateGenerationConfig",
-                "type": "structure",
-            },
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-            {"name": "FeatureSpecificationS3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "Mode", "shape": "AutoMLMode", "type": "string"},
-            {
-                "name": "GenerateCandidateDefinitionsOnly",
-                "shape": "GenerateCandidateDefinitionsOnly",
-                "type": "boolean",
-            },
-            {"name": "ProblemType", "shape": "ProblemType", "type": "string"},
-            {
-                "name": "TargetAttributeName",
-                "shape": "TargetAttributeName",
-                "type": "string",
-            },
-            {
-                "name": "SampleWeightAttributeName",
-                "shape": "SampleWeightAttributeName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "TabularResolvedAttributes": {
-        "members": [{"name": "ProblemType", "shape": "ProblemType", "type": "string"}],
-        "type": "structure",
-    },
-    "Tag": {
-        "members": [
-            {"name": "Key", "shape": "TagKey", "type": "string"},
-            {"name": "Value", "shape": "TagValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TagKeyList": {"member_shape": "TagKey", "member_type": "string", "type": "list"},
-    "TagList": {"member_shape": "Tag", "member_type": "structure", "type": "list"},
-    "TargetPlatform": {
-        "members": [
-            {"name": "Os", "shape": "TargetPlatformOs", "type": "string"},
-            {"name": "Arch", "shape": "TargetPlatformArch", "type": "string"},
-            {
-                "name": "Accelerator",
-                "shape": "TargetPlatformAccelerator",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "TargetTrackingScalingPolicyConfiguration": {
-        "members": [
-            {
-                "name": "MetricSpecification",
-                "shape": "MetricSpecification",
-                "type": "structure",
-            },
-            {"name": "TargetValue", "shape": "Double", "type": "double"},
-        ],
-        "type": "structure",
-    },
-    "TaskKeywords": {
-        "member_shape": "TaskKeyword",
-        "member_type": "string",
-        "type": "list",
-    },
-    "TensorBoardAppSettings": {
-        "members": [
-            {
-                "name": "DefaultResourceSpec",
-                "shape": "ResourceSpec",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "TensorBoardOutputConfig": {
-        "members": [
-            {"name": "LocalPath", "shape": "DirectoryPath", "type": "string"},
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TextClassificationJobConfig": {
-        "members": [
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-            {"name": "ContentColumn", "shape": "ContentColumn", "type": "string"},
-            {
-                "name": "TargetLabelColumn",
-                "shape": "TargetLabelColumn",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "TextGenerationHyperParameters": {
-        "key_shape": "TextGenerationHyperParameterKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "TextGenerationHyperParameterValue",
-        "value_type": "string",
-    },
-    "TextGenerationJobConfig": {
-        "members": [
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-            {"name": "BaseModelName", "shape": "BaseModelName", "type": "string"},
-            {
-                "name": "TextGenerationHyperParameters",
-                "shape": "TextGenerationHyperParameters",
-                "type": "map",
-            },
-            {
-                "name": "ModelAccessConfig",
-                "shape": "ModelAccessConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "TextGenerationResolvedAttributes": {
-        "members": [
-            {"name": "BaseModelName", "shape": "BaseModelName", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "ThroughputConfig": {
-        "members": [
-            {"name": "ThroughputMode", "shape": "ThroughputMode", "type": "string"},
-            {
-                "name": "ProvisionedReadCapacityUnits",
-                "shape": "CapacityUnit",
-                "type": "integer",
-            },
-            {
-                "name": "ProvisionedWriteCapacityUnits",
-                "shape": "CapacityUnit",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ThroughputConfigDescription": {
-        "members": [
-            {"name": "ThroughputMode", "shape": "ThroughputMode", "type": "string"},
-            {
-                "name": "ProvisionedReadCapacityUnits",
-                "shape": "CapacityUnit",
-                "type": "integer",
-            },
-            {
-                "name": "ProvisionedWriteCapacityUnits",
-                "shape": "CapacityUnit",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "ThroughputConfigUpdate": {
-        "members": [
-            {"name": "ThroughputMode", "shape": "ThroughputMode", "type": "string"},
-            {
-                "name": "ProvisionedReadCapacityUnits",
-                "shape": "CapacityUnit",
-                "type": "integer",
-            },
-            {
-                "name": "ProvisionedWriteCapacityUnits",
-                "shape": "CapacityUnit",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "TimeSeriesConfig": {
-        "members": [
-            {
-                "name": "TargetAttributeName",
-                "shape": "TargetAttributeName",
-                "type": "string",
-            },
-            {
-                "name": "TimestampAttributeName",
-                "shape": "TimestampAttributeName",
-                "type": "string",
-            },
-            {
-                "name": "ItemIdentifierAttributeName",
-                "shape": "ItemIdentifierAttributeName",
-                "type": "string",
-            },
-            {
-                "name": "GroupingAttributeNames",
-                "shape": "GroupingAttributeNames",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "TimeSeriesForecastingJobConfig": {
-        "members": [
-            {"name": "FeatureSpecificationS3Uri", "shape": "S3Uri", "type": "string"},
-            {
-                "name": "CompletionCriteria",
-                "shape": "AutoMLJobCompletionCriteria",
-                "type": "structure",
-            },
-            {
-                "name": "ForecastFrequency",
-                "shape": "ForecastFrequency",
-                "type": "string",
-            },
-            {"name": "ForecastHorizon", "shape": "ForecastHorizon", "type": "integer"},
-            {"name": "ForecastQuantiles", "shape": "ForecastQuantiles", "type": "list"},
-            {
-                "name": "Transformations",
-                "shape": "TimeSeriesTransformations",
-                "type": "structure",
-            },
-            {
-                "name": "TimeSeriesConfig",
-                "shape": "TimeSeriesConfig",
-                "type": "structure",
-            },
-            {"name": "HolidayConfig", "shape": "HolidayConfig", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "TimeSeriesForecastingSettings": {
-        "members": [
-            {"name": "Status", "shape": "FeatureStatus", "type": "string"},
-            {"name": "AmazonForecastRoleArn", "shape": "RoleArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TimeSeriesTransformations": {
-        "members": [
-            {"name": "Filling", "shape": "FillingTransformations", "type": "map"},
-            {
-                "name": "Aggregation",
-                "shape": "AggregationTransformations",
-                "type": "map",
-            },
-        ],
-        "type": "structure",
-    },
-    "TrafficPattern": {
-        "members": [
-            {"name": "TrafficType", "shape": "TrafficType", "type": "string"},
-            {"name": "Phases", "shape": "Phases", "type": "list"},
-            {"name": "Stairs", "shape": "Stairs", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "TrafficRoutingConfig": {
-        "members": [
-            {"name": "Type", "shape": "TrafficRoutingConfigType", "type": "string"},
-            {
-                "name": "WaitIntervalInSeconds",
-                "shape": "WaitIntervalInSeconds",
-                "type": "integer",
-            },
-            {"name": "CanarySize", "shape": "CapacitySize", "type": "structure"},
-            {"name": "LinearStepSize", "shape": "CapacitySize", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "TrainingContainerArguments": {
-        "member_shape": "TrainingContainerArgument",
-        "member_type": "string",
-        "type": "list",
-    },
-    "TrainingContainerEntrypoint": {
-        "member_shape": "TrainingContainerEntrypointString",
-        "member_type": "string",
-        "type": "list",
-    },
-    "TrainingEnvironmentMap": {
-        "key_shape": "TrainingEnvironmentKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "TrainingEnvironmentValue",
-        "value_type": "string",
-    },
-    "TrainingImageConfig": {
-        "members": [
-            {
-                "name": "TrainingRepositoryAccessMode",
-                "shape": "TrainingRepositoryAccessMode",
-                "type": "string",
-            },
-            {
-                "name": "TrainingRepositoryAuthConfig",
-                "shape": "TrainingRepositoryAuthConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "TrainingInstanceTypes": {
-        "member_shape": "TrainingInstanceType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "TrainingJob": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"},
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"},
-            {
-                "name": "TuningJobArn",
-                "shape": "HyperParameterTuningJobArn",
-                "type": "string",
-            },
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "ModelArtifacts", "shape": "ModelArtifacts", "type": "structure"},
-            {
-                "name": "TrainingJobStatus",
-                "shape": "TrainingJobStatus",
-                "type": "string",
-            },
-            {"name": "SecondaryStatus", "shape": "SecondaryStatus", "type": "string"},
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "HyperParameters", "shape": "HyperParameters", "type": "map"},
-            {
-                "name": "AlgorithmSpecification",
-                "shape": "AlgorithmSpecification",
-                "type": "structure",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {"name": "InputDataConfig", "shape": "InputDataConfig", "type": "list"},
-            {
-                "name": "OutputDataConfig",
-                "shape": "OutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "ResourceConfig", "shape": "ResourceConfig", "type": "structure"},
-            {"name": "VpcConfig", "shape": "VpcConfig", "type": "structure"},
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "SecondaryStatusTransitions",
-                "shape": "SecondaryStatusTransitions",
-                "type": "list",
-            },
-            {
-                "name": "FinalMetricDataList",
-                "shape": "FinalMetricDataList",
-                "type": "list",
-            },
-            {"name": "EnableNetworkIsolation", "shape": "Boolean", "type": "boolean"},
-            {
-                "name": "EnableInterContainerTrafficEncryption",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "EnableManagedSpotTraining",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "CheckpointConfig",
-                "shape": "CheckpointConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TrainingTimeInSeconds",
-                "shape": "TrainingTimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "BillableTimeInSeconds",
-                "shape": "BillableTimeInSeconds",
-                "type": "integer",
-            },
-            {
-                "name": "DebugHookConfig",
-                "shape": "DebugHookConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DebugRuleConfigurations",
-                "shape": "DebugRuleConfigurations",
-                "type": "list",
-            },
-            {
-                "name": "TensorBoardOutputConfig",
-                "shape": "TensorBoardOutputConfig",
-                "type": "structure",
-            },
-            {
-                "name": "DebugRuleEvaluationStatuses",
-                "shape": "DebugRuleEvaluationStatuses",
-                "type": "list",
-            },
-            {"name": "ProfilerConfig", "shape": "ProfilerConfig", "type": "structure"},
-            {"name": "Environment", "shape": "TrainingEnvironmentMap", "type": "map"},
-            {"name": "RetryStrategy", "shape": "RetryStrategy", "type": "structure"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "TrainingJobDefinition": {
-        "members": [
-            {
-                "name": "TrainingInputMode",
-                "shape": "TrainingInputMode",
-                "type": "string",
-            },
-            {"name": "HyperParameters", "shape": "HyperParameters", "type": "map"},
-            {"name": "InputDataConfig", "shape": "InputDataConfig", "type": "list"},
-            {
-                "name": "OutputDataConfig",
-                "shape": "OutputDataConfig",
-                "type": "structure",
-            },
-            {"name": "ResourceConfig", "shape": "ResourceConfig", "type": "structure"},
-            {
-                "name": "StoppingCondition",
-                "shape": "StoppingCondition",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "TrainingJobStatusCounters": {
-        "members": [
-            {
-                "name": "Completed",
-                "shape": "TrainingJobStatusCounter",
-                "type": "integer",
-            },
-            {
-                "name": "InProgress",
-                "shape": "TrainingJobStatusCounter",
-                "type": "integer",
-            },
-            {
-                "name": "RetryableError",
-                "shape": "TrainingJobStatusCounter",
-                "type": "integer",
-            },
-            {
-                "name": "NonRetryableError",
-                "shape": "TrainingJobStatusCounter",
-                "type": "integer",
-            },
-            {"name": "Stopped", "shape": "TrainingJobStatusCounter", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "TrainingJobStepMetadata": {
-        "members": [{"name": "Arn", "shape": "TrainingJobArn", "type": "string"}],
-        "type": "structure",
-    },
-    "TrainingJobSummaries": {
-        "member_shape": "TrainingJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TrainingJobSummary": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"},
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TrainingEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "TrainingJobStatus",
-                "shape": "TrainingJobStatus",
-                "type": "string",
-            },
-            {"name": "WarmPoolStatus", "shape": "WarmPoolStatus", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "TrainingRepositoryAuthConfig": {
-        "members": [
-            {
-                "name": "TrainingRepositoryCredentialsProviderArn",
-                "shape": "TrainingRepositoryCredentialsProviderArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "TrainingSpecification": {
-        "members": [
-            {"name": "TrainingImage", "shape": "ContainerImage", "type": "string"},
-            {"name": "TrainingImageDigest", "shape": "ImageDigest", "type": "string"},
-            {
-                "name": "SupportedHyperParameters",
-                "shape": "HyperParameterSpecifications",
-                "type": "list",
-            },
-            {
-                "name": "SupportedTrainingInstanceTypes",
-                "shape": "TrainingInstanceTypes",
-                "type": "list",
-            },
-            {
-                "name": "SupportsDistributedTraining",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "MetricDefinitions",
-                "shape": "MetricDefinitionList",
-                "type": "list",
-            },
-            {
-                "name": "TrainingChannels",
-                "shape": "ChannelSpecifications",
-                "type": "list",
-            },
-            {
-                "name": "SupportedTuningJobObjectiveMetrics",
-                "shape": "HyperParameterTuningJobObjectives",
-                "type": "list",
-            },
-            {
-                "name": "AdditionalS3DataSource",
-                "shape": "AdditionalS3DataSource",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "TransformDataSource": {
-        "members": [
-            {
-                "name": "S3DataSource",
-                "shape": "TransformS3DataSource",
-                "type": "structure",
-            }
-        ],
-        "type": "structure",
-    },
-    "TransformEnvironmentMap": {
-        "key_shape": "TransformEnvironmentKey",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "TransformEnvironmentValue",
-        "value_type": "string",
-    },
-    "TransformInput": {
-        "members": [
-            {"name": "DataSource", "shape": "TransformDataSource", "type": "structure"},
-            {"name": "ContentType", "shape": "ContentType", "type": "string"},
-            {"name": "CompressionType", "shape": "CompressionType", "type": "string"},
-            {"name": "SplitType", "shape": "SplitType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TransformInstanceTypes": {
-        "member_shape": "TransformInstanceType",
-        "member_type": "string",
-        "type": "list",
-    },
-    "TransformJob": {
-        "members": [
-            {"name": "TransformJobName", "shape": "TransformJobName", "type": "string"},
-            {"name": "TransformJobArn", "shape": "TransformJobArn", "type": "string"},
-            {
-                "name": "TransformJobStatus",
-                "shape": "TransformJobStatus",
-                "type": "string",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-            {"name": "ModelName", "shape": "ModelName", "type": "string"},
-            {
-                "name": "MaxConcurrentTransforms",
-                "shape": "MaxConcurrentTransforms",
-                "type": "integer",
-            },
-            {
-                "name": "ModelClientConfig",
-                "shape": "ModelClientConfig",
-                "type": "structure",
-            },
-            {"name": "MaxPayloadInMB", "shape": "MaxPayloadInMB", "type": "integer"},
-            {"name": "BatchStrategy", "shape": "BatchStrategy", "type": "string"},
-            {"name": "Environment", "shape": "TransformEnvironmentMap", "type": "map"},
-            {"name": "TransformInput", "shape": "TransformInput", "type": "structure"},
-            {
-                "name": "TransformOutput",
-                "shape": "TransformOutput",
-                "type": "structure",
-            },
-            {
-                "name": "DataCaptureConfig",
-                "shape": "BatchDataCaptureConfig",
-                "type": "structure",
-            },
-            {
-                "name": "TransformResources",
-                "shape": "TransformResources",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TransformStartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TransformEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LabelingJobArn", "shape": "LabelingJobArn", "type": "string"},
-            {"name": "AutoMLJobArn", "shape": "AutoMLJobArn", "type": "string"},
-            {"name": "DataProcessing", "shape": "DataProcessing", "type": "structure"},
-            {
-                "name": "ExperimentConfig",
-                "shape": "ExperimentConfig",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "TransformJobDefinition": {
-        "members": [
-            {
-                "name": "MaxConcurrentTransforms",
-                "shape": "MaxConcurrentTransforms",
-                "type": "integer",
-            },
-            {"name": "MaxPayloadInMB", "shape": "MaxPayloadInMB", "type": "integer"},
-            {"name": "BatchStrategy", "shape": "BatchStrategy", "type": "string"},
-            {"name": "Environment", "shape": "TransformEnvironmentMap", "type": "map"},
-            {"name": "TransformInput", "shape": "TransformInput", "type": "structure"},
-            {
-                "name": "TransformOutput",
-                "shape": "TransformOutput",
-                "type": "structure",
-            },
-            {
-                "name": "TransformResources",
-                "shape": "TransformResources",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "TransformJobStepMetadata": {
-        "members": [{"name": "Arn", "shape": "TransformJobArn", "type": "string"}],
-        "type": "structure",
-    },
-    "TransformJobSummaries": {
-        "member_shape": "TransformJobSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TransformJobSummary": {
-        "members": [
-            {"name": "TransformJobName", "shape": "TransformJobName", "type": "string"},
-            {"name": "TransformJobArn", "shape": "TransformJobArn", "type": "string"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "TransformEndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "TransformJobStatus",
-                "shape": "TransformJobStatus",
-                "type": "string",
-            },
-            {"name": "FailureReason", "shape": "FailureReason", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TransformOutput": {
-        "members": [
-            {"name": "S3OutputPath", "shape": "S3Uri", "type": "string"},
-            {"name": "Accept", "shape": "Accept", "type": "string"},
-            {"name": "AssembleWith", "shape": "AssemblyType", "type": "string"},
-            {"name": "KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TransformResources": {
-        "members": [
-            {
-                "name": "InstanceType",
-                "shape": "TransformInstanceType",
-                "type": "string",
-            },
-            {
-                "name": "InstanceCount",
-                "shape": "TransformInstanceCount",
-                "type": "integer",
-            },
-            {"name": "VolumeKmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TransformS3DataSource": {
-        "members": [
-            {"name": "S3DataType", "shape": "S3DataType", "type": "string"},
-            {"name": "S3Uri", "shape": "S3Uri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Trial": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "TrialArn", "shape": "TrialArn", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "Source", "shape": "TrialSource", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {
-                "name": "TrialComponentSummaries",
-                "shape": "TrialComponentSimpleSummaries",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "TrialComponent": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            },
-            {"name": "Source", "shape": "TrialComponentSource", "type": "structure"},
-            {"name": "Status", "shape": "TrialComponentStatus", "type": "structure"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "Parameters", "shape": "TrialComponentParameters", "type": "map"},
-            {
-                "name": "InputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "OutputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "Metrics",
-                "shape": "TrialComponentMetricSummaries",
-                "type": "list",
-            },
-            {
-                "name": "MetadataProperties",
-                "shape": "MetadataProperties",
-                "type": "structure",
-            },
-            {
-                "name": "SourceDetail",
-                "shape": "TrialComponentSourceDetail",
-                "type": "structure",
-            },
-            {"name": "LineageGroupArn", "shape": "LineageGroupArn", "type": "string"},
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-            {"name": "Parents", "shape": "Parents", "type": "list"},
-            {"name": "RunName", "shape": "ExperimentEntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentArtifact": {
-        "members": [
-            {"name": "MediaType", "shape": "MediaType", "type": "string"},
-            {"name": "Value", "shape": "TrialComponentArtifactValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentArtifacts": {
-        "key_shape": "TrialComponentKey128",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "TrialComponentArtifact",
-        "value_type": "structure",
-    },
-    "TrialComponentMetricSummaries": {
-        "member_shape": "TrialComponentMetricSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TrialComponentMetricSummary": {
-        "members": [
-            {"name": "MetricName", "shape": "MetricName", "type": "string"},
-            {"name": "SourceArn", "shape": "TrialComponentSourceArn", "type": "string"},
-            {"name": "TimeStamp", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Max", "shape": "OptionalDouble", "type": "double"},
-            {"name": "Min", "shape": "OptionalDouble", "type": "double"},
-            {"name": "Last", "shape": "OptionalDouble", "type": "double"},
-            {"name": "Count", "shape": "OptionalInteger", "type": "integer"},
-            {"name": "Avg", "shape": "OptionalDouble", "type": "double"},
-            {"name": "StdDev", "shape": "OptionalDouble", "type": "double"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentParameterValue": {
-        "members": [
-            {"name": "StringValue", "shape": "StringParameterValue", "type": "string"},
-            {"name": "NumberValue", "shape": "DoubleParameterValue", "type": "double"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentParameters": {
-        "key_shape": "TrialComponentKey320",
-        "key_type": "string",
-        "type": "map",
-        "value_shape": "TrialComponentParameterValue",
-        "value_type": "structure",
-    },
-    "TrialComponentSimpleSummaries": {
-        "member_shape": "TrialComponentSimpleSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TrialComponentSimpleSummary": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            },
-            {
-                "name": "TrialComponentSource",
-                "shape": "TrialComponentSource",
-                "type": "structure",
-            },
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentSource": {
-        "members": [
-            {"name": "SourceArn", "shape": "TrialComponentSourceArn", "type": "string"},
-            {"name": "SourceType", "shape": "SourceType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentSourceDetail": {
-        "members": [
-            {"name": "SourceArn", "shape": "TrialComponentSourceArn", "type": "string"},
-            {"name": "TrainingJob", "shape": "TrainingJob", "type": "structure"},
-            {"name": "ProcessingJob", "shape": "ProcessingJob", "type": "structure"},
-            {"name": "TransformJob", "shape": "TransformJob", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "TrialComponentSources": {
-        "member_shape": "TrialComponentSource",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TrialComponentStatus": {
-        "members": [
-            {
-                "name": "PrimaryStatus",
-                "shape": "TrialComponentPrimaryStatus",
-                "type": "string",
-            },
-            {
-                "name": "Message",
-                "shape": "TrialComponentStatusMessage",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "TrialComponentSummaries": {
-        "member_shape": "TrialComponentSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TrialComponentSummary": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {
-                "name": "TrialComponentSource",
-                "shape": "TrialComponentSource",
-                "type": "structure",
-            },
-            {"name": "Status", "shape": "TrialComponentStatus", "type": "structure"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "CreatedBy", "shape": "UserContext", "type": "structure"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedBy", "shape": "UserContext", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "TrialSource": {
-        "members": [
-            {"name": "SourceArn", "shape": "TrialSourceArn", "type": "string"},
-            {"name": "SourceType", "shape": "SourceType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "TrialSummaries": {
-        "member_shape": "TrialSummary",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "TrialSummary": {
-        "members": [
-            {"name": "TrialArn", "shape": "TrialArn", "type": "string"},
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "TrialSource", "shape": "TrialSource", "type": "structure"},
-            {"name": "CreationTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastModifiedTime", "shape": "Timestamp", "type": "timestamp"},
-        ],
-        "type": "structure",
-    },
-    "TtlDuration": {
-        "members": [
-            {"name": "Unit", "shape": "TtlDurationUnit", "type": "string"},
-            {"name": "Value", "shape": "TtlDurationValue", "type": "integer"},
-        ],
-        "type": "structure",
-    },
-    "TuningJobCompletionCriteria": {
-        "members": [
-            {
-                "name": "TargetObjectiveMetricValue",
-                "shape": "TargetObjectiveMetricValue",
-                "type": "float",
-            },
-            {
-                "name": "BestObjectiveNotImproving",
-                "shape": "BestObjectiveNotImproving",
-                "type": "structure",
-            },
-            {
-                "name": "ConvergenceDetected",
-                "shape": "ConvergenceDetected",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "TuningJobStepMetaData": {
-        "members": [
-            {"name": "Arn", "shape": "HyperParameterTuningJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "USD": {
-        "members": [
-            {"name": "Dollars", "shape": "Dollars", "type": "integer"},
-            {"name": "Cents", "shape": "Cents", "type": "integer"},
-            {
-                "name": "TenthFractionsOfACent",
-                "shape": "TenthFractionsOfACent",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "UiConfig": {
-        "members": [
-            {"name": "UiTemplateS3Uri", "shape": "S3Uri", "type": "string"},
-            {"name": "HumanTaskUiArn", "shape": "HumanTaskUiArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UiTemplate": {
-        "members": [{"name": "Content", "shape": "TemplateContent", "type": "string"}],
-        "type": "structure",
-    },
-    "UiTemplateInfo": {
-        "members": [
-            {"name": "Url", "shape": "TemplateUrl", "type": "string"},
-            {
-                "name": "ContentSha256",
-                "shape": "TemplateContentSha256",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateActionRequest": {
-        "members": [
-            {"name": "ActionName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Status", "shape": "ActionStatus", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {
-                "name": "PropertiesToRemove",
-                "shape": "ListLineageEntityParameterKey",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateActionResponse": {
-        "members": [{"name": "ActionArn", "shape": "ActionArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateAppImageConfigRequest": {
-        "members": [
-            {
-                "name": "AppImageConfigName",
-                "shape": "AppImageConfigName",
-                "type": "string",
-            },
-            {
-                "name": "KernelGatewayImageConfig",
-                "shape": "KernelGatewayImageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterLabAppImageConfig",
-                "shape": "JupyterLabAppImageConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateAppImageConfigResponse": {
-        "members": [
-            {
-                "name": "AppImageConfigArn",
-                "shape": "AppImageConfigArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateArtifactRequest": {
-        "members": [
-            {"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"},
-            {"name": "ArtifactName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Properties", "shape": "ArtifactProperties", "type": "map"},
-            {
-                "name": "PropertiesToRemove",
-                "shape": "ListLineageEntityParameterKey",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateArtifactResponse": {
-        "members": [{"name": "ArtifactArn", "shape": "ArtifactArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateClusterRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterNameOrArn", "type": "string"},
-            {
-                "name": "InstanceGroups",
-                "shape": "ClusterInstanceGroupSpecifications",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateClusterResponse": {
-        "members": [{"name": "ClusterArn", "shape": "ClusterArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateClusterSoftwareRequest": {
-        "members": [
-            {"name": "ClusterName", "shape": "ClusterNameOrArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateClusterSoftwareResponse": {
-        "members": [{"name": "ClusterArn", "shape": "ClusterArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateCodeRepositoryInput": {
-        "members": [
-            {"name": "CodeRepositoryName", "shape": "EntityName", "type": "string"},
-            {"name": "GitConfig", "shape": "GitConfigForUpdate", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "UpdateCodeRepositoryOutput": {
-        "members": [
-            {
-                "name": "CodeRepositoryArn",
-                "shape": "CodeRepositoryArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateContextRequest": {
-        "members": [
-            {"name": "ContextName", "shape": "ContextName", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-            {"name": "Properties", "shape": "LineageEntityParameters", "type": "map"},
-            {
-                "name": "PropertiesToRemove",
-                "shape": "ListLineageEntityParameterKey",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateContextResponse": {
-        "members": [{"name": "ContextArn", "shape": "ContextArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateDeviceFleetRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "Description",
-                "shape": "DeviceFleetDescription",
-                "type": "string",
-            },
-            {"name": "OutputConfig", "shape": "EdgeOutputConfig", "type": "structure"},
-            {
-                "name": "EnableIotRoleAlias",
-                "shape": "EnableIotRoleAlias",
-                "type": "boolean",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateDevicesRequest": {
-        "members": [
-            {"name": "DeviceFleetName", "shape": "EntityName", "type": "string"},
-            {"name": "Devices", "shape": "Devices", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "UpdateDomainRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {
-                "name": "DefaultUserSettings",
-                "shape": "UserSettings",
-                "type": "structure",
-            },
-            {
-                "name": "DomainSettingsForUpdate",
-                "shape": "DomainSettingsForUpdate",
-                "type": "structure",
-            },
-            {
-                "name": "AppSecurityGroupManagement",
-                "shape": "AppSecurityGroupManagement",
-                "type": "string",
-            },
-            {
-                "name": "DefaultSpaceSettings",
-                "shape": "DefaultSpaceSettings",
-                "type": "structure",
-            },
-            {"name": "SubnetIds", "shape": "Subnets", "type": "list"},
-            {
-                "name": "AppNetworkAccessType",
-                "shape": "AppNetworkAccessType",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateDomainResponse": {
-        "members": [{"name": "DomainArn", "shape": "DomainArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateEndpointInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "EndpointConfigName",
-                "shape": "EndpointConfigName",
-                "type": "string",
-            },
-            {
-                "name": "RetainAllVariantProperties",
-                "shape": "Boolean",
-                "type": "boolean",
-            },
-            {
-                "name": "ExcludeRetainedVariantProperties",
-                "shape": "VariantPropertyList",
-                "type": "list",
-            },
-            {
-                "name": "DeploymentConfig",
-                "shape": "DeploymentConfig",
-                "type": "structure",
-            },
-            {"name": "RetainDeploymentConfig", "shape": "Boolean", "type": "boolean"},
-        ],
-        "type": "structure",
-    },
-    "UpdateEndpointOutput": {
-        "members": [{"name": "EndpointArn", "shape": "EndpointArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateEndpointWeightsAndCapacitiesInput": {
-        "members": [
-            {"name": "EndpointName", "shape": "EndpointName", "type": "string"},
-            {
-                "name": "DesiredWeightsAndCapacities",
-                "shape": "DesiredWeightAndCapacityList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateEndpointWeightsAndCapacitiesOutput": {
-        "members": [{"name": "EndpointArn", "shape": "EndpointArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateExperimentRequest": {
-        "members": [
-            {
-                "name": "ExperimentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Description", "shape": "ExperimentDescription", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateExperimentResponse": {
-        "members": [
-            {"name": "ExperimentArn", "shape": "ExperimentArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateFeatureGroupRequest": {
-        "members": [
-            {
-                "name": "FeatureGroupName",
-                "shape": "FeatureGroupNameOrArn",
-                "type": "string",
-            },
-            {"name": "FeatureAdditions", "shape": "FeatureAdditions", "type": "list"},
-            {
-                "name": "OnlineStoreConfig",
-                "shape": "OnlineStoreConfigUpdate",
-                "type": "structure",
-            },
-            {
-                "name": "ThroughputConfig",
-                "shape": "ThroughputConfigUpdate",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateFeatureGroupResponse": {
-        "members": [
-            {"name": "FeatureGroupArn", "shape": "FeatureGroupArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateFeatureMetadataRequest": {
-        "members": [
-            {
-                "name": "FeatureGroupName",
-                "shape": "FeatureGroupNameOrArn",
-                "type": "string",
-            },
-            {"name": "FeatureName", "shape": "FeatureName", "type": "string"},
-            {"name": "Description", "shape": "FeatureDescription", "type": "string"},
-            {
-                "name": "ParameterAdditions",
-                "shape": "FeatureParameterAdditions",
-                "type": "list",
-            },
-            {
-                "name": "ParameterRemovals",
-                "shape": "FeatureParameterRemovals",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateHubRequest": {
-        "members": [
-            {"name": "HubName", "shape": "HubName", "type": "string"},
-            {"name": "HubDescription", "shape": "HubDescription", "type": "string"},
-            {"name": "HubDisplayName", "shape": "HubDisplayName", "type": "string"},
-            {
-                "name": "HubSearchKeywords",
-                "shape": "HubSearchKeywordList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateHubResponse": {
-        "members": [{"name": "HubArn", "shape": "HubArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateImageRequest": {
-        "members": [
-            {
-                "name": "DeleteProperties",
-                "shape": "ImageDeletePropertyList",
-                "type": "list",
-            },
-            {"name": "Description", "shape": "ImageDescription", "type": "string"},
-            {"name": "DisplayName", "shape": "ImageDisplayName", "type": "string"},
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateImageResponse": {
-        "members": [{"name": "ImageArn", "shape": "ImageArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateImageVersionRequest": {
-        "members": [
-            {"name": "ImageName", "shape": "ImageName", "type": "string"},
-            {"name": "Alias", "shape": "SageMakerImageVersionAlias", "type": "string"},
-            {"name": "Version", "shape": "ImageVersionNumber", "type": "integer"},
-            {
-                "name": "AliasesToAdd",
-                "shape": "SageMakerImageVersionAliases",
-                "type": "list",
-            },
-            {
-                "name": "AliasesToDelete",
-                "shape": "SageMakerImageVersionAliases",
-                "type": "list",
-            },
-            {"name": "VendorGuidance", "shape": "VendorGuidance", "type": "string"},
-            {"name": "JobType", "shape": "JobType", "type": "string"},
-            {"name": "MLFramework", "shape": "MLFramework", "type": "string"},
-            {"name": "ProgrammingLang", "shape": "ProgrammingLang", "type": "string"},
-            {"name": "Processor", "shape": "Processor", "type": "string"},
-            {"name": "Horovod", "shape": "Horovod", "type": "boolean"},
-            {"name": "ReleaseNotes", "shape": "ReleaseNotes", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateImageVersionResponse": {
-        "members": [
-            {"name": "ImageVersionArn", "shape": "ImageVersionArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateInferenceComponentInput": {
-        "members": [
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            },
-            {
-                "name": "Specification",
-                "shape": "InferenceComponentSpecification",
-                "type": "structure",
-            },
-            {
-                "name": "RuntimeConfig",
-                "shape": "InferenceComponentRuntimeConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateInferenceComponentOutput": {
-        "members": [
-            {
-                "name": "InferenceComponentArn",
-                "shape": "InferenceComponentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateInferenceComponentRuntimeConfigInput": {
-        "members": [
-            {
-                "name": "InferenceComponentName",
-                "shape": "InferenceComponentName",
-                "type": "string",
-            },
-            {
-                "name": "DesiredRuntimeConfig",
-                "shape": "InferenceComponentRuntimeConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateInferenceComponentRuntimeConfigOutput": {
-        "members": [
-            {
-                "name": "InferenceComponentArn",
-                "shape": "InferenceComponentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateInferenceExperimentRequest": {
-        "members": [
-            {"name": "Name", "shape": "InferenceExperimentName", "type": "string"},
-            {
-                "name": "Schedule",
-                "shape": "InferenceExperimentSchedule",
-                "type": "structure",
-            },
-            {
-                "name": "Description",
-                "shape": "InferenceExperimentDescription",
-                "type": "string",
-            },
-            {
-                "name": "ModelVariants",
-                "shape": "ModelVariantConfigList",
-                "type": "list",
-            },
-            {
-                "name": "DataStorageConfig",
-                "shape": "InferenceExperimentDataStorageConfig",
-                "type": "structure",
-            },
-            {
-                "name": "ShadowModeConfig",
-                "shape": "ShadowModeConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateInferenceExperimentResponse": {
-        "members": [
-            {
-                "name": "InferenceExperimentArn",
-                "shape": "InferenceExperimentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateModelCardRequest": {
-        "members": [
-            {"name": "ModelCardName", "shape": "ModelCardNameOrArn", "type": "string"},
-            {"name": "Content", "shape": "ModelCardContent", "type": "string"},
-            {"name": "ModelCardStatus", "shape": "ModelCardStatus", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateModelCardResponse": {
-        "members": [
-            {"name": "ModelCardArn", "shape": "ModelCardArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateModelPackageInput": {
-        "members": [
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"},
-            {
-                "name": "ModelApprovalStatus",
-                "shape": "ModelApprovalStatus",
-                "type": "string",
-            },
-            {
-                "name": "ApprovalDescription",
-                "shape": "ApprovalDescription",
-                "type": "string",
-            },
-            {
-                "name": "CustomerMetadataProperties",
-                "shape": "CustomerMetadataMap",
-                "type": "map",
-            },
-            {
-                "name": "CustomerMetadataPropertiesToRemove",
-                "shape": "CustomerMetadataKeyList",
-                "type": "list",
-            },
-            {
-                "name": "AdditionalInferenceSpecificationsToAdd",
-                "shape": "AdditionalInferenceSpecifications",
-                "type": "list",
-            },
-            {
-                "name": "InferenceSpecification",
-                "shape": "InferenceSpecification",
-                "type": "structure",
-            },
-            {"name": "SourceUri", "shape": "ModelPackageSourceUri", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateModelPackageOutput": {
-        "members": [
-            {"name": "ModelPackageArn", "shape": "ModelPackageArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateMonitoringAlertRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringAlertName",
-                "shape": "MonitoringAlertName",
-                "type": "string",
-            },
-            {
-                "name": "DatapointsToAlert",
-                "shape": "MonitoringDatapointsToAlert",
-                "type": "integer",
-            },
-            {
-                "name": "EvaluationPeriod",
-                "shape": "MonitoringEvaluationPeriod",
-                "type": "integer",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateMonitoringAlertResponse": {
-        "members": [
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringAlertName",
-                "shape": "MonitoringAlertName",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateMonitoringScheduleRequest": {
-        "members": [
-            {
-                "name": "MonitoringScheduleName",
-                "shape": "MonitoringScheduleName",
-                "type": "string",
-            },
-            {
-                "name": "MonitoringScheduleConfig",
-                "shape": "MonitoringScheduleConfig",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateMonitoringScheduleResponse": {
-        "members": [
-            {
-                "name": "MonitoringScheduleArn",
-                "shape": "MonitoringScheduleArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateNotebookInstanceInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceName",
-                "shape": "NotebookInstanceName",
-                "type": "string",
-            },
-            {"name": "InstanceType", "shape": "InstanceType", "type": "string"},
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "LifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "DisassociateLifecycleConfig",
-                "shape": "DisassociateNotebookInstanceLifecycleConfig",
-                "type": "boolean",
-            },
-            {
-                "name": "VolumeSizeInGB",
-                "shape": "NotebookInstanceVolumeSizeInGB",
-                "type": "integer",
-            },
-            {
-                "name": "DefaultCodeRepository",
-                "shape": "CodeRepositoryNameOrUrl",
-                "type": "string",
-            },
-            {
-                "name": "AdditionalCodeRepositories",
-                "shape": "AdditionalCodeRepositoryNamesOrUrls",
-                "type": "list",
-            },
-            {
-                "name": "AcceleratorTypes",
-                "shape": "NotebookInstanceAcceleratorTypes",
-                "type": "list",
-            },
-            {
-                "name": "DisassociateAcceleratorTypes",
-                "shape": "DisassociateNotebookInstanceAcceleratorTypes",
-                "type": "boolean",
-            },
-            {
-                "name": "DisassociateDefaultCodeRepository",
-                "shape": "DisassociateDefaultCodeRepository",
-                "type": "boolean",
-            },
-            {
-                "name": "DisassociateAdditionalCodeRepositories",
-                "shape": "DisassociateAdditionalCodeRepositories",
-                "type": "boolean",
-            },
-            {"name": "RootAccess", "shape": "RootAccess", "type": "string"},
-            {
-                "name": "InstanceMetadataServiceConfiguration",
-                "shape": "InstanceMetadataServiceConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateNotebookInstanceLifecycleConfigInput": {
-        "members": [
-            {
-                "name": "NotebookInstanceLifecycleConfigName",
-                "shape": "NotebookInstanceLifecycleConfigName",
-                "type": "string",
-            },
-            {
-                "name": "OnCreate",
-                "shape": "NotebookInstanceLifecycleConfigList",
-                "type": "list",
-            },
-            {
-                "name": "OnStart",
-                "shape": "NotebookInstanceLifecycleConfigList",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateNotebookInstanceLifecycleConfigOutput": {"members": [], "type": "structure"},
-    "UpdateNotebookInstanceOutput": {"members": [], "type": "structure"},
-    "UpdatePipelineExecutionRequest": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDescription",
-                "shape": "PipelineExecutionDescription",
-                "type": "string",
-            },
-            {
-                "name": "PipelineExecutionDisplayName",
-                "shape": "PipelineExecutionName",
-                "type": "string",
-            },
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdatePipelineExecutionResponse": {
-        "members": [
-            {
-                "name": "PipelineExecutionArn",
-                "shape": "PipelineExecutionArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdatePipelineRequest": {
-        "members": [
-            {"name": "PipelineName", "shape": "PipelineName", "type": "string"},
-            {"name": "PipelineDisplayName", "shape": "PipelineName", "type": "string"},
-            {
-                "name": "PipelineDefinition",
-                "shape": "PipelineDefinition",
-                "type": "string",
-            },
-            {
-                "name": "PipelineDefinitionS3Location",
-                "shape": "PipelineDefinitionS3Location",
-                "type": "structure",
-            },
-            {
-                "name": "PipelineDescription",
-                "shape": "PipelineDescription",
-                "type": "string",
-            },
-            {"name": "RoleArn", "shape": "RoleArn", "type": "string"},
-            {
-                "name": "ParallelismConfiguration",
-                "shape": "ParallelismConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdatePipelineResponse": {
-        "members": [{"name": "PipelineArn", "shape": "PipelineArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateProjectInput": {
-        "members": [
-            {"name": "ProjectName", "shape": "ProjectEntityName", "type": "string"},
-            {
-                "name": "ProjectDescription",
-                "shape": "EntityDescription",
-                "type": "string",
-            },
-            {
-                "name": "ServiceCatalogProvisioningUpdateDetails",
-                "shape": "ServiceCatalogProvisioningUpdateDetails",
-                "type": "structure",
-            },
-            {"name": "Tags", "shape": "TagList", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "UpdateProjectOutput": {
-        "members": [{"name": "ProjectArn", "shape": "ProjectArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateSpaceRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "SpaceName", "shape": "SpaceName", "type": "string"},
-            {"name": "SpaceSettings", "shape": "SpaceSettings", "type": "structure"},
-            {"name": "SpaceDisplayName", "shape": "NonEmptyString64", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateSpaceResponse": {
-        "members": [{"name": "SpaceArn", "shape": "SpaceArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateTrainingJobRequest": {
-        "members": [
-            {"name": "TrainingJobName", "shape": "TrainingJobName", "type": "string"},
-            {
-                "name": "ProfilerConfig",
-                "shape": "ProfilerConfigForUpdate",
-                "type": "structure",
-            },
-            {
-                "name": "ProfilerRuleConfigurations",
-                "shape": "ProfilerRuleConfigurations",
-                "type": "list",
-            },
-            {
-                "name": "ResourceConfig",
-                "shape": "ResourceConfigForUpdate",
-                "type": "structure",
-            },
-            {
-                "name": "RemoteDebugConfig",
-                "shape": "RemoteDebugConfigForUpdate",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateTrainingJobResponse": {
-        "members": [
-            {"name": "TrainingJobArn", "shape": "TrainingJobArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateTrialComponentRequest": {
-        "members": [
-            {
-                "name": "TrialComponentName",
-                "shape": "ExperimentEntityName",
-                "type": "string",
-            },
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "Status", "shape": "TrialComponentStatus", "type": "structure"},
-            {"name": "StartTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "EndTime", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "Parameters", "shape": "TrialComponentParameters", "type": "map"},
-            {
-                "name": "ParametersToRemove",
-                "shape": "ListTrialComponentKey256",
-                "type": "list",
-            },
-            {
-                "name": "InputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "InputArtifactsToRemove",
-                "shape": "ListTrialComponentKey256",
-                "type": "list",
-            },
-            {
-                "name": "OutputArtifacts",
-                "shape": "TrialComponentArtifacts",
-                "type": "map",
-            },
-            {
-                "name": "OutputArtifactsToRemove",
-                "shape": "ListTrialComponentKey256",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateTrialComponentResponse": {
-        "members": [
-            {
-                "name": "TrialComponentArn",
-                "shape": "TrialComponentArn",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "UpdateTrialRequest": {
-        "members": [
-            {"name": "TrialName", "shape": "ExperimentEntityName", "type": "string"},
-            {"name": "DisplayName", "shape": "ExperimentEntityName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "UpdateTrialResponse": {
-        "members": [{"name": "TrialArn", "shape": "TrialArn", "type": "string"}],
-        "type": "structure",
-    },
-    "UpdateUserProfileRequest": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "UserSettings", "shape": "UserSettings", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "UpdateUserProfileResponse": {
-        "members": [
-            {"name": "UserProfileArn", "shape": "UserProfileArn", "type": "string"}
-        ],
-        "type": "structure",
-    },
-    "UpdateWorkforceRequest": {
-        "members": [
-            {"name": "WorkforceName", "shape": "WorkforceName", "type": "string"},
-            {"name": "SourceIpConfig", "shape": "SourceIpConfig", "type": "structure"},
-            {"name": "OidcConfig", "shape": "OidcConfig", "type": "structure"},
-            {
-                "name": "WorkforceVpcConfig",
-                "shape": "WorkforceVpcConfigRequest",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateWorkforceResponse": {
-        "members": [{"name": "Workforce", "shape": "Workforce", "type": "structure"}],
-        "type": "structure",
-    },
-    "UpdateWorkteamRequest": {
-        "members": [
-            {"name": "WorkteamName", "shape": "WorkteamName", "type": "string"},
-            {"name": "MemberDefinitions", "shape": "MemberDefinitions", "type": "list"},
-            {"name": "Description", "shape": "String200", "type": "string"},
-            {
-                "name": "NotificationConfiguration",
-                "shape": "NotificationConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "UpdateWorkteamResponse": {
-        "members": [{"name": "Workteam", "shape": "Workteam", "type": "structure"}],
-        "type": "structure",
-    },
-    "UserContext": {
-        "members": [
-            {"name": "UserProfileArn", "shape": "String", "type": "string"},
-            {"name": "UserProfileName", "shape": "String", "type": "string"},
-            {"name": "DomainId", "shape": "String", "type": "string"},
-            {"name": "IamIdentity", "shape": "IamIdentity", "type": "structure"},
-        ],
-        "type": "structure",
-    },
-    "UserProfileDetails": {
-        "members": [
-            {"name": "DomainId", "shape": "DomainId", "type": "string"},
-            {"name": "UserProfileName", "shape": "UserProfileName", "type": "string"},
-            {"name": "Status", "shape": "UserProfileStatus", "type": "string"},
-            {"name": "CreationTime", "shape": "CreationTime", "type": "timestamp"},
-            {
-                "name": "LastModifiedTime",
-                "shape": "LastModifiedTime",
-                "type": "timestamp",
-            },
-        ],
-        "type": "structure",
-    },
-    "UserProfileList": {
-        "member_shape": "UserProfileDetails",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "UserSettings": {
-        "members": [
-            {"name": "ExecutionRole", "shape": "RoleArn", "type": "string"},
-            {"name": "SecurityGroups", "shape": "SecurityGroupIds", "type": "list"},
-            {
-                "name": "SharingSettings",
-                "shape": "SharingSettings",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterServerAppSettings",
-                "shape": "JupyterServerAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "KernelGatewayAppSettings",
-                "shape": "KernelGatewayAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "TensorBoardAppSettings",
-                "shape": "TensorBoardAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "RStudioServerProAppSettings",
-                "shape": "RStudioServerProAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "RSessionAppSettings",
-                "shape": "RSessionAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "CanvasAppSettings",
-                "shape": "CanvasAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "CodeEditorAppSettings",
-                "shape": "CodeEditorAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "JupyterLabAppSettings",
-                "shape": "JupyterLabAppSettings",
-                "type": "structure",
-            },
-            {
-                "name": "SpaceStorageSettings",
-                "shape": "DefaultSpaceStorageSettings",
-                "type": "structure",
-            },
-            {"name": "DefaultLandingUri", "shape": "LandingUri", "type": "string"},
-            {"name": "StudioWebPortal", "shape": "StudioWebPortal", "type": "string"},
-            {
-                "name": "CustomPosixUserConfig",
-                "shape": "CustomPosixUserConfig",
-                "type": "structure",
-            },
-            {
-                "name": "CustomFileSystemConfigs",
-                "shape": "CustomFileSystemConfigs",
-                "type": "list",
-            },
-        ],
-        "type": "structure",
-    },
-    "ValidationError": {
-        "members": [{"name": "Message", "shape": "Message", "type": "string"}],
-        "type": "structure",
-    },
-    "VariantProperty": {
-        "members": [
-            {
-                "name": "VariantPropertyType",
-                "shape": "VariantPropertyType",
-                "type": "string",
-            }
-        ],
-        "type": "structure",
-    },
-    "VariantPropertyList": {
-        "member_shape": "VariantProperty",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "VectorConfig": {
-        "members": [{"name": "Dimension", "shape": "Dimension", "type": "integer"}],
-        "type": "structure",
-    },
-    "Vertex": {
-        "members": [
-            {"name": "Arn", "shape": "AssociationEntityArn", "type": "string"},
-            {"name": "Type", "shape": "String40", "type": "string"},
-            {"name": "LineageType", "shape": "LineageType", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Vertices": {"member_shape": "Vertex", "member_type": "structure", "type": "list"},
-    "VisibilityConditions": {
-        "members": [
-            {"name": "Key", "shape": "VisibilityConditionsKey", "type": "string"},
-            {"name": "Value", "shape": "VisibilityConditionsValue", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "VisibilityConditionsList": {
-        "member_shape": "VisibilityConditions",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "VpcConfig": {
-        "members": [
-            {
-                "name": "SecurityGroupIds",
-                "shape": "VpcSecurityGroupIds",
-                "type": "list",
-            },
-            {"name": "Subnets", "shape": "Subnets", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "VpcOnlyTrustedAccounts": {
-        "member_shape": "AccountId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "VpcSecurityGroupIds": {
-        "member_shape": "SecurityGroupId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "WarmPoolStatus": {
-        "members": [
-            {"name": "Status", "shape": "WarmPoolResourceStatus", "type": "string"},
-            {
-                "name": "ResourceRetainedBillableTimeInSeconds",
-                "shape": "ResourceRetainedBillableTimeInSeconds",
-                "type": "integer",
-            },
-            {"name": "ReusedByJob", "shape": "TrainingJobName", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Workforce": {
-        "members": [
-            {"name": "WorkforceName", "shape": "WorkforceName", "type": "string"},
-            {"name": "WorkforceArn", "shape": "WorkforceArn", "type": "string"},
-            {"name": "LastUpdatedDate", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "SourceIpConfig", "shape": "SourceIpConfig", "type": "structure"},
-            {"name": "SubDomain", "shape": "String", "type": "string"},
-            {"name": "CognitoConfig", "shape": "CognitoConfig", "type": "structure"},
-            {
-                "name": "OidcConfig",
-                "shape": "OidcConfigForResponse",
-                "type": "structure",
-            },
-            {"name": "CreateDate", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "WorkforceVpcConfig",
-                "shape": "WorkforceVpcConfigResponse",
-                "type": "structure",
-            },
-            {"name": "Status", "shape": "WorkforceStatus", "type": "string"},
-            {
-                "name": "FailureReason",
-                "shape": "WorkforceFailureReason",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "WorkforceSecurityGroupIds": {
-        "member_shape": "WorkforceSecurityGroupId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "WorkforceSubnets": {
-        "member_shape": "WorkforceSubnetId",
-        "member_type": "string",
-        "type": "list",
-    },
-    "WorkforceVpcConfigRequest": {
-        "members": [
-            {"name": "VpcId", "shape": "WorkforceVpcId", "type": "string"},
-            {
-                "name": "SecurityGroupIds",
-                "shape": "WorkforceSecurityGroupIds",
-                "type": "list",
-            },
-            {"name": "Subnets", "shape": "WorkforceSubnets", "type": "list"},
-        ],
-        "type": "structure",
-    },
-    "WorkforceVpcConfigResponse": {
-        "members": [
-            {"name": "VpcId", "shape": "WorkforceVpcId", "type": "string"},
-            {
-                "name": "SecurityGroupIds",
-                "shape": "WorkforceSecurityGroupIds",
-                "type": "list",
-            },
-            {"name": "Subnets", "shape": "WorkforceSubnets", "type": "list"},
-            {
-                "name": "VpcEndpointId",
-                "shape": "WorkforceVpcEndpointId",
-                "type": "string",
-            },
-        ],
-        "type": "structure",
-    },
-    "Workforces": {
-        "member_shape": "Workforce",
-        "member_type": "structure",
-        "type": "list",
-    },
-    "WorkspaceSettings": {
-        "members": [
-            {"name": "S3ArtifactPath", "shape": "S3Uri", "type": "string"},
-            {"name": "S3KmsKeyId", "shape": "KmsKeyId", "type": "string"},
-        ],
-        "type": "structure",
-    },
-    "Workteam": {
-        "members": [
-            {"name": "WorkteamName", "shape": "WorkteamName", "type": "string"},
-            {"name": "MemberDefinitions", "shape": "MemberDefinitions", "type": "list"},
-            {"name": "WorkteamArn", "shape": "WorkteamArn", "type": "string"},
-            {"name": "WorkforceArn", "shape": "WorkforceArn", "type": "string"},
-            {"name": "ProductListingIds", "shape": "ProductListings", "type": "list"},
-            {"name": "Description", "shape": "String200", "type": "string"},
-            {"name": "SubDomain", "shape": "String", "type": "string"},
-            {"name": "CreateDate", "shape": "Timestamp", "type": "timestamp"},
-            {"name": "LastUpdatedDate", "shape": "Timestamp", "type": "timestamp"},
-            {
-                "name": "NotificationConfiguration",
-                "shape": "NotificationConfiguration",
-                "type": "structure",
-            },
-        ],
-        "type": "structure",
-    },
-    "Workteams": {
-        "member_shape": "Workteam",
-        "member_type": "structure",
-        "type": "list",
-    },
+"""Generated compact shape DAG, see CompactShapeDag."""
+
+from src.code_injection.compact_shape_dag import CompactShapeDag
+
+# fmt: off
+_STRINGS = (
+    'ActionSource',
+    'ActionSummaries',
+    'ActionSummary',
+    'AddAssociationRequest',
+    'AddAssociationResponse',
+    'AddTagsInput',
+    'AddTagsOutput',
+    'AdditionalCodeRepositoryNamesOrUrls',
+    'AdditionalInferenceSpecificationDefinition',
+    'AdditionalInferenceSpecifications',
+    'AdditionalS3DataSource',
+    'AgentVersion',
+    'AgentVersions',
+    'AggregationTransformations',
+    'Alarm',
+    'AlarmList',
+    'AlgorithmSpecification',
+    'AlgorithmStatusDetails',
+    'AlgorithmStatusItem',
+    'AlgorithmStatusItemList',
+    'AlgorithmSummary',
+    'AlgorithmSummaryList',
+    'AlgorithmValidationProfile',
+    'AlgorithmValidationProfiles',
+    'AlgorithmValidationSpecification',
+    'AnnotationConsolidationConfig',
+    'AppDetails',
+    'AppImageConfigDetails',
+    'AppImageConfigList',
+    'AppList',
+    'AppSpecification',
+    'ArtifactProperties',
+    'ArtifactSource',
+    'ArtifactSourceType',
+    'ArtifactSourceTypes',
+    'ArtifactSummaries',
+    'ArtifactSummary',
+    'AssociateTrialComponentRequest',
+    'AssociateTrialComponentResponse',
+    'AssociationSummaries',
+    'AssociationSummary',
+    'AsyncInferenceClientConfig',
+    'AsyncInferenceConfig',
+    'AsyncInferenceNotificationConfig',
+    'AsyncInferenceOutputConfig',
+    'AsyncNotificationTopicTypeList',
+    'AthenaDatasetDefinition',
+    'AttributeNames',
+    'AutoMLAlgorithmConfig',
+    'AutoMLAlgorithms',
+    'AutoMLAlgorithmsConfig',
+    'AutoMLCandidate',
+    'AutoMLCandidateGenerationConfig',
+    'AutoMLCandidateStep',
+    'AutoMLCandidates',
+    'AutoMLChannel',
+    'AutoMLContainerDefinition',
+    'AutoMLContainerDefinitions',
+    'AutoMLDataSource',
+    'AutoMLDataSplitConfig',
+    'AutoMLInferenceContainerDefinitions',
+    'AutoMLInputDataConfig',
+    'AutoMLJobArtifacts',
+    'AutoMLJobChannel',
+    'AutoMLJobCompletionCriteria',
+    'AutoMLJobConfig',
+    'AutoMLJobInputDataConfig',
+    'AutoMLJobObjective',
+    'AutoMLJobStepMetadata',
+    'AutoMLJobSummaries',
+    'AutoMLJobSummary',
+    'AutoMLOutputDataConfig',
+    'AutoMLPartialFailureReason',
+    'AutoMLPartialFailureReasons',
+    'AutoMLProblemTypeConfig',
+    'AutoMLProblemTypeResolvedAttributes',
+    'AutoMLResolvedAttributes',
+    'AutoMLS3DataSource',
+    'AutoMLSecurityConfig',
+    'AutoParameter',
+    'AutoParameters',
+    'AutoRollbackConfig',
+    'Autotune',
+    'BatchDataCaptureConfig',
+    'BatchDescribeModelPackageError',
+    'BatchDescribeModelPackageErrorMap',
+    'BatchDescribeModelPackageInput',
+    'BatchDescribeModelPackageOutput',
+    'BatchDescribeModelPackageSummary',
+    'BatchTransformInput',
+    'BestObjectiveNotImproving',
+    'Bias',
+    'BlueGreenUpdatePolicy',
+    'CacheHitResult',
+    'CallbackStepMetadata',
+    'CandidateArtifactLocations',
+    'CandidateGenerationConfig',
+    'CandidateProperties',
+    'CandidateSteps',
+    'CanvasAppSettings',
+    'CapacitySize',
+    'CaptureContentTypeHeader',
+    'CaptureOption',
+    'CaptureOptionList',
+    'CategoricalParameter',
+    'CategoricalParameterRange',
+    'CategoricalParameterRangeSpecification',
+    'CategoricalParameterRangeValues',
+    'CategoricalParameterRanges',
+    'CategoricalParameters',
+    'Channel',
+    'ChannelSpecification',
+    'ChannelSpecifications',
+    'CheckpointConfig',
+    'Cidrs',
+    'ClarifyCheckStepMetadata',
+    'ClarifyExplainerConfig',
+    'ClarifyFeatureHeaders',
+    'ClarifyFeatureTypes',
+    'ClarifyInferenceConfig',
+    'ClarifyLabelHeaders',
+    'ClarifyShapBaselineConfig',
+    'ClarifyShapConfig',
+    'ClarifyTextConfig',
+    'ClusterInstanceGroupDetails',
+    'ClusterInstanceGroupDetailsList',
+    'ClusterInstanceGroupSpecification',
+    'ClusterInstanceGroupSpecifications',
+    'ClusterInstanceStatusDetails',
+    'ClusterLifeCycleConfig',
+    'ClusterNodeDetails',
+    'ClusterNodeSummaries',
+    'ClusterNodeSummary',
+    'ClusterSummaries',
+    'ClusterSummary',
+    'CodeEditorAppSettings',
+    'CodeRepositories',
+    'CodeRepository',
+    'CodeRepositorySummary',
+    'CodeRepositorySummaryList',
+    'CognitoConfig',
+    'CognitoMemberDefinition',
+    'CollectionConfig',
+    'CollectionConfiguration',
+    'CollectionConfigurations',
+    'CollectionParameters',
+    'CompilationJobSummaries',
+    'CompilationJobSummary',
+    'CompressionTypes',
+    'ConditionStepMetadata',
+    'ConflictException',
+    'ContainerArguments',
+    'ContainerConfig',
+    'ContainerDefinition',
+    'ContainerDefinitionList',
+    'ContainerEntrypoint',
+    'ContentClassifiers',
+    'ContentTypes',
+    'ContextSource',
+    'ContextSummaries',
+    'ContextSummary',
+    'ContinuousParameterRange',
+    'ContinuousParameterRangeSpecification',
+    'ContinuousParameterRanges',
+    'ConvergenceDetected',
+    'CreateActionRequest',
+    'CreateActionResponse',
+    'CreateAlgorithmInput',
+    'CreateAlgorithmOutput',
+    'CreateAppImageConfigRequest',
+    'CreateAppImageConfigResponse',
+    'CreateAppRequest',
+    'CreateAppResponse',
+    'CreateArtifactRequest',
+    'CreateArtifactResponse',
+    'CreateAutoMLJobRequest',
+    'CreateAutoMLJobResponse',
+    'CreateAutoMLJobV2Request',
+    'CreateAutoMLJobV2Response',
+    'CreateClusterRequest',
+    'CreateClusterResponse',
+    'CreateCodeRepositoryInput',
+    'CreateCodeRepositoryOutput',
+    'CreateCompilationJobRequest',
+    'CreateCompilationJobResponse',
+    'CreateContextRequest',
+    'CreateContextResponse',
+    'CreateDataQualityJobDefinitionRequest',
+    'CreateDataQualityJobDefinitionResponse',
+    'CreateDeviceFleetRequest',
+    'CreateDomainRequest',
+    'CreateDomainResponse',
+    'CreateEdgeDeploymentPlanRequest',
+    'CreateEdgeDeploymentPlanResponse',
+    'CreateEdgeDeploymentStageRequest',
+    'CreateEdgePackagingJobRequest',
+    'CreateEndpointConfigInput',
+    'CreateEndpointConfigOutput',
+    'CreateEndpointInput',
+    'CreateEndpointOutput',
+    'CreateExperimentRequest',
+    'CreateExperimentResponse',
+    'CreateFeatureGroupRequest',
+    'CreateFeatureGroupResponse',
+    'CreateFlowDefinitionRequest',
+    'CreateFlowDefinitionResponse',
+    'CreateHubRequest',
+    'CreateHubResponse',
+    'CreateHumanTaskUiRequest',
+    'CreateHumanTaskUiResponse',
+    'CreateHyperParameterTuningJobRequest',
+    'CreateHyperParameterTuningJobResponse',
+    'CreateImageRequest',
+    'CreateImageResponse',
+    'CreateImageVersionRequest',
+    'CreateImageVersionResponse',
+    'CreateInferenceComponentInput',
+    'CreateInferenceComponentOutput',
+    'CreateInferenceExperimentRequest',
+    'CreateInferenceExperimentResponse',
+    'CreateInferenceRecommendationsJobRequest',
+    'CreateInferenceRecommendationsJobResponse',
+    'CreateLabelingJobRequest',
+    'CreateLabelingJobResponse',
+    'CreateModelBiasJobDefinitionRequest',
+    'CreateModelBiasJobDefinitionResponse',
+    'CreateModelCardExportJobRequest',
+    'CreateModelCardExportJobResponse',
+    'CreateModelCardRequest',
+    'CreateModelCardResponse',
+    'CreateModelExplainabilityJobDefinitionRequest',
+    'CreateModelExplainabilityJobDefinitionResponse',
+    'CreateModelInput',
+    'CreateModelOutput',
+    'CreateModelPackageGroupInput',
+    'CreateModelPackageGroupOutput',
+    'CreateModelPackageInput',
+    'CreateModelPackageOutput',
+    'CreateModelQualityJobDefinitionRequest',
+    'CreateModelQualityJobDefinitionResponse',
+    'CreateMonitoringScheduleRequest',
+    'CreateMonitoringScheduleResponse',
+    'CreateNotebookInstanceInput',
+    'CreateNotebookInstanceLifecycleConfigInput',
+    'CreateNotebookInstanceLifecycleConfigOutput',
+    'CreateNotebookInstanceOutput',
+    'CreatePipelineRequest',
+    'CreatePipelineResponse',
+    'CreatePresignedDomainUrlRequest',
+    'CreatePresignedDomainUrlResponse',
+    'CreatePresignedNotebookInstanceUrlInput',
+    'CreatePresignedNotebookInstanceUrlOutput',
+    'CreateProcessingJobRequest',
+    'CreateProcessingJobResponse',
+    'CreateProjectInput',
+    'CreateProjectOutput',
+    'CreateSpaceRequest',
+    'CreateSpaceResponse',
+    'CreateStudioLifecycleConfigRequest',
+    'CreateStudioLifecycleConfigResponse',
+    'CreateTrainingJobRequest',
+    'CreateTrainingJobResponse',
+    'CreateTransformJobRequest',
+    'CreateTransformJobResponse',
+    'CreateTrialComponentRequest',
+    'CreateTrialComponentResponse',
+    'CreateTrialRequest',
+    'CreateTrialResponse',
+    'CreateUserProfileRequest',
+    'CreateUserProfileResponse',
+    'CreateWorkforceRequest',
+    'CreateWorkforceResponse',
+    'CreateWorkteamRequest',
+    'CreateWorkteamResponse',
+    'CsvContentTypes',
+    'CustomFileSystem',
+    'CustomFileSystemConfig',
+    'CustomFileSystemConfigs',
+    'CustomFileSystems',
+    'CustomImage',
+    'CustomImageContainerArguments',
+    'CustomImageContainerEntrypoint',
+    'CustomImageContainerEnvironmentVariables',
+    'CustomImages',
+    'CustomPosixUserConfig',
+    'CustomerMetadataKeyList',
+    'CustomerMetadataMap',
+    'CustomizedMetricSpecification',
+    'DataCaptureConfig',
+    'DataCaptureConfigSummary',
+    'DataCatalogConfig',
+    'DataProcessing',
+    'DataQualityAppSpecification',
+    'DataQualityBaselineConfig',
+    'DataQualityJobInput',
+    'DataSource',
+    'DatasetDefinition',
+    'DebugHookConfig',
+    'DebugRuleConfiguration',
+    'DebugRuleConfigurations',
+    'DebugRuleEvaluationStatus',
+    'DebugRuleEvaluationStatuses',
+    'DefaultEbsStorageSettings',
+    'DefaultSpaceSettings',
+    'DefaultSpaceStorageSettings',
+    'DeleteActionRequest',
+    'DeleteActionResponse',
+    'DeleteAlgorithmInput',
+    'DeleteAppImageConfigRequest',
+    'DeleteAppRequest',
+    'DeleteArtifactRequest',
+    'DeleteArtifactResponse',
+    'DeleteAssociationRequest',
+    'DeleteAssociationResponse',
+    'DeleteClusterRequest',
+    'DeleteClusterResponse',
+    'DeleteCodeRepositoryInput',
+    'DeleteCompilationJobRequest',
+    'DeleteContextRequest',
+    'DeleteContextResponse',
+    'DeleteDataQualityJobDefinitionRequest',
+    'DeleteDeviceFleetRequest',
+    'DeleteDomainRequest',
+    'DeleteEdgeDeploymentPlanRequest',
+    'DeleteEdgeDeploymentStageRequest',
+    'DeleteEndpointConfigInput',
+    'DeleteEndpointInput',
+    'DeleteExperimentRequest',
+    'DeleteExperimentResponse',
+    'DeleteFeatureGroupRequest',
+    'DeleteFlowDefinitionRequest',
+    'DeleteFlowDefinitionResponse',
+    'DeleteHubContentRequest',
+    'DeleteHubRequest',
+    'DeleteHumanTaskUiRequest',
+    'DeleteHumanTaskUiResponse',
+    'DeleteHyperParameterTuningJobRequest',
+    'DeleteImageRequest',
+    'DeleteImageResponse',
+    'DeleteImageVersionRequest',
+    'DeleteImageVersionResponse',
+    'DeleteInferenceComponentInput',
+    'DeleteInferenceExperimentRequest',
+    'DeleteInferenceExperimentResponse',
+    'DeleteModelBiasJobDefinitionRequest',
+    'DeleteModelCardRequest',
+    'DeleteModelExplainabilityJobDefinitionRequest',
+    'DeleteModelInput',
+    'DeleteModelPackageGroupInput',
+    'DeleteModelPackageGroupPolicyInput',
+    'DeleteModelPackageInput',
+    'DeleteModelQualityJobDefinitionRequest',
+    'DeleteMonitoringScheduleRequest',
+    'DeleteNotebookInstanceInput',
+    'DeleteNotebookInstanceLifecycleConfigInput',
+    'DeletePipelineRequest',
+    'DeletePipelineResponse',
+    'DeleteProjectInput',
+    'DeleteSpaceRequest',
+    'DeleteStudioLifecycleConfigRequest',
+    'DeleteTagsInput',
+    'DeleteTagsOutput',
+    'DeleteTrialComponentRequest',
+    'DeleteTrialComponentResponse',
+    'DeleteTrialRequest',
+    'DeleteTrialResponse',
+    'DeleteUserProfileRequest',
+    'DeleteWorkforceRequest',
+    'DeleteWorkforceResponse',
+    'DeleteWorkteamRequest',
+    'DeleteWorkteamResponse',
+    'DeployedImage',
+    'DeployedImages',
+    'DeploymentConfig',
+    'DeploymentRecommendation',
+    'DeploymentStage',
+    'DeploymentStageStatusSummaries',
+    'DeploymentStageStatusSummary',
+    'DeploymentStages',
+    'DeregisterDevicesRequest',
+    'DerivedInformation',
+    'DescribeActionRequest',
+    'DescribeActionResponse',
+    'DescribeAlgorithmInput',
+    'DescribeAlgorithmOutput',
+    'DescribeAppImageConfigRequest',
+    'DescribeAppImageConfigResponse',
+    'DescribeAppRequest',
+    'DescribeAppResponse',
+    'DescribeArtifactRequest',
+    'DescribeArtifactResponse',
+    'DescribeAutoMLJobRequest',
+    'DescribeAutoMLJobResponse',
+    'DescribeAutoMLJobV2Request',
+    'DescribeAutoMLJobV2Response',
+    'DescribeClusterNodeRequest',
+    'DescribeClusterNodeResponse',
+    'DescribeClusterRequest',
+    'DescribeClusterResponse',
+    'DescribeCodeRepositoryInput',
+    'DescribeCodeRepositoryOutput',
+    'DescribeCompilationJobRequest',
+    'DescribeCompilationJobResponse',
+    'DescribeContextRequest',
+    'DescribeContextResponse',
+    'DescribeDataQualityJobDefinitionRequest',
+    'DescribeDataQualityJobDefinitionResponse',
+    'DescribeDeviceFleetRequest',
+    'DescribeDeviceFleetResponse',
+    'DescribeDeviceRequest',
+    'DescribeDeviceResponse',
+    'DescribeDomainRequest',
+    'DescribeDomainResponse',
+    'DescribeEdgeDeploymentPlanRequest',
+    'DescribeEdgeDeploymentPlanResponse',
+    'DescribeEdgePackagingJobRequest',
+    'DescribeEdgePackagingJobResponse',
+    'DescribeEndpointConfigInput',
+    'DescribeEndpointConfigOutput',
+    'DescribeEndpointInput',
+    'DescribeEndpointOutput',
+    'DescribeExperimentRequest',
+    'DescribeExperimentResponse',
+    'DescribeFeatureGroupRequest',
+    'DescribeFeatureGroupResponse',
+    'DescribeFeatureMetadataRequest',
+    'DescribeFeatureMetadataResponse',
+    'DescribeFlowDefinitionRequest',
+    'DescribeFlowDefinitionResponse',
+    'DescribeHubContentRequest',
+    'DescribeHubContentResponse',
+    'DescribeHubRequest',
+    'DescribeHubResponse',
+    'DescribeHumanTaskUiRequest',
+    'DescribeHumanTaskUiResponse',
+    'DescribeHyperParameterTuningJobRequest',
+    'DescribeHyperParameterTuningJobResponse',
+    'DescribeImageRequest',
+    'DescribeImageResponse',
+    'DescribeImageVersionRequest',
+    'DescribeImageVersionResponse',
+    'DescribeInferenceComponentInput',
+    'DescribeInferenceComponentOutput',
+    'DescribeInferenceExperimentRequest',
+    'DescribeInferenceExperimentResponse',
+    'DescribeInferenceRecommendationsJobRequest',
+    'DescribeInferenceRecommendationsJobResponse',
+    'DescribeLabelingJobRequest',
+    'DescribeLabelingJobResponse',
+    'DescribeLineageGroupRequest',
+    'DescribeLineageGroupResponse',
+    'DescribeModelBiasJobDefinitionRequest',
+    'DescribeModelBiasJobDefinitionResponse',
+    'DescribeModelCardExportJobRequest',
+    'DescribeModelCardExportJobResponse',
+    'DescribeModelCardRequest',
+    'DescribeModelCardResponse',
+    'DescribeModelExplainabilityJobDefinitionRequest',
+    'DescribeModelExplainabilityJobDefinitionResponse',
+    'DescribeModelInput',
+    'DescribeModelOutput',
+    'DescribeModelPackageGroupInput',
+    'DescribeModelPackageGroupOutput',
+    'DescribeModelPackageInput',
+    'DescribeModelPackageOutput',
+    'DescribeModelQualityJobDefinitionRequest',
+    'DescribeModelQualityJobDefinitionResponse',
+    'DescribeMonitoringScheduleRequest',
+    'DescribeMonitoringScheduleResponse',
+    'DescribeNotebookInstanceInput',
+    'DescribeNotebookInstanceLifecycleConfigInput',
+    'DescribeNotebookInstanceLifecycleConfigOutput',
+    'DescribeNotebookInstanceOutput',
+    'DescribePipelineDefinitionForExecutionRequest',
+    'DescribePipelineDefinitionForExecutionResponse',
+    'DescribePipelineExecutionRequest',
+    'DescribePipelineExecutionResponse',
+    'DescribePipelineRequest',
+    'DescribePipelineResponse',
+    'DescribeProcessingJobRequest',
+    'DescribeProcessingJobResponse',
+    'DescribeProjectInput',
+    'DescribeProjectOutput',
+    'DescribeSpaceRequest',
+    'DescribeSpaceResponse',
+    'DescribeStudioLifecycleConfigRequest',
+    'DescribeStudioLifecycleConfigResponse',
+    'DescribeSubscribedWorkteamRequest',
+    'DescribeSubscribedWorkteamResponse',
+    'DescribeTrainingJobRequest',
+    'DescribeTrainingJobResponse',
+    'DescribeTransformJobRequest',
+    'DescribeTransformJobResponse',
+    'DescribeTrialComponentRequest',
+    'DescribeTrialComponentResponse',
+    'DescribeTrialRequest',
+    'DescribeTrialResponse',
+    'DescribeUserProfileRequest',
+    'DescribeUserProfileResponse',
+    'DescribeWorkforceRequest',
+    'DescribeWorkforceResponse',
+    'DescribeWorkteamRequest',
+    'DescribeWorkteamResponse',
+    'DesiredWeightAndCapacity',
+    'DesiredWeightAndCapacityList',
+    'Device',
+    'DeviceDeploymentSummaries',
+    'DeviceDeploymentSummary',
+    'DeviceFleetSummaries',
+    'DeviceFleetSummary',
+    'DeviceNames',
+    'DeviceSelectionConfig',
+    'DeviceStats',
+    'DeviceSummaries',
+    'DeviceSummary',
+    'Devices',
+    'DirectDeploySettings',
+    'DisableSagemakerServicecatalogPortfolioInput',
+    'DisableSagemakerServicecatalogPortfolioOutput',
+    'DisassociateTrialComponentRequest',
+    'DisassociateTrialComponentResponse',
+    'DockerSettings',
+    'DomainDetails',
+    'DomainList',
+    'DomainSecurityGroupIds',
+    'DomainSettings',
+    'DomainSettingsForUpdate',
+    'DriftCheckBaselines',
+    'DriftCheckBias',
+    'DriftCheckExplainability',
+    'DriftCheckModelDataQuality',
+    'DriftCheckModelQuality',
+    'DynamicScalingConfiguration',
+    'EFSFileSystem',
+    'EFSFileSystemConfig',
+    'EMRStepMetadata',
+    'EbsStorageSettings',
+    'Edge',
+    'EdgeDeploymentConfig',
+    'EdgeDeploymentModelConfig',
+    'EdgeDeploymentModelConfigs',
+    'EdgeDeploymentPlanSummaries',
+    'EdgeDeploymentPlanSummary',
+    'EdgeDeploymentStatus',
+    'EdgeModel',
+    'EdgeModelStat',
+    'EdgeModelStats',
+    'EdgeModelSummaries',
+    'EdgeModelSummary',
+    'EdgeModels',
+    'EdgeOutputConfig',
+    'EdgePackagingJobSummaries',
+    'EdgePackagingJobSummary',
+    'EdgePresetDeploymentOutput',
+    'Edges',
+    'EnableSagemakerServicecatalogPortfolioInput',
+    'EnableSagemakerServicecatalogPortfolioOutput',
+    'Endpoint',
+    'EndpointConfigSummary',
+    'EndpointConfigSummaryList',
+    'EndpointInfo',
+    'EndpointInput',
+    'EndpointInputConfiguration',
+    'EndpointInputConfigurations',
+    'EndpointMetadata',
+    'EndpointOutputConfiguration',
+    'EndpointPerformance',
+    'EndpointPerformances',
+    'EndpointSummary',
+    'EndpointSummaryList',
+    'Endpoints',
+    'EnvironmentMap',
+    'EnvironmentParameter',
+    'EnvironmentParameterRanges',
+    'EnvironmentParameters',
+    'Experiment',
+    'ExperimentConfig',
+    'ExperimentSource',
+    'ExperimentSummaries',
+    'ExperimentSummary',
+    'Explainability',
+    'ExplainerConfig',
+    'FailStepMetadata',
+    'FeatureAdditions',
+    'FeatureDefinition',
+    'FeatureDefinitions',
+    'FeatureGroup',
+    'FeatureGroupSummaries',
+    'FeatureGroupSummary',
+    'FeatureMetadata',
+    'FeatureParameter',
+    'FeatureParameterAdditions',
+    'FeatureParameterRemovals',
+    'FeatureParameters',
+    'FileSource',
+    'FileSystemConfig',
+    'FileSystemDataSource',
+    'FillingTransformationMap',
+    'FillingTransformations',
+    'Filter',
+    'FilterList',
+    'FinalAutoMLJobObjectiveMetric',
+    'FinalHyperParameterTuningJobObjectiveMetric',
+    'FinalMetricDataList',
+    'FlowDefinitionOutputConfig',
+    'FlowDefinitionSummaries',
+    'FlowDefinitionSummary',
+    'FlowDefinitionTaskKeywords',
+    'ForecastQuantiles',
+    'GenerativeAiSettings',
+    'GetDeviceFleetReportRequest',
+    'GetDeviceFleetReportResponse',
+    'GetLineageGroupPolicyRequest',
+    'GetLineageGroupPolicyResponse',
+    'GetModelPackageGroupPolicyInput',
+    'GetModelPackageGroupPolicyOutput',
+    'GetSagemakerServicecatalogPortfolioStatusInput',
+    'GetSagemakerServicecatalogPortfolioStatusOutput',
+    'GetScalingConfigurationRecommendationRequest',
+    'GetScalingConfigurationRecommendationResponse',
+    'GetSearchSuggestionsRequest',
+    'GetSearchSuggestionsResponse',
+    'GitConfig',
+    'GitConfigForUpdate',
+    'GroupingAttributeNames',
+    'Groups',
+    'HolidayConfig',
+    'HolidayConfigAttributes',
+    'HookParameters',
+    'HubContentDependency',
+    'HubContentDependencyList',
+    'HubContentInfo',
+    'HubContentInfoList',
+    'HubContentSearchKeywordList',
+    'HubInfo',
+    'HubInfoList',
+    'HubS3StorageConfig',
+    'HubSearchKeywordList',
+    'HumanLoopActivationConditionsConfig',
+    'HumanLoopActivationConfig',
+    'HumanLoopConfig',
+    'HumanLoopRequestSource',
+    'HumanTaskConfig',
+    'HumanTaskUiSummaries',
+    'HumanTaskUiSummary',
+    'HyperParameterAlgorithmSpecification',
+    'HyperParameterSpecification',
+    'HyperParameterSpecifications',
+    'HyperParameterTrainingJobDefinition',
+    'HyperParameterTrainingJobDefinitions',
+    'HyperParameterTrainingJobEnvironmentMap',
+    'HyperParameterTrainingJobSummaries',
+    'HyperParameterTrainingJobSummary',
+    'HyperParameterTuningInstanceConfig',
+    'HyperParameterTuningInstanceConfigs',
+    'HyperParameterTuningJobCompletionDetails',
+    'HyperParameterTuningJobConfig',
+    'HyperParameterTuningJobConsumedResources',
+    'HyperParameterTuningJobObjective',
+    'HyperParameterTuningJobObjectives',
+    'HyperParameterTuningJobSearchEntity',
+    'HyperParameterTuningJobStrategyConfig',
+    'HyperParameterTuningJobSummaries',
+    'HyperParameterTuningJobSummary',
+    'HyperParameterTuningJobWarmStartConfig',
+    'HyperParameterTuningResourceConfig',
+    'HyperParameters',
+    'HyperbandStrategyConfig',
+    'IamIdentity',
+    'IdentityProviderOAuthSetting',
+    'IdentityProviderOAuthSettings',
+    'Image',
+    'ImageClassificationJobConfig',
+    'ImageConfig',
+    'ImageDeletePropertyList',
+    'ImageVersion',
+    'ImageVersions',
+    'Images',
+    'ImportHubContentRequest',
+    'ImportHubContentResponse',
+    'InferenceComponentComputeResourceRequirements',
+    'InferenceComponentContainerSpecification',
+    'InferenceComponentContainerSpecificationSummary',
+    'InferenceComponentRuntimeConfig',
+    'InferenceComponentRuntimeConfigSummary',
+    'InferenceComponentSpecification',
+    'InferenceComponentSpecificationSummary',
+    'InferenceComponentStartupParameters',
+    'InferenceComponentSummary',
+    'InferenceComponentSummaryList',
+    'InferenceExecutionConfig',
+    'InferenceExperimentDataStorageConfig',
+    'InferenceExperimentList',
+    'InferenceExperimentSchedule',
+    'InferenceExperimentSummary',
+    'InferenceMetrics',
+    'InferenceRecommendation',
+    'InferenceRecommendations',
+    'InferenceRecommendationsJob',
+    'InferenceRecommendationsJobStep',
+    'InferenceRecommendationsJobSteps',
+    'InferenceRecommendationsJobs',
+    'InferenceSpecification',
+    'InfraCheckConfig',
+    'InputConfig',
+    'InputDataConfig',
+    'InputModes',
+    'InstanceGroup',
+    'InstanceGroupNames',
+    'InstanceGroups',
+    'InstanceMetadataServiceConfiguration',
+    'IntegerParameterRange',
+    'IntegerParameterRangeSpecification',
+    'IntegerParameterRanges',
+    'InternalDependencyException',
+    'InternalFailure',
+    'InternalStreamFailure',
+    'InvokeEndpointAsyncInput',
+    'InvokeEndpointAsyncOutput',
+    'InvokeEndpointInput',
+    'InvokeEndpointOutput',
+    'InvokeEndpointWithResponseStreamInput',
+    'InvokeEndpointWithResponseStreamOutput',
+    'JsonContentTypes',
+    'JupyterLabAppImageConfig',
+    'JupyterLabAppSettings',
+    'JupyterServerAppSettings',
+    'KendraSettings',
+    'KernelGatewayAppSettings',
+    'KernelGatewayImageConfig',
+    'KernelSpec',
+    'KernelSpecs',
+    'LabelCounters',
+    'LabelCountersForWorkteam',
+    'LabelingJobAlgorithmsConfig',
+    'LabelingJobDataAttributes',
+    'LabelingJobDataSource',
+    'LabelingJobForWorkteamSummary',
+    'LabelingJobForWorkteamSummaryList',
+    'LabelingJobInputConfig',
+    'LabelingJobOutput',
+    'LabelingJobOutputConfig',
+    'LabelingJobResourceConfig',
+    'LabelingJobS3DataSource',
+    'LabelingJobSnsDataSource',
+    'LabelingJobStoppingConditions',
+    'LabelingJobSummary',
+    'LabelingJobSummaryList',
+    'LambdaStepMetadata',
+    'LastUpdateStatus',
+    'LifecycleConfigArns',
+    'LineageEntityParameters',
+    'LineageGroupSummaries',
+    'LineageGroupSummary',
+    'ListActionsRequest',
+    'ListActionsResponse',
+    'ListAlgorithmsInput',
+    'ListAlgorithmsOutput',
+    'ListAliasesRequest',
+    'ListAliasesResponse',
+    'ListAppImageConfigsRequest',
+    'ListAppImageConfigsResponse',
+    'ListAppsRequest',
+    'ListAppsResponse',
+    'ListArtifactsRequest',
+    'ListArtifactsResponse',
+    'ListAssociationsRequest',
+    'ListAssociationsResponse',
+    'ListAutoMLJobsRequest',
+    'ListAutoMLJobsResponse',
+    'ListCandidatesForAutoMLJobRequest',
+    'ListCandidatesForAutoMLJobResponse',
+    'ListClusterNodesRequest',
+    'ListClusterNodesResponse',
+    'ListClustersRequest',
+    'ListClustersResponse',
+    'ListCodeRepositoriesInput',
+    'ListCodeRepositoriesOutput',
+    'ListCompilationJobsRequest',
+    'ListCompilationJobsResponse',
+    'ListContextsRequest',
+    'ListContextsResponse',
+    'ListDataQualityJobDefinitionsRequest',
+    'ListDataQualityJobDefinitionsResponse',
+    'ListDeviceFleetsRequest',
+    'ListDeviceFleetsResponse',
+    'ListDevicesRequest',
+    'ListDevicesResponse',
+    'ListDomainsRequest',
+    'ListDomainsResponse',
+    'ListEdgeDeploymentPlansRequest',
+    'ListEdgeDeploymentPlansResponse',
+    'ListEdgePackagingJobsRequest',
+    'ListEdgePackagingJobsResponse',
+    'ListEndpointConfigsInput',
+    'ListEndpointConfigsOutput',
+    'ListEndpointsInput',
+    'ListEndpointsOutput',
+    'ListExperimentsRequest',
+    'ListExperimentsResponse',
+    'ListFeatureGroupsRequest',
+    'ListFeatureGroupsResponse',
+    'ListFlowDefinitionsRequest',
+    'ListFlowDefinitionsResponse',
+    'ListHubContentVersionsRequest',
+    'ListHubContentVersionsResponse',
+    'ListHubContentsRequest',
+    'ListHubContentsResponse',
+    'ListHubsRequest',
+    'ListHubsResponse',
+    'ListHumanTaskUisRequest',
+    'ListHumanTaskUisResponse',
+    'ListHyperParameterTuningJobsRequest',
+    'ListHyperParameterTuningJobsResponse',
+    'ListImageVersionsRequest',
+    'ListImageVersionsResponse',
+    'ListImagesRequest',
+    'ListImagesResponse',
+    'ListInferenceComponentsInput',
+    'ListInferenceComponentsOutput',
+    'ListInferenceExperimentsRequest',
+    'ListInferenceExperimentsResponse',
+    'ListInferenceRecommendationsJobStepsRequest',
+    'ListInferenceRecommendationsJobStepsResponse',
+    'ListInferenceRecommendationsJobsRequest',
+    'ListInferenceRecommendationsJobsResponse',
+    'ListLabelingJobsForWorkteamRequest',
+    'ListLabelingJobsForWorkteamResponse',
+    'ListLabelingJobsRequest',
+    'ListLabelingJobsResponse',
+    'ListLineageEntityParameterKey',
+    'ListLineageGroupsRequest',
+    'ListLineageGroupsResponse',
+    'ListModelBiasJobDefinitionsRequest',
+    'ListModelBiasJobDefinitionsResponse',
+    'ListModelCardExportJobsRequest',
+    'ListModelCardExportJobsResponse',
+    'ListModelCardVersionsRequest',
+    'ListModelCardVersionsResponse',
+    'ListModelCardsRequest',
+    'ListModelCardsResponse',
+    'ListModelExplainabilityJobDefinitionsRequest',
+    'ListModelExplainabilityJobDefinitionsResponse',
+    'ListModelMetadataRequest',
+    'ListModelMetadataResponse',
+    'ListModelPackageGroupsInput',
+    'ListModelPackageGroupsOutput',
+    'ListModelPackagesInput',
+    'ListModelPackagesOutput',
+    'ListModelQualityJobDefinitionsRequest',
+    'ListModelQualityJobDefinitionsResponse',
+    'ListModelsInput',
+    'ListModelsOutput',
+    'ListMonitoringAlertHistoryRequest',
+    'ListMonitoringAlertHistoryResponse',
+    'ListMonitoringAlertsRequest',
+    'ListMonitoringAlertsResponse',
+    'ListMonitoringExecutionsRequest',
+    'ListMonitoringExecutionsResponse',
+    'ListMonitoringSchedulesRequest',
+    'ListMonitoringSchedulesResponse',
+    'ListNotebookInstanceLifecycleConfigsInput',
+    'ListNotebookInstanceLifecycleConfigsOutput',
+    'ListNotebookInstancesInput',
+    'ListNotebookInstancesOutput',
+    'ListPipelineExecutionStepsRequest',
+    'ListPipelineExecutionStepsResponse',
+    'ListPipelineExecutionsRequest',
+    'ListPipelineExecutionsResponse',
+    'ListPipelineParametersForExecutionRequest',
+    'ListPipelineParametersForExecutionResponse',
+    'ListPipelinesRequest',
+    'ListPipelinesResponse',
+    'ListProcessingJobsRequest',
+    'ListProcessingJobsResponse',
+    'ListProjectsInput',
+    'ListProjectsOutput',
+    'ListResourceCatalogsRequest',
+    'ListResourceCatalogsResponse',
+    'ListSpacesRequest',
+    'ListSpacesResponse',
+    'ListStageDevicesRequest',
+    'ListStageDevicesResponse',
+    'ListStudioLifecycleConfigsRequest',
+    'ListStudioLifecycleConfigsResponse',
+    'ListSubscribedWorkteamsRequest',
+    'ListSubscribedWorkteamsResponse',
+    'ListTagsInput',
+    'ListTagsOutput',
+    'ListTrainingJobsForHyperParameterTuningJobRequest',
+    'ListTrainingJobsForHyperParameterTuningJobResponse',
+    'ListTrainingJobsRequest',
+    'ListTrainingJobsResponse',
+    'ListTransformJobsRequest',
+    'ListTransformJobsResponse',
+    'ListTrialComponentKey256',
+    'ListTrialComponentsRequest',
+    'ListTrialComponentsResponse',
+    'ListTrialsRequest',
+    'ListTrialsResponse',
+    'ListUserProfilesRequest',
+    'ListUserProfilesResponse',
+    'ListWorkforcesRequest',
+    'ListWorkforcesResponse',
+    'ListWorkteamsRequest',
+    'ListWorkteamsResponse',
+    'MemberDefinition',
+    'MemberDefinitions',
+    'MetadataProperties',
+    'MetricData',
+    'MetricDataList',
+    'MetricDatum',
+    'MetricDefinition',
+    'MetricDefinitionList',
+    'MetricSpecification',
+    'MetricsSource',
+    'Model',
+    'ModelAccessConfig',
+    'ModelArtifacts',
+    'ModelBiasAppSpecification',
+    'ModelBiasBaselineConfig',
+    'ModelBiasJobInput',
+    'ModelCard',
+    'ModelCardExportArtifacts',
+    'ModelCardExportJobSummary',
+    'ModelCardExportJobSummaryList',
+    'ModelCardExportOutputConfig',
+    'ModelCardSecurityConfig',
+    'ModelCardSummary',
+    'ModelCardSummaryList',
+    'ModelCardVersionSummary',
+    'ModelCardVersionSummaryList',
+    'ModelClientConfig',
+    'ModelConfiguration',
+    'ModelDashboardEndpoint',
+    'ModelDashboardEndpoints',
+    'ModelDashboardIndicatorAction',
+    'ModelDashboardModel',
+    'ModelDashboardModelCard',
+    'ModelDashboardMonitoringSchedule',
+    'ModelDashboardMonitoringSchedules',
+    'ModelDataQuality',
+    'ModelDataSource',
+    'ModelDeployConfig',
+    'ModelDeployResult',
+    'ModelDigests',
+    'ModelError',
+    'ModelExplainabilityAppSpecification',
+    'ModelExplainabilityBaselineConfig',
+    'ModelExplainabilityJobInput',
+    'ModelInfrastructureConfig',
+    'ModelInput',
+    'ModelLatencyThreshold',
+    'ModelLatencyThresholds',
+    'ModelMetadataFilter',
+    'ModelMetadataFilters',
+    'ModelMetadataSearchExpression',
+    'ModelMetadataSummaries',
+    'ModelMetadataSummary',
+    'ModelMetrics',
+    'ModelNotReadyException',
+    'ModelPackage',
+    'ModelPackageArnList',
+    'ModelPackageContainerDefinition',
+    'ModelPackageContainerDefinitionList',
+    'ModelPackageGroup',
+    'ModelPackageGroupSummary',
+    'ModelPackageGroupSummaryList',
+    'ModelPackageStatusDetails',
+    'ModelPackageStatusItem',
+    'ModelPackageStatusItemList',
+    'ModelPackageSummaries',
+    'ModelPackageSummary',
+    'ModelPackageSummaryList',
+    'ModelPackageValidationProfile',
+    'ModelPackageValidationProfiles',
+    'ModelPackageValidationSpecification',
+    'ModelQuality',
+    'ModelQualityAppSpecification',
+    'ModelQualityBaselineConfig',
+    'ModelQualityJobInput',
+    'ModelRegisterSettings',
+    'ModelStepMetadata',
+    'ModelStreamError',
+    'ModelSummary',
+    'ModelSummaryList',
+    'ModelVariantActionMap',
+    'ModelVariantConfig',
+    'ModelVariantConfigList',
+    'ModelVariantConfigSummary',
+    'ModelVariantConfigSummaryList',
+    'MonitoringAlertActions',
+    'MonitoringAlertHistoryList',
+    'MonitoringAlertHistorySummary',
+    'MonitoringAlertSummary',
+    'MonitoringAlertSummaryList',
+    'MonitoringAppSpecification',
+    'MonitoringBaselineConfig',
+    'MonitoringClusterConfig',
+    'MonitoringConstraintsResource',
+    'MonitoringContainerArguments',
+    'MonitoringCsvDatasetFormat',
+    'MonitoringDatasetFormat',
+    'MonitoringEnvironmentMap',
+    'MonitoringExecutionSummary',
+    'MonitoringExecutionSummaryList',
+    'MonitoringGroundTruthS3Input',
+    'MonitoringInput',
+    'MonitoringInputs',
+    'MonitoringJobDefinition',
+    'MonitoringJobDefinitionSummary',
+    'MonitoringJobDefinitionSummaryList',
+    'MonitoringJsonDatasetFormat',
+    'MonitoringNetworkConfig',
+    'MonitoringOutput',
+    'MonitoringOutputConfig',
+    'MonitoringOutputs',
+    'MonitoringParquetDatasetFormat',
+    'MonitoringResources',
+    'MonitoringS3Output',
+    'MonitoringSchedule',
+    'MonitoringScheduleConfig',
+    'MonitoringScheduleList',
+    'MonitoringScheduleSummary',
+    'MonitoringScheduleSummaryList',
+    'MonitoringStatisticsResource',
+    'MonitoringStoppingCondition',
+    'MultiModelConfig',
+    'NeoVpcConfig',
+    'NeoVpcSecurityGroupIds',
+    'NeoVpcSubnets',
+    'NestedFilters',
+    'NestedFiltersList',
+    'NetworkConfig',
+    'NotebookInstanceAcceleratorTypes',
+    'NotebookInstanceLifecycleConfigList',
+    'NotebookInstanceLifecycleConfigSummary',
+    'NotebookInstanceLifecycleConfigSummaryList',
+    'NotebookInstanceLifecycleHook',
+    'NotebookInstanceSummary',
+    'NotebookInstanceSummaryList',
+    'NotificationConfiguration',
+    'ObjectiveStatusCounters',
+    'OfflineStoreConfig',
+    'OfflineStoreStatus',
+    'OidcConfig',
+    'OidcConfigForResponse',
+    'OidcMemberDefinition',
+    'OnlineStoreConfig',
+    'OnlineStoreConfigUpdate',
+    'OnlineStoreSecurityConfig',
+    'OutputConfig',
+    'OutputDataConfig',
+    'OutputParameter',
+    'OutputParameterList',
+    'OwnershipSettings',
+    'OwnershipSettingsSummary',
+    'ParallelismConfiguration',
+    'Parameter',
+    'ParameterList',
+    'ParameterRange',
+    'ParameterRanges',
+    'ParameterValues',
+    'Parent',
+    'ParentHyperParameterTuningJob',
+    'ParentHyperParameterTuningJobs',
+    'Parents',
+    'PayloadPart',
+    'PendingDeploymentSummary',
+    'PendingProductionVariantSummary',
+    'PendingProductionVariantSummaryList',
+    'Phase',
+    'Phases',
+    'Pipeline',
+    'PipelineDefinitionS3Location',
+    'PipelineExecution',
+    'PipelineExecutionStep',
+    'PipelineExecutionStepList',
+    'PipelineExecutionStepMetadata',
+    'PipelineExecutionSummary',
+    'PipelineExecutionSummaryList',
+    'PipelineExperimentConfig',
+    'PipelineSummary',
+    'PipelineSummaryList',
+    'PredefinedMetricSpecification',
+    'ProcessingClusterConfig',
+    'ProcessingEnvironmentMap',
+    'ProcessingFeatureStoreOutput',
+    'ProcessingInput',
+    'ProcessingInputs',
+    'ProcessingJob',
+    'ProcessingJobStepMetadata',
+    'ProcessingJobSummaries',
+    'ProcessingJobSummary',
+    'ProcessingOutput',
+    'ProcessingOutputConfig',
+    'ProcessingOutputs',
+    'ProcessingResources',
+    'ProcessingS3Input',
+    'ProcessingS3Output',
+    'ProcessingStoppingCondition',
+    'ProductListings',
+    'ProductionVariant',
+    'ProductionVariantCoreDumpConfig',
+    'ProductionVariantList',
+    'ProductionVariantManagedInstanceScaling',
+    'ProductionVariantRoutingConfig',
+    'ProductionVariantServerlessConfig',
+    'ProductionVariantServerlessUpdateConfig',
+    'ProductionVariantStatus',
+    'ProductionVariantStatusList',
+    'ProductionVariantSummary',
+    'ProductionVariantSummaryList',
+    'ProfilerConfig',
+    'ProfilerConfigForUpdate',
+    'ProfilerRuleConfiguration',
+    'ProfilerRuleConfigurations',
+    'ProfilerRuleEvaluationStatus',
+    'ProfilerRuleEvaluationStatuses',
+    'ProfilingParameters',
+    'Project',
+    'ProjectSummary',
+    'ProjectSummaryList',
+    'PropertyNameQuery',
+    'PropertyNameSuggestion',
+    'PropertyNameSuggestionList',
+    'ProvisioningParameter',
+    'ProvisioningParameters',
+    'PublicWorkforceTaskPrice',
+    'PutModelPackageGroupPolicyInput',
+    'PutModelPackageGroupPolicyOutput',
+    'QualityCheckStepMetadata',
+    'QueryFilters',
+    'QueryLineageRequest',
+    'QueryLineageResponse',
+    'QueryLineageStartArns',
+    'QueryLineageTypes',
+    'QueryProperties',
+    'QueryTypes',
+    'RSessionAppSettings',
+    'RStudioServerProAppSettings',
+    'RStudioServerProDomainSettings',
+    'RStudioServerProDomainSettingsForUpdate',
+    'RealTimeInferenceConfig',
+    'RealTimeInferenceRecommendation',
+    'RealTimeInferenceRecommendations',
+    'RealtimeInferenceInstanceTypes',
+    'RecommendationJobCompiledOutputConfig',
+    'RecommendationJobContainerConfig',
+    'RecommendationJobInferenceBenchmark',
+    'RecommendationJobInputConfig',
+    'RecommendationJobOutputConfig',
+    'RecommendationJobPayloadConfig',
+    'RecommendationJobResourceLimit',
+    'RecommendationJobStoppingConditions',
+    'RecommendationJobSupportedContentTypes',
+    'RecommendationJobSupportedInstanceTypes',
+    'RecommendationJobSupportedResponseMIMETypes',
+    'RecommendationJobVpcConfig',
+    'RecommendationJobVpcSecurityGroupIds',
+    'RecommendationJobVpcSubnets',
+    'RecommendationMetrics',
+    'RedshiftDatasetDefinition',
+    'RegisterDevicesRequest',
+    'RegisterModelStepMetadata',
+    'RemoteDebugConfig',
+    'RemoteDebugConfigForUpdate',
+    'RenderUiTemplateRequest',
+    'RenderUiTemplateResponse',
+    'RenderableTask',
+    'RenderingError',
+    'RenderingErrorList',
+    'RepositoryAuthConfig',
+    'ResolvedAttributes',
+    'ResourceCatalog',
+    'ResourceCatalogList',
+    'ResourceConfig',
+    'ResourceConfigForUpdate',
+    'ResourceInUse',
+    'ResourceLimitExceeded',
+    'ResourceLimits',
+    'ResourceNotFound',
+    'ResourceSpec',
+    'ResponseMIMETypes',
+    'ResponseStream',
+    'RetentionPolicy',
+    'RetryPipelineExecutionRequest',
+    'RetryPipelineExecutionResponse',
+    'RetryStrategy',
+    'RollingUpdatePolicy',
+    'RuleParameters',
+    'S3DataSource',
+    'S3ModelDataSource',
+    'S3StorageConfig',
+    'SageMakerImageVersionAliases',
+    'ScalingPolicies',
+    'ScalingPolicy',
+    'ScalingPolicyMetric',
+    'ScalingPolicyObjective',
+    'ScheduleConfig',
+    'SearchExpression',
+    'SearchExpressionList',
+    'SearchRecord',
+    'SearchRequest',
+    'SearchResponse',
+    'SearchResultsList',
+    'SecondaryStatusTransition',
+    'SecondaryStatusTransitions',
+    'SecurityGroupIds',
+    'SelectedStep',
+    'SelectedStepList',
+    'SelectiveExecutionConfig',
+    'SelectiveExecutionResult',
+    'SendPipelineExecutionStepFailureRequest',
+    'SendPipelineExecutionStepFailureResponse',
+    'SendPipelineExecutionStepSuccessRequest',
+    'SendPipelineExecutionStepSuccessResponse',
+    'ServiceCatalogProvisionedProductDetails',
+    'ServiceCatalogProvisioningDetails',
+    'ServiceCatalogProvisioningUpdateDetails',
+    'ServiceUnavailable',
+    'ShadowModeConfig',
+    'ShadowModelVariantConfig',
+    'ShadowModelVariantConfigList',
+    'SharingSettings',
+    'ShuffleConfig',
+    'SourceAlgorithm',
+    'SourceAlgorithmList',
+    'SourceAlgorithmSpecification',
+    'SourceIpConfig',
+    'SpaceCodeEditorAppSettings',
+    'SpaceDetails',
+    'SpaceJupyterLabAppSettings',
+    'SpaceList',
+    'SpaceSettings',
+    'SpaceSettingsSummary',
+    'SpaceSharingSettings',
+    'SpaceSharingSettingsSummary',
+    'SpaceStorageSettings',
+    'Stairs',
+    'StartEdgeDeploymentStageRequest',
+    'StartInferenceExperimentRequest',
+    'StartInferenceExperimentResponse',
+    'StartMonitoringScheduleRequest',
+    'StartNotebookInstanceInput',
+    'StartPipelineExecutionRequest',
+    'StartPipelineExecutionResponse',
+    'StopAutoMLJobRequest',
+    'StopCompilationJobRequest',
+    'StopEdgeDeploymentStageRequest',
+    'StopEdgePackagingJobRequest',
+    'StopHyperParameterTuningJobRequest',
+    'StopInferenceExperimentRequest',
+    'StopInferenceExperimentResponse',
+    'StopInferenceRecommendationsJobRequest',
+    'StopLabelingJobRequest',
+    'StopMonitoringScheduleRequest',
+    'StopNotebookInstanceInput',
+    'StopPipelineExecutionRequest',
+    'StopPipelineExecutionResponse',
+    'StopProcessingJobRequest',
+    'StopTrainingJobRequest',
+    'StopTransformJobRequest',
+    'StoppingCondition',
+    'StudioLifecycleConfigDetails',
+    'StudioLifecycleConfigsList',
+    'Subnets',
+    'SubscribedWorkteam',
+    'SubscribedWorkteams',
+    'SuggestionQuery',
+    'TabularJobConfig',
+    'TabularResolvedAttributes',
+    'Tag',
+    'TagKeyList',
+    'TagList',
+    'TargetPlatform',
+    'TargetTrackingScalingPolicyConfiguration',
+    'TaskKeywords',
+    'TensorBoardAppSettings',
+    'TensorBoardOutputConfig',
+    'TextClassificationJobConfig',
+    'TextGenerationHyperParameters',
+    'TextGenerationJobConfig',
+    'TextGenerationResolvedAttributes',
+    'ThroughputConfig',
+    'ThroughputConfigDescription',
+    'ThroughputConfigUpdate',
+    'TimeSeriesConfig',
+    'TimeSeriesForecastingJobConfig',
+    'TimeSeriesForecastingSettings',
+    'TimeSeriesTransformations',
+    'TrafficPattern',
+    'TrafficRoutingConfig',
+    'TrainingContainerArguments',
+    'TrainingContainerEntrypoint',
+    'TrainingEnvironmentMap',
+    'TrainingImageConfig',
+    'TrainingInstanceTypes',
+    'TrainingJob',
+    'TrainingJobDefinition',
+    'TrainingJobStatusCounters',
+    'TrainingJobStepMetadata',
+    'TrainingJobSummaries',
+    'TrainingJobSummary',
+    'TrainingRepositoryAuthConfig',
+    'TrainingSpecification',
+    'TransformDataSource',
+    'TransformEnvironmentMap',
+    'TransformInput',
+    'TransformInstanceTypes',
+    'TransformJob',
+    'TransformJobDefinition',
+    'TransformJobStepMetadata',
+    'TransformJobSummaries',
+    'TransformJobSummary',
+    'TransformOutput',
+    'TransformResources',
+    'TransformS3DataSource',
+    'Trial',
+    'TrialComponent',
+    'TrialComponentArtifact',
+    'TrialComponentArtifacts',
+    'TrialComponentMetricSummaries',
+    'TrialComponentMetricSummary',
+    'TrialComponentParameterValue',
+    'TrialComponentParameters',
+    'TrialComponentSimpleSummaries',
+    'TrialComponentSimpleSummary',
+    'TrialComponentSource',
+    'TrialComponentSourceDetail',
+    'TrialComponentSources',
+    'TrialComponentStatus',
+    'TrialComponentSummaries',
+    'TrialComponentSummary',
+    'TrialSource',
+    'TrialSummaries',
+    'TrialSummary',
+    'TtlDuration',
+    'TuningJobCompletionCriteria',
+    'TuningJobStepMetaData',
+    'USD',
+    'UiConfig',
+    'UiTemplate',
+    'UiTemplateInfo',
+    'UpdateActionRequest',
+    'UpdateActionResponse',
+    'UpdateAppImageConfigRequest',
+    'UpdateAppImageConfigResponse',
+    'UpdateArtifactRequest',
+    'UpdateArtifactResponse',
+    'UpdateClusterRequest',
+    'UpdateClusterResponse',
+    'UpdateClusterSoftwareRequest',
+    'UpdateClusterSoftwareResponse',
+    'UpdateCodeRepositoryInput',
+    'UpdateCodeRepositoryOutput',
+    'UpdateContextRequest',
+    'UpdateContextResponse',
+    'UpdateDeviceFleetRequest',
+    'UpdateDevicesRequest',
+    'UpdateDomainRequest',
+    'UpdateDomainResponse',
+    'UpdateEndpointInput',
+    'UpdateEndpointOutput',
+    'UpdateEndpointWeightsAndCapacitiesInput',
+    'UpdateEndpointWeightsAndCapacitiesOutput',
+    'UpdateExperimentRequest',
+    'UpdateExperimentResponse',
+    'UpdateFeatureGroupRequest',
+    'UpdateFeatureGroupResponse',
+    'UpdateFeatureMetadataRequest',
+    'UpdateHubRequest',
+    'UpdateHubResponse',
+    'UpdateImageRequest',
+    'UpdateImageResponse',
+    'UpdateImageVersionRequest',
+    'UpdateImageVersionResponse',
+    'UpdateInferenceComponentInput',
+    'UpdateInferenceComponentOutput',
+    'UpdateInferenceComponentRuntimeConfigInput',
+    'UpdateInferenceComponentRuntimeConfigOutput',
+    'UpdateInferenceExperimentRequest',
+    'UpdateInferenceExperimentResponse',
+    'UpdateModelCardRequest',
+    'UpdateModelCardResponse',
+    'UpdateModelPackageInput',
+    'UpdateModelPackageOutput',
+    'UpdateMonitoringAlertRequest',
+    'UpdateMonitoringAlertResponse',
+    'UpdateMonitoringScheduleRequest',
+    'UpdateMonitoringScheduleResponse',
+    'UpdateNotebookInstanceInput',
+    'UpdateNotebookInstanceLifecycleConfigInput',
+    'UpdateNotebookInstanceLifecycleConfigOutput',
+    'UpdateNotebookInstanceOutput',
+    'UpdatePipelineExecutionRequest',
+    'UpdatePipelineExecutionResponse',
+    'UpdatePipelineRequest',
+    'UpdatePipelineResponse',
+    'UpdateProjectInput',
+    'UpdateProjectOutput',
+    'UpdateSpaceRequest',
+    'UpdateSpaceResponse',
+    'UpdateTrainingJobRequest',
+    'UpdateTrainingJobResponse',
+    'UpdateTrialComponentRequest',
+    'UpdateTrialComponentResponse',
+    'UpdateTrialRequest',
+    'UpdateTrialResponse',
+    'UpdateUserProfileRequest',
+    'UpdateUserProfileResponse',
+    'UpdateWorkforceRequest',
+    'UpdateWorkforceResponse',
+    'UpdateWorkteamRequest',
+    'UpdateWorkteamResponse',
+    'UserContext',
+    'UserProfileDetails',
+    'UserProfileList',
+    'UserSettings',
+    'ValidationError',
+    'VariantProperty',
+    'VariantPropertyList',
+    'VectorConfig',
+    'Vertex',
+    'Vertices',
+    'VisibilityConditions',
+    'VisibilityConditionsList',
+    'VpcConfig',
+    'VpcOnlyTrustedAccounts',
+    'VpcSecurityGroupIds',
+    'WarmPoolStatus',
+    'Workforce',
+    'WorkforceSecurityGroupIds',
+    'WorkforceSubnets',
+    'WorkforceVpcConfigRequest',
+    'WorkforceVpcConfigResponse',
+    'Workforces',
+    'WorkspaceSettings',
+    'Workteam',
+    'Workteams',
+    'structure',
+    'SourceUri',
+    'string',
+    'SourceType',
+    'String256',
+    'SourceId',
+    'list',
+    'ActionArn',
+    'ActionName',
+    'ExperimentEntityName',
+    'Source',
+    'ActionType',
+    'String64',
+    'Status',
+    'ActionStatus',
+    'CreationTime',
+    'Timestamp',
+    'timestamp',
+    'LastModifiedTime',
+    'SourceArn',
+    'AssociationEntityArn',
+    'DestinationArn',
+    'AssociationType',
+    'AssociationEdgeType',
+    'ResourceArn',
+    'Tags',
+    'CodeRepositoryNameOrUrl',
+    'Name',
+    'EntityName',
+    'Description',
+    'EntityDescription',
+    'Containers',
+    'SupportedTransformInstanceTypes',
+    'SupportedRealtimeInferenceInstanceTypes',
+    'SupportedContentTypes',
+    'SupportedResponseMIMETypes',
+    'S3DataType',
+    'AdditionalS3DataSourceDataType',
+    'S3Uri',
+    'CompressionType',
+    'Version',
+    'EdgeVersion',
+    'AgentCount',
+    'Long',
+    'long',
+    'map',
+    'TransformationAttributeName',
+    'AggregationTransformationValue',
+    'AlarmName',
+    'TrainingImage',
+    'AlgorithmImage',
+    'AlgorithmName',
+    'ArnOrName',
+    'TrainingInputMode',
+    'MetricDefinitions',
+    'EnableSageMakerMetricsTimeSeries',
+    'Boolean',
+    'boolean',
+    'ValidationStatuses',
+    'ImageScanStatuses',
+    'DetailedAlgorithmStatus',
+    'FailureReason',
+    'String',
+    'AlgorithmArn',
+    'AlgorithmDescription',
+    'AlgorithmStatus',
+    'ProfileName',
+    'ValidationRole',
+    'RoleArn',
+    'ValidationProfiles',
+    'AnnotationConsolidationLambdaArn',
+    'LambdaFunctionArn',
+    'DomainId',
+    'UserProfileName',
+    'SpaceName',
+    'AppType',
+    'AppName',
+    'AppStatus',
+    'AppImageConfigArn',
+    'AppImageConfigName',
+    'ImageUri',
+    'StringParameterValue',
+    'ArtifactPropertyValue',
+    'SourceTypes',
+    'SourceIdType',
+    'ArtifactSourceIdType',
+    'Value',
+    'ArtifactArn',
+    'ArtifactName',
+    'ArtifactType',
+    'TrialComponentName',
+    'TrialName',
+    'TrialComponentArn',
+    'TrialArn',
+    'DestinationType',
+    'SourceName',
+    'DestinationName',
+    'CreatedBy',
+    'MaxConcurrentInvocationsPerInstance',
+    'integer',
+    'ClientConfig',
+    'SuccessTopic',
+    'SnsTopicArn',
+    'ErrorTopic',
+    'IncludeInferenceResponseIn',
+    'KmsKeyId',
+    'S3OutputPath',
+    'DestinationS3Uri',
+    'NotificationConfig',
+    'S3FailurePath',
+    'AsyncNotificationTopicTypes',
+    'Catalog',
+    'AthenaCatalog',
+    'Database',
+    'AthenaDatabase',
+    'QueryString',
+    'AthenaQueryString',
+    'WorkGroup',
+    'AthenaWorkGroup',
+    'OutputS3Uri',
+    'OutputFormat',
+    'AthenaResultFormat',
+    'OutputCompression',
+    'AthenaResultCompressionType',
+    'AttributeName',
+    'AutoMLAlgorithm',
+    'CandidateName',
+    'ObjectiveStatus',
+    'CandidateStatus',
+    'InferenceContainers',
+    'EndTime',
+    'AutoMLFailureReason',
+    'InferenceContainerDefinitions',
+    'FeatureSpecificationS3Uri',
+    'AlgorithmsConfig',
+    'CandidateStepType',
+    'CandidateStepArn',
+    'CandidateStepName',
+    'TargetAttributeName',
+    'ContentType',
+    'ChannelType',
+    'AutoMLChannelType',
+    'SampleWeightAttributeName',
+    'ContainerImage',
+    'ModelDataUrl',
+    'Url',
+    'Environment',
+    'ValidationFraction',
+    'float',
+    'AutoMLProcessingUnit',
+    'CandidateDefinitionNotebookLocation',
+    'DataExplorationNotebookLocation',
+    'MaxCandidates',
+    'MaxRuntimePerTrainingJobInSeconds',
+    'MaxAutoMLJobRuntimeInSeconds',
+    'CompletionCriteria',
+    'SecurityConfig',
+    'DataSplitConfig',
+    'Mode',
+    'AutoMLMode',
+    'MetricName',
+    'AutoMLMetricEnum',
+    'Arn',
+    'AutoMLJobArn',
+    'AutoMLJobName',
+    'AutoMLJobStatus',
+    'AutoMLJobSecondaryStatus',
+    'PartialFailureReasons',
+    'PartialFailureMessage',
+    'AutoMLS3DataType',
+    'VolumeKmsKeyId',
+    'EnableInterContainerTrafficEncryption',
+    'ParameterKey',
+    'ValueHint',
+    'ParameterValue',
+    'Alarms',
+    'AutotuneMode',
+    'GenerateInferenceId',
+    'ErrorCode',
+    'ErrorResponse',
+    'ModelPackageArn',
+    'ModelPackageGroupName',
+    'ModelPackageVersion',
+    'ModelPackageDescription',
+    'ModelPackageStatus',
+    'ModelApprovalStatus',
+    'DataCapturedDestinationS3Uri',
+    'DatasetFormat',
+    'LocalPath',
+    'ProcessingLocalPath',
+    'S3InputMode',
+    'ProcessingS3InputMode',
+    'S3DataDistributionType',
+    'ProcessingS3DataDistributionType',
+    'FeaturesAttribute',
+    'InferenceAttribute',
+    'ProbabilityAttribute',
+    'ProbabilityThresholdAttribute',
+    'double',
+    'StartTimeOffset',
+    'MonitoringTimeOffsetString',
+    'EndTimeOffset',
+    'ExcludeFeaturesAttribute',
+    'MaxNumberOfTrainingJobsNotImproving',
+    'Report',
+    'PreTrainingReport',
+    'PostTrainingReport',
+    'TrafficRoutingConfiguration',
+    'TerminationWaitInSeconds',
+    'MaximumExecutionTimeoutInSeconds',
+    'SourcePipelineExecutionArn',
+    'PipelineExecutionArn',
+    'CallbackToken',
+    'SqsQueueUrl',
+    'OutputParameters',
+    'ExplainabilityLocation',
+    'ModelInsights',
+    'ModelInsightsLocation',
+    'BacktestResults',
+    'BacktestResultsLocation',
+    'CandidateMetrics',
+    'Type',
+    'CapacitySizeType',
+    'CapacitySizeValue',
+    'CaptureMode',
+    'Values',
+    'String128',
+    'ChannelName',
+    'RecordWrapperType',
+    'RecordWrapper',
+    'InputMode',
+    'IsRequired',
+    'SupportedCompressionTypes',
+    'SupportedInputModes',
+    'DirectoryPath',
+    'Cidr',
+    'CheckType',
+    'BaselineUsedForDriftCheckConstraints',
+    'String1024',
+    'CalculatedBaselineConstraints',
+    'ViolationReport',
+    'CheckJobArn',
+    'SkipCheck',
+    'RegisterNewBaseline',
+    'EnableExplanations',
+    'ClarifyEnableExplanations',
+    'InferenceConfig',
+    'ShapConfig',
+    'ClarifyHeader',
+    'ClarifyFeatureType',
+    'ClarifyFeaturesAttribute',
+    'ContentTemplate',
+    'ClarifyContentTemplate',
+    'MaxRecordCount',
+    'ClarifyMaxRecordCount',
+    'MaxPayloadInMB',
+    'ClarifyMaxPayloadInMB',
+    'ProbabilityIndex',
+    'ClarifyProbabilityIndex',
+    'LabelIndex',
+    'ClarifyLabelIndex',
+    'ClarifyProbabilityAttribute',
+    'LabelAttribute',
+    'ClarifyLabelAttribute',
+    'LabelHeaders',
+    'FeatureHeaders',
+    'FeatureTypes',
+    'MimeType',
+    'ClarifyMimeType',
+    'ShapBaseline',
+    'ClarifyShapBaseline',
+    'ShapBaselineUri',
+    'ShapBaselineConfig',
+    'NumberOfSamples',
+    'ClarifyShapNumberOfSamples',
+    'UseLogit',
+    'ClarifyShapUseLogit',
+    'Seed',
+    'ClarifyShapSeed',
+    'TextConfig',
+    'Language',
+    'ClarifyTextLanguage',
+    'Granularity',
+    'ClarifyTextGranularity',
+    'CurrentCount',
+    'ClusterNonNegativeInstanceCount',
+    'TargetCount',
+    'ClusterInstanceCount',
+    'InstanceGroupName',
+    'ClusterInstanceGroupName',
+    'InstanceType',
+    'ClusterInstanceType',
+    'LifeCycleConfig',
+    'ExecutionRole',
+    'ThreadsPerCore',
+    'ClusterThreadsPerCore',
+    'InstanceCount',
+    'ClusterInstanceStatus',
+    'Message',
+    'SourceS3Uri',
+    'OnCreate',
+    'ClusterLifeCycleConfigFileName',
+    'InstanceId',
+    'InstanceStatus',
+    'LaunchTime',
+    'ClusterArn',
+    'ClusterName',
+    'ClusterStatus',
+    'DefaultResourceSpec',
+    'RepositoryUrl',
+    'CodeRepositoryName',
+    'CodeRepositoryArn',
+    'UserPool',
+    'CognitoUserPool',
+    'ClientId',
+    'UserGroup',
+    'CognitoUserGroup',
+    'CollectionName',
+    'ConfigKey',
+    'ConfigValue',
+    'CompilationJobName',
+    'CompilationJobArn',
+    'CompilationStartTime',
+    'CompilationEndTime',
+    'CompilationTargetDevice',
+    'TargetDevice',
+    'CompilationTargetPlatformOs',
+    'TargetPlatformOs',
+    'CompilationTargetPlatformArch',
+    'TargetPlatformArch',
+    'CompilationTargetPlatformAccelerator',
+    'TargetPlatformAccelerator',
+    'CompilationJobStatus',
+    'Outcome',
+    'ConditionOutcome',
+    'ContainerArgument',
+    'ContainerEnvironmentVariables',
+    'ContainerHostname',
+    'ContainerMode',
+    'ModelPackageName',
+    'VersionedArnOrName',
+    'InferenceSpecificationName',
+    'ContainerEntrypointString',
+    'ContentClassifier',
+    'ContextArn',
+    'ContextName',
+    'ContextType',
+    'MinValue',
+    'MaxValue',
+    'ScalingType',
+    'HyperParameterScalingType',
+    'CompleteOnConvergence',
+    'ExperimentDescription',
+    'Properties',
+    'ValidationSpecification',
+    'CertifyForMarketplace',
+    'AppArn',
+    'ProblemType',
+    'GenerateCandidateDefinitionsOnly',
+    'ModelPackageVersionArn',
+    'JobDefinitionName',
+    'MonitoringJobDefinitionName',
+    'DataQualityJobOutputConfig',
+    'JobResources',
+    'JobDefinitionArn',
+    'MonitoringJobDefinitionArn',
+    'DeviceFleetName',
+    'DeviceFleetDescription',
+    'EnableIotRoleAlias',
+    'DomainName',
+    'AuthMode',
+    'DefaultUserSettings',
+    'SubnetIds',
+    'VpcId',
+    'AppNetworkAccessType',
+    'HomeEfsFileSystemKmsKeyId',
+    'AppSecurityGroupManagement',
+    'DomainArn',
+    'EdgeDeploymentPlanName',
+    'ModelConfigs',
+    'Stages',
+    'EdgeDeploymentPlanArn',
+    'EdgePackagingJobName',
+    'ModelName',
+    'ModelVersion',
+    'ResourceKey',
+    'EndpointConfigName',
+    'ProductionVariants',
+    'ShadowProductionVariants',
+    'ExecutionRoleArn',
+    'EnableNetworkIsolation',
+    'EndpointConfigArn',
+    'EndpointName',
+    'EndpointArn',
+    'ExperimentName',
+    'DisplayName',
+    'ExperimentArn',
+    'FeatureGroupName',
+    'RecordIdentifierFeatureName',
+    'FeatureName',
+    'EventTimeFeatureName',
+    'FeatureGroupArn',
+    'FlowDefinitionName',
+    'FlowDefinitionArn',
+    'HubName',
+    'HubDescription',
+    'HubDisplayName',
+    'HubSearchKeywords',
+    'HubArn',
+    'HumanTaskUiName',
+    'HumanTaskUiArn',
+    'HyperParameterTuningJobName',
+    'TrainingJobDefinitions',
+    'WarmStartConfig',
+    'HyperParameterTuningJobArn',
+    'ImageDescription',
+    'ImageDisplayName',
+    'ImageName',
+    'ImageArn',
+    'BaseImage',
+    'ImageBaseImage',
+    'ClientToken',
+    'Aliases',
+    'VendorGuidance',
+    'JobType',
+    'MLFramework',
+    'ProgrammingLang',
+    'Processor',
+    'Horovod',
+    'ReleaseNotes',
+    'ImageVersionArn',
+    'InferenceComponentName',
+    'VariantName',
+    'Specification',
+    'RuntimeConfig',
+    'InferenceComponentArn',
+    'InferenceExperimentName',
+    'InferenceExperimentType',
+    'Schedule',
+    'InferenceExperimentDescription',
+    'ModelVariants',
+    'DataStorageConfig',
+    'KmsKey',
+    'InferenceExperimentArn',
+    'JobName',
+    'RecommendationJobName',
+    'RecommendationJobType',
+    'JobDescription',
+    'RecommendationJobDescription',
+    'StoppingConditions',
+    'JobArn',
+    'RecommendationJobArn',
+    'LabelingJobName',
+    'LabelAttributeName',
+    'LabelCategoryConfigS3Uri',
+    'LabelingJobArn',
+    'ModelBiasJobOutputConfig',
+    'ModelCardName',
+    'ModelCardNameOrArn',
+    'ModelCardVersion',
+    'Integer',
+    'ModelCardExportJobName',
+    'ModelCardExportJobArn',
+    'Content',
+    'ModelCardContent',
+    'ModelCardStatus',
+    'ModelCardArn',
+    'ModelExplainabilityJobOutputConfig',
+    'PrimaryContainer',
+    'ModelArn',
+    'ModelPackageGroupDescription',
+    'ModelPackageGroupArn',
+    'Domain',
+    'Task',
+    'SamplePayloadUrl',
+    'CustomerMetadataProperties',
+    'SkipModelValidation',
+    'ModelPackageSourceUri',
+    'ModelQualityJobOutputConfig',
+    'MonitoringScheduleName',
+    'MonitoringScheduleArn',
+    'NotebookInstanceName',
+    'SubnetId',
+    'LifecycleConfigName',
+    'NotebookInstanceLifecycleConfigName',
+    'DirectInternetAccess',
+    'VolumeSizeInGB',
+    'NotebookInstanceVolumeSizeInGB',
+    'AcceleratorTypes',
+    'DefaultCodeRepository',
+    'AdditionalCodeRepositories',
+    'RootAccess',
+    'PlatformIdentifier',
+    'OnStart',
+    'NotebookInstanceLifecycleConfigArn',
+    'NotebookInstanceArn',
+    'PipelineName',
+    'PipelineDisplayName',
+    'PipelineDefinition',
+    'PipelineDescription',
+    'ClientRequestToken',
+    'IdempotencyToken',
+    'PipelineArn',
+    'SessionExpirationDurationInSeconds',
+    'ExpiresInSeconds',
+    'LandingUri',
+    'AuthorizedUrl',
+    'PresignedDomainUrl',
+    'NotebookInstanceUrl',
+    'ProcessingJobName',
+    'ProcessingJobArn',
+    'ProjectName',
+    'ProjectEntityName',
+    'ProjectDescription',
+    'ProjectArn',
+    'ProjectId',
+    'SpaceDisplayName',
+    'NonEmptyString64',
+    'SpaceArn',
+    'StudioLifecycleConfigName',
+    'StudioLifecycleConfigContent',
+    'StudioLifecycleConfigAppType',
+    'StudioLifecycleConfigArn',
+    'TrainingJobName',
+    'EnableManagedSpotTraining',
+    'TrainingJobArn',
+    'TransformJobName',
+    'MaxConcurrentTransforms',
+    'BatchStrategy',
+    'TransformJobArn',
+    'StartTime',
+    'Parameters',
+    'InputArtifacts',
+    'OutputArtifacts',
+    'SingleSignOnUserIdentifier',
+    'SingleSignOnUserValue',
+    'UserProfileArn',
+    'WorkforceName',
+    'WorkforceVpcConfig',
+    'WorkforceArn',
+    'WorkteamName',
+    'String200',
+    'WorkteamArn',
+    'CsvContentType',
+    'ImageVersionNumber',
+    'NonEmptyString256',
+    'Uid',
+    'Gid',
+    'CustomerMetadataKey',
+    'CustomerMetadataValue',
+    'Namespace',
+    'Statistic',
+    'EnableCapture',
+    'InitialSamplingPercentage',
+    'SamplingPercentage',
+    'CaptureOptions',
+    'CaptureStatus',
+    'CurrentSamplingPercentage',
+    'TableName',
+    'InputFilter',
+    'JsonPath',
+    'OutputFilter',
+    'JoinSource',
+    'RecordPreprocessorSourceUri',
+    'PostAnalyticsProcessorSourceUri',
+    'BaseliningJobName',
+    'ConstraintsResource',
+    'StatisticsResource',
+    'DataDistributionType',
+    'RuleConfigurationName',
+    'RuleEvaluatorImage',
+    'ProcessingInstanceType',
+    'OptionalVolumeSizeInGB',
+    'RuleEvaluationJobArn',
+    'RuleEvaluationStatus',
+    'StatusDetails',
+    'DefaultEbsVolumeSizeInGb',
+    'SpaceEbsVolumeSizeInGb',
+    'MaximumEbsVolumeSizeInGb',
+    'SecurityGroups',
+    'ClusterNameOrArn',
+    'StageName',
+    'HubContentType',
+    'HubContentName',
+    'HubContentVersion',
+    'Alias',
+    'SageMakerImageVersionAlias',
+    'TagKeys',
+    'Success',
+    'SpecifiedImage',
+    'ResolvedImage',
+    'ResolutionTime',
+    'AutoRollbackConfiguration',
+    'RecommendationStatus',
+    'DeploymentStatus',
+    'DerivedDataInputConfig',
+    'DataInputConfig',
+    'ExperimentEntityNameOrArn',
+    'LastModifiedBy',
+    'LineageGroupArn',
+    'ProductId',
+    'LastHealthCheckTimestamp',
+    'LastUserActivityTimestamp',
+    'BestCandidate',
+    'AutoMLProblemTypeConfigName',
+    'NodeId',
+    'ClusterNodeId',
+    'NodeDetails',
+    'FailureMessage',
+    'InferenceImage',
+    'ContextNameOrArn',
+    'DeviceFleetArn',
+    'IotRoleAlias',
+    'NextToken',
+    'DeviceName',
+    'DeviceArn',
+    'DeviceDescription',
+    'IotThingName',
+    'ThingName',
+    'RegistrationTime',
+    'LatestHeartbeat',
+    'Models',
+    'MaxModels',
+    'HomeEfsFileSystemId',
+    'ResourceId',
+    'SingleSignOnManagedApplicationInstanceId',
+    'SingleSignOnApplicationArn',
+    'DomainStatus',
+    'SecurityGroupIdForDomainBoundary',
+    'SecurityGroupId',
+    'MaxResults',
+    'DeploymentStageMaxResults',
+    'EdgeDeploymentSuccess',
+    'EdgeDeploymentPending',
+    'EdgeDeploymentFailed',
+    'EdgePackagingJobArn',
+    'EdgePackagingJobStatus',
+    'EdgePackagingJobStatusMessage',
+    'ModelArtifact',
+    'ModelSignature',
+    'PresetDeploymentOutput',
+    'EndpointStatus',
+    'LastDeploymentConfig',
+    'FeatureGroupNameOrArn',
+    'FeatureGroupStatus',
+    'OnlineStoreTotalSizeBytes',
+    'FeatureType',
+    'FeatureDescription',
+    'FlowDefinitionStatus',
+    'HubContentArn',
+    'DocumentSchemaVersion',
+    'HubContentDisplayName',
+    'HubContentDescription',
+    'HubContentMarkdown',
+    'HubContentDocument',
+    'HubContentSearchKeywords',
+    'HubContentDependencies',
+    'HubContentStatus',
+    'HubStatus',
+    'HumanTaskUiStatus',
+    'HyperParameterTuningJobStatus',
+    'HyperParameterTuningEndTime',
+    'BestTrainingJob',
+    'OverallBestTrainingJob',
+    'TuningJobCompletionDetails',
+    'ConsumedResources',
+    'ImageStatus',
+    'ImageContainerImage',
+    'ImageVersionStatus',
+    'InferenceComponentStatus',
+    'InferenceExperimentStatus',
+    'StatusReason',
+    'InferenceExperimentStatusReason',
+    'CompletionTime',
+    'RecommendationJobStatus',
+    'LabelingJobStatus',
+    'JobReferenceCode',
+    'LineageGroupName',
+    'ModelCardExportJobStatus',
+    'CreatedAt',
+    'LastModifiedAt',
+    'ExportArtifacts',
+    'ModelCardProcessingStatus',
+    'ModelPackageGroupStatus',
+    'ApprovalDescription',
+    'MonitoringScheduleStatus',
+    'ScheduleStatus',
+    'MonitoringType',
+    'LastMonitoringExecutionSummary',
+    'NotebookInstanceStatus',
+    'NetworkInterfaceId',
+    'PipelineExecutionDisplayName',
+    'PipelineExecutionName',
+    'PipelineExecutionStatus',
+    'PipelineExecutionDescription',
+    'PipelineExecutionFailureReason',
+    'PipelineNameOrArn',
+    'PipelineStatus',
+    'LastRunTime',
+    'ProcessingJobStatus',
+    'ExitMessage',
+    'ProcessingEndTime',
+    'ProcessingStartTime',
+    'ProjectStatus',
+    'HomeEfsFileSystemUid',
+    'EfsUid',
+    'SpaceStatus',
+    'TuningJobArn',
+    'TrainingJobStatus',
+    'SecondaryStatus',
+    'TrainingStartTime',
+    'TrainingEndTime',
+    'TrainingTimeInSeconds',
+    'BillableTimeInSeconds',
+    'ProfilingStatus',
+    'TransformJobStatus',
+    'TransformStartTime',
+    'TransformEndTime',
+    'Metrics',
+    'Sources',
+    'UserProfileStatus',
+    'DesiredWeight',
+    'VariantWeight',
+    'DesiredInstanceCount',
+    'TaskCount',
+    'ServerlessUpdateConfig',
+    'DeployedStageName',
+    'DeviceDeploymentStatus',
+    'DeviceDeploymentStatusMessage',
+    'DeploymentStartTime',
+    'DeviceSubsetType',
+    'Percentage',
+    'DeviceNameContains',
+    'ConnectedDeviceCount',
+    'RegisteredDeviceCount',
+    'FeatureStatus',
+    'EnableDockerAccess',
+    'ExecutionRoleIdentityConfig',
+    'ConfigFile',
+    'PreTrainingConstraints',
+    'PostTrainingConstraints',
+    'Constraints',
+    'Statistics',
+    'MinCapacity',
+    'MaxCapacity',
+    'ScaleInCooldown',
+    'ScaleOutCooldown',
+    'FileSystemId',
+    'FileSystemPath',
+    'ClusterId',
+    'StepId',
+    'StepName',
+    'LogFilePath',
+    'EbsVolumeSizeInGb',
+    'FailureHandlingPolicy',
+    'ModelHandle',
+    'StageStatus',
+    'EdgeDeploymentSuccessInStage',
+    'EdgeDeploymentPendingInStage',
+    'EdgeDeploymentFailedInStage',
+    'EdgeDeploymentStatusMessage',
+    'EdgeDeploymentStageStartTime',
+    'LatestSampleTime',
+    'LatestInference',
+    'OfflineDeviceCount',
+    'ActiveDeviceCount',
+    'SamplingDeviceCount',
+    'S3OutputLocation',
+    'PresetDeploymentType',
+    'EdgePresetDeploymentType',
+    'PresetDeploymentConfig',
+    'Artifact',
+    'EdgePresetDeploymentArtifact',
+    'EdgePresetDeploymentStatus',
+    'StatusMessage',
+    'MonitoringSchedules',
+    'ProductionVariantInstanceType',
+    'ServerlessConfig',
+    'InitialInstanceCount',
+    'EnvironmentKey',
+    'EnvironmentValue',
+    'Key',
+    'ValueType',
+    'TrialComponentDisplayName',
+    'RunName',
+    'ExperimentSourceArn',
+    'ErrorMessage',
+    'String3072',
+    'CollectionType',
+    'FeatureParameterKey',
+    'FeatureParameterValue',
+    'ContentDigest',
+    'MountPath',
+    'DefaultUid',
+    'DefaultGid',
+    'FileSystemAccessMode',
+    'FileSystemType',
+    'FillingType',
+    'FillingTransformationValue',
+    'ResourcePropertyName',
+    'Operator',
+    'FilterValue',
+    'AutoMLJobObjectiveType',
+    'MetricValue',
+    'StandardMetricName',
+    'HyperParameterTuningJobObjectiveType',
+    'FlowDefinitionTaskKeyword',
+    'ForecastQuantile',
+    'AmazonBedrockRoleArn',
+    'ReportGenerated',
+    'ModelStats',
+    'LineageGroupNameOrArn',
+    'ResourcePolicy',
+    'ResourcePolicyString',
+    'PolicyString',
+    'SagemakerServicecatalogStatus',
+    'InferenceRecommendationsJobName',
+    'RecommendationId',
+    'TargetCpuUtilizationPerCore',
+    'UtilizationPercentagePerCore',
+    'Metric',
+    'Resource',
+    'ResourceType',
+    'PropertyNameSuggestions',
+    'GitConfigUrl',
+    'Branch',
+    'SecretArn',
+    'GroupingAttributeName',
+    'Group',
+    'CountryCode',
+    'DependencyOriginPath',
+    'DependencyCopyPath',
+    'HubSearchKeyword',
+    'HumanLoopActivationConditions',
+    'TaskTitle',
+    'FlowDefinitionTaskTitle',
+    'TaskDescription',
+    'FlowDefinitionTaskDescription',
+    'FlowDefinitionTaskCount',
+    'TaskAvailabilityLifetimeInSeconds',
+    'FlowDefinitionTaskAvailabilityLifetimeInSeconds',
+    'TaskTimeLimitInSeconds',
+    'FlowDefinitionTaskTimeLimitInSeconds',
+    'AwsManagedHumanLoopRequestSource',
+    'PreHumanTaskLambdaArn',
+    'NumberOfHumanWorkersPerDataObject',
+    'MaxConcurrentTaskCount',
+    'ParameterName',
+    'ParameterType',
+    'Range',
+    'IsTunable',
+    'DefaultValue',
+    'HyperParameterValue',
+    'DefinitionName',
+    'HyperParameterTrainingJobDefinitionName',
+    'TuningObjective',
+    'HyperParameterRanges',
+    'StaticHyperParameters',
+    'HyperParameterTrainingJobEnvironmentKey',
+    'HyperParameterTrainingJobEnvironmentValue',
+    'TrainingJobDefinitionName',
+    'TuningJobName',
+    'TunedHyperParameters',
+    'TrainingInstanceType',
+    'TrainingInstanceCount',
+    'NumberOfTrainingJobsObjectiveNotImproving',
+    'ConvergenceDetectedTime',
+    'Strategy',
+    'HyperParameterTuningJobStrategyType',
+    'StrategyConfig',
+    'TrainingJobEarlyStoppingType',
+    'RandomSeed',
+    'RuntimeInSeconds',
+    'WarmStartType',
+    'HyperParameterTuningJobWarmStartType',
+    'AllocationStrategy',
+    'HyperParameterTuningAllocationStrategy',
+    'InstanceConfigs',
+    'HyperParameterKey',
+    'MinResource',
+    'HyperbandStrategyMinResource',
+    'MaxResource',
+    'HyperbandStrategyMaxResource',
+    'PrincipalId',
+    'SourceIdentity',
+    'DataSourceName',
+    'RepositoryAccessMode',
+    'ImageDeleteProperty',
+    'NumberOfCpuCoresRequired',
+    'NumberOfCpuCores',
+    'NumberOfAcceleratorDevicesRequired',
+    'NumberOfAcceleratorDevices',
+    'MinMemoryRequiredInMb',
+    'MemoryInMb',
+    'MaxMemoryRequiredInMb',
+    'ArtifactUrl',
+    'CopyCount',
+    'InferenceComponentCopyCount',
+    'DesiredCopyCount',
+    'CurrentCopyCount',
+    'Container',
+    'StartupParameters',
+    'ComputeResourceRequirements',
+    'ModelDataDownloadTimeoutInSeconds',
+    'ProductionVariantModelDataDownloadTimeoutInSeconds',
+    'ContainerStartupHealthCheckTimeoutInSeconds',
+    'ProductionVariantContainerStartupHealthCheckTimeoutInSeconds',
+    'InferenceExecutionMode',
+    'Destination',
+    'MaxInvocations',
+    'ModelLatency',
+    'EndpointConfiguration',
+    'InvocationEndTime',
+    'InvocationStartTime',
+    'StepType',
+    'RecommendationStepType',
+    'InferenceBenchmark',
+    'EnableInfraCheck',
+    'Framework',
+    'FrameworkVersion',
+    'MinimumInstanceMetadataServiceVersion',
+    'Header',
+    'Accept',
+    'CustomAttributes',
+    'CustomAttributesHeader',
+    'InferenceId',
+    'InputLocation',
+    'InputLocationHeader',
+    'RequestTTLSeconds',
+    'RequestTTLSecondsHeader',
+    'InvocationTimeoutSeconds',
+    'InvocationTimeoutSecondsHeader',
+    'OutputLocation',
+    'FailureLocation',
+    'Body',
+    'BodyBlob',
+    'blob',
+    'TargetModel',
+    'TargetModelHeader',
+    'TargetVariant',
+    'TargetVariantHeader',
+    'TargetContainerHostname',
+    'TargetContainerHostnameHeader',
+    'EnableExplanationsHeader',
+    'InferenceComponentHeader',
+    'InvokedProductionVariant',
+    'JsonContentType',
+    'KernelName',
+    'KernelDisplayName',
+    'TotalLabeled',
+    'LabelCounter',
+    'HumanLabeled',
+    'MachineLabeled',
+    'FailedNonRetryableError',
+    'Unlabeled',
+    'PendingHuman',
+    'Total',
+    'LabelingJobAlgorithmSpecificationArn',
+    'InitialActiveLearningModelArn',
+    'SnsDataSource',
+    'WorkRequesterAccountId',
+    'AccountId',
+    'DataAttributes',
+    'OutputDatasetS3Uri',
+    'FinalActiveLearningModelArn',
+    'ManifestS3Uri',
+    'MaxHumanLabeledObjectCount',
+    'MaxPercentageOfInputDatasetLabeled',
+    'LastUpdateStatusValue',
+    'CreatedAfter',
+    'CreatedBefore',
+    'SortBy',
+    'SortActionsBy',
+    'SortOrder',
+    'CreationTimeAfter',
+    'CreationTimeBefore',
+    'NameContains',
+    'AlgorithmSortBy',
+    'ModifiedTimeBefore',
+    'ModifiedTimeAfter',
+    'AppImageConfigSortKey',
+    'AppImageConfigs',
+    'AppSortKey',
+    'DomainIdEquals',
+    'UserProfileNameEquals',
+    'SpaceNameEquals',
+    'Apps',
+    'SortArtifactsBy',
+    'SortAssociationsBy',
+    'LastModifiedTimeAfter',
+    'LastModifiedTimeBefore',
+    'AutoMLNameContains',
+    'StatusEquals',
+    'AutoMLSortOrder',
+    'AutoMLSortBy',
+    'AutoMLMaxResults',
+    'CandidateNameEquals',
+    'CandidateSortBy',
+    'AutoMLMaxResultsForTrials',
+    'Candidates',
+    'InstanceGroupNameContains',
+    'ClusterSortBy',
+    'CodeRepositoryNameContains',
+    'CodeRepositorySortBy',
+    'CodeRepositorySortOrder',
+    'ListCompilationJobsSortBy',
+    'SortContextsBy',
+    'MonitoringJobDefinitionSortKey',
+    'JobDefinitionSummaries',
+    'ListMaxResults',
+    'ListDeviceFleetsSortBy',
+    'LatestHeartbeatAfter',
+    'Domains',
+    'DeviceFleetNameContains',
+    'ListEdgeDeploymentPlansSortBy',
+    'ModelNameContains',
+    'ListEdgePackagingJobsSortBy',
+    'EndpointConfigSortKey',
+    'OrderKey',
+    'PaginationToken',
+    'EndpointConfigNameContains',
+    'EndpointConfigs',
+    'EndpointSortKey',
+    'EndpointNameContains',
+    'SortExperimentsBy',
+    'FeatureGroupNameContains',
+    'FeatureGroupStatusEquals',
+    'OfflineStoreStatusEquals',
+    'OfflineStoreStatusValue',
+    'FeatureGroupSortOrder',
+    'FeatureGroupSortBy',
+    'FeatureGroupMaxResults',
+    'MinVersion',
+    'MaxSchemaVersion',
+    'HubContentSortBy',
+    'HubContentSummaries',
+    'HubSortBy',
+    'HubSummaries',
+    'HyperParameterTuningJobSortByOptions',
+    'ImageVersionSortBy',
+    'ImageVersionSortOrder',
+    'ImageNameContains',
+    'ImageSortBy',
+    'ImageSortOrder',
+    'InferenceComponentSortKey',
+    'InferenceComponentNameContains',
+    'EndpointNameEquals',
+    'VariantNameEquals',
+    'InferenceComponents',
+    'SortInferenceExperimentsBy',
+    'InferenceExperiments',
+    'Steps',
+    'ListInferenceRecommendationsJobsSortBy',
+    'ModelNameEquals',
+    'ModelPackageVersionArnEquals',
+    'JobReferenceCodeContains',
+    'ListLabelingJobsForWorkteamSortByOptions',
+    'SortLineageGroupsBy',
+    'ModelCardExportJobNameContains',
+    'ModelCardExportJobSortBy',
+    'ModelCardExportJobSortOrder',
+    'ModelCardExportJobSummaries',
+    'ModelCardVersionSortBy',
+    'ModelCardSortOrder',
+    'ModelCardSortBy',
+    'ModelCardSummaries',
+    'ModelPackageGroupSortBy',
+    'ModelPackageType',
+    'ModelPackageSortBy',
+    'ModelSortKey',
+    'MonitoringAlertName',
+    'MonitoringAlertHistorySortKey',
+    'MonitoringAlertStatus',
+    'MonitoringAlertHistory',
+    'MonitoringAlertSummaries',
+    'MonitoringExecutionSortKey',
+    'ScheduledTimeBefore',
+    'ScheduledTimeAfter',
+    'ExecutionStatus',
+    'MonitoringTypeEquals',
+    'MonitoringExecutionSummaries',
+    'MonitoringScheduleSortKey',
+    'MonitoringScheduleSummaries',
+    'NotebookInstanceLifecycleConfigSortKey',
+    'NotebookInstanceLifecycleConfigSortOrder',
+    'NotebookInstanceLifecycleConfigNameContains',
+    'NotebookInstanceLifecycleConfigs',
+    'NotebookInstanceSortKey',
+    'NotebookInstanceSortOrder',
+    'NotebookInstanceNameContains',
+    'DefaultCodeRepositoryContains',
+    'CodeRepositoryContains',
+    'AdditionalCodeRepositoryEquals',
+    'NotebookInstances',
+    'PipelineExecutionSteps',
+    'SortPipelineExecutionsBy',
+    'PipelineExecutionSummaries',
+    'PipelineParameters',
+    'PipelineNamePrefix',
+    'SortPipelinesBy',
+    'PipelineSummaries',
+    'ProjectSortBy',
+    'ProjectSortOrder',
+    'ResourceCatalogName',
+    'ResourceCatalogSortOrder',
+    'ResourceCatalogSortBy',
+    'ResourceCatalogs',
+    'SpaceSortKey',
+    'SpaceNameContains',
+    'Spaces',
+    'ExcludeDevicesDeployedInOtherStage',
+    'AppTypeEquals',
+    'StudioLifecycleConfigSortKey',
+    'StudioLifecycleConfigs',
+    'ListTagsMaxResults',
+    'TrainingJobSortByOptions',
+    'WarmPoolStatusEquals',
+    'WarmPoolResourceStatus',
+    'TrialComponentKey256',
+    'SortTrialComponentsBy',
+    'SortTrialsBy',
+    'UserProfileSortKey',
+    'UserProfileNameContains',
+    'UserProfiles',
+    'ListWorkforcesSortByOptions',
+    'ListWorkteamsSortByOptions',
+    'CommitId',
+    'MetadataPropertyValue',
+    'Repository',
+    'GeneratedBy',
+    'Float',
+    'Set',
+    'MetricSetSource',
+    'AutoMLMetricExtendedEnum',
+    'Regex',
+    'MetricRegex',
+    'Predefined',
+    'Customized',
+    'AcceptEula',
+    'S3ModelArtifacts',
+    'ConfigUri',
+    'GroundTruthS3Input',
+    'ModelId',
+    'RiskRating',
+    'S3ExportArtifacts',
+    'InvocationsTimeoutInSeconds',
+    'InvocationsMaxRetries',
+    'RecommendationJobCompilationJobName',
+    'Enabled',
+    'LastBatchTransformJob',
+    'AutoGenerateEndpointName',
+    'ArtifactDigest',
+    'OriginalStatusCode',
+    'StatusCode',
+    'OriginalMessage',
+    'LogStreamArn',
+    'InfrastructureType',
+    'ModelInfrastructureType',
+    'Percentile',
+    'ValueInMilliseconds',
+    'ModelMetadataFilterType',
+    'Filters',
+    'ImageDigest',
+    'ModelPackageFrameworkVersion',
+    'NearestModelName',
+    'DetailedModelPackageStatus',
+    'MonitoringProblemType',
+    'CrossAccountModelRegisterRoleArn',
+    'ModelVariantName',
+    'ModelVariantAction',
+    'InfrastructureConfig',
+    'ModelVariantStatus',
+    'ModelDashboardIndicator',
+    'AlertStatus',
+    'DatapointsToAlert',
+    'MonitoringDatapointsToAlert',
+    'EvaluationPeriod',
+    'MonitoringEvaluationPeriod',
+    'Actions',
+    'ProcessingInstanceCount',
+    'ProcessingVolumeSizeInGB',
+    'Csv',
+    'Json',
+    'Parquet',
+    'ProcessingEnvironmentKey',
+    'ProcessingEnvironmentValue',
+    'ScheduledTime',
+    'MonitoringExecutionStatus',
+    'MonitoringS3Uri',
+    'BaselineConfig',
+    'Line',
+    'S3Output',
+    'ClusterConfig',
+    'S3UploadMode',
+    'ProcessingS3UploadMode',
+    'MaxRuntimeInSeconds',
+    'MonitoringMaxRuntimeInSeconds',
+    'ModelCacheSetting',
+    'NeoVpcSecurityGroupId',
+    'NeoVpcSubnetId',
+    'NestedPropertyName',
+    'NotebookInstanceAcceleratorType',
+    'NotebookInstanceLifecycleConfigContent',
+    'NotificationTopicArn',
+    'Succeeded',
+    'ObjectiveStatusCounter',
+    'Pending',
+    'Failed',
+    'DisableGlueTableCreation',
+    'TableFormat',
+    'BlockedReason',
+    'ClientSecret',
+    'Issuer',
+    'OidcEndpoint',
+    'AuthorizationEndpoint',
+    'TokenEndpoint',
+    'UserInfoEndpoint',
+    'LogoutEndpoint',
+    'JwksUri',
+    'EnableOnlineStore',
+    'StorageType',
+    'CompilerOptions',
+    'OutputCompressionType',
+    'OwnerUserProfileName',
+    'MaxParallelExecutionSteps',
+    'PipelineParameterName',
+    'Bytes',
+    'PartBlob',
+    'CurrentWeight',
+    'CurrentInstanceCount',
+    'AcceleratorType',
+    'ProductionVariantAcceleratorType',
+    'VariantStatus',
+    'CurrentServerlessConfig',
+    'DesiredServerlessConfig',
+    'ManagedInstanceScaling',
+    'RoutingConfig',
+    'InitialNumberOfUsers',
+    'SpawnRate',
+    'DurationInSeconds',
+    'TrafficDurationInSeconds',
+    'Bucket',
+    'BucketName',
+    'ObjectKey',
+    'VersionId',
+    'StepDisplayName',
+    'StepDescription',
+    'StepStatus',
+    'Metadata',
+    'AttemptCount',
+    'TuningJob',
+    'RegisterModel',
+    'Condition',
+    'Callback',
+    'Lambda',
+    'EMR',
+    'QualityCheck',
+    'ClarifyCheck',
+    'Fail',
+    'AutoMLJob',
+    'LastExecutionTime',
+    'PredefinedMetricType',
+    'InputName',
+    'AppManaged',
+    'S3Input',
+    'OutputName',
+    'FeatureStoreOutput',
+    'Outputs',
+    'ProcessingS3DataType',
+    'S3CompressionType',
+    'ProcessingS3CompressionType',
+    'ProcessingMaxRuntimeInSeconds',
+    'InitialTaskCount',
+    'InitialVariantWeight',
+    'CoreDumpConfig',
+    'ProductionVariantVolumeSizeInGB',
+    'EnableSSMAccess',
+    'ProductionVariantSSMAccess',
+    'ManagedInstanceScalingStatus',
+    'MinInstanceCount',
+    'ManagedInstanceScalingMinInstanceCount',
+    'MaxInstanceCount',
+    'ManagedInstanceScalingMaxInstanceCount',
+    'RoutingStrategy',
+    'MemorySizeInMB',
+    'ServerlessMemorySizeInMB',
+    'MaxConcurrency',
+    'ServerlessMaxConcurrency',
+    'ProvisionedConcurrency',
+    'ServerlessProvisionedConcurrency',
+    'VariantStatusMessage',
+    'ProfilingIntervalInMilliseconds',
+    'DisableProfiler',
+    'PropertyNameHint',
+    'PropertyName',
+    'ProvisioningParameterKey',
+    'ProvisioningParameterValue',
+    'AmountInUsd',
+    'BaselineUsedForDriftCheckStatistics',
+    'CalculatedBaselineStatistics',
+    'Types',
+    'LineageTypes',
+    'ModifiedBefore',
+    'ModifiedAfter',
+    'StartArns',
+    'Direction',
+    'IncludeEdges',
+    'MaxDepth',
+    'QueryLineageMaxDepth',
+    'QueryLineageMaxResults',
+    'String8192',
+    'LineageType',
+    'String40',
+    'AccessStatus',
+    'RStudioServerProAccessStatus',
+    'RStudioServerProUserGroup',
+    'DomainExecutionRoleArn',
+    'RStudioConnectUrl',
+    'RStudioPackageManagerUrl',
+    'S3OutputUri',
+    'RecommendationJobFrameworkVersion',
+    'PayloadConfig',
+    'SupportedInstanceTypes',
+    'SupportedEndpointType',
+    'RecommendationJobSupportedEndpointType',
+    'RecommendationJobDataInputConfig',
+    'EndpointMetrics',
+    'RecommendationFailureReason',
+    'JobDurationInSeconds',
+    'ResourceLimit',
+    'EndpointConfigurations',
+    'CompiledOutputConfig',
+    'MaxNumberOfTests',
+    'MaxParallelOfTests',
+    'FlatInvocations',
+    'RecommendationJobSupportedContentType',
+    'RecommendationJobSupportedResponseMIMEType',
+    'RecommendationJobVpcSecurityGroupId',
+    'RecommendationJobVpcSubnetId',
+    'CostPerHour',
+    'CostPerInference',
+    'CpuUtilization',
+    'UtilizationMetric',
+    'MemoryUtilization',
+    'ModelSetupTime',
+    'RedshiftClusterId',
+    'RedshiftDatabase',
+    'DbUser',
+    'RedshiftUserName',
+    'RedshiftQueryString',
+    'ClusterRoleArn',
+    'RedshiftResultFormat',
+    'RedshiftResultCompressionType',
+    'EnableRemoteDebug',
+    'RenderedContent',
+    'Errors',
+    'Input',
+    'TaskInput',
+    'Code',
+    'RepositoryCredentialsProviderArn',
+    'ResourceCatalogArn',
+    'ResourceCatalogDescription',
+    'KeepAlivePeriodInSeconds',
+    'MaxNumberOfTrainingJobs',
+    'MaxParallelTrainingJobs',
+    'HyperParameterTuningMaxRuntimeInSeconds',
+    'SageMakerImageArn',
+    'SageMakerImageVersionArn',
+    'ImageVersionAlias',
+    'AppInstanceType',
+    'LifecycleConfigArn',
+    'ResponseMIMEType',
+    'HomeEfsFileSystem',
+    'RetentionType',
+    'MaximumRetryAttempts',
+    'MaximumBatchSize',
+    'WaitIntervalInSeconds',
+    'RollbackMaximumBatchSize',
+    'S3DataDistribution',
+    'S3ModelUri',
+    'S3ModelDataType',
+    'ModelCompressionType',
+    'ResolvedOutputS3Uri',
+    'TargetTracking',
+    'InvocationsPerInstance',
+    'MinInvocationsPerMinute',
+    'MaxInvocationsPerMinute',
+    'ScheduleExpression',
+    'DataAnalysisStartTime',
+    'DataAnalysisEndTime',
+    'SubExpressions',
+    'BooleanOperator',
+    'HyperParameterTuningJob',
+    'SearchSortOrder',
+    'CrossAccountFilterOption',
+    'Results',
+    'SelectedSteps',
+    'ProvisionedProductId',
+    'ServiceCatalogEntityId',
+    'ProvisionedProductStatusMessage',
+    'ProvisioningArtifactId',
+    'PathId',
+    'SourceModelVariantName',
+    'ShadowModelVariants',
+    'ShadowModelVariantName',
+    'NotebookOutputOption',
+    'S3KmsKeyId',
+    'SourceAlgorithms',
+    'SharingType',
+    'NumberOfSteps',
+    'UsersPerStep',
+    'ModelVariantActions',
+    'DesiredModelVariants',
+    'DesiredState',
+    'InferenceExperimentStopDesiredState',
+    'Reason',
+    'MaxWaitTimeInSeconds',
+    'MaxPendingTimeInSeconds',
+    'MarketplaceTitle',
+    'SellerName',
+    'MarketplaceDescription',
+    'ListingId',
+    'TagKey',
+    'TagValue',
+    'Os',
+    'Arch',
+    'Accelerator',
+    'TargetValue',
+    'Double',
+    'TaskKeyword',
+    'ContentColumn',
+    'TargetLabelColumn',
+    'TextGenerationHyperParameterKey',
+    'TextGenerationHyperParameterValue',
+    'BaseModelName',
+    'ThroughputMode',
+    'ProvisionedReadCapacityUnits',
+    'CapacityUnit',
+    'ProvisionedWriteCapacityUnits',
+    'TimestampAttributeName',
+    'ItemIdentifierAttributeName',
+    'ForecastFrequency',
+    'ForecastHorizon',
+    'Transformations',
+    'AmazonForecastRoleArn',
+    'Filling',
+    'Aggregation',
+    'TrafficType',
+    'TrafficRoutingConfigType',
+    'CanarySize',
+    'LinearStepSize',
+    'TrainingContainerArgument',
+    'TrainingContainerEntrypointString',
+    'TrainingEnvironmentKey',
+    'TrainingEnvironmentValue',
+    'TrainingRepositoryAccessMode',
+    'Completed',
+    'TrainingJobStatusCounter',
+    'InProgress',
+    'RetryableError',
+    'NonRetryableError',
+    'Stopped',
+    'TrainingRepositoryCredentialsProviderArn',
+    'TrainingImageDigest',
+    'SupportedHyperParameters',
+    'SupportedTrainingInstanceTypes',
+    'SupportsDistributedTraining',
+    'TrainingChannels',
+    'SupportedTuningJobObjectiveMetrics',
+    'TransformEnvironmentKey',
+    'TransformEnvironmentValue',
+    'SplitType',
+    'TransformInstanceType',
+    'AssembleWith',
+    'AssemblyType',
+    'TransformInstanceCount',
+    'SourceDetail',
+    'MediaType',
+    'TrialComponentArtifactValue',
+    'TrialComponentKey128',
+    'TrialComponentSourceArn',
+    'TimeStamp',
+    'Max',
+    'OptionalDouble',
+    'Min',
+    'Last',
+    'Count',
+    'OptionalInteger',
+    'Avg',
+    'StdDev',
+    'StringValue',
+    'NumberValue',
+    'DoubleParameterValue',
+    'TrialComponentKey320',
+    'PrimaryStatus',
+    'TrialComponentPrimaryStatus',
+    'TrialComponentStatusMessage',
+    'TrialSourceArn',
+    'Unit',
+    'TtlDurationUnit',
+    'TtlDurationValue',
+    'TargetObjectiveMetricValue',
+    'Dollars',
+    'Cents',
+    'TenthFractionsOfACent',
+    'UiTemplateS3Uri',
+    'TemplateContent',
+    'TemplateUrl',
+    'ContentSha256',
+    'TemplateContentSha256',
+    'PropertiesToRemove',
+    'RetainAllVariantProperties',
+    'ExcludeRetainedVariantProperties',
+    'RetainDeploymentConfig',
+    'DesiredWeightsAndCapacities',
+    'ParameterAdditions',
+    'ParameterRemovals',
+    'DeleteProperties',
+    'AliasesToAdd',
+    'AliasesToDelete',
+    'DesiredRuntimeConfig',
+    'CustomerMetadataPropertiesToRemove',
+    'AdditionalInferenceSpecificationsToAdd',
+    'DisassociateLifecycleConfig',
+    'DisassociateNotebookInstanceLifecycleConfig',
+    'DisassociateAcceleratorTypes',
+    'DisassociateNotebookInstanceAcceleratorTypes',
+    'DisassociateDefaultCodeRepository',
+    'DisassociateAdditionalCodeRepositories',
+    'ParametersToRemove',
+    'InputArtifactsToRemove',
+    'OutputArtifactsToRemove',
+    'DefaultLandingUri',
+    'StudioWebPortal',
+    'VariantPropertyType',
+    'Dimension',
+    'VisibilityConditionsKey',
+    'VisibilityConditionsValue',
+    'ResourceRetainedBillableTimeInSeconds',
+    'ReusedByJob',
+    'LastUpdatedDate',
+    'SubDomain',
+    'CreateDate',
+    'WorkforceStatus',
+    'WorkforceFailureReason',
+    'WorkforceSecurityGroupId',
+    'WorkforceSubnetId',
+    'WorkforceVpcId',
+    'VpcEndpointId',
+    'WorkforceVpcEndpointId',
+    'S3ArtifactPath',
+    'ProductListingIds',
+)
+_RECORDS = (
+    (1440, 1441, 1441, 1442, 1443, 1444, 1442, 1445, 1444, 1442),
+    (1446, 2, 1440),
+    (1440, 1447, 1447, 1442, 1448, 1449, 1442, 1450, 0, 1440, 1451, 1452, 1442, 1453, 1454, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442, 1462, 1463, 1442),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442),
+    (1440, 1464, 1464, 1442, 1465, 1274, 1446),
+    (1440, 1465, 1274, 1446),
+    (1446, 1466, 1442),
+    (1440, 1467, 1468, 1442, 1469, 1470, 1442, 1471, 964, 1446, 1472, 1309, 1446, 1473, 1146, 1446, 1474, 157, 1446, 1475, 1183, 1446),
+    (1446, 8, 1440),
+    (1440, 1476, 1477, 1442, 1478, 1478, 1442, 1479, 1479, 1442),
+    (1440, 1480, 1481, 1442, 1482, 1483, 1484),
+    (1446, 11, 1440),
+    (1485, 1486, 1442, 1487, 1442),
+    (1440, 1488, 1488, 1442),
+    (1446, 14, 1440),
+    (1440, 1489, 1490, 1442, 1491, 1492, 1442, 1493, 1493, 1442, 1494, 913, 1446, 1495, 1496, 1497, 155, 1294, 1446, 151, 1293, 1446, 1296, 1296, 1440),
+    (1440, 1498, 19, 1446, 1499, 19, 1446),
+    (1440, 1467, 1468, 1442, 1453, 1500, 1442, 1501, 1502, 1442),
+    (1446, 18, 1440),
+    (1440, 1491, 1468, 1442, 1503, 1503, 1442, 1504, 1470, 1442, 1455, 1455, 1457, 1505, 1505, 1442),
+    (1446, 20, 1440),
+    (1440, 1506, 1468, 1442, 1299, 1299, 1440, 1311, 1311, 1440),
+    (1446, 22, 1440),
+    (1440, 1507, 1508, 1442, 1509, 23, 1446),
+    (1440, 1510, 1511, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1514, 1514, 1442, 1515, 1515, 1442, 1516, 1516, 1442, 1453, 1517, 1442, 1455, 1455, 1457, 1182, 1182, 1440),
+    (1440, 1518, 1518, 1442, 1519, 1519, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 729, 729, 1440, 724, 724, 1440),
+    (1446, 27, 1440),
+    (1446, 26, 1440),
+    (1440, 1520, 1520, 1442, 155, 155, 1446, 151, 151, 1446),
+    (1485, 1521, 1442, 1522, 1442),
+    (1440, 1441, 1441, 1442, 1523, 34, 1446),
+    (1440, 1524, 1525, 1442, 1526, 1444, 1442),
+    (1446, 33, 1440),
+    (1446, 36, 1440),
+    (1440, 1527, 1527, 1442, 1528, 1449, 1442, 1450, 32, 1440, 1529, 1444, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1530, 1449, 1442, 1531, 1449, 1442),
+    (1440, 1532, 1532, 1442, 1533, 1533, 1442),
+    (1446, 40, 1440),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442, 1443, 1444, 1442, 1534, 1444, 1442, 1462, 1463, 1442, 1535, 1449, 1442, 1536, 1449, 1442, 1455, 1456, 1457, 1537, 1415, 1440),
+    (1440, 1538, 1538, 1539),
+    (1440, 1540, 41, 1440, 1051, 44, 1440),
+    (1440, 1541, 1542, 1442, 1543, 1542, 1442, 1544, 45, 1446),
+    (1440, 1545, 1545, 1442, 1546, 1547, 1442, 1548, 43, 1440, 1549, 1547, 1442),
+    (1446, 1550, 1442),
+    (1440, 1551, 1552, 1442, 1553, 1554, 1442, 1555, 1556, 1442, 1557, 1558, 1442, 1559, 1478, 1442, 1545, 1545, 1442, 1560, 1561, 1442, 1562, 1563, 1442),
+    (1446, 1564, 1442),
+    (1440, 49, 49, 1446),
+    (1446, 1565, 1442),
+    (1446, 48, 1440),
+    (1440, 1566, 1566, 1442, 601, 601, 1440, 1567, 1567, 1442, 98, 98, 1446, 1568, 1568, 1442, 1569, 57, 1446, 1455, 1456, 1457, 1570, 1456, 1457, 1458, 1456, 1457, 1501, 1571, 1442, 97, 97, 1440, 1572, 60, 1485),
+    (1440, 1573, 1478, 1442, 1574, 50, 1446),
+    (1440, 1575, 1575, 1442, 1576, 1576, 1442, 1577, 1577, 1442),
+    (1446, 51, 1440),
+    (1440, 295, 58, 1440, 1479, 1479, 1442, 1578, 1578, 1442, 1579, 1579, 1442, 1580, 1581, 1442, 1582, 1582, 1442),
+    (1440, 671, 1583, 1442, 1584, 1585, 1442, 1586, 571, 1485),
+    (1446, 56, 1440),
+    (1440, 1191, 77, 1440),
+    (1440, 1587, 1587, 1588),
+    (1485, 1589, 1442, 57, 1446),
+    (1446, 55, 1440),
+    (1440, 1590, 1590, 1442, 1591, 1591, 1442),
+    (1440, 1580, 1581, 1442, 1579, 1579, 1442, 1479, 1479, 1442, 295, 58, 1440),
+    (1440, 1592, 1592, 1539, 1593, 1593, 1539, 1594, 1594, 1539),
+    (1440, 1595, 64, 1440, 1596, 78, 1440, 96, 52, 1440, 1597, 59, 1440, 1598, 1599, 1442),
+    (1446, 63, 1440),
+    (1440, 1600, 1601, 1442),
+    (1440, 1602, 1603, 1442),
+    (1446, 70, 1440),
+    (1440, 1604, 1604, 1442, 1603, 1603, 1442, 1605, 1605, 1442, 1606, 1606, 1442, 1455, 1456, 1457, 1570, 1456, 1457, 1458, 1456, 1457, 1501, 1571, 1442, 1607, 73, 1446),
+    (1440, 1545, 1545, 1442, 1546, 1478, 1442),
+    (1440, 1608, 1571, 1442),
+    (1446, 72, 1440),
+    (1440, 672, 672, 1440, 1280, 1280, 1440, 1288, 1288, 1440, 1270, 1270, 1440, 1282, 1282, 1440),
+    (1440, 1271, 1271, 1440, 1283, 1283, 1440),
+    (1440, 67, 67, 1440, 1595, 64, 1440, 75, 75, 1440),
+    (1440, 1476, 1609, 1442, 1478, 1478, 1442),
+    (1440, 1610, 1545, 1442, 1611, 1496, 1497, 1427, 1427, 1440),
+    (1440, 1467, 1612, 1442, 1613, 1614, 1442),
+    (1446, 79, 1440),
+    (1440, 1615, 15, 1446),
+    (1440, 1598, 1616, 1442),
+    (1440, 1547, 1478, 1442, 1545, 1545, 1442, 1617, 1496, 1497),
+    (1440, 1618, 1502, 1442, 1619, 1502, 1442),
+    (1485, 1620, 1442, 84, 1440),
+    (1440, 962, 962, 1446),
+    (1440, 971, 971, 1485, 85, 85, 1485),
+    (1440, 1621, 1468, 1442, 1622, 1622, 1539, 1620, 1620, 1442, 1623, 1470, 1442, 1455, 1455, 1457, 702, 702, 1440, 1624, 1624, 1442, 1625, 1625, 1442),
+    (1440, 1626, 1547, 1442, 1627, 1002, 1440, 1628, 1629, 1442, 1630, 1631, 1442, 1632, 1633, 1442, 1634, 1502, 1442, 1635, 1502, 1442, 1636, 1502, 1442, 1637, 1637, 1638, 1639, 1640, 1442, 1641, 1640, 1442, 1642, 1642, 1442),
+    (1440, 1643, 1643, 1539),
+    (1440, 1644, 915, 1440, 1645, 915, 1440, 1646, 915, 1440),
+    (1440, 1647, 1292, 1440, 1648, 1648, 1539, 1649, 1649, 1539),
+    (1440, 1650, 1651, 1442),
+    (1440, 1652, 1652, 1442, 1653, 1444, 1442, 1654, 1054, 1446),
+    (1440, 580, 1655, 1442, 1656, 1657, 1442, 1658, 1659, 1442),
+    (1440, 1574, 50, 1446),
+    (1440, 95, 95, 1440, 1660, 910, 1446),
+    (1446, 53, 1440),
+    (1440, 1289, 1289, 1440, 981, 981, 1440, 1437, 1437, 1440, 670, 670, 1446, 516, 516, 1440, 727, 727, 1440, 609, 609, 1440),
+    (1440, 1661, 1662, 1442, 1526, 1663, 1539),
+    (1440, 274, 274, 1446, 723, 723, 1446),
+    (1440, 1664, 1664, 1442),
+    (1446, 102, 1440),
+    (1440, 1467, 1452, 1442, 1526, 107, 1446),
+    (1440, 1467, 1612, 1442, 1665, 1062, 1446),
+    (1440, 1665, 1062, 1446),
+    (1446, 1666, 1442),
+    (1446, 105, 1440),
+    (1446, 104, 1440),
+    (1440, 1667, 1667, 1442, 295, 295, 1440, 1579, 1579, 1442, 1479, 1479, 1442, 1668, 1669, 1442, 1670, 1493, 1442, 1225, 1225, 1440),
+    (1440, 1467, 1667, 1442, 1469, 1470, 1442, 1671, 1496, 1497, 1474, 157, 1446, 1672, 148, 1446, 1673, 706, 1446),
+    (1446, 111, 1440),
+    (1440, 1478, 1478, 1442, 1628, 1674, 1442),
+    (1446, 1675, 1442),
+    (1440, 1676, 1444, 1442, 1677, 1678, 1442, 1679, 1678, 1442, 1621, 1444, 1442, 1680, 1678, 1442, 1681, 1444, 1442, 1682, 1496, 1497, 1683, 1496, 1497),
+    (1440, 1684, 1685, 1442, 1686, 119, 1440, 1687, 122, 1440),
+    (1446, 1688, 1442),
+    (1446, 1689, 1442),
+    (1440, 1634, 1690, 1442, 1691, 1692, 1442, 1693, 1694, 1539, 1695, 1696, 1539, 1697, 1698, 1539, 1699, 1700, 1539, 1636, 1701, 1442, 1702, 1703, 1442, 1704, 120, 1446, 1705, 117, 1446, 1706, 118, 1446),
+    (1446, 1688, 1442),
+    (1440, 1707, 1708, 1442, 1709, 1710, 1442, 1711, 1585, 1442),
+    (1440, 1712, 121, 1440, 1713, 1714, 1539, 1715, 1716, 1497, 1717, 1718, 1539, 1719, 123, 1440),
+    (1440, 1720, 1721, 1442, 1722, 1723, 1442),
+    (1440, 1724, 1725, 1539, 1726, 1727, 1539, 1728, 1729, 1442, 1730, 1731, 1442, 1732, 129, 1440, 1733, 1508, 1442, 1734, 1735, 1539),
+    (1446, 124, 1440),
+    (1440, 1736, 1727, 1539, 1728, 1729, 1442, 1730, 1731, 1442, 1732, 129, 1440, 1733, 1508, 1442, 1734, 1735, 1539),
+    (1446, 126, 1440),
+    (1440, 1453, 1737, 1442, 1738, 1502, 1442),
+    (1440, 1739, 1478, 1442, 1740, 1741, 1442),
+    (1440, 1728, 1729, 1442, 1742, 1502, 1442, 1743, 128, 1440, 1730, 1731, 1442, 1744, 1456, 1457, 1732, 129, 1440, 1734, 1735, 1539),
+    (1446, 132, 1440),
+    (1440, 1728, 1729, 1442, 1742, 1502, 1442, 1730, 1731, 1442, 1744, 1456, 1457, 1743, 128, 1440),
+    (1446, 134, 1440),
+    (1440, 1745, 1745, 1442, 1746, 1746, 1442, 1455, 1456, 1457, 1747, 1747, 1442),
+    (1440, 1748, 1182, 1440, 750, 750, 1446),
+    (1446, 137, 1440),
+    (1440, 1749, 1749, 1442),
+    (1440, 1750, 1468, 1442, 1751, 1751, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 622, 622, 1440),
+    (1446, 138, 1440),
+    (1440, 1752, 1753, 1442, 1754, 1754, 1442),
+    (1440, 1752, 1753, 1442, 1755, 1756, 1442, 1754, 1754, 1442),
+    (1440, 1422, 1422, 1440),
+    (1440, 1757, 1757, 1442, 145, 145, 1485),
+    (1446, 143, 1440),
+    (1485, 1758, 1442, 1759, 1442),
+    (1446, 147, 1440),
+    (1440, 1760, 1468, 1442, 1761, 1761, 1442, 1455, 1455, 1457, 1762, 1456, 1457, 1763, 1456, 1457, 1764, 1765, 1442, 1766, 1767, 1442, 1768, 1769, 1442, 1770, 1771, 1442, 1458, 1458, 1457, 1772, 1772, 1442),
+    (1446, 1479, 1442),
+    (1440, 1773, 1774, 1442),
+    (1440, 1738, 1501, 1442),
+    (1446, 1775, 1442),
+    (1440, 151, 280, 1446, 155, 281, 1446, 1776, 282, 1485),
+    (1440, 1777, 1777, 1442, 671, 1583, 1442, 673, 673, 1440, 1598, 1778, 1442, 1584, 1585, 1442, 942, 942, 1440, 1586, 571, 1485, 1779, 1780, 1442, 1781, 1781, 1442, 1027, 1027, 1440),
+    (1446, 153, 1440),
+    (1446, 1782, 1442),
+    (1446, 1783, 1442),
+    (1446, 1579, 1442),
+    (1440, 1441, 1441, 1442, 1443, 1444, 1442, 1445, 1444, 1442),
+    (1446, 160, 1440),
+    (1440, 1784, 1784, 1442, 1785, 1785, 1442, 1450, 158, 1440, 1786, 1444, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1467, 1612, 1442, 1787, 1614, 1442, 1788, 1614, 1442, 1789, 1790, 1442),
+    (1440, 1787, 1614, 1442, 1788, 1614, 1442),
+    (1446, 161, 1440),
+    (1440, 1791, 1791, 1442),
+    (1440, 1448, 1449, 1442, 1450, 0, 1440, 1451, 1444, 1442, 1469, 1792, 1442, 1453, 1454, 1442, 1793, 751, 1485, 908, 908, 1440, 1465, 1274, 1446),
+    (1440, 1447, 1447, 1442),
+    (1440, 1491, 1468, 1442, 1504, 1470, 1442, 1305, 1305, 1440, 702, 702, 1440, 1794, 24, 1440, 1795, 1795, 1497, 1465, 1274, 1446),
+    (1440, 1503, 1503, 1442),
+    (1440, 1519, 1519, 1442, 1465, 1274, 1446, 729, 729, 1440, 724, 724, 1440),
+    (1440, 1518, 1518, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1514, 1514, 1442, 1515, 1515, 1442, 1516, 1516, 1442, 1465, 1274, 1446, 1182, 1182, 1440),
+    (1440, 1796, 1796, 1442),
+    (1440, 1528, 1449, 1442, 1450, 32, 1440, 1529, 1444, 1442, 1793, 31, 1485, 908, 908, 1440, 1465, 1274, 1446),
+    (1440, 1527, 1527, 1442),
+    (1440, 1604, 1604, 1442, 705, 61, 1446, 1052, 71, 1440, 1797, 1797, 1442, 67, 67, 1440, 65, 65, 1440, 1508, 1508, 1442, 1798, 1798, 1497, 1465, 1274, 1446, 943, 943, 1440),
+    (1440, 1603, 1603, 1442),
+    (1440, 1604, 1604, 1442, 66, 66, 1446, 1052, 71, 1440, 74, 74, 1440, 1508, 1508, 1442, 1465, 1274, 1446, 1596, 78, 1440, 67, 67, 1440, 943, 943, 1440, 1597, 59, 1440),
+    (1440, 1603, 1603, 1442),
+    (1440, 1746, 1746, 1442, 709, 127, 1446, 1427, 1427, 1440, 1465, 1274, 1446),
+    (1440, 1745, 1745, 1442),
+    (1440, 1750, 1468, 1442, 622, 622, 1440, 1465, 1274, 1446),
+    (1440, 1751, 1751, 1442),
+    (1440, 1760, 1468, 1442, 1508, 1508, 1442, 1799, 1620, 1442, 704, 704, 1440, 1051, 1051, 1440, 1427, 1028, 1440, 1263, 1263, 1440, 1465, 1274, 1446),
+    (1440, 1761, 1761, 1442),
+    (1440, 1785, 1785, 1442, 1450, 158, 1440, 1786, 1444, 1442, 1469, 1792, 1442, 1793, 751, 1485, 1465, 1274, 1446),
+    (1440, 1784, 1784, 1442),
+    (1440, 1800, 1801, 1442, 293, 293, 1440, 292, 292, 1440, 294, 294, 1440, 1802, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440, 1465, 1274, 1446),
+    (1440, 1804, 1805, 1442),
+    (1440, 1806, 1468, 1442, 1508, 1508, 1442, 1469, 1807, 1442, 1051, 550, 1440, 1465, 1274, 1446, 1808, 1808, 1497),
+    (1440, 1809, 1809, 1442, 1810, 1810, 1442, 1811, 1418, 1440, 525, 525, 1440, 1812, 1266, 1446, 1813, 1813, 1442, 1465, 1274, 1446, 1814, 1814, 1442, 1815, 1545, 1442, 1545, 1545, 1442, 1816, 1816, 1442, 303, 303, 1440),
+    (1440, 1817, 1817, 1442, 1585, 1678, 1442),
+    (1440, 1818, 1468, 1442, 1819, 540, 1446, 1806, 1468, 1442, 1820, 378, 1446, 1465, 1274, 1446),
+    (1440, 1821, 1821, 1442),
+    (1440, 1818, 1468, 1442, 1820, 378, 1446),
+    (1440, 1822, 1468, 1442, 1760, 1468, 1442, 1823, 1468, 1442, 1824, 1481, 1442, 1508, 1508, 1442, 1051, 550, 1440, 1825, 1545, 1442, 1465, 1274, 1446),
+    (1440, 1826, 1826, 1442, 1827, 1104, 1446, 288, 288, 1440, 1465, 1274, 1446, 1545, 1545, 1442, 42, 42, 1440, 581, 581, 1440, 1828, 1104, 1446, 1829, 1508, 1442, 1427, 1427, 1440, 1830, 1496, 1497),
+    (1440, 1831, 1831, 1442),
+    (1440, 1832, 1832, 1442, 1826, 1826, 1442, 373, 373, 1440, 1465, 1274, 1446),
+    (1440, 1833, 1833, 1442),
+    (1440, 1834, 1449, 1442, 1835, 1449, 1442, 1469, 1792, 1442, 1465, 1274, 1446),
+    (1440, 1836, 1836, 1442),
+    (1440, 1837, 1837, 1442, 1838, 1839, 1442, 1840, 1839, 1442, 585, 585, 1446, 1048, 1048, 1440, 1043, 1043, 1440, 1284, 1284, 1440, 1508, 1508, 1442, 1469, 1469, 1442, 1465, 1274, 1446),
+    (1440, 1841, 1841, 1442),
+    (1440, 1842, 1842, 1442, 641, 641, 1440, 639, 639, 1440, 640, 640, 1440, 1051, 604, 1440, 1508, 1508, 1442, 1465, 1274, 1446),
+    (1440, 1843, 1843, 1442),
+    (1440, 1844, 1844, 1442, 1845, 1845, 1442, 1846, 1846, 1442, 1847, 637, 1446, 1193, 636, 1440, 1465, 1274, 1446),
+    (1440, 1848, 1848, 1442),
+    (1440, 1849, 1849, 1442, 1342, 1342, 1440, 1465, 1274, 1446),
+    (1440, 1850, 1850, 1442),
+    (1440, 1851, 1851, 1442, 656, 656, 1440, 1299, 648, 1440, 1852, 649, 1446, 1853, 664, 1440, 1465, 1274, 1446, 82, 82, 1440),
+    (1440, 1854, 1854, 1442),
+    (1440, 1469, 1855, 1442, 1835, 1856, 1442, 1857, 1857, 1442, 1508, 1508, 1442, 1465, 1274, 1446),
+    (1440, 1858, 1858, 1442),
+    (1440, 1859, 1860, 1442, 1861, 1861, 1442, 1857, 1857, 1442, 1862, 1194, 1446, 1863, 1863, 1442, 1864, 1864, 1442, 1865, 1865, 1442, 1866, 1866, 1442, 1867, 1867, 1442, 1868, 1868, 1497, 1869, 1869, 1442),
+    (1440, 1870, 1870, 1442),
+    (1440, 1871, 1871, 1442, 1832, 1832, 1442, 1872, 1872, 1442, 1873, 685, 1440, 1874, 683, 1440, 1465, 1274, 1446),
+    (1440, 1875, 1875, 1442),
+    (1440, 1467, 1876, 1442, 1661, 1877, 1442, 1878, 693, 1440, 1469, 1879, 1442, 1508, 1508, 1442, 1832, 1832, 1442, 1880, 988, 1446, 1881, 691, 1440, 1221, 1221, 1440, 1882, 1545, 1442, 1465, 1274, 1446),
+    (1440, 1883, 1883, 1442),
+    (1440, 1884, 1885, 1442, 1864, 1886, 1442, 1508, 1508, 1442, 704, 1150, 1440, 1887, 1888, 1442, 1889, 1154, 1440, 1051, 1151, 1440, 1465, 1274, 1446),
+    (1440, 1890, 1891, 1442),
+    (1440, 1892, 1892, 1442, 1893, 1893, 1442, 704, 739, 1440, 1051, 741, 1440, 1508, 1508, 1442, 1894, 1478, 1442, 1889, 745, 1440, 734, 734, 1440, 642, 642, 1440, 1465, 1274, 1446),
+    (1440, 1895, 1895, 1442),
+    (1440, 1800, 1801, 1442, 920, 920, 1440, 919, 919, 1440, 921, 921, 1440, 1896, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440, 1465, 1274, 1446),
+    (1440, 1804, 1805, 1442),
+    (1440, 1897, 1898, 1442, 1899, 1900, 1539, 1901, 1468, 1442, 1051, 926, 1440),
+    (1440, 1902, 1902, 1442),
+    (1440, 1897, 1468, 1442, 1596, 927, 1440, 1903, 1904, 1442, 1905, 1905, 1442, 1465, 1274, 1446),
+    (1440, 1906, 1906, 1442),
+    (1440, 1800, 1801, 1442, 948, 948, 1440, 947, 947, 1440, 949, 949, 1440, 1907, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440, 1465, 1274, 1446),
+    (1440, 1804, 1805, 1442),
+    (1440, 1823, 1823, 1442, 1908, 153, 1440, 1471, 154, 1446, 690, 690, 1440, 1829, 1508, 1442, 1465, 1274, 1446, 1427, 1427, 1440, 1830, 1496, 1497),
+    (1440, 1909, 1909, 1442),
+    (1440, 1621, 1468, 1442, 1910, 1470, 1442, 1465, 1274, 1446),
+    (1440, 1911, 1911, 1442),
+    (1440, 1779, 1468, 1442, 1621, 1492, 1442, 1623, 1470, 1442, 702, 702, 1440, 1794, 976, 1440, 1228, 1228, 1440, 1795, 1795, 1497, 1465, 1274, 1446, 1625, 1625, 1442, 908, 908, 1440, 959, 959, 1440, 1861, 1861, 1442, 1912, 1502, 1442, 1913, 1502, 1442, 1914, 1478, 1442, 1915, 286, 1485, 527, 527, 1440, 9, 9, 1446, 1916, 1916, 1442, 1441, 1917, 1442),
+    (1440, 1620, 1620, 1442),
+    (1440, 1800, 1801, 1442, 979, 979, 1440, 978, 978, 1440, 980, 980, 1440, 1918, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440, 1465, 1274, 1446),
+    (1440, 1804, 1805, 1442),
+    (1440, 1919, 1919, 1442, 1021, 1021, 1440, 1465, 1274, 1446),
+    (1440, 1920, 1920, 1442),
+    (1440, 1921, 1921, 1442, 1730, 1730, 1442, 1922, 1922, 1442, 1208, 1208, 1446, 1508, 1508, 1442, 1545, 1545, 1442, 1465, 1274, 1446, 1923, 1924, 1442, 1925, 1925, 1442, 1926, 1927, 1539, 1928, 1034, 1446, 1929, 1466, 1442, 1930, 7, 1446, 1931, 1931, 1442, 1932, 1932, 1442, 710, 710, 1440),
+    (1440, 1924, 1924, 1442, 1740, 1035, 1446, 1933, 1035, 1446),
+    (1440, 1934, 1934, 1442),
+    (1440, 1935, 1935, 1442),
+    (1440, 1936, 1936, 1442, 1937, 1936, 1442, 1938, 1938, 1442, 1074, 1074, 1440, 1939, 1939, 1442, 1940, 1941, 1442, 1508, 1508, 1442, 1465, 1274, 1446, 1057, 1057, 1440),
+    (1440, 1942, 1942, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1943, 1943, 1539, 1944, 1944, 1539, 1514, 1514, 1442, 1945, 1945, 1442),
+    (1440, 1946, 1947, 1442),
+    (1440, 1921, 1921, 1442, 1943, 1943, 1539),
+    (1440, 1946, 1948, 1442),
+    (1440, 1089, 1089, 1446, 1095, 1095, 1440, 1949, 1949, 1442, 1097, 1097, 1440, 1263, 1100, 1440, 30, 30, 1440, 1586, 1086, 1485, 1033, 1033, 1440, 1508, 1508, 1442, 1465, 1274, 1446, 576, 576, 1440),
+    (1440, 1950, 1950, 1442),
+    (1440, 1951, 1952, 1442, 1953, 1470, 1442, 1218, 1218, 1440, 1465, 1274, 1446),
+    (1440, 1954, 1954, 1442, 1955, 1955, 1442),
+    (1440, 1512, 1512, 1442, 1514, 1514, 1442, 1465, 1274, 1446, 1234, 1234, 1440, 1055, 1055, 1440, 1236, 1236, 1440, 1956, 1957, 1442),
+    (1440, 1958, 1958, 1442),
+    (1440, 1959, 1959, 1442, 1960, 1960, 1442, 1961, 1961, 1442, 1465, 1274, 1446),
+    (1440, 1962, 1962, 1442),
+    (1440, 1963, 1963, 1442, 666, 666, 1485, 16, 16, 1440, 1508, 1508, 1442, 705, 705, 1446, 1052, 1052, 1440, 1176, 1176, 1440, 1427, 1427, 1440, 1263, 1263, 1440, 1465, 1274, 1446, 1830, 1496, 1497, 1611, 1496, 1497, 1964, 1496, 1497, 113, 113, 1440, 297, 297, 1440, 299, 299, 1446, 1279, 1279, 1440, 576, 576, 1440, 1113, 1113, 1440, 1116, 1116, 1446, 1586, 1295, 1485, 1188, 1188, 1440, 1165, 1165, 1440, 703, 703, 1440),
+    (1440, 1965, 1965, 1442),
+    (1440, 1966, 1966, 1442, 1823, 1823, 1442, 1967, 1967, 1539, 932, 932, 1440, 1695, 1695, 1539, 1968, 1968, 1442, 1586, 1307, 1485, 1308, 1308, 1440, 1315, 1315, 1440, 288, 83, 1440, 1316, 1316, 1440, 291, 291, 1440, 1465, 1274, 1446, 576, 576, 1440),
+    (1440, 1969, 1969, 1442),
+    (1440, 1530, 1449, 1442, 1835, 1449, 1442, 1453, 1331, 1440, 1970, 1456, 1457, 1570, 1456, 1457, 1971, 1325, 1485, 1972, 1321, 1485, 1973, 1321, 1485, 908, 908, 1440, 1465, 1274, 1446),
+    (1440, 1532, 1532, 1442),
+    (1440, 1531, 1449, 1442, 1835, 1449, 1442, 1834, 1449, 1442, 908, 908, 1440, 1465, 1274, 1446),
+    (1440, 1533, 1533, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1974, 1974, 1442, 1975, 1444, 1442, 1465, 1274, 1446, 1418, 1418, 1440),
+    (1440, 1976, 1976, 1442),
+    (1440, 140, 140, 1440, 1045, 1045, 1440, 1229, 1229, 1440, 1977, 1977, 1442, 1465, 1274, 1446, 1978, 1434, 1440),
+    (1440, 1979, 1979, 1442),
+    (1440, 1980, 1980, 1442, 1977, 1977, 1442, 907, 907, 1446, 1469, 1981, 1442, 1041, 1041, 1440, 1465, 1274, 1446),
+    (1440, 1982, 1982, 1442),
+    (1446, 1983, 1442),
+    (1440, 533, 533, 1440),
+    (1440, 534, 534, 1440),
+    (1446, 276, 1440),
+    (1446, 275, 1440),
+    (1440, 1857, 1857, 1442, 1984, 1984, 1539, 1519, 1519, 1442),
+    (1446, 1957, 1442),
+    (1446, 1985, 1442),
+    (1485, 1985, 1442, 1444, 1442),
+    (1446, 279, 1440),
+    (1440, 1986, 1986, 1484, 1987, 1987, 1484),
+    (1446, 1988, 1442),
+    (1485, 1988, 1442, 1989, 1442),
+    (1440, 1600, 1502, 1442, 1990, 1502, 1442, 1991, 1991, 1442),
+    (1440, 1992, 1992, 1497, 1993, 1994, 1539, 1547, 1547, 1442, 1545, 1545, 1442, 1995, 103, 1446, 101, 101, 1440),
+    (1440, 1992, 1992, 1497, 1996, 1996, 1442, 1997, 1994, 1539, 1547, 1547, 1442, 1545, 1545, 1442),
+    (1440, 1998, 1998, 1442, 1551, 1551, 1442, 1553, 1553, 1442),
+    (1440, 1999, 2000, 1442, 2001, 2000, 1442, 2002, 2002, 1442),
+    (1440, 1520, 1520, 1442, 155, 155, 1446, 151, 1000, 1446, 2003, 1478, 1442, 2004, 1478, 1442, 1586, 1003, 1485),
+    (1440, 2005, 1949, 1442, 2006, 999, 1440, 2007, 1025, 1440),
+    (1440, 561, 561, 1440, 89, 89, 1440),
+    (1440, 1191, 1191, 1440, 596, 596, 1440),
+    (1440, 46, 46, 1440, 1162, 1162, 1440, 1628, 1629, 1442, 2008, 2008, 1442, 1670, 1670, 1442),
+    (1440, 1628, 1674, 1442, 1546, 1478, 1442, 628, 628, 1485, 144, 144, 1446),
+    (1440, 2009, 2009, 1442, 1628, 1674, 1442, 1546, 1478, 1442, 2010, 1490, 1442, 1730, 2011, 1442, 1926, 2012, 1539, 1190, 1190, 1485),
+    (1446, 298, 1440),
+    (1440, 2009, 2009, 1442, 2013, 1950, 1442, 2014, 2014, 1442, 2015, 2015, 1442, 1458, 1456, 1457),
+    (1446, 300, 1440),
+    (1440, 2016, 2017, 1539, 2018, 2017, 1539),
+    (1440, 1733, 1508, 1442, 2019, 1208, 1446, 726, 726, 1440, 728, 728, 1440),
+    (1440, 302, 302, 1440),
+    (1440, 1448, 1449, 1442),
+    (1440, 1447, 1447, 1442),
+    (1440, 1491, 1468, 1442),
+    (1440, 1519, 1519, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1514, 1514, 1442, 1515, 1515, 1442, 1516, 1516, 1442),
+    (1440, 1527, 1527, 1442, 1450, 32, 1440),
+    (1440, 1527, 1527, 1442),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442),
+    (1440, 1746, 2020, 1442),
+    (1440, 1745, 1745, 1442),
+    (1440, 1750, 1468, 1442),
+    (1440, 1760, 1468, 1442),
+    (1440, 1785, 1785, 1442),
+    (1440, 1784, 1784, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1806, 1468, 1442),
+    (1440, 1512, 1512, 1442, 1185, 1185, 1440),
+    (1440, 1818, 1468, 1442),
+    (1440, 1818, 1468, 1442, 2021, 1468, 1442),
+    (1440, 1826, 1826, 1442),
+    (1440, 1832, 1832, 1442),
+    (1440, 1834, 1449, 1442),
+    (1440, 1836, 1836, 1442),
+    (1440, 1837, 1837, 1442),
+    (1440, 1842, 1842, 1442),
+    (1440,),
+    (1440, 1844, 1844, 1442, 2022, 2022, 1442, 2023, 2023, 1442, 2024, 2024, 1442),
+    (1440, 1844, 1844, 1442),
+    (1440, 1849, 1849, 1442),
+    (1440,),
+    (1440, 1851, 1851, 1442),
+    (1440, 1857, 1857, 1442),
+    (1440,),
+    (1440, 1857, 1857, 1442, 1480, 1984, 1539, 2025, 2026, 1442),
+    (1440,),
+    (1440, 1871, 1871, 1442),
+    (1440, 1467, 1876, 1442),
+    (1440, 1883, 1883, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1897, 1468, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1823, 1823, 1442),
+    (1440, 1621, 1492, 1442),
+    (1440, 1621, 1468, 1442),
+    (1440, 1779, 1780, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1919, 1919, 1442),
+    (1440, 1921, 1921, 1442),
+    (1440, 1924, 1924, 1442),
+    (1440, 1936, 1936, 1442, 1940, 1941, 1442),
+    (1440, 1942, 1942, 1442),
+    (1440, 1951, 1952, 1442),
+    (1440, 1512, 1512, 1442, 1514, 1514, 1442),
+    (1440, 1959, 1959, 1442),
+    (1440, 1464, 1464, 1442, 2027, 1273, 1446),
+    (1440,),
+    (1440, 1530, 1449, 1442),
+    (1440, 1532, 1532, 1442),
+    (1440, 1531, 1449, 1442),
+    (1440, 1533, 1533, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442),
+    (1440, 1977, 1977, 1442),
+    (1440,),
+    (1440, 1980, 1980, 1442),
+    (1440, 2028, 2028, 1497),
+    (1440, 2029, 1583, 1442, 2030, 1583, 1442, 2031, 1456, 1457),
+    (1446, 371, 1440),
+    (1440, 92, 92, 1440, 1189, 1189, 1440, 2032, 81, 1440),
+    (1440, 2033, 2033, 1442, 1145, 1145, 1446),
+    (1440, 2021, 1468, 1442, 511, 511, 1440, 373, 538, 1440),
+    (1446, 377, 1440),
+    (1440, 2021, 1468, 1442, 511, 511, 1440, 373, 538, 1440, 2034, 543, 1440),
+    (1446, 375, 1440),
+    (1440, 1806, 1468, 1442, 510, 510, 1446),
+    (1440, 2035, 2036, 1442),
+    (1440, 1448, 2037, 1442),
+    (1440, 1448, 2037, 1442, 1447, 1447, 1442, 1450, 0, 1440, 1451, 1444, 1442, 1469, 1792, 1442, 1453, 1454, 1442, 1793, 751, 1485, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 908, 908, 1440, 2039, 2039, 1442),
+    (1440, 1491, 1492, 1442),
+    (1440, 1491, 1468, 1442, 1503, 1503, 1442, 1504, 1470, 1442, 1455, 1455, 1457, 1305, 1305, 1440, 702, 702, 1440, 1794, 24, 1440, 1505, 1505, 1442, 17, 17, 1440, 2040, 2040, 1442, 1795, 1795, 1497),
+    (1440, 1519, 1519, 1442),
+    (1440, 1518, 1518, 1442, 1519, 1519, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 729, 729, 1440, 724, 724, 1440),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1514, 1514, 1442, 1515, 1515, 1442, 1516, 1516, 1442),
+    (1440, 1796, 1796, 1442, 1515, 1515, 1442, 1516, 1516, 1442, 1512, 1512, 1442, 1513, 1513, 1442, 1514, 1514, 1442, 1453, 1517, 1442, 2041, 1456, 1457, 2042, 1456, 1457, 1455, 1456, 1457, 1501, 1501, 1442, 1182, 1182, 1440),
+    (1440, 1527, 1527, 1442),
+    (1440, 1528, 2037, 1442, 1527, 1527, 1442, 1450, 32, 1440, 1529, 1444, 1442, 1793, 751, 1485, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 908, 908, 1440, 2039, 2039, 1442),
+    (1440, 1604, 1604, 1442),
+    (1440, 1604, 1604, 1442, 1603, 1603, 1442, 705, 61, 1446, 1052, 71, 1440, 1508, 1508, 1442, 67, 67, 1440, 1797, 1797, 1442, 65, 65, 1440, 1455, 1456, 1457, 1570, 1456, 1457, 1458, 1456, 1457, 1501, 1571, 1442, 1607, 73, 1446, 2043, 51, 1440, 1605, 1605, 1442, 1606, 1606, 1442, 1798, 1798, 1497, 62, 62, 1440, 1173, 1173, 1440, 943, 943, 1440, 944, 944, 1440),
+    (1440, 1604, 1604, 1442),
+    (1440, 1604, 1604, 1442, 1603, 1603, 1442, 66, 66, 1446, 1052, 71, 1440, 1508, 1508, 1442, 67, 67, 1440, 74, 74, 1440, 2044, 2044, 1442, 1455, 1456, 1457, 1570, 1456, 1457, 1458, 1456, 1457, 1501, 1571, 1442, 1607, 73, 1446, 2043, 51, 1440, 1605, 1605, 1442, 1606, 1606, 1442, 62, 62, 1440, 1173, 76, 1440, 943, 943, 1440, 944, 944, 1440, 1597, 59, 1440, 1596, 78, 1440),
+    (1440, 1746, 2020, 1442, 2045, 2046, 1442),
+    (1440, 2047, 130, 1440),
+    (1440, 1746, 2020, 1442),
+    (1440, 1745, 1745, 1442, 1746, 1746, 1442, 1747, 1747, 1442, 1455, 1456, 1457, 2048, 1502, 1442, 709, 125, 1446, 1427, 1427, 1440),
+    (1440, 1750, 1468, 1442),
+    (1440, 1750, 1468, 1442, 1751, 1751, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 622, 622, 1440),
+    (1440, 1760, 1468, 1442),
+    (1440, 1760, 1468, 1442, 1761, 1761, 1442, 1772, 1772, 1442, 1762, 1456, 1457, 1763, 1456, 1457, 1263, 1263, 1440, 2049, 2049, 1442, 1799, 1620, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1501, 1501, 1442, 918, 918, 1440, 945, 945, 1440, 1508, 1508, 1442, 704, 704, 1440, 1051, 1051, 1440, 1427, 1028, 1440, 380, 380, 1440),
+    (1440, 1785, 2050, 1442),
+    (1440, 1785, 1785, 1442, 1784, 1784, 1442, 1450, 158, 1440, 1786, 1444, 1442, 1469, 1792, 1442, 1793, 751, 1485, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 2039, 2039, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1804, 1805, 1442, 1800, 1801, 1442, 1455, 1456, 1457, 293, 293, 1440, 292, 292, 1440, 294, 294, 1440, 1802, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440),
+    (1440, 1806, 1468, 1442),
+    (1440, 1806, 1468, 1442, 2051, 2051, 1442, 1051, 550, 1440, 1469, 1807, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1508, 1508, 1442, 2052, 2052, 1442),
+    (1440, 2053, 2053, 1442, 2054, 1468, 1442, 1806, 1468, 1442),
+    (1440, 2055, 2055, 1442, 2054, 1468, 1442, 1469, 2056, 1442, 1806, 1468, 1442, 2057, 2058, 1442, 2059, 1456, 1457, 2060, 1456, 1457, 2061, 549, 1446, 2062, 1900, 1539, 2053, 2053, 1442, 11, 1481, 1442),
+    (1440, 1512, 1512, 1442),
+    (1440, 1817, 1817, 1442, 1512, 1512, 1442, 1809, 1809, 1442, 2063, 2064, 1442, 2065, 1444, 1442, 2066, 2066, 1442, 1453, 2067, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1501, 1501, 1442, 2068, 2069, 1442, 1810, 1810, 1442, 1811, 1418, 1440, 525, 525, 1440, 1814, 1814, 1442, 1815, 1545, 1442, 1812, 1266, 1446, 1585, 1678, 1442, 1813, 1813, 1442, 1545, 1545, 1442, 1816, 1816, 1442, 303, 303, 1440),
+    (1440, 1818, 1468, 1442, 2053, 2053, 1442, 2070, 2071, 1539),
+    (1440, 1821, 1821, 1442, 1818, 1468, 1442, 1819, 540, 1446, 1806, 1468, 1442, 2072, 1900, 1539, 2073, 1900, 1539, 2074, 1900, 1539, 1820, 376, 1446, 2053, 2053, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1822, 1468, 1442),
+    (1440, 2075, 2075, 1442, 1822, 1468, 1442, 1760, 1468, 1442, 1823, 1468, 1442, 1824, 1481, 1442, 1508, 1508, 1442, 1051, 550, 1440, 1825, 1545, 1442, 2076, 2076, 1442, 2077, 1502, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2078, 1478, 1442, 2079, 1502, 1442, 2080, 553, 1440),
+    (1440, 1826, 1826, 1442),
+    (1440, 1826, 1826, 1442, 1831, 1831, 1442, 1827, 1104, 1446, 288, 288, 1440, 1545, 1545, 1442, 1455, 1456, 1457, 42, 42, 1440, 581, 581, 1440, 1828, 1104, 1446, 1829, 1508, 1442, 1427, 1427, 1440, 1830, 1496, 1497),
+    (1440, 1832, 1832, 1442),
+    (1440, 1832, 1832, 1442, 1833, 1833, 1442, 1826, 1826, 1442, 1827, 1112, 1446, 288, 289, 1440, 2081, 2081, 1442, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2082, 373, 1440, 42, 42, 1440, 1068, 1068, 1440, 581, 581, 1440, 1828, 1112, 1446),
+    (1440, 1834, 1449, 1442),
+    (1440, 1834, 1449, 1442, 1836, 1836, 1442, 1835, 1449, 1442, 1450, 577, 1440, 1469, 1792, 1442, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440),
+    (1440, 1837, 2083, 1442, 2053, 2053, 1442),
+    (1440, 1841, 1841, 1442, 1837, 1837, 1442, 1838, 1839, 1442, 1840, 1839, 1442, 585, 585, 1446, 1455, 1455, 1457, 1458, 1458, 1457, 1048, 1048, 1440, 1043, 1043, 1440, 1284, 1285, 1440, 1508, 1508, 1442, 2084, 2084, 1442, 1044, 1044, 1440, 749, 749, 1440, 1501, 1501, 1442, 1469, 1469, 1442, 2053, 2053, 1442, 2085, 2085, 1484),
+    (1440, 1837, 2083, 1442, 1839, 1839, 1442),
+    (1440, 1841, 1841, 1442, 1837, 1837, 1442, 1839, 1839, 1442, 2086, 2086, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1469, 2087, 1442, 1971, 593, 1446),
+    (1440, 1842, 1842, 1442),
+    (1440, 1843, 1843, 1442, 1842, 1842, 1442, 2088, 2088, 1442, 1455, 1456, 1457, 641, 641, 1440, 639, 639, 1440, 640, 640, 1440, 1051, 604, 1440, 1508, 1508, 1442, 1501, 1501, 1442),
+    (1440, 1844, 1844, 1442, 2022, 2022, 1442, 2023, 2023, 1442, 2024, 2024, 1442),
+    (1440, 2023, 2023, 1442, 2089, 2089, 1442, 2024, 2024, 1442, 2022, 2022, 1442, 2090, 2090, 1442, 1844, 1844, 1442, 1848, 1848, 1442, 2091, 2091, 1442, 2092, 2092, 1442, 2093, 2093, 1442, 2094, 2094, 1442, 2095, 633, 1446, 2096, 630, 1446, 2097, 2097, 1442, 1501, 1501, 1442, 1455, 1456, 1457),
+    (1440, 1844, 1844, 1442),
+    (1440, 1844, 1844, 1442, 1848, 1848, 1442, 1846, 1846, 1442, 1845, 1845, 1442, 1847, 637, 1446, 1193, 636, 1440, 2098, 2098, 1442, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1849, 1849, 1442),
+    (1440, 1850, 1850, 1442, 1849, 1849, 1442, 2099, 2099, 1442, 1455, 1456, 1457, 1342, 1343, 1440),
+    (1440, 1851, 1851, 1442),
+    (1440, 1851, 1851, 1442, 1854, 1854, 1442, 656, 656, 1440, 1299, 648, 1440, 1852, 649, 1446, 2100, 2100, 1442, 1455, 1456, 1457, 2101, 1456, 1457, 1458, 1456, 1457, 1300, 1300, 1440, 1042, 1042, 1440, 2102, 652, 1440, 2103, 652, 1440, 1853, 664, 1440, 82, 82, 1440, 1501, 1501, 1442, 2104, 655, 1440, 2105, 657, 1440),
+    (1440, 1857, 1857, 1442),
+    (1440, 1455, 1456, 1457, 1469, 1855, 1442, 1835, 1856, 1442, 1501, 1501, 1442, 1858, 1858, 1442, 1857, 1857, 1442, 2106, 2106, 1442, 1458, 1456, 1457, 1508, 1508, 1442),
+    (1440, 1857, 1857, 1442, 1480, 1984, 1539, 2025, 2026, 1442),
+    (1440, 1859, 1860, 1442, 1583, 2107, 1442, 1455, 1456, 1457, 1501, 1501, 1442, 1858, 1858, 1442, 1870, 1870, 1442, 2108, 2108, 1442, 1458, 1456, 1457, 1480, 1984, 1539, 1863, 1863, 1442, 1864, 1864, 1442, 1865, 1865, 1442, 1866, 1866, 1442, 1867, 1867, 1442, 1868, 1868, 1497, 1869, 1869, 1442),
+    (1440, 1871, 1871, 1442),
+    (1440, 1871, 1871, 1442, 1875, 1875, 1442, 1832, 1832, 1442, 1833, 1833, 1442, 1872, 1872, 1442, 1501, 1501, 1442, 1873, 686, 1440, 1874, 684, 1440, 1455, 1456, 1457, 1458, 1456, 1457, 2109, 2109, 1442),
+    (1440, 1467, 1876, 1442),
+    (1440, 1602, 1883, 1442, 1467, 1876, 1442, 1661, 1877, 1442, 1878, 693, 1440, 1453, 2110, 1442, 2111, 2112, 1442, 1469, 1879, 1442, 1455, 1456, 1457, 2113, 1456, 1457, 1458, 1456, 1457, 1508, 1508, 1442, 564, 564, 1440, 1880, 990, 1446, 1881, 691, 1440, 1221, 1221, 1440, 1882, 1545, 1442),
+    (1440, 1884, 1885, 1442),
+    (1440, 1884, 1885, 1442, 1887, 1888, 1442, 1864, 1886, 1442, 1890, 1891, 1442, 1508, 1508, 1442, 1453, 2114, 1442, 1455, 1455, 1457, 2113, 1456, 1457, 1458, 1458, 1457, 1501, 1501, 1442, 704, 1150, 1440, 1889, 1154, 1440, 697, 697, 1446, 567, 567, 1446),
+    (1440, 1892, 1892, 1442),
+    (1440, 2115, 2115, 1442, 732, 732, 1440, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2116, 2116, 1442, 1892, 1892, 1442, 1895, 1895, 1442, 1893, 1893, 1442, 704, 739, 1440, 1051, 741, 1440, 1508, 1508, 1442, 1894, 1478, 1442, 1889, 745, 1440, 734, 734, 1440, 642, 642, 1440, 1465, 1274, 1446, 740, 740, 1440),
+    (1440, 2117, 1449, 1442),
+    (1440, 2117, 1449, 1442, 2039, 2039, 1442, 1835, 1449, 1442, 1469, 1792, 1442, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440),
+    (1440, 1800, 1801, 1442),
+    (1440, 1804, 1805, 1442, 1800, 1801, 1442, 1455, 1456, 1457, 920, 920, 1440, 919, 919, 1440, 921, 921, 1440, 1896, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440),
+    (1440, 1902, 1902, 1442),
+    (1440, 1901, 1468, 1442, 1902, 1902, 1442, 1453, 2118, 1442, 1897, 1468, 1442, 1899, 1900, 1539, 1051, 926, 1440, 2119, 1456, 1457, 2120, 1456, 1457, 1501, 1501, 1442, 2121, 923, 1440),
+    (1440, 1897, 1898, 1442, 1899, 1900, 1539),
+    (1440, 1906, 1906, 1442, 1897, 1468, 1442, 1899, 1900, 1539, 1903, 1904, 1442, 1905, 1905, 1442, 1596, 927, 1440, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 2122, 2122, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1804, 1805, 1442, 1800, 1801, 1442, 1455, 1456, 1457, 948, 948, 1440, 947, 947, 1440, 949, 949, 1440, 1907, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440),
+    (1440, 1823, 1823, 1442),
+    (1440, 1823, 1823, 1442, 1908, 153, 1440, 1471, 154, 1446, 690, 690, 1440, 1829, 1508, 1442, 1427, 1427, 1440, 1455, 1456, 1457, 1909, 1909, 1442, 1830, 1496, 1497, 374, 374, 1440),
+    (1440, 1621, 1492, 1442),
+    (1440, 1621, 1468, 1442, 1911, 1911, 1442, 1910, 1470, 1442, 1455, 1455, 1457, 1537, 1415, 1440, 2123, 2123, 1442),
+    (1440, 1779, 1780, 1442),
+    (1440, 1779, 1468, 1442, 1621, 1468, 1442, 1622, 1622, 1539, 1620, 1620, 1442, 1623, 1470, 1442, 1455, 1455, 1457, 702, 702, 1440, 1228, 1228, 1440, 1794, 976, 1440, 1624, 1624, 1442, 968, 968, 1440, 1795, 1795, 1497, 1625, 1625, 1442, 1537, 1415, 1440, 908, 908, 1440, 959, 959, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 2124, 2124, 1442, 1912, 1502, 1442, 1913, 1502, 1442, 1914, 1502, 1442, 1915, 286, 1485, 527, 527, 1440, 9, 9, 1446, 1916, 1916, 1442, 1441, 1917, 1442),
+    (1440, 1800, 1801, 1442),
+    (1440, 1804, 1805, 1442, 1800, 1801, 1442, 1455, 1456, 1457, 979, 979, 1440, 978, 978, 1440, 980, 980, 1440, 1918, 1015, 1440, 1803, 1018, 1440, 1033, 1013, 1440, 1508, 1508, 1442, 1263, 1026, 1440),
+    (1440, 1919, 1919, 1442),
+    (1440, 1920, 1920, 1442, 1919, 1919, 1442, 2125, 2126, 1442, 2127, 2127, 1442, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1021, 1021, 1440, 1832, 1832, 1442, 2128, 1004, 1440),
+    (1440, 1921, 1921, 1442),
+    (1440, 1924, 1924, 1442),
+    (1440, 1934, 1934, 1442, 1924, 1924, 1442, 1740, 1035, 1446, 1933, 1035, 1446, 1458, 1458, 1457, 1455, 1455, 1457),
+    (1440, 1935, 1935, 1442, 1921, 1921, 1442, 2129, 2129, 1442, 1501, 1501, 1442, 1585, 1948, 1442, 1730, 1730, 1442, 1922, 1922, 1442, 2019, 1208, 1446, 1508, 1508, 1442, 1545, 1545, 1442, 2130, 2130, 1442, 1458, 1458, 1457, 1455, 1455, 1457, 1924, 1924, 1442, 1925, 1925, 1442, 1926, 1927, 1539, 1928, 1034, 1446, 1929, 1466, 1442, 1930, 7, 1446, 1931, 1931, 1442, 1932, 1932, 1442, 710, 710, 1440),
+    (1440, 1651, 1651, 1442),
+    (1440, 1938, 1938, 1442, 1455, 1456, 1457),
+    (1440, 1651, 1651, 1442),
+    (1440, 1942, 1942, 1442, 1651, 1651, 1442, 2131, 2132, 1442, 2133, 2133, 1442, 2134, 2134, 1442, 1081, 1081, 1440, 1501, 2135, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1537, 1415, 1440, 2038, 1415, 1440, 1057, 1057, 1440, 1211, 1211, 1440),
+    (1440, 1936, 2136, 1442),
+    (1440, 1942, 1942, 1442, 1936, 1936, 1442, 1937, 1936, 1442, 1938, 1938, 1442, 1939, 1939, 1442, 1508, 1508, 1442, 2137, 2137, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2138, 1456, 1457, 1537, 1415, 1440, 2038, 1415, 1440, 1057, 1057, 1440),
+    (1440, 1949, 1949, 1442),
+    (1440, 1089, 1089, 1446, 1095, 1095, 1440, 1949, 1949, 1442, 1097, 1097, 1440, 1263, 1100, 1440, 30, 30, 1440, 1586, 1086, 1485, 1033, 1033, 1440, 1508, 1508, 1442, 576, 576, 1440, 1950, 1950, 1442, 2139, 2139, 1442, 2140, 2140, 1442, 1501, 1501, 1442, 2141, 1456, 1457, 2142, 1456, 1457, 1458, 1456, 1457, 1455, 1456, 1457, 1920, 1920, 1442, 1603, 1603, 1442, 1965, 1965, 1442),
+    (1440, 1951, 1952, 1442),
+    (1440, 1954, 1954, 1442, 1951, 1952, 1442, 1955, 1955, 1442, 1953, 1470, 1442, 1218, 1218, 1440, 1217, 1217, 1440, 2143, 2143, 1442, 1537, 1415, 1440, 1455, 1456, 1457, 1458, 1456, 1457, 2038, 1415, 1440),
+    (1440, 1512, 1512, 1442, 1514, 1514, 1442),
+    (1440, 1512, 1512, 1442, 1958, 1958, 1442, 1514, 1514, 1442, 2144, 2145, 1442, 1453, 2146, 1442, 1458, 1458, 1457, 1455, 1455, 1457, 1501, 1501, 1442, 1234, 1234, 1440, 1055, 1055, 1440, 1236, 1236, 1440, 1956, 1957, 1442, 1585, 1678, 1442),
+    (1440, 1959, 1959, 1442),
+    (1440, 1962, 1962, 1442, 1959, 1959, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1960, 1960, 1442, 1961, 1961, 1442),
+    (1440, 1982, 1982, 1442),
+    (1440, 1267, 1267, 1440),
+    (1440, 1963, 1963, 1442),
+    (1440, 1963, 1963, 1442, 1965, 1965, 1442, 2147, 1854, 1442, 1895, 1895, 1442, 1603, 1603, 1442, 918, 918, 1440, 2148, 2148, 1442, 2149, 2149, 1442, 1501, 1501, 1442, 666, 666, 1485, 16, 16, 1440, 1508, 1508, 1442, 705, 705, 1446, 1052, 1052, 1440, 1176, 1176, 1440, 1430, 1430, 1440, 1427, 1427, 1440, 1263, 1263, 1440, 1455, 1456, 1457, 2150, 1456, 1457, 2151, 1456, 1457, 1458, 1456, 1457, 1207, 1207, 1446, 603, 603, 1446, 1830, 1496, 1497, 1611, 1496, 1497, 1964, 1496, 1497, 113, 113, 1440, 2152, 2152, 1539, 2153, 2153, 1539, 297, 297, 1440, 576, 576, 1440, 299, 299, 1446, 1279, 1279, 1440, 301, 301, 1446, 1113, 1113, 1440, 1116, 1116, 1446, 1118, 1118, 1446, 2154, 2154, 1442, 1586, 1295, 1485, 1188, 1188, 1440, 1165, 1165, 1440, 703, 703, 1440),
+    (1440, 1966, 1966, 1442),
+    (1440, 1966, 1966, 1442, 1969, 1969, 1442, 2155, 2155, 1442, 1501, 1501, 1442, 1823, 1823, 1442, 1967, 1967, 1539, 932, 932, 1440, 1695, 1695, 1539, 1968, 1968, 1442, 1586, 1307, 1485, 1308, 1308, 1440, 1315, 1315, 1440, 288, 83, 1440, 1316, 1316, 1440, 1455, 1456, 1457, 2156, 1456, 1457, 2157, 1456, 1457, 1895, 1895, 1442, 1603, 1603, 1442, 291, 291, 1440, 576, 576, 1440),
+    (1440, 1530, 2037, 1442),
+    (1440, 1530, 1449, 1442, 1532, 1532, 1442, 1835, 1449, 1442, 1450, 1328, 1440, 1453, 1331, 1440, 1970, 1456, 1457, 1570, 1456, 1457, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 1971, 1325, 1485, 1972, 1321, 1485, 1973, 1321, 1485, 908, 908, 1440, 2158, 1322, 1446, 2039, 2039, 1442, 2159, 1330, 1446),
+    (1440, 1531, 1449, 1442),
+    (1440, 1531, 1449, 1442, 1533, 1533, 1442, 1835, 1449, 1442, 1834, 1449, 1442, 1450, 1334, 1440, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 908, 908, 1440),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442),
+    (1440, 1512, 1512, 1442, 1976, 1976, 1442, 1513, 1513, 1442, 2144, 2145, 1442, 1453, 2160, 1442, 1458, 1458, 1457, 1455, 1455, 1457, 1501, 1501, 1442, 1974, 1974, 1442, 1975, 1444, 1442, 1418, 1418, 1440),
+    (1440, 1977, 1977, 1442),
+    (1440, 1431, 1431, 1440),
+    (1440, 1980, 1980, 1442),
+    (1440, 1438, 1438, 1440),
+    (1440, 1872, 1872, 1442, 2161, 2162, 1588, 2163, 2164, 1539, 2165, 1108, 1440),
+    (1446, 503, 1440),
+    (1440, 2054, 2054, 1442, 1469, 2056, 1442, 2057, 2058, 1442),
+    (1446, 507, 1440),
+    (1440, 1821, 1821, 1442, 1818, 1468, 1442, 2021, 1468, 1442, 2166, 1468, 1442, 1806, 1468, 1442, 2054, 2054, 1442, 2055, 2055, 1442, 2167, 2167, 1442, 2168, 1502, 1442, 1469, 2056, 1442, 2169, 1456, 1457),
+    (1446, 509, 1440),
+    (1440, 2051, 2051, 1442, 1806, 1468, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1446, 2054, 1442),
+    (1440, 2170, 2170, 1442, 2171, 2171, 1539, 510, 510, 1446, 2172, 2054, 1442),
+    (1440, 2173, 1483, 1484, 2174, 1483, 1484),
+    (1446, 514, 1440),
+    (1440, 2054, 1468, 1442, 2055, 2055, 1442, 1469, 2056, 1442, 1806, 1468, 1442, 2057, 2058, 1442, 2059, 1456, 1457, 2060, 1456, 1457, 2061, 547, 1446, 11, 1481, 1442),
+    (1446, 505, 1440),
+    (1440, 1453, 2175, 1442),
+    (1440,),
+    (1440,),
+    (1440, 1530, 1449, 1442, 1531, 1449, 1442),
+    (1440, 1532, 1532, 1442, 1533, 1533, 1442),
+    (1440, 2176, 2175, 1442, 1428, 1428, 1446),
+    (1440, 1817, 1817, 1442, 1512, 1512, 1442, 1809, 1809, 1442, 1453, 2067, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1585, 1678, 1442),
+    (1446, 522, 1440),
+    (1446, 2069, 1442),
+    (1440, 1208, 524, 1446, 1141, 1141, 1440, 2177, 2177, 1442, 521, 521, 1440),
+    (1440, 1142, 1142, 1440, 2177, 2177, 1442, 1208, 524, 1446, 521, 521, 1440),
+    (1440, 91, 528, 1440, 580, 529, 1440, 977, 531, 1440, 941, 530, 1440),
+    (1440, 2178, 594, 1440, 2179, 915, 1440, 2180, 915, 1440),
+    (1440, 2181, 915, 1440, 2178, 594, 1440),
+    (1440, 2182, 915, 1440, 2181, 915, 1440),
+    (1440, 2182, 915, 1440, 2181, 915, 1440),
+    (1440, 2183, 1900, 1539, 2184, 1900, 1539, 2185, 1900, 1539, 2186, 1900, 1539, 1195, 1195, 1446),
+    (1440, 2187, 2187, 1442),
+    (1440, 2187, 2187, 1442, 2188, 2188, 1442),
+    (1440, 2189, 1444, 1442, 2190, 1444, 1442, 2191, 1444, 1442, 2192, 1678, 1442),
+    (1440, 2193, 2017, 1539),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442, 1462, 1463, 1442),
+    (1440, 2194, 2194, 1442),
+    (1440, 2195, 1468, 1442, 1822, 1468, 1442),
+    (1446, 539, 1440),
+    (1446, 542, 1440),
+    (1440, 1821, 1821, 1442, 1818, 1468, 1442, 1806, 1468, 1442, 2072, 1900, 1539, 2073, 1900, 1539, 2074, 1900, 1539, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 2196, 2196, 1442, 2197, 1900, 1539, 2198, 1900, 1539, 2199, 1900, 1539, 2200, 1502, 1442, 2201, 1456, 1457),
+    (1440, 1823, 1468, 1442, 1824, 1481, 1442, 2202, 1456, 1457, 2203, 1456, 1457),
+    (1440, 1823, 1468, 1442, 1824, 1481, 1442, 2204, 1483, 1484, 2173, 1483, 1484, 2205, 1483, 1484, 2206, 1483, 1484),
+    (1446, 545, 1440),
+    (1446, 548, 1440),
+    (1440, 1823, 1468, 1442, 1824, 1481, 1442),
+    (1446, 544, 1440),
+    (1440, 2207, 1478, 1442, 1545, 1545, 1442, 2208, 2209, 1442, 2210, 1502, 1442),
+    (1446, 552, 1440),
+    (1440, 2075, 2075, 1442, 1822, 1468, 1442, 2076, 2076, 1442, 1760, 1468, 1442, 1823, 1468, 1442, 1824, 1481, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1661, 2209, 1442, 2211, 2212, 1442, 1453, 2213, 1442, 2214, 1502, 1442),
+    (1446, 537, 1440),
+    (1440,),
+    (1440,),
+    (1440, 1832, 1832, 1442, 1833, 1833, 1442, 1826, 1826, 1442, 1827, 1112, 1446, 288, 289, 1440, 2081, 2081, 1442, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2215, 1022, 1446, 1465, 1274, 1446, 1828, 1112, 1446),
+    (1440, 1826, 1826, 1442, 1831, 1831, 1442, 1455, 1456, 1457),
+    (1446, 558, 1440),
+    (1440, 1832, 1832, 1442),
+    (1440, 1832, 1832, 1442, 1628, 1629, 1442, 1630, 1631, 1442, 1632, 1633, 1442, 1634, 1502, 1442, 1635, 1502, 1442, 1636, 1502, 1442, 1637, 1637, 1638, 1639, 1640, 1442, 1641, 1640, 1442, 1642, 1642, 1442),
+    (1440, 1730, 2216, 1442, 2217, 1107, 1440, 1781, 1781, 1442, 573, 573, 1440),
+    (1446, 562, 1440),
+    (1440, 1832, 1832, 1442, 1826, 1826, 1442, 2081, 2081, 1442, 1501, 1501, 1442),
+    (1440, 1832, 1502, 1442, 1872, 1502, 1442, 1730, 2216, 1442, 2218, 2218, 1539, 2217, 1107, 1440),
+    (1440, 2158, 695, 1440, 560, 560, 1440),
+    (1446, 566, 1440),
+    (1440, 1832, 1832, 1442, 1833, 1833, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2081, 2081, 1442),
+    (1446, 568, 1440),
+    (1446, 560, 1440),
+    (1485, 2219, 1442, 2220, 1442),
+    (1440, 2221, 1502, 1442, 2222, 1502, 1442, 1526, 1502, 1442),
+    (1440, 108, 109, 1446),
+    (1446, 572, 1440),
+    (1440, 1834, 1449, 1442, 1836, 1836, 1442, 1835, 1449, 1442, 1450, 577, 1440, 1469, 1792, 1442, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 1465, 1274, 1446),
+    (1440, 1834, 1449, 1442, 1531, 1449, 1442, 2223, 1449, 1442, 2224, 1449, 1442),
+    (1440, 1459, 2225, 1442, 1443, 1443, 1442),
+    (1446, 579, 1440),
+    (1440, 1836, 1836, 1442, 1834, 1449, 1442, 1835, 1449, 1442, 577, 577, 1440, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1644, 915, 1440),
+    (1440, 116, 116, 1440),
+    (1440, 2226, 2227, 1442),
+    (1446, 584, 1440),
+    (1440, 1839, 1839, 1442, 2086, 2086, 1442, 2228, 2228, 1442, 142, 142, 1440),
+    (1446, 584, 1440),
+    (1440, 1841, 1841, 1442, 1837, 1837, 1442, 1838, 1839, 1442, 1840, 1839, 1442, 585, 585, 1446, 1455, 1455, 1457, 1458, 1458, 1457, 1048, 1048, 1440, 1043, 1043, 1440, 1508, 1508, 1442, 2084, 2084, 1442, 1044, 1044, 1440, 749, 749, 1440, 1501, 1501, 1442, 1469, 1469, 1442, 1465, 1274, 1446),
+    (1446, 588, 1440),
+    (1440, 1837, 1837, 1442, 1841, 1841, 1442, 1455, 1456, 1457, 2084, 2084, 1442, 1044, 1044, 1440),
+    (1440, 1841, 1841, 1442, 1837, 1837, 1442, 1839, 1839, 1442, 2086, 2086, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1469, 2087, 1442, 1971, 593, 1446),
+    (1440, 2221, 2229, 1442, 1526, 2230, 1442),
+    (1446, 590, 1440),
+    (1446, 2229, 1442),
+    (1446, 590, 1440),
+    (1440, 1579, 1579, 1442, 2231, 2231, 1442, 1478, 1478, 1442),
+    (1440, 2232, 2232, 1442, 2233, 2233, 1539, 2234, 2234, 1539),
+    (1440, 2187, 2187, 1442, 2235, 2235, 1442, 2236, 2236, 1442, 1674, 1674, 1442),
+    (1485, 2237, 1442, 2238, 1442),
+    (1485, 1486, 1442, 597, 1485),
+    (1440, 1467, 2239, 1442, 2240, 2240, 1442, 1526, 2241, 1442),
+    (1446, 599, 1440),
+    (1440, 1661, 2242, 1442, 1600, 1601, 1442, 1526, 2243, 1588, 2244, 1601, 1442),
+    (1440, 1661, 2245, 1442, 1600, 1600, 1442, 1526, 2243, 1588),
+    (1446, 909, 1440),
+    (1440, 1546, 1478, 1442, 1545, 1545, 1442),
+    (1446, 606, 1440),
+    (1440, 1842, 1842, 1442, 1843, 1843, 1442, 2088, 2088, 1442, 1455, 1456, 1457, 1501, 1501, 1442),
+    (1446, 2246, 1442),
+    (1446, 2247, 1442),
+    (1440, 2248, 1508, 1442),
+    (1440, 1806, 1468, 1442),
+    (1440, 2051, 2051, 1442, 1806, 1468, 1442, 1051, 550, 1440, 1469, 1807, 1442, 2249, 1456, 1457, 512, 512, 1440, 12, 12, 1446, 2250, 546, 1446),
+    (1440, 2117, 2251, 1442),
+    (1440, 2039, 2039, 1442, 2252, 2253, 1442),
+    (1440, 1621, 1468, 1442),
+    (1440, 2252, 2254, 1442),
+    (1440,),
+    (1440, 1453, 2255, 1442),
+    (1440, 2256, 1885, 1442, 2257, 1502, 1442, 1832, 1832, 1442, 2258, 2259, 1539, 1198, 1198, 1440),
+    (1440, 2256, 1885, 1442, 2257, 1502, 1442, 1832, 1832, 1442, 2258, 2259, 1539, 1198, 1198, 1440, 2260, 1197, 1440, 532, 532, 1440),
+    (1440, 2261, 2262, 1442, 1269, 1269, 1440),
+    (1440, 2263, 1125, 1446),
+    (1440, 1749, 2264, 1442, 2265, 2265, 1442, 2266, 2266, 1442),
+    (1440, 2266, 2266, 1442),
+    (1446, 2267, 1442),
+    (1446, 2268, 1442),
+    (1446, 627, 1440),
+    (1440, 2269, 2269, 1442),
+    (1485, 1758, 1442, 1759, 1442),
+    (1440, 2270, 2270, 1442, 2271, 2271, 1442),
+    (1446, 629, 1440),
+    (1440, 2023, 2023, 1442, 2089, 2089, 1442, 2024, 2024, 1442, 2022, 2022, 1442, 2090, 2090, 1442, 2091, 2091, 1442, 2092, 2092, 1442, 2095, 633, 1446, 2097, 2097, 1442, 1455, 1456, 1457),
+    (1446, 631, 1440),
+    (1446, 2272, 1442),
+    (1440, 1844, 1844, 1442, 1848, 1848, 1442, 1846, 1846, 1442, 1845, 1845, 1442, 1847, 637, 1446, 2098, 2098, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1446, 634, 1440),
+    (1440, 1546, 1546, 1442),
+    (1446, 2272, 1442),
+    (1440, 2273, 2273, 1442),
+    (1440, 638, 638, 1440),
+    (1440, 1982, 1982, 1442, 1850, 1850, 1442, 2274, 2275, 1442, 2276, 2277, 1442, 2164, 2278, 1539, 2279, 2280, 1539, 2281, 2282, 1539, 1277, 607, 1446, 1128, 1128, 1440),
+    (1440, 2283, 2283, 1442),
+    (1440, 1982, 1982, 1442, 1341, 1341, 1440, 2284, 1511, 1442, 1277, 1277, 1446, 2274, 2274, 1442, 2276, 2276, 1442, 2285, 2285, 1539, 2281, 2281, 1539, 2279, 2279, 1539, 2286, 2286, 1539, 25, 25, 1440, 1128, 1128, 1440),
+    (1446, 644, 1440),
+    (1440, 1849, 1849, 1442, 1850, 1850, 1442, 1455, 1456, 1457),
+    (1440, 1489, 1490, 1442, 1493, 1493, 1442, 1491, 1492, 1442, 1494, 913, 1446),
+    (1440, 1467, 2287, 1442, 1469, 1470, 1442, 1661, 2288, 1442, 2289, 1060, 1440, 2290, 1496, 1497, 1671, 1496, 1497, 2291, 2292, 1442),
+    (1446, 646, 1440),
+    (1440, 2293, 2294, 1442, 2295, 658, 1440, 2296, 1061, 1440, 2297, 666, 1485, 16, 645, 1440, 1508, 1508, 1442, 705, 705, 1446, 1427, 1427, 1440, 1052, 1052, 1440, 1176, 1176, 1440, 665, 665, 1440, 1263, 1263, 1440, 1830, 1496, 1497, 1611, 1496, 1497, 1964, 1496, 1497, 113, 113, 1440, 1188, 1188, 1440, 1586, 650, 1485),
+    (1446, 648, 1440),
+    (1485, 2298, 1442, 2299, 1442),
+    (1446, 652, 1440),
+    (1440, 2300, 2294, 1442, 1963, 1963, 1442, 1965, 1965, 1442, 2301, 1851, 1442, 1455, 1456, 1457, 2150, 1456, 1457, 2151, 1456, 1457, 2148, 2148, 1442, 2302, 666, 1485, 1501, 1501, 1442, 602, 602, 1440, 1567, 1567, 1442),
+    (1440, 1730, 2303, 1442, 1736, 2304, 1539, 1926, 1926, 1539),
+    (1446, 653, 1440),
+    (1440, 2305, 1900, 1539, 2306, 1456, 1457),
+    (1440, 2307, 2308, 1442, 2309, 661, 1440, 658, 658, 1440, 1180, 1180, 1440, 1061, 1061, 1440, 2310, 2310, 1442, 1338, 1338, 1440, 2311, 2311, 1539),
+    (1440, 2312, 1900, 1539),
+    (1440, 1661, 2245, 1442, 1600, 1600, 1442),
+    (1446, 658, 1440),
+    (1440, 1851, 1851, 1442, 1854, 1854, 1442, 656, 656, 1440, 1299, 648, 1440, 1852, 649, 1446, 2100, 2100, 1442, 1455, 1456, 1457, 2101, 1456, 1457, 1458, 1456, 1457, 1300, 1300, 1440, 1042, 1042, 1440, 2102, 652, 1440, 2103, 652, 1440, 1853, 664, 1440, 1501, 1501, 1442, 2104, 655, 1440, 2105, 657, 1440, 1465, 1274, 1446),
+    (1440, 667, 667, 1440),
+    (1446, 663, 1440),
+    (1440, 1851, 1851, 1442, 1854, 1854, 1442, 2100, 2100, 1442, 2307, 2308, 1442, 1455, 1456, 1457, 2101, 1456, 1457, 1458, 1456, 1457, 1300, 1300, 1440, 1042, 1042, 1440, 1180, 1180, 1440),
+    (1440, 1065, 1065, 1446, 2313, 2314, 1442),
+    (1440, 1730, 2303, 1442, 1736, 2304, 1539, 1926, 2012, 1539, 1610, 1545, 1442, 2315, 2316, 1442, 2317, 654, 1446),
+    (1485, 2318, 1442, 2292, 1442),
+    (1440, 2319, 2320, 1539, 2321, 2322, 1539),
+    (1440, 1602, 1502, 1442, 2323, 1502, 1442, 2324, 1502, 1442),
+    (1440, 2325, 2325, 1442, 1453, 2175, 1442, 2266, 2266, 1442),
+    (1446, 669, 1440),
+    (1440, 1455, 1456, 1457, 1469, 1855, 1442, 1835, 1856, 1442, 1501, 1501, 1442, 1858, 1858, 1442, 1857, 1857, 1442, 2106, 2106, 1442, 1458, 1456, 1457),
+    (1440, 1595, 64, 1440),
+    (1440, 2326, 2326, 1442, 1172, 1172, 1440),
+    (1446, 2327, 1442),
+    (1440, 1455, 1456, 1457, 1501, 1501, 1442, 1858, 1858, 1442, 1870, 1870, 1442, 2108, 2108, 1442, 1458, 1456, 1457, 1480, 1984, 1539),
+    (1446, 675, 1440),
+    (1446, 671, 1440),
+    (1440, 2023, 2023, 1442, 2024, 2024, 1442, 2022, 2022, 1442, 2090, 2090, 1442, 1844, 1844, 1442, 2091, 2091, 1442, 2092, 2092, 1442, 2093, 2093, 1442, 2094, 2094, 1442, 2095, 633, 1446, 1465, 1274, 1446),
+    (1440, 1848, 1848, 1442, 2089, 2089, 1442),
+    (1440, 2328, 2329, 1588, 2330, 2331, 1588, 2332, 2333, 1539, 2334, 2333, 1539),
+    (1440, 671, 1583, 1442, 2335, 1585, 1442, 1586, 571, 1485),
+    (1440, 371, 371, 1440, 2335, 1585, 1442, 1586, 571, 1485),
+    (1440, 2336, 2337, 1539),
+    (1440, 2338, 2337, 1539, 2339, 2337, 1539),
+    (1440, 1823, 1823, 1442, 2340, 681, 1440, 2341, 687, 1440, 2342, 680, 1440),
+    (1440, 1823, 1823, 1442, 2340, 682, 1440, 2341, 687, 1440, 2342, 680, 1440),
+    (1440, 2343, 2344, 1539, 2345, 2346, 1539),
+    (1440, 1455, 1456, 1457, 1875, 1875, 1442, 1871, 1871, 1442, 1833, 1833, 1442, 1832, 1832, 1442, 1872, 1872, 1442, 2109, 2109, 1442, 1458, 1456, 1457),
+    (1446, 688, 1440),
+    (1440, 1598, 2347, 1442),
+    (1440, 2348, 1547, 1442, 1882, 1545, 1442, 1579, 101, 1440),
+    (1446, 694, 1440),
+    (1440, 1970, 1456, 1457, 1570, 1456, 1457),
+    (1440, 1467, 1876, 1442, 1661, 1877, 1442, 1878, 693, 1440, 1453, 2110, 1442, 2111, 2112, 1442, 1469, 1879, 1442, 1455, 1456, 1457, 2113, 1456, 1457, 1458, 1456, 1457, 1508, 1508, 1442),
+    (1440, 2349, 1900, 1539, 2350, 1900, 1539),
+    (1440, 2257, 1502, 1442, 2158, 1161, 1440, 2351, 565, 1440, 933, 933, 1440, 2352, 2352, 1457, 2353, 2353, 1457),
+    (1446, 696, 1440),
+    (1440, 1884, 1885, 1442, 1887, 1888, 1442, 1864, 1886, 1442, 1890, 1891, 1442, 1453, 2114, 1442, 1455, 1455, 1457, 2113, 1456, 1457, 1508, 1508, 1442, 1458, 1458, 1457, 1501, 1501, 1442, 1823, 1823, 1442, 1914, 1478, 1442, 1799, 1620, 1442),
+    (1440, 2354, 2355, 1442, 1884, 1885, 1442, 1453, 2114, 1442, 2356, 1149, 1440),
+    (1446, 699, 1440),
+    (1446, 698, 1440),
+    (1440, 1471, 964, 1446, 1472, 1309, 1446, 1473, 1146, 1446, 1474, 157, 1446, 1475, 1183, 1446),
+    (1440, 2357, 2357, 1497),
+    (1440, 1478, 1478, 1442, 2036, 2036, 1442, 2358, 2358, 1442, 2359, 2359, 1442),
+    (1446, 110, 1440),
+    (1446, 1493, 1442),
+    (1440, 1730, 2303, 1442, 1736, 2304, 1539, 1728, 1728, 1442),
+    (1446, 1728, 1442),
+    (1446, 707, 1440),
+    (1440, 2360, 2360, 1442),
+    (1440, 1467, 1612, 1442, 1787, 1614, 1442, 1788, 1614, 1442, 1789, 1790, 1442),
+    (1440, 1787, 1614, 1442, 1788, 1614, 1442),
+    (1446, 711, 1440),
+    (1440, 1738, 1738, 1442),
+    (1440, 1738, 1738, 1442),
+    (1440, 1738, 1738, 1442),
+    (1440, 1832, 1832, 1442, 1579, 2361, 1442, 2362, 2361, 1442, 2363, 2364, 1442, 2365, 2365, 1442, 2366, 2367, 1442, 2368, 2369, 1539, 2370, 2371, 1539),
+    (1440, 2365, 2361, 1442, 2372, 2361, 1442, 2373, 2361, 1442),
+    (1440, 1832, 1832, 1442, 2374, 2375, 2376, 1579, 2361, 1442, 2362, 2361, 1442, 2363, 2364, 1442, 2377, 2378, 1442, 2379, 2380, 1442, 2381, 2382, 1442, 2365, 2365, 1442, 1684, 2383, 1442, 1871, 2384, 1442),
+    (1440, 2374, 2375, 2376, 1579, 2361, 1442, 2385, 2361, 1442, 2363, 2364, 1442),
+    (1440, 1832, 1832, 1442, 2374, 2375, 2376, 1579, 2361, 1442, 2362, 2361, 1442, 2363, 2364, 1442, 2379, 2380, 1442, 2381, 2382, 1442, 2365, 2365, 1442, 1871, 2384, 1442),
+    (1440, 2374, 1184, 1440, 1579, 2361, 1442, 2385, 2361, 1442, 2363, 2364, 1442),
+    (1446, 2386, 1442),
+    (1440, 595, 595, 1440, 152, 152, 1440),
+    (1440, 1748, 1182, 1440, 283, 283, 1446, 750, 750, 1446, 136, 136, 1446),
+    (1440, 1748, 1182, 1440, 750, 750, 1446, 136, 136, 1446),
+    (1440, 1453, 2175, 1442),
+    (1440, 1748, 1182, 1440, 283, 283, 1446, 750, 750, 1446),
+    (1440, 731, 731, 1446, 595, 595, 1440),
+    (1440, 1467, 2387, 1442, 1835, 2388, 1442),
+    (1446, 730, 1440),
+    (1440, 2389, 2390, 1539, 2391, 2390, 1539, 2392, 2390, 1539, 2393, 2390, 1539, 2394, 2390, 1539),
+    (1440, 2391, 2390, 1539, 2395, 2390, 1539, 2396, 2390, 1539),
+    (1440, 2397, 2397, 1442, 2398, 1909, 1442, 742, 742, 1440),
+    (1440, 156, 156, 1446),
+    (1440, 1191, 743, 1440, 2399, 744, 1440),
+    (1440, 1892, 1892, 1442, 2116, 2116, 1442, 2400, 2401, 1442, 1455, 1456, 1457, 732, 733, 1440, 2285, 2285, 1539),
+    (1446, 737, 1440),
+    (1440, 295, 736, 1440, 2402, 735, 1440),
+    (1440, 2403, 1478, 1442, 2404, 1909, 1442),
+    (1440, 1546, 1478, 1442, 1545, 1545, 1442, 1542, 1542, 1442),
+    (1440, 1610, 1545, 1442, 1427, 1427, 1440),
+    (1440, 2405, 1478, 1442),
+    (1440, 1542, 1542, 1442),
+    (1440, 2406, 2406, 1539, 2407, 2407, 1539),
+    (1440, 1892, 1892, 1442, 1895, 1895, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2115, 2115, 1442, 732, 732, 1440, 1982, 1982, 1442, 2284, 1511, 1442, 1510, 1511, 1442, 1501, 1501, 1442, 740, 740, 1440, 704, 739, 1440),
+    (1446, 746, 1440),
+    (1440, 1602, 1444, 1442, 1654, 1054, 1446),
+    (1440, 1453, 2408, 1442, 1501, 1501, 1442),
+    (1446, 1962, 1442),
+    (1485, 1521, 1442, 1521, 1442),
+    (1446, 753, 1440),
+    (1440, 2039, 2039, 1442, 2117, 1449, 1442, 1835, 1449, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 1441, 1441, 1442, 1451, 1444, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2412, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 1, 1, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1455, 1457, 2415, 1455, 1457, 2070, 2070, 1539, 2416, 2416, 1442, 2053, 2053, 1442, 2411, 2417, 1442, 2413, 2413, 1442),
+    (1440, 21, 21, 1446, 2053, 2053, 1442),
+    (1440, 1857, 1857, 1442, 2025, 2026, 1442, 1480, 1984, 1539, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 1194, 1194, 1446, 2053, 2053, 1442),
+    (1440, 2070, 2070, 1539, 2053, 2053, 1442, 2416, 1519, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2418, 1456, 1457, 2419, 1456, 1457, 2411, 2420, 1442, 2413, 2413, 1442),
+    (1440, 2053, 2053, 1442, 2421, 28, 1446),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2413, 2413, 1442, 2411, 2422, 1442, 2423, 1512, 1442, 2424, 1513, 1442, 2425, 1514, 1442),
+    (1440, 2426, 29, 1446, 2053, 2053, 1442),
+    (1440, 1441, 1441, 1442, 1529, 1444, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2427, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 35, 35, 1446, 2053, 2053, 1442),
+    (1440, 1459, 1460, 1442, 1461, 1460, 1442, 1443, 1444, 1442, 1534, 1444, 1442, 1462, 1463, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2428, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 39, 39, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 2431, 1442, 2432, 1605, 1442, 2413, 2433, 1442, 2411, 2434, 1442, 2070, 2435, 1539, 2053, 2053, 1442),
+    (1440, 69, 69, 1446, 2053, 2053, 1442),
+    (1440, 1604, 1604, 1442, 2432, 1568, 1442, 2436, 1566, 1442, 2413, 2433, 1442, 2411, 2437, 1442, 2070, 2438, 1539, 2053, 2053, 1442),
+    (1440, 2439, 54, 1446, 2053, 2053, 1442),
+    (1440, 1746, 2020, 1442, 2414, 1456, 1457, 2415, 1456, 1457, 2440, 1729, 1442, 2070, 2070, 1539, 2053, 2053, 1442, 2411, 2441, 1442, 2413, 2413, 1442),
+    (1440, 2053, 2053, 1442, 131, 131, 1446),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2070, 2070, 1539, 2416, 2416, 1442, 2053, 2053, 1442, 2411, 2441, 1442, 2413, 2413, 1442),
+    (1440, 2053, 2053, 1442, 133, 133, 1446),
+    (1440, 2414, 1455, 1457, 2415, 1455, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2070, 2070, 1539, 2416, 2442, 1442, 2053, 2053, 1442, 2411, 2443, 1442, 2413, 2444, 1442),
+    (1440, 139, 139, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2414, 1455, 1457, 2415, 1455, 1457, 2429, 1458, 1457, 2430, 1458, 1457, 2416, 2416, 1442, 2432, 1772, 1442, 2411, 2445, 1442, 2413, 2413, 1442),
+    (1440, 146, 146, 1446, 2053, 2053, 1442),
+    (1440, 1441, 1441, 1442, 1786, 1444, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2446, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 159, 159, 1446, 2053, 2053, 1442),
+    (1440, 1832, 1832, 1442, 2411, 2447, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2416, 2416, 1442, 2415, 1456, 1457, 2414, 1456, 1457),
+    (1440, 2448, 1011, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2449, 1539, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 2416, 1442, 2411, 2450, 1442, 2413, 2413, 1442),
+    (1440, 508, 508, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2449, 1539, 2451, 1456, 1457, 1823, 1468, 1442, 1806, 1468, 1442),
+    (1440, 513, 513, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2452, 523, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2449, 1539, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 2416, 1442, 2453, 2416, 1442, 2411, 2454, 1442, 2413, 2413, 1442),
+    (1440, 541, 541, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2449, 1539, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 2416, 1442, 2455, 2416, 1442, 2432, 2076, 1442, 2411, 2456, 1442, 2413, 2413, 1442),
+    (1440, 551, 551, 1446, 2053, 2053, 1442),
+    (1440, 2411, 2457, 1442, 2413, 2458, 1442, 2053, 2459, 1442, 2070, 2070, 1539, 2416, 2460, 1442, 2415, 1456, 1457, 2414, 1456, 1457),
+    (1440, 2461, 559, 1446, 2053, 2459, 1442),
+    (1440, 2411, 2462, 1442, 2413, 2458, 1442, 2053, 2459, 1442, 2070, 2070, 1539, 2416, 2463, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2430, 1456, 1457, 2429, 1456, 1457, 2432, 2081, 1442),
+    (1440, 570, 569, 1446, 2053, 2459, 1442),
+    (1440, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2464, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 578, 578, 1446, 2053, 2053, 1442),
+    (1440, 2416, 2465, 1442, 2466, 2084, 1442, 2467, 2468, 1442, 2414, 1455, 1457, 2415, 1455, 1457, 2413, 2469, 1442, 2411, 2470, 1442, 2070, 2471, 1539, 2053, 2053, 1442),
+    (1440, 587, 587, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 605, 605, 1446, 2053, 2053, 1442),
+    (1440, 1844, 1844, 1442, 2022, 2022, 1442, 2023, 2023, 1442, 2472, 2024, 1442, 2473, 2090, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2411, 2474, 1442, 2413, 2413, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 2475, 632, 1446, 2053, 2053, 1442),
+    (1440, 1844, 1844, 1442, 2022, 2022, 1442, 2416, 2416, 1442, 2473, 2090, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2411, 2474, 1442, 2413, 2413, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 2475, 632, 1446, 2053, 2053, 1442),
+    (1440, 2416, 2416, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2430, 1456, 1457, 2429, 1456, 1457, 2411, 2476, 1442, 2413, 2413, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 2477, 635, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 643, 643, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2411, 2478, 1442, 2413, 2413, 1442, 2416, 2416, 1442, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2432, 2100, 1442),
+    (1440, 662, 662, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 1857, 1857, 1442, 2429, 1456, 1457, 2430, 1456, 1457, 2070, 2070, 1539, 2053, 2053, 1442, 2411, 2479, 1442, 2413, 2480, 1442),
+    (1440, 676, 676, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2070, 2070, 1539, 2416, 2481, 1442, 2053, 2053, 1442, 2411, 2482, 1442, 2413, 2483, 1442),
+    (1440, 677, 677, 1446, 2053, 2053, 1442),
+    (1440, 2411, 2484, 1442, 2413, 2458, 1442, 2053, 2459, 1442, 2070, 2070, 1539, 2416, 2485, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2430, 1456, 1457, 2429, 1456, 1457, 2432, 2109, 1442, 2486, 1832, 1442, 2487, 1872, 1442),
+    (1440, 2488, 689, 1446, 2053, 2459, 1442),
+    (1440, 2416, 2416, 1442, 1661, 1877, 1442, 2432, 2110, 1442, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2411, 2489, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2490, 692, 1446, 2053, 2053, 1442),
+    (1440, 1884, 1885, 1442, 1453, 2114, 1442, 2354, 2355, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 2491, 700, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1455, 1457, 2415, 1455, 1457, 2429, 1458, 1457, 2430, 1458, 1457, 2416, 2416, 1442, 2432, 2114, 1442, 2411, 2492, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2493, 1823, 1442, 2494, 1620, 1442),
+    (1440, 701, 701, 1446, 2053, 2053, 1442),
+    (1440, 1982, 1982, 1442, 2070, 2070, 1539, 2053, 2053, 1442, 2414, 1456, 1457, 2415, 1456, 1457, 2495, 2495, 1442, 2411, 2496, 1442, 2413, 2413, 1442),
+    (1440, 747, 738, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2070, 2070, 1539, 2053, 2053, 1442, 2416, 2416, 1442, 2411, 2411, 1442, 2413, 2413, 1442, 2432, 2115, 1442),
+    (1440, 747, 747, 1446, 2053, 2053, 1442),
+    (1446, 1521, 1442),
+    (1440, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2497, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 752, 752, 1446, 2053, 2053, 1442),
+    (1440, 1832, 1832, 1442, 2411, 2447, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2416, 2416, 1442, 2415, 1456, 1457, 2414, 1456, 1457),
+    (1440, 2448, 1011, 1446, 2053, 2053, 1442),
+    (1440, 1897, 1468, 1442, 1899, 1900, 1539, 2414, 1456, 1457, 2415, 1456, 1457, 2498, 1468, 1442, 2432, 2118, 1442, 2411, 2499, 1442, 2413, 2500, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2501, 925, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2070, 2070, 1539, 1897, 1898, 1442, 1905, 1905, 1442, 2053, 2053, 1442, 2411, 2502, 1442, 2413, 2503, 1442),
+    (1440, 931, 931, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2070, 2070, 1539, 2416, 1468, 1442, 1905, 1905, 1442, 2053, 2053, 1442, 2411, 2504, 1442, 2413, 2503, 1442),
+    (1440, 2505, 929, 1446, 2053, 2053, 1442),
+    (1440, 1832, 1832, 1442, 2411, 2447, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2416, 2416, 1442, 2415, 1456, 1457, 2414, 1456, 1457),
+    (1440, 2448, 1011, 1446, 2053, 2053, 1442),
+    (1440, 1200, 956, 1440, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 957, 957, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1455, 1457, 2415, 1455, 1457, 2070, 2070, 1539, 2416, 2416, 1442, 2053, 2053, 1442, 2411, 2506, 1442, 2413, 2413, 1442),
+    (1440, 967, 967, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1455, 1457, 2415, 1455, 1457, 2070, 2070, 1539, 2416, 2416, 1442, 1625, 1625, 1442, 1621, 1492, 1442, 2507, 2507, 1442, 2053, 2053, 1442, 2411, 2508, 1442, 2413, 2413, 1442),
+    (1440, 973, 973, 1446, 2053, 2053, 1442),
+    (1440, 1832, 1832, 1442, 2411, 2447, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2416, 2416, 1442, 2415, 1456, 1457, 2414, 1456, 1457),
+    (1440, 2448, 1011, 1446, 2053, 2053, 1442),
+    (1440, 2411, 2509, 1442, 2413, 2458, 1442, 2053, 2459, 1442, 2070, 2070, 1539, 2416, 2455, 1442, 2415, 1456, 1457, 2414, 1456, 1457),
+    (1440, 2061, 985, 1446, 2053, 2459, 1442),
+    (1440, 1919, 1919, 1442, 2510, 2510, 1442, 2411, 2511, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2415, 1456, 1457, 2414, 1456, 1457, 2432, 2512, 1442),
+    (1440, 2513, 992, 1446, 2053, 2053, 1442),
+    (1440, 1919, 1919, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2514, 995, 1446, 2053, 2053, 1442),
+    (1440, 1919, 1919, 1442, 1832, 1832, 1442, 2411, 2515, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2516, 1456, 1457, 2517, 1456, 1457, 2415, 1456, 1457, 2414, 1456, 1457, 2430, 1456, 1457, 2429, 1456, 1457, 2432, 2518, 1442, 1801, 1801, 1442, 2519, 2127, 1442),
+    (1440, 2520, 1005, 1446, 2053, 2053, 1442),
+    (1440, 1832, 1832, 1442, 2411, 2521, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2416, 2416, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2430, 1456, 1457, 2429, 1456, 1457, 2432, 2126, 1442, 1801, 1801, 1442, 2519, 2127, 1442),
+    (1440, 2522, 1024, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2411, 2523, 1442, 2413, 2524, 1442, 2416, 2525, 1442, 2415, 1455, 1457, 2414, 1455, 1457, 2430, 1458, 1457, 2429, 1458, 1457),
+    (1440, 2053, 2053, 1442, 2526, 1037, 1446),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2411, 2527, 1442, 2413, 2528, 1442, 2416, 2529, 1442, 2415, 1455, 1457, 2414, 1455, 1457, 2430, 1458, 1457, 2429, 1458, 1457, 2432, 2129, 1442, 2525, 1924, 1442, 2530, 2531, 1442, 2532, 1466, 1442),
+    (1440, 2053, 2053, 1442, 2533, 1040, 1446),
+    (1440, 1651, 1651, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2413, 2413, 1442),
+    (1440, 2534, 1077, 1446, 2053, 2053, 1442),
+    (1440, 1936, 2136, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2535, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2536, 1080, 1446, 2053, 2053, 1442),
+    (1440, 1651, 1651, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2537, 1059, 1446, 2053, 2053, 1442),
+    (1440, 2538, 1936, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2539, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 2540, 1083, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 1502, 1442, 2432, 2139, 1442, 2411, 2411, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 1092, 1092, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2070, 2070, 1539, 2416, 1952, 1442, 2053, 2053, 1442, 2411, 2541, 1442, 2413, 2542, 1442),
+    (1440, 1122, 1122, 1446, 2053, 2053, 1442),
+    (1440, 2416, 2543, 1442, 2414, 1456, 1457, 2415, 1456, 1457, 2413, 2544, 1442, 2411, 2545, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 2546, 1175, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2413, 2413, 1442, 2411, 2547, 1442, 2423, 1512, 1442, 2548, 1514, 1442),
+    (1440, 2549, 1233, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2449, 1539, 1818, 1468, 1442, 2550, 1496, 1497, 2021, 1468, 1442),
+    (1440, 506, 506, 1446, 2053, 2053, 1442),
+    (1440, 2070, 2070, 1539, 2053, 2053, 1442, 2416, 1959, 1442, 2551, 1961, 1442, 2415, 1456, 1457, 2414, 1456, 1457, 2418, 1456, 1457, 2419, 1456, 1457, 2411, 2552, 1442, 2413, 2413, 1442),
+    (1440, 2053, 2053, 1442, 2553, 1265, 1446),
+    (1440, 2416, 1980, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 1268, 1268, 1446, 2053, 2053, 1442),
+    (1440, 1464, 1464, 1442, 2053, 2053, 1442, 2070, 2554, 1539),
+    (1440, 1465, 1274, 1446, 2053, 2053, 1442),
+    (1440, 1851, 1851, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2432, 2148, 1442, 2411, 2555, 1442, 2413, 2413, 1442),
+    (1440, 1302, 651, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 2416, 1442, 2432, 2148, 1442, 2411, 2411, 1442, 2413, 2413, 1442, 2556, 2557, 1442),
+    (1440, 1302, 1302, 1446, 2053, 2053, 1442),
+    (1440, 2414, 1456, 1457, 2415, 1456, 1457, 2429, 1456, 1457, 2430, 1456, 1457, 2416, 2416, 1442, 2432, 2155, 1442, 2411, 2411, 1442, 2413, 2413, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 1313, 1313, 1446, 2053, 2053, 1442),
+    (1446, 2558, 1442),
+    (1440, 1834, 1449, 1442, 1531, 1449, 1442, 1459, 1444, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2559, 1442, 2413, 2413, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 1332, 1332, 1446, 2053, 2053, 1442),
+    (1440, 1834, 1449, 1442, 1530, 1449, 1442, 2409, 1456, 1457, 2410, 1456, 1457, 2411, 2560, 1442, 2413, 2413, 1442, 2070, 2070, 1539, 2053, 2053, 1442),
+    (1440, 1335, 1335, 1446, 2053, 2053, 1442),
+    (1440, 2053, 2053, 1442, 2070, 2070, 1539, 2413, 2413, 1442, 2411, 2561, 1442, 2423, 1512, 1442, 2562, 1513, 1442),
+    (1440, 2563, 1417, 1446, 2053, 2053, 1442),
+    (1440, 2411, 2564, 1442, 2413, 2413, 1442, 2416, 1977, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 1436, 1436, 1446, 2053, 2053, 1442),
+    (1440, 2411, 2565, 1442, 2413, 2413, 1442, 2416, 1980, 1442, 2053, 2053, 1442, 2070, 2070, 1539),
+    (1440, 1439, 1439, 1446, 2053, 2053, 1442),
+    (1440, 141, 141, 1440, 1047, 1047, 1440),
+    (1446, 906, 1440),
+    (1440, 2566, 2567, 1442, 2568, 2567, 1442, 2569, 2567, 1442, 1955, 2567, 1442),
+    (1440, 1600, 1600, 1442, 1526, 2570, 1588, 1456, 1456, 1457),
+    (1446, 911, 1440),
+    (1440, 1600, 1601, 1442, 1526, 2570, 1588, 2571, 2572, 1442, 2244, 2573, 1442),
+    (1440, 1467, 1600, 1442, 2574, 2575, 1442),
+    (1446, 912, 1440),
+    (1440, 2576, 1084, 1440, 2577, 287, 1440),
+    (1440, 1579, 1579, 1442, 2231, 2231, 1442, 1478, 1478, 1442),
+    (1440, 1823, 1823, 1442, 1908, 153, 1440, 1471, 154, 1446, 690, 690, 1440, 1829, 1508, 1442, 1427, 1427, 1440, 1455, 1456, 1457, 1909, 1909, 1442, 1830, 1496, 1497, 1465, 1274, 1446, 374, 374, 1440),
+    (1440, 2578, 2578, 1497),
+    (1440, 2579, 1478, 1442),
+    (1440, 1520, 1520, 1442, 2580, 1478, 1442, 1586, 1003, 1485),
+    (1440, 2005, 1949, 1442, 2006, 999, 1440),
+    (1440, 561, 561, 1440, 89, 89, 1440, 2581, 1006, 1440),
+    (1440, 1906, 1906, 1442, 1897, 1468, 1442, 1899, 1900, 1539, 1903, 1904, 1442, 1905, 1905, 1442, 1596, 927, 1440, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 1465, 1274, 1446, 2582, 1502, 1442, 2583, 1502, 1442, 1621, 1502, 1442),
+    (1440, 2584, 1478, 1442),
+    (1440, 1901, 1468, 1442, 1902, 1902, 1442, 1453, 2118, 1442, 1897, 1468, 1442, 1899, 1900, 1539, 2119, 1456, 1457, 2120, 1456, 1457),
+    (1446, 924, 1440),
+    (1440, 1546, 1478, 1442),
+    (1440, 1545, 1545, 1442),
+    (1440, 1897, 1468, 1442, 1906, 1906, 1442, 1905, 1905, 1442, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1446, 928, 1440),
+    (1440, 1897, 1468, 1442, 1906, 1906, 1442, 1905, 1905, 1442, 1899, 1900, 1539, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1446, 930, 1440),
+    (1440, 2585, 2585, 1539, 2586, 2586, 1539),
+    (1440, 1781, 1781, 1442, 574, 574, 1446, 1760, 2587, 1442),
+    (1440, 1832, 1832, 1442, 1833, 1833, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2081, 2081, 1442),
+    (1446, 934, 1440),
+    (1440, 2588, 1496, 1497),
+    (1440, 916, 916, 1440, 570, 935, 1446, 2589, 1310, 1440, 2215, 940, 1446, 922, 938, 1440),
+    (1440, 1906, 1906, 1442, 1897, 1468, 1442, 1899, 1900, 1539, 1905, 1905, 1442, 1596, 927, 1440, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 1465, 1274, 1446, 2582, 1502, 1442, 2583, 1502, 1442),
+    (1440, 1920, 1920, 1442, 1919, 1919, 1442, 2125, 2126, 1442, 2127, 2127, 1442, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1021, 1021, 1440, 1832, 1832, 1442, 2514, 995, 1446, 2128, 1004, 1440, 89, 89, 1440),
+    (1446, 939, 1440),
+    (1440, 2182, 915, 1440, 2181, 915, 1440),
+    (1440, 1191, 1192, 1440),
+    (1440, 2590, 2590, 1497, 1832, 1832, 1442),
+    (1440, 1832, 1832, 1442),
+    (1440, 2591, 2591, 1442),
+    (1440, 1738, 1738, 1442, 2592, 2593, 1539, 2594, 1738, 1442, 2595, 2595, 1442),
+    (1440, 1520, 1520, 1442, 2580, 1478, 1442, 1586, 1003, 1485),
+    (1440, 2005, 1949, 1442, 2006, 999, 1440),
+    (1440, 561, 561, 1440, 89, 89, 1440),
+    (1440, 2596, 2597, 1442, 1143, 1143, 1440),
+    (1440, 2036, 2036, 1442),
+    (1440, 2598, 1452, 1442, 2599, 1900, 1539),
+    (1446, 952, 1440),
+    (1440, 1467, 2600, 1442, 1526, 1444, 1442),
+    (1446, 954, 1440),
+    (1440, 2601, 955, 1446),
+    (1446, 958, 1440),
+    (1440, 1912, 1502, 1442, 2358, 1502, 1442, 1913, 1502, 1442, 916, 1502, 1442, 2359, 1502, 1442),
+    (1440, 977, 977, 1440, 941, 941, 1440, 91, 91, 1440, 580, 580, 1440),
+    (1440, 1738, 1738, 1442),
+    (1440, 1779, 1468, 1442, 1621, 1468, 1442, 1622, 1622, 1539, 1620, 1620, 1442, 1623, 1470, 1442, 1455, 1455, 1457, 702, 702, 1440, 1228, 1228, 1440, 1794, 976, 1440, 1624, 1624, 1442, 968, 968, 1440, 1795, 1795, 1497, 1625, 1625, 1442, 1537, 1415, 1440, 908, 908, 1440, 959, 959, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 2124, 2124, 1442, 1912, 1502, 1442, 1913, 1502, 1442, 1914, 1502, 1442, 9, 9, 1446, 1441, 1917, 1442, 1465, 1274, 1446, 1915, 286, 1485, 527, 527, 1440, 1916, 1916, 1442),
+    (1446, 1620, 1442),
+    (1440, 1777, 1777, 1442, 671, 1583, 1442, 2602, 2602, 1442, 1584, 1585, 1442, 942, 942, 1440, 2040, 2040, 1442, 1586, 571, 1485, 951, 951, 1440, 2358, 1502, 1442, 2359, 2603, 1442, 2604, 1502, 1442, 10, 10, 1440),
+    (1446, 963, 1440),
+    (1440, 1621, 1468, 1442, 1911, 1911, 1442, 1910, 1470, 1442, 1455, 1455, 1457, 1537, 1415, 1440, 2123, 2123, 1442, 1465, 1274, 1446),
+    (1440, 1621, 1468, 1442, 1911, 1911, 1442, 1910, 1470, 1442, 1455, 1455, 1457, 2123, 2123, 1442),
+    (1446, 966, 1440),
+    (1440, 1498, 970, 1446, 1499, 970, 1446),
+    (1440, 1467, 1468, 1442, 1453, 2605, 1442, 1501, 1502, 1442),
+    (1446, 969, 1440),
+    (1485, 1620, 1442, 88, 1440),
+    (1440, 1779, 1468, 1442, 1621, 1468, 1442, 1622, 1622, 1539, 1620, 1620, 1442, 1623, 1470, 1442, 1455, 1455, 1457, 1624, 1624, 1442, 1625, 1625, 1442),
+    (1446, 972, 1440),
+    (1440, 1506, 1468, 1442, 1311, 1311, 1440),
+    (1446, 974, 1440),
+    (1440, 1507, 1508, 1442, 1509, 975, 1446),
+    (1440, 2182, 915, 1440, 2181, 915, 1440),
+    (1440, 1520, 1520, 1442, 155, 155, 1446, 151, 1000, 1446, 2003, 1478, 1442, 2004, 1478, 1442, 1797, 2606, 1442, 1586, 1003, 1485),
+    (1440, 2005, 1949, 1442, 2006, 999, 1440),
+    (1440, 561, 561, 1440, 89, 89, 1440, 2581, 1006, 1440),
+    (1440, 1453, 2175, 1442, 2607, 1508, 1442),
+    (1440, 1602, 1444, 1442),
+    (1440, 1738, 1738, 1442, 1618, 1618, 1442),
+    (1440, 1823, 1823, 1442, 1909, 1909, 1442, 1455, 1456, 1457),
+    (1446, 984, 1440),
+    (1485, 2608, 1442, 2609, 1442),
+    (1440, 1823, 1823, 1442, 1872, 2608, 1442, 2610, 950, 1440),
+    (1446, 987, 1440),
+    (1440, 1823, 1823, 1442, 1872, 2608, 1442, 2610, 950, 1440, 1453, 2611, 1442),
+    (1446, 989, 1440),
+    (1440, 2612, 936, 1440),
+    (1446, 993, 1440),
+    (1440, 1919, 1919, 1442, 2510, 2510, 1442, 1455, 1456, 1457, 2613, 2512, 1442),
+    (1440, 2510, 2510, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2613, 2512, 1442, 2614, 2615, 1539, 2616, 2617, 1539, 2618, 991, 1440),
+    (1446, 994, 1440),
+    (1440, 1520, 1520, 1442, 155, 155, 1446, 151, 1000, 1446, 2003, 1478, 1442, 2004, 1478, 1442),
+    (1440, 2005, 1949, 1442, 2006, 999, 1440, 2007, 1025, 1440),
+    (1440, 1736, 2619, 1539, 1730, 2011, 1442, 1926, 2620, 1539, 1610, 1545, 1442),
+    (1440, 1478, 1478, 1442),
+    (1446, 1775, 1442),
+    (1440, 2361, 1496, 1497),
+    (1440, 2621, 1001, 1440, 2622, 1012, 1440, 2623, 1017, 1440),
+    (1485, 2624, 1442, 2625, 1442),
+    (1440, 1919, 1919, 1442, 2626, 1456, 1457, 1455, 1456, 1457, 1458, 1456, 1457, 2627, 2518, 1442, 1950, 1950, 1442, 1832, 1832, 1442, 1501, 1501, 1442, 1801, 1801, 1442, 2127, 2127, 1442),
+    (1446, 1004, 1440),
+    (1440, 1478, 2628, 1442),
+    (1440, 561, 561, 1440, 89, 89, 1440),
+    (1446, 1007, 1440),
+    (1440, 2629, 997, 1440, 1008, 1008, 1446, 1015, 1015, 1440, 1018, 1018, 1440, 996, 996, 1440, 1263, 1026, 1440, 1586, 1003, 1485, 1033, 1033, 1440, 1508, 1508, 1442),
+    (1440, 1801, 1801, 1442, 1805, 1805, 1442, 1455, 1456, 1457, 1832, 1832, 1442),
+    (1446, 1010, 1440),
+    (1440, 2630, 1496, 1497),
+    (1440, 1611, 1496, 1497, 1830, 1496, 1497, 1427, 1427, 1440),
+    (1440, 2631, 1019, 1440),
+    (1440, 1016, 1016, 1446, 1545, 1545, 1442),
+    (1446, 1014, 1440),
+    (1440,),
+    (1440, 2632, 998, 1440),
+    (1440, 1478, 2628, 1442, 1628, 1629, 1442, 2633, 2634, 1442),
+    (1440, 1920, 1920, 1442, 1919, 1919, 1442, 2125, 2126, 1442, 2127, 2127, 1442, 1501, 1501, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1021, 1021, 1440, 1832, 1832, 1442, 2128, 1004, 1440, 1465, 1274, 1446),
+    (1440, 1199, 1199, 1440, 1009, 1009, 1440, 1801, 1801, 1442, 2127, 2127, 1442),
+    (1446, 1020, 1440),
+    (1440, 1919, 1919, 1442, 1920, 1920, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2125, 2126, 1442, 1832, 1832, 1442, 1801, 1801, 1442, 2127, 2127, 1442),
+    (1446, 1023, 1440),
+    (1440, 1478, 1478, 1442),
+    (1440, 2635, 2636, 1539),
+    (1440, 2637, 2637, 1442),
+    (1440, 1208, 1029, 1446, 1266, 1030, 1446),
+    (1446, 2638, 1442),
+    (1446, 2639, 1442),
+    (1440, 2640, 2239, 1442, 2601, 600, 1446),
+    (1446, 1031, 1440),
+    (1440, 1611, 1496, 1497, 1830, 1496, 1497, 1427, 1427, 1440),
+    (1446, 2641, 1442),
+    (1446, 1038, 1440),
+    (1440, 1924, 1924, 1442, 1934, 1934, 1442, 1455, 1455, 1457, 1458, 1458, 1457),
+    (1446, 1036, 1440),
+    (1440, 1903, 2642, 1442),
+    (1440, 1921, 1921, 1442, 1935, 1935, 1442, 2129, 2129, 1442, 1585, 1948, 1442, 1730, 1730, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1924, 1924, 1442, 1929, 1466, 1442, 1930, 7, 1446),
+    (1446, 1039, 1440),
+    (1440, 2643, 2643, 1442),
+    (1440, 2644, 2645, 1539, 2646, 2645, 1539, 2647, 2645, 1539),
+    (1440, 1193, 1193, 1440, 2648, 1496, 1497, 290, 290, 1440, 2649, 2649, 1442),
+    (1440, 1453, 2468, 1442, 2650, 2650, 1442),
+    (1440, 1754, 1754, 1442, 2651, 2651, 1442, 2652, 2653, 1442, 2654, 2653, 1442, 2655, 2653, 1442, 2656, 2653, 1442, 2657, 2653, 1442, 2658, 2653, 1442),
+    (1440, 1754, 1754, 1442, 2652, 2653, 1442, 2654, 2653, 1442, 2655, 2653, 1442, 2656, 2653, 1442, 2657, 2653, 1442, 2658, 2653, 1442),
+    (1440, 625, 625, 1446),
+    (1440, 1596, 1050, 1440, 2659, 1496, 1497, 1337, 1337, 1440, 2660, 2660, 1442),
+    (1440, 1337, 1337, 1440),
+    (1440, 1545, 1545, 1442),
+    (1440, 2207, 1478, 1442, 1765, 1765, 1442, 1275, 1275, 1440, 2661, 2661, 1442, 1545, 1545, 1442),
+    (1440, 1545, 1545, 1442, 1546, 1478, 1442, 1479, 2662, 1442),
+    (1440, 1467, 1444, 1442, 1526, 1678, 1442),
+    (1446, 1053, 1440),
+    (1440, 2663, 1513, 1442),
+    (1440, 2663, 1513, 1442),
+    (1440, 2664, 2664, 1539),
+    (1440, 1467, 2665, 1442, 1526, 1678, 1442),
+    (1446, 1058, 1440),
+    (1440, 712, 712, 1440, 162, 162, 1440, 106, 106, 1440),
+    (1440, 713, 713, 1446, 163, 163, 1446, 108, 108, 1446, 80, 80, 1446),
+    (1446, 1614, 1442),
+    (1440, 1531, 1449, 1442, 1834, 1449, 1442),
+    (1440, 1851, 1851, 1442),
+    (1446, 1064, 1440),
+    (1446, 1063, 1440),
+    (1440, 2666, 2667, 2376),
+    (1440, 1826, 1826, 1442, 1827, 1070, 1446, 1970, 1456, 1457, 1828, 1070, 1446),
+    (1440, 1872, 1872, 1442, 372, 372, 1446, 2668, 2162, 1588, 2161, 2162, 1588, 2669, 2164, 1539, 2163, 2164, 1539, 1730, 2216, 1442, 2670, 2671, 1442, 2672, 1110, 1446, 2673, 1107, 1440, 2674, 1107, 1440, 2675, 1105, 1440, 2676, 1106, 1440),
+    (1446, 1069, 1440),
+    (1440, 2677, 2677, 1539, 2678, 2678, 1539, 2679, 2680, 1539),
+    (1446, 1071, 1440),
+    (1440, 1942, 1942, 1442, 1936, 1936, 1442, 1937, 1936, 1442, 1939, 1939, 1442, 1508, 1508, 1442, 2137, 2137, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2138, 1456, 1457, 1537, 1415, 1440, 2038, 1415, 1440, 1057, 1057, 1440, 1465, 1274, 1446),
+    (1440, 2681, 2682, 1442, 2683, 2221, 1442, 2684, 2684, 1442),
+    (1440, 1942, 1942, 1442, 1651, 1651, 1442, 2131, 2132, 1442, 2133, 2133, 1442, 2134, 2134, 1442, 1081, 1081, 1440, 1501, 2135, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1537, 1415, 1440, 2038, 1415, 1440, 1057, 1057, 1440, 1211, 1211, 1440, 2537, 1059, 1446),
+    (1440, 2191, 2191, 1442, 2685, 2685, 1442, 2686, 2686, 1442, 1970, 1456, 1457, 1570, 1456, 1457, 2687, 2687, 1442, 93, 93, 1440, 1501, 1501, 1442, 2688, 1078, 1440, 2689, 1900, 1539, 1212, 1212, 1440),
+    (1446, 1076, 1440),
+    (1440, 1298, 1301, 1440, 1090, 1091, 1440, 1310, 1312, 1440, 2690, 1339, 1440, 916, 982, 1440, 2691, 1164, 1440, 2692, 149, 1440, 2693, 94, 1440, 2694, 748, 1440, 2695, 535, 1440, 2696, 1131, 1440, 2697, 115, 1440, 2698, 582, 1440, 2699, 68, 1440),
+    (1440, 1651, 1651, 1442, 1970, 1456, 1457, 2133, 2133, 1442, 2134, 2134, 1442, 2131, 2132, 1442, 2135, 2227, 1442),
+    (1446, 1079, 1440),
+    (1440, 1834, 1449, 1442, 1531, 1449, 1442),
+    (1440, 1942, 1942, 1442, 1936, 1936, 1442, 1937, 1936, 1442, 1939, 1939, 1442, 1508, 1508, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 2700, 1456, 1457),
+    (1446, 1082, 1440),
+    (1440, 2701, 1502, 1442),
+    (1440, 1736, 2619, 1539, 1730, 2011, 1442, 1926, 2620, 1539, 1610, 1545, 1442),
+    (1485, 2624, 1442, 2625, 1442),
+    (1440, 1837, 1837, 1442),
+    (1440, 2702, 1502, 1442, 2703, 2703, 1497, 2704, 1098, 1440, 296, 296, 1440),
+    (1446, 1088, 1440),
+    (1440, 1089, 1089, 1446, 1095, 1095, 1440, 1949, 1949, 1442, 1097, 1097, 1440, 1263, 1100, 1440, 30, 30, 1440, 1586, 1086, 1485, 1033, 1033, 1440, 1508, 1508, 1442, 576, 576, 1440, 1950, 1950, 1442, 2139, 2139, 1442, 2140, 2140, 1442, 1501, 1501, 1442, 2141, 1456, 1457, 2142, 1456, 1457, 1458, 1456, 1457, 1455, 1456, 1457, 1920, 1920, 1442, 1603, 1603, 1442, 1965, 1965, 1442, 1465, 1274, 1446),
+    (1440, 1602, 1950, 1442),
+    (1446, 1093, 1440),
+    (1440, 1949, 1949, 1442, 1950, 1950, 1442, 1455, 1456, 1457, 2141, 1456, 1457, 1458, 1456, 1457, 2139, 2139, 1442, 1501, 1501, 1442, 2140, 2140, 1442),
+    (1440, 2705, 1502, 1442, 2631, 1099, 1440, 2706, 1087, 1440, 2703, 2703, 1497),
+    (1440, 2707, 1096, 1446, 1545, 1545, 1442),
+    (1446, 1094, 1440),
+    (1440, 2632, 1085, 1440),
+    (1440, 1478, 1478, 1442, 1628, 1629, 1442, 1476, 2708, 1442, 1630, 1631, 1442, 1632, 1633, 1442, 2709, 2710, 1442),
+    (1440, 1478, 1478, 1442, 1628, 1629, 1442, 2633, 2634, 1442),
+    (1440, 2635, 2711, 1539),
+    (1446, 1502, 1442),
+    (1440, 1872, 1872, 1442, 1823, 1823, 1442, 2218, 2712, 1539, 1730, 2216, 1442, 2713, 2162, 1588, 2670, 2671, 1442, 2714, 1103, 1440, 2217, 1107, 1440, 1926, 2715, 1539, 2343, 2344, 1539, 2345, 2346, 1539, 2716, 2717, 1497, 2675, 1105, 1440, 2676, 1106, 1440),
+    (1440, 1547, 1547, 1442, 1545, 1545, 1442),
+    (1446, 1102, 1440),
+    (1440, 1453, 2718, 1442, 2719, 2720, 1539, 2721, 2722, 1539),
+    (1440, 2723, 2723, 1442),
+    (1440, 2724, 2725, 1539, 2726, 2727, 1539, 2728, 2729, 1539),
+    (1440, 2726, 2727, 1539, 2728, 2729, 1539),
+    (1440, 1453, 2672, 1442, 2214, 2730, 1442, 1970, 1456, 1457),
+    (1446, 1109, 1440),
+    (1440, 1872, 1872, 1442, 372, 372, 1446, 2668, 2162, 1588, 2161, 2162, 1588, 2669, 2164, 1539, 2163, 2164, 1539, 2672, 1110, 1446, 2673, 1107, 1440, 2674, 1107, 1440, 2675, 1105, 1440, 2676, 1106, 1440),
+    (1446, 1111, 1440),
+    (1440, 1546, 1478, 1442, 2731, 2731, 1484, 1119, 1119, 1485, 2732, 2732, 1497),
+    (1440, 1546, 1478, 1442, 2731, 2731, 1484, 1119, 1119, 1485, 2732, 2732, 1497),
+    (1440, 2009, 2009, 1442, 1628, 1674, 1442, 1546, 1478, 1442, 2010, 1490, 1442, 1730, 2011, 1442, 1926, 2012, 1539, 1190, 1190, 1485),
+    (1446, 1115, 1440),
+    (1440, 2009, 2009, 1442, 2013, 1950, 1442, 2014, 2014, 1442, 2015, 2015, 1442, 1458, 1456, 1457),
+    (1446, 1117, 1440),
+    (1485, 1758, 1442, 1759, 1442),
+    (1440, 1954, 1954, 1442, 1951, 1952, 1442, 1955, 1955, 1442, 1953, 1470, 1442, 1218, 1218, 1440, 1217, 1217, 1440, 2143, 2143, 1442, 1537, 1415, 1440, 1455, 1456, 1457, 1465, 1274, 1446, 1458, 1456, 1457, 2038, 1415, 1440),
+    (1440, 1951, 1952, 1442, 1953, 1470, 1442, 1954, 1954, 1442, 1955, 1955, 1442, 1455, 1456, 1457, 2143, 2143, 1442),
+    (1446, 1121, 1440),
+    (1440, 2733, 2733, 1442),
+    (1440, 2734, 2239, 1442),
+    (1446, 1124, 1440),
+    (1440, 2221, 2735, 1442, 1526, 2736, 1442),
+    (1446, 1126, 1440),
+    (1440, 2737, 1340, 1440),
+    (1440, 1621, 1468, 1442, 2252, 2254, 1442),
+    (1440, 1911, 1911, 1442),
+    (1440, 1676, 1444, 1442, 2738, 1678, 1442, 1677, 1678, 1442, 2739, 1678, 1442, 1679, 1678, 1442, 1621, 1444, 1442, 1680, 1678, 1442, 1681, 1444, 1442, 1682, 1496, 1497, 1683, 1496, 1497),
+    (1440, 2740, 1138, 1446, 2741, 1136, 1446, 2410, 1456, 1457, 2409, 1456, 1457, 2742, 1456, 1457, 2743, 1456, 1457, 1793, 1137, 1485),
+    (1440, 2744, 1135, 1446, 2745, 2745, 1442, 2746, 1496, 1497, 2601, 1132, 1440, 2747, 2748, 1539, 2070, 2749, 1539, 2053, 2750, 1442),
+    (1440, 1424, 1424, 1446, 554, 554, 1446, 2053, 2750, 1442),
+    (1446, 1460, 1442),
+    (1446, 2751, 1442),
+    (1485, 1444, 1442, 1444, 1442),
+    (1446, 2752, 1442),
+    (1440, 1748, 1182, 1440, 283, 283, 1446),
+    (1440, 2753, 2754, 1442, 1755, 2755, 1442),
+    (1440, 2756, 1508, 1442, 2757, 1502, 1442, 2758, 1502, 1442, 1748, 1182, 1440),
+    (1440, 2756, 1508, 1442, 1748, 1182, 1440, 2757, 1502, 1442, 2758, 1502, 1442),
+    (1440, 1730, 1730, 1442, 1736, 2164, 1539),
+    (1440, 2257, 1502, 1442, 1730, 2216, 1442, 1586, 571, 1485),
+    (1446, 1144, 1440),
+    (1446, 2216, 1442),
+    (1440, 2759, 1478, 1442),
+    (1440, 1912, 1502, 1442, 1913, 1502, 1442, 2358, 1502, 1442, 2359, 2760, 1442, 2761, 1152, 1440, 2604, 1502, 1442, 2762, 1156, 1446, 2763, 2764, 1442, 2036, 2765, 1442, 1475, 1157, 1446),
+    (1440, 2158, 1161, 1440, 2766, 695, 1440, 2351, 565, 1440, 933, 933, 1440, 1501, 2767, 1442, 2352, 2352, 1457, 2353, 2353, 1457),
+    (1440, 1799, 1620, 1442, 1823, 1823, 1442, 2768, 2768, 1539, 1291, 1291, 1440, 2769, 1153, 1440, 2770, 563, 1446, 1610, 1545, 1442, 152, 1148, 1440, 570, 570, 1446, 1427, 1158, 1440),
+    (1440, 1545, 1545, 1442, 2771, 1147, 1440),
+    (1440, 1914, 1478, 1442, 1474, 1155, 1446),
+    (1440, 2772, 2772, 1539, 2773, 2773, 1539),
+    (1440, 2349, 1900, 1539, 953, 953, 1446, 2774, 2774, 1442),
+    (1446, 2775, 1442),
+    (1446, 1502, 1442),
+    (1446, 2776, 1442),
+    (1440, 1208, 1159, 1446, 1266, 1160, 1446),
+    (1446, 2777, 1442),
+    (1446, 2778, 1442),
+    (1440, 2779, 2570, 1588, 2780, 2570, 1588, 2349, 1900, 1539, 2350, 1900, 1539, 2781, 2782, 1588, 2783, 2782, 1588, 2784, 2784, 1539),
+    (1440, 2189, 2785, 1442, 1553, 2786, 1442, 2787, 2788, 1442, 1555, 2789, 1442, 2790, 1508, 1442, 1559, 1478, 1442, 1545, 1545, 1442, 1560, 2791, 1442, 1562, 2792, 1442),
+    (1440, 1806, 1468, 1442, 515, 515, 1446, 1465, 1274, 1446),
+    (1440, 1602, 1444, 1442),
+    (1440, 2793, 2793, 1497),
+    (1440, 2793, 2793, 1497),
+    (1440, 1342, 1342, 1440, 1913, 1169, 1440, 1508, 1508, 1442, 1850, 1850, 1442),
+    (1440, 2794, 1502, 1442, 2795, 1171, 1446),
+    (1440, 2796, 2797, 1442),
+    (1440, 2798, 1502, 1442, 1738, 1502, 1442),
+    (1446, 1170, 1440),
+    (1440, 2799, 2799, 1442),
+    (1440, 67, 67, 1440, 1797, 1797, 1442, 1595, 64, 1440),
+    (1440, 2800, 2800, 1442, 2543, 2543, 1442, 1469, 2801, 1442, 1455, 1456, 1457),
+    (1446, 1174, 1440),
+    (1440, 1730, 2303, 1442, 1736, 2304, 1539, 1926, 1926, 1539, 1610, 1545, 1442, 2802, 2802, 1539, 709, 709, 1446),
+    (1440, 2802, 2802, 1539),
+    (1440, 1738, 1501, 1442),
+    (1440, 1738, 1501, 1442),
+    (1440, 2803, 2803, 1539, 2804, 2804, 1539, 2635, 2805, 1539),
+    (1440, 1738, 1501, 1442),
+    (1440, 2806, 1858, 1442, 2807, 1870, 1442, 2026, 2808, 1442, 1730, 2809, 1442, 2810, 1962, 1442),
+    (1446, 2811, 1442),
+    (1440, 1067, 1067, 1440, 983, 983, 1440, 716, 716, 1440),
+    (1440, 2812, 2813, 1442),
+    (1440, 1651, 1651, 1442, 1940, 1941, 1442, 1057, 1057, 1440),
+    (1440, 1651, 1651, 1442),
+    (1440, 2814, 2814, 1539),
+    (1440, 2815, 100, 1440, 2816, 2816, 1539, 1649, 1649, 1539, 2817, 100, 1440),
+    (1485, 1758, 1442, 1759, 1442),
+    (1440, 1476, 1476, 1442, 1478, 1478, 1442, 1632, 2818, 1442, 47, 47, 1446, 708, 708, 1446),
+    (1440, 1478, 2819, 1442, 1476, 2820, 1442, 1479, 2821, 1442, 917, 917, 1440),
+    (1440, 1478, 1478, 1442, 1545, 1545, 1442, 2822, 1478, 1442),
+    (1446, 2026, 1442),
+    (1446, 1196, 1440),
+    (1440, 2823, 1276, 1440),
+    (1440, 2824, 1900, 1539, 2350, 1900, 1539),
+    (1440, 2825, 1900, 1539, 2826, 1900, 1539),
+    (1440, 2827, 2827, 1442, 2828, 1502, 1442, 2829, 1502, 1442),
+    (1440, 2601, 600, 1446, 1031, 1032, 1446, 2830, 1201, 1446, 2240, 2831, 1442),
+    (1446, 1200, 1440),
+    (1440, 1298, 1298, 1440, 575, 575, 1440, 1318, 1318, 1440, 1319, 1319, 1440, 557, 557, 1440, 961, 961, 1440, 965, 965, 1440, 1073, 1073, 1440, 1075, 1075, 1440, 586, 586, 1440, 589, 589, 1440, 1120, 1120, 1440, 2832, 660, 1440, 922, 922, 1440, 916, 937, 1440),
+    (1440, 2261, 2262, 1442, 1200, 1200, 1440, 2411, 2239, 1442, 2413, 2833, 1442, 2053, 2053, 1442, 2070, 2070, 1539, 2834, 2834, 1442, 1425, 1426, 1446),
+    (1440, 2835, 1205, 1446, 2053, 2053, 1442),
+    (1446, 1202, 1440),
+    (1440, 1453, 2149, 1442, 1970, 1456, 1457, 1570, 1456, 1457, 2214, 2214, 1442),
+    (1446, 1206, 1440),
+    (1446, 2069, 1442),
+    (1440, 2191, 1444, 1442),
+    (1446, 1209, 1440),
+    (1440, 1650, 1651, 1442, 2836, 1210, 1446),
+    (1440, 1650, 1651, 1442),
+    (1440, 1652, 1652, 1442, 1501, 1444, 1442, 1940, 1941, 1442),
+    (1440, 1651, 1651, 1442),
+    (1440, 1652, 1652, 1442, 1654, 1054, 1446, 1940, 1941, 1442),
+    (1440, 1651, 1651, 1442),
+    (1440, 2837, 2838, 1442, 2839, 2839, 1442),
+    (1440, 2040, 2838, 1442, 2840, 2838, 1442, 2841, 2838, 1442, 1127, 1127, 1446),
+    (1440, 2840, 2838, 1442, 1127, 1127, 1446),
+    (1440, 1738, 1738, 1442),
+    (1440, 2842, 2608, 1442, 2843, 1223, 1446),
+    (1440, 2844, 2608, 1442, 1994, 2171, 1539),
+    (1446, 1222, 1440),
+    (1440, 2845, 2845, 1442, 1546, 1478, 1442, 2846, 1545, 1442),
+    (1440, 1717, 1717, 1484),
+    (1440, 1584, 1585, 1442, 942, 942, 1440, 1491, 1492, 1442),
+    (1446, 1226, 1440),
+    (1440, 2847, 1227, 1446),
+    (1440, 114, 114, 1446),
+    (1440, 1748, 1182, 1440),
+    (1440, 1512, 1512, 1442, 1514, 1514, 1442, 1453, 2146, 1442, 1455, 1455, 1457, 1458, 1458, 1457, 1235, 1235, 1440, 1237, 1237, 1440, 1056, 1056, 1440, 1956, 1957, 1442),
+    (1440, 1748, 1182, 1440, 136, 136, 1446),
+    (1446, 1231, 1440),
+    (1440, 726, 726, 1440, 728, 728, 1440, 135, 1230, 1440, 725, 1232, 1440, 1515, 1515, 1442, 1238, 1238, 1440, 278, 278, 1446),
+    (1440, 1515, 1515, 1442, 1238, 1238, 1440),
+    (1440, 2848, 2848, 1442),
+    (1440, 2848, 2848, 1442),
+    (1440, 536, 536, 1440),
+    (1440, 2679, 2680, 1539, 2849, 2849, 1539, 2850, 2850, 1539),
+    (1440, 1818, 1468, 1442, 2021, 1468, 1442),
+    (1440, 1467, 1876, 1442),
+    (1440, 1883, 1883, 1442),
+    (1440, 1919, 1919, 1442),
+    (1440, 1921, 1921, 1442),
+    (1440, 1936, 2136, 1442, 2131, 2132, 1442, 2537, 1059, 1446, 2134, 2134, 1442, 1940, 1941, 1442, 1057, 1057, 1440, 1211, 1211, 1440),
+    (1440, 1651, 1651, 1442),
+    (1440, 1604, 1604, 1442),
+    (1440, 1760, 1468, 1442),
+    (1440, 1818, 1468, 1442, 2021, 1468, 1442),
+    (1440, 1822, 1468, 1442),
+    (1440, 1851, 1851, 1442),
+    (1440, 1467, 1876, 1442, 2851, 986, 1485, 2852, 988, 1446, 2853, 2854, 1442, 2855, 2112, 1442),
+    (1440, 1883, 1883, 1442),
+    (1440, 1884, 1885, 1442),
+    (1440, 1892, 1892, 1442),
+    (1440, 1919, 1919, 1442),
+    (1440, 1921, 1921, 1442),
+    (1440, 1651, 1651, 1442, 1940, 1941, 1442),
+    (1440, 1651, 1651, 1442),
+    (1440, 1949, 1949, 1442),
+    (1440, 1963, 1963, 1442),
+    (1440, 1966, 1966, 1442),
+    (1440, 2635, 2635, 1539, 2856, 2856, 1539, 2857, 2857, 1539),
+    (1440, 1962, 1962, 1442, 1959, 1959, 1442, 1455, 1456, 1457, 1458, 1456, 1457, 1961, 1961, 1442),
+    (1446, 1264, 1440),
+    (1446, 1922, 1442),
+    (1440, 1982, 1982, 1442, 2858, 1981, 1442, 2859, 1502, 1442, 2860, 1981, 1442, 2861, 1502, 1442),
+    (1446, 1267, 1440),
+    (1440, 1123, 1123, 1440),
+    (1440, 96, 96, 1440, 1595, 64, 1440, 1573, 1478, 1442, 1598, 1599, 1442, 1798, 1798, 1497, 1797, 1797, 1442, 1578, 1578, 1442, 1582, 1582, 1442),
+    (1440, 1797, 1797, 1442),
+    (1440, 2221, 2862, 1442, 1526, 2863, 1442),
+    (1446, 2862, 1442),
+    (1446, 1272, 1440),
+    (1440, 2864, 1767, 1442, 2865, 1769, 1442, 2866, 1771, 1442),
+    (1440, 914, 914, 1440, 2867, 2868, 1638),
+    (1446, 2869, 1442),
+    (1440, 1748, 1182, 1440),
+    (1440, 1628, 1674, 1442, 1546, 1478, 1442),
+    (1440, 1595, 64, 1440, 2870, 2870, 1442, 2871, 2871, 1442),
+    (1485, 2872, 1442, 2873, 1442),
+    (1440, 1595, 64, 1440, 2874, 2874, 1442, 1281, 1281, 1485, 917, 917, 1440),
+    (1440, 2874, 2874, 1442),
+    (1440, 2875, 2875, 1442, 2876, 2877, 1539, 2878, 2877, 1539),
+    (1440, 2875, 2875, 1442, 2876, 2877, 1539, 2878, 2877, 1539),
+    (1440, 2875, 2875, 1442, 2876, 2877, 1539, 2878, 2877, 1539),
+    (1440, 1578, 1578, 1442, 2879, 2879, 1442, 2880, 2880, 1442, 624, 624, 1446),
+    (1440, 1573, 1478, 1442, 1595, 64, 1440, 2881, 2881, 1442, 2882, 2882, 1539, 608, 608, 1446, 2883, 1290, 1440, 1287, 1287, 1440, 626, 626, 1446),
+    (1440, 1453, 2175, 1442, 2884, 1508, 1442),
+    (1440, 2885, 598, 1485, 2886, 13, 1485),
+    (1440, 2887, 2887, 1442, 1072, 1072, 1446, 1239, 1239, 1440),
+    (1440, 1661, 2888, 1442, 2816, 2816, 1539, 2889, 100, 1440, 2890, 100, 1440),
+    (1446, 2891, 1442),
+    (1446, 2892, 1442),
+    (1485, 2893, 1442, 2894, 1442),
+    (1440, 2895, 2895, 1442, 1304, 1304, 1440),
+    (1446, 2303, 1442),
+    (1440, 1963, 1963, 1442, 1965, 1965, 1442, 2147, 1854, 1442, 1895, 1895, 1442, 1603, 1603, 1442, 918, 918, 1440, 2148, 2148, 1442, 2149, 2149, 1442, 1501, 1501, 1442, 666, 666, 1485, 16, 16, 1440, 1508, 1508, 1442, 705, 705, 1446, 1052, 1052, 1440, 1176, 1176, 1440, 1427, 1427, 1440, 1263, 1263, 1440, 1455, 1456, 1457, 2150, 1456, 1457, 2151, 1456, 1457, 1458, 1456, 1457, 1207, 1207, 1446, 603, 603, 1446, 1830, 1496, 1497, 1611, 1496, 1497, 1964, 1496, 1497, 113, 113, 1440, 2152, 2152, 1539, 2153, 2153, 1539, 297, 297, 1440, 576, 576, 1440, 299, 299, 1446, 1279, 1279, 1440, 301, 301, 1446, 1113, 1113, 1440, 1586, 1295, 1485, 1188, 1188, 1440, 1465, 1274, 1446),
+    (1440, 1493, 1493, 1442, 666, 666, 1485, 705, 705, 1446, 1052, 1052, 1440, 1176, 1176, 1440, 1263, 1263, 1440),
+    (1440, 2896, 2897, 1539, 2898, 2897, 1539, 2899, 2897, 1539, 2900, 2897, 1539, 2901, 2897, 1539),
+    (1440, 1602, 1965, 1442),
+    (1446, 1303, 1440),
+    (1440, 1963, 1963, 1442, 1965, 1965, 1442, 1455, 1456, 1457, 2151, 1456, 1457, 1458, 1456, 1457, 2148, 2148, 1442, 1430, 1430, 1440),
+    (1440, 2902, 2902, 1442),
+    (1440, 1489, 1583, 1442, 2903, 2602, 1442, 2904, 647, 1446, 2905, 1297, 1446, 2906, 1496, 1497, 1494, 913, 1446, 2907, 112, 1446, 2908, 659, 1446, 10, 10, 1440),
+    (1440, 1191, 1317, 1440),
+    (1485, 2909, 1442, 2910, 1442),
+    (1440, 295, 1306, 1440, 1579, 1579, 1442, 1479, 1479, 1442, 2911, 2911, 1442),
+    (1446, 2912, 1442),
+    (1440, 1966, 1966, 1442, 1969, 1969, 1442, 2155, 2155, 1442, 1501, 1501, 1442, 1823, 1823, 1442, 1967, 1967, 1539, 932, 932, 1440, 1695, 1695, 1539, 1968, 1968, 1442, 1586, 1307, 1485, 1308, 1308, 1440, 1315, 1315, 1440, 288, 83, 1440, 1316, 1316, 1440, 1455, 1456, 1457, 2156, 1456, 1457, 2157, 1456, 1457, 1895, 1895, 1442, 1603, 1603, 1442, 291, 291, 1440, 576, 576, 1440, 1465, 1274, 1446),
+    (1440, 1967, 1967, 1539, 1695, 1695, 1539, 1968, 1968, 1442, 1586, 1307, 1485, 1308, 1308, 1440, 1315, 1315, 1440, 1316, 1316, 1440),
+    (1440, 1602, 1969, 1442),
+    (1446, 1314, 1440),
+    (1440, 1966, 1966, 1442, 1969, 1969, 1442, 1455, 1456, 1457, 2157, 1456, 1457, 1458, 1456, 1457, 2155, 2155, 1442, 1501, 1501, 1442),
+    (1440, 1546, 1478, 1442, 2362, 2362, 1442, 2913, 2914, 1442, 1545, 1545, 1442),
+    (1440, 1730, 2912, 1442, 1736, 2915, 1539, 1610, 1545, 1442),
+    (1440, 1476, 1476, 1442, 1478, 1478, 1442),
+    (1440, 1531, 1449, 1442, 1533, 1533, 1442, 1835, 1449, 1442, 1834, 1449, 1442, 1450, 1334, 1440, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 908, 908, 1440, 1465, 1274, 1446, 1332, 1326, 1446),
+    (1440, 1530, 1449, 1442, 1835, 1449, 1442, 1532, 1532, 1442, 1450, 1328, 1440, 1453, 1331, 1440, 1970, 1456, 1457, 1570, 1456, 1457, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440, 1971, 1325, 1485, 1972, 1321, 1485, 1973, 1321, 1485, 2158, 1322, 1446, 908, 908, 1440, 2916, 1329, 1440, 2039, 2039, 1442, 1465, 1274, 1446, 1066, 1066, 1446, 2224, 1449, 1442),
+    (1440, 2917, 2917, 1442, 1526, 2918, 1442),
+    (1485, 2919, 1442, 1320, 1440),
+    (1446, 1323, 1440),
+    (1440, 1600, 1600, 1442, 1459, 2920, 1442, 2921, 1456, 1457, 2922, 2923, 1638, 2924, 2923, 1638, 2925, 2923, 1638, 2926, 2927, 1539, 2928, 2923, 1638, 2929, 2923, 1638),
+    (1440, 2930, 1521, 1442, 2931, 2932, 1638),
+    (1485, 2933, 1442, 1324, 1440),
+    (1446, 1327, 1440),
+    (1440, 1530, 1449, 1442, 1532, 1532, 1442, 1328, 1328, 1440, 1455, 1456, 1457, 1537, 1415, 1440),
+    (1440, 1459, 2920, 1442, 1443, 1443, 1442),
+    (1440, 1459, 2920, 1442, 1298, 1298, 1440, 1090, 1090, 1440, 1310, 1310, 1440),
+    (1446, 1328, 1440),
+    (1440, 2934, 2935, 1442, 1738, 2936, 1442),
+    (1446, 1333, 1440),
+    (1440, 1530, 1449, 1442, 1532, 1532, 1442, 1835, 1449, 1442, 1328, 1328, 1440, 1453, 1331, 1440, 1970, 1456, 1457, 1570, 1456, 1457, 1455, 1456, 1457, 1537, 1415, 1440, 1458, 1456, 1457, 2038, 1415, 1440),
+    (1440, 1459, 2937, 1442, 1443, 1443, 1442),
+    (1446, 1336, 1440),
+    (1440, 1533, 1533, 1442, 1531, 1449, 1442, 1835, 1449, 1442, 1334, 1334, 1440, 1455, 1456, 1457, 1458, 1456, 1457),
+    (1440, 2938, 2939, 1442, 1526, 2940, 1539),
+    (1440, 2941, 2941, 1588, 90, 90, 1440, 164, 164, 1440),
+    (1440, 1602, 1854, 1442),
+    (1440, 2942, 2942, 1539, 2943, 2943, 1539, 2944, 2944, 1539),
+    (1440, 2945, 1478, 1442, 1850, 1850, 1442),
+    (1440, 1903, 2946, 1442),
+    (1440, 1585, 2947, 1442, 2948, 2949, 1442),
+    (1440, 1448, 1449, 1442, 1469, 1792, 1442, 1453, 1454, 1442, 1793, 751, 1485, 2950, 830, 1446),
+    (1440, 1447, 1447, 1442),
+    (1440, 1519, 1519, 1442, 729, 729, 1440, 724, 724, 1440),
+    (1440, 1518, 1518, 1442),
+    (1440, 1527, 1527, 1442, 1528, 1449, 1442, 1793, 31, 1485, 2950, 830, 1446),
+    (1440, 1527, 1527, 1442),
+    (1440, 1746, 2020, 1442, 709, 127, 1446),
+    (1440, 1745, 1745, 1442),
+    (1440, 1746, 2020, 1442),
+    (1440, 1745, 1745, 1442),
+    (1440, 1750, 1468, 1442, 622, 623, 1440),
+    (1440, 1751, 1751, 1442),
+    (1440, 1785, 1785, 1442, 1469, 1792, 1442, 1793, 751, 1485, 2950, 830, 1446),
+    (1440, 1784, 1784, 1442),
+    (1440, 1806, 1468, 1442, 1508, 1508, 1442, 1469, 1807, 1442, 1051, 550, 1440, 1808, 1808, 1497),
+    (1440, 1806, 1468, 1442, 515, 515, 1446),
+    (1440, 1512, 1512, 1442, 1811, 1418, 1440, 526, 526, 1440, 1816, 1816, 1442, 303, 303, 1440, 1812, 1266, 1446, 1814, 1814, 1442),
+    (1440, 1817, 1817, 1442),
+    (1440, 1832, 1832, 1442, 1826, 1826, 1442, 2951, 1496, 1497, 2952, 1421, 1446, 373, 373, 1440, 2953, 1496, 1497),
+    (1440, 1833, 1833, 1442),
+    (1440, 1832, 1832, 1442, 2954, 504, 1446),
+    (1440, 1833, 1833, 1442),
+    (1440, 1834, 1449, 1442, 1835, 1449, 1442, 1469, 1792, 1442),
+    (1440, 1836, 1836, 1442),
+    (1440, 1837, 2083, 1442, 583, 583, 1446, 1048, 1049, 1440, 1284, 1286, 1440),
+    (1440, 1841, 1841, 1442),
+    (1440, 1837, 2083, 1442, 1839, 1839, 1442, 1469, 2087, 1442, 2955, 591, 1446, 2956, 592, 1446),
+    (1440, 1844, 1844, 1442, 1845, 1845, 1442, 1846, 1846, 1442, 1847, 637, 1446),
+    (1440, 1848, 1848, 1442),
+    (1440, 2957, 674, 1446, 1469, 1855, 1442, 1835, 1856, 1442, 1857, 1857, 1442, 1508, 1508, 1442),
+    (1440, 1858, 1858, 1442),
+    (1440, 1857, 1857, 1442, 2025, 2026, 1442, 1480, 1984, 1539, 2958, 1194, 1446, 2959, 1194, 1446, 1863, 1863, 1442, 1864, 1864, 1442, 1865, 1865, 1442, 1866, 1866, 1442, 1867, 1867, 1442, 1868, 1868, 1497, 1869, 1869, 1442),
+    (1440, 1870, 1870, 1442),
+    (1440, 1871, 1871, 1442, 1873, 685, 1440, 1874, 683, 1440),
+    (1440, 1875, 1875, 1442),
+    (1440, 1871, 1871, 1442, 2960, 683, 1440),
+    (1440, 1875, 1875, 1442),
+    (1440, 1467, 1876, 1442, 1878, 693, 1440, 1469, 1879, 1442, 1880, 988, 1446, 1881, 691, 1440, 1221, 1221, 1440),
+    (1440, 1883, 1883, 1442),
+    (1440, 1897, 1898, 1442, 1903, 1904, 1442, 1905, 1905, 1442),
+    (1440, 1906, 1906, 1442),
+    (1440, 1620, 1620, 1442, 1625, 1625, 1442, 2124, 2124, 1442, 1915, 286, 1485, 2961, 285, 1446, 2962, 9, 1446, 702, 702, 1440, 1441, 1917, 1442),
+    (1440, 1620, 1620, 1442),
+    (1440, 1919, 1919, 1442, 2510, 2510, 1442, 2614, 2615, 1539, 2616, 2617, 1539),
+    (1440, 1920, 1920, 1442, 2510, 2510, 1442),
+    (1440, 1919, 1919, 1442, 1021, 1021, 1440),
+    (1440, 1920, 1920, 1442),
+    (1440, 1921, 1921, 1442, 1730, 1730, 1442, 1508, 1508, 1442, 1923, 1924, 1442, 2963, 2964, 1497, 1926, 1927, 1539, 1929, 1466, 1442, 1930, 7, 1446, 1928, 1034, 1446, 2965, 2966, 1497, 2967, 2967, 1497, 2968, 2968, 1497, 1931, 1931, 1442, 710, 710, 1440),
+    (1440, 1924, 1924, 1442, 1740, 1035, 1446, 1933, 1035, 1446),
+    (1440,),
+    (1440,),
+    (1440, 1651, 1651, 1442, 2134, 2134, 1442, 2131, 2132, 1442, 1057, 1057, 1440),
+    (1440, 1651, 1651, 1442),
+    (1440, 1936, 1936, 1442, 1937, 1936, 1442, 1938, 1938, 1442, 1074, 1074, 1440, 1939, 1939, 1442, 1508, 1508, 1442, 1057, 1057, 1440),
+    (1440, 1942, 1942, 1442),
+    (1440, 1951, 1952, 1442, 1953, 1470, 1442, 1219, 1219, 1440, 1465, 1274, 1446),
+    (1440, 1954, 1954, 1442),
+    (1440, 1512, 1512, 1442, 1514, 1514, 1442, 1234, 1234, 1440, 1956, 1957, 1442),
+    (1440, 1958, 1958, 1442),
+    (1440, 1963, 1963, 1442, 1113, 1114, 1440, 1116, 1116, 1446, 1176, 1177, 1440, 1165, 1166, 1440),
+    (1440, 1965, 1965, 1442),
+    (1440, 1530, 1449, 1442, 1835, 1449, 1442, 1453, 1331, 1440, 1970, 1456, 1457, 1570, 1456, 1457, 1971, 1325, 1485, 2969, 895, 1446, 1972, 1321, 1485, 2970, 895, 1446, 1973, 1321, 1485, 2971, 895, 1446),
+    (1440, 1532, 1532, 1442),
+    (1440, 1531, 1449, 1442, 1835, 1449, 1442),
+    (1440, 1533, 1533, 1442),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1418, 1418, 1440),
+    (1440, 1976, 1976, 1442),
+    (1440, 1977, 1977, 1442, 1229, 1229, 1440, 1045, 1045, 1440, 1978, 1434, 1440),
+    (1440, 1431, 1431, 1440),
+    (1440, 1980, 1980, 1442, 907, 907, 1446, 1469, 1981, 1442, 1041, 1041, 1440),
+    (1440, 1438, 1438, 1440),
+    (1440, 1976, 1502, 1442, 1513, 1502, 1442, 1512, 1502, 1442, 668, 668, 1440),
+    (1440, 1512, 1512, 1442, 1513, 1513, 1442, 1453, 2160, 1442, 1455, 1455, 1457, 1458, 1458, 1457),
+    (1446, 1416, 1440),
+    (1440, 1733, 1508, 1442, 2019, 1208, 1446, 1224, 1224, 1440, 726, 726, 1440, 728, 728, 1440, 1278, 1278, 1440, 1140, 1140, 1440, 1139, 1139, 1440, 99, 99, 1440, 135, 135, 1440, 725, 725, 1440, 1238, 304, 1440, 2972, 1945, 1442, 2973, 2973, 1442, 284, 284, 1440, 277, 277, 1446),
+    (1440, 1738, 1738, 1442),
+    (1440, 2974, 2974, 1442),
+    (1446, 1420, 1440),
+    (1440, 2975, 2975, 1539),
+    (1440, 1602, 1460, 1442, 1661, 2752, 1442, 2751, 2751, 1442),
+    (1446, 1423, 1440),
+    (1440, 2221, 2976, 1442, 1526, 2977, 1442),
+    (1446, 1425, 1440),
+    (1440, 1208, 1429, 1446, 1266, 1266, 1446),
+    (1446, 2401, 1442),
+    (1446, 2069, 1442),
+    (1440, 1453, 2557, 1442, 2978, 2978, 1539, 2979, 1963, 1442),
+    (1440, 1977, 1977, 1442, 1979, 1979, 1442, 2980, 1456, 1457, 1229, 1229, 1440, 2981, 1502, 1442, 140, 140, 1440, 1045, 1046, 1440, 2982, 1456, 1457, 1978, 1435, 1440, 1453, 2983, 1442, 1501, 2984, 1442),
+    (1446, 2985, 1442),
+    (1446, 2986, 1442),
+    (1440, 1813, 2987, 1442, 1208, 1432, 1446, 1266, 1433, 1446),
+    (1440, 1813, 2987, 1442, 1208, 1432, 1446, 1266, 1433, 1446, 2988, 2989, 1442),
+    (1446, 1431, 1440),
+    (1440, 2990, 1478, 1442, 2846, 1545, 1442),
+    (1440, 1980, 1980, 1442, 907, 907, 1446, 1982, 1982, 1442, 1979, 1979, 1442, 2991, 1101, 1446, 1469, 1981, 1442, 2981, 1502, 1442, 2982, 1456, 1457, 2980, 1456, 1457, 1041, 1041, 1440),
+    (1446, 1438, 1440),
+)
+# The values of the enum shapes of string members
+ENUM_VALUES = {
+    'ActionStatus': ('Unknown', 'InProgress', 'Completed', 'Failed', 'Stopping', 'Stopped'),
+    'AdditionalS3DataSourceDataType': ('S3Object', 'S3Prefix'),
+    'AggregationTransformationValue': ('sum', 'avg', 'first', 'min', 'max'),
+    'AlgorithmSortBy': ('Name', 'CreationTime'),
+    'AlgorithmStatus': ('Pending', 'InProgress', 'Completed', 'Failed', 'Deleting'),
+    'AppImageConfigSortKey': ('CreationTime', 'LastModifiedTime', 'Name'),
+    'AppInstanceType': ('system', 'ml.t3.micro', 'ml.t3.small', 'ml.t3.medium', 'ml.t3.large', 'ml.t3.xlarge', 'ml.t3.2xlarge', 'ml.m5.large', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.8xlarge', 'ml.m5.12xlarge', 'ml.m5.16xlarge', 'ml.m5.24xlarge', 'ml.m5d.large', 'ml.m5d.xlarge', 'ml.m5d.2xlarge', 'ml.m5d.4xlarge', 'ml.m5d.8xlarge', 'ml.m5d.12xlarge', 'ml.m5d.16xlarge', 'ml.m5d.24xlarge', 'ml.c5.large', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.12xlarge', 'ml.c5.18xlarge', 'ml.c5.24xlarge', 'ml.p3.2xlarge', 'ml.p3.8xlarge', 'ml.p3.16xlarge', 'ml.p3dn.24xlarge', 'ml.g4dn.xlarge', 'ml.g4dn.2xlarge', 'ml.g4dn.4xlarge', 'ml.g4dn.8xlarge', 'ml.g4dn.12xlarge', 'ml.g4dn.16xlarge', 'ml.r5.large', 'ml.r5.xlarge', 'ml.r5.2xlarge', 'ml.r5.4xlarge', 'ml.r5.8xlarge', 'ml.r5.12xlarge', 'ml.r5.16xlarge', 'ml.r5.24xlarge', 'ml.g5.xlarge', 'ml.g5.2xlarge', 'ml.g5.4xlarge', 'ml.g5.8xlarge', 'ml.g5.16xlarge', 'ml.g5.12xlarge', 'ml.g5.24xlarge', 'ml.g5.48xlarge', 'ml.geospatial.interactive', 'ml.p4d.24xlarge', 'ml.p4de.24xlarge', 'ml.trn1.2xlarge', 'ml.trn1.32xlarge', 'ml.trn1n.32xlarge'),
+    'AppNetworkAccessType': ('PublicInternetOnly', 'VpcOnly'),
+    'AppSecurityGroupManagement': ('Service', 'Customer'),
+    'AppSortKey': ('CreationTime',),
+    'AppStatus': ('Deleted', 'Deleting', 'Failed', 'InService', 'Pending'),
+    'AppType': ('JupyterServer', 'KernelGateway', 'DetailedProfiler', 'TensorBoard', 'CodeEditor', 'JupyterLab', 'RStudioServerPro', 'RSessionGateway', 'Canvas'),
+    'ArtifactSourceIdType': ('MD5Hash', 'S3ETag', 'S3Version', 'Custom'),
+    'AssemblyType': ('None', 'Line'),
+    'AssociationEdgeType': ('ContributedTo', 'AssociatedWith', 'DerivedFrom', 'Produced', 'SameAs'),
+    'AsyncNotificationTopicTypes': ('SUCCESS_NOTIFICATION_TOPIC', 'ERROR_NOTIFICATION_TOPIC'),
+    'AthenaResultCompressionType': ('GZIP', 'SNAPPY', 'ZLIB'),
+    'AthenaResultFormat': ('PARQUET', 'ORC', 'AVRO', 'JSON', 'TEXTFILE'),
+    'AuthMode': ('SSO', 'IAM'),
+    'AutoMLAlgorithm': ('xgboost', 'linear-learner', 'mlp', 'lightgbm', 'catboost', 'randomforest', 'extra-trees', 'nn-torch', 'fastai'),
+    'AutoMLChannelType': ('training', 'validation'),
+    'AutoMLJobObjectiveType': ('Maximize', 'Minimize'),
+    'AutoMLJobSecondaryStatus': ('Starting', 'MaxCandidatesReached', 'Failed', 'Stopped', 'MaxAutoMLJobRuntimeReached', 'Stopping', 'CandidateDefinitionsGenerated', 'Completed', 'ExplainabilityError', 'DeployingModel', 'ModelDeploymentError', 'GeneratingModelInsightsReport', 'ModelInsightsError', 'AnalyzingData', 'FeatureEngineering', 'ModelTuning', 'GeneratingExplainabilityReport', 'TrainingModels', 'PreTraining'),
+    'AutoMLJobStatus': ('Completed', 'InProgress', 'Failed', 'Stopped', 'Stopping'),
+    'AutoMLMetricEnum': ('Accuracy', 'MSE', 'F1', 'F1macro', 'AUC', 'RMSE', 'BalancedAccuracy', 'R2', 'Recall', 'RecallMacro', 'Precision', 'PrecisionMacro', 'MAE', 'MAPE', 'MASE', 'WAPE', 'AverageWeightedQuantileLoss'),
+    'AutoMLMetricExtendedEnum': ('Accuracy', 'MSE', 'F1', 'F1macro', 'AUC', 'RMSE', 'MAE', 'R2', 'BalancedAccuracy', 'Precision', 'PrecisionMacro', 'Recall', 'RecallMacro', 'LogLoss', 'InferenceLatency', 'MAPE', 'MASE', 'WAPE', 'AverageWeightedQuantileLoss', 'Rouge1', 'Rouge2', 'RougeL', 'RougeLSum', 'Perplexity', 'ValidationLoss', 'TrainingLoss'),
+    'AutoMLMode': ('AUTO', 'ENSEMBLING', 'HYPERPARAMETER_TUNING'),
+    'AutoMLProblemTypeConfigName': ('ImageClassification', 'TextClassification', 'TimeSeriesForecasting', 'Tabular', 'TextGeneration'),
+    'AutoMLS3DataType': ('ManifestFile', 'S3Prefix', 'AugmentedManifestFile'),
+    'AutoMLSortBy': ('Name', 'CreationTime', 'Status'),
+    'AutoMLSortOrder': ('Ascending', 'Descending'),
+    'AutotuneMode': ('Enabled',),
+    'AwsManagedHumanLoopRequestSource': ('AWS/Rekognition/DetectModerationLabels/Image/V3', 'AWS/Textract/AnalyzeDocument/Forms/V1', 'AWS/Textract/AnalyzeExpense', 'AWS/Handshake/VerifyIdentity', 'AWS/Bedrock/ModelEvaluation'),
+    'BatchStrategy': ('MultiRecord', 'SingleRecord'),
+    'BooleanOperator': ('And', 'Or'),
+    'CandidateSortBy': ('CreationTime', 'Status', 'FinalObjectiveMetricValue'),
+    'CandidateStatus': ('Completed', 'InProgress', 'Failed', 'Stopped', 'Stopping'),
+    'CandidateStepType': ('AWS::SageMaker::TrainingJob', 'AWS::SageMaker::TransformJob', 'AWS::SageMaker::ProcessingJob'),
+    'CapacitySizeType': ('INSTANCE_COUNT', 'CAPACITY_PERCENT'),
+    'CaptureMode': ('Input', 'Output', 'InputAndOutput'),
+    'CaptureStatus': ('Started', 'Stopped'),
+    'ClarifyFeatureType': ('numerical', 'categorical', 'text'),
+    'ClarifyTextGranularity': ('token', 'sentence', 'paragraph'),
+    'ClarifyTextLanguage': ('af', 'sq', 'ar', 'hy', 'eu', 'bn', 'bg', 'ca', 'zh', 'hr', 'cs', 'da', 'nl', 'en', 'et', 'fi', 'fr', 'de', 'el', 'gu', 'he', 'hi', 'hu', 'is', 'id', 'ga', 'it', 'kn', 'ky', 'lv', 'lt', 'lb', 'mk', 'ml', 'mr', 'ne', 'nb', 'fa', 'pl', 'pt', 'ro', 'ru', 'sa', 'sr', 'tn', 'si', 'sk', 'sl', 'es', 'sv', 'tl', 'ta', 'tt', 'te', 'tr', 'uk', 'ur', 'yo', 'lij', 'xx'),
+    'ClusterInstanceStatus': ('Running', 'Failure', 'Pending', 'ShuttingDown', 'SystemUpdating'),
+    'ClusterInstanceType': ('ml.p4d.24xlarge', 'ml.p4de.24xlarge', 'ml.p5.48xlarge', 'ml.trn1.32xlarge', 'ml.trn1n.32xlarge', 'ml.g5.xlarge', 'ml.g5.2xlarge', 'ml.g5.4xlarge', 'ml.g5.8xlarge', 'ml.g5.12xlarge', 'ml.g5.16xlarge', 'ml.g5.24xlarge', 'ml.g5.48xlarge', 'ml.c5.large', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.12xlarge', 'ml.c5.18xlarge', 'ml.c5.24xlarge', 'ml.c5n.large', 'ml.c5n.2xlarge', 'ml.c5n.4xlarge', 'ml.c5n.9xlarge', 'ml.c5n.18xlarge', 'ml.m5.large', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.8xlarge', 'ml.m5.12xlarge', 'ml.m5.16xlarge', 'ml.m5.24xlarge', 'ml.t3.medium', 'ml.t3.large', 'ml.t3.xlarge', 'ml.t3.2xlarge'),
+    'ClusterSortBy': ('CREATION_TIME', 'NAME'),
+    'ClusterStatus': ('Creating', 'Deleting', 'Failed', 'InService', 'RollingBack', 'SystemUpdating', 'Updating'),
+    'CodeRepositorySortBy': ('Name', 'CreationTime', 'LastModifiedTime'),
+    'CodeRepositorySortOrder': ('Ascending', 'Descending'),
+    'CollectionType': ('List', 'Set', 'Vector'),
+    'CompilationJobStatus': ('INPROGRESS', 'COMPLETED', 'FAILED', 'STARTING', 'STOPPING', 'STOPPED'),
+    'CompleteOnConvergence': ('Disabled', 'Enabled'),
+    'CompressionType': ('None', 'Gzip'),
+    'ConditionOutcome': ('True', 'False'),
+    'ContainerMode': ('SingleModel', 'MultiModel'),
+    'ContentClassifier': ('FreeOfPersonallyIdentifiableInformation', 'FreeOfAdultContent'),
+    'CrossAccountFilterOption': ('SameAccount', 'CrossAccount'),
+    'DataDistributionType': ('FullyReplicated', 'ShardedByS3Key'),
+    'DataSourceName': ('SalesforceGenie', 'Snowflake'),
+    'DetailedAlgorithmStatus': ('NotStarted', 'InProgress', 'Completed', 'Failed'),
+    'DetailedModelPackageStatus': ('NotStarted', 'InProgress', 'Completed', 'Failed'),
+    'DeviceDeploymentStatus': ('READYTODEPLOY', 'INPROGRESS', 'DEPLOYED', 'FAILED', 'STOPPING', 'STOPPED'),
+    'DeviceSubsetType': ('PERCENTAGE', 'SELECTION', 'NAMECONTAINS'),
+    'DirectInternetAccess': ('Enabled', 'Disabled'),
+    'Direction': ('Both', 'Ascendants', 'Descendants'),
+    'DomainStatus': ('Deleting', 'Failed', 'InService', 'Pending', 'Updating', 'Update_Failed', 'Delete_Failed'),
+    'EdgePackagingJobStatus': ('STARTING', 'INPROGRESS', 'COMPLETED', 'FAILED', 'STOPPING', 'STOPPED'),
+    'EdgePresetDeploymentStatus': ('COMPLETED', 'FAILED'),
+    'EdgePresetDeploymentType': ('GreengrassV2Component',),
+    'EndpointConfigSortKey': ('Name', 'CreationTime'),
+    'EndpointSortKey': ('Name', 'CreationTime', 'Status'),
+    'EndpointStatus': ('OutOfService', 'Creating', 'Updating', 'SystemUpdating', 'RollingBack', 'InService', 'Deleting', 'Failed', 'UpdateRollbackFailed'),
+    'ExecutionRoleIdentityConfig': ('USER_PROFILE_NAME', 'DISABLED'),
+    'ExecutionStatus': ('Pending', 'Completed', 'CompletedWithViolations', 'InProgress', 'Failed', 'Stopping', 'Stopped'),
+    'FailureHandlingPolicy': ('ROLLBACK_ON_FAILURE', 'DO_NOTHING'),
+    'FeatureGroupSortBy': ('Name', 'FeatureGroupStatus', 'OfflineStoreStatus', 'CreationTime'),
+    'FeatureGroupSortOrder': ('Ascending', 'Descending'),
+    'FeatureGroupStatus': ('Creating', 'Created', 'CreateFailed', 'Deleting', 'DeleteFailed'),
+    'FeatureStatus': ('ENABLED', 'DISABLED'),
+    'FeatureType': ('Integral', 'Fractional', 'String'),
+    'FileSystemAccessMode': ('rw', 'ro'),
+    'FileSystemType': ('EFS', 'FSxLustre'),
+    'FlatInvocations': ('Continue', 'Stop'),
+    'FlowDefinitionStatus': ('Initializing', 'Active', 'Failed', 'Deleting'),
+    'Framework': ('TENSORFLOW', 'KERAS', 'MXNET', 'ONNX', 'PYTORCH', 'XGBOOST', 'TFLITE', 'DARKNET', 'SKLEARN'),
+    'HubContentSortBy': ('HubContentName', 'CreationTime', 'HubContentStatus'),
+    'HubContentStatus': ('Available', 'Importing', 'Deleting', 'ImportFailed', 'DeleteFailed'),
+    'HubContentType': ('Model', 'Notebook'),
+    'HubSortBy': ('HubName', 'CreationTime', 'HubStatus', 'AccountIdOwner'),
+    'HubStatus': ('InService', 'Creating', 'Updating', 'Deleting', 'CreateFailed', 'UpdateFailed', 'DeleteFailed'),
+    'HumanTaskUiStatus': ('Active', 'Deleting'),
+    'HyperParameterScalingType': ('Auto', 'Linear', 'Logarithmic', 'ReverseLogarithmic'),
+    'HyperParameterTuningAllocationStrategy': ('Prioritized',),
+    'HyperParameterTuningJobObjectiveType': ('Maximize', 'Minimize'),
+    'HyperParameterTuningJobSortByOptions': ('Name', 'Status', 'CreationTime'),
+    'HyperParameterTuningJobStatus': ('Completed', 'InProgress', 'Failed', 'Stopped', 'Stopping', 'Deleting', 'DeleteFailed'),
+    'HyperParameterTuningJobStrategyType': ('Bayesian', 'Random', 'Hyperband', 'Grid'),
+    'HyperParameterTuningJobWarmStartType': ('IdenticalDataAndAlgorithm', 'TransferLearning'),
+    'ImageSortBy': ('CREATION_TIME', 'LAST_MODIFIED_TIME', 'IMAGE_NAME'),
+    'ImageSortOrder': ('ASCENDING', 'DESCENDING'),
+    'ImageStatus': ('CREATING', 'CREATED', 'CREATE_FAILED', 'UPDATING', 'UPDATE_FAILED', 'DELETING', 'DELETE_FAILED'),
+    'ImageVersionSortBy': ('CREATION_TIME', 'LAST_MODIFIED_TIME', 'VERSION'),
+    'ImageVersionSortOrder': ('ASCENDING', 'DESCENDING'),
+    'ImageVersionStatus': ('CREATING', 'CREATED', 'CREATE_FAILED', 'DELETING', 'DELETE_FAILED'),
+    'InferenceComponentSortKey': ('Name', 'CreationTime', 'Status'),
+    'InferenceComponentStatus': ('InService', 'Creating', 'Updating', 'Failed', 'Deleting'),
+    'InferenceExecutionMode': ('Serial', 'Direct'),
+    'InferenceExperimentStatus': ('Creating', 'Created', 'Updating', 'Running', 'Starting', 'Stopping', 'Completed', 'Cancelled'),
+    'InferenceExperimentStopDesiredState': ('Completed', 'Cancelled'),
+    'InferenceExperimentType': ('ShadowMode',),
+    'InputMode': ('Pipe', 'File'),
+    'InstanceType': ('ml.t2.medium', 'ml.t2.large', 'ml.t2.xlarge', 'ml.t2.2xlarge', 'ml.t3.medium', 'ml.t3.large', 'ml.t3.xlarge', 'ml.t3.2xlarge', 'ml.m4.xlarge', 'ml.m4.2xlarge', 'ml.m4.4xlarge', 'ml.m4.10xlarge', 'ml.m4.16xlarge', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.12xlarge', 'ml.m5.24xlarge', 'ml.m5d.large', 'ml.m5d.xlarge', 'ml.m5d.2xlarge', 'ml.m5d.4xlarge', 'ml.m5d.8xlarge', 'ml.m5d.12xlarge', 'ml.m5d.16xlarge', 'ml.m5d.24xlarge', 'ml.c4.xlarge', 'ml.c4.2xlarge', 'ml.c4.4xlarge', 'ml.c4.8xlarge', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.18xlarge', 'ml.c5d.xlarge', 'ml.c5d.2xlarge', 'ml.c5d.4xlarge', 'ml.c5d.9xlarge', 'ml.c5d.18xlarge', 'ml.p2.xlarge', 'ml.p2.8xlarge', 'ml.p2.16xlarge', 'ml.p3.2xlarge', 'ml.p3.8xlarge', 'ml.p3.16xlarge', 'ml.p3dn.24xlarge', 'ml.g4dn.xlarge', 'ml.g4dn.2xlarge', 'ml.g4dn.4xlarge', 'ml.g4dn.8xlarge', 'ml.g4dn.12xlarge', 'ml.g4dn.16xlarge', 'ml.r5.large', 'ml.r5.xlarge', 'ml.r5.2xlarge', 'ml.r5.4xlarge', 'ml.r5.8xlarge', 'ml.r5.12xlarge', 'ml.r5.16xlarge', 'ml.r5.24xlarge', 'ml.g5.xlarge', 'ml.g5.2xlarge', 'ml.g5.4xlarge', 'ml.g5.8xlarge', 'ml.g5.16xlarge', 'ml.g5.12xlarge', 'ml.g5.24xlarge', 'ml.g5.48xlarge', 'ml.inf1.xlarge', 'ml.inf1.2xlarge', 'ml.inf1.6xlarge', 'ml.inf1.24xlarge', 'ml.p4d.24xlarge', 'ml.p4de.24xlarge', 'ml.p5.48xlarge', 'ml.m6i.large', 'ml.m6i.xlarge', 'ml.m6i.2xlarge', 'ml.m6i.4xlarge', 'ml.m6i.8xlarge', 'ml.m6i.12xlarge', 'ml.m6i.16xlarge', 'ml.m6i.24xlarge', 'ml.m6i.32xlarge', 'ml.m7i.large', 'ml.m7i.xlarge', 'ml.m7i.2xlarge', 'ml.m7i.4xlarge', 'ml.m7i.8xlarge', 'ml.m7i.12xlarge', 'ml.m7i.16xlarge', 'ml.m7i.24xlarge', 'ml.m7i.48xlarge', 'ml.c6i.large', 'ml.c6i.xlarge', 'ml.c6i.2xlarge', 'ml.c6i.4xlarge', 'ml.c6i.8xlarge', 'ml.c6i.12xlarge', 'ml.c6i.16xlarge', 'ml.c6i.24xlarge', 'ml.c6i.32xlarge', 'ml.c7i.large', 'ml.c7i.xlarge', 'ml.c7i.2xlarge', 'ml.c7i.4xlarge', 'ml.c7i.8xlarge', 'ml.c7i.12xlarge', 'ml.c7i.16xlarge', 'ml.c7i.24xlarge', 'ml.c7i.48xlarge', 'ml.r6i.large', 'ml.r6i.xlarge', 'ml.r6i.2xlarge', 'ml.r6i.4xlarge', 'ml.r6i.8xlarge', 'ml.r6i.12xlarge', 'ml.r6i.16xlarge', 'ml.r6i.24xlarge', 'ml.r6i.32xlarge', 'ml.r7i.large', 'ml.r7i.xlarge', 'ml.r7i.2xlarge', 'ml.r7i.4xlarge', 'ml.r7i.8xlarge', 'ml.r7i.12xlarge', 'ml.r7i.16xlarge', 'ml.r7i.24xlarge', 'ml.r7i.48xlarge', 'ml.m6id.large', 'ml.m6id.xlarge', 'ml.m6id.2xlarge', 'ml.m6id.4xlarge', 'ml.m6id.8xlarge', 'ml.m6id.12xlarge', 'ml.m6id.16xlarge', 'ml.m6id.24xlarge', 'ml.m6id.32xlarge', 'ml.c6id.large', 'ml.c6id.xlarge', 'ml.c6id.2xlarge', 'ml.c6id.4xlarge', 'ml.c6id.8xlarge', 'ml.c6id.12xlarge', 'ml.c6id.16xlarge', 'ml.c6id.24xlarge', 'ml.c6id.32xlarge', 'ml.r6id.large', 'ml.r6id.xlarge', 'ml.r6id.2xlarge', 'ml.r6id.4xlarge', 'ml.r6id.8xlarge', 'ml.r6id.12xlarge', 'ml.r6id.16xlarge', 'ml.r6id.24xlarge', 'ml.r6id.32xlarge'),
+    'JobType': ('TRAINING', 'INFERENCE', 'NOTEBOOK_KERNEL'),
+    'JoinSource': ('Input', 'None'),
+    'LabelingJobStatus': ('Initializing', 'InProgress', 'Completed', 'Failed', 'Stopping', 'Stopped'),
+    'LastUpdateStatusValue': ('Successful', 'Failed', 'InProgress'),
+    'LineageType': ('TrialComponent', 'Artifact', 'Context', 'Action'),
+    'ListCompilationJobsSortBy': ('Name', 'CreationTime', 'Status'),
+    'ListDeviceFleetsSortBy': ('NAME', 'CREATION_TIME', 'LAST_MODIFIED_TIME'),
+    'ListEdgeDeploymentPlansSortBy': ('NAME', 'DEVICE_FLEET_NAME', 'CREATION_TIME', 'LAST_MODIFIED_TIME'),
+    'ListEdgePackagingJobsSortBy': ('NAME', 'MODEL_NAME', 'CREATION_TIME', 'LAST_MODIFIED_TIME', 'STATUS'),
+    'ListInferenceRecommendationsJobsSortBy': ('Name', 'CreationTime', 'Status'),
+    'ListLabelingJobsForWorkteamSortByOptions': ('CreationTime',),
+    'ListWorkforcesSortByOptions': ('Name', 'CreateDate'),
+    'ListWorkteamsSortByOptions': ('Name', 'CreateDate'),
+    'ManagedInstanceScalingStatus': ('ENABLED', 'DISABLED'),
+    'MetricSetSource': ('Train', 'Validation', 'Test'),
+    'ModelApprovalStatus': ('Approved', 'Rejected', 'PendingManualApproval'),
+    'ModelCacheSetting': ('Enabled', 'Disabled'),
+    'ModelCardExportJobSortBy': ('Name', 'CreationTime', 'Status'),
+    'ModelCardExportJobSortOrder': ('Ascending', 'Descending'),
+    'ModelCardExportJobStatus': ('InProgress', 'Completed', 'Failed'),
+    'ModelCardProcessingStatus': ('DeleteInProgress', 'DeletePending', 'ContentDeleted', 'ExportJobsDeleted', 'DeleteCompleted', 'DeleteFailed'),
+    'ModelCardSortBy': ('Name', 'CreationTime'),
+    'ModelCardSortOrder': ('Ascending', 'Descending'),
+    'ModelCardStatus': ('Draft', 'PendingReview', 'Approved', 'Archived'),
+    'ModelCardVersionSortBy': ('Version',),
+    'ModelCompressionType': ('None', 'Gzip'),
+    'ModelInfrastructureType': ('RealTimeInference',),
+    'ModelMetadataFilterType': ('Domain', 'Framework', 'Task', 'FrameworkVersion'),
+    'ModelPackageGroupSortBy': ('Name', 'CreationTime'),
+    'ModelPackageGroupStatus': ('Pending', 'InProgress', 'Completed', 'Failed', 'Deleting', 'DeleteFailed'),
+    'ModelPackageSortBy': ('Name', 'CreationTime'),
+    'ModelPackageStatus': ('Pending', 'InProgress', 'Completed', 'Failed', 'Deleting'),
+    'ModelPackageType': ('Versioned', 'Unversioned', 'Both'),
+    'ModelSortKey': ('Name', 'CreationTime'),
+    'ModelVariantAction': ('Retain', 'Remove', 'Promote'),
+    'ModelVariantStatus': ('Creating', 'Updating', 'InService', 'Deleting', 'Deleted'),
+    'MonitoringAlertHistorySortKey': ('CreationTime', 'Status'),
+    'MonitoringAlertStatus': ('InAlert', 'OK'),
+    'MonitoringExecutionSortKey': ('CreationTime', 'ScheduledTime', 'Status'),
+    'MonitoringJobDefinitionSortKey': ('Name', 'CreationTime'),
+    'MonitoringProblemType': ('BinaryClassification', 'MulticlassClassification', 'Regression'),
+    'MonitoringScheduleSortKey': ('Name', 'CreationTime', 'Status'),
+    'MonitoringType': ('DataQuality', 'ModelQuality', 'ModelBias', 'ModelExplainability'),
+    'NotebookInstanceAcceleratorType': ('ml.eia1.medium', 'ml.eia1.large', 'ml.eia1.xlarge', 'ml.eia2.medium', 'ml.eia2.large', 'ml.eia2.xlarge'),
+    'NotebookInstanceLifecycleConfigSortKey': ('Name', 'CreationTime', 'LastModifiedTime'),
+    'NotebookInstanceLifecycleConfigSortOrder': ('Ascending', 'Descending'),
+    'NotebookInstanceSortKey': ('Name', 'CreationTime', 'Status'),
+    'NotebookInstanceSortOrder': ('Ascending', 'Descending'),
+    'NotebookInstanceStatus': ('Pending', 'InService', 'Stopping', 'Stopped', 'Failed', 'Deleting', 'Updating'),
+    'NotebookOutputOption': ('Allowed', 'Disabled'),
+    'ObjectiveStatus': ('Succeeded', 'Pending', 'Failed'),
+    'OfflineStoreStatusValue': ('Active', 'Blocked', 'Disabled'),
+    'Operator': ('Equals', 'NotEquals', 'GreaterThan', 'GreaterThanOrEqualTo', 'LessThan', 'LessThanOrEqualTo', 'Contains', 'Exists', 'NotExists', 'In'),
+    'OrderKey': ('Ascending', 'Descending'),
+    'OutputCompressionType': ('GZIP', 'NONE'),
+    'ParameterType': ('Integer', 'Continuous', 'Categorical', 'FreeText'),
+    'PipelineExecutionStatus': ('Executing', 'Stopping', 'Stopped', 'Failed', 'Succeeded'),
+    'PipelineStatus': ('Active', 'Deleting'),
+    'ProblemType': ('BinaryClassification', 'MulticlassClassification', 'Regression'),
+    'ProcessingInstanceType': ('ml.t3.medium', 'ml.t3.large', 'ml.t3.xlarge', 'ml.t3.2xlarge', 'ml.m4.xlarge', 'ml.m4.2xlarge', 'ml.m4.4xlarge', 'ml.m4.10xlarge', 'ml.m4.16xlarge', 'ml.c4.xlarge', 'ml.c4.2xlarge', 'ml.c4.4xlarge', 'ml.c4.8xlarge', 'ml.p2.xlarge', 'ml.p2.8xlarge', 'ml.p2.16xlarge', 'ml.p3.2xlarge', 'ml.p3.8xlarge', 'ml.p3.16xlarge', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.18xlarge', 'ml.m5.large', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.12xlarge', 'ml.m5.24xlarge', 'ml.r5.large', 'ml.r5.xlarge', 'ml.r5.2xlarge', 'ml.r5.4xlarge', 'ml.r5.8xlarge', 'ml.r5.12xlarge', 'ml.r5.16xlarge', 'ml.r5.24xlarge', 'ml.g4dn.xlarge', 'ml.g4dn.2xlarge', 'ml.g4dn.4xlarge', 'ml.g4dn.8xlarge', 'ml.g4dn.12xlarge', 'ml.g4dn.16xlarge'),
+    'ProcessingJobStatus': ('InProgress', 'Completed', 'Failed', 'Stopping', 'Stopped'),
+    'ProcessingS3CompressionType': ('None', 'Gzip'),
+    'ProcessingS3DataDistributionType': ('FullyReplicated', 'ShardedByS3Key'),
+    'ProcessingS3DataType': ('ManifestFile', 'S3Prefix'),
+    'ProcessingS3InputMode': ('Pipe', 'File'),
+    'ProcessingS3UploadMode': ('Continuous', 'EndOfJob'),
+    'Processor': ('CPU', 'GPU'),
+    'ProductionVariantAcceleratorType': ('ml.eia1.medium', 'ml.eia1.large', 'ml.eia1.xlarge', 'ml.eia2.medium', 'ml.eia2.large', 'ml.eia2.xlarge'),
+    'ProductionVariantInstanceType': ('ml.t2.medium', 'ml.t2.large', 'ml.t2.xlarge', 'ml.t2.2xlarge', 'ml.m4.xlarge', 'ml.m4.2xlarge', 'ml.m4.4xlarge', 'ml.m4.10xlarge', 'ml.m4.16xlarge', 'ml.m5.large', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.12xlarge', 'ml.m5.24xlarge', 'ml.m5d.large', 'ml.m5d.xlarge', 'ml.m5d.2xlarge', 'ml.m5d.4xlarge', 'ml.m5d.12xlarge', 'ml.m5d.24xlarge', 'ml.c4.large', 'ml.c4.xlarge', 'ml.c4.2xlarge', 'ml.c4.4xlarge', 'ml.c4.8xlarge', 'ml.p2.xlarge', 'ml.p2.8xlarge', 'ml.p2.16xlarge', 'ml.p3.2xlarge', 'ml.p3.8xlarge', 'ml.p3.16xlarge', 'ml.c5.large', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.18xlarge', 'ml.c5d.large', 'ml.c5d.xlarge', 'ml.c5d.2xlarge', 'ml.c5d.4xlarge', 'ml.c5d.9xlarge', 'ml.c5d.18xlarge', 'ml.g4dn.xlarge', 'ml.g4dn.2xlarge', 'ml.g4dn.4xlarge', 'ml.g4dn.8xlarge', 'ml.g4dn.12xlarge', 'ml.g4dn.16xlarge', 'ml.r5.large', 'ml.r5.xlarge', 'ml.r5.2xlarge', 'ml.r5.4xlarge', 'ml.r5.12xlarge', 'ml.r5.24xlarge', 'ml.r5d.large', 'ml.r5d.xlarge', 'ml.r5d.2xlarge', 'ml.r5d.4xlarge', 'ml.r5d.12xlarge', 'ml.r5d.24xlarge', 'ml.inf1.xlarge', 'ml.inf1.2xlarge', 'ml.inf1.6xlarge', 'ml.inf1.24xlarge', 'ml.dl1.24xlarge', 'ml.c6i.large', 'ml.c6i.xlarge', 'ml.c6i.2xlarge', 'ml.c6i.4xlarge', 'ml.c6i.8xlarge', 'ml.c6i.12xlarge', 'ml.c6i.16xlarge', 'ml.c6i.24xlarge', 'ml.c6i.32xlarge', 'ml.g5.xlarge', 'ml.g5.2xlarge', 'ml.g5.4xlarge', 'ml.g5.8xlarge', 'ml.g5.12xlarge', 'ml.g5.16xlarge', 'ml.g5.24xlarge', 'ml.g5.48xlarge', 'ml.p4d.24xlarge', 'ml.c7g.large', 'ml.c7g.xlarge', 'ml.c7g.2xlarge', 'ml.c7g.4xlarge', 'ml.c7g.8xlarge', 'ml.c7g.12xlarge', 'ml.c7g.16xlarge', 'ml.m6g.large', 'ml.m6g.xlarge', 'ml.m6g.2xlarge', 'ml.m6g.4xlarge', 'ml.m6g.8xlarge', 'ml.m6g.12xlarge', 'ml.m6g.16xlarge', 'ml.m6gd.large', 'ml.m6gd.xlarge', 'ml.m6gd.2xlarge', 'ml.m6gd.4xlarge', 'ml.m6gd.8xlarge', 'ml.m6gd.12xlarge', 'ml.m6gd.16xlarge', 'ml.c6g.large', 'ml.c6g.xlarge', 'ml.c6g.2xlarge', 'ml.c6g.4xlarge', 'ml.c6g.8xlarge', 'ml.c6g.12xlarge', 'ml.c6g.16xlarge', 'ml.c6gd.large', 'ml.c6gd.xlarge', 'ml.c6gd.2xlarge', 'ml.c6gd.4xlarge', 'ml.c6gd.8xlarge', 'ml.c6gd.12xlarge', 'ml.c6gd.16xlarge', 'ml.c6gn.large', 'ml.c6gn.xlarge', 'ml.c6gn.2xlarge', 'ml.c6gn.4xlarge', 'ml.c6gn.8xlarge', 'ml.c6gn.12xlarge', 'ml.c6gn.16xlarge', 'ml.r6g.large', 'ml.r6g.xlarge', 'ml.r6g.2xlarge', 'ml.r6g.4xlarge', 'ml.r6g.8xlarge', 'ml.r6g.12xlarge', 'ml.r6g.16xlarge', 'ml.r6gd.large', 'ml.r6gd.xlarge', 'ml.r6gd.2xlarge', 'ml.r6gd.4xlarge', 'ml.r6gd.8xlarge', 'ml.r6gd.12xlarge', 'ml.r6gd.16xlarge', 'ml.p4de.24xlarge', 'ml.trn1.2xlarge', 'ml.trn1.32xlarge', 'ml.trn1n.32xlarge', 'ml.inf2.xlarge', 'ml.inf2.8xlarge', 'ml.inf2.24xlarge', 'ml.inf2.48xlarge', 'ml.p5.48xlarge', 'ml.m7i.large', 'ml.m7i.xlarge', 'ml.m7i.2xlarge', 'ml.m7i.4xlarge', 'ml.m7i.8xlarge', 'ml.m7i.12xlarge', 'ml.m7i.16xlarge', 'ml.m7i.24xlarge', 'ml.m7i.48xlarge', 'ml.c7i.large', 'ml.c7i.xlarge', 'ml.c7i.2xlarge', 'ml.c7i.4xlarge', 'ml.c7i.8xlarge', 'ml.c7i.12xlarge', 'ml.c7i.16xlarge', 'ml.c7i.24xlarge', 'ml.c7i.48xlarge', 'ml.r7i.large', 'ml.r7i.xlarge', 'ml.r7i.2xlarge', 'ml.r7i.4xlarge', 'ml.r7i.8xlarge', 'ml.r7i.12xlarge', 'ml.r7i.16xlarge', 'ml.r7i.24xlarge', 'ml.r7i.48xlarge'),
+    'ProfilingStatus': ('Enabled', 'Disabled'),
+    'ProjectSortBy': ('Name', 'CreationTime'),
+    'ProjectSortOrder': ('Ascending', 'Descending'),
+    'ProjectStatus': ('Pending', 'CreateInProgress', 'CreateCompleted', 'CreateFailed', 'DeleteInProgress', 'DeleteFailed', 'DeleteCompleted', 'UpdateInProgress', 'UpdateCompleted', 'UpdateFailed'),
+    'RStudioServerProAccessStatus': ('ENABLED', 'DISABLED'),
+    'RStudioServerProUserGroup': ('R_STUDIO_ADMIN', 'R_STUDIO_USER'),
+    'RecommendationJobStatus': ('PENDING', 'IN_PROGRESS', 'COMPLETED', 'FAILED', 'STOPPING', 'STOPPED', 'DELETING', 'DELETED'),
+    'RecommendationJobSupportedEndpointType': ('RealTime', 'Serverless'),
+    'RecommendationJobType': ('Default', 'Advanced'),
+    'RecommendationStatus': ('IN_PROGRESS', 'COMPLETED', 'FAILED', 'NOT_APPLICABLE'),
+    'RecommendationStepType': ('BENCHMARK',),
+    'RecordWrapper': ('None', 'RecordIO'),
+    'RedshiftResultCompressionType': ('None', 'GZIP', 'BZIP2', 'ZSTD', 'SNAPPY'),
+    'RedshiftResultFormat': ('PARQUET', 'CSV'),
+    'RepositoryAccessMode': ('Platform', 'Vpc'),
+    'ResourceCatalogSortBy': ('CreationTime',),
+    'ResourceCatalogSortOrder': ('Ascending', 'Descending'),
+    'ResourceType': ('TrainingJob', 'Experiment', 'ExperimentTrial', 'ExperimentTrialComponent', 'Endpoint', 'Model', 'ModelPackage', 'ModelPackageGroup', 'Pipeline', 'PipelineExecution', 'FeatureGroup', 'FeatureMetadata', 'Image', 'ImageVersion', 'Project', 'HyperParameterTuningJob', 'ModelCard'),
+    'RetentionType': ('Retain', 'Delete'),
+    'RootAccess': ('Enabled', 'Disabled'),
+    'RoutingStrategy': ('LEAST_OUTSTANDING_REQUESTS', 'RANDOM'),
+    'RuleEvaluationStatus': ('InProgress', 'NoIssuesFound', 'IssuesFound', 'Error', 'Stopping', 'Stopped'),
+    'S3DataDistribution': ('FullyReplicated', 'ShardedByS3Key'),
+    'S3DataType': ('ManifestFile', 'S3Prefix', 'AugmentedManifestFile'),
+    'S3ModelDataType': ('S3Prefix', 'S3Object'),
+    'SagemakerServicecatalogStatus': ('Enabled', 'Disabled'),
+    'ScheduleStatus': ('Pending', 'Failed', 'Scheduled', 'Stopped'),
+    'SearchSortOrder': ('Ascending', 'Descending'),
+    'SecondaryStatus': ('Starting', 'LaunchingMLInstances', 'PreparingTrainingStack', 'Downloading', 'DownloadingTrainingImage', 'Training', 'Uploading', 'Stopping', 'Stopped', 'MaxRuntimeExceeded', 'Completed', 'Failed', 'Interrupted', 'MaxWaitTimeExceeded', 'Updating', 'Restarting', 'Pending'),
+    'SharingType': ('Private', 'Shared'),
+    'SkipModelValidation': ('All', 'None'),
+    'SortActionsBy': ('Name', 'CreationTime'),
+    'SortArtifactsBy': ('CreationTime',),
+    'SortAssociationsBy': ('SourceArn', 'DestinationArn', 'SourceType', 'DestinationType', 'CreationTime'),
+    'SortBy': ('Name', 'CreationTime', 'Status'),
+    'SortContextsBy': ('Name', 'CreationTime'),
+    'SortExperimentsBy': ('Name', 'CreationTime'),
+    'SortInferenceExperimentsBy': ('Name', 'CreationTime', 'Status'),
+    'SortLineageGroupsBy': ('Name', 'CreationTime'),
+    'SortOrder': ('Ascending', 'Descending'),
+    'SortPipelineExecutionsBy': ('CreationTime', 'PipelineExecutionArn'),
+    'SortPipelinesBy': ('Name', 'CreationTime'),
+    'SortTrialComponentsBy': ('Name', 'CreationTime'),
+    'SortTrialsBy': ('Name', 'CreationTime'),
+    'SpaceSortKey': ('CreationTime', 'LastModifiedTime'),
+    'SpaceStatus': ('Deleting', 'Failed', 'InService', 'Pending', 'Updating', 'Update_Failed', 'Delete_Failed'),
+    'SplitType': ('None', 'Line', 'RecordIO', 'TFRecord'),
+    'StageStatus': ('CREATING', 'READYTODEPLOY', 'STARTING', 'INPROGRESS', 'DEPLOYED', 'FAILED', 'STOPPING', 'STOPPED'),
+    'Statistic': ('Average', 'Minimum', 'Maximum', 'SampleCount', 'Sum'),
+    'StepStatus': ('Starting', 'Executing', 'Stopping', 'Stopped', 'Failed', 'Succeeded'),
+    'StorageType': ('Standard', 'InMemory'),
+    'StudioLifecycleConfigAppType': ('JupyterServer', 'KernelGateway', 'CodeEditor', 'JupyterLab'),
+    'StudioLifecycleConfigSortKey': ('CreationTime', 'LastModifiedTime', 'Name'),
+    'StudioWebPortal': ('ENABLED', 'DISABLED'),
+    'TableFormat': ('Default', 'Glue', 'Iceberg'),
+    'TargetDevice': ('lambda', 'ml_m4', 'ml_m5', 'ml_m6g', 'ml_c4', 'ml_c5', 'ml_c6g', 'ml_p2', 'ml_p3', 'ml_g4dn', 'ml_inf1', 'ml_inf2', 'ml_trn1', 'ml_eia2', 'jetson_tx1', 'jetson_tx2', 'jetson_nano', 'jetson_xavier', 'rasp3b', 'rasp4b', 'imx8qm', 'deeplens', 'rk3399', 'rk3288', 'aisage', 'sbe_c', 'qcs605', 'qcs603', 'sitara_am57x', 'amba_cv2', 'amba_cv22', 'amba_cv25', 'x86_win32', 'x86_win64', 'coreml', 'jacinto_tda4vm', 'imx8mplus'),
+    'TargetPlatformAccelerator': ('INTEL_GRAPHICS', 'MALI', 'NVIDIA', 'NNA'),
+    'TargetPlatformArch': ('X86_64', 'X86', 'ARM64', 'ARM_EABI', 'ARM_EABIHF'),
+    'TargetPlatformOs': ('ANDROID', 'LINUX'),
+    'ThroughputMode': ('OnDemand', 'Provisioned'),
+    'TrafficRoutingConfigType': ('ALL_AT_ONCE', 'CANARY', 'LINEAR'),
+    'TrafficType': ('PHASES', 'STAIRS'),
+    'TrainingInputMode': ('Pipe', 'File', 'FastFile'),
+    'TrainingInstanceType': ('ml.m4.xlarge', 'ml.m4.2xlarge', 'ml.m4.4xlarge', 'ml.m4.10xlarge', 'ml.m4.16xlarge', 'ml.g4dn.xlarge', 'ml.g4dn.2xlarge', 'ml.g4dn.4xlarge', 'ml.g4dn.8xlarge', 'ml.g4dn.12xlarge', 'ml.g4dn.16xlarge', 'ml.m5.large', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.12xlarge', 'ml.m5.24xlarge', 'ml.c4.xlarge', 'ml.c4.2xlarge', 'ml.c4.4xlarge', 'ml.c4.8xlarge', 'ml.p2.xlarge', 'ml.p2.8xlarge', 'ml.p2.16xlarge', 'ml.p3.2xlarge', 'ml.p3.8xlarge', 'ml.p3.16xlarge', 'ml.p3dn.24xlarge', 'ml.p4d.24xlarge', 'ml.p4de.24xlarge', 'ml.p5.48xlarge', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.18xlarge', 'ml.c5n.xlarge', 'ml.c5n.2xlarge', 'ml.c5n.4xlarge', 'ml.c5n.9xlarge', 'ml.c5n.18xlarge', 'ml.g5.xlarge', 'ml.g5.2xlarge', 'ml.g5.4xlarge', 'ml.g5.8xlarge', 'ml.g5.16xlarge', 'ml.g5.12xlarge', 'ml.g5.24xlarge', 'ml.g5.48xlarge', 'ml.trn1.2xlarge', 'ml.trn1.32xlarge', 'ml.trn1n.32xlarge', 'ml.m6i.large', 'ml.m6i.xlarge', 'ml.m6i.2xlarge', 'ml.m6i.4xlarge', 'ml.m6i.8xlarge', 'ml.m6i.12xlarge', 'ml.m6i.16xlarge', 'ml.m6i.24xlarge', 'ml.m6i.32xlarge', 'ml.c6i.xlarge', 'ml.c6i.2xlarge', 'ml.c6i.8xlarge', 'ml.c6i.4xlarge', 'ml.c6i.12xlarge', 'ml.c6i.16xlarge', 'ml.c6i.24xlarge', 'ml.c6i.32xlarge'),
+    'TrainingJobEarlyStoppingType': ('Off', 'Auto'),
+    'TrainingJobSortByOptions': ('Name', 'CreationTime', 'Status', 'FinalObjectiveMetricValue'),
+    'TrainingJobStatus': ('InProgress', 'Completed', 'Failed', 'Stopping', 'Stopped'),
+    'TrainingRepositoryAccessMode': ('Platform', 'Vpc'),
+    'TransformInstanceType': ('ml.m4.xlarge', 'ml.m4.2xlarge', 'ml.m4.4xlarge', 'ml.m4.10xlarge', 'ml.m4.16xlarge', 'ml.c4.xlarge', 'ml.c4.2xlarge', 'ml.c4.4xlarge', 'ml.c4.8xlarge', 'ml.p2.xlarge', 'ml.p2.8xlarge', 'ml.p2.16xlarge', 'ml.p3.2xlarge', 'ml.p3.8xlarge', 'ml.p3.16xlarge', 'ml.c5.xlarge', 'ml.c5.2xlarge', 'ml.c5.4xlarge', 'ml.c5.9xlarge', 'ml.c5.18xlarge', 'ml.m5.large', 'ml.m5.xlarge', 'ml.m5.2xlarge', 'ml.m5.4xlarge', 'ml.m5.12xlarge', 'ml.m5.24xlarge', 'ml.g4dn.xlarge', 'ml.g4dn.2xlarge', 'ml.g4dn.4xlarge', 'ml.g4dn.8xlarge', 'ml.g4dn.12xlarge', 'ml.g4dn.16xlarge'),
+    'TransformJobStatus': ('InProgress', 'Completed', 'Failed', 'Stopping', 'Stopped'),
+    'TrialComponentPrimaryStatus': ('InProgress', 'Completed', 'Failed', 'Stopping', 'Stopped'),
+    'TtlDurationUnit': ('Seconds', 'Minutes', 'Hours', 'Days', 'Weeks'),
+    'UserProfileSortKey': ('CreationTime', 'LastModifiedTime'),
+    'UserProfileStatus': ('Deleting', 'Failed', 'InService', 'Pending', 'Updating', 'Update_Failed', 'Delete_Failed'),
+    'VariantPropertyType': ('DesiredInstanceCount', 'DesiredWeight', 'DataCaptureConfig'),
+    'VariantStatus': ('Creating', 'Updating', 'Deleting', 'ActivatingTraffic', 'Baking'),
+    'VendorGuidance': ('NOT_PROVIDED', 'STABLE', 'TO_BE_ARCHIVED', 'ARCHIVED'),
+    'WarmPoolResourceStatus': ('Available', 'Terminated', 'Reused', 'InUse'),
+    'WorkforceStatus': ('Initializing', 'Updating', 'Deleting', 'Failed', 'Active'),
 }
+# fmt: on
+
+SHAPE_DAG = CompactShapeDag(_STRINGS, _RECORDS)
@@ -0,0 +1,118 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Read-only views of decoded shapes, the base of the generated <Shape>View classes."""
+from typing import ClassVar, Optional
+
+
+def _to_model(value):
+    if isinstance(value, ShapeView):
+        return value.to_model()
+    if isinstance(value, list):
+        return [_to_model(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_model(item) for key, item in value.items()}
+    return value
+
+
+def _to_dict(value):
+    if isinstance(value, ShapeView):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_dict(item) for key, item in value.items()}
+    return value
+
+
+class ShapeView:
+    """
+    A frozen, __slots__ based view of a decoded shape.
+
+    The attributes are the ones of the shape class, nested structures are views too and
+    missing members are None. Views have no per-instance __dict__ and skip validation,
+    use to_model for a mutable and validated model.
+    """
+
+    __slots__ = ()
+    _shape: ClassVar[str] = ""
+
+    def __init__(self, **attributes):
+        set_attribute = object.__setattr__
+        for name, value in attributes.items():
+            set_attribute(self, name, value)
+
+    def __getattr__(self, name: str):
+        # only called for the slots of the members missing from the response
+        if name in type(self).__slots__:
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only, see to_model")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only, see to_model")
+
+    def __iter__(self):
+        """Iterates over the (attribute name, value) pairs of the members present."""
+        for name in type(self).__slots__:
+            try:
+                yield name, object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return dict(self) == dict(other)
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(f"{name}={value!r}" for name, value in self)
+        return f"{type(self).__name__}({attributes})"
+
+    def __reduce__(self):
+        return _restore_view, (type(self), dict(self))
+
+    def to_dict(self) -> dict:
+        """Returns the members present as a dict, nested views included."""
+        return {name: _to_dict(value) for name, value in self}
+
+    def to_model(self, model: Optional[type] = None, validate: bool = False):
+        """
+        Converts the view to a pydantic model, nested views included.
+
+        Args:
+            model (type): The model class, a shape or resource class. Defaults to the
+                shape class of the view, which operation responses do not have.
+            validate (bool): Whether to validate the attributes, they are trusted by
+                default like the ones of decoded responses.
+
+        Returns:
+            The model instance, with the attributes of the view that are fields of
+            the model.
+        """
+        if model is None:
+            from src.generated import shapes
+
+            model = getattr(shapes, self._shape)
+        model_fields = model.model_fields
+        attributes = {
+            name: _to_model(value) for name, value in self if name in model_fields
+        }
+        return model(**attributes) if validate else model.model_construct(**attributes)
+
+
+def _restore_view(view_class: type, attributes: dict) -> ShapeView:
+    return view_class(**attributes)
@@ -0,0 +1,531 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Waiter engine of the generated wait methods and of multi-resource waits."""
+import asyncio
+import datetime
+import logging
+import os
+import random
+import threading
+import time
+
+from collections import defaultdict
+from typing import (
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
+
+from src.code_injection.codec import transform
+from src.generated.utils import SageMakerClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DELAY = 60
+
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+    ]
+)
+TRANSIENT_ERROR_CODES = frozenset(
+    [
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "InternalFailure",
+        "InternalServerError",
+        "ServiceUnavailable",
+    ]
+)
+
+
+class WaiterError(Exception):
+    """Raised when a resource does not reach the status it is waited for."""
+
+    def __init__(self, message: str, resource_type: str, status: Optional[str]):
+        super().__init__(message)
+        self.resource_type = resource_type
+        self.status = status
+
+
+class TimeoutExceededError(WaiterError):
+    """Raised when the timeout of a waiter is exceeded."""
+
+
+class FailedStatusError(WaiterError):
+    """Raised when a resource reaches a failure status while it is waited for."""
+
+
+class PollingFailedError(WaiterError):
+    """
+    Raised by wait_all once the other resources are done, when some could not be polled.
+
+    The failures are the pairs of a resource and the non-retryable error of its call.
+    """
+
+    def __init__(self, message: str, failures: list):
+        super().__init__(message, type(failures[0][0]).__name__, None)
+        self.failures = failures
+
+
+def get_status(response: dict, status_path: Sequence[str]) -> Optional[str]:
+    """
+    Extracts the status from a raw describe response, without deserializing it.
+
+    Args:
+        response (dict): The raw describe response.
+        status_path (Sequence[str]): The member names leading to the status.
+
+    Returns:
+        str: The status, or None if the response has no status.
+    """
+    value = response
+    for member_name in status_path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(member_name)
+    return value
+
+
+def backoff_delays(poll: float, max_delay: float) -> Iterator[float]:
+    """
+    Yields exponentially increasing delays with equal jitter.
+
+    The n-th delay is drawn between half and all of min(max_delay, poll * 2 ** n), so
+    pollers started together spread out instead of describing in lockstep.
+
+    Args:
+        poll (float): The base delay in seconds.
+        max_delay (float): The cap of the delays in seconds.
+    """
+    attempt = 0
+    while True:
+        delay = min(max_delay, poll * 2**attempt)
+        yield delay / 2 + random.uniform(0, delay / 2)
+        if delay < max_delay:
+            attempt += 1
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Returns whether an error means the request rate is too high."""
+    return (
+        isinstance(error, ClientError)
+        and error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+    )
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Returns whether a failed call may succeed when retried."""
+    if is_throttling_error(error):
+        return True
+    if isinstance(error, (ConnectionError, HTTPClientError)):
+        return True
+    if isinstance(error, ClientError):
+        status_code = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return error.response.get("Error", {}).get(
+            "Code"
+        ) in TRANSIENT_ERROR_CODES or status_code in (500, 502, 503, 504)
+    return False
+
+
+class Waiter:
+    """
+    Polls the describe API of a resource until it reaches a success status.
+
+    Intermediate responses are only inspected for their status, the final response
+    is returned raw so the caller deserializes it once.
+    """
+
+    def __init__(
+        self,
+        resource_type: str,
+        status_path: Sequence[str],
+        success_states: Iterable[str],
+        failure_states: Iterable[str] = (),
+        poll: float = 5,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initializes a Waiter.
+
+        Args:
+            resource_type (str): The resource name, used in error messages.
+            status_path (Sequence[str]): The member names leading to the status in
+                the describe response.
+            success_states (Iterable[str]): The states ending the wait.
+            failure_states (Iterable[str]): The states raising a FailedStatusError.
+            poll (float): The base delay between two describe calls in seconds.
+            max_delay (float): The maximum delay between two describe calls in seconds.
+            timeout (float): The maximum time to wait in seconds, None to wait forever.
+        """
+        self.resource_type = resource_type
+        self.status_path = tuple(status_path)
+        self.success_states = frozenset(success_states)
+        self.failure_states = frozenset(failure_states) - self.success_states
+        self.poll = poll
+        self.max_delay = max(poll, max_delay)
+        self.timeout = timeout
+
+    def _is_done(self, response: dict) -> bool:
+        status = get_status(response, self.status_path)
+        if status in self.success_states:
+            return True
+        if status in self.failure_states:
+            raise FailedStatusError(
+                f"{self.resource_type} reached failure status {status}",
+                self.resource_type,
+                status,
+            )
+        logger.debug(f"{self.resource_type} status: {status}")
+        return False
+
+    def _next_delay(self, delays: Iterator[float], start_time: float, status) -> float:
+        delay = next(delays)
+        if self.timeout is None:
+            return delay
+
+        remaining = self.timeout - (time.monotonic() - start_time)
+        if remaining <= 0:
+            raise TimeoutExceededError(
+                f"Timeout exceeded. Final resource state - {status}",
+                self.resource_type,
+                status,
+            )
+        return min(delay, remaining)
+
+    def wait(self, describe: Callable[[], dict]) -> dict:
+        """
+        Polls until the resource reaches a success status.
+
+        Args:
+            describe (Callable[[], dict]): Calls the describe API of the resource.
+
+        Returns:
+            dict: The raw describe response holding the success status.
+
+        Raises:
+            FailedStatusError: If the resource reaches a failure status.
+            TimeoutExceededError: If the timeout is exceeded.
+        """
+        start_time = time.monotonic()
+        delays = backoff_delays(self.poll, self.max_delay)
+        while True:
+            response = describe()
+            if self._is_done(response):
+                return response
+            status = get_status(response, self.status_path)
+            time.sleep(self._next_delay(delays, start_time, status))
+
+    async def async_wait(self, describe: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        The asyncio counterpart of wait.
+
+        Args:
+            describe (Callable[[], Awaitable[dict]]): Calls the describe API of the
+                resource.
+
+        Returns:
+            dict: The raw describe response holding the success status.
+        """
+        start_time = time.monotonic()
+        delays = backoff_delays(self.poll, self.max_delay)
+        while True:
+            response = await describe()
+            if self._is_done(response):
+                return response
+            status = get_status(response, self.status_path)
+            await asyncio.sleep(self._next_delay(delays, start_time, status))
+
+
+class WaiterConfig(NamedTuple):
+    """
+    Describes how to poll the status of a waitable resource class.
+
+    The list members are only set when the List API of the resource can be filtered
+    by status and its summaries identify the resource.
+    """
+
+    resource_type: str
+    status_path: Tuple[str, ...]
+    terminal_states: Tuple[str, ...]
+    describe_method: str
+    identifiers: Tuple[Tuple[str, str], ...]
+    describe_output_shape: str
+    list_method: Optional[str] = None
+    summaries_key: Optional[str] = None
+    summary_name: Optional[str] = None
+    list_filters: Tuple[str, ...] = ()
+
+
+class RateLimiter:
+    """A thread-safe token bucket bounding the rate of API calls."""
+
+    def __init__(self, max_requests_per_second: float, burst: Optional[int] = None):
+        self.rate = max_requests_per_second
+        self.capacity = burst or max(1, int(max_requests_per_second))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long to wait before it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            return 0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks until a call is allowed by the rate budget."""
+        if delay := self._reserve():
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        """The asyncio counterpart of acquire."""
+        if delay := self._reserve():
+            await asyncio.sleep(delay)
+
+
+def _update_from_summary(resource, config: WaiterConfig, summary: dict) -> None:
+    transformed_summary = transform(summary, config.summary_name)
+    for attribute, value in transformed_summary.items():
+        if attribute in type(resource).model_fields:
+            setattr(resource, attribute, value)
+
+
+def _creation_time(resource) -> Optional[datetime.datetime]:
+    """
+    Reads the creation time of a resource without describing it.
+
+    Accessing an unassigned attribute describes the resource, one call per resource
+    outside of the rate budget, so only a value at hand is read.
+    """
+    raw_members = getattr(resource, "_raw_members", None)
+    if raw_members and "creation_time" in raw_members:
+        # converting a raw member of a response makes no call
+        return resource.creation_time
+    creation_time = vars(resource).get("creation_time")
+    if isinstance(creation_time, datetime.datetime):
+        return creation_time
+    return None
+
+
+def _poll_with_list(
+    client, config: WaiterConfig, resources: list, rate_limiter, failures: list
+):
+    """
+    Finds the resources in terminal states with List API calls filtered by status.
+
+    One paginated List call per terminal state replaces one describe call per
+    resource, narrowed by the common name prefix and the oldest creation time. Without
+    either, the List calls would page the whole account history every round, so the
+    resources are described one by one instead, as they are when a List call fails
+    with a non-retryable error.
+    """
+    name_member, name_attribute = config.identifiers[0]
+    by_name = {getattr(resource, name_attribute): resource for resource in resources}
+
+    list_method_kwargs = {}
+    if "NameContains" in config.list_filters:
+        if name_prefix := os.path.commonprefix(list(by_name)):
+            list_method_kwargs["NameContains"] = name_prefix
+    creation_times = [_creation_time(resource) for resource in resources]
+    if "CreationTimeAfter" in config.list_filters and all(
+        isinstance(creation_time, datetime.datetime) for creation_time in creation_times
+    ):
+        # CreationTimeAfter is exclusive
+        list_method_kwargs["CreationTimeAfter"] = min(
+            creation_times
+        ) - datetime.timedelta(seconds=1)
+    if not list_method_kwargs:
+        yield from _poll_with_describe(
+            client, config, resources, rate_limiter, failures
+        )
+        return
+
+    for state in config.terminal_states:
+        next_token = None
+        while by_name:
+            rate_limiter.acquire()
+            page_kwargs = dict(list_method_kwargs, StatusEquals=state)
+            if next_token:
+                page_kwargs["NextToken"] = next_token
+            try:
+                response = getattr(client, config.list_method)(**page_kwargs)
+            except Exception as error:
+                if is_retryable_error(error):
+                    # the resources not found yet are listed again next round
+                    logger.debug(f"Listing failed with {error!r}, retrying next round")
+                    return
+                logger.debug(f"Listing failed with {error!r}, describing instead")
+                yield from _poll_with_describe(
+                    client, config, list(by_name.values()), rate_limiter, failures
+                )
+                return
+            for summary in response.get(config.summaries_key, []):
+                if (
+                    resource := by_name.pop(summary.get(name_member), None)
+                ) is not None:
+                    _update_from_summary(resource, config, summary)
+                    yield resource
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+
+
+def _poll_with_describe(
+    client, config: WaiterConfig, resources: list, rate_limiter, failures: list
+):
+    """
+    Finds the resources in terminal states with one describe call each.
+
+    A resource whose call fails with a retryable error is described again next round,
+    with another error it is added to the failures and no longer polled.
+    """
+    for resource in resources:
+        rate_limiter.acquire()
+        try:
+            response = getattr(client, config.describe_method)(
+                **{
+                    member_name: getattr(resource, attribute)
+                    for member_name, attribute in config.identifiers
+                }
+            )
+        except Exception as error:
+            if is_retryable_error(error):
+                logger.debug(f"Describing failed with {error!r}, retrying next round")
+            else:
+                failures.append((resource, error))
+            continue
+        if get_status(response, config.status_path) in config.terminal_states:
+            resource._update_from_describe(response, config.describe_output_shape)
+            yield resource
+
+
+def wait_all(
+    resources: Iterable,
+    poll: float = 5,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    timeout: Optional[float] = None,
+    max_requests_per_second: float = 5,
+    list_threshold: int = 10,
+) -> Iterator:
+    """
+    Waits for many resources at once, yielding each one as it reaches a terminal state.
+
+    The resources are polled in rounds separated by exponential backoff. All the
+    calls share a single rate budget. Groups of at least list_threshold resources of a
+    class whose List API filters by status are polled with List calls instead of one
+    describe call per resource. A call failing with a throttling or transient error is
+    made again next round, a resource whose describe call fails with another error is
+    no longer polled and reported once the other resources are done.
+
+    Args:
+        resources (Iterable): The waitable resources, ie. TrainingJob objects.
+        poll (float): The base delay between two polling rounds in seconds.
+        max_delay (float): The maximum delay between two polling rounds in seconds.
+        timeout (float): The maximum time to wait in seconds, None to wait forever.
+        max_requests_per_second (float): The rate budget shared by all the calls.
+        list_threshold (int): The group size from which List calls are preferred.
+
+    Yields:
+        The resources, in the order they reach a terminal state.
+
+    Raises:
+        TimeoutExceededError: If the timeout is exceeded before all resources are done.
+        PollingFailedError: If some resources could not be polled.
+    """
+    pending = list(resources)
+    for resource in pending:
+        if getattr(type(resource), "_waiter_config", None) is None:
+            raise ValueError(f"{type(resource).__name__} is not a waitable resource")
+
+    rate_limiter = RateLimiter(max_requests_per_second)
+    delays = backoff_delays(poll, max(poll, max_delay))
+    start_time = time.monotonic()
+    failures = []
+    while True:
+        groups = defaultdict(list)
+        for resource in pending:
+            groups[(type(resource), resource._session, resource._region)].append(
+                resource
+            )
+
+        done = set()
+        for (resource_cls, session, region), group in groups.items():
+            config = resource_cls._waiter_config
+            client = SageMakerClient(session=session, region_name=region).client
+            if config.list_method and len(group) >= list_threshold:
+                poller = _poll_with_list(client, config, group, rate_limiter, failures)
+            else:
+                poller = _poll_with_describe(
+                    client, config, group, rate_limiter, failures
+                )
+            for resource in poller:
+                done.add(id(resource))
+                yield resource
+
+        done.update(id(resource) for resource, _ in failures)
+        pending = [resource for resource in pending if id(resource) not in done]
+        if not pending:
+            if failures:
+                raise PollingFailedError(
+                    f"{len(failures)} resources could not be polled", failures
+                )
+            return
+
+        delay = next(delays)
+        if timeout is not None:
+            remaining = timeout - (time.monotonic() - start_time)
+            if remaining <= 0:
+                raise TimeoutExceededError(
+                    f"Timeout exceeded. {len(pending)} resources still pending",
+                    type(pending[0]).__name__,
+                    None,
+                )
+            delay = min(delay, remaining)
+        time.sleep(delay)
+
+
+def wait_any(resources: Iterable, **kwargs):
+    """
+    Waits until any of the resources reaches a terminal state.
+
+    Args:
+        resources (Iterable): The waitable resources, ie. TrainingJob objects.
+        **kwargs: The polling arguments of wait_all.
+
+    Returns:
+        The first resource to reach a terminal state.
+    """
+    resources_in_terminal_state = wait_all(resources, **kwargs)
+    try:
+        return next(resources_in_terminal_state)
+    finally:
+        resources_in_terminal_state.close()
@@ -0,0 +1,50 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Builds the deferred validators of the generated models ahead of their first use."""
+import logging
+import threading
+
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def build_models(
+    get_models: Callable[[], Iterable[type]], background: bool = True
+) -> Optional[threading.Thread]:
+    """
+    Builds the core schema and validator of pydantic models declared with defer_build.
+
+    Args:
+        get_models (Callable): Returns the models to build. It is called on the building
+            thread, so the lazy imports of the models happen there too.
+        background (bool): Whether to build the models on a daemon thread.
+
+    Returns:
+        Optional[threading.Thread]: The started thread if background, None otherwise.
+    """
+
+    def build():
+        for model in get_models():
+            try:
+                # a no-op for the models already built by an earlier instantiation
+                model.model_rebuild()
+            except Exception:
+                logger.debug(f"Could not build {model!r} ahead of use", exc_info=True)
+
+    if not background:
+        build()
+        return None
+    thread = threading.Thread(target=build, name="sagemaker-warm-up", daemon=True)
+    thread.start()
+    return thread
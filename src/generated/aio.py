@@ -0,0 +1,14126 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+from pydantic import validate_call
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from . import resources
+from .resources import Base
+from .utils import (
+    AsyncResourceIterator,
+    get_async_transport,
+    async_cached_describe,
+    invalidate_describe_cache,
+)
+from .intelligent_defaults_helper import get_config_value
+from src.code_injection.codec import serialize_request, transform, transform_view
+from src.code_injection.batch import (
+    BatchResult,
+    async_stream_batch,
+    is_throttling_error,
+)
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter
+from .shapes import (
+    ActionSource,
+    AdditionalInferenceSpecificationDefinition,
+    AlgorithmSpecification,
+    AlgorithmValidationSpecification,
+    AppSpecification,
+    ArtifactSource,
+    AsyncInferenceConfig,
+    AutoMLChannel,
+    AutoMLDataSplitConfig,
+    AutoMLJobChannel,
+    AutoMLJobConfig,
+    AutoMLJobObjective,
+    AutoMLOutputDataConfig,
+    AutoMLProblemTypeConfig,
+    AutoMLSecurityConfig,
+    Autotune,
+    BatchDataCaptureConfig,
+    Channel,
+    CheckpointConfig,
+    ClusterInstanceGroupSpecification,
+    CognitoConfig,
+    ContainerDefinition,
+    ContextSource,
+    DataCaptureConfig,
+    DataProcessing,
+    DataQualityAppSpecification,
+    DataQualityBaselineConfig,
+    DataQualityJobInput,
+    DebugHookConfig,
+    DebugRuleConfiguration,
+    DefaultSpaceSettings,
+    DeploymentConfig,
+    DeploymentStage,
+    DomainSettings,
+    DomainSettingsForUpdate,
+    DriftCheckBaselines,
+    EdgeDeploymentModelConfig,
+    EdgeOutputConfig,
+    ExperimentConfig,
+    ExplainerConfig,
+    FeatureDefinition,
+    FlowDefinitionOutputConfig,
+    GitConfig,
+    HubS3StorageConfig,
+    HumanLoopActivationConfig,
+    HumanLoopConfig,
+    HumanLoopRequestSource,
+    HumanTaskConfig,
+    HyperParameterTrainingJobDefinition,
+    HyperParameterTuningJobConfig,
+    HyperParameterTuningJobWarmStartConfig,
+    InferenceComponentRuntimeConfig,
+    InferenceComponentSpecification,
+    InferenceExecutionConfig,
+    InferenceExperimentDataStorageConfig,
+    InferenceExperimentSchedule,
+    InferenceSpecification,
+    InfraCheckConfig,
+    InputConfig,
+    InstanceMetadataServiceConfiguration,
+    JupyterLabAppImageConfig,
+    KernelGatewayImageConfig,
+    LabelingJobAlgorithmsConfig,
+    LabelingJobInputConfig,
+    LabelingJobOutputConfig,
+    LabelingJobStoppingConditions,
+    MemberDefinition,
+    MetadataProperties,
+    ModelBiasAppSpecification,
+    ModelBiasBaselineConfig,
+    ModelBiasJobInput,
+    ModelCardExportOutputConfig,
+    ModelCardSecurityConfig,
+    ModelClientConfig,
+    ModelDeployConfig,
+    ModelExplainabilityAppSpecification,
+    ModelExplainabilityBaselineConfig,
+    ModelExplainabilityJobInput,
+    ModelMetrics,
+    ModelPackageValidationSpecification,
+    ModelQualityAppSpecification,
+    ModelQualityBaselineConfig,
+    ModelQualityJobInput,
+    ModelVariantConfig,
+    MonitoringNetworkConfig,
+    MonitoringOutputConfig,
+    MonitoringResources,
+    MonitoringScheduleConfig,
+    MonitoringStoppingCondition,
+    NeoVpcConfig,
+    NetworkConfig,
+    NotebookInstanceLifecycleHook,
+    NotificationConfiguration,
+    OfflineStoreConfig,
+    OidcConfig,
+    OnlineStoreConfig,
+    OutputConfig,
+    OutputDataConfig,
+    OwnershipSettings,
+    ParallelismConfiguration,
+    PipelineDefinitionS3Location,
+    ProcessingInput,
+    ProcessingOutputConfig,
+    ProcessingResources,
+    ProcessingStoppingCondition,
+    ProductionVariant,
+    ProfilerConfig,
+    ProfilerRuleConfiguration,
+    RecommendationJobInputConfig,
+    RecommendationJobOutputConfig,
+    RecommendationJobStoppingConditions,
+    RemoteDebugConfig,
+    ResourceConfig,
+    ResourceSpec,
+    RetryStrategy,
+    ServiceCatalogProvisioningDetails,
+    ServiceCatalogProvisioningUpdateDetails,
+    ShadowModeConfig,
+    SourceAlgorithmSpecification,
+    SourceIpConfig,
+    SpaceSettings,
+    SpaceSharingSettings,
+    StoppingCondition,
+    Tag,
+    TensorBoardOutputConfig,
+    ThroughputConfig,
+    TrainingSpecification,
+    TransformInput,
+    TransformOutput,
+    TransformResources,
+    TrialComponentArtifact,
+    TrialComponentParameterValue,
+    TrialComponentStatus,
+    UiTemplate,
+    Unassigned,
+    UserSettings,
+    VariantProperty,
+    VpcConfig,
+    WorkforceVpcConfigRequest,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AsyncBase:
+    # the bulk methods of the resources, awaiting the coroutines of the asyncio classes on the running loop
+
+    @classmethod
+    async def create_many(
+        cls,
+        inputs: List[Dict],
+        max_concurrency: int = 8,
+        max_attempts: int = 5,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> List[BatchResult]:
+        """Creates a resource per dict of create arguments, concurrently. Results keep the order of the inputs."""
+        # Create is not idempotent, it is only retried when throttled, and without the describe
+        results = [
+            result
+            async for result in async_stream_batch(
+                lambda kwargs: cls.create(
+                    **kwargs, session=session, region=region, skip_describe=True
+                ),
+                inputs,
+                max_concurrency=max_concurrency,
+                max_attempts=max_attempts,
+                retryable=is_throttling_error,
+            )
+        ]
+        described = [
+            result
+            async for result in async_stream_batch(
+                lambda resource: resource.refresh(),
+                [result.result for result in results if result.ok],
+                max_concurrency=max_concurrency,
+                max_attempts=max_attempts,
+            )
+        ]
+        # asyncio resources are not described on first access, a resource whose describe
+        # failed is kept in the result along with the error, await its refresh() to describe it
+        described = iter(described)
+        for index, result in enumerate(results):
+            if result.ok:
+                describe = next(described)
+                results[index] = result._replace(
+                    latency=result.latency + describe.latency, error=describe.error
+                )
+        return results
+
+    @classmethod
+    async def get_many(
+        cls,
+        identifiers: List,
+        max_concurrency: int = 8,
+        max_attempts: int = 5,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> List[BatchResult]:
+        """Gets a resource per name or dict of get arguments, concurrently. Results keep the order of the identifiers."""
+
+        def get(identifier):
+            if isinstance(identifier, Dict):
+                return cls.get(**identifier, session=session, region=region)
+            return cls.get(identifier, session=session, region=region)
+
+        return [
+            result
+            async for result in async_stream_batch(
+                get,
+                identifiers,
+                max_concurrency=max_concurrency,
+                max_attempts=max_attempts,
+            )
+        ]
+
+    @classmethod
+    async def delete_many(
+        cls,
+        resources: List["AsyncBase"],
+        max_concurrency: int = 8,
+        max_attempts: int = 5,
+    ) -> List[BatchResult]:
+        """Deletes the resources concurrently. Results keep the order of the resources."""
+        return [
+            result
+            async for result in async_stream_batch(
+                lambda resource: resource.delete(),
+                resources,
+                max_concurrency=max_concurrency,
+                max_attempts=max_attempts,
+            )
+        ]
+
+
+class Action(AsyncBase, resources.Action):
+
+    @classmethod
+    async def create(
+        cls,
+        action_name: str,
+        source: ActionSource,
+        action_type: str,
+        description: Optional[str] = Unassigned(),
+        status: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating action resource.")
+        operation_input_args = {
+            "ActionName": action_name,
+            "Source": source,
+            "ActionType": action_type,
+            "Description": description,
+            "Status": status,
+            "Properties": properties,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateActionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_action",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Action", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateActionRequest"),
+                transform(response, "CreateActionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(action_name=action_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        action_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ActionName": action_name,
+        }
+        response = await async_cached_describe(
+            "Action",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_action",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeActionResponse")
+
+        # deserialize the response
+        action = cls._from_describe(
+            response,
+            "DescribeActionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return action
+
+    @classmethod
+    def list(
+        cls,
+        source_uri: Optional[str] = Unassigned(),
+        action_type: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Action"]:
+        operation_input_args = {
+            "SourceUri": source_uri,
+            "ActionType": action_type,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListActionsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_actions",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ActionSummaries",
+            summary_name="ActionSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ActionName": self.action_name,
+        }
+        response = await async_cached_describe(
+            "Action",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_action",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeActionResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        properties_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating action resource.")
+        operation_input_args = {
+            "ActionName": self.action_name,
+            "Description": self.description,
+            "Status": self.status,
+            "Properties": self.properties,
+            "PropertiesToRemove": properties_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateActionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_action",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Action", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ActionName": self.action_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_action",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Action", operation_input_args, session=self._session, region=self._region
+        )
+
+
+class Algorithm(AsyncBase, resources.Algorithm):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "training_specification": {
+                    "additional_s3_data_source": {
+                        "s3_data_type": {"type": "string"},
+                        "s3_uri": {"type": "string"},
+                    }
+                },
+                "validation_specification": {"validation_role": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Algorithm", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        algorithm_name: str,
+        training_specification: TrainingSpecification,
+        algorithm_description: Optional[str] = Unassigned(),
+        inference_specification: Optional[InferenceSpecification] = Unassigned(),
+        validation_specification: Optional[
+            AlgorithmValidationSpecification
+        ] = Unassigned(),
+        certify_for_marketplace: Optional[bool] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating algorithm resource.")
+        operation_input_args = {
+            "AlgorithmName": algorithm_name,
+            "AlgorithmDescription": algorithm_description,
+            "TrainingSpecification": training_specification,
+            "InferenceSpecification": inference_specification,
+            "ValidationSpecification": validation_specification,
+            "CertifyForMarketplace": certify_for_marketplace,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAlgorithmInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_algorithm",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Algorithm", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateAlgorithmInput"),
+                transform(response, "CreateAlgorithmOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            algorithm_name=algorithm_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        algorithm_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AlgorithmName": algorithm_name,
+        }
+        response = await async_cached_describe(
+            "Algorithm",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_algorithm",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAlgorithmOutput")
+
+        # deserialize the response
+        algorithm = cls._from_describe(
+            response,
+            "DescribeAlgorithmOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return algorithm
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Algorithm"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListAlgorithmsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_algorithms",
+            list_method_kwargs=operation_input_args,
+            summaries_key="AlgorithmSummaryList",
+            summary_name="AlgorithmSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        response = await async_cached_describe(
+            "Algorithm",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_algorithm",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeAlgorithmOutput", fields=fields)
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_algorithm",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Algorithm",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        waiter = Waiter(
+            resource_type="Algorithm",
+            status_path=("AlgorithmStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_algorithm",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAlgorithmOutput")
+        return self
+
+
+class App(AsyncBase, resources.App):
+
+    @classmethod
+    async def create(
+        cls,
+        domain_id: str,
+        app_type: str,
+        app_name: str,
+        user_profile_name: Optional[str] = Unassigned(),
+        space_name: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        resource_spec: Optional[ResourceSpec] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating app resource.")
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SpaceName": space_name,
+            "AppType": app_type,
+            "AppName": app_name,
+            "Tags": tags,
+            "ResourceSpec": resource_spec,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAppRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_app",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "App", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateAppRequest"),
+                transform(response, "CreateAppResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            domain_id=domain_id,
+            app_type=app_type,
+            app_name=app_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        domain_id: str,
+        app_type: str,
+        app_name: str,
+        user_profile_name: Optional[str] = Unassigned(),
+        space_name: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SpaceName": space_name,
+            "AppType": app_type,
+            "AppName": app_name,
+        }
+        response = await async_cached_describe(
+            "App",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_app",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAppResponse")
+
+        # deserialize the response
+        app = cls._from_describe(
+            response,
+            "DescribeAppResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return app
+
+    @classmethod
+    def list(
+        cls,
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        domain_id_equals: Optional[str] = Unassigned(),
+        user_profile_name_equals: Optional[str] = Unassigned(),
+        space_name_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["App"]:
+        operation_input_args = {
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "DomainIdEquals": domain_id_equals,
+            "UserProfileNameEquals": user_profile_name_equals,
+            "SpaceNameEquals": space_name_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListAppsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_apps",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Apps",
+            summary_name="AppDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        response = await async_cached_describe(
+            "App",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_app",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeAppResponse", fields=fields)
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_app",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "App", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Deleted", "Deleting", "Failed", "InService", "Pending"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        waiter = Waiter(
+            resource_type="App",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_app",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAppResponse")
+        return self
+
+
+class AppImageConfig(AsyncBase, resources.AppImageConfig):
+
+    @classmethod
+    async def create(
+        cls,
+        app_image_config_name: str,
+        tags: Optional[List[Tag]] = Unassigned(),
+        kernel_gateway_image_config: Optional[KernelGatewayImageConfig] = Unassigned(),
+        jupyter_lab_app_image_config: Optional[JupyterLabAppImageConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating app_image_config resource.")
+        operation_input_args = {
+            "AppImageConfigName": app_image_config_name,
+            "Tags": tags,
+            "KernelGatewayImageConfig": kernel_gateway_image_config,
+            "JupyterLabAppImageConfig": jupyter_lab_app_image_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAppImageConfigRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_app_image_config",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "AppImageConfig", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateAppImageConfigRequest"),
+                transform(response, "CreateAppImageConfigResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            app_image_config_name=app_image_config_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        app_image_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AppImageConfigName": app_image_config_name,
+        }
+        response = await async_cached_describe(
+            "AppImageConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_app_image_config",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAppImageConfigResponse")
+
+        # deserialize the response
+        app_image_config = cls._from_describe(
+            response,
+            "DescribeAppImageConfigResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return app_image_config
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["AppImageConfig"]:
+        operation_input_args = {
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "ModifiedTimeBefore": modified_time_before,
+            "ModifiedTimeAfter": modified_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListAppImageConfigsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_app_image_configs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="AppImageConfigs",
+            summary_name="AppImageConfigDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "AppImageConfigName": self.app_image_config_name,
+        }
+        response = await async_cached_describe(
+            "AppImageConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_app_image_config",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeAppImageConfigResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating app_image_config resource.")
+        operation_input_args = {
+            "AppImageConfigName": self.app_image_config_name,
+            "KernelGatewayImageConfig": self.kernel_gateway_image_config,
+            "JupyterLabAppImageConfig": self.jupyter_lab_app_image_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateAppImageConfigRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_app_image_config",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "AppImageConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "AppImageConfigName": self.app_image_config_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_app_image_config",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "AppImageConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class Artifact(AsyncBase, resources.Artifact):
+
+    @classmethod
+    async def create(
+        cls,
+        source: ArtifactSource,
+        artifact_type: str,
+        artifact_name: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating artifact resource.")
+        operation_input_args = {
+            "ArtifactName": artifact_name,
+            "Source": source,
+            "ArtifactType": artifact_type,
+            "Properties": properties,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateArtifactRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_artifact",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Artifact", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateArtifactRequest"),
+                transform(response, "CreateArtifactResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            artifact_arn=response["ArtifactArn"], session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        artifact_arn: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ArtifactArn": artifact_arn,
+        }
+        response = await async_cached_describe(
+            "Artifact",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_artifact",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeArtifactResponse")
+
+        # deserialize the response
+        artifact = cls._from_describe(
+            response,
+            "DescribeArtifactResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return artifact
+
+    @classmethod
+    def list(
+        cls,
+        source_uri: Optional[str] = Unassigned(),
+        artifact_type: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Artifact"]:
+        operation_input_args = {
+            "SourceUri": source_uri,
+            "ArtifactType": artifact_type,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListArtifactsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_artifacts",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ArtifactSummaries",
+            summary_name="ArtifactSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+        }
+        response = await async_cached_describe(
+            "Artifact",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_artifact",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeArtifactResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        properties_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating artifact resource.")
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+            "ArtifactName": self.artifact_name,
+            "Properties": self.properties,
+            "PropertiesToRemove": properties_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateArtifactRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_artifact",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Artifact", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+            "Source": self.source,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_artifact",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Artifact", operation_input_args, session=self._session, region=self._region
+        )
+
+
+class AutoMLJob(AsyncBase, resources.AutoMLJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "auto_m_l_job_config": {
+                    "security_config": {
+                        "volume_kms_key_id": {"type": "string"},
+                        "vpc_config": {
+                            "security_group_ids": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            },
+                            "subnets": {"type": "array", "items": {"type": "string"}},
+                        },
+                    },
+                    "candidate_generation_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "AutoMLJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        auto_m_l_job_name: str,
+        input_data_config: List[AutoMLChannel],
+        output_data_config: AutoMLOutputDataConfig,
+        role_arn: str,
+        problem_type: Optional[str] = Unassigned(),
+        auto_m_l_job_objective: Optional[AutoMLJobObjective] = Unassigned(),
+        auto_m_l_job_config: Optional[AutoMLJobConfig] = Unassigned(),
+        generate_candidate_definitions_only: Optional[bool] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        model_deploy_config: Optional[ModelDeployConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating auto_m_l_job resource.")
+        operation_input_args = {
+            "AutoMLJobName": auto_m_l_job_name,
+            "InputDataConfig": input_data_config,
+            "OutputDataConfig": output_data_config,
+            "ProblemType": problem_type,
+            "AutoMLJobObjective": auto_m_l_job_objective,
+            "AutoMLJobConfig": auto_m_l_job_config,
+            "RoleArn": role_arn,
+            "GenerateCandidateDefinitionsOnly": generate_candidate_definitions_only,
+            "Tags": tags,
+            "ModelDeployConfig": model_deploy_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAutoMLJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_auto_m_l_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "AutoMLJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateAutoMLJobRequest"),
+                transform(response, "CreateAutoMLJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            auto_m_l_job_name=auto_m_l_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        auto_m_l_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AutoMLJobName": auto_m_l_job_name,
+        }
+        response = await async_cached_describe(
+            "AutoMLJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_auto_m_l_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAutoMLJobResponse")
+
+        # deserialize the response
+        auto_m_l_job = cls._from_describe(
+            response,
+            "DescribeAutoMLJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return auto_m_l_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["AutoMLJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListAutoMLJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_auto_m_l_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="AutoMLJobSummaries",
+            summary_name="AutoMLJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        response = await async_cached_describe(
+            "AutoMLJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_auto_m_l_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeAutoMLJobResponse", fields=fields)
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_auto_m_l_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "AutoMLJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        waiter = Waiter(
+            resource_type="AutoMLJob",
+            status_path=("AutoMLJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_auto_m_l_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAutoMLJobResponse")
+        return self
+
+
+class AutoMLJobV2(AsyncBase, resources.AutoMLJobV2):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "auto_m_l_problem_type_config": {
+                    "time_series_forecasting_job_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                    "tabular_job_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                },
+                "security_config": {
+                    "volume_kms_key_id": {"type": "string"},
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "AutoMLJobV2", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        auto_m_l_job_name: str,
+        auto_m_l_job_input_data_config: List[AutoMLJobChannel],
+        output_data_config: AutoMLOutputDataConfig,
+        auto_m_l_problem_type_config: AutoMLProblemTypeConfig,
+        role_arn: str,
+        tags: Optional[List[Tag]] = Unassigned(),
+        security_config: Optional[AutoMLSecurityConfig] = Unassigned(),
+        auto_m_l_job_objective: Optional[AutoMLJobObjective] = Unassigned(),
+        model_deploy_config: Optional[ModelDeployConfig] = Unassigned(),
+        data_split_config: Optional[AutoMLDataSplitConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating auto_m_l_job_v2 resource.")
+        operation_input_args = {
+            "AutoMLJobName": auto_m_l_job_name,
+            "AutoMLJobInputDataConfig": auto_m_l_job_input_data_config,
+            "OutputDataConfig": output_data_config,
+            "AutoMLProblemTypeConfig": auto_m_l_problem_type_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "SecurityConfig": security_config,
+            "AutoMLJobObjective": auto_m_l_job_objective,
+            "ModelDeployConfig": model_deploy_config,
+            "DataSplitConfig": data_split_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAutoMLJobV2Request"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_auto_m_l_job_v2",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "AutoMLJobV2", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateAutoMLJobV2Request"),
+                transform(response, "CreateAutoMLJobV2Response"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            auto_m_l_job_name=auto_m_l_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        auto_m_l_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AutoMLJobName": auto_m_l_job_name,
+        }
+        response = await async_cached_describe(
+            "AutoMLJobV2",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_auto_m_l_job_v2",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAutoMLJobV2Response")
+
+        # deserialize the response
+        auto_m_l_job_v2 = cls._from_describe(
+            response,
+            "DescribeAutoMLJobV2Response",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return auto_m_l_job_v2
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        response = await async_cached_describe(
+            "AutoMLJobV2",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_auto_m_l_job_v2",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeAutoMLJobV2Response", fields=fields
+        )
+        return self
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        waiter = Waiter(
+            resource_type="AutoMLJobV2",
+            status_path=("AutoMLJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_auto_m_l_job_v2",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAutoMLJobV2Response")
+        return self
+
+
+class Cluster(AsyncBase, resources.Cluster):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Cluster", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        cluster_name: str,
+        instance_groups: List[ClusterInstanceGroupSpecification],
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating cluster resource.")
+        operation_input_args = {
+            "ClusterName": cluster_name,
+            "InstanceGroups": instance_groups,
+            "VpcConfig": vpc_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateClusterRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_cluster",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Cluster", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateClusterRequest"),
+                transform(response, "CreateClusterResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(cluster_name=cluster_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        cluster_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ClusterName": cluster_name,
+        }
+        response = await async_cached_describe(
+            "Cluster",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_cluster",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeClusterResponse")
+
+        # deserialize the response
+        cluster = cls._from_describe(
+            response,
+            "DescribeClusterResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return cluster
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Cluster"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListClustersRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_clusters",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ClusterSummaries",
+            summary_name="ClusterSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        response = await async_cached_describe(
+            "Cluster",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_cluster",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeClusterResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating cluster resource.")
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "InstanceGroups": self.instance_groups,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateClusterRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_cluster",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Cluster", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_cluster",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Cluster", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Creating",
+            "Deleting",
+            "Failed",
+            "InService",
+            "RollingBack",
+            "SystemUpdating",
+            "Updating",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        waiter = Waiter(
+            resource_type="Cluster",
+            status_path=("ClusterStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_cluster",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeClusterResponse")
+        return self
+
+
+class CodeRepository(AsyncBase, resources.CodeRepository):
+
+    @classmethod
+    async def create(
+        cls,
+        code_repository_name: str,
+        git_config: GitConfig,
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating code_repository resource.")
+        operation_input_args = {
+            "CodeRepositoryName": code_repository_name,
+            "GitConfig": git_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateCodeRepositoryInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_code_repository",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "CodeRepository", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateCodeRepositoryInput"),
+                transform(response, "CreateCodeRepositoryOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            code_repository_name=code_repository_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        code_repository_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "CodeRepositoryName": code_repository_name,
+        }
+        response = await async_cached_describe(
+            "CodeRepository",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_code_repository",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeCodeRepositoryOutput")
+
+        # deserialize the response
+        code_repository = cls._from_describe(
+            response,
+            "DescribeCodeRepositoryOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return code_repository
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "CodeRepositoryName": self.code_repository_name,
+        }
+        response = await async_cached_describe(
+            "CodeRepository",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_code_repository",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeCodeRepositoryOutput", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating code_repository resource.")
+        operation_input_args = {
+            "CodeRepositoryName": self.code_repository_name,
+            "GitConfig": self.git_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateCodeRepositoryInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_code_repository",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "CodeRepository",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "CodeRepositoryName": self.code_repository_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_code_repository",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "CodeRepository",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class CompilationJob(AsyncBase, resources.CompilationJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_artifacts": {"s3_model_artifacts": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "input_config": {"s3_uri": {"type": "string"}},
+                "output_config": {
+                    "s3_output_location": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "CompilationJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        compilation_job_name: str,
+        role_arn: str,
+        output_config: OutputConfig,
+        stopping_condition: StoppingCondition,
+        model_package_version_arn: Optional[str] = Unassigned(),
+        input_config: Optional[InputConfig] = Unassigned(),
+        vpc_config: Optional[NeoVpcConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating compilation_job resource.")
+        operation_input_args = {
+            "CompilationJobName": compilation_job_name,
+            "RoleArn": role_arn,
+            "ModelPackageVersionArn": model_package_version_arn,
+            "InputConfig": input_config,
+            "OutputConfig": output_config,
+            "VpcConfig": vpc_config,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateCompilationJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_compilation_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "CompilationJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateCompilationJobRequest"),
+                transform(response, "CreateCompilationJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            compilation_job_name=compilation_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        compilation_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "CompilationJobName": compilation_job_name,
+        }
+        response = await async_cached_describe(
+            "CompilationJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_compilation_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeCompilationJobResponse")
+
+        # deserialize the response
+        compilation_job = cls._from_describe(
+            response,
+            "DescribeCompilationJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return compilation_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["CompilationJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListCompilationJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_compilation_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="CompilationJobSummaries",
+            summary_name="CompilationJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        response = await async_cached_describe(
+            "CompilationJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_compilation_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeCompilationJobResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_compilation_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "CompilationJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_compilation_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "CompilationJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED"]
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        waiter = Waiter(
+            resource_type="CompilationJob",
+            status_path=("CompilationJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_compilation_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeCompilationJobResponse")
+        return self
+
+
+class Context(AsyncBase, resources.Context):
+
+    @classmethod
+    async def create(
+        cls,
+        context_name: str,
+        source: ContextSource,
+        context_type: str,
+        description: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating context resource.")
+        operation_input_args = {
+            "ContextName": context_name,
+            "Source": source,
+            "ContextType": context_type,
+            "Description": description,
+            "Properties": properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateContextRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_context",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Context", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateContextRequest"),
+                transform(response, "CreateContextResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(context_name=context_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        context_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ContextName": context_name,
+        }
+        response = await async_cached_describe(
+            "Context",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_context",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeContextResponse")
+
+        # deserialize the response
+        context = cls._from_describe(
+            response,
+            "DescribeContextResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return context
+
+    @classmethod
+    def list(
+        cls,
+        source_uri: Optional[str] = Unassigned(),
+        context_type: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Context"]:
+        operation_input_args = {
+            "SourceUri": source_uri,
+            "ContextType": context_type,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListContextsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_contexts",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ContextSummaries",
+            summary_name="ContextSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ContextName": self.context_name,
+        }
+        response = await async_cached_describe(
+            "Context",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_context",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeContextResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        properties_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating context resource.")
+        operation_input_args = {
+            "ContextName": self.context_name,
+            "Description": self.description,
+            "Properties": self.properties,
+            "PropertiesToRemove": properties_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateContextRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_context",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Context", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ContextName": self.context_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_context",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Context", operation_input_args, session=self._session, region=self._region
+        )
+
+
+class DataQualityJobDefinition(AsyncBase, resources.DataQualityJobDefinition):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "data_quality_job_input": {
+                    "endpoint_input": {
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                    "batch_transform_input": {
+                        "data_captured_destination_s3_uri": {"type": "string"},
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                },
+                "data_quality_job_output_config": {"kms_key_id": {"type": "string"}},
+                "job_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "role_arn": {"type": "string"},
+                "data_quality_baseline_config": {
+                    "constraints_resource": {"s3_uri": {"type": "string"}},
+                    "statistics_resource": {"s3_uri": {"type": "string"}},
+                },
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "DataQualityJobDefinition", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        job_definition_name: str,
+        data_quality_app_specification: DataQualityAppSpecification,
+        data_quality_job_input: DataQualityJobInput,
+        data_quality_job_output_config: MonitoringOutputConfig,
+        job_resources: MonitoringResources,
+        role_arn: str,
+        data_quality_baseline_config: Optional[
+            DataQualityBaselineConfig
+        ] = Unassigned(),
+        network_config: Optional[MonitoringNetworkConfig] = Unassigned(),
+        stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating data_quality_job_definition resource.")
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+            "DataQualityBaselineConfig": data_quality_baseline_config,
+            "DataQualityAppSpecification": data_quality_app_specification,
+            "DataQualityJobInput": data_quality_job_input,
+            "DataQualityJobOutputConfig": data_quality_job_output_config,
+            "JobResources": job_resources,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateDataQualityJobDefinitionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_data_quality_job_definition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "DataQualityJobDefinition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(
+                    operation_input_args, "CreateDataQualityJobDefinitionRequest"
+                ),
+                transform(response, "CreateDataQualityJobDefinitionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            job_definition_name=job_definition_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        job_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+        }
+        response = await async_cached_describe(
+            "DataQualityJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_data_quality_job_definition",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeDataQualityJobDefinitionResponse")
+
+        # deserialize the response
+        data_quality_job_definition = cls._from_describe(
+            response,
+            "DescribeDataQualityJobDefinitionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return data_quality_job_definition
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        response = await async_cached_describe(
+            "DataQualityJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_data_quality_job_definition",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeDataQualityJobDefinitionResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_data_quality_job_definition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "DataQualityJobDefinition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class DeviceFleet(AsyncBase, resources.DeviceFleet):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_config": {
+                    "s3_output_location": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "iot_role_alias": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "DeviceFleet", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        device_fleet_name: str,
+        output_config: EdgeOutputConfig,
+        role_arn: Optional[str] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        enable_iot_role_alias: Optional[bool] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating device_fleet resource.")
+        operation_input_args = {
+            "DeviceFleetName": device_fleet_name,
+            "RoleArn": role_arn,
+            "Description": description,
+            "OutputConfig": output_config,
+            "Tags": tags,
+            "EnableIotRoleAlias": enable_iot_role_alias,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateDeviceFleetRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_device_fleet",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "DeviceFleet", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateDeviceFleetRequest"),
+                {},
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            device_fleet_name=device_fleet_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        device_fleet_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DeviceFleetName": device_fleet_name,
+        }
+        response = await async_cached_describe(
+            "DeviceFleet",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_device_fleet",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeDeviceFleetResponse")
+
+        # deserialize the response
+        device_fleet = cls._from_describe(
+            response,
+            "DescribeDeviceFleetResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return device_fleet
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["DeviceFleet"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListDeviceFleetsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_device_fleets",
+            list_method_kwargs=operation_input_args,
+            summaries_key="DeviceFleetSummaries",
+            summary_name="DeviceFleetSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DeviceFleetName": self.device_fleet_name,
+        }
+        response = await async_cached_describe(
+            "DeviceFleet",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_device_fleet",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeDeviceFleetResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+        enable_iot_role_alias: Optional[bool] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating device_fleet resource.")
+        operation_input_args = {
+            "DeviceFleetName": self.device_fleet_name,
+            "RoleArn": self.role_arn,
+            "Description": self.description,
+            "OutputConfig": self.output_config,
+            "EnableIotRoleAlias": enable_iot_role_alias,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateDeviceFleetRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_device_fleet",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "DeviceFleet",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "DeviceFleetName": self.device_fleet_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_device_fleet",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "DeviceFleet",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class Domain(AsyncBase, resources.Domain):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "security_group_id_for_domain_boundary": {"type": "string"},
+                "default_user_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                    "sharing_settings": {
+                        "s3_output_path": {"type": "string"},
+                        "s3_kms_key_id": {"type": "string"},
+                    },
+                    "canvas_app_settings": {
+                        "time_series_forecasting_settings": {
+                            "amazon_forecast_role_arn": {"type": "string"}
+                        },
+                        "model_register_settings": {
+                            "cross_account_model_register_role_arn": {"type": "string"}
+                        },
+                        "workspace_settings": {
+                            "s3_artifact_path": {"type": "string"},
+                            "s3_kms_key_id": {"type": "string"},
+                        },
+                        "generative_ai_settings": {
+                            "amazon_bedrock_role_arn": {"type": "string"}
+                        },
+                    },
+                },
+                "domain_settings": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "r_studio_server_pro_domain_settings": {
+                        "domain_execution_role_arn": {"type": "string"}
+                    },
+                    "execution_role_identity_config": {"type": "string"},
+                },
+                "home_efs_file_system_kms_key_id": {"type": "string"},
+                "subnet_ids": {"type": "array", "items": {"type": "string"}},
+                "kms_key_id": {"type": "string"},
+                "app_security_group_management": {"type": "string"},
+                "default_space_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Domain", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        domain_name: str,
+        auth_mode: str,
+        default_user_settings: UserSettings,
+        subnet_ids: List[str],
+        vpc_id: str,
+        domain_settings: Optional[DomainSettings] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        app_network_access_type: Optional[str] = Unassigned(),
+        home_efs_file_system_kms_key_id: Optional[str] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        app_security_group_management: Optional[str] = Unassigned(),
+        default_space_settings: Optional[DefaultSpaceSettings] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating domain resource.")
+        operation_input_args = {
+            "DomainName": domain_name,
+            "AuthMode": auth_mode,
+            "DefaultUserSettings": default_user_settings,
+            "DomainSettings": domain_settings,
+            "SubnetIds": subnet_ids,
+            "VpcId": vpc_id,
+            "Tags": tags,
+            "AppNetworkAccessType": app_network_access_type,
+            "HomeEfsFileSystemKmsKeyId": home_efs_file_system_kms_key_id,
+            "KmsKeyId": kms_key_id,
+            "AppSecurityGroupManagement": app_security_group_management,
+            "DefaultSpaceSettings": default_space_settings,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateDomainRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_domain",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Domain", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateDomainRequest"),
+                transform(response, "CreateDomainResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            domain_id=response["DomainId"], session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        domain_id: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+        }
+        response = await async_cached_describe(
+            "Domain",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_domain",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeDomainResponse")
+
+        # deserialize the response
+        domain = cls._from_describe(
+            response,
+            "DescribeDomainResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return domain
+
+    @classmethod
+    def list(
+        cls,
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Domain"]:
+        operation_input_args = {}
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListDomainsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_domains",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Domains",
+            summary_name="DomainDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+        }
+        response = await async_cached_describe(
+            "Domain",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_domain",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeDomainResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        domain_settings_for_update: Optional[DomainSettingsForUpdate] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating domain resource.")
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "DefaultUserSettings": self.default_user_settings,
+            "DomainSettingsForUpdate": domain_settings_for_update,
+            "AppSecurityGroupManagement": self.app_security_group_management,
+            "DefaultSpaceSettings": self.default_space_settings,
+            "SubnetIds": self.subnet_ids,
+            "AppNetworkAccessType": self.app_network_access_type,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateDomainRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_domain",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Domain", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "RetentionPolicy": self.retention_policy,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_domain",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Domain", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+        }
+        waiter = Waiter(
+            resource_type="Domain",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed", "Update_Failed", "Delete_Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_domain",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeDomainResponse")
+        return self
+
+
+class EdgeDeploymentPlan(AsyncBase, resources.EdgeDeploymentPlan):
+
+    @classmethod
+    async def create(
+        cls,
+        edge_deployment_plan_name: str,
+        model_configs: List[EdgeDeploymentModelConfig],
+        device_fleet_name: str,
+        stages: Optional[List[DeploymentStage]] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating edge_deployment_plan resource.")
+        operation_input_args = {
+            "EdgeDeploymentPlanName": edge_deployment_plan_name,
+            "ModelConfigs": model_configs,
+            "DeviceFleetName": device_fleet_name,
+            "Stages": stages,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEdgeDeploymentPlanRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_edge_deployment_plan",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "EdgeDeploymentPlan", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateEdgeDeploymentPlanRequest"),
+                transform(response, "CreateEdgeDeploymentPlanResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            edge_deployment_plan_name=edge_deployment_plan_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        edge_deployment_plan_name: str,
+        next_token: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EdgeDeploymentPlanName": edge_deployment_plan_name,
+            "NextToken": next_token,
+            "MaxResults": max_results,
+        }
+        response = await async_cached_describe(
+            "EdgeDeploymentPlan",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_edge_deployment_plan",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEdgeDeploymentPlanResponse")
+
+        # deserialize the response
+        edge_deployment_plan = cls._from_describe(
+            response,
+            "DescribeEdgeDeploymentPlanResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return edge_deployment_plan
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        device_fleet_name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["EdgeDeploymentPlan"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "DeviceFleetNameContains": device_fleet_name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEdgeDeploymentPlansRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_edge_deployment_plans",
+            list_method_kwargs=operation_input_args,
+            summaries_key="EdgeDeploymentPlanSummaries",
+            summary_name="EdgeDeploymentPlanSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EdgeDeploymentPlanName": self.edge_deployment_plan_name,
+            "NextToken": self.next_token,
+            "MaxResults": self.max_results,
+        }
+        response = await async_cached_describe(
+            "EdgeDeploymentPlan",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_edge_deployment_plan",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeEdgeDeploymentPlanResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "EdgeDeploymentPlanName": self.edge_deployment_plan_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_edge_deployment_plan",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "EdgeDeploymentPlan",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class EdgePackagingJob(AsyncBase, resources.EdgePackagingJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "output_config": {
+                    "s3_output_location": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "EdgePackagingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        edge_packaging_job_name: str,
+        compilation_job_name: str,
+        model_name: str,
+        model_version: str,
+        role_arn: str,
+        output_config: EdgeOutputConfig,
+        resource_key: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating edge_packaging_job resource.")
+        operation_input_args = {
+            "EdgePackagingJobName": edge_packaging_job_name,
+            "CompilationJobName": compilation_job_name,
+            "ModelName": model_name,
+            "ModelVersion": model_version,
+            "RoleArn": role_arn,
+            "OutputConfig": output_config,
+            "ResourceKey": resource_key,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEdgePackagingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_edge_packaging_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "EdgePackagingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateEdgePackagingJobRequest"),
+                {},
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            edge_packaging_job_name=edge_packaging_job_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        edge_packaging_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EdgePackagingJobName": edge_packaging_job_name,
+        }
+        response = await async_cached_describe(
+            "EdgePackagingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_edge_packaging_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEdgePackagingJobResponse")
+
+        # deserialize the response
+        edge_packaging_job = cls._from_describe(
+            response,
+            "DescribeEdgePackagingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return edge_packaging_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["EdgePackagingJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "ModelNameContains": model_name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEdgePackagingJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_edge_packaging_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="EdgePackagingJobSummaries",
+            summary_name="EdgePackagingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        response = await async_cached_describe(
+            "EdgePackagingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_edge_packaging_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeEdgePackagingJobResponse", fields=fields
+        )
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_edge_packaging_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "EdgePackagingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED"]
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        waiter = Waiter(
+            resource_type="EdgePackagingJob",
+            status_path=("EdgePackagingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_edge_packaging_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeEdgePackagingJobResponse")
+        return self
+
+
+class Endpoint(AsyncBase, resources.Endpoint):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "async_inference_config": {
+                    "output_config": {
+                        "kms_key_id": {"type": "string"},
+                        "s3_output_path": {"type": "string"},
+                        "s3_failure_path": {"type": "string"},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Endpoint", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        endpoint_name: str,
+        endpoint_config_name: str,
+        deployment_config: Optional[DeploymentConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating endpoint resource.")
+        operation_input_args = {
+            "EndpointName": endpoint_name,
+            "EndpointConfigName": endpoint_config_name,
+            "DeploymentConfig": deployment_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEndpointInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_endpoint",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Endpoint", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateEndpointInput"),
+                transform(response, "CreateEndpointOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            endpoint_name=endpoint_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        endpoint_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EndpointName": endpoint_name,
+        }
+        response = await async_cached_describe(
+            "Endpoint",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_endpoint",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEndpointOutput")
+
+        # deserialize the response
+        endpoint = cls._from_describe(
+            response,
+            "DescribeEndpointOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return endpoint
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Endpoint"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEndpointsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_endpoints",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Endpoints",
+            summary_name="EndpointSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+        }
+        response = await async_cached_describe(
+            "Endpoint",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_endpoint",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeEndpointOutput", fields=fields)
+        return self
+
+    async def update(
+        self,
+        retain_all_variant_properties: Optional[bool] = Unassigned(),
+        exclude_retained_variant_properties: Optional[
+            List[VariantProperty]
+        ] = Unassigned(),
+        deployment_config: Optional[DeploymentConfig] = Unassigned(),
+        retain_deployment_config: Optional[bool] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating endpoint resource.")
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "EndpointConfigName": self.endpoint_config_name,
+            "RetainAllVariantProperties": retain_all_variant_properties,
+            "ExcludeRetainedVariantProperties": exclude_retained_variant_properties,
+            "DeploymentConfig": deployment_config,
+            "RetainDeploymentConfig": retain_deployment_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateEndpointInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_endpoint",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Endpoint", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_endpoint",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Endpoint", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "OutOfService",
+            "Creating",
+            "Updating",
+            "SystemUpdating",
+            "RollingBack",
+            "InService",
+            "Deleting",
+            "Failed",
+            "UpdateRollbackFailed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+        }
+        waiter = Waiter(
+            resource_type="Endpoint",
+            status_path=("EndpointStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=30,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_endpoint",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeEndpointOutput")
+        return self
+
+    async def invoke(
+        self,
+        body: Any,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_model: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        enable_explanations: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug(f"Invoking endpoint resource.")
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "Body": body,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetModel": target_model,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "EnableExplanations": enable_explanations,
+            "InferenceComponentName": inference_component_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        response = await get_async_transport().call(
+            "sagemaker-runtime",
+            "invoke_endpoint",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+
+        return response
+
+    def invoke_many(
+        self,
+        bodies: Union[Iterable[Any], AsyncIterable[Any]],
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_model: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        enable_explanations: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+        concurrency: int = 8,
+        ordered: bool = True,
+        max_attempts: int = 5,
+    ) -> AsyncIterator[BatchResult]:
+        """Invokes the endpoint once per body, concurrently. Results are yielded in the order of the bodies, or as completed if not ordered."""
+        logger.debug(
+            f"Invoking endpoint resource with {concurrency} concurrent requests."
+        )
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetModel": target_model,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "EnableExplanations": enable_explanations,
+            "InferenceComponentName": inference_component_name,
+        }
+        # serialize the arguments shared by all the requests once
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointInput"
+        )
+
+        # a connection per concurrent request
+        config = Config(max_pool_connections=concurrency)
+        return async_stream_batch(
+            lambda body: get_async_transport().call(
+                "sagemaker-runtime",
+                "invoke_endpoint",
+                {**operation_input_args, "Body": body},
+                session=self._session,
+                region=self._region,
+                config=config,
+            ),
+            bodies,
+            max_concurrency=concurrency,
+            max_attempts=max_attempts,
+            ordered=ordered,
+        )
+
+    async def invoke_async(
+        self,
+        input_location: str,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        request_t_t_l_seconds: Optional[int] = Unassigned(),
+        invocation_timeout_seconds: Optional[int] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug(f"Invoking endpoint resource.")
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "InferenceId": inference_id,
+            "InputLocation": input_location,
+            "RequestTTLSeconds": request_t_t_l_seconds,
+            "InvocationTimeoutSeconds": invocation_timeout_seconds,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointAsyncInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        response = await get_async_transport().call(
+            "sagemaker-runtime",
+            "invoke_endpoint_async",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+
+        return response
+
+    async def invoke_with_response_stream(
+        self,
+        body: Any,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug(f"Invoking endpoint resource.")
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "Body": body,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "InferenceComponentName": inference_component_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointWithResponseStreamInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        response = await get_async_transport().call(
+            "sagemaker-runtime",
+            "invoke_endpoint_with_response_stream",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+
+        return response
+
+    async def invoke_stream(
+        self,
+        body: Any,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+        framing: Union[str, StreamFraming] = "jsonlines",
+    ) -> ResponseStreamReader:
+        """Invokes the endpoint with a response stream, returning a reader yielding the decoded records as soon as they complete, see ResponseStreamReader."""
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "Body": body,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "InferenceComponentName": inference_component_name,
+        }
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointWithResponseStreamInput"
+        )
+
+        started_at = time.perf_counter()
+        response = await get_async_transport().call(
+            "sagemaker-runtime",
+            "invoke_endpoint_with_response_stream",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        return ResponseStreamReader(response["Body"], framing, started_at=started_at)
+
+
+class EndpointConfig(AsyncBase, resources.EndpointConfig):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "kms_key_id": {"type": "string"},
+                "async_inference_config": {
+                    "output_config": {
+                        "kms_key_id": {"type": "string"},
+                        "s3_output_path": {"type": "string"},
+                        "s3_failure_path": {"type": "string"},
+                    }
+                },
+                "execution_role_arn": {"type": "string"},
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "EndpointConfig", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        endpoint_config_name: str,
+        production_variants: List[ProductionVariant],
+        data_capture_config: Optional[DataCaptureConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        async_inference_config: Optional[AsyncInferenceConfig] = Unassigned(),
+        explainer_config: Optional[ExplainerConfig] = Unassigned(),
+        shadow_production_variants: Optional[List[ProductionVariant]] = Unassigned(),
+        execution_role_arn: Optional[str] = Unassigned(),
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        enable_network_isolation: Optional[bool] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating endpoint_config resource.")
+        operation_input_args = {
+            "EndpointConfigName": endpoint_config_name,
+            "ProductionVariants": production_variants,
+            "DataCaptureConfig": data_capture_config,
+            "Tags": tags,
+            "KmsKeyId": kms_key_id,
+            "AsyncInferenceConfig": async_inference_config,
+            "ExplainerConfig": explainer_config,
+            "ShadowProductionVariants": shadow_production_variants,
+            "ExecutionRoleArn": execution_role_arn,
+            "VpcConfig": vpc_config,
+            "EnableNetworkIsolation": enable_network_isolation,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEndpointConfigInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_endpoint_config",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "EndpointConfig", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateEndpointConfigInput"),
+                transform(response, "CreateEndpointConfigOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            endpoint_config_name=endpoint_config_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        endpoint_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EndpointConfigName": endpoint_config_name,
+        }
+        response = await async_cached_describe(
+            "EndpointConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_endpoint_config",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEndpointConfigOutput")
+
+        # deserialize the response
+        endpoint_config = cls._from_describe(
+            response,
+            "DescribeEndpointConfigOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return endpoint_config
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["EndpointConfig"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEndpointConfigsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_endpoint_configs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="EndpointConfigs",
+            summary_name="EndpointConfigSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EndpointConfigName": self.endpoint_config_name,
+        }
+        response = await async_cached_describe(
+            "EndpointConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_endpoint_config",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeEndpointConfigOutput", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "EndpointConfigName": self.endpoint_config_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_endpoint_config",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "EndpointConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class Experiment(AsyncBase, resources.Experiment):
+
+    @classmethod
+    async def create(
+        cls,
+        experiment_name: str,
+        display_name: Optional[str] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating experiment resource.")
+        operation_input_args = {
+            "ExperimentName": experiment_name,
+            "DisplayName": display_name,
+            "Description": description,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateExperimentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_experiment",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Experiment", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateExperimentRequest"),
+                transform(response, "CreateExperimentResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            experiment_name=experiment_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        experiment_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ExperimentName": experiment_name,
+        }
+        response = await async_cached_describe(
+            "Experiment",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_experiment",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeExperimentResponse")
+
+        # deserialize the response
+        experiment = cls._from_describe(
+            response,
+            "DescribeExperimentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return experiment
+
+    @classmethod
+    def list(
+        cls,
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Experiment"]:
+        operation_input_args = {
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListExperimentsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_experiments",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ExperimentSummaries",
+            summary_name="ExperimentSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ExperimentName": self.experiment_name,
+        }
+        response = await async_cached_describe(
+            "Experiment",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_experiment",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeExperimentResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating experiment resource.")
+        operation_input_args = {
+            "ExperimentName": self.experiment_name,
+            "DisplayName": self.display_name,
+            "Description": self.description,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateExperimentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ExperimentName": self.experiment_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class FeatureGroup(AsyncBase, resources.FeatureGroup):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "online_store_config": {
+                    "security_config": {"kms_key_id": {"type": "string"}}
+                },
+                "offline_store_config": {
+                    "s3_storage_config": {
+                        "s3_uri": {"type": "string"},
+                        "kms_key_id": {"type": "string"},
+                        "resolved_output_s3_uri": {"type": "string"},
+                    }
+                },
+                "role_arn": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "FeatureGroup", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        feature_group_name: str,
+        record_identifier_feature_name: str,
+        event_time_feature_name: str,
+        feature_definitions: List[FeatureDefinition],
+        online_store_config: Optional[OnlineStoreConfig] = Unassigned(),
+        offline_store_config: Optional[OfflineStoreConfig] = Unassigned(),
+        throughput_config: Optional[ThroughputConfig] = Unassigned(),
+        role_arn: Optional[str] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating feature_group resource.")
+        operation_input_args = {
+            "FeatureGroupName": feature_group_name,
+            "RecordIdentifierFeatureName": record_identifier_feature_name,
+            "EventTimeFeatureName": event_time_feature_name,
+            "FeatureDefinitions": feature_definitions,
+            "OnlineStoreConfig": online_store_config,
+            "OfflineStoreConfig": offline_store_config,
+            "ThroughputConfig": throughput_config,
+            "RoleArn": role_arn,
+            "Description": description,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateFeatureGroupRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_feature_group",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "FeatureGroup", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateFeatureGroupRequest"),
+                transform(response, "CreateFeatureGroupResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            feature_group_name=feature_group_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        feature_group_name: str,
+        next_token: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "FeatureGroupName": feature_group_name,
+            "NextToken": next_token,
+        }
+        response = await async_cached_describe(
+            "FeatureGroup",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_feature_group",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeFeatureGroupResponse")
+
+        # deserialize the response
+        feature_group = cls._from_describe(
+            response,
+            "DescribeFeatureGroupResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return feature_group
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        feature_group_status_equals: Optional[str] = Unassigned(),
+        offline_store_status_equals: Optional[str] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["FeatureGroup"]:
+        operation_input_args = {
+            "NameContains": name_contains,
+            "FeatureGroupStatusEquals": feature_group_status_equals,
+            "OfflineStoreStatusEquals": offline_store_status_equals,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListFeatureGroupsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_feature_groups",
+            list_method_kwargs=operation_input_args,
+            summaries_key="FeatureGroupSummaries",
+            summary_name="FeatureGroupSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "NextToken": self.next_token,
+        }
+        response = await async_cached_describe(
+            "FeatureGroup",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_feature_group",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeFeatureGroupResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+        feature_additions: Optional[List[FeatureDefinition]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating feature_group resource.")
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "FeatureAdditions": feature_additions,
+            "OnlineStoreConfig": self.online_store_config,
+            "ThroughputConfig": self.throughput_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateFeatureGroupRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_feature_group",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "FeatureGroup",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_feature_group",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "FeatureGroup",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Creating", "Created", "CreateFailed", "Deleting", "DeleteFailed"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "NextToken": self.next_token,
+        }
+        waiter = Waiter(
+            resource_type="FeatureGroup",
+            status_path=("FeatureGroupStatus",),
+            success_states=[status],
+            failure_states=["CreateFailed", "DeleteFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_feature_group",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeFeatureGroupResponse")
+        return self
+
+
+class FlowDefinition(AsyncBase, resources.FlowDefinition):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "FlowDefinition", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        flow_definition_name: str,
+        output_config: FlowDefinitionOutputConfig,
+        role_arn: str,
+        human_loop_request_source: Optional[HumanLoopRequestSource] = Unassigned(),
+        human_loop_activation_config: Optional[
+            HumanLoopActivationConfig
+        ] = Unassigned(),
+        human_loop_config: Optional[HumanLoopConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating flow_definition resource.")
+        operation_input_args = {
+            "FlowDefinitionName": flow_definition_name,
+            "HumanLoopRequestSource": human_loop_request_source,
+            "HumanLoopActivationConfig": human_loop_activation_config,
+            "HumanLoopConfig": human_loop_config,
+            "OutputConfig": output_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateFlowDefinitionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_flow_definition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "FlowDefinition", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateFlowDefinitionRequest"),
+                transform(response, "CreateFlowDefinitionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            flow_definition_name=flow_definition_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        flow_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "FlowDefinitionName": flow_definition_name,
+        }
+        response = await async_cached_describe(
+            "FlowDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_flow_definition",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeFlowDefinitionResponse")
+
+        # deserialize the response
+        flow_definition = cls._from_describe(
+            response,
+            "DescribeFlowDefinitionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return flow_definition
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["FlowDefinition"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListFlowDefinitionsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_flow_definitions",
+            list_method_kwargs=operation_input_args,
+            summaries_key="FlowDefinitionSummaries",
+            summary_name="FlowDefinitionSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "FlowDefinitionName": self.flow_definition_name,
+        }
+        response = await async_cached_describe(
+            "FlowDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_flow_definition",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeFlowDefinitionResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "FlowDefinitionName": self.flow_definition_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_flow_definition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "FlowDefinition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Initializing", "Active", "Failed", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "FlowDefinitionName": self.flow_definition_name,
+        }
+        waiter = Waiter(
+            resource_type="FlowDefinition",
+            status_path=("FlowDefinitionStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_flow_definition",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeFlowDefinitionResponse")
+        return self
+
+
+class Hub(AsyncBase, resources.Hub):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "s3_storage_config": {"s3_output_path": {"type": "string"}}
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Hub", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        hub_name: str,
+        hub_description: str,
+        hub_display_name: Optional[str] = Unassigned(),
+        hub_search_keywords: Optional[List[str]] = Unassigned(),
+        s3_storage_config: Optional[HubS3StorageConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating hub resource.")
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubDescription": hub_description,
+            "HubDisplayName": hub_display_name,
+            "HubSearchKeywords": hub_search_keywords,
+            "S3StorageConfig": s3_storage_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateHubRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_hub",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Hub", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateHubRequest"),
+                transform(response, "CreateHubResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(hub_name=hub_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        hub_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HubName": hub_name,
+        }
+        response = await async_cached_describe(
+            "Hub",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hub",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeHubResponse")
+
+        # deserialize the response
+        hub = cls._from_describe(
+            response,
+            "DescribeHubResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return hub
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Hub"]:
+        operation_input_args = {
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListHubsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_hubs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="HubSummaries",
+            summary_name="HubInfo",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+        }
+        response = await async_cached_describe(
+            "Hub",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hub",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeHubResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating hub resource.")
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubDescription": self.hub_description,
+            "HubDisplayName": self.hub_display_name,
+            "HubSearchKeywords": self.hub_search_keywords,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateHubRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_hub",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Hub", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_hub",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Hub", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "InService",
+            "Creating",
+            "Updating",
+            "Deleting",
+            "CreateFailed",
+            "UpdateFailed",
+            "DeleteFailed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HubName": self.hub_name,
+        }
+        waiter = Waiter(
+            resource_type="Hub",
+            status_path=("HubStatus",),
+            success_states=[status],
+            failure_states=["CreateFailed", "UpdateFailed", "DeleteFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hub",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeHubResponse")
+        return self
+
+
+class HubContent(AsyncBase, resources.HubContent):
+
+    @classmethod
+    async def get(
+        cls,
+        hub_name: str,
+        hub_content_type: str,
+        hub_content_name: str,
+        hub_content_version: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+        }
+        response = await async_cached_describe(
+            "HubContent",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hub_content",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeHubContentResponse")
+
+        # deserialize the response
+        hub_content = cls._from_describe(
+            response,
+            "DescribeHubContentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return hub_content
+
+    @classmethod
+    def list(
+        cls,
+        hub_name: str,
+        hub_content_type: str,
+        name_contains: Optional[str] = Unassigned(),
+        max_schema_version: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["HubContent"]:
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "NameContains": name_contains,
+            "MaxSchemaVersion": max_schema_version,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListHubContentsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_hub_contents",
+            list_method_kwargs=operation_input_args,
+            summaries_key="HubContentSummaries",
+            summary_name="HubContentInfo",
+            resource_cls=cls,
+            resource_kwargs={"hub_name": hub_name},
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        response = await async_cached_describe(
+            "HubContent",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hub_content",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeHubContentResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_hub_content",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "HubContent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Available", "Importing", "Deleting", "ImportFailed", "DeleteFailed"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        waiter = Waiter(
+            resource_type="HubContent",
+            status_path=("HubContentStatus",),
+            success_states=[status],
+            failure_states=["ImportFailed", "DeleteFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hub_content",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeHubContentResponse")
+        return self
+
+    @classmethod
+    async def load(
+        cls,
+        hub_content_name: str,
+        hub_content_type: str,
+        document_schema_version: str,
+        hub_name: str,
+        hub_content_document: str,
+        hub_content_version: Optional[str] = Unassigned(),
+        hub_content_display_name: Optional[str] = Unassigned(),
+        hub_content_description: Optional[str] = Unassigned(),
+        hub_content_markdown: Optional[str] = Unassigned(),
+        hub_content_search_keywords: Optional[List[str]] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[object]:
+        logger.debug(f"Importing hub_content resource.")
+        operation_input_args = {
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+            "HubContentType": hub_content_type,
+            "DocumentSchemaVersion": document_schema_version,
+            "HubName": hub_name,
+            "HubContentDisplayName": hub_content_display_name,
+            "HubContentDescription": hub_content_description,
+            "HubContentMarkdown": hub_content_markdown,
+            "HubContentDocument": hub_content_document,
+            "HubContentSearchKeywords": hub_content_search_keywords,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ImportHubContentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # import the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "import_hub_content",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "HubContent", operation_input_args, session=session, region=region
+        )
+
+        return await cls.get(
+            hub_name=hub_name,
+            hub_content_type=hub_content_type,
+            hub_content_name=hub_content_name,
+            session=session,
+            region=region,
+        )
+
+
+class HumanTaskUi(AsyncBase, resources.HumanTaskUi):
+
+    @classmethod
+    async def create(
+        cls,
+        human_task_ui_name: str,
+        ui_template: UiTemplate,
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating human_task_ui resource.")
+        operation_input_args = {
+            "HumanTaskUiName": human_task_ui_name,
+            "UiTemplate": ui_template,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateHumanTaskUiRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_human_task_ui",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "HumanTaskUi", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateHumanTaskUiRequest"),
+                transform(response, "CreateHumanTaskUiResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            human_task_ui_name=human_task_ui_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        human_task_ui_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HumanTaskUiName": human_task_ui_name,
+        }
+        response = await async_cached_describe(
+            "HumanTaskUi",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_human_task_ui",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeHumanTaskUiResponse")
+
+        # deserialize the response
+        human_task_ui = cls._from_describe(
+            response,
+            "DescribeHumanTaskUiResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return human_task_ui
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["HumanTaskUi"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListHumanTaskUisRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_human_task_uis",
+            list_method_kwargs=operation_input_args,
+            summaries_key="HumanTaskUiSummaries",
+            summary_name="HumanTaskUiSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "HumanTaskUiName": self.human_task_ui_name,
+        }
+        response = await async_cached_describe(
+            "HumanTaskUi",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_human_task_ui",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeHumanTaskUiResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "HumanTaskUiName": self.human_task_ui_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_human_task_ui",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "HumanTaskUi",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Active", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HumanTaskUiName": self.human_task_ui_name,
+        }
+        waiter = Waiter(
+            resource_type="HumanTaskUi",
+            status_path=("HumanTaskUiStatus",),
+            success_states=[status],
+            failure_states=[],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_human_task_ui",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeHumanTaskUiResponse")
+        return self
+
+
+class HyperParameterTuningJob(AsyncBase, resources.HyperParameterTuningJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "training_job_definition": {
+                    "role_arn": {"type": "string"},
+                    "output_data_config": {
+                        "s3_output_path": {"type": "string"},
+                        "kms_key_id": {"type": "string"},
+                    },
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "resource_config": {"volume_kms_key_id": {"type": "string"}},
+                    "hyper_parameter_tuning_resource_config": {
+                        "volume_kms_key_id": {"type": "string"}
+                    },
+                    "checkpoint_config": {"s3_uri": {"type": "string"}},
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "HyperParameterTuningJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        hyper_parameter_tuning_job_name: str,
+        hyper_parameter_tuning_job_config: HyperParameterTuningJobConfig,
+        training_job_definition: Optional[
+            HyperParameterTrainingJobDefinition
+        ] = Unassigned(),
+        training_job_definitions: Optional[
+            List[HyperParameterTrainingJobDefinition]
+        ] = Unassigned(),
+        warm_start_config: Optional[
+            HyperParameterTuningJobWarmStartConfig
+        ] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        autotune: Optional[Autotune] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating hyper_parameter_tuning_job resource.")
+        operation_input_args = {
+            "HyperParameterTuningJobName": hyper_parameter_tuning_job_name,
+            "HyperParameterTuningJobConfig": hyper_parameter_tuning_job_config,
+            "TrainingJobDefinition": training_job_definition,
+            "TrainingJobDefinitions": training_job_definitions,
+            "WarmStartConfig": warm_start_config,
+            "Tags": tags,
+            "Autotune": autotune,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateHyperParameterTuningJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_hyper_parameter_tuning_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateHyperParameterTuningJobRequest"),
+                transform(response, "CreateHyperParameterTuningJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            hyper_parameter_tuning_job_name=hyper_parameter_tuning_job_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        hyper_parameter_tuning_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HyperParameterTuningJobName": hyper_parameter_tuning_job_name,
+        }
+        response = await async_cached_describe(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hyper_parameter_tuning_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeHyperParameterTuningJobResponse")
+
+        # deserialize the response
+        hyper_parameter_tuning_job = cls._from_describe(
+            response,
+            "DescribeHyperParameterTuningJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return hyper_parameter_tuning_job
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["HyperParameterTuningJob"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListHyperParameterTuningJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_hyper_parameter_tuning_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="HyperParameterTuningJobSummaries",
+            summary_name="HyperParameterTuningJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        response = await async_cached_describe(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hyper_parameter_tuning_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeHyperParameterTuningJobResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_hyper_parameter_tuning_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_hyper_parameter_tuning_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped", "DeleteFailed"]
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        waiter = Waiter(
+            resource_type="HyperParameterTuningJob",
+            status_path=("HyperParameterTuningJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_hyper_parameter_tuning_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeHyperParameterTuningJobResponse")
+        return self
+
+
+class Image(AsyncBase, resources.Image):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {"role_arn": {"type": "string"}}
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Image", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        image_name: str,
+        role_arn: str,
+        description: Optional[str] = Unassigned(),
+        display_name: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating image resource.")
+        operation_input_args = {
+            "Description": description,
+            "DisplayName": display_name,
+            "ImageName": image_name,
+            "RoleArn": role_arn,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateImageRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_image",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Image", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateImageRequest"),
+                transform(response, "CreateImageResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(image_name=image_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        image_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ImageName": image_name,
+        }
+        response = await async_cached_describe(
+            "Image",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_image",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeImageResponse")
+
+        # deserialize the response
+        image = cls._from_describe(
+            response,
+            "DescribeImageResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return image
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Image"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListImagesRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_images",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Images",
+            summary_name="Image",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ImageName": self.image_name,
+        }
+        response = await async_cached_describe(
+            "Image",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_image",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeImageResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        delete_properties: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating image resource.")
+        operation_input_args = {
+            "DeleteProperties": delete_properties,
+            "Description": self.description,
+            "DisplayName": self.display_name,
+            "ImageName": self.image_name,
+            "RoleArn": self.role_arn,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateImageRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_image",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Image", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ImageName": self.image_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_image",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Image", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "CREATING",
+            "CREATED",
+            "CREATE_FAILED",
+            "UPDATING",
+            "UPDATE_FAILED",
+            "DELETING",
+            "DELETE_FAILED",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ImageName": self.image_name,
+        }
+        waiter = Waiter(
+            resource_type="Image",
+            status_path=("ImageStatus",),
+            success_states=[status],
+            failure_states=["CREATE_FAILED", "UPDATE_FAILED", "DELETE_FAILED"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_image",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeImageResponse")
+        return self
+
+
+class ImageVersion(AsyncBase, resources.ImageVersion):
+
+    @classmethod
+    async def create(
+        cls,
+        base_image: str,
+        client_token: str,
+        image_name: str,
+        aliases: Optional[List[str]] = Unassigned(),
+        vendor_guidance: Optional[str] = Unassigned(),
+        job_type: Optional[str] = Unassigned(),
+        m_l_framework: Optional[str] = Unassigned(),
+        programming_lang: Optional[str] = Unassigned(),
+        processor: Optional[str] = Unassigned(),
+        horovod: Optional[bool] = Unassigned(),
+        release_notes: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating image_version resource.")
+        operation_input_args = {
+            "BaseImage": base_image,
+            "ClientToken": client_token,
+            "ImageName": image_name,
+            "Aliases": aliases,
+            "VendorGuidance": vendor_guidance,
+            "JobType": job_type,
+            "MLFramework": m_l_framework,
+            "ProgrammingLang": programming_lang,
+            "Processor": processor,
+            "Horovod": horovod,
+            "ReleaseNotes": release_notes,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateImageVersionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_image_version",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ImageVersion", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateImageVersionRequest"),
+                transform(response, "CreateImageVersionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(image_name=image_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        image_name: str,
+        version: Optional[int] = Unassigned(),
+        alias: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ImageName": image_name,
+            "Version": version,
+            "Alias": alias,
+        }
+        response = await async_cached_describe(
+            "ImageVersion",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_image_version",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeImageVersionResponse")
+
+        # deserialize the response
+        image_version = cls._from_describe(
+            response,
+            "DescribeImageVersionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return image_version
+
+    @classmethod
+    def list(
+        cls,
+        image_name: str,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["ImageVersion"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "ImageName": image_name,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListImageVersionsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_image_versions",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ImageVersions",
+            summary_name="ImageVersion",
+            resource_cls=cls,
+            resource_kwargs={"image_name": image_name},
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ImageName": self.image_name,
+            "Version": self.version,
+            "Alias": self.alias,
+        }
+        response = await async_cached_describe(
+            "ImageVersion",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_image_version",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeImageVersionResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+        image_name: str,
+        alias: Optional[str] = Unassigned(),
+        aliases_to_add: Optional[List[str]] = Unassigned(),
+        aliases_to_delete: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating image_version resource.")
+        operation_input_args = {
+            "ImageName": image_name,
+            "Alias": alias,
+            "Version": self.version,
+            "AliasesToAdd": aliases_to_add,
+            "AliasesToDelete": aliases_to_delete,
+            "VendorGuidance": self.vendor_guidance,
+            "JobType": self.job_type,
+            "MLFramework": self.m_l_framework,
+            "ProgrammingLang": self.programming_lang,
+            "Processor": self.processor,
+            "Horovod": self.horovod,
+            "ReleaseNotes": self.release_notes,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateImageVersionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_image_version",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ImageVersion",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ImageName": self.image_name,
+            "Version": self.version,
+            "Alias": self.alias,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_image_version",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ImageVersion",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "CREATING", "CREATED", "CREATE_FAILED", "DELETING", "DELETE_FAILED"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ImageName": self.image_name,
+            "Version": self.version,
+            "Alias": self.alias,
+        }
+        waiter = Waiter(
+            resource_type="ImageVersion",
+            status_path=("ImageVersionStatus",),
+            success_states=[status],
+            failure_states=["CREATE_FAILED", "DELETE_FAILED"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_image_version",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeImageVersionResponse")
+        return self
+
+
+class InferenceComponent(AsyncBase, resources.InferenceComponent):
+
+    @classmethod
+    async def create(
+        cls,
+        inference_component_name: str,
+        endpoint_name: str,
+        variant_name: str,
+        specification: InferenceComponentSpecification,
+        runtime_config: InferenceComponentRuntimeConfig,
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating inference_component resource.")
+        operation_input_args = {
+            "InferenceComponentName": inference_component_name,
+            "EndpointName": endpoint_name,
+            "VariantName": variant_name,
+            "Specification": specification,
+            "RuntimeConfig": runtime_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateInferenceComponentInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_inference_component",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceComponent", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateInferenceComponentInput"),
+                transform(response, "CreateInferenceComponentOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            inference_component_name=inference_component_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        inference_component_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "InferenceComponentName": inference_component_name,
+        }
+        response = await async_cached_describe(
+            "InferenceComponent",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_component",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeInferenceComponentOutput")
+
+        # deserialize the response
+        inference_component = cls._from_describe(
+            response,
+            "DescribeInferenceComponentOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return inference_component
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        endpoint_name_equals: Optional[str] = Unassigned(),
+        variant_name_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["InferenceComponent"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "StatusEquals": status_equals,
+            "EndpointNameEquals": endpoint_name_equals,
+            "VariantNameEquals": variant_name_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListInferenceComponentsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_inference_components",
+            list_method_kwargs=operation_input_args,
+            summaries_key="InferenceComponents",
+            summary_name="InferenceComponentSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "InferenceComponentName": self.inference_component_name,
+        }
+        response = await async_cached_describe(
+            "InferenceComponent",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_component",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceComponentOutput", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating inference_component resource.")
+        operation_input_args = {
+            "InferenceComponentName": self.inference_component_name,
+            "Specification": self.specification,
+            "RuntimeConfig": self.runtime_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateInferenceComponentInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_inference_component",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceComponent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "InferenceComponentName": self.inference_component_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_inference_component",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "InferenceComponent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["InService", "Creating", "Updating", "Failed", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "InferenceComponentName": self.inference_component_name,
+        }
+        waiter = Waiter(
+            resource_type="InferenceComponent",
+            status_path=("InferenceComponentStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_component",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeInferenceComponentOutput")
+        return self
+
+
+class InferenceExperiment(AsyncBase, resources.InferenceExperiment):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "data_storage_config": {"kms_key": {"type": "string"}},
+                "kms_key": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "InferenceExperiment", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        name: str,
+        type: str,
+        role_arn: str,
+        endpoint_name: str,
+        model_variants: List[ModelVariantConfig],
+        shadow_mode_config: ShadowModeConfig,
+        schedule: Optional[InferenceExperimentSchedule] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        data_storage_config: Optional[
+            InferenceExperimentDataStorageConfig
+        ] = Unassigned(),
+        kms_key: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating inference_experiment resource.")
+        operation_input_args = {
+            "Name": name,
+            "Type": type,
+            "Schedule": schedule,
+            "Description": description,
+            "RoleArn": role_arn,
+            "EndpointName": endpoint_name,
+            "ModelVariants": model_variants,
+            "DataStorageConfig": data_storage_config,
+            "ShadowModeConfig": shadow_mode_config,
+            "KmsKey": kms_key,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateInferenceExperimentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_inference_experiment",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceExperiment", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateInferenceExperimentRequest"),
+                transform(response, "CreateInferenceExperimentResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(name=name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "Name": name,
+        }
+        response = await async_cached_describe(
+            "InferenceExperiment",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_experiment",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeInferenceExperimentResponse")
+
+        # deserialize the response
+        inference_experiment = cls._from_describe(
+            response,
+            "DescribeInferenceExperimentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return inference_experiment
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        type: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["InferenceExperiment"]:
+        operation_input_args = {
+            "NameContains": name_contains,
+            "Type": type,
+            "StatusEquals": status_equals,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListInferenceExperimentsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_inference_experiments",
+            list_method_kwargs=operation_input_args,
+            summaries_key="InferenceExperiments",
+            summary_name="InferenceExperimentSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "Name": self.name,
+        }
+        response = await async_cached_describe(
+            "InferenceExperiment",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_experiment",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceExperimentResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating inference_experiment resource.")
+        operation_input_args = {
+            "Name": self.name,
+            "Schedule": self.schedule,
+            "Description": self.description,
+            "ModelVariants": self.model_variants,
+            "DataStorageConfig": self.data_storage_config,
+            "ShadowModeConfig": self.shadow_mode_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateInferenceExperimentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_inference_experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceExperiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "Name": self.name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_inference_experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "InferenceExperiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "Name": self.name,
+            "ModelVariantActions": self.model_variant_actions,
+            "DesiredModelVariants": self.desired_model_variants,
+            "DesiredState": self.desired_state,
+            "Reason": self.reason,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_inference_experiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "InferenceExperiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Creating",
+            "Created",
+            "Updating",
+            "Running",
+            "Starting",
+            "Stopping",
+            "Completed",
+            "Cancelled",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "Name": self.name,
+        }
+        waiter = Waiter(
+            resource_type="InferenceExperiment",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=[],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_experiment",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeInferenceExperimentResponse")
+        return self
+
+
+class InferenceRecommendationsJob(AsyncBase, resources.InferenceRecommendationsJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "input_config": {
+                    "volume_kms_key_id": {"type": "string"},
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "InferenceRecommendationsJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        job_name: str,
+        job_type: str,
+        role_arn: str,
+        input_config: RecommendationJobInputConfig,
+        job_description: Optional[str] = Unassigned(),
+        stopping_conditions: Optional[
+            RecommendationJobStoppingConditions
+        ] = Unassigned(),
+        output_config: Optional[RecommendationJobOutputConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating inference_recommendations_job resource.")
+        operation_input_args = {
+            "JobName": job_name,
+            "JobType": job_type,
+            "RoleArn": role_arn,
+            "InputConfig": input_config,
+            "JobDescription": job_description,
+            "StoppingConditions": stopping_conditions,
+            "OutputConfig": output_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateInferenceRecommendationsJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_inference_recommendations_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(
+                    operation_input_args, "CreateInferenceRecommendationsJobRequest"
+                ),
+                transform(response, "CreateInferenceRecommendationsJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(job_name=job_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobName": job_name,
+        }
+        response = await async_cached_describe(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_recommendations_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(
+                response, "DescribeInferenceRecommendationsJobResponse"
+            )
+
+        # deserialize the response
+        inference_recommendations_job = cls._from_describe(
+            response,
+            "DescribeInferenceRecommendationsJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return inference_recommendations_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        model_name_equals: Optional[str] = Unassigned(),
+        model_package_version_arn_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["InferenceRecommendationsJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "ModelNameEquals": model_name_equals,
+            "ModelPackageVersionArnEquals": model_package_version_arn_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListInferenceRecommendationsJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_inference_recommendations_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="InferenceRecommendationsJobs",
+            summary_name="InferenceRecommendationsJob",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobName": self.job_name,
+        }
+        response = await async_cached_describe(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_recommendations_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceRecommendationsJobResponse", fields=fields
+        )
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "JobName": self.job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_inference_recommendations_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED", "DELETED"]
+        operation_input_args = {
+            "JobName": self.job_name,
+        }
+        waiter = Waiter(
+            resource_type="InferenceRecommendationsJob",
+            status_path=("Status",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_inference_recommendations_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceRecommendationsJobResponse"
+        )
+        return self
+
+
+class LabelingJob(AsyncBase, resources.LabelingJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "input_config": {
+                    "data_source": {
+                        "s3_data_source": {"manifest_s3_uri": {"type": "string"}}
+                    }
+                },
+                "output_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "human_task_config": {
+                    "ui_config": {"ui_template_s3_uri": {"type": "string"}}
+                },
+                "label_category_config_s3_uri": {"type": "string"},
+                "labeling_job_algorithms_config": {
+                    "labeling_job_resource_config": {
+                        "volume_kms_key_id": {"type": "string"},
+                        "vpc_config": {
+                            "security_group_ids": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            },
+                            "subnets": {"type": "array", "items": {"type": "string"}},
+                        },
+                    }
+                },
+                "labeling_job_output": {"output_dataset_s3_uri": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "LabelingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        labeling_job_name: str,
+        label_attribute_name: str,
+        input_config: LabelingJobInputConfig,
+        output_config: LabelingJobOutputConfig,
+        role_arn: str,
+        human_task_config: HumanTaskConfig,
+        label_category_config_s3_uri: Optional[str] = Unassigned(),
+        stopping_conditions: Optional[LabelingJobStoppingConditions] = Unassigned(),
+        labeling_job_algorithms_config: Optional[
+            LabelingJobAlgorithmsConfig
+        ] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating labeling_job resource.")
+        operation_input_args = {
+            "LabelingJobName": labeling_job_name,
+            "LabelAttributeName": label_attribute_name,
+            "InputConfig": input_config,
+            "OutputConfig": output_config,
+            "RoleArn": role_arn,
+            "LabelCategoryConfigS3Uri": label_category_config_s3_uri,
+            "StoppingConditions": stopping_conditions,
+            "LabelingJobAlgorithmsConfig": labeling_job_algorithms_config,
+            "HumanTaskConfig": human_task_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateLabelingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_labeling_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "LabelingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateLabelingJobRequest"),
+                transform(response, "CreateLabelingJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            labeling_job_name=labeling_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        labeling_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "LabelingJobName": labeling_job_name,
+        }
+        response = await async_cached_describe(
+            "LabelingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_labeling_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeLabelingJobResponse")
+
+        # deserialize the response
+        labeling_job = cls._from_describe(
+            response,
+            "DescribeLabelingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return labeling_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["LabelingJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListLabelingJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_labeling_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="LabelingJobSummaryList",
+            summary_name="LabelingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "LabelingJobName": self.labeling_job_name,
+        }
+        response = await async_cached_describe(
+            "LabelingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_labeling_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeLabelingJobResponse", fields=fields
+        )
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "LabelingJobName": self.labeling_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_labeling_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "LabelingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "LabelingJobName": self.labeling_job_name,
+        }
+        waiter = Waiter(
+            resource_type="LabelingJob",
+            status_path=("LabelingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_labeling_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeLabelingJobResponse")
+        return self
+
+
+class Model(AsyncBase, resources.Model):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "primary_container": {
+                    "model_data_source": {
+                        "s3_data_source": {
+                            "s3_uri": {"type": "string"},
+                            "s3_data_type": {"type": "string"},
+                        }
+                    }
+                },
+                "execution_role_arn": {"type": "string"},
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Model", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        model_name: str,
+        primary_container: Optional[ContainerDefinition] = Unassigned(),
+        containers: Optional[List[ContainerDefinition]] = Unassigned(),
+        inference_execution_config: Optional[InferenceExecutionConfig] = Unassigned(),
+        execution_role_arn: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        enable_network_isolation: Optional[bool] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model resource.")
+        operation_input_args = {
+            "ModelName": model_name,
+            "PrimaryContainer": primary_container,
+            "Containers": containers,
+            "InferenceExecutionConfig": inference_execution_config,
+            "ExecutionRoleArn": execution_role_arn,
+            "Tags": tags,
+            "VpcConfig": vpc_config,
+            "EnableNetworkIsolation": enable_network_isolation,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Model", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelInput"),
+                transform(response, "CreateModelOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(model_name=model_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        model_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelName": model_name,
+        }
+        response = await async_cached_describe(
+            "Model",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelOutput")
+
+        # deserialize the response
+        model = cls._from_describe(
+            response,
+            "DescribeModelOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Model"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListModelsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_models",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Models",
+            summary_name="ModelSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ModelName": self.model_name,
+        }
+        response = await async_cached_describe(
+            "Model",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeModelOutput", fields=fields)
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ModelName": self.model_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Model", operation_input_args, session=self._session, region=self._region
+        )
+
+
+class ModelBiasJobDefinition(AsyncBase, resources.ModelBiasJobDefinition):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_bias_job_input": {
+                    "ground_truth_s3_input": {"s3_uri": {"type": "string"}},
+                    "endpoint_input": {
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                    "batch_transform_input": {
+                        "data_captured_destination_s3_uri": {"type": "string"},
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                },
+                "model_bias_job_output_config": {"kms_key_id": {"type": "string"}},
+                "job_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "role_arn": {"type": "string"},
+                "model_bias_baseline_config": {
+                    "constraints_resource": {"s3_uri": {"type": "string"}}
+                },
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelBiasJobDefinition", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        job_definition_name: str,
+        model_bias_app_specification: ModelBiasAppSpecification,
+        model_bias_job_input: ModelBiasJobInput,
+        model_bias_job_output_config: MonitoringOutputConfig,
+        job_resources: MonitoringResources,
+        role_arn: str,
+        model_bias_baseline_config: Optional[ModelBiasBaselineConfig] = Unassigned(),
+        network_config: Optional[MonitoringNetworkConfig] = Unassigned(),
+        stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_bias_job_definition resource.")
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+            "ModelBiasBaselineConfig": model_bias_baseline_config,
+            "ModelBiasAppSpecification": model_bias_app_specification,
+            "ModelBiasJobInput": model_bias_job_input,
+            "ModelBiasJobOutputConfig": model_bias_job_output_config,
+            "JobResources": job_resources,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelBiasJobDefinitionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_bias_job_definition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelBiasJobDefinitionRequest"),
+                transform(response, "CreateModelBiasJobDefinitionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            job_definition_name=job_definition_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        job_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+        }
+        response = await async_cached_describe(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_bias_job_definition",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelBiasJobDefinitionResponse")
+
+        # deserialize the response
+        model_bias_job_definition = cls._from_describe(
+            response,
+            "DescribeModelBiasJobDefinitionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_bias_job_definition
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        response = await async_cached_describe(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_bias_job_definition",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelBiasJobDefinitionResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model_bias_job_definition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class ModelCard(AsyncBase, resources.ModelCard):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "security_config": {"kms_key_id": {"type": "string"}}
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelCard", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        model_card_name: str,
+        content: str,
+        model_card_status: str,
+        security_config: Optional[ModelCardSecurityConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_card resource.")
+        operation_input_args = {
+            "ModelCardName": model_card_name,
+            "SecurityConfig": security_config,
+            "Content": content,
+            "ModelCardStatus": model_card_status,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelCardRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_card",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelCard", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelCardRequest"),
+                transform(response, "CreateModelCardResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            model_card_name=model_card_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        model_card_name: str,
+        model_card_version: Optional[int] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelCardName": model_card_name,
+            "ModelCardVersion": model_card_version,
+        }
+        response = await async_cached_describe(
+            "ModelCard",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_card",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelCardResponse")
+
+        # deserialize the response
+        model_card = cls._from_describe(
+            response,
+            "DescribeModelCardResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_card
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_card_status: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["ModelCard"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "ModelCardStatus": model_card_status,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListModelCardsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_model_cards",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ModelCardSummaries",
+            summary_name="ModelCardSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ModelCardName": self.model_card_name,
+            "ModelCardVersion": self.model_card_version,
+        }
+        response = await async_cached_describe(
+            "ModelCard",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_card",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeModelCardResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating model_card resource.")
+        operation_input_args = {
+            "ModelCardName": self.model_card_name,
+            "Content": self.content,
+            "ModelCardStatus": self.model_card_status,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateModelCardRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_model_card",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelCard",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ModelCardName": self.model_card_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model_card",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ModelCard",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Draft", "PendingReview", "Approved", "Archived"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelCardName": self.model_card_name,
+            "ModelCardVersion": self.model_card_version,
+        }
+        waiter = Waiter(
+            resource_type="ModelCard",
+            status_path=("ModelCardStatus",),
+            success_states=[status],
+            failure_states=[],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_card",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeModelCardResponse")
+        return self
+
+
+class ModelCardExportJob(AsyncBase, resources.ModelCardExportJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_config": {"s3_output_path": {"type": "string"}},
+                "export_artifacts": {"s3_export_artifacts": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelCardExportJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        model_card_name: str,
+        model_card_export_job_name: str,
+        output_config: ModelCardExportOutputConfig,
+        model_card_version: Optional[int] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_card_export_job resource.")
+        operation_input_args = {
+            "ModelCardName": model_card_name,
+            "ModelCardVersion": model_card_version,
+            "ModelCardExportJobName": model_card_export_job_name,
+            "OutputConfig": output_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelCardExportJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_card_export_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelCardExportJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelCardExportJobRequest"),
+                transform(response, "CreateModelCardExportJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            model_card_export_job_arn=response["ModelCardExportJobArn"],
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        model_card_export_job_arn: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelCardExportJobArn": model_card_export_job_arn,
+        }
+        response = await async_cached_describe(
+            "ModelCardExportJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_card_export_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelCardExportJobResponse")
+
+        # deserialize the response
+        model_card_export_job = cls._from_describe(
+            response,
+            "DescribeModelCardExportJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_card_export_job
+
+    @classmethod
+    def list(
+        cls,
+        model_card_name: str,
+        model_card_version: Optional[int] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        model_card_export_job_name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["ModelCardExportJob"]:
+        operation_input_args = {
+            "ModelCardName": model_card_name,
+            "ModelCardVersion": model_card_version,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "ModelCardExportJobNameContains": model_card_export_job_name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListModelCardExportJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_model_card_export_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ModelCardExportJobSummaries",
+            summary_name="ModelCardExportJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ModelCardExportJobArn": self.model_card_export_job_arn,
+        }
+        response = await async_cached_describe(
+            "ModelCardExportJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_card_export_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelCardExportJobResponse", fields=fields
+        )
+        return self
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed"]
+        operation_input_args = {
+            "ModelCardExportJobArn": self.model_card_export_job_arn,
+        }
+        waiter = Waiter(
+            resource_type="ModelCardExportJob",
+            status_path=("Status",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_card_export_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeModelCardExportJobResponse")
+        return self
+
+
+class ModelExplainabilityJobDefinition(
+    AsyncBase, resources.ModelExplainabilityJobDefinition
+):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_explainability_job_input": {
+                    "endpoint_input": {
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                    "batch_transform_input": {
+                        "data_captured_destination_s3_uri": {"type": "string"},
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                },
+                "model_explainability_job_output_config": {
+                    "kms_key_id": {"type": "string"}
+                },
+                "job_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "role_arn": {"type": "string"},
+                "model_explainability_baseline_config": {
+                    "constraints_resource": {"s3_uri": {"type": "string"}}
+                },
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource,
+                    "ModelExplainabilityJobDefinition",
+                    **kwargs,
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        job_definition_name: str,
+        model_explainability_app_specification: ModelExplainabilityAppSpecification,
+        model_explainability_job_input: ModelExplainabilityJobInput,
+        model_explainability_job_output_config: MonitoringOutputConfig,
+        job_resources: MonitoringResources,
+        role_arn: str,
+        model_explainability_baseline_config: Optional[
+            ModelExplainabilityBaselineConfig
+        ] = Unassigned(),
+        network_config: Optional[MonitoringNetworkConfig] = Unassigned(),
+        stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_explainability_job_definition resource.")
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+            "ModelExplainabilityBaselineConfig": model_explainability_baseline_config,
+            "ModelExplainabilityAppSpecification": model_explainability_app_specification,
+            "ModelExplainabilityJobInput": model_explainability_job_input,
+            "ModelExplainabilityJobOutputConfig": model_explainability_job_output_config,
+            "JobResources": job_resources,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelExplainabilityJobDefinitionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_explainability_job_definition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelExplainabilityJobDefinition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(
+                    operation_input_args,
+                    "CreateModelExplainabilityJobDefinitionRequest",
+                ),
+                transform(response, "CreateModelExplainabilityJobDefinitionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            job_definition_name=job_definition_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        job_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+        }
+        response = await async_cached_describe(
+            "ModelExplainabilityJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_explainability_job_definition",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(
+                response, "DescribeModelExplainabilityJobDefinitionResponse"
+            )
+
+        # deserialize the response
+        model_explainability_job_definition = cls._from_describe(
+            response,
+            "DescribeModelExplainabilityJobDefinitionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_explainability_job_definition
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        response = await async_cached_describe(
+            "ModelExplainabilityJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_explainability_job_definition",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelExplainabilityJobDefinitionResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model_explainability_job_definition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ModelExplainabilityJobDefinition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class ModelPackage(AsyncBase, resources.ModelPackage):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "validation_specification": {"validation_role": {"type": "string"}},
+                "model_metrics": {
+                    "model_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_data_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "bias": {
+                        "report": {"s3_uri": {"type": "string"}},
+                        "pre_training_report": {"s3_uri": {"type": "string"}},
+                        "post_training_report": {"s3_uri": {"type": "string"}},
+                    },
+                    "explainability": {"report": {"s3_uri": {"type": "string"}}},
+                },
+                "drift_check_baselines": {
+                    "bias": {
+                        "config_file": {"s3_uri": {"type": "string"}},
+                        "pre_training_constraints": {"s3_uri": {"type": "string"}},
+                        "post_training_constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "explainability": {
+                        "constraints": {"s3_uri": {"type": "string"}},
+                        "config_file": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_data_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelPackage", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        model_package_name: Optional[str] = Unassigned(),
+        model_package_group_name: Optional[str] = Unassigned(),
+        model_package_description: Optional[str] = Unassigned(),
+        inference_specification: Optional[InferenceSpecification] = Unassigned(),
+        validation_specification: Optional[
+            ModelPackageValidationSpecification
+        ] = Unassigned(),
+        source_algorithm_specification: Optional[
+            SourceAlgorithmSpecification
+        ] = Unassigned(),
+        certify_for_marketplace: Optional[bool] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        model_approval_status: Optional[str] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        model_metrics: Optional[ModelMetrics] = Unassigned(),
+        client_token: Optional[str] = Unassigned(),
+        domain: Optional[str] = Unassigned(),
+        task: Optional[str] = Unassigned(),
+        sample_payload_url: Optional[str] = Unassigned(),
+        customer_metadata_properties: Optional[Dict[str, str]] = Unassigned(),
+        drift_check_baselines: Optional[DriftCheckBaselines] = Unassigned(),
+        additional_inference_specifications: Optional[
+            List[AdditionalInferenceSpecificationDefinition]
+        ] = Unassigned(),
+        skip_model_validation: Optional[str] = Unassigned(),
+        source_uri: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_package resource.")
+        operation_input_args = {
+            "ModelPackageName": model_package_name,
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageDescription": model_package_description,
+            "InferenceSpecification": inference_specification,
+            "ValidationSpecification": validation_specification,
+            "SourceAlgorithmSpecification": source_algorithm_specification,
+            "CertifyForMarketplace": certify_for_marketplace,
+            "Tags": tags,
+            "ModelApprovalStatus": model_approval_status,
+            "MetadataProperties": metadata_properties,
+            "ModelMetrics": model_metrics,
+            "ClientToken": client_token,
+            "Domain": domain,
+            "Task": task,
+            "SamplePayloadUrl": sample_payload_url,
+            "CustomerMetadataProperties": customer_metadata_properties,
+            "DriftCheckBaselines": drift_check_baselines,
+            "AdditionalInferenceSpecifications": additional_inference_specifications,
+            "SkipModelValidation": skip_model_validation,
+            "SourceUri": source_uri,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelPackageInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_package",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelPackage", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelPackageInput"),
+                transform(response, "CreateModelPackageOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            model_package_name=response["ModelPackageName"],
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        model_package_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelPackageName": model_package_name,
+        }
+        response = await async_cached_describe(
+            "ModelPackage",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_package",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelPackageOutput")
+
+        # deserialize the response
+        model_package = cls._from_describe(
+            response,
+            "DescribeModelPackageOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_package
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_approval_status: Optional[str] = Unassigned(),
+        model_package_group_name: Optional[str] = Unassigned(),
+        model_package_type: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["ModelPackage"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "ModelApprovalStatus": model_approval_status,
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageType": model_package_type,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListModelPackagesInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_model_packages",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ModelPackageSummaryList",
+            summary_name="ModelPackageSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        response = await async_cached_describe(
+            "ModelPackage",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_package",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelPackageOutput", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+        customer_metadata_properties_to_remove: Optional[List[str]] = Unassigned(),
+        additional_inference_specifications_to_add: Optional[
+            List[AdditionalInferenceSpecificationDefinition]
+        ] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating model_package resource.")
+        operation_input_args = {
+            "ModelPackageArn": self.model_package_arn,
+            "ModelApprovalStatus": self.model_approval_status,
+            "ApprovalDescription": self.approval_description,
+            "CustomerMetadataProperties": self.customer_metadata_properties,
+            "CustomerMetadataPropertiesToRemove": customer_metadata_properties_to_remove,
+            "AdditionalInferenceSpecificationsToAdd": additional_inference_specifications_to_add,
+            "InferenceSpecification": self.inference_specification,
+            "SourceUri": self.source_uri,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateModelPackageInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_model_package",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelPackage",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model_package",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ModelPackage",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        waiter = Waiter(
+            resource_type="ModelPackage",
+            status_path=("ModelPackageStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_package",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeModelPackageOutput")
+        return self
+
+
+class ModelPackageGroup(AsyncBase, resources.ModelPackageGroup):
+
+    @classmethod
+    async def create(
+        cls,
+        model_package_group_name: str,
+        model_package_group_description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_package_group resource.")
+        operation_input_args = {
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageGroupDescription": model_package_group_description,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelPackageGroupInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_package_group",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelPackageGroup", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelPackageGroupInput"),
+                transform(response, "CreateModelPackageGroupOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            model_package_group_name=model_package_group_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        model_package_group_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelPackageGroupName": model_package_group_name,
+        }
+        response = await async_cached_describe(
+            "ModelPackageGroup",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_package_group",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelPackageGroupOutput")
+
+        # deserialize the response
+        model_package_group = cls._from_describe(
+            response,
+            "DescribeModelPackageGroupOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_package_group
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["ModelPackageGroup"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListModelPackageGroupsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_model_package_groups",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ModelPackageGroupSummaryList",
+            summary_name="ModelPackageGroupSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ModelPackageGroupName": self.model_package_group_name,
+        }
+        response = await async_cached_describe(
+            "ModelPackageGroup",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_package_group",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelPackageGroupOutput", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ModelPackageGroupName": self.model_package_group_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model_package_group",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ModelPackageGroup",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Pending", "InProgress", "Completed", "Failed", "Deleting", "DeleteFailed"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelPackageGroupName": self.model_package_group_name,
+        }
+        waiter = Waiter(
+            resource_type="ModelPackageGroup",
+            status_path=("ModelPackageGroupStatus",),
+            success_states=[status],
+            failure_states=["Failed", "DeleteFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_package_group",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeModelPackageGroupOutput")
+        return self
+
+
+class ModelQualityJobDefinition(AsyncBase, resources.ModelQualityJobDefinition):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_quality_job_input": {
+                    "ground_truth_s3_input": {"s3_uri": {"type": "string"}},
+                    "endpoint_input": {
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                    "batch_transform_input": {
+                        "data_captured_destination_s3_uri": {"type": "string"},
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                },
+                "model_quality_job_output_config": {"kms_key_id": {"type": "string"}},
+                "job_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "role_arn": {"type": "string"},
+                "model_quality_baseline_config": {
+                    "constraints_resource": {"s3_uri": {"type": "string"}}
+                },
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelQualityJobDefinition", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        job_definition_name: str,
+        model_quality_app_specification: ModelQualityAppSpecification,
+        model_quality_job_input: ModelQualityJobInput,
+        model_quality_job_output_config: MonitoringOutputConfig,
+        job_resources: MonitoringResources,
+        role_arn: str,
+        model_quality_baseline_config: Optional[
+            ModelQualityBaselineConfig
+        ] = Unassigned(),
+        network_config: Optional[MonitoringNetworkConfig] = Unassigned(),
+        stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_quality_job_definition resource.")
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+            "ModelQualityBaselineConfig": model_quality_baseline_config,
+            "ModelQualityAppSpecification": model_quality_app_specification,
+            "ModelQualityJobInput": model_quality_job_input,
+            "ModelQualityJobOutputConfig": model_quality_job_output_config,
+            "JobResources": job_resources,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelQualityJobDefinitionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_model_quality_job_definition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelQualityJobDefinition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(
+                    operation_input_args, "CreateModelQualityJobDefinitionRequest"
+                ),
+                transform(response, "CreateModelQualityJobDefinitionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            job_definition_name=job_definition_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        job_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+        }
+        response = await async_cached_describe(
+            "ModelQualityJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_quality_job_definition",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelQualityJobDefinitionResponse")
+
+        # deserialize the response
+        model_quality_job_definition = cls._from_describe(
+            response,
+            "DescribeModelQualityJobDefinitionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_quality_job_definition
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        response = await async_cached_describe(
+            "ModelQualityJobDefinition",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_model_quality_job_definition",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelQualityJobDefinitionResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_model_quality_job_definition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ModelQualityJobDefinition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class MonitoringSchedule(AsyncBase, resources.MonitoringSchedule):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "monitoring_schedule_config": {
+                    "monitoring_job_definition": {
+                        "monitoring_output_config": {"kms_key_id": {"type": "string"}},
+                        "monitoring_resources": {
+                            "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                        },
+                        "role_arn": {"type": "string"},
+                        "baseline_config": {
+                            "constraints_resource": {"s3_uri": {"type": "string"}},
+                            "statistics_resource": {"s3_uri": {"type": "string"}},
+                        },
+                        "network_config": {
+                            "vpc_config": {
+                                "security_group_ids": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                },
+                                "subnets": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                },
+                            }
+                        },
+                    }
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "MonitoringSchedule", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        monitoring_schedule_name: str,
+        monitoring_schedule_config: MonitoringScheduleConfig,
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating monitoring_schedule resource.")
+        operation_input_args = {
+            "MonitoringScheduleName": monitoring_schedule_name,
+            "MonitoringScheduleConfig": monitoring_schedule_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateMonitoringScheduleRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_monitoring_schedule",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "MonitoringSchedule", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateMonitoringScheduleRequest"),
+                transform(response, "CreateMonitoringScheduleResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            monitoring_schedule_name=monitoring_schedule_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        monitoring_schedule_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "MonitoringScheduleName": monitoring_schedule_name,
+        }
+        response = await async_cached_describe(
+            "MonitoringSchedule",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_monitoring_schedule",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeMonitoringScheduleResponse")
+
+        # deserialize the response
+        monitoring_schedule = cls._from_describe(
+            response,
+            "DescribeMonitoringScheduleResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return monitoring_schedule
+
+    @classmethod
+    def list(
+        cls,
+        endpoint_name: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        monitoring_job_definition_name: Optional[str] = Unassigned(),
+        monitoring_type_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["MonitoringSchedule"]:
+        operation_input_args = {
+            "EndpointName": endpoint_name,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "StatusEquals": status_equals,
+            "MonitoringJobDefinitionName": monitoring_job_definition_name,
+            "MonitoringTypeEquals": monitoring_type_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListMonitoringSchedulesRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_monitoring_schedules",
+            list_method_kwargs=operation_input_args,
+            summaries_key="MonitoringScheduleSummaries",
+            summary_name="MonitoringScheduleSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "MonitoringScheduleName": self.monitoring_schedule_name,
+        }
+        response = await async_cached_describe(
+            "MonitoringSchedule",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_monitoring_schedule",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeMonitoringScheduleResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating monitoring_schedule resource.")
+        operation_input_args = {
+            "MonitoringScheduleName": self.monitoring_schedule_name,
+            "MonitoringScheduleConfig": self.monitoring_schedule_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateMonitoringScheduleRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_monitoring_schedule",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "MonitoringSchedule",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "MonitoringScheduleName": self.monitoring_schedule_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_monitoring_schedule",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "MonitoringSchedule",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "MonitoringScheduleName": self.monitoring_schedule_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_monitoring_schedule",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "MonitoringSchedule",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Pending", "Failed", "Scheduled", "Stopped"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "MonitoringScheduleName": self.monitoring_schedule_name,
+        }
+        waiter = Waiter(
+            resource_type="MonitoringSchedule",
+            status_path=("MonitoringScheduleStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_monitoring_schedule",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeMonitoringScheduleResponse")
+        return self
+
+
+class NotebookInstance(AsyncBase, resources.NotebookInstance):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "subnet_id": {"type": "string"},
+                "security_groups": {"type": "array", "items": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "kms_key_id": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "NotebookInstance", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        notebook_instance_name: str,
+        instance_type: str,
+        role_arn: str,
+        subnet_id: Optional[str] = Unassigned(),
+        security_group_ids: Optional[List[str]] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        lifecycle_config_name: Optional[str] = Unassigned(),
+        direct_internet_access: Optional[str] = Unassigned(),
+        volume_size_in_g_b: Optional[int] = Unassigned(),
+        accelerator_types: Optional[List[str]] = Unassigned(),
+        default_code_repository: Optional[str] = Unassigned(),
+        additional_code_repositories: Optional[List[str]] = Unassigned(),
+        root_access: Optional[str] = Unassigned(),
+        platform_identifier: Optional[str] = Unassigned(),
+        instance_metadata_service_configuration: Optional[
+            InstanceMetadataServiceConfiguration
+        ] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating notebook_instance resource.")
+        operation_input_args = {
+            "NotebookInstanceName": notebook_instance_name,
+            "InstanceType": instance_type,
+            "SubnetId": subnet_id,
+            "SecurityGroupIds": security_group_ids,
+            "RoleArn": role_arn,
+            "KmsKeyId": kms_key_id,
+            "Tags": tags,
+            "LifecycleConfigName": lifecycle_config_name,
+            "DirectInternetAccess": direct_internet_access,
+            "VolumeSizeInGB": volume_size_in_g_b,
+            "AcceleratorTypes": accelerator_types,
+            "DefaultCodeRepository": default_code_repository,
+            "AdditionalCodeRepositories": additional_code_repositories,
+            "RootAccess": root_access,
+            "PlatformIdentifier": platform_identifier,
+            "InstanceMetadataServiceConfiguration": instance_metadata_service_configuration,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateNotebookInstanceInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_notebook_instance",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstance", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateNotebookInstanceInput"),
+                transform(response, "CreateNotebookInstanceOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            notebook_instance_name=notebook_instance_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        notebook_instance_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "NotebookInstanceName": notebook_instance_name,
+        }
+        response = await async_cached_describe(
+            "NotebookInstance",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_notebook_instance",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeNotebookInstanceOutput")
+
+        # deserialize the response
+        notebook_instance = cls._from_describe(
+            response,
+            "DescribeNotebookInstanceOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return notebook_instance
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        notebook_instance_lifecycle_config_name_contains: Optional[str] = Unassigned(),
+        default_code_repository_contains: Optional[str] = Unassigned(),
+        additional_code_repository_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["NotebookInstance"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "StatusEquals": status_equals,
+            "NotebookInstanceLifecycleConfigNameContains": notebook_instance_lifecycle_config_name_contains,
+            "DefaultCodeRepositoryContains": default_code_repository_contains,
+            "AdditionalCodeRepositoryEquals": additional_code_repository_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListNotebookInstancesInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_notebook_instances",
+            list_method_kwargs=operation_input_args,
+            summaries_key="NotebookInstances",
+            summary_name="NotebookInstanceSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        response = await async_cached_describe(
+            "NotebookInstance",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_notebook_instance",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeNotebookInstanceOutput", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+        lifecycle_config_name: Optional[str] = Unassigned(),
+        disassociate_lifecycle_config: Optional[bool] = Unassigned(),
+        disassociate_accelerator_types: Optional[bool] = Unassigned(),
+        disassociate_default_code_repository: Optional[bool] = Unassigned(),
+        disassociate_additional_code_repositories: Optional[bool] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating notebook_instance resource.")
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+            "InstanceType": self.instance_type,
+            "RoleArn": self.role_arn,
+            "LifecycleConfigName": lifecycle_config_name,
+            "DisassociateLifecycleConfig": disassociate_lifecycle_config,
+            "VolumeSizeInGB": self.volume_size_in_g_b,
+            "DefaultCodeRepository": self.default_code_repository,
+            "AdditionalCodeRepositories": self.additional_code_repositories,
+            "AcceleratorTypes": self.accelerator_types,
+            "DisassociateAcceleratorTypes": disassociate_accelerator_types,
+            "DisassociateDefaultCodeRepository": disassociate_default_code_repository,
+            "DisassociateAdditionalCodeRepositories": disassociate_additional_code_repositories,
+            "RootAccess": self.root_access,
+            "InstanceMetadataServiceConfiguration": self.instance_metadata_service_configuration,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateNotebookInstanceInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_notebook_instance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_notebook_instance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "NotebookInstance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_notebook_instance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "NotebookInstance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Pending",
+            "InService",
+            "Stopping",
+            "Stopped",
+            "Failed",
+            "Deleting",
+            "Updating",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        waiter = Waiter(
+            resource_type="NotebookInstance",
+            status_path=("NotebookInstanceStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=30,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_notebook_instance",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeNotebookInstanceOutput")
+        return self
+
+
+class NotebookInstanceLifecycleConfig(
+    AsyncBase, resources.NotebookInstanceLifecycleConfig
+):
+
+    @classmethod
+    async def create(
+        cls,
+        notebook_instance_lifecycle_config_name: str,
+        on_create: Optional[List[NotebookInstanceLifecycleHook]] = Unassigned(),
+        on_start: Optional[List[NotebookInstanceLifecycleHook]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating notebook_instance_lifecycle_config resource.")
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": notebook_instance_lifecycle_config_name,
+            "OnCreate": on_create,
+            "OnStart": on_start,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateNotebookInstanceLifecycleConfigInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_notebook_instance_lifecycle_config",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(
+                    operation_input_args, "CreateNotebookInstanceLifecycleConfigInput"
+                ),
+                transform(response, "CreateNotebookInstanceLifecycleConfigOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            notebook_instance_lifecycle_config_name=notebook_instance_lifecycle_config_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        notebook_instance_lifecycle_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": notebook_instance_lifecycle_config_name,
+        }
+        response = await async_cached_describe(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_notebook_instance_lifecycle_config",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(
+                response, "DescribeNotebookInstanceLifecycleConfigOutput"
+            )
+
+        # deserialize the response
+        notebook_instance_lifecycle_config = cls._from_describe(
+            response,
+            "DescribeNotebookInstanceLifecycleConfigOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return notebook_instance_lifecycle_config
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["NotebookInstanceLifecycleConfig"]:
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListNotebookInstanceLifecycleConfigsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_notebook_instance_lifecycle_configs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="NotebookInstanceLifecycleConfigs",
+            summary_name="NotebookInstanceLifecycleConfigSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": self.notebook_instance_lifecycle_config_name,
+        }
+        response = await async_cached_describe(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_notebook_instance_lifecycle_config",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeNotebookInstanceLifecycleConfigOutput", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating notebook_instance_lifecycle_config resource.")
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": self.notebook_instance_lifecycle_config_name,
+            "OnCreate": self.on_create,
+            "OnStart": self.on_start,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateNotebookInstanceLifecycleConfigInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_notebook_instance_lifecycle_config",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": self.notebook_instance_lifecycle_config_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_notebook_instance_lifecycle_config",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class Pipeline(AsyncBase, resources.Pipeline):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {"role_arn": {"type": "string"}}
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Pipeline", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        pipeline_name: str,
+        client_request_token: str,
+        role_arn: str,
+        pipeline_display_name: Optional[str] = Unassigned(),
+        pipeline_definition: Optional[str] = Unassigned(),
+        pipeline_definition_s3_location: Optional[
+            PipelineDefinitionS3Location
+        ] = Unassigned(),
+        pipeline_description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        parallelism_configuration: Optional[ParallelismConfiguration] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating pipeline resource.")
+        operation_input_args = {
+            "PipelineName": pipeline_name,
+            "PipelineDisplayName": pipeline_display_name,
+            "PipelineDefinition": pipeline_definition,
+            "PipelineDefinitionS3Location": pipeline_definition_s3_location,
+            "PipelineDescription": pipeline_description,
+            "ClientRequestToken": client_request_token,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "ParallelismConfiguration": parallelism_configuration,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreatePipelineRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_pipeline",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Pipeline", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreatePipelineRequest"),
+                transform(response, "CreatePipelineResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            pipeline_name=pipeline_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        pipeline_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "PipelineName": pipeline_name,
+        }
+        response = await async_cached_describe(
+            "Pipeline",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_pipeline",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribePipelineResponse")
+
+        # deserialize the response
+        pipeline = cls._from_describe(
+            response,
+            "DescribePipelineResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return pipeline
+
+    @classmethod
+    def list(
+        cls,
+        pipeline_name_prefix: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Pipeline"]:
+        operation_input_args = {
+            "PipelineNamePrefix": pipeline_name_prefix,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListPipelinesRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_pipelines",
+            list_method_kwargs=operation_input_args,
+            summaries_key="PipelineSummaries",
+            summary_name="PipelineSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+        }
+        response = await async_cached_describe(
+            "Pipeline",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_pipeline",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribePipelineResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        pipeline_definition_s3_location: Optional[
+            PipelineDefinitionS3Location
+        ] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating pipeline resource.")
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+            "PipelineDisplayName": self.pipeline_display_name,
+            "PipelineDefinition": self.pipeline_definition,
+            "PipelineDefinitionS3Location": pipeline_definition_s3_location,
+            "PipelineDescription": self.pipeline_description,
+            "RoleArn": self.role_arn,
+            "ParallelismConfiguration": self.parallelism_configuration,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdatePipelineRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_pipeline",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Pipeline", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+            "ClientRequestToken": self.client_request_token,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_pipeline",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Pipeline", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Active", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+        }
+        waiter = Waiter(
+            resource_type="Pipeline",
+            status_path=("PipelineStatus",),
+            success_states=[status],
+            failure_states=[],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_pipeline",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribePipelineResponse")
+        return self
+
+
+class PipelineExecution(AsyncBase, resources.PipelineExecution):
+
+    @classmethod
+    async def get(
+        cls,
+        pipeline_execution_arn: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "PipelineExecutionArn": pipeline_execution_arn,
+        }
+        response = await async_cached_describe(
+            "PipelineExecution",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_pipeline_execution",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribePipelineExecutionResponse")
+
+        # deserialize the response
+        pipeline_execution = cls._from_describe(
+            response,
+            "DescribePipelineExecutionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return pipeline_execution
+
+    @classmethod
+    def list(
+        cls,
+        pipeline_name: str,
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["PipelineExecution"]:
+        operation_input_args = {
+            "PipelineName": pipeline_name,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListPipelineExecutionsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_pipeline_executions",
+            list_method_kwargs=operation_input_args,
+            summaries_key="PipelineExecutionSummaries",
+            summary_name="PipelineExecutionSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "PipelineExecutionArn": self.pipeline_execution_arn,
+        }
+        response = await async_cached_describe(
+            "PipelineExecution",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_pipeline_execution",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribePipelineExecutionResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating pipeline_execution resource.")
+        operation_input_args = {
+            "PipelineExecutionArn": self.pipeline_execution_arn,
+            "PipelineExecutionDescription": self.pipeline_execution_description,
+            "PipelineExecutionDisplayName": self.pipeline_execution_display_name,
+            "ParallelismConfiguration": self.parallelism_configuration,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdatePipelineExecutionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_pipeline_execution",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "PipelineExecution",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "PipelineExecutionArn": self.pipeline_execution_arn,
+            "ClientRequestToken": self.client_request_token,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_pipeline_execution",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "PipelineExecution",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Executing", "Stopping", "Stopped", "Failed", "Succeeded"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "PipelineExecutionArn": self.pipeline_execution_arn,
+        }
+        waiter = Waiter(
+            resource_type="PipelineExecution",
+            status_path=("PipelineExecutionStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_pipeline_execution",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribePipelineExecutionResponse")
+        return self
+
+
+class ProcessingJob(AsyncBase, resources.ProcessingJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "processing_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "processing_output_config": {"kms_key_id": {"type": "string"}},
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+                "role_arn": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ProcessingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        processing_job_name: str,
+        processing_resources: ProcessingResources,
+        app_specification: AppSpecification,
+        role_arn: str,
+        processing_inputs: Optional[List[ProcessingInput]] = Unassigned(),
+        processing_output_config: Optional[ProcessingOutputConfig] = Unassigned(),
+        stopping_condition: Optional[ProcessingStoppingCondition] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        network_config: Optional[NetworkConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        experiment_config: Optional[ExperimentConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating processing_job resource.")
+        operation_input_args = {
+            "ProcessingInputs": processing_inputs,
+            "ProcessingOutputConfig": processing_output_config,
+            "ProcessingJobName": processing_job_name,
+            "ProcessingResources": processing_resources,
+            "StoppingCondition": stopping_condition,
+            "AppSpecification": app_specification,
+            "Environment": environment,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "ExperimentConfig": experiment_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateProcessingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_processing_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ProcessingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateProcessingJobRequest"),
+                transform(response, "CreateProcessingJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            processing_job_name=processing_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        processing_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ProcessingJobName": processing_job_name,
+        }
+        response = await async_cached_describe(
+            "ProcessingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_processing_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeProcessingJobResponse")
+
+        # deserialize the response
+        processing_job = cls._from_describe(
+            response,
+            "DescribeProcessingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return processing_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["ProcessingJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListProcessingJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_processing_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ProcessingJobSummaries",
+            summary_name="ProcessingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        response = await async_cached_describe(
+            "ProcessingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_processing_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeProcessingJobResponse", fields=fields
+        )
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_processing_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "ProcessingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        waiter = Waiter(
+            resource_type="ProcessingJob",
+            status_path=("ProcessingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_processing_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeProcessingJobResponse")
+        return self
+
+
+class Project(AsyncBase, resources.Project):
+
+    @classmethod
+    async def create(
+        cls,
+        project_name: str,
+        service_catalog_provisioning_details: ServiceCatalogProvisioningDetails,
+        project_description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating project resource.")
+        operation_input_args = {
+            "ProjectName": project_name,
+            "ProjectDescription": project_description,
+            "ServiceCatalogProvisioningDetails": service_catalog_provisioning_details,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateProjectInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_project",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Project", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateProjectInput"),
+                transform(response, "CreateProjectOutput"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(project_name=project_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        project_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ProjectName": project_name,
+        }
+        response = await async_cached_describe(
+            "Project",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_project",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeProjectOutput")
+
+        # deserialize the response
+        project = cls._from_describe(
+            response,
+            "DescribeProjectOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return project
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Project"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListProjectsInput"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_projects",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ProjectSummaryList",
+            summary_name="ProjectSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ProjectName": self.project_name,
+        }
+        response = await async_cached_describe(
+            "Project",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_project",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeProjectOutput", fields=fields)
+        return self
+
+    async def update(
+        self,
+        service_catalog_provisioning_update_details: Optional[
+            ServiceCatalogProvisioningUpdateDetails
+        ] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating project resource.")
+        operation_input_args = {
+            "ProjectName": self.project_name,
+            "ProjectDescription": self.project_description,
+            "ServiceCatalogProvisioningUpdateDetails": service_catalog_provisioning_update_details,
+            "Tags": tags,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateProjectInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_project",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Project", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "ProjectName": self.project_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_project",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Project", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Pending",
+            "CreateInProgress",
+            "CreateCompleted",
+            "CreateFailed",
+            "DeleteInProgress",
+            "DeleteFailed",
+            "DeleteCompleted",
+            "UpdateInProgress",
+            "UpdateCompleted",
+            "UpdateFailed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ProjectName": self.project_name,
+        }
+        waiter = Waiter(
+            resource_type="Project",
+            status_path=("ProjectStatus",),
+            success_states=[status],
+            failure_states=["CreateFailed", "DeleteFailed", "UpdateFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_project",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeProjectOutput")
+        return self
+
+
+class Space(AsyncBase, resources.Space):
+
+    @classmethod
+    async def create(
+        cls,
+        domain_id: str,
+        space_name: str,
+        tags: Optional[List[Tag]] = Unassigned(),
+        space_settings: Optional[SpaceSettings] = Unassigned(),
+        ownership_settings: Optional[OwnershipSettings] = Unassigned(),
+        space_sharing_settings: Optional[SpaceSharingSettings] = Unassigned(),
+        space_display_name: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating space resource.")
+        operation_input_args = {
+            "DomainId": domain_id,
+            "SpaceName": space_name,
+            "Tags": tags,
+            "SpaceSettings": space_settings,
+            "OwnershipSettings": ownership_settings,
+            "SpaceSharingSettings": space_sharing_settings,
+            "SpaceDisplayName": space_display_name,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateSpaceRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_space",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Space", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateSpaceRequest"),
+                transform(response, "CreateSpaceResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            domain_id=domain_id, space_name=space_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        domain_id: str,
+        space_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+            "SpaceName": space_name,
+        }
+        response = await async_cached_describe(
+            "Space",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_space",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeSpaceResponse")
+
+        # deserialize the response
+        space = cls._from_describe(
+            response,
+            "DescribeSpaceResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return space
+
+    @classmethod
+    def list(
+        cls,
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        domain_id_equals: Optional[str] = Unassigned(),
+        space_name_contains: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Space"]:
+        operation_input_args = {
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "DomainIdEquals": domain_id_equals,
+            "SpaceNameContains": space_name_contains,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListSpacesRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_spaces",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Spaces",
+            summary_name="SpaceDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+        }
+        response = await async_cached_describe(
+            "Space",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_space",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeSpaceResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating space resource.")
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+            "SpaceSettings": self.space_settings,
+            "SpaceDisplayName": self.space_display_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateSpaceRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_space",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Space", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_space",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Space", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+        }
+        waiter = Waiter(
+            resource_type="Space",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed", "Update_Failed", "Delete_Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_space",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeSpaceResponse")
+        return self
+
+
+class StudioLifecycleConfig(AsyncBase, resources.StudioLifecycleConfig):
+
+    @classmethod
+    async def create(
+        cls,
+        studio_lifecycle_config_name: str,
+        studio_lifecycle_config_content: str,
+        studio_lifecycle_config_app_type: str,
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating studio_lifecycle_config resource.")
+        operation_input_args = {
+            "StudioLifecycleConfigName": studio_lifecycle_config_name,
+            "StudioLifecycleConfigContent": studio_lifecycle_config_content,
+            "StudioLifecycleConfigAppType": studio_lifecycle_config_app_type,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateStudioLifecycleConfigRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_studio_lifecycle_config",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "StudioLifecycleConfig",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateStudioLifecycleConfigRequest"),
+                transform(response, "CreateStudioLifecycleConfigResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            studio_lifecycle_config_name=studio_lifecycle_config_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        studio_lifecycle_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "StudioLifecycleConfigName": studio_lifecycle_config_name,
+        }
+        response = await async_cached_describe(
+            "StudioLifecycleConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_studio_lifecycle_config",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeStudioLifecycleConfigResponse")
+
+        # deserialize the response
+        studio_lifecycle_config = cls._from_describe(
+            response,
+            "DescribeStudioLifecycleConfigResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return studio_lifecycle_config
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        app_type_equals: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["StudioLifecycleConfig"]:
+        operation_input_args = {
+            "NameContains": name_contains,
+            "AppTypeEquals": app_type_equals,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "ModifiedTimeBefore": modified_time_before,
+            "ModifiedTimeAfter": modified_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListStudioLifecycleConfigsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_studio_lifecycle_configs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="StudioLifecycleConfigs",
+            summary_name="StudioLifecycleConfigDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "StudioLifecycleConfigName": self.studio_lifecycle_config_name,
+        }
+        response = await async_cached_describe(
+            "StudioLifecycleConfig",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_studio_lifecycle_config",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeStudioLifecycleConfigResponse", fields=fields
+        )
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "StudioLifecycleConfigName": self.studio_lifecycle_config_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_studio_lifecycle_config",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "StudioLifecycleConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+
+class TrainingJob(AsyncBase, resources.TrainingJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_artifacts": {"s3_model_artifacts": {"type": "string"}},
+                "resource_config": {"volume_kms_key_id": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+                "checkpoint_config": {"s3_uri": {"type": "string"}},
+                "debug_hook_config": {"s3_output_path": {"type": "string"}},
+                "tensor_board_output_config": {"s3_output_path": {"type": "string"}},
+                "profiler_config": {"s3_output_path": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "TrainingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        training_job_name: str,
+        algorithm_specification: AlgorithmSpecification,
+        role_arn: str,
+        output_data_config: OutputDataConfig,
+        resource_config: ResourceConfig,
+        stopping_condition: StoppingCondition,
+        hyper_parameters: Optional[Dict[str, str]] = Unassigned(),
+        input_data_config: Optional[List[Channel]] = Unassigned(),
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        enable_network_isolation: Optional[bool] = Unassigned(),
+        enable_inter_container_traffic_encryption: Optional[bool] = Unassigned(),
+        enable_managed_spot_training: Optional[bool] = Unassigned(),
+        checkpoint_config: Optional[CheckpointConfig] = Unassigned(),
+        debug_hook_config: Optional[DebugHookConfig] = Unassigned(),
+        debug_rule_configurations: Optional[
+            List[DebugRuleConfiguration]
+        ] = Unassigned(),
+        tensor_board_output_config: Optional[TensorBoardOutputConfig] = Unassigned(),
+        experiment_config: Optional[ExperimentConfig] = Unassigned(),
+        profiler_config: Optional[ProfilerConfig] = Unassigned(),
+        profiler_rule_configurations: Optional[
+            List[ProfilerRuleConfiguration]
+        ] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        retry_strategy: Optional[RetryStrategy] = Unassigned(),
+        remote_debug_config: Optional[RemoteDebugConfig] = Unassigned(),
+        infra_check_config: Optional[InfraCheckConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating training_job resource.")
+        operation_input_args = {
+            "TrainingJobName": training_job_name,
+            "HyperParameters": hyper_parameters,
+            "AlgorithmSpecification": algorithm_specification,
+            "RoleArn": role_arn,
+            "InputDataConfig": input_data_config,
+            "OutputDataConfig": output_data_config,
+            "ResourceConfig": resource_config,
+            "VpcConfig": vpc_config,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+            "EnableNetworkIsolation": enable_network_isolation,
+            "EnableInterContainerTrafficEncryption": enable_inter_container_traffic_encryption,
+            "EnableManagedSpotTraining": enable_managed_spot_training,
+            "CheckpointConfig": checkpoint_config,
+            "DebugHookConfig": debug_hook_config,
+            "DebugRuleConfigurations": debug_rule_configurations,
+            "TensorBoardOutputConfig": tensor_board_output_config,
+            "ExperimentConfig": experiment_config,
+            "ProfilerConfig": profiler_config,
+            "ProfilerRuleConfigurations": profiler_rule_configurations,
+            "Environment": environment,
+            "RetryStrategy": retry_strategy,
+            "RemoteDebugConfig": remote_debug_config,
+            "InfraCheckConfig": infra_check_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTrainingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_training_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrainingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateTrainingJobRequest"),
+                transform(response, "CreateTrainingJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            training_job_name=training_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        training_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrainingJobName": training_job_name,
+        }
+        response = await async_cached_describe(
+            "TrainingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_training_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTrainingJobResponse")
+
+        # deserialize the response
+        training_job = cls._from_describe(
+            response,
+            "DescribeTrainingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return training_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        warm_pool_status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["TrainingJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "WarmPoolStatusEquals": warm_pool_status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTrainingJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_training_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TrainingJobSummaries",
+            summary_name="TrainingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        response = await async_cached_describe(
+            "TrainingJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_training_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeTrainingJobResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating training_job resource.")
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+            "ProfilerConfig": self.profiler_config,
+            "ProfilerRuleConfigurations": self.profiler_rule_configurations,
+            "ResourceConfig": self.resource_config,
+            "RemoteDebugConfig": self.remote_debug_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateTrainingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_training_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrainingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_training_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "TrainingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        waiter = Waiter(
+            resource_type="TrainingJob",
+            status_path=("TrainingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=120,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_training_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeTrainingJobResponse")
+        return self
+
+
+class TransformJob(AsyncBase, resources.TransformJob):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "transform_input": {
+                    "data_source": {
+                        "s3_data_source": {
+                            "s3_data_type": {"type": "string"},
+                            "s3_uri": {"type": "string"},
+                        }
+                    }
+                },
+                "transform_resources": {"volume_kms_key_id": {"type": "string"}},
+                "transform_output": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "TransformJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        transform_job_name: str,
+        model_name: str,
+        transform_input: TransformInput,
+        transform_output: TransformOutput,
+        transform_resources: TransformResources,
+        max_concurrent_transforms: Optional[int] = Unassigned(),
+        model_client_config: Optional[ModelClientConfig] = Unassigned(),
+        max_payload_in_m_b: Optional[int] = Unassigned(),
+        batch_strategy: Optional[str] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        data_capture_config: Optional[BatchDataCaptureConfig] = Unassigned(),
+        data_processing: Optional[DataProcessing] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        experiment_config: Optional[ExperimentConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating transform_job resource.")
+        operation_input_args = {
+            "TransformJobName": transform_job_name,
+            "ModelName": model_name,
+            "MaxConcurrentTransforms": max_concurrent_transforms,
+            "ModelClientConfig": model_client_config,
+            "MaxPayloadInMB": max_payload_in_m_b,
+            "BatchStrategy": batch_strategy,
+            "Environment": environment,
+            "TransformInput": transform_input,
+            "TransformOutput": transform_output,
+            "DataCaptureConfig": data_capture_config,
+            "TransformResources": transform_resources,
+            "DataProcessing": data_processing,
+            "Tags": tags,
+            "ExperimentConfig": experiment_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTransformJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_transform_job",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TransformJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateTransformJobRequest"),
+                transform(response, "CreateTransformJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            transform_job_name=transform_job_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        transform_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TransformJobName": transform_job_name,
+        }
+        response = await async_cached_describe(
+            "TransformJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_transform_job",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTransformJobResponse")
+
+        # deserialize the response
+        transform_job = cls._from_describe(
+            response,
+            "DescribeTransformJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return transform_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["TransformJob"]:
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTransformJobsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_transform_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TransformJobSummaries",
+            summary_name="TransformJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        response = await async_cached_describe(
+            "TransformJob",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_transform_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeTransformJobResponse", fields=fields
+        )
+        return self
+
+    async def stop(self) -> None:
+
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "stop_transform_job",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "TransformJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait(
+        self, poll: int = 5, timeout: Optional[int] = None
+    ) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        waiter = Waiter(
+            resource_type="TransformJob",
+            status_path=("TransformJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_transform_job",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeTransformJobResponse")
+        return self
+
+
+class Trial(AsyncBase, resources.Trial):
+
+    @classmethod
+    async def create(
+        cls,
+        trial_name: str,
+        experiment_name: str,
+        display_name: Optional[str] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating trial resource.")
+        operation_input_args = {
+            "TrialName": trial_name,
+            "DisplayName": display_name,
+            "ExperimentName": experiment_name,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTrialRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_trial",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Trial", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateTrialRequest"),
+                transform(response, "CreateTrialResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(trial_name=trial_name, session=session, region=region)
+
+    @classmethod
+    async def get(
+        cls,
+        trial_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrialName": trial_name,
+        }
+        response = await async_cached_describe(
+            "Trial",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_trial",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTrialResponse")
+
+        # deserialize the response
+        trial = cls._from_describe(
+            response,
+            "DescribeTrialResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return trial
+
+    @classmethod
+    def list(
+        cls,
+        experiment_name: Optional[str] = Unassigned(),
+        trial_component_name: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["Trial"]:
+        operation_input_args = {
+            "ExperimentName": experiment_name,
+            "TrialComponentName": trial_component_name,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTrialsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_trials",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TrialSummaries",
+            summary_name="TrialSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TrialName": self.trial_name,
+        }
+        response = await async_cached_describe(
+            "Trial",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_trial",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeTrialResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating trial resource.")
+        operation_input_args = {
+            "TrialName": self.trial_name,
+            "DisplayName": self.display_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateTrialRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_trial",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Trial", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "TrialName": self.trial_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_trial",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Trial", operation_input_args, session=self._session, region=self._region
+        )
+
+
+class TrialComponent(AsyncBase, resources.TrialComponent):
+
+    @classmethod
+    async def create(
+        cls,
+        trial_component_name: str,
+        display_name: Optional[str] = Unassigned(),
+        status: Optional[TrialComponentStatus] = Unassigned(),
+        start_time: Optional[datetime.datetime] = Unassigned(),
+        end_time: Optional[datetime.datetime] = Unassigned(),
+        parameters: Optional[Dict[str, TrialComponentParameterValue]] = Unassigned(),
+        input_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned(),
+        output_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating trial_component resource.")
+        operation_input_args = {
+            "TrialComponentName": trial_component_name,
+            "DisplayName": display_name,
+            "Status": status,
+            "StartTime": start_time,
+            "EndTime": end_time,
+            "Parameters": parameters,
+            "InputArtifacts": input_artifacts,
+            "OutputArtifacts": output_artifacts,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTrialComponentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_trial_component",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrialComponent", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateTrialComponentRequest"),
+                transform(response, "CreateTrialComponentResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            trial_component_name=trial_component_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        trial_component_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrialComponentName": trial_component_name,
+        }
+        response = await async_cached_describe(
+            "TrialComponent",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_trial_component",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTrialComponentResponse")
+
+        # deserialize the response
+        trial_component = cls._from_describe(
+            response,
+            "DescribeTrialComponentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return trial_component
+
+    @classmethod
+    def list(
+        cls,
+        experiment_name: Optional[str] = Unassigned(),
+        trial_name: Optional[str] = Unassigned(),
+        source_arn: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["TrialComponent"]:
+        operation_input_args = {
+            "ExperimentName": experiment_name,
+            "TrialName": trial_name,
+            "SourceArn": source_arn,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTrialComponentsRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_trial_components",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TrialComponentSummaries",
+            summary_name="TrialComponentSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        response = await async_cached_describe(
+            "TrialComponent",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_trial_component",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeTrialComponentResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+        parameters_to_remove: Optional[List[str]] = Unassigned(),
+        input_artifacts_to_remove: Optional[List[str]] = Unassigned(),
+        output_artifacts_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating trial_component resource.")
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+            "DisplayName": self.display_name,
+            "Status": self.status,
+            "StartTime": self.start_time,
+            "EndTime": self.end_time,
+            "Parameters": self.parameters,
+            "ParametersToRemove": parameters_to_remove,
+            "InputArtifacts": self.input_artifacts,
+            "InputArtifactsToRemove": input_artifacts_to_remove,
+            "OutputArtifacts": self.output_artifacts,
+            "OutputArtifactsToRemove": output_artifacts_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateTrialComponentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_trial_component",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrialComponent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_trial_component",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "TrialComponent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["InProgress", "Completed", "Failed", "Stopping", "Stopped"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        waiter = Waiter(
+            resource_type="TrialComponent",
+            status_path=("Status", "PrimaryStatus"),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_trial_component",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeTrialComponentResponse")
+        return self
+
+
+class UserProfile(AsyncBase, resources.UserProfile):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "user_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                    "sharing_settings": {
+                        "s3_output_path": {"type": "string"},
+                        "s3_kms_key_id": {"type": "string"},
+                    },
+                    "canvas_app_settings": {
+                        "time_series_forecasting_settings": {
+                            "amazon_forecast_role_arn": {"type": "string"}
+                        },
+                        "model_register_settings": {
+                            "cross_account_model_register_role_arn": {"type": "string"}
+                        },
+                        "workspace_settings": {
+                            "s3_artifact_path": {"type": "string"},
+                            "s3_kms_key_id": {"type": "string"},
+                        },
+                        "generative_ai_settings": {
+                            "amazon_bedrock_role_arn": {"type": "string"}
+                        },
+                    },
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "UserProfile", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        domain_id: str,
+        user_profile_name: str,
+        single_sign_on_user_identifier: Optional[str] = Unassigned(),
+        single_sign_on_user_value: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        user_settings: Optional[UserSettings] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating user_profile resource.")
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SingleSignOnUserIdentifier": single_sign_on_user_identifier,
+            "SingleSignOnUserValue": single_sign_on_user_value,
+            "Tags": tags,
+            "UserSettings": user_settings,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateUserProfileRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_user_profile",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "UserProfile", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateUserProfileRequest"),
+                transform(response, "CreateUserProfileResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            domain_id=domain_id,
+            user_profile_name=user_profile_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        domain_id: str,
+        user_profile_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+        }
+        response = await async_cached_describe(
+            "UserProfile",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_user_profile",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeUserProfileResponse")
+
+        # deserialize the response
+        user_profile = cls._from_describe(
+            response,
+            "DescribeUserProfileResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return user_profile
+
+    @classmethod
+    def list(
+        cls,
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        domain_id_equals: Optional[str] = Unassigned(),
+        user_profile_name_contains: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> AsyncResourceIterator["UserProfile"]:
+        operation_input_args = {
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "DomainIdEquals": domain_id_equals,
+            "UserProfileNameContains": user_profile_name_contains,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListUserProfilesRequest"
+        )
+
+        return AsyncResourceIterator(
+            service_name="sagemaker",
+            session=session,
+            region=region,
+            list_method="list_user_profiles",
+            list_method_kwargs=operation_input_args,
+            summaries_key="UserProfiles",
+            summary_name="UserProfileDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+        )
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+        }
+        response = await async_cached_describe(
+            "UserProfile",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_user_profile",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeUserProfileResponse", fields=fields
+        )
+        return self
+
+    async def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Updating user_profile resource.")
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "UserSettings": self.user_settings,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateUserProfileRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_user_profile",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "UserProfile",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_user_profile",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "UserProfile",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+        }
+        waiter = Waiter(
+            resource_type="UserProfile",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed", "Update_Failed", "Delete_Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_user_profile",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeUserProfileResponse")
+        return self
+
+
+class Workforce(AsyncBase, resources.Workforce):
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "workforce": {
+                    "workforce_vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Workforce", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    async def create(
+        cls,
+        workforce_name: str,
+        cognito_config: Optional[CognitoConfig] = Unassigned(),
+        oidc_config: Optional[OidcConfig] = Unassigned(),
+        source_ip_config: Optional[SourceIpConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        workforce_vpc_config: Optional[WorkforceVpcConfigRequest] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating workforce resource.")
+        operation_input_args = {
+            "CognitoConfig": cognito_config,
+            "OidcConfig": oidc_config,
+            "SourceIpConfig": source_ip_config,
+            "WorkforceName": workforce_name,
+            "Tags": tags,
+            "WorkforceVpcConfig": workforce_vpc_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateWorkforceRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_workforce",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Workforce", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateWorkforceRequest"),
+                transform(response, "CreateWorkforceResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            workforce_name=workforce_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        workforce_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "WorkforceName": workforce_name,
+        }
+        response = await async_cached_describe(
+            "Workforce",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_workforce",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeWorkforceResponse")
+
+        # deserialize the response
+        workforce = cls._from_describe(
+            response,
+            "DescribeWorkforceResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return workforce
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "WorkforceName": self.workforce_name,
+        }
+        response = await async_cached_describe(
+            "Workforce",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_workforce",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeWorkforceResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        workforce_name: str,
+        source_ip_config: Optional[SourceIpConfig] = Unassigned(),
+        oidc_config: Optional[OidcConfig] = Unassigned(),
+        workforce_vpc_config: Optional[WorkforceVpcConfigRequest] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating workforce resource.")
+        operation_input_args = {
+            "WorkforceName": workforce_name,
+            "SourceIpConfig": source_ip_config,
+            "OidcConfig": oidc_config,
+            "WorkforceVpcConfig": workforce_vpc_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateWorkforceRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_workforce",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Workforce",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "WorkforceName": self.workforce_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_workforce",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Workforce",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    async def wait_for_status(
+        self,
+        status: Literal["Initializing", "Updating", "Deleting", "Failed", "Active"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "WorkforceName": self.workforce_name,
+        }
+        waiter = Waiter(
+            resource_type="Workforce",
+            status_path=("Workforce", "Status"),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = await waiter.async_wait(
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_workforce",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeWorkforceResponse")
+        return self
+
+
+class Workteam(AsyncBase, resources.Workteam):
+
+    @classmethod
+    async def create(
+        cls,
+        workteam_name: str,
+        member_definitions: List[MemberDefinition],
+        description: str,
+        workforce_name: Optional[str] = Unassigned(),
+        notification_configuration: Optional[NotificationConfiguration] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating workteam resource.")
+        operation_input_args = {
+            "WorkteamName": workteam_name,
+            "WorkforceName": workforce_name,
+            "MemberDefinitions": member_definitions,
+            "Description": description,
+            "NotificationConfiguration": notification_configuration,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateWorkteamRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "create_workteam",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Workteam", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes must be described with refresh()
+            return cls._from_create(
+                transform(operation_input_args, "CreateWorkteamRequest"),
+                transform(response, "CreateWorkteamResponse"),
+                session=session,
+                region=region,
+            )
+
+        return await cls.get(
+            workteam_name=workteam_name, session=session, region=region
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        workteam_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "WorkteamName": workteam_name,
+        }
+        response = await async_cached_describe(
+            "Workteam",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_workteam",
+                operation_input_args,
+                session=session,
+                region=region,
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeWorkteamResponse")
+
+        # deserialize the response
+        workteam = cls._from_describe(
+            response,
+            "DescribeWorkteamResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return workteam
+
+    async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "WorkteamName": self.workteam_name,
+        }
+        response = await async_cached_describe(
+            "Workteam",
+            operation_input_args,
+            lambda: get_async_transport().call(
+                "sagemaker",
+                "describe_workteam",
+                operation_input_args,
+                session=self._session,
+                region=self._region,
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeWorkteamResponse", fields=fields)
+        return self
+
+    async def update(
+        self,
+        workteam_name: str,
+        member_definitions: Optional[List[MemberDefinition]] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        notification_configuration: Optional[NotificationConfiguration] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Updating workteam resource.")
+        operation_input_args = {
+            "WorkteamName": workteam_name,
+            "MemberDefinitions": member_definitions,
+            "Description": description,
+            "NotificationConfiguration": notification_configuration,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateWorkteamRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # update the resource
+        response = await get_async_transport().call(
+            "sagemaker",
+            "update_workteam",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Workteam", operation_input_args, session=self._session, region=self._region
+        )
+        await self.refresh()
+
+        return self
+
+    async def delete(self) -> None:
+
+        operation_input_args = {
+            "WorkteamName": self.workteam_name,
+        }
+        await get_async_transport().call(
+            "sagemaker",
+            "delete_workteam",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        invalidate_describe_cache(
+            "Workteam", operation_input_args, session=self._session, region=self._region
+        )
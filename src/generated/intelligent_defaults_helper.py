@@ -17,7 +17,6 @@ import os
 from platformdirs import site_config_dir, user_config_dir
 import jsonschema
 from functools import lru_cache
-from .shapes import *
 from .config_schema import SAGEMAKER_PYTHON_SDK_CONFIG_SCHEMA
 from botocore.utils import merge_dicts
 import boto3
@@ -0,0 +1,386 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import importlib
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from threading import Thread
+from src.code_injection.warm_up import build_models
+from .. import shapes
+from ..shapes import Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Base(BaseModel):
+    # the validator is built on first instantiation, see warm_up
+    model_config = ConfigDict(defer_build=True)
+
+    _session: Optional[Session] = PrivateAttr(default=None)
+    _region: Optional[str] = PrivateAttr(default=None)
+    _hydrate_pending: bool = PrivateAttr(default=False)
+    _raw_members: Optional[Dict] = PrivateAttr(default=None)
+    _raw_shape: Optional[str] = PrivateAttr(default=None)
+
+    def __getattribute__(self, name: str):
+        value = super().__getattribute__(name)
+        if isinstance(value, Unassigned) and not name.startswith("_"):
+            value = self._hydrate_attribute(name, value)
+        return value
+
+    def _hydrate_attribute(self, name: str, value):
+        raw_members = self._raw_members
+        if raw_members and name in raw_members:
+            # convert a raw member of a lazily deserialized response
+            member_name, raw_value = raw_members.pop(name)
+            value = transform({member_name: raw_value}, self._raw_shape, trusted=True)[
+                name
+            ]
+            setattr(self, name, value)
+        elif self._hydrate_pending:
+            self._hydrate_pending = False
+            self._hydrate()
+            value = super().__getattribute__(name)
+        return value
+
+    @classmethod
+    def _from_describe(
+        cls,
+        response: Dict,
+        shape: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> "Base":
+        if fields:
+            # only the given fields are deserialized, the others are converted on first access
+            transformed_response, raw_members = transform_fields(
+                response, shape, fields, trusted=True
+            )
+        elif lazy:
+            # only the basic members are deserialized, the others are converted on first access
+            transformed_response, raw_members = transform_lazily(response, shape)
+        else:
+            # the response was parsed by botocore against the service model, skip validation
+            transformed_response, raw_members = (
+                transform(response, shape, trusted=True),
+                None,
+            )
+        resource = cls.model_construct(**transformed_response)
+        if raw_members is not None:
+            resource._set_raw_members(raw_members, shape)
+        resource._session = session
+        resource._region = region
+        return resource
+
+    def _update_from_describe(
+        self, response: Dict, shape: str, fields: Optional[List[str]] = None
+    ) -> None:
+        self._raw_members = None
+        self._hydrate_pending = False
+        if not fields:
+            transform(response, shape, self, trusted=True)
+            return
+        transformed_response, raw_members = transform_fields(
+            response, shape, fields, trusted=True
+        )
+        for attr, value in transformed_response.items():
+            setattr(self, attr, value)
+        self._set_raw_members(raw_members, shape)
+
+    def _set_raw_members(self, raw_members: Dict, shape: str) -> None:
+        self._raw_members = {
+            attr: raw_member
+            for attr, raw_member in raw_members.items()
+            if attr in type(self).model_fields
+        }
+        self._raw_shape = shape
+        # unset the attributes, required ones included, so they are converted on access
+        for attr in self._raw_members:
+            setattr(self, attr, Unassigned())
+
+    def _hydrate(self) -> None:
+        refresh = getattr(self, "refresh", None)
+        if refresh is None:
+            return
+        if inspect.isawaitable(refreshed := refresh()):
+            refreshed.close()
+            logger.warning(
+                "Attributes of asyncio resources are not described on access, await refresh() instead."
+            )
+
+    @classmethod
+    def _from_create(
+        cls,
+        create_input: Dict,
+        create_output: Dict,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> "Base":
+        attributes = {
+            attr: value
+            for attr, value in {**create_input, **create_output}.items()
+            if attr in cls.model_fields
+        }
+        try:
+            resource = cls(**attributes)
+        except ValidationError:
+            # A create member may not have the type of the described attribute, keep the identifiers
+            resource = cls(
+                **{
+                    attr: value
+                    for attr, value in attributes.items()
+                    if cls.model_fields[attr].is_required()
+                }
+            )
+        resource._session = session
+        resource._region = region
+        resource._hydrate_pending = True
+        return resource
+
+    @classmethod
+    def create_many(
+        cls,
+        inputs: List[Dict],
+        max_workers: int = 8,
+        max_attempts: int = 5,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> List[BatchResult]:
+        """Creates a resource per dict of create arguments, concurrently. Results keep the order of the inputs."""
+        # Create is not idempotent, it is only retried when throttled, and without the describe
+        results = run_batch(
+            lambda kwargs: cls.create(
+                **kwargs, session=session, region=region, skip_describe=True
+            ),
+            inputs,
+            max_workers=max_workers,
+            max_attempts=max_attempts,
+            retryable=is_throttling_error,
+        )
+        described = run_batch(
+            lambda resource: resource.refresh(),
+            [result.result for result in results if result.ok],
+            max_workers=max_workers,
+            max_attempts=max_attempts,
+        )
+        # a resource whose describe failed is described on first access
+        described = iter(described)
+        return [
+            (
+                result._replace(latency=result.latency + next(described).latency)
+                if result.ok
+                else result
+            )
+            for result in results
+        ]
+
+    @classmethod
+    def get_many(
+        cls,
+        identifiers: List,
+        max_workers: int = 8,
+        max_attempts: int = 5,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> List[BatchResult]:
+        """Gets a resource per name or dict of get arguments, concurrently. Results keep the order of the identifiers."""
+
+        def get(identifier):
+            if isinstance(identifier, Dict):
+                return cls.get(**identifier, session=session, region=region)
+            return cls.get(identifier, session=session, region=region)
+
+        return run_batch(
+            get, identifiers, max_workers=max_workers, max_attempts=max_attempts
+        )
+
+    @classmethod
+    def delete_many(
+        cls, resources: List["Base"], max_workers: int = 8, max_attempts: int = 5
+    ) -> List[BatchResult]:
+        """Deletes the resources concurrently. Results keep the order of the resources."""
+        return run_batch(
+            lambda resource: resource.delete(),
+            resources,
+            max_workers=max_workers,
+            max_attempts=max_attempts,
+        )
+
+    @staticmethod
+    def get_updated_kwargs_with_configured_attributes(
+        config_schema_for_resource: dict, resource_name: str, **kwargs
+    ):
+        try:
+            for configurable_attribute in config_schema_for_resource:
+                if kwargs.get(configurable_attribute) is None:
+                    resource_defaults = load_default_configs_for_resource_name(
+                        resource_name=resource_name
+                    )
+                    global_defaults = load_default_configs_for_resource_name(
+                        resource_name="GlobalDefaults"
+                    )
+                    formatted_attribute = pascal_to_snake(configurable_attribute)
+                    if config_value := get_config_value(
+                        formatted_attribute, resource_defaults, global_defaults
+                    ):
+                        kwargs[formatted_attribute] = config_value
+        except BaseException as e:
+            logger.info("Could not load Default Configs. Continuing.", exc_info=True)
+            # Continue with existing kwargs if no default configs found
+        return kwargs
+
+
+# The module of each class, imported on first access of one of its classes
+_RESOURCE_MODULES = {
+    "Action": "action",
+    "Algorithm": "algorithm",
+    "App": "app",
+    "AppImageConfig": "app_image_config",
+    "Artifact": "artifact",
+    "AutoMLJob": "auto_m_l_job",
+    "AutoMLJobV2": "auto_m_l_job_v2",
+    "Cluster": "cluster",
+    "CodeRepository": "code_repository",
+    "CompilationJob": "compilation_job",
+    "Context": "context",
+    "DataQualityJobDefinition": "data_quality_job_definition",
+    "DeviceFleet": "device_fleet",
+    "Domain": "domain",
+    "EdgeDeploymentPlan": "edge_deployment_plan",
+    "EdgePackagingJob": "edge_packaging_job",
+    "Endpoint": "endpoint",
+    "EndpointConfig": "endpoint_config",
+    "Experiment": "experiment",
+    "FeatureGroup": "feature_group",
+    "FlowDefinition": "flow_definition",
+    "Hub": "hub",
+    "HubContent": "hub_content",
+    "HumanTaskUi": "human_task_ui",
+    "HyperParameterTuningJob": "hyper_parameter_tuning_job",
+    "Image": "image",
+    "ImageVersion": "image_version",
+    "InferenceComponent": "inference_component",
+    "InferenceExperiment": "inference_experiment",
+    "InferenceRecommendationsJob": "inference_recommendations_job",
+    "LabelingJob": "labeling_job",
+    "Model": "model",
+    "ModelBiasJobDefinition": "model_bias_job_definition",
+    "ModelCard": "model_card",
+    "ModelCardExportJob": "model_card_export_job",
+    "ModelExplainabilityJobDefinition": "model_explainability_job_definition",
+    "ModelPackage": "model_package",
+    "ModelPackageGroup": "model_package_group",
+    "ModelQualityJobDefinition": "model_quality_job_definition",
+    "MonitoringSchedule": "monitoring_schedule",
+    "NotebookInstance": "notebook_instance",
+    "NotebookInstanceLifecycleConfig": "notebook_instance_lifecycle_config",
+    "Pipeline": "pipeline",
+    "PipelineExecution": "pipeline_execution",
+    "ProcessingJob": "processing_job",
+    "Project": "project",
+    "Space": "space",
+    "StudioLifecycleConfig": "studio_lifecycle_config",
+    "TrainingJob": "training_job",
+    "TransformJob": "transform_job",
+    "Trial": "trial",
+    "TrialComponent": "trial_component",
+    "UserProfile": "user_profile",
+    "Workforce": "workforce",
+    "Workteam": "workteam",
+}
+
+__all__ = ["Base", *_RESOURCE_MODULES]
+
+
+def __getattr__(name):
+    module_name = _RESOURCE_MODULES.get(name)
+    if module_name is None:
+        # shape classes used to be importable from the resources module
+        if name in shapes.__all__:
+            return getattr(shapes, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_RESOURCE_MODULES))
+
+
+def warm_up(
+    names: Optional[Iterable[str]] = None, background: bool = True
+) -> Optional[Thread]:
+    """
+    Imports classes and builds their deferred validators ahead of their first use.
+
+    Args:
+        names (Iterable[str]): The names of the classes, defaults to all the classes.
+        background (bool): Whether to build them on a daemon thread.
+
+    Returns:
+        Optional[Thread]: The started thread if background, None otherwise.
+    """
+    names = list(_RESOURCE_MODULES if names is None else names)
+    return build_models(lambda: (__getattr__(name) for name in names), background)
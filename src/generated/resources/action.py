@@ -0,0 +1,289 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import ActionSource, MetadataProperties, Tag, Unassigned, UserContext
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Action(Base):
+    action_name: str
+    action_arn: Optional[str] = Unassigned()
+    source: Optional[ActionSource] = Unassigned()
+    action_type: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    properties: Optional[Dict[str, str]] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    lineage_group_arn: Optional[str] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        action_name: str,
+        source: ActionSource,
+        action_type: str,
+        description: Optional[str] = Unassigned(),
+        status: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating action resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ActionName": action_name,
+            "Source": source,
+            "ActionType": action_type,
+            "Description": description,
+            "Status": status,
+            "Properties": properties,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateActionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_action(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Action", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateActionRequest"),
+                transform(response, "CreateActionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(action_name=action_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        action_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ActionName": action_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Action",
+            operation_input_args,
+            lambda: client.describe_action(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeActionResponse")
+
+        # deserialize the response
+        action = cls._from_describe(
+            response,
+            "DescribeActionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return action
+
+    @classmethod
+    def list(
+        cls,
+        source_uri: Optional[str] = Unassigned(),
+        action_type: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Action"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SourceUri": source_uri,
+            "ActionType": action_type,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListActionsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_actions",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ActionSummaries",
+            summary_name="ActionSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ActionName": self.action_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Action",
+            operation_input_args,
+            lambda: client.describe_action(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeActionResponse", fields=fields)
+        return self
+
+    def update(
+        self,
+        properties_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating action resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ActionName": self.action_name,
+            "Description": self.description,
+            "Status": self.status,
+            "Properties": self.properties,
+            "PropertiesToRemove": properties_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateActionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_action(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Action", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "ActionName": self.action_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_action(**operation_input_args)
+        invalidate_describe_cache(
+            "Action", operation_input_args, session=self._session, region=self._region
+        )
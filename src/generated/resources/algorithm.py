@@ -0,0 +1,313 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AlgorithmStatusDetails,
+    AlgorithmValidationSpecification,
+    InferenceSpecification,
+    Tag,
+    TrainingSpecification,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Algorithm(Base):
+    algorithm_name: str
+    algorithm_arn: Optional[str] = Unassigned()
+    algorithm_description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    training_specification: Optional[TrainingSpecification] = Unassigned()
+    inference_specification: Optional[InferenceSpecification] = Unassigned()
+    validation_specification: Optional[AlgorithmValidationSpecification] = Unassigned()
+    algorithm_status: Optional[str] = Unassigned()
+    algorithm_status_details: Optional[AlgorithmStatusDetails] = Unassigned()
+    product_id: Optional[str] = Unassigned()
+    certify_for_marketplace: Optional[bool] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "training_specification": {
+                    "additional_s3_data_source": {
+                        "s3_data_type": {"type": "string"},
+                        "s3_uri": {"type": "string"},
+                    }
+                },
+                "validation_specification": {"validation_role": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Algorithm", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        algorithm_name: str,
+        training_specification: TrainingSpecification,
+        algorithm_description: Optional[str] = Unassigned(),
+        inference_specification: Optional[InferenceSpecification] = Unassigned(),
+        validation_specification: Optional[
+            AlgorithmValidationSpecification
+        ] = Unassigned(),
+        certify_for_marketplace: Optional[bool] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating algorithm resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "AlgorithmName": algorithm_name,
+            "AlgorithmDescription": algorithm_description,
+            "TrainingSpecification": training_specification,
+            "InferenceSpecification": inference_specification,
+            "ValidationSpecification": validation_specification,
+            "CertifyForMarketplace": certify_for_marketplace,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAlgorithmInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_algorithm(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Algorithm", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateAlgorithmInput"),
+                transform(response, "CreateAlgorithmOutput"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(algorithm_name=algorithm_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        algorithm_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AlgorithmName": algorithm_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Algorithm",
+            operation_input_args,
+            lambda: client.describe_algorithm(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAlgorithmOutput")
+
+        # deserialize the response
+        algorithm = cls._from_describe(
+            response,
+            "DescribeAlgorithmOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return algorithm
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Algorithm"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListAlgorithmsInput"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_algorithms",
+            list_method_kwargs=operation_input_args,
+            summaries_key="AlgorithmSummaryList",
+            summary_name="AlgorithmSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Algorithm",
+            operation_input_args,
+            lambda: client.describe_algorithm(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeAlgorithmOutput", fields=fields)
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_algorithm(**operation_input_args)
+        invalidate_describe_cache(
+            "Algorithm",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="Algorithm",
+            status_path=("AlgorithmStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_algorithm(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAlgorithmOutput")
+        return self
@@ -0,0 +1,305 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import ResourceSpec, Tag, Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class App(Base):
+    domain_id: str
+    app_type: str
+    app_name: str
+    app_arn: Optional[str] = Unassigned()
+    user_profile_name: Optional[str] = Unassigned()
+    space_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    last_health_check_timestamp: Optional[datetime.datetime] = Unassigned()
+    last_user_activity_timestamp: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    resource_spec: Optional[ResourceSpec] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        domain_id: str,
+        app_type: str,
+        app_name: str,
+        user_profile_name: Optional[str] = Unassigned(),
+        space_name: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        resource_spec: Optional[ResourceSpec] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating app resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SpaceName": space_name,
+            "AppType": app_type,
+            "AppName": app_name,
+            "Tags": tags,
+            "ResourceSpec": resource_spec,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAppRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_app(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "App", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateAppRequest"),
+                transform(response, "CreateAppResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            domain_id=domain_id,
+            app_type=app_type,
+            app_name=app_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        domain_id: str,
+        app_type: str,
+        app_name: str,
+        user_profile_name: Optional[str] = Unassigned(),
+        space_name: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SpaceName": space_name,
+            "AppType": app_type,
+            "AppName": app_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "App",
+            operation_input_args,
+            lambda: client.describe_app(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAppResponse")
+
+        # deserialize the response
+        app = cls._from_describe(
+            response,
+            "DescribeAppResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return app
+
+    @classmethod
+    def list(
+        cls,
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        domain_id_equals: Optional[str] = Unassigned(),
+        user_profile_name_equals: Optional[str] = Unassigned(),
+        space_name_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["App"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "DomainIdEquals": domain_id_equals,
+            "UserProfileNameEquals": user_profile_name_equals,
+            "SpaceNameEquals": space_name_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListAppsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_apps",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Apps",
+            summary_name="AppDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "App",
+            operation_input_args,
+            lambda: client.describe_app(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeAppResponse", fields=fields)
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_app(**operation_input_args)
+        invalidate_describe_cache(
+            "App", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal["Deleted", "Deleting", "Failed", "InService", "Pending"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="App",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(lambda: client.describe_app(**operation_input_args))
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAppResponse")
+        return self
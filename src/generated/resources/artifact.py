@@ -0,0 +1,285 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import ArtifactSource, MetadataProperties, Tag, Unassigned, UserContext
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Artifact(Base):
+    artifact_arn: str
+    artifact_name: Optional[str] = Unassigned()
+    source: Optional[ArtifactSource] = Unassigned()
+    artifact_type: Optional[str] = Unassigned()
+    properties: Optional[Dict[str, str]] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    lineage_group_arn: Optional[str] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        source: ArtifactSource,
+        artifact_type: str,
+        artifact_name: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating artifact resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ArtifactName": artifact_name,
+            "Source": source,
+            "ArtifactType": artifact_type,
+            "Properties": properties,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateArtifactRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_artifact(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Artifact", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateArtifactRequest"),
+                transform(response, "CreateArtifactResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            artifact_arn=response["ArtifactArn"], session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        artifact_arn: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ArtifactArn": artifact_arn,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Artifact",
+            operation_input_args,
+            lambda: client.describe_artifact(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeArtifactResponse")
+
+        # deserialize the response
+        artifact = cls._from_describe(
+            response,
+            "DescribeArtifactResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return artifact
+
+    @classmethod
+    def list(
+        cls,
+        source_uri: Optional[str] = Unassigned(),
+        artifact_type: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Artifact"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SourceUri": source_uri,
+            "ArtifactType": artifact_type,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListArtifactsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_artifacts",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ArtifactSummaries",
+            summary_name="ArtifactSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Artifact",
+            operation_input_args,
+            lambda: client.describe_artifact(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeArtifactResponse", fields=fields)
+        return self
+
+    def update(
+        self,
+        properties_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating artifact resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+            "ArtifactName": self.artifact_name,
+            "Properties": self.properties,
+            "PropertiesToRemove": properties_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateArtifactRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_artifact(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Artifact", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+            "Source": self.source,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_artifact(**operation_input_args)
+        invalidate_describe_cache(
+            "Artifact", operation_input_args, session=self._session, region=self._region
+        )
@@ -0,0 +1,302 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AutoMLCandidate,
+    AutoMLDataSplitConfig,
+    AutoMLJobArtifacts,
+    AutoMLJobChannel,
+    AutoMLJobObjective,
+    AutoMLOutputDataConfig,
+    AutoMLPartialFailureReason,
+    AutoMLProblemTypeConfig,
+    AutoMLResolvedAttributes,
+    AutoMLSecurityConfig,
+    ModelDeployConfig,
+    ModelDeployResult,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AutoMLJobV2(Base):
+    auto_m_l_job_name: str
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    auto_m_l_job_input_data_config: Optional[List[AutoMLJobChannel]] = Unassigned()
+    output_data_config: Optional[AutoMLOutputDataConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    auto_m_l_job_objective: Optional[AutoMLJobObjective] = Unassigned()
+    auto_m_l_problem_type_config: Optional[AutoMLProblemTypeConfig] = Unassigned()
+    auto_m_l_problem_type_config_name: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    partial_failure_reasons: Optional[List[AutoMLPartialFailureReason]] = Unassigned()
+    best_candidate: Optional[AutoMLCandidate] = Unassigned()
+    auto_m_l_job_status: Optional[str] = Unassigned()
+    auto_m_l_job_secondary_status: Optional[str] = Unassigned()
+    auto_m_l_job_artifacts: Optional[AutoMLJobArtifacts] = Unassigned()
+    resolved_attributes: Optional[AutoMLResolvedAttributes] = Unassigned()
+    model_deploy_config: Optional[ModelDeployConfig] = Unassigned()
+    model_deploy_result: Optional[ModelDeployResult] = Unassigned()
+    data_split_config: Optional[AutoMLDataSplitConfig] = Unassigned()
+    security_config: Optional[AutoMLSecurityConfig] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="AutoMLJobV2",
+        status_path=("AutoMLJobStatus",),
+        terminal_states=("Completed", "Failed", "Stopped"),
+        describe_method="describe_auto_m_l_job_v2",
+        identifiers=(("AutoMLJobName", "auto_m_l_job_name"),),
+        describe_output_shape="DescribeAutoMLJobV2Response",
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "auto_m_l_problem_type_config": {
+                    "time_series_forecasting_job_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                    "tabular_job_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                },
+                "security_config": {
+                    "volume_kms_key_id": {"type": "string"},
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "AutoMLJobV2", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        auto_m_l_job_name: str,
+        auto_m_l_job_input_data_config: List[AutoMLJobChannel],
+        output_data_config: AutoMLOutputDataConfig,
+        auto_m_l_problem_type_config: AutoMLProblemTypeConfig,
+        role_arn: str,
+        tags: Optional[List[Tag]] = Unassigned(),
+        security_config: Optional[AutoMLSecurityConfig] = Unassigned(),
+        auto_m_l_job_objective: Optional[AutoMLJobObjective] = Unassigned(),
+        model_deploy_config: Optional[ModelDeployConfig] = Unassigned(),
+        data_split_config: Optional[AutoMLDataSplitConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating auto_m_l_job_v2 resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "AutoMLJobName": auto_m_l_job_name,
+            "AutoMLJobInputDataConfig": auto_m_l_job_input_data_config,
+            "OutputDataConfig": output_data_config,
+            "AutoMLProblemTypeConfig": auto_m_l_problem_type_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "SecurityConfig": security_config,
+            "AutoMLJobObjective": auto_m_l_job_objective,
+            "ModelDeployConfig": model_deploy_config,
+            "DataSplitConfig": data_split_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateAutoMLJobV2Request"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_auto_m_l_job_v2(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "AutoMLJobV2", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateAutoMLJobV2Request"),
+                transform(response, "CreateAutoMLJobV2Response"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            auto_m_l_job_name=auto_m_l_job_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        auto_m_l_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "AutoMLJobName": auto_m_l_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "AutoMLJobV2",
+            operation_input_args,
+            lambda: client.describe_auto_m_l_job_v2(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeAutoMLJobV2Response")
+
+        # deserialize the response
+        auto_m_l_job_v2 = cls._from_describe(
+            response,
+            "DescribeAutoMLJobV2Response",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return auto_m_l_job_v2
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "AutoMLJobV2",
+            operation_input_args,
+            lambda: client.describe_auto_m_l_job_v2(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeAutoMLJobV2Response", fields=fields
+        )
+        return self
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "AutoMLJobName": self.auto_m_l_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="AutoMLJobV2",
+            status_path=("AutoMLJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_auto_m_l_job_v2(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeAutoMLJobV2Response")
+        return self
@@ -0,0 +1,332 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    ClusterInstanceGroupDetails,
+    ClusterInstanceGroupSpecification,
+    Tag,
+    Unassigned,
+    VpcConfig,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Cluster(Base):
+    cluster_name: str
+    cluster_arn: Optional[str] = Unassigned()
+    cluster_status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    failure_message: Optional[str] = Unassigned()
+    instance_groups: Optional[List[ClusterInstanceGroupDetails]] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Cluster", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        cluster_name: str,
+        instance_groups: List[ClusterInstanceGroupSpecification],
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating cluster resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ClusterName": cluster_name,
+            "InstanceGroups": instance_groups,
+            "VpcConfig": vpc_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateClusterRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_cluster(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Cluster", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateClusterRequest"),
+                transform(response, "CreateClusterResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(cluster_name=cluster_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        cluster_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ClusterName": cluster_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Cluster",
+            operation_input_args,
+            lambda: client.describe_cluster(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeClusterResponse")
+
+        # deserialize the response
+        cluster = cls._from_describe(
+            response,
+            "DescribeClusterResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return cluster
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Cluster"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListClustersRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_clusters",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ClusterSummaries",
+            summary_name="ClusterSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Cluster",
+            operation_input_args,
+            lambda: client.describe_cluster(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeClusterResponse", fields=fields)
+        return self
+
+    def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Creating cluster resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "InstanceGroups": self.instance_groups,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateClusterRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_cluster(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Cluster", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_cluster(**operation_input_args)
+        invalidate_describe_cache(
+            "Cluster", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Creating",
+            "Deleting",
+            "Failed",
+            "InService",
+            "RollingBack",
+            "SystemUpdating",
+            "Updating",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="Cluster",
+            status_path=("ClusterStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(lambda: client.describe_cluster(**operation_input_args))
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeClusterResponse")
+        return self
@@ -0,0 +1,364 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    DerivedInformation,
+    InputConfig,
+    ModelArtifacts,
+    ModelDigests,
+    NeoVpcConfig,
+    OutputConfig,
+    StoppingCondition,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CompilationJob(Base):
+    compilation_job_name: str
+    compilation_job_arn: Optional[str] = Unassigned()
+    compilation_job_status: Optional[str] = Unassigned()
+    compilation_start_time: Optional[datetime.datetime] = Unassigned()
+    compilation_end_time: Optional[datetime.datetime] = Unassigned()
+    stopping_condition: Optional[StoppingCondition] = Unassigned()
+    inference_image: Optional[str] = Unassigned()
+    model_package_version_arn: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    model_artifacts: Optional[ModelArtifacts] = Unassigned()
+    model_digests: Optional[ModelDigests] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    input_config: Optional[InputConfig] = Unassigned()
+    output_config: Optional[OutputConfig] = Unassigned()
+    vpc_config: Optional[NeoVpcConfig] = Unassigned()
+    derived_information: Optional[DerivedInformation] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="CompilationJob",
+        status_path=("CompilationJobStatus",),
+        terminal_states=("COMPLETED", "FAILED", "STOPPED"),
+        describe_method="describe_compilation_job",
+        identifiers=(("CompilationJobName", "compilation_job_name"),),
+        describe_output_shape="DescribeCompilationJobResponse",
+        list_method="list_compilation_jobs",
+        summaries_key="CompilationJobSummaries",
+        summary_name="CompilationJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_artifacts": {"s3_model_artifacts": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "input_config": {"s3_uri": {"type": "string"}},
+                "output_config": {
+                    "s3_output_location": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "CompilationJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        compilation_job_name: str,
+        role_arn: str,
+        output_config: OutputConfig,
+        stopping_condition: StoppingCondition,
+        model_package_version_arn: Optional[str] = Unassigned(),
+        input_config: Optional[InputConfig] = Unassigned(),
+        vpc_config: Optional[NeoVpcConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating compilation_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CompilationJobName": compilation_job_name,
+            "RoleArn": role_arn,
+            "ModelPackageVersionArn": model_package_version_arn,
+            "InputConfig": input_config,
+            "OutputConfig": output_config,
+            "VpcConfig": vpc_config,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateCompilationJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_compilation_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "CompilationJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateCompilationJobRequest"),
+                transform(response, "CreateCompilationJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            compilation_job_name=compilation_job_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        compilation_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "CompilationJobName": compilation_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "CompilationJob",
+            operation_input_args,
+            lambda: client.describe_compilation_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeCompilationJobResponse")
+
+        # deserialize the response
+        compilation_job = cls._from_describe(
+            response,
+            "DescribeCompilationJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return compilation_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["CompilationJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListCompilationJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_compilation_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="CompilationJobSummaries",
+            summary_name="CompilationJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "CompilationJob",
+            operation_input_args,
+            lambda: client.describe_compilation_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeCompilationJobResponse", fields=fields
+        )
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_compilation_job(**operation_input_args)
+        invalidate_describe_cache(
+            "CompilationJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_compilation_job(**operation_input_args)
+        invalidate_describe_cache(
+            "CompilationJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED"]
+        operation_input_args = {
+            "CompilationJobName": self.compilation_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="CompilationJob",
+            status_path=("CompilationJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_compilation_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeCompilationJobResponse")
+        return self
@@ -0,0 +1,395 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    DefaultSpaceSettings,
+    DomainSettings,
+    DomainSettingsForUpdate,
+    Tag,
+    Unassigned,
+    UserSettings,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Domain(Base):
+    domain_id: str
+    domain_arn: Optional[str] = Unassigned()
+    domain_name: Optional[str] = Unassigned()
+    home_efs_file_system_id: Optional[str] = Unassigned()
+    single_sign_on_managed_application_instance_id: Optional[str] = Unassigned()
+    single_sign_on_application_arn: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    security_group_id_for_domain_boundary: Optional[str] = Unassigned()
+    auth_mode: Optional[str] = Unassigned()
+    default_user_settings: Optional[UserSettings] = Unassigned()
+    domain_settings: Optional[DomainSettings] = Unassigned()
+    app_network_access_type: Optional[str] = Unassigned()
+    home_efs_file_system_kms_key_id: Optional[str] = Unassigned()
+    subnet_ids: Optional[List[str]] = Unassigned()
+    url: Optional[str] = Unassigned()
+    vpc_id: Optional[str] = Unassigned()
+    kms_key_id: Optional[str] = Unassigned()
+    app_security_group_management: Optional[str] = Unassigned()
+    default_space_settings: Optional[DefaultSpaceSettings] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "security_group_id_for_domain_boundary": {"type": "string"},
+                "default_user_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                    "sharing_settings": {
+                        "s3_output_path": {"type": "string"},
+                        "s3_kms_key_id": {"type": "string"},
+                    },
+                    "canvas_app_settings": {
+                        "time_series_forecasting_settings": {
+                            "amazon_forecast_role_arn": {"type": "string"}
+                        },
+                        "model_register_settings": {
+                            "cross_account_model_register_role_arn": {"type": "string"}
+                        },
+                        "workspace_settings": {
+                            "s3_artifact_path": {"type": "string"},
+                            "s3_kms_key_id": {"type": "string"},
+                        },
+                        "generative_ai_settings": {
+                            "amazon_bedrock_role_arn": {"type": "string"}
+                        },
+                    },
+                },
+                "domain_settings": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "r_studio_server_pro_domain_settings": {
+                        "domain_execution_role_arn": {"type": "string"}
+                    },
+                    "execution_role_identity_config": {"type": "string"},
+                },
+                "home_efs_file_system_kms_key_id": {"type": "string"},
+                "subnet_ids": {"type": "array", "items": {"type": "string"}},
+                "kms_key_id": {"type": "string"},
+                "app_security_group_management": {"type": "string"},
+                "default_space_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Domain", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        domain_name: str,
+        auth_mode: str,
+        default_user_settings: UserSettings,
+        subnet_ids: List[str],
+        vpc_id: str,
+        domain_settings: Optional[DomainSettings] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        app_network_access_type: Optional[str] = Unassigned(),
+        home_efs_file_system_kms_key_id: Optional[str] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        app_security_group_management: Optional[str] = Unassigned(),
+        default_space_settings: Optional[DefaultSpaceSettings] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating domain resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "DomainName": domain_name,
+            "AuthMode": auth_mode,
+            "DefaultUserSettings": default_user_settings,
+            "DomainSettings": domain_settings,
+            "SubnetIds": subnet_ids,
+            "VpcId": vpc_id,
+            "Tags": tags,
+            "AppNetworkAccessType": app_network_access_type,
+            "HomeEfsFileSystemKmsKeyId": home_efs_file_system_kms_key_id,
+            "KmsKeyId": kms_key_id,
+            "AppSecurityGroupManagement": app_security_group_management,
+            "DefaultSpaceSettings": default_space_settings,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateDomainRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_domain(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Domain", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateDomainRequest"),
+                transform(response, "CreateDomainResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(domain_id=response["DomainId"], session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        domain_id: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Domain",
+            operation_input_args,
+            lambda: client.describe_domain(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeDomainResponse")
+
+        # deserialize the response
+        domain = cls._from_describe(
+            response,
+            "DescribeDomainResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return domain
+
+    @classmethod
+    def list(
+        cls,
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Domain"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {}
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListDomainsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_domains",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Domains",
+            summary_name="DomainDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Domain",
+            operation_input_args,
+            lambda: client.describe_domain(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeDomainResponse", fields=fields)
+        return self
+
+    def update(
+        self,
+        domain_settings_for_update: Optional[DomainSettingsForUpdate] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating domain resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "DefaultUserSettings": self.default_user_settings,
+            "DomainSettingsForUpdate": domain_settings_for_update,
+            "AppSecurityGroupManagement": self.app_security_group_management,
+            "DefaultSpaceSettings": self.default_space_settings,
+            "SubnetIds": self.subnet_ids,
+            "AppNetworkAccessType": self.app_network_access_type,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateDomainRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_domain(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Domain", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "RetentionPolicy": self.retention_policy,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_domain(**operation_input_args)
+        invalidate_describe_cache(
+            "Domain", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="Domain",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed", "Update_Failed", "Delete_Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(lambda: client.describe_domain(**operation_input_args))
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeDomainResponse")
+        return self
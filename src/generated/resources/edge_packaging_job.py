@@ -0,0 +1,330 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import EdgeOutputConfig, EdgePresetDeploymentOutput, Tag, Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class EdgePackagingJob(Base):
+    edge_packaging_job_name: str
+    edge_packaging_job_arn: Optional[str] = Unassigned()
+    compilation_job_name: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    model_version: Optional[str] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    output_config: Optional[EdgeOutputConfig] = Unassigned()
+    resource_key: Optional[str] = Unassigned()
+    edge_packaging_job_status: Optional[str] = Unassigned()
+    edge_packaging_job_status_message: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    model_artifact: Optional[str] = Unassigned()
+    model_signature: Optional[str] = Unassigned()
+    preset_deployment_output: Optional[EdgePresetDeploymentOutput] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="EdgePackagingJob",
+        status_path=("EdgePackagingJobStatus",),
+        terminal_states=("COMPLETED", "FAILED", "STOPPED"),
+        describe_method="describe_edge_packaging_job",
+        identifiers=(("EdgePackagingJobName", "edge_packaging_job_name"),),
+        describe_output_shape="DescribeEdgePackagingJobResponse",
+        list_method="list_edge_packaging_jobs",
+        summaries_key="EdgePackagingJobSummaries",
+        summary_name="EdgePackagingJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "output_config": {
+                    "s3_output_location": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "EdgePackagingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        edge_packaging_job_name: str,
+        compilation_job_name: str,
+        model_name: str,
+        model_version: str,
+        role_arn: str,
+        output_config: EdgeOutputConfig,
+        resource_key: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating edge_packaging_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "EdgePackagingJobName": edge_packaging_job_name,
+            "CompilationJobName": compilation_job_name,
+            "ModelName": model_name,
+            "ModelVersion": model_version,
+            "RoleArn": role_arn,
+            "OutputConfig": output_config,
+            "ResourceKey": resource_key,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEdgePackagingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_edge_packaging_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "EdgePackagingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateEdgePackagingJobRequest"),
+                {},
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            edge_packaging_job_name=edge_packaging_job_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        edge_packaging_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EdgePackagingJobName": edge_packaging_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "EdgePackagingJob",
+            operation_input_args,
+            lambda: client.describe_edge_packaging_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEdgePackagingJobResponse")
+
+        # deserialize the response
+        edge_packaging_job = cls._from_describe(
+            response,
+            "DescribeEdgePackagingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return edge_packaging_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["EdgePackagingJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "ModelNameContains": model_name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEdgePackagingJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_edge_packaging_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="EdgePackagingJobSummaries",
+            summary_name="EdgePackagingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "EdgePackagingJob",
+            operation_input_args,
+            lambda: client.describe_edge_packaging_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeEdgePackagingJobResponse", fields=fields
+        )
+        return self
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_edge_packaging_job(**operation_input_args)
+        invalidate_describe_cache(
+            "EdgePackagingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED"]
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="EdgePackagingJob",
+            status_path=("EdgePackagingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_edge_packaging_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeEdgePackagingJobResponse")
+        return self
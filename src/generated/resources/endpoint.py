@@ -0,0 +1,631 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AsyncInferenceConfig,
+    DataCaptureConfigSummary,
+    DeploymentConfig,
+    ExplainerConfig,
+    PendingDeploymentSummary,
+    ProductionVariantSummary,
+    Tag,
+    Unassigned,
+    VariantProperty,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Endpoint(Base):
+    endpoint_name: str
+    endpoint_arn: Optional[str] = Unassigned()
+    endpoint_config_name: Optional[str] = Unassigned()
+    production_variants: Optional[List[ProductionVariantSummary]] = Unassigned()
+    data_capture_config: Optional[DataCaptureConfigSummary] = Unassigned()
+    endpoint_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_deployment_config: Optional[DeploymentConfig] = Unassigned()
+    async_inference_config: Optional[AsyncInferenceConfig] = Unassigned()
+    pending_deployment_summary: Optional[PendingDeploymentSummary] = Unassigned()
+    explainer_config: Optional[ExplainerConfig] = Unassigned()
+    shadow_production_variants: Optional[List[ProductionVariantSummary]] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "async_inference_config": {
+                    "output_config": {
+                        "kms_key_id": {"type": "string"},
+                        "s3_output_path": {"type": "string"},
+                        "s3_failure_path": {"type": "string"},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Endpoint", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        endpoint_name: str,
+        endpoint_config_name: str,
+        deployment_config: Optional[DeploymentConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating endpoint resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "EndpointName": endpoint_name,
+            "EndpointConfigName": endpoint_config_name,
+            "DeploymentConfig": deployment_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEndpointInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_endpoint(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Endpoint", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateEndpointInput"),
+                transform(response, "CreateEndpointOutput"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(endpoint_name=endpoint_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        endpoint_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EndpointName": endpoint_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Endpoint",
+            operation_input_args,
+            lambda: client.describe_endpoint(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEndpointOutput")
+
+        # deserialize the response
+        endpoint = cls._from_describe(
+            response,
+            "DescribeEndpointOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return endpoint
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Endpoint"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEndpointsInput"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_endpoints",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Endpoints",
+            summary_name="EndpointSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Endpoint",
+            operation_input_args,
+            lambda: client.describe_endpoint(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeEndpointOutput", fields=fields)
+        return self
+
+    def update(
+        self,
+        retain_all_variant_properties: Optional[bool] = Unassigned(),
+        exclude_retained_variant_properties: Optional[
+            List[VariantProperty]
+        ] = Unassigned(),
+        deployment_config: Optional[DeploymentConfig] = Unassigned(),
+        retain_deployment_config: Optional[bool] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating endpoint resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "EndpointConfigName": self.endpoint_config_name,
+            "RetainAllVariantProperties": retain_all_variant_properties,
+            "ExcludeRetainedVariantProperties": exclude_retained_variant_properties,
+            "DeploymentConfig": deployment_config,
+            "RetainDeploymentConfig": retain_deployment_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateEndpointInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_endpoint(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Endpoint", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_endpoint(**operation_input_args)
+        invalidate_describe_cache(
+            "Endpoint", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "OutOfService",
+            "Creating",
+            "Updating",
+            "SystemUpdating",
+            "RollingBack",
+            "InService",
+            "Deleting",
+            "Failed",
+            "UpdateRollbackFailed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="Endpoint",
+            status_path=("EndpointStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=30,
+            timeout=timeout,
+        )
+        response = waiter.wait(lambda: client.describe_endpoint(**operation_input_args))
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeEndpointOutput")
+        return self
+
+    def invoke(
+        self,
+        body: Any,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_model: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        enable_explanations: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug(f"Invoking endpoint resource.")
+        client = SageMakerRuntimeClient(
+            session=self._session,
+            region_name=self._region,
+            service_name="sagemaker-runtime",
+        ).client
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "Body": body,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetModel": target_model,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "EnableExplanations": enable_explanations,
+            "InferenceComponentName": inference_component_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.invoke_endpoint(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return response
+
+    def invoke_many(
+        self,
+        bodies: Iterable[Any],
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_model: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        enable_explanations: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+        concurrency: int = 8,
+        ordered: bool = True,
+        max_attempts: int = 5,
+    ) -> Iterator[BatchResult]:
+        """Invokes the endpoint once per body, concurrently. Results are yielded in the order of the bodies, or as completed if not ordered."""
+        logger.debug(
+            f"Invoking endpoint resource with {concurrency} concurrent requests."
+        )
+        # one client for all the requests, with a connection per concurrent request
+        client = SageMakerRuntimeClient(
+            session=self._session,
+            region_name=self._region,
+            service_name="sagemaker-runtime",
+            config=Config(max_pool_connections=concurrency),
+        ).client
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetModel": target_model,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "EnableExplanations": enable_explanations,
+            "InferenceComponentName": inference_component_name,
+        }
+        # serialize the arguments shared by all the requests once
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointInput"
+        )
+
+        return stream_batch(
+            lambda body: client.invoke_endpoint(**operation_input_args, Body=body),
+            bodies,
+            max_workers=concurrency,
+            max_attempts=max_attempts,
+            ordered=ordered,
+        )
+
+    def micro_batcher(
+        self,
+        custom_attributes: Optional[str] = Unassigned(),
+        target_model: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        enable_explanations: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+        codec: Optional[PayloadCodec] = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        max_concurrency: int = 4,
+    ) -> MicroBatcher:
+        """Returns a MicroBatcher packing the records of concurrent callers into batched invocations of the endpoint, JSON lines by default."""
+        codec = codec or JsonLinesCodec()
+        content_type, accept = codec.content_type, codec.accept
+        client = SageMakerRuntimeClient(
+            session=self._session,
+            region_name=self._region,
+            service_name="sagemaker-runtime",
+            config=Config(max_pool_connections=max_concurrency),
+        ).client
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetModel": target_model,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "EnableExplanations": enable_explanations,
+            "InferenceComponentName": inference_component_name,
+        }
+        # serialize the arguments shared by all the batches once
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointInput"
+        )
+
+        return MicroBatcher(
+            lambda body: client.invoke_endpoint(**operation_input_args, Body=body)[
+                "Body"
+            ].read(),
+            codec,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+            max_concurrency=max_concurrency,
+        )
+
+    def invoke_async(
+        self,
+        input_location: str,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        request_t_t_l_seconds: Optional[int] = Unassigned(),
+        invocation_timeout_seconds: Optional[int] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug(f"Invoking endpoint resource Async.")
+        client = SageMakerRuntimeClient(
+            session=self._session,
+            region_name=self._region,
+            service_name="sagemaker-runtime",
+        ).client
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "InferenceId": inference_id,
+            "InputLocation": input_location,
+            "RequestTTLSeconds": request_t_t_l_seconds,
+            "InvocationTimeoutSeconds": invocation_timeout_seconds,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointAsyncInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.invoke_endpoint_async(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return response
+
+    def invoke_with_response_stream(
+        self,
+        body: Any,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug(f"Invoking endpoint resource with Response Stream.")
+        client = SageMakerRuntimeClient(
+            session=self._session,
+            region_name=self._region,
+            service_name="sagemaker-runtime",
+        ).client
+
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "Body": body,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "InferenceComponentName": inference_component_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointWithResponseStreamInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.invoke_endpoint_with_response_stream(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return response
+
+    def invoke_stream(
+        self,
+        body: Any,
+        content_type: Optional[str] = Unassigned(),
+        accept: Optional[str] = Unassigned(),
+        custom_attributes: Optional[str] = Unassigned(),
+        target_variant: Optional[str] = Unassigned(),
+        target_container_hostname: Optional[str] = Unassigned(),
+        inference_id: Optional[str] = Unassigned(),
+        inference_component_name: Optional[str] = Unassigned(),
+        framing: Union[str, StreamFraming] = "jsonlines",
+    ) -> ResponseStreamReader:
+        """Invokes the endpoint with a response stream, returning a reader yielding the decoded records as soon as they complete, see ResponseStreamReader."""
+        client = SageMakerRuntimeClient(
+            session=self._session,
+            region_name=self._region,
+            service_name="sagemaker-runtime",
+        ).client
+        operation_input_args = {
+            "EndpointName": self.endpoint_name,
+            "Body": body,
+            "ContentType": content_type,
+            "Accept": accept,
+            "CustomAttributes": custom_attributes,
+            "TargetVariant": target_variant,
+            "TargetContainerHostname": target_container_hostname,
+            "InferenceId": inference_id,
+            "InferenceComponentName": inference_component_name,
+        }
+        operation_input_args = serialize_request(
+            operation_input_args, "InvokeEndpointWithResponseStreamInput"
+        )
+
+        started_at = time.perf_counter()
+        response = client.invoke_endpoint_with_response_stream(**operation_input_args)
+        return ResponseStreamReader(response["Body"], framing, started_at=started_at)
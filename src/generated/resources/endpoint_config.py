@@ -0,0 +1,308 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AsyncInferenceConfig,
+    DataCaptureConfig,
+    ExplainerConfig,
+    ProductionVariant,
+    Tag,
+    Unassigned,
+    VpcConfig,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class EndpointConfig(Base):
+    endpoint_config_name: str
+    endpoint_config_arn: Optional[str] = Unassigned()
+    production_variants: Optional[List[ProductionVariant]] = Unassigned()
+    data_capture_config: Optional[DataCaptureConfig] = Unassigned()
+    kms_key_id: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    async_inference_config: Optional[AsyncInferenceConfig] = Unassigned()
+    explainer_config: Optional[ExplainerConfig] = Unassigned()
+    shadow_production_variants: Optional[List[ProductionVariant]] = Unassigned()
+    execution_role_arn: Optional[str] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "kms_key_id": {"type": "string"},
+                "async_inference_config": {
+                    "output_config": {
+                        "kms_key_id": {"type": "string"},
+                        "s3_output_path": {"type": "string"},
+                        "s3_failure_path": {"type": "string"},
+                    }
+                },
+                "execution_role_arn": {"type": "string"},
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "EndpointConfig", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        endpoint_config_name: str,
+        production_variants: List[ProductionVariant],
+        data_capture_config: Optional[DataCaptureConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        async_inference_config: Optional[AsyncInferenceConfig] = Unassigned(),
+        explainer_config: Optional[ExplainerConfig] = Unassigned(),
+        shadow_production_variants: Optional[List[ProductionVariant]] = Unassigned(),
+        execution_role_arn: Optional[str] = Unassigned(),
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        enable_network_isolation: Optional[bool] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating endpoint_config resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "EndpointConfigName": endpoint_config_name,
+            "ProductionVariants": production_variants,
+            "DataCaptureConfig": data_capture_config,
+            "Tags": tags,
+            "KmsKeyId": kms_key_id,
+            "AsyncInferenceConfig": async_inference_config,
+            "ExplainerConfig": explainer_config,
+            "ShadowProductionVariants": shadow_production_variants,
+            "ExecutionRoleArn": execution_role_arn,
+            "VpcConfig": vpc_config,
+            "EnableNetworkIsolation": enable_network_isolation,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateEndpointConfigInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_endpoint_config(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "EndpointConfig", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateEndpointConfigInput"),
+                transform(response, "CreateEndpointConfigOutput"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            endpoint_config_name=endpoint_config_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        endpoint_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "EndpointConfigName": endpoint_config_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "EndpointConfig",
+            operation_input_args,
+            lambda: client.describe_endpoint_config(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeEndpointConfigOutput")
+
+        # deserialize the response
+        endpoint_config = cls._from_describe(
+            response,
+            "DescribeEndpointConfigOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return endpoint_config
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["EndpointConfig"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListEndpointConfigsInput"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_endpoint_configs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="EndpointConfigs",
+            summary_name="EndpointConfigSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "EndpointConfigName": self.endpoint_config_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "EndpointConfig",
+            operation_input_args,
+            lambda: client.describe_endpoint_config(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeEndpointConfigOutput", fields=fields
+        )
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "EndpointConfigName": self.endpoint_config_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_endpoint_config(**operation_input_args)
+        invalidate_describe_cache(
+            "EndpointConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
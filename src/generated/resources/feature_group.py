@@ -0,0 +1,380 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    FeatureDefinition,
+    LastUpdateStatus,
+    OfflineStoreConfig,
+    OfflineStoreStatus,
+    OnlineStoreConfig,
+    Tag,
+    ThroughputConfig,
+    ThroughputConfigDescription,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FeatureGroup(Base):
+    feature_group_name: str
+    feature_group_arn: Optional[str] = Unassigned()
+    record_identifier_feature_name: Optional[str] = Unassigned()
+    event_time_feature_name: Optional[str] = Unassigned()
+    feature_definitions: Optional[List[FeatureDefinition]] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    online_store_config: Optional[OnlineStoreConfig] = Unassigned()
+    offline_store_config: Optional[OfflineStoreConfig] = Unassigned()
+    throughput_config: Optional[ThroughputConfigDescription] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    feature_group_status: Optional[str] = Unassigned()
+    offline_store_status: Optional[OfflineStoreStatus] = Unassigned()
+    last_update_status: Optional[LastUpdateStatus] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    next_token: Optional[str] = Unassigned()
+    online_store_total_size_bytes: Optional[int] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "online_store_config": {
+                    "security_config": {"kms_key_id": {"type": "string"}}
+                },
+                "offline_store_config": {
+                    "s3_storage_config": {
+                        "s3_uri": {"type": "string"},
+                        "kms_key_id": {"type": "string"},
+                        "resolved_output_s3_uri": {"type": "string"},
+                    }
+                },
+                "role_arn": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "FeatureGroup", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        feature_group_name: str,
+        record_identifier_feature_name: str,
+        event_time_feature_name: str,
+        feature_definitions: List[FeatureDefinition],
+        online_store_config: Optional[OnlineStoreConfig] = Unassigned(),
+        offline_store_config: Optional[OfflineStoreConfig] = Unassigned(),
+        throughput_config: Optional[ThroughputConfig] = Unassigned(),
+        role_arn: Optional[str] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating feature_group resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "FeatureGroupName": feature_group_name,
+            "RecordIdentifierFeatureName": record_identifier_feature_name,
+            "EventTimeFeatureName": event_time_feature_name,
+            "FeatureDefinitions": feature_definitions,
+            "OnlineStoreConfig": online_store_config,
+            "OfflineStoreConfig": offline_store_config,
+            "ThroughputConfig": throughput_config,
+            "RoleArn": role_arn,
+            "Description": description,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateFeatureGroupRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_feature_group(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "FeatureGroup", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateFeatureGroupRequest"),
+                transform(response, "CreateFeatureGroupResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            feature_group_name=feature_group_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        feature_group_name: str,
+        next_token: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "FeatureGroupName": feature_group_name,
+            "NextToken": next_token,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "FeatureGroup",
+            operation_input_args,
+            lambda: client.describe_feature_group(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeFeatureGroupResponse")
+
+        # deserialize the response
+        feature_group = cls._from_describe(
+            response,
+            "DescribeFeatureGroupResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return feature_group
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        feature_group_status_equals: Optional[str] = Unassigned(),
+        offline_store_status_equals: Optional[str] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["FeatureGroup"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "NameContains": name_contains,
+            "FeatureGroupStatusEquals": feature_group_status_equals,
+            "OfflineStoreStatusEquals": offline_store_status_equals,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListFeatureGroupsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_feature_groups",
+            list_method_kwargs=operation_input_args,
+            summaries_key="FeatureGroupSummaries",
+            summary_name="FeatureGroupSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "NextToken": self.next_token,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "FeatureGroup",
+            operation_input_args,
+            lambda: client.describe_feature_group(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeFeatureGroupResponse", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+        feature_additions: Optional[List[FeatureDefinition]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating feature_group resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "FeatureAdditions": feature_additions,
+            "OnlineStoreConfig": self.online_store_config,
+            "ThroughputConfig": self.throughput_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateFeatureGroupRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_feature_group(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "FeatureGroup",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_feature_group(**operation_input_args)
+        invalidate_describe_cache(
+            "FeatureGroup",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Creating", "Created", "CreateFailed", "Deleting", "DeleteFailed"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "NextToken": self.next_token,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="FeatureGroup",
+            status_path=("FeatureGroupStatus",),
+            success_states=[status],
+            failure_states=["CreateFailed", "DeleteFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_feature_group(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeFeatureGroupResponse")
+        return self
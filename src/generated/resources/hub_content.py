@@ -0,0 +1,318 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import HubContentDependency, Tag, Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class HubContent(Base):
+    hub_name: str
+    hub_content_type: str
+    hub_content_name: str
+    hub_content_arn: Optional[str] = Unassigned()
+    hub_content_version: Optional[str] = Unassigned()
+    document_schema_version: Optional[str] = Unassigned()
+    hub_arn: Optional[str] = Unassigned()
+    hub_content_display_name: Optional[str] = Unassigned()
+    hub_content_description: Optional[str] = Unassigned()
+    hub_content_markdown: Optional[str] = Unassigned()
+    hub_content_document: Optional[str] = Unassigned()
+    hub_content_search_keywords: Optional[List[str]] = Unassigned()
+    hub_content_dependencies: Optional[List[HubContentDependency]] = Unassigned()
+    hub_content_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+
+    @classmethod
+    def get(
+        cls,
+        hub_name: str,
+        hub_content_type: str,
+        hub_content_name: str,
+        hub_content_version: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "HubContent",
+            operation_input_args,
+            lambda: client.describe_hub_content(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeHubContentResponse")
+
+        # deserialize the response
+        hub_content = cls._from_describe(
+            response,
+            "DescribeHubContentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return hub_content
+
+    @classmethod
+    def list(
+        cls,
+        hub_name: str,
+        hub_content_type: str,
+        name_contains: Optional[str] = Unassigned(),
+        max_schema_version: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["HubContent"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "NameContains": name_contains,
+            "MaxSchemaVersion": max_schema_version,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListHubContentsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_hub_contents",
+            list_method_kwargs=operation_input_args,
+            summaries_key="HubContentSummaries",
+            summary_name="HubContentInfo",
+            resource_cls=cls,
+            resource_kwargs={"hub_name": hub_name},
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "HubContent",
+            operation_input_args,
+            lambda: client.describe_hub_content(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeHubContentResponse", fields=fields
+        )
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_hub_content(**operation_input_args)
+        invalidate_describe_cache(
+            "HubContent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Available", "Importing", "Deleting", "ImportFailed", "DeleteFailed"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="HubContent",
+            status_path=("HubContentStatus",),
+            success_states=[status],
+            failure_states=["ImportFailed", "DeleteFailed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_hub_content(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeHubContentResponse")
+        return self
+
+    @classmethod
+    def load(
+        cls,
+        hub_content_name: str,
+        hub_content_type: str,
+        document_schema_version: str,
+        hub_name: str,
+        hub_content_document: str,
+        hub_content_version: Optional[str] = Unassigned(),
+        hub_content_display_name: Optional[str] = Unassigned(),
+        hub_content_description: Optional[str] = Unassigned(),
+        hub_content_markdown: Optional[str] = Unassigned(),
+        hub_content_search_keywords: Optional[List[str]] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[object]:
+        logger.debug(f"Importing hub_content resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+            "HubContentType": hub_content_type,
+            "DocumentSchemaVersion": document_schema_version,
+            "HubName": hub_name,
+            "HubContentDisplayName": hub_content_display_name,
+            "HubContentDescription": hub_content_description,
+            "HubContentMarkdown": hub_content_markdown,
+            "HubContentDocument": hub_content_document,
+            "HubContentSearchKeywords": hub_content_search_keywords,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ImportHubContentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # import the resource
+        response = client.import_hub_content(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "HubContent", operation_input_args, session=session, region=region
+        )
+
+        return cls.get(
+            hub_name=hub_name,
+            hub_content_type=hub_content_type,
+            hub_content_name=hub_content_name,
+            session=session,
+            region=region,
+        )
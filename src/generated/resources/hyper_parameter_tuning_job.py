@@ -0,0 +1,392 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    Autotune,
+    HyperParameterTrainingJobDefinition,
+    HyperParameterTrainingJobSummary,
+    HyperParameterTuningJobCompletionDetails,
+    HyperParameterTuningJobConfig,
+    HyperParameterTuningJobConsumedResources,
+    HyperParameterTuningJobWarmStartConfig,
+    ObjectiveStatusCounters,
+    Tag,
+    TrainingJobStatusCounters,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class HyperParameterTuningJob(Base):
+    hyper_parameter_tuning_job_name: str
+    hyper_parameter_tuning_job_arn: Optional[str] = Unassigned()
+    hyper_parameter_tuning_job_config: Optional[HyperParameterTuningJobConfig] = (
+        Unassigned()
+    )
+    training_job_definition: Optional[HyperParameterTrainingJobDefinition] = (
+        Unassigned()
+    )
+    training_job_definitions: Optional[List[HyperParameterTrainingJobDefinition]] = (
+        Unassigned()
+    )
+    hyper_parameter_tuning_job_status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    hyper_parameter_tuning_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    training_job_status_counters: Optional[TrainingJobStatusCounters] = Unassigned()
+    objective_status_counters: Optional[ObjectiveStatusCounters] = Unassigned()
+    best_training_job: Optional[HyperParameterTrainingJobSummary] = Unassigned()
+    overall_best_training_job: Optional[HyperParameterTrainingJobSummary] = Unassigned()
+    warm_start_config: Optional[HyperParameterTuningJobWarmStartConfig] = Unassigned()
+    autotune: Optional[Autotune] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    tuning_job_completion_details: Optional[
+        HyperParameterTuningJobCompletionDetails
+    ] = Unassigned()
+    consumed_resources: Optional[HyperParameterTuningJobConsumedResources] = (
+        Unassigned()
+    )
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="HyperParameterTuningJob",
+        status_path=("HyperParameterTuningJobStatus",),
+        terminal_states=("Completed", "Failed", "Stopped", "DeleteFailed"),
+        describe_method="describe_hyper_parameter_tuning_job",
+        identifiers=(
+            ("HyperParameterTuningJobName", "hyper_parameter_tuning_job_name"),
+        ),
+        describe_output_shape="DescribeHyperParameterTuningJobResponse",
+        list_method="list_hyper_parameter_tuning_jobs",
+        summaries_key="HyperParameterTuningJobSummaries",
+        summary_name="HyperParameterTuningJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "training_job_definition": {
+                    "role_arn": {"type": "string"},
+                    "output_data_config": {
+                        "s3_output_path": {"type": "string"},
+                        "kms_key_id": {"type": "string"},
+                    },
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "resource_config": {"volume_kms_key_id": {"type": "string"}},
+                    "hyper_parameter_tuning_resource_config": {
+                        "volume_kms_key_id": {"type": "string"}
+                    },
+                    "checkpoint_config": {"s3_uri": {"type": "string"}},
+                }
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "HyperParameterTuningJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        hyper_parameter_tuning_job_name: str,
+        hyper_parameter_tuning_job_config: HyperParameterTuningJobConfig,
+        training_job_definition: Optional[
+            HyperParameterTrainingJobDefinition
+        ] = Unassigned(),
+        training_job_definitions: Optional[
+            List[HyperParameterTrainingJobDefinition]
+        ] = Unassigned(),
+        warm_start_config: Optional[
+            HyperParameterTuningJobWarmStartConfig
+        ] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        autotune: Optional[Autotune] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating hyper_parameter_tuning_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": hyper_parameter_tuning_job_name,
+            "HyperParameterTuningJobConfig": hyper_parameter_tuning_job_config,
+            "TrainingJobDefinition": training_job_definition,
+            "TrainingJobDefinitions": training_job_definitions,
+            "WarmStartConfig": warm_start_config,
+            "Tags": tags,
+            "Autotune": autotune,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateHyperParameterTuningJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_hyper_parameter_tuning_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateHyperParameterTuningJobRequest"),
+                transform(response, "CreateHyperParameterTuningJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            hyper_parameter_tuning_job_name=hyper_parameter_tuning_job_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        hyper_parameter_tuning_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "HyperParameterTuningJobName": hyper_parameter_tuning_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            lambda: client.describe_hyper_parameter_tuning_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeHyperParameterTuningJobResponse")
+
+        # deserialize the response
+        hyper_parameter_tuning_job = cls._from_describe(
+            response,
+            "DescribeHyperParameterTuningJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return hyper_parameter_tuning_job
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["HyperParameterTuningJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListHyperParameterTuningJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_hyper_parameter_tuning_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="HyperParameterTuningJobSummaries",
+            summary_name="HyperParameterTuningJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            lambda: client.describe_hyper_parameter_tuning_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeHyperParameterTuningJobResponse", fields=fields
+        )
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_hyper_parameter_tuning_job(**operation_input_args)
+        invalidate_describe_cache(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_hyper_parameter_tuning_job(**operation_input_args)
+        invalidate_describe_cache(
+            "HyperParameterTuningJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped", "DeleteFailed"]
+        operation_input_args = {
+            "HyperParameterTuningJobName": self.hyper_parameter_tuning_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="HyperParameterTuningJob",
+            status_path=("HyperParameterTuningJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_hyper_parameter_tuning_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeHyperParameterTuningJobResponse")
+        return self
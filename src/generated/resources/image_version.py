@@ -0,0 +1,361 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ImageVersion(Base):
+    base_image: Optional[str] = Unassigned()
+    container_image: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    image_arn: Optional[str] = Unassigned()
+    image_version_arn: Optional[str] = Unassigned()
+    image_version_status: Optional[str] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    version: Optional[int] = Unassigned()
+    vendor_guidance: Optional[str] = Unassigned()
+    job_type: Optional[str] = Unassigned()
+    m_l_framework: Optional[str] = Unassigned()
+    programming_lang: Optional[str] = Unassigned()
+    processor: Optional[str] = Unassigned()
+    horovod: Optional[bool] = Unassigned()
+    release_notes: Optional[str] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        base_image: str,
+        client_token: str,
+        image_name: str,
+        aliases: Optional[List[str]] = Unassigned(),
+        vendor_guidance: Optional[str] = Unassigned(),
+        job_type: Optional[str] = Unassigned(),
+        m_l_framework: Optional[str] = Unassigned(),
+        programming_lang: Optional[str] = Unassigned(),
+        processor: Optional[str] = Unassigned(),
+        horovod: Optional[bool] = Unassigned(),
+        release_notes: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating image_version resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "BaseImage": base_image,
+            "ClientToken": client_token,
+            "ImageName": image_name,
+            "Aliases": aliases,
+            "VendorGuidance": vendor_guidance,
+            "JobType": job_type,
+            "MLFramework": m_l_framework,
+            "ProgrammingLang": programming_lang,
+            "Processor": processor,
+            "Horovod": horovod,
+            "ReleaseNotes": release_notes,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateImageVersionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_image_version(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ImageVersion", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateImageVersionRequest"),
+                transform(response, "CreateImageVersionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(image_name=image_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        image_name: str,
+        version: Optional[int] = Unassigned(),
+        alias: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ImageName": image_name,
+            "Version": version,
+            "Alias": alias,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ImageVersion",
+            operation_input_args,
+            lambda: client.describe_image_version(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeImageVersionResponse")
+
+        # deserialize the response
+        image_version = cls._from_describe(
+            response,
+            "DescribeImageVersionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return image_version
+
+    @classmethod
+    def list(
+        cls,
+        image_name: str,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ImageVersion"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "ImageName": image_name,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListImageVersionsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_image_versions",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ImageVersions",
+            summary_name="ImageVersion",
+            resource_cls=cls,
+            resource_kwargs={"image_name": image_name},
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ImageName": self.image_name,
+            "Version": self.version,
+            "Alias": self.alias,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ImageVersion",
+            operation_input_args,
+            lambda: client.describe_image_version(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeImageVersionResponse", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+        image_name: str,
+        alias: Optional[str] = Unassigned(),
+        aliases_to_add: Optional[List[str]] = Unassigned(),
+        aliases_to_delete: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating image_version resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ImageName": image_name,
+            "Alias": alias,
+            "Version": self.version,
+            "AliasesToAdd": aliases_to_add,
+            "AliasesToDelete": aliases_to_delete,
+            "VendorGuidance": self.vendor_guidance,
+            "JobType": self.job_type,
+            "MLFramework": self.m_l_framework,
+            "ProgrammingLang": self.programming_lang,
+            "Processor": self.processor,
+            "Horovod": self.horovod,
+            "ReleaseNotes": self.release_notes,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateImageVersionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_image_version(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ImageVersion",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "ImageName": self.image_name,
+            "Version": self.version,
+            "Alias": self.alias,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_image_version(**operation_input_args)
+        invalidate_describe_cache(
+            "ImageVersion",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "CREATING", "CREATED", "CREATE_FAILED", "DELETING", "DELETE_FAILED"
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ImageName": self.image_name,
+            "Version": self.version,
+            "Alias": self.alias,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="ImageVersion",
+            status_path=("ImageVersionStatus",),
+            success_states=[status],
+            failure_states=["CREATE_FAILED", "DELETE_FAILED"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_image_version(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeImageVersionResponse")
+        return self
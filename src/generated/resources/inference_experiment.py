@@ -0,0 +1,399 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    EndpointMetadata,
+    InferenceExperimentDataStorageConfig,
+    InferenceExperimentSchedule,
+    ModelVariantConfig,
+    ModelVariantConfigSummary,
+    ShadowModeConfig,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class InferenceExperiment(Base):
+    name: str
+    arn: Optional[str] = Unassigned()
+    type: Optional[str] = Unassigned()
+    schedule: Optional[InferenceExperimentSchedule] = Unassigned()
+    status: Optional[str] = Unassigned()
+    status_reason: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    completion_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    endpoint_metadata: Optional[EndpointMetadata] = Unassigned()
+    model_variants: Optional[List[ModelVariantConfigSummary]] = Unassigned()
+    data_storage_config: Optional[InferenceExperimentDataStorageConfig] = Unassigned()
+    shadow_mode_config: Optional[ShadowModeConfig] = Unassigned()
+    kms_key: Optional[str] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "data_storage_config": {"kms_key": {"type": "string"}},
+                "kms_key": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "InferenceExperiment", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        name: str,
+        type: str,
+        role_arn: str,
+        endpoint_name: str,
+        model_variants: List[ModelVariantConfig],
+        shadow_mode_config: ShadowModeConfig,
+        schedule: Optional[InferenceExperimentSchedule] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+        data_storage_config: Optional[
+            InferenceExperimentDataStorageConfig
+        ] = Unassigned(),
+        kms_key: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating inference_experiment resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "Name": name,
+            "Type": type,
+            "Schedule": schedule,
+            "Description": description,
+            "RoleArn": role_arn,
+            "EndpointName": endpoint_name,
+            "ModelVariants": model_variants,
+            "DataStorageConfig": data_storage_config,
+            "ShadowModeConfig": shadow_mode_config,
+            "KmsKey": kms_key,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateInferenceExperimentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_inference_experiment(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceExperiment", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateInferenceExperimentRequest"),
+                transform(response, "CreateInferenceExperimentResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(name=name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "Name": name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "InferenceExperiment",
+            operation_input_args,
+            lambda: client.describe_inference_experiment(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeInferenceExperimentResponse")
+
+        # deserialize the response
+        inference_experiment = cls._from_describe(
+            response,
+            "DescribeInferenceExperimentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return inference_experiment
+
+    @classmethod
+    def list(
+        cls,
+        name_contains: Optional[str] = Unassigned(),
+        type: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["InferenceExperiment"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "NameContains": name_contains,
+            "Type": type,
+            "StatusEquals": status_equals,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListInferenceExperimentsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_inference_experiments",
+            list_method_kwargs=operation_input_args,
+            summaries_key="InferenceExperiments",
+            summary_name="InferenceExperimentSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "Name": self.name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "InferenceExperiment",
+            operation_input_args,
+            lambda: client.describe_inference_experiment(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceExperimentResponse", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Creating inference_experiment resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "Name": self.name,
+            "Schedule": self.schedule,
+            "Description": self.description,
+            "ModelVariants": self.model_variants,
+            "DataStorageConfig": self.data_storage_config,
+            "ShadowModeConfig": self.shadow_mode_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateInferenceExperimentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_inference_experiment(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceExperiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "Name": self.name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_inference_experiment(**operation_input_args)
+        invalidate_describe_cache(
+            "InferenceExperiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "Name": self.name,
+            "ModelVariantActions": self.model_variant_actions,
+            "DesiredModelVariants": self.desired_model_variants,
+            "DesiredState": self.desired_state,
+            "Reason": self.reason,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_inference_experiment(**operation_input_args)
+        invalidate_describe_cache(
+            "InferenceExperiment",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Creating",
+            "Created",
+            "Updating",
+            "Running",
+            "Starting",
+            "Stopping",
+            "Completed",
+            "Cancelled",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "Name": self.name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="InferenceExperiment",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=[],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_inference_experiment(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeInferenceExperimentResponse")
+        return self
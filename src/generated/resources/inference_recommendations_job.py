@@ -0,0 +1,358 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    EndpointPerformance,
+    InferenceRecommendation,
+    RecommendationJobInputConfig,
+    RecommendationJobOutputConfig,
+    RecommendationJobStoppingConditions,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class InferenceRecommendationsJob(Base):
+    job_name: str
+    job_description: Optional[str] = Unassigned()
+    job_type: Optional[str] = Unassigned()
+    job_arn: Optional[str] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    completion_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    input_config: Optional[RecommendationJobInputConfig] = Unassigned()
+    stopping_conditions: Optional[RecommendationJobStoppingConditions] = Unassigned()
+    inference_recommendations: Optional[List[InferenceRecommendation]] = Unassigned()
+    endpoint_performances: Optional[List[EndpointPerformance]] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="InferenceRecommendationsJob",
+        status_path=("Status",),
+        terminal_states=("COMPLETED", "FAILED", "STOPPED", "DELETED"),
+        describe_method="describe_inference_recommendations_job",
+        identifiers=(("JobName", "job_name"),),
+        describe_output_shape="DescribeInferenceRecommendationsJobResponse",
+        list_method="list_inference_recommendations_jobs",
+        summaries_key="InferenceRecommendationsJobs",
+        summary_name="InferenceRecommendationsJob",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "input_config": {
+                    "volume_kms_key_id": {"type": "string"},
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "InferenceRecommendationsJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        job_name: str,
+        job_type: str,
+        role_arn: str,
+        input_config: RecommendationJobInputConfig,
+        job_description: Optional[str] = Unassigned(),
+        stopping_conditions: Optional[
+            RecommendationJobStoppingConditions
+        ] = Unassigned(),
+        output_config: Optional[RecommendationJobOutputConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating inference_recommendations_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "JobName": job_name,
+            "JobType": job_type,
+            "RoleArn": role_arn,
+            "InputConfig": input_config,
+            "JobDescription": job_description,
+            "StoppingConditions": stopping_conditions,
+            "OutputConfig": output_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateInferenceRecommendationsJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_inference_recommendations_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(
+                    operation_input_args, "CreateInferenceRecommendationsJobRequest"
+                ),
+                transform(response, "CreateInferenceRecommendationsJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(job_name=job_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobName": job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            lambda: client.describe_inference_recommendations_job(
+                **operation_input_args
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(
+                response, "DescribeInferenceRecommendationsJobResponse"
+            )
+
+        # deserialize the response
+        inference_recommendations_job = cls._from_describe(
+            response,
+            "DescribeInferenceRecommendationsJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return inference_recommendations_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        model_name_equals: Optional[str] = Unassigned(),
+        model_package_version_arn_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["InferenceRecommendationsJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "ModelNameEquals": model_name_equals,
+            "ModelPackageVersionArnEquals": model_package_version_arn_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListInferenceRecommendationsJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_inference_recommendations_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="InferenceRecommendationsJobs",
+            summary_name="InferenceRecommendationsJob",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobName": self.job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            lambda: client.describe_inference_recommendations_job(
+                **operation_input_args
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceRecommendationsJobResponse", fields=fields
+        )
+        return self
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "JobName": self.job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_inference_recommendations_job(**operation_input_args)
+        invalidate_describe_cache(
+            "InferenceRecommendationsJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED", "DELETED"]
+        operation_input_args = {
+            "JobName": self.job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="InferenceRecommendationsJob",
+            status_path=("Status",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_inference_recommendations_job(
+                **operation_input_args
+            )
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(
+            response, "DescribeInferenceRecommendationsJobResponse"
+        )
+        return self
@@ -0,0 +1,367 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    HumanTaskConfig,
+    LabelCounters,
+    LabelingJobAlgorithmsConfig,
+    LabelingJobInputConfig,
+    LabelingJobOutput,
+    LabelingJobOutputConfig,
+    LabelingJobStoppingConditions,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class LabelingJob(Base):
+    labeling_job_name: str
+    labeling_job_status: Optional[str] = Unassigned()
+    label_counters: Optional[LabelCounters] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    job_reference_code: Optional[str] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    label_attribute_name: Optional[str] = Unassigned()
+    input_config: Optional[LabelingJobInputConfig] = Unassigned()
+    output_config: Optional[LabelingJobOutputConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    label_category_config_s3_uri: Optional[str] = Unassigned()
+    stopping_conditions: Optional[LabelingJobStoppingConditions] = Unassigned()
+    labeling_job_algorithms_config: Optional[LabelingJobAlgorithmsConfig] = Unassigned()
+    human_task_config: Optional[HumanTaskConfig] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    labeling_job_output: Optional[LabelingJobOutput] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="LabelingJob",
+        status_path=("LabelingJobStatus",),
+        terminal_states=("Completed", "Failed", "Stopped"),
+        describe_method="describe_labeling_job",
+        identifiers=(("LabelingJobName", "labeling_job_name"),),
+        describe_output_shape="DescribeLabelingJobResponse",
+        list_method="list_labeling_jobs",
+        summaries_key="LabelingJobSummaryList",
+        summary_name="LabelingJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "input_config": {
+                    "data_source": {
+                        "s3_data_source": {"manifest_s3_uri": {"type": "string"}}
+                    }
+                },
+                "output_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "human_task_config": {
+                    "ui_config": {"ui_template_s3_uri": {"type": "string"}}
+                },
+                "label_category_config_s3_uri": {"type": "string"},
+                "labeling_job_algorithms_config": {
+                    "labeling_job_resource_config": {
+                        "volume_kms_key_id": {"type": "string"},
+                        "vpc_config": {
+                            "security_group_ids": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            },
+                            "subnets": {"type": "array", "items": {"type": "string"}},
+                        },
+                    }
+                },
+                "labeling_job_output": {"output_dataset_s3_uri": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "LabelingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        labeling_job_name: str,
+        label_attribute_name: str,
+        input_config: LabelingJobInputConfig,
+        output_config: LabelingJobOutputConfig,
+        role_arn: str,
+        human_task_config: HumanTaskConfig,
+        label_category_config_s3_uri: Optional[str] = Unassigned(),
+        stopping_conditions: Optional[LabelingJobStoppingConditions] = Unassigned(),
+        labeling_job_algorithms_config: Optional[
+            LabelingJobAlgorithmsConfig
+        ] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating labeling_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "LabelingJobName": labeling_job_name,
+            "LabelAttributeName": label_attribute_name,
+            "InputConfig": input_config,
+            "OutputConfig": output_config,
+            "RoleArn": role_arn,
+            "LabelCategoryConfigS3Uri": label_category_config_s3_uri,
+            "StoppingConditions": stopping_conditions,
+            "LabelingJobAlgorithmsConfig": labeling_job_algorithms_config,
+            "HumanTaskConfig": human_task_config,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateLabelingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_labeling_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "LabelingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateLabelingJobRequest"),
+                transform(response, "CreateLabelingJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            labeling_job_name=labeling_job_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        labeling_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "LabelingJobName": labeling_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "LabelingJob",
+            operation_input_args,
+            lambda: client.describe_labeling_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeLabelingJobResponse")
+
+        # deserialize the response
+        labeling_job = cls._from_describe(
+            response,
+            "DescribeLabelingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return labeling_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["LabelingJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListLabelingJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_labeling_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="LabelingJobSummaryList",
+            summary_name="LabelingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "LabelingJobName": self.labeling_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "LabelingJob",
+            operation_input_args,
+            lambda: client.describe_labeling_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeLabelingJobResponse", fields=fields
+        )
+        return self
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "LabelingJobName": self.labeling_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_labeling_job(**operation_input_args)
+        invalidate_describe_cache(
+            "LabelingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "LabelingJobName": self.labeling_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="LabelingJob",
+            status_path=("LabelingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_labeling_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeLabelingJobResponse")
+        return self
@@ -0,0 +1,277 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    ModelBiasAppSpecification,
+    ModelBiasBaselineConfig,
+    ModelBiasJobInput,
+    MonitoringNetworkConfig,
+    MonitoringOutputConfig,
+    MonitoringResources,
+    MonitoringStoppingCondition,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ModelBiasJobDefinition(Base):
+    job_definition_name: str
+    job_definition_arn: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    model_bias_baseline_config: Optional[ModelBiasBaselineConfig] = Unassigned()
+    model_bias_app_specification: Optional[ModelBiasAppSpecification] = Unassigned()
+    model_bias_job_input: Optional[ModelBiasJobInput] = Unassigned()
+    model_bias_job_output_config: Optional[MonitoringOutputConfig] = Unassigned()
+    job_resources: Optional[MonitoringResources] = Unassigned()
+    network_config: Optional[MonitoringNetworkConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_bias_job_input": {
+                    "ground_truth_s3_input": {"s3_uri": {"type": "string"}},
+                    "endpoint_input": {
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                    "batch_transform_input": {
+                        "data_captured_destination_s3_uri": {"type": "string"},
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                },
+                "model_bias_job_output_config": {"kms_key_id": {"type": "string"}},
+                "job_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "role_arn": {"type": "string"},
+                "model_bias_baseline_config": {
+                    "constraints_resource": {"s3_uri": {"type": "string"}}
+                },
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelBiasJobDefinition", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        job_definition_name: str,
+        model_bias_app_specification: ModelBiasAppSpecification,
+        model_bias_job_input: ModelBiasJobInput,
+        model_bias_job_output_config: MonitoringOutputConfig,
+        job_resources: MonitoringResources,
+        role_arn: str,
+        model_bias_baseline_config: Optional[ModelBiasBaselineConfig] = Unassigned(),
+        network_config: Optional[MonitoringNetworkConfig] = Unassigned(),
+        stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_bias_job_definition resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+            "ModelBiasBaselineConfig": model_bias_baseline_config,
+            "ModelBiasAppSpecification": model_bias_app_specification,
+            "ModelBiasJobInput": model_bias_job_input,
+            "ModelBiasJobOutputConfig": model_bias_job_output_config,
+            "JobResources": job_resources,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelBiasJobDefinitionRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_model_bias_job_definition(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelBiasJobDefinitionRequest"),
+                transform(response, "CreateModelBiasJobDefinitionResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            job_definition_name=job_definition_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        job_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            lambda: client.describe_model_bias_job_definition(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelBiasJobDefinitionResponse")
+
+        # deserialize the response
+        model_bias_job_definition = cls._from_describe(
+            response,
+            "DescribeModelBiasJobDefinitionResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_bias_job_definition
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            lambda: client.describe_model_bias_job_definition(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelBiasJobDefinitionResponse", fields=fields
+        )
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_model_bias_job_definition(**operation_input_args)
+        invalidate_describe_cache(
+            "ModelBiasJobDefinition",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
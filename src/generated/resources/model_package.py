@@ -0,0 +1,453 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AdditionalInferenceSpecificationDefinition,
+    DriftCheckBaselines,
+    InferenceSpecification,
+    MetadataProperties,
+    ModelMetrics,
+    ModelPackageStatusDetails,
+    ModelPackageValidationSpecification,
+    SourceAlgorithmSpecification,
+    Tag,
+    Unassigned,
+    UserContext,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ModelPackage(Base):
+    model_package_name: str
+    model_package_group_name: Optional[str] = Unassigned()
+    model_package_version: Optional[int] = Unassigned()
+    model_package_arn: Optional[str] = Unassigned()
+    model_package_description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    inference_specification: Optional[InferenceSpecification] = Unassigned()
+    source_algorithm_specification: Optional[SourceAlgorithmSpecification] = (
+        Unassigned()
+    )
+    validation_specification: Optional[ModelPackageValidationSpecification] = (
+        Unassigned()
+    )
+    model_package_status: Optional[str] = Unassigned()
+    model_package_status_details: Optional[ModelPackageStatusDetails] = Unassigned()
+    certify_for_marketplace: Optional[bool] = Unassigned()
+    model_approval_status: Optional[str] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    model_metrics: Optional[ModelMetrics] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    approval_description: Optional[str] = Unassigned()
+    domain: Optional[str] = Unassigned()
+    task: Optional[str] = Unassigned()
+    sample_payload_url: Optional[str] = Unassigned()
+    customer_metadata_properties: Optional[Dict[str, str]] = Unassigned()
+    drift_check_baselines: Optional[DriftCheckBaselines] = Unassigned()
+    additional_inference_specifications: Optional[
+        List[AdditionalInferenceSpecificationDefinition]
+    ] = Unassigned()
+    skip_model_validation: Optional[str] = Unassigned()
+    source_uri: Optional[str] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "validation_specification": {"validation_role": {"type": "string"}},
+                "model_metrics": {
+                    "model_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_data_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "bias": {
+                        "report": {"s3_uri": {"type": "string"}},
+                        "pre_training_report": {"s3_uri": {"type": "string"}},
+                        "post_training_report": {"s3_uri": {"type": "string"}},
+                    },
+                    "explainability": {"report": {"s3_uri": {"type": "string"}}},
+                },
+                "drift_check_baselines": {
+                    "bias": {
+                        "config_file": {"s3_uri": {"type": "string"}},
+                        "pre_training_constraints": {"s3_uri": {"type": "string"}},
+                        "post_training_constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "explainability": {
+                        "constraints": {"s3_uri": {"type": "string"}},
+                        "config_file": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_data_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelPackage", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        model_package_name: Optional[str] = Unassigned(),
+        model_package_group_name: Optional[str] = Unassigned(),
+        model_package_description: Optional[str] = Unassigned(),
+        inference_specification: Optional[InferenceSpecification] = Unassigned(),
+        validation_specification: Optional[
+            ModelPackageValidationSpecification
+        ] = Unassigned(),
+        source_algorithm_specification: Optional[
+            SourceAlgorithmSpecification
+        ] = Unassigned(),
+        certify_for_marketplace: Optional[bool] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        model_approval_status: Optional[str] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        model_metrics: Optional[ModelMetrics] = Unassigned(),
+        client_token: Optional[str] = Unassigned(),
+        domain: Optional[str] = Unassigned(),
+        task: Optional[str] = Unassigned(),
+        sample_payload_url: Optional[str] = Unassigned(),
+        customer_metadata_properties: Optional[Dict[str, str]] = Unassigned(),
+        drift_check_baselines: Optional[DriftCheckBaselines] = Unassigned(),
+        additional_inference_specifications: Optional[
+            List[AdditionalInferenceSpecificationDefinition]
+        ] = Unassigned(),
+        skip_model_validation: Optional[str] = Unassigned(),
+        source_uri: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating model_package resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ModelPackageName": model_package_name,
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageDescription": model_package_description,
+            "InferenceSpecification": inference_specification,
+            "ValidationSpecification": validation_specification,
+            "SourceAlgorithmSpecification": source_algorithm_specification,
+            "CertifyForMarketplace": certify_for_marketplace,
+            "Tags": tags,
+            "ModelApprovalStatus": model_approval_status,
+            "MetadataProperties": metadata_properties,
+            "ModelMetrics": model_metrics,
+            "ClientToken": client_token,
+            "Domain": domain,
+            "Task": task,
+            "SamplePayloadUrl": sample_payload_url,
+            "CustomerMetadataProperties": customer_metadata_properties,
+            "DriftCheckBaselines": drift_check_baselines,
+            "AdditionalInferenceSpecifications": additional_inference_specifications,
+            "SkipModelValidation": skip_model_validation,
+            "SourceUri": source_uri,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateModelPackageInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_model_package(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelPackage", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateModelPackageInput"),
+                transform(response, "CreateModelPackageOutput"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            model_package_name=response["ModelPackageName"],
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        model_package_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelPackageName": model_package_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ModelPackage",
+            operation_input_args,
+            lambda: client.describe_model_package(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeModelPackageOutput")
+
+        # deserialize the response
+        model_package = cls._from_describe(
+            response,
+            "DescribeModelPackageOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return model_package
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_approval_status: Optional[str] = Unassigned(),
+        model_package_group_name: Optional[str] = Unassigned(),
+        model_package_type: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ModelPackage"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "NameContains": name_contains,
+            "ModelApprovalStatus": model_approval_status,
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageType": model_package_type,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListModelPackagesInput"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_model_packages",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ModelPackageSummaryList",
+            summary_name="ModelPackageSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ModelPackage",
+            operation_input_args,
+            lambda: client.describe_model_package(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeModelPackageOutput", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+        customer_metadata_properties_to_remove: Optional[List[str]] = Unassigned(),
+        additional_inference_specifications_to_add: Optional[
+            List[AdditionalInferenceSpecificationDefinition]
+        ] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating model_package resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ModelPackageArn": self.model_package_arn,
+            "ModelApprovalStatus": self.model_approval_status,
+            "ApprovalDescription": self.approval_description,
+            "CustomerMetadataProperties": self.customer_metadata_properties,
+            "CustomerMetadataPropertiesToRemove": customer_metadata_properties_to_remove,
+            "AdditionalInferenceSpecificationsToAdd": additional_inference_specifications_to_add,
+            "InferenceSpecification": self.inference_specification,
+            "SourceUri": self.source_uri,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateModelPackageInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_model_package(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ModelPackage",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_model_package(**operation_input_args)
+        invalidate_describe_cache(
+            "ModelPackage",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="ModelPackage",
+            status_path=("ModelPackageStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_model_package(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeModelPackageOutput")
+        return self
@@ -0,0 +1,425 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import InstanceMetadataServiceConfiguration, Tag, Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class NotebookInstance(Base):
+    notebook_instance_name: str
+    notebook_instance_arn: Optional[str] = Unassigned()
+    notebook_instance_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    url: Optional[str] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    subnet_id: Optional[str] = Unassigned()
+    security_groups: Optional[List[str]] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    kms_key_id: Optional[str] = Unassigned()
+    network_interface_id: Optional[str] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    notebook_instance_lifecycle_config_name: Optional[str] = Unassigned()
+    direct_internet_access: Optional[str] = Unassigned()
+    volume_size_in_g_b: Optional[int] = Unassigned()
+    accelerator_types: Optional[List[str]] = Unassigned()
+    default_code_repository: Optional[str] = Unassigned()
+    additional_code_repositories: Optional[List[str]] = Unassigned()
+    root_access: Optional[str] = Unassigned()
+    platform_identifier: Optional[str] = Unassigned()
+    instance_metadata_service_configuration: Optional[
+        InstanceMetadataServiceConfiguration
+    ] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "subnet_id": {"type": "string"},
+                "security_groups": {"type": "array", "items": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "kms_key_id": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "NotebookInstance", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        notebook_instance_name: str,
+        instance_type: str,
+        role_arn: str,
+        subnet_id: Optional[str] = Unassigned(),
+        security_group_ids: Optional[List[str]] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        lifecycle_config_name: Optional[str] = Unassigned(),
+        direct_internet_access: Optional[str] = Unassigned(),
+        volume_size_in_g_b: Optional[int] = Unassigned(),
+        accelerator_types: Optional[List[str]] = Unassigned(),
+        default_code_repository: Optional[str] = Unassigned(),
+        additional_code_repositories: Optional[List[str]] = Unassigned(),
+        root_access: Optional[str] = Unassigned(),
+        platform_identifier: Optional[str] = Unassigned(),
+        instance_metadata_service_configuration: Optional[
+            InstanceMetadataServiceConfiguration
+        ] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating notebook_instance resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "NotebookInstanceName": notebook_instance_name,
+            "InstanceType": instance_type,
+            "SubnetId": subnet_id,
+            "SecurityGroupIds": security_group_ids,
+            "RoleArn": role_arn,
+            "KmsKeyId": kms_key_id,
+            "Tags": tags,
+            "LifecycleConfigName": lifecycle_config_name,
+            "DirectInternetAccess": direct_internet_access,
+            "VolumeSizeInGB": volume_size_in_g_b,
+            "AcceleratorTypes": accelerator_types,
+            "DefaultCodeRepository": default_code_repository,
+            "AdditionalCodeRepositories": additional_code_repositories,
+            "RootAccess": root_access,
+            "PlatformIdentifier": platform_identifier,
+            "InstanceMetadataServiceConfiguration": instance_metadata_service_configuration,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateNotebookInstanceInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_notebook_instance(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstance", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateNotebookInstanceInput"),
+                transform(response, "CreateNotebookInstanceOutput"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            notebook_instance_name=notebook_instance_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        notebook_instance_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "NotebookInstanceName": notebook_instance_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "NotebookInstance",
+            operation_input_args,
+            lambda: client.describe_notebook_instance(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeNotebookInstanceOutput")
+
+        # deserialize the response
+        notebook_instance = cls._from_describe(
+            response,
+            "DescribeNotebookInstanceOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return notebook_instance
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        notebook_instance_lifecycle_config_name_contains: Optional[str] = Unassigned(),
+        default_code_repository_contains: Optional[str] = Unassigned(),
+        additional_code_repository_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["NotebookInstance"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "StatusEquals": status_equals,
+            "NotebookInstanceLifecycleConfigNameContains": notebook_instance_lifecycle_config_name_contains,
+            "DefaultCodeRepositoryContains": default_code_repository_contains,
+            "AdditionalCodeRepositoryEquals": additional_code_repository_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListNotebookInstancesInput"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_notebook_instances",
+            list_method_kwargs=operation_input_args,
+            summaries_key="NotebookInstances",
+            summary_name="NotebookInstanceSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "NotebookInstance",
+            operation_input_args,
+            lambda: client.describe_notebook_instance(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeNotebookInstanceOutput", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+        lifecycle_config_name: Optional[str] = Unassigned(),
+        disassociate_lifecycle_config: Optional[bool] = Unassigned(),
+        disassociate_accelerator_types: Optional[bool] = Unassigned(),
+        disassociate_default_code_repository: Optional[bool] = Unassigned(),
+        disassociate_additional_code_repositories: Optional[bool] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating notebook_instance resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+            "InstanceType": self.instance_type,
+            "RoleArn": self.role_arn,
+            "LifecycleConfigName": lifecycle_config_name,
+            "DisassociateLifecycleConfig": disassociate_lifecycle_config,
+            "VolumeSizeInGB": self.volume_size_in_g_b,
+            "DefaultCodeRepository": self.default_code_repository,
+            "AdditionalCodeRepositories": self.additional_code_repositories,
+            "AcceleratorTypes": self.accelerator_types,
+            "DisassociateAcceleratorTypes": disassociate_accelerator_types,
+            "DisassociateDefaultCodeRepository": disassociate_default_code_repository,
+            "DisassociateAdditionalCodeRepositories": disassociate_additional_code_repositories,
+            "RootAccess": self.root_access,
+            "InstanceMetadataServiceConfiguration": self.instance_metadata_service_configuration,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateNotebookInstanceInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_notebook_instance(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_notebook_instance(**operation_input_args)
+        invalidate_describe_cache(
+            "NotebookInstance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_notebook_instance(**operation_input_args)
+        invalidate_describe_cache(
+            "NotebookInstance",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Pending",
+            "InService",
+            "Stopping",
+            "Stopped",
+            "Failed",
+            "Deleting",
+            "Updating",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "NotebookInstanceName": self.notebook_instance_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="NotebookInstance",
+            status_path=("NotebookInstanceStatus",),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=30,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_notebook_instance(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeNotebookInstanceOutput")
+        return self
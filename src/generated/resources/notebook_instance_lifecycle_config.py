@@ -0,0 +1,298 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import NotebookInstanceLifecycleHook, Unassigned
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class NotebookInstanceLifecycleConfig(Base):
+    notebook_instance_lifecycle_config_name: str
+    notebook_instance_lifecycle_config_arn: Optional[str] = Unassigned()
+    on_create: Optional[List[NotebookInstanceLifecycleHook]] = Unassigned()
+    on_start: Optional[List[NotebookInstanceLifecycleHook]] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        notebook_instance_lifecycle_config_name: str,
+        on_create: Optional[List[NotebookInstanceLifecycleHook]] = Unassigned(),
+        on_start: Optional[List[NotebookInstanceLifecycleHook]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating notebook_instance_lifecycle_config resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": notebook_instance_lifecycle_config_name,
+            "OnCreate": on_create,
+            "OnStart": on_start,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateNotebookInstanceLifecycleConfigInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_notebook_instance_lifecycle_config(
+            **operation_input_args
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            session=session,
+            region=region,
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(
+                    operation_input_args, "CreateNotebookInstanceLifecycleConfigInput"
+                ),
+                transform(response, "CreateNotebookInstanceLifecycleConfigOutput"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            notebook_instance_lifecycle_config_name=notebook_instance_lifecycle_config_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        notebook_instance_lifecycle_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": notebook_instance_lifecycle_config_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            lambda: client.describe_notebook_instance_lifecycle_config(
+                **operation_input_args
+            ),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(
+                response, "DescribeNotebookInstanceLifecycleConfigOutput"
+            )
+
+        # deserialize the response
+        notebook_instance_lifecycle_config = cls._from_describe(
+            response,
+            "DescribeNotebookInstanceLifecycleConfigOutput",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return notebook_instance_lifecycle_config
+
+    @classmethod
+    def list(
+        cls,
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["NotebookInstanceLifecycleConfig"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListNotebookInstanceLifecycleConfigsInput"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_notebook_instance_lifecycle_configs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="NotebookInstanceLifecycleConfigs",
+            summary_name="NotebookInstanceLifecycleConfigSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": self.notebook_instance_lifecycle_config_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            lambda: client.describe_notebook_instance_lifecycle_config(
+                **operation_input_args
+            ),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeNotebookInstanceLifecycleConfigOutput", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Creating notebook_instance_lifecycle_config resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": self.notebook_instance_lifecycle_config_name,
+            "OnCreate": self.on_create,
+            "OnStart": self.on_start,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateNotebookInstanceLifecycleConfigInput"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_notebook_instance_lifecycle_config(
+            **operation_input_args
+        )
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "NotebookInstanceLifecycleConfigName": self.notebook_instance_lifecycle_config_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_notebook_instance_lifecycle_config(**operation_input_args)
+        invalidate_describe_cache(
+            "NotebookInstanceLifecycleConfig",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
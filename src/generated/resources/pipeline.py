@@ -0,0 +1,343 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    ParallelismConfiguration,
+    PipelineDefinitionS3Location,
+    Tag,
+    Unassigned,
+    UserContext,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Pipeline(Base):
+    pipeline_name: str
+    pipeline_arn: Optional[str] = Unassigned()
+    pipeline_display_name: Optional[str] = Unassigned()
+    pipeline_definition: Optional[str] = Unassigned()
+    pipeline_description: Optional[str] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    pipeline_status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_run_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    parallelism_configuration: Optional[ParallelismConfiguration] = Unassigned()
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {"role_arn": {"type": "string"}}
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Pipeline", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        pipeline_name: str,
+        client_request_token: str,
+        role_arn: str,
+        pipeline_display_name: Optional[str] = Unassigned(),
+        pipeline_definition: Optional[str] = Unassigned(),
+        pipeline_definition_s3_location: Optional[
+            PipelineDefinitionS3Location
+        ] = Unassigned(),
+        pipeline_description: Optional[str] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        parallelism_configuration: Optional[ParallelismConfiguration] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating pipeline resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "PipelineName": pipeline_name,
+            "PipelineDisplayName": pipeline_display_name,
+            "PipelineDefinition": pipeline_definition,
+            "PipelineDefinitionS3Location": pipeline_definition_s3_location,
+            "PipelineDescription": pipeline_description,
+            "ClientRequestToken": client_request_token,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "ParallelismConfiguration": parallelism_configuration,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreatePipelineRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_pipeline(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Pipeline", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreatePipelineRequest"),
+                transform(response, "CreatePipelineResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(pipeline_name=pipeline_name, session=session, region=region)
+
+    @classmethod
+    def get(
+        cls,
+        pipeline_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "PipelineName": pipeline_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Pipeline",
+            operation_input_args,
+            lambda: client.describe_pipeline(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribePipelineResponse")
+
+        # deserialize the response
+        pipeline = cls._from_describe(
+            response,
+            "DescribePipelineResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return pipeline
+
+    @classmethod
+    def list(
+        cls,
+        pipeline_name_prefix: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Pipeline"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "PipelineNamePrefix": pipeline_name_prefix,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListPipelinesRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_pipelines",
+            list_method_kwargs=operation_input_args,
+            summaries_key="PipelineSummaries",
+            summary_name="PipelineSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Pipeline",
+            operation_input_args,
+            lambda: client.describe_pipeline(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribePipelineResponse", fields=fields)
+        return self
+
+    def update(
+        self,
+        pipeline_definition_s3_location: Optional[
+            PipelineDefinitionS3Location
+        ] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating pipeline resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+            "PipelineDisplayName": self.pipeline_display_name,
+            "PipelineDefinition": self.pipeline_definition,
+            "PipelineDefinitionS3Location": pipeline_definition_s3_location,
+            "PipelineDescription": self.pipeline_description,
+            "RoleArn": self.role_arn,
+            "ParallelismConfiguration": self.parallelism_configuration,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdatePipelineRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_pipeline(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Pipeline", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+            "ClientRequestToken": self.client_request_token,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_pipeline(**operation_input_args)
+        invalidate_describe_cache(
+            "Pipeline", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal["Active", "Deleting"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "PipelineName": self.pipeline_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="Pipeline",
+            status_path=("PipelineStatus",),
+            success_states=[status],
+            failure_states=[],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(lambda: client.describe_pipeline(**operation_input_args))
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribePipelineResponse")
+        return self
@@ -0,0 +1,357 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AppSpecification,
+    ExperimentConfig,
+    NetworkConfig,
+    ProcessingInput,
+    ProcessingOutputConfig,
+    ProcessingResources,
+    ProcessingStoppingCondition,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ProcessingJob(Base):
+    processing_job_name: str
+    processing_inputs: Optional[List[ProcessingInput]] = Unassigned()
+    processing_output_config: Optional[ProcessingOutputConfig] = Unassigned()
+    processing_resources: Optional[ProcessingResources] = Unassigned()
+    stopping_condition: Optional[ProcessingStoppingCondition] = Unassigned()
+    app_specification: Optional[AppSpecification] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    network_config: Optional[NetworkConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    experiment_config: Optional[ExperimentConfig] = Unassigned()
+    processing_job_arn: Optional[str] = Unassigned()
+    processing_job_status: Optional[str] = Unassigned()
+    exit_message: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    processing_end_time: Optional[datetime.datetime] = Unassigned()
+    processing_start_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    monitoring_schedule_arn: Optional[str] = Unassigned()
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    training_job_arn: Optional[str] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="ProcessingJob",
+        status_path=("ProcessingJobStatus",),
+        terminal_states=("Completed", "Failed", "Stopped"),
+        describe_method="describe_processing_job",
+        identifiers=(("ProcessingJobName", "processing_job_name"),),
+        describe_output_shape="DescribeProcessingJobResponse",
+        list_method="list_processing_jobs",
+        summaries_key="ProcessingJobSummaries",
+        summary_name="ProcessingJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "processing_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "processing_output_config": {"kms_key_id": {"type": "string"}},
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+                "role_arn": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ProcessingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        processing_job_name: str,
+        processing_resources: ProcessingResources,
+        app_specification: AppSpecification,
+        role_arn: str,
+        processing_inputs: Optional[List[ProcessingInput]] = Unassigned(),
+        processing_output_config: Optional[ProcessingOutputConfig] = Unassigned(),
+        stopping_condition: Optional[ProcessingStoppingCondition] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        network_config: Optional[NetworkConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        experiment_config: Optional[ExperimentConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating processing_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ProcessingInputs": processing_inputs,
+            "ProcessingOutputConfig": processing_output_config,
+            "ProcessingJobName": processing_job_name,
+            "ProcessingResources": processing_resources,
+            "StoppingCondition": stopping_condition,
+            "AppSpecification": app_specification,
+            "Environment": environment,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "ExperimentConfig": experiment_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateProcessingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_processing_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "ProcessingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateProcessingJobRequest"),
+                transform(response, "CreateProcessingJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            processing_job_name=processing_job_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        processing_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "ProcessingJobName": processing_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ProcessingJob",
+            operation_input_args,
+            lambda: client.describe_processing_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeProcessingJobResponse")
+
+        # deserialize the response
+        processing_job = cls._from_describe(
+            response,
+            "DescribeProcessingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return processing_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ProcessingJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListProcessingJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_processing_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="ProcessingJobSummaries",
+            summary_name="ProcessingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "ProcessingJob",
+            operation_input_args,
+            lambda: client.describe_processing_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeProcessingJobResponse", fields=fields
+        )
+        return self
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_processing_job(**operation_input_args)
+        invalidate_describe_cache(
+            "ProcessingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="ProcessingJob",
+            status_path=("ProcessingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_processing_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeProcessingJobResponse")
+        return self
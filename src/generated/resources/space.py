@@ -0,0 +1,330 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    OwnershipSettings,
+    SpaceSettings,
+    SpaceSharingSettings,
+    Tag,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Space(Base):
+    domain_id: str
+    space_name: str
+    space_arn: Optional[str] = Unassigned()
+    home_efs_file_system_uid: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    space_settings: Optional[SpaceSettings] = Unassigned()
+    ownership_settings: Optional[OwnershipSettings] = Unassigned()
+    space_sharing_settings: Optional[SpaceSharingSettings] = Unassigned()
+    space_display_name: Optional[str] = Unassigned()
+    url: Optional[str] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        domain_id: str,
+        space_name: str,
+        tags: Optional[List[Tag]] = Unassigned(),
+        space_settings: Optional[SpaceSettings] = Unassigned(),
+        ownership_settings: Optional[OwnershipSettings] = Unassigned(),
+        space_sharing_settings: Optional[SpaceSharingSettings] = Unassigned(),
+        space_display_name: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating space resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "DomainId": domain_id,
+            "SpaceName": space_name,
+            "Tags": tags,
+            "SpaceSettings": space_settings,
+            "OwnershipSettings": ownership_settings,
+            "SpaceSharingSettings": space_sharing_settings,
+            "SpaceDisplayName": space_display_name,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateSpaceRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_space(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Space", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateSpaceRequest"),
+                transform(response, "CreateSpaceResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            domain_id=domain_id, space_name=space_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        domain_id: str,
+        space_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": domain_id,
+            "SpaceName": space_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Space",
+            operation_input_args,
+            lambda: client.describe_space(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeSpaceResponse")
+
+        # deserialize the response
+        space = cls._from_describe(
+            response,
+            "DescribeSpaceResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return space
+
+    @classmethod
+    def list(
+        cls,
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        domain_id_equals: Optional[str] = Unassigned(),
+        space_name_contains: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Space"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "DomainIdEquals": domain_id_equals,
+            "SpaceNameContains": space_name_contains,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListSpacesRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_spaces",
+            list_method_kwargs=operation_input_args,
+            summaries_key="Spaces",
+            summary_name="SpaceDetails",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "Space",
+            operation_input_args,
+            lambda: client.describe_space(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(response, "DescribeSpaceResponse", fields=fields)
+        return self
+
+    def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Creating space resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+            "SpaceSettings": self.space_settings,
+            "SpaceDisplayName": self.space_display_name,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateSpaceRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_space(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "Space", operation_input_args, session=self._session, region=self._region
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_space(**operation_input_args)
+        invalidate_describe_cache(
+            "Space", operation_input_args, session=self._session, region=self._region
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "SpaceName": self.space_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="Space",
+            status_path=("Status",),
+            success_states=[status],
+            failure_states=["Failed", "Update_Failed", "Delete_Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(lambda: client.describe_space(**operation_input_args))
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeSpaceResponse")
+        return self
@@ -0,0 +1,473 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    AlgorithmSpecification,
+    Channel,
+    CheckpointConfig,
+    DebugHookConfig,
+    DebugRuleConfiguration,
+    DebugRuleEvaluationStatus,
+    ExperimentConfig,
+    InfraCheckConfig,
+    MetricData,
+    ModelArtifacts,
+    OutputDataConfig,
+    ProfilerConfig,
+    ProfilerRuleConfiguration,
+    ProfilerRuleEvaluationStatus,
+    RemoteDebugConfig,
+    ResourceConfig,
+    RetryStrategy,
+    SecondaryStatusTransition,
+    StoppingCondition,
+    Tag,
+    TensorBoardOutputConfig,
+    Unassigned,
+    VpcConfig,
+    WarmPoolStatus,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TrainingJob(Base):
+    training_job_name: str
+    training_job_arn: Optional[str] = Unassigned()
+    tuning_job_arn: Optional[str] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    model_artifacts: Optional[ModelArtifacts] = Unassigned()
+    training_job_status: Optional[str] = Unassigned()
+    secondary_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    hyper_parameters: Optional[Dict[str, str]] = Unassigned()
+    algorithm_specification: Optional[AlgorithmSpecification] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    input_data_config: Optional[List[Channel]] = Unassigned()
+    output_data_config: Optional[OutputDataConfig] = Unassigned()
+    resource_config: Optional[ResourceConfig] = Unassigned()
+    warm_pool_status: Optional[WarmPoolStatus] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+    stopping_condition: Optional[StoppingCondition] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    training_start_time: Optional[datetime.datetime] = Unassigned()
+    training_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    secondary_status_transitions: Optional[List[SecondaryStatusTransition]] = (
+        Unassigned()
+    )
+    final_metric_data_list: Optional[List[MetricData]] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    enable_managed_spot_training: Optional[bool] = Unassigned()
+    checkpoint_config: Optional[CheckpointConfig] = Unassigned()
+    training_time_in_seconds: Optional[int] = Unassigned()
+    billable_time_in_seconds: Optional[int] = Unassigned()
+    debug_hook_config: Optional[DebugHookConfig] = Unassigned()
+    experiment_config: Optional[ExperimentConfig] = Unassigned()
+    debug_rule_configurations: Optional[List[DebugRuleConfiguration]] = Unassigned()
+    tensor_board_output_config: Optional[TensorBoardOutputConfig] = Unassigned()
+    debug_rule_evaluation_statuses: Optional[List[DebugRuleEvaluationStatus]] = (
+        Unassigned()
+    )
+    profiler_config: Optional[ProfilerConfig] = Unassigned()
+    profiler_rule_configurations: Optional[List[ProfilerRuleConfiguration]] = (
+        Unassigned()
+    )
+    profiler_rule_evaluation_statuses: Optional[List[ProfilerRuleEvaluationStatus]] = (
+        Unassigned()
+    )
+    profiling_status: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    retry_strategy: Optional[RetryStrategy] = Unassigned()
+    remote_debug_config: Optional[RemoteDebugConfig] = Unassigned()
+    infra_check_config: Optional[InfraCheckConfig] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="TrainingJob",
+        status_path=("TrainingJobStatus",),
+        terminal_states=("Completed", "Failed", "Stopped"),
+        describe_method="describe_training_job",
+        identifiers=(("TrainingJobName", "training_job_name"),),
+        describe_output_shape="DescribeTrainingJobResponse",
+        list_method="list_training_jobs",
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_artifacts": {"s3_model_artifacts": {"type": "string"}},
+                "resource_config": {"volume_kms_key_id": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "vpc_config": {
+                    "security_group_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+                "checkpoint_config": {"s3_uri": {"type": "string"}},
+                "debug_hook_config": {"s3_output_path": {"type": "string"}},
+                "tensor_board_output_config": {"s3_output_path": {"type": "string"}},
+                "profiler_config": {"s3_output_path": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "TrainingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        training_job_name: str,
+        algorithm_specification: AlgorithmSpecification,
+        role_arn: str,
+        output_data_config: OutputDataConfig,
+        resource_config: ResourceConfig,
+        stopping_condition: StoppingCondition,
+        hyper_parameters: Optional[Dict[str, str]] = Unassigned(),
+        input_data_config: Optional[List[Channel]] = Unassigned(),
+        vpc_config: Optional[VpcConfig] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        enable_network_isolation: Optional[bool] = Unassigned(),
+        enable_inter_container_traffic_encryption: Optional[bool] = Unassigned(),
+        enable_managed_spot_training: Optional[bool] = Unassigned(),
+        checkpoint_config: Optional[CheckpointConfig] = Unassigned(),
+        debug_hook_config: Optional[DebugHookConfig] = Unassigned(),
+        debug_rule_configurations: Optional[
+            List[DebugRuleConfiguration]
+        ] = Unassigned(),
+        tensor_board_output_config: Optional[TensorBoardOutputConfig] = Unassigned(),
+        experiment_config: Optional[ExperimentConfig] = Unassigned(),
+        profiler_config: Optional[ProfilerConfig] = Unassigned(),
+        profiler_rule_configurations: Optional[
+            List[ProfilerRuleConfiguration]
+        ] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        retry_strategy: Optional[RetryStrategy] = Unassigned(),
+        remote_debug_config: Optional[RemoteDebugConfig] = Unassigned(),
+        infra_check_config: Optional[InfraCheckConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating training_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "TrainingJobName": training_job_name,
+            "HyperParameters": hyper_parameters,
+            "AlgorithmSpecification": algorithm_specification,
+            "RoleArn": role_arn,
+            "InputDataConfig": input_data_config,
+            "OutputDataConfig": output_data_config,
+            "ResourceConfig": resource_config,
+            "VpcConfig": vpc_config,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+            "EnableNetworkIsolation": enable_network_isolation,
+            "EnableInterContainerTrafficEncryption": enable_inter_container_traffic_encryption,
+            "EnableManagedSpotTraining": enable_managed_spot_training,
+            "CheckpointConfig": checkpoint_config,
+            "DebugHookConfig": debug_hook_config,
+            "DebugRuleConfigurations": debug_rule_configurations,
+            "TensorBoardOutputConfig": tensor_board_output_config,
+            "ExperimentConfig": experiment_config,
+            "ProfilerConfig": profiler_config,
+            "ProfilerRuleConfigurations": profiler_rule_configurations,
+            "Environment": environment,
+            "RetryStrategy": retry_strategy,
+            "RemoteDebugConfig": remote_debug_config,
+            "InfraCheckConfig": infra_check_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTrainingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_training_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrainingJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateTrainingJobRequest"),
+                transform(response, "CreateTrainingJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            training_job_name=training_job_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        training_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrainingJobName": training_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "TrainingJob",
+            operation_input_args,
+            lambda: client.describe_training_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTrainingJobResponse")
+
+        # deserialize the response
+        training_job = cls._from_describe(
+            response,
+            "DescribeTrainingJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return training_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        warm_pool_status_equals: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["TrainingJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "WarmPoolStatusEquals": warm_pool_status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTrainingJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_training_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TrainingJobSummaries",
+            summary_name="TrainingJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "TrainingJob",
+            operation_input_args,
+            lambda: client.describe_training_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeTrainingJobResponse", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+    ) -> Optional[object]:
+        logger.debug("Creating training_job resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+            "ProfilerConfig": self.profiler_config,
+            "ProfilerRuleConfigurations": self.profiler_rule_configurations,
+            "ResourceConfig": self.resource_config,
+            "RemoteDebugConfig": self.remote_debug_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateTrainingJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_training_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrainingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_training_job(**operation_input_args)
+        invalidate_describe_cache(
+            "TrainingJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="TrainingJob",
+            status_path=("TrainingJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=120,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_training_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeTrainingJobResponse")
+        return self
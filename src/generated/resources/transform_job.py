@@ -0,0 +1,366 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    BatchDataCaptureConfig,
+    DataProcessing,
+    ExperimentConfig,
+    ModelClientConfig,
+    Tag,
+    TransformInput,
+    TransformOutput,
+    TransformResources,
+    Unassigned,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TransformJob(Base):
+    transform_job_name: str
+    transform_job_arn: Optional[str] = Unassigned()
+    transform_job_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    max_concurrent_transforms: Optional[int] = Unassigned()
+    model_client_config: Optional[ModelClientConfig] = Unassigned()
+    max_payload_in_m_b: Optional[int] = Unassigned()
+    batch_strategy: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    transform_input: Optional[TransformInput] = Unassigned()
+    transform_output: Optional[TransformOutput] = Unassigned()
+    data_capture_config: Optional[BatchDataCaptureConfig] = Unassigned()
+    transform_resources: Optional[TransformResources] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    transform_start_time: Optional[datetime.datetime] = Unassigned()
+    transform_end_time: Optional[datetime.datetime] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    data_processing: Optional[DataProcessing] = Unassigned()
+    experiment_config: Optional[ExperimentConfig] = Unassigned()
+
+    _waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+        resource_type="TransformJob",
+        status_path=("TransformJobStatus",),
+        terminal_states=("Completed", "Failed", "Stopped"),
+        describe_method="describe_transform_job",
+        identifiers=(("TransformJobName", "transform_job_name"),),
+        describe_output_shape="DescribeTransformJobResponse",
+        list_method="list_transform_jobs",
+        summaries_key="TransformJobSummaries",
+        summary_name="TransformJobSummary",
+        list_filters=("NameContains", "CreationTimeAfter"),
+    )
+
+    def populate_inputs_decorator(create_func):
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "transform_input": {
+                    "data_source": {
+                        "s3_data_source": {
+                            "s3_data_type": {"type": "string"},
+                            "s3_uri": {"type": "string"},
+                        }
+                    }
+                },
+                "transform_resources": {"volume_kms_key_id": {"type": "string"}},
+                "transform_output": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "TransformJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    def create(
+        cls,
+        transform_job_name: str,
+        model_name: str,
+        transform_input: TransformInput,
+        transform_output: TransformOutput,
+        transform_resources: TransformResources,
+        max_concurrent_transforms: Optional[int] = Unassigned(),
+        model_client_config: Optional[ModelClientConfig] = Unassigned(),
+        max_payload_in_m_b: Optional[int] = Unassigned(),
+        batch_strategy: Optional[str] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        data_capture_config: Optional[BatchDataCaptureConfig] = Unassigned(),
+        data_processing: Optional[DataProcessing] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        experiment_config: Optional[ExperimentConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating transform_job resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "TransformJobName": transform_job_name,
+            "ModelName": model_name,
+            "MaxConcurrentTransforms": max_concurrent_transforms,
+            "ModelClientConfig": model_client_config,
+            "MaxPayloadInMB": max_payload_in_m_b,
+            "BatchStrategy": batch_strategy,
+            "Environment": environment,
+            "TransformInput": transform_input,
+            "TransformOutput": transform_output,
+            "DataCaptureConfig": data_capture_config,
+            "TransformResources": transform_resources,
+            "DataProcessing": data_processing,
+            "Tags": tags,
+            "ExperimentConfig": experiment_config,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTransformJobRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_transform_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TransformJob", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateTransformJobRequest"),
+                transform(response, "CreateTransformJobResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            transform_job_name=transform_job_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        transform_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TransformJobName": transform_job_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "TransformJob",
+            operation_input_args,
+            lambda: client.describe_transform_job(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTransformJobResponse")
+
+        # deserialize the response
+        transform_job = cls._from_describe(
+            response,
+            "DescribeTransformJobResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return transform_job
+
+    @classmethod
+    def list(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["TransformJob"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTransformJobsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_transform_jobs",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TransformJobSummaries",
+            summary_name="TransformJobSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "TransformJob",
+            operation_input_args,
+            lambda: client.describe_transform_job(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeTransformJobResponse", fields=fields
+        )
+        return self
+
+    def stop(self) -> None:
+
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.stop_transform_job(**operation_input_args)
+        invalidate_describe_cache(
+            "TransformJob",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait(self, poll: int = 5, timeout: Optional[int] = None) -> Optional[object]:
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="TransformJob",
+            status_path=("TransformJobStatus",),
+            success_states=terminal_states,
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_transform_job(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeTransformJobResponse")
+        return self
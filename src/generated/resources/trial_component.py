@@ -0,0 +1,358 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+
+import datetime
+import time
+import os
+import inspect
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+from boto3.session import Session
+from botocore.config import Config
+from ..utils import (
+    SageMakerClient,
+    SageMakerRuntimeClient,
+    ResourceIterator,
+    snake_to_pascal,
+    pascal_to_snake,
+    cached_describe,
+    invalidate_describe_cache,
+)
+from ..intelligent_defaults_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from src.code_injection.codec import (
+    serialize_request,
+    transform,
+    transform_fields,
+    transform_lazily,
+    transform_view,
+)
+from src.code_injection.batch import (
+    BatchResult,
+    is_throttling_error,
+    run_batch,
+    stream_batch,
+)
+from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec
+from src.code_injection.response_stream import ResponseStreamReader, StreamFraming
+from src.code_injection.waiter import Waiter, WaiterConfig
+from . import Base
+from ..shapes import (
+    MetadataProperties,
+    Tag,
+    TrialComponentArtifact,
+    TrialComponentMetricSummary,
+    TrialComponentParameterValue,
+    TrialComponentSource,
+    TrialComponentStatus,
+    Unassigned,
+    UserContext,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TrialComponent(Base):
+    trial_component_name: str
+    trial_component_arn: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    source: Optional[TrialComponentSource] = Unassigned()
+    status: Optional[TrialComponentStatus] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    parameters: Optional[Dict[str, TrialComponentParameterValue]] = Unassigned()
+    input_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned()
+    output_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    metrics: Optional[List[TrialComponentMetricSummary]] = Unassigned()
+    lineage_group_arn: Optional[str] = Unassigned()
+    sources: Optional[List[TrialComponentSource]] = Unassigned()
+
+    @classmethod
+    def create(
+        cls,
+        trial_component_name: str,
+        display_name: Optional[str] = Unassigned(),
+        status: Optional[TrialComponentStatus] = Unassigned(),
+        start_time: Optional[datetime.datetime] = Unassigned(),
+        end_time: Optional[datetime.datetime] = Unassigned(),
+        parameters: Optional[Dict[str, TrialComponentParameterValue]] = Unassigned(),
+        input_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned(),
+        output_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned(),
+        metadata_properties: Optional[MetadataProperties] = Unassigned(),
+        tags: Optional[List[Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        skip_describe: bool = False,
+    ) -> Optional[object]:
+        logger.debug("Creating trial_component resource.")
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "TrialComponentName": trial_component_name,
+            "DisplayName": display_name,
+            "Status": status,
+            "StartTime": start_time,
+            "EndTime": end_time,
+            "Parameters": parameters,
+            "InputArtifacts": input_artifacts,
+            "OutputArtifacts": output_artifacts,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "CreateTrialComponentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_trial_component(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrialComponent", operation_input_args, session=session, region=region
+        )
+
+        if skip_describe:
+            # the other attributes are described on first access
+            return cls._from_create(
+                transform(operation_input_args, "CreateTrialComponentRequest"),
+                transform(response, "CreateTrialComponentResponse"),
+                session=session,
+                region=region,
+            )
+
+        return cls.get(
+            trial_component_name=trial_component_name, session=session, region=region
+        )
+
+    @classmethod
+    def get(
+        cls,
+        trial_component_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        view: bool = False,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrialComponentName": trial_component_name,
+        }
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "TrialComponent",
+            operation_input_args,
+            lambda: client.describe_trial_component(**operation_input_args),
+            session=session,
+            region=region,
+        )
+
+        if view:
+            # a read-only view of the response, see ShapeView.to_model
+            return transform_view(response, "DescribeTrialComponentResponse")
+
+        # deserialize the response
+        trial_component = cls._from_describe(
+            response,
+            "DescribeTrialComponentResponse",
+            session=session,
+            region=region,
+            lazy=lazy,
+            fields=fields,
+        )
+        return trial_component
+
+    @classmethod
+    def list(
+        cls,
+        experiment_name: Optional[str] = Unassigned(),
+        trial_name: Optional[str] = Unassigned(),
+        source_arn: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["TrialComponent"]:
+        client = SageMakerClient(
+            session=session, region_name=region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "ExperimentName": experiment_name,
+            "TrialName": trial_name,
+            "SourceArn": source_arn,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "ListTrialComponentsRequest"
+        )
+
+        return ResourceIterator(
+            client=client,
+            list_method="list_trial_components",
+            list_method_kwargs=operation_input_args,
+            summaries_key="TrialComponentSummaries",
+            summary_name="TrialComponentSummary",
+            resource_cls=cls,
+            max_results=max_results,
+            page_size=page_size,
+            session=session,
+            region=region,
+        )
+
+    def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        response = cached_describe(
+            "TrialComponent",
+            operation_input_args,
+            lambda: client.describe_trial_component(**operation_input_args),
+            session=self._session,
+            region=self._region,
+        )
+
+        # deserialize response and update self
+        self._update_from_describe(
+            response, "DescribeTrialComponentResponse", fields=fields
+        )
+        return self
+
+    def update(
+        self,
+        parameters_to_remove: Optional[List[str]] = Unassigned(),
+        input_artifacts_to_remove: Optional[List[str]] = Unassigned(),
+        output_artifacts_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional[object]:
+        logger.debug("Creating trial_component resource.")
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+            "DisplayName": self.display_name,
+            "Status": self.status,
+            "StartTime": self.start_time,
+            "EndTime": self.end_time,
+            "Parameters": self.parameters,
+            "ParametersToRemove": parameters_to_remove,
+            "InputArtifacts": self.input_artifacts,
+            "InputArtifactsToRemove": input_artifacts_to_remove,
+            "OutputArtifacts": self.output_artifacts,
+            "OutputArtifactsToRemove": output_artifacts_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize_request(
+            operation_input_args, "UpdateTrialComponentRequest"
+        )
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_trial_component(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        invalidate_describe_cache(
+            "TrialComponent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+        self.refresh()
+
+        return self
+
+    def delete(self) -> None:
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        client.delete_trial_component(**operation_input_args)
+        invalidate_describe_cache(
+            "TrialComponent",
+            operation_input_args,
+            session=self._session,
+            region=self._region,
+        )
+
+    @validate_call
+    def wait_for_status(
+        self,
+        status: Literal["InProgress", "Completed", "Failed", "Stopping", "Stopped"],
+        poll: int = 5,
+        timeout: Optional[int] = None,
+    ) -> Optional[object]:
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        client = SageMakerClient(
+            session=self._session, region_name=self._region, service_name="sagemaker"
+        ).client
+        waiter = Waiter(
+            resource_type="TrialComponent",
+            status_path=("Status", "PrimaryStatus"),
+            success_states=[status],
+            failure_states=["Failed"],
+            poll=poll,
+            max_delay=60,
+            timeout=timeout,
+        )
+        response = waiter.wait(
+            lambda: client.describe_trial_component(**operation_input_args)
+        )
+
+        # deserialize the final response and update self
+        self._update_from_describe(response, "DescribeTrialComponentResponse")
+        return self
@@ -0,0 +1,660 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import importlib
+import datetime
+
+from pydantic import BaseModel, ConfigDict
+from threading import Thread
+from typing import List, Dict, Iterable, Optional, Any
+
+from src.code_injection.codec import serialize_shape
+from src.code_injection.warm_up import build_models
+
+
+class Base(BaseModel):
+    # the validator is built on first instantiation, see warm_up
+    model_config = ConfigDict(defer_build=True)
+
+    def serialize(self):
+        return serialize_shape(self)
+
+
+class Unassigned:
+    """A custom type used to signify an undefined optional argument."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+
+# The module of each class, imported on first access of one of its classes
+_SHAPE_MODULES = {
+    "ActionSource": "action_source",
+    "ActionSummary": "action_source",
+    "AdditionalInferenceSpecificationDefinition": "additional_inference_specification_definition",
+    "BatchDescribeModelPackageError": "additional_inference_specification_definition",
+    "BatchDescribeModelPackageSummary": "additional_inference_specification_definition",
+    "MetricsSource": "additional_inference_specification_definition",
+    "Bias": "additional_inference_specification_definition",
+    "ModelPackageValidationProfile": "additional_inference_specification_definition",
+    "ModelPackageValidationSpecification": "additional_inference_specification_definition",
+    "SourceAlgorithm": "additional_inference_specification_definition",
+    "SourceAlgorithmSpecification": "additional_inference_specification_definition",
+    "ModelQuality": "additional_inference_specification_definition",
+    "ModelDataQuality": "additional_inference_specification_definition",
+    "Explainability": "additional_inference_specification_definition",
+    "ModelMetrics": "additional_inference_specification_definition",
+    "FileSource": "additional_inference_specification_definition",
+    "DriftCheckBias": "additional_inference_specification_definition",
+    "DriftCheckExplainability": "additional_inference_specification_definition",
+    "DriftCheckModelQuality": "additional_inference_specification_definition",
+    "DriftCheckModelDataQuality": "additional_inference_specification_definition",
+    "DriftCheckBaselines": "additional_inference_specification_definition",
+    "ModelPackageStatusItem": "additional_inference_specification_definition",
+    "ModelPackageStatusDetails": "additional_inference_specification_definition",
+    "ModelPackageSummary": "additional_inference_specification_definition",
+    "ModelInput": "additional_s3_data_source",
+    "AdditionalS3DataSource": "additional_s3_data_source",
+    "ModelPackageContainerDefinition": "additional_s3_data_source",
+    "TransformJobDefinition": "additional_s3_data_source",
+    "InferenceSpecification": "additional_s3_data_source",
+    "AgentVersion": "agent_version",
+    "DeviceStats": "agent_version",
+    "EdgeModelStat": "agent_version",
+    "Alarm": "alarm",
+    "AutoRollbackConfig": "alarm",
+    "CapacitySize": "alarm",
+    "TrafficRoutingConfig": "alarm",
+    "BlueGreenUpdatePolicy": "alarm",
+    "RollingUpdatePolicy": "alarm",
+    "DeploymentConfig": "alarm",
+    "DataCaptureConfigSummary": "alarm",
+    "ProductionVariantStatus": "alarm",
+    "ProductionVariantSummary": "alarm",
+    "PendingProductionVariantSummary": "alarm",
+    "PendingDeploymentSummary": "alarm",
+    "EndpointSummary": "alarm",
+    "VariantProperty": "alarm",
+    "InternalStreamFailure": "alarm",
+    "PayloadPart": "alarm",
+    "ModelStreamError": "alarm",
+    "ResponseStream": "alarm",
+    "TrainingRepositoryAuthConfig": "algorithm_specification",
+    "TrainingImageConfig": "algorithm_specification",
+    "AlgorithmSpecification": "algorithm_specification",
+    "CollectionConfiguration": "algorithm_specification",
+    "DebugHookConfig": "algorithm_specification",
+    "DebugRuleConfiguration": "algorithm_specification",
+    "TensorBoardOutputConfig": "algorithm_specification",
+    "ProfilerConfig": "algorithm_specification",
+    "ProfilerRuleConfiguration": "algorithm_specification",
+    "RemoteDebugConfig": "algorithm_specification",
+    "InfraCheckConfig": "algorithm_specification",
+    "DebugRuleEvaluationStatus": "algorithm_specification",
+    "WarmPoolStatus": "algorithm_specification",
+    "SecondaryStatusTransition": "algorithm_specification",
+    "MetricData": "algorithm_specification",
+    "ProfilerRuleEvaluationStatus": "algorithm_specification",
+    "TrainingJobSummary": "algorithm_specification",
+    "ProfilerConfigForUpdate": "algorithm_specification",
+    "RemoteDebugConfigForUpdate": "algorithm_specification",
+    "ResourceConfigForUpdate": "algorithm_specification",
+    "AlgorithmStatusItem": "algorithm_status_details",
+    "AlgorithmStatusDetails": "algorithm_status_details",
+    "AlgorithmSummary": "algorithm_status_details",
+    "TrainingJobDefinition": "algorithm_status_details",
+    "AlgorithmValidationProfile": "algorithm_status_details",
+    "AlgorithmValidationSpecification": "algorithm_status_details",
+    "CategoricalParameterRangeSpecification": "algorithm_status_details",
+    "ChannelSpecification": "algorithm_status_details",
+    "ContinuousParameterRangeSpecification": "algorithm_status_details",
+    "IntegerParameterRangeSpecification": "algorithm_status_details",
+    "ParameterRange": "algorithm_status_details",
+    "HyperParameterSpecification": "algorithm_status_details",
+    "TrainingSpecification": "algorithm_status_details",
+    "AnnotationConsolidationConfig": "annotation_consolidation_config",
+    "LabelingJobS3DataSource": "annotation_consolidation_config",
+    "LabelingJobSnsDataSource": "annotation_consolidation_config",
+    "LabelingJobDataSource": "annotation_consolidation_config",
+    "LabelingJobDataAttributes": "annotation_consolidation_config",
+    "LabelingJobInputConfig": "annotation_consolidation_config",
+    "LabelingJobOutputConfig": "annotation_consolidation_config",
+    "LabelingJobStoppingConditions": "annotation_consolidation_config",
+    "LabelingJobResourceConfig": "annotation_consolidation_config",
+    "LabelingJobAlgorithmsConfig": "annotation_consolidation_config",
+    "UiConfig": "annotation_consolidation_config",
+    "HumanTaskConfig": "annotation_consolidation_config",
+    "LabelCounters": "annotation_consolidation_config",
+    "LabelingJobOutput": "annotation_consolidation_config",
+    "LabelingJobSummary": "annotation_consolidation_config",
+    "AppDetails": "app_details",
+    "KernelSpec": "app_image_config_details",
+    "FileSystemConfig": "app_image_config_details",
+    "KernelGatewayImageConfig": "app_image_config_details",
+    "ContainerConfig": "app_image_config_details",
+    "JupyterLabAppImageConfig": "app_image_config_details",
+    "AppImageConfigDetails": "app_image_config_details",
+    "AppSpecification": "app_specification",
+    "AthenaDatasetDefinition": "app_specification",
+    "ProcessingS3Input": "app_specification",
+    "RedshiftDatasetDefinition": "app_specification",
+    "DatasetDefinition": "app_specification",
+    "ProcessingInput": "app_specification",
+    "ProcessingS3Output": "app_specification",
+    "ProcessingFeatureStoreOutput": "app_specification",
+    "ProcessingOutput": "app_specification",
+    "ProcessingOutputConfig": "app_specification",
+    "ProcessingClusterConfig": "app_specification",
+    "ProcessingResources": "app_specification",
+    "ProcessingStoppingCondition": "app_specification",
+    "ProcessingJobSummary": "app_specification",
+    "ArtifactSourceType": "artifact_source",
+    "ArtifactSource": "artifact_source",
+    "ArtifactSummary": "artifact_source",
+    "AssociationSummary": "association_summary",
+    "AsyncInferenceClientConfig": "async_inference_client_config",
+    "AsyncInferenceNotificationConfig": "async_inference_client_config",
+    "AsyncInferenceOutputConfig": "async_inference_client_config",
+    "AsyncInferenceConfig": "async_inference_client_config",
+    "ClarifyInferenceConfig": "async_inference_client_config",
+    "ClarifyShapBaselineConfig": "async_inference_client_config",
+    "ClarifyTextConfig": "async_inference_client_config",
+    "ClarifyShapConfig": "async_inference_client_config",
+    "ClarifyExplainerConfig": "async_inference_client_config",
+    "ProductionVariantManagedInstanceScaling": "async_inference_client_config",
+    "ProductionVariantRoutingConfig": "async_inference_client_config",
+    "ExplainerConfig": "async_inference_client_config",
+    "AutoMLAlgorithmConfig": "auto_m_l_algorithm_config",
+    "FinalAutoMLJobObjectiveMetric": "auto_m_l_algorithm_config",
+    "AutoMLCandidateStep": "auto_m_l_algorithm_config",
+    "AutoMLContainerDefinition": "auto_m_l_algorithm_config",
+    "CandidateArtifactLocations": "auto_m_l_algorithm_config",
+    "MetricDatum": "auto_m_l_algorithm_config",
+    "CandidateProperties": "auto_m_l_algorithm_config",
+    "AutoMLCandidate": "auto_m_l_algorithm_config",
+    "AutoMLS3DataSource": "auto_m_l_algorithm_config",
+    "AutoMLDataSource": "auto_m_l_algorithm_config",
+    "AutoMLDataSplitConfig": "auto_m_l_algorithm_config",
+    "AutoMLJobArtifacts": "auto_m_l_algorithm_config",
+    "AutoMLJobCompletionCriteria": "auto_m_l_algorithm_config",
+    "AutoMLSecurityConfig": "auto_m_l_algorithm_config",
+    "AutoMLJobObjective": "auto_m_l_algorithm_config",
+    "AutoMLPartialFailureReason": "auto_m_l_algorithm_config",
+    "AutoMLOutputDataConfig": "auto_m_l_algorithm_config",
+    "ModelDeployConfig": "auto_m_l_algorithm_config",
+    "ModelDeployResult": "auto_m_l_algorithm_config",
+    "AutoMLCandidateGenerationConfig": "auto_m_l_candidate_generation_config",
+    "AutoMLChannel": "auto_m_l_candidate_generation_config",
+    "AutoMLJobConfig": "auto_m_l_candidate_generation_config",
+    "AutoMLJobSummary": "auto_m_l_candidate_generation_config",
+    "ResolvedAttributes": "auto_m_l_candidate_generation_config",
+    "AutoMLJobChannel": "auto_m_l_job_channel",
+    "ImageClassificationJobConfig": "auto_m_l_job_channel",
+    "TextClassificationJobConfig": "auto_m_l_job_channel",
+    "TimeSeriesTransformations": "auto_m_l_job_channel",
+    "TimeSeriesConfig": "auto_m_l_job_channel",
+    "HolidayConfigAttributes": "auto_m_l_job_channel",
+    "TimeSeriesForecastingJobConfig": "auto_m_l_job_channel",
+    "CandidateGenerationConfig": "auto_m_l_job_channel",
+    "TabularJobConfig": "auto_m_l_job_channel",
+    "TextGenerationJobConfig": "auto_m_l_job_channel",
+    "AutoMLProblemTypeConfig": "auto_m_l_job_channel",
+    "TabularResolvedAttributes": "auto_m_l_job_channel",
+    "TextGenerationResolvedAttributes": "auto_m_l_job_channel",
+    "AutoMLProblemTypeResolvedAttributes": "auto_m_l_job_channel",
+    "AutoMLResolvedAttributes": "auto_m_l_job_channel",
+    "AutoMLJobStepMetadata": "auto_m_l_job_step_metadata",
+    "CacheHitResult": "auto_m_l_job_step_metadata",
+    "CallbackStepMetadata": "auto_m_l_job_step_metadata",
+    "ClarifyCheckStepMetadata": "auto_m_l_job_step_metadata",
+    "ConditionStepMetadata": "auto_m_l_job_step_metadata",
+    "EMRStepMetadata": "auto_m_l_job_step_metadata",
+    "FailStepMetadata": "auto_m_l_job_step_metadata",
+    "LambdaStepMetadata": "auto_m_l_job_step_metadata",
+    "TrainingJobStepMetadata": "auto_m_l_job_step_metadata",
+    "ProcessingJobStepMetadata": "auto_m_l_job_step_metadata",
+    "TransformJobStepMetadata": "auto_m_l_job_step_metadata",
+    "TuningJobStepMetaData": "auto_m_l_job_step_metadata",
+    "ModelStepMetadata": "auto_m_l_job_step_metadata",
+    "RegisterModelStepMetadata": "auto_m_l_job_step_metadata",
+    "QualityCheckStepMetadata": "auto_m_l_job_step_metadata",
+    "PipelineExecutionStepMetadata": "auto_m_l_job_step_metadata",
+    "SelectiveExecutionResult": "auto_m_l_job_step_metadata",
+    "PipelineExecutionStep": "auto_m_l_job_step_metadata",
+    "AutoParameter": "auto_parameter",
+    "Autotune": "auto_parameter",
+    "BestObjectiveNotImproving": "auto_parameter",
+    "CategoricalParameterRange": "auto_parameter",
+    "ContinuousParameterRange": "auto_parameter",
+    "ConvergenceDetected": "auto_parameter",
+    "HyperbandStrategyConfig": "auto_parameter",
+    "HyperParameterTuningJobStrategyConfig": "auto_parameter",
+    "ResourceLimits": "auto_parameter",
+    "IntegerParameterRange": "auto_parameter",
+    "ParameterRanges": "auto_parameter",
+    "TuningJobCompletionCriteria": "auto_parameter",
+    "HyperParameterTuningJobConfig": "auto_parameter",
+    "HyperParameterAlgorithmSpecification": "auto_parameter",
+    "HyperParameterTuningInstanceConfig": "auto_parameter",
+    "HyperParameterTuningResourceConfig": "auto_parameter",
+    "HyperParameterTrainingJobDefinition": "auto_parameter",
+    "ParentHyperParameterTuningJob": "auto_parameter",
+    "HyperParameterTuningJobWarmStartConfig": "auto_parameter",
+    "TrainingJobStatusCounters": "auto_parameter",
+    "ObjectiveStatusCounters": "auto_parameter",
+    "FinalHyperParameterTuningJobObjectiveMetric": "auto_parameter",
+    "HyperParameterTrainingJobSummary": "auto_parameter",
+    "HyperParameterTuningJobCompletionDetails": "auto_parameter",
+    "HyperParameterTuningJobConsumedResources": "auto_parameter",
+    "HyperParameterTuningJobSummary": "auto_parameter",
+    "BatchDataCaptureConfig": "batch_data_capture_config",
+    "ModelClientConfig": "batch_data_capture_config",
+    "DataProcessing": "batch_data_capture_config",
+    "TransformJobSummary": "batch_data_capture_config",
+    "MonitoringCsvDatasetFormat": "batch_transform_input",
+    "MonitoringJsonDatasetFormat": "batch_transform_input",
+    "MonitoringParquetDatasetFormat": "batch_transform_input",
+    "MonitoringDatasetFormat": "batch_transform_input",
+    "BatchTransformInput": "batch_transform_input",
+    "MonitoringConstraintsResource": "batch_transform_input",
+    "EndpointInput": "batch_transform_input",
+    "MonitoringS3Output": "batch_transform_input",
+    "MonitoringOutput": "batch_transform_input",
+    "MonitoringOutputConfig": "batch_transform_input",
+    "MonitoringClusterConfig": "batch_transform_input",
+    "MonitoringResources": "batch_transform_input",
+    "MonitoringStoppingCondition": "batch_transform_input",
+    "TimeSeriesForecastingSettings": "canvas_app_settings",
+    "ModelRegisterSettings": "canvas_app_settings",
+    "WorkspaceSettings": "canvas_app_settings",
+    "IdentityProviderOAuthSetting": "canvas_app_settings",
+    "DirectDeploySettings": "canvas_app_settings",
+    "KendraSettings": "canvas_app_settings",
+    "GenerativeAiSettings": "canvas_app_settings",
+    "CanvasAppSettings": "canvas_app_settings",
+    "CodeEditorAppSettings": "canvas_app_settings",
+    "SharingSettings": "canvas_app_settings",
+    "TensorBoardAppSettings": "canvas_app_settings",
+    "RStudioServerProAppSettings": "canvas_app_settings",
+    "RSessionAppSettings": "canvas_app_settings",
+    "JupyterLabAppSettings": "canvas_app_settings",
+    "DefaultEbsStorageSettings": "canvas_app_settings",
+    "DefaultSpaceStorageSettings": "canvas_app_settings",
+    "CustomPosixUserConfig": "canvas_app_settings",
+    "EFSFileSystemConfig": "canvas_app_settings",
+    "CustomFileSystemConfig": "canvas_app_settings",
+    "UserSettings": "canvas_app_settings",
+    "CaptureContentTypeHeader": "capture_content_type_header",
+    "CaptureOption": "capture_option",
+    "ProductionVariantCoreDumpConfig": "capture_option",
+    "ProductionVariant": "capture_option",
+    "DataCaptureConfig": "capture_option",
+    "EndpointConfigSummary": "capture_option",
+    "CategoricalParameter": "categorical_parameter",
+    "Phase": "categorical_parameter",
+    "Stairs": "categorical_parameter",
+    "TrafficPattern": "categorical_parameter",
+    "RecommendationJobResourceLimit": "categorical_parameter",
+    "EnvironmentParameterRanges": "categorical_parameter",
+    "EndpointInputConfiguration": "categorical_parameter",
+    "RecommendationJobPayloadConfig": "categorical_parameter",
+    "RecommendationJobContainerConfig": "categorical_parameter",
+    "EndpointInfo": "categorical_parameter",
+    "RecommendationJobVpcConfig": "categorical_parameter",
+    "RecommendationJobInputConfig": "categorical_parameter",
+    "ModelLatencyThreshold": "categorical_parameter",
+    "RecommendationJobStoppingConditions": "categorical_parameter",
+    "RecommendationJobCompiledOutputConfig": "categorical_parameter",
+    "RecommendationJobOutputConfig": "categorical_parameter",
+    "RecommendationMetrics": "categorical_parameter",
+    "EndpointOutputConfiguration": "categorical_parameter",
+    "EnvironmentParameter": "categorical_parameter",
+    "ModelConfiguration": "categorical_parameter",
+    "InferenceRecommendation": "categorical_parameter",
+    "InferenceMetrics": "categorical_parameter",
+    "EndpointPerformance": "categorical_parameter",
+    "InferenceRecommendationsJob": "categorical_parameter",
+    "MetricDefinition": "channel",
+    "S3DataSource": "channel",
+    "FileSystemDataSource": "channel",
+    "DataSource": "channel",
+    "ShuffleConfig": "channel",
+    "Channel": "channel",
+    "OutputDataConfig": "channel",
+    "InstanceGroup": "channel",
+    "ResourceConfig": "channel",
+    "CheckpointConfig": "checkpoint_config",
+    "RetryStrategy": "checkpoint_config",
+    "ClusterLifeCycleConfig": "cluster_instance_group_details",
+    "ClusterInstanceGroupDetails": "cluster_instance_group_details",
+    "ClusterInstanceGroupSpecification": "cluster_instance_group_details",
+    "ClusterSummary": "cluster_instance_group_details",
+    "ClusterInstanceStatusDetails": "cluster_instance_status_details",
+    "ClusterNodeDetails": "cluster_node_details",
+    "ClusterNodeSummary": "cluster_node_summary",
+    "CodeRepository": "code_repository",
+    "JupyterServerAppSettings": "code_repository",
+    "CustomImage": "code_repository",
+    "KernelGatewayAppSettings": "code_repository",
+    "CodeRepositorySummary": "code_repository_summary",
+    "CognitoConfig": "cognito_config",
+    "OidcConfig": "cognito_config",
+    "SourceIpConfig": "cognito_config",
+    "WorkforceVpcConfigRequest": "cognito_config",
+    "OidcConfigForResponse": "cognito_config",
+    "WorkforceVpcConfigResponse": "cognito_config",
+    "Workforce": "cognito_config",
+    "CognitoMemberDefinition": "cognito_member_definition",
+    "OidcMemberDefinition": "cognito_member_definition",
+    "MemberDefinition": "cognito_member_definition",
+    "NotificationConfiguration": "cognito_member_definition",
+    "SubscribedWorkteam": "cognito_member_definition",
+    "Workteam": "cognito_member_definition",
+    "LabelCountersForWorkteam": "cognito_member_definition",
+    "LabelingJobForWorkteamSummary": "cognito_member_definition",
+    "VectorConfig": "collection_config",
+    "CollectionConfig": "collection_config",
+    "FeatureDefinition": "collection_config",
+    "OnlineStoreSecurityConfig": "collection_config",
+    "TtlDuration": "collection_config",
+    "OnlineStoreConfig": "collection_config",
+    "S3StorageConfig": "collection_config",
+    "DataCatalogConfig": "collection_config",
+    "OfflineStoreConfig": "collection_config",
+    "ThroughputConfig": "collection_config",
+    "ThroughputConfigDescription": "collection_config",
+    "OfflineStoreStatus": "collection_config",
+    "LastUpdateStatus": "collection_config",
+    "FeatureGroupSummary": "collection_config",
+    "OnlineStoreConfigUpdate": "collection_config",
+    "ThroughputConfigUpdate": "collection_config",
+    "CompilationJobSummary": "compilation_job_summary",
+    "InputConfig": "compilation_job_summary",
+    "TargetPlatform": "compilation_job_summary",
+    "OutputConfig": "compilation_job_summary",
+    "NeoVpcConfig": "compilation_job_summary",
+    "DerivedInformation": "compilation_job_summary",
+    "ModelDigests": "compilation_job_summary",
+    "ConflictException": "conflict_exception",
+    "RepositoryAuthConfig": "container_definition",
+    "ImageConfig": "container_definition",
+    "MultiModelConfig": "container_definition",
+    "ContainerDefinition": "container_definition",
+    "InferenceExecutionConfig": "container_definition",
+    "RealTimeInferenceRecommendation": "container_definition",
+    "DeploymentRecommendation": "container_definition",
+    "ModelSummary": "container_definition",
+    "ContextSource": "context_source",
+    "ContextSummary": "context_source",
+    "SpaceCodeEditorAppSettings": "custom_file_system",
+    "SpaceJupyterLabAppSettings": "custom_file_system",
+    "EbsStorageSettings": "custom_file_system",
+    "SpaceStorageSettings": "custom_file_system",
+    "EFSFileSystem": "custom_file_system",
+    "CustomFileSystem": "custom_file_system",
+    "SpaceSettings": "custom_file_system",
+    "OwnershipSettings": "custom_file_system",
+    "SpaceSharingSettings": "custom_file_system",
+    "SpaceSettingsSummary": "custom_file_system",
+    "SpaceSharingSettingsSummary": "custom_file_system",
+    "OwnershipSettingsSummary": "custom_file_system",
+    "SpaceDetails": "custom_file_system",
+    "CustomizedMetricSpecification": "customized_metric_specification",
+    "PredefinedMetricSpecification": "customized_metric_specification",
+    "MetricSpecification": "customized_metric_specification",
+    "TargetTrackingScalingPolicyConfiguration": "customized_metric_specification",
+    "ScalingPolicy": "customized_metric_specification",
+    "DynamicScalingConfiguration": "customized_metric_specification",
+    "ScalingPolicyObjective": "customized_metric_specification",
+    "ScalingPolicyMetric": "customized_metric_specification",
+    "DataQualityBaselineConfig": "data_quality_app_specification",
+    "DataQualityAppSpecification": "data_quality_app_specification",
+    "DataQualityJobInput": "data_quality_app_specification",
+    "RStudioServerProDomainSettings": "default_space_settings",
+    "DockerSettings": "default_space_settings",
+    "DomainSettings": "default_space_settings",
+    "DefaultSpaceSettings": "default_space_settings",
+    "RetentionPolicy": "default_space_settings",
+    "DomainDetails": "default_space_settings",
+    "RStudioServerProDomainSettingsForUpdate": "default_space_settings",
+    "DomainSettingsForUpdate": "default_space_settings",
+    "DeployedImage": "deployed_image",
+    "DeviceSelectionConfig": "deployment_stage",
+    "EdgeDeploymentConfig": "deployment_stage",
+    "DeploymentStage": "deployment_stage",
+    "EdgeDeploymentModelConfig": "deployment_stage_status_summary",
+    "EdgeDeploymentStatus": "deployment_stage_status_summary",
+    "DeploymentStageStatusSummary": "deployment_stage_status_summary",
+    "EdgeDeploymentPlanSummary": "deployment_stage_status_summary",
+    "ProductionVariantServerlessUpdateConfig": "desired_weight_and_capacity",
+    "DesiredWeightAndCapacity": "desired_weight_and_capacity",
+    "Device": "device",
+    "DeviceDeploymentSummary": "device",
+    "EdgeModelSummary": "device",
+    "DeviceSummary": "device",
+    "DeviceFleetSummary": "device_fleet_summary",
+    "Edge": "edge",
+    "QueryFilters": "edge",
+    "Vertex": "edge",
+    "EdgeModel": "edge_model",
+    "EdgeOutputConfig": "edge_output_config",
+    "EdgePresetDeploymentOutput": "edge_packaging_job_summary",
+    "EdgePackagingJobSummary": "edge_packaging_job_summary",
+    "MonitoringSchedule": "endpoint",
+    "Endpoint": "endpoint",
+    "Experiment": "endpoint",
+    "FeatureGroup": "endpoint",
+    "FeatureMetadata": "endpoint",
+    "Filter": "endpoint",
+    "HyperParameterTuningJobSearchEntity": "endpoint",
+    "Model": "endpoint",
+    "ModelCard": "endpoint",
+    "ModelDashboardEndpoint": "endpoint",
+    "TransformJob": "endpoint",
+    "ModelDashboardMonitoringSchedule": "endpoint",
+    "ModelDashboardModelCard": "endpoint",
+    "ModelDashboardModel": "endpoint",
+    "ModelPackage": "endpoint",
+    "ModelPackageGroup": "endpoint",
+    "NestedFilters": "endpoint",
+    "Parent": "endpoint",
+    "Pipeline": "endpoint",
+    "PipelineExecution": "endpoint",
+    "ProcessingJob": "endpoint",
+    "Project": "endpoint",
+    "SearchExpression": "endpoint",
+    "TrainingJob": "endpoint",
+    "TrialComponentSimpleSummary": "endpoint",
+    "Trial": "endpoint",
+    "TrialComponentSourceDetail": "endpoint",
+    "TrialComponent": "endpoint",
+    "SearchRecord": "endpoint",
+    "VisibilityConditions": "endpoint",
+    "InferenceExperimentSchedule": "endpoint_metadata",
+    "RealTimeInferenceConfig": "endpoint_metadata",
+    "ModelInfrastructureConfig": "endpoint_metadata",
+    "ModelVariantConfig": "endpoint_metadata",
+    "InferenceExperimentDataStorageConfig": "endpoint_metadata",
+    "ShadowModelVariantConfig": "endpoint_metadata",
+    "ShadowModeConfig": "endpoint_metadata",
+    "EndpointMetadata": "endpoint_metadata",
+    "ModelVariantConfigSummary": "endpoint_metadata",
+    "InferenceExperimentSummary": "endpoint_metadata",
+    "ExperimentConfig": "experiment_config",
+    "ExperimentSource": "experiment_source",
+    "ExperimentSummary": "experiment_source",
+    "FeatureParameter": "feature_parameter",
+    "HumanLoopRequestSource": "flow_definition_output_config",
+    "HumanLoopActivationConditionsConfig": "flow_definition_output_config",
+    "HumanLoopActivationConfig": "flow_definition_output_config",
+    "HumanLoopConfig": "flow_definition_output_config",
+    "FlowDefinitionOutputConfig": "flow_definition_output_config",
+    "FlowDefinitionSummary": "flow_definition_output_config",
+    "GitConfig": "git_config",
+    "GitConfigForUpdate": "git_config",
+    "HubContentDependency": "hub_content_dependency",
+    "HubContentInfo": "hub_content_dependency",
+    "HubS3StorageConfig": "hub_info",
+    "HubInfo": "hub_info",
+    "UiTemplate": "human_task_ui_summary",
+    "UiTemplateInfo": "human_task_ui_summary",
+    "HumanTaskUiSummary": "human_task_ui_summary",
+    "HyperParameterTuningJobObjective": "hyper_parameter_tuning_job_objective",
+    "IamIdentity": "iam_identity",
+    "UserContext": "iam_identity",
+    "Image": "image",
+    "ImageVersion": "image_version",
+    "InferenceComponentContainerSpecification": "inference_component_compute_resource_requirements",
+    "InferenceComponentStartupParameters": "inference_component_compute_resource_requirements",
+    "InferenceComponentComputeResourceRequirements": "inference_component_compute_resource_requirements",
+    "InferenceComponentSpecification": "inference_component_compute_resource_requirements",
+    "InferenceComponentRuntimeConfig": "inference_component_compute_resource_requirements",
+    "InferenceComponentContainerSpecificationSummary": "inference_component_compute_resource_requirements",
+    "InferenceComponentSpecificationSummary": "inference_component_compute_resource_requirements",
+    "InferenceComponentRuntimeConfigSummary": "inference_component_compute_resource_requirements",
+    "InferenceComponentSummary": "inference_component_compute_resource_requirements",
+    "RecommendationJobInferenceBenchmark": "inference_recommendations_job_step",
+    "InferenceRecommendationsJobStep": "inference_recommendations_job_step",
+    "InstanceMetadataServiceConfiguration": "instance_metadata_service_configuration",
+    "NotebookInstanceSummary": "instance_metadata_service_configuration",
+    "InternalDependencyException": "internal_dependency_exception",
+    "InternalFailure": "internal_failure",
+    "LineageGroupSummary": "lineage_group_summary",
+    "MetadataProperties": "metadata_properties",
+    "ModelAccessConfig": "model_access_config",
+    "ModelArtifacts": "model_artifacts",
+    "ModelBiasBaselineConfig": "model_bias_app_specification",
+    "ModelBiasAppSpecification": "model_bias_app_specification",
+    "ModelBiasJobInput": "model_bias_app_specification",
+    "ModelCardExportOutputConfig": "model_card_export_artifacts",
+    "ModelCardExportArtifacts": "model_card_export_artifacts",
+    "ModelCardExportJobSummary": "model_card_export_artifacts",
+    "ModelCardSecurityConfig": "model_card_security_config",
+    "ModelCardSummary": "model_card_security_config",
+    "ModelCardVersionSummary": "model_card_version_summary",
+    "ModelDashboardIndicatorAction": "model_dashboard_indicator_action",
+    "MonitoringAlertActions": "model_dashboard_indicator_action",
+    "MonitoringAlertSummary": "model_dashboard_indicator_action",
+    "S3ModelDataSource": "model_data_source",
+    "ModelDataSource": "model_data_source",
+    "ModelError": "model_error",
+    "ModelExplainabilityBaselineConfig": "model_explainability_app_specification",
+    "ModelExplainabilityAppSpecification": "model_explainability_app_specification",
+    "ModelExplainabilityJobInput": "model_explainability_app_specification",
+    "ModelMetadataFilter": "model_metadata_filter",
+    "ModelMetadataSearchExpression": "model_metadata_filter",
+    "ModelMetadataSummary": "model_metadata_filter",
+    "ModelNotReadyException": "model_not_ready_exception",
+    "ModelPackageGroupSummary": "model_package_group_summary",
+    "ModelQualityBaselineConfig": "model_quality_app_specification",
+    "ModelQualityAppSpecification": "model_quality_app_specification",
+    "ModelQualityJobInput": "model_quality_app_specification",
+    "MonitoringAlertHistorySummary": "monitoring_alert_history_summary",
+    "ScheduleConfig": "monitoring_app_specification",
+    "MonitoringBaselineConfig": "monitoring_app_specification",
+    "MonitoringInput": "monitoring_app_specification",
+    "MonitoringAppSpecification": "monitoring_app_specification",
+    "MonitoringJobDefinition": "monitoring_app_specification",
+    "MonitoringScheduleConfig": "monitoring_app_specification",
+    "MonitoringExecutionSummary": "monitoring_app_specification",
+    "MonitoringScheduleSummary": "monitoring_app_specification",
+    "MonitoringGroundTruthS3Input": "monitoring_ground_truth_s3_input",
+    "MonitoringNetworkConfig": "monitoring_job_definition_summary",
+    "MonitoringJobDefinitionSummary": "monitoring_job_definition_summary",
+    "MonitoringStatisticsResource": "monitoring_statistics_resource",
+    "NetworkConfig": "network_config",
+    "NotebookInstanceLifecycleHook": "notebook_instance_lifecycle_config_summary",
+    "NotebookInstanceLifecycleConfigSummary": "notebook_instance_lifecycle_config_summary",
+    "OutputParameter": "output_parameter",
+    "ParallelismConfiguration": "parallelism_configuration",
+    "PipelineExperimentConfig": "parameter",
+    "SelectedStep": "parameter",
+    "SelectiveExecutionConfig": "parameter",
+    "PipelineExecutionSummary": "parameter",
+    "Parameter": "parameter",
+    "PipelineDefinitionS3Location": "pipeline_definition_s3_location",
+    "PipelineSummary": "pipeline_definition_s3_location",
+    "ProductionVariantServerlessConfig": "production_variant_serverless_config",
+    "ProvisioningParameter": "project_summary",
+    "ServiceCatalogProvisioningDetails": "project_summary",
+    "ServiceCatalogProvisionedProductDetails": "project_summary",
+    "ProjectSummary": "project_summary",
+    "ServiceCatalogProvisioningUpdateDetails": "project_summary",
+    "PropertyNameQuery": "property_name_query",
+    "SuggestionQuery": "property_name_query",
+    "PropertyNameSuggestion": "property_name_query",
+    "USD": "public_workforce_task_price",
+    "PublicWorkforceTaskPrice": "public_workforce_task_price",
+    "RenderableTask": "renderable_task",
+    "RenderingError": "renderable_task",
+    "ResourceCatalog": "resource_catalog",
+    "ResourceInUse": "resource_in_use",
+    "ResourceLimitExceeded": "resource_limit_exceeded",
+    "ResourceNotFound": "resource_not_found",
+    "ResourceSpec": "resource_spec",
+    "ServiceUnavailable": "service_unavailable",
+    "StoppingCondition": "stopping_condition",
+    "StudioLifecycleConfigDetails": "studio_lifecycle_config_details",
+    "Tag": "tag",
+    "TransformS3DataSource": "transform_data_source",
+    "TransformDataSource": "transform_data_source",
+    "TransformInput": "transform_data_source",
+    "TransformOutput": "transform_data_source",
+    "TransformResources": "transform_data_source",
+    "TrialComponentStatus": "trial_component_artifact",
+    "TrialComponentParameterValue": "trial_component_artifact",
+    "TrialComponentArtifact": "trial_component_artifact",
+    "TrialComponentSource": "trial_component_artifact",
+    "TrialComponentMetricSummary": "trial_component_artifact",
+    "TrialComponentSummary": "trial_component_artifact",
+    "TrialSource": "trial_source",
+    "TrialSummary": "trial_source",
+    "UserProfileDetails": "user_profile_details",
+    "ValidationError": "validation_error",
+    "VpcConfig": "vpc_config",
+}
+
+__all__ = ["Base", "Unassigned", *_SHAPE_MODULES]
+
+
+def __getattr__(name):
+    module_name = _SHAPE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SHAPE_MODULES))
+
+
+def warm_up(
+    names: Optional[Iterable[str]] = None, background: bool = True
+) -> Optional[Thread]:
+    """
+    Imports classes and builds their deferred validators ahead of their first use.
+
+    Args:
+        names (Iterable[str]): The names of the classes, defaults to all the classes.
+        background (bool): Whether to build them on a daemon thread.
+
+    Returns:
+        Optional[Thread]: The started thread if background, None otherwise.
+    """
+    names = list(_SHAPE_MODULES if names is None else names)
+    return build_models(lambda: (__getattr__(name) for name in names), background)
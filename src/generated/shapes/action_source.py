@@ -0,0 +1,59 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ActionSource(Base):
+    """
+    ActionSource
+         <p>A structure describing the source of an action.</p>
+
+        Attributes
+       ----------------------
+       source_uri: 	 <p>The URI of the source.</p>
+       source_type: 	 <p>The type of the source.</p>
+       source_id: 	 <p>The ID of the source.</p>
+    """
+
+    source_uri: str
+    source_type: Optional[str] = Unassigned()
+    source_id: Optional[str] = Unassigned()
+
+
+class ActionSummary(Base):
+    """
+    ActionSummary
+         <p>Lists the properties of an <i>action</i>. An action represents an action or activity. Some examples are a workflow step and a model deployment. Generally, an action involves at least one input artifact or output artifact.</p>
+
+        Attributes
+       ----------------------
+       action_arn: 	 <p>The Amazon Resource Name (ARN) of the action.</p>
+       action_name: 	 <p>The name of the action.</p>
+       source: 	 <p>The source of the action.</p>
+       action_type: 	 <p>The type of the action.</p>
+       status: 	 <p>The status of the action.</p>
+       creation_time: 	 <p>When the action was created.</p>
+       last_modified_time: 	 <p>When the action was last modified.</p>
+    """
+
+    action_arn: Optional[str] = Unassigned()
+    action_name: Optional[str] = Unassigned()
+    source: Optional[ActionSource] = Unassigned()
+    action_type: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
@@ -0,0 +1,403 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .additional_s3_data_source import (
+    InferenceSpecification,
+    ModelPackageContainerDefinition,
+    TransformJobDefinition,
+)
+from .model_data_source import ModelDataSource
+
+
+class AdditionalInferenceSpecificationDefinition(Base):
+    """
+    AdditionalInferenceSpecificationDefinition
+         <p>A structure of additional Inference Specification. Additional Inference Specification specifies details about inference jobs that can be run with models based on this model package</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>A unique name to identify the additional inference specification. The name must be unique within the list of your additional inference specifications for a particular model package.</p>
+       description: 	 <p>A description of the additional Inference specification</p>
+       containers: 	 <p>The Amazon ECR registry path of the Docker image that contains the inference code.</p>
+       supported_transform_instance_types: 	 <p>A list of the instance types on which a transformation job can be run or on which an endpoint can be deployed.</p>
+       supported_realtime_inference_instance_types: 	 <p>A list of the instance types that are used to generate inferences in real-time.</p>
+       supported_content_types: 	 <p>The supported MIME types for the input data.</p>
+       supported_response_m_i_m_e_types: 	 <p>The supported MIME types for the output data.</p>
+    """
+
+    name: str
+    containers: List[ModelPackageContainerDefinition]
+    description: Optional[str] = Unassigned()
+    supported_transform_instance_types: Optional[List[str]] = Unassigned()
+    supported_realtime_inference_instance_types: Optional[List[str]] = Unassigned()
+    supported_content_types: Optional[List[str]] = Unassigned()
+    supported_response_m_i_m_e_types: Optional[List[str]] = Unassigned()
+
+
+class BatchDescribeModelPackageError(Base):
+    """
+    BatchDescribeModelPackageError
+         <p>The error code and error description associated with the resource.</p>
+
+        Attributes
+       ----------------------
+       error_code: 	 <p/>
+       error_response: 	 <p/>
+    """
+
+    error_code: str
+    error_response: str
+
+
+class BatchDescribeModelPackageSummary(Base):
+    """
+    BatchDescribeModelPackageSummary
+         <p>Provides summary information about the model package.</p>
+
+        Attributes
+       ----------------------
+       model_package_group_name: 	 <p>The group name for the model package</p>
+       model_package_version: 	 <p>The version number of a versioned model.</p>
+       model_package_arn: 	 <p>The Amazon Resource Name (ARN) of the model package.</p>
+       model_package_description: 	 <p>The description of the model package.</p>
+       creation_time: 	 <p>The creation time of the mortgage package summary.</p>
+       inference_specification
+       model_package_status: 	 <p>The status of the mortgage package.</p>
+       model_approval_status: 	 <p>The approval status of the model.</p>
+    """
+
+    model_package_group_name: str
+    model_package_arn: str
+    creation_time: datetime.datetime
+    inference_specification: InferenceSpecification
+    model_package_status: str
+    model_package_version: Optional[int] = Unassigned()
+    model_package_description: Optional[str] = Unassigned()
+    model_approval_status: Optional[str] = Unassigned()
+
+
+class MetricsSource(Base):
+    """
+    MetricsSource
+         <p>Details about the metrics source.</p>
+
+        Attributes
+       ----------------------
+       content_type: 	 <p>The metric source content type.</p>
+       content_digest: 	 <p>The hash key used for the metrics source.</p>
+       s3_uri: 	 <p>The S3 URI for the metrics source.</p>
+    """
+
+    content_type: str
+    s3_uri: str
+    content_digest: Optional[str] = Unassigned()
+
+
+class Bias(Base):
+    """
+    Bias
+         <p>Contains bias metrics for a model.</p>
+
+        Attributes
+       ----------------------
+       report: 	 <p>The bias report for a model</p>
+       pre_training_report: 	 <p>The pre-training bias report for a model.</p>
+       post_training_report: 	 <p>The post-training bias report for a model.</p>
+    """
+
+    report: Optional[MetricsSource] = Unassigned()
+    pre_training_report: Optional[MetricsSource] = Unassigned()
+    post_training_report: Optional[MetricsSource] = Unassigned()
+
+
+class ModelPackageValidationProfile(Base):
+    """
+    ModelPackageValidationProfile
+         <p>Contains data, such as the inputs and targeted instance types that are used in the process of validating the model package.</p> <p>The data provided in the validation profile is made available to your buyers on Amazon Web Services Marketplace.</p>
+
+        Attributes
+       ----------------------
+       profile_name: 	 <p>The name of the profile for the model package.</p>
+       transform_job_definition: 	 <p>The <code>TransformJobDefinition</code> object that describes the transform job used for the validation of the model package.</p>
+    """
+
+    profile_name: str
+    transform_job_definition: TransformJobDefinition
+
+
+class ModelPackageValidationSpecification(Base):
+    """
+    ModelPackageValidationSpecification
+         <p>Specifies batch transform jobs that SageMaker runs to validate your model package.</p>
+
+        Attributes
+       ----------------------
+       validation_role: 	 <p>The IAM roles to be used for the validation of the model package.</p>
+       validation_profiles: 	 <p>An array of <code>ModelPackageValidationProfile</code> objects, each of which specifies a batch transform job that SageMaker runs to validate your model package.</p>
+    """
+
+    validation_role: str
+    validation_profiles: List[ModelPackageValidationProfile]
+
+
+class SourceAlgorithm(Base):
+    """
+    SourceAlgorithm
+         <p>Specifies an algorithm that was used to create the model package. The algorithm must be either an algorithm resource in your SageMaker account or an algorithm in Amazon Web Services Marketplace that you are subscribed to.</p>
+
+        Attributes
+       ----------------------
+       model_data_url: 	 <p>The Amazon S3 path where the model artifacts, which result from model training, are stored. This path must point to a single <code>gzip</code> compressed tar archive (<code>.tar.gz</code> suffix).</p> <note> <p>The model artifacts must be in an S3 bucket that is in the same Amazon Web Services region as the algorithm.</p> </note>
+       model_data_source: 	 <p>Specifies the location of ML model data to deploy during endpoint creation.</p>
+       algorithm_name: 	 <p>The name of an algorithm that was used to create the model package. The algorithm must be either an algorithm resource in your SageMaker account or an algorithm in Amazon Web Services Marketplace that you are subscribed to.</p>
+    """
+
+    algorithm_name: str
+    model_data_url: Optional[str] = Unassigned()
+    model_data_source: Optional[ModelDataSource] = Unassigned()
+
+
+class SourceAlgorithmSpecification(Base):
+    """
+    SourceAlgorithmSpecification
+         <p>A list of algorithms that were used to create a model package.</p>
+
+        Attributes
+       ----------------------
+       source_algorithms: 	 <p>A list of the algorithms that were used to create a model package.</p>
+    """
+
+    source_algorithms: List[SourceAlgorithm]
+
+
+class ModelQuality(Base):
+    """
+    ModelQuality
+         <p>Model quality statistics and constraints.</p>
+
+        Attributes
+       ----------------------
+       statistics: 	 <p>Model quality statistics.</p>
+       constraints: 	 <p>Model quality constraints.</p>
+    """
+
+    statistics: Optional[MetricsSource] = Unassigned()
+    constraints: Optional[MetricsSource] = Unassigned()
+
+
+class ModelDataQuality(Base):
+    """
+    ModelDataQuality
+         <p>Data quality constraints and statistics for a model.</p>
+
+        Attributes
+       ----------------------
+       statistics: 	 <p>Data quality statistics for a model.</p>
+       constraints: 	 <p>Data quality constraints for a model.</p>
+    """
+
+    statistics: Optional[MetricsSource] = Unassigned()
+    constraints: Optional[MetricsSource] = Unassigned()
+
+
+class Explainability(Base):
+    """
+    Explainability
+         <p>Contains explainability metrics for a model.</p>
+
+        Attributes
+       ----------------------
+       report: 	 <p>The explainability report for a model.</p>
+    """
+
+    report: Optional[MetricsSource] = Unassigned()
+
+
+class ModelMetrics(Base):
+    """
+    ModelMetrics
+         <p>Contains metrics captured from a model.</p>
+
+        Attributes
+       ----------------------
+       model_quality: 	 <p>Metrics that measure the quality of a model.</p>
+       model_data_quality: 	 <p>Metrics that measure the quality of the input data for a model.</p>
+       bias: 	 <p>Metrics that measure bias in a model.</p>
+       explainability: 	 <p>Metrics that help explain a model.</p>
+    """
+
+    model_quality: Optional[ModelQuality] = Unassigned()
+    model_data_quality: Optional[ModelDataQuality] = Unassigned()
+    bias: Optional[Bias] = Unassigned()
+    explainability: Optional[Explainability] = Unassigned()
+
+
+class FileSource(Base):
+    """
+    FileSource
+         <p>Contains details regarding the file source.</p>
+
+        Attributes
+       ----------------------
+       content_type: 	 <p>The type of content stored in the file source.</p>
+       content_digest: 	 <p>The digest of the file source.</p>
+       s3_uri: 	 <p>The Amazon S3 URI for the file source.</p>
+    """
+
+    s3_uri: str
+    content_type: Optional[str] = Unassigned()
+    content_digest: Optional[str] = Unassigned()
+
+
+class DriftCheckBias(Base):
+    """
+    DriftCheckBias
+         <p>Represents the drift check bias baselines that can be used when the model monitor is set using the model package.</p>
+
+        Attributes
+       ----------------------
+       config_file: 	 <p>The bias config file for a model.</p>
+       pre_training_constraints: 	 <p>The pre-training constraints.</p>
+       post_training_constraints: 	 <p>The post-training constraints.</p>
+    """
+
+    config_file: Optional[FileSource] = Unassigned()
+    pre_training_constraints: Optional[MetricsSource] = Unassigned()
+    post_training_constraints: Optional[MetricsSource] = Unassigned()
+
+
+class DriftCheckExplainability(Base):
+    """
+    DriftCheckExplainability
+         <p>Represents the drift check explainability baselines that can be used when the model monitor is set using the model package. </p>
+
+        Attributes
+       ----------------------
+       constraints: 	 <p>The drift check explainability constraints.</p>
+       config_file: 	 <p>The explainability config file for the model.</p>
+    """
+
+    constraints: Optional[MetricsSource] = Unassigned()
+    config_file: Optional[FileSource] = Unassigned()
+
+
+class DriftCheckModelQuality(Base):
+    """
+    DriftCheckModelQuality
+         <p>Represents the drift check model quality baselines that can be used when the model monitor is set using the model package. </p>
+
+        Attributes
+       ----------------------
+       statistics: 	 <p>The drift check model quality statistics.</p>
+       constraints: 	 <p>The drift check model quality constraints.</p>
+    """
+
+    statistics: Optional[MetricsSource] = Unassigned()
+    constraints: Optional[MetricsSource] = Unassigned()
+
+
+class DriftCheckModelDataQuality(Base):
+    """
+    DriftCheckModelDataQuality
+         <p>Represents the drift check data quality baselines that can be used when the model monitor is set using the model package. </p>
+
+        Attributes
+       ----------------------
+       statistics: 	 <p>The drift check model data quality statistics.</p>
+       constraints: 	 <p>The drift check model data quality constraints.</p>
+    """
+
+    statistics: Optional[MetricsSource] = Unassigned()
+    constraints: Optional[MetricsSource] = Unassigned()
+
+
+class DriftCheckBaselines(Base):
+    """
+    DriftCheckBaselines
+         <p>Represents the drift check baselines that can be used when the model monitor is set using the model package. </p>
+
+        Attributes
+       ----------------------
+       bias: 	 <p>Represents the drift check bias baselines that can be used when the model monitor is set using the model package. </p>
+       explainability: 	 <p>Represents the drift check explainability baselines that can be used when the model monitor is set using the model package. </p>
+       model_quality: 	 <p>Represents the drift check model quality baselines that can be used when the model monitor is set using the model package.</p>
+       model_data_quality: 	 <p>Represents the drift check model data quality baselines that can be used when the model monitor is set using the model package.</p>
+    """
+
+    bias: Optional[DriftCheckBias] = Unassigned()
+    explainability: Optional[DriftCheckExplainability] = Unassigned()
+    model_quality: Optional[DriftCheckModelQuality] = Unassigned()
+    model_data_quality: Optional[DriftCheckModelDataQuality] = Unassigned()
+
+
+class ModelPackageStatusItem(Base):
+    """
+    ModelPackageStatusItem
+         <p>Represents the overall status of a model package.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the model package for which the overall status is being reported.</p>
+       status: 	 <p>The current status.</p>
+       failure_reason: 	 <p>if the overall status is <code>Failed</code>, the reason for the failure.</p>
+    """
+
+    name: str
+    status: str
+    failure_reason: Optional[str] = Unassigned()
+
+
+class ModelPackageStatusDetails(Base):
+    """
+    ModelPackageStatusDetails
+         <p>Specifies the validation and image scan statuses of the model package.</p>
+
+        Attributes
+       ----------------------
+       validation_statuses: 	 <p>The validation status of the model package.</p>
+       image_scan_statuses: 	 <p>The status of the scan of the Docker image container for the model package.</p>
+    """
+
+    validation_statuses: List[ModelPackageStatusItem]
+    image_scan_statuses: Optional[List[ModelPackageStatusItem]] = Unassigned()
+
+
+class ModelPackageSummary(Base):
+    """
+    ModelPackageSummary
+         <p>Provides summary information about a model package.</p>
+
+        Attributes
+       ----------------------
+       model_package_name: 	 <p>The name of the model package.</p>
+       model_package_group_name: 	 <p>If the model package is a versioned model, the model group that the versioned model belongs to.</p>
+       model_package_version: 	 <p>If the model package is a versioned model, the version of the model.</p>
+       model_package_arn: 	 <p>The Amazon Resource Name (ARN) of the model package.</p>
+       model_package_description: 	 <p>A brief description of the model package.</p>
+       creation_time: 	 <p>A timestamp that shows when the model package was created.</p>
+       model_package_status: 	 <p>The overall status of the model package.</p>
+       model_approval_status: 	 <p>The approval status of the model. This can be one of the following values.</p> <ul> <li> <p> <code>APPROVED</code> - The model is approved</p> </li> <li> <p> <code>REJECTED</code> - The model is rejected.</p> </li> <li> <p> <code>PENDING_MANUAL_APPROVAL</code> - The model is waiting for manual approval.</p> </li> </ul>
+    """
+
+    model_package_arn: str
+    creation_time: datetime.datetime
+    model_package_status: str
+    model_package_name: Optional[str] = Unassigned()
+    model_package_group_name: Optional[str] = Unassigned()
+    model_package_version: Optional[int] = Unassigned()
+    model_package_description: Optional[str] = Unassigned()
+    model_approval_status: Optional[str] = Unassigned()
@@ -0,0 +1,130 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .model_data_source import ModelDataSource
+from .transform_data_source import TransformInput, TransformOutput, TransformResources
+
+
+class ModelInput(Base):
+    """
+    ModelInput
+         <p>Input object for the model.</p>
+
+        Attributes
+       ----------------------
+       data_input_config: 	 <p>The input configuration object for the model.</p>
+    """
+
+    data_input_config: str
+
+
+class AdditionalS3DataSource(Base):
+    """
+    AdditionalS3DataSource
+         <p>A data source used for training or inference that is in addition to the input dataset or model data.</p>
+
+        Attributes
+       ----------------------
+       s3_data_type: 	 <p>The data type of the additional data source that you specify for use in inference or training. </p>
+       s3_uri: 	 <p>The uniform resource identifier (URI) used to identify an additional data source used in inference or training.</p>
+       compression_type: 	 <p>The type of compression used for an additional data source used in inference or training. Specify <code>None</code> if your additional data source is not compressed.</p>
+    """
+
+    s3_data_type: str
+    s3_uri: str
+    compression_type: Optional[str] = Unassigned()
+
+
+class ModelPackageContainerDefinition(Base):
+    """
+    ModelPackageContainerDefinition
+         <p>Describes the Docker container for the model package.</p>
+
+        Attributes
+       ----------------------
+       container_hostname: 	 <p>The DNS host name for the Docker container.</p>
+       image: 	 <p>The Amazon EC2 Container Registry (Amazon ECR) path where inference code is stored.</p> <p>If you are using your own custom algorithm instead of an algorithm provided by SageMaker, the inference code must meet SageMaker requirements. SageMaker supports both <code>registry/repository[:tag]</code> and <code>registry/repository[@digest]</code> image path formats. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms.html">Using Your Own Algorithms with Amazon SageMaker</a>.</p>
+       image_digest: 	 <p>An MD5 hash of the training algorithm that identifies the Docker image used for training.</p>
+       model_data_url: 	 <p>The Amazon S3 path where the model artifacts, which result from model training, are stored. This path must point to a single <code>gzip</code> compressed tar archive (<code>.tar.gz</code> suffix).</p> <note> <p>The model artifacts must be in an S3 bucket that is in the same region as the model package.</p> </note>
+       model_data_source: 	 <p>Specifies the location of ML model data to deploy during endpoint creation.</p>
+       product_id: 	 <p>The Amazon Web Services Marketplace product ID of the model package.</p>
+       environment: 	 <p>The environment variables to set in the Docker container. Each key and value in the <code>Environment</code> string to string map can have length of up to 1024. We support up to 16 entries in the map.</p>
+       model_input: 	 <p>A structure with Model Input details.</p>
+       framework: 	 <p>The machine learning framework of the model package container image.</p>
+       framework_version: 	 <p>The framework version of the Model Package Container Image.</p>
+       nearest_model_name: 	 <p>The name of a pre-trained machine learning benchmarked by Amazon SageMaker Inference Recommender model that matches your model. You can find a list of benchmarked models by calling <code>ListModelMetadata</code>.</p>
+       additional_s3_data_source: 	 <p>The additional data source that is used during inference in the Docker container for your model package.</p>
+    """
+
+    image: str
+    container_hostname: Optional[str] = Unassigned()
+    image_digest: Optional[str] = Unassigned()
+    model_data_url: Optional[str] = Unassigned()
+    model_data_source: Optional[ModelDataSource] = Unassigned()
+    product_id: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    model_input: Optional[ModelInput] = Unassigned()
+    framework: Optional[str] = Unassigned()
+    framework_version: Optional[str] = Unassigned()
+    nearest_model_name: Optional[str] = Unassigned()
+    additional_s3_data_source: Optional[AdditionalS3DataSource] = Unassigned()
+
+
+class TransformJobDefinition(Base):
+    """
+    TransformJobDefinition
+         <p>Defines the input needed to run a transform job using the inference specification specified in the algorithm.</p>
+
+        Attributes
+       ----------------------
+       max_concurrent_transforms: 	 <p>The maximum number of parallel requests that can be sent to each instance in a transform job. The default value is 1.</p>
+       max_payload_in_m_b: 	 <p>The maximum payload size allowed, in MB. A payload is the data portion of a record (without metadata).</p>
+       batch_strategy: 	 <p>A string that determines the number of records included in a single mini-batch.</p> <p> <code>SingleRecord</code> means only one record is used per mini-batch. <code>MultiRecord</code> means a mini-batch is set to contain as many records that can fit within the <code>MaxPayloadInMB</code> limit.</p>
+       environment: 	 <p>The environment variables to set in the Docker container. We support up to 16 key and values entries in the map.</p>
+       transform_input: 	 <p>A description of the input source and the way the transform job consumes it.</p>
+       transform_output: 	 <p>Identifies the Amazon S3 location where you want Amazon SageMaker to save the results from the transform job.</p>
+       transform_resources: 	 <p>Identifies the ML compute instances for the transform job.</p>
+    """
+
+    transform_input: TransformInput
+    transform_output: TransformOutput
+    transform_resources: TransformResources
+    max_concurrent_transforms: Optional[int] = Unassigned()
+    max_payload_in_m_b: Optional[int] = Unassigned()
+    batch_strategy: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class InferenceSpecification(Base):
+    """
+    InferenceSpecification
+         <p>Defines how to perform inference generation after a training job is run.</p>
+
+        Attributes
+       ----------------------
+       containers: 	 <p>The Amazon ECR registry path of the Docker image that contains the inference code.</p>
+       supported_transform_instance_types: 	 <p>A list of the instance types on which a transformation job can be run or on which an endpoint can be deployed.</p> <p>This parameter is required for unversioned models, and optional for versioned models.</p>
+       supported_realtime_inference_instance_types: 	 <p>A list of the instance types that are used to generate inferences in real-time.</p> <p>This parameter is required for unversioned models, and optional for versioned models.</p>
+       supported_content_types: 	 <p>The supported MIME types for the input data.</p>
+       supported_response_m_i_m_e_types: 	 <p>The supported MIME types for the output data.</p>
+    """
+
+    containers: List[ModelPackageContainerDefinition]
+    supported_transform_instance_types: Optional[List[str]] = Unassigned()
+    supported_realtime_inference_instance_types: Optional[List[str]] = Unassigned()
+    supported_content_types: Optional[List[str]] = Unassigned()
+    supported_response_m_i_m_e_types: Optional[List[str]] = Unassigned()
@@ -0,0 +1,70 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class AgentVersion(Base):
+    """
+    AgentVersion
+         <p>Edge Manager agent version.</p>
+
+        Attributes
+       ----------------------
+       version: 	 <p>Version of the agent.</p>
+       agent_count: 	 <p>The number of Edge Manager agents.</p>
+    """
+
+    version: str
+    agent_count: int
+
+
+class DeviceStats(Base):
+    """
+    DeviceStats
+         <p>Status of devices.</p>
+
+        Attributes
+       ----------------------
+       connected_device_count: 	 <p>The number of devices connected with a heartbeat.</p>
+       registered_device_count: 	 <p>The number of registered devices.</p>
+    """
+
+    connected_device_count: int
+    registered_device_count: int
+
+
+class EdgeModelStat(Base):
+    """
+    EdgeModelStat
+         <p>Status of edge devices with this model.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the model.</p>
+       model_version: 	 <p>The model version.</p>
+       offline_device_count: 	 <p>The number of devices that have this model version and do not have a heart beat.</p>
+       connected_device_count: 	 <p>The number of devices that have this model version and have a heart beat. </p>
+       active_device_count: 	 <p>The number of devices that have this model version, a heart beat, and are currently running.</p>
+       sampling_device_count: 	 <p>The number of devices with this model version and are producing sample data.</p>
+    """
+
+    model_name: str
+    model_version: str
+    offline_device_count: int
+    connected_device_count: int
+    active_device_count: int
+    sampling_device_count: int
@@ -0,0 +1,369 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .async_inference_client_config import (
+    ProductionVariantManagedInstanceScaling,
+    ProductionVariantRoutingConfig,
+)
+from .deployed_image import DeployedImage
+from .production_variant_serverless_config import ProductionVariantServerlessConfig
+
+
+class Alarm(Base):
+    """
+    Alarm
+         <p>An Amazon CloudWatch alarm configured to monitor metrics on an endpoint.</p>
+
+        Attributes
+       ----------------------
+       alarm_name: 	 <p>The name of a CloudWatch alarm in your account.</p>
+    """
+
+    alarm_name: Optional[str] = Unassigned()
+
+
+class AutoRollbackConfig(Base):
+    """
+    AutoRollbackConfig
+         <p>Automatic rollback configuration for handling endpoint deployment failures and recovery.</p>
+
+        Attributes
+       ----------------------
+       alarms: 	 <p>List of CloudWatch alarms in your account that are configured to monitor metrics on an endpoint. If any alarms are tripped during a deployment, SageMaker rolls back the deployment.</p>
+    """
+
+    alarms: Optional[List[Alarm]] = Unassigned()
+
+
+class CapacitySize(Base):
+    """
+    CapacitySize
+         <p>Specifies the type and size of the endpoint capacity to activate for a blue/green deployment, a rolling deployment, or a rollback strategy. You can specify your batches as either instance count or the overall percentage or your fleet.</p> <p>For a rollback strategy, if you don't specify the fields in this object, or if you set the <code>Value</code> to 100%, then SageMaker uses a blue/green rollback strategy and rolls all traffic back to the blue fleet.</p>
+
+        Attributes
+       ----------------------
+       type: 	 <p>Specifies the endpoint capacity type.</p> <ul> <li> <p> <code>INSTANCE_COUNT</code>: The endpoint activates based on the number of instances.</p> </li> <li> <p> <code>CAPACITY_PERCENT</code>: The endpoint activates based on the specified percentage of capacity.</p> </li> </ul>
+       value: 	 <p>Defines the capacity size, either as a number of instances or a capacity percentage.</p>
+    """
+
+    type: str
+    value: int
+
+
+class TrafficRoutingConfig(Base):
+    """
+    TrafficRoutingConfig
+         <p>Defines the traffic routing strategy during an endpoint deployment to shift traffic from the old fleet to the new fleet.</p>
+
+        Attributes
+       ----------------------
+       type: 	 <p>Traffic routing strategy type.</p> <ul> <li> <p> <code>ALL_AT_ONCE</code>: Endpoint traffic shifts to the new fleet in a single step. </p> </li> <li> <p> <code>CANARY</code>: Endpoint traffic shifts to the new fleet in two steps. The first step is the canary, which is a small portion of the traffic. The second step is the remainder of the traffic. </p> </li> <li> <p> <code>LINEAR</code>: Endpoint traffic shifts to the new fleet in n steps of a configurable size. </p> </li> </ul>
+       wait_interval_in_seconds: 	 <p>The waiting time (in seconds) between incremental steps to turn on traffic on the new endpoint fleet.</p>
+       canary_size: 	 <p>Batch size for the first step to turn on traffic on the new endpoint fleet. <code>Value</code> must be less than or equal to 50% of the variant's total instance count.</p>
+       linear_step_size: 	 <p>Batch size for each step to turn on traffic on the new endpoint fleet. <code>Value</code> must be 10-50% of the variant's total instance count.</p>
+    """
+
+    type: str
+    wait_interval_in_seconds: int
+    canary_size: Optional[CapacitySize] = Unassigned()
+    linear_step_size: Optional[CapacitySize] = Unassigned()
+
+
+class BlueGreenUpdatePolicy(Base):
+    """
+    BlueGreenUpdatePolicy
+         <p>Update policy for a blue/green deployment. If this update policy is specified, SageMaker creates a new fleet during the deployment while maintaining the old fleet. SageMaker flips traffic to the new fleet according to the specified traffic routing configuration. Only one update policy should be used in the deployment configuration. If no update policy is specified, SageMaker uses a blue/green deployment strategy with all at once traffic shifting by default.</p>
+
+        Attributes
+       ----------------------
+       traffic_routing_configuration: 	 <p>Defines the traffic routing strategy to shift traffic from the old fleet to the new fleet during an endpoint deployment.</p>
+       termination_wait_in_seconds: 	 <p>Additional waiting time in seconds after the completion of an endpoint deployment before terminating the old endpoint fleet. Default is 0.</p>
+       maximum_execution_timeout_in_seconds: 	 <p>Maximum execution timeout for the deployment. Note that the timeout value should be larger than the total waiting time specified in <code>TerminationWaitInSeconds</code> and <code>WaitIntervalInSeconds</code>.</p>
+    """
+
+    traffic_routing_configuration: TrafficRoutingConfig
+    termination_wait_in_seconds: Optional[int] = Unassigned()
+    maximum_execution_timeout_in_seconds: Optional[int] = Unassigned()
+
+
+class RollingUpdatePolicy(Base):
+    """
+    RollingUpdatePolicy
+         <p>Specifies a rolling deployment strategy for updating a SageMaker endpoint.</p>
+
+        Attributes
+       ----------------------
+       maximum_batch_size: 	 <p>Batch size for each rolling step to provision capacity and turn on traffic on the new endpoint fleet, and terminate capacity on the old endpoint fleet. Value must be between 5% to 50% of the variant's total instance count.</p>
+       wait_interval_in_seconds: 	 <p>The length of the baking period, during which SageMaker monitors alarms for each batch on the new fleet.</p>
+       maximum_execution_timeout_in_seconds: 	 <p>The time limit for the total deployment. Exceeding this limit causes a timeout.</p>
+       rollback_maximum_batch_size: 	 <p>Batch size for rollback to the old endpoint fleet. Each rolling step to provision capacity and turn on traffic on the old endpoint fleet, and terminate capacity on the new endpoint fleet. If this field is absent, the default value will be set to 100% of total capacity which means to bring up the whole capacity of the old fleet at once during rollback.</p>
+    """
+
+    maximum_batch_size: CapacitySize
+    wait_interval_in_seconds: int
+    maximum_execution_timeout_in_seconds: Optional[int] = Unassigned()
+    rollback_maximum_batch_size: Optional[CapacitySize] = Unassigned()
+
+
+class DeploymentConfig(Base):
+    """
+    DeploymentConfig
+         <p>The deployment configuration for an endpoint, which contains the desired deployment strategy and rollback configurations.</p>
+
+        Attributes
+       ----------------------
+       blue_green_update_policy: 	 <p>Update policy for a blue/green deployment. If this update policy is specified, SageMaker creates a new fleet during the deployment while maintaining the old fleet. SageMaker flips traffic to the new fleet according to the specified traffic routing configuration. Only one update policy should be used in the deployment configuration. If no update policy is specified, SageMaker uses a blue/green deployment strategy with all at once traffic shifting by default.</p>
+       rolling_update_policy: 	 <p>Specifies a rolling deployment strategy for updating a SageMaker endpoint.</p>
+       auto_rollback_configuration: 	 <p>Automatic rollback configuration for handling endpoint deployment failures and recovery.</p>
+    """
+
+    blue_green_update_policy: Optional[BlueGreenUpdatePolicy] = Unassigned()
+    rolling_update_policy: Optional[RollingUpdatePolicy] = Unassigned()
+    auto_rollback_configuration: Optional[AutoRollbackConfig] = Unassigned()
+
+
+class DataCaptureConfigSummary(Base):
+    """
+    DataCaptureConfigSummary
+         <p>The currently active data capture configuration used by your Endpoint.</p>
+
+        Attributes
+       ----------------------
+       enable_capture: 	 <p>Whether data capture is enabled or disabled.</p>
+       capture_status: 	 <p>Whether data capture is currently functional.</p>
+       current_sampling_percentage: 	 <p>The percentage of requests being captured by your Endpoint.</p>
+       destination_s3_uri: 	 <p>The Amazon S3 location being used to capture the data.</p>
+       kms_key_id: 	 <p>The KMS key being used to encrypt the data in Amazon S3.</p>
+    """
+
+    enable_capture: bool
+    capture_status: str
+    current_sampling_percentage: int
+    destination_s3_uri: str
+    kms_key_id: str
+
+
+class ProductionVariantStatus(Base):
+    """
+    ProductionVariantStatus
+         <p>Describes the status of the production variant.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>The endpoint variant status which describes the current deployment stage status or operational status.</p> <ul> <li> <p> <code>Creating</code>: Creating inference resources for the production variant.</p> </li> <li> <p> <code>Deleting</code>: Terminating inference resources for the production variant.</p> </li> <li> <p> <code>Updating</code>: Updating capacity for the production variant.</p> </li> <li> <p> <code>ActivatingTraffic</code>: Turning on traffic for the production variant.</p> </li> <li> <p> <code>Baking</code>: Waiting period to monitor the CloudWatch alarms in the automatic rollback configuration.</p> </li> </ul>
+       status_message: 	 <p>A message that describes the status of the production variant.</p>
+       start_time: 	 <p>The start time of the current status change.</p>
+    """
+
+    status: str
+    status_message: Optional[str] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+
+
+class ProductionVariantSummary(Base):
+    """
+    ProductionVariantSummary
+         <p>Describes weight and capacities for a production variant associated with an endpoint. If you sent a request to the <code>UpdateEndpointWeightsAndCapacities</code> API and the endpoint status is <code>Updating</code>, you get different desired and current values. </p>
+
+        Attributes
+       ----------------------
+       variant_name: 	 <p>The name of the variant.</p>
+       deployed_images: 	 <p>An array of <code>DeployedImage</code> objects that specify the Amazon EC2 Container Registry paths of the inference images deployed on instances of this <code>ProductionVariant</code>.</p>
+       current_weight: 	 <p>The weight associated with the variant.</p>
+       desired_weight: 	 <p>The requested weight, as specified in the <code>UpdateEndpointWeightsAndCapacities</code> request. </p>
+       current_instance_count: 	 <p>The number of instances associated with the variant.</p>
+       desired_instance_count: 	 <p>The number of instances requested in the <code>UpdateEndpointWeightsAndCapacities</code> request. </p>
+       variant_status: 	 <p>The endpoint variant status which describes the current deployment stage status or operational status.</p>
+       current_serverless_config: 	 <p>The serverless configuration for the endpoint.</p>
+       desired_serverless_config: 	 <p>The serverless configuration requested for the endpoint update.</p>
+       managed_instance_scaling: 	 <p>Settings that control the range in the number of instances that the endpoint provisions as it scales up or down to accommodate traffic. </p>
+       routing_config: 	 <p>Settings that control how the endpoint routes incoming traffic to the instances that the endpoint hosts.</p>
+    """
+
+    variant_name: str
+    deployed_images: Optional[List[DeployedImage]] = Unassigned()
+    current_weight: Optional[float] = Unassigned()
+    desired_weight: Optional[float] = Unassigned()
+    current_instance_count: Optional[int] = Unassigned()
+    desired_instance_count: Optional[int] = Unassigned()
+    variant_status: Optional[List[ProductionVariantStatus]] = Unassigned()
+    current_serverless_config: Optional[ProductionVariantServerlessConfig] = (
+        Unassigned()
+    )
+    desired_serverless_config: Optional[ProductionVariantServerlessConfig] = (
+        Unassigned()
+    )
+    managed_instance_scaling: Optional[ProductionVariantManagedInstanceScaling] = (
+        Unassigned()
+    )
+    routing_config: Optional[ProductionVariantRoutingConfig] = Unassigned()
+
+
+class PendingProductionVariantSummary(Base):
+    """
+    PendingProductionVariantSummary
+         <p>The production variant summary for a deployment when an endpoint is creating or updating with the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateEndpoint.html">CreateEndpoint</a> or <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpoint.html">UpdateEndpoint</a> operations. Describes the <code>VariantStatus </code>, weight and capacity for a production variant associated with an endpoint. </p>
+
+        Attributes
+       ----------------------
+       variant_name: 	 <p>The name of the variant.</p>
+       deployed_images: 	 <p>An array of <code>DeployedImage</code> objects that specify the Amazon EC2 Container Registry paths of the inference images deployed on instances of this <code>ProductionVariant</code>.</p>
+       current_weight: 	 <p>The weight associated with the variant.</p>
+       desired_weight: 	 <p>The requested weight for the variant in this deployment, as specified in the endpoint configuration for the endpoint. The value is taken from the request to the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateEndpointConfig.html">CreateEndpointConfig</a> operation.</p>
+       current_instance_count: 	 <p>The number of instances associated with the variant.</p>
+       desired_instance_count: 	 <p>The number of instances requested in this deployment, as specified in the endpoint configuration for the endpoint. The value is taken from the request to the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateEndpointConfig.html">CreateEndpointConfig</a> operation.</p>
+       instance_type: 	 <p>The type of instances associated with the variant.</p>
+       accelerator_type: 	 <p>The size of the Elastic Inference (EI) instance to use for the production variant. EI instances provide on-demand GPU computing for inference. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/ei.html">Using Elastic Inference in Amazon SageMaker</a>.</p>
+       variant_status: 	 <p>The endpoint variant status which describes the current deployment stage status or operational status.</p>
+       current_serverless_config: 	 <p>The serverless configuration for the endpoint.</p>
+       desired_serverless_config: 	 <p>The serverless configuration requested for this deployment, as specified in the endpoint configuration for the endpoint.</p>
+       managed_instance_scaling: 	 <p>Settings that control the range in the number of instances that the endpoint provisions as it scales up or down to accommodate traffic. </p>
+       routing_config: 	 <p>Settings that control how the endpoint routes incoming traffic to the instances that the endpoint hosts.</p>
+    """
+
+    variant_name: str
+    deployed_images: Optional[List[DeployedImage]] = Unassigned()
+    current_weight: Optional[float] = Unassigned()
+    desired_weight: Optional[float] = Unassigned()
+    current_instance_count: Optional[int] = Unassigned()
+    desired_instance_count: Optional[int] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    accelerator_type: Optional[str] = Unassigned()
+    variant_status: Optional[List[ProductionVariantStatus]] = Unassigned()
+    current_serverless_config: Optional[ProductionVariantServerlessConfig] = (
+        Unassigned()
+    )
+    desired_serverless_config: Optional[ProductionVariantServerlessConfig] = (
+        Unassigned()
+    )
+    managed_instance_scaling: Optional[ProductionVariantManagedInstanceScaling] = (
+        Unassigned()
+    )
+    routing_config: Optional[ProductionVariantRoutingConfig] = Unassigned()
+
+
+class PendingDeploymentSummary(Base):
+    """
+    PendingDeploymentSummary
+         <p>The summary of an in-progress deployment when an endpoint is creating or updating with a new endpoint configuration.</p>
+
+        Attributes
+       ----------------------
+       endpoint_config_name: 	 <p>The name of the endpoint configuration used in the deployment. </p>
+       production_variants: 	 <p>An array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_PendingProductionVariantSummary.html">PendingProductionVariantSummary</a> objects, one for each model hosted behind this endpoint for the in-progress deployment.</p>
+       start_time: 	 <p>The start time of the deployment.</p>
+       shadow_production_variants: 	 <p>An array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_PendingProductionVariantSummary.html">PendingProductionVariantSummary</a> objects, one for each model hosted behind this endpoint in shadow mode with production traffic replicated from the model specified on <code>ProductionVariants</code> for the in-progress deployment.</p>
+    """
+
+    endpoint_config_name: str
+    production_variants: Optional[List[PendingProductionVariantSummary]] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    shadow_production_variants: Optional[List[PendingProductionVariantSummary]] = (
+        Unassigned()
+    )
+
+
+class EndpointSummary(Base):
+    """
+    EndpointSummary
+         <p>Provides summary information for an endpoint.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The name of the endpoint.</p>
+       endpoint_arn: 	 <p>The Amazon Resource Name (ARN) of the endpoint.</p>
+       creation_time: 	 <p>A timestamp that shows when the endpoint was created.</p>
+       last_modified_time: 	 <p>A timestamp that shows when the endpoint was last modified.</p>
+       endpoint_status: 	 <p>The status of the endpoint.</p> <ul> <li> <p> <code>OutOfService</code>: Endpoint is not available to take incoming requests.</p> </li> <li> <p> <code>Creating</code>: <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateEndpoint.html">CreateEndpoint</a> is executing.</p> </li> <li> <p> <code>Updating</code>: <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpoint.html">UpdateEndpoint</a> or <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpointWeightsAndCapacities.html">UpdateEndpointWeightsAndCapacities</a> is executing.</p> </li> <li> <p> <code>SystemUpdating</code>: Endpoint is undergoing maintenance and cannot be updated or deleted or re-scaled until it has completed. This maintenance operation does not change any customer-specified values such as VPC config, KMS encryption, model, instance type, or instance count.</p> </li> <li> <p> <code>RollingBack</code>: Endpoint fails to scale up or down or change its variant weight and is in the process of rolling back to its previous configuration. Once the rollback completes, endpoint returns to an <code>InService</code> status. This transitional status only applies to an endpoint that has autoscaling enabled and is undergoing variant weight or capacity changes as part of an <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpointWeightsAndCapacities.html">UpdateEndpointWeightsAndCapacities</a> call or when the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpointWeightsAndCapacities.html">UpdateEndpointWeightsAndCapacities</a> operation is called explicitly.</p> </li> <li> <p> <code>InService</code>: Endpoint is available to process incoming requests.</p> </li> <li> <p> <code>Deleting</code>: <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DeleteEndpoint.html">DeleteEndpoint</a> is executing.</p> </li> <li> <p> <code>Failed</code>: Endpoint could not be created, updated, or re-scaled. Use <code>DescribeEndpointOutput$FailureReason</code> for information about the failure. <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DeleteEndpoint.html">DeleteEndpoint</a> is the only operation that can be performed on a failed endpoint.</p> </li> </ul> <p>To get a list of endpoints with a specified status, use the <code>StatusEquals</code> filter with a call to <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ListEndpoints.html">ListEndpoints</a>.</p>
+    """
+
+    endpoint_name: str
+    endpoint_arn: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    endpoint_status: str
+
+
+class VariantProperty(Base):
+    """
+    VariantProperty
+         <p>Specifies a production variant property type for an Endpoint.</p> <p>If you are updating an endpoint with the <code>RetainAllVariantProperties</code> option of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpoint.html">UpdateEndpointInput</a> set to <code>true</code>, the <code>VariantProperty</code> objects listed in the <code>ExcludeRetainedVariantProperties</code> parameter of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateEndpoint.html">UpdateEndpointInput</a> override the existing variant properties of the endpoint.</p>
+
+        Attributes
+       ----------------------
+       variant_property_type: 	 <p>The type of variant property. The supported values are:</p> <ul> <li> <p> <code>DesiredInstanceCount</code>: Overrides the existing variant instance counts using the <code>InitialInstanceCount</code> values in the <code>ProductionVariants</code> of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateEndpointConfig.html">CreateEndpointConfig</a>.</p> </li> <li> <p> <code>DesiredWeight</code>: Overrides the existing variant weights using the <code>InitialVariantWeight</code> values in the <code>ProductionVariants</code> of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateEndpointConfig.html">CreateEndpointConfig</a>.</p> </li> <li> <p> <code>DataCaptureConfig</code>: (Not currently supported.)</p> </li> </ul>
+    """
+
+    variant_property_type: str
+
+
+class InternalStreamFailure(Base):
+    """
+    InternalStreamFailure
+         <p>The stream processing failed because of an unknown error, exception or failure. Try your request again.</p>
+
+        Attributes
+       ----------------------
+       message
+    """
+
+    message: Optional[str] = Unassigned()
+
+
+class PayloadPart(Base):
+    """
+    PayloadPart
+         <p>A wrapper for pieces of the payload that's returned in response to a streaming inference request. A streaming inference response consists of one or more payload parts. </p>
+
+        Attributes
+       ----------------------
+       bytes: 	 <p>A blob that contains part of the response for your streaming inference request.</p>
+    """
+
+    bytes: Optional[Any] = Unassigned()
+
+
+class ModelStreamError(Base):
+    """
+    ModelStreamError
+         <p> An error occurred while streaming the response body. This error can have the following error codes:</p> <dl> <dt>ModelInvocationTimeExceeded</dt> <dd> <p>The model failed to finish sending the response within the timeout period allowed by Amazon SageMaker.</p> </dd> <dt>StreamBroken</dt> <dd> <p>The Transmission Control Protocol (TCP) connection between the client and the model was reset or closed.</p> </dd> </dl>
+
+        Attributes
+       ----------------------
+       message
+       error_code: 	 <p>This error can have the following error codes:</p> <dl> <dt>ModelInvocationTimeExceeded</dt> <dd> <p>The model failed to finish sending the response within the timeout period allowed by Amazon SageMaker.</p> </dd> <dt>StreamBroken</dt> <dd> <p>The Transmission Control Protocol (TCP) connection between the client and the model was reset or closed.</p> </dd> </dl>
+    """
+
+    message: Optional[str] = Unassigned()
+    error_code: Optional[str] = Unassigned()
+
+
+class ResponseStream(Base):
+    """
+    ResponseStream
+         <p>A stream of payload parts. Each part contains a portion of the response for a streaming inference request.</p>
+
+        Attributes
+       ----------------------
+       payload_part: 	 <p>A wrapper for pieces of the payload that's returned in response to a streaming inference request. A streaming inference response consists of one or more payload parts. </p>
+       model_stream_error: 	 <p> An error occurred while streaming the response body. This error can have the following error codes:</p> <dl> <dt>ModelInvocationTimeExceeded</dt> <dd> <p>The model failed to finish sending the response within the timeout period allowed by Amazon SageMaker.</p> </dd> <dt>StreamBroken</dt> <dd> <p>The Transmission Control Protocol (TCP) connection between the client and the model was reset or closed.</p> </dd> </dl>
+       internal_stream_failure: 	 <p>The stream processing failed because of an unknown error, exception or failure. Try your request again.</p>
+    """
+
+    payload_part: Optional[PayloadPart] = Unassigned()
+    model_stream_error: Optional[ModelStreamError] = Unassigned()
+    internal_stream_failure: Optional[InternalStreamFailure] = Unassigned()
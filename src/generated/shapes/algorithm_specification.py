@@ -0,0 +1,384 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .channel import MetricDefinition
+
+
+class TrainingRepositoryAuthConfig(Base):
+    """
+    TrainingRepositoryAuthConfig
+         <p>An object containing authentication information for a private Docker registry.</p>
+
+        Attributes
+       ----------------------
+       training_repository_credentials_provider_arn: 	 <p>The Amazon Resource Name (ARN) of an Amazon Web Services Lambda function used to give SageMaker access credentials to your private Docker registry.</p>
+    """
+
+    training_repository_credentials_provider_arn: str
+
+
+class TrainingImageConfig(Base):
+    """
+    TrainingImageConfig
+         <p>The configuration to use an image from a private Docker registry for a training job.</p>
+
+        Attributes
+       ----------------------
+       training_repository_access_mode: 	 <p>The method that your training job will use to gain access to the images in your private Docker registry. For access to an image in a private Docker registry, set to <code>Vpc</code>.</p>
+       training_repository_auth_config: 	 <p>An object containing authentication information for a private Docker registry containing your training images.</p>
+    """
+
+    training_repository_access_mode: str
+    training_repository_auth_config: Optional[TrainingRepositoryAuthConfig] = (
+        Unassigned()
+    )
+
+
+class AlgorithmSpecification(Base):
+    """
+    AlgorithmSpecification
+         <p>Specifies the training algorithm to use in a <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrainingJob.html">CreateTrainingJob</a> request.</p> <p>For more information about algorithms provided by SageMaker, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/algos.html">Algorithms</a>. For information about using your own algorithms, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms.html">Using Your Own Algorithms with Amazon SageMaker</a>. </p>
+
+        Attributes
+       ----------------------
+       training_image: 	 <p>The registry path of the Docker image that contains the training algorithm. For information about docker registry paths for SageMaker built-in algorithms, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-algo-docker-registry-paths.html">Docker Registry Paths and Example Code</a> in the <i>Amazon SageMaker developer guide</i>. SageMaker supports both <code>registry/repository[:tag]</code> and <code>registry/repository[@digest]</code> image path formats. For more information about using your custom training container, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms.html">Using Your Own Algorithms with Amazon SageMaker</a>.</p> <note> <p>You must specify either the algorithm name to the <code>AlgorithmName</code> parameter or the image URI of the algorithm container to the <code>TrainingImage</code> parameter.</p> <p>For more information, see the note in the <code>AlgorithmName</code> parameter description.</p> </note>
+       algorithm_name: 	 <p>The name of the algorithm resource to use for the training job. This must be an algorithm resource that you created or subscribe to on Amazon Web Services Marketplace.</p> <note> <p>You must specify either the algorithm name to the <code>AlgorithmName</code> parameter or the image URI of the algorithm container to the <code>TrainingImage</code> parameter.</p> <p>Note that the <code>AlgorithmName</code> parameter is mutually exclusive with the <code>TrainingImage</code> parameter. If you specify a value for the <code>AlgorithmName</code> parameter, you can't specify a value for <code>TrainingImage</code>, and vice versa.</p> <p>If you specify values for both parameters, the training job might break; if you don't specify any value for both parameters, the training job might raise a <code>null</code> error.</p> </note>
+       training_input_mode
+       metric_definitions: 	 <p>A list of metric definition objects. Each object specifies the metric name and regular expressions used to parse algorithm logs. SageMaker publishes each metric to Amazon CloudWatch.</p>
+       enable_sage_maker_metrics_time_series: 	 <p>To generate and save time-series metrics during training, set to <code>true</code>. The default is <code>false</code> and time-series metrics aren't generated except in the following cases:</p> <ul> <li> <p>You use one of the SageMaker built-in algorithms</p> </li> <li> <p>You use one of the following <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/pre-built-containers-frameworks-deep-learning.html">Prebuilt SageMaker Docker Images</a>:</p> <ul> <li> <p>Tensorflow (version &gt;= 1.15)</p> </li> <li> <p>MXNet (version &gt;= 1.6)</p> </li> <li> <p>PyTorch (version &gt;= 1.3)</p> </li> </ul> </li> <li> <p>You specify at least one <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_MetricDefinition.html">MetricDefinition</a> </p> </li> </ul>
+       container_entrypoint: 	 <p>The <a href="https://docs.docker.com/engine/reference/builder/">entrypoint script for a Docker container</a> used to run a training job. This script takes precedence over the default train processing instructions. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms-training-algo-dockerfile.html">How Amazon SageMaker Runs Your Training Image</a> for more information.</p>
+       container_arguments: 	 <p>The arguments for a container used to run a training job. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms-training-algo-dockerfile.html">How Amazon SageMaker Runs Your Training Image</a> for additional information.</p>
+       training_image_config: 	 <p>The configuration to use an image from a private Docker registry for a training job.</p>
+    """
+
+    training_input_mode: str
+    training_image: Optional[str] = Unassigned()
+    algorithm_name: Optional[str] = Unassigned()
+    metric_definitions: Optional[List[MetricDefinition]] = Unassigned()
+    enable_sage_maker_metrics_time_series: Optional[bool] = Unassigned()
+    container_entrypoint: Optional[List[str]] = Unassigned()
+    container_arguments: Optional[List[str]] = Unassigned()
+    training_image_config: Optional[TrainingImageConfig] = Unassigned()
+
+
+class CollectionConfiguration(Base):
+    """
+    CollectionConfiguration
+         <p>Configuration information for the Amazon SageMaker Debugger output tensor collections.</p>
+
+        Attributes
+       ----------------------
+       collection_name: 	 <p>The name of the tensor collection. The name must be unique relative to other rule configuration names.</p>
+       collection_parameters: 	 <p>Parameter values for the tensor collection. The allowed parameters are <code>"name"</code>, <code>"include_regex"</code>, <code>"reduction_config"</code>, <code>"save_config"</code>, <code>"tensor_names"</code>, and <code>"save_histogram"</code>.</p>
+    """
+
+    collection_name: Optional[str] = Unassigned()
+    collection_parameters: Optional[Dict[str, str]] = Unassigned()
+
+
+class DebugHookConfig(Base):
+    """
+    DebugHookConfig
+         <p>Configuration information for the Amazon SageMaker Debugger hook parameters, metric and tensor collections, and storage paths. To learn more about how to configure the <code>DebugHookConfig</code> parameter, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/debugger-createtrainingjob-api.html">Use the SageMaker and Debugger Configuration API Operations to Create, Update, and Debug Your Training Job</a>.</p>
+
+        Attributes
+       ----------------------
+       local_path: 	 <p>Path to local storage location for metrics and tensors. Defaults to <code>/opt/ml/output/tensors/</code>.</p>
+       s3_output_path: 	 <p>Path to Amazon S3 storage location for metrics and tensors.</p>
+       hook_parameters: 	 <p>Configuration information for the Amazon SageMaker Debugger hook parameters.</p>
+       collection_configurations: 	 <p>Configuration information for Amazon SageMaker Debugger tensor collections. To learn more about how to configure the <code>CollectionConfiguration</code> parameter, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/debugger-createtrainingjob-api.html">Use the SageMaker and Debugger Configuration API Operations to Create, Update, and Debug Your Training Job</a>. </p>
+    """
+
+    s3_output_path: str
+    local_path: Optional[str] = Unassigned()
+    hook_parameters: Optional[Dict[str, str]] = Unassigned()
+    collection_configurations: Optional[List[CollectionConfiguration]] = Unassigned()
+
+
+class DebugRuleConfiguration(Base):
+    """
+    DebugRuleConfiguration
+         <p>Configuration information for SageMaker Debugger rules for debugging. To learn more about how to configure the <code>DebugRuleConfiguration</code> parameter, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/debugger-createtrainingjob-api.html">Use the SageMaker and Debugger Configuration API Operations to Create, Update, and Debug Your Training Job</a>.</p>
+
+        Attributes
+       ----------------------
+       rule_configuration_name: 	 <p>The name of the rule configuration. It must be unique relative to other rule configuration names.</p>
+       local_path: 	 <p>Path to local storage location for output of rules. Defaults to <code>/opt/ml/processing/output/rule/</code>.</p>
+       s3_output_path: 	 <p>Path to Amazon S3 storage location for rules.</p>
+       rule_evaluator_image: 	 <p>The Amazon Elastic Container (ECR) Image for the managed rule evaluation.</p>
+       instance_type: 	 <p>The instance type to deploy a custom rule for debugging a training job.</p>
+       volume_size_in_g_b: 	 <p>The size, in GB, of the ML storage volume attached to the processing instance.</p>
+       rule_parameters: 	 <p>Runtime configuration for rule container.</p>
+    """
+
+    rule_configuration_name: str
+    rule_evaluator_image: str
+    local_path: Optional[str] = Unassigned()
+    s3_output_path: Optional[str] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    volume_size_in_g_b: Optional[int] = Unassigned()
+    rule_parameters: Optional[Dict[str, str]] = Unassigned()
+
+
+class TensorBoardOutputConfig(Base):
+    """
+    TensorBoardOutputConfig
+         <p>Configuration of storage locations for the Amazon SageMaker Debugger TensorBoard output data.</p>
+
+        Attributes
+       ----------------------
+       local_path: 	 <p>Path to local storage location for tensorBoard output. Defaults to <code>/opt/ml/output/tensorboard</code>.</p>
+       s3_output_path: 	 <p>Path to Amazon S3 storage location for TensorBoard output.</p>
+    """
+
+    s3_output_path: str
+    local_path: Optional[str] = Unassigned()
+
+
+class ProfilerConfig(Base):
+    """
+    ProfilerConfig
+         <p>Configuration information for Amazon SageMaker Debugger system monitoring, framework profiling, and storage paths.</p>
+
+        Attributes
+       ----------------------
+       s3_output_path: 	 <p>Path to Amazon S3 storage location for system and framework metrics.</p>
+       profiling_interval_in_milliseconds: 	 <p>A time interval for capturing system metrics in milliseconds. Available values are 100, 200, 500, 1000 (1 second), 5000 (5 seconds), and 60000 (1 minute) milliseconds. The default value is 500 milliseconds.</p>
+       profiling_parameters: 	 <p>Configuration information for capturing framework metrics. Available key strings for different profiling options are <code>DetailedProfilingConfig</code>, <code>PythonProfilingConfig</code>, and <code>DataLoaderProfilingConfig</code>. The following codes are configuration structures for the <code>ProfilingParameters</code> parameter. To learn more about how to configure the <code>ProfilingParameters</code> parameter, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/debugger-createtrainingjob-api.html">Use the SageMaker and Debugger Configuration API Operations to Create, Update, and Debug Your Training Job</a>. </p>
+       disable_profiler: 	 <p>Configuration to turn off Amazon SageMaker Debugger's system monitoring and profiling functionality. To turn it off, set to <code>True</code>.</p>
+    """
+
+    s3_output_path: Optional[str] = Unassigned()
+    profiling_interval_in_milliseconds: Optional[int] = Unassigned()
+    profiling_parameters: Optional[Dict[str, str]] = Unassigned()
+    disable_profiler: Optional[bool] = Unassigned()
+
+
+class ProfilerRuleConfiguration(Base):
+    """
+    ProfilerRuleConfiguration
+         <p>Configuration information for profiling rules.</p>
+
+        Attributes
+       ----------------------
+       rule_configuration_name: 	 <p>The name of the rule configuration. It must be unique relative to other rule configuration names.</p>
+       local_path: 	 <p>Path to local storage location for output of rules. Defaults to <code>/opt/ml/processing/output/rule/</code>. </p>
+       s3_output_path: 	 <p>Path to Amazon S3 storage location for rules.</p>
+       rule_evaluator_image: 	 <p>The Amazon Elastic Container Registry Image for the managed rule evaluation.</p>
+       instance_type: 	 <p>The instance type to deploy a custom rule for profiling a training job.</p>
+       volume_size_in_g_b: 	 <p>The size, in GB, of the ML storage volume attached to the processing instance.</p>
+       rule_parameters: 	 <p>Runtime configuration for rule container.</p>
+    """
+
+    rule_configuration_name: str
+    rule_evaluator_image: str
+    local_path: Optional[str] = Unassigned()
+    s3_output_path: Optional[str] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    volume_size_in_g_b: Optional[int] = Unassigned()
+    rule_parameters: Optional[Dict[str, str]] = Unassigned()
+
+
+class RemoteDebugConfig(Base):
+    """
+    RemoteDebugConfig
+         <p>Configuration for remote debugging for the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrainingJob.html">CreateTrainingJob</a> API. To learn more about the remote debugging functionality of SageMaker, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/train-remote-debugging.html">Access a training container through Amazon Web Services Systems Manager (SSM) for remote debugging</a>.</p>
+
+        Attributes
+       ----------------------
+       enable_remote_debug: 	 <p>If set to True, enables remote debugging.</p>
+    """
+
+    enable_remote_debug: Optional[bool] = Unassigned()
+
+
+class InfraCheckConfig(Base):
+    """
+    InfraCheckConfig
+         <p>Configuration information for the infrastructure health check of a training job. A SageMaker-provided health check tests the health of instance hardware and cluster network connectivity.</p>
+
+        Attributes
+       ----------------------
+       enable_infra_check: 	 <p>Enables an infrastructure health check.</p>
+    """
+
+    enable_infra_check: Optional[bool] = Unassigned()
+
+
+class DebugRuleEvaluationStatus(Base):
+    """
+    DebugRuleEvaluationStatus
+         <p>Information about the status of the rule evaluation.</p>
+
+        Attributes
+       ----------------------
+       rule_configuration_name: 	 <p>The name of the rule configuration.</p>
+       rule_evaluation_job_arn: 	 <p>The Amazon Resource Name (ARN) of the rule evaluation job.</p>
+       rule_evaluation_status: 	 <p>Status of the rule evaluation.</p>
+       status_details: 	 <p>Details from the rule evaluation.</p>
+       last_modified_time: 	 <p>Timestamp when the rule evaluation status was last modified.</p>
+    """
+
+    rule_configuration_name: Optional[str] = Unassigned()
+    rule_evaluation_job_arn: Optional[str] = Unassigned()
+    rule_evaluation_status: Optional[str] = Unassigned()
+    status_details: Optional[str] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+
+
+class WarmPoolStatus(Base):
+    """
+    WarmPoolStatus
+         <p>Status and billing information about the warm pool.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>The status of the warm pool.</p> <ul> <li> <p> <code>InUse</code>: The warm pool is in use for the training job.</p> </li> <li> <p> <code>Available</code>: The warm pool is available to reuse for a matching training job.</p> </li> <li> <p> <code>Reused</code>: The warm pool moved to a matching training job for reuse.</p> </li> <li> <p> <code>Terminated</code>: The warm pool is no longer available. Warm pools are unavailable if they are terminated by a user, terminated for a patch update, or terminated for exceeding the specified <code>KeepAlivePeriodInSeconds</code>.</p> </li> </ul>
+       resource_retained_billable_time_in_seconds: 	 <p>The billable time in seconds used by the warm pool. Billable time refers to the absolute wall-clock time.</p> <p>Multiply <code>ResourceRetainedBillableTimeInSeconds</code> by the number of instances (<code>InstanceCount</code>) in your training cluster to get the total compute time SageMaker bills you if you run warm pool training. The formula is as follows: <code>ResourceRetainedBillableTimeInSeconds * InstanceCount</code>.</p>
+       reused_by_job: 	 <p>The name of the matching training job that reused the warm pool.</p>
+    """
+
+    status: str
+    resource_retained_billable_time_in_seconds: Optional[int] = Unassigned()
+    reused_by_job: Optional[str] = Unassigned()
+
+
+class SecondaryStatusTransition(Base):
+    """
+    SecondaryStatusTransition
+         <p>An array element of <code>SecondaryStatusTransitions</code> for <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DescribeTrainingJob.html">DescribeTrainingJob</a>. It provides additional details about a status that the training job has transitioned through. A training job can be in one of several states, for example, starting, downloading, training, or uploading. Within each state, there are a number of intermediate states. For example, within the starting state, SageMaker could be starting the training job or launching the ML instances. These transitional states are referred to as the job's secondary status. </p> <p/>
+
+        Attributes
+       ----------------------
+       status: 	 <p>Contains a secondary status information from a training job.</p> <p>Status might be one of the following secondary statuses:</p> <dl> <dt>InProgress</dt> <dd> <ul> <li> <p> <code>Starting</code> - Starting the training job.</p> </li> <li> <p> <code>Downloading</code> - An optional stage for algorithms that support <code>File</code> training input mode. It indicates that data is being downloaded to the ML storage volumes.</p> </li> <li> <p> <code>Training</code> - Training is in progress.</p> </li> <li> <p> <code>Uploading</code> - Training is complete and the model artifacts are being uploaded to the S3 location.</p> </li> </ul> </dd> <dt>Completed</dt> <dd> <ul> <li> <p> <code>Completed</code> - The training job has completed.</p> </li> </ul> </dd> <dt>Failed</dt> <dd> <ul> <li> <p> <code>Failed</code> - The training job has failed. The reason for the failure is returned in the <code>FailureReason</code> field of <code>DescribeTrainingJobResponse</code>.</p> </li> </ul> </dd> <dt>Stopped</dt> <dd> <ul> <li> <p> <code>MaxRuntimeExceeded</code> - The job stopped because it exceeded the maximum allowed runtime.</p> </li> <li> <p> <code>Stopped</code> - The training job has stopped.</p> </li> </ul> </dd> <dt>Stopping</dt> <dd> <ul> <li> <p> <code>Stopping</code> - Stopping the training job.</p> </li> </ul> </dd> </dl> <p>We no longer support the following secondary statuses:</p> <ul> <li> <p> <code>LaunchingMLInstances</code> </p> </li> <li> <p> <code>PreparingTrainingStack</code> </p> </li> <li> <p> <code>DownloadingTrainingImage</code> </p> </li> </ul>
+       start_time: 	 <p>A timestamp that shows when the training job transitioned to the current secondary status state.</p>
+       end_time: 	 <p>A timestamp that shows when the training job transitioned out of this secondary status state into another secondary status state or when the training job has ended.</p>
+       status_message: 	 <p>A detailed description of the progress within a secondary status. </p> <p>SageMaker provides secondary statuses and status messages that apply to each of them:</p> <dl> <dt>Starting</dt> <dd> <ul> <li> <p>Starting the training job.</p> </li> <li> <p>Launching requested ML instances.</p> </li> <li> <p>Insufficient capacity error from EC2 while launching instances, retrying!</p> </li> <li> <p>Launched instance was unhealthy, replacing it!</p> </li> <li> <p>Preparing the instances for training.</p> </li> </ul> </dd> <dt>Training</dt> <dd> <ul> <li> <p>Training image download completed. Training in progress.</p> </li> </ul> </dd> </dl> <important> <p>Status messages are subject to change. Therefore, we recommend not including them in code that programmatically initiates actions. For examples, don't use status messages in if statements.</p> </important> <p>To have an overview of your training job's progress, view <code>TrainingJobStatus</code> and <code>SecondaryStatus</code> in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DescribeTrainingJob.html">DescribeTrainingJob</a>, and <code>StatusMessage</code> together. For example, at the start of a training job, you might see the following:</p> <ul> <li> <p> <code>TrainingJobStatus</code> - InProgress</p> </li> <li> <p> <code>SecondaryStatus</code> - Training</p> </li> <li> <p> <code>StatusMessage</code> - Downloading the training image</p> </li> </ul>
+    """
+
+    status: str
+    start_time: datetime.datetime
+    end_time: Optional[datetime.datetime] = Unassigned()
+    status_message: Optional[str] = Unassigned()
+
+
+class MetricData(Base):
+    """
+    MetricData
+         <p>The name, value, and date and time of a metric that was emitted to Amazon CloudWatch.</p>
+
+        Attributes
+       ----------------------
+       metric_name: 	 <p>The name of the metric.</p>
+       value: 	 <p>The value of the metric.</p>
+       timestamp: 	 <p>The date and time that the algorithm emitted the metric.</p>
+    """
+
+    metric_name: Optional[str] = Unassigned()
+    value: Optional[float] = Unassigned()
+    timestamp: Optional[datetime.datetime] = Unassigned()
+
+
+class ProfilerRuleEvaluationStatus(Base):
+    """
+    ProfilerRuleEvaluationStatus
+         <p>Information about the status of the rule evaluation.</p>
+
+        Attributes
+       ----------------------
+       rule_configuration_name: 	 <p>The name of the rule configuration.</p>
+       rule_evaluation_job_arn: 	 <p>The Amazon Resource Name (ARN) of the rule evaluation job.</p>
+       rule_evaluation_status: 	 <p>Status of the rule evaluation.</p>
+       status_details: 	 <p>Details from the rule evaluation.</p>
+       last_modified_time: 	 <p>Timestamp when the rule evaluation status was last modified.</p>
+    """
+
+    rule_configuration_name: Optional[str] = Unassigned()
+    rule_evaluation_job_arn: Optional[str] = Unassigned()
+    rule_evaluation_status: Optional[str] = Unassigned()
+    status_details: Optional[str] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+
+
+class TrainingJobSummary(Base):
+    """
+    TrainingJobSummary
+         <p>Provides summary information about a training job.</p>
+
+        Attributes
+       ----------------------
+       training_job_name: 	 <p>The name of the training job that you want a summary for.</p>
+       training_job_arn: 	 <p>The Amazon Resource Name (ARN) of the training job.</p>
+       creation_time: 	 <p>A timestamp that shows when the training job was created.</p>
+       training_end_time: 	 <p>A timestamp that shows when the training job ended. This field is set only if the training job has one of the terminal statuses (<code>Completed</code>, <code>Failed</code>, or <code>Stopped</code>). </p>
+       last_modified_time: 	 <p> Timestamp when the training job was last modified. </p>
+       training_job_status: 	 <p>The status of the training job.</p>
+       warm_pool_status: 	 <p>The status of the warm pool associated with the training job.</p>
+    """
+
+    training_job_name: str
+    training_job_arn: str
+    creation_time: datetime.datetime
+    training_job_status: str
+    training_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    warm_pool_status: Optional[WarmPoolStatus] = Unassigned()
+
+
+class ProfilerConfigForUpdate(Base):
+    """
+    ProfilerConfigForUpdate
+         <p>Configuration information for updating the Amazon SageMaker Debugger profile parameters, system and framework metrics configurations, and storage paths.</p>
+
+        Attributes
+       ----------------------
+       s3_output_path: 	 <p>Path to Amazon S3 storage location for system and framework metrics.</p>
+       profiling_interval_in_milliseconds: 	 <p>A time interval for capturing system metrics in milliseconds. Available values are 100, 200, 500, 1000 (1 second), 5000 (5 seconds), and 60000 (1 minute) milliseconds. The default value is 500 milliseconds.</p>
+       profiling_parameters: 	 <p>Configuration information for capturing framework metrics. Available key strings for different profiling options are <code>DetailedProfilingConfig</code>, <code>PythonProfilingConfig</code>, and <code>DataLoaderProfilingConfig</code>. The following codes are configuration structures for the <code>ProfilingParameters</code> parameter. To learn more about how to configure the <code>ProfilingParameters</code> parameter, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/debugger-createtrainingjob-api.html">Use the SageMaker and Debugger Configuration API Operations to Create, Update, and Debug Your Training Job</a>. </p>
+       disable_profiler: 	 <p>To turn off Amazon SageMaker Debugger monitoring and profiling while a training job is in progress, set to <code>True</code>.</p>
+    """
+
+    s3_output_path: Optional[str] = Unassigned()
+    profiling_interval_in_milliseconds: Optional[int] = Unassigned()
+    profiling_parameters: Optional[Dict[str, str]] = Unassigned()
+    disable_profiler: Optional[bool] = Unassigned()
+
+
+class RemoteDebugConfigForUpdate(Base):
+    """
+    RemoteDebugConfigForUpdate
+         <p>Configuration for remote debugging for the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateTrainingJob.html">UpdateTrainingJob</a> API. To learn more about the remote debugging functionality of SageMaker, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/train-remote-debugging.html">Access a training container through Amazon Web Services Systems Manager (SSM) for remote debugging</a>.</p>
+
+        Attributes
+       ----------------------
+       enable_remote_debug: 	 <p>If set to True, enables remote debugging.</p>
+    """
+
+    enable_remote_debug: Optional[bool] = Unassigned()
+
+
+class ResourceConfigForUpdate(Base):
+    """
+    ResourceConfigForUpdate
+         <p>The <code>ResourceConfig</code> to update <code>KeepAlivePeriodInSeconds</code>. Other fields in the <code>ResourceConfig</code> cannot be updated.</p>
+
+        Attributes
+       ----------------------
+       keep_alive_period_in_seconds: 	 <p>The <code>KeepAlivePeriodInSeconds</code> value specified in the <code>ResourceConfig</code> to update.</p>
+    """
+
+    keep_alive_period_in_seconds: int
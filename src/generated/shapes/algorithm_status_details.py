@@ -0,0 +1,276 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .additional_s3_data_source import AdditionalS3DataSource, TransformJobDefinition
+from .channel import Channel, MetricDefinition, OutputDataConfig, ResourceConfig
+from .hyper_parameter_tuning_job_objective import HyperParameterTuningJobObjective
+from .stopping_condition import StoppingCondition
+
+
+class AlgorithmStatusItem(Base):
+    """
+    AlgorithmStatusItem
+         <p>Represents the overall status of an algorithm.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the algorithm for which the overall status is being reported.</p>
+       status: 	 <p>The current status.</p>
+       failure_reason: 	 <p>if the overall status is <code>Failed</code>, the reason for the failure.</p>
+    """
+
+    name: str
+    status: str
+    failure_reason: Optional[str] = Unassigned()
+
+
+class AlgorithmStatusDetails(Base):
+    """
+    AlgorithmStatusDetails
+         <p>Specifies the validation and image scan statuses of the algorithm.</p>
+
+        Attributes
+       ----------------------
+       validation_statuses: 	 <p>The status of algorithm validation.</p>
+       image_scan_statuses: 	 <p>The status of the scan of the algorithm's Docker image container.</p>
+    """
+
+    validation_statuses: Optional[List[AlgorithmStatusItem]] = Unassigned()
+    image_scan_statuses: Optional[List[AlgorithmStatusItem]] = Unassigned()
+
+
+class AlgorithmSummary(Base):
+    """
+    AlgorithmSummary
+         <p>Provides summary information about an algorithm.</p>
+
+        Attributes
+       ----------------------
+       algorithm_name: 	 <p>The name of the algorithm that is described by the summary.</p>
+       algorithm_arn: 	 <p>The Amazon Resource Name (ARN) of the algorithm.</p>
+       algorithm_description: 	 <p>A brief description of the algorithm.</p>
+       creation_time: 	 <p>A timestamp that shows when the algorithm was created.</p>
+       algorithm_status: 	 <p>The overall status of the algorithm.</p>
+    """
+
+    algorithm_name: str
+    algorithm_arn: str
+    creation_time: datetime.datetime
+    algorithm_status: str
+    algorithm_description: Optional[str] = Unassigned()
+
+
+class TrainingJobDefinition(Base):
+    """
+    TrainingJobDefinition
+         <p>Defines the input needed to run a training job using the algorithm.</p>
+
+        Attributes
+       ----------------------
+       training_input_mode
+       hyper_parameters: 	 <p>The hyperparameters used for the training job.</p>
+       input_data_config: 	 <p>An array of <code>Channel</code> objects, each of which specifies an input source.</p>
+       output_data_config: 	 <p>the path to the S3 bucket where you want to store model artifacts. SageMaker creates subfolders for the artifacts.</p>
+       resource_config: 	 <p>The resources, including the ML compute instances and ML storage volumes, to use for model training.</p>
+       stopping_condition: 	 <p>Specifies a limit to how long a model training job can run. It also specifies how long a managed Spot training job has to complete. When the job reaches the time limit, SageMaker ends the training job. Use this API to cap model training costs.</p> <p>To stop a job, SageMaker sends the algorithm the SIGTERM signal, which delays job termination for 120 seconds. Algorithms can use this 120-second window to save the model artifacts.</p>
+    """
+
+    training_input_mode: str
+    input_data_config: List[Channel]
+    output_data_config: OutputDataConfig
+    resource_config: ResourceConfig
+    stopping_condition: StoppingCondition
+    hyper_parameters: Optional[Dict[str, str]] = Unassigned()
+
+
+class AlgorithmValidationProfile(Base):
+    """
+    AlgorithmValidationProfile
+         <p>Defines a training job and a batch transform job that SageMaker runs to validate your algorithm.</p> <p>The data provided in the validation profile is made available to your buyers on Amazon Web Services Marketplace.</p>
+
+        Attributes
+       ----------------------
+       profile_name: 	 <p>The name of the profile for the algorithm. The name must have 1 to 63 characters. Valid characters are a-z, A-Z, 0-9, and - (hyphen).</p>
+       training_job_definition: 	 <p>The <code>TrainingJobDefinition</code> object that describes the training job that SageMaker runs to validate your algorithm.</p>
+       transform_job_definition: 	 <p>The <code>TransformJobDefinition</code> object that describes the transform job that SageMaker runs to validate your algorithm.</p>
+    """
+
+    profile_name: str
+    training_job_definition: TrainingJobDefinition
+    transform_job_definition: Optional[TransformJobDefinition] = Unassigned()
+
+
+class AlgorithmValidationSpecification(Base):
+    """
+    AlgorithmValidationSpecification
+         <p>Specifies configurations for one or more training jobs that SageMaker runs to test the algorithm.</p>
+
+        Attributes
+       ----------------------
+       validation_role: 	 <p>The IAM roles that SageMaker uses to run the training jobs.</p>
+       validation_profiles: 	 <p>An array of <code>AlgorithmValidationProfile</code> objects, each of which specifies a training job and batch transform job that SageMaker runs to validate your algorithm.</p>
+    """
+
+    validation_role: str
+    validation_profiles: List[AlgorithmValidationProfile]
+
+
+class CategoricalParameterRangeSpecification(Base):
+    """
+    CategoricalParameterRangeSpecification
+         <p>Defines the possible values for a categorical hyperparameter.</p>
+
+        Attributes
+       ----------------------
+       values: 	 <p>The allowed categories for the hyperparameter.</p>
+    """
+
+    values: List[str]
+
+
+class ChannelSpecification(Base):
+    """
+    ChannelSpecification
+         <p>Defines a named input source, called a channel, to be used by an algorithm.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the channel.</p>
+       description: 	 <p>A brief description of the channel.</p>
+       is_required: 	 <p>Indicates whether the channel is required by the algorithm.</p>
+       supported_content_types: 	 <p>The supported MIME types for the data.</p>
+       supported_compression_types: 	 <p>The allowed compression types, if data compression is used.</p>
+       supported_input_modes: 	 <p>The allowed input mode, either FILE or PIPE.</p> <p>In FILE mode, Amazon SageMaker copies the data from the input source onto the local Amazon Elastic Block Store (Amazon EBS) volumes before starting your training algorithm. This is the most commonly used input mode.</p> <p>In PIPE mode, Amazon SageMaker streams input data from the source directly to your algorithm without using the EBS volume.</p>
+    """
+
+    name: str
+    supported_content_types: List[str]
+    supported_input_modes: List[str]
+    description: Optional[str] = Unassigned()
+    is_required: Optional[bool] = Unassigned()
+    supported_compression_types: Optional[List[str]] = Unassigned()
+
+
+class ContinuousParameterRangeSpecification(Base):
+    """
+    ContinuousParameterRangeSpecification
+         <p>Defines the possible values for a continuous hyperparameter.</p>
+
+        Attributes
+       ----------------------
+       min_value: 	 <p>The minimum floating-point value allowed.</p>
+       max_value: 	 <p>The maximum floating-point value allowed.</p>
+    """
+
+    min_value: str
+    max_value: str
+
+
+class IntegerParameterRangeSpecification(Base):
+    """
+    IntegerParameterRangeSpecification
+         <p>Defines the possible values for an integer hyperparameter.</p>
+
+        Attributes
+       ----------------------
+       min_value: 	 <p>The minimum integer value allowed.</p>
+       max_value: 	 <p>The maximum integer value allowed.</p>
+    """
+
+    min_value: str
+    max_value: str
+
+
+class ParameterRange(Base):
+    """
+    ParameterRange
+         <p>Defines the possible values for categorical, continuous, and integer hyperparameters to be used by an algorithm.</p>
+
+        Attributes
+       ----------------------
+       integer_parameter_range_specification: 	 <p>A <code>IntegerParameterRangeSpecification</code> object that defines the possible values for an integer hyperparameter.</p>
+       continuous_parameter_range_specification: 	 <p>A <code>ContinuousParameterRangeSpecification</code> object that defines the possible values for a continuous hyperparameter.</p>
+       categorical_parameter_range_specification: 	 <p>A <code>CategoricalParameterRangeSpecification</code> object that defines the possible values for a categorical hyperparameter.</p>
+    """
+
+    integer_parameter_range_specification: Optional[
+        IntegerParameterRangeSpecification
+    ] = Unassigned()
+    continuous_parameter_range_specification: Optional[
+        ContinuousParameterRangeSpecification
+    ] = Unassigned()
+    categorical_parameter_range_specification: Optional[
+        CategoricalParameterRangeSpecification
+    ] = Unassigned()
+
+
+class HyperParameterSpecification(Base):
+    """
+    HyperParameterSpecification
+         <p>Defines a hyperparameter to be used by an algorithm.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of this hyperparameter. The name must be unique.</p>
+       description: 	 <p>A brief description of the hyperparameter.</p>
+       type: 	 <p>The type of this hyperparameter. The valid types are <code>Integer</code>, <code>Continuous</code>, <code>Categorical</code>, and <code>FreeText</code>.</p>
+       range: 	 <p>The allowed range for this hyperparameter.</p>
+       is_tunable: 	 <p>Indicates whether this hyperparameter is tunable in a hyperparameter tuning job.</p>
+       is_required: 	 <p>Indicates whether this hyperparameter is required.</p>
+       default_value: 	 <p>The default value for this hyperparameter. If a default value is specified, a hyperparameter cannot be required.</p>
+    """
+
+    name: str
+    type: str
+    description: Optional[str] = Unassigned()
+    range: Optional[ParameterRange] = Unassigned()
+    is_tunable: Optional[bool] = Unassigned()
+    is_required: Optional[bool] = Unassigned()
+    default_value: Optional[str] = Unassigned()
+
+
+class TrainingSpecification(Base):
+    """
+    TrainingSpecification
+         <p>Defines how the algorithm is used for a training job.</p>
+
+        Attributes
+       ----------------------
+       training_image: 	 <p>The Amazon ECR registry path of the Docker image that contains the training algorithm.</p>
+       training_image_digest: 	 <p>An MD5 hash of the training algorithm that identifies the Docker image used for training.</p>
+       supported_hyper_parameters: 	 <p>A list of the <code>HyperParameterSpecification</code> objects, that define the supported hyperparameters. This is required if the algorithm supports automatic model tuning.&gt;</p>
+       supported_training_instance_types: 	 <p>A list of the instance types that this algorithm can use for training.</p>
+       supports_distributed_training: 	 <p>Indicates whether the algorithm supports distributed training. If set to false, buyers can't request more than one instance during training.</p>
+       metric_definitions: 	 <p>A list of <code>MetricDefinition</code> objects, which are used for parsing metrics generated by the algorithm.</p>
+       training_channels: 	 <p>A list of <code>ChannelSpecification</code> objects, which specify the input sources to be used by the algorithm.</p>
+       supported_tuning_job_objective_metrics: 	 <p>A list of the metrics that the algorithm emits that can be used as the objective metric in a hyperparameter tuning job.</p>
+       additional_s3_data_source: 	 <p>The additional data source used during the training job.</p>
+    """
+
+    training_image: str
+    supported_training_instance_types: List[str]
+    training_channels: List[ChannelSpecification]
+    training_image_digest: Optional[str] = Unassigned()
+    supported_hyper_parameters: Optional[List[HyperParameterSpecification]] = (
+        Unassigned()
+    )
+    supports_distributed_training: Optional[bool] = Unassigned()
+    metric_definitions: Optional[List[MetricDefinition]] = Unassigned()
+    supported_tuning_job_objective_metrics: Optional[
+        List[HyperParameterTuningJobObjective]
+    ] = Unassigned()
+    additional_s3_data_source: Optional[AdditionalS3DataSource] = Unassigned()
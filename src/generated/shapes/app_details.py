@@ -0,0 +1,45 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .resource_spec import ResourceSpec
+
+
+class AppDetails(Base):
+    """
+    AppDetails
+         <p>Details about an Amazon SageMaker app.</p>
+
+        Attributes
+       ----------------------
+       domain_id: 	 <p>The domain ID.</p>
+       user_profile_name: 	 <p>The user profile name.</p>
+       space_name: 	 <p>The name of the space.</p>
+       app_type: 	 <p>The type of app.</p>
+       app_name: 	 <p>The name of the app.</p>
+       status: 	 <p>The status.</p>
+       creation_time: 	 <p>The creation time.</p>
+       resource_spec
+    """
+
+    domain_id: Optional[str] = Unassigned()
+    user_profile_name: Optional[str] = Unassigned()
+    space_name: Optional[str] = Unassigned()
+    app_type: Optional[str] = Unassigned()
+    app_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    resource_spec: Optional[ResourceSpec] = Unassigned()
@@ -0,0 +1,119 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class KernelSpec(Base):
+    """
+    KernelSpec
+         <p>The specification of a Jupyter kernel.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the Jupyter kernel in the image. This value is case sensitive.</p>
+       display_name: 	 <p>The display name of the kernel.</p>
+    """
+
+    name: str
+    display_name: Optional[str] = Unassigned()
+
+
+class FileSystemConfig(Base):
+    """
+    FileSystemConfig
+         <p>The Amazon Elastic File System storage configuration for a SageMaker image.</p>
+
+        Attributes
+       ----------------------
+       mount_path: 	 <p>The path within the image to mount the user's EFS home directory. The directory should be empty. If not specified, defaults to <i>/home/sagemaker-user</i>.</p>
+       default_uid: 	 <p>The default POSIX user ID (UID). If not specified, defaults to <code>1000</code>.</p>
+       default_gid: 	 <p>The default POSIX group ID (GID). If not specified, defaults to <code>100</code>.</p>
+    """
+
+    mount_path: Optional[str] = Unassigned()
+    default_uid: Optional[int] = Unassigned()
+    default_gid: Optional[int] = Unassigned()
+
+
+class KernelGatewayImageConfig(Base):
+    """
+    KernelGatewayImageConfig
+         <p>The configuration for the file system and kernels in a SageMaker image running as a KernelGateway app.</p>
+
+        Attributes
+       ----------------------
+       kernel_specs: 	 <p>The specification of the Jupyter kernels in the image.</p>
+       file_system_config: 	 <p>The Amazon Elastic File System storage configuration for a SageMaker image.</p>
+    """
+
+    kernel_specs: List[KernelSpec]
+    file_system_config: Optional[FileSystemConfig] = Unassigned()
+
+
+class ContainerConfig(Base):
+    """
+    ContainerConfig
+         <p>The configuration used to run the application image container.</p>
+
+        Attributes
+       ----------------------
+       container_arguments: 	 <p>The arguments for the container when you're running the application.</p>
+       container_entrypoint: 	 <p>The entrypoint used to run the application in the container.</p>
+       container_environment_variables: 	 <p>The environment variables to set in the container</p>
+    """
+
+    container_arguments: Optional[List[str]] = Unassigned()
+    container_entrypoint: Optional[List[str]] = Unassigned()
+    container_environment_variables: Optional[Dict[str, str]] = Unassigned()
+
+
+class JupyterLabAppImageConfig(Base):
+    """
+    JupyterLabAppImageConfig
+         <p>The configuration for the file system and kernels in a SageMaker image running as a JupyterLab app. The <code>FileSystemConfig</code> object is not supported.</p>
+
+        Attributes
+       ----------------------
+       file_system_config
+       container_config
+    """
+
+    file_system_config: Optional[FileSystemConfig] = Unassigned()
+    container_config: Optional[ContainerConfig] = Unassigned()
+
+
+class AppImageConfigDetails(Base):
+    """
+    AppImageConfigDetails
+         <p>The configuration for running a SageMaker image as a KernelGateway app.</p>
+
+        Attributes
+       ----------------------
+       app_image_config_arn: 	 <p>The ARN of the AppImageConfig.</p>
+       app_image_config_name: 	 <p>The name of the AppImageConfig. Must be unique to your account.</p>
+       creation_time: 	 <p>When the AppImageConfig was created.</p>
+       last_modified_time: 	 <p>When the AppImageConfig was last modified.</p>
+       kernel_gateway_image_config: 	 <p>The configuration for the file system and kernels in the SageMaker image.</p>
+       jupyter_lab_app_image_config: 	 <p>The configuration for the file system and the runtime, such as the environment variables and entry point.</p>
+    """
+
+    app_image_config_arn: Optional[str] = Unassigned()
+    app_image_config_name: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    kernel_gateway_image_config: Optional[KernelGatewayImageConfig] = Unassigned()
+    jupyter_lab_app_image_config: Optional[JupyterLabAppImageConfig] = Unassigned()
@@ -0,0 +1,289 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class AppSpecification(Base):
+    """
+    AppSpecification
+         <p>Configuration to run a processing job in a specified container image.</p>
+
+        Attributes
+       ----------------------
+       image_uri: 	 <p>The container image to be run by the processing job.</p>
+       container_entrypoint: 	 <p>The entrypoint for a container used to run a processing job.</p>
+       container_arguments: 	 <p>The arguments for a container used to run a processing job.</p>
+    """
+
+    image_uri: str
+    container_entrypoint: Optional[List[str]] = Unassigned()
+    container_arguments: Optional[List[str]] = Unassigned()
+
+
+class AthenaDatasetDefinition(Base):
+    """
+    AthenaDatasetDefinition
+         <p>Configuration for Athena Dataset Definition input.</p>
+
+        Attributes
+       ----------------------
+       catalog
+       database
+       query_string
+       work_group
+       output_s3_uri: 	 <p>The location in Amazon S3 where Athena query results are stored.</p>
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (Amazon Web Services KMS) key that Amazon SageMaker uses to encrypt data generated from an Athena query execution.</p>
+       output_format
+       output_compression
+    """
+
+    catalog: str
+    database: str
+    query_string: str
+    output_s3_uri: str
+    output_format: str
+    work_group: Optional[str] = Unassigned()
+    kms_key_id: Optional[str] = Unassigned()
+    output_compression: Optional[str] = Unassigned()
+
+
+class ProcessingS3Input(Base):
+    """
+    ProcessingS3Input
+         <p>Configuration for downloading input data from Amazon S3 into the processing container.</p>
+
+        Attributes
+       ----------------------
+       s3_uri: 	 <p>The URI of the Amazon S3 prefix Amazon SageMaker downloads data required to run a processing job.</p>
+       local_path: 	 <p>The local path in your container where you want Amazon SageMaker to write input data to. <code>LocalPath</code> is an absolute path to the input data and must begin with <code>/opt/ml/processing/</code>. <code>LocalPath</code> is a required parameter when <code>AppManaged</code> is <code>False</code> (default).</p>
+       s3_data_type: 	 <p>Whether you use an <code>S3Prefix</code> or a <code>ManifestFile</code> for the data type. If you choose <code>S3Prefix</code>, <code>S3Uri</code> identifies a key name prefix. Amazon SageMaker uses all objects with the specified key name prefix for the processing job. If you choose <code>ManifestFile</code>, <code>S3Uri</code> identifies an object that is a manifest file containing a list of object keys that you want Amazon SageMaker to use for the processing job.</p>
+       s3_input_mode: 	 <p>Whether to use <code>File</code> or <code>Pipe</code> input mode. In File mode, Amazon SageMaker copies the data from the input source onto the local ML storage volume before starting your processing container. This is the most commonly used input mode. In <code>Pipe</code> mode, Amazon SageMaker streams input data from the source directly to your processing container into named pipes without using the ML storage volume.</p>
+       s3_data_distribution_type: 	 <p>Whether to distribute the data from Amazon S3 to all processing instances with <code>FullyReplicated</code>, or whether the data from Amazon S3 is shared by Amazon S3 key, downloading one shard of data to each processing instance.</p>
+       s3_compression_type: 	 <p>Whether to GZIP-decompress the data in Amazon S3 as it is streamed into the processing container. <code>Gzip</code> can only be used when <code>Pipe</code> mode is specified as the <code>S3InputMode</code>. In <code>Pipe</code> mode, Amazon SageMaker streams input data from the source directly to your container without using the EBS volume.</p>
+    """
+
+    s3_uri: str
+    s3_data_type: str
+    local_path: Optional[str] = Unassigned()
+    s3_input_mode: Optional[str] = Unassigned()
+    s3_data_distribution_type: Optional[str] = Unassigned()
+    s3_compression_type: Optional[str] = Unassigned()
+
+
+class RedshiftDatasetDefinition(Base):
+    """
+    RedshiftDatasetDefinition
+         <p>Configuration for Redshift Dataset Definition input.</p>
+
+        Attributes
+       ----------------------
+       cluster_id
+       database
+       db_user
+       query_string
+       cluster_role_arn: 	 <p>The IAM role attached to your Redshift cluster that Amazon SageMaker uses to generate datasets.</p>
+       output_s3_uri: 	 <p>The location in Amazon S3 where the Redshift query results are stored.</p>
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (Amazon Web Services KMS) key that Amazon SageMaker uses to encrypt data from a Redshift execution.</p>
+       output_format
+       output_compression
+    """
+
+    cluster_id: str
+    database: str
+    db_user: str
+    query_string: str
+    cluster_role_arn: str
+    output_s3_uri: str
+    output_format: str
+    kms_key_id: Optional[str] = Unassigned()
+    output_compression: Optional[str] = Unassigned()
+
+
+class DatasetDefinition(Base):
+    """
+    DatasetDefinition
+         <p>Configuration for Dataset Definition inputs. The Dataset Definition input must specify exactly one of either <code>AthenaDatasetDefinition</code> or <code>RedshiftDatasetDefinition</code> types.</p>
+
+        Attributes
+       ----------------------
+       athena_dataset_definition
+       redshift_dataset_definition
+       local_path: 	 <p>The local path where you want Amazon SageMaker to download the Dataset Definition inputs to run a processing job. <code>LocalPath</code> is an absolute path to the input data. This is a required parameter when <code>AppManaged</code> is <code>False</code> (default).</p>
+       data_distribution_type: 	 <p>Whether the generated dataset is <code>FullyReplicated</code> or <code>ShardedByS3Key</code> (default).</p>
+       input_mode: 	 <p>Whether to use <code>File</code> or <code>Pipe</code> input mode. In <code>File</code> (default) mode, Amazon SageMaker copies the data from the input source onto the local Amazon Elastic Block Store (Amazon EBS) volumes before starting your training algorithm. This is the most commonly used input mode. In <code>Pipe</code> mode, Amazon SageMaker streams input data from the source directly to your algorithm without using the EBS volume.</p>
+    """
+
+    athena_dataset_definition: Optional[AthenaDatasetDefinition] = Unassigned()
+    redshift_dataset_definition: Optional[RedshiftDatasetDefinition] = Unassigned()
+    local_path: Optional[str] = Unassigned()
+    data_distribution_type: Optional[str] = Unassigned()
+    input_mode: Optional[str] = Unassigned()
+
+
+class ProcessingInput(Base):
+    """
+    ProcessingInput
+         <p>The inputs for a processing job. The processing input must specify exactly one of either <code>S3Input</code> or <code>DatasetDefinition</code> types.</p>
+
+        Attributes
+       ----------------------
+       input_name: 	 <p>The name for the processing job input.</p>
+       app_managed: 	 <p>When <code>True</code>, input operations such as data download are managed natively by the processing job application. When <code>False</code> (default), input operations are managed by Amazon SageMaker.</p>
+       s3_input: 	 <p>Configuration for downloading input data from Amazon S3 into the processing container.</p>
+       dataset_definition: 	 <p>Configuration for a Dataset Definition input. </p>
+    """
+
+    input_name: str
+    app_managed: Optional[bool] = Unassigned()
+    s3_input: Optional[ProcessingS3Input] = Unassigned()
+    dataset_definition: Optional[DatasetDefinition] = Unassigned()
+
+
+class ProcessingS3Output(Base):
+    """
+    ProcessingS3Output
+         <p>Configuration for uploading output data to Amazon S3 from the processing container.</p>
+
+        Attributes
+       ----------------------
+       s3_uri: 	 <p>A URI that identifies the Amazon S3 bucket where you want Amazon SageMaker to save the results of a processing job.</p>
+       local_path: 	 <p>The local path of a directory where you want Amazon SageMaker to upload its contents to Amazon S3. <code>LocalPath</code> is an absolute path to a directory containing output files. This directory will be created by the platform and exist when your container's entrypoint is invoked.</p>
+       s3_upload_mode: 	 <p>Whether to upload the results of the processing job continuously or after the job completes.</p>
+    """
+
+    s3_uri: str
+    local_path: str
+    s3_upload_mode: str
+
+
+class ProcessingFeatureStoreOutput(Base):
+    """
+    ProcessingFeatureStoreOutput
+         <p>Configuration for processing job outputs in Amazon SageMaker Feature Store.</p>
+
+        Attributes
+       ----------------------
+       feature_group_name: 	 <p>The name of the Amazon SageMaker FeatureGroup to use as the destination for processing job output. Note that your processing script is responsible for putting records into your Feature Store.</p>
+    """
+
+    feature_group_name: str
+
+
+class ProcessingOutput(Base):
+    """
+    ProcessingOutput
+         <p>Describes the results of a processing job. The processing output must specify exactly one of either <code>S3Output</code> or <code>FeatureStoreOutput</code> types.</p>
+
+        Attributes
+       ----------------------
+       output_name: 	 <p>The name for the processing job output.</p>
+       s3_output: 	 <p>Configuration for processing job outputs in Amazon S3.</p>
+       feature_store_output: 	 <p>Configuration for processing job outputs in Amazon SageMaker Feature Store. This processing output type is only supported when <code>AppManaged</code> is specified. </p>
+       app_managed: 	 <p>When <code>True</code>, output operations such as data upload are managed natively by the processing job application. When <code>False</code> (default), output operations are managed by Amazon SageMaker.</p>
+    """
+
+    output_name: str
+    s3_output: Optional[ProcessingS3Output] = Unassigned()
+    feature_store_output: Optional[ProcessingFeatureStoreOutput] = Unassigned()
+    app_managed: Optional[bool] = Unassigned()
+
+
+class ProcessingOutputConfig(Base):
+    """
+    ProcessingOutputConfig
+         <p>Configuration for uploading output from the processing container.</p>
+
+        Attributes
+       ----------------------
+       outputs: 	 <p>An array of outputs configuring the data to upload from the processing container.</p>
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (Amazon Web Services KMS) key that Amazon SageMaker uses to encrypt the processing job output. <code>KmsKeyId</code> can be an ID of a KMS key, ARN of a KMS key, alias of a KMS key, or alias of a KMS key. The <code>KmsKeyId</code> is applied to all outputs.</p>
+    """
+
+    outputs: List[ProcessingOutput]
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class ProcessingClusterConfig(Base):
+    """
+    ProcessingClusterConfig
+         <p>Configuration for the cluster used to run a processing job.</p>
+
+        Attributes
+       ----------------------
+       instance_count: 	 <p>The number of ML compute instances to use in the processing job. For distributed processing jobs, specify a value greater than 1. The default value is 1.</p>
+       instance_type: 	 <p>The ML compute instance type for the processing job.</p>
+       volume_size_in_g_b: 	 <p>The size of the ML storage volume in gigabytes that you want to provision. You must specify sufficient ML storage for your scenario.</p> <note> <p>Certain Nitro-based instances include local storage with a fixed total size, dependent on the instance type. When using these instances for processing, Amazon SageMaker mounts the local instance storage instead of Amazon EBS gp2 storage. You can't request a <code>VolumeSizeInGB</code> greater than the total size of the local instance storage.</p> <p>For a list of instance types that support local instance storage, including the total size per instance type, see <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/InstanceStorage.html#instance-store-volumes">Instance Store Volumes</a>.</p> </note>
+       volume_kms_key_id: 	 <p>The Amazon Web Services Key Management Service (Amazon Web Services KMS) key that Amazon SageMaker uses to encrypt data on the storage volume attached to the ML compute instance(s) that run the processing job. </p> <note> <p>Certain Nitro-based instances include local storage, dependent on the instance type. Local storage volumes are encrypted using a hardware module on the instance. You can't request a <code>VolumeKmsKeyId</code> when using an instance type with local storage.</p> <p>For a list of instance types that support local instance storage, see <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/InstanceStorage.html#instance-store-volumes">Instance Store Volumes</a>.</p> <p>For more information about local instance storage encryption, see <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ssd-instance-store.html">SSD Instance Store Volumes</a>.</p> </note>
+    """
+
+    instance_count: int
+    instance_type: str
+    volume_size_in_g_b: int
+    volume_kms_key_id: Optional[str] = Unassigned()
+
+
+class ProcessingResources(Base):
+    """
+    ProcessingResources
+         <p>Identifies the resources, ML compute instances, and ML storage volumes to deploy for a processing job. In distributed training, you specify more than one instance.</p>
+
+        Attributes
+       ----------------------
+       cluster_config: 	 <p>The configuration for the resources in a cluster used to run the processing job.</p>
+    """
+
+    cluster_config: ProcessingClusterConfig
+
+
+class ProcessingStoppingCondition(Base):
+    """
+    ProcessingStoppingCondition
+         <p>Configures conditions under which the processing job should be stopped, such as how long the processing job has been running. After the condition is met, the processing job is stopped.</p>
+
+        Attributes
+       ----------------------
+       max_runtime_in_seconds: 	 <p>Specifies the maximum runtime in seconds.</p>
+    """
+
+    max_runtime_in_seconds: int
+
+
+class ProcessingJobSummary(Base):
+    """
+    ProcessingJobSummary
+         <p>Summary of information about a processing job.</p>
+
+        Attributes
+       ----------------------
+       processing_job_name: 	 <p>The name of the processing job.</p>
+       processing_job_arn: 	 <p>The Amazon Resource Name (ARN) of the processing job..</p>
+       creation_time: 	 <p>The time at which the processing job was created.</p>
+       processing_end_time: 	 <p>The time at which the processing job completed.</p>
+       last_modified_time: 	 <p>A timestamp that indicates the last time the processing job was modified.</p>
+       processing_job_status: 	 <p>The status of the processing job.</p>
+       failure_reason: 	 <p>A string, up to one KB in size, that contains the reason a processing job failed, if it failed.</p>
+       exit_message: 	 <p>An optional string, up to one KB in size, that contains metadata from the processing container when the processing job exits.</p>
+    """
+
+    processing_job_name: str
+    processing_job_arn: str
+    creation_time: datetime.datetime
+    processing_job_status: str
+    processing_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    exit_message: Optional[str] = Unassigned()
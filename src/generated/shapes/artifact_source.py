@@ -0,0 +1,70 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ArtifactSourceType(Base):
+    """
+    ArtifactSourceType
+         <p>The ID and ID type of an artifact source.</p>
+
+        Attributes
+       ----------------------
+       source_id_type: 	 <p>The type of ID.</p>
+       value: 	 <p>The ID.</p>
+    """
+
+    source_id_type: str
+    value: str
+
+
+class ArtifactSource(Base):
+    """
+    ArtifactSource
+         <p>A structure describing the source of an artifact.</p>
+
+        Attributes
+       ----------------------
+       source_uri: 	 <p>The URI of the source.</p>
+       source_types: 	 <p>A list of source types.</p>
+    """
+
+    source_uri: str
+    source_types: Optional[List[ArtifactSourceType]] = Unassigned()
+
+
+class ArtifactSummary(Base):
+    """
+    ArtifactSummary
+         <p>Lists a summary of the properties of an artifact. An artifact represents a URI addressable object or data. Some examples are a dataset and a model.</p>
+
+        Attributes
+       ----------------------
+       artifact_arn: 	 <p>The Amazon Resource Name (ARN) of the artifact.</p>
+       artifact_name: 	 <p>The name of the artifact.</p>
+       source: 	 <p>The source of the artifact.</p>
+       artifact_type: 	 <p>The type of the artifact.</p>
+       creation_time: 	 <p>When the artifact was created.</p>
+       last_modified_time: 	 <p>When the artifact was last modified.</p>
+    """
+
+    artifact_arn: Optional[str] = Unassigned()
+    artifact_name: Optional[str] = Unassigned()
+    source: Optional[ArtifactSource] = Unassigned()
+    artifact_type: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
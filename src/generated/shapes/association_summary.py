@@ -0,0 +1,47 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .iam_identity import UserContext
+
+
+class AssociationSummary(Base):
+    """
+    AssociationSummary
+         <p>Lists a summary of the properties of an association. An association is an entity that links other lineage or experiment entities. An example would be an association between a training job and a model.</p>
+
+        Attributes
+       ----------------------
+       source_arn: 	 <p>The ARN of the source.</p>
+       destination_arn: 	 <p>The Amazon Resource Name (ARN) of the destination.</p>
+       source_type: 	 <p>The source type.</p>
+       destination_type: 	 <p>The destination type.</p>
+       association_type: 	 <p>The type of the association.</p>
+       source_name: 	 <p>The name of the source.</p>
+       destination_name: 	 <p>The name of the destination.</p>
+       creation_time: 	 <p>When the association was created.</p>
+       created_by
+    """
+
+    source_arn: Optional[str] = Unassigned()
+    destination_arn: Optional[str] = Unassigned()
+    source_type: Optional[str] = Unassigned()
+    destination_type: Optional[str] = Unassigned()
+    association_type: Optional[str] = Unassigned()
+    source_name: Optional[str] = Unassigned()
+    destination_name: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
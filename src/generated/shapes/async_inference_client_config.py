@@ -0,0 +1,227 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class AsyncInferenceClientConfig(Base):
+    """
+    AsyncInferenceClientConfig
+         <p>Configures the behavior of the client used by SageMaker to interact with the model container during asynchronous inference.</p>
+
+        Attributes
+       ----------------------
+       max_concurrent_invocations_per_instance: 	 <p>The maximum number of concurrent requests sent by the SageMaker client to the model container. If no value is provided, SageMaker chooses an optimal value.</p>
+    """
+
+    max_concurrent_invocations_per_instance: Optional[int] = Unassigned()
+
+
+class AsyncInferenceNotificationConfig(Base):
+    """
+    AsyncInferenceNotificationConfig
+         <p>Specifies the configuration for notifications of inference results for asynchronous inference.</p>
+
+        Attributes
+       ----------------------
+       success_topic: 	 <p>Amazon SNS topic to post a notification to when inference completes successfully. If no topic is provided, no notification is sent on success.</p>
+       error_topic: 	 <p>Amazon SNS topic to post a notification to when inference fails. If no topic is provided, no notification is sent on failure.</p>
+       include_inference_response_in: 	 <p>The Amazon SNS topics where you want the inference response to be included.</p> <note> <p>The inference response is included only if the response size is less than or equal to 128 KB.</p> </note>
+    """
+
+    success_topic: Optional[str] = Unassigned()
+    error_topic: Optional[str] = Unassigned()
+    include_inference_response_in: Optional[List[str]] = Unassigned()
+
+
+class AsyncInferenceOutputConfig(Base):
+    """
+    AsyncInferenceOutputConfig
+         <p>Specifies the configuration for asynchronous inference invocation outputs.</p>
+
+        Attributes
+       ----------------------
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (Amazon Web Services KMS) key that SageMaker uses to encrypt the asynchronous inference output in Amazon S3.</p> <p/>
+       s3_output_path: 	 <p>The Amazon S3 location to upload inference responses to.</p>
+       notification_config: 	 <p>Specifies the configuration for notifications of inference results for asynchronous inference.</p>
+       s3_failure_path: 	 <p>The Amazon S3 location to upload failure inference responses to.</p>
+    """
+
+    kms_key_id: Optional[str] = Unassigned()
+    s3_output_path: Optional[str] = Unassigned()
+    notification_config: Optional[AsyncInferenceNotificationConfig] = Unassigned()
+    s3_failure_path: Optional[str] = Unassigned()
+
+
+class AsyncInferenceConfig(Base):
+    """
+    AsyncInferenceConfig
+         <p>Specifies configuration for how an endpoint performs asynchronous inference.</p>
+
+        Attributes
+       ----------------------
+       client_config: 	 <p>Configures the behavior of the client used by SageMaker to interact with the model container during asynchronous inference.</p>
+       output_config: 	 <p>Specifies the configuration for asynchronous inference invocation outputs.</p>
+    """
+
+    output_config: AsyncInferenceOutputConfig
+    client_config: Optional[AsyncInferenceClientConfig] = Unassigned()
+
+
+class ClarifyInferenceConfig(Base):
+    """
+    ClarifyInferenceConfig
+         <p>The inference configuration parameter for the model container.</p>
+
+        Attributes
+       ----------------------
+       features_attribute: 	 <p>Provides the JMESPath expression to extract the features from a model container input in JSON Lines format. For example, if <code>FeaturesAttribute</code> is the JMESPath expression <code>'myfeatures'</code>, it extracts a list of features <code>[1,2,3]</code> from request data <code>'{"myfeatures":[1,2,3]}'</code>.</p>
+       content_template: 	 <p>A template string used to format a JSON record into an acceptable model container input. For example, a <code>ContentTemplate</code> string <code>'{"myfeatures":$features}'</code> will format a list of features <code>[1,2,3]</code> into the record string <code>'{"myfeatures":[1,2,3]}'</code>. Required only when the model container input is in JSON Lines format.</p>
+       max_record_count: 	 <p>The maximum number of records in a request that the model container can process when querying the model container for the predictions of a <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-create-endpoint.html#clarify-online-explainability-create-endpoint-synthetic">synthetic dataset</a>. A record is a unit of input data that inference can be made on, for example, a single line in CSV data. If <code>MaxRecordCount</code> is <code>1</code>, the model container expects one record per request. A value of 2 or greater means that the model expects batch requests, which can reduce overhead and speed up the inferencing process. If this parameter is not provided, the explainer will tune the record count per request according to the model container's capacity at runtime.</p>
+       max_payload_in_m_b: 	 <p>The maximum payload size (MB) allowed of a request from the explainer to the model container. Defaults to <code>6</code> MB.</p>
+       probability_index: 	 <p>A zero-based index used to extract a probability value (score) or list from model container output in CSV format. If this value is not provided, the entire model container output will be treated as a probability value (score) or list.</p> <p> <b>Example for a single class model:</b> If the model container output consists of a string-formatted prediction label followed by its probability: <code>'1,0.6'</code>, set <code>ProbabilityIndex</code> to <code>1</code> to select the probability value <code>0.6</code>.</p> <p> <b>Example for a multiclass model:</b> If the model container output consists of a string-formatted prediction label followed by its probability: <code>'"[\'cat\',\'dog\',\'fish\']","[0.1,0.6,0.3]"'</code>, set <code>ProbabilityIndex</code> to <code>1</code> to select the probability values <code>[0.1,0.6,0.3]</code>.</p>
+       label_index: 	 <p>A zero-based index used to extract a label header or list of label headers from model container output in CSV format.</p> <p> <b>Example for a multiclass model:</b> If the model container output consists of label headers followed by probabilities: <code>'"[\'cat\',\'dog\',\'fish\']","[0.1,0.6,0.3]"'</code>, set <code>LabelIndex</code> to <code>0</code> to select the label headers <code>['cat','dog','fish']</code>.</p>
+       probability_attribute: 	 <p>A JMESPath expression used to extract the probability (or score) from the model container output if the model container is in JSON Lines format.</p> <p> <b>Example</b>: If the model container output of a single request is <code>'{"predicted_label":1,"probability":0.6}'</code>, then set <code>ProbabilityAttribute</code> to <code>'probability'</code>.</p>
+       label_attribute: 	 <p>A JMESPath expression used to locate the list of label headers in the model container output.</p> <p> <b>Example</b>: If the model container output of a batch request is <code>'{"labels":["cat","dog","fish"],"probability":[0.6,0.3,0.1]}'</code>, then set <code>LabelAttribute</code> to <code>'labels'</code> to extract the list of label headers <code>["cat","dog","fish"]</code> </p>
+       label_headers: 	 <p>For multiclass classification problems, the label headers are the names of the classes. Otherwise, the label header is the name of the predicted label. These are used to help readability for the output of the <code>InvokeEndpoint</code> API. See the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-invoke-endpoint.html#clarify-online-explainability-response">response</a> section under <b>Invoke the endpoint</b> in the Developer Guide for more information. If there are no label headers in the model container output, provide them manually using this parameter.</p>
+       feature_headers: 	 <p>The names of the features. If provided, these are included in the endpoint response payload to help readability of the <code>InvokeEndpoint</code> output. See the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-invoke-endpoint.html#clarify-online-explainability-response">Response</a> section under <b>Invoke the endpoint</b> in the Developer Guide for more information.</p>
+       feature_types: 	 <p>A list of data types of the features (optional). Applicable only to NLP explainability. If provided, <code>FeatureTypes</code> must have at least one <code>'text'</code> string (for example, <code>['text']</code>). If <code>FeatureTypes</code> is not provided, the explainer infers the feature types based on the baseline data. The feature types are included in the endpoint response payload. For additional information see the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-invoke-endpoint.html#clarify-online-explainability-response">response</a> section under <b>Invoke the endpoint</b> in the Developer Guide for more information.</p>
+    """
+
+    features_attribute: Optional[str] = Unassigned()
+    content_template: Optional[str] = Unassigned()
+    max_record_count: Optional[int] = Unassigned()
+    max_payload_in_m_b: Optional[int] = Unassigned()
+    probability_index: Optional[int] = Unassigned()
+    label_index: Optional[int] = Unassigned()
+    probability_attribute: Optional[str] = Unassigned()
+    label_attribute: Optional[str] = Unassigned()
+    label_headers: Optional[List[str]] = Unassigned()
+    feature_headers: Optional[List[str]] = Unassigned()
+    feature_types: Optional[List[str]] = Unassigned()
+
+
+class ClarifyShapBaselineConfig(Base):
+    """
+    ClarifyShapBaselineConfig
+         <p>The configuration for the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-feature-attribute-shap-baselines.html">SHAP baseline</a> (also called the background or reference dataset) of the Kernal SHAP algorithm.</p> <note> <ul> <li> <p>The number of records in the baseline data determines the size of the synthetic dataset, which has an impact on latency of explainability requests. For more information, see the <b>Synthetic data</b> of <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-create-endpoint.html">Configure and create an endpoint</a>.</p> </li> <li> <p> <code>ShapBaseline</code> and <code>ShapBaselineUri</code> are mutually exclusive parameters. One or the either is required to configure a SHAP baseline. </p> </li> </ul> </note>
+
+        Attributes
+       ----------------------
+       mime_type: 	 <p>The MIME type of the baseline data. Choose from <code>'text/csv'</code> or <code>'application/jsonlines'</code>. Defaults to <code>'text/csv'</code>.</p>
+       shap_baseline: 	 <p>The inline SHAP baseline data in string format. <code>ShapBaseline</code> can have one or multiple records to be used as the baseline dataset. The format of the SHAP baseline file should be the same format as the training dataset. For example, if the training dataset is in CSV format and each record contains four features, and all features are numerical, then the format of the baseline data should also share these characteristics. For natural language processing (NLP) of text columns, the baseline value should be the value used to replace the unit of text specified by the <code>Granularity</code> of the <code>TextConfig</code> parameter. The size limit for <code>ShapBasline</code> is 4 KB. Use the <code>ShapBaselineUri</code> parameter if you want to provide more than 4 KB of baseline data.</p>
+       shap_baseline_uri: 	 <p>The uniform resource identifier (URI) of the S3 bucket where the SHAP baseline file is stored. The format of the SHAP baseline file should be the same format as the format of the training dataset. For example, if the training dataset is in CSV format, and each record in the training dataset has four features, and all features are numerical, then the baseline file should also have this same format. Each record should contain only the features. If you are using a virtual private cloud (VPC), the <code>ShapBaselineUri</code> should be accessible to the VPC. For more information about setting up endpoints with Amazon Virtual Private Cloud, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/infrastructure-give-access.html">Give SageMaker access to Resources in your Amazon Virtual Private Cloud</a>.</p>
+    """
+
+    mime_type: Optional[str] = Unassigned()
+    shap_baseline: Optional[str] = Unassigned()
+    shap_baseline_uri: Optional[str] = Unassigned()
+
+
+class ClarifyTextConfig(Base):
+    """
+    ClarifyTextConfig
+         <p>A parameter used to configure the SageMaker Clarify explainer to treat text features as text so that explanations are provided for individual units of text. Required only for natural language processing (NLP) explainability. </p>
+
+        Attributes
+       ----------------------
+       language: 	 <p>Specifies the language of the text features in <a href=" https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes">ISO 639-1</a> or <a href="https://en.wikipedia.org/wiki/ISO_639-3">ISO 639-3</a> code of a supported language. </p> <note> <p>For a mix of multiple languages, use code <code>'xx'</code>.</p> </note>
+       granularity: 	 <p>The unit of granularity for the analysis of text features. For example, if the unit is <code>'token'</code>, then each token (like a word in English) of the text is treated as a feature. SHAP values are computed for each unit/feature.</p>
+    """
+
+    language: str
+    granularity: str
+
+
+class ClarifyShapConfig(Base):
+    """
+    ClarifyShapConfig
+         <p>The configuration for SHAP analysis using SageMaker Clarify Explainer.</p>
+
+        Attributes
+       ----------------------
+       shap_baseline_config: 	 <p>The configuration for the SHAP baseline of the Kernal SHAP algorithm.</p>
+       number_of_samples: 	 <p>The number of samples to be used for analysis by the Kernal SHAP algorithm. </p> <note> <p>The number of samples determines the size of the synthetic dataset, which has an impact on latency of explainability requests. For more information, see the <b>Synthetic data</b> of <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-create-endpoint.html">Configure and create an endpoint</a>.</p> </note>
+       use_logit: 	 <p>A Boolean toggle to indicate if you want to use the logit function (true) or log-odds units (false) for model predictions. Defaults to false.</p>
+       seed: 	 <p>The starting value used to initialize the random number generator in the explainer. Provide a value for this parameter to obtain a deterministic SHAP result.</p>
+       text_config: 	 <p>A parameter that indicates if text features are treated as text and explanations are provided for individual units of text. Required for natural language processing (NLP) explainability only.</p>
+    """
+
+    shap_baseline_config: ClarifyShapBaselineConfig
+    number_of_samples: Optional[int] = Unassigned()
+    use_logit: Optional[bool] = Unassigned()
+    seed: Optional[int] = Unassigned()
+    text_config: Optional[ClarifyTextConfig] = Unassigned()
+
+
+class ClarifyExplainerConfig(Base):
+    """
+    ClarifyExplainerConfig
+         <p>The configuration parameters for the SageMaker Clarify explainer.</p>
+
+        Attributes
+       ----------------------
+       enable_explanations: 	 <p>A JMESPath boolean expression used to filter which records to explain. Explanations are activated by default. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-online-explainability-create-endpoint.html#clarify-online-explainability-create-endpoint-enable"> <code>EnableExplanations</code> </a>for additional information.</p>
+       inference_config: 	 <p>The inference configuration parameter for the model container.</p>
+       shap_config: 	 <p>The configuration for SHAP analysis.</p>
+    """
+
+    shap_config: ClarifyShapConfig
+    enable_explanations: Optional[str] = Unassigned()
+    inference_config: Optional[ClarifyInferenceConfig] = Unassigned()
+
+
+class ProductionVariantManagedInstanceScaling(Base):
+    """
+    ProductionVariantManagedInstanceScaling
+         <p>Settings that control the range in the number of instances that the endpoint provisions as it scales up or down to accommodate traffic. </p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>Indicates whether managed instance scaling is enabled.</p>
+       min_instance_count: 	 <p>The minimum number of instances that the endpoint must retain when it scales down to accommodate a decrease in traffic.</p>
+       max_instance_count: 	 <p>The maximum number of instances that the endpoint can provision when it scales up to accommodate an increase in traffic.</p>
+    """
+
+    status: Optional[str] = Unassigned()
+    min_instance_count: Optional[int] = Unassigned()
+    max_instance_count: Optional[int] = Unassigned()
+
+
+class ProductionVariantRoutingConfig(Base):
+    """
+    ProductionVariantRoutingConfig
+         <p>Settings that control how the endpoint routes incoming traffic to the instances that the endpoint hosts.</p>
+
+        Attributes
+       ----------------------
+       routing_strategy: 	 <p>Sets how the endpoint routes incoming traffic:</p> <ul> <li> <p> <code>LEAST_OUTSTANDING_REQUESTS</code>: The endpoint routes requests to the specific instances that have more capacity to process them.</p> </li> <li> <p> <code>RANDOM</code>: The endpoint routes each request to a randomly chosen instance.</p> </li> </ul>
+    """
+
+    routing_strategy: str
+
+
+class ExplainerConfig(Base):
+    """
+    ExplainerConfig
+         <p>A parameter to activate explainers.</p>
+
+        Attributes
+       ----------------------
+       clarify_explainer_config: 	 <p>A member of <code>ExplainerConfig</code> that contains configuration parameters for the SageMaker Clarify explainer.</p>
+    """
+
+    clarify_explainer_config: Optional[ClarifyExplainerConfig] = Unassigned()
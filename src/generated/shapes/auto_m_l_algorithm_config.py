@@ -0,0 +1,333 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .vpc_config import VpcConfig
+
+
+class AutoMLAlgorithmConfig(Base):
+    """
+    AutoMLAlgorithmConfig
+         <p>The collection of algorithms run on a dataset for training the model candidates of an Autopilot job.</p>
+
+        Attributes
+       ----------------------
+       auto_m_l_algorithms: 	 <p>The selection of algorithms run on a dataset to train the model candidates of an Autopilot job. </p> <note> <p>Selected algorithms must belong to the list corresponding to the training mode set in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLJobConfig.html#sagemaker-Type-AutoMLJobConfig-Mode">AutoMLJobConfig.Mode</a> (<code>ENSEMBLING</code> or <code>HYPERPARAMETER_TUNING</code>). Choose a minimum of 1 algorithm. </p> </note> <ul> <li> <p>In <code>ENSEMBLING</code> mode:</p> <ul> <li> <p>"catboost"</p> </li> <li> <p>"extra-trees"</p> </li> <li> <p>"fastai"</p> </li> <li> <p>"lightgbm"</p> </li> <li> <p>"linear-learner"</p> </li> <li> <p>"nn-torch"</p> </li> <li> <p>"randomforest"</p> </li> <li> <p>"xgboost"</p> </li> </ul> </li> <li> <p>In <code>HYPERPARAMETER_TUNING</code> mode:</p> <ul> <li> <p>"linear-learner"</p> </li> <li> <p>"mlp"</p> </li> <li> <p>"xgboost"</p> </li> </ul> </li> </ul>
+    """
+
+    auto_m_l_algorithms: List[str]
+
+
+class FinalAutoMLJobObjectiveMetric(Base):
+    """
+    FinalAutoMLJobObjectiveMetric
+         <p>The best candidate result from an AutoML training job.</p>
+
+        Attributes
+       ----------------------
+       type: 	 <p>The type of metric with the best result.</p>
+       metric_name: 	 <p>The name of the metric with the best result. For a description of the possible objective metrics, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLJobObjective.html">AutoMLJobObjective$MetricName</a>.</p>
+       value: 	 <p>The value of the metric with the best result.</p>
+       standard_metric_name: 	 <p>The name of the standard metric. For a description of the standard metrics, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-metrics-validation.html#autopilot-metrics">Autopilot candidate metrics</a>.</p>
+    """
+
+    metric_name: str
+    value: float
+    type: Optional[str] = Unassigned()
+    standard_metric_name: Optional[str] = Unassigned()
+
+
+class AutoMLCandidateStep(Base):
+    """
+    AutoMLCandidateStep
+         <p>Information about the steps for a candidate and what step it is working on.</p>
+
+        Attributes
+       ----------------------
+       candidate_step_type: 	 <p>Whether the candidate is at the transform, training, or processing step.</p>
+       candidate_step_arn: 	 <p>The ARN for the candidate's step.</p>
+       candidate_step_name: 	 <p>The name for the candidate's step.</p>
+    """
+
+    candidate_step_type: str
+    candidate_step_arn: str
+    candidate_step_name: str
+
+
+class AutoMLContainerDefinition(Base):
+    """
+    AutoMLContainerDefinition
+         <p>A list of container definitions that describe the different containers that make up an AutoML candidate. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ContainerDefinition.html"> ContainerDefinition</a>.</p>
+
+        Attributes
+       ----------------------
+       image: 	 <p>The Amazon Elastic Container Registry (Amazon ECR) path of the container. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ContainerDefinition.html"> ContainerDefinition</a>.</p>
+       model_data_url: 	 <p>The location of the model artifacts. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ContainerDefinition.html"> ContainerDefinition</a>.</p>
+       environment: 	 <p>The environment variables to set in the container. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ContainerDefinition.html"> ContainerDefinition</a>.</p>
+    """
+
+    image: str
+    model_data_url: str
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class CandidateArtifactLocations(Base):
+    """
+    CandidateArtifactLocations
+         <p>The location of artifacts for an AutoML candidate job.</p>
+
+        Attributes
+       ----------------------
+       explainability: 	 <p>The Amazon S3 prefix to the explainability artifacts generated for the AutoML candidate.</p>
+       model_insights: 	 <p>The Amazon S3 prefix to the model insight artifacts generated for the AutoML candidate.</p>
+       backtest_results: 	 <p>The Amazon S3 prefix to the accuracy metrics and the inference results observed over the testing window. Available only for the time-series forecasting problem type.</p>
+    """
+
+    explainability: str
+    model_insights: Optional[str] = Unassigned()
+    backtest_results: Optional[str] = Unassigned()
+
+
+class MetricDatum(Base):
+    """
+    MetricDatum
+         <p>Information about the metric for a candidate produced by an AutoML job.</p>
+
+        Attributes
+       ----------------------
+       metric_name: 	 <p>The name of the metric.</p>
+       value: 	 <p>The value of the metric.</p>
+       set: 	 <p>The dataset split from which the AutoML job produced the metric.</p>
+       standard_metric_name: 	 <p>The name of the standard metric. </p> <note> <p>For definitions of the standard metrics, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-metrics"> <code>Autopilot candidate metrics</code> </a>.</p> </note>
+    """
+
+    metric_name: Optional[str] = Unassigned()
+    value: Optional[float] = Unassigned()
+    set: Optional[str] = Unassigned()
+    standard_metric_name: Optional[str] = Unassigned()
+
+
+class CandidateProperties(Base):
+    """
+    CandidateProperties
+         <p>The properties of an AutoML candidate job.</p>
+
+        Attributes
+       ----------------------
+       candidate_artifact_locations: 	 <p>The Amazon S3 prefix to the artifacts generated for an AutoML candidate.</p>
+       candidate_metrics: 	 <p>Information about the candidate metrics for an AutoML job.</p>
+    """
+
+    candidate_artifact_locations: Optional[CandidateArtifactLocations] = Unassigned()
+    candidate_metrics: Optional[List[MetricDatum]] = Unassigned()
+
+
+class AutoMLCandidate(Base):
+    """
+    AutoMLCandidate
+         <p>Information about a candidate produced by an AutoML training job, including its status, steps, and other properties.</p>
+
+        Attributes
+       ----------------------
+       candidate_name: 	 <p>The name of the candidate.</p>
+       final_auto_m_l_job_objective_metric
+       objective_status: 	 <p>The objective's status.</p>
+       candidate_steps: 	 <p>Information about the candidate's steps.</p>
+       candidate_status: 	 <p>The candidate's status.</p>
+       inference_containers: 	 <p>Information about the recommended inference container definitions.</p>
+       creation_time: 	 <p>The creation time.</p>
+       end_time: 	 <p>The end time.</p>
+       last_modified_time: 	 <p>The last modified time.</p>
+       failure_reason: 	 <p>The failure reason.</p>
+       candidate_properties: 	 <p>The properties of an AutoML candidate job.</p>
+       inference_container_definitions: 	 <p>The mapping of all supported processing unit (CPU, GPU, etc...) to inference container definitions for the candidate. This field is populated for the AutoML jobs V2 (for example, for jobs created by calling <code>CreateAutoMLJobV2</code>) related to image or text classification problem types only.</p>
+    """
+
+    candidate_name: str
+    objective_status: str
+    candidate_steps: List[AutoMLCandidateStep]
+    candidate_status: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    final_auto_m_l_job_objective_metric: Optional[FinalAutoMLJobObjectiveMetric] = (
+        Unassigned()
+    )
+    inference_containers: Optional[List[AutoMLContainerDefinition]] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    candidate_properties: Optional[CandidateProperties] = Unassigned()
+    inference_container_definitions: Optional[
+        Dict[str, List[AutoMLContainerDefinition]]
+    ] = Unassigned()
+
+
+class AutoMLS3DataSource(Base):
+    """
+    AutoMLS3DataSource
+         <p>Describes the Amazon S3 data source.</p>
+
+        Attributes
+       ----------------------
+       s3_data_type: 	 <p>The data type. </p> <ul> <li> <p>If you choose <code>S3Prefix</code>, <code>S3Uri</code> identifies a key name prefix. SageMaker uses all objects that match the specified key name prefix for model training.</p> <p>The <code>S3Prefix</code> should have the following format:</p> <p> <code>s3://DOC-EXAMPLE-BUCKET/DOC-EXAMPLE-FOLDER-OR-FILE</code> </p> </li> <li> <p>If you choose <code>ManifestFile</code>, <code>S3Uri</code> identifies an object that is a manifest file containing a list of object keys that you want SageMaker to use for model training.</p> <p>A <code>ManifestFile</code> should have the format shown below:</p> <p> <code>[ {"prefix": "s3://DOC-EXAMPLE-BUCKET/DOC-EXAMPLE-FOLDER/DOC-EXAMPLE-PREFIX/"}, </code> </p> <p> <code>"DOC-EXAMPLE-RELATIVE-PATH/DOC-EXAMPLE-FOLDER/DATA-1",</code> </p> <p> <code>"DOC-EXAMPLE-RELATIVE-PATH/DOC-EXAMPLE-FOLDER/DATA-2",</code> </p> <p> <code>... "DOC-EXAMPLE-RELATIVE-PATH/DOC-EXAMPLE-FOLDER/DATA-N" ]</code> </p> </li> <li> <p>If you choose <code>AugmentedManifestFile</code>, <code>S3Uri</code> identifies an object that is an augmented manifest file in JSON lines format. This file contains the data you want to use for model training. <code>AugmentedManifestFile</code> is available for V2 API jobs only (for example, for jobs created by calling <code>CreateAutoMLJobV2</code>).</p> <p>Here is a minimal, single-record example of an <code>AugmentedManifestFile</code>:</p> <p> <code>{"source-ref": "s3://DOC-EXAMPLE-BUCKET/DOC-EXAMPLE-FOLDER/cats/cat.jpg",</code> </p> <p> <code>"label-metadata": {"class-name": "cat"</code> }</p> <p>For more information on <code>AugmentedManifestFile</code>, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/augmented-manifest.html">Provide Dataset Metadata to Training Jobs with an Augmented Manifest File</a>.</p> </li> </ul>
+       s3_uri: 	 <p>The URL to the Amazon S3 data source. The Uri refers to the Amazon S3 prefix or ManifestFile depending on the data type.</p>
+    """
+
+    s3_data_type: str
+    s3_uri: str
+
+
+class AutoMLDataSource(Base):
+    """
+    AutoMLDataSource
+         <p>The data source for the Autopilot job.</p>
+
+        Attributes
+       ----------------------
+       s3_data_source: 	 <p>The Amazon S3 location of the input data.</p>
+    """
+
+    s3_data_source: AutoMLS3DataSource
+
+
+class AutoMLDataSplitConfig(Base):
+    """
+    AutoMLDataSplitConfig
+         <p>This structure specifies how to split the data into train and validation datasets.</p> <p>The validation and training datasets must contain the same headers. For jobs created by calling <code>CreateAutoMLJob</code>, the validation dataset must be less than 2 GB in size.</p>
+
+        Attributes
+       ----------------------
+       validation_fraction: 	 <p>The validation fraction (optional) is a float that specifies the portion of the training dataset to be used for validation. The default value is 0.2, and values must be greater than 0 and less than 1. We recommend setting this value to be less than 0.5.</p>
+    """
+
+    validation_fraction: Optional[float] = Unassigned()
+
+
+class AutoMLJobArtifacts(Base):
+    """
+    AutoMLJobArtifacts
+         <p>The artifacts that are generated during an AutoML job.</p>
+
+        Attributes
+       ----------------------
+       candidate_definition_notebook_location: 	 <p>The URL of the notebook location.</p>
+       data_exploration_notebook_location: 	 <p>The URL of the notebook location.</p>
+    """
+
+    candidate_definition_notebook_location: Optional[str] = Unassigned()
+    data_exploration_notebook_location: Optional[str] = Unassigned()
+
+
+class AutoMLJobCompletionCriteria(Base):
+    """
+    AutoMLJobCompletionCriteria
+         <p>How long a job is allowed to run, or how many candidates a job is allowed to generate.</p>
+
+        Attributes
+       ----------------------
+       max_candidates: 	 <p>The maximum number of times a training job is allowed to run.</p> <p>For text and image classification, time-series forecasting, as well as text generation (LLMs fine-tuning) problem types, the supported value is 1. For tabular problem types, the maximum value is 750.</p>
+       max_runtime_per_training_job_in_seconds: 	 <p>The maximum time, in seconds, that each training job executed inside hyperparameter tuning is allowed to run as part of a hyperparameter tuning job. For more information, see the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_StoppingCondition.html">StoppingCondition</a> used by the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateHyperParameterTuningJob.html">CreateHyperParameterTuningJob</a> action.</p> <p>For job V2s (jobs created by calling <code>CreateAutoMLJobV2</code>), this field controls the runtime of the job candidate.</p> <p>For <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_TextClassificationJobConfig.html">TextGenerationJobConfig</a> problem types, the maximum time defaults to 72 hours (259200 seconds).</p>
+       max_auto_m_l_job_runtime_in_seconds: 	 <p>The maximum runtime, in seconds, an AutoML job has to complete.</p> <p>If an AutoML job exceeds the maximum runtime, the job is stopped automatically and its processing is ended gracefully. The AutoML job identifies the best model whose training was completed and marks it as the best-performing model. Any unfinished steps of the job, such as automatic one-click Autopilot model deployment, are not completed.</p>
+    """
+
+    max_candidates: Optional[int] = Unassigned()
+    max_runtime_per_training_job_in_seconds: Optional[int] = Unassigned()
+    max_auto_m_l_job_runtime_in_seconds: Optional[int] = Unassigned()
+
+
+class AutoMLSecurityConfig(Base):
+    """
+    AutoMLSecurityConfig
+         <p>Security options.</p>
+
+        Attributes
+       ----------------------
+       volume_kms_key_id: 	 <p>The key used to encrypt stored data.</p>
+       enable_inter_container_traffic_encryption: 	 <p>Whether to use traffic encryption between the container layers.</p>
+       vpc_config: 	 <p>The VPC configuration.</p>
+    """
+
+    volume_kms_key_id: Optional[str] = Unassigned()
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+
+
+class AutoMLJobObjective(Base):
+    """
+    AutoMLJobObjective
+         <p>Specifies a metric to minimize or maximize as the objective of an AutoML job.</p>
+
+        Attributes
+       ----------------------
+       metric_name: 	 <p>The name of the objective metric used to measure the predictive quality of a machine learning system. During training, the model's parameters are updated iteratively to optimize its performance based on the feedback provided by the objective metric when evaluating the model on the validation dataset.</p> <p>The list of available metrics supported by Autopilot and the default metric applied when you do not specify a metric name explicitly depend on the problem type.</p> <ul> <li> <p>For tabular problem types:</p> <ul> <li> <p>List of available metrics: </p> <ul> <li> <p> Regression: <code>MAE</code>, <code>MSE</code>, <code>R2</code>, <code>RMSE</code> </p> </li> <li> <p> Binary classification: <code>Accuracy</code>, <code>AUC</code>, <code>BalancedAccuracy</code>, <code>F1</code>, <code>Precision</code>, <code>Recall</code> </p> </li> <li> <p> Multiclass classification: <code>Accuracy</code>, <code>BalancedAccuracy</code>, <code>F1macro</code>, <code>PrecisionMacro</code>, <code>RecallMacro</code> </p> </li> </ul> <p>For a description of each metric, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-metrics-validation.html#autopilot-metrics">Autopilot metrics for classification and regression</a>.</p> </li> <li> <p>Default objective metrics:</p> <ul> <li> <p>Regression: <code>MSE</code>.</p> </li> <li> <p>Binary classification: <code>F1</code>.</p> </li> <li> <p>Multiclass classification: <code>Accuracy</code>.</p> </li> </ul> </li> </ul> </li> <li> <p>For image or text classification problem types:</p> <ul> <li> <p>List of available metrics: <code>Accuracy</code> </p> <p>For a description of each metric, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/text-classification-data-format-and-metric.html">Autopilot metrics for text and image classification</a>.</p> </li> <li> <p>Default objective metrics: <code>Accuracy</code> </p> </li> </ul> </li> <li> <p>For time-series forecasting problem types:</p> <ul> <li> <p>List of available metrics: <code>RMSE</code>, <code>wQL</code>, <code>Average wQL</code>, <code>MASE</code>, <code>MAPE</code>, <code>WAPE</code> </p> <p>For a description of each metric, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/timeseries-objective-metric.html">Autopilot metrics for time-series forecasting</a>.</p> </li> <li> <p>Default objective metrics: <code>AverageWeightedQuantileLoss</code> </p> </li> </ul> </li> <li> <p>For text generation problem types (LLMs fine-tuning): Fine-tuning language models in Autopilot does not require setting the <code>AutoMLJobObjective</code> field. Autopilot fine-tunes LLMs without requiring multiple candidates to be trained and evaluated. Instead, using your dataset, Autopilot directly fine-tunes your target model to enhance a default objective metric, the cross-entropy loss. After fine-tuning a language model, you can evaluate the quality of its generated text using different metrics. For a list of the available metrics, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-llms-finetuning-metrics.html">Metrics for fine-tuning LLMs in Autopilot</a>.</p> </li> </ul>
+    """
+
+    metric_name: str
+
+
+class AutoMLPartialFailureReason(Base):
+    """
+    AutoMLPartialFailureReason
+         <p>The reason for a partial failure of an AutoML job.</p>
+
+        Attributes
+       ----------------------
+       partial_failure_message: 	 <p>The message containing the reason for a partial failure of an AutoML job.</p>
+    """
+
+    partial_failure_message: Optional[str] = Unassigned()
+
+
+class AutoMLOutputDataConfig(Base):
+    """
+    AutoMLOutputDataConfig
+         <p>The output data configuration.</p>
+
+        Attributes
+       ----------------------
+       kms_key_id: 	 <p>The Key Management Service encryption key ID.</p>
+       s3_output_path: 	 <p>The Amazon S3 output path. Must be 128 characters or less.</p>
+    """
+
+    s3_output_path: str
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class ModelDeployConfig(Base):
+    """
+    ModelDeployConfig
+         <p>Specifies how to generate the endpoint name for an automatic one-click Autopilot model deployment.</p>
+
+        Attributes
+       ----------------------
+       auto_generate_endpoint_name: 	 <p>Set to <code>True</code> to automatically generate an endpoint name for a one-click Autopilot model deployment; set to <code>False</code> otherwise. The default value is <code>False</code>.</p> <note> <p>If you set <code>AutoGenerateEndpointName</code> to <code>True</code>, do not specify the <code>EndpointName</code>; otherwise a 400 error is thrown.</p> </note>
+       endpoint_name: 	 <p>Specifies the endpoint name to use for a one-click Autopilot model deployment if the endpoint name is not generated automatically.</p> <note> <p>Specify the <code>EndpointName</code> if and only if you set <code>AutoGenerateEndpointName</code> to <code>False</code>; otherwise a 400 error is thrown.</p> </note>
+    """
+
+    auto_generate_endpoint_name: Optional[bool] = Unassigned()
+    endpoint_name: Optional[str] = Unassigned()
+
+
+class ModelDeployResult(Base):
+    """
+    ModelDeployResult
+         <p>Provides information about the endpoint of the model deployment.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The name of the endpoint to which the model has been deployed.</p> <note> <p>If model deployment fails, this field is omitted from the response.</p> </note>
+    """
+
+    endpoint_name: Optional[str] = Unassigned()
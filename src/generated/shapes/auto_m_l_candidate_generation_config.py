@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .auto_m_l_algorithm_config import (
+    AutoMLAlgorithmConfig,
+    AutoMLDataSource,
+    AutoMLDataSplitConfig,
+    AutoMLJobCompletionCriteria,
+    AutoMLJobObjective,
+    AutoMLPartialFailureReason,
+    AutoMLSecurityConfig,
+)
+
+
+class AutoMLCandidateGenerationConfig(Base):
+    """
+    AutoMLCandidateGenerationConfig
+         <p>Stores the configuration information for how a candidate is generated (optional).</p>
+
+        Attributes
+       ----------------------
+       feature_specification_s3_uri: 	 <p>A URL to the Amazon S3 data source containing selected features from the input data source to run an Autopilot job. You can input <code>FeatureAttributeNames</code> (optional) in JSON format as shown below: </p> <p> <code>{ "FeatureAttributeNames":["col1", "col2", ...] }</code>.</p> <p>You can also specify the data type of the feature (optional) in the format shown below:</p> <p> <code>{ "FeatureDataTypes":{"col1":"numeric", "col2":"categorical" ... } }</code> </p> <note> <p>These column keys may not include the target column.</p> </note> <p>In ensembling mode, Autopilot only supports the following data types: <code>numeric</code>, <code>categorical</code>, <code>text</code>, and <code>datetime</code>. In HPO mode, Autopilot can support <code>numeric</code>, <code>categorical</code>, <code>text</code>, <code>datetime</code>, and <code>sequence</code>.</p> <p>If only <code>FeatureDataTypes</code> is provided, the column keys (<code>col1</code>, <code>col2</code>,..) should be a subset of the column names in the input data. </p> <p>If both <code>FeatureDataTypes</code> and <code>FeatureAttributeNames</code> are provided, then the column keys should be a subset of the column names provided in <code>FeatureAttributeNames</code>. </p> <p>The key name <code>FeatureAttributeNames</code> is fixed. The values listed in <code>["col1", "col2", ...]</code> are case sensitive and should be a list of strings containing unique values that are a subset of the column names in the input data. The list of columns provided must not include the target column.</p>
+       algorithms_config: 	 <p>Stores the configuration information for the selection of algorithms used to train the model candidates.</p> <p>The list of available algorithms to choose from depends on the training mode set in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLJobConfig.html"> <code>AutoMLJobConfig.Mode</code> </a>.</p> <ul> <li> <p> <code>AlgorithmsConfig</code> should not be set in <code>AUTO</code> training mode.</p> </li> <li> <p>When <code>AlgorithmsConfig</code> is provided, one <code>AutoMLAlgorithms</code> attribute must be set and one only.</p> <p>If the list of algorithms provided as values for <code>AutoMLAlgorithms</code> is empty, <code>AutoMLCandidateGenerationConfig</code> uses the full set of algorithms for the given training mode.</p> </li> <li> <p>When <code>AlgorithmsConfig</code> is not provided, <code>AutoMLCandidateGenerationConfig</code> uses the full set of algorithms for the given training mode.</p> </li> </ul> <p>For the list of all algorithms per training mode, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLAlgorithmConfig.html"> AutoMLAlgorithmConfig</a>.</p> <p>For more information on each algorithm, see the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-algorithm-support">Algorithm support</a> section in Autopilot developer guide.</p>
+    """
+
+    feature_specification_s3_uri: Optional[str] = Unassigned()
+    algorithms_config: Optional[List[AutoMLAlgorithmConfig]] = Unassigned()
+
+
+class AutoMLChannel(Base):
+    """
+    AutoMLChannel
+         <p>A channel is a named input source that training algorithms can consume. The validation dataset size is limited to less than 2 GB. The training dataset size must be less than 100 GB. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Channel.html"> Channel</a>.</p> <note> <p>A validation dataset must contain the same headers as the training dataset.</p> </note> <p/>
+
+        Attributes
+       ----------------------
+       data_source: 	 <p>The data source for an AutoML channel.</p>
+       compression_type: 	 <p>You can use <code>Gzip</code> or <code>None</code>. The default value is <code>None</code>.</p>
+       target_attribute_name: 	 <p>The name of the target variable in supervised learning, usually represented by 'y'.</p>
+       content_type: 	 <p>The content type of the data from the input source. You can use <code>text/csv;header=present</code> or <code>x-application/vnd.amazon+parquet</code>. The default value is <code>text/csv;header=present</code>.</p>
+       channel_type: 	 <p>The channel type (optional) is an <code>enum</code> string. The default value is <code>training</code>. Channels for training and validation must share the same <code>ContentType</code> and <code>TargetAttributeName</code>. For information on specifying training and validation channel types, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-datasets-problem-types.html#autopilot-data-sources-training-or-validation">How to specify training and validation datasets</a>.</p>
+       sample_weight_attribute_name: 	 <p>If specified, this column name indicates which column of the dataset should be treated as sample weights for use by the objective metric during the training, evaluation, and the selection of the best model. This column is not considered as a predictive feature. For more information on Autopilot metrics, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-metrics-validation.html">Metrics and validation</a>.</p> <p>Sample weights should be numeric, non-negative, with larger values indicating which rows are more important than others. Data points that have invalid or no weight value are excluded.</p> <p>Support for sample weights is available in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLAlgorithmConfig.html">Ensembling</a> mode only.</p>
+    """
+
+    target_attribute_name: str
+    data_source: Optional[AutoMLDataSource] = Unassigned()
+    compression_type: Optional[str] = Unassigned()
+    content_type: Optional[str] = Unassigned()
+    channel_type: Optional[str] = Unassigned()
+    sample_weight_attribute_name: Optional[str] = Unassigned()
+
+
+class AutoMLJobConfig(Base):
+    """
+    AutoMLJobConfig
+         <p>A collection of settings used for an AutoML job.</p>
+
+        Attributes
+       ----------------------
+       completion_criteria: 	 <p>How long an AutoML job is allowed to run, or how many candidates a job is allowed to generate.</p>
+       security_config: 	 <p>The security configuration for traffic encryption or Amazon VPC settings.</p>
+       candidate_generation_config: 	 <p>The configuration for generating a candidate for an AutoML job (optional). </p>
+       data_split_config: 	 <p>The configuration for splitting the input training dataset.</p> <p>Type: AutoMLDataSplitConfig</p>
+       mode: 	 <p>The method that Autopilot uses to train the data. You can either specify the mode manually or let Autopilot choose for you based on the dataset size by selecting <code>AUTO</code>. In <code>AUTO</code> mode, Autopilot chooses <code>ENSEMBLING</code> for datasets smaller than 100 MB, and <code>HYPERPARAMETER_TUNING</code> for larger ones.</p> <p>The <code>ENSEMBLING</code> mode uses a multi-stack ensemble model to predict classification and regression tasks directly from your dataset. This machine learning mode combines several base models to produce an optimal predictive model. It then uses a stacking ensemble method to combine predictions from contributing members. A multi-stack ensemble model can provide better performance over a single model by combining the predictive capabilities of multiple models. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-algorithm-support">Autopilot algorithm support</a> for a list of algorithms supported by <code>ENSEMBLING</code> mode.</p> <p>The <code>HYPERPARAMETER_TUNING</code> (HPO) mode uses the best hyperparameters to train the best version of a model. HPO automatically selects an algorithm for the type of problem you want to solve. Then HPO finds the best hyperparameters according to your objective metric. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-algorithm-support">Autopilot algorithm support</a> for a list of algorithms supported by <code>HYPERPARAMETER_TUNING</code> mode.</p>
+    """
+
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+    security_config: Optional[AutoMLSecurityConfig] = Unassigned()
+    candidate_generation_config: Optional[AutoMLCandidateGenerationConfig] = (
+        Unassigned()
+    )
+    data_split_config: Optional[AutoMLDataSplitConfig] = Unassigned()
+    mode: Optional[str] = Unassigned()
+
+
+class AutoMLJobSummary(Base):
+    """
+    AutoMLJobSummary
+         <p>Provides a summary about an AutoML job.</p>
+
+        Attributes
+       ----------------------
+       auto_m_l_job_name: 	 <p>The name of the AutoML job you are requesting.</p>
+       auto_m_l_job_arn: 	 <p>The ARN of the AutoML job.</p>
+       auto_m_l_job_status: 	 <p>The status of the AutoML job.</p>
+       auto_m_l_job_secondary_status: 	 <p>The secondary status of the AutoML job.</p>
+       creation_time: 	 <p>When the AutoML job was created.</p>
+       end_time: 	 <p>The end time of an AutoML job.</p>
+       last_modified_time: 	 <p>When the AutoML job was last modified.</p>
+       failure_reason: 	 <p>The failure reason of an AutoML job.</p>
+       partial_failure_reasons: 	 <p>The list of reasons for partial failures within an AutoML job.</p>
+    """
+
+    auto_m_l_job_name: str
+    auto_m_l_job_arn: str
+    auto_m_l_job_status: str
+    auto_m_l_job_secondary_status: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    end_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    partial_failure_reasons: Optional[List[AutoMLPartialFailureReason]] = Unassigned()
+
+
+class ResolvedAttributes(Base):
+    """
+    ResolvedAttributes
+         <p>The resolved attributes.</p>
+
+        Attributes
+       ----------------------
+       auto_m_l_job_objective
+       problem_type: 	 <p>The problem type.</p>
+       completion_criteria
+    """
+
+    auto_m_l_job_objective: Optional[AutoMLJobObjective] = Unassigned()
+    problem_type: Optional[str] = Unassigned()
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
@@ -0,0 +1,293 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .auto_m_l_algorithm_config import (
+    AutoMLAlgorithmConfig,
+    AutoMLDataSource,
+    AutoMLJobCompletionCriteria,
+    AutoMLJobObjective,
+)
+from .model_access_config import ModelAccessConfig
+
+
+class AutoMLJobChannel(Base):
+    """
+    AutoMLJobChannel
+         <p>A channel is a named input source that training algorithms can consume. This channel is used for AutoML jobs V2 (jobs created by calling <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateAutoMLJobV2.html">CreateAutoMLJobV2</a>).</p>
+
+        Attributes
+       ----------------------
+       channel_type: 	 <p>The type of channel. Defines whether the data are used for training or validation. The default value is <code>training</code>. Channels for <code>training</code> and <code>validation</code> must share the same <code>ContentType</code> </p> <note> <p>The type of channel defaults to <code>training</code> for the time-series forecasting problem type.</p> </note>
+       content_type: 	 <p>The content type of the data from the input source. The following are the allowed content types for different problems:</p> <ul> <li> <p>For tabular problem types: <code>text/csv;header=present</code> or <code>x-application/vnd.amazon+parquet</code>. The default value is <code>text/csv;header=present</code>.</p> </li> <li> <p>For image classification: <code>image/png</code>, <code>image/jpeg</code>, or <code>image/*</code>. The default value is <code>image/*</code>.</p> </li> <li> <p>For text classification: <code>text/csv;header=present</code> or <code>x-application/vnd.amazon+parquet</code>. The default value is <code>text/csv;header=present</code>.</p> </li> <li> <p>For time-series forecasting: <code>text/csv;header=present</code> or <code>x-application/vnd.amazon+parquet</code>. The default value is <code>text/csv;header=present</code>.</p> </li> <li> <p>For text generation (LLMs fine-tuning): <code>text/csv;header=present</code> or <code>x-application/vnd.amazon+parquet</code>. The default value is <code>text/csv;header=present</code>.</p> </li> </ul>
+       compression_type: 	 <p>The allowed compression types depend on the input format and problem type. We allow the compression type <code>Gzip</code> for <code>S3Prefix</code> inputs on tabular data only. For all other inputs, the compression type should be <code>None</code>. If no compression type is provided, we default to <code>None</code>.</p>
+       data_source: 	 <p>The data source for an AutoML channel (Required).</p>
+    """
+
+    channel_type: Optional[str] = Unassigned()
+    content_type: Optional[str] = Unassigned()
+    compression_type: Optional[str] = Unassigned()
+    data_source: Optional[AutoMLDataSource] = Unassigned()
+
+
+class ImageClassificationJobConfig(Base):
+    """
+    ImageClassificationJobConfig
+         <p>The collection of settings used by an AutoML job V2 for the image classification problem type.</p>
+
+        Attributes
+       ----------------------
+       completion_criteria: 	 <p>How long a job is allowed to run, or how many candidates a job is allowed to generate.</p>
+    """
+
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+
+
+class TextClassificationJobConfig(Base):
+    """
+    TextClassificationJobConfig
+         <p>The collection of settings used by an AutoML job V2 for the text classification problem type.</p>
+
+        Attributes
+       ----------------------
+       completion_criteria: 	 <p>How long a job is allowed to run, or how many candidates a job is allowed to generate.</p>
+       content_column: 	 <p>The name of the column used to provide the sentences to be classified. It should not be the same as the target column.</p>
+       target_label_column: 	 <p>The name of the column used to provide the class labels. It should not be same as the content column.</p>
+    """
+
+    content_column: str
+    target_label_column: str
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+
+
+class TimeSeriesTransformations(Base):
+    """
+    TimeSeriesTransformations
+         <p>Transformations allowed on the dataset. Supported transformations are <code>Filling</code> and <code>Aggregation</code>. <code>Filling</code> specifies how to add values to missing values in the dataset. <code>Aggregation</code> defines how to aggregate data that does not align with forecast frequency.</p>
+
+        Attributes
+       ----------------------
+       filling: 	 <p>A key value pair defining the filling method for a column, where the key is the column name and the value is an object which defines the filling logic. You can specify multiple filling methods for a single column.</p> <p>The supported filling methods and their corresponding options are:</p> <ul> <li> <p> <code>frontfill</code>: <code>none</code> (Supported only for target column)</p> </li> <li> <p> <code>middlefill</code>: <code>zero</code>, <code>value</code>, <code>median</code>, <code>mean</code>, <code>min</code>, <code>max</code> </p> </li> <li> <p> <code>backfill</code>: <code>zero</code>, <code>value</code>, <code>median</code>, <code>mean</code>, <code>min</code>, <code>max</code> </p> </li> <li> <p> <code>futurefill</code>: <code>zero</code>, <code>value</code>, <code>median</code>, <code>mean</code>, <code>min</code>, <code>max</code> </p> </li> </ul> <p>To set a filling method to a specific value, set the fill parameter to the chosen filling method value (for example <code>"backfill" : "value"</code>), and define the filling value in an additional parameter prefixed with "_value". For example, to set <code>backfill</code> to a value of <code>2</code>, you must include two parameters: <code>"backfill": "value"</code> and <code>"backfill_value":"2"</code>.</p>
+       aggregation: 	 <p>A key value pair defining the aggregation method for a column, where the key is the column name and the value is the aggregation method.</p> <p>The supported aggregation methods are <code>sum</code> (default), <code>avg</code>, <code>first</code>, <code>min</code>, <code>max</code>.</p> <note> <p>Aggregation is only supported for the target column.</p> </note>
+    """
+
+    filling: Optional[Dict[str, Dict[str, str]]] = Unassigned()
+    aggregation: Optional[Dict[str, str]] = Unassigned()
+
+
+class TimeSeriesConfig(Base):
+    """
+    TimeSeriesConfig
+         <p>The collection of components that defines the time-series.</p>
+
+        Attributes
+       ----------------------
+       target_attribute_name: 	 <p>The name of the column representing the target variable that you want to predict for each item in your dataset. The data type of the target variable must be numerical.</p>
+       timestamp_attribute_name: 	 <p>The name of the column indicating a point in time at which the target value of a given item is recorded.</p>
+       item_identifier_attribute_name: 	 <p>The name of the column that represents the set of item identifiers for which you want to predict the target value.</p>
+       grouping_attribute_names: 	 <p>A set of columns names that can be grouped with the item identifier column to create a composite key for which a target value is predicted.</p>
+    """
+
+    target_attribute_name: str
+    timestamp_attribute_name: str
+    item_identifier_attribute_name: str
+    grouping_attribute_names: Optional[List[str]] = Unassigned()
+
+
+class HolidayConfigAttributes(Base):
+    """
+    HolidayConfigAttributes
+         <p>Stores the holiday featurization attributes applicable to each item of time-series datasets during the training of a forecasting model. This allows the model to identify patterns associated with specific holidays.</p>
+
+        Attributes
+       ----------------------
+       country_code: 	 <p>The country code for the holiday calendar.</p> <p>For the list of public holiday calendars supported by AutoML job V2, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-timeseries-forecasting-holiday-calendars.html#holiday-country-codes">Country Codes</a>. Use the country code corresponding to the country of your choice.</p>
+    """
+
+    country_code: Optional[str] = Unassigned()
+
+
+class TimeSeriesForecastingJobConfig(Base):
+    """
+    TimeSeriesForecastingJobConfig
+         <p>The collection of settings used by an AutoML job V2 for the time-series forecasting problem type.</p>
+
+        Attributes
+       ----------------------
+       feature_specification_s3_uri: 	 <p>A URL to the Amazon S3 data source containing additional selected features that complement the target, itemID, timestamp, and grouped columns set in <code>TimeSeriesConfig</code>. When not provided, the AutoML job V2 includes all the columns from the original dataset that are not already declared in <code>TimeSeriesConfig</code>. If provided, the AutoML job V2 only considers these additional columns as a complement to the ones declared in <code>TimeSeriesConfig</code>.</p> <p>You can input <code>FeatureAttributeNames</code> (optional) in JSON format as shown below: </p> <p> <code>{ "FeatureAttributeNames":["col1", "col2", ...] }</code>.</p> <p>You can also specify the data type of the feature (optional) in the format shown below:</p> <p> <code>{ "FeatureDataTypes":{"col1":"numeric", "col2":"categorical" ... } }</code> </p> <p>Autopilot supports the following data types: <code>numeric</code>, <code>categorical</code>, <code>text</code>, and <code>datetime</code>.</p> <note> <p>These column keys must not include any column set in <code>TimeSeriesConfig</code>.</p> </note>
+       completion_criteria
+       forecast_frequency: 	 <p>The frequency of predictions in a forecast.</p> <p>Valid intervals are an integer followed by Y (Year), M (Month), W (Week), D (Day), H (Hour), and min (Minute). For example, <code>1D</code> indicates every day and <code>15min</code> indicates every 15 minutes. The value of a frequency must not overlap with the next larger frequency. For example, you must use a frequency of <code>1H</code> instead of <code>60min</code>.</p> <p>The valid values for each frequency are the following:</p> <ul> <li> <p>Minute - 1-59</p> </li> <li> <p>Hour - 1-23</p> </li> <li> <p>Day - 1-6</p> </li> <li> <p>Week - 1-4</p> </li> <li> <p>Month - 1-11</p> </li> <li> <p>Year - 1</p> </li> </ul>
+       forecast_horizon: 	 <p>The number of time-steps that the model predicts. The forecast horizon is also called the prediction length. The maximum forecast horizon is the lesser of 500 time-steps or 1/4 of the time-steps in the dataset.</p>
+       forecast_quantiles: 	 <p>The quantiles used to train the model for forecasts at a specified quantile. You can specify quantiles from <code>0.01</code> (p1) to <code>0.99</code> (p99), by increments of 0.01 or higher. Up to five forecast quantiles can be specified. When <code>ForecastQuantiles</code> is not provided, the AutoML job uses the quantiles p10, p50, and p90 as default.</p>
+       transformations: 	 <p>The transformations modifying specific attributes of the time-series, such as filling strategies for missing values.</p>
+       time_series_config: 	 <p>The collection of components that defines the time-series.</p>
+       holiday_config: 	 <p>The collection of holiday featurization attributes used to incorporate national holiday information into your forecasting model.</p>
+    """
+
+    forecast_frequency: str
+    forecast_horizon: int
+    time_series_config: TimeSeriesConfig
+    feature_specification_s3_uri: Optional[str] = Unassigned()
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+    forecast_quantiles: Optional[List[str]] = Unassigned()
+    transformations: Optional[TimeSeriesTransformations] = Unassigned()
+    holiday_config: Optional[List[HolidayConfigAttributes]] = Unassigned()
+
+
+class CandidateGenerationConfig(Base):
+    """
+    CandidateGenerationConfig
+         <p>Stores the configuration information for how model candidates are generated using an AutoML job V2.</p>
+
+        Attributes
+       ----------------------
+       algorithms_config: 	 <p>Stores the configuration information for the selection of algorithms used to train model candidates on tabular data.</p> <p>The list of available algorithms to choose from depends on the training mode set in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_TabularJobConfig.html"> <code>TabularJobConfig.Mode</code> </a>.</p> <ul> <li> <p> <code>AlgorithmsConfig</code> should not be set in <code>AUTO</code> training mode.</p> </li> <li> <p>When <code>AlgorithmsConfig</code> is provided, one <code>AutoMLAlgorithms</code> attribute must be set and one only.</p> <p>If the list of algorithms provided as values for <code>AutoMLAlgorithms</code> is empty, <code>CandidateGenerationConfig</code> uses the full set of algorithms for the given training mode.</p> </li> <li> <p>When <code>AlgorithmsConfig</code> is not provided, <code>CandidateGenerationConfig</code> uses the full set of algorithms for the given training mode.</p> </li> </ul> <p>For the list of all algorithms per problem type and training mode, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLAlgorithmConfig.html"> AutoMLAlgorithmConfig</a>.</p> <p>For more information on each algorithm, see the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-algorithm-support">Algorithm support</a> section in Autopilot developer guide.</p>
+    """
+
+    algorithms_config: Optional[List[AutoMLAlgorithmConfig]] = Unassigned()
+
+
+class TabularJobConfig(Base):
+    """
+    TabularJobConfig
+         <p>The collection of settings used by an AutoML job V2 for the tabular problem type.</p>
+
+        Attributes
+       ----------------------
+       candidate_generation_config: 	 <p>The configuration information of how model candidates are generated.</p>
+       completion_criteria
+       feature_specification_s3_uri: 	 <p>A URL to the Amazon S3 data source containing selected features from the input data source to run an Autopilot job V2. You can input <code>FeatureAttributeNames</code> (optional) in JSON format as shown below: </p> <p> <code>{ "FeatureAttributeNames":["col1", "col2", ...] }</code>.</p> <p>You can also specify the data type of the feature (optional) in the format shown below:</p> <p> <code>{ "FeatureDataTypes":{"col1":"numeric", "col2":"categorical" ... } }</code> </p> <note> <p>These column keys may not include the target column.</p> </note> <p>In ensembling mode, Autopilot only supports the following data types: <code>numeric</code>, <code>categorical</code>, <code>text</code>, and <code>datetime</code>. In HPO mode, Autopilot can support <code>numeric</code>, <code>categorical</code>, <code>text</code>, <code>datetime</code>, and <code>sequence</code>.</p> <p>If only <code>FeatureDataTypes</code> is provided, the column keys (<code>col1</code>, <code>col2</code>,..) should be a subset of the column names in the input data. </p> <p>If both <code>FeatureDataTypes</code> and <code>FeatureAttributeNames</code> are provided, then the column keys should be a subset of the column names provided in <code>FeatureAttributeNames</code>. </p> <p>The key name <code>FeatureAttributeNames</code> is fixed. The values listed in <code>["col1", "col2", ...]</code> are case sensitive and should be a list of strings containing unique values that are a subset of the column names in the input data. The list of columns provided must not include the target column.</p>
+       mode: 	 <p>The method that Autopilot uses to train the data. You can either specify the mode manually or let Autopilot choose for you based on the dataset size by selecting <code>AUTO</code>. In <code>AUTO</code> mode, Autopilot chooses <code>ENSEMBLING</code> for datasets smaller than 100 MB, and <code>HYPERPARAMETER_TUNING</code> for larger ones.</p> <p>The <code>ENSEMBLING</code> mode uses a multi-stack ensemble model to predict classification and regression tasks directly from your dataset. This machine learning mode combines several base models to produce an optimal predictive model. It then uses a stacking ensemble method to combine predictions from contributing members. A multi-stack ensemble model can provide better performance over a single model by combining the predictive capabilities of multiple models. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-algorithm-support">Autopilot algorithm support</a> for a list of algorithms supported by <code>ENSEMBLING</code> mode.</p> <p>The <code>HYPERPARAMETER_TUNING</code> (HPO) mode uses the best hyperparameters to train the best version of a model. HPO automatically selects an algorithm for the type of problem you want to solve. Then HPO finds the best hyperparameters according to your objective metric. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-model-support-validation.html#autopilot-algorithm-support">Autopilot algorithm support</a> for a list of algorithms supported by <code>HYPERPARAMETER_TUNING</code> mode.</p>
+       generate_candidate_definitions_only: 	 <p>Generates possible candidates without training the models. A model candidate is a combination of data preprocessors, algorithms, and algorithm parameter settings.</p>
+       problem_type: 	 <p>The type of supervised learning problem available for the model candidates of the AutoML job V2. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-datasets-problem-types.html#autopilot-problem-types"> SageMaker Autopilot problem types</a>.</p> <note> <p>You must either specify the type of supervised learning problem in <code>ProblemType</code> and provide the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateAutoMLJobV2.html#sagemaker-CreateAutoMLJobV2-request-AutoMLJobObjective">AutoMLJobObjective</a> metric, or none at all.</p> </note>
+       target_attribute_name: 	 <p>The name of the target variable in supervised learning, usually represented by 'y'.</p>
+       sample_weight_attribute_name: 	 <p>If specified, this column name indicates which column of the dataset should be treated as sample weights for use by the objective metric during the training, evaluation, and the selection of the best model. This column is not considered as a predictive feature. For more information on Autopilot metrics, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-metrics-validation.html">Metrics and validation</a>.</p> <p>Sample weights should be numeric, non-negative, with larger values indicating which rows are more important than others. Data points that have invalid or no weight value are excluded.</p> <p>Support for sample weights is available in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_AutoMLAlgorithmConfig.html">Ensembling</a> mode only.</p>
+    """
+
+    target_attribute_name: str
+    candidate_generation_config: Optional[CandidateGenerationConfig] = Unassigned()
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+    feature_specification_s3_uri: Optional[str] = Unassigned()
+    mode: Optional[str] = Unassigned()
+    generate_candidate_definitions_only: Optional[bool] = Unassigned()
+    problem_type: Optional[str] = Unassigned()
+    sample_weight_attribute_name: Optional[str] = Unassigned()
+
+
+class TextGenerationJobConfig(Base):
+    """
+    TextGenerationJobConfig
+         <p>The collection of settings used by an AutoML job V2 for the text generation problem type.</p> <note> <p>The text generation models that support fine-tuning in Autopilot are currently accessible exclusively in regions supported by Canvas. Refer to the documentation of Canvas for the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/canvas.html">full list of its supported Regions</a>.</p> </note>
+
+        Attributes
+       ----------------------
+       completion_criteria: 	 <p>How long a fine-tuning job is allowed to run. For <code>TextGenerationJobConfig</code> problem types, the <code>MaxRuntimePerTrainingJobInSeconds</code> attribute of <code>AutoMLJobCompletionCriteria</code> defaults to 72h (259200s).</p>
+       base_model_name: 	 <p>The name of the base model to fine-tune. Autopilot supports fine-tuning a variety of large language models. For information on the list of supported models, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-llms-finetuning-models.html#autopilot-llms-finetuning-supported-llms">Text generation models supporting fine-tuning in Autopilot</a>. If no <code>BaseModelName</code> is provided, the default model used is <b>Falcon7BInstruct</b>. </p>
+       text_generation_hyper_parameters: 	 <p>The hyperparameters used to configure and optimize the learning process of the base model. You can set any combination of the following hyperparameters for all base models. For more information on each supported hyperparameter, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-llms-finetuning-set-hyperparameters.html">Optimize the learning process of your text generation models with hyperparameters</a>.</p> <ul> <li> <p> <code>"epochCount"</code>: The number of times the model goes through the entire training dataset. Its value should be a string containing an integer value within the range of "1" to "10".</p> </li> <li> <p> <code>"batchSize"</code>: The number of data samples used in each iteration of training. Its value should be a string containing an integer value within the range of "1" to "64".</p> </li> <li> <p> <code>"learningRate"</code>: The step size at which a model's parameters are updated during training. Its value should be a string containing a floating-point value within the range of "0" to "1".</p> </li> <li> <p> <code>"learningRateWarmupSteps"</code>: The number of training steps during which the learning rate gradually increases before reaching its target or maximum value. Its value should be a string containing an integer value within the range of "0" to "250".</p> </li> </ul> <p>Here is an example where all four hyperparameters are configured.</p> <p> <code>{ "epochCount":"5", "learningRate":"0.5", "batchSize": "32", "learningRateWarmupSteps": "10" }</code> </p>
+       model_access_config
+    """
+
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+    base_model_name: Optional[str] = Unassigned()
+    text_generation_hyper_parameters: Optional[Dict[str, str]] = Unassigned()
+    model_access_config: Optional[ModelAccessConfig] = Unassigned()
+
+
+class AutoMLProblemTypeConfig(Base):
+    """
+    AutoMLProblemTypeConfig
+         <p>A collection of settings specific to the problem type used to configure an AutoML job V2. There must be one and only one config of the following type.</p>
+
+        Attributes
+       ----------------------
+       image_classification_job_config: 	 <p>Settings used to configure an AutoML job V2 for the image classification problem type.</p>
+       text_classification_job_config: 	 <p>Settings used to configure an AutoML job V2 for the text classification problem type.</p>
+       time_series_forecasting_job_config: 	 <p>Settings used to configure an AutoML job V2 for the time-series forecasting problem type.</p>
+       tabular_job_config: 	 <p>Settings used to configure an AutoML job V2 for the tabular problem type (regression, classification).</p>
+       text_generation_job_config: 	 <p>Settings used to configure an AutoML job V2 for the text generation (LLMs fine-tuning) problem type.</p> <note> <p>The text generation models that support fine-tuning in Autopilot are currently accessible exclusively in regions supported by Canvas. Refer to the documentation of Canvas for the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/canvas.html">full list of its supported Regions</a>.</p> </note>
+    """
+
+    image_classification_job_config: Optional[ImageClassificationJobConfig] = (
+        Unassigned()
+    )
+    text_classification_job_config: Optional[TextClassificationJobConfig] = Unassigned()
+    time_series_forecasting_job_config: Optional[TimeSeriesForecastingJobConfig] = (
+        Unassigned()
+    )
+    tabular_job_config: Optional[TabularJobConfig] = Unassigned()
+    text_generation_job_config: Optional[TextGenerationJobConfig] = Unassigned()
+
+
+class TabularResolvedAttributes(Base):
+    """
+    TabularResolvedAttributes
+         <p>The resolved attributes specific to the tabular problem type.</p>
+
+        Attributes
+       ----------------------
+       problem_type: 	 <p>The type of supervised learning problem available for the model candidates of the AutoML job V2 (Binary Classification, Multiclass Classification, Regression). For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/autopilot-datasets-problem-types.html#autopilot-problem-types"> SageMaker Autopilot problem types</a>.</p>
+    """
+
+    problem_type: Optional[str] = Unassigned()
+
+
+class TextGenerationResolvedAttributes(Base):
+    """
+    TextGenerationResolvedAttributes
+         <p>The resolved attributes specific to the text generation problem type.</p>
+
+        Attributes
+       ----------------------
+       base_model_name: 	 <p>The name of the base model to fine-tune.</p>
+    """
+
+    base_model_name: Optional[str] = Unassigned()
+
+
+class AutoMLProblemTypeResolvedAttributes(Base):
+    """
+    AutoMLProblemTypeResolvedAttributes
+         <p>Stores resolved attributes specific to the problem type of an AutoML job V2.</p>
+
+        Attributes
+       ----------------------
+       tabular_resolved_attributes: 	 <p>The resolved attributes for the tabular problem type.</p>
+       text_generation_resolved_attributes: 	 <p>The resolved attributes for the text generation problem type.</p>
+    """
+
+    tabular_resolved_attributes: Optional[TabularResolvedAttributes] = Unassigned()
+    text_generation_resolved_attributes: Optional[TextGenerationResolvedAttributes] = (
+        Unassigned()
+    )
+
+
+class AutoMLResolvedAttributes(Base):
+    """
+    AutoMLResolvedAttributes
+         <p>The resolved attributes used to configure an AutoML job V2.</p>
+
+        Attributes
+       ----------------------
+       auto_m_l_job_objective
+       completion_criteria
+       auto_m_l_problem_type_resolved_attributes: 	 <p>Defines the resolved attributes specific to a problem type.</p>
+    """
+
+    auto_m_l_job_objective: Optional[AutoMLJobObjective] = Unassigned()
+    completion_criteria: Optional[AutoMLJobCompletionCriteria] = Unassigned()
+    auto_m_l_problem_type_resolved_attributes: Optional[
+        AutoMLProblemTypeResolvedAttributes
+    ] = Unassigned()
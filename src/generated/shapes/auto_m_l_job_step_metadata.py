@@ -0,0 +1,342 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .output_parameter import OutputParameter
+
+
+class AutoMLJobStepMetadata(Base):
+    """
+    AutoMLJobStepMetadata
+         <p>Metadata for an AutoML job step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the AutoML job.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class CacheHitResult(Base):
+    """
+    CacheHitResult
+         <p>Details on the cache hit of a pipeline execution step.</p>
+
+        Attributes
+       ----------------------
+       source_pipeline_execution_arn: 	 <p>The Amazon Resource Name (ARN) of the pipeline execution.</p>
+    """
+
+    source_pipeline_execution_arn: Optional[str] = Unassigned()
+
+
+class CallbackStepMetadata(Base):
+    """
+    CallbackStepMetadata
+         <p>Metadata about a callback step.</p>
+
+        Attributes
+       ----------------------
+       callback_token: 	 <p>The pipeline generated token from the Amazon SQS queue.</p>
+       sqs_queue_url: 	 <p>The URL of the Amazon Simple Queue Service (Amazon SQS) queue used by the callback step.</p>
+       output_parameters: 	 <p>A list of the output parameters of the callback step.</p>
+    """
+
+    callback_token: Optional[str] = Unassigned()
+    sqs_queue_url: Optional[str] = Unassigned()
+    output_parameters: Optional[List[OutputParameter]] = Unassigned()
+
+
+class ClarifyCheckStepMetadata(Base):
+    """
+    ClarifyCheckStepMetadata
+         <p>The container for the metadata for the ClarifyCheck step. For more information, see the topic on <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/build-and-manage-steps.html#step-type-clarify-check">ClarifyCheck step</a> in the <i>Amazon SageMaker Developer Guide</i>. </p>
+
+        Attributes
+       ----------------------
+       check_type: 	 <p>The type of the Clarify Check step</p>
+       baseline_used_for_drift_check_constraints: 	 <p>The Amazon S3 URI of baseline constraints file to be used for the drift check.</p>
+       calculated_baseline_constraints: 	 <p>The Amazon S3 URI of the newly calculated baseline constraints file.</p>
+       model_package_group_name: 	 <p>The model package group name.</p>
+       violation_report: 	 <p>The Amazon S3 URI of the violation report if violations are detected.</p>
+       check_job_arn: 	 <p>The Amazon Resource Name (ARN) of the check processing job that was run by this step's execution.</p>
+       skip_check: 	 <p>This flag indicates if the drift check against the previous baseline will be skipped or not. If it is set to <code>False</code>, the previous baseline of the configured check type must be available.</p>
+       register_new_baseline: 	 <p>This flag indicates if a newly calculated baseline can be accessed through step properties <code>BaselineUsedForDriftCheckConstraints</code> and <code>BaselineUsedForDriftCheckStatistics</code>. If it is set to <code>False</code>, the previous baseline of the configured check type must also be available. These can be accessed through the <code>BaselineUsedForDriftCheckConstraints</code> property. </p>
+    """
+
+    check_type: Optional[str] = Unassigned()
+    baseline_used_for_drift_check_constraints: Optional[str] = Unassigned()
+    calculated_baseline_constraints: Optional[str] = Unassigned()
+    model_package_group_name: Optional[str] = Unassigned()
+    violation_report: Optional[str] = Unassigned()
+    check_job_arn: Optional[str] = Unassigned()
+    skip_check: Optional[bool] = Unassigned()
+    register_new_baseline: Optional[bool] = Unassigned()
+
+
+class ConditionStepMetadata(Base):
+    """
+    ConditionStepMetadata
+         <p>Metadata for a Condition step.</p>
+
+        Attributes
+       ----------------------
+       outcome: 	 <p>The outcome of the Condition step evaluation.</p>
+    """
+
+    outcome: Optional[str] = Unassigned()
+
+
+class EMRStepMetadata(Base):
+    """
+    EMRStepMetadata
+         <p>The configurations and outcomes of an Amazon EMR step execution.</p>
+
+        Attributes
+       ----------------------
+       cluster_id: 	 <p>The identifier of the EMR cluster.</p>
+       step_id: 	 <p>The identifier of the EMR cluster step.</p>
+       step_name: 	 <p>The name of the EMR cluster step.</p>
+       log_file_path: 	 <p>The path to the log file where the cluster step's failure root cause is recorded.</p>
+    """
+
+    cluster_id: Optional[str] = Unassigned()
+    step_id: Optional[str] = Unassigned()
+    step_name: Optional[str] = Unassigned()
+    log_file_path: Optional[str] = Unassigned()
+
+
+class FailStepMetadata(Base):
+    """
+    FailStepMetadata
+         <p>The container for the metadata for Fail step.</p>
+
+        Attributes
+       ----------------------
+       error_message: 	 <p>A message that you define and then is processed and rendered by the Fail step when the error occurs.</p>
+    """
+
+    error_message: Optional[str] = Unassigned()
+
+
+class LambdaStepMetadata(Base):
+    """
+    LambdaStepMetadata
+         <p>Metadata for a Lambda step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the Lambda function that was run by this step execution.</p>
+       output_parameters: 	 <p>A list of the output parameters of the Lambda step.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+    output_parameters: Optional[List[OutputParameter]] = Unassigned()
+
+
+class TrainingJobStepMetadata(Base):
+    """
+    TrainingJobStepMetadata
+         <p>Metadata for a training job step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the training job that was run by this step execution.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class ProcessingJobStepMetadata(Base):
+    """
+    ProcessingJobStepMetadata
+         <p>Metadata for a processing job step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the processing job.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class TransformJobStepMetadata(Base):
+    """
+    TransformJobStepMetadata
+         <p>Metadata for a transform job step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the transform job that was run by this step execution.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class TuningJobStepMetaData(Base):
+    """
+    TuningJobStepMetaData
+         <p>Metadata for a tuning step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the tuning job that was run by this step execution.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class ModelStepMetadata(Base):
+    """
+    ModelStepMetadata
+         <p>Metadata for Model steps.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the created model.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class RegisterModelStepMetadata(Base):
+    """
+    RegisterModelStepMetadata
+         <p>Metadata for a register model job step.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the model package.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+
+
+class QualityCheckStepMetadata(Base):
+    """
+    QualityCheckStepMetadata
+         <p>Container for the metadata for a Quality check step. For more information, see the topic on <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/build-and-manage-steps.html#step-type-quality-check">QualityCheck step</a> in the <i>Amazon SageMaker Developer Guide</i>. </p>
+
+        Attributes
+       ----------------------
+       check_type: 	 <p>The type of the Quality check step.</p>
+       baseline_used_for_drift_check_statistics: 	 <p>The Amazon S3 URI of the baseline statistics file used for the drift check.</p>
+       baseline_used_for_drift_check_constraints: 	 <p>The Amazon S3 URI of the baseline constraints file used for the drift check.</p>
+       calculated_baseline_statistics: 	 <p>The Amazon S3 URI of the newly calculated baseline statistics file.</p>
+       calculated_baseline_constraints: 	 <p>The Amazon S3 URI of the newly calculated baseline constraints file.</p>
+       model_package_group_name: 	 <p>The model package group name.</p>
+       violation_report: 	 <p>The Amazon S3 URI of violation report if violations are detected.</p>
+       check_job_arn: 	 <p>The Amazon Resource Name (ARN) of the Quality check processing job that was run by this step execution.</p>
+       skip_check: 	 <p>This flag indicates if the drift check against the previous baseline will be skipped or not. If it is set to <code>False</code>, the previous baseline of the configured check type must be available.</p>
+       register_new_baseline: 	 <p>This flag indicates if a newly calculated baseline can be accessed through step properties <code>BaselineUsedForDriftCheckConstraints</code> and <code>BaselineUsedForDriftCheckStatistics</code>. If it is set to <code>False</code>, the previous baseline of the configured check type must also be available. These can be accessed through the <code>BaselineUsedForDriftCheckConstraints</code> and <code> BaselineUsedForDriftCheckStatistics</code> properties. </p>
+    """
+
+    check_type: Optional[str] = Unassigned()
+    baseline_used_for_drift_check_statistics: Optional[str] = Unassigned()
+    baseline_used_for_drift_check_constraints: Optional[str] = Unassigned()
+    calculated_baseline_statistics: Optional[str] = Unassigned()
+    calculated_baseline_constraints: Optional[str] = Unassigned()
+    model_package_group_name: Optional[str] = Unassigned()
+    violation_report: Optional[str] = Unassigned()
+    check_job_arn: Optional[str] = Unassigned()
+    skip_check: Optional[bool] = Unassigned()
+    register_new_baseline: Optional[bool] = Unassigned()
+
+
+class PipelineExecutionStepMetadata(Base):
+    """
+    PipelineExecutionStepMetadata
+         <p>Metadata for a step execution.</p>
+
+        Attributes
+       ----------------------
+       training_job: 	 <p>The Amazon Resource Name (ARN) of the training job that was run by this step execution.</p>
+       processing_job: 	 <p>The Amazon Resource Name (ARN) of the processing job that was run by this step execution.</p>
+       transform_job: 	 <p>The Amazon Resource Name (ARN) of the transform job that was run by this step execution.</p>
+       tuning_job: 	 <p>The Amazon Resource Name (ARN) of the tuning job that was run by this step execution.</p>
+       model: 	 <p>The Amazon Resource Name (ARN) of the model that was created by this step execution.</p>
+       register_model: 	 <p>The Amazon Resource Name (ARN) of the model package that the model was registered to by this step execution.</p>
+       condition: 	 <p>The outcome of the condition evaluation that was run by this step execution.</p>
+       callback: 	 <p>The URL of the Amazon SQS queue used by this step execution, the pipeline generated token, and a list of output parameters.</p>
+       lambda: 	 <p>The Amazon Resource Name (ARN) of the Lambda function that was run by this step execution and a list of output parameters.</p>
+       e_m_r: 	 <p>The configurations and outcomes of an Amazon EMR step execution.</p>
+       quality_check: 	 <p>The configurations and outcomes of the check step execution. This includes: </p> <ul> <li> <p>The type of the check conducted.</p> </li> <li> <p>The Amazon S3 URIs of baseline constraints and statistics files to be used for the drift check.</p> </li> <li> <p>The Amazon S3 URIs of newly calculated baseline constraints and statistics.</p> </li> <li> <p>The model package group name provided.</p> </li> <li> <p>The Amazon S3 URI of the violation report if violations detected.</p> </li> <li> <p>The Amazon Resource Name (ARN) of check processing job initiated by the step execution.</p> </li> <li> <p>The Boolean flags indicating if the drift check is skipped.</p> </li> <li> <p>If step property <code>BaselineUsedForDriftCheck</code> is set the same as <code>CalculatedBaseline</code>.</p> </li> </ul>
+       clarify_check: 	 <p>Container for the metadata for a Clarify check step. The configurations and outcomes of the check step execution. This includes: </p> <ul> <li> <p>The type of the check conducted,</p> </li> <li> <p>The Amazon S3 URIs of baseline constraints and statistics files to be used for the drift check.</p> </li> <li> <p>The Amazon S3 URIs of newly calculated baseline constraints and statistics.</p> </li> <li> <p>The model package group name provided.</p> </li> <li> <p>The Amazon S3 URI of the violation report if violations detected.</p> </li> <li> <p>The Amazon Resource Name (ARN) of check processing job initiated by the step execution.</p> </li> <li> <p>The boolean flags indicating if the drift check is skipped.</p> </li> <li> <p>If step property <code>BaselineUsedForDriftCheck</code> is set the same as <code>CalculatedBaseline</code>.</p> </li> </ul>
+       fail: 	 <p>The configurations and outcomes of a Fail step execution.</p>
+       auto_m_l_job: 	 <p>The Amazon Resource Name (ARN) of the AutoML job that was run by this step.</p>
+    """
+
+    training_job: Optional[TrainingJobStepMetadata] = Unassigned()
+    processing_job: Optional[ProcessingJobStepMetadata] = Unassigned()
+    transform_job: Optional[TransformJobStepMetadata] = Unassigned()
+    tuning_job: Optional[TuningJobStepMetaData] = Unassigned()
+    model: Optional[ModelStepMetadata] = Unassigned()
+    register_model: Optional[RegisterModelStepMetadata] = Unassigned()
+    condition: Optional[ConditionStepMetadata] = Unassigned()
+    callback: Optional[CallbackStepMetadata] = Unassigned()
+    # lambda: Optional[LambdaStepMetadata] = Unassigned()
+    e_m_r: Optional[EMRStepMetadata] = Unassigned()
+    quality_check: Optional[QualityCheckStepMetadata] = Unassigned()
+    clarify_check: Optional[ClarifyCheckStepMetadata] = Unassigned()
+    fail: Optional[FailStepMetadata] = Unassigned()
+    auto_m_l_job: Optional[AutoMLJobStepMetadata] = Unassigned()
+
+
+class SelectiveExecutionResult(Base):
+    """
+    SelectiveExecutionResult
+         <p>The ARN from an execution of the current pipeline.</p>
+
+        Attributes
+       ----------------------
+       source_pipeline_execution_arn: 	 <p>The ARN from an execution of the current pipeline.</p>
+    """
+
+    source_pipeline_execution_arn: Optional[str] = Unassigned()
+
+
+class PipelineExecutionStep(Base):
+    """
+    PipelineExecutionStep
+         <p>An execution of a step in a pipeline.</p>
+
+        Attributes
+       ----------------------
+       step_name: 	 <p>The name of the step that is executed.</p>
+       step_display_name: 	 <p>The display name of the step.</p>
+       step_description: 	 <p>The description of the step.</p>
+       start_time: 	 <p>The time that the step started executing.</p>
+       end_time: 	 <p>The time that the step stopped executing.</p>
+       step_status: 	 <p>The status of the step execution.</p>
+       cache_hit_result: 	 <p>If this pipeline execution step was cached, details on the cache hit.</p>
+       failure_reason: 	 <p>The reason why the step failed execution. This is only returned if the step failed its execution.</p>
+       metadata: 	 <p>Metadata to run the pipeline step.</p>
+       attempt_count: 	 <p>The current attempt of the execution step. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/pipelines-retry-policy.html">Retry Policy for SageMaker Pipelines steps</a>.</p>
+       selective_execution_result: 	 <p>The ARN from an execution of the current pipeline from which results are reused for this step.</p>
+    """
+
+    step_name: Optional[str] = Unassigned()
+    step_display_name: Optional[str] = Unassigned()
+    step_description: Optional[str] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    step_status: Optional[str] = Unassigned()
+    cache_hit_result: Optional[CacheHitResult] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    metadata: Optional[PipelineExecutionStepMetadata] = Unassigned()
+    attempt_count: Optional[int] = Unassigned()
+    selective_execution_result: Optional[SelectiveExecutionResult] = Unassigned()
@@ -0,0 +1,528 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .channel import Channel, MetricDefinition, OutputDataConfig, ResourceConfig
+from .checkpoint_config import CheckpointConfig, RetryStrategy
+from .hyper_parameter_tuning_job_objective import HyperParameterTuningJobObjective
+from .stopping_condition import StoppingCondition
+from .vpc_config import VpcConfig
+
+
+class AutoParameter(Base):
+    """
+    AutoParameter
+         <p>The name and an example value of the hyperparameter that you want to use in Autotune. If Automatic model tuning (AMT) determines that your hyperparameter is eligible for Autotune, an optimal hyperparameter range is selected for you.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the hyperparameter to optimize using Autotune.</p>
+       value_hint: 	 <p>An example value of the hyperparameter to optimize using Autotune.</p>
+    """
+
+    name: str
+    value_hint: str
+
+
+class Autotune(Base):
+    """
+    Autotune
+         <p>A flag to indicate if you want to use Autotune to automatically find optimal values for the following fields:</p> <ul> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTuningJobConfig.html#sagemaker-Type-HyperParameterTuningJobConfig-ParameterRanges">ParameterRanges</a>: The names and ranges of parameters that a hyperparameter tuning job can optimize.</p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ResourceLimits.html">ResourceLimits</a>: The maximum resources that can be used for a training job. These resources include the maximum number of training jobs, the maximum runtime of a tuning job, and the maximum number of training jobs to run at the same time.</p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTuningJobConfig.html#sagemaker-Type-HyperParameterTuningJobConfig-TrainingJobEarlyStoppingType">TrainingJobEarlyStoppingType</a>: A flag that specifies whether or not to use early stopping for training jobs launched by a hyperparameter tuning job.</p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTrainingJobDefinition.html#sagemaker-Type-HyperParameterTrainingJobDefinition-RetryStrategy">RetryStrategy</a>: The number of times to retry a training job.</p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTuningJobConfig.html">Strategy</a>: Specifies how hyperparameter tuning chooses the combinations of hyperparameter values to use for the training jobs that it launches.</p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ConvergenceDetected.html">ConvergenceDetected</a>: A flag to indicate that Automatic model tuning (AMT) has detected model convergence.</p> </li> </ul>
+
+        Attributes
+       ----------------------
+       mode: 	 <p>Set <code>Mode</code> to <code>Enabled</code> if you want to use Autotune.</p>
+    """
+
+    mode: str
+
+
+class BestObjectiveNotImproving(Base):
+    """
+    BestObjectiveNotImproving
+         <p>A structure that keeps track of which training jobs launched by your hyperparameter tuning job are not improving model performance as evaluated against an objective function.</p>
+
+        Attributes
+       ----------------------
+       max_number_of_training_jobs_not_improving: 	 <p>The number of training jobs that have failed to improve model performance by 1% or greater over prior training jobs as evaluated against an objective function.</p>
+    """
+
+    max_number_of_training_jobs_not_improving: Optional[int] = Unassigned()
+
+
+class CategoricalParameterRange(Base):
+    """
+    CategoricalParameterRange
+         <p>A list of categorical hyperparameters to tune.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the categorical hyperparameter to tune.</p>
+       values: 	 <p>A list of the categories for the hyperparameter.</p>
+    """
+
+    name: str
+    values: List[str]
+
+
+class ContinuousParameterRange(Base):
+    """
+    ContinuousParameterRange
+         <p>A list of continuous hyperparameters to tune.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the continuous hyperparameter to tune.</p>
+       min_value: 	 <p>The minimum value for the hyperparameter. The tuning job uses floating-point values between this value and <code>MaxValue</code>for tuning.</p>
+       max_value: 	 <p>The maximum value for the hyperparameter. The tuning job uses floating-point values between <code>MinValue</code> value and this value for tuning.</p>
+       scaling_type: 	 <p>The scale that hyperparameter tuning uses to search the hyperparameter range. For information about choosing a hyperparameter scale, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-define-ranges.html#scaling-type">Hyperparameter Scaling</a>. One of the following values:</p> <dl> <dt>Auto</dt> <dd> <p>SageMaker hyperparameter tuning chooses the best scale for the hyperparameter.</p> </dd> <dt>Linear</dt> <dd> <p>Hyperparameter tuning searches the values in the hyperparameter range by using a linear scale.</p> </dd> <dt>Logarithmic</dt> <dd> <p>Hyperparameter tuning searches the values in the hyperparameter range by using a logarithmic scale.</p> <p>Logarithmic scaling works only for ranges that have only values greater than 0.</p> </dd> <dt>ReverseLogarithmic</dt> <dd> <p>Hyperparameter tuning searches the values in the hyperparameter range by using a reverse logarithmic scale.</p> <p>Reverse logarithmic scaling works only for ranges that are entirely within the range 0&lt;=x&lt;1.0.</p> </dd> </dl>
+    """
+
+    name: str
+    min_value: str
+    max_value: str
+    scaling_type: Optional[str] = Unassigned()
+
+
+class ConvergenceDetected(Base):
+    """
+    ConvergenceDetected
+         <p>A flag to indicating that automatic model tuning (AMT) has detected model convergence, defined as a lack of significant improvement (1% or less) against an objective metric.</p>
+
+        Attributes
+       ----------------------
+       complete_on_convergence: 	 <p>A flag to stop a tuning job once AMT has detected that the job has converged.</p>
+    """
+
+    complete_on_convergence: Optional[str] = Unassigned()
+
+
+class HyperbandStrategyConfig(Base):
+    """
+    HyperbandStrategyConfig
+         <p>The configuration for <code>Hyperband</code>, a multi-fidelity based hyperparameter tuning strategy. <code>Hyperband</code> uses the final and intermediate results of a training job to dynamically allocate resources to utilized hyperparameter configurations while automatically stopping under-performing configurations. This parameter should be provided only if <code>Hyperband</code> is selected as the <code>StrategyConfig</code> under the <code>HyperParameterTuningJobConfig</code> API.</p>
+
+        Attributes
+       ----------------------
+       min_resource: 	 <p>The minimum number of resources (such as epochs) that can be used by a training job launched by a hyperparameter tuning job. If the value for <code>MinResource</code> has not been reached, the training job is not stopped by <code>Hyperband</code>.</p>
+       max_resource: 	 <p>The maximum number of resources (such as epochs) that can be used by a training job launched by a hyperparameter tuning job. Once a job reaches the <code>MaxResource</code> value, it is stopped. If a value for <code>MaxResource</code> is not provided, and <code>Hyperband</code> is selected as the hyperparameter tuning strategy, <code>HyperbandTraining</code> attempts to infer <code>MaxResource</code> from the following keys (if present) in <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTrainingJobDefinition.html#sagemaker-Type-HyperParameterTrainingJobDefinition-StaticHyperParameters">StaticsHyperParameters</a>:</p> <ul> <li> <p> <code>epochs</code> </p> </li> <li> <p> <code>numepochs</code> </p> </li> <li> <p> <code>n-epochs</code> </p> </li> <li> <p> <code>n_epochs</code> </p> </li> <li> <p> <code>num_epochs</code> </p> </li> </ul> <p>If <code>HyperbandStrategyConfig</code> is unable to infer a value for <code>MaxResource</code>, it generates a validation error. The maximum value is 20,000 epochs. All metrics that correspond to an objective metric are used to derive <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-early-stopping.html">early stopping decisions</a>. For <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/distributed-training.html">distributed</a> training jobs, ensure that duplicate metrics are not printed in the logs across the individual nodes in a training job. If multiple nodes are publishing duplicate or incorrect metrics, training jobs may make an incorrect stopping decision and stop the job prematurely. </p>
+    """
+
+    min_resource: Optional[int] = Unassigned()
+    max_resource: Optional[int] = Unassigned()
+
+
+class HyperParameterTuningJobStrategyConfig(Base):
+    """
+    HyperParameterTuningJobStrategyConfig
+         <p>The configuration for a training job launched by a hyperparameter tuning job. Choose <code>Bayesian</code> for Bayesian optimization, and <code>Random</code> for random search optimization. For more advanced use cases, use <code>Hyperband</code>, which evaluates objective metrics for training jobs after every epoch. For more information about strategies, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-how-it-works.html">How Hyperparameter Tuning Works</a>.</p>
+
+        Attributes
+       ----------------------
+       hyperband_strategy_config: 	 <p>The configuration for the object that specifies the <code>Hyperband</code> strategy. This parameter is only supported for the <code>Hyperband</code> selection for <code>Strategy</code> within the <code>HyperParameterTuningJobConfig</code> API.</p>
+    """
+
+    hyperband_strategy_config: Optional[HyperbandStrategyConfig] = Unassigned()
+
+
+class ResourceLimits(Base):
+    """
+    ResourceLimits
+         <p>Specifies the maximum number of training jobs and parallel training jobs that a hyperparameter tuning job can launch.</p>
+
+        Attributes
+       ----------------------
+       max_number_of_training_jobs: 	 <p>The maximum number of training jobs that a hyperparameter tuning job can launch.</p>
+       max_parallel_training_jobs: 	 <p>The maximum number of concurrent training jobs that a hyperparameter tuning job can launch.</p>
+       max_runtime_in_seconds: 	 <p>The maximum time in seconds that a hyperparameter tuning job can run.</p>
+    """
+
+    max_parallel_training_jobs: int
+    max_number_of_training_jobs: Optional[int] = Unassigned()
+    max_runtime_in_seconds: Optional[int] = Unassigned()
+
+
+class IntegerParameterRange(Base):
+    """
+    IntegerParameterRange
+         <p>For a hyperparameter of the integer type, specifies the range that a hyperparameter tuning job searches.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the hyperparameter to search.</p>
+       min_value: 	 <p>The minimum value of the hyperparameter to search.</p>
+       max_value: 	 <p>The maximum value of the hyperparameter to search.</p>
+       scaling_type: 	 <p>The scale that hyperparameter tuning uses to search the hyperparameter range. For information about choosing a hyperparameter scale, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-define-ranges.html#scaling-type">Hyperparameter Scaling</a>. One of the following values:</p> <dl> <dt>Auto</dt> <dd> <p>SageMaker hyperparameter tuning chooses the best scale for the hyperparameter.</p> </dd> <dt>Linear</dt> <dd> <p>Hyperparameter tuning searches the values in the hyperparameter range by using a linear scale.</p> </dd> <dt>Logarithmic</dt> <dd> <p>Hyperparameter tuning searches the values in the hyperparameter range by using a logarithmic scale.</p> <p>Logarithmic scaling works only for ranges that have only values greater than 0.</p> </dd> </dl>
+    """
+
+    name: str
+    min_value: str
+    max_value: str
+    scaling_type: Optional[str] = Unassigned()
+
+
+class ParameterRanges(Base):
+    """
+    ParameterRanges
+         <p>Specifies ranges of integer, continuous, and categorical hyperparameters that a hyperparameter tuning job searches. The hyperparameter tuning job launches training jobs with hyperparameter values within these ranges to find the combination of values that result in the training job with the best performance as measured by the objective metric of the hyperparameter tuning job.</p> <note> <p>The maximum number of items specified for <code>Array Members</code> refers to the maximum number of hyperparameters for each range and also the maximum for the hyperparameter tuning job itself. That is, the sum of the number of hyperparameters for all the ranges can't exceed the maximum number specified.</p> </note>
+
+        Attributes
+       ----------------------
+       integer_parameter_ranges: 	 <p>The array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_IntegerParameterRange.html">IntegerParameterRange</a> objects that specify ranges of integer hyperparameters that a hyperparameter tuning job searches.</p>
+       continuous_parameter_ranges: 	 <p>The array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ContinuousParameterRange.html">ContinuousParameterRange</a> objects that specify ranges of continuous hyperparameters that a hyperparameter tuning job searches.</p>
+       categorical_parameter_ranges: 	 <p>The array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CategoricalParameterRange.html">CategoricalParameterRange</a> objects that specify ranges of categorical hyperparameters that a hyperparameter tuning job searches.</p>
+       auto_parameters: 	 <p>A list containing hyperparameter names and example values to be used by Autotune to determine optimal ranges for your tuning job.</p>
+    """
+
+    integer_parameter_ranges: Optional[List[IntegerParameterRange]] = Unassigned()
+    continuous_parameter_ranges: Optional[List[ContinuousParameterRange]] = Unassigned()
+    categorical_parameter_ranges: Optional[List[CategoricalParameterRange]] = (
+        Unassigned()
+    )
+    auto_parameters: Optional[List[AutoParameter]] = Unassigned()
+
+
+class TuningJobCompletionCriteria(Base):
+    """
+    TuningJobCompletionCriteria
+         <p>The job completion criteria.</p>
+
+        Attributes
+       ----------------------
+       target_objective_metric_value: 	 <p>The value of the objective metric.</p>
+       best_objective_not_improving: 	 <p>A flag to stop your hyperparameter tuning job if model performance fails to improve as evaluated against an objective function.</p>
+       convergence_detected: 	 <p>A flag to top your hyperparameter tuning job if automatic model tuning (AMT) has detected that your model has converged as evaluated against your objective function.</p>
+    """
+
+    target_objective_metric_value: Optional[float] = Unassigned()
+    best_objective_not_improving: Optional[BestObjectiveNotImproving] = Unassigned()
+    convergence_detected: Optional[ConvergenceDetected] = Unassigned()
+
+
+class HyperParameterTuningJobConfig(Base):
+    """
+    HyperParameterTuningJobConfig
+         <p>Configures a hyperparameter tuning job.</p>
+
+        Attributes
+       ----------------------
+       strategy: 	 <p>Specifies how hyperparameter tuning chooses the combinations of hyperparameter values to use for the training job it launches. For information about search strategies, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-how-it-works.html">How Hyperparameter Tuning Works</a>.</p>
+       strategy_config: 	 <p>The configuration for the <code>Hyperband</code> optimization strategy. This parameter should be provided only if <code>Hyperband</code> is selected as the strategy for <code>HyperParameterTuningJobConfig</code>.</p>
+       hyper_parameter_tuning_job_objective: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTuningJobObjective.html">HyperParameterTuningJobObjective</a> specifies the objective metric used to evaluate the performance of training jobs launched by this tuning job.</p>
+       resource_limits: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ResourceLimits.html">ResourceLimits</a> object that specifies the maximum number of training and parallel training jobs that can be used for this hyperparameter tuning job.</p>
+       parameter_ranges: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ParameterRanges.html">ParameterRanges</a> object that specifies the ranges of hyperparameters that this tuning job searches over to find the optimal configuration for the highest model performance against your chosen objective metric. </p>
+       training_job_early_stopping_type: 	 <p>Specifies whether to use early stopping for training jobs launched by the hyperparameter tuning job. Because the <code>Hyperband</code> strategy has its own advanced internal early stopping mechanism, <code>TrainingJobEarlyStoppingType</code> must be <code>OFF</code> to use <code>Hyperband</code>. This parameter can take on one of the following values (the default value is <code>OFF</code>):</p> <dl> <dt>OFF</dt> <dd> <p>Training jobs launched by the hyperparameter tuning job do not use early stopping.</p> </dd> <dt>AUTO</dt> <dd> <p>SageMaker stops training jobs launched by the hyperparameter tuning job when they are unlikely to perform better than previously completed training jobs. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-early-stopping.html">Stop Training Jobs Early</a>.</p> </dd> </dl>
+       tuning_job_completion_criteria: 	 <p>The tuning job's completion criteria.</p>
+       random_seed: 	 <p>A value used to initialize a pseudo-random number generator. Setting a random seed and using the same seed later for the same tuning job will allow hyperparameter optimization to find more a consistent hyperparameter configuration between the two runs.</p>
+    """
+
+    strategy: str
+    resource_limits: ResourceLimits
+    strategy_config: Optional[HyperParameterTuningJobStrategyConfig] = Unassigned()
+    hyper_parameter_tuning_job_objective: Optional[HyperParameterTuningJobObjective] = (
+        Unassigned()
+    )
+    parameter_ranges: Optional[ParameterRanges] = Unassigned()
+    training_job_early_stopping_type: Optional[str] = Unassigned()
+    tuning_job_completion_criteria: Optional[TuningJobCompletionCriteria] = Unassigned()
+    random_seed: Optional[int] = Unassigned()
+
+
+class HyperParameterAlgorithmSpecification(Base):
+    """
+    HyperParameterAlgorithmSpecification
+         <p>Specifies which training algorithm to use for training jobs that a hyperparameter tuning job launches and the metrics to monitor.</p>
+
+        Attributes
+       ----------------------
+       training_image: 	 <p> The registry path of the Docker image that contains the training algorithm. For information about Docker registry paths for built-in algorithms, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-algo-docker-registry-paths.html">Algorithms Provided by Amazon SageMaker: Common Parameters</a>. SageMaker supports both <code>registry/repository[:tag]</code> and <code>registry/repository[@digest]</code> image path formats. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms.html">Using Your Own Algorithms with Amazon SageMaker</a>.</p>
+       training_input_mode
+       algorithm_name: 	 <p>The name of the resource algorithm to use for the hyperparameter tuning job. If you specify a value for this parameter, do not specify a value for <code>TrainingImage</code>.</p>
+       metric_definitions: 	 <p>An array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_MetricDefinition.html">MetricDefinition</a> objects that specify the metrics that the algorithm emits.</p>
+    """
+
+    training_input_mode: str
+    training_image: Optional[str] = Unassigned()
+    algorithm_name: Optional[str] = Unassigned()
+    metric_definitions: Optional[List[MetricDefinition]] = Unassigned()
+
+
+class HyperParameterTuningInstanceConfig(Base):
+    """
+    HyperParameterTuningInstanceConfig
+         <p>The configuration for hyperparameter tuning resources for use in training jobs launched by the tuning job. These resources include compute instances and storage volumes. Specify one or more compute instance configurations and allocation strategies to select resources (optional).</p>
+
+        Attributes
+       ----------------------
+       instance_type: 	 <p>The instance type used for processing of hyperparameter optimization jobs. Choose from general purpose (no GPUs) instance types: ml.m5.xlarge, ml.m5.2xlarge, and ml.m5.4xlarge or compute optimized (no GPUs) instance types: ml.c5.xlarge and ml.c5.2xlarge. For more information about instance types, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/notebooks-available-instance-types.html">instance type descriptions</a>.</p>
+       instance_count: 	 <p>The number of instances of the type specified by <code>InstanceType</code>. Choose an instance count larger than 1 for distributed training algorithms. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/data-parallel-use-api.html">Step 2: Launch a SageMaker Distributed Training Job Using the SageMaker Python SDK</a> for more information.</p>
+       volume_size_in_g_b: 	 <p>The volume size in GB of the data to be processed for hyperparameter optimization (optional).</p>
+    """
+
+    instance_type: str
+    instance_count: int
+    volume_size_in_g_b: int
+
+
+class HyperParameterTuningResourceConfig(Base):
+    """
+    HyperParameterTuningResourceConfig
+         <p>The configuration of resources, including compute instances and storage volumes for use in training jobs launched by hyperparameter tuning jobs. <code>HyperParameterTuningResourceConfig</code> is similar to <code>ResourceConfig</code>, but has the additional <code>InstanceConfigs</code> and <code>AllocationStrategy</code> fields to allow for flexible instance management. Specify one or more instance types, count, and the allocation strategy for instance selection.</p> <note> <p> <code>HyperParameterTuningResourceConfig</code> supports the capabilities of <code>ResourceConfig</code> with the exception of <code>KeepAlivePeriodInSeconds</code>. Hyperparameter tuning jobs use warm pools by default, which reuse clusters between training jobs.</p> </note>
+
+        Attributes
+       ----------------------
+       instance_type: 	 <p>The instance type used to run hyperparameter optimization tuning jobs. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/notebooks-available-instance-types.html"> descriptions of instance types</a> for more information.</p>
+       instance_count: 	 <p>The number of compute instances of type <code>InstanceType</code> to use. For <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/data-parallel-use-api.html">distributed training</a>, select a value greater than 1.</p>
+       volume_size_in_g_b: 	 <p>The volume size in GB for the storage volume to be used in processing hyperparameter optimization jobs (optional). These volumes store model artifacts, incremental states and optionally, scratch space for training algorithms. Do not provide a value for this parameter if a value for <code>InstanceConfigs</code> is also specified.</p> <p>Some instance types have a fixed total local storage size. If you select one of these instances for training, <code>VolumeSizeInGB</code> cannot be greater than this total size. For a list of instance types with local instance storage and their sizes, see <a href="http://aws.amazon.com/releasenotes/host-instance-storage-volumes-table/">instance store volumes</a>.</p> <note> <p>SageMaker supports only the <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ebs-volume-types.html">General Purpose SSD (gp2)</a> storage volume type.</p> </note>
+       volume_kms_key_id: 	 <p>A key used by Amazon Web Services Key Management Service to encrypt data on the storage volume attached to the compute instances used to run the training job. You can use either of the following formats to specify a key.</p> <p>KMS Key ID:</p> <p> <code>"1234abcd-12ab-34cd-56ef-1234567890ab"</code> </p> <p>Amazon Resource Name (ARN) of a KMS key:</p> <p> <code>"arn:aws:kms:us-west-2:111122223333:key/1234abcd-12ab-34cd-56ef-1234567890ab"</code> </p> <p>Some instances use local storage, which use a <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ssd-instance-store.html">hardware module to encrypt</a> storage volumes. If you choose one of these instance types, you cannot request a <code>VolumeKmsKeyId</code>. For a list of instance types that use local storage, see <a href="http://aws.amazon.com/releasenotes/host-instance-storage-volumes-table/">instance store volumes</a>. For more information about Amazon Web Services Key Management Service, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sms-security-kms-permissions.html">KMS encryption</a> for more information.</p>
+       allocation_strategy: 	 <p>The strategy that determines the order of preference for resources specified in <code>InstanceConfigs</code> used in hyperparameter optimization.</p>
+       instance_configs: 	 <p>A list containing the configuration(s) for one or more resources for processing hyperparameter jobs. These resources include compute instances and storage volumes to use in model training jobs launched by hyperparameter tuning jobs. The <code>AllocationStrategy</code> controls the order in which multiple configurations provided in <code>InstanceConfigs</code> are used.</p> <note> <p>If you only want to use a single instance configuration inside the <code>HyperParameterTuningResourceConfig</code> API, do not provide a value for <code>InstanceConfigs</code>. Instead, use <code>InstanceType</code>, <code>VolumeSizeInGB</code> and <code>InstanceCount</code>. If you use <code>InstanceConfigs</code>, do not provide values for <code>InstanceType</code>, <code>VolumeSizeInGB</code> or <code>InstanceCount</code>.</p> </note>
+    """
+
+    instance_type: Optional[str] = Unassigned()
+    instance_count: Optional[int] = Unassigned()
+    volume_size_in_g_b: Optional[int] = Unassigned()
+    volume_kms_key_id: Optional[str] = Unassigned()
+    allocation_strategy: Optional[str] = Unassigned()
+    instance_configs: Optional[List[HyperParameterTuningInstanceConfig]] = Unassigned()
+
+
+class HyperParameterTrainingJobDefinition(Base):
+    """
+    HyperParameterTrainingJobDefinition
+         <p>Defines the training jobs launched by a hyperparameter tuning job.</p>
+
+        Attributes
+       ----------------------
+       definition_name: 	 <p>The job definition name.</p>
+       tuning_objective
+       hyper_parameter_ranges
+       static_hyper_parameters: 	 <p>Specifies the values of hyperparameters that do not change for the tuning job.</p>
+       algorithm_specification: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterAlgorithmSpecification.html">HyperParameterAlgorithmSpecification</a> object that specifies the resource algorithm to use for the training jobs that the tuning job launches.</p>
+       role_arn: 	 <p>The Amazon Resource Name (ARN) of the IAM role associated with the training jobs that the tuning job launches.</p>
+       input_data_config: 	 <p>An array of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Channel.html">Channel</a> objects that specify the input for the training jobs that the tuning job launches.</p>
+       vpc_config: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_VpcConfig.html">VpcConfig</a> object that specifies the VPC that you want the training jobs that this hyperparameter tuning job launches to connect to. Control access to and from your training container by configuring the VPC. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/train-vpc.html">Protect Training Jobs by Using an Amazon Virtual Private Cloud</a>.</p>
+       output_data_config: 	 <p>Specifies the path to the Amazon S3 bucket where you store model artifacts from the training jobs that the tuning job launches.</p>
+       resource_config: 	 <p>The resources, including the compute instances and storage volumes, to use for the training jobs that the tuning job launches.</p> <p>Storage volumes store model artifacts and incremental states. Training algorithms might also use storage volumes for scratch space. If you want SageMaker to use the storage volume to store the training data, choose <code>File</code> as the <code>TrainingInputMode</code> in the algorithm specification. For distributed training algorithms, specify an instance count greater than 1.</p> <note> <p>If you want to use hyperparameter optimization with instance type flexibility, use <code>HyperParameterTuningResourceConfig</code> instead.</p> </note>
+       hyper_parameter_tuning_resource_config: 	 <p>The configuration for the hyperparameter tuning resources, including the compute instances and storage volumes, used for training jobs launched by the tuning job. By default, storage volumes hold model artifacts and incremental states. Choose <code>File</code> for <code>TrainingInputMode</code> in the <code>AlgorithmSpecification</code> parameter to additionally store training data in the storage volume (optional).</p>
+       stopping_condition: 	 <p>Specifies a limit to how long a model hyperparameter training job can run. It also specifies how long a managed spot training job has to complete. When the job reaches the time limit, SageMaker ends the training job. Use this API to cap model training costs.</p>
+       enable_network_isolation: 	 <p>Isolates the training container. No inbound or outbound network calls can be made, except for calls between peers within a training cluster for distributed training. If network isolation is used for training jobs that are configured to use a VPC, SageMaker downloads and uploads customer data and model artifacts through the specified VPC, but the training container does not have network access.</p>
+       enable_inter_container_traffic_encryption: 	 <p>To encrypt all communications between ML compute instances in distributed training, choose <code>True</code>. Encryption provides greater security for distributed training, but training might take longer. How long it takes depends on the amount of communication between compute instances, especially if you use a deep learning algorithm in distributed training.</p>
+       enable_managed_spot_training: 	 <p>A Boolean indicating whether managed spot training is enabled (<code>True</code>) or not (<code>False</code>).</p>
+       checkpoint_config
+       retry_strategy: 	 <p>The number of times to retry the job when the job fails due to an <code>InternalServerError</code>.</p>
+       environment: 	 <p>An environment variable that you can pass into the SageMaker <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrainingJob.html">CreateTrainingJob</a> API. You can use an existing <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrainingJob.html#sagemaker-CreateTrainingJob-request-Environment">environment variable from the training container</a> or use your own. See <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-define-metrics-variables.html">Define metrics and variables</a> for more information.</p> <note> <p>The maximum number of items specified for <code>Map Entries</code> refers to the maximum number of environment variables for each <code>TrainingJobDefinition</code> and also the maximum for the hyperparameter tuning job itself. That is, the sum of the number of environment variables for all the training job definitions can't exceed the maximum number specified.</p> </note>
+    """
+
+    algorithm_specification: HyperParameterAlgorithmSpecification
+    role_arn: str
+    output_data_config: OutputDataConfig
+    stopping_condition: StoppingCondition
+    definition_name: Optional[str] = Unassigned()
+    tuning_objective: Optional[HyperParameterTuningJobObjective] = Unassigned()
+    hyper_parameter_ranges: Optional[ParameterRanges] = Unassigned()
+    static_hyper_parameters: Optional[Dict[str, str]] = Unassigned()
+    input_data_config: Optional[List[Channel]] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+    resource_config: Optional[ResourceConfig] = Unassigned()
+    hyper_parameter_tuning_resource_config: Optional[
+        HyperParameterTuningResourceConfig
+    ] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    enable_managed_spot_training: Optional[bool] = Unassigned()
+    checkpoint_config: Optional[CheckpointConfig] = Unassigned()
+    retry_strategy: Optional[RetryStrategy] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class ParentHyperParameterTuningJob(Base):
+    """
+    ParentHyperParameterTuningJob
+         <p>A previously completed or stopped hyperparameter tuning job to be used as a starting point for a new hyperparameter tuning job.</p>
+
+        Attributes
+       ----------------------
+       hyper_parameter_tuning_job_name: 	 <p>The name of the hyperparameter tuning job to be used as a starting point for a new hyperparameter tuning job.</p>
+    """
+
+    hyper_parameter_tuning_job_name: Optional[str] = Unassigned()
+
+
+class HyperParameterTuningJobWarmStartConfig(Base):
+    """
+    HyperParameterTuningJobWarmStartConfig
+         <p>Specifies the configuration for a hyperparameter tuning job that uses one or more previous hyperparameter tuning jobs as a starting point. The results of previous tuning jobs are used to inform which combinations of hyperparameters to search over in the new tuning job.</p> <p>All training jobs launched by the new hyperparameter tuning job are evaluated by using the objective metric, and the training job that performs the best is compared to the best training jobs from the parent tuning jobs. From these, the training job that performs the best as measured by the objective metric is returned as the overall best training job.</p> <note> <p>All training jobs launched by parent hyperparameter tuning jobs and the new hyperparameter tuning jobs count against the limit of training jobs for the tuning job.</p> </note>
+
+        Attributes
+       ----------------------
+       parent_hyper_parameter_tuning_jobs: 	 <p>An array of hyperparameter tuning jobs that are used as the starting point for the new hyperparameter tuning job. For more information about warm starting a hyperparameter tuning job, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-warm-start.html">Using a Previous Hyperparameter Tuning Job as a Starting Point</a>.</p> <p>Hyperparameter tuning jobs created before October 1, 2018 cannot be used as parent jobs for warm start tuning jobs.</p>
+       warm_start_type: 	 <p>Specifies one of the following:</p> <dl> <dt>IDENTICAL_DATA_AND_ALGORITHM</dt> <dd> <p>The new hyperparameter tuning job uses the same input data and training image as the parent tuning jobs. You can change the hyperparameter ranges to search and the maximum number of training jobs that the hyperparameter tuning job launches. You cannot use a new version of the training algorithm, unless the changes in the new version do not affect the algorithm itself. For example, changes that improve logging or adding support for a different data format are allowed. You can also change hyperparameters from tunable to static, and from static to tunable, but the total number of static plus tunable hyperparameters must remain the same as it is in all parent jobs. The objective metric for the new tuning job must be the same as for all parent jobs.</p> </dd> <dt>TRANSFER_LEARNING</dt> <dd> <p>The new hyperparameter tuning job can include input data, hyperparameter ranges, maximum number of concurrent training jobs, and maximum number of training jobs that are different than those of its parent hyperparameter tuning jobs. The training image can also be a different version from the version used in the parent hyperparameter tuning job. You can also change hyperparameters from tunable to static, and from static to tunable, but the total number of static plus tunable hyperparameters must remain the same as it is in all parent jobs. The objective metric for the new tuning job must be the same as for all parent jobs.</p> </dd> </dl>
+    """
+
+    parent_hyper_parameter_tuning_jobs: List[ParentHyperParameterTuningJob]
+    warm_start_type: str
+
+
+class TrainingJobStatusCounters(Base):
+    """
+    TrainingJobStatusCounters
+         <p>The numbers of training jobs launched by a hyperparameter tuning job, categorized by status.</p>
+
+        Attributes
+       ----------------------
+       completed: 	 <p>The number of completed training jobs launched by the hyperparameter tuning job.</p>
+       in_progress: 	 <p>The number of in-progress training jobs launched by a hyperparameter tuning job.</p>
+       retryable_error: 	 <p>The number of training jobs that failed, but can be retried. A failed training job can be retried only if it failed because an internal service error occurred.</p>
+       non_retryable_error: 	 <p>The number of training jobs that failed and can't be retried. A failed training job can't be retried if it failed because a client error occurred.</p>
+       stopped: 	 <p>The number of training jobs launched by a hyperparameter tuning job that were manually stopped.</p>
+    """
+
+    completed: Optional[int] = Unassigned()
+    in_progress: Optional[int] = Unassigned()
+    retryable_error: Optional[int] = Unassigned()
+    non_retryable_error: Optional[int] = Unassigned()
+    stopped: Optional[int] = Unassigned()
+
+
+class ObjectiveStatusCounters(Base):
+    """
+    ObjectiveStatusCounters
+         <p>Specifies the number of training jobs that this hyperparameter tuning job launched, categorized by the status of their objective metric. The objective metric status shows whether the final objective metric for the training job has been evaluated by the tuning job and used in the hyperparameter tuning process.</p>
+
+        Attributes
+       ----------------------
+       succeeded: 	 <p>The number of training jobs whose final objective metric was evaluated by the hyperparameter tuning job and used in the hyperparameter tuning process.</p>
+       pending: 	 <p>The number of training jobs that are in progress and pending evaluation of their final objective metric.</p>
+       failed: 	 <p>The number of training jobs whose final objective metric was not evaluated and used in the hyperparameter tuning process. This typically occurs when the training job failed or did not emit an objective metric.</p>
+    """
+
+    succeeded: Optional[int] = Unassigned()
+    pending: Optional[int] = Unassigned()
+    failed: Optional[int] = Unassigned()
+
+
+class FinalHyperParameterTuningJobObjectiveMetric(Base):
+    """
+    FinalHyperParameterTuningJobObjectiveMetric
+         <p>Shows the latest objective metric emitted by a training job that was launched by a hyperparameter tuning job. You define the objective metric in the <code>HyperParameterTuningJobObjective</code> parameter of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HyperParameterTuningJobConfig.html">HyperParameterTuningJobConfig</a>.</p>
+
+        Attributes
+       ----------------------
+       type: 	 <p>Select if you want to minimize or maximize the objective metric during hyperparameter tuning. </p>
+       metric_name: 	 <p>The name of the objective metric. For SageMaker built-in algorithms, metrics are defined per algorithm. See the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/xgboost-tuning.html">metrics for XGBoost</a> as an example. You can also use a custom algorithm for training and define your own metrics. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/automatic-model-tuning-define-metrics-variables.html">Define metrics and environment variables</a>.</p>
+       value: 	 <p>The value of the objective metric.</p>
+    """
+
+    metric_name: str
+    value: float
+    type: Optional[str] = Unassigned()
+
+
+class HyperParameterTrainingJobSummary(Base):
+    """
+    HyperParameterTrainingJobSummary
+         <p>The container for the summary information about a training job.</p>
+
+        Attributes
+       ----------------------
+       training_job_definition_name: 	 <p>The training job definition name.</p>
+       training_job_name: 	 <p>The name of the training job.</p>
+       training_job_arn: 	 <p>The Amazon Resource Name (ARN) of the training job.</p>
+       tuning_job_name: 	 <p>The HyperParameter tuning job that launched the training job.</p>
+       creation_time: 	 <p>The date and time that the training job was created.</p>
+       training_start_time: 	 <p>The date and time that the training job started.</p>
+       training_end_time: 	 <p>Specifies the time when the training job ends on training instances. You are billed for the time interval between the value of <code>TrainingStartTime</code> and this time. For successful jobs and stopped jobs, this is the time after model artifacts are uploaded. For failed jobs, this is the time when SageMaker detects a job failure.</p>
+       training_job_status: 	 <p>The status of the training job.</p>
+       tuned_hyper_parameters: 	 <p>A list of the hyperparameters for which you specified ranges to search.</p>
+       failure_reason: 	 <p>The reason that the training job failed. </p>
+       final_hyper_parameter_tuning_job_objective_metric: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_FinalHyperParameterTuningJobObjectiveMetric.html">FinalHyperParameterTuningJobObjectiveMetric</a> object that specifies the value of the objective metric of the tuning job that launched this training job.</p>
+       objective_status: 	 <p>The status of the objective metric for the training job:</p> <ul> <li> <p>Succeeded: The final objective metric for the training job was evaluated by the hyperparameter tuning job and used in the hyperparameter tuning process.</p> </li> </ul> <ul> <li> <p>Pending: The training job is in progress and evaluation of its final objective metric is pending.</p> </li> </ul> <ul> <li> <p>Failed: The final objective metric for the training job was not evaluated, and was not used in the hyperparameter tuning process. This typically occurs when the training job failed or did not emit an objective metric.</p> </li> </ul>
+    """
+
+    training_job_name: str
+    training_job_arn: str
+    creation_time: datetime.datetime
+    training_job_status: str
+    tuned_hyper_parameters: Dict[str, str]
+    training_job_definition_name: Optional[str] = Unassigned()
+    tuning_job_name: Optional[str] = Unassigned()
+    training_start_time: Optional[datetime.datetime] = Unassigned()
+    training_end_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    final_hyper_parameter_tuning_job_objective_metric: Optional[
+        FinalHyperParameterTuningJobObjectiveMetric
+    ] = Unassigned()
+    objective_status: Optional[str] = Unassigned()
+
+
+class HyperParameterTuningJobCompletionDetails(Base):
+    """
+    HyperParameterTuningJobCompletionDetails
+         <p>A structure that contains runtime information about both current and completed hyperparameter tuning jobs.</p>
+
+        Attributes
+       ----------------------
+       number_of_training_jobs_objective_not_improving: 	 <p>The number of training jobs launched by a tuning job that are not improving (1% or less) as measured by model performance evaluated against an objective function.</p>
+       convergence_detected_time: 	 <p>The time in timestamp format that AMT detected model convergence, as defined by a lack of significant improvement over time based on criteria developed over a wide range of diverse benchmarking tests.</p>
+    """
+
+    number_of_training_jobs_objective_not_improving: Optional[int] = Unassigned()
+    convergence_detected_time: Optional[datetime.datetime] = Unassigned()
+
+
+class HyperParameterTuningJobConsumedResources(Base):
+    """
+    HyperParameterTuningJobConsumedResources
+         <p>The total resources consumed by your hyperparameter tuning job.</p>
+
+        Attributes
+       ----------------------
+       runtime_in_seconds: 	 <p>The wall clock runtime in seconds used by your hyperparameter tuning job.</p>
+    """
+
+    runtime_in_seconds: Optional[int] = Unassigned()
+
+
+class HyperParameterTuningJobSummary(Base):
+    """
+    HyperParameterTuningJobSummary
+         <p>Provides summary information about a hyperparameter tuning job.</p>
+
+        Attributes
+       ----------------------
+       hyper_parameter_tuning_job_name: 	 <p>The name of the tuning job.</p>
+       hyper_parameter_tuning_job_arn: 	 <p>The Amazon Resource Name (ARN) of the tuning job.</p>
+       hyper_parameter_tuning_job_status: 	 <p>The status of the tuning job.</p>
+       strategy: 	 <p>Specifies the search strategy hyperparameter tuning uses to choose which hyperparameters to evaluate at each iteration.</p>
+       creation_time: 	 <p>The date and time that the tuning job was created.</p>
+       hyper_parameter_tuning_end_time: 	 <p>The date and time that the tuning job ended.</p>
+       last_modified_time: 	 <p>The date and time that the tuning job was modified.</p>
+       training_job_status_counters: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_TrainingJobStatusCounters.html">TrainingJobStatusCounters</a> object that specifies the numbers of training jobs, categorized by status, that this tuning job launched.</p>
+       objective_status_counters: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ObjectiveStatusCounters.html">ObjectiveStatusCounters</a> object that specifies the numbers of training jobs, categorized by objective metric status, that this tuning job launched.</p>
+       resource_limits: 	 <p>The <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ResourceLimits.html">ResourceLimits</a> object that specifies the maximum number of training jobs and parallel training jobs allowed for this tuning job.</p>
+    """
+
+    hyper_parameter_tuning_job_name: str
+    hyper_parameter_tuning_job_arn: str
+    hyper_parameter_tuning_job_status: str
+    strategy: str
+    creation_time: datetime.datetime
+    training_job_status_counters: TrainingJobStatusCounters
+    objective_status_counters: ObjectiveStatusCounters
+    hyper_parameter_tuning_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    resource_limits: Optional[ResourceLimits] = Unassigned()
@@ -0,0 +1,91 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class BatchDataCaptureConfig(Base):
+    """
+    BatchDataCaptureConfig
+         <p>Configuration to control how SageMaker captures inference data for batch transform jobs.</p>
+
+        Attributes
+       ----------------------
+       destination_s3_uri: 	 <p>The Amazon S3 location being used to capture the data.</p>
+       kms_key_id: 	 <p>The Amazon Resource Name (ARN) of a Amazon Web Services Key Management Service key that SageMaker uses to encrypt data on the storage volume attached to the ML compute instance that hosts the batch transform job.</p> <p>The KmsKeyId can be any of the following formats: </p> <ul> <li> <p>Key ID: <code>1234abcd-12ab-34cd-56ef-1234567890ab</code> </p> </li> <li> <p>Key ARN: <code>arn:aws:kms:us-west-2:111122223333:key/1234abcd-12ab-34cd-56ef-1234567890ab</code> </p> </li> <li> <p>Alias name: <code>alias/ExampleAlias</code> </p> </li> <li> <p>Alias name ARN: <code>arn:aws:kms:us-west-2:111122223333:alias/ExampleAlias</code> </p> </li> </ul>
+       generate_inference_id: 	 <p>Flag that indicates whether to append inference id to the output.</p>
+    """
+
+    destination_s3_uri: str
+    kms_key_id: Optional[str] = Unassigned()
+    generate_inference_id: Optional[bool] = Unassigned()
+
+
+class ModelClientConfig(Base):
+    """
+    ModelClientConfig
+         <p>Configures the timeout and maximum number of retries for processing a transform job invocation.</p>
+
+        Attributes
+       ----------------------
+       invocations_timeout_in_seconds: 	 <p>The timeout value in seconds for an invocation request. The default value is 600.</p>
+       invocations_max_retries: 	 <p>The maximum number of retries when invocation requests are failing. The default value is 3.</p>
+    """
+
+    invocations_timeout_in_seconds: Optional[int] = Unassigned()
+    invocations_max_retries: Optional[int] = Unassigned()
+
+
+class DataProcessing(Base):
+    """
+    DataProcessing
+         <p>The data structure used to specify the data to be used for inference in a batch transform job and to associate the data that is relevant to the prediction results in the output. The input filter provided allows you to exclude input data that is not needed for inference in a batch transform job. The output filter provided allows you to include input data relevant to interpreting the predictions in the output from the job. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/batch-transform-data-processing.html">Associate Prediction Results with their Corresponding Input Records</a>.</p>
+
+        Attributes
+       ----------------------
+       input_filter: 	 <p>A <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/batch-transform-data-processing.html#data-processing-operators">JSONPath</a> expression used to select a portion of the input data to pass to the algorithm. Use the <code>InputFilter</code> parameter to exclude fields, such as an ID column, from the input. If you want SageMaker to pass the entire input dataset to the algorithm, accept the default value <code>$</code>.</p> <p>Examples: <code>"$"</code>, <code>"$[1:]"</code>, <code>"$.features"</code> </p>
+       output_filter: 	 <p>A <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/batch-transform-data-processing.html#data-processing-operators">JSONPath</a> expression used to select a portion of the joined dataset to save in the output file for a batch transform job. If you want SageMaker to store the entire input dataset in the output file, leave the default value, <code>$</code>. If you specify indexes that aren't within the dimension size of the joined dataset, you get an error.</p> <p>Examples: <code>"$"</code>, <code>"$[0,5:]"</code>, <code>"$['id','SageMakerOutput']"</code> </p>
+       join_source: 	 <p>Specifies the source of the data to join with the transformed data. The valid values are <code>None</code> and <code>Input</code>. The default value is <code>None</code>, which specifies not to join the input with the transformed data. If you want the batch transform job to join the original input data with the transformed data, set <code>JoinSource</code> to <code>Input</code>. You can specify <code>OutputFilter</code> as an additional filter to select a portion of the joined dataset and store it in the output file.</p> <p>For JSON or JSONLines objects, such as a JSON array, SageMaker adds the transformed data to the input JSON object in an attribute called <code>SageMakerOutput</code>. The joined result for JSON must be a key-value pair object. If the input is not a key-value pair object, SageMaker creates a new JSON file. In the new JSON file, and the input data is stored under the <code>SageMakerInput</code> key and the results are stored in <code>SageMakerOutput</code>.</p> <p>For CSV data, SageMaker takes each row as a JSON array and joins the transformed data with the input by appending each transformed row to the end of the input. The joined data has the original input data followed by the transformed data and the output is a CSV file.</p> <p>For information on how joining in applied, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/batch-transform-data-processing.html#batch-transform-data-processing-workflow">Workflow for Associating Inferences with Input Records</a>.</p>
+    """
+
+    input_filter: Optional[str] = Unassigned()
+    output_filter: Optional[str] = Unassigned()
+    join_source: Optional[str] = Unassigned()
+
+
+class TransformJobSummary(Base):
+    """
+    TransformJobSummary
+         <p>Provides a summary of a transform job. Multiple <code>TransformJobSummary</code> objects are returned as a list after in response to a <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ListTransformJobs.html">ListTransformJobs</a> call.</p>
+
+        Attributes
+       ----------------------
+       transform_job_name: 	 <p>The name of the transform job.</p>
+       transform_job_arn: 	 <p>The Amazon Resource Name (ARN) of the transform job.</p>
+       creation_time: 	 <p>A timestamp that shows when the transform Job was created.</p>
+       transform_end_time: 	 <p>Indicates when the transform job ends on compute instances. For successful jobs and stopped jobs, this is the exact time recorded after the results are uploaded. For failed jobs, this is when Amazon SageMaker detected that the job failed.</p>
+       last_modified_time: 	 <p>Indicates when the transform job was last modified.</p>
+       transform_job_status: 	 <p>The status of the transform job.</p>
+       failure_reason: 	 <p>If the transform job failed, the reason it failed.</p>
+    """
+
+    transform_job_name: str
+    transform_job_arn: str
+    creation_time: datetime.datetime
+    transform_job_status: str
+    transform_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
@@ -0,0 +1,241 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class MonitoringCsvDatasetFormat(Base):
+    """
+    MonitoringCsvDatasetFormat
+         <p>Represents the CSV dataset format used when running a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       header: 	 <p>Indicates if the CSV data has a header.</p>
+    """
+
+    header: Optional[bool] = Unassigned()
+
+
+class MonitoringJsonDatasetFormat(Base):
+    """
+    MonitoringJsonDatasetFormat
+         <p>Represents the JSON dataset format used when running a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       line: 	 <p>Indicates if the file should be read as a JSON object per line. </p>
+    """
+
+    line: Optional[bool] = Unassigned()
+
+
+class MonitoringParquetDatasetFormat(Base):
+    """
+    MonitoringParquetDatasetFormat
+         <p>Represents the Parquet dataset format used when running a monitoring job.</p>
+
+        Attributes
+       ----------------------
+    """
+
+
+class MonitoringDatasetFormat(Base):
+    """
+    MonitoringDatasetFormat
+         <p>Represents the dataset format used when running a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       csv: 	 <p>The CSV dataset used in the monitoring job.</p>
+       json: 	 <p>The JSON dataset used in the monitoring job</p>
+       parquet: 	 <p>The Parquet dataset used in the monitoring job</p>
+    """
+
+    csv: Optional[MonitoringCsvDatasetFormat] = Unassigned()
+    json: Optional[MonitoringJsonDatasetFormat] = Unassigned()
+    parquet: Optional[MonitoringParquetDatasetFormat] = Unassigned()
+
+
+class BatchTransformInput(Base):
+    """
+    BatchTransformInput
+         <p>Input object for the batch transform job.</p>
+
+        Attributes
+       ----------------------
+       data_captured_destination_s3_uri: 	 <p>The Amazon S3 location being used to capture the data.</p>
+       dataset_format: 	 <p>The dataset format for your batch transform job.</p>
+       local_path: 	 <p>Path to the filesystem where the batch transform data is available to the container.</p>
+       s3_input_mode: 	 <p>Whether the <code>Pipe</code> or <code>File</code> is used as the input mode for transferring data for the monitoring job. <code>Pipe</code> mode is recommended for large datasets. <code>File</code> mode is useful for small files that fit in memory. Defaults to <code>File</code>.</p>
+       s3_data_distribution_type: 	 <p>Whether input data distributed in Amazon S3 is fully replicated or sharded by an S3 key. Defaults to <code>FullyReplicated</code> </p>
+       features_attribute: 	 <p>The attributes of the input data that are the input features.</p>
+       inference_attribute: 	 <p>The attribute of the input data that represents the ground truth label.</p>
+       probability_attribute: 	 <p>In a classification problem, the attribute that represents the class probability.</p>
+       probability_threshold_attribute: 	 <p>The threshold for the class probability to be evaluated as a positive result.</p>
+       start_time_offset: 	 <p>If specified, monitoring jobs substract this time from the start time. For information about using offsets for scheduling monitoring jobs, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-monitor-model-quality-schedule.html">Schedule Model Quality Monitoring Jobs</a>.</p>
+       end_time_offset: 	 <p>If specified, monitoring jobs subtract this time from the end time. For information about using offsets for scheduling monitoring jobs, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-monitor-model-quality-schedule.html">Schedule Model Quality Monitoring Jobs</a>.</p>
+       exclude_features_attribute: 	 <p>The attributes of the input data to exclude from the analysis.</p>
+    """
+
+    data_captured_destination_s3_uri: str
+    dataset_format: MonitoringDatasetFormat
+    local_path: str
+    s3_input_mode: Optional[str] = Unassigned()
+    s3_data_distribution_type: Optional[str] = Unassigned()
+    features_attribute: Optional[str] = Unassigned()
+    inference_attribute: Optional[str] = Unassigned()
+    probability_attribute: Optional[str] = Unassigned()
+    probability_threshold_attribute: Optional[float] = Unassigned()
+    start_time_offset: Optional[str] = Unassigned()
+    end_time_offset: Optional[str] = Unassigned()
+    exclude_features_attribute: Optional[str] = Unassigned()
+
+
+class MonitoringConstraintsResource(Base):
+    """
+    MonitoringConstraintsResource
+         <p>The constraints resource for a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       s3_uri: 	 <p>The Amazon S3 URI for the constraints resource.</p>
+    """
+
+    s3_uri: Optional[str] = Unassigned()
+
+
+class EndpointInput(Base):
+    """
+    EndpointInput
+         <p>Input object for the endpoint</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>An endpoint in customer's account which has enabled <code>DataCaptureConfig</code> enabled.</p>
+       local_path: 	 <p>Path to the filesystem where the endpoint data is available to the container.</p>
+       s3_input_mode: 	 <p>Whether the <code>Pipe</code> or <code>File</code> is used as the input mode for transferring data for the monitoring job. <code>Pipe</code> mode is recommended for large datasets. <code>File</code> mode is useful for small files that fit in memory. Defaults to <code>File</code>.</p>
+       s3_data_distribution_type: 	 <p>Whether input data distributed in Amazon S3 is fully replicated or sharded by an Amazon S3 key. Defaults to <code>FullyReplicated</code> </p>
+       features_attribute: 	 <p>The attributes of the input data that are the input features.</p>
+       inference_attribute: 	 <p>The attribute of the input data that represents the ground truth label.</p>
+       probability_attribute: 	 <p>In a classification problem, the attribute that represents the class probability.</p>
+       probability_threshold_attribute: 	 <p>The threshold for the class probability to be evaluated as a positive result.</p>
+       start_time_offset: 	 <p>If specified, monitoring jobs substract this time from the start time. For information about using offsets for scheduling monitoring jobs, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-monitor-model-quality-schedule.html">Schedule Model Quality Monitoring Jobs</a>.</p>
+       end_time_offset: 	 <p>If specified, monitoring jobs substract this time from the end time. For information about using offsets for scheduling monitoring jobs, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-monitor-model-quality-schedule.html">Schedule Model Quality Monitoring Jobs</a>.</p>
+       exclude_features_attribute: 	 <p>The attributes of the input data to exclude from the analysis.</p>
+    """
+
+    endpoint_name: str
+    local_path: str
+    s3_input_mode: Optional[str] = Unassigned()
+    s3_data_distribution_type: Optional[str] = Unassigned()
+    features_attribute: Optional[str] = Unassigned()
+    inference_attribute: Optional[str] = Unassigned()
+    probability_attribute: Optional[str] = Unassigned()
+    probability_threshold_attribute: Optional[float] = Unassigned()
+    start_time_offset: Optional[str] = Unassigned()
+    end_time_offset: Optional[str] = Unassigned()
+    exclude_features_attribute: Optional[str] = Unassigned()
+
+
+class MonitoringS3Output(Base):
+    """
+    MonitoringS3Output
+         <p>Information about where and how you want to store the results of a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       s3_uri: 	 <p>A URI that identifies the Amazon S3 storage location where Amazon SageMaker saves the results of a monitoring job.</p>
+       local_path: 	 <p>The local path to the Amazon S3 storage location where Amazon SageMaker saves the results of a monitoring job. LocalPath is an absolute path for the output data.</p>
+       s3_upload_mode: 	 <p>Whether to upload the results of the monitoring job continuously or after the job completes.</p>
+    """
+
+    s3_uri: str
+    local_path: str
+    s3_upload_mode: Optional[str] = Unassigned()
+
+
+class MonitoringOutput(Base):
+    """
+    MonitoringOutput
+         <p>The output object for a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       s3_output: 	 <p>The Amazon S3 storage location where the results of a monitoring job are saved.</p>
+    """
+
+    s3_output: MonitoringS3Output
+
+
+class MonitoringOutputConfig(Base):
+    """
+    MonitoringOutputConfig
+         <p>The output configuration for monitoring jobs.</p>
+
+        Attributes
+       ----------------------
+       monitoring_outputs: 	 <p>Monitoring outputs for monitoring jobs. This is where the output of the periodic monitoring jobs is uploaded.</p>
+       kms_key_id: 	 <p>The Key Management Service (KMS) key that Amazon SageMaker uses to encrypt the model artifacts at rest using Amazon S3 server-side encryption.</p>
+    """
+
+    monitoring_outputs: List[MonitoringOutput]
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class MonitoringClusterConfig(Base):
+    """
+    MonitoringClusterConfig
+         <p>Configuration for the cluster used to run model monitoring jobs.</p>
+
+        Attributes
+       ----------------------
+       instance_count: 	 <p>The number of ML compute instances to use in the model monitoring job. For distributed processing jobs, specify a value greater than 1. The default value is 1.</p>
+       instance_type: 	 <p>The ML compute instance type for the processing job.</p>
+       volume_size_in_g_b: 	 <p>The size of the ML storage volume, in gigabytes, that you want to provision. You must specify sufficient ML storage for your scenario.</p>
+       volume_kms_key_id: 	 <p>The Key Management Service (KMS) key that Amazon SageMaker uses to encrypt data on the storage volume attached to the ML compute instance(s) that run the model monitoring job.</p>
+    """
+
+    instance_count: int
+    instance_type: str
+    volume_size_in_g_b: int
+    volume_kms_key_id: Optional[str] = Unassigned()
+
+
+class MonitoringResources(Base):
+    """
+    MonitoringResources
+         <p>Identifies the resources to deploy for a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       cluster_config: 	 <p>The configuration for the cluster resources used to run the processing job.</p>
+    """
+
+    cluster_config: MonitoringClusterConfig
+
+
+class MonitoringStoppingCondition(Base):
+    """
+    MonitoringStoppingCondition
+         <p>A time limit for how long the monitoring job is allowed to run before stopping.</p>
+
+        Attributes
+       ----------------------
+       max_runtime_in_seconds: 	 <p>The maximum runtime allowed in seconds.</p> <note> <p>The <code>MaxRuntimeInSeconds</code> cannot exceed the frequency of the job. For data quality and model explainability, this can be up to 3600 seconds for an hourly schedule. For model bias and model quality hourly schedules, this can be up to 1800 seconds.</p> </note>
+    """
+
+    max_runtime_in_seconds: int
@@ -0,0 +1,364 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .code_repository import (
+    CodeRepository,
+    CustomImage,
+    JupyterServerAppSettings,
+    KernelGatewayAppSettings,
+)
+from .resource_spec import ResourceSpec
+
+
+class TimeSeriesForecastingSettings(Base):
+    """
+    TimeSeriesForecastingSettings
+         <p>Time series forecast settings for the SageMaker Canvas application.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>Describes whether time series forecasting is enabled or disabled in the Canvas application.</p>
+       amazon_forecast_role_arn: 	 <p>The IAM role that Canvas passes to Amazon Forecast for time series forecasting. By default, Canvas uses the execution role specified in the <code>UserProfile</code> that launches the Canvas application. If an execution role is not specified in the <code>UserProfile</code>, Canvas uses the execution role specified in the Domain that owns the <code>UserProfile</code>. To allow time series forecasting, this IAM role should have the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/security-iam-awsmanpol-canvas.html#security-iam-awsmanpol-AmazonSageMakerCanvasForecastAccess"> AmazonSageMakerCanvasForecastAccess</a> policy attached and <code>forecast.amazonaws.com</code> added in the trust relationship as a service principal.</p>
+    """
+
+    status: Optional[str] = Unassigned()
+    amazon_forecast_role_arn: Optional[str] = Unassigned()
+
+
+class ModelRegisterSettings(Base):
+    """
+    ModelRegisterSettings
+         <p>The model registry settings for the SageMaker Canvas application.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>Describes whether the integration to the model registry is enabled or disabled in the Canvas application.</p>
+       cross_account_model_register_role_arn: 	 <p>The Amazon Resource Name (ARN) of the SageMaker model registry account. Required only to register model versions created by a different SageMaker Canvas Amazon Web Services account than the Amazon Web Services account in which SageMaker model registry is set up.</p>
+    """
+
+    status: Optional[str] = Unassigned()
+    cross_account_model_register_role_arn: Optional[str] = Unassigned()
+
+
+class WorkspaceSettings(Base):
+    """
+    WorkspaceSettings
+         <p>The workspace settings for the SageMaker Canvas application.</p>
+
+        Attributes
+       ----------------------
+       s3_artifact_path: 	 <p>The Amazon S3 bucket used to store artifacts generated by Canvas. Updating the Amazon S3 location impacts existing configuration settings, and Canvas users no longer have access to their artifacts. Canvas users must log out and log back in to apply the new location.</p>
+       s3_kms_key_id: 	 <p>The Amazon Web Services Key Management Service (KMS) encryption key ID that is used to encrypt artifacts generated by Canvas in the Amazon S3 bucket.</p>
+    """
+
+    s3_artifact_path: Optional[str] = Unassigned()
+    s3_kms_key_id: Optional[str] = Unassigned()
+
+
+class IdentityProviderOAuthSetting(Base):
+    """
+    IdentityProviderOAuthSetting
+         <p>The Amazon SageMaker Canvas application setting where you configure OAuth for connecting to an external data source, such as Snowflake.</p>
+
+        Attributes
+       ----------------------
+       data_source_name: 	 <p>The name of the data source that you're connecting to. Canvas currently supports OAuth for Snowflake and Salesforce Data Cloud.</p>
+       status: 	 <p>Describes whether OAuth for a data source is enabled or disabled in the Canvas application.</p>
+       secret_arn: 	 <p>The ARN of an Amazon Web Services Secrets Manager secret that stores the credentials from your identity provider, such as the client ID and secret, authorization URL, and token URL. </p>
+    """
+
+    data_source_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    secret_arn: Optional[str] = Unassigned()
+
+
+class DirectDeploySettings(Base):
+    """
+    DirectDeploySettings
+         <p>The model deployment settings for the SageMaker Canvas application.</p> <note> <p>In order to enable model deployment for Canvas, the SageMaker Domain's or user profile's Amazon Web Services IAM execution role must have the <code>AmazonSageMakerCanvasDirectDeployAccess</code> policy attached. You can also turn on model deployment permissions through the SageMaker Domain's or user profile's settings in the SageMaker console.</p> </note>
+
+        Attributes
+       ----------------------
+       status: 	 <p>Describes whether model deployment permissions are enabled or disabled in the Canvas application.</p>
+    """
+
+    status: Optional[str] = Unassigned()
+
+
+class KendraSettings(Base):
+    """
+    KendraSettings
+         <p>The Amazon SageMaker Canvas application setting where you configure document querying.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>Describes whether the document querying feature is enabled or disabled in the Canvas application.</p>
+    """
+
+    status: Optional[str] = Unassigned()
+
+
+class GenerativeAiSettings(Base):
+    """
+    GenerativeAiSettings
+         <p>The generative AI settings for the SageMaker Canvas application.</p> <p>Configure these settings for Canvas users starting chats with generative AI foundation models. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/canvas-fm-chat.html"> Use generative AI with foundation models</a>.</p>
+
+        Attributes
+       ----------------------
+       amazon_bedrock_role_arn: 	 <p>The ARN of an Amazon Web Services IAM role that allows fine-tuning of large language models (LLMs) in Amazon Bedrock. The IAM role should have Amazon S3 read and write permissions, as well as a trust relationship that establishes <code>bedrock.amazonaws.com</code> as a service principal.</p>
+    """
+
+    amazon_bedrock_role_arn: Optional[str] = Unassigned()
+
+
+class CanvasAppSettings(Base):
+    """
+    CanvasAppSettings
+         <p>The SageMaker Canvas application settings.</p>
+
+        Attributes
+       ----------------------
+       time_series_forecasting_settings: 	 <p>Time series forecast settings for the SageMaker Canvas application.</p>
+       model_register_settings: 	 <p>The model registry settings for the SageMaker Canvas application.</p>
+       workspace_settings: 	 <p>The workspace settings for the SageMaker Canvas application.</p>
+       identity_provider_o_auth_settings: 	 <p>The settings for connecting to an external data source with OAuth.</p>
+       direct_deploy_settings: 	 <p>The model deployment settings for the SageMaker Canvas application.</p>
+       kendra_settings: 	 <p>The settings for document querying.</p>
+       generative_ai_settings: 	 <p>The generative AI settings for the SageMaker Canvas application.</p>
+    """
+
+    time_series_forecasting_settings: Optional[TimeSeriesForecastingSettings] = (
+        Unassigned()
+    )
+    model_register_settings: Optional[ModelRegisterSettings] = Unassigned()
+    workspace_settings: Optional[WorkspaceSettings] = Unassigned()
+    identity_provider_o_auth_settings: Optional[List[IdentityProviderOAuthSetting]] = (
+        Unassigned()
+    )
+    direct_deploy_settings: Optional[DirectDeploySettings] = Unassigned()
+    kendra_settings: Optional[KendraSettings] = Unassigned()
+    generative_ai_settings: Optional[GenerativeAiSettings] = Unassigned()
+
+
+class CodeEditorAppSettings(Base):
+    """
+    CodeEditorAppSettings
+         <p>The Code Editor application settings.</p> <p>For more information about Code Editor, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/code-editor.html">Get started with Code Editor in Amazon SageMaker</a>.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec
+       lifecycle_config_arns: 	 <p>The Amazon Resource Name (ARN) of the Code Editor application lifecycle configuration.</p>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    lifecycle_config_arns: Optional[List[str]] = Unassigned()
+
+
+class SharingSettings(Base):
+    """
+    SharingSettings
+         <p>Specifies options for sharing Amazon SageMaker Studio notebooks. These settings are specified as part of <code>DefaultUserSettings</code> when the <code>CreateDomain</code> API is called, and as part of <code>UserSettings</code> when the <code>CreateUserProfile</code> API is called. When <code>SharingSettings</code> is not specified, notebook sharing isn't allowed.</p>
+
+        Attributes
+       ----------------------
+       notebook_output_option: 	 <p>Whether to include the notebook cell output when sharing the notebook. The default is <code>Disabled</code>.</p>
+       s3_output_path: 	 <p>When <code>NotebookOutputOption</code> is <code>Allowed</code>, the Amazon S3 bucket used to store the shared notebook snapshots.</p>
+       s3_kms_key_id: 	 <p>When <code>NotebookOutputOption</code> is <code>Allowed</code>, the Amazon Web Services Key Management Service (KMS) encryption key ID used to encrypt the notebook cell output in the Amazon S3 bucket.</p>
+    """
+
+    notebook_output_option: Optional[str] = Unassigned()
+    s3_output_path: Optional[str] = Unassigned()
+    s3_kms_key_id: Optional[str] = Unassigned()
+
+
+class TensorBoardAppSettings(Base):
+    """
+    TensorBoardAppSettings
+         <p>The TensorBoard app settings.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec: 	 <p>The default instance type and the Amazon Resource Name (ARN) of the SageMaker image created on the instance.</p>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+
+
+class RStudioServerProAppSettings(Base):
+    """
+    RStudioServerProAppSettings
+         <p>A collection of settings that configure user interaction with the <code>RStudioServerPro</code> app.</p>
+
+        Attributes
+       ----------------------
+       access_status: 	 <p>Indicates whether the current user has access to the <code>RStudioServerPro</code> app.</p>
+       user_group: 	 <p>The level of permissions that the user has within the <code>RStudioServerPro</code> app. This value defaults to `User`. The `Admin` value allows the user access to the RStudio Administrative Dashboard.</p>
+    """
+
+    access_status: Optional[str] = Unassigned()
+    user_group: Optional[str] = Unassigned()
+
+
+class RSessionAppSettings(Base):
+    """
+    RSessionAppSettings
+         <p>A collection of settings that apply to an <code>RSessionGateway</code> app.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec
+       custom_images: 	 <p>A list of custom SageMaker images that are configured to run as a RSession app.</p>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    custom_images: Optional[List[CustomImage]] = Unassigned()
+
+
+class JupyterLabAppSettings(Base):
+    """
+    JupyterLabAppSettings
+         <p>The settings for the JupyterLab application.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec
+       custom_images: 	 <p>A list of custom SageMaker images that are configured to run as a JupyterLab app.</p>
+       lifecycle_config_arns: 	 <p>The Amazon Resource Name (ARN) of the lifecycle configurations attached to the user profile or domain. To remove a lifecycle config, you must set <code>LifecycleConfigArns</code> to an empty list.</p>
+       code_repositories: 	 <p>A list of Git repositories that SageMaker automatically displays to users for cloning in the JupyterLab application.</p>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    custom_images: Optional[List[CustomImage]] = Unassigned()
+    lifecycle_config_arns: Optional[List[str]] = Unassigned()
+    code_repositories: Optional[List[CodeRepository]] = Unassigned()
+
+
+class DefaultEbsStorageSettings(Base):
+    """
+    DefaultEbsStorageSettings
+         <p>A collection of default EBS storage settings that applies to private spaces created within a domain or user profile.</p>
+
+        Attributes
+       ----------------------
+       default_ebs_volume_size_in_gb: 	 <p>The default size of the EBS storage volume for a private space.</p>
+       maximum_ebs_volume_size_in_gb: 	 <p>The maximum size of the EBS storage volume for a private space.</p>
+    """
+
+    default_ebs_volume_size_in_gb: int
+    maximum_ebs_volume_size_in_gb: int
+
+
+class DefaultSpaceStorageSettings(Base):
+    """
+    DefaultSpaceStorageSettings
+         <p>The default storage settings for a private space.</p>
+
+        Attributes
+       ----------------------
+       default_ebs_storage_settings: 	 <p>The default EBS storage settings for a private space.</p>
+    """
+
+    default_ebs_storage_settings: Optional[DefaultEbsStorageSettings] = Unassigned()
+
+
+class CustomPosixUserConfig(Base):
+    """
+    CustomPosixUserConfig
+         <p>Details about the POSIX identity that is used for file system operations.</p>
+
+        Attributes
+       ----------------------
+       uid: 	 <p>The POSIX user ID.</p>
+       gid: 	 <p>The POSIX group ID.</p>
+    """
+
+    uid: int
+    gid: int
+
+
+class EFSFileSystemConfig(Base):
+    """
+    EFSFileSystemConfig
+         <p>The settings for assigning a custom Amazon EFS file system to a user profile or space for an Amazon SageMaker Domain.</p>
+
+        Attributes
+       ----------------------
+       file_system_id: 	 <p>The ID of your Amazon EFS file system.</p>
+       file_system_path: 	 <p>The path to the file system directory that is accessible in Amazon SageMaker Studio. Permitted users can access only this directory and below.</p>
+    """
+
+    file_system_id: str
+    file_system_path: Optional[str] = Unassigned()
+
+
+class CustomFileSystemConfig(Base):
+    """
+    CustomFileSystemConfig
+         <p>The settings for assigning a custom file system to a user profile or space for an Amazon SageMaker Domain. Permitted users can access this file system in Amazon SageMaker Studio.</p>
+
+        Attributes
+       ----------------------
+       e_f_s_file_system_config: 	 <p>The settings for a custom Amazon EFS file system.</p>
+    """
+
+    e_f_s_file_system_config: Optional[EFSFileSystemConfig] = Unassigned()
+
+
+class UserSettings(Base):
+    """
+    UserSettings
+         <p>A collection of settings that apply to users in a domain. These settings are specified when the <code>CreateUserProfile</code> API is called, and as <code>DefaultUserSettings</code> when the <code>CreateDomain</code> API is called.</p> <p> <code>SecurityGroups</code> is aggregated when specified in both calls. For all other settings in <code>UserSettings</code>, the values specified in <code>CreateUserProfile</code> take precedence over those specified in <code>CreateDomain</code>.</p>
+
+        Attributes
+       ----------------------
+       execution_role: 	 <p>The execution role for the user.</p>
+       security_groups: 	 <p>The security groups for the Amazon Virtual Private Cloud (VPC) that the domain uses for communication.</p> <p>Optional when the <code>CreateDomain.AppNetworkAccessType</code> parameter is set to <code>PublicInternetOnly</code>.</p> <p>Required when the <code>CreateDomain.AppNetworkAccessType</code> parameter is set to <code>VpcOnly</code>, unless specified as part of the <code>DefaultUserSettings</code> for the domain.</p> <p>Amazon SageMaker adds a security group to allow NFS traffic from Amazon SageMaker Studio. Therefore, the number of security groups that you can specify is one less than the maximum number shown.</p>
+       sharing_settings: 	 <p>Specifies options for sharing Amazon SageMaker Studio notebooks.</p>
+       jupyter_server_app_settings: 	 <p>The Jupyter server's app settings.</p>
+       kernel_gateway_app_settings: 	 <p>The kernel gateway app settings.</p>
+       tensor_board_app_settings: 	 <p>The TensorBoard app settings.</p>
+       r_studio_server_pro_app_settings: 	 <p>A collection of settings that configure user interaction with the <code>RStudioServerPro</code> app.</p>
+       r_session_app_settings: 	 <p>A collection of settings that configure the <code>RSessionGateway</code> app.</p>
+       canvas_app_settings: 	 <p>The Canvas app settings.</p>
+       code_editor_app_settings: 	 <p>The Code Editor application settings.</p>
+       jupyter_lab_app_settings: 	 <p>The settings for the JupyterLab application.</p>
+       space_storage_settings: 	 <p>The storage settings for a private space.</p>
+       default_landing_uri: 	 <p>The default experience that the user is directed to when accessing the domain. The supported values are:</p> <ul> <li> <p> <code>studio::</code>: Indicates that Studio is the default experience. This value can only be passed if <code>StudioWebPortal</code> is set to <code>ENABLED</code>.</p> </li> <li> <p> <code>app:JupyterServer:</code>: Indicates that Studio Classic is the default experience.</p> </li> </ul>
+       studio_web_portal: 	 <p>Whether the user can access Studio. If this value is set to <code>DISABLED</code>, the user cannot access Studio, even if that is the default experience for the domain.</p>
+       custom_posix_user_config: 	 <p>Details about the POSIX identity that is used for file system operations.</p>
+       custom_file_system_configs: 	 <p>The settings for assigning a custom file system to a user profile. Permitted users can access this file system in Amazon SageMaker Studio.</p>
+    """
+
+    execution_role: Optional[str] = Unassigned()
+    security_groups: Optional[List[str]] = Unassigned()
+    sharing_settings: Optional[SharingSettings] = Unassigned()
+    jupyter_server_app_settings: Optional[JupyterServerAppSettings] = Unassigned()
+    kernel_gateway_app_settings: Optional[KernelGatewayAppSettings] = Unassigned()
+    tensor_board_app_settings: Optional[TensorBoardAppSettings] = Unassigned()
+    r_studio_server_pro_app_settings: Optional[RStudioServerProAppSettings] = (
+        Unassigned()
+    )
+    r_session_app_settings: Optional[RSessionAppSettings] = Unassigned()
+    canvas_app_settings: Optional[CanvasAppSettings] = Unassigned()
+    code_editor_app_settings: Optional[CodeEditorAppSettings] = Unassigned()
+    jupyter_lab_app_settings: Optional[JupyterLabAppSettings] = Unassigned()
+    space_storage_settings: Optional[DefaultSpaceStorageSettings] = Unassigned()
+    default_landing_uri: Optional[str] = Unassigned()
+    studio_web_portal: Optional[str] = Unassigned()
+    custom_posix_user_config: Optional[CustomPosixUserConfig] = Unassigned()
+    custom_file_system_configs: Optional[List[CustomFileSystemConfig]] = Unassigned()
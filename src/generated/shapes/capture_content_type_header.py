@@ -0,0 +1,32 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class CaptureContentTypeHeader(Base):
+    """
+    CaptureContentTypeHeader
+         <p>Configuration specifying how to treat different headers. If no headers are specified Amazon SageMaker will by default base64 encode when capturing the data.</p>
+
+        Attributes
+       ----------------------
+       csv_content_types: 	 <p>The list of all content type headers that Amazon SageMaker will treat as CSV and capture accordingly.</p>
+       json_content_types: 	 <p>The list of all content type headers that SageMaker will treat as JSON and capture accordingly.</p>
+    """
+
+    csv_content_types: Optional[List[str]] = Unassigned()
+    json_content_types: Optional[List[str]] = Unassigned()
@@ -0,0 +1,132 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .async_inference_client_config import (
+    ProductionVariantManagedInstanceScaling,
+    ProductionVariantRoutingConfig,
+)
+from .capture_content_type_header import CaptureContentTypeHeader
+from .production_variant_serverless_config import ProductionVariantServerlessConfig
+
+
+class CaptureOption(Base):
+    """
+    CaptureOption
+         <p>Specifies data Model Monitor will capture.</p>
+
+        Attributes
+       ----------------------
+       capture_mode: 	 <p>Specify the boundary of data to capture.</p>
+    """
+
+    capture_mode: str
+
+
+class ProductionVariantCoreDumpConfig(Base):
+    """
+    ProductionVariantCoreDumpConfig
+         <p>Specifies configuration for a core dump from the model container when the process crashes.</p>
+
+        Attributes
+       ----------------------
+       destination_s3_uri: 	 <p>The Amazon S3 bucket to send the core dump to.</p>
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (Amazon Web Services KMS) key that SageMaker uses to encrypt the core dump data at rest using Amazon S3 server-side encryption. The <code>KmsKeyId</code> can be any of the following formats: </p> <ul> <li> <p>// KMS Key ID</p> <p> <code>"1234abcd-12ab-34cd-56ef-1234567890ab"</code> </p> </li> <li> <p>// Amazon Resource Name (ARN) of a KMS Key</p> <p> <code>"arn:aws:kms:us-west-2:111122223333:key/1234abcd-12ab-34cd-56ef-1234567890ab"</code> </p> </li> <li> <p>// KMS Key Alias</p> <p> <code>"alias/ExampleAlias"</code> </p> </li> <li> <p>// Amazon Resource Name (ARN) of a KMS Key Alias</p> <p> <code>"arn:aws:kms:us-west-2:111122223333:alias/ExampleAlias"</code> </p> </li> </ul> <p>If you use a KMS key ID or an alias of your KMS key, the SageMaker execution role must include permissions to call <code>kms:Encrypt</code>. If you don't provide a KMS key ID, SageMaker uses the default KMS key for Amazon S3 for your role's account. SageMaker uses server-side encryption with KMS-managed keys for <code>OutputDataConfig</code>. If you use a bucket policy with an <code>s3:PutObject</code> permission that only allows objects with server-side encryption, set the condition key of <code>s3:x-amz-server-side-encryption</code> to <code>"aws:kms"</code>. For more information, see <a href="https://docs.aws.amazon.com/AmazonS3/latest/dev/UsingKMSEncryption.html">KMS-Managed Encryption Keys</a> in the <i>Amazon Simple Storage Service Developer Guide.</i> </p> <p>The KMS key policy must grant permission to the IAM role that you specify in your <code>CreateEndpoint</code> and <code>UpdateEndpoint</code> requests. For more information, see <a href="https://docs.aws.amazon.com/kms/latest/developerguide/key-policies.html">Using Key Policies in Amazon Web Services KMS</a> in the <i>Amazon Web Services Key Management Service Developer Guide</i>.</p>
+    """
+
+    destination_s3_uri: str
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class ProductionVariant(Base):
+    """
+    ProductionVariant
+         <p> Identifies a model that you want to host and the resources chosen to deploy for hosting it. If you are deploying multiple models, tell SageMaker how to distribute traffic among the models by specifying variant weights. For more information on production variants, check <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-ab-testing.html"> Production variants</a>. </p>
+
+        Attributes
+       ----------------------
+       variant_name: 	 <p>The name of the production variant.</p>
+       model_name: 	 <p>The name of the model that you want to host. This is the name that you specified when creating the model.</p>
+       initial_instance_count: 	 <p>Number of instances to launch initially.</p>
+       instance_type: 	 <p>The ML compute instance type.</p>
+       initial_variant_weight: 	 <p>Determines initial traffic distribution among all of the models that you specify in the endpoint configuration. The traffic to a production variant is determined by the ratio of the <code>VariantWeight</code> to the sum of all <code>VariantWeight</code> values across all ProductionVariants. If unspecified, it defaults to 1.0. </p>
+       accelerator_type: 	 <p>The size of the Elastic Inference (EI) instance to use for the production variant. EI instances provide on-demand GPU computing for inference. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/ei.html">Using Elastic Inference in Amazon SageMaker</a>.</p>
+       core_dump_config: 	 <p>Specifies configuration for a core dump from the model container when the process crashes.</p>
+       serverless_config: 	 <p>The serverless configuration for an endpoint. Specifies a serverless endpoint configuration instead of an instance-based endpoint configuration.</p>
+       volume_size_in_g_b: 	 <p>The size, in GB, of the ML storage volume attached to individual inference instance associated with the production variant. Currently only Amazon EBS gp2 storage volumes are supported.</p>
+       model_data_download_timeout_in_seconds: 	 <p>The timeout value, in seconds, to download and extract the model that you want to host from Amazon S3 to the individual inference instance associated with this production variant.</p>
+       container_startup_health_check_timeout_in_seconds: 	 <p>The timeout value, in seconds, for your inference container to pass health check by SageMaker Hosting. For more information about health check, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms-inference-code.html#your-algorithms-inference-algo-ping-requests">How Your Container Should Respond to Health Check (Ping) Requests</a>.</p>
+       enable_s_s_m_access: 	 <p> You can use this parameter to turn on native Amazon Web Services Systems Manager (SSM) access for a production variant behind an endpoint. By default, SSM access is disabled for all production variants behind an endpoint. You can turn on or turn off SSM access for a production variant behind an existing endpoint by creating a new endpoint configuration and calling <code>UpdateEndpoint</code>. </p>
+       managed_instance_scaling: 	 <p>Settings that control the range in the number of instances that the endpoint provisions as it scales up or down to accommodate traffic. </p>
+       routing_config: 	 <p>Settings that control how the endpoint routes incoming traffic to the instances that the endpoint hosts.</p>
+    """
+
+    variant_name: str
+    model_name: Optional[str] = Unassigned()
+    initial_instance_count: Optional[int] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    initial_variant_weight: Optional[float] = Unassigned()
+    accelerator_type: Optional[str] = Unassigned()
+    core_dump_config: Optional[ProductionVariantCoreDumpConfig] = Unassigned()
+    serverless_config: Optional[ProductionVariantServerlessConfig] = Unassigned()
+    volume_size_in_g_b: Optional[int] = Unassigned()
+    model_data_download_timeout_in_seconds: Optional[int] = Unassigned()
+    container_startup_health_check_timeout_in_seconds: Optional[int] = Unassigned()
+    enable_s_s_m_access: Optional[bool] = Unassigned()
+    managed_instance_scaling: Optional[ProductionVariantManagedInstanceScaling] = (
+        Unassigned()
+    )
+    routing_config: Optional[ProductionVariantRoutingConfig] = Unassigned()
+
+
+class DataCaptureConfig(Base):
+    """
+    DataCaptureConfig
+         <p>Configuration to control how SageMaker captures inference data.</p>
+
+        Attributes
+       ----------------------
+       enable_capture: 	 <p>Whether data capture should be enabled or disabled (defaults to enabled).</p>
+       initial_sampling_percentage: 	 <p>The percentage of requests SageMaker will capture. A lower value is recommended for Endpoints with high traffic.</p>
+       destination_s3_uri: 	 <p>The Amazon S3 location used to capture the data.</p>
+       kms_key_id: 	 <p>The Amazon Resource Name (ARN) of an Key Management Service key that SageMaker uses to encrypt the captured data at rest using Amazon S3 server-side encryption.</p> <p>The KmsKeyId can be any of the following formats: </p> <ul> <li> <p>Key ID: <code>1234abcd-12ab-34cd-56ef-1234567890ab</code> </p> </li> <li> <p>Key ARN: <code>arn:aws:kms:us-west-2:111122223333:key/1234abcd-12ab-34cd-56ef-1234567890ab</code> </p> </li> <li> <p>Alias name: <code>alias/ExampleAlias</code> </p> </li> <li> <p>Alias name ARN: <code>arn:aws:kms:us-west-2:111122223333:alias/ExampleAlias</code> </p> </li> </ul>
+       capture_options: 	 <p>Specifies data Model Monitor will capture. You can configure whether to collect only input, only output, or both</p>
+       capture_content_type_header: 	 <p>Configuration specifying how to treat different headers. If no headers are specified SageMaker will by default base64 encode when capturing the data.</p>
+    """
+
+    initial_sampling_percentage: int
+    destination_s3_uri: str
+    capture_options: List[CaptureOption]
+    enable_capture: Optional[bool] = Unassigned()
+    kms_key_id: Optional[str] = Unassigned()
+    capture_content_type_header: Optional[CaptureContentTypeHeader] = Unassigned()
+
+
+class EndpointConfigSummary(Base):
+    """
+    EndpointConfigSummary
+         <p>Provides summary information for an endpoint configuration.</p>
+
+        Attributes
+       ----------------------
+       endpoint_config_name: 	 <p>The name of the endpoint configuration.</p>
+       endpoint_config_arn: 	 <p>The Amazon Resource Name (ARN) of the endpoint configuration.</p>
+       creation_time: 	 <p>A timestamp that shows when the endpoint configuration was created.</p>
+    """
+
+    endpoint_config_name: str
+    endpoint_config_arn: str
+    creation_time: datetime.datetime
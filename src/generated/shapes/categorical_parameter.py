@@ -0,0 +1,468 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .production_variant_serverless_config import ProductionVariantServerlessConfig
+
+
+class CategoricalParameter(Base):
+    """
+    CategoricalParameter
+         <p>Environment parameters you want to benchmark your load test against.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The Name of the environment variable.</p>
+       value: 	 <p>The list of values you can pass.</p>
+    """
+
+    name: str
+    value: List[str]
+
+
+class Phase(Base):
+    """
+    Phase
+         <p>Defines the traffic pattern.</p>
+
+        Attributes
+       ----------------------
+       initial_number_of_users: 	 <p>Specifies how many concurrent users to start with. The value should be between 1 and 3.</p>
+       spawn_rate: 	 <p>Specified how many new users to spawn in a minute.</p>
+       duration_in_seconds: 	 <p>Specifies how long a traffic phase should be. For custom load tests, the value should be between 120 and 3600. This value should not exceed <code>JobDurationInSeconds</code>.</p>
+    """
+
+    initial_number_of_users: Optional[int] = Unassigned()
+    spawn_rate: Optional[int] = Unassigned()
+    duration_in_seconds: Optional[int] = Unassigned()
+
+
+class Stairs(Base):
+    """
+    Stairs
+         <p>Defines the stairs traffic pattern for an Inference Recommender load test. This pattern type consists of multiple steps where the number of users increases at each step.</p> <p>Specify either the stairs or phases traffic pattern.</p>
+
+        Attributes
+       ----------------------
+       duration_in_seconds: 	 <p>Defines how long each traffic step should be.</p>
+       number_of_steps: 	 <p>Specifies how many steps to perform during traffic.</p>
+       users_per_step: 	 <p>Specifies how many new users to spawn in each step.</p>
+    """
+
+    duration_in_seconds: Optional[int] = Unassigned()
+    number_of_steps: Optional[int] = Unassigned()
+    users_per_step: Optional[int] = Unassigned()
+
+
+class TrafficPattern(Base):
+    """
+    TrafficPattern
+         <p>Defines the traffic pattern of the load test.</p>
+
+        Attributes
+       ----------------------
+       traffic_type: 	 <p>Defines the traffic patterns. Choose either <code>PHASES</code> or <code>STAIRS</code>.</p>
+       phases: 	 <p>Defines the phases traffic specification.</p>
+       stairs: 	 <p>Defines the stairs traffic pattern.</p>
+    """
+
+    traffic_type: Optional[str] = Unassigned()
+    phases: Optional[List[Phase]] = Unassigned()
+    stairs: Optional[Stairs] = Unassigned()
+
+
+class RecommendationJobResourceLimit(Base):
+    """
+    RecommendationJobResourceLimit
+         <p>Specifies the maximum number of jobs that can run in parallel and the maximum number of jobs that can run.</p>
+
+        Attributes
+       ----------------------
+       max_number_of_tests: 	 <p>Defines the maximum number of load tests.</p>
+       max_parallel_of_tests: 	 <p>Defines the maximum number of parallel load tests.</p>
+    """
+
+    max_number_of_tests: Optional[int] = Unassigned()
+    max_parallel_of_tests: Optional[int] = Unassigned()
+
+
+class EnvironmentParameterRanges(Base):
+    """
+    EnvironmentParameterRanges
+         <p>Specifies the range of environment parameters</p>
+
+        Attributes
+       ----------------------
+       categorical_parameter_ranges: 	 <p>Specified a list of parameters for each category.</p>
+    """
+
+    categorical_parameter_ranges: Optional[List[CategoricalParameter]] = Unassigned()
+
+
+class EndpointInputConfiguration(Base):
+    """
+    EndpointInputConfiguration
+         <p>The endpoint configuration for the load test.</p>
+
+        Attributes
+       ----------------------
+       instance_type: 	 <p>The instance types to use for the load test.</p>
+       serverless_config
+       inference_specification_name: 	 <p>The inference specification name in the model package version.</p>
+       environment_parameter_ranges: 	 <p> The parameter you want to benchmark against.</p>
+    """
+
+    instance_type: Optional[str] = Unassigned()
+    serverless_config: Optional[ProductionVariantServerlessConfig] = Unassigned()
+    inference_specification_name: Optional[str] = Unassigned()
+    environment_parameter_ranges: Optional[EnvironmentParameterRanges] = Unassigned()
+
+
+class RecommendationJobPayloadConfig(Base):
+    """
+    RecommendationJobPayloadConfig
+         <p>The configuration for the payload for a recommendation job.</p>
+
+        Attributes
+       ----------------------
+       sample_payload_url: 	 <p>The Amazon Simple Storage Service (Amazon S3) path where the sample payload is stored. This path must point to a single gzip compressed tar archive (.tar.gz suffix).</p>
+       supported_content_types: 	 <p>The supported MIME types for the input data.</p>
+    """
+
+    sample_payload_url: Optional[str] = Unassigned()
+    supported_content_types: Optional[List[str]] = Unassigned()
+
+
+class RecommendationJobContainerConfig(Base):
+    """
+    RecommendationJobContainerConfig
+         <p>Specifies mandatory fields for running an Inference Recommender job directly in the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateInferenceRecommendationsJob.html">CreateInferenceRecommendationsJob</a> API. The fields specified in <code>ContainerConfig</code> override the corresponding fields in the model package. Use <code>ContainerConfig</code> if you want to specify these fields for the recommendation job but don't want to edit them in your model package.</p>
+
+        Attributes
+       ----------------------
+       domain: 	 <p>The machine learning domain of the model and its components.</p> <p>Valid Values: <code>COMPUTER_VISION | NATURAL_LANGUAGE_PROCESSING | MACHINE_LEARNING</code> </p>
+       task: 	 <p>The machine learning task that the model accomplishes.</p> <p>Valid Values: <code>IMAGE_CLASSIFICATION | OBJECT_DETECTION | TEXT_GENERATION | IMAGE_SEGMENTATION | FILL_MASK | CLASSIFICATION | REGRESSION | OTHER</code> </p>
+       framework: 	 <p>The machine learning framework of the container image.</p> <p>Valid Values: <code>TENSORFLOW | PYTORCH | XGBOOST | SAGEMAKER-SCIKIT-LEARN</code> </p>
+       framework_version: 	 <p>The framework version of the container image.</p>
+       payload_config: 	 <p>Specifies the <code>SamplePayloadUrl</code> and all other sample payload-related fields.</p>
+       nearest_model_name: 	 <p>The name of a pre-trained machine learning model benchmarked by Amazon SageMaker Inference Recommender that matches your model.</p> <p>Valid Values: <code>efficientnetb7 | unet | xgboost | faster-rcnn-resnet101 | nasnetlarge | vgg16 | inception-v3 | mask-rcnn | sagemaker-scikit-learn | densenet201-gluon | resnet18v2-gluon | xception | densenet201 | yolov4 | resnet152 | bert-base-cased | xceptionV1-keras | resnet50 | retinanet</code> </p>
+       supported_instance_types: 	 <p>A list of the instance types that are used to generate inferences in real-time.</p>
+       supported_endpoint_type: 	 <p>The endpoint type to receive recommendations for. By default this is null, and the results of the inference recommendation job return a combined list of both real-time and serverless benchmarks. By specifying a value for this field, you can receive a longer list of benchmarks for the desired endpoint type.</p>
+       data_input_config: 	 <p>Specifies the name and shape of the expected data inputs for your trained model with a JSON dictionary form. This field is used for optimizing your model using SageMaker Neo. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_InputConfig.html#sagemaker-Type-InputConfig-DataInputConfig">DataInputConfig</a>.</p>
+       supported_response_m_i_m_e_types: 	 <p>The supported MIME types for the output data.</p>
+    """
+
+    domain: Optional[str] = Unassigned()
+    task: Optional[str] = Unassigned()
+    framework: Optional[str] = Unassigned()
+    framework_version: Optional[str] = Unassigned()
+    payload_config: Optional[RecommendationJobPayloadConfig] = Unassigned()
+    nearest_model_name: Optional[str] = Unassigned()
+    supported_instance_types: Optional[List[str]] = Unassigned()
+    supported_endpoint_type: Optional[str] = Unassigned()
+    data_input_config: Optional[str] = Unassigned()
+    supported_response_m_i_m_e_types: Optional[List[str]] = Unassigned()
+
+
+class EndpointInfo(Base):
+    """
+    EndpointInfo
+         <p>Details about a customer endpoint that was compared in an Inference Recommender job.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The name of a customer's endpoint.</p>
+    """
+
+    endpoint_name: Optional[str] = Unassigned()
+
+
+class RecommendationJobVpcConfig(Base):
+    """
+    RecommendationJobVpcConfig
+         <p>Inference Recommender provisions SageMaker endpoints with access to VPC in the inference recommendation job.</p>
+
+        Attributes
+       ----------------------
+       security_group_ids: 	 <p>The VPC security group IDs. IDs have the form of <code>sg-xxxxxxxx</code>. Specify the security groups for the VPC that is specified in the <code>Subnets</code> field.</p>
+       subnets: 	 <p>The ID of the subnets in the VPC to which you want to connect your model.</p>
+    """
+
+    security_group_ids: List[str]
+    subnets: List[str]
+
+
+class RecommendationJobInputConfig(Base):
+    """
+    RecommendationJobInputConfig
+         <p>The input configuration of the recommendation job.</p>
+
+        Attributes
+       ----------------------
+       model_package_version_arn: 	 <p>The Amazon Resource Name (ARN) of a versioned model package.</p>
+       model_name: 	 <p>The name of the created model.</p>
+       job_duration_in_seconds: 	 <p>Specifies the maximum duration of the job, in seconds. The maximum value is 18,000 seconds.</p>
+       traffic_pattern: 	 <p>Specifies the traffic pattern of the job.</p>
+       resource_limit: 	 <p>Defines the resource limit of the job.</p>
+       endpoint_configurations: 	 <p>Specifies the endpoint configuration to use for a job.</p>
+       volume_kms_key_id: 	 <p>The Amazon Resource Name (ARN) of a Amazon Web Services Key Management Service (Amazon Web Services KMS) key that Amazon SageMaker uses to encrypt data on the storage volume attached to the ML compute instance that hosts the endpoint. This key will be passed to SageMaker Hosting for endpoint creation. </p> <p>The SageMaker execution role must have <code>kms:CreateGrant</code> permission in order to encrypt data on the storage volume of the endpoints created for inference recommendation. The inference recommendation job will fail asynchronously during endpoint configuration creation if the role passed does not have <code>kms:CreateGrant</code> permission.</p> <p>The <code>KmsKeyId</code> can be any of the following formats:</p> <ul> <li> <p>// KMS Key ID</p> <p> <code>"1234abcd-12ab-34cd-56ef-1234567890ab"</code> </p> </li> <li> <p>// Amazon Resource Name (ARN) of a KMS Key</p> <p> <code>"arn:aws:kms:&lt;region&gt;:&lt;account&gt;:key/&lt;key-id-12ab-34cd-56ef-1234567890ab&gt;"</code> </p> </li> <li> <p>// KMS Key Alias</p> <p> <code>"alias/ExampleAlias"</code> </p> </li> <li> <p>// Amazon Resource Name (ARN) of a KMS Key Alias</p> <p> <code>"arn:aws:kms:&lt;region&gt;:&lt;account&gt;:alias/&lt;ExampleAlias&gt;"</code> </p> </li> </ul> <p>For more information about key identifiers, see <a href="https://docs.aws.amazon.com/kms/latest/developerguide/concepts.html#key-id-key-id">Key identifiers (KeyID)</a> in the Amazon Web Services Key Management Service (Amazon Web Services KMS) documentation.</p>
+       container_config: 	 <p>Specifies mandatory fields for running an Inference Recommender job. The fields specified in <code>ContainerConfig</code> override the corresponding fields in the model package.</p>
+       endpoints: 	 <p>Existing customer endpoints on which to run an Inference Recommender job.</p>
+       vpc_config: 	 <p>Inference Recommender provisions SageMaker endpoints with access to VPC in the inference recommendation job.</p>
+    """
+
+    model_package_version_arn: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    job_duration_in_seconds: Optional[int] = Unassigned()
+    traffic_pattern: Optional[TrafficPattern] = Unassigned()
+    resource_limit: Optional[RecommendationJobResourceLimit] = Unassigned()
+    endpoint_configurations: Optional[List[EndpointInputConfiguration]] = Unassigned()
+    volume_kms_key_id: Optional[str] = Unassigned()
+    container_config: Optional[RecommendationJobContainerConfig] = Unassigned()
+    endpoints: Optional[List[EndpointInfo]] = Unassigned()
+    vpc_config: Optional[RecommendationJobVpcConfig] = Unassigned()
+
+
+class ModelLatencyThreshold(Base):
+    """
+    ModelLatencyThreshold
+         <p>The model latency threshold.</p>
+
+        Attributes
+       ----------------------
+       percentile: 	 <p>The model latency percentile threshold. Acceptable values are <code>P95</code> and <code>P99</code>. For custom load tests, specify the value as <code>P95</code>.</p>
+       value_in_milliseconds: 	 <p>The model latency percentile value in milliseconds.</p>
+    """
+
+    percentile: Optional[str] = Unassigned()
+    value_in_milliseconds: Optional[int] = Unassigned()
+
+
+class RecommendationJobStoppingConditions(Base):
+    """
+    RecommendationJobStoppingConditions
+         <p>Specifies conditions for stopping a job. When a job reaches a stopping condition limit, SageMaker ends the job.</p>
+
+        Attributes
+       ----------------------
+       max_invocations: 	 <p>The maximum number of requests per minute expected for the endpoint.</p>
+       model_latency_thresholds: 	 <p>The interval of time taken by a model to respond as viewed from SageMaker. The interval includes the local communication time taken to send the request and to fetch the response from the container of a model and the time taken to complete the inference in the container.</p>
+       flat_invocations: 	 <p>Stops a load test when the number of invocations (TPS) peaks and flattens, which means that the instance has reached capacity. The default value is <code>Stop</code>. If you want the load test to continue after invocations have flattened, set the value to <code>Continue</code>.</p>
+    """
+
+    max_invocations: Optional[int] = Unassigned()
+    model_latency_thresholds: Optional[List[ModelLatencyThreshold]] = Unassigned()
+    flat_invocations: Optional[str] = Unassigned()
+
+
+class RecommendationJobCompiledOutputConfig(Base):
+    """
+    RecommendationJobCompiledOutputConfig
+         <p>Provides information about the output configuration for the compiled model.</p>
+
+        Attributes
+       ----------------------
+       s3_output_uri: 	 <p>Identifies the Amazon S3 bucket where you want SageMaker to store the compiled model artifacts.</p>
+    """
+
+    s3_output_uri: Optional[str] = Unassigned()
+
+
+class RecommendationJobOutputConfig(Base):
+    """
+    RecommendationJobOutputConfig
+         <p>Provides information about the output configuration for the compiled model.</p>
+
+        Attributes
+       ----------------------
+       kms_key_id: 	 <p>The Amazon Resource Name (ARN) of a Amazon Web Services Key Management Service (Amazon Web Services KMS) key that Amazon SageMaker uses to encrypt your output artifacts with Amazon S3 server-side encryption. The SageMaker execution role must have <code>kms:GenerateDataKey</code> permission.</p> <p>The <code>KmsKeyId</code> can be any of the following formats:</p> <ul> <li> <p>// KMS Key ID</p> <p> <code>"1234abcd-12ab-34cd-56ef-1234567890ab"</code> </p> </li> <li> <p>// Amazon Resource Name (ARN) of a KMS Key</p> <p> <code>"arn:aws:kms:&lt;region&gt;:&lt;account&gt;:key/&lt;key-id-12ab-34cd-56ef-1234567890ab&gt;"</code> </p> </li> <li> <p>// KMS Key Alias</p> <p> <code>"alias/ExampleAlias"</code> </p> </li> <li> <p>// Amazon Resource Name (ARN) of a KMS Key Alias</p> <p> <code>"arn:aws:kms:&lt;region&gt;:&lt;account&gt;:alias/&lt;ExampleAlias&gt;"</code> </p> </li> </ul> <p>For more information about key identifiers, see <a href="https://docs.aws.amazon.com/kms/latest/developerguide/concepts.html#key-id-key-id">Key identifiers (KeyID)</a> in the Amazon Web Services Key Management Service (Amazon Web Services KMS) documentation.</p>
+       compiled_output_config: 	 <p>Provides information about the output configuration for the compiled model.</p>
+    """
+
+    kms_key_id: Optional[str] = Unassigned()
+    compiled_output_config: Optional[RecommendationJobCompiledOutputConfig] = (
+        Unassigned()
+    )
+
+
+class RecommendationMetrics(Base):
+    """
+    RecommendationMetrics
+         <p>The metrics of recommendations.</p>
+
+        Attributes
+       ----------------------
+       cost_per_hour: 	 <p>Defines the cost per hour for the instance. </p>
+       cost_per_inference: 	 <p>Defines the cost per inference for the instance .</p>
+       max_invocations: 	 <p>The expected maximum number of requests per minute for the instance.</p>
+       model_latency: 	 <p>The expected model latency at maximum invocation per minute for the instance.</p>
+       cpu_utilization: 	 <p>The expected CPU utilization at maximum invocations per minute for the instance.</p> <p> <code>NaN</code> indicates that the value is not available.</p>
+       memory_utilization: 	 <p>The expected memory utilization at maximum invocations per minute for the instance.</p> <p> <code>NaN</code> indicates that the value is not available.</p>
+       model_setup_time: 	 <p>The time it takes to launch new compute resources for a serverless endpoint. The time can vary depending on the model size, how long it takes to download the model, and the start-up time of the container.</p> <p> <code>NaN</code> indicates that the value is not available.</p>
+    """
+
+    cost_per_hour: float
+    cost_per_inference: float
+    max_invocations: int
+    model_latency: int
+    cpu_utilization: Optional[float] = Unassigned()
+    memory_utilization: Optional[float] = Unassigned()
+    model_setup_time: Optional[int] = Unassigned()
+
+
+class EndpointOutputConfiguration(Base):
+    """
+    EndpointOutputConfiguration
+         <p>The endpoint configuration made by Inference Recommender during a recommendation job.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The name of the endpoint made during a recommendation job.</p>
+       variant_name: 	 <p>The name of the production variant (deployed model) made during a recommendation job.</p>
+       instance_type: 	 <p>The instance type recommended by Amazon SageMaker Inference Recommender.</p>
+       initial_instance_count: 	 <p>The number of instances recommended to launch initially.</p>
+       serverless_config
+    """
+
+    endpoint_name: str
+    variant_name: str
+    instance_type: Optional[str] = Unassigned()
+    initial_instance_count: Optional[int] = Unassigned()
+    serverless_config: Optional[ProductionVariantServerlessConfig] = Unassigned()
+
+
+class EnvironmentParameter(Base):
+    """
+    EnvironmentParameter
+         <p>A list of environment parameters suggested by the Amazon SageMaker Inference Recommender.</p>
+
+        Attributes
+       ----------------------
+       key: 	 <p>The environment key suggested by the Amazon SageMaker Inference Recommender.</p>
+       value_type: 	 <p>The value type suggested by the Amazon SageMaker Inference Recommender.</p>
+       value: 	 <p>The value suggested by the Amazon SageMaker Inference Recommender.</p>
+    """
+
+    key: str
+    value_type: str
+    value: str
+
+
+class ModelConfiguration(Base):
+    """
+    ModelConfiguration
+         <p>Defines the model configuration. Includes the specification name and environment parameters.</p>
+
+        Attributes
+       ----------------------
+       inference_specification_name: 	 <p>The inference specification name in the model package version.</p>
+       environment_parameters: 	 <p>Defines the environment parameters that includes key, value types, and values.</p>
+       compilation_job_name: 	 <p>The name of the compilation job used to create the recommended model artifacts.</p>
+    """
+
+    inference_specification_name: Optional[str] = Unassigned()
+    environment_parameters: Optional[List[EnvironmentParameter]] = Unassigned()
+    compilation_job_name: Optional[str] = Unassigned()
+
+
+class InferenceRecommendation(Base):
+    """
+    InferenceRecommendation
+         <p>A list of recommendations made by Amazon SageMaker Inference Recommender.</p>
+
+        Attributes
+       ----------------------
+       recommendation_id: 	 <p>The recommendation ID which uniquely identifies each recommendation.</p>
+       metrics: 	 <p>The metrics used to decide what recommendation to make.</p>
+       endpoint_configuration: 	 <p>Defines the endpoint configuration parameters.</p>
+       model_configuration: 	 <p>Defines the model configuration.</p>
+       invocation_end_time: 	 <p>A timestamp that shows when the benchmark completed.</p>
+       invocation_start_time: 	 <p>A timestamp that shows when the benchmark started.</p>
+    """
+
+    metrics: RecommendationMetrics
+    endpoint_configuration: EndpointOutputConfiguration
+    model_configuration: ModelConfiguration
+    recommendation_id: Optional[str] = Unassigned()
+    invocation_end_time: Optional[datetime.datetime] = Unassigned()
+    invocation_start_time: Optional[datetime.datetime] = Unassigned()
+
+
+class InferenceMetrics(Base):
+    """
+    InferenceMetrics
+         <p>The metrics for an existing endpoint compared in an Inference Recommender job.</p>
+
+        Attributes
+       ----------------------
+       max_invocations: 	 <p>The expected maximum number of requests per minute for the instance.</p>
+       model_latency: 	 <p>The expected model latency at maximum invocations per minute for the instance.</p>
+    """
+
+    max_invocations: int
+    model_latency: int
+
+
+class EndpointPerformance(Base):
+    """
+    EndpointPerformance
+         <p>The performance results from running an Inference Recommender job on an existing endpoint.</p>
+
+        Attributes
+       ----------------------
+       metrics: 	 <p>The metrics for an existing endpoint.</p>
+       endpoint_info
+    """
+
+    metrics: InferenceMetrics
+    endpoint_info: EndpointInfo
+
+
+class InferenceRecommendationsJob(Base):
+    """
+    InferenceRecommendationsJob
+         <p>A structure that contains a list of recommendation jobs.</p>
+
+        Attributes
+       ----------------------
+       job_name: 	 <p>The name of the job.</p>
+       job_description: 	 <p>The job description.</p>
+       job_type: 	 <p>The recommendation job type.</p>
+       job_arn: 	 <p>The Amazon Resource Name (ARN) of the recommendation job.</p>
+       status: 	 <p>The status of the job.</p>
+       creation_time: 	 <p>A timestamp that shows when the job was created.</p>
+       completion_time: 	 <p>A timestamp that shows when the job completed.</p>
+       role_arn: 	 <p>The Amazon Resource Name (ARN) of an IAM role that enables Amazon SageMaker to perform tasks on your behalf.</p>
+       last_modified_time: 	 <p>A timestamp that shows when the job was last modified.</p>
+       failure_reason: 	 <p>If the job fails, provides information why the job failed.</p>
+       model_name: 	 <p>The name of the created model.</p>
+       sample_payload_url: 	 <p>The Amazon Simple Storage Service (Amazon S3) path where the sample payload is stored. This path must point to a single gzip compressed tar archive (.tar.gz suffix).</p>
+       model_package_version_arn: 	 <p>The Amazon Resource Name (ARN) of a versioned model package.</p>
+    """
+
+    job_name: str
+    job_description: str
+    job_type: str
+    job_arn: str
+    status: str
+    creation_time: datetime.datetime
+    role_arn: str
+    last_modified_time: datetime.datetime
+    completion_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    sample_payload_url: Optional[str] = Unassigned()
+    model_package_version_arn: Optional[str] = Unassigned()
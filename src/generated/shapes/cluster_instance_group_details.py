@@ -0,0 +1,99 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ClusterLifeCycleConfig(Base):
+    """
+    ClusterLifeCycleConfig
+         <p>The LifeCycle configuration for a SageMaker HyperPod cluster.</p>
+
+        Attributes
+       ----------------------
+       source_s3_uri: 	 <p>An Amazon S3 bucket path where your LifeCycle scripts are stored.</p>
+       on_create: 	 <p>The directory of the LifeCycle script under <code>SourceS3Uri</code>. This LifeCycle script runs during cluster creation.</p>
+    """
+
+    source_s3_uri: str
+    on_create: str
+
+
+class ClusterInstanceGroupDetails(Base):
+    """
+    ClusterInstanceGroupDetails
+         <p>Details of an instance group in a SageMaker HyperPod cluster.</p>
+
+        Attributes
+       ----------------------
+       current_count: 	 <p>The number of instances that are currently in the instance group of a SageMaker HyperPod cluster.</p>
+       target_count: 	 <p>The number of instances you specified to add to the instance group of a SageMaker HyperPod cluster.</p>
+       instance_group_name: 	 <p>The name of the instance group of a SageMaker HyperPod cluster.</p>
+       instance_type: 	 <p>The instance type of the instance group of a SageMaker HyperPod cluster.</p>
+       life_cycle_config: 	 <p>Details of LifeCycle configuration for the instance group.</p>
+       execution_role: 	 <p>The execution role for the instance group to assume.</p>
+       threads_per_core: 	 <p>The number you specified to <code>TreadsPerCore</code> in <code>CreateCluster</code> for enabling or disabling multithreading. For instance types that support multithreading, you can specify 1 for disabling multithreading and 2 for enabling multithreading. For more information, see the reference table of <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/cpu-options-supported-instances-values.html">CPU cores and threads per CPU core per instance type</a> in the <i>Amazon Elastic Compute Cloud User Guide</i>.</p>
+    """
+
+    current_count: Optional[int] = Unassigned()
+    target_count: Optional[int] = Unassigned()
+    instance_group_name: Optional[str] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    life_cycle_config: Optional[ClusterLifeCycleConfig] = Unassigned()
+    execution_role: Optional[str] = Unassigned()
+    threads_per_core: Optional[int] = Unassigned()
+
+
+class ClusterInstanceGroupSpecification(Base):
+    """
+    ClusterInstanceGroupSpecification
+         <p>The specifications of an instance group that you need to define.</p>
+
+        Attributes
+       ----------------------
+       instance_count: 	 <p>Specifies the number of instances to add to the instance group of a SageMaker HyperPod cluster.</p>
+       instance_group_name: 	 <p>Specifies the name of the instance group.</p>
+       instance_type: 	 <p>Specifies the instance type of the instance group.</p>
+       life_cycle_config: 	 <p>Specifies the LifeCycle configuration for the instance group.</p>
+       execution_role: 	 <p>Specifies an IAM execution role to be assumed by the instance group.</p>
+       threads_per_core: 	 <p>Specifies the value for <b>Threads per core</b>. For instance types that support multithreading, you can specify <code>1</code> for disabling multithreading and <code>2</code> for enabling multithreading. For instance types that doesn't support multithreading, specify <code>1</code>. For more information, see the reference table of <a href="https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/cpu-options-supported-instances-values.html">CPU cores and threads per CPU core per instance type</a> in the <i>Amazon Elastic Compute Cloud User Guide</i>.</p>
+    """
+
+    instance_count: int
+    instance_group_name: str
+    instance_type: str
+    life_cycle_config: ClusterLifeCycleConfig
+    execution_role: str
+    threads_per_core: Optional[int] = Unassigned()
+
+
+class ClusterSummary(Base):
+    """
+    ClusterSummary
+         <p>Lists a summary of the properties of a SageMaker HyperPod cluster.</p>
+
+        Attributes
+       ----------------------
+       cluster_arn: 	 <p>The Amazon Resource Name (ARN) of the SageMaker HyperPod cluster.</p>
+       cluster_name: 	 <p>The name of the SageMaker HyperPod cluster.</p>
+       creation_time: 	 <p>The time when the SageMaker HyperPod cluster is created.</p>
+       cluster_status: 	 <p>The status of the SageMaker HyperPod cluster.</p>
+    """
+
+    cluster_arn: str
+    cluster_name: str
+    creation_time: datetime.datetime
+    cluster_status: str
@@ -0,0 +1,32 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ClusterInstanceStatusDetails(Base):
+    """
+    ClusterInstanceStatusDetails
+         <p>Details of an instance in a SageMaker HyperPod cluster.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>The status of an instance in a SageMaker HyperPod cluster.</p>
+       message: 	 <p>The message from an instance in a SageMaker HyperPod cluster.</p>
+    """
+
+    status: str
+    message: Optional[str] = Unassigned()
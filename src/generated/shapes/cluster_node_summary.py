@@ -0,0 +1,39 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .cluster_instance_status_details import ClusterInstanceStatusDetails
+
+
+class ClusterNodeSummary(Base):
+    """
+    ClusterNodeSummary
+         <p>Lists a summary of the properties of an instance (also called a <i>node</i> interchangeably) of a SageMaker HyperPod cluster.</p>
+
+        Attributes
+       ----------------------
+       instance_group_name: 	 <p>The name of the instance group in which the instance is.</p>
+       instance_id: 	 <p>The ID of the instance.</p>
+       instance_type: 	 <p>The type of the instance.</p>
+       launch_time: 	 <p>The time when the instance is launched.</p>
+       instance_status: 	 <p>The status of the instance.</p>
+    """
+
+    instance_group_name: str
+    instance_id: str
+    instance_type: str
+    launch_time: datetime.datetime
+    instance_status: ClusterInstanceStatusDetails
@@ -0,0 +1,82 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .resource_spec import ResourceSpec
+
+
+class CodeRepository(Base):
+    """
+    CodeRepository
+         <p>A Git repository that SageMaker automatically displays to users for cloning in the JupyterServer application.</p>
+
+        Attributes
+       ----------------------
+       repository_url: 	 <p>The URL of the Git repository.</p>
+    """
+
+    repository_url: str
+
+
+class JupyterServerAppSettings(Base):
+    """
+    JupyterServerAppSettings
+         <p>The JupyterServer app settings.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec: 	 <p>The default instance type and the Amazon Resource Name (ARN) of the default SageMaker image used by the JupyterServer app. If you use the <code>LifecycleConfigArns</code> parameter, then this parameter is also required.</p>
+       lifecycle_config_arns: 	 <p> The Amazon Resource Name (ARN) of the Lifecycle Configurations attached to the JupyterServerApp. If you use this parameter, the <code>DefaultResourceSpec</code> parameter is also required.</p> <note> <p>To remove a Lifecycle Config, you must set <code>LifecycleConfigArns</code> to an empty list.</p> </note>
+       code_repositories: 	 <p>A list of Git repositories that SageMaker automatically displays to users for cloning in the JupyterServer application.</p>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    lifecycle_config_arns: Optional[List[str]] = Unassigned()
+    code_repositories: Optional[List[CodeRepository]] = Unassigned()
+
+
+class CustomImage(Base):
+    """
+    CustomImage
+         <p>A custom SageMaker image. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/studio-byoi.html">Bring your own SageMaker image</a>.</p>
+
+        Attributes
+       ----------------------
+       image_name: 	 <p>The name of the CustomImage. Must be unique to your account.</p>
+       image_version_number: 	 <p>The version number of the CustomImage.</p>
+       app_image_config_name: 	 <p>The name of the AppImageConfig.</p>
+    """
+
+    image_name: str
+    app_image_config_name: str
+    image_version_number: Optional[int] = Unassigned()
+
+
+class KernelGatewayAppSettings(Base):
+    """
+    KernelGatewayAppSettings
+         <p>The KernelGateway app settings.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec: 	 <p>The default instance type and the Amazon Resource Name (ARN) of the default SageMaker image used by the KernelGateway app.</p> <note> <p>The Amazon SageMaker Studio UI does not use the default instance type value set here. The default instance type set here is used when Apps are created using the CLI or CloudFormation and the instance type parameter value is not passed.</p> </note>
+       custom_images: 	 <p>A list of custom SageMaker images that are configured to run as a KernelGateway app.</p>
+       lifecycle_config_arns: 	 <p> The Amazon Resource Name (ARN) of the Lifecycle Configurations attached to the the user profile or domain.</p> <note> <p>To remove a Lifecycle Config, you must set <code>LifecycleConfigArns</code> to an empty list.</p> </note>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    custom_images: Optional[List[CustomImage]] = Unassigned()
+    lifecycle_config_arns: Optional[List[str]] = Unassigned()
@@ -0,0 +1,39 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .git_config import GitConfig
+
+
+class CodeRepositorySummary(Base):
+    """
+    CodeRepositorySummary
+         <p>Specifies summary information about a Git repository.</p>
+
+        Attributes
+       ----------------------
+       code_repository_name: 	 <p>The name of the Git repository.</p>
+       code_repository_arn: 	 <p>The Amazon Resource Name (ARN) of the Git repository.</p>
+       creation_time: 	 <p>The date and time that the Git repository was created.</p>
+       last_modified_time: 	 <p>The date and time that the Git repository was last modified.</p>
+       git_config: 	 <p>Configuration details for the Git repository, including the URL where it is located and the ARN of the Amazon Web Services Secrets Manager secret that contains the credentials used to access the repository.</p>
+    """
+
+    code_repository_name: str
+    code_repository_arn: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    git_config: Optional[GitConfig] = Unassigned()
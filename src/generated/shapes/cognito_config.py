@@ -0,0 +1,166 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class CognitoConfig(Base):
+    """
+    CognitoConfig
+         <p>Use this parameter to configure your Amazon Cognito workforce. A single Cognito workforce is created using and corresponds to a single <a href="https://docs.aws.amazon.com/cognito/latest/developerguide/cognito-user-identity-pools.html"> Amazon Cognito user pool</a>.</p>
+
+        Attributes
+       ----------------------
+       user_pool: 	 <p>A <a href="https://docs.aws.amazon.com/cognito/latest/developerguide/cognito-user-identity-pools.html"> user pool</a> is a user directory in Amazon Cognito. With a user pool, your users can sign in to your web or mobile app through Amazon Cognito. Your users can also sign in through social identity providers like Google, Facebook, Amazon, or Apple, and through SAML identity providers.</p>
+       client_id: 	 <p>The client ID for your Amazon Cognito user pool.</p>
+    """
+
+    user_pool: str
+    client_id: str
+
+
+class OidcConfig(Base):
+    """
+    OidcConfig
+         <p>Use this parameter to configure your OIDC Identity Provider (IdP).</p>
+
+        Attributes
+       ----------------------
+       client_id: 	 <p>The OIDC IdP client ID used to configure your private workforce.</p>
+       client_secret: 	 <p>The OIDC IdP client secret used to configure your private workforce.</p>
+       issuer: 	 <p>The OIDC IdP issuer used to configure your private workforce.</p>
+       authorization_endpoint: 	 <p>The OIDC IdP authorization endpoint used to configure your private workforce.</p>
+       token_endpoint: 	 <p>The OIDC IdP token endpoint used to configure your private workforce.</p>
+       user_info_endpoint: 	 <p>The OIDC IdP user information endpoint used to configure your private workforce.</p>
+       logout_endpoint: 	 <p>The OIDC IdP logout endpoint used to configure your private workforce.</p>
+       jwks_uri: 	 <p>The OIDC IdP JSON Web Key Set (Jwks) URI used to configure your private workforce.</p>
+    """
+
+    client_id: str
+    client_secret: str
+    issuer: str
+    authorization_endpoint: str
+    token_endpoint: str
+    user_info_endpoint: str
+    logout_endpoint: str
+    jwks_uri: str
+
+
+class SourceIpConfig(Base):
+    """
+    SourceIpConfig
+         <p>A list of IP address ranges (<a href="https://docs.aws.amazon.com/vpc/latest/userguide/VPC_Subnets.html">CIDRs</a>). Used to create an allow list of IP addresses for a private workforce. Workers will only be able to login to their worker portal from an IP address within this range. By default, a workforce isn't restricted to specific IP addresses.</p>
+
+        Attributes
+       ----------------------
+       cidrs: 	 <p>A list of one to ten <a href="https://docs.aws.amazon.com/vpc/latest/userguide/VPC_Subnets.html">Classless Inter-Domain Routing</a> (CIDR) values.</p> <p>Maximum: Ten CIDR values</p> <note> <p>The following Length Constraints apply to individual CIDR values in the CIDR value list.</p> </note>
+    """
+
+    cidrs: List[str]
+
+
+class WorkforceVpcConfigRequest(Base):
+    """
+    WorkforceVpcConfigRequest
+         <p>The VPC object you use to create or update a workforce.</p>
+
+        Attributes
+       ----------------------
+       vpc_id: 	 <p>The ID of the VPC that the workforce uses for communication.</p>
+       security_group_ids: 	 <p>The VPC security group IDs, in the form sg-xxxxxxxx. The security groups must be for the same VPC as specified in the subnet.</p>
+       subnets: 	 <p>The ID of the subnets in the VPC that you want to connect.</p>
+    """
+
+    vpc_id: Optional[str] = Unassigned()
+    security_group_ids: Optional[List[str]] = Unassigned()
+    subnets: Optional[List[str]] = Unassigned()
+
+
+class OidcConfigForResponse(Base):
+    """
+    OidcConfigForResponse
+         <p>Your OIDC IdP workforce configuration.</p>
+
+        Attributes
+       ----------------------
+       client_id: 	 <p>The OIDC IdP client ID used to configure your private workforce.</p>
+       issuer: 	 <p>The OIDC IdP issuer used to configure your private workforce.</p>
+       authorization_endpoint: 	 <p>The OIDC IdP authorization endpoint used to configure your private workforce.</p>
+       token_endpoint: 	 <p>The OIDC IdP token endpoint used to configure your private workforce.</p>
+       user_info_endpoint: 	 <p>The OIDC IdP user information endpoint used to configure your private workforce.</p>
+       logout_endpoint: 	 <p>The OIDC IdP logout endpoint used to configure your private workforce.</p>
+       jwks_uri: 	 <p>The OIDC IdP JSON Web Key Set (Jwks) URI used to configure your private workforce.</p>
+    """
+
+    client_id: Optional[str] = Unassigned()
+    issuer: Optional[str] = Unassigned()
+    authorization_endpoint: Optional[str] = Unassigned()
+    token_endpoint: Optional[str] = Unassigned()
+    user_info_endpoint: Optional[str] = Unassigned()
+    logout_endpoint: Optional[str] = Unassigned()
+    jwks_uri: Optional[str] = Unassigned()
+
+
+class WorkforceVpcConfigResponse(Base):
+    """
+    WorkforceVpcConfigResponse
+         <p>A VpcConfig object that specifies the VPC that you want your workforce to connect to.</p>
+
+        Attributes
+       ----------------------
+       vpc_id: 	 <p>The ID of the VPC that the workforce uses for communication.</p>
+       security_group_ids: 	 <p>The VPC security group IDs, in the form sg-xxxxxxxx. The security groups must be for the same VPC as specified in the subnet.</p>
+       subnets: 	 <p>The ID of the subnets in the VPC that you want to connect.</p>
+       vpc_endpoint_id: 	 <p>The IDs for the VPC service endpoints of your VPC workforce when it is created and updated.</p>
+    """
+
+    vpc_id: str
+    security_group_ids: List[str]
+    subnets: List[str]
+    vpc_endpoint_id: Optional[str] = Unassigned()
+
+
+class Workforce(Base):
+    """
+    Workforce
+         <p>A single private workforce, which is automatically created when you create your first private work team. You can create one private work force in each Amazon Web Services Region. By default, any workforce-related API operation used in a specific region will apply to the workforce created in that region. To learn how to create a private workforce, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sms-workforce-create-private.html">Create a Private Workforce</a>.</p>
+
+        Attributes
+       ----------------------
+       workforce_name: 	 <p>The name of the private workforce.</p>
+       workforce_arn: 	 <p>The Amazon Resource Name (ARN) of the private workforce.</p>
+       last_updated_date: 	 <p>The most recent date that <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_UpdateWorkforce.html">UpdateWorkforce</a> was used to successfully add one or more IP address ranges (<a href="https://docs.aws.amazon.com/vpc/latest/userguide/VPC_Subnets.html">CIDRs</a>) to a private workforce's allow list.</p>
+       source_ip_config: 	 <p>A list of one to ten IP address ranges (<a href="https://docs.aws.amazon.com/vpc/latest/userguide/VPC_Subnets.html">CIDRs</a>) to be added to the workforce allow list. By default, a workforce isn't restricted to specific IP addresses.</p>
+       sub_domain: 	 <p>The subdomain for your OIDC Identity Provider.</p>
+       cognito_config: 	 <p>The configuration of an Amazon Cognito workforce. A single Cognito workforce is created using and corresponds to a single <a href="https://docs.aws.amazon.com/cognito/latest/developerguide/cognito-user-identity-pools.html"> Amazon Cognito user pool</a>.</p>
+       oidc_config: 	 <p>The configuration of an OIDC Identity Provider (IdP) private workforce.</p>
+       create_date: 	 <p>The date that the workforce is created.</p>
+       workforce_vpc_config: 	 <p>The configuration of a VPC workforce.</p>
+       status: 	 <p>The status of your workforce.</p>
+       failure_reason: 	 <p>The reason your workforce failed.</p>
+    """
+
+    workforce_name: str
+    workforce_arn: str
+    last_updated_date: Optional[datetime.datetime] = Unassigned()
+    source_ip_config: Optional[SourceIpConfig] = Unassigned()
+    sub_domain: Optional[str] = Unassigned()
+    cognito_config: Optional[CognitoConfig] = Unassigned()
+    oidc_config: Optional[OidcConfigForResponse] = Unassigned()
+    create_date: Optional[datetime.datetime] = Unassigned()
+    workforce_vpc_config: Optional[WorkforceVpcConfigResponse] = Unassigned()
+    status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
@@ -0,0 +1,167 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class CognitoMemberDefinition(Base):
+    """
+    CognitoMemberDefinition
+         <p>Identifies a Amazon Cognito user group. A user group can be used in on or more work teams.</p>
+
+        Attributes
+       ----------------------
+       user_pool: 	 <p>An identifier for a user pool. The user pool must be in the same region as the service that you are calling.</p>
+       user_group: 	 <p>An identifier for a user group.</p>
+       client_id: 	 <p>An identifier for an application client. You must create the app client ID using Amazon Cognito.</p>
+    """
+
+    user_pool: str
+    user_group: str
+    client_id: str
+
+
+class OidcMemberDefinition(Base):
+    """
+    OidcMemberDefinition
+         <p>A list of user groups that exist in your OIDC Identity Provider (IdP). One to ten groups can be used to create a single private work team. When you add a user group to the list of <code>Groups</code>, you can add that user group to one or more private work teams. If you add a user group to a private work team, all workers in that user group are added to the work team.</p>
+
+        Attributes
+       ----------------------
+       groups: 	 <p>A list of comma seperated strings that identifies user groups in your OIDC IdP. Each user group is made up of a group of private workers.</p>
+    """
+
+    groups: Optional[List[str]] = Unassigned()
+
+
+class MemberDefinition(Base):
+    """
+    MemberDefinition
+         <p>Defines an Amazon Cognito or your own OIDC IdP user group that is part of a work team.</p>
+
+        Attributes
+       ----------------------
+       cognito_member_definition: 	 <p>The Amazon Cognito user group that is part of the work team.</p>
+       oidc_member_definition: 	 <p>A list user groups that exist in your OIDC Identity Provider (IdP). One to ten groups can be used to create a single private work team. When you add a user group to the list of <code>Groups</code>, you can add that user group to one or more private work teams. If you add a user group to a private work team, all workers in that user group are added to the work team.</p>
+    """
+
+    cognito_member_definition: Optional[CognitoMemberDefinition] = Unassigned()
+    oidc_member_definition: Optional[OidcMemberDefinition] = Unassigned()
+
+
+class NotificationConfiguration(Base):
+    """
+    NotificationConfiguration
+         <p>Configures Amazon SNS notifications of available or expiring work items for work teams.</p>
+
+        Attributes
+       ----------------------
+       notification_topic_arn: 	 <p>The ARN for the Amazon SNS topic to which notifications should be published.</p>
+    """
+
+    notification_topic_arn: Optional[str] = Unassigned()
+
+
+class SubscribedWorkteam(Base):
+    """
+    SubscribedWorkteam
+         <p>Describes a work team of a vendor that does the a labelling job.</p>
+
+        Attributes
+       ----------------------
+       workteam_arn: 	 <p>The Amazon Resource Name (ARN) of the vendor that you have subscribed.</p>
+       marketplace_title: 	 <p>The title of the service provided by the vendor in the Amazon Marketplace.</p>
+       seller_name: 	 <p>The name of the vendor in the Amazon Marketplace.</p>
+       marketplace_description: 	 <p>The description of the vendor from the Amazon Marketplace.</p>
+       listing_id: 	 <p>Marketplace product listing ID.</p>
+    """
+
+    workteam_arn: str
+    marketplace_title: Optional[str] = Unassigned()
+    seller_name: Optional[str] = Unassigned()
+    marketplace_description: Optional[str] = Unassigned()
+    listing_id: Optional[str] = Unassigned()
+
+
+class Workteam(Base):
+    """
+    Workteam
+         <p>Provides details about a labeling work team.</p>
+
+        Attributes
+       ----------------------
+       workteam_name: 	 <p>The name of the work team.</p>
+       member_definitions: 	 <p>A list of <code>MemberDefinition</code> objects that contains objects that identify the workers that make up the work team. </p> <p>Workforces can be created using Amazon Cognito or your own OIDC Identity Provider (IdP). For private workforces created using Amazon Cognito use <code>CognitoMemberDefinition</code>. For workforces created using your own OIDC identity provider (IdP) use <code>OidcMemberDefinition</code>.</p>
+       workteam_arn: 	 <p>The Amazon Resource Name (ARN) that identifies the work team.</p>
+       workforce_arn: 	 <p>The Amazon Resource Name (ARN) of the workforce.</p>
+       product_listing_ids: 	 <p>The Amazon Marketplace identifier for a vendor's work team.</p>
+       description: 	 <p>A description of the work team.</p>
+       sub_domain: 	 <p>The URI of the labeling job's user interface. Workers open this URI to start labeling your data objects.</p>
+       create_date: 	 <p>The date and time that the work team was created (timestamp).</p>
+       last_updated_date: 	 <p>The date and time that the work team was last updated (timestamp).</p>
+       notification_configuration: 	 <p>Configures SNS notifications of available or expiring work items for work teams.</p>
+    """
+
+    workteam_name: str
+    member_definitions: List[MemberDefinition]
+    workteam_arn: str
+    description: str
+    workforce_arn: Optional[str] = Unassigned()
+    product_listing_ids: Optional[List[str]] = Unassigned()
+    sub_domain: Optional[str] = Unassigned()
+    create_date: Optional[datetime.datetime] = Unassigned()
+    last_updated_date: Optional[datetime.datetime] = Unassigned()
+    notification_configuration: Optional[NotificationConfiguration] = Unassigned()
+
+
+class LabelCountersForWorkteam(Base):
+    """
+    LabelCountersForWorkteam
+         <p>Provides counts for human-labeled tasks in the labeling job.</p>
+
+        Attributes
+       ----------------------
+       human_labeled: 	 <p>The total number of data objects labeled by a human worker.</p>
+       pending_human: 	 <p>The total number of data objects that need to be labeled by a human worker.</p>
+       total: 	 <p>The total number of tasks in the labeling job.</p>
+    """
+
+    human_labeled: Optional[int] = Unassigned()
+    pending_human: Optional[int] = Unassigned()
+    total: Optional[int] = Unassigned()
+
+
+class LabelingJobForWorkteamSummary(Base):
+    """
+    LabelingJobForWorkteamSummary
+         <p>Provides summary information for a work team.</p>
+
+        Attributes
+       ----------------------
+       labeling_job_name: 	 <p>The name of the labeling job that the work team is assigned to.</p>
+       job_reference_code: 	 <p>A unique identifier for a labeling job. You can use this to refer to a specific labeling job.</p>
+       work_requester_account_id: 	 <p>The Amazon Web Services account ID of the account used to start the labeling job.</p>
+       creation_time: 	 <p>The date and time that the labeling job was created.</p>
+       label_counters: 	 <p>Provides information about the progress of a labeling job.</p>
+       number_of_human_workers_per_data_object: 	 <p>The configured number of workers per data object.</p>
+    """
+
+    job_reference_code: str
+    work_requester_account_id: str
+    creation_time: datetime.datetime
+    labeling_job_name: Optional[str] = Unassigned()
+    label_counters: Optional[LabelCountersForWorkteam] = Unassigned()
+    number_of_human_workers_per_data_object: Optional[int] = Unassigned()
@@ -0,0 +1,277 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class VectorConfig(Base):
+    """
+    VectorConfig
+         <p>Configuration for your vector collection type.</p>
+
+        Attributes
+       ----------------------
+       dimension: 	 <p>The number of elements in your vector.</p>
+    """
+
+    dimension: int
+
+
+class CollectionConfig(Base):
+    """
+    CollectionConfig
+         <p>Configuration for your collection.</p>
+
+        Attributes
+       ----------------------
+       vector_config: 	 <p>Configuration for your vector collection type.</p> <ul> <li> <p> <code>Dimension</code>: The number of elements in your vector.</p> </li> </ul>
+    """
+
+    vector_config: Optional[VectorConfig] = Unassigned()
+
+
+class FeatureDefinition(Base):
+    """
+    FeatureDefinition
+         <p>A list of features. You must include <code>FeatureName</code> and <code>FeatureType</code>. Valid feature <code>FeatureType</code>s are <code>Integral</code>, <code>Fractional</code> and <code>String</code>. </p>
+
+        Attributes
+       ----------------------
+       feature_name: 	 <p>The name of a feature. The type must be a string. <code>FeatureName</code> cannot be any of the following: <code>is_deleted</code>, <code>write_time</code>, <code>api_invocation_time</code>.</p> <p>The name:</p> <ul> <li> <p>Must start and end with an alphanumeric character.</p> </li> <li> <p>Can only include alphanumeric characters, underscores, and hyphens. Spaces are not allowed.</p> </li> </ul>
+       feature_type: 	 <p>The value type of a feature. Valid values are Integral, Fractional, or String.</p>
+       collection_type: 	 <p>A grouping of elements where each element within the collection must have the same feature type (<code>String</code>, <code>Integral</code>, or <code>Fractional</code>).</p> <ul> <li> <p> <code>List</code>: An ordered collection of elements.</p> </li> <li> <p> <code>Set</code>: An unordered collection of unique elements.</p> </li> <li> <p> <code>Vector</code>: A specialized list that represents a fixed-size array of elements. The vector dimension is determined by you. Must have elements with fractional feature types. </p> </li> </ul>
+       collection_config: 	 <p>Configuration for your collection.</p>
+    """
+
+    feature_name: str
+    feature_type: str
+    collection_type: Optional[str] = Unassigned()
+    collection_config: Optional[CollectionConfig] = Unassigned()
+
+
+class OnlineStoreSecurityConfig(Base):
+    """
+    OnlineStoreSecurityConfig
+         <p>The security configuration for <code>OnlineStore</code>.</p>
+
+        Attributes
+       ----------------------
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (KMS) key ARN that SageMaker Feature Store uses to encrypt the Amazon S3 objects at rest using Amazon S3 server-side encryption.</p> <p>The caller (either user or IAM role) of <code>CreateFeatureGroup</code> must have below permissions to the <code>OnlineStore</code> <code>KmsKeyId</code>:</p> <ul> <li> <p> <code>"kms:Encrypt"</code> </p> </li> <li> <p> <code>"kms:Decrypt"</code> </p> </li> <li> <p> <code>"kms:DescribeKey"</code> </p> </li> <li> <p> <code>"kms:CreateGrant"</code> </p> </li> <li> <p> <code>"kms:RetireGrant"</code> </p> </li> <li> <p> <code>"kms:ReEncryptFrom"</code> </p> </li> <li> <p> <code>"kms:ReEncryptTo"</code> </p> </li> <li> <p> <code>"kms:GenerateDataKey"</code> </p> </li> <li> <p> <code>"kms:ListAliases"</code> </p> </li> <li> <p> <code>"kms:ListGrants"</code> </p> </li> <li> <p> <code>"kms:RevokeGrant"</code> </p> </li> </ul> <p>The caller (either user or IAM role) to all DataPlane operations (<code>PutRecord</code>, <code>GetRecord</code>, <code>DeleteRecord</code>) must have the following permissions to the <code>KmsKeyId</code>:</p> <ul> <li> <p> <code>"kms:Decrypt"</code> </p> </li> </ul>
+    """
+
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class TtlDuration(Base):
+    """
+    TtlDuration
+         <p>Time to live duration, where the record is hard deleted after the expiration time is reached; <code>ExpiresAt</code> = <code>EventTime</code> + <code>TtlDuration</code>. For information on HardDelete, see the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_feature_store_DeleteRecord.html">DeleteRecord</a> API in the Amazon SageMaker API Reference guide.</p>
+
+        Attributes
+       ----------------------
+       unit: 	 <p> <code>TtlDuration</code> time unit.</p>
+       value: 	 <p> <code>TtlDuration</code> time value.</p>
+    """
+
+    unit: Optional[str] = Unassigned()
+    value: Optional[int] = Unassigned()
+
+
+class OnlineStoreConfig(Base):
+    """
+    OnlineStoreConfig
+         <p>Use this to specify the Amazon Web Services Key Management Service (KMS) Key ID, or <code>KMSKeyId</code>, for at rest data encryption. You can turn <code>OnlineStore</code> on or off by specifying the <code>EnableOnlineStore</code> flag at General Assembly.</p> <p>The default value is <code>False</code>.</p>
+
+        Attributes
+       ----------------------
+       security_config: 	 <p>Use to specify KMS Key ID (<code>KMSKeyId</code>) for at-rest encryption of your <code>OnlineStore</code>.</p>
+       enable_online_store: 	 <p>Turn <code>OnlineStore</code> off by specifying <code>False</code> for the <code>EnableOnlineStore</code> flag. Turn <code>OnlineStore</code> on by specifying <code>True</code> for the <code>EnableOnlineStore</code> flag. </p> <p>The default value is <code>False</code>.</p>
+       ttl_duration: 	 <p>Time to live duration, where the record is hard deleted after the expiration time is reached; <code>ExpiresAt</code> = <code>EventTime</code> + <code>TtlDuration</code>. For information on HardDelete, see the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_feature_store_DeleteRecord.html">DeleteRecord</a> API in the Amazon SageMaker API Reference guide.</p>
+       storage_type: 	 <p>Option for different tiers of low latency storage for real-time data retrieval.</p> <ul> <li> <p> <code>Standard</code>: A managed low latency data store for feature groups.</p> </li> <li> <p> <code>InMemory</code>: A managed data store for feature groups that supports very low latency retrieval. </p> </li> </ul>
+    """
+
+    security_config: Optional[OnlineStoreSecurityConfig] = Unassigned()
+    enable_online_store: Optional[bool] = Unassigned()
+    ttl_duration: Optional[TtlDuration] = Unassigned()
+    storage_type: Optional[str] = Unassigned()
+
+
+class S3StorageConfig(Base):
+    """
+    S3StorageConfig
+         <p>The Amazon Simple Storage (Amazon S3) location and security configuration for <code>OfflineStore</code>.</p>
+
+        Attributes
+       ----------------------
+       s3_uri: 	 <p>The S3 URI, or location in Amazon S3, of <code>OfflineStore</code>.</p> <p>S3 URIs have a format similar to the following: <code>s3://example-bucket/prefix/</code>.</p>
+       kms_key_id: 	 <p>The Amazon Web Services Key Management Service (KMS) key ARN of the key used to encrypt any objects written into the <code>OfflineStore</code> S3 location.</p> <p>The IAM <code>roleARN</code> that is passed as a parameter to <code>CreateFeatureGroup</code> must have below permissions to the <code>KmsKeyId</code>:</p> <ul> <li> <p> <code>"kms:GenerateDataKey"</code> </p> </li> </ul>
+       resolved_output_s3_uri: 	 <p>The S3 path where offline records are written.</p>
+    """
+
+    s3_uri: str
+    kms_key_id: Optional[str] = Unassigned()
+    resolved_output_s3_uri: Optional[str] = Unassigned()
+
+
+class DataCatalogConfig(Base):
+    """
+    DataCatalogConfig
+         <p>The meta data of the Glue table which serves as data catalog for the <code>OfflineStore</code>. </p>
+
+        Attributes
+       ----------------------
+       table_name: 	 <p>The name of the Glue table.</p>
+       catalog: 	 <p>The name of the Glue table catalog.</p>
+       database: 	 <p>The name of the Glue table database.</p>
+    """
+
+    table_name: str
+    catalog: str
+    database: str
+
+
+class OfflineStoreConfig(Base):
+    """
+    OfflineStoreConfig
+         <p>The configuration of an <code>OfflineStore</code>.</p> <p>Provide an <code>OfflineStoreConfig</code> in a request to <code>CreateFeatureGroup</code> to create an <code>OfflineStore</code>.</p> <p>To encrypt an <code>OfflineStore</code> using at rest data encryption, specify Amazon Web Services Key Management Service (KMS) key ID, or <code>KMSKeyId</code>, in <code>S3StorageConfig</code>.</p>
+
+        Attributes
+       ----------------------
+       s3_storage_config: 	 <p>The Amazon Simple Storage (Amazon S3) location of <code>OfflineStore</code>.</p>
+       disable_glue_table_creation: 	 <p>Set to <code>True</code> to disable the automatic creation of an Amazon Web Services Glue table when configuring an <code>OfflineStore</code>. If set to <code>False</code>, Feature Store will name the <code>OfflineStore</code> Glue table following <a href="https://docs.aws.amazon.com/athena/latest/ug/tables-databases-columns-names.html">Athena's naming recommendations</a>.</p> <p>The default value is <code>False</code>.</p>
+       data_catalog_config: 	 <p>The meta data of the Glue table that is autogenerated when an <code>OfflineStore</code> is created. </p>
+       table_format: 	 <p>Format for the offline store table. Supported formats are Glue (Default) and <a href="https://iceberg.apache.org/">Apache Iceberg</a>.</p>
+    """
+
+    s3_storage_config: S3StorageConfig
+    disable_glue_table_creation: Optional[bool] = Unassigned()
+    data_catalog_config: Optional[DataCatalogConfig] = Unassigned()
+    table_format: Optional[str] = Unassigned()
+
+
+class ThroughputConfig(Base):
+    """
+    ThroughputConfig
+         <p>Used to set feature group throughput configuration. There are two modes: <code>ON_DEMAND</code> and <code>PROVISIONED</code>. With on-demand mode, you are charged for data reads and writes that your application performs on your feature group. You do not need to specify read and write throughput because Feature Store accommodates your workloads as they ramp up and down. You can switch a feature group to on-demand only once in a 24 hour period. With provisioned throughput mode, you specify the read and write capacity per second that you expect your application to require, and you are billed based on those limits. Exceeding provisioned throughput will result in your requests being throttled. </p> <p>Note: <code>PROVISIONED</code> throughput mode is supported only for feature groups that are offline-only, or use the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_OnlineStoreConfig.html#sagemaker-Type-OnlineStoreConfig-StorageType"> <code>Standard</code> </a> tier online store. </p>
+
+        Attributes
+       ----------------------
+       throughput_mode: 	 <p>The mode used for your feature group throughput: <code>ON_DEMAND</code> or <code>PROVISIONED</code>. </p>
+       provisioned_read_capacity_units: 	 <p> For provisioned feature groups with online store enabled, this indicates the read throughput you are billed for and can consume without throttling. </p> <p>This field is not applicable for on-demand feature groups. </p>
+       provisioned_write_capacity_units: 	 <p> For provisioned feature groups, this indicates the write throughput you are billed for and can consume without throttling. </p> <p>This field is not applicable for on-demand feature groups. </p>
+    """
+
+    throughput_mode: str
+    provisioned_read_capacity_units: Optional[int] = Unassigned()
+    provisioned_write_capacity_units: Optional[int] = Unassigned()
+
+
+class ThroughputConfigDescription(Base):
+    """
+    ThroughputConfigDescription
+         <p>Active throughput configuration of the feature group. There are two modes: <code>ON_DEMAND</code> and <code>PROVISIONED</code>. With on-demand mode, you are charged for data reads and writes that your application performs on your feature group. You do not need to specify read and write throughput because Feature Store accommodates your workloads as they ramp up and down. You can switch a feature group to on-demand only once in a 24 hour period. With provisioned throughput mode, you specify the read and write capacity per second that you expect your application to require, and you are billed based on those limits. Exceeding provisioned throughput will result in your requests being throttled. </p> <p>Note: <code>PROVISIONED</code> throughput mode is supported only for feature groups that are offline-only, or use the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_OnlineStoreConfig.html#sagemaker-Type-OnlineStoreConfig-StorageType"> <code>Standard</code> </a> tier online store. </p>
+
+        Attributes
+       ----------------------
+       throughput_mode: 	 <p>The mode used for your feature group throughput: <code>ON_DEMAND</code> or <code>PROVISIONED</code>. </p>
+       provisioned_read_capacity_units: 	 <p> For provisioned feature groups with online store enabled, this indicates the read throughput you are billed for and can consume without throttling. </p> <p>This field is not applicable for on-demand feature groups. </p>
+       provisioned_write_capacity_units: 	 <p> For provisioned feature groups, this indicates the write throughput you are billed for and can consume without throttling. </p> <p>This field is not applicable for on-demand feature groups. </p>
+    """
+
+    throughput_mode: str
+    provisioned_read_capacity_units: Optional[int] = Unassigned()
+    provisioned_write_capacity_units: Optional[int] = Unassigned()
+
+
+class OfflineStoreStatus(Base):
+    """
+    OfflineStoreStatus
+         <p>The status of <code>OfflineStore</code>.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>An <code>OfflineStore</code> status.</p>
+       blocked_reason: 	 <p>The justification for why the OfflineStoreStatus is Blocked (if applicable).</p>
+    """
+
+    status: str
+    blocked_reason: Optional[str] = Unassigned()
+
+
+class LastUpdateStatus(Base):
+    """
+    LastUpdateStatus
+         <p>A value that indicates whether the update was successful.</p>
+
+        Attributes
+       ----------------------
+       status: 	 <p>A value that indicates whether the update was made successful.</p>
+       failure_reason: 	 <p>If the update wasn't successful, indicates the reason why it failed.</p>
+    """
+
+    status: str
+    failure_reason: Optional[str] = Unassigned()
+
+
+class FeatureGroupSummary(Base):
+    """
+    FeatureGroupSummary
+         <p>The name, ARN, <code>CreationTime</code>, <code>FeatureGroup</code> values, <code>LastUpdatedTime</code> and <code>EnableOnlineStorage</code> status of a <code>FeatureGroup</code>.</p>
+
+        Attributes
+       ----------------------
+       feature_group_name: 	 <p>The name of <code>FeatureGroup</code>.</p>
+       feature_group_arn: 	 <p>Unique identifier for the <code>FeatureGroup</code>.</p>
+       creation_time: 	 <p>A timestamp indicating the time of creation time of the <code>FeatureGroup</code>.</p>
+       feature_group_status: 	 <p>The status of a FeatureGroup. The status can be any of the following: <code>Creating</code>, <code>Created</code>, <code>CreateFail</code>, <code>Deleting</code> or <code>DetailFail</code>. </p>
+       offline_store_status: 	 <p>Notifies you if replicating data into the <code>OfflineStore</code> has failed. Returns either: <code>Active</code> or <code>Blocked</code>.</p>
+    """
+
+    feature_group_name: str
+    feature_group_arn: str
+    creation_time: datetime.datetime
+    feature_group_status: Optional[str] = Unassigned()
+    offline_store_status: Optional[OfflineStoreStatus] = Unassigned()
+
+
+class OnlineStoreConfigUpdate(Base):
+    """
+    OnlineStoreConfigUpdate
+         <p>Updates the feature group online store configuration.</p>
+
+        Attributes
+       ----------------------
+       ttl_duration: 	 <p>Time to live duration, where the record is hard deleted after the expiration time is reached; <code>ExpiresAt</code> = <code>EventTime</code> + <code>TtlDuration</code>. For information on HardDelete, see the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_feature_store_DeleteRecord.html">DeleteRecord</a> API in the Amazon SageMaker API Reference guide.</p>
+    """
+
+    ttl_duration: Optional[TtlDuration] = Unassigned()
+
+
+class ThroughputConfigUpdate(Base):
+    """
+    ThroughputConfigUpdate
+         <p>The new throughput configuration for the feature group. You can switch between on-demand and provisioned modes or update the read / write capacity of provisioned feature groups. You can switch a feature group to on-demand only once in a 24 hour period. </p>
+
+        Attributes
+       ----------------------
+       throughput_mode: 	 <p>Target throughput mode of the feature group. Throughput update is an asynchronous operation, and the outcome should be monitored by polling <code>LastUpdateStatus</code> field in <code>DescribeFeatureGroup</code> response. You cannot update a feature group's throughput while another update is in progress. </p>
+       provisioned_read_capacity_units: 	 <p>For provisioned feature groups with online store enabled, this indicates the read throughput you are billed for and can consume without throttling. </p>
+       provisioned_write_capacity_units: 	 <p>For provisioned feature groups, this indicates the write throughput you are billed for and can consume without throttling. </p>
+    """
+
+    throughput_mode: Optional[str] = Unassigned()
+    provisioned_read_capacity_units: Optional[int] = Unassigned()
+    provisioned_write_capacity_units: Optional[int] = Unassigned()
@@ -0,0 +1,154 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .model_data_source import ModelDataSource
+
+
+class RepositoryAuthConfig(Base):
+    """
+    RepositoryAuthConfig
+         <p>Specifies an authentication configuration for the private docker registry where your model image is hosted. Specify a value for this property only if you specified <code>Vpc</code> as the value for the <code>RepositoryAccessMode</code> field of the <code>ImageConfig</code> object that you passed to a call to <code>CreateModel</code> and the private Docker registry where the model image is hosted requires authentication.</p>
+
+        Attributes
+       ----------------------
+       repository_credentials_provider_arn: 	 <p>The Amazon Resource Name (ARN) of an Amazon Web Services Lambda function that provides credentials to authenticate to the private Docker registry where your model image is hosted. For information about how to create an Amazon Web Services Lambda function, see <a href="https://docs.aws.amazon.com/lambda/latest/dg/getting-started-create-function.html">Create a Lambda function with the console</a> in the <i>Amazon Web Services Lambda Developer Guide</i>.</p>
+    """
+
+    repository_credentials_provider_arn: str
+
+
+class ImageConfig(Base):
+    """
+    ImageConfig
+         <p>Specifies whether the model container is in Amazon ECR or a private Docker registry accessible from your Amazon Virtual Private Cloud (VPC).</p>
+
+        Attributes
+       ----------------------
+       repository_access_mode: 	 <p>Set this to one of the following values:</p> <ul> <li> <p> <code>Platform</code> - The model image is hosted in Amazon ECR.</p> </li> <li> <p> <code>Vpc</code> - The model image is hosted in a private Docker registry in your VPC.</p> </li> </ul>
+       repository_auth_config: 	 <p>(Optional) Specifies an authentication configuration for the private docker registry where your model image is hosted. Specify a value for this property only if you specified <code>Vpc</code> as the value for the <code>RepositoryAccessMode</code> field, and the private Docker registry where the model image is hosted requires authentication.</p>
+    """
+
+    repository_access_mode: str
+    repository_auth_config: Optional[RepositoryAuthConfig] = Unassigned()
+
+
+class MultiModelConfig(Base):
+    """
+    MultiModelConfig
+         <p>Specifies additional configuration for hosting multi-model endpoints.</p>
+
+        Attributes
+       ----------------------
+       model_cache_setting: 	 <p>Whether to cache models for a multi-model endpoint. By default, multi-model endpoints cache models so that a model does not have to be loaded into memory each time it is invoked. Some use cases do not benefit from model caching. For example, if an endpoint hosts a large number of models that are each invoked infrequently, the endpoint might perform better if you disable model caching. To disable model caching, set the value of this parameter to <code>Disabled</code>.</p>
+    """
+
+    model_cache_setting: Optional[str] = Unassigned()
+
+
+class ContainerDefinition(Base):
+    """
+    ContainerDefinition
+         <p>Describes the container, as part of model definition.</p>
+
+        Attributes
+       ----------------------
+       container_hostname: 	 <p>This parameter is ignored for models that contain only a <code>PrimaryContainer</code>.</p> <p>When a <code>ContainerDefinition</code> is part of an inference pipeline, the value of the parameter uniquely identifies the container for the purposes of logging and metrics. For information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/inference-pipeline-logs-metrics.html">Use Logs and Metrics to Monitor an Inference Pipeline</a>. If you don't specify a value for this parameter for a <code>ContainerDefinition</code> that is part of an inference pipeline, a unique name is automatically assigned based on the position of the <code>ContainerDefinition</code> in the pipeline. If you specify a value for the <code>ContainerHostName</code> for any <code>ContainerDefinition</code> that is part of an inference pipeline, you must specify a value for the <code>ContainerHostName</code> parameter of every <code>ContainerDefinition</code> in that pipeline.</p>
+       image: 	 <p>The path where inference code is stored. This can be either in Amazon EC2 Container Registry or in a Docker registry that is accessible from the same VPC that you configure for your endpoint. If you are using your own custom algorithm instead of an algorithm provided by SageMaker, the inference code must meet SageMaker requirements. SageMaker supports both <code>registry/repository[:tag]</code> and <code>registry/repository[@digest]</code> image path formats. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms.html">Using Your Own Algorithms with Amazon SageMaker</a>. </p> <note> <p>The model artifacts in an Amazon S3 bucket and the Docker image for inference container in Amazon EC2 Container Registry must be in the same region as the model or endpoint you are creating.</p> </note>
+       image_config: 	 <p>Specifies whether the model container is in Amazon ECR or a private Docker registry accessible from your Amazon Virtual Private Cloud (VPC). For information about storing containers in a private Docker registry, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms-containers-inference-private.html">Use a Private Docker Registry for Real-Time Inference Containers</a>. </p> <note> <p>The model artifacts in an Amazon S3 bucket and the Docker image for inference container in Amazon EC2 Container Registry must be in the same region as the model or endpoint you are creating.</p> </note>
+       mode: 	 <p>Whether the container hosts a single model or multiple models.</p>
+       model_data_url: 	 <p>The S3 path where the model artifacts, which result from model training, are stored. This path must point to a single gzip compressed tar archive (.tar.gz suffix). The S3 path is required for SageMaker built-in algorithms, but not if you use your own algorithms. For more information on built-in algorithms, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-algo-docker-registry-paths.html">Common Parameters</a>. </p> <note> <p>The model artifacts must be in an S3 bucket that is in the same region as the model or endpoint you are creating.</p> </note> <p>If you provide a value for this parameter, SageMaker uses Amazon Web Services Security Token Service to download model artifacts from the S3 path you provide. Amazon Web Services STS is activated in your Amazon Web Services account by default. If you previously deactivated Amazon Web Services STS for a region, you need to reactivate Amazon Web Services STS for that region. For more information, see <a href="https://docs.aws.amazon.com/IAM/latest/UserGuide/id_credentials_temp_enable-regions.html">Activating and Deactivating Amazon Web Services STS in an Amazon Web Services Region</a> in the <i>Amazon Web Services Identity and Access Management User Guide</i>.</p> <important> <p>If you use a built-in algorithm to create a model, SageMaker requires that you provide a S3 path to the model artifacts in <code>ModelDataUrl</code>.</p> </important>
+       model_data_source: 	 <p>Specifies the location of ML model data to deploy.</p> <note> <p>Currently you cannot use <code>ModelDataSource</code> in conjunction with SageMaker batch transform, SageMaker serverless endpoints, SageMaker multi-model endpoints, and SageMaker Marketplace.</p> </note>
+       environment: 	 <p>The environment variables to set in the Docker container.</p> <p>The maximum length of each key and value in the <code>Environment</code> map is 1024 bytes. The maximum length of all keys and values in the map, combined, is 32 KB. If you pass multiple containers to a <code>CreateModel</code> request, then the maximum length of all of their maps, combined, is also 32 KB.</p>
+       model_package_name: 	 <p>The name or Amazon Resource Name (ARN) of the model package to use to create the model.</p>
+       inference_specification_name: 	 <p>The inference specification name in the model package version.</p>
+       multi_model_config: 	 <p>Specifies additional configuration for multi-model endpoints.</p>
+    """
+
+    container_hostname: Optional[str] = Unassigned()
+    image: Optional[str] = Unassigned()
+    image_config: Optional[ImageConfig] = Unassigned()
+    mode: Optional[str] = Unassigned()
+    model_data_url: Optional[str] = Unassigned()
+    model_data_source: Optional[ModelDataSource] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    model_package_name: Optional[str] = Unassigned()
+    inference_specification_name: Optional[str] = Unassigned()
+    multi_model_config: Optional[MultiModelConfig] = Unassigned()
+
+
+class InferenceExecutionConfig(Base):
+    """
+    InferenceExecutionConfig
+         <p>Specifies details about how containers in a multi-container endpoint are run.</p>
+
+        Attributes
+       ----------------------
+       mode: 	 <p>How containers in a multi-container are run. The following values are valid.</p> <ul> <li> <p> <code>SERIAL</code> - Containers run as a serial pipeline.</p> </li> <li> <p> <code>DIRECT</code> - Only the individual container that you specify is run.</p> </li> </ul>
+    """
+
+    mode: str
+
+
+class RealTimeInferenceRecommendation(Base):
+    """
+    RealTimeInferenceRecommendation
+         <p>The recommended configuration to use for Real-Time Inference.</p>
+
+        Attributes
+       ----------------------
+       recommendation_id: 	 <p>The recommendation ID which uniquely identifies each recommendation.</p>
+       instance_type: 	 <p>The recommended instance type for Real-Time Inference.</p>
+       environment: 	 <p>The recommended environment variables to set in the model container for Real-Time Inference.</p>
+    """
+
+    recommendation_id: str
+    instance_type: str
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class DeploymentRecommendation(Base):
+    """
+    DeploymentRecommendation
+         <p>A set of recommended deployment configurations for the model. To get more advanced recommendations, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateInferenceRecommendationsJob.html">CreateInferenceRecommendationsJob</a> to create an inference recommendation job.</p>
+
+        Attributes
+       ----------------------
+       recommendation_status: 	 <p>Status of the deployment recommendation. The status <code>NOT_APPLICABLE</code> means that SageMaker is unable to provide a default recommendation for the model using the information provided. If the deployment status is <code>IN_PROGRESS</code>, retry your API call after a few seconds to get a <code>COMPLETED</code> deployment recommendation.</p>
+       real_time_inference_recommendations: 	 <p>A list of <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_RealTimeInferenceRecommendation.html">RealTimeInferenceRecommendation</a> items.</p>
+    """
+
+    recommendation_status: str
+    real_time_inference_recommendations: Optional[
+        List[RealTimeInferenceRecommendation]
+    ] = Unassigned()
+
+
+class ModelSummary(Base):
+    """
+    ModelSummary
+         <p>Provides summary information about a model.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the model that you want a summary for.</p>
+       model_arn: 	 <p>The Amazon Resource Name (ARN) of the model.</p>
+       creation_time: 	 <p>A timestamp that indicates when the model was created.</p>
+    """
+
+    model_name: str
+    model_arn: str
+    creation_time: datetime.datetime
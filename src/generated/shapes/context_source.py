@@ -0,0 +1,57 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ContextSource(Base):
+    """
+    ContextSource
+         <p>A structure describing the source of a context.</p>
+
+        Attributes
+       ----------------------
+       source_uri: 	 <p>The URI of the source.</p>
+       source_type: 	 <p>The type of the source.</p>
+       source_id: 	 <p>The ID of the source.</p>
+    """
+
+    source_uri: str
+    source_type: Optional[str] = Unassigned()
+    source_id: Optional[str] = Unassigned()
+
+
+class ContextSummary(Base):
+    """
+    ContextSummary
+         <p>Lists a summary of the properties of a context. A context provides a logical grouping of other entities.</p>
+
+        Attributes
+       ----------------------
+       context_arn: 	 <p>The Amazon Resource Name (ARN) of the context.</p>
+       context_name: 	 <p>The name of the context.</p>
+       source: 	 <p>The source of the context.</p>
+       context_type: 	 <p>The type of the context.</p>
+       creation_time: 	 <p>When the context was created.</p>
+       last_modified_time: 	 <p>When the context was last modified.</p>
+    """
+
+    context_arn: Optional[str] = Unassigned()
+    context_name: Optional[str] = Unassigned()
+    source: Optional[ContextSource] = Unassigned()
+    context_type: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
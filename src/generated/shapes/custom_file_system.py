@@ -0,0 +1,224 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .code_repository import (
+    CodeRepository,
+    JupyterServerAppSettings,
+    KernelGatewayAppSettings,
+)
+from .resource_spec import ResourceSpec
+
+
+class SpaceCodeEditorAppSettings(Base):
+    """
+    SpaceCodeEditorAppSettings
+         <p>The application settings for a Code Editor space.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+
+
+class SpaceJupyterLabAppSettings(Base):
+    """
+    SpaceJupyterLabAppSettings
+         <p>The settings for the JupyterLab application within a space.</p>
+
+        Attributes
+       ----------------------
+       default_resource_spec
+       code_repositories: 	 <p>A list of Git repositories that SageMaker automatically displays to users for cloning in the JupyterLab application.</p>
+    """
+
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    code_repositories: Optional[List[CodeRepository]] = Unassigned()
+
+
+class EbsStorageSettings(Base):
+    """
+    EbsStorageSettings
+         <p>A collection of EBS storage settings that applies to private spaces.</p>
+
+        Attributes
+       ----------------------
+       ebs_volume_size_in_gb: 	 <p>The size of an EBS storage volume for a private space.</p>
+    """
+
+    ebs_volume_size_in_gb: int
+
+
+class SpaceStorageSettings(Base):
+    """
+    SpaceStorageSettings
+         <p>The storage settings for a private space.</p>
+
+        Attributes
+       ----------------------
+       ebs_storage_settings: 	 <p>A collection of EBS storage settings for a private space.</p>
+    """
+
+    ebs_storage_settings: Optional[EbsStorageSettings] = Unassigned()
+
+
+class EFSFileSystem(Base):
+    """
+    EFSFileSystem
+         <p>A file system, created by you in Amazon EFS, that you assign to a user profile or space for an Amazon SageMaker Domain. Permitted users can access this file system in Amazon SageMaker Studio.</p>
+
+        Attributes
+       ----------------------
+       file_system_id: 	 <p>The ID of your Amazon EFS file system.</p>
+    """
+
+    file_system_id: str
+
+
+class CustomFileSystem(Base):
+    """
+    CustomFileSystem
+         <p>A file system, created by you, that you assign to a user profile or space for an Amazon SageMaker Domain. Permitted users can access this file system in Amazon SageMaker Studio.</p>
+
+        Attributes
+       ----------------------
+       e_f_s_file_system: 	 <p>A custom file system in Amazon EFS.</p>
+    """
+
+    e_f_s_file_system: Optional[EFSFileSystem] = Unassigned()
+
+
+class SpaceSettings(Base):
+    """
+    SpaceSettings
+         <p>A collection of space settings.</p>
+
+        Attributes
+       ----------------------
+       jupyter_server_app_settings
+       kernel_gateway_app_settings
+       code_editor_app_settings: 	 <p>The Code Editor application settings.</p>
+       jupyter_lab_app_settings: 	 <p>The settings for the JupyterLab application.</p>
+       app_type: 	 <p>The type of app created within the space.</p>
+       space_storage_settings: 	 <p>The storage settings for a private space.</p>
+       custom_file_systems: 	 <p>A file system, created by you, that you assign to a space for an Amazon SageMaker Domain. Permitted users can access this file system in Amazon SageMaker Studio.</p>
+    """
+
+    jupyter_server_app_settings: Optional[JupyterServerAppSettings] = Unassigned()
+    kernel_gateway_app_settings: Optional[KernelGatewayAppSettings] = Unassigned()
+    code_editor_app_settings: Optional[SpaceCodeEditorAppSettings] = Unassigned()
+    jupyter_lab_app_settings: Optional[SpaceJupyterLabAppSettings] = Unassigned()
+    app_type: Optional[str] = Unassigned()
+    space_storage_settings: Optional[SpaceStorageSettings] = Unassigned()
+    custom_file_systems: Optional[List[CustomFileSystem]] = Unassigned()
+
+
+class OwnershipSettings(Base):
+    """
+    OwnershipSettings
+         <p>The collection of ownership settings for a space.</p>
+
+        Attributes
+       ----------------------
+       owner_user_profile_name: 	 <p>The user profile who is the owner of the private space.</p>
+    """
+
+    owner_user_profile_name: str
+
+
+class SpaceSharingSettings(Base):
+    """
+    SpaceSharingSettings
+         <p>A collection of space sharing settings.</p>
+
+        Attributes
+       ----------------------
+       sharing_type: 	 <p>Specifies the sharing type of the space.</p>
+    """
+
+    sharing_type: str
+
+
+class SpaceSettingsSummary(Base):
+    """
+    SpaceSettingsSummary
+         <p>Specifies summary information about the space settings.</p>
+
+        Attributes
+       ----------------------
+       app_type: 	 <p>The type of app created within the space.</p>
+       space_storage_settings: 	 <p>The storage settings for a private space.</p>
+    """
+
+    app_type: Optional[str] = Unassigned()
+    space_storage_settings: Optional[SpaceStorageSettings] = Unassigned()
+
+
+class SpaceSharingSettingsSummary(Base):
+    """
+    SpaceSharingSettingsSummary
+         <p>Specifies summary information about the space sharing settings.</p>
+
+        Attributes
+       ----------------------
+       sharing_type: 	 <p>Specifies the sharing type of the space.</p>
+    """
+
+    sharing_type: Optional[str] = Unassigned()
+
+
+class OwnershipSettingsSummary(Base):
+    """
+    OwnershipSettingsSummary
+         <p>Specifies summary information about the ownership settings.</p>
+
+        Attributes
+       ----------------------
+       owner_user_profile_name: 	 <p>The user profile who is the owner of the private space.</p>
+    """
+
+    owner_user_profile_name: Optional[str] = Unassigned()
+
+
+class SpaceDetails(Base):
+    """
+    SpaceDetails
+         <p>The space's details.</p>
+
+        Attributes
+       ----------------------
+       domain_id: 	 <p>The ID of the associated domain.</p>
+       space_name: 	 <p>The name of the space.</p>
+       status: 	 <p>The status.</p>
+       creation_time: 	 <p>The creation time.</p>
+       last_modified_time: 	 <p>The last modified time.</p>
+       space_settings_summary: 	 <p>Specifies summary information about the space settings.</p>
+       space_sharing_settings_summary: 	 <p>Specifies summary information about the space sharing settings.</p>
+       ownership_settings_summary: 	 <p>Specifies summary information about the ownership settings.</p>
+       space_display_name: 	 <p>The name of the space that appears in the Studio UI.</p>
+    """
+
+    domain_id: Optional[str] = Unassigned()
+    space_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    space_settings_summary: Optional[SpaceSettingsSummary] = Unassigned()
+    space_sharing_settings_summary: Optional[SpaceSharingSettingsSummary] = Unassigned()
+    ownership_settings_summary: Optional[OwnershipSettingsSummary] = Unassigned()
+    space_display_name: Optional[str] = Unassigned()
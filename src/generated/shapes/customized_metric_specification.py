@@ -0,0 +1,141 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class CustomizedMetricSpecification(Base):
+    """
+    CustomizedMetricSpecification
+         <p>A customized metric.</p>
+
+        Attributes
+       ----------------------
+       metric_name: 	 <p>The name of the customized metric.</p>
+       namespace: 	 <p>The namespace of the customized metric.</p>
+       statistic: 	 <p>The statistic of the customized metric.</p>
+    """
+
+    metric_name: Optional[str] = Unassigned()
+    namespace: Optional[str] = Unassigned()
+    statistic: Optional[str] = Unassigned()
+
+
+class PredefinedMetricSpecification(Base):
+    """
+    PredefinedMetricSpecification
+         <p>A specification for a predefined metric.</p>
+
+        Attributes
+       ----------------------
+       predefined_metric_type: 	 <p>The metric type. You can only apply SageMaker metric types to SageMaker endpoints.</p>
+    """
+
+    predefined_metric_type: Optional[str] = Unassigned()
+
+
+class MetricSpecification(Base):
+    """
+    MetricSpecification
+         <p>An object containing information about a metric.</p>
+
+        Attributes
+       ----------------------
+       predefined: 	 <p>Information about a predefined metric.</p>
+       customized: 	 <p>Information about a customized metric.</p>
+    """
+
+    predefined: Optional[PredefinedMetricSpecification] = Unassigned()
+    customized: Optional[CustomizedMetricSpecification] = Unassigned()
+
+
+class TargetTrackingScalingPolicyConfiguration(Base):
+    """
+    TargetTrackingScalingPolicyConfiguration
+         <p>A target tracking scaling policy. Includes support for predefined or customized metrics.</p> <p>When using the <a href="https://docs.aws.amazon.com/autoscaling/application/APIReference/API_PutScalingPolicy.html">PutScalingPolicy</a> API, this parameter is required when you are creating a policy with the policy type <code>TargetTrackingScaling</code>.</p>
+
+        Attributes
+       ----------------------
+       metric_specification: 	 <p>An object containing information about a metric.</p>
+       target_value: 	 <p>The recommended target value to specify for the metric when creating a scaling policy.</p>
+    """
+
+    metric_specification: Optional[MetricSpecification] = Unassigned()
+    target_value: Optional[float] = Unassigned()
+
+
+class ScalingPolicy(Base):
+    """
+    ScalingPolicy
+         <p>An object containing a recommended scaling policy.</p>
+
+        Attributes
+       ----------------------
+       target_tracking: 	 <p>A target tracking scaling policy. Includes support for predefined or customized metrics.</p>
+    """
+
+    target_tracking: Optional[TargetTrackingScalingPolicyConfiguration] = Unassigned()
+
+
+class DynamicScalingConfiguration(Base):
+    """
+    DynamicScalingConfiguration
+         <p>An object with the recommended values for you to specify when creating an autoscaling policy.</p>
+
+        Attributes
+       ----------------------
+       min_capacity: 	 <p>The recommended minimum capacity to specify for your autoscaling policy.</p>
+       max_capacity: 	 <p>The recommended maximum capacity to specify for your autoscaling policy.</p>
+       scale_in_cooldown: 	 <p>The recommended scale in cooldown time for your autoscaling policy.</p>
+       scale_out_cooldown: 	 <p>The recommended scale out cooldown time for your autoscaling policy.</p>
+       scaling_policies: 	 <p>An object of the scaling policies for each metric.</p>
+    """
+
+    min_capacity: Optional[int] = Unassigned()
+    max_capacity: Optional[int] = Unassigned()
+    scale_in_cooldown: Optional[int] = Unassigned()
+    scale_out_cooldown: Optional[int] = Unassigned()
+    scaling_policies: Optional[List[ScalingPolicy]] = Unassigned()
+
+
+class ScalingPolicyObjective(Base):
+    """
+    ScalingPolicyObjective
+         <p>An object where you specify the anticipated traffic pattern for an endpoint.</p>
+
+        Attributes
+       ----------------------
+       min_invocations_per_minute: 	 <p>The minimum number of expected requests to your endpoint per minute.</p>
+       max_invocations_per_minute: 	 <p>The maximum number of expected requests to your endpoint per minute.</p>
+    """
+
+    min_invocations_per_minute: Optional[int] = Unassigned()
+    max_invocations_per_minute: Optional[int] = Unassigned()
+
+
+class ScalingPolicyMetric(Base):
+    """
+    ScalingPolicyMetric
+         <p>The metric for a scaling policy.</p>
+
+        Attributes
+       ----------------------
+       invocations_per_instance: 	 <p>The number of invocations sent to a model, normalized by <code>InstanceCount</code> in each ProductionVariant. <code>1/numberOfInstances</code> is sent as the value on each request, where <code>numberOfInstances</code> is the number of active instances for the ProductionVariant behind the endpoint at the time of the request.</p>
+       model_latency: 	 <p>The interval of time taken by a model to respond as viewed from SageMaker. This interval includes the local communication times taken to send the request and to fetch the response from the container of a model and the time taken to complete the inference in the container.</p>
+    """
+
+    invocations_per_instance: Optional[int] = Unassigned()
+    model_latency: Optional[int] = Unassigned()
@@ -0,0 +1,78 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .batch_transform_input import (
+    BatchTransformInput,
+    EndpointInput,
+    MonitoringConstraintsResource,
+)
+from .monitoring_statistics_resource import MonitoringStatisticsResource
+
+
+class DataQualityBaselineConfig(Base):
+    """
+    DataQualityBaselineConfig
+         <p>Configuration for monitoring constraints and monitoring statistics. These baseline resources are compared against the results of the current job from the series of jobs scheduled to collect data periodically.</p>
+
+        Attributes
+       ----------------------
+       baselining_job_name: 	 <p>The name of the job that performs baselining for the data quality monitoring job.</p>
+       constraints_resource
+       statistics_resource
+    """
+
+    baselining_job_name: Optional[str] = Unassigned()
+    constraints_resource: Optional[MonitoringConstraintsResource] = Unassigned()
+    statistics_resource: Optional[MonitoringStatisticsResource] = Unassigned()
+
+
+class DataQualityAppSpecification(Base):
+    """
+    DataQualityAppSpecification
+         <p>Information about the container that a data quality monitoring job runs.</p>
+
+        Attributes
+       ----------------------
+       image_uri: 	 <p>The container image that the data quality monitoring job runs.</p>
+       container_entrypoint: 	 <p>The entrypoint for a container used to run a monitoring job.</p>
+       container_arguments: 	 <p>The arguments to send to the container that the monitoring job runs.</p>
+       record_preprocessor_source_uri: 	 <p>An Amazon S3 URI to a script that is called per row prior to running analysis. It can base64 decode the payload and convert it into a flattened JSON so that the built-in container can use the converted data. Applicable only for the built-in (first party) containers.</p>
+       post_analytics_processor_source_uri: 	 <p>An Amazon S3 URI to a script that is called after analysis has been performed. Applicable only for the built-in (first party) containers.</p>
+       environment: 	 <p>Sets the environment variables in the container that the monitoring job runs.</p>
+    """
+
+    image_uri: str
+    container_entrypoint: Optional[List[str]] = Unassigned()
+    container_arguments: Optional[List[str]] = Unassigned()
+    record_preprocessor_source_uri: Optional[str] = Unassigned()
+    post_analytics_processor_source_uri: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class DataQualityJobInput(Base):
+    """
+    DataQualityJobInput
+         <p>The input for the data quality monitoring job. Currently endpoints are supported for input.</p>
+
+        Attributes
+       ----------------------
+       endpoint_input
+       batch_transform_input: 	 <p>Input object for the batch transform job.</p>
+    """
+
+    endpoint_input: Optional[EndpointInput] = Unassigned()
+    batch_transform_input: Optional[BatchTransformInput] = Unassigned()
@@ -0,0 +1,171 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .code_repository import JupyterServerAppSettings, KernelGatewayAppSettings
+from .resource_spec import ResourceSpec
+
+
+class RStudioServerProDomainSettings(Base):
+    """
+    RStudioServerProDomainSettings
+         <p>A collection of settings that configure the <code>RStudioServerPro</code> Domain-level app.</p>
+
+        Attributes
+       ----------------------
+       domain_execution_role_arn: 	 <p>The ARN of the execution role for the <code>RStudioServerPro</code> Domain-level app.</p>
+       r_studio_connect_url: 	 <p>A URL pointing to an RStudio Connect server.</p>
+       r_studio_package_manager_url: 	 <p>A URL pointing to an RStudio Package Manager server.</p>
+       default_resource_spec
+    """
+
+    domain_execution_role_arn: str
+    r_studio_connect_url: Optional[str] = Unassigned()
+    r_studio_package_manager_url: Optional[str] = Unassigned()
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+
+
+class DockerSettings(Base):
+    """
+    DockerSettings
+         <p>A collection of settings that configure the domain's Docker interaction.</p>
+
+        Attributes
+       ----------------------
+       enable_docker_access: 	 <p>Indicates whether the domain can access Docker.</p>
+       vpc_only_trusted_accounts: 	 <p>The list of Amazon Web Services accounts that are trusted when the domain is created in VPC-only mode.</p>
+    """
+
+    enable_docker_access: Optional[str] = Unassigned()
+    vpc_only_trusted_accounts: Optional[List[str]] = Unassigned()
+
+
+class DomainSettings(Base):
+    """
+    DomainSettings
+         <p>A collection of settings that apply to the <code>SageMaker Domain</code>. These settings are specified through the <code>CreateDomain</code> API call.</p>
+
+        Attributes
+       ----------------------
+       security_group_ids: 	 <p>The security groups for the Amazon Virtual Private Cloud that the <code>Domain</code> uses for communication between Domain-level apps and user apps.</p>
+       r_studio_server_pro_domain_settings: 	 <p>A collection of settings that configure the <code>RStudioServerPro</code> Domain-level app.</p>
+       execution_role_identity_config: 	 <p>The configuration for attaching a SageMaker user profile name to the execution role as a <a href="https://docs.aws.amazon.com/IAM/latest/UserGuide/id_credentials_temp_control-access_monitor.html">sts:SourceIdentity key</a>.</p>
+       docker_settings: 	 <p>A collection of settings that configure the domain's Docker interaction.</p>
+    """
+
+    security_group_ids: Optional[List[str]] = Unassigned()
+    r_studio_server_pro_domain_settings: Optional[RStudioServerProDomainSettings] = (
+        Unassigned()
+    )
+    execution_role_identity_config: Optional[str] = Unassigned()
+    docker_settings: Optional[DockerSettings] = Unassigned()
+
+
+class DefaultSpaceSettings(Base):
+    """
+    DefaultSpaceSettings
+         <p>A collection of settings that apply to spaces created in the domain.</p>
+
+        Attributes
+       ----------------------
+       execution_role: 	 <p>The ARN of the execution role for the space.</p>
+       security_groups: 	 <p>The security group IDs for the Amazon VPC that the space uses for communication.</p>
+       jupyter_server_app_settings
+       kernel_gateway_app_settings
+    """
+
+    execution_role: Optional[str] = Unassigned()
+    security_groups: Optional[List[str]] = Unassigned()
+    jupyter_server_app_settings: Optional[JupyterServerAppSettings] = Unassigned()
+    kernel_gateway_app_settings: Optional[KernelGatewayAppSettings] = Unassigned()
+
+
+class RetentionPolicy(Base):
+    """
+    RetentionPolicy
+         <p>The retention policy for data stored on an Amazon Elastic File System volume.</p>
+
+        Attributes
+       ----------------------
+       home_efs_file_system: 	 <p>The default is <code>Retain</code>, which specifies to keep the data stored on the Amazon EFS volume.</p> <p>Specify <code>Delete</code> to delete the data stored on the Amazon EFS volume.</p>
+    """
+
+    home_efs_file_system: Optional[str] = Unassigned()
+
+
+class DomainDetails(Base):
+    """
+    DomainDetails
+         <p>The domain's details.</p>
+
+        Attributes
+       ----------------------
+       domain_arn: 	 <p>The domain's Amazon Resource Name (ARN).</p>
+       domain_id: 	 <p>The domain ID.</p>
+       domain_name: 	 <p>The domain name.</p>
+       status: 	 <p>The status.</p>
+       creation_time: 	 <p>The creation time.</p>
+       last_modified_time: 	 <p>The last modified time.</p>
+       url: 	 <p>The domain's URL.</p>
+    """
+
+    domain_arn: Optional[str] = Unassigned()
+    domain_id: Optional[str] = Unassigned()
+    domain_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    url: Optional[str] = Unassigned()
+
+
+class RStudioServerProDomainSettingsForUpdate(Base):
+    """
+    RStudioServerProDomainSettingsForUpdate
+         <p>A collection of settings that update the current configuration for the <code>RStudioServerPro</code> Domain-level app.</p>
+
+        Attributes
+       ----------------------
+       domain_execution_role_arn: 	 <p>The execution role for the <code>RStudioServerPro</code> Domain-level app.</p>
+       default_resource_spec
+       r_studio_connect_url: 	 <p>A URL pointing to an RStudio Connect server.</p>
+       r_studio_package_manager_url: 	 <p>A URL pointing to an RStudio Package Manager server.</p>
+    """
+
+    domain_execution_role_arn: str
+    default_resource_spec: Optional[ResourceSpec] = Unassigned()
+    r_studio_connect_url: Optional[str] = Unassigned()
+    r_studio_package_manager_url: Optional[str] = Unassigned()
+
+
+class DomainSettingsForUpdate(Base):
+    """
+    DomainSettingsForUpdate
+         <p>A collection of <code>Domain</code> configuration settings to update.</p>
+
+        Attributes
+       ----------------------
+       r_studio_server_pro_domain_settings_for_update: 	 <p>A collection of <code>RStudioServerPro</code> Domain-level app settings to update. A single <code>RStudioServerPro</code> application is created for a domain.</p>
+       execution_role_identity_config: 	 <p>The configuration for attaching a SageMaker user profile name to the execution role as a <a href="https://docs.aws.amazon.com/IAM/latest/UserGuide/id_credentials_temp_control-access_monitor.html">sts:SourceIdentity key</a>. This configuration can only be modified if there are no apps in the <code>InService</code> or <code>Pending</code> state.</p>
+       security_group_ids: 	 <p>The security groups for the Amazon Virtual Private Cloud that the <code>Domain</code> uses for communication between Domain-level apps and user apps.</p>
+       docker_settings: 	 <p>A collection of settings that configure the domain's Docker interaction.</p>
+    """
+
+    r_studio_server_pro_domain_settings_for_update: Optional[
+        RStudioServerProDomainSettingsForUpdate
+    ] = Unassigned()
+    execution_role_identity_config: Optional[str] = Unassigned()
+    security_group_ids: Optional[List[str]] = Unassigned()
+    docker_settings: Optional[DockerSettings] = Unassigned()
@@ -0,0 +1,66 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class DeviceSelectionConfig(Base):
+    """
+    DeviceSelectionConfig
+         <p>Contains information about the configurations of selected devices.</p>
+
+        Attributes
+       ----------------------
+       device_subset_type: 	 <p>Type of device subsets to deploy to the current stage.</p>
+       percentage: 	 <p>Percentage of devices in the fleet to deploy to the current stage.</p>
+       device_names: 	 <p>List of devices chosen to deploy.</p>
+       device_name_contains: 	 <p>A filter to select devices with names containing this name.</p>
+    """
+
+    device_subset_type: str
+    percentage: Optional[int] = Unassigned()
+    device_names: Optional[List[str]] = Unassigned()
+    device_name_contains: Optional[str] = Unassigned()
+
+
+class EdgeDeploymentConfig(Base):
+    """
+    EdgeDeploymentConfig
+         <p>Contains information about the configuration of a deployment.</p>
+
+        Attributes
+       ----------------------
+       failure_handling_policy: 	 <p>Toggle that determines whether to rollback to previous configuration if the current deployment fails. By default this is turned on. You may turn this off if you want to investigate the errors yourself.</p>
+    """
+
+    failure_handling_policy: str
+
+
+class DeploymentStage(Base):
+    """
+    DeploymentStage
+         <p>Contains information about a stage in an edge deployment plan.</p>
+
+        Attributes
+       ----------------------
+       stage_name: 	 <p>The name of the stage.</p>
+       device_selection_config: 	 <p>Configuration of the devices in the stage.</p>
+       deployment_config: 	 <p>Configuration of the deployment details.</p>
+    """
+
+    stage_name: str
+    device_selection_config: DeviceSelectionConfig
+    deployment_config: Optional[EdgeDeploymentConfig] = Unassigned()
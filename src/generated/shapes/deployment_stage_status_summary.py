@@ -0,0 +1,102 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .deployment_stage import DeviceSelectionConfig, EdgeDeploymentConfig
+
+
+class EdgeDeploymentModelConfig(Base):
+    """
+    EdgeDeploymentModelConfig
+         <p>Contains information about the configuration of a model in a deployment.</p>
+
+        Attributes
+       ----------------------
+       model_handle: 	 <p>The name the device application uses to reference this model.</p>
+       edge_packaging_job_name: 	 <p>The edge packaging job associated with this deployment.</p>
+    """
+
+    model_handle: str
+    edge_packaging_job_name: str
+
+
+class EdgeDeploymentStatus(Base):
+    """
+    EdgeDeploymentStatus
+         <p>Contains information summarizing the deployment stage results.</p>
+
+        Attributes
+       ----------------------
+       stage_status: 	 <p>The general status of the current stage.</p>
+       edge_deployment_success_in_stage: 	 <p>The number of edge devices with the successful deployment in the current stage.</p>
+       edge_deployment_pending_in_stage: 	 <p>The number of edge devices yet to pick up the deployment in current stage, or in progress.</p>
+       edge_deployment_failed_in_stage: 	 <p>The number of edge devices that failed the deployment in current stage.</p>
+       edge_deployment_status_message: 	 <p>A detailed message about deployment status in current stage.</p>
+       edge_deployment_stage_start_time: 	 <p>The time when the deployment API started.</p>
+    """
+
+    stage_status: str
+    edge_deployment_success_in_stage: int
+    edge_deployment_pending_in_stage: int
+    edge_deployment_failed_in_stage: int
+    edge_deployment_status_message: Optional[str] = Unassigned()
+    edge_deployment_stage_start_time: Optional[datetime.datetime] = Unassigned()
+
+
+class DeploymentStageStatusSummary(Base):
+    """
+    DeploymentStageStatusSummary
+         <p>Contains information summarizing the deployment stage results.</p>
+
+        Attributes
+       ----------------------
+       stage_name: 	 <p>The name of the stage.</p>
+       device_selection_config: 	 <p>Configuration of the devices in the stage.</p>
+       deployment_config: 	 <p>Configuration of the deployment details.</p>
+       deployment_status: 	 <p>General status of the current state.</p>
+    """
+
+    stage_name: str
+    device_selection_config: DeviceSelectionConfig
+    deployment_config: EdgeDeploymentConfig
+    deployment_status: EdgeDeploymentStatus
+
+
+class EdgeDeploymentPlanSummary(Base):
+    """
+    EdgeDeploymentPlanSummary
+         <p>Contains information summarizing an edge deployment plan.</p>
+
+        Attributes
+       ----------------------
+       edge_deployment_plan_arn: 	 <p>The ARN of the edge deployment plan.</p>
+       edge_deployment_plan_name: 	 <p>The name of the edge deployment plan.</p>
+       device_fleet_name: 	 <p>The name of the device fleet used for the deployment. </p>
+       edge_deployment_success: 	 <p>The number of edge devices with the successful deployment.</p>
+       edge_deployment_pending: 	 <p>The number of edge devices yet to pick up the deployment, or in progress.</p>
+       edge_deployment_failed: 	 <p>The number of edge devices that failed the deployment.</p>
+       creation_time: 	 <p>The time when the edge deployment plan was created.</p>
+       last_modified_time: 	 <p>The time when the edge deployment plan was last updated.</p>
+    """
+
+    edge_deployment_plan_arn: str
+    edge_deployment_plan_name: str
+    device_fleet_name: str
+    edge_deployment_success: int
+    edge_deployment_pending: int
+    edge_deployment_failed: int
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ProductionVariantServerlessUpdateConfig(Base):
+    """
+    ProductionVariantServerlessUpdateConfig
+         <p>Specifies the serverless update concurrency configuration for an endpoint variant.</p>
+
+        Attributes
+       ----------------------
+       max_concurrency: 	 <p>The updated maximum number of concurrent invocations your serverless endpoint can process.</p>
+       provisioned_concurrency: 	 <p>The updated amount of provisioned concurrency to allocate for the serverless endpoint. Should be less than or equal to <code>MaxConcurrency</code>.</p>
+    """
+
+    max_concurrency: Optional[int] = Unassigned()
+    provisioned_concurrency: Optional[int] = Unassigned()
+
+
+class DesiredWeightAndCapacity(Base):
+    """
+    DesiredWeightAndCapacity
+         <p>Specifies weight and capacity values for a production variant.</p>
+
+        Attributes
+       ----------------------
+       variant_name: 	 <p>The name of the variant to update.</p>
+       desired_weight: 	 <p>The variant's weight.</p>
+       desired_instance_count: 	 <p>The variant's capacity.</p>
+       serverless_update_config: 	 <p>Specifies the serverless update concurrency configuration for an endpoint variant.</p>
+    """
+
+    variant_name: str
+    desired_weight: Optional[float] = Unassigned()
+    desired_instance_count: Optional[int] = Unassigned()
+    serverless_update_config: Optional[ProductionVariantServerlessUpdateConfig] = (
+        Unassigned()
+    )
@@ -0,0 +1,111 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class Device(Base):
+    """
+    Device
+         <p>Information of a particular device.</p>
+
+        Attributes
+       ----------------------
+       device_name: 	 <p>The name of the device.</p>
+       description: 	 <p>Description of the device.</p>
+       iot_thing_name: 	 <p>Amazon Web Services Internet of Things (IoT) object name.</p>
+    """
+
+    device_name: str
+    description: Optional[str] = Unassigned()
+    iot_thing_name: Optional[str] = Unassigned()
+
+
+class DeviceDeploymentSummary(Base):
+    """
+    DeviceDeploymentSummary
+         <p>Contains information summarizing device details and deployment status.</p>
+
+        Attributes
+       ----------------------
+       edge_deployment_plan_arn: 	 <p>The ARN of the edge deployment plan.</p>
+       edge_deployment_plan_name: 	 <p>The name of the edge deployment plan.</p>
+       stage_name: 	 <p>The name of the stage in the edge deployment plan.</p>
+       deployed_stage_name: 	 <p>The name of the deployed stage.</p>
+       device_fleet_name: 	 <p>The name of the fleet to which the device belongs to.</p>
+       device_name: 	 <p>The name of the device.</p>
+       device_arn: 	 <p>The ARN of the device.</p>
+       device_deployment_status: 	 <p>The deployment status of the device.</p>
+       device_deployment_status_message: 	 <p>The detailed error message for the deployoment status result.</p>
+       description: 	 <p>The description of the device.</p>
+       deployment_start_time: 	 <p>The time when the deployment on the device started.</p>
+    """
+
+    edge_deployment_plan_arn: str
+    edge_deployment_plan_name: str
+    stage_name: str
+    device_name: str
+    device_arn: str
+    deployed_stage_name: Optional[str] = Unassigned()
+    device_fleet_name: Optional[str] = Unassigned()
+    device_deployment_status: Optional[str] = Unassigned()
+    device_deployment_status_message: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    deployment_start_time: Optional[datetime.datetime] = Unassigned()
+
+
+class EdgeModelSummary(Base):
+    """
+    EdgeModelSummary
+         <p>Summary of model on edge device.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the model.</p>
+       model_version: 	 <p>The version model.</p>
+    """
+
+    model_name: str
+    model_version: str
+
+
+class DeviceSummary(Base):
+    """
+    DeviceSummary
+         <p>Summary of the device.</p>
+
+        Attributes
+       ----------------------
+       device_name: 	 <p>The unique identifier of the device.</p>
+       device_arn: 	 <p>Amazon Resource Name (ARN) of the device.</p>
+       description: 	 <p>A description of the device.</p>
+       device_fleet_name: 	 <p>The name of the fleet the device belongs to.</p>
+       iot_thing_name: 	 <p>The Amazon Web Services Internet of Things (IoT) object thing name associated with the device..</p>
+       registration_time: 	 <p>The timestamp of the last registration or de-reregistration.</p>
+       latest_heartbeat: 	 <p>The last heartbeat received from the device.</p>
+       models: 	 <p>Models on the device.</p>
+       agent_version: 	 <p>Edge Manager agent version.</p>
+    """
+
+    device_name: str
+    device_arn: str
+    description: Optional[str] = Unassigned()
+    device_fleet_name: Optional[str] = Unassigned()
+    iot_thing_name: Optional[str] = Unassigned()
+    registration_time: Optional[datetime.datetime] = Unassigned()
+    latest_heartbeat: Optional[datetime.datetime] = Unassigned()
+    models: Optional[List[EdgeModelSummary]] = Unassigned()
+    agent_version: Optional[str] = Unassigned()
@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class DeviceFleetSummary(Base):
+    """
+    DeviceFleetSummary
+         <p>Summary of the device fleet.</p>
+
+        Attributes
+       ----------------------
+       device_fleet_arn: 	 <p>Amazon Resource Name (ARN) of the device fleet.</p>
+       device_fleet_name: 	 <p>Name of the device fleet.</p>
+       creation_time: 	 <p>Timestamp of when the device fleet was created.</p>
+       last_modified_time: 	 <p>Timestamp of when the device fleet was last updated.</p>
+    """
+
+    device_fleet_arn: str
+    device_fleet_name: str
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
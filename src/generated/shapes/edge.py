@@ -0,0 +1,76 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class Edge(Base):
+    """
+    Edge
+         <p>A directed edge connecting two lineage entities.</p>
+
+        Attributes
+       ----------------------
+       source_arn: 	 <p>The Amazon Resource Name (ARN) of the source lineage entity of the directed edge.</p>
+       destination_arn: 	 <p>The Amazon Resource Name (ARN) of the destination lineage entity of the directed edge.</p>
+       association_type: 	 <p>The type of the Association(Edge) between the source and destination. For example <code>ContributedTo</code>, <code>Produced</code>, or <code>DerivedFrom</code>.</p>
+    """
+
+    source_arn: Optional[str] = Unassigned()
+    destination_arn: Optional[str] = Unassigned()
+    association_type: Optional[str] = Unassigned()
+
+
+class QueryFilters(Base):
+    """
+    QueryFilters
+         <p>A set of filters to narrow the set of lineage entities connected to the <code>StartArn</code>(s) returned by the <code>QueryLineage</code> API action.</p>
+
+        Attributes
+       ----------------------
+       types: 	 <p>Filter the lineage entities connected to the <code>StartArn</code> by type. For example: <code>DataSet</code>, <code>Model</code>, <code>Endpoint</code>, or <code>ModelDeployment</code>.</p>
+       lineage_types: 	 <p>Filter the lineage entities connected to the <code>StartArn</code>(s) by the type of the lineage entity.</p>
+       created_before: 	 <p>Filter the lineage entities connected to the <code>StartArn</code>(s) by created date.</p>
+       created_after: 	 <p>Filter the lineage entities connected to the <code>StartArn</code>(s) after the create date.</p>
+       modified_before: 	 <p>Filter the lineage entities connected to the <code>StartArn</code>(s) before the last modified date.</p>
+       modified_after: 	 <p>Filter the lineage entities connected to the <code>StartArn</code>(s) after the last modified date.</p>
+       properties: 	 <p>Filter the lineage entities connected to the <code>StartArn</code>(s) by a set if property key value pairs. If multiple pairs are provided, an entity is included in the results if it matches any of the provided pairs.</p>
+    """
+
+    types: Optional[List[str]] = Unassigned()
+    lineage_types: Optional[List[str]] = Unassigned()
+    created_before: Optional[datetime.datetime] = Unassigned()
+    created_after: Optional[datetime.datetime] = Unassigned()
+    modified_before: Optional[datetime.datetime] = Unassigned()
+    modified_after: Optional[datetime.datetime] = Unassigned()
+    properties: Optional[Dict[str, str]] = Unassigned()
+
+
+class Vertex(Base):
+    """
+    Vertex
+         <p>A lineage entity connected to the starting entity(ies).</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the lineage entity resource.</p>
+       type: 	 <p>The type of the lineage entity resource. For example: <code>DataSet</code>, <code>Model</code>, <code>Endpoint</code>, etc...</p>
+       lineage_type: 	 <p>The type of resource of the lineage entity.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+    type: Optional[str] = Unassigned()
+    lineage_type: Optional[str] = Unassigned()
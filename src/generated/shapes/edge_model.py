@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class EdgeModel(Base):
+    """
+    EdgeModel
+         <p>The model on the edge device.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the model.</p>
+       model_version: 	 <p>The model version.</p>
+       latest_sample_time: 	 <p>The timestamp of the last data sample taken.</p>
+       latest_inference: 	 <p>The timestamp of the last inference that was made.</p>
+    """
+
+    model_name: str
+    model_version: str
+    latest_sample_time: Optional[datetime.datetime] = Unassigned()
+    latest_inference: Optional[datetime.datetime] = Unassigned()
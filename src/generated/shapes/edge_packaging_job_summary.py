@@ -0,0 +1,63 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class EdgePresetDeploymentOutput(Base):
+    """
+    EdgePresetDeploymentOutput
+         <p>The output of a SageMaker Edge Manager deployable resource.</p>
+
+        Attributes
+       ----------------------
+       type: 	 <p>The deployment type created by SageMaker Edge Manager. Currently only supports Amazon Web Services IoT Greengrass Version 2 components.</p>
+       artifact: 	 <p>The Amazon Resource Name (ARN) of the generated deployable resource.</p>
+       status: 	 <p>The status of the deployable resource.</p>
+       status_message: 	 <p>Returns a message describing the status of the deployed resource.</p>
+    """
+
+    type: str
+    artifact: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    status_message: Optional[str] = Unassigned()
+
+
+class EdgePackagingJobSummary(Base):
+    """
+    EdgePackagingJobSummary
+         <p>Summary of edge packaging job.</p>
+
+        Attributes
+       ----------------------
+       edge_packaging_job_arn: 	 <p>The Amazon Resource Name (ARN) of the edge packaging job.</p>
+       edge_packaging_job_name: 	 <p>The name of the edge packaging job.</p>
+       edge_packaging_job_status: 	 <p>The status of the edge packaging job.</p>
+       compilation_job_name: 	 <p>The name of the SageMaker Neo compilation job.</p>
+       model_name: 	 <p>The name of the model.</p>
+       model_version: 	 <p>The version of the model.</p>
+       creation_time: 	 <p>The timestamp of when the job was created.</p>
+       last_modified_time: 	 <p>The timestamp of when the edge packaging job was last updated.</p>
+    """
+
+    edge_packaging_job_arn: str
+    edge_packaging_job_name: str
+    edge_packaging_job_status: str
+    compilation_job_name: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    model_version: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
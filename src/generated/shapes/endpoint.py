@@ -0,0 +1,1189 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .additional_inference_specification_definition import (
+    AdditionalInferenceSpecificationDefinition,
+    DriftCheckBaselines,
+    ModelMetrics,
+    ModelPackageStatusDetails,
+    ModelPackageValidationSpecification,
+    SourceAlgorithmSpecification,
+)
+from .additional_s3_data_source import InferenceSpecification
+from .alarm import DataCaptureConfigSummary, ProductionVariantSummary
+from .algorithm_specification import (
+    AlgorithmSpecification,
+    DebugHookConfig,
+    DebugRuleConfiguration,
+    DebugRuleEvaluationStatus,
+    MetricData,
+    ProfilerConfig,
+    SecondaryStatusTransition,
+    TensorBoardOutputConfig,
+)
+from .app_specification import (
+    AppSpecification,
+    ProcessingInput,
+    ProcessingOutputConfig,
+    ProcessingResources,
+    ProcessingStoppingCondition,
+)
+from .auto_parameter import (
+    HyperParameterTrainingJobDefinition,
+    HyperParameterTrainingJobSummary,
+    HyperParameterTuningJobCompletionDetails,
+    HyperParameterTuningJobConfig,
+    HyperParameterTuningJobConsumedResources,
+    HyperParameterTuningJobWarmStartConfig,
+    ObjectiveStatusCounters,
+    TrainingJobStatusCounters,
+)
+from .batch_data_capture_config import (
+    BatchDataCaptureConfig,
+    DataProcessing,
+    ModelClientConfig,
+)
+from .batch_transform_input import BatchTransformInput
+from .channel import Channel, OutputDataConfig, ResourceConfig
+from .checkpoint_config import CheckpointConfig, RetryStrategy
+from .collection_config import (
+    FeatureDefinition,
+    LastUpdateStatus,
+    OfflineStoreConfig,
+    OfflineStoreStatus,
+    OnlineStoreConfig,
+)
+from .container_definition import (
+    ContainerDefinition,
+    DeploymentRecommendation,
+    InferenceExecutionConfig,
+)
+from .experiment_config import ExperimentConfig
+from .experiment_source import ExperimentSource
+from .feature_parameter import FeatureParameter
+from .iam_identity import UserContext
+from .metadata_properties import MetadataProperties
+from .model_artifacts import ModelArtifacts
+from .model_card_security_config import ModelCardSecurityConfig
+from .model_dashboard_indicator_action import MonitoringAlertSummary
+from .monitoring_app_specification import (
+    MonitoringExecutionSummary,
+    MonitoringScheduleConfig,
+)
+from .network_config import NetworkConfig
+from .parallelism_configuration import ParallelismConfiguration
+from .parameter import Parameter, PipelineExperimentConfig, SelectiveExecutionConfig
+from .project_summary import (
+    ServiceCatalogProvisionedProductDetails,
+    ServiceCatalogProvisioningDetails,
+)
+from .stopping_condition import StoppingCondition
+from .tag import Tag
+from .transform_data_source import TransformInput, TransformOutput, TransformResources
+from .trial_component_artifact import (
+    TrialComponentArtifact,
+    TrialComponentMetricSummary,
+    TrialComponentParameterValue,
+    TrialComponentSource,
+    TrialComponentStatus,
+)
+from .trial_source import TrialSource
+from .vpc_config import VpcConfig
+
+
+class MonitoringSchedule(Base):
+    """
+    MonitoringSchedule
+         <p>A schedule for a model monitoring job. For information about model monitor, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-monitor.html">Amazon SageMaker Model Monitor</a>.</p>
+
+        Attributes
+       ----------------------
+       monitoring_schedule_arn: 	 <p>The Amazon Resource Name (ARN) of the monitoring schedule.</p>
+       monitoring_schedule_name: 	 <p>The name of the monitoring schedule.</p>
+       monitoring_schedule_status: 	 <p>The status of the monitoring schedule. This can be one of the following values.</p> <ul> <li> <p> <code>PENDING</code> - The schedule is pending being created.</p> </li> <li> <p> <code>FAILED</code> - The schedule failed.</p> </li> <li> <p> <code>SCHEDULED</code> - The schedule was successfully created.</p> </li> <li> <p> <code>STOPPED</code> - The schedule was stopped.</p> </li> </ul>
+       monitoring_type: 	 <p>The type of the monitoring job definition to schedule.</p>
+       failure_reason: 	 <p>If the monitoring schedule failed, the reason it failed.</p>
+       creation_time: 	 <p>The time that the monitoring schedule was created.</p>
+       last_modified_time: 	 <p>The last time the monitoring schedule was changed.</p>
+       monitoring_schedule_config
+       endpoint_name: 	 <p>The endpoint that hosts the model being monitored.</p>
+       last_monitoring_execution_summary
+       tags: 	 <p>A list of the tags associated with the monitoring schedlue. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services resources</a> in the <i>Amazon Web Services General Reference Guide</i>.</p>
+    """
+
+    monitoring_schedule_arn: Optional[str] = Unassigned()
+    monitoring_schedule_name: Optional[str] = Unassigned()
+    monitoring_schedule_status: Optional[str] = Unassigned()
+    monitoring_type: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    monitoring_schedule_config: Optional[MonitoringScheduleConfig] = Unassigned()
+    endpoint_name: Optional[str] = Unassigned()
+    last_monitoring_execution_summary: Optional[MonitoringExecutionSummary] = (
+        Unassigned()
+    )
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class Endpoint(Base):
+    """
+    Endpoint
+         <p>A hosted endpoint for real-time inference.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The name of the endpoint.</p>
+       endpoint_arn: 	 <p>The Amazon Resource Name (ARN) of the endpoint.</p>
+       endpoint_config_name: 	 <p>The endpoint configuration associated with the endpoint.</p>
+       production_variants: 	 <p>A list of the production variants hosted on the endpoint. Each production variant is a model.</p>
+       data_capture_config
+       endpoint_status: 	 <p>The status of the endpoint.</p>
+       failure_reason: 	 <p>If the endpoint failed, the reason it failed.</p>
+       creation_time: 	 <p>The time that the endpoint was created.</p>
+       last_modified_time: 	 <p>The last time the endpoint was modified.</p>
+       monitoring_schedules: 	 <p>A list of monitoring schedules for the endpoint. For information about model monitoring, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-monitor.html">Amazon SageMaker Model Monitor</a>.</p>
+       tags: 	 <p>A list of the tags associated with the endpoint. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services resources</a> in the <i>Amazon Web Services General Reference Guide</i>.</p>
+       shadow_production_variants: 	 <p>A list of the shadow variants hosted on the endpoint. Each shadow variant is a model in shadow mode with production traffic replicated from the production variant.</p>
+    """
+
+    endpoint_name: str
+    endpoint_arn: str
+    endpoint_config_name: str
+    endpoint_status: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    production_variants: Optional[List[ProductionVariantSummary]] = Unassigned()
+    data_capture_config: Optional[DataCaptureConfigSummary] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    monitoring_schedules: Optional[List[MonitoringSchedule]] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    shadow_production_variants: Optional[List[ProductionVariantSummary]] = Unassigned()
+
+
+class Experiment(Base):
+    """
+    Experiment
+         <p>The properties of an experiment as returned by the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API.</p>
+
+        Attributes
+       ----------------------
+       experiment_name: 	 <p>The name of the experiment.</p>
+       experiment_arn: 	 <p>The Amazon Resource Name (ARN) of the experiment.</p>
+       display_name: 	 <p>The name of the experiment as displayed. If <code>DisplayName</code> isn't specified, <code>ExperimentName</code> is displayed.</p>
+       source
+       description: 	 <p>The description of the experiment.</p>
+       creation_time: 	 <p>When the experiment was created.</p>
+       created_by: 	 <p>Who created the experiment.</p>
+       last_modified_time: 	 <p>When the experiment was last modified.</p>
+       last_modified_by
+       tags: 	 <p>The list of tags that are associated with the experiment. You can use <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API to search on the tags.</p>
+    """
+
+    experiment_name: Optional[str] = Unassigned()
+    experiment_arn: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    source: Optional[ExperimentSource] = Unassigned()
+    description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class FeatureGroup(Base):
+    """
+    FeatureGroup
+         <p>Amazon SageMaker Feature Store stores features in a collection called Feature Group. A Feature Group can be visualized as a table which has rows, with a unique identifier for each row where each column in the table is a feature. In principle, a Feature Group is composed of features and values per features.</p>
+
+        Attributes
+       ----------------------
+       feature_group_arn: 	 <p>The Amazon Resource Name (ARN) of a <code>FeatureGroup</code>.</p>
+       feature_group_name: 	 <p>The name of the <code>FeatureGroup</code>.</p>
+       record_identifier_feature_name: 	 <p>The name of the <code>Feature</code> whose value uniquely identifies a <code>Record</code> defined in the <code>FeatureGroup</code> <code>FeatureDefinitions</code>.</p>
+       event_time_feature_name: 	 <p>The name of the feature that stores the <code>EventTime</code> of a Record in a <code>FeatureGroup</code>.</p> <p>A <code>EventTime</code> is point in time when a new event occurs that corresponds to the creation or update of a <code>Record</code> in <code>FeatureGroup</code>. All <code>Records</code> in the <code>FeatureGroup</code> must have a corresponding <code>EventTime</code>.</p>
+       feature_definitions: 	 <p>A list of <code>Feature</code>s. Each <code>Feature</code> must include a <code>FeatureName</code> and a <code>FeatureType</code>. </p> <p>Valid <code>FeatureType</code>s are <code>Integral</code>, <code>Fractional</code> and <code>String</code>. </p> <p> <code>FeatureName</code>s cannot be any of the following: <code>is_deleted</code>, <code>write_time</code>, <code>api_invocation_time</code>.</p> <p>You can create up to 2,500 <code>FeatureDefinition</code>s per <code>FeatureGroup</code>.</p>
+       creation_time: 	 <p>The time a <code>FeatureGroup</code> was created.</p>
+       last_modified_time: 	 <p>A timestamp indicating the last time you updated the feature group.</p>
+       online_store_config
+       offline_store_config
+       role_arn: 	 <p>The Amazon Resource Name (ARN) of the IAM execution role used to create the feature group.</p>
+       feature_group_status: 	 <p>A <code>FeatureGroup</code> status.</p>
+       offline_store_status
+       last_update_status: 	 <p>A value that indicates whether the feature group was updated successfully.</p>
+       failure_reason: 	 <p>The reason that the <code>FeatureGroup</code> failed to be replicated in the <code>OfflineStore</code>. This is failure may be due to a failure to create a <code>FeatureGroup</code> in or delete a <code>FeatureGroup</code> from the <code>OfflineStore</code>.</p>
+       description: 	 <p>A free form description of a <code>FeatureGroup</code>.</p>
+       tags: 	 <p>Tags used to define a <code>FeatureGroup</code>.</p>
+    """
+
+    feature_group_arn: Optional[str] = Unassigned()
+    feature_group_name: Optional[str] = Unassigned()
+    record_identifier_feature_name: Optional[str] = Unassigned()
+    event_time_feature_name: Optional[str] = Unassigned()
+    feature_definitions: Optional[List[FeatureDefinition]] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    online_store_config: Optional[OnlineStoreConfig] = Unassigned()
+    offline_store_config: Optional[OfflineStoreConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    feature_group_status: Optional[str] = Unassigned()
+    offline_store_status: Optional[OfflineStoreStatus] = Unassigned()
+    last_update_status: Optional[LastUpdateStatus] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class FeatureMetadata(Base):
+    """
+    FeatureMetadata
+         <p>The metadata for a feature. It can either be metadata that you specify, or metadata that is updated automatically.</p>
+
+        Attributes
+       ----------------------
+       feature_group_arn: 	 <p>The Amazon Resource Number (ARN) of the feature group.</p>
+       feature_group_name: 	 <p>The name of the feature group containing the feature.</p>
+       feature_name: 	 <p>The name of feature.</p>
+       feature_type: 	 <p>The data type of the feature.</p>
+       creation_time: 	 <p>A timestamp indicating when the feature was created.</p>
+       last_modified_time: 	 <p>A timestamp indicating when the feature was last modified.</p>
+       description: 	 <p>An optional description that you specify to better describe the feature.</p>
+       parameters: 	 <p>Optional key-value pairs that you specify to better describe the feature.</p>
+    """
+
+    feature_group_arn: Optional[str] = Unassigned()
+    feature_group_name: Optional[str] = Unassigned()
+    feature_name: Optional[str] = Unassigned()
+    feature_type: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    description: Optional[str] = Unassigned()
+    parameters: Optional[List[FeatureParameter]] = Unassigned()
+
+
+class Filter(Base):
+    """
+    Filter
+         <p>A conditional statement for a search expression that includes a resource property, a Boolean operator, and a value. Resources that match the statement are returned in the results from the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API.</p> <p>If you specify a <code>Value</code>, but not an <code>Operator</code>, SageMaker uses the equals operator.</p> <p>In search, there are several property types:</p> <dl> <dt>Metrics</dt> <dd> <p>To define a metric filter, enter a value using the form <code>"Metrics.&lt;name&gt;"</code>, where <code>&lt;name&gt;</code> is a metric name. For example, the following filter searches for training jobs with an <code>"accuracy"</code> metric greater than <code>"0.9"</code>:</p> <p> <code>{</code> </p> <p> <code>"Name": "Metrics.accuracy",</code> </p> <p> <code>"Operator": "GreaterThan",</code> </p> <p> <code>"Value": "0.9"</code> </p> <p> <code>}</code> </p> </dd> <dt>HyperParameters</dt> <dd> <p>To define a hyperparameter filter, enter a value with the form <code>"HyperParameters.&lt;name&gt;"</code>. Decimal hyperparameter values are treated as a decimal in a comparison if the specified <code>Value</code> is also a decimal value. If the specified <code>Value</code> is an integer, the decimal hyperparameter values are treated as integers. For example, the following filter is satisfied by training jobs with a <code>"learning_rate"</code> hyperparameter that is less than <code>"0.5"</code>:</p> <p> <code> {</code> </p> <p> <code> "Name": "HyperParameters.learning_rate",</code> </p> <p> <code> "Operator": "LessThan",</code> </p> <p> <code> "Value": "0.5"</code> </p> <p> <code> }</code> </p> </dd> <dt>Tags</dt> <dd> <p>To define a tag filter, enter a value with the form <code>Tags.&lt;key&gt;</code>.</p> </dd> </dl>
+
+        Attributes
+       ----------------------
+       name: 	 <p>A resource property name. For example, <code>TrainingJobName</code>. For valid property names, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_SearchRecord.html">SearchRecord</a>. You must specify a valid property for the resource.</p>
+       operator: 	 <p>A Boolean binary operator that is used to evaluate the filter. The operator field contains one of the following values:</p> <dl> <dt>Equals</dt> <dd> <p>The value of <code>Name</code> equals <code>Value</code>.</p> </dd> <dt>NotEquals</dt> <dd> <p>The value of <code>Name</code> doesn't equal <code>Value</code>.</p> </dd> <dt>Exists</dt> <dd> <p>The <code>Name</code> property exists.</p> </dd> <dt>NotExists</dt> <dd> <p>The <code>Name</code> property does not exist.</p> </dd> <dt>GreaterThan</dt> <dd> <p>The value of <code>Name</code> is greater than <code>Value</code>. Not supported for text properties.</p> </dd> <dt>GreaterThanOrEqualTo</dt> <dd> <p>The value of <code>Name</code> is greater than or equal to <code>Value</code>. Not supported for text properties.</p> </dd> <dt>LessThan</dt> <dd> <p>The value of <code>Name</code> is less than <code>Value</code>. Not supported for text properties.</p> </dd> <dt>LessThanOrEqualTo</dt> <dd> <p>The value of <code>Name</code> is less than or equal to <code>Value</code>. Not supported for text properties.</p> </dd> <dt>In</dt> <dd> <p>The value of <code>Name</code> is one of the comma delimited strings in <code>Value</code>. Only supported for text properties.</p> </dd> <dt>Contains</dt> <dd> <p>The value of <code>Name</code> contains the string <code>Value</code>. Only supported for text properties.</p> <p>A <code>SearchExpression</code> can include the <code>Contains</code> operator multiple times when the value of <code>Name</code> is one of the following:</p> <ul> <li> <p> <code>Experiment.DisplayName</code> </p> </li> <li> <p> <code>Experiment.ExperimentName</code> </p> </li> <li> <p> <code>Experiment.Tags</code> </p> </li> <li> <p> <code>Trial.DisplayName</code> </p> </li> <li> <p> <code>Trial.TrialName</code> </p> </li> <li> <p> <code>Trial.Tags</code> </p> </li> <li> <p> <code>TrialComponent.DisplayName</code> </p> </li> <li> <p> <code>TrialComponent.TrialComponentName</code> </p> </li> <li> <p> <code>TrialComponent.Tags</code> </p> </li> <li> <p> <code>TrialComponent.InputArtifacts</code> </p> </li> <li> <p> <code>TrialComponent.OutputArtifacts</code> </p> </li> </ul> <p>A <code>SearchExpression</code> can include only one <code>Contains</code> operator for all other values of <code>Name</code>. In these cases, if you include multiple <code>Contains</code> operators in the <code>SearchExpression</code>, the result is the following error message: "<code>'CONTAINS' operator usage limit of 1 exceeded.</code>"</p> </dd> </dl>
+       value: 	 <p>A value used with <code>Name</code> and <code>Operator</code> to determine which resources satisfy the filter's condition. For numerical properties, <code>Value</code> must be an integer or floating-point decimal. For timestamp properties, <code>Value</code> must be an ISO 8601 date-time string of the following format: <code>YYYY-mm-dd'T'HH:MM:SS</code>.</p>
+    """
+
+    name: str
+    operator: Optional[str] = Unassigned()
+    value: Optional[str] = Unassigned()
+
+
+class HyperParameterTuningJobSearchEntity(Base):
+    """
+    HyperParameterTuningJobSearchEntity
+         <p>An entity returned by the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_SearchRecord.html">SearchRecord</a> API containing the properties of a hyperparameter tuning job.</p>
+
+        Attributes
+       ----------------------
+       hyper_parameter_tuning_job_name: 	 <p>The name of a hyperparameter tuning job.</p>
+       hyper_parameter_tuning_job_arn: 	 <p>The Amazon Resource Name (ARN) of a hyperparameter tuning job.</p>
+       hyper_parameter_tuning_job_config
+       training_job_definition
+       training_job_definitions: 	 <p>The job definitions included in a hyperparameter tuning job.</p>
+       hyper_parameter_tuning_job_status: 	 <p>The status of a hyperparameter tuning job.</p>
+       creation_time: 	 <p>The time that a hyperparameter tuning job was created.</p>
+       hyper_parameter_tuning_end_time: 	 <p>The time that a hyperparameter tuning job ended.</p>
+       last_modified_time: 	 <p>The time that a hyperparameter tuning job was last modified.</p>
+       training_job_status_counters
+       objective_status_counters
+       best_training_job
+       overall_best_training_job
+       warm_start_config
+       failure_reason: 	 <p>The error that was created when a hyperparameter tuning job failed.</p>
+       tuning_job_completion_details: 	 <p>Information about either a current or completed hyperparameter tuning job.</p>
+       consumed_resources: 	 <p>The total amount of resources consumed by a hyperparameter tuning job.</p>
+       tags: 	 <p>The tags associated with a hyperparameter tuning job. For more information see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services resources</a>.</p>
+    """
+
+    hyper_parameter_tuning_job_name: Optional[str] = Unassigned()
+    hyper_parameter_tuning_job_arn: Optional[str] = Unassigned()
+    hyper_parameter_tuning_job_config: Optional[HyperParameterTuningJobConfig] = (
+        Unassigned()
+    )
+    training_job_definition: Optional[HyperParameterTrainingJobDefinition] = (
+        Unassigned()
+    )
+    training_job_definitions: Optional[List[HyperParameterTrainingJobDefinition]] = (
+        Unassigned()
+    )
+    hyper_parameter_tuning_job_status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    hyper_parameter_tuning_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    training_job_status_counters: Optional[TrainingJobStatusCounters] = Unassigned()
+    objective_status_counters: Optional[ObjectiveStatusCounters] = Unassigned()
+    best_training_job: Optional[HyperParameterTrainingJobSummary] = Unassigned()
+    overall_best_training_job: Optional[HyperParameterTrainingJobSummary] = Unassigned()
+    warm_start_config: Optional[HyperParameterTuningJobWarmStartConfig] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    tuning_job_completion_details: Optional[
+        HyperParameterTuningJobCompletionDetails
+    ] = Unassigned()
+    consumed_resources: Optional[HyperParameterTuningJobConsumedResources] = (
+        Unassigned()
+    )
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class Model(Base):
+    """
+    Model
+         <p>The properties of a model as returned by the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the model.</p>
+       primary_container
+       containers: 	 <p>The containers in the inference pipeline.</p>
+       inference_execution_config
+       execution_role_arn: 	 <p>The Amazon Resource Name (ARN) of the IAM role that you specified for the model.</p>
+       vpc_config
+       creation_time: 	 <p>A timestamp that indicates when the model was created.</p>
+       model_arn: 	 <p>The Amazon Resource Name (ARN) of the model.</p>
+       enable_network_isolation: 	 <p>Isolates the model container. No inbound or outbound network calls can be made to or from the model container.</p>
+       tags: 	 <p>A list of key-value pairs associated with the model. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services resources</a> in the <i>Amazon Web Services General Reference Guide</i>.</p>
+       deployment_recommendation: 	 <p>A set of recommended deployment configurations for the model.</p>
+    """
+
+    model_name: Optional[str] = Unassigned()
+    primary_container: Optional[ContainerDefinition] = Unassigned()
+    containers: Optional[List[ContainerDefinition]] = Unassigned()
+    inference_execution_config: Optional[InferenceExecutionConfig] = Unassigned()
+    execution_role_arn: Optional[str] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    model_arn: Optional[str] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    deployment_recommendation: Optional[DeploymentRecommendation] = Unassigned()
+
+
+class ModelCard(Base):
+    """
+    ModelCard
+         <p>An Amazon SageMaker Model Card.</p>
+
+        Attributes
+       ----------------------
+       model_card_arn: 	 <p>The Amazon Resource Name (ARN) of the model card.</p>
+       model_card_name: 	 <p>The unique name of the model card.</p>
+       model_card_version: 	 <p>The version of the model card.</p>
+       content: 	 <p>The content of the model card. Content uses the <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-cards.html#model-cards-json-schema">model card JSON schema</a> and provided as a string.</p>
+       model_card_status: 	 <p>The approval status of the model card within your organization. Different organizations might have different criteria for model card review and approval.</p> <ul> <li> <p> <code>Draft</code>: The model card is a work in progress.</p> </li> <li> <p> <code>PendingReview</code>: The model card is pending review.</p> </li> <li> <p> <code>Approved</code>: The model card is approved.</p> </li> <li> <p> <code>Archived</code>: The model card is archived. No more updates should be made to the model card, but it can still be exported.</p> </li> </ul>
+       security_config: 	 <p>The security configuration used to protect model card data.</p>
+       creation_time: 	 <p>The date and time that the model card was created.</p>
+       created_by
+       last_modified_time: 	 <p>The date and time that the model card was last modified.</p>
+       last_modified_by
+       tags: 	 <p>Key-value pairs used to manage metadata for the model card.</p>
+       model_id: 	 <p>The unique name (ID) of the model.</p>
+       risk_rating: 	 <p>The risk rating of the model. Different organizations might have different criteria for model card risk ratings. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-cards-risk-rating.html">Risk ratings</a>.</p>
+       model_package_group_name: 	 <p>The model package group that contains the model package. Only relevant for model cards created for model packages in the Amazon SageMaker Model Registry. </p>
+    """
+
+    model_card_arn: Optional[str] = Unassigned()
+    model_card_name: Optional[str] = Unassigned()
+    model_card_version: Optional[int] = Unassigned()
+    content: Optional[str] = Unassigned()
+    model_card_status: Optional[str] = Unassigned()
+    security_config: Optional[ModelCardSecurityConfig] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    model_id: Optional[str] = Unassigned()
+    risk_rating: Optional[str] = Unassigned()
+    model_package_group_name: Optional[str] = Unassigned()
+
+
+class ModelDashboardEndpoint(Base):
+    """
+    ModelDashboardEndpoint
+         <p>An endpoint that hosts a model displayed in the Amazon SageMaker Model Dashboard.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The endpoint name.</p>
+       endpoint_arn: 	 <p>The Amazon Resource Name (ARN) of the endpoint.</p>
+       creation_time: 	 <p>A timestamp that indicates when the endpoint was created.</p>
+       last_modified_time: 	 <p>The last time the endpoint was modified.</p>
+       endpoint_status: 	 <p>The endpoint status.</p>
+    """
+
+    endpoint_name: str
+    endpoint_arn: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    endpoint_status: str
+
+
+class TransformJob(Base):
+    """
+    TransformJob
+         <p>A batch transform job. For information about SageMaker batch transform, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/batch-transform.html">Use Batch Transform</a>.</p>
+
+        Attributes
+       ----------------------
+       transform_job_name: 	 <p>The name of the transform job.</p>
+       transform_job_arn: 	 <p>The Amazon Resource Name (ARN) of the transform job.</p>
+       transform_job_status: 	 <p>The status of the transform job.</p> <p>Transform job statuses are:</p> <ul> <li> <p> <code>InProgress</code> - The job is in progress.</p> </li> <li> <p> <code>Completed</code> - The job has completed.</p> </li> <li> <p> <code>Failed</code> - The transform job has failed. To see the reason for the failure, see the <code>FailureReason</code> field in the response to a <code>DescribeTransformJob</code> call.</p> </li> <li> <p> <code>Stopping</code> - The transform job is stopping.</p> </li> <li> <p> <code>Stopped</code> - The transform job has stopped.</p> </li> </ul>
+       failure_reason: 	 <p>If the transform job failed, the reason it failed.</p>
+       model_name: 	 <p>The name of the model associated with the transform job.</p>
+       max_concurrent_transforms: 	 <p>The maximum number of parallel requests that can be sent to each instance in a transform job. If <code>MaxConcurrentTransforms</code> is set to 0 or left unset, SageMaker checks the optional execution-parameters to determine the settings for your chosen algorithm. If the execution-parameters endpoint is not enabled, the default value is 1. For built-in algorithms, you don't need to set a value for <code>MaxConcurrentTransforms</code>.</p>
+       model_client_config
+       max_payload_in_m_b: 	 <p>The maximum allowed size of the payload, in MB. A payload is the data portion of a record (without metadata). The value in <code>MaxPayloadInMB</code> must be greater than, or equal to, the size of a single record. To estimate the size of a record in MB, divide the size of your dataset by the number of records. To ensure that the records fit within the maximum payload size, we recommend using a slightly larger value. The default value is 6 MB. For cases where the payload might be arbitrarily large and is transmitted using HTTP chunked encoding, set the value to 0. This feature works only in supported algorithms. Currently, SageMaker built-in algorithms do not support HTTP chunked encoding.</p>
+       batch_strategy: 	 <p>Specifies the number of records to include in a mini-batch for an HTTP inference request. A record is a single unit of input data that inference can be made on. For example, a single line in a CSV file is a record.</p>
+       environment: 	 <p>The environment variables to set in the Docker container. We support up to 16 key and values entries in the map.</p>
+       transform_input
+       transform_output
+       data_capture_config
+       transform_resources
+       creation_time: 	 <p>A timestamp that shows when the transform Job was created.</p>
+       transform_start_time: 	 <p>Indicates when the transform job starts on ML instances. You are billed for the time interval between this time and the value of <code>TransformEndTime</code>.</p>
+       transform_end_time: 	 <p>Indicates when the transform job has been completed, or has stopped or failed. You are billed for the time interval between this time and the value of <code>TransformStartTime</code>.</p>
+       labeling_job_arn: 	 <p>The Amazon Resource Name (ARN) of the labeling job that created the transform job.</p>
+       auto_m_l_job_arn: 	 <p>The Amazon Resource Name (ARN) of the AutoML job that created the transform job.</p>
+       data_processing
+       experiment_config
+       tags: 	 <p>A list of tags associated with the transform job.</p>
+    """
+
+    transform_job_name: Optional[str] = Unassigned()
+    transform_job_arn: Optional[str] = Unassigned()
+    transform_job_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    max_concurrent_transforms: Optional[int] = Unassigned()
+    model_client_config: Optional[ModelClientConfig] = Unassigned()
+    max_payload_in_m_b: Optional[int] = Unassigned()
+    batch_strategy: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    transform_input: Optional[TransformInput] = Unassigned()
+    transform_output: Optional[TransformOutput] = Unassigned()
+    data_capture_config: Optional[BatchDataCaptureConfig] = Unassigned()
+    transform_resources: Optional[TransformResources] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    transform_start_time: Optional[datetime.datetime] = Unassigned()
+    transform_end_time: Optional[datetime.datetime] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    data_processing: Optional[DataProcessing] = Unassigned()
+    experiment_config: Optional[ExperimentConfig] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class ModelDashboardMonitoringSchedule(Base):
+    """
+    ModelDashboardMonitoringSchedule
+         <p>A monitoring schedule for a model displayed in the Amazon SageMaker Model Dashboard.</p>
+
+        Attributes
+       ----------------------
+       monitoring_schedule_arn: 	 <p>The Amazon Resource Name (ARN) of a monitoring schedule.</p>
+       monitoring_schedule_name: 	 <p>The name of a monitoring schedule.</p>
+       monitoring_schedule_status: 	 <p>The status of the monitoring schedule.</p>
+       monitoring_type: 	 <p>The monitor type of a model monitor.</p>
+       failure_reason: 	 <p>If a monitoring job failed, provides the reason.</p>
+       creation_time: 	 <p>A timestamp that indicates when the monitoring schedule was created.</p>
+       last_modified_time: 	 <p>A timestamp that indicates when the monitoring schedule was last updated.</p>
+       monitoring_schedule_config
+       endpoint_name: 	 <p>The endpoint which is monitored.</p>
+       monitoring_alert_summaries: 	 <p>A JSON array where each element is a summary for a monitoring alert.</p>
+       last_monitoring_execution_summary
+       batch_transform_input
+    """
+
+    monitoring_schedule_arn: Optional[str] = Unassigned()
+    monitoring_schedule_name: Optional[str] = Unassigned()
+    monitoring_schedule_status: Optional[str] = Unassigned()
+    monitoring_type: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    monitoring_schedule_config: Optional[MonitoringScheduleConfig] = Unassigned()
+    endpoint_name: Optional[str] = Unassigned()
+    monitoring_alert_summaries: Optional[List[MonitoringAlertSummary]] = Unassigned()
+    last_monitoring_execution_summary: Optional[MonitoringExecutionSummary] = (
+        Unassigned()
+    )
+    batch_transform_input: Optional[BatchTransformInput] = Unassigned()
+
+
+class ModelDashboardModelCard(Base):
+    """
+    ModelDashboardModelCard
+         <p>The model card for a model displayed in the Amazon SageMaker Model Dashboard.</p>
+
+        Attributes
+       ----------------------
+       model_card_arn: 	 <p>The Amazon Resource Name (ARN) for a model card.</p>
+       model_card_name: 	 <p>The name of a model card.</p>
+       model_card_version: 	 <p>The model card version.</p>
+       model_card_status: 	 <p>The model card status.</p>
+       security_config: 	 <p>The KMS Key ID (<code>KMSKeyId</code>) for encryption of model card information.</p>
+       creation_time: 	 <p>A timestamp that indicates when the model card was created.</p>
+       created_by
+       last_modified_time: 	 <p>A timestamp that indicates when the model card was last updated.</p>
+       last_modified_by
+       tags: 	 <p>The tags associated with a model card.</p>
+       model_id: 	 <p>For models created in SageMaker, this is the model ARN. For models created outside of SageMaker, this is a user-customized string.</p>
+       risk_rating: 	 <p>A model card's risk rating. Can be low, medium, or high.</p>
+    """
+
+    model_card_arn: Optional[str] = Unassigned()
+    model_card_name: Optional[str] = Unassigned()
+    model_card_version: Optional[int] = Unassigned()
+    model_card_status: Optional[str] = Unassigned()
+    security_config: Optional[ModelCardSecurityConfig] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    model_id: Optional[str] = Unassigned()
+    risk_rating: Optional[str] = Unassigned()
+
+
+class ModelDashboardModel(Base):
+    """
+    ModelDashboardModel
+         <p>A model displayed in the Amazon SageMaker Model Dashboard.</p>
+
+        Attributes
+       ----------------------
+       model: 	 <p>A model displayed in the Model Dashboard.</p>
+       endpoints: 	 <p>The endpoints that host a model.</p>
+       last_batch_transform_job
+       monitoring_schedules: 	 <p>The monitoring schedules for a model.</p>
+       model_card: 	 <p>The model card for a model.</p>
+    """
+
+    model: Optional[Model] = Unassigned()
+    endpoints: Optional[List[ModelDashboardEndpoint]] = Unassigned()
+    last_batch_transform_job: Optional[TransformJob] = Unassigned()
+    monitoring_schedules: Optional[List[ModelDashboardMonitoringSchedule]] = (
+        Unassigned()
+    )
+    model_card: Optional[ModelDashboardModelCard] = Unassigned()
+
+
+class ModelPackage(Base):
+    """
+    ModelPackage
+         <p>A versioned model that can be deployed for SageMaker inference.</p>
+
+        Attributes
+       ----------------------
+       model_package_name: 	 <p>The name of the model.</p>
+       model_package_group_name: 	 <p>The model group to which the model belongs.</p>
+       model_package_version: 	 <p>The version number of a versioned model.</p>
+       model_package_arn: 	 <p>The Amazon Resource Name (ARN) of the model package.</p>
+       model_package_description: 	 <p>The description of the model package.</p>
+       creation_time: 	 <p>The time that the model package was created.</p>
+       inference_specification: 	 <p>Defines how to perform inference generation after a training job is run.</p>
+       source_algorithm_specification: 	 <p>A list of algorithms that were used to create a model package.</p>
+       validation_specification: 	 <p>Specifies batch transform jobs that SageMaker runs to validate your model package.</p>
+       model_package_status: 	 <p>The status of the model package. This can be one of the following values.</p> <ul> <li> <p> <code>PENDING</code> - The model package is pending being created.</p> </li> <li> <p> <code>IN_PROGRESS</code> - The model package is in the process of being created.</p> </li> <li> <p> <code>COMPLETED</code> - The model package was successfully created.</p> </li> <li> <p> <code>FAILED</code> - The model package failed.</p> </li> <li> <p> <code>DELETING</code> - The model package is in the process of being deleted.</p> </li> </ul>
+       model_package_status_details: 	 <p>Specifies the validation and image scan statuses of the model package.</p>
+       certify_for_marketplace: 	 <p>Whether the model package is to be certified to be listed on Amazon Web Services Marketplace. For information about listing model packages on Amazon Web Services Marketplace, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-mkt-list.html">List Your Algorithm or Model Package on Amazon Web Services Marketplace</a>.</p>
+       model_approval_status: 	 <p>The approval status of the model. This can be one of the following values.</p> <ul> <li> <p> <code>APPROVED</code> - The model is approved</p> </li> <li> <p> <code>REJECTED</code> - The model is rejected.</p> </li> <li> <p> <code>PENDING_MANUAL_APPROVAL</code> - The model is waiting for manual approval.</p> </li> </ul>
+       created_by: 	 <p>Information about the user who created or modified an experiment, trial, trial component, lineage group, or project.</p>
+       metadata_properties: 	 <p>Metadata properties of the tracking entity, trial, or trial component.</p>
+       model_metrics: 	 <p>Metrics for the model.</p>
+       last_modified_time: 	 <p>The last time the model package was modified.</p>
+       last_modified_by: 	 <p>Information about the user who created or modified an experiment, trial, trial component, lineage group, or project.</p>
+       approval_description: 	 <p>A description provided when the model approval is set.</p>
+       domain: 	 <p>The machine learning domain of your model package and its components. Common machine learning domains include computer vision and natural language processing.</p>
+       task: 	 <p>The machine learning task your model package accomplishes. Common machine learning tasks include object detection and image classification.</p>
+       sample_payload_url: 	 <p>The Amazon Simple Storage Service path where the sample payload are stored. This path must point to a single gzip compressed tar archive (.tar.gz suffix).</p>
+       additional_inference_specifications: 	 <p>An array of additional Inference Specification objects.</p>
+       source_uri: 	 <p>The URI of the source for the model package.</p>
+       tags: 	 <p>A list of the tags associated with the model package. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services resources</a> in the <i>Amazon Web Services General Reference Guide</i>.</p>
+       customer_metadata_properties: 	 <p>The metadata properties for the model package. </p>
+       drift_check_baselines: 	 <p>Represents the drift check baselines that can be used when the model monitor is set using the model package.</p>
+       skip_model_validation: 	 <p>Indicates if you want to skip model validation.</p>
+    """
+
+    model_package_name: Optional[str] = Unassigned()
+    model_package_group_name: Optional[str] = Unassigned()
+    model_package_version: Optional[int] = Unassigned()
+    model_package_arn: Optional[str] = Unassigned()
+    model_package_description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    inference_specification: Optional[InferenceSpecification] = Unassigned()
+    source_algorithm_specification: Optional[SourceAlgorithmSpecification] = (
+        Unassigned()
+    )
+    validation_specification: Optional[ModelPackageValidationSpecification] = (
+        Unassigned()
+    )
+    model_package_status: Optional[str] = Unassigned()
+    model_package_status_details: Optional[ModelPackageStatusDetails] = Unassigned()
+    certify_for_marketplace: Optional[bool] = Unassigned()
+    model_approval_status: Optional[str] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    model_metrics: Optional[ModelMetrics] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    approval_description: Optional[str] = Unassigned()
+    domain: Optional[str] = Unassigned()
+    task: Optional[str] = Unassigned()
+    sample_payload_url: Optional[str] = Unassigned()
+    additional_inference_specifications: Optional[
+        List[AdditionalInferenceSpecificationDefinition]
+    ] = Unassigned()
+    source_uri: Optional[str] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    customer_metadata_properties: Optional[Dict[str, str]] = Unassigned()
+    drift_check_baselines: Optional[DriftCheckBaselines] = Unassigned()
+    skip_model_validation: Optional[str] = Unassigned()
+
+
+class ModelPackageGroup(Base):
+    """
+    ModelPackageGroup
+         <p>A group of versioned models in the model registry.</p>
+
+        Attributes
+       ----------------------
+       model_package_group_name: 	 <p>The name of the model group.</p>
+       model_package_group_arn: 	 <p>The Amazon Resource Name (ARN) of the model group.</p>
+       model_package_group_description: 	 <p>The description for the model group.</p>
+       creation_time: 	 <p>The time that the model group was created.</p>
+       created_by
+       model_package_group_status: 	 <p>The status of the model group. This can be one of the following values.</p> <ul> <li> <p> <code>PENDING</code> - The model group is pending being created.</p> </li> <li> <p> <code>IN_PROGRESS</code> - The model group is in the process of being created.</p> </li> <li> <p> <code>COMPLETED</code> - The model group was successfully created.</p> </li> <li> <p> <code>FAILED</code> - The model group failed.</p> </li> <li> <p> <code>DELETING</code> - The model group is in the process of being deleted.</p> </li> <li> <p> <code>DELETE_FAILED</code> - SageMaker failed to delete the model group.</p> </li> </ul>
+       tags: 	 <p>A list of the tags associated with the model group. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services resources</a> in the <i>Amazon Web Services General Reference Guide</i>.</p>
+    """
+
+    model_package_group_name: Optional[str] = Unassigned()
+    model_package_group_arn: Optional[str] = Unassigned()
+    model_package_group_description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    model_package_group_status: Optional[str] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class NestedFilters(Base):
+    """
+    NestedFilters
+         <p>A list of nested <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Filter.html">Filter</a> objects. A resource must satisfy the conditions of all filters to be included in the results returned from the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API.</p> <p>For example, to filter on a training job's <code>InputDataConfig</code> property with a specific channel name and <code>S3Uri</code> prefix, define the following filters:</p> <ul> <li> <p> <code>'{Name:"InputDataConfig.ChannelName", "Operator":"Equals", "Value":"train"}',</code> </p> </li> <li> <p> <code>'{Name:"InputDataConfig.DataSource.S3DataSource.S3Uri", "Operator":"Contains", "Value":"mybucket/catdata"}'</code> </p> </li> </ul>
+
+        Attributes
+       ----------------------
+       nested_property_name: 	 <p>The name of the property to use in the nested filters. The value must match a listed property name, such as <code>InputDataConfig</code>.</p>
+       filters: 	 <p>A list of filters. Each filter acts on a property. Filters must contain at least one <code>Filters</code> value. For example, a <code>NestedFilters</code> call might include a filter on the <code>PropertyName</code> parameter of the <code>InputDataConfig</code> property: <code>InputDataConfig.DataSource.S3DataSource.S3Uri</code>.</p>
+    """
+
+    nested_property_name: str
+    filters: List[Filter]
+
+
+class Parent(Base):
+    """
+    Parent
+         <p>The trial that a trial component is associated with and the experiment the trial is part of. A component might not be associated with a trial. A component can be associated with multiple trials.</p>
+
+        Attributes
+       ----------------------
+       trial_name: 	 <p>The name of the trial.</p>
+       experiment_name: 	 <p>The name of the experiment.</p>
+    """
+
+    trial_name: Optional[str] = Unassigned()
+    experiment_name: Optional[str] = Unassigned()
+
+
+class Pipeline(Base):
+    """
+    Pipeline
+         <p>A SageMaker Model Building Pipeline instance.</p>
+
+        Attributes
+       ----------------------
+       pipeline_arn: 	 <p>The Amazon Resource Name (ARN) of the pipeline.</p>
+       pipeline_name: 	 <p>The name of the pipeline.</p>
+       pipeline_display_name: 	 <p>The display name of the pipeline.</p>
+       pipeline_description: 	 <p>The description of the pipeline.</p>
+       role_arn: 	 <p>The Amazon Resource Name (ARN) of the role that created the pipeline.</p>
+       pipeline_status: 	 <p>The status of the pipeline.</p>
+       creation_time: 	 <p>The creation time of the pipeline.</p>
+       last_modified_time: 	 <p>The time that the pipeline was last modified.</p>
+       last_run_time: 	 <p>The time when the pipeline was last run.</p>
+       created_by
+       last_modified_by
+       parallelism_configuration: 	 <p>The parallelism configuration applied to the pipeline.</p>
+       tags: 	 <p>A list of tags that apply to the pipeline.</p>
+    """
+
+    pipeline_arn: Optional[str] = Unassigned()
+    pipeline_name: Optional[str] = Unassigned()
+    pipeline_display_name: Optional[str] = Unassigned()
+    pipeline_description: Optional[str] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    pipeline_status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_run_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    parallelism_configuration: Optional[ParallelismConfiguration] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class PipelineExecution(Base):
+    """
+    PipelineExecution
+         <p>An execution of a pipeline.</p>
+
+        Attributes
+       ----------------------
+       pipeline_arn: 	 <p>The Amazon Resource Name (ARN) of the pipeline that was executed.</p>
+       pipeline_execution_arn: 	 <p>The Amazon Resource Name (ARN) of the pipeline execution.</p>
+       pipeline_execution_display_name: 	 <p>The display name of the pipeline execution.</p>
+       pipeline_execution_status: 	 <p>The status of the pipeline status.</p>
+       pipeline_execution_description: 	 <p>The description of the pipeline execution.</p>
+       pipeline_experiment_config
+       failure_reason: 	 <p>If the execution failed, a message describing why.</p>
+       creation_time: 	 <p>The creation time of the pipeline execution.</p>
+       last_modified_time: 	 <p>The time that the pipeline execution was last modified.</p>
+       created_by
+       last_modified_by
+       parallelism_configuration: 	 <p>The parallelism configuration applied to the pipeline execution.</p>
+       selective_execution_config: 	 <p>The selective execution configuration applied to the pipeline run.</p>
+       pipeline_parameters: 	 <p>Contains a list of pipeline parameters. This list can be empty. </p>
+    """
+
+    pipeline_arn: Optional[str] = Unassigned()
+    pipeline_execution_arn: Optional[str] = Unassigned()
+    pipeline_execution_display_name: Optional[str] = Unassigned()
+    pipeline_execution_status: Optional[str] = Unassigned()
+    pipeline_execution_description: Optional[str] = Unassigned()
+    pipeline_experiment_config: Optional[PipelineExperimentConfig] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    parallelism_configuration: Optional[ParallelismConfiguration] = Unassigned()
+    selective_execution_config: Optional[SelectiveExecutionConfig] = Unassigned()
+    pipeline_parameters: Optional[List[Parameter]] = Unassigned()
+
+
+class ProcessingJob(Base):
+    """
+    ProcessingJob
+         <p>An Amazon SageMaker processing job that is used to analyze data and evaluate models. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/processing-job.html">Process Data and Evaluate Models</a>.</p>
+
+        Attributes
+       ----------------------
+       processing_inputs: 	 <p>List of input configurations for the processing job.</p>
+       processing_output_config
+       processing_job_name: 	 <p>The name of the processing job.</p>
+       processing_resources
+       stopping_condition
+       app_specification
+       environment: 	 <p>Sets the environment variables in the Docker container.</p>
+       network_config
+       role_arn: 	 <p>The ARN of the role used to create the processing job.</p>
+       experiment_config
+       processing_job_arn: 	 <p>The ARN of the processing job.</p>
+       processing_job_status: 	 <p>The status of the processing job.</p>
+       exit_message: 	 <p>A string, up to one KB in size, that contains metadata from the processing container when the processing job exits.</p>
+       failure_reason: 	 <p>A string, up to one KB in size, that contains the reason a processing job failed, if it failed.</p>
+       processing_end_time: 	 <p>The time that the processing job ended.</p>
+       processing_start_time: 	 <p>The time that the processing job started.</p>
+       last_modified_time: 	 <p>The time the processing job was last modified.</p>
+       creation_time: 	 <p>The time the processing job was created.</p>
+       monitoring_schedule_arn: 	 <p>The ARN of a monitoring schedule for an endpoint associated with this processing job.</p>
+       auto_m_l_job_arn: 	 <p>The Amazon Resource Name (ARN) of the AutoML job associated with this processing job.</p>
+       training_job_arn: 	 <p>The ARN of the training job associated with this processing job.</p>
+       tags: 	 <p>An array of key-value pairs. For more information, see <a href="https://docs.aws.amazon.com/awsaccountbilling/latest/aboutv2/cost-alloc-tags.html#allocation-whatURL">Using Cost Allocation Tags</a> in the <i>Amazon Web Services Billing and Cost Management User Guide</i>.</p>
+    """
+
+    processing_inputs: Optional[List[ProcessingInput]] = Unassigned()
+    processing_output_config: Optional[ProcessingOutputConfig] = Unassigned()
+    processing_job_name: Optional[str] = Unassigned()
+    processing_resources: Optional[ProcessingResources] = Unassigned()
+    stopping_condition: Optional[ProcessingStoppingCondition] = Unassigned()
+    app_specification: Optional[AppSpecification] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    network_config: Optional[NetworkConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    experiment_config: Optional[ExperimentConfig] = Unassigned()
+    processing_job_arn: Optional[str] = Unassigned()
+    processing_job_status: Optional[str] = Unassigned()
+    exit_message: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    processing_end_time: Optional[datetime.datetime] = Unassigned()
+    processing_start_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    monitoring_schedule_arn: Optional[str] = Unassigned()
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    training_job_arn: Optional[str] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class Project(Base):
+    """
+    Project
+         <p>The properties of a project as returned by the Search API.</p>
+
+        Attributes
+       ----------------------
+       project_arn: 	 <p>The Amazon Resource Name (ARN) of the project.</p>
+       project_name: 	 <p>The name of the project.</p>
+       project_id: 	 <p>The ID of the project.</p>
+       project_description: 	 <p>The description of the project.</p>
+       service_catalog_provisioning_details
+       service_catalog_provisioned_product_details
+       project_status: 	 <p>The status of the project.</p>
+       created_by: 	 <p>Who created the project.</p>
+       creation_time: 	 <p>A timestamp specifying when the project was created.</p>
+       tags: 	 <p>An array of key-value pairs. You can use tags to categorize your Amazon Web Services resources in different ways, for example, by purpose, owner, or environment. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services Resources</a>.</p>
+       last_modified_time: 	 <p>A timestamp container for when the project was last modified.</p>
+       last_modified_by
+    """
+
+    project_arn: Optional[str] = Unassigned()
+    project_name: Optional[str] = Unassigned()
+    project_id: Optional[str] = Unassigned()
+    project_description: Optional[str] = Unassigned()
+    service_catalog_provisioning_details: Optional[
+        ServiceCatalogProvisioningDetails
+    ] = Unassigned()
+    service_catalog_provisioned_product_details: Optional[
+        ServiceCatalogProvisionedProductDetails
+    ] = Unassigned()
+    project_status: Optional[str] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+
+
+class SearchExpression(Base):
+    """
+    SearchExpression
+         <p>A multi-expression that searches for the specified resource or resources in a search. All resource objects that satisfy the expression's condition are included in the search results. You must specify at least one subexpression, filter, or nested filter. A <code>SearchExpression</code> can contain up to twenty elements.</p> <p>A <code>SearchExpression</code> contains the following components:</p> <ul> <li> <p>A list of <code>Filter</code> objects. Each filter defines a simple Boolean expression comprised of a resource property name, Boolean operator, and value.</p> </li> <li> <p>A list of <code>NestedFilter</code> objects. Each nested filter defines a list of Boolean expressions using a list of resource properties. A nested filter is satisfied if a single object in the list satisfies all Boolean expressions.</p> </li> <li> <p>A list of <code>SearchExpression</code> objects. A search expression object can be nested in a list of search expression objects.</p> </li> <li> <p>A Boolean operator: <code>And</code> or <code>Or</code>.</p> </li> </ul>
+
+        Attributes
+       ----------------------
+       filters: 	 <p>A list of filter objects.</p>
+       nested_filters: 	 <p>A list of nested filter objects.</p>
+       sub_expressions: 	 <p>A list of search expression objects.</p>
+       operator: 	 <p>A Boolean operator used to evaluate the search expression. If you want every conditional statement in all lists to be satisfied for the entire search expression to be true, specify <code>And</code>. If only a single conditional statement needs to be true for the entire search expression to be true, specify <code>Or</code>. The default value is <code>And</code>.</p>
+    """
+
+    filters: Optional[List[Filter]] = Unassigned()
+    nested_filters: Optional[List[NestedFilters]] = Unassigned()
+    sub_expressions: Optional[List["SearchExpression"]] = Unassigned()
+    operator: Optional[str] = Unassigned()
+
+
+class TrainingJob(Base):
+    """
+    TrainingJob
+         <p>Contains information about a training job.</p>
+
+        Attributes
+       ----------------------
+       training_job_name: 	 <p>The name of the training job.</p>
+       training_job_arn: 	 <p>The Amazon Resource Name (ARN) of the training job.</p>
+       tuning_job_arn: 	 <p>The Amazon Resource Name (ARN) of the associated hyperparameter tuning job if the training job was launched by a hyperparameter tuning job.</p>
+       labeling_job_arn: 	 <p>The Amazon Resource Name (ARN) of the labeling job.</p>
+       auto_m_l_job_arn: 	 <p>The Amazon Resource Name (ARN) of the job.</p>
+       model_artifacts: 	 <p>Information about the Amazon S3 location that is configured for storing model artifacts.</p>
+       training_job_status: 	 <p>The status of the training job.</p> <p>Training job statuses are:</p> <ul> <li> <p> <code>InProgress</code> - The training is in progress.</p> </li> <li> <p> <code>Completed</code> - The training job has completed.</p> </li> <li> <p> <code>Failed</code> - The training job has failed. To see the reason for the failure, see the <code>FailureReason</code> field in the response to a <code>DescribeTrainingJobResponse</code> call.</p> </li> <li> <p> <code>Stopping</code> - The training job is stopping.</p> </li> <li> <p> <code>Stopped</code> - The training job has stopped.</p> </li> </ul> <p>For more detailed information, see <code>SecondaryStatus</code>. </p>
+       secondary_status: 	 <p> Provides detailed information about the state of the training job. For detailed information about the secondary status of the training job, see <code>StatusMessage</code> under <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_SecondaryStatusTransition.html">SecondaryStatusTransition</a>.</p> <p>SageMaker provides primary statuses and secondary statuses that apply to each of them:</p> <dl> <dt>InProgress</dt> <dd> <ul> <li> <p> <code>Starting</code> - Starting the training job.</p> </li> <li> <p> <code>Downloading</code> - An optional stage for algorithms that support <code>File</code> training input mode. It indicates that data is being downloaded to the ML storage volumes.</p> </li> <li> <p> <code>Training</code> - Training is in progress.</p> </li> <li> <p> <code>Uploading</code> - Training is complete and the model artifacts are being uploaded to the S3 location.</p> </li> </ul> </dd> <dt>Completed</dt> <dd> <ul> <li> <p> <code>Completed</code> - The training job has completed.</p> </li> </ul> </dd> <dt>Failed</dt> <dd> <ul> <li> <p> <code>Failed</code> - The training job has failed. The reason for the failure is returned in the <code>FailureReason</code> field of <code>DescribeTrainingJobResponse</code>.</p> </li> </ul> </dd> <dt>Stopped</dt> <dd> <ul> <li> <p> <code>MaxRuntimeExceeded</code> - The job stopped because it exceeded the maximum allowed runtime.</p> </li> <li> <p> <code>Stopped</code> - The training job has stopped.</p> </li> </ul> </dd> <dt>Stopping</dt> <dd> <ul> <li> <p> <code>Stopping</code> - Stopping the training job.</p> </li> </ul> </dd> </dl> <important> <p>Valid values for <code>SecondaryStatus</code> are subject to change. </p> </important> <p>We no longer support the following secondary statuses:</p> <ul> <li> <p> <code>LaunchingMLInstances</code> </p> </li> <li> <p> <code>PreparingTrainingStack</code> </p> </li> <li> <p> <code>DownloadingTrainingImage</code> </p> </li> </ul>
+       failure_reason: 	 <p>If the training job failed, the reason it failed.</p>
+       hyper_parameters: 	 <p>Algorithm-specific parameters.</p>
+       algorithm_specification: 	 <p>Information about the algorithm used for training, and algorithm metadata.</p>
+       role_arn: 	 <p>The Amazon Web Services Identity and Access Management (IAM) role configured for the training job.</p>
+       input_data_config: 	 <p>An array of <code>Channel</code> objects that describes each data input channel.</p> <p>Your input must be in the same Amazon Web Services region as your training job.</p>
+       output_data_config: 	 <p>The S3 path where model artifacts that you configured when creating the job are stored. SageMaker creates subfolders for model artifacts.</p>
+       resource_config: 	 <p>Resources, including ML compute instances and ML storage volumes, that are configured for model training.</p>
+       vpc_config: 	 <p>A <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_VpcConfig.html">VpcConfig</a> object that specifies the VPC that this training job has access to. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/train-vpc.html">Protect Training Jobs by Using an Amazon Virtual Private Cloud</a>.</p>
+       stopping_condition: 	 <p>Specifies a limit to how long a model training job can run. It also specifies how long a managed Spot training job has to complete. When the job reaches the time limit, SageMaker ends the training job. Use this API to cap model training costs.</p> <p>To stop a job, SageMaker sends the algorithm the <code>SIGTERM</code> signal, which delays job termination for 120 seconds. Algorithms can use this 120-second window to save the model artifacts, so the results of training are not lost. </p>
+       creation_time: 	 <p>A timestamp that indicates when the training job was created.</p>
+       training_start_time: 	 <p>Indicates the time when the training job starts on training instances. You are billed for the time interval between this time and the value of <code>TrainingEndTime</code>. The start time in CloudWatch Logs might be later than this time. The difference is due to the time it takes to download the training data and to the size of the training container.</p>
+       training_end_time: 	 <p>Indicates the time when the training job ends on training instances. You are billed for the time interval between the value of <code>TrainingStartTime</code> and this time. For successful jobs and stopped jobs, this is the time after model artifacts are uploaded. For failed jobs, this is the time when SageMaker detects a job failure.</p>
+       last_modified_time: 	 <p>A timestamp that indicates when the status of the training job was last modified.</p>
+       secondary_status_transitions: 	 <p>A history of all of the secondary statuses that the training job has transitioned through.</p>
+       final_metric_data_list: 	 <p>A list of final metric values that are set when the training job completes. Used only if the training job was configured to use metrics.</p>
+       enable_network_isolation: 	 <p>If the <code>TrainingJob</code> was created with network isolation, the value is set to <code>true</code>. If network isolation is enabled, nodes can't communicate beyond the VPC they run in.</p>
+       enable_inter_container_traffic_encryption: 	 <p>To encrypt all communications between ML compute instances in distributed training, choose <code>True</code>. Encryption provides greater security for distributed training, but training might take longer. How long it takes depends on the amount of communication between compute instances, especially if you use a deep learning algorithm in distributed training.</p>
+       enable_managed_spot_training: 	 <p>When true, enables managed spot training using Amazon EC2 Spot instances to run training jobs instead of on-demand instances. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/model-managed-spot-training.html">Managed Spot Training</a>.</p>
+       checkpoint_config
+       training_time_in_seconds: 	 <p>The training time in seconds.</p>
+       billable_time_in_seconds: 	 <p>The billable time in seconds.</p>
+       debug_hook_config
+       experiment_config
+       debug_rule_configurations: 	 <p>Information about the debug rule configuration.</p>
+       tensor_board_output_config
+       debug_rule_evaluation_statuses: 	 <p>Information about the evaluation status of the rules for the training job.</p>
+       profiler_config
+       environment: 	 <p>The environment variables to set in the Docker container.</p>
+       retry_strategy: 	 <p>The number of times to retry the job when the job fails due to an <code>InternalServerError</code>.</p>
+       tags: 	 <p>An array of key-value pairs. You can use tags to categorize your Amazon Web Services resources in different ways, for example, by purpose, owner, or environment. For more information, see <a href="https://docs.aws.amazon.com/general/latest/gr/aws_tagging.html">Tagging Amazon Web Services Resources</a>.</p>
+    """
+
+    training_job_name: Optional[str] = Unassigned()
+    training_job_arn: Optional[str] = Unassigned()
+    tuning_job_arn: Optional[str] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    auto_m_l_job_arn: Optional[str] = Unassigned()
+    model_artifacts: Optional[ModelArtifacts] = Unassigned()
+    training_job_status: Optional[str] = Unassigned()
+    secondary_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    hyper_parameters: Optional[Dict[str, str]] = Unassigned()
+    algorithm_specification: Optional[AlgorithmSpecification] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    input_data_config: Optional[List[Channel]] = Unassigned()
+    output_data_config: Optional[OutputDataConfig] = Unassigned()
+    resource_config: Optional[ResourceConfig] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+    stopping_condition: Optional[StoppingCondition] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    training_start_time: Optional[datetime.datetime] = Unassigned()
+    training_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    secondary_status_transitions: Optional[List[SecondaryStatusTransition]] = (
+        Unassigned()
+    )
+    final_metric_data_list: Optional[List[MetricData]] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    enable_managed_spot_training: Optional[bool] = Unassigned()
+    checkpoint_config: Optional[CheckpointConfig] = Unassigned()
+    training_time_in_seconds: Optional[int] = Unassigned()
+    billable_time_in_seconds: Optional[int] = Unassigned()
+    debug_hook_config: Optional[DebugHookConfig] = Unassigned()
+    experiment_config: Optional[ExperimentConfig] = Unassigned()
+    debug_rule_configurations: Optional[List[DebugRuleConfiguration]] = Unassigned()
+    tensor_board_output_config: Optional[TensorBoardOutputConfig] = Unassigned()
+    debug_rule_evaluation_statuses: Optional[List[DebugRuleEvaluationStatus]] = (
+        Unassigned()
+    )
+    profiler_config: Optional[ProfilerConfig] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    retry_strategy: Optional[RetryStrategy] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+
+
+class TrialComponentSimpleSummary(Base):
+    """
+    TrialComponentSimpleSummary
+         <p>A short summary of a trial component.</p>
+
+        Attributes
+       ----------------------
+       trial_component_name: 	 <p>The name of the trial component.</p>
+       trial_component_arn: 	 <p>The Amazon Resource Name (ARN) of the trial component.</p>
+       trial_component_source
+       creation_time: 	 <p>When the component was created.</p>
+       created_by
+    """
+
+    trial_component_name: Optional[str] = Unassigned()
+    trial_component_arn: Optional[str] = Unassigned()
+    trial_component_source: Optional[TrialComponentSource] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+
+
+class Trial(Base):
+    """
+    Trial
+         <p>The properties of a trial as returned by the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API.</p>
+
+        Attributes
+       ----------------------
+       trial_name: 	 <p>The name of the trial.</p>
+       trial_arn: 	 <p>The Amazon Resource Name (ARN) of the trial.</p>
+       display_name: 	 <p>The name of the trial as displayed. If <code>DisplayName</code> isn't specified, <code>TrialName</code> is displayed.</p>
+       experiment_name: 	 <p>The name of the experiment the trial is part of.</p>
+       source
+       creation_time: 	 <p>When the trial was created.</p>
+       created_by: 	 <p>Who created the trial.</p>
+       last_modified_time: 	 <p>Who last modified the trial.</p>
+       last_modified_by
+       metadata_properties
+       tags: 	 <p>The list of tags that are associated with the trial. You can use <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API to search on the tags.</p>
+       trial_component_summaries: 	 <p>A list of the components associated with the trial. For each component, a summary of the component's properties is included.</p>
+    """
+
+    trial_name: Optional[str] = Unassigned()
+    trial_arn: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    experiment_name: Optional[str] = Unassigned()
+    source: Optional[TrialSource] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    trial_component_summaries: Optional[List[TrialComponentSimpleSummary]] = (
+        Unassigned()
+    )
+
+
+class TrialComponentSourceDetail(Base):
+    """
+    TrialComponentSourceDetail
+         <p>Detailed information about the source of a trial component. Either <code>ProcessingJob</code> or <code>TrainingJob</code> is returned.</p>
+
+        Attributes
+       ----------------------
+       source_arn: 	 <p>The Amazon Resource Name (ARN) of the source.</p>
+       training_job: 	 <p>Information about a training job that's the source of a trial component.</p>
+       processing_job: 	 <p>Information about a processing job that's the source of a trial component.</p>
+       transform_job: 	 <p>Information about a transform job that's the source of a trial component.</p>
+    """
+
+    source_arn: Optional[str] = Unassigned()
+    training_job: Optional[TrainingJob] = Unassigned()
+    processing_job: Optional[ProcessingJob] = Unassigned()
+    transform_job: Optional[TransformJob] = Unassigned()
+
+
+class TrialComponent(Base):
+    """
+    TrialComponent
+         <p>The properties of a trial component as returned by the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API.</p>
+
+        Attributes
+       ----------------------
+       trial_component_name: 	 <p>The name of the trial component.</p>
+       display_name: 	 <p>The name of the component as displayed. If <code>DisplayName</code> isn't specified, <code>TrialComponentName</code> is displayed.</p>
+       trial_component_arn: 	 <p>The Amazon Resource Name (ARN) of the trial component.</p>
+       source: 	 <p>The Amazon Resource Name (ARN) and job type of the source of the component.</p>
+       status
+       start_time: 	 <p>When the component started.</p>
+       end_time: 	 <p>When the component ended.</p>
+       creation_time: 	 <p>When the component was created.</p>
+       created_by: 	 <p>Who created the trial component.</p>
+       last_modified_time: 	 <p>When the component was last modified.</p>
+       last_modified_by
+       parameters: 	 <p>The hyperparameters of the component.</p>
+       input_artifacts: 	 <p>The input artifacts of the component.</p>
+       output_artifacts: 	 <p>The output artifacts of the component.</p>
+       metrics: 	 <p>The metrics for the component.</p>
+       metadata_properties
+       source_detail: 	 <p>Details of the source of the component.</p>
+       lineage_group_arn: 	 <p>The Amazon Resource Name (ARN) of the lineage group resource.</p>
+       tags: 	 <p>The list of tags that are associated with the component. You can use <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API to search on the tags.</p>
+       parents: 	 <p>An array of the parents of the component. A parent is a trial the component is associated with and the experiment the trial is part of. A component might not have any parents.</p>
+       run_name: 	 <p>The name of the experiment run.</p>
+    """
+
+    trial_component_name: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    trial_component_arn: Optional[str] = Unassigned()
+    source: Optional[TrialComponentSource] = Unassigned()
+    status: Optional[TrialComponentStatus] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
+    parameters: Optional[Dict[str, TrialComponentParameterValue]] = Unassigned()
+    input_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned()
+    output_artifacts: Optional[Dict[str, TrialComponentArtifact]] = Unassigned()
+    metrics: Optional[List[TrialComponentMetricSummary]] = Unassigned()
+    metadata_properties: Optional[MetadataProperties] = Unassigned()
+    source_detail: Optional[TrialComponentSourceDetail] = Unassigned()
+    lineage_group_arn: Optional[str] = Unassigned()
+    tags: Optional[List[Tag]] = Unassigned()
+    parents: Optional[List[Parent]] = Unassigned()
+    run_name: Optional[str] = Unassigned()
+
+
+class SearchRecord(Base):
+    """
+    SearchRecord
+         <p>A single resource returned as part of the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_Search.html">Search</a> API response.</p>
+
+        Attributes
+       ----------------------
+       training_job: 	 <p>The properties of a training job.</p>
+       experiment: 	 <p>The properties of an experiment.</p>
+       trial: 	 <p>The properties of a trial.</p>
+       trial_component: 	 <p>The properties of a trial component.</p>
+       endpoint
+       model_package
+       model_package_group
+       pipeline
+       pipeline_execution
+       feature_group
+       feature_metadata: 	 <p>The feature metadata used to search through the features.</p>
+       project: 	 <p>The properties of a project.</p>
+       hyper_parameter_tuning_job: 	 <p>The properties of a hyperparameter tuning job.</p>
+       model_card: 	 <p>An Amazon SageMaker Model Card that documents details about a machine learning model.</p>
+       model
+    """
+
+    training_job: Optional[TrainingJob] = Unassigned()
+    experiment: Optional[Experiment] = Unassigned()
+    trial: Optional[Trial] = Unassigned()
+    trial_component: Optional[TrialComponent] = Unassigned()
+    endpoint: Optional[Endpoint] = Unassigned()
+    model_package: Optional[ModelPackage] = Unassigned()
+    model_package_group: Optional[ModelPackageGroup] = Unassigned()
+    pipeline: Optional[Pipeline] = Unassigned()
+    pipeline_execution: Optional[PipelineExecution] = Unassigned()
+    feature_group: Optional[FeatureGroup] = Unassigned()
+    feature_metadata: Optional[FeatureMetadata] = Unassigned()
+    project: Optional[Project] = Unassigned()
+    hyper_parameter_tuning_job: Optional[HyperParameterTuningJobSearchEntity] = (
+        Unassigned()
+    )
+    model_card: Optional[ModelCard] = Unassigned()
+    model: Optional[ModelDashboardModel] = Unassigned()
+
+
+class VisibilityConditions(Base):
+    """
+    VisibilityConditions
+         <p>The list of key-value pairs used to filter your search results. If a search result contains a key from your list, it is included in the final search response if the value associated with the key in the result matches the value you specified. If the value doesn't match, the result is excluded from the search response. Any resources that don't have a key from the list that you've provided will also be included in the search response.</p>
+
+        Attributes
+       ----------------------
+       key: 	 <p>The key that specifies the tag that you're using to filter the search results. It must be in the following format: <code>Tags.&lt;key&gt;</code>.</p>
+       value: 	 <p>The value for the tag that you're using to filter the search results.</p>
+    """
+
+    key: Optional[str] = Unassigned()
+    value: Optional[str] = Unassigned()
@@ -0,0 +1,196 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .capture_content_type_header import CaptureContentTypeHeader
+
+
+class InferenceExperimentSchedule(Base):
+    """
+    InferenceExperimentSchedule
+         <p>The start and end times of an inference experiment.</p> <p>The maximum duration that you can set for an inference experiment is 30 days.</p>
+
+        Attributes
+       ----------------------
+       start_time: 	 <p>The timestamp at which the inference experiment started or will start.</p>
+       end_time: 	 <p>The timestamp at which the inference experiment ended or will end.</p>
+    """
+
+    start_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+
+
+class RealTimeInferenceConfig(Base):
+    """
+    RealTimeInferenceConfig
+         <p>The infrastructure configuration for deploying the model to a real-time inference endpoint.</p>
+
+        Attributes
+       ----------------------
+       instance_type: 	 <p>The instance type the model is deployed to.</p>
+       instance_count: 	 <p>The number of instances of the type specified by <code>InstanceType</code>.</p>
+    """
+
+    instance_type: str
+    instance_count: int
+
+
+class ModelInfrastructureConfig(Base):
+    """
+    ModelInfrastructureConfig
+         <p>The configuration for the infrastructure that the model will be deployed to.</p>
+
+        Attributes
+       ----------------------
+       infrastructure_type: 	 <p>The inference option to which to deploy your model. Possible values are the following:</p> <ul> <li> <p> <code>RealTime</code>: Deploy to real-time inference.</p> </li> </ul>
+       real_time_inference_config: 	 <p>The infrastructure configuration for deploying the model to real-time inference.</p>
+    """
+
+    infrastructure_type: str
+    real_time_inference_config: RealTimeInferenceConfig
+
+
+class ModelVariantConfig(Base):
+    """
+    ModelVariantConfig
+         <p>Contains information about the deployment options of a model.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the Amazon SageMaker Model entity.</p>
+       variant_name: 	 <p>The name of the variant.</p>
+       infrastructure_config: 	 <p>The configuration for the infrastructure that the model will be deployed to.</p>
+    """
+
+    model_name: str
+    variant_name: str
+    infrastructure_config: ModelInfrastructureConfig
+
+
+class InferenceExperimentDataStorageConfig(Base):
+    """
+    InferenceExperimentDataStorageConfig
+         <p>The Amazon S3 location and configuration for storing inference request and response data.</p>
+
+        Attributes
+       ----------------------
+       destination: 	 <p>The Amazon S3 bucket where the inference request and response data is stored. </p>
+       kms_key: 	 <p> The Amazon Web Services Key Management Service key that Amazon SageMaker uses to encrypt captured data at rest using Amazon S3 server-side encryption. </p>
+       content_type
+    """
+
+    destination: str
+    kms_key: Optional[str] = Unassigned()
+    content_type: Optional[CaptureContentTypeHeader] = Unassigned()
+
+
+class ShadowModelVariantConfig(Base):
+    """
+    ShadowModelVariantConfig
+         <p>The name and sampling percentage of a shadow variant.</p>
+
+        Attributes
+       ----------------------
+       shadow_model_variant_name: 	 <p>The name of the shadow variant.</p>
+       sampling_percentage: 	 <p> The percentage of inference requests that Amazon SageMaker replicates from the production variant to the shadow variant. </p>
+    """
+
+    shadow_model_variant_name: str
+    sampling_percentage: int
+
+
+class ShadowModeConfig(Base):
+    """
+    ShadowModeConfig
+         <p> The configuration of <code>ShadowMode</code> inference experiment type, which specifies a production variant to take all the inference requests, and a shadow variant to which Amazon SageMaker replicates a percentage of the inference requests. For the shadow variant it also specifies the percentage of requests that Amazon SageMaker replicates. </p>
+
+        Attributes
+       ----------------------
+       source_model_variant_name: 	 <p> The name of the production variant, which takes all the inference requests. </p>
+       shadow_model_variants: 	 <p>List of shadow variant configurations.</p>
+    """
+
+    source_model_variant_name: str
+    shadow_model_variants: List[ShadowModelVariantConfig]
+
+
+class EndpointMetadata(Base):
+    """
+    EndpointMetadata
+         <p>The metadata of the endpoint.</p>
+
+        Attributes
+       ----------------------
+       endpoint_name: 	 <p>The name of the endpoint.</p>
+       endpoint_config_name: 	 <p>The name of the endpoint configuration.</p>
+       endpoint_status: 	 <p> The status of the endpoint. For possible values of the status of an endpoint, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_EndpointSummary.html">EndpointSummary</a>. </p>
+       failure_reason: 	 <p> If the status of the endpoint is <code>Failed</code>, or the status is <code>InService</code> but update operation fails, this provides the reason why it failed. </p>
+    """
+
+    endpoint_name: str
+    endpoint_config_name: Optional[str] = Unassigned()
+    endpoint_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+
+
+class ModelVariantConfigSummary(Base):
+    """
+    ModelVariantConfigSummary
+         <p>Summary of the deployment configuration of a model.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the Amazon SageMaker Model entity.</p>
+       variant_name: 	 <p>The name of the variant.</p>
+       infrastructure_config: 	 <p>The configuration of the infrastructure that the model has been deployed to.</p>
+       status: 	 <p>The status of deployment for the model variant on the hosted inference endpoint.</p> <ul> <li> <p> <code>Creating</code> - Amazon SageMaker is preparing the model variant on the hosted inference endpoint. </p> </li> <li> <p> <code>InService</code> - The model variant is running on the hosted inference endpoint. </p> </li> <li> <p> <code>Updating</code> - Amazon SageMaker is updating the model variant on the hosted inference endpoint. </p> </li> <li> <p> <code>Deleting</code> - Amazon SageMaker is deleting the model variant on the hosted inference endpoint. </p> </li> <li> <p> <code>Deleted</code> - The model variant has been deleted on the hosted inference endpoint. This can only happen after stopping the experiment. </p> </li> </ul>
+    """
+
+    model_name: str
+    variant_name: str
+    infrastructure_config: ModelInfrastructureConfig
+    status: str
+
+
+class InferenceExperimentSummary(Base):
+    """
+    InferenceExperimentSummary
+         <p>Lists a summary of properties of an inference experiment.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the inference experiment.</p>
+       type: 	 <p>The type of the inference experiment.</p>
+       schedule: 	 <p>The duration for which the inference experiment ran or will run.</p> <p>The maximum duration that you can set for an inference experiment is 30 days.</p>
+       status: 	 <p>The status of the inference experiment.</p>
+       status_reason: 	 <p>The error message for the inference experiment status result.</p>
+       description: 	 <p>The description of the inference experiment.</p>
+       creation_time: 	 <p>The timestamp at which the inference experiment was created.</p>
+       completion_time: 	 <p>The timestamp at which the inference experiment was completed.</p>
+       last_modified_time: 	 <p>The timestamp when you last modified the inference experiment.</p>
+       role_arn: 	 <p> The ARN of the IAM role that Amazon SageMaker can assume to access model artifacts and container images, and manage Amazon SageMaker Inference endpoints for model deployment. </p>
+    """
+
+    name: str
+    type: str
+    status: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    schedule: Optional[InferenceExperimentSchedule] = Unassigned()
+    status_reason: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    completion_time: Optional[datetime.datetime] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ExperimentConfig(Base):
+    """
+    ExperimentConfig
+         <p>Associates a SageMaker job as a trial component with an experiment and trial. Specified when you call the following APIs:</p> <ul> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateProcessingJob.html">CreateProcessingJob</a> </p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrainingJob.html">CreateTrainingJob</a> </p> </li> <li> <p> <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTransformJob.html">CreateTransformJob</a> </p> </li> </ul>
+
+        Attributes
+       ----------------------
+       experiment_name: 	 <p>The name of an existing experiment to associate with the trial component.</p>
+       trial_name: 	 <p>The name of an existing trial to associate the trial component with. If not specified, a new trial is created.</p>
+       trial_component_display_name: 	 <p>The display name for the trial component. If this key isn't specified, the display name is the trial component name.</p>
+       run_name: 	 <p>The name of the experiment run to associate with the trial component.</p>
+    """
+
+    experiment_name: Optional[str] = Unassigned()
+    trial_name: Optional[str] = Unassigned()
+    trial_component_display_name: Optional[str] = Unassigned()
+    run_name: Optional[str] = Unassigned()
@@ -0,0 +1,55 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ExperimentSource(Base):
+    """
+    ExperimentSource
+         <p>The source of the experiment.</p>
+
+        Attributes
+       ----------------------
+       source_arn: 	 <p>The Amazon Resource Name (ARN) of the source.</p>
+       source_type: 	 <p>The source type.</p>
+    """
+
+    source_arn: str
+    source_type: Optional[str] = Unassigned()
+
+
+class ExperimentSummary(Base):
+    """
+    ExperimentSummary
+         <p>A summary of the properties of an experiment. To get the complete set of properties, call the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DescribeExperiment.html">DescribeExperiment</a> API and provide the <code>ExperimentName</code>.</p>
+
+        Attributes
+       ----------------------
+       experiment_arn: 	 <p>The Amazon Resource Name (ARN) of the experiment.</p>
+       experiment_name: 	 <p>The name of the experiment.</p>
+       display_name: 	 <p>The name of the experiment as displayed. If <code>DisplayName</code> isn't specified, <code>ExperimentName</code> is displayed.</p>
+       experiment_source
+       creation_time: 	 <p>When the experiment was created.</p>
+       last_modified_time: 	 <p>When the experiment was last modified.</p>
+    """
+
+    experiment_arn: Optional[str] = Unassigned()
+    experiment_name: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    experiment_source: Optional[ExperimentSource] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
@@ -0,0 +1,32 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class FeatureParameter(Base):
+    """
+    FeatureParameter
+         <p>A key-value pair that you specify to describe the feature.</p>
+
+        Attributes
+       ----------------------
+       key: 	 <p>A key that must contain a value to describe the feature.</p>
+       value: 	 <p>The value that belongs to a key.</p>
+    """
+
+    key: Optional[str] = Unassigned()
+    value: Optional[str] = Unassigned()
@@ -0,0 +1,122 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .public_workforce_task_price import PublicWorkforceTaskPrice
+
+
+class HumanLoopRequestSource(Base):
+    """
+    HumanLoopRequestSource
+         <p>Container for configuring the source of human task requests.</p>
+
+        Attributes
+       ----------------------
+       aws_managed_human_loop_request_source: 	 <p>Specifies whether Amazon Rekognition or Amazon Textract are used as the integration source. The default field settings and JSON parsing rules are different based on the integration source. Valid values:</p>
+    """
+
+    aws_managed_human_loop_request_source: str
+
+
+class HumanLoopActivationConditionsConfig(Base):
+    """
+    HumanLoopActivationConditionsConfig
+         <p>Defines under what conditions SageMaker creates a human loop. Used within <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateFlowDefinition.html">CreateFlowDefinition</a>. See <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_HumanLoopActivationConditionsConfig.html">HumanLoopActivationConditionsConfig</a> for the required format of activation conditions.</p>
+
+        Attributes
+       ----------------------
+       human_loop_activation_conditions: 	 <p>JSON expressing use-case specific conditions declaratively. If any condition is matched, atomic tasks are created against the configured work team. The set of conditions is different for Rekognition and Textract. For more information about how to structure the JSON, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/a2i-human-fallback-conditions-json-schema.html">JSON Schema for Human Loop Activation Conditions in Amazon Augmented AI</a> in the <i>Amazon SageMaker Developer Guide</i>.</p>
+    """
+
+    human_loop_activation_conditions: str
+
+
+class HumanLoopActivationConfig(Base):
+    """
+    HumanLoopActivationConfig
+         <p>Provides information about how and under what conditions SageMaker creates a human loop. If <code>HumanLoopActivationConfig</code> is not given, then all requests go to humans.</p>
+
+        Attributes
+       ----------------------
+       human_loop_activation_conditions_config: 	 <p>Container structure for defining under what conditions SageMaker creates a human loop.</p>
+    """
+
+    human_loop_activation_conditions_config: HumanLoopActivationConditionsConfig
+
+
+class HumanLoopConfig(Base):
+    """
+    HumanLoopConfig
+         <p>Describes the work to be performed by human workers.</p>
+
+        Attributes
+       ----------------------
+       workteam_arn: 	 <p>Amazon Resource Name (ARN) of a team of workers. To learn more about the types of workforces and work teams you can create and use with Amazon A2I, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/sms-workforce-management.html">Create and Manage Workforces</a>.</p>
+       human_task_ui_arn: 	 <p>The Amazon Resource Name (ARN) of the human task user interface.</p> <p>You can use standard HTML and Crowd HTML Elements to create a custom worker task template. You use this template to create a human task UI.</p> <p>To learn how to create a custom HTML template, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/a2i-custom-templates.html">Create Custom Worker Task Template</a>.</p> <p>To learn how to create a human task UI, which is a worker task template that can be used in a flow definition, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/a2i-worker-template-console.html">Create and Delete a Worker Task Templates</a>.</p>
+       task_title: 	 <p>A title for the human worker task.</p>
+       task_description: 	 <p>A description for the human worker task.</p>
+       task_count: 	 <p>The number of distinct workers who will perform the same task on each object. For example, if <code>TaskCount</code> is set to <code>3</code> for an image classification labeling job, three workers will classify each input image. Increasing <code>TaskCount</code> can improve label accuracy.</p>
+       task_availability_lifetime_in_seconds: 	 <p>The length of time that a task remains available for review by human workers.</p>
+       task_time_limit_in_seconds: 	 <p>The amount of time that a worker has to complete a task. The default value is 3,600 seconds (1 hour).</p>
+       task_keywords: 	 <p>Keywords used to describe the task so that workers can discover the task.</p>
+       public_workforce_task_price
+    """
+
+    workteam_arn: str
+    human_task_ui_arn: str
+    task_title: str
+    task_description: str
+    task_count: int
+    task_availability_lifetime_in_seconds: Optional[int] = Unassigned()
+    task_time_limit_in_seconds: Optional[int] = Unassigned()
+    task_keywords: Optional[List[str]] = Unassigned()
+    public_workforce_task_price: Optional[PublicWorkforceTaskPrice] = Unassigned()
+
+
+class FlowDefinitionOutputConfig(Base):
+    """
+    FlowDefinitionOutputConfig
+         <p>Contains information about where human output will be stored.</p>
+
+        Attributes
+       ----------------------
+       s3_output_path: 	 <p>The Amazon S3 path where the object containing human output will be made available.</p> <p>To learn more about the format of Amazon A2I output data, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/a2i-output-data.html">Amazon A2I Output Data</a>.</p>
+       kms_key_id: 	 <p>The Amazon Key Management Service (KMS) key ID for server-side encryption.</p>
+    """
+
+    s3_output_path: str
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class FlowDefinitionSummary(Base):
+    """
+    FlowDefinitionSummary
+         <p>Contains summary information about the flow definition.</p>
+
+        Attributes
+       ----------------------
+       flow_definition_name: 	 <p>The name of the flow definition.</p>
+       flow_definition_arn: 	 <p>The Amazon Resource Name (ARN) of the flow definition.</p>
+       flow_definition_status: 	 <p>The status of the flow definition. Valid values:</p>
+       creation_time: 	 <p>The timestamp when SageMaker created the flow definition.</p>
+       failure_reason: 	 <p>The reason why the flow definition creation failed. A failure reason is returned only when the flow definition status is <code>Failed</code>.</p>
+    """
+
+    flow_definition_name: str
+    flow_definition_arn: str
+    flow_definition_status: str
+    creation_time: datetime.datetime
+    failure_reason: Optional[str] = Unassigned()
@@ -0,0 +1,47 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class GitConfig(Base):
+    """
+    GitConfig
+         <p>Specifies configuration details for a Git repository in your Amazon Web Services account.</p>
+
+        Attributes
+       ----------------------
+       repository_url: 	 <p>The URL where the Git repository is located.</p>
+       branch: 	 <p>The default branch for the Git repository.</p>
+       secret_arn: 	 <p>The Amazon Resource Name (ARN) of the Amazon Web Services Secrets Manager secret that contains the credentials used to access the git repository. The secret must have a staging label of <code>AWSCURRENT</code> and must be in the following format:</p> <p> <code>{"username": <i>UserName</i>, "password": <i>Password</i>}</code> </p>
+    """
+
+    repository_url: str
+    branch: Optional[str] = Unassigned()
+    secret_arn: Optional[str] = Unassigned()
+
+
+class GitConfigForUpdate(Base):
+    """
+    GitConfigForUpdate
+         <p>Specifies configuration details for a Git repository when the repository is updated.</p>
+
+        Attributes
+       ----------------------
+       secret_arn: 	 <p>The Amazon Resource Name (ARN) of the Amazon Web Services Secrets Manager secret that contains the credentials used to access the git repository. The secret must have a staging label of <code>AWSCURRENT</code> and must be in the following format:</p> <p> <code>{"username": <i>UserName</i>, "password": <i>Password</i>}</code> </p>
+    """
+
+    secret_arn: Optional[str] = Unassigned()
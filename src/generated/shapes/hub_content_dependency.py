@@ -0,0 +1,63 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class HubContentDependency(Base):
+    """
+    HubContentDependency
+         <p>Any dependencies related to hub content, such as scripts, model artifacts, datasets, or notebooks.</p>
+
+        Attributes
+       ----------------------
+       dependency_origin_path: 	 <p>The hub content dependency origin path.</p>
+       dependency_copy_path: 	 <p>The hub content dependency copy path.</p>
+    """
+
+    dependency_origin_path: Optional[str] = Unassigned()
+    dependency_copy_path: Optional[str] = Unassigned()
+
+
+class HubContentInfo(Base):
+    """
+    HubContentInfo
+         <p>Information about hub content.</p>
+
+        Attributes
+       ----------------------
+       hub_content_name: 	 <p>The name of the hub content.</p>
+       hub_content_arn: 	 <p>The Amazon Resource Name (ARN) of the hub content.</p>
+       hub_content_version: 	 <p>The version of the hub content.</p>
+       hub_content_type: 	 <p>The type of hub content.</p>
+       document_schema_version: 	 <p>The version of the hub content document schema.</p>
+       hub_content_display_name: 	 <p>The display name of the hub content.</p>
+       hub_content_description: 	 <p>A description of the hub content.</p>
+       hub_content_search_keywords: 	 <p>The searchable keywords for the hub content.</p>
+       hub_content_status: 	 <p>The status of the hub content.</p>
+       creation_time: 	 <p>The date and time that the hub content was created.</p>
+    """
+
+    hub_content_name: str
+    hub_content_arn: str
+    hub_content_version: str
+    hub_content_type: str
+    document_schema_version: str
+    hub_content_status: str
+    creation_time: datetime.datetime
+    hub_content_display_name: Optional[str] = Unassigned()
+    hub_content_description: Optional[str] = Unassigned()
+    hub_content_search_keywords: Optional[List[str]] = Unassigned()
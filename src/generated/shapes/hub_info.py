@@ -0,0 +1,57 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class HubS3StorageConfig(Base):
+    """
+    HubS3StorageConfig
+         <p>The Amazon S3 storage configuration of a hub.</p>
+
+        Attributes
+       ----------------------
+       s3_output_path: 	 <p>The Amazon S3 bucket prefix for hosting hub content.</p>
+    """
+
+    s3_output_path: Optional[str] = Unassigned()
+
+
+class HubInfo(Base):
+    """
+    HubInfo
+         <p>Information about a hub.</p>
+
+        Attributes
+       ----------------------
+       hub_name: 	 <p>The name of the hub.</p>
+       hub_arn: 	 <p>The Amazon Resource Name (ARN) of the hub.</p>
+       hub_display_name: 	 <p>The display name of the hub.</p>
+       hub_description: 	 <p>A description of the hub.</p>
+       hub_search_keywords: 	 <p>The searchable keywords for the hub.</p>
+       hub_status: 	 <p>The status of the hub.</p>
+       creation_time: 	 <p>The date and time that the hub was created.</p>
+       last_modified_time: 	 <p>The date and time that the hub was last modified.</p>
+    """
+
+    hub_name: str
+    hub_arn: str
+    hub_status: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    hub_display_name: Optional[str] = Unassigned()
+    hub_description: Optional[str] = Unassigned()
+    hub_search_keywords: Optional[List[str]] = Unassigned()
@@ -0,0 +1,62 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class UiTemplate(Base):
+    """
+    UiTemplate
+         <p>The Liquid template for the worker user interface.</p>
+
+        Attributes
+       ----------------------
+       content: 	 <p>The content of the Liquid template for the worker user interface.</p>
+    """
+
+    content: str
+
+
+class UiTemplateInfo(Base):
+    """
+    UiTemplateInfo
+         <p>Container for user interface template information.</p>
+
+        Attributes
+       ----------------------
+       url: 	 <p>The URL for the user interface template.</p>
+       content_sha256: 	 <p>The SHA-256 digest of the contents of the template.</p>
+    """
+
+    url: Optional[str] = Unassigned()
+    content_sha256: Optional[str] = Unassigned()
+
+
+class HumanTaskUiSummary(Base):
+    """
+    HumanTaskUiSummary
+         <p>Container for human task user interface information.</p>
+
+        Attributes
+       ----------------------
+       human_task_ui_name: 	 <p>The name of the human task user interface.</p>
+       human_task_ui_arn: 	 <p>The Amazon Resource Name (ARN) of the human task user interface.</p>
+       creation_time: 	 <p>A timestamp when SageMaker created the human task user interface.</p>
+    """
+
+    human_task_ui_name: str
+    human_task_ui_arn: str
+    creation_time: datetime.datetime
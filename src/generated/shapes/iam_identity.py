@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class IamIdentity(Base):
+    """
+    IamIdentity
+         <p>The IAM Identity details associated with the user. These details are associated with model package groups, model packages and project entities only.</p>
+
+        Attributes
+       ----------------------
+       arn: 	 <p>The Amazon Resource Name (ARN) of the IAM identity.</p>
+       principal_id: 	 <p>The ID of the principal that assumes the IAM identity.</p>
+       source_identity: 	 <p>The person or application which assumes the IAM identity.</p>
+    """
+
+    arn: Optional[str] = Unassigned()
+    principal_id: Optional[str] = Unassigned()
+    source_identity: Optional[str] = Unassigned()
+
+
+class UserContext(Base):
+    """
+    UserContext
+         <p>Information about the user who created or modified an experiment, trial, trial component, lineage group, project, or model card.</p>
+
+        Attributes
+       ----------------------
+       user_profile_arn: 	 <p>The Amazon Resource Name (ARN) of the user's profile.</p>
+       user_profile_name: 	 <p>The name of the user's profile.</p>
+       domain_id: 	 <p>The domain associated with the user.</p>
+       iam_identity: 	 <p>The IAM Identity details associated with the user. These details are associated with model package groups, model packages, and project entities only.</p>
+    """
+
+    user_profile_arn: Optional[str] = Unassigned()
+    user_profile_name: Optional[str] = Unassigned()
+    domain_id: Optional[str] = Unassigned()
+    iam_identity: Optional[IamIdentity] = Unassigned()
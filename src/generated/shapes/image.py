@@ -0,0 +1,44 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class Image(Base):
+    """
+    Image
+         <p>A SageMaker image. A SageMaker image represents a set of container images that are derived from a common base container image. Each of these container images is represented by a SageMaker <code>ImageVersion</code>.</p>
+
+        Attributes
+       ----------------------
+       creation_time: 	 <p>When the image was created.</p>
+       description: 	 <p>The description of the image.</p>
+       display_name: 	 <p>The name of the image as displayed.</p>
+       failure_reason: 	 <p>When a create, update, or delete operation fails, the reason for the failure.</p>
+       image_arn: 	 <p>The ARN of the image.</p>
+       image_name: 	 <p>The name of the image.</p>
+       image_status: 	 <p>The status of the image.</p>
+       last_modified_time: 	 <p>When the image was last modified.</p>
+    """
+
+    creation_time: datetime.datetime
+    image_arn: str
+    image_name: str
+    image_status: str
+    last_modified_time: datetime.datetime
+    description: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
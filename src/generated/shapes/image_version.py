@@ -0,0 +1,42 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ImageVersion(Base):
+    """
+    ImageVersion
+         <p>A version of a SageMaker <code>Image</code>. A version represents an existing container image.</p>
+
+        Attributes
+       ----------------------
+       creation_time: 	 <p>When the version was created.</p>
+       failure_reason: 	 <p>When a create or delete operation fails, the reason for the failure.</p>
+       image_arn: 	 <p>The ARN of the image the version is based on.</p>
+       image_version_arn: 	 <p>The ARN of the version.</p>
+       image_version_status: 	 <p>The status of the version.</p>
+       last_modified_time: 	 <p>When the version was last modified.</p>
+       version: 	 <p>The version number.</p>
+    """
+
+    creation_time: datetime.datetime
+    image_arn: str
+    image_version_arn: str
+    image_version_status: str
+    last_modified_time: datetime.datetime
+    version: int
+    failure_reason: Optional[str] = Unassigned()
@@ -0,0 +1,181 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .deployed_image import DeployedImage
+
+
+class InferenceComponentContainerSpecification(Base):
+    """
+    InferenceComponentContainerSpecification
+         <p>Defines a container that provides the runtime environment for a model that you deploy with an inference component.</p>
+
+        Attributes
+       ----------------------
+       image: 	 <p>The Amazon Elastic Container Registry (Amazon ECR) path where the Docker image for the model is stored.</p>
+       artifact_url: 	 <p>The Amazon S3 path where the model artifacts, which result from model training, are stored. This path must point to a single gzip compressed tar archive (.tar.gz suffix).</p>
+       environment: 	 <p>The environment variables to set in the Docker container. Each key and value in the Environment string-to-string map can have length of up to 1024. We support up to 16 entries in the map.</p>
+    """
+
+    image: Optional[str] = Unassigned()
+    artifact_url: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class InferenceComponentStartupParameters(Base):
+    """
+    InferenceComponentStartupParameters
+         <p>Settings that take effect while the model container starts up.</p>
+
+        Attributes
+       ----------------------
+       model_data_download_timeout_in_seconds: 	 <p>The timeout value, in seconds, to download and extract the model that you want to host from Amazon S3 to the individual inference instance associated with this inference component.</p>
+       container_startup_health_check_timeout_in_seconds: 	 <p>The timeout value, in seconds, for your inference container to pass health check by Amazon S3 Hosting. For more information about health check, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/your-algorithms-inference-code.html#your-algorithms-inference-algo-ping-requests">How Your Container Should Respond to Health Check (Ping) Requests</a>.</p>
+    """
+
+    model_data_download_timeout_in_seconds: Optional[int] = Unassigned()
+    container_startup_health_check_timeout_in_seconds: Optional[int] = Unassigned()
+
+
+class InferenceComponentComputeResourceRequirements(Base):
+    """
+    InferenceComponentComputeResourceRequirements
+         <p>Defines the compute resources to allocate to run a model that you assign to an inference component. These resources include CPU cores, accelerators, and memory.</p>
+
+        Attributes
+       ----------------------
+       number_of_cpu_cores_required: 	 <p>The number of CPU cores to allocate to run a model that you assign to an inference component.</p>
+       number_of_accelerator_devices_required: 	 <p>The number of accelerators to allocate to run a model that you assign to an inference component. Accelerators include GPUs and Amazon Web Services Inferentia.</p>
+       min_memory_required_in_mb: 	 <p>The minimum MB of memory to allocate to run a model that you assign to an inference component.</p>
+       max_memory_required_in_mb: 	 <p>The maximum MB of memory to allocate to run a model that you assign to an inference component.</p>
+    """
+
+    min_memory_required_in_mb: int
+    number_of_cpu_cores_required: Optional[float] = Unassigned()
+    number_of_accelerator_devices_required: Optional[float] = Unassigned()
+    max_memory_required_in_mb: Optional[int] = Unassigned()
+
+
+class InferenceComponentSpecification(Base):
+    """
+    InferenceComponentSpecification
+         <p>Details about the resources to deploy with this inference component, including the model, container, and compute resources.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of an existing SageMaker model object in your account that you want to deploy with the inference component.</p>
+       container: 	 <p>Defines a container that provides the runtime environment for a model that you deploy with an inference component.</p>
+       startup_parameters: 	 <p>Settings that take effect while the model container starts up.</p>
+       compute_resource_requirements: 	 <p>The compute resources allocated to run the model assigned to the inference component.</p>
+    """
+
+    compute_resource_requirements: InferenceComponentComputeResourceRequirements
+    model_name: Optional[str] = Unassigned()
+    container: Optional[InferenceComponentContainerSpecification] = Unassigned()
+    startup_parameters: Optional[InferenceComponentStartupParameters] = Unassigned()
+
+
+class InferenceComponentRuntimeConfig(Base):
+    """
+    InferenceComponentRuntimeConfig
+         <p>Runtime settings for a model that is deployed with an inference component.</p>
+
+        Attributes
+       ----------------------
+       copy_count: 	 <p>The number of runtime copies of the model container to deploy with the inference component. Each copy can serve inference requests.</p>
+    """
+
+    copy_count: int
+
+
+class InferenceComponentContainerSpecificationSummary(Base):
+    """
+    InferenceComponentContainerSpecificationSummary
+         <p>Details about the resources that are deployed with this inference component.</p>
+
+        Attributes
+       ----------------------
+       deployed_image
+       artifact_url: 	 <p>The Amazon S3 path where the model artifacts are stored.</p>
+       environment: 	 <p>The environment variables to set in the Docker container.</p>
+    """
+
+    deployed_image: Optional[DeployedImage] = Unassigned()
+    artifact_url: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class InferenceComponentSpecificationSummary(Base):
+    """
+    InferenceComponentSpecificationSummary
+         <p>Details about the resources that are deployed with this inference component.</p>
+
+        Attributes
+       ----------------------
+       model_name: 	 <p>The name of the SageMaker model object that is deployed with the inference component.</p>
+       container: 	 <p>Details about the container that provides the runtime environment for the model that is deployed with the inference component.</p>
+       startup_parameters: 	 <p>Settings that take effect while the model container starts up.</p>
+       compute_resource_requirements: 	 <p>The compute resources allocated to run the model assigned to the inference component.</p>
+    """
+
+    model_name: Optional[str] = Unassigned()
+    container: Optional[InferenceComponentContainerSpecificationSummary] = Unassigned()
+    startup_parameters: Optional[InferenceComponentStartupParameters] = Unassigned()
+    compute_resource_requirements: Optional[
+        InferenceComponentComputeResourceRequirements
+    ] = Unassigned()
+
+
+class InferenceComponentRuntimeConfigSummary(Base):
+    """
+    InferenceComponentRuntimeConfigSummary
+         <p>Details about the runtime settings for the model that is deployed with the inference component.</p>
+
+        Attributes
+       ----------------------
+       desired_copy_count: 	 <p>The number of runtime copies of the model container that you requested to deploy with the inference component.</p>
+       current_copy_count: 	 <p>The number of runtime copies of the model container that are currently deployed.</p>
+    """
+
+    desired_copy_count: Optional[int] = Unassigned()
+    current_copy_count: Optional[int] = Unassigned()
+
+
+class InferenceComponentSummary(Base):
+    """
+    InferenceComponentSummary
+         <p>A summary of the properties of an inference component.</p>
+
+        Attributes
+       ----------------------
+       creation_time: 	 <p>The time when the inference component was created.</p>
+       inference_component_arn: 	 <p>The Amazon Resource Name (ARN) of the inference component.</p>
+       inference_component_name: 	 <p>The name of the inference component.</p>
+       endpoint_arn: 	 <p>The Amazon Resource Name (ARN) of the endpoint that hosts the inference component.</p>
+       endpoint_name: 	 <p>The name of the endpoint that hosts the inference component.</p>
+       variant_name: 	 <p>The name of the production variant that hosts the inference component.</p>
+       inference_component_status: 	 <p>The status of the inference component.</p>
+       last_modified_time: 	 <p>The time when the inference component was last updated.</p>
+    """
+
+    creation_time: datetime.datetime
+    inference_component_arn: str
+    inference_component_name: str
+    endpoint_arn: str
+    endpoint_name: str
+    variant_name: str
+    last_modified_time: datetime.datetime
+    inference_component_status: Optional[str] = Unassigned()
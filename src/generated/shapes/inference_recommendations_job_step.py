@@ -0,0 +1,67 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .categorical_parameter import (
+    EndpointOutputConfiguration,
+    InferenceMetrics,
+    ModelConfiguration,
+    RecommendationMetrics,
+)
+
+
+class RecommendationJobInferenceBenchmark(Base):
+    """
+    RecommendationJobInferenceBenchmark
+         <p>The details for a specific benchmark from an Inference Recommender job.</p>
+
+        Attributes
+       ----------------------
+       metrics
+       endpoint_metrics
+       endpoint_configuration
+       model_configuration
+       failure_reason: 	 <p>The reason why a benchmark failed.</p>
+       invocation_end_time: 	 <p>A timestamp that shows when the benchmark completed.</p>
+       invocation_start_time: 	 <p>A timestamp that shows when the benchmark started.</p>
+    """
+
+    model_configuration: ModelConfiguration
+    metrics: Optional[RecommendationMetrics] = Unassigned()
+    endpoint_metrics: Optional[InferenceMetrics] = Unassigned()
+    endpoint_configuration: Optional[EndpointOutputConfiguration] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    invocation_end_time: Optional[datetime.datetime] = Unassigned()
+    invocation_start_time: Optional[datetime.datetime] = Unassigned()
+
+
+class InferenceRecommendationsJobStep(Base):
+    """
+    InferenceRecommendationsJobStep
+         <p>A returned array object for the <code>Steps</code> response field in the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_ListInferenceRecommendationsJobSteps.html">ListInferenceRecommendationsJobSteps</a> API command.</p>
+
+        Attributes
+       ----------------------
+       step_type: 	 <p>The type of the subtask.</p> <p> <code>BENCHMARK</code>: Evaluate the performance of your model on different instance types.</p>
+       job_name: 	 <p>The name of the Inference Recommender job.</p>
+       status: 	 <p>The current status of the benchmark.</p>
+       inference_benchmark: 	 <p>The details for a specific benchmark.</p>
+    """
+
+    step_type: str
+    job_name: str
+    status: str
+    inference_benchmark: Optional[RecommendationJobInferenceBenchmark] = Unassigned()
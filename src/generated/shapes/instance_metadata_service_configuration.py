@@ -0,0 +1,61 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class InstanceMetadataServiceConfiguration(Base):
+    """
+    InstanceMetadataServiceConfiguration
+         <p>Information on the IMDS configuration of the notebook instance</p>
+
+        Attributes
+       ----------------------
+       minimum_instance_metadata_service_version: 	 <p>Indicates the minimum IMDS version that the notebook instance supports. When passed as part of <code>CreateNotebookInstance</code>, if no value is selected, then it defaults to IMDSv1. This means that both IMDSv1 and IMDSv2 are supported. If passed as part of <code>UpdateNotebookInstance</code>, there is no default.</p>
+    """
+
+    minimum_instance_metadata_service_version: str
+
+
+class NotebookInstanceSummary(Base):
+    """
+    NotebookInstanceSummary
+         <p>Provides summary information for an SageMaker notebook instance.</p>
+
+        Attributes
+       ----------------------
+       notebook_instance_name: 	 <p>The name of the notebook instance that you want a summary for.</p>
+       notebook_instance_arn: 	 <p>The Amazon Resource Name (ARN) of the notebook instance.</p>
+       notebook_instance_status: 	 <p>The status of the notebook instance.</p>
+       url: 	 <p>The URL that you use to connect to the Jupyter notebook running in your notebook instance. </p>
+       instance_type: 	 <p>The type of ML compute instance that the notebook instance is running on.</p>
+       creation_time: 	 <p>A timestamp that shows when the notebook instance was created.</p>
+       last_modified_time: 	 <p>A timestamp that shows when the notebook instance was last modified.</p>
+       notebook_instance_lifecycle_config_name: 	 <p>The name of a notebook instance lifecycle configuration associated with this notebook instance.</p> <p>For information about notebook instance lifestyle configurations, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/notebook-lifecycle-config.html">Step 2.1: (Optional) Customize a Notebook Instance</a>.</p>
+       default_code_repository: 	 <p>The Git repository associated with the notebook instance as its default code repository. This can be either the name of a Git repository stored as a resource in your account, or the URL of a Git repository in <a href="https://docs.aws.amazon.com/codecommit/latest/userguide/welcome.html">Amazon Web Services CodeCommit</a> or in any other Git repository. When you open a notebook instance, it opens in the directory that contains this repository. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/nbi-git-repo.html">Associating Git Repositories with SageMaker Notebook Instances</a>.</p>
+       additional_code_repositories: 	 <p>An array of up to three Git repositories associated with the notebook instance. These can be either the names of Git repositories stored as resources in your account, or the URL of Git repositories in <a href="https://docs.aws.amazon.com/codecommit/latest/userguide/welcome.html">Amazon Web Services CodeCommit</a> or in any other Git repository. These repositories are cloned at the same level as the default repository of your notebook instance. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/nbi-git-repo.html">Associating Git Repositories with SageMaker Notebook Instances</a>.</p>
+    """
+
+    notebook_instance_name: str
+    notebook_instance_arn: str
+    notebook_instance_status: Optional[str] = Unassigned()
+    url: Optional[str] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    notebook_instance_lifecycle_config_name: Optional[str] = Unassigned()
+    default_code_repository: Optional[str] = Unassigned()
+    additional_code_repositories: Optional[List[str]] = Unassigned()
@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class LineageGroupSummary(Base):
+    """
+    LineageGroupSummary
+         <p>Lists a summary of the properties of a lineage group. A lineage group provides a group of shareable lineage entity resources.</p>
+
+        Attributes
+       ----------------------
+       lineage_group_arn: 	 <p>The Amazon Resource Name (ARN) of the lineage group resource.</p>
+       lineage_group_name: 	 <p>The name or Amazon Resource Name (ARN) of the lineage group.</p>
+       display_name: 	 <p>The display name of the lineage group summary.</p>
+       creation_time: 	 <p>The creation time of the lineage group summary.</p>
+       last_modified_time: 	 <p>The last modified time of the lineage group summary.</p>
+    """
+
+    lineage_group_arn: Optional[str] = Unassigned()
+    lineage_group_name: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class MetadataProperties(Base):
+    """
+    MetadataProperties
+         <p>Metadata properties of the tracking entity, trial, or trial component.</p>
+
+        Attributes
+       ----------------------
+       commit_id: 	 <p>The commit ID.</p>
+       repository: 	 <p>The repository.</p>
+       generated_by: 	 <p>The entity this entity was generated by.</p>
+       project_id: 	 <p>The project ID.</p>
+    """
+
+    commit_id: Optional[str] = Unassigned()
+    repository: Optional[str] = Unassigned()
+    generated_by: Optional[str] = Unassigned()
+    project_id: Optional[str] = Unassigned()
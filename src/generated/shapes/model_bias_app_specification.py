@@ -0,0 +1,72 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .batch_transform_input import (
+    BatchTransformInput,
+    EndpointInput,
+    MonitoringConstraintsResource,
+)
+from .monitoring_ground_truth_s3_input import MonitoringGroundTruthS3Input
+
+
+class ModelBiasBaselineConfig(Base):
+    """
+    ModelBiasBaselineConfig
+         <p>The configuration for a baseline model bias job.</p>
+
+        Attributes
+       ----------------------
+       baselining_job_name: 	 <p>The name of the baseline model bias job.</p>
+       constraints_resource
+    """
+
+    baselining_job_name: Optional[str] = Unassigned()
+    constraints_resource: Optional[MonitoringConstraintsResource] = Unassigned()
+
+
+class ModelBiasAppSpecification(Base):
+    """
+    ModelBiasAppSpecification
+         <p>Docker container image configuration object for the model bias job.</p>
+
+        Attributes
+       ----------------------
+       image_uri: 	 <p>The container image to be run by the model bias job.</p>
+       config_uri: 	 <p>JSON formatted S3 file that defines bias parameters. For more information on this JSON configuration file, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/clarify-config-json-monitor-bias-parameters.html">Configure bias parameters</a>.</p>
+       environment: 	 <p>Sets the environment variables in the Docker container.</p>
+    """
+
+    image_uri: str
+    config_uri: str
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class ModelBiasJobInput(Base):
+    """
+    ModelBiasJobInput
+         <p>Inputs for the model bias job.</p>
+
+        Attributes
+       ----------------------
+       endpoint_input
+       batch_transform_input: 	 <p>Input object for the batch transform job.</p>
+       ground_truth_s3_input: 	 <p>Location of ground truth labels to use in model bias job.</p>
+    """
+
+    ground_truth_s3_input: MonitoringGroundTruthS3Input
+    endpoint_input: Optional[EndpointInput] = Unassigned()
+    batch_transform_input: Optional[BatchTransformInput] = Unassigned()
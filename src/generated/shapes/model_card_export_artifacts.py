@@ -0,0 +1,68 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ModelCardExportOutputConfig(Base):
+    """
+    ModelCardExportOutputConfig
+         <p>Configure the export output details for an Amazon SageMaker Model Card.</p>
+
+        Attributes
+       ----------------------
+       s3_output_path: 	 <p>The Amazon S3 output path to export your model card PDF.</p>
+    """
+
+    s3_output_path: str
+
+
+class ModelCardExportArtifacts(Base):
+    """
+    ModelCardExportArtifacts
+         <p>The artifacts of the model card export job.</p>
+
+        Attributes
+       ----------------------
+       s3_export_artifacts: 	 <p>The Amazon S3 URI of the exported model artifacts.</p>
+    """
+
+    s3_export_artifacts: str
+
+
+class ModelCardExportJobSummary(Base):
+    """
+    ModelCardExportJobSummary
+         <p>The summary of the Amazon SageMaker Model Card export job.</p>
+
+        Attributes
+       ----------------------
+       model_card_export_job_name: 	 <p>The name of the model card export job.</p>
+       model_card_export_job_arn: 	 <p>The Amazon Resource Name (ARN) of the model card export job.</p>
+       status: 	 <p>The completion status of the model card export job.</p>
+       model_card_name: 	 <p>The name of the model card that the export job exports.</p>
+       model_card_version: 	 <p>The version of the model card that the export job exports.</p>
+       created_at: 	 <p>The date and time that the model card export job was created.</p>
+       last_modified_at: 	 <p>The date and time that the model card export job was last modified..</p>
+    """
+
+    model_card_export_job_name: str
+    model_card_export_job_arn: str
+    status: str
+    model_card_name: str
+    model_card_version: int
+    created_at: datetime.datetime
+    last_modified_at: datetime.datetime
@@ -0,0 +1,51 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ModelCardSecurityConfig(Base):
+    """
+    ModelCardSecurityConfig
+         <p>Configure the security settings to protect model card data.</p>
+
+        Attributes
+       ----------------------
+       kms_key_id: 	 <p>A Key Management Service <a href="https://docs.aws.amazon.com/kms/latest/developerguide/concepts.html#key-id-key-id">key ID</a> to use for encrypting a model card.</p>
+    """
+
+    kms_key_id: Optional[str] = Unassigned()
+
+
+class ModelCardSummary(Base):
+    """
+    ModelCardSummary
+         <p>A summary of the model card.</p>
+
+        Attributes
+       ----------------------
+       model_card_name: 	 <p>The name of the model card.</p>
+       model_card_arn: 	 <p>The Amazon Resource Name (ARN) of the model card.</p>
+       model_card_status: 	 <p>The approval status of the model card within your organization. Different organizations might have different criteria for model card review and approval.</p> <ul> <li> <p> <code>Draft</code>: The model card is a work in progress.</p> </li> <li> <p> <code>PendingReview</code>: The model card is pending review.</p> </li> <li> <p> <code>Approved</code>: The model card is approved.</p> </li> <li> <p> <code>Archived</code>: The model card is archived. No more updates should be made to the model card, but it can still be exported.</p> </li> </ul>
+       creation_time: 	 <p>The date and time that the model card was created.</p>
+       last_modified_time: 	 <p>The date and time that the model card was last modified.</p>
+    """
+
+    model_card_name: str
+    model_card_arn: str
+    model_card_status: str
+    creation_time: datetime.datetime
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
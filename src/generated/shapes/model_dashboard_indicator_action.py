@@ -0,0 +1,68 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ModelDashboardIndicatorAction(Base):
+    """
+    ModelDashboardIndicatorAction
+         <p>An alert action taken to light up an icon on the Amazon SageMaker Model Dashboard when an alert goes into <code>InAlert</code> status.</p>
+
+        Attributes
+       ----------------------
+       enabled: 	 <p>Indicates whether the alert action is turned on.</p>
+    """
+
+    enabled: Optional[bool] = Unassigned()
+
+
+class MonitoringAlertActions(Base):
+    """
+    MonitoringAlertActions
+         <p>A list of alert actions taken in response to an alert going into <code>InAlert</code> status.</p>
+
+        Attributes
+       ----------------------
+       model_dashboard_indicator: 	 <p>An alert action taken to light up an icon on the Model Dashboard when an alert goes into <code>InAlert</code> status.</p>
+    """
+
+    model_dashboard_indicator: Optional[ModelDashboardIndicatorAction] = Unassigned()
+
+
+class MonitoringAlertSummary(Base):
+    """
+    MonitoringAlertSummary
+         <p>Provides summary information about a monitor alert.</p>
+
+        Attributes
+       ----------------------
+       monitoring_alert_name: 	 <p>The name of a monitoring alert.</p>
+       creation_time: 	 <p>A timestamp that indicates when a monitor alert was created.</p>
+       last_modified_time: 	 <p>A timestamp that indicates when a monitor alert was last updated.</p>
+       alert_status: 	 <p>The current status of an alert.</p>
+       datapoints_to_alert: 	 <p>Within <code>EvaluationPeriod</code>, how many execution failures will raise an alert.</p>
+       evaluation_period: 	 <p>The number of most recent monitoring executions to consider when evaluating alert status.</p>
+       actions: 	 <p>A list of alert actions taken in response to an alert going into <code>InAlert</code> status.</p>
+    """
+
+    monitoring_alert_name: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    alert_status: str
+    datapoints_to_alert: int
+    evaluation_period: int
+    actions: MonitoringAlertActions
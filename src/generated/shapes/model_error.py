@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ModelError(Base):
+    """
+    ModelError
+         <p> Model (owned by the customer in the container) returned 4xx or 5xx error code. </p>
+
+        Attributes
+       ----------------------
+       message
+       original_status_code: 	 <p> Original status code. </p>
+       original_message: 	 <p> Original message. </p>
+       log_stream_arn: 	 <p> The Amazon Resource Name (ARN) of the log stream. </p>
+    """
+
+    message: Optional[str] = Unassigned()
+    original_status_code: Optional[int] = Unassigned()
+    original_message: Optional[str] = Unassigned()
+    log_stream_arn: Optional[str] = Unassigned()
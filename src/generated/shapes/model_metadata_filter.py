@@ -0,0 +1,66 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ModelMetadataFilter(Base):
+    """
+    ModelMetadataFilter
+         <p>Part of the search expression. You can specify the name and value (domain, task, framework, framework version, task, and model).</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the of the model to filter by.</p>
+       value: 	 <p>The value to filter the model metadata.</p>
+    """
+
+    name: str
+    value: str
+
+
+class ModelMetadataSearchExpression(Base):
+    """
+    ModelMetadataSearchExpression
+         <p>One or more filters that searches for the specified resource or resources in a search. All resource objects that satisfy the expression's condition are included in the search results</p>
+
+        Attributes
+       ----------------------
+       filters: 	 <p>A list of filter objects.</p>
+    """
+
+    filters: Optional[List[ModelMetadataFilter]] = Unassigned()
+
+
+class ModelMetadataSummary(Base):
+    """
+    ModelMetadataSummary
+         <p>A summary of the model metadata.</p>
+
+        Attributes
+       ----------------------
+       domain: 	 <p>The machine learning domain of the model.</p>
+       framework: 	 <p>The machine learning framework of the model.</p>
+       task: 	 <p>The machine learning task of the model.</p>
+       model: 	 <p>The name of the model.</p>
+       framework_version: 	 <p>The framework version of the model.</p>
+    """
+
+    domain: str
+    framework: str
+    task: str
+    model: str
+    framework_version: str
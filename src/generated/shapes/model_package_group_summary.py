@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ModelPackageGroupSummary(Base):
+    """
+    ModelPackageGroupSummary
+         <p>Summary information about a model group.</p>
+
+        Attributes
+       ----------------------
+       model_package_group_name: 	 <p>The name of the model group.</p>
+       model_package_group_arn: 	 <p>The Amazon Resource Name (ARN) of the model group.</p>
+       model_package_group_description: 	 <p>A description of the model group.</p>
+       creation_time: 	 <p>The time that the model group was created.</p>
+       model_package_group_status: 	 <p>The status of the model group.</p>
+    """
+
+    model_package_group_name: str
+    model_package_group_arn: str
+    creation_time: datetime.datetime
+    model_package_group_status: str
+    model_package_group_description: Optional[str] = Unassigned()
@@ -0,0 +1,80 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .batch_transform_input import (
+    BatchTransformInput,
+    EndpointInput,
+    MonitoringConstraintsResource,
+)
+from .monitoring_ground_truth_s3_input import MonitoringGroundTruthS3Input
+
+
+class ModelQualityBaselineConfig(Base):
+    """
+    ModelQualityBaselineConfig
+         <p>Configuration for monitoring constraints and monitoring statistics. These baseline resources are compared against the results of the current job from the series of jobs scheduled to collect data periodically.</p>
+
+        Attributes
+       ----------------------
+       baselining_job_name: 	 <p>The name of the job that performs baselining for the monitoring job.</p>
+       constraints_resource
+    """
+
+    baselining_job_name: Optional[str] = Unassigned()
+    constraints_resource: Optional[MonitoringConstraintsResource] = Unassigned()
+
+
+class ModelQualityAppSpecification(Base):
+    """
+    ModelQualityAppSpecification
+         <p>Container image configuration object for the monitoring job.</p>
+
+        Attributes
+       ----------------------
+       image_uri: 	 <p>The address of the container image that the monitoring job runs.</p>
+       container_entrypoint: 	 <p>Specifies the entrypoint for a container that the monitoring job runs.</p>
+       container_arguments: 	 <p>An array of arguments for the container used to run the monitoring job.</p>
+       record_preprocessor_source_uri: 	 <p>An Amazon S3 URI to a script that is called per row prior to running analysis. It can base64 decode the payload and convert it into a flattened JSON so that the built-in container can use the converted data. Applicable only for the built-in (first party) containers.</p>
+       post_analytics_processor_source_uri: 	 <p>An Amazon S3 URI to a script that is called after analysis has been performed. Applicable only for the built-in (first party) containers.</p>
+       problem_type: 	 <p>The machine learning problem type of the model that the monitoring job monitors.</p>
+       environment: 	 <p>Sets the environment variables in the container that the monitoring job runs.</p>
+    """
+
+    image_uri: str
+    container_entrypoint: Optional[List[str]] = Unassigned()
+    container_arguments: Optional[List[str]] = Unassigned()
+    record_preprocessor_source_uri: Optional[str] = Unassigned()
+    post_analytics_processor_source_uri: Optional[str] = Unassigned()
+    problem_type: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+
+
+class ModelQualityJobInput(Base):
+    """
+    ModelQualityJobInput
+         <p>The input for the model quality monitoring job. Currently endpoints are supported for input for model quality monitoring jobs.</p>
+
+        Attributes
+       ----------------------
+       endpoint_input
+       batch_transform_input: 	 <p>Input object for the batch transform job.</p>
+       ground_truth_s3_input: 	 <p>The ground truth label provided for the model.</p>
+    """
+
+    ground_truth_s3_input: MonitoringGroundTruthS3Input
+    endpoint_input: Optional[EndpointInput] = Unassigned()
+    batch_transform_input: Optional[BatchTransformInput] = Unassigned()
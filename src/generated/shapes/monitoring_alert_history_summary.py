@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class MonitoringAlertHistorySummary(Base):
+    """
+    MonitoringAlertHistorySummary
+         <p>Provides summary information of an alert's history.</p>
+
+        Attributes
+       ----------------------
+       monitoring_schedule_name: 	 <p>The name of a monitoring schedule.</p>
+       monitoring_alert_name: 	 <p>The name of a monitoring alert.</p>
+       creation_time: 	 <p>A timestamp that indicates when the first alert transition occurred in an alert history. An alert transition can be from status <code>InAlert</code> to <code>OK</code>, or from <code>OK</code> to <code>InAlert</code>.</p>
+       alert_status: 	 <p>The current alert status of an alert.</p>
+    """
+
+    monitoring_schedule_name: str
+    monitoring_alert_name: str
+    creation_time: datetime.datetime
+    alert_status: str
@@ -0,0 +1,203 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .batch_transform_input import (
+    BatchTransformInput,
+    EndpointInput,
+    MonitoringConstraintsResource,
+    MonitoringOutputConfig,
+    MonitoringResources,
+    MonitoringStoppingCondition,
+)
+from .monitoring_statistics_resource import MonitoringStatisticsResource
+from .network_config import NetworkConfig
+
+
+class ScheduleConfig(Base):
+    """
+    ScheduleConfig
+         <p>Configuration details about the monitoring schedule.</p>
+
+        Attributes
+       ----------------------
+       schedule_expression: 	 <p>A cron expression that describes details about the monitoring schedule.</p> <p>The supported cron expressions are:</p> <ul> <li> <p>If you want to set the job to start every hour, use the following:</p> <p> <code>Hourly: cron(0 * ? * * *)</code> </p> </li> <li> <p>If you want to start the job daily:</p> <p> <code>cron(0 [00-23] ? * * *)</code> </p> </li> <li> <p>If you want to run the job one time, immediately, use the following keyword:</p> <p> <code>NOW</code> </p> </li> </ul> <p>For example, the following are valid cron expressions:</p> <ul> <li> <p>Daily at noon UTC: <code>cron(0 12 ? * * *)</code> </p> </li> <li> <p>Daily at midnight UTC: <code>cron(0 0 ? * * *)</code> </p> </li> </ul> <p>To support running every 6, 12 hours, the following are also supported:</p> <p> <code>cron(0 [00-23]/[01-24] ? * * *)</code> </p> <p>For example, the following are valid cron expressions:</p> <ul> <li> <p>Every 12 hours, starting at 5pm UTC: <code>cron(0 17/12 ? * * *)</code> </p> </li> <li> <p>Every two hours starting at midnight: <code>cron(0 0/2 ? * * *)</code> </p> </li> </ul> <note> <ul> <li> <p>Even though the cron expression is set to start at 5PM UTC, note that there could be a delay of 0-20 minutes from the actual requested time to run the execution. </p> </li> <li> <p>We recommend that if you would like a daily schedule, you do not provide this parameter. Amazon SageMaker will pick a time for running every day.</p> </li> </ul> </note> <p>You can also specify the keyword <code>NOW</code> to run the monitoring job immediately, one time, without recurring.</p>
+       data_analysis_start_time: 	 <p>Sets the start time for a monitoring job window. Express this time as an offset to the times that you schedule your monitoring jobs to run. You schedule monitoring jobs with the <code>ScheduleExpression</code> parameter. Specify this offset in ISO 8601 duration format. For example, if you want to monitor the five hours of data in your dataset that precede the start of each monitoring job, you would specify: <code>"-PT5H"</code>.</p> <p>The start time that you specify must not precede the end time that you specify by more than 24 hours. You specify the end time with the <code>DataAnalysisEndTime</code> parameter.</p> <p>If you set <code>ScheduleExpression</code> to <code>NOW</code>, this parameter is required.</p>
+       data_analysis_end_time: 	 <p>Sets the end time for a monitoring job window. Express this time as an offset to the times that you schedule your monitoring jobs to run. You schedule monitoring jobs with the <code>ScheduleExpression</code> parameter. Specify this offset in ISO 8601 duration format. For example, if you want to end the window one hour before the start of each monitoring job, you would specify: <code>"-PT1H"</code>.</p> <p>The end time that you specify must not follow the start time that you specify by more than 24 hours. You specify the start time with the <code>DataAnalysisStartTime</code> parameter.</p> <p>If you set <code>ScheduleExpression</code> to <code>NOW</code>, this parameter is required.</p>
+    """
+
+    schedule_expression: str
+    data_analysis_start_time: Optional[str] = Unassigned()
+    data_analysis_end_time: Optional[str] = Unassigned()
+
+
+class MonitoringBaselineConfig(Base):
+    """
+    MonitoringBaselineConfig
+         <p>Configuration for monitoring constraints and monitoring statistics. These baseline resources are compared against the results of the current job from the series of jobs scheduled to collect data periodically.</p>
+
+        Attributes
+       ----------------------
+       baselining_job_name: 	 <p>The name of the job that performs baselining for the monitoring job.</p>
+       constraints_resource: 	 <p>The baseline constraint file in Amazon S3 that the current monitoring job should validated against.</p>
+       statistics_resource: 	 <p>The baseline statistics file in Amazon S3 that the current monitoring job should be validated against.</p>
+    """
+
+    baselining_job_name: Optional[str] = Unassigned()
+    constraints_resource: Optional[MonitoringConstraintsResource] = Unassigned()
+    statistics_resource: Optional[MonitoringStatisticsResource] = Unassigned()
+
+
+class MonitoringInput(Base):
+    """
+    MonitoringInput
+         <p>The inputs for a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       endpoint_input: 	 <p>The endpoint for a monitoring job.</p>
+       batch_transform_input: 	 <p>Input object for the batch transform job.</p>
+    """
+
+    endpoint_input: Optional[EndpointInput] = Unassigned()
+    batch_transform_input: Optional[BatchTransformInput] = Unassigned()
+
+
+class MonitoringAppSpecification(Base):
+    """
+    MonitoringAppSpecification
+         <p>Container image configuration object for the monitoring job.</p>
+
+        Attributes
+       ----------------------
+       image_uri: 	 <p>The container image to be run by the monitoring job.</p>
+       container_entrypoint: 	 <p>Specifies the entrypoint for a container used to run the monitoring job.</p>
+       container_arguments: 	 <p>An array of arguments for the container used to run the monitoring job.</p>
+       record_preprocessor_source_uri: 	 <p>An Amazon S3 URI to a script that is called per row prior to running analysis. It can base64 decode the payload and convert it into a flattened JSON so that the built-in container can use the converted data. Applicable only for the built-in (first party) containers.</p>
+       post_analytics_processor_source_uri: 	 <p>An Amazon S3 URI to a script that is called after analysis has been performed. Applicable only for the built-in (first party) containers.</p>
+    """
+
+    image_uri: str
+    container_entrypoint: Optional[List[str]] = Unassigned()
+    container_arguments: Optional[List[str]] = Unassigned()
+    record_preprocessor_source_uri: Optional[str] = Unassigned()
+    post_analytics_processor_source_uri: Optional[str] = Unassigned()
+
+
+class MonitoringJobDefinition(Base):
+    """
+    MonitoringJobDefinition
+         <p>Defines the monitoring job.</p>
+
+        Attributes
+       ----------------------
+       baseline_config: 	 <p>Baseline configuration used to validate that the data conforms to the specified constraints and statistics</p>
+       monitoring_inputs: 	 <p>The array of inputs for the monitoring job. Currently we support monitoring an Amazon SageMaker Endpoint.</p>
+       monitoring_output_config: 	 <p>The array of outputs from the monitoring job to be uploaded to Amazon S3.</p>
+       monitoring_resources: 	 <p>Identifies the resources, ML compute instances, and ML storage volumes to deploy for a monitoring job. In distributed processing, you specify more than one instance.</p>
+       monitoring_app_specification: 	 <p>Configures the monitoring job to run a specified Docker container image.</p>
+       stopping_condition: 	 <p>Specifies a time limit for how long the monitoring job is allowed to run.</p>
+       environment: 	 <p>Sets the environment variables in the Docker container.</p>
+       network_config: 	 <p>Specifies networking options for an monitoring job.</p>
+       role_arn: 	 <p>The Amazon Resource Name (ARN) of an IAM role that Amazon SageMaker can assume to perform tasks on your behalf.</p>
+    """
+
+    monitoring_inputs: List[MonitoringInput]
+    monitoring_output_config: MonitoringOutputConfig
+    monitoring_resources: MonitoringResources
+    monitoring_app_specification: MonitoringAppSpecification
+    role_arn: str
+    baseline_config: Optional[MonitoringBaselineConfig] = Unassigned()
+    stopping_condition: Optional[MonitoringStoppingCondition] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    network_config: Optional[NetworkConfig] = Unassigned()
+
+
+class MonitoringScheduleConfig(Base):
+    """
+    MonitoringScheduleConfig
+         <p>Configures the monitoring schedule and defines the monitoring job.</p>
+
+        Attributes
+       ----------------------
+       schedule_config: 	 <p>Configures the monitoring schedule.</p>
+       monitoring_job_definition: 	 <p>Defines the monitoring job.</p>
+       monitoring_job_definition_name: 	 <p>The name of the monitoring job definition to schedule.</p>
+       monitoring_type: 	 <p>The type of the monitoring job definition to schedule.</p>
+    """
+
+    schedule_config: Optional[ScheduleConfig] = Unassigned()
+    monitoring_job_definition: Optional[MonitoringJobDefinition] = Unassigned()
+    monitoring_job_definition_name: Optional[str] = Unassigned()
+    monitoring_type: Optional[str] = Unassigned()
+
+
+class MonitoringExecutionSummary(Base):
+    """
+    MonitoringExecutionSummary
+         <p>Summary of information about the last monitoring job to run.</p>
+
+        Attributes
+       ----------------------
+       monitoring_schedule_name: 	 <p>The name of the monitoring schedule.</p>
+       scheduled_time: 	 <p>The time the monitoring job was scheduled.</p>
+       creation_time: 	 <p>The time at which the monitoring job was created.</p>
+       last_modified_time: 	 <p>A timestamp that indicates the last time the monitoring job was modified.</p>
+       monitoring_execution_status: 	 <p>The status of the monitoring job.</p>
+       processing_job_arn: 	 <p>The Amazon Resource Name (ARN) of the monitoring job.</p>
+       endpoint_name: 	 <p>The name of the endpoint used to run the monitoring job.</p>
+       failure_reason: 	 <p>Contains the reason a monitoring job failed, if it failed.</p>
+       monitoring_job_definition_name: 	 <p>The name of the monitoring job.</p>
+       monitoring_type: 	 <p>The type of the monitoring job.</p>
+    """
+
+    monitoring_schedule_name: str
+    scheduled_time: datetime.datetime
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    monitoring_execution_status: str
+    processing_job_arn: Optional[str] = Unassigned()
+    endpoint_name: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    monitoring_job_definition_name: Optional[str] = Unassigned()
+    monitoring_type: Optional[str] = Unassigned()
+
+
+class MonitoringScheduleSummary(Base):
+    """
+    MonitoringScheduleSummary
+         <p>Summarizes the monitoring schedule.</p>
+
+        Attributes
+       ----------------------
+       monitoring_schedule_name: 	 <p>The name of the monitoring schedule.</p>
+       monitoring_schedule_arn: 	 <p>The Amazon Resource Name (ARN) of the monitoring schedule.</p>
+       creation_time: 	 <p>The creation time of the monitoring schedule.</p>
+       last_modified_time: 	 <p>The last time the monitoring schedule was modified.</p>
+       monitoring_schedule_status: 	 <p>The status of the monitoring schedule.</p>
+       endpoint_name: 	 <p>The name of the endpoint using the monitoring schedule.</p>
+       monitoring_job_definition_name: 	 <p>The name of the monitoring job definition that the schedule is for.</p>
+       monitoring_type: 	 <p>The type of the monitoring job definition that the schedule is for.</p>
+    """
+
+    monitoring_schedule_name: str
+    monitoring_schedule_arn: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    monitoring_schedule_status: str
+    endpoint_name: Optional[str] = Unassigned()
+    monitoring_job_definition_name: Optional[str] = Unassigned()
+    monitoring_type: Optional[str] = Unassigned()
@@ -0,0 +1,30 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class MonitoringGroundTruthS3Input(Base):
+    """
+    MonitoringGroundTruthS3Input
+         <p>The ground truth labels for the dataset used for the monitoring job.</p>
+
+        Attributes
+       ----------------------
+       s3_uri: 	 <p>The address of the Amazon S3 location of the ground truth labels.</p>
+    """
+
+    s3_uri: Optional[str] = Unassigned()
@@ -0,0 +1,54 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .vpc_config import VpcConfig
+
+
+class MonitoringNetworkConfig(Base):
+    """
+    MonitoringNetworkConfig
+         <p>The networking configuration for the monitoring job.</p>
+
+        Attributes
+       ----------------------
+       enable_inter_container_traffic_encryption: 	 <p>Whether to encrypt all communications between the instances used for the monitoring jobs. Choose <code>True</code> to encrypt communications. Encryption provides greater security for distributed jobs, but the processing might take longer.</p>
+       enable_network_isolation: 	 <p>Whether to allow inbound and outbound network calls to and from the containers used for the monitoring job.</p>
+       vpc_config
+    """
+
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
+
+
+class MonitoringJobDefinitionSummary(Base):
+    """
+    MonitoringJobDefinitionSummary
+         <p>Summary information about a monitoring job.</p>
+
+        Attributes
+       ----------------------
+       monitoring_job_definition_name: 	 <p>The name of the monitoring job.</p>
+       monitoring_job_definition_arn: 	 <p>The Amazon Resource Name (ARN) of the monitoring job.</p>
+       creation_time: 	 <p>The time that the monitoring job was created.</p>
+       endpoint_name: 	 <p>The name of the endpoint that the job monitors.</p>
+    """
+
+    monitoring_job_definition_name: str
+    monitoring_job_definition_arn: str
+    creation_time: datetime.datetime
+    endpoint_name: str
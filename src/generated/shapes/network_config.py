@@ -0,0 +1,35 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .vpc_config import VpcConfig
+
+
+class NetworkConfig(Base):
+    """
+    NetworkConfig
+         <p>Networking options for a job, such as network traffic encryption between containers, whether to allow inbound and outbound network calls to and from containers, and the VPC subnets and security groups to use for VPC-enabled jobs.</p>
+
+        Attributes
+       ----------------------
+       enable_inter_container_traffic_encryption: 	 <p>Whether to encrypt all communications between distributed processing jobs. Choose <code>True</code> to encrypt communications. Encryption provides greater security for distributed processing jobs, but the processing might take longer.</p>
+       enable_network_isolation: 	 <p>Whether to allow inbound and outbound network calls to and from the containers used for the processing job.</p>
+       vpc_config
+    """
+
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    vpc_config: Optional[VpcConfig] = Unassigned()
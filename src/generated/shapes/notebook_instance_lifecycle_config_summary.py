@@ -0,0 +1,49 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class NotebookInstanceLifecycleHook(Base):
+    """
+    NotebookInstanceLifecycleHook
+         <p>Contains the notebook instance lifecycle configuration script.</p> <p>Each lifecycle configuration script has a limit of 16384 characters.</p> <p>The value of the <code>$PATH</code> environment variable that is available to both scripts is <code>/sbin:bin:/usr/sbin:/usr/bin</code>.</p> <p>View Amazon CloudWatch Logs for notebook instance lifecycle configurations in log group <code>/aws/sagemaker/NotebookInstances</code> in log stream <code>[notebook-instance-name]/[LifecycleConfigHook]</code>.</p> <p>Lifecycle configuration scripts cannot run for longer than 5 minutes. If a script runs for longer than 5 minutes, it fails and the notebook instance is not created or started.</p> <p>For information about notebook instance lifestyle configurations, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/notebook-lifecycle-config.html">Step 2.1: (Optional) Customize a Notebook Instance</a>.</p>
+
+        Attributes
+       ----------------------
+       content: 	 <p>A base64-encoded string that contains a shell script for a notebook instance lifecycle configuration.</p>
+    """
+
+    content: Optional[str] = Unassigned()
+
+
+class NotebookInstanceLifecycleConfigSummary(Base):
+    """
+    NotebookInstanceLifecycleConfigSummary
+         <p>Provides a summary of a notebook instance lifecycle configuration.</p>
+
+        Attributes
+       ----------------------
+       notebook_instance_lifecycle_config_name: 	 <p>The name of the lifecycle configuration.</p>
+       notebook_instance_lifecycle_config_arn: 	 <p>The Amazon Resource Name (ARN) of the lifecycle configuration.</p>
+       creation_time: 	 <p>A timestamp that tells when the lifecycle configuration was created.</p>
+       last_modified_time: 	 <p>A timestamp that tells when the lifecycle configuration was last modified.</p>
+    """
+
+    notebook_instance_lifecycle_config_name: str
+    notebook_instance_lifecycle_config_arn: str
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
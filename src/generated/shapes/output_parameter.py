@@ -0,0 +1,32 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class OutputParameter(Base):
+    """
+    OutputParameter
+         <p>An output parameter of a pipeline step.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the output parameter.</p>
+       value: 	 <p>The value of the output parameter.</p>
+    """
+
+    name: str
+    value: str
@@ -0,0 +1,98 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class PipelineExperimentConfig(Base):
+    """
+    PipelineExperimentConfig
+         <p>Specifies the names of the experiment and trial created by a pipeline.</p>
+
+        Attributes
+       ----------------------
+       experiment_name: 	 <p>The name of the experiment.</p>
+       trial_name: 	 <p>The name of the trial.</p>
+    """
+
+    experiment_name: Optional[str] = Unassigned()
+    trial_name: Optional[str] = Unassigned()
+
+
+class SelectedStep(Base):
+    """
+    SelectedStep
+         <p>A step selected to run in selective execution mode.</p>
+
+        Attributes
+       ----------------------
+       step_name: 	 <p>The name of the pipeline step.</p>
+    """
+
+    step_name: str
+
+
+class SelectiveExecutionConfig(Base):
+    """
+    SelectiveExecutionConfig
+         <p>The selective execution configuration applied to the pipeline run.</p>
+
+        Attributes
+       ----------------------
+       source_pipeline_execution_arn: 	 <p>The ARN from a reference execution of the current pipeline. Used to copy input collaterals needed for the selected steps to run. The execution status of the pipeline can be either <code>Failed</code> or <code>Success</code>.</p> <p>This field is required if the steps you specify for <code>SelectedSteps</code> depend on output collaterals from any non-specified pipeline steps. For more information, see <a href="https://docs.aws.amazon.com/sagemaker/latest/dg/pipelines-selective-ex.html">Selective Execution for Pipeline Steps</a>.</p>
+       selected_steps: 	 <p>A list of pipeline steps to run. All step(s) in all path(s) between two selected steps should be included.</p>
+    """
+
+    selected_steps: List[SelectedStep]
+    source_pipeline_execution_arn: Optional[str] = Unassigned()
+
+
+class PipelineExecutionSummary(Base):
+    """
+    PipelineExecutionSummary
+         <p>A pipeline execution summary.</p>
+
+        Attributes
+       ----------------------
+       pipeline_execution_arn: 	 <p>The Amazon Resource Name (ARN) of the pipeline execution.</p>
+       start_time: 	 <p>The start time of the pipeline execution.</p>
+       pipeline_execution_status: 	 <p>The status of the pipeline execution.</p>
+       pipeline_execution_description: 	 <p>The description of the pipeline execution.</p>
+       pipeline_execution_display_name: 	 <p>The display name of the pipeline execution.</p>
+       pipeline_execution_failure_reason: 	 <p>A message generated by SageMaker Pipelines describing why the pipeline execution failed.</p>
+    """
+
+    pipeline_execution_arn: Optional[str] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    pipeline_execution_status: Optional[str] = Unassigned()
+    pipeline_execution_description: Optional[str] = Unassigned()
+    pipeline_execution_display_name: Optional[str] = Unassigned()
+    pipeline_execution_failure_reason: Optional[str] = Unassigned()
+
+
+class Parameter(Base):
+    """
+    Parameter
+         <p>Assigns a value to a named Pipeline parameter.</p>
+
+        Attributes
+       ----------------------
+       name: 	 <p>The name of the parameter to assign a value to. This parameter name must match a named parameter in the pipeline definition.</p>
+       value: 	 <p>The literal value for the parameter.</p>
+    """
+
+    name: str
+    value: str
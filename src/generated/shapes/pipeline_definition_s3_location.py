@@ -0,0 +1,61 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class PipelineDefinitionS3Location(Base):
+    """
+    PipelineDefinitionS3Location
+         <p>The location of the pipeline definition stored in Amazon S3.</p>
+
+        Attributes
+       ----------------------
+       bucket: 	 <p>Name of the S3 bucket.</p>
+       object_key: 	 <p>The object key (or key name) uniquely identifies the object in an S3 bucket. </p>
+       version_id: 	 <p>Version Id of the pipeline definition file. If not specified, Amazon SageMaker will retrieve the latest version.</p>
+    """
+
+    bucket: str
+    object_key: str
+    version_id: Optional[str] = Unassigned()
+
+
+class PipelineSummary(Base):
+    """
+    PipelineSummary
+         <p>A summary of a pipeline.</p>
+
+        Attributes
+       ----------------------
+       pipeline_arn: 	 <p> The Amazon Resource Name (ARN) of the pipeline.</p>
+       pipeline_name: 	 <p>The name of the pipeline.</p>
+       pipeline_display_name: 	 <p>The display name of the pipeline.</p>
+       pipeline_description: 	 <p>The description of the pipeline.</p>
+       role_arn: 	 <p>The Amazon Resource Name (ARN) that the pipeline used to execute.</p>
+       creation_time: 	 <p>The creation time of the pipeline.</p>
+       last_modified_time: 	 <p>The time that the pipeline was last modified.</p>
+       last_execution_time: 	 <p>The last time that a pipeline execution began.</p>
+    """
+
+    pipeline_arn: Optional[str] = Unassigned()
+    pipeline_name: Optional[str] = Unassigned()
+    pipeline_display_name: Optional[str] = Unassigned()
+    pipeline_description: Optional[str] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_execution_time: Optional[datetime.datetime] = Unassigned()
@@ -0,0 +1,104 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ProvisioningParameter(Base):
+    """
+    ProvisioningParameter
+         <p>A key value pair used when you provision a project as a service catalog product. For information, see <a href="https://docs.aws.amazon.com/servicecatalog/latest/adminguide/introduction.html">What is Amazon Web Services Service Catalog</a>.</p>
+
+        Attributes
+       ----------------------
+       key: 	 <p>The key that identifies a provisioning parameter.</p>
+       value: 	 <p>The value of the provisioning parameter.</p>
+    """
+
+    key: Optional[str] = Unassigned()
+    value: Optional[str] = Unassigned()
+
+
+class ServiceCatalogProvisioningDetails(Base):
+    """
+    ServiceCatalogProvisioningDetails
+         <p>Details that you specify to provision a service catalog product. For information about service catalog, see <a href="https://docs.aws.amazon.com/servicecatalog/latest/adminguide/introduction.html">What is Amazon Web Services Service Catalog</a>.</p>
+
+        Attributes
+       ----------------------
+       product_id: 	 <p>The ID of the product to provision.</p>
+       provisioning_artifact_id: 	 <p>The ID of the provisioning artifact.</p>
+       path_id: 	 <p>The path identifier of the product. This value is optional if the product has a default path, and required if the product has more than one path. </p>
+       provisioning_parameters: 	 <p>A list of key value pairs that you specify when you provision a product.</p>
+    """
+
+    product_id: str
+    provisioning_artifact_id: Optional[str] = Unassigned()
+    path_id: Optional[str] = Unassigned()
+    provisioning_parameters: Optional[List[ProvisioningParameter]] = Unassigned()
+
+
+class ServiceCatalogProvisionedProductDetails(Base):
+    """
+    ServiceCatalogProvisionedProductDetails
+         <p>Details of a provisioned service catalog product. For information about service catalog, see <a href="https://docs.aws.amazon.com/servicecatalog/latest/adminguide/introduction.html">What is Amazon Web Services Service Catalog</a>.</p>
+
+        Attributes
+       ----------------------
+       provisioned_product_id: 	 <p>The ID of the provisioned product.</p>
+       provisioned_product_status_message: 	 <p>The current status of the product.</p> <ul> <li> <p> <code>AVAILABLE</code> - Stable state, ready to perform any operation. The most recent operation succeeded and completed.</p> </li> <li> <p> <code>UNDER_CHANGE</code> - Transitive state. Operations performed might not have valid results. Wait for an AVAILABLE status before performing operations.</p> </li> <li> <p> <code>TAINTED</code> - Stable state, ready to perform any operation. The stack has completed the requested operation but is not exactly what was requested. For example, a request to update to a new version failed and the stack rolled back to the current version.</p> </li> <li> <p> <code>ERROR</code> - An unexpected error occurred. The provisioned product exists but the stack is not running. For example, CloudFormation received a parameter value that was not valid and could not launch the stack.</p> </li> <li> <p> <code>PLAN_IN_PROGRESS</code> - Transitive state. The plan operations were performed to provision a new product, but resources have not yet been created. After reviewing the list of resources to be created, execute the plan. Wait for an AVAILABLE status before performing operations.</p> </li> </ul>
+    """
+
+    provisioned_product_id: Optional[str] = Unassigned()
+    provisioned_product_status_message: Optional[str] = Unassigned()
+
+
+class ProjectSummary(Base):
+    """
+    ProjectSummary
+         <p>Information about a project.</p>
+
+        Attributes
+       ----------------------
+       project_name: 	 <p>The name of the project.</p>
+       project_description: 	 <p>The description of the project.</p>
+       project_arn: 	 <p>The Amazon Resource Name (ARN) of the project.</p>
+       project_id: 	 <p>The ID of the project.</p>
+       creation_time: 	 <p>The time that the project was created.</p>
+       project_status: 	 <p>The status of the project.</p>
+    """
+
+    project_name: str
+    project_arn: str
+    project_id: str
+    creation_time: datetime.datetime
+    project_status: str
+    project_description: Optional[str] = Unassigned()
+
+
+class ServiceCatalogProvisioningUpdateDetails(Base):
+    """
+    ServiceCatalogProvisioningUpdateDetails
+         <p>Details that you specify to provision a service catalog product. For information about service catalog, see <a href="https://docs.aws.amazon.com/servicecatalog/latest/adminguide/introduction.html">What is Amazon Web Services Service Catalog</a>. </p>
+
+        Attributes
+       ----------------------
+       provisioning_artifact_id: 	 <p>The ID of the provisioning artifact.</p>
+       provisioning_parameters: 	 <p>A list of key value pairs that you specify when you provision a product.</p>
+    """
+
+    provisioning_artifact_id: Optional[str] = Unassigned()
+    provisioning_parameters: Optional[List[ProvisioningParameter]] = Unassigned()
@@ -0,0 +1,56 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class PropertyNameQuery(Base):
+    """
+    PropertyNameQuery
+         <p>Part of the <code>SuggestionQuery</code> type. Specifies a hint for retrieving property names that begin with the specified text.</p>
+
+        Attributes
+       ----------------------
+       property_name_hint: 	 <p>Text that begins a property's name.</p>
+    """
+
+    property_name_hint: str
+
+
+class SuggestionQuery(Base):
+    """
+    SuggestionQuery
+         <p>Specified in the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_GetSearchSuggestions.html">GetSearchSuggestions</a> request. Limits the property names that are included in the response.</p>
+
+        Attributes
+       ----------------------
+       property_name_query: 	 <p>Defines a property name hint. Only property names that begin with the specified hint are included in the response.</p>
+    """
+
+    property_name_query: Optional[PropertyNameQuery] = Unassigned()
+
+
+class PropertyNameSuggestion(Base):
+    """
+    PropertyNameSuggestion
+         <p>A property name returned from a <code>GetSearchSuggestions</code> call that specifies a value in the <code>PropertyNameQuery</code> field.</p>
+
+        Attributes
+       ----------------------
+       property_name: 	 <p>A suggested property name based on what you entered in the search textbox in the SageMaker console.</p>
+    """
+
+    property_name: Optional[str] = Unassigned()
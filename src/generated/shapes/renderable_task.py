@@ -0,0 +1,45 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class RenderableTask(Base):
+    """
+    RenderableTask
+         <p>Contains input values for a task.</p>
+
+        Attributes
+       ----------------------
+       input: 	 <p>A JSON object that contains values for the variables defined in the template. It is made available to the template under the substitution variable <code>task.input</code>. For example, if you define a variable <code>task.input.text</code> in your template, you can supply the variable in the JSON object as <code>"text": "sample text"</code>.</p>
+    """
+
+    input: str
+
+
+class RenderingError(Base):
+    """
+    RenderingError
+         <p>A description of an error that occurred while rendering the template.</p>
+
+        Attributes
+       ----------------------
+       code: 	 <p>A unique identifier for a specific class of errors.</p>
+       message: 	 <p>A human-readable message describing the error.</p>
+    """
+
+    code: str
+    message: str
@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ResourceCatalog(Base):
+    """
+    ResourceCatalog
+         <p> A resource catalog containing all of the resources of a specific resource type within a resource owner account. For an example on sharing the Amazon SageMaker Feature Store <code>DefaultFeatureGroupCatalog</code>, see <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/feature-store-cross-account-discoverability-share-sagemaker-catalog.html">Share Amazon SageMaker Catalog resource type</a> in the Amazon SageMaker Developer Guide. </p>
+
+        Attributes
+       ----------------------
+       resource_catalog_arn: 	 <p> The Amazon Resource Name (ARN) of the <code>ResourceCatalog</code>. </p>
+       resource_catalog_name: 	 <p> The name of the <code>ResourceCatalog</code>. </p>
+       description: 	 <p> A free form description of the <code>ResourceCatalog</code>. </p>
+       creation_time: 	 <p> The time the <code>ResourceCatalog</code> was created. </p>
+    """
+
+    resource_catalog_arn: str
+    resource_catalog_name: str
+    description: str
+    creation_time: datetime.datetime
@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class ResourceSpec(Base):
+    """
+    ResourceSpec
+         <p>Specifies the ARN's of a SageMaker image and SageMaker image version, and the instance type that the version runs on.</p>
+
+        Attributes
+       ----------------------
+       sage_maker_image_arn: 	 <p>The ARN of the SageMaker image that the image version belongs to.</p>
+       sage_maker_image_version_arn: 	 <p>The ARN of the image version created on the instance.</p>
+       sage_maker_image_version_alias: 	 <p>The SageMakerImageVersionAlias of the image to launch with. This value is in SemVer 2.0.0 versioning format.</p>
+       instance_type: 	 <p>The instance type that the image version runs on.</p> <note> <p> <b>JupyterServer apps</b> only support the <code>system</code> value.</p> <p>For <b>KernelGateway apps</b>, the <code>system</code> value is translated to <code>ml.t3.medium</code>. KernelGateway apps also support all other values for available instance types.</p> </note>
+       lifecycle_config_arn: 	 <p> The Amazon Resource Name (ARN) of the Lifecycle Configuration attached to the Resource.</p>
+    """
+
+    sage_maker_image_arn: Optional[str] = Unassigned()
+    sage_maker_image_version_arn: Optional[str] = Unassigned()
+    sage_maker_image_version_alias: Optional[str] = Unassigned()
+    instance_type: Optional[str] = Unassigned()
+    lifecycle_config_arn: Optional[str] = Unassigned()
@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class StudioLifecycleConfigDetails(Base):
+    """
+    StudioLifecycleConfigDetails
+         <p>Details of the Amazon SageMaker Studio Lifecycle Configuration.</p>
+
+        Attributes
+       ----------------------
+       studio_lifecycle_config_arn: 	 <p> The Amazon Resource Name (ARN) of the Lifecycle Configuration.</p>
+       studio_lifecycle_config_name: 	 <p>The name of the Amazon SageMaker Studio Lifecycle Configuration.</p>
+       creation_time: 	 <p>The creation time of the Amazon SageMaker Studio Lifecycle Configuration.</p>
+       last_modified_time: 	 <p>This value is equivalent to CreationTime because Amazon SageMaker Studio Lifecycle Configurations are immutable.</p>
+       studio_lifecycle_config_app_type: 	 <p>The App type to which the Lifecycle Configuration is attached.</p>
+    """
+
+    studio_lifecycle_config_arn: Optional[str] = Unassigned()
+    studio_lifecycle_config_name: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    studio_lifecycle_config_app_type: Optional[str] = Unassigned()
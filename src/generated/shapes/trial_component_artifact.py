@@ -0,0 +1,140 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+from .iam_identity import UserContext
+
+
+class TrialComponentStatus(Base):
+    """
+    TrialComponentStatus
+         <p>The status of the trial component.</p>
+
+        Attributes
+       ----------------------
+       primary_status: 	 <p>The status of the trial component.</p>
+       message: 	 <p>If the component failed, a message describing why.</p>
+    """
+
+    primary_status: Optional[str] = Unassigned()
+    message: Optional[str] = Unassigned()
+
+
+class TrialComponentParameterValue(Base):
+    """
+    TrialComponentParameterValue
+         <p>The value of a hyperparameter. Only one of <code>NumberValue</code> or <code>StringValue</code> can be specified.</p> <p>This object is specified in the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrialComponent.html">CreateTrialComponent</a> request.</p>
+
+        Attributes
+       ----------------------
+       string_value: 	 <p>The string value of a categorical hyperparameter. If you specify a value for this parameter, you can't specify the <code>NumberValue</code> parameter.</p>
+       number_value: 	 <p>The numeric value of a numeric hyperparameter. If you specify a value for this parameter, you can't specify the <code>StringValue</code> parameter.</p>
+    """
+
+    string_value: Optional[str] = Unassigned()
+    number_value: Optional[float] = Unassigned()
+
+
+class TrialComponentArtifact(Base):
+    """
+    TrialComponentArtifact
+         <p>Represents an input or output artifact of a trial component. You specify <code>TrialComponentArtifact</code> as part of the <code>InputArtifacts</code> and <code>OutputArtifacts</code> parameters in the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_CreateTrialComponent.html">CreateTrialComponent</a> request.</p> <p>Examples of input artifacts are datasets, algorithms, hyperparameters, source code, and instance types. Examples of output artifacts are metrics, snapshots, logs, and images.</p>
+
+        Attributes
+       ----------------------
+       media_type: 	 <p>The media type of the artifact, which indicates the type of data in the artifact file. The media type consists of a <i>type</i> and a <i>subtype</i> concatenated with a slash (/) character, for example, text/csv, image/jpeg, and s3/uri. The type specifies the category of the media. The subtype specifies the kind of data.</p>
+       value: 	 <p>The location of the artifact.</p>
+    """
+
+    value: str
+    media_type: Optional[str] = Unassigned()
+
+
+class TrialComponentSource(Base):
+    """
+    TrialComponentSource
+         <p>The Amazon Resource Name (ARN) and job type of the source of a trial component.</p>
+
+        Attributes
+       ----------------------
+       source_arn: 	 <p>The source Amazon Resource Name (ARN).</p>
+       source_type: 	 <p>The source job type.</p>
+    """
+
+    source_arn: str
+    source_type: Optional[str] = Unassigned()
+
+
+class TrialComponentMetricSummary(Base):
+    """
+    TrialComponentMetricSummary
+         <p>A summary of the metrics of a trial component.</p>
+
+        Attributes
+       ----------------------
+       metric_name: 	 <p>The name of the metric.</p>
+       source_arn: 	 <p>The Amazon Resource Name (ARN) of the source.</p>
+       time_stamp: 	 <p>When the metric was last updated.</p>
+       max: 	 <p>The maximum value of the metric.</p>
+       min: 	 <p>The minimum value of the metric.</p>
+       last: 	 <p>The most recent value of the metric.</p>
+       count: 	 <p>The number of samples used to generate the metric.</p>
+       avg: 	 <p>The average value of the metric.</p>
+       std_dev: 	 <p>The standard deviation of the metric.</p>
+    """
+
+    metric_name: Optional[str] = Unassigned()
+    source_arn: Optional[str] = Unassigned()
+    time_stamp: Optional[datetime.datetime] = Unassigned()
+    max: Optional[float] = Unassigned()
+    min: Optional[float] = Unassigned()
+    last: Optional[float] = Unassigned()
+    count: Optional[int] = Unassigned()
+    avg: Optional[float] = Unassigned()
+    std_dev: Optional[float] = Unassigned()
+
+
+class TrialComponentSummary(Base):
+    """
+    TrialComponentSummary
+         <p>A summary of the properties of a trial component. To get all the properties, call the <a href="https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DescribeTrialComponent.html">DescribeTrialComponent</a> API and provide the <code>TrialComponentName</code>.</p>
+
+        Attributes
+       ----------------------
+       trial_component_name: 	 <p>The name of the trial component.</p>
+       trial_component_arn: 	 <p>The Amazon Resource Name (ARN) of the trial component.</p>
+       display_name: 	 <p>The name of the component as displayed. If <code>DisplayName</code> isn't specified, <code>TrialComponentName</code> is displayed.</p>
+       trial_component_source
+       status: 	 <p>The status of the component. States include:</p> <ul> <li> <p>InProgress</p> </li> <li> <p>Completed</p> </li> <li> <p>Failed</p> </li> </ul>
+       start_time: 	 <p>When the component started.</p>
+       end_time: 	 <p>When the component ended.</p>
+       creation_time: 	 <p>When the component was created.</p>
+       created_by: 	 <p>Who created the trial component.</p>
+       last_modified_time: 	 <p>When the component was last modified.</p>
+       last_modified_by: 	 <p>Who last modified the component.</p>
+    """
+
+    trial_component_name: Optional[str] = Unassigned()
+    trial_component_arn: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    trial_component_source: Optional[TrialComponentSource] = Unassigned()
+    status: Optional[TrialComponentStatus] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[UserContext] = Unassigned()
@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+
+from typing import List, Dict, Optional, Any
+
+from . import Base, Unassigned
+
+
+class UserProfileDetails(Base):
+    """
+    UserProfileDetails
+         <p>The user profile details.</p>
+
+        Attributes
+       ----------------------
+       domain_id: 	 <p>The domain ID.</p>
+       user_profile_name: 	 <p>The user profile name.</p>
+       status: 	 <p>The status.</p>
+       creation_time: 	 <p>The creation time.</p>
+       last_modified_time: 	 <p>The last modified time.</p>
+    """
+
+    domain_id: Optional[str] = Unassigned()
+    user_profile_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
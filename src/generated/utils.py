@@ -11,103 +11,691 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import asyncio
+import functools
 import logging
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 from boto3.session import Session
+from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
+
+from src.code_injection.codec import (
+    pascal_to_snake,
+    snake_to_pascal,
+    transform,
+    transform_view,
+)
+from src.code_injection.columnar import ColumnTable
+from src.code_injection.views import ShapeView
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def snake_to_pascal(snake_str):
+class Unassigned:
+    """A custom type used to signify an undefined optional argument."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+
+class ClientPool:
+    """
+    A bounded, thread-safe pool of boto3 clients with LRU eviction.
+
+    Clients are keyed by credentials identity, region, service name and client config,
+    so calls made with different sessions or regions never share a client while calls
+    made with the same ones reuse its connections.
+    """
+
+    def __init__(self, max_size: int = 64, max_pool_connections: int = 10):
+        """
+        Initializes a ClientPool.
+
+        Args:
+            max_size (int): The maximum number of clients kept in the pool.
+            max_pool_connections (int): The maximum number of connections each pooled
+                client keeps open, unless set in the config of the call.
+        """
+        self.max_size = max_size
+        self.max_pool_connections = max_pool_connections
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+        self._default_session = None
+
+    def get_default_session(self) -> Session:
+        """Returns the session used when none is provided, created once."""
+        if self._default_session is None:
+            with self._lock:
+                if self._default_session is None:
+                    logger.warning("No boto3 session provided. Creating a new session.")
+                    self._default_session = Session()
+        return self._default_session
+
+    def get_client(
+        self,
+        session: Optional[Session] = None,
+        region_name: Optional[str] = None,
+        service_name: str = "sagemaker",
+        config: Optional[Config] = None,
+    ):
+        """
+        Returns the pooled client of the given session, region and service.
+
+        Args:
+            session (Session): The boto3 session. Defaults to the pool's default session.
+            region_name (str): The region. Defaults to the region of the session.
+            service_name (str): The service name, ie. sagemaker or sagemaker-runtime.
+            config (Config): Additional botocore client config.
+
+        Returns:
+            The boto3 client.
+        """
+        session = session or self.get_default_session()
+        region_name = region_name or session.region_name
+        key = (
+            _credentials_identity(session),
+            region_name,
+            service_name,
+            _config_identity(config),
+        )
+
+        with self._lock:
+            if (client := self._clients.get(key)) is not None:
+                self._clients.move_to_end(key)
+                return client
+
+        # Build outside of the lock, client creation is slow
+        client_config = Config(max_pool_connections=self.max_pool_connections)
+        if config is not None:
+            client_config = client_config.merge(config)
+        client = session.client(service_name, region_name, config=client_config)
+
+        with self._lock:
+            # Another thread may have built the same client meanwhile
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self) -> None:
+        """Removes all the clients from the pool."""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def _credentials_identity(session: Session):
+    """
+    Returns a hashable identity of the credentials of a session.
+
+    Refreshable credentials are identified by their object, as their keys rotate,
+    while static credentials are identified by their values.
     """
-    Convert a snake_case string to PascalCase.
+    credentials = session.get_credentials()
+    if credentials is None or isinstance(credentials, RefreshableCredentials):
+        return credentials
+    return credentials.get_frozen_credentials()
+
+
+def _config_identity(config: Optional[Config]) -> Optional[str]:
+    """Returns a hashable identity of a botocore client config, from its public options."""
+    if config is None:
+        return None
+    return repr(
+        sorted((name, getattr(config, name)) for name in Config.OPTION_DEFAULTS)
+    )
+
+
+_client_pool = ClientPool()
+
+
+def get_client_pool() -> ClientPool:
+    """Returns the client pool shared by all resources."""
+    return _client_pool
+
+
+def configure_client_pool(
+    max_size: Optional[int] = None, max_pool_connections: Optional[int] = None
+) -> None:
+    """
+    Configures the client pool shared by all resources.
 
     Args:
-        snake_str (str): The snake_case string to be converted.
+        max_size (int): The maximum number of clients kept in the pool.
+        max_pool_connections (int): The maximum number of connections of each client
+            created from now on.
+    """
+    with _client_pool._lock:
+        if max_size is not None:
+            _client_pool.max_size = max_size
+            while len(_client_pool._clients) > max_size:
+                _client_pool._clients.popitem(last=False)
+        if max_pool_connections is not None:
+            _client_pool.max_pool_connections = max_pool_connections
+
+
+class DescribeCacheStats(NamedTuple):
+    """The counters of a DescribeCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+def _args_identity(operation_input_args: dict):
+    """Returns a hashable identity of the input arguments of a Describe API."""
+    identity = tuple(sorted(operation_input_args.items()))
+    try:
+        hash(identity)
+    except TypeError:
+        return repr(identity)
+    return identity
 
-    Returns:
-        str: The PascalCase string.
 
+def _describe_key(
+    resource_type: str,
+    operation_input_args: dict,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> tuple:
+    """Returns the identity of a Describe call, see DescribeCache and SingleFlight."""
+    session = session or get_client_pool().get_default_session()
+    return (
+        resource_type,
+        _args_identity(operation_input_args),
+        _credentials_identity(session),
+        region or session.region_name,
+    )
+
+
+def _is_changed_by_write(
+    key: tuple,
+    describe_args: dict,
+    resource_type: str,
+    write_args: dict,
+    region: str,
+) -> bool:
+    """
+    Whether a write call may change the response of a Describe call.
+
+    It does when the Describe call is of the resource type and region, and every
+    Describe input argument that is also an argument of the write call has the same
+    value, so a write sharing no argument with the Describe API changes all the
+    responses of the resource type. Credentials are ignored, other credentials may be
+    of the same account.
+    """
+    return (
+        key[0] == resource_type
+        and key[3] == region
+        and all(
+            write_args.get(name, value) == value
+            for name, value in describe_args.items()
+        )
+    )
+
+
+class DescribeCache:
     """
-    components = snake_str.split("_")
-    return "".join(x.title() for x in components[0:])
+    A bounded, thread-safe cache of Describe API responses with LRU eviction and a TTL.
+
+    Responses are keyed by resource type, Describe input arguments, credentials identity
+    and region. The raw responses are cached, every get still builds its own resource
+    from them.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 5.0):
+        """
+        Initializes a DescribeCache.
+
+        Args:
+            max_size (int): The maximum number of responses kept in the cache.
+            ttl (float): The number of seconds a response is served from the cache.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+        self._expirations = self._invalidations = 0
+
+    def key(
+        self,
+        resource_type: str,
+        operation_input_args: dict,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> tuple:
+        """Returns the cache key of a Describe call."""
+        return _describe_key(resource_type, operation_input_args, session, region)
+
+    def get(self, key: tuple) -> Optional[dict]:
+        """Returns the cached response of a key, None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response, _ = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return response
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return None
 
+    def put(self, key: tuple, response: dict, operation_input_args: dict) -> None:
+        """Caches the response of a key for ttl seconds."""
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + self.ttl,
+                response,
+                operation_input_args,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
 
-def pascal_to_snake(pascal_str):
+    def invalidate(
+        self,
+        resource_type: str,
+        operation_input_args: Optional[dict] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> int:
+        """
+        Removes the cached responses of the resources a write call may have changed.
+
+        The removed responses are the ones the write call may have changed, see
+        _is_changed_by_write.
+
+        Args:
+            resource_type (str): The resource type, ie. Endpoint.
+            operation_input_args (dict): The serialized input arguments of the write
+                call, all the responses of the resource type are removed if None.
+            session (Session): The boto3 session of the write call.
+            region (str): The region of the write call.
+
+        Returns:
+            int: The number of removed responses.
+        """
+        session = session or get_client_pool().get_default_session()
+        region = region or session.region_name
+        operation_input_args = operation_input_args or {}
+        with self._lock:
+            removed_keys = [
+                key
+                for key, (_, _, describe_args) in self._entries.items()
+                if _is_changed_by_write(
+                    key, describe_args, resource_type, operation_input_args, region
+                )
+            ]
+            for key in removed_keys:
+                del self._entries[key]
+            self._invalidations += len(removed_keys)
+        return len(removed_keys)
+
+    def clear(self) -> None:
+        """Removes all the responses from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> DescribeCacheStats:
+        """Returns a snapshot of the counters of the cache."""
+        with self._lock:
+            return DescribeCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_describe_cache: Optional[DescribeCache] = None
+
+
+def get_describe_cache() -> Optional[DescribeCache]:
+    """Returns the describe cache shared by all resources, None if disabled."""
+    return _describe_cache
+
+
+def configure_describe_cache(
+    enabled: bool = True, max_size: int = 1024, ttl: float = 5.0
+) -> Optional[DescribeCache]:
     """
-    Converts a PascalCase string to snake_case.
+    Enables or disables the describe cache shared by the get and refresh methods.
+
+    The cache is disabled by default. The create, load, update, delete and stop
+    methods of a resource invalidate its cached responses.
 
     Args:
-        pascal_str (str): The PascalCase string to be converted.
+        enabled (bool): Whether to cache the Describe responses.
+        max_size (int): The maximum number of responses kept in the cache.
+        ttl (float): The number of seconds a response is served from the cache.
 
     Returns:
-        str: The converted snake_case string.
+        Optional[DescribeCache]: The new cache if enabled, None otherwise.
     """
-    return "".join(["_" + i.lower() if i.isupper() else i for i in pascal_str]).lstrip(
-        "_"
-    )
+    global _describe_cache
+    _describe_cache = DescribeCache(max_size=max_size, ttl=ttl) if enabled else None
+    return _describe_cache
 
 
-class Unassigned:
-    """A custom type used to signify an undefined optional argument."""
+class SingleFlightStats(NamedTuple):
+    """The counters of a SingleFlight."""
 
-    _instance = None
+    calls: int
+    coalesced: int
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
 
+class _Flight:
+    """An in-flight call, shared by the threads making the same call."""
 
-class SingletonMeta(type):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
     """
-    Singleton metaclass. Ensures that a single instance of a class using this metaclass is created.
+    Coalesces concurrent identical calls into one in-flight call.
+
+    The callers making a call while an identical one is in flight wait for it and share
+    its result, or its error. Nothing is kept once the call returns, so unlike a cache,
+    a call never returns a result older than itself. Threads share the calls made by
+    other threads, coroutines the calls made on the same event loop.
     """
 
-    _instances = {}
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._calls = self._coalesced = 0
 
-    def __call__(cls, *args, **kwargs):
+    def call(self, key: tuple, function: Callable[[], Any], describe_args: dict):
         """
-        Overrides the call method to return an existing instance of the class if it exists,
-        or create a new one if it doesn't.
+        Calls function, unless an identical call is in flight.
+
+        Args:
+            key (tuple): The identity of the call.
+            function (Callable): Makes the call.
+            describe_args (dict): The input arguments of the call, see forget.
+
+        Returns:
+            The result of the in-flight call.
+        """
+        flight_key = (None, key)
+        with self._lock:
+            entry = self._flights.get(flight_key)
+            if entry is None:
+                flight = _Flight()
+                self._flights[flight_key] = (flight, describe_args)
+                self._calls += 1
+            else:
+                flight = entry[0]
+                self._coalesced += 1
+        if entry is not None:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = function()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            self._land(flight_key, flight)
+            flight.done.set()
+        return flight.result
+
+    async def async_call(
+        self, key: tuple, function: Callable[[], Awaitable], describe_args: dict
+    ):
         """
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        The asyncio counterpart of call, function returns an awaitable.
+
+        The call runs in its own task, a caller being cancelled does not cancel it for
+        the other callers.
+        """
+        flight_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            entry = self._flights.get(flight_key)
+            if entry is None:
+                task = asyncio.ensure_future(function())
+                self._flights[flight_key] = (task, describe_args)
+                task.add_done_callback(lambda _: self._land(flight_key, task))
+                self._calls += 1
+            else:
+                task = entry[0]
+                self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _land(self, flight_key: tuple, flight) -> None:
+        with self._lock:
+            entry = self._flights.get(flight_key)
+            if entry is not None and entry[0] is flight:
+                del self._flights[flight_key]
+
+    def forget(self, resource_type: str, write_args: dict, region: str) -> int:
+        """
+        Stops sharing the in-flight calls a write call may have changed the result of.
+
+        The callers already waiting for these calls still share them, later callers make
+        new calls, so a get following a write never returns a response older than it.
+
+        Returns:
+            int: The number of forgotten calls.
+        """
+        with self._lock:
+            forgotten_keys = [
+                flight_key
+                for flight_key, (_, describe_args) in self._flights.items()
+                if _is_changed_by_write(
+                    flight_key[1], describe_args, resource_type, write_args, region
+                )
+            ]
+            for flight_key in forgotten_keys:
+                del self._flights[flight_key]
+        return len(forgotten_keys)
+
+    def stats(self) -> SingleFlightStats:
+        """Returns a snapshot of the counters of the calls."""
+        with self._lock:
+            return SingleFlightStats(calls=self._calls, coalesced=self._coalesced)
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Returns the single flight shared by all resources, None if disabled."""
+    return _single_flight
+
+
+def configure_single_flight(enabled: bool = True) -> Optional[SingleFlight]:
+    """
+    Enables or disables the coalescing of concurrent identical Describe calls.
+
+    It is disabled by default. Once enabled, the concurrent get and refresh calls of a
+    resource share one Describe call and its raw response.
+
+    Args:
+        enabled (bool): Whether to coalesce the Describe calls.
+
+    Returns:
+        Optional[SingleFlight]: The new single flight if enabled, None otherwise.
+    """
+    global _single_flight
+    _single_flight = SingleFlight() if enabled else None
+    return _single_flight
+
+
+def cached_describe(
+    resource_type: str,
+    operation_input_args: dict,
+    describe: Callable[[], dict],
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> dict:
+    """
+    Calls a Describe API through the describe cache and the single flight, if enabled.
+
+    Args:
+        resource_type (str): The resource type, ie. Endpoint.
+        operation_input_args (dict): The serialized input arguments of the Describe API.
+        describe (Callable): Calls the Describe API.
+        session (Session): The boto3 session of the call.
+        region (str): The region of the call.
+
+    Returns:
+        dict: The raw response of the Describe API.
+    """
+    cache, single_flight = _describe_cache, _single_flight
+    if cache is None and single_flight is None:
+        return describe()
+    key = _describe_key(resource_type, operation_input_args, session, region)
+    if cache is not None:
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        def describe_and_cache():
+            response = describe()
+            cache.put(key, response, operation_input_args)
+            return response
+
+    else:
+        describe_and_cache = describe
+    if single_flight is None:
+        return describe_and_cache()
+    return single_flight.call(key, describe_and_cache, operation_input_args)
+
+
+async def async_cached_describe(
+    resource_type: str,
+    operation_input_args: dict,
+    describe: Callable[[], Awaitable[dict]],
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> dict:
+    """The asyncio counterpart of cached_describe, describe returns an awaitable."""
+    cache, single_flight = _describe_cache, _single_flight
+    if cache is None and single_flight is None:
+        return await describe()
+    key = _describe_key(resource_type, operation_input_args, session, region)
+    if cache is not None:
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        async def describe_and_cache():
+            response = await describe()
+            cache.put(key, response, operation_input_args)
+            return response
+
+    else:
+        describe_and_cache = describe
+    if single_flight is None:
+        return await describe_and_cache()
+    return await single_flight.async_call(key, describe_and_cache, operation_input_args)
+
+
+def invalidate_describe_cache(
+    resource_type: str,
+    operation_input_args: dict,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> None:
+    """
+    Invalidates the cached responses and in-flight Describe calls changed by a write call.
+
+    See DescribeCache.invalidate and SingleFlight.forget.
+    """
+    cache, single_flight = _describe_cache, _single_flight
+    if cache is not None:
+        cache.invalidate(resource_type, operation_input_args, session, region)
+    if single_flight is not None:
+        session = session or get_client_pool().get_default_session()
+        single_flight.forget(
+            resource_type, operation_input_args or {}, region or session.region_name
+        )
 
 
-class SageMakerClient(metaclass=SingletonMeta):
+class SageMakerClient:
     """
-    A singleton class for creating a SageMaker client.
+    A SageMaker client backed by the shared client pool.
     """
 
     def __init__(
-        self, session: Session = None, region_name: str = None, service_name="sagemaker"
+        self,
+        session: Session = None,
+        region_name: str = None,
+        service_name="sagemaker",
+        config: Optional[Config] = None,
     ):
         """
         Initializes the SageMakerClient with a boto3 session, region name, and service name.
-        Creates a boto3 client using the provided session, region, and service.
+        Reuses the pooled boto3 client of the provided session, region, and service.
         """
-        if session is None:
-            logger.warning("No boto3 session provided. Creating a new session.")
-            session = Session()
-
-        if region_name is None:
-            logger.warning("No region provided. Using default region.")
-            region_name = session.region_name
-
         self.session = session
         self.region_name = region_name
         self.service_name = service_name
-        self.client = session.client(service_name, region_name)
+        self.client = get_client_pool().get_client(
+            session=session,
+            region_name=region_name,
+            service_name=service_name,
+            config=config,
+        )
 
 
-class SageMakerRuntimeClient(metaclass=SingletonMeta):
+class SageMakerRuntimeClient(SageMakerClient):
     """
-    A singleton class for creating a SageMaker client.
+    A SageMaker Runtime client backed by the shared client pool.
     """
 
     def __init__(
@@ -115,20 +703,519 @@ class SageMakerRuntimeClient(metaclass=SingletonMeta):
         session: Session = None,
         region_name: str = None,
         service_name="sagemaker-runtime",
+        config: Optional[Config] = None,
     ):
+        super().__init__(
+            session=session,
+            region_name=region_name,
+            service_name=service_name,
+            config=config,
+        )
+
+
+T = TypeVar("T")
+
+
+class _BaseResourceIterator(Generic[T]):
+    """Common state of the sync and async resource iterators."""
+
+    def __init__(
+        self,
+        list_method: str,
+        list_method_kwargs: dict,
+        summaries_key: str,
+        summary_name: str,
+        resource_cls: Type[T],
+        resource_kwargs: Optional[dict] = None,
+        max_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ):
+        self.list_method = list_method
+        self.list_method_kwargs = list_method_kwargs
+        self.summaries_key = summaries_key
+        self.summary_name = summary_name
+        self.resource_cls = resource_cls
+        self.resource_kwargs = resource_kwargs or {}
+        self.max_results = max_results
+        self.page_size = page_size
+        self.session = session
+        self.region = region
+
+    def _page_kwargs(self, next_token: Optional[str], remaining: Optional[int]) -> dict:
+        """Builds the List API input arguments of the next page."""
+        list_method_kwargs = dict(self.list_method_kwargs)
+        if next_token:
+            list_method_kwargs["NextToken"] = next_token
+        if self.page_size is not None:
+            list_method_kwargs["MaxResults"] = (
+                self.page_size if remaining is None else min(self.page_size, remaining)
+            )
+        return list_method_kwargs
+
+    def _to_resource(self, summary: dict) -> T:
         """
-        Initializes the SageMakerClient with a boto3 session, region name, and service name.
-        Creates a boto3 client using the provided session, region, and service.
+        Builds a resource object from a raw summary.
+
+        Only the summary members that are also attributes of the resource are kept.
         """
-        if session is None:
-            logger.warning("No boto3 session provided. Creating a new session.")
-            session = Session()
+        model_fields = self.resource_cls.model_fields
+        transformed_summary = transform(summary, self.summary_name)
+        resource_kwargs = {
+            attribute: value
+            for attribute, value in transformed_summary.items()
+            if attribute in model_fields
+        }
+        resource_kwargs.update(self.resource_kwargs)
+        resource = self.resource_cls(**resource_kwargs)
+        resource._session = self.session
+        resource._region = self.region
+        return resource
 
-        if region_name is None:
-            logger.warning("No region provided. Using default region.")
-            region_name = session.region_name
+    def _append_page(self, table: ColumnTable, response: dict) -> None:
+        """Appends the summaries of a raw List API response to a table, up to max_results."""
+        summaries = response.get(self.summaries_key, [])
+        if self.max_results is not None:
+            summaries = summaries[: self.max_results - len(table)]
+        table.append_page(summaries)
 
-        self.session = session
-        self.region_name = region_name
+
+class ResourceIterator(_BaseResourceIterator[T]):
+    """
+    A lazy iterator over the resources returned by a paginated List API.
+
+    Pages are only requested while the iterator is consumed, following the NextToken
+    of each response, and every summary is deserialized into a resource object as it
+    is yielded. Breaking out of the loop stops the pagination.
+    """
+
+    def __init__(self, client, **kwargs):
+        """
+        Initializes a ResourceIterator.
+
+        Args:
+            client: The boto3 client used to call the List API.
+            list_method (str): The name of the client method of the List API.
+            list_method_kwargs (dict): The serialized input arguments of the List API.
+            summaries_key (str): The response member holding the list of summaries.
+            summary_name (str): The shape name of a summary.
+            resource_cls (Type[T]): The resource class to build from each summary.
+            resource_kwargs (dict): Additional attributes set on every resource, used
+                for identifiers that are List API inputs rather than summary members.
+            max_results (int): The maximum number of resources to yield in total.
+            page_size (int): The number of resources requested per List API call.
+            session (Session): The boto3 session the resources are bound to.
+            region (str): The region the resources are bound to.
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iterate()
+
+    def iter_pages(self) -> Iterator[dict]:
+        """
+        Lazily iterates over the raw List API responses, one per page.
+
+        Yields:
+            dict: The raw response of each List API call.
+        """
+        next_token, remaining = None, self.max_results
+        while remaining is None or remaining > 0:
+            list_method_kwargs = self._page_kwargs(next_token, remaining)
+            response = getattr(self.client, self.list_method)(**list_method_kwargs)
+            yield response
+
+            if remaining is not None:
+                remaining -= len(response.get(self.summaries_key, []))
+            next_token = response.get("NextToken")
+            if not next_token:
+                return
+
+    def _iterate(self) -> Iterator[T]:
+        count = 0
+        for response in self.iter_pages():
+            for summary in response.get(self.summaries_key, []):
+                if self.max_results is not None and count >= self.max_results:
+                    return
+                count += 1
+                yield self._to_resource(summary)
+
+    def iter_views(self) -> Iterator[ShapeView]:
+        """
+        Lazily iterates over read-only views of the summaries, without building resources.
+
+        Yields:
+            ShapeView: The view of each summary, see ShapeView.to_model.
+        """
+        count = 0
+        for response in self.iter_pages():
+            for summary in response.get(self.summaries_key, []):
+                if self.max_results is not None and count >= self.max_results:
+                    return
+                count += 1
+                yield transform_view(summary, self.summary_name)
+
+    def to_table(self, fields: Optional[List[str]] = None) -> ColumnTable:
+        """
+        Decodes the summaries of all the pages into columns, without building resources.
+
+        Args:
+            fields (List[str]): The snake cased summary attributes to decode, all by default.
+
+        Returns:
+            ColumnTable: The decoded summaries.
+        """
+        table = ColumnTable(self.summary_name, fields)
+        for response in self.iter_pages():
+            self._append_page(table, response)
+        return table
+
+    def to_columns(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Decodes the summaries of all the pages into columns, see ColumnTable.to_columns.
+
+        Args:
+            fields (List[str]): The snake cased summary attributes to decode, all by default.
+
+        Returns:
+            dict: The column of every attribute.
+        """
+        return self.to_table(fields).to_columns()
+
+    def to_pandas(self, fields: Optional[List[str]] = None):
+        """
+        Decodes the summaries of all the pages into a pandas DataFrame.
+
+        Args:
+            fields (List[str]): The snake cased summary attributes to decode, all by default.
+
+        Returns:
+            pandas.DataFrame: One row per summary and one column per attribute.
+        """
+        return self.to_table(fields).to_pandas()
+
+
+class AsyncResourceIterator(_BaseResourceIterator[T]):
+    """
+    The asyncio counterpart of ResourceIterator, consumed with ``async for``.
+
+    The List API calls go through the configured AsyncTransport.
+    """
+
+    def __init__(self, service_name: str, **kwargs):
+        """
+        Initializes an AsyncResourceIterator.
+
+        Args:
+            service_name (str): The service of the List API.
+            **kwargs: The arguments of ResourceIterator other than the client.
+        """
+        super().__init__(**kwargs)
         self.service_name = service_name
-        self.client = session.client(service_name, region_name)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
+
+    async def iter_pages(self) -> AsyncIterator[dict]:
+        """
+        Lazily iterates over the raw List API responses, one per page.
+
+        Yields:
+            dict: The raw response of each List API call.
+        """
+        next_token, remaining = None, self.max_results
+        while remaining is None or remaining > 0:
+            list_method_kwargs = self._page_kwargs(next_token, remaining)
+            response = await get_async_transport().call(
+                self.service_name,
+                self.list_method,
+                list_method_kwargs,
+                session=self.session,
+                region=self.region,
+            )
+            yield response
+
+            if remaining is not None:
+                remaining -= len(response.get(self.summaries_key, []))
+            next_token = response.get("NextToken")
+            if not next_token:
+                return
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        count = 0
+        async for response in self.iter_pages():
+            for summary in response.get(self.summaries_key, []):
+                if self.max_results is not None and count >= self.max_results:
+                    return
+                count += 1
+                yield self._to_resource(summary)
+
+    async def iter_views(self) -> AsyncIterator[ShapeView]:
+        """
+        Lazily iterates over read-only views of the summaries, without building resources.
+
+        Yields:
+            ShapeView: The view of each summary, see ShapeView.to_model.
+        """
+        count = 0
+        async for response in self.iter_pages():
+            for summary in response.get(self.summaries_key, []):
+                if self.max_results is not None and count >= self.max_results:
+                    return
+                count += 1
+                yield transform_view(summary, self.summary_name)
+
+    async def to_table(self, fields: Optional[List[str]] = None) -> ColumnTable:
+        """
+        Decodes the summaries of all the pages into columns, without building resources.
+
+        Args:
+            fields (List[str]): The snake cased summary attributes to decode, all by default.
+
+        Returns:
+            ColumnTable: The decoded summaries.
+        """
+        table = ColumnTable(self.summary_name, fields)
+        async for response in self.iter_pages():
+            self._append_page(table, response)
+        return table
+
+    async def to_columns(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Decodes the summaries of all the pages into columns, see ColumnTable.to_columns.
+
+        Args:
+            fields (List[str]): The snake cased summary attributes to decode, all by default.
+
+        Returns:
+            dict: The column of every attribute.
+        """
+        return (await self.to_table(fields)).to_columns()
+
+    async def to_pandas(self, fields: Optional[List[str]] = None):
+        """
+        Decodes the summaries of all the pages into a pandas DataFrame.
+
+        Args:
+            fields (List[str]): The snake cased summary attributes to decode, all by default.
+
+        Returns:
+            pandas.DataFrame: One row per summary and one column per attribute.
+        """
+        return (await self.to_table(fields)).to_pandas()
+
+
+def _get_client(
+    service_name: str,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+    config: Optional[Config] = None,
+):
+    """Returns the boto3 client of the given service."""
+    if service_name == "sagemaker-runtime":
+        return SageMakerRuntimeClient(
+            session=session,
+            region_name=region,
+            service_name=service_name,
+            config=config,
+        ).client
+    return SageMakerClient(
+        session=session, region_name=region, service_name=service_name, config=config
+    ).client
+
+
+class AsyncTransport:
+    """
+    The transport used by the asyncio resource API to call the service.
+
+    Subclass it and register it with set_async_transport() to plug in another client.
+    """
+
+    async def call(
+        self,
+        service_name: str,
+        operation_name: str,
+        operation_input_args: dict,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> dict:
+        """
+        Calls a service operation.
+
+        Args:
+            service_name (str): The service name, ie. sagemaker or sagemaker-runtime.
+            operation_name (str): The snake cased operation name, ie. describe_endpoint.
+            operation_input_args (dict): The serialized input arguments.
+            session (Session): The boto3 session the call is made with.
+            region (str): The region the call is made in.
+            config (Config): The botocore config of the client the call is made with,
+                ie. to size its connection pool.
+
+        Returns:
+            dict: The raw response of the operation.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Releases the resources held by the transport."""
+
+
+class ExecutorAsyncTransport(AsyncTransport):
+    """
+    Runs the blocking boto3 client calls in a bounded thread pool.
+
+    This transport has no extra dependency and shares the clients of the sync API.
+    """
+
+    def __init__(self, max_workers: int = 32):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sagemaker-aio"
+        )
+
+    async def call(
+        self,
+        service_name: str,
+        operation_name: str,
+        operation_input_args: dict,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> dict:
+        client = _get_client(
+            service_name, session=session, region=region, config=config
+        )
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(getattr(client, operation_name), **operation_input_args),
+        )
+
+    async def close(self) -> None:
+        self.executor.shutdown(wait=False)
+
+
+class AiobotocoreAsyncTransport(AsyncTransport):
+    """
+    Calls the service with aiobotocore clients, so no thread is blocked per call.
+
+    Requires the optional aiobotocore dependency. One client is opened per service,
+    region and credentials. As credentials rotate, the least recently used clients are
+    closed beyond max_size, the others are closed when close() is awaited.
+    """
+
+    def __init__(self, aiobotocore_session=None, max_size: int = 64):
+        """
+        Initializes an AiobotocoreAsyncTransport.
+
+        Args:
+            aiobotocore_session: The aiobotocore session the clients are created with.
+                Defaults to a new session.
+            max_size (int): The maximum number of clients kept open.
+        """
+        if aiobotocore_session is None:
+            try:
+                from aiobotocore.session import get_session
+            except ImportError as e:
+                raise ImportError(
+                    "aiobotocore is required to use AiobotocoreAsyncTransport"
+                ) from e
+            aiobotocore_session = get_session()
+
+        self.aiobotocore_session = aiobotocore_session
+        self.max_size = max_size
+        self._clients = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def _get_async_client(
+        self,
+        service_name: str,
+        session: Optional[Session],
+        region: Optional[str],
+        config: Optional[Config] = None,
+    ):
+        credentials = session.get_credentials() if session else None
+        credentials = credentials.get_frozen_credentials() if credentials else None
+        region = region or (session.region_name if session else None)
+        key = (service_name, region, credentials, _config_identity(config))
+        if (client := self._clients.get(key)) is not None:
+            self._clients.move_to_end(key)
+            return client
+
+        async with self._lock:
+            if (client := self._clients.get(key)) is None:
+                client = await self.aiobotocore_session.create_client(
+                    service_name,
+                    region_name=region,
+                    aws_access_key_id=(credentials.access_key if credentials else None),
+                    aws_secret_access_key=(
+                        credentials.secret_key if credentials else None
+                    ),
+                    aws_session_token=credentials.token if credentials else None,
+                    config=self._aio_config(config),
+                ).__aenter__()
+                self._clients[key] = client
+                while len(self._clients) > self.max_size:
+                    _, evicted_client = self._clients.popitem(last=False)
+                    await evicted_client.__aexit__(None, None, None)
+            self._clients.move_to_end(key)
+        return client
+
+    @staticmethod
+    def _aio_config(config: Optional[Config]):
+        if config is None:
+            return None
+        from aiobotocore.config import AioConfig
+
+        return AioConfig(
+            **{
+                name: getattr(config, name)
+                for name in Config.OPTION_DEFAULTS
+                if getattr(config, name) is not None
+            }
+        )
+
+    async def call(
+        self,
+        service_name: str,
+        operation_name: str,
+        operation_input_args: dict,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> dict:
+        client = await self._get_async_client(service_name, session, region, config)
+        return await getattr(client, operation_name)(**operation_input_args)
+
+    async def close(self) -> None:
+        async with self._lock:
+            while self._clients:
+                _, client = self._clients.popitem()
+                await client.__aexit__(None, None, None)
+
+
+_async_transport: Optional[AsyncTransport] = None
+
+
+def get_async_transport() -> AsyncTransport:
+    """
+    Returns the transport used by the asyncio resource API.
+
+    An ExecutorAsyncTransport is created on first use if none was set.
+    """
+    global _async_transport
+    if _async_transport is None:
+        _async_transport = ExecutorAsyncTransport()
+    return _async_transport
+
+
+def set_async_transport(transport: AsyncTransport) -> None:
+    """
+    Sets the transport used by the asyncio resource API.
+
+    Args:
+        transport (AsyncTransport): The transport to use for all subsequent calls.
+    """
+    global _async_transport
+    _async_transport = transport
@@ -0,0 +1,1195 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import importlib
+
+from src.code_injection.views import ShapeView
+
+# The module of each class, imported on first access of one of its classes
+_VIEW_MODULES = {
+    "ActionSourceView": "action_source",
+    "ActionSummaryView": "action_source",
+    "CreateActionRequestView": "action_source",
+    "CreateActionResponseView": "action_source",
+    "DeleteActionRequestView": "action_source",
+    "DeleteActionResponseView": "action_source",
+    "DescribeActionRequestView": "action_source",
+    "DescribeActionResponseView": "action_source",
+    "ListActionsRequestView": "action_source",
+    "ListActionsResponseView": "action_source",
+    "UpdateActionRequestView": "action_source",
+    "UpdateActionResponseView": "action_source",
+    "AddAssociationRequestView": "add_association_request",
+    "AddAssociationResponseView": "add_association_request",
+    "AssociationSummaryView": "add_association_request",
+    "DeleteAssociationRequestView": "add_association_request",
+    "DeleteAssociationResponseView": "add_association_request",
+    "ListAssociationsRequestView": "add_association_request",
+    "ListAssociationsResponseView": "add_association_request",
+    "AddTagsInputView": "add_tags_input",
+    "AddTagsOutputView": "add_tags_input",
+    "DeleteTagsInputView": "add_tags_input",
+    "ListTagsInputView": "add_tags_input",
+    "ListTagsOutputView": "add_tags_input",
+    "AdditionalInferenceSpecificationDefinitionView": "additional_inference_specification_definition",
+    "BatchDescribeModelPackageErrorView": "additional_inference_specification_definition",
+    "BatchDescribeModelPackageInputView": "additional_inference_specification_definition",
+    "BatchDescribeModelPackageOutputView": "additional_inference_specification_definition",
+    "BatchDescribeModelPackageSummaryView": "additional_inference_specification_definition",
+    "BiasView": "additional_inference_specification_definition",
+    "CreateModelPackageInputView": "additional_inference_specification_definition",
+    "CreateModelPackageOutputView": "additional_inference_specification_definition",
+    "DeleteModelPackageInputView": "additional_inference_specification_definition",
+    "DescribeModelPackageInputView": "additional_inference_specification_definition",
+    "DescribeModelPackageOutputView": "additional_inference_specification_definition",
+    "DriftCheckBaselinesView": "additional_inference_specification_definition",
+    "DriftCheckBiasView": "additional_inference_specification_definition",
+    "DriftCheckExplainabilityView": "additional_inference_specification_definition",
+    "DriftCheckModelDataQualityView": "additional_inference_specification_definition",
+    "DriftCheckModelQualityView": "additional_inference_specification_definition",
+    "ExplainabilityView": "additional_inference_specification_definition",
+    "FileSourceView": "additional_inference_specification_definition",
+    "ListModelPackagesInputView": "additional_inference_specification_definition",
+    "ListModelPackagesOutputView": "additional_inference_specification_definition",
+    "MetricsSourceView": "additional_inference_specification_definition",
+    "ModelDataQualityView": "additional_inference_specification_definition",
+    "ModelMetricsView": "additional_inference_specification_definition",
+    "ModelPackageStatusDetailsView": "additional_inference_specification_definition",
+    "ModelPackageStatusItemView": "additional_inference_specification_definition",
+    "ModelPackageSummaryView": "additional_inference_specification_definition",
+    "ModelPackageValidationProfileView": "additional_inference_specification_definition",
+    "ModelPackageValidationSpecificationView": "additional_inference_specification_definition",
+    "ModelQualityView": "additional_inference_specification_definition",
+    "SourceAlgorithmView": "additional_inference_specification_definition",
+    "SourceAlgorithmSpecificationView": "additional_inference_specification_definition",
+    "UpdateModelPackageInputView": "additional_inference_specification_definition",
+    "UpdateModelPackageOutputView": "additional_inference_specification_definition",
+    "AdditionalS3DataSourceView": "additional_s3_data_source",
+    "InferenceSpecificationView": "additional_s3_data_source",
+    "ModelInputView": "additional_s3_data_source",
+    "ModelPackageContainerDefinitionView": "additional_s3_data_source",
+    "TransformJobDefinitionView": "additional_s3_data_source",
+    "AgentVersionView": "agent_version",
+    "DeviceStatsView": "agent_version",
+    "EdgeModelStatView": "agent_version",
+    "GetDeviceFleetReportRequestView": "agent_version",
+    "GetDeviceFleetReportResponseView": "agent_version",
+    "AlarmView": "alarm",
+    "AutoRollbackConfigView": "alarm",
+    "BlueGreenUpdatePolicyView": "alarm",
+    "CapacitySizeView": "alarm",
+    "CreateEndpointInputView": "alarm",
+    "CreateEndpointOutputView": "alarm",
+    "DataCaptureConfigSummaryView": "alarm",
+    "DeleteEndpointInputView": "alarm",
+    "DeploymentConfigView": "alarm",
+    "DescribeEndpointInputView": "alarm",
+    "DescribeEndpointOutputView": "alarm",
+    "EndpointSummaryView": "alarm",
+    "InternalStreamFailureView": "alarm",
+    "InvokeEndpointAsyncInputView": "alarm",
+    "InvokeEndpointAsyncOutputView": "alarm",
+    "InvokeEndpointInputView": "alarm",
+    "InvokeEndpointOutputView": "alarm",
+    "InvokeEndpointWithResponseStreamInputView": "alarm",
+    "InvokeEndpointWithResponseStreamOutputView": "alarm",
+    "ListEndpointsInputView": "alarm",
+    "ListEndpointsOutputView": "alarm",
+    "ModelStreamErrorView": "alarm",
+    "PayloadPartView": "alarm",
+    "PendingDeploymentSummaryView": "alarm",
+    "PendingProductionVariantSummaryView": "alarm",
+    "ProductionVariantStatusView": "alarm",
+    "ProductionVariantSummaryView": "alarm",
+    "ResponseStreamView": "alarm",
+    "RollingUpdatePolicyView": "alarm",
+    "TrafficRoutingConfigView": "alarm",
+    "UpdateEndpointInputView": "alarm",
+    "UpdateEndpointOutputView": "alarm",
+    "VariantPropertyView": "alarm",
+    "AlgorithmSpecificationView": "algorithm_specification",
+    "CollectionConfigurationView": "algorithm_specification",
+    "CreateTrainingJobRequestView": "algorithm_specification",
+    "CreateTrainingJobResponseView": "algorithm_specification",
+    "DebugHookConfigView": "algorithm_specification",
+    "DebugRuleConfigurationView": "algorithm_specification",
+    "DebugRuleEvaluationStatusView": "algorithm_specification",
+    "DescribeTrainingJobRequestView": "algorithm_specification",
+    "DescribeTrainingJobResponseView": "algorithm_specification",
+    "InfraCheckConfigView": "algorithm_specification",
+    "ListTrainingJobsRequestView": "algorithm_specification",
+    "ListTrainingJobsResponseView": "algorithm_specification",
+    "MetricDataView": "algorithm_specification",
+    "ProfilerConfigView": "algorithm_specification",
+    "ProfilerConfigForUpdateView": "algorithm_specification",
+    "ProfilerRuleConfigurationView": "algorithm_specification",
+    "ProfilerRuleEvaluationStatusView": "algorithm_specification",
+    "RemoteDebugConfigView": "algorithm_specification",
+    "RemoteDebugConfigForUpdateView": "algorithm_specification",
+    "ResourceConfigForUpdateView": "algorithm_specification",
+    "SecondaryStatusTransitionView": "algorithm_specification",
+    "StopTrainingJobRequestView": "algorithm_specification",
+    "TensorBoardOutputConfigView": "algorithm_specification",
+    "TrainingImageConfigView": "algorithm_specification",
+    "TrainingJobSummaryView": "algorithm_specification",
+    "TrainingRepositoryAuthConfigView": "algorithm_specification",
+    "UpdateTrainingJobRequestView": "algorithm_specification",
+    "UpdateTrainingJobResponseView": "algorithm_specification",
+    "WarmPoolStatusView": "algorithm_specification",
+    "AlgorithmStatusDetailsView": "algorithm_status_details",
+    "AlgorithmStatusItemView": "algorithm_status_details",
+    "AlgorithmSummaryView": "algorithm_status_details",
+    "AlgorithmValidationProfileView": "algorithm_status_details",
+    "AlgorithmValidationSpecificationView": "algorithm_status_details",
+    "CategoricalParameterRangeSpecificationView": "algorithm_status_details",
+    "ChannelSpecificationView": "algorithm_status_details",
+    "ContinuousParameterRangeSpecificationView": "algorithm_status_details",
+    "CreateAlgorithmInputView": "algorithm_status_details",
+    "CreateAlgorithmOutputView": "algorithm_status_details",
+    "DeleteAlgorithmInputView": "algorithm_status_details",
+    "DescribeAlgorithmInputView": "algorithm_status_details",
+    "DescribeAlgorithmOutputView": "algorithm_status_details",
+    "HyperParameterSpecificationView": "algorithm_status_details",
+    "IntegerParameterRangeSpecificationView": "algorithm_status_details",
+    "ListAlgorithmsInputView": "algorithm_status_details",
+    "ListAlgorithmsOutputView": "algorithm_status_details",
+    "ParameterRangeView": "algorithm_status_details",
+    "TrainingJobDefinitionView": "algorithm_status_details",
+    "TrainingSpecificationView": "algorithm_status_details",
+    "AnnotationConsolidationConfigView": "annotation_consolidation_config",
+    "CreateLabelingJobRequestView": "annotation_consolidation_config",
+    "CreateLabelingJobResponseView": "annotation_consolidation_config",
+    "DescribeLabelingJobRequestView": "annotation_consolidation_config",
+    "DescribeLabelingJobResponseView": "annotation_consolidation_config",
+    "HumanTaskConfigView": "annotation_consolidation_config",
+    "LabelCountersView": "annotation_consolidation_config",
+    "LabelingJobAlgorithmsConfigView": "annotation_consolidation_config",
+    "LabelingJobDataAttributesView": "annotation_consolidation_config",
+    "LabelingJobDataSourceView": "annotation_consolidation_config",
+    "LabelingJobInputConfigView": "annotation_consolidation_config",
+    "LabelingJobOutputView": "annotation_consolidation_config",
+    "LabelingJobOutputConfigView": "annotation_consolidation_config",
+    "LabelingJobResourceConfigView": "annotation_consolidation_config",
+    "LabelingJobS3DataSourceView": "annotation_consolidation_config",
+    "LabelingJobSnsDataSourceView": "annotation_consolidation_config",
+    "LabelingJobStoppingConditionsView": "annotation_consolidation_config",
+    "LabelingJobSummaryView": "annotation_consolidation_config",
+    "ListLabelingJobsRequestView": "annotation_consolidation_config",
+    "ListLabelingJobsResponseView": "annotation_consolidation_config",
+    "StopLabelingJobRequestView": "annotation_consolidation_config",
+    "UiConfigView": "annotation_consolidation_config",
+    "AppDetailsView": "app_details",
+    "CreateAppRequestView": "app_details",
+    "CreateAppResponseView": "app_details",
+    "DeleteAppRequestView": "app_details",
+    "DescribeAppRequestView": "app_details",
+    "DescribeAppResponseView": "app_details",
+    "ListAppsRequestView": "app_details",
+    "ListAppsResponseView": "app_details",
+    "AppImageConfigDetailsView": "app_image_config_details",
+    "ContainerConfigView": "app_image_config_details",
+    "CreateAppImageConfigRequestView": "app_image_config_details",
+    "CreateAppImageConfigResponseView": "app_image_config_details",
+    "DeleteAppImageConfigRequestView": "app_image_config_details",
+    "DescribeAppImageConfigRequestView": "app_image_config_details",
+    "DescribeAppImageConfigResponseView": "app_image_config_details",
+    "FileSystemConfigView": "app_image_config_details",
+    "JupyterLabAppImageConfigView": "app_image_config_details",
+    "KernelGatewayImageConfigView": "app_image_config_details",
+    "KernelSpecView": "app_image_config_details",
+    "ListAppImageConfigsRequestView": "app_image_config_details",
+    "ListAppImageConfigsResponseView": "app_image_config_details",
+    "UpdateAppImageConfigRequestView": "app_image_config_details",
+    "UpdateAppImageConfigResponseView": "app_image_config_details",
+    "AppSpecificationView": "app_specification",
+    "AthenaDatasetDefinitionView": "app_specification",
+    "CreateProcessingJobRequestView": "app_specification",
+    "CreateProcessingJobResponseView": "app_specification",
+    "DatasetDefinitionView": "app_specification",
+    "DescribeProcessingJobRequestView": "app_specification",
+    "DescribeProcessingJobResponseView": "app_specification",
+    "ListProcessingJobsRequestView": "app_specification",
+    "ListProcessingJobsResponseView": "app_specification",
+    "ProcessingClusterConfigView": "app_specification",
+    "ProcessingFeatureStoreOutputView": "app_specification",
+    "ProcessingInputView": "app_specification",
+    "ProcessingJobSummaryView": "app_specification",
+    "ProcessingOutputView": "app_specification",
+    "ProcessingOutputConfigView": "app_specification",
+    "ProcessingResourcesView": "app_specification",
+    "ProcessingS3InputView": "app_specification",
+    "ProcessingS3OutputView": "app_specification",
+    "ProcessingStoppingConditionView": "app_specification",
+    "RedshiftDatasetDefinitionView": "app_specification",
+    "StopProcessingJobRequestView": "app_specification",
+    "ArtifactSourceView": "artifact_source",
+    "ArtifactSourceTypeView": "artifact_source",
+    "ArtifactSummaryView": "artifact_source",
+    "CreateArtifactRequestView": "artifact_source",
+    "CreateArtifactResponseView": "artifact_source",
+    "DeleteArtifactRequestView": "artifact_source",
+    "DeleteArtifactResponseView": "artifact_source",
+    "DescribeArtifactRequestView": "artifact_source",
+    "DescribeArtifactResponseView": "artifact_source",
+    "ListArtifactsRequestView": "artifact_source",
+    "ListArtifactsResponseView": "artifact_source",
+    "UpdateArtifactRequestView": "artifact_source",
+    "UpdateArtifactResponseView": "artifact_source",
+    "AssociateTrialComponentRequestView": "associate_trial_component_request",
+    "AssociateTrialComponentResponseView": "associate_trial_component_request",
+    "CreateTrialComponentRequestView": "associate_trial_component_request",
+    "CreateTrialComponentResponseView": "associate_trial_component_request",
+    "DeleteTrialComponentRequestView": "associate_trial_component_request",
+    "DeleteTrialComponentResponseView": "associate_trial_component_request",
+    "DescribeTrialComponentRequestView": "associate_trial_component_request",
+    "DescribeTrialComponentResponseView": "associate_trial_component_request",
+    "DisassociateTrialComponentRequestView": "associate_trial_component_request",
+    "DisassociateTrialComponentResponseView": "associate_trial_component_request",
+    "ListTrialComponentsRequestView": "associate_trial_component_request",
+    "ListTrialComponentsResponseView": "associate_trial_component_request",
+    "TrialComponentArtifactView": "associate_trial_component_request",
+    "TrialComponentMetricSummaryView": "associate_trial_component_request",
+    "TrialComponentParameterValueView": "associate_trial_component_request",
+    "TrialComponentSourceView": "associate_trial_component_request",
+    "TrialComponentStatusView": "associate_trial_component_request",
+    "TrialComponentSummaryView": "associate_trial_component_request",
+    "UpdateTrialComponentRequestView": "associate_trial_component_request",
+    "UpdateTrialComponentResponseView": "associate_trial_component_request",
+    "AsyncInferenceClientConfigView": "async_inference_client_config",
+    "AsyncInferenceConfigView": "async_inference_client_config",
+    "AsyncInferenceNotificationConfigView": "async_inference_client_config",
+    "AsyncInferenceOutputConfigView": "async_inference_client_config",
+    "ClarifyExplainerConfigView": "async_inference_client_config",
+    "ClarifyInferenceConfigView": "async_inference_client_config",
+    "ClarifyShapBaselineConfigView": "async_inference_client_config",
+    "ClarifyShapConfigView": "async_inference_client_config",
+    "ClarifyTextConfigView": "async_inference_client_config",
+    "ExplainerConfigView": "async_inference_client_config",
+    "ProductionVariantManagedInstanceScalingView": "async_inference_client_config",
+    "ProductionVariantRoutingConfigView": "async_inference_client_config",
+    "AutoMLAlgorithmConfigView": "auto_m_l_algorithm_config",
+    "AutoMLCandidateView": "auto_m_l_algorithm_config",
+    "AutoMLCandidateStepView": "auto_m_l_algorithm_config",
+    "AutoMLContainerDefinitionView": "auto_m_l_algorithm_config",
+    "AutoMLDataSourceView": "auto_m_l_algorithm_config",
+    "AutoMLDataSplitConfigView": "auto_m_l_algorithm_config",
+    "AutoMLJobArtifactsView": "auto_m_l_algorithm_config",
+    "AutoMLJobCompletionCriteriaView": "auto_m_l_algorithm_config",
+    "AutoMLJobObjectiveView": "auto_m_l_algorithm_config",
+    "AutoMLOutputDataConfigView": "auto_m_l_algorithm_config",
+    "AutoMLPartialFailureReasonView": "auto_m_l_algorithm_config",
+    "AutoMLS3DataSourceView": "auto_m_l_algorithm_config",
+    "AutoMLSecurityConfigView": "auto_m_l_algorithm_config",
+    "CandidateArtifactLocationsView": "auto_m_l_algorithm_config",
+    "CandidatePropertiesView": "auto_m_l_algorithm_config",
+    "FinalAutoMLJobObjectiveMetricView": "auto_m_l_algorithm_config",
+    "MetricDatumView": "auto_m_l_algorithm_config",
+    "ModelDeployConfigView": "auto_m_l_algorithm_config",
+    "ModelDeployResultView": "auto_m_l_algorithm_config",
+    "AutoMLCandidateGenerationConfigView": "auto_m_l_candidate_generation_config",
+    "AutoMLChannelView": "auto_m_l_candidate_generation_config",
+    "AutoMLJobConfigView": "auto_m_l_candidate_generation_config",
+    "AutoMLJobSummaryView": "auto_m_l_candidate_generation_config",
+    "CreateAutoMLJobRequestView": "auto_m_l_candidate_generation_config",
+    "CreateAutoMLJobResponseView": "auto_m_l_candidate_generation_config",
+    "DescribeAutoMLJobRequestView": "auto_m_l_candidate_generation_config",
+    "DescribeAutoMLJobResponseView": "auto_m_l_candidate_generation_config",
+    "ListAutoMLJobsRequestView": "auto_m_l_candidate_generation_config",
+    "ListAutoMLJobsResponseView": "auto_m_l_candidate_generation_config",
+    "ListCandidatesForAutoMLJobRequestView": "auto_m_l_candidate_generation_config",
+    "ListCandidatesForAutoMLJobResponseView": "auto_m_l_candidate_generation_config",
+    "ResolvedAttributesView": "auto_m_l_candidate_generation_config",
+    "StopAutoMLJobRequestView": "auto_m_l_candidate_generation_config",
+    "AutoMLJobChannelView": "auto_m_l_job_channel",
+    "AutoMLProblemTypeConfigView": "auto_m_l_job_channel",
+    "AutoMLProblemTypeResolvedAttributesView": "auto_m_l_job_channel",
+    "AutoMLResolvedAttributesView": "auto_m_l_job_channel",
+    "CandidateGenerationConfigView": "auto_m_l_job_channel",
+    "CreateAutoMLJobV2RequestView": "auto_m_l_job_channel",
+    "CreateAutoMLJobV2ResponseView": "auto_m_l_job_channel",
+    "DescribeAutoMLJobV2RequestView": "auto_m_l_job_channel",
+    "DescribeAutoMLJobV2ResponseView": "auto_m_l_job_channel",
+    "HolidayConfigAttributesView": "auto_m_l_job_channel",
+    "ImageClassificationJobConfigView": "auto_m_l_job_channel",
+    "TabularJobConfigView": "auto_m_l_job_channel",
+    "TabularResolvedAttributesView": "auto_m_l_job_channel",
+    "TextClassificationJobConfigView": "auto_m_l_job_channel",
+    "TextGenerationJobConfigView": "auto_m_l_job_channel",
+    "TextGenerationResolvedAttributesView": "auto_m_l_job_channel",
+    "TimeSeriesConfigView": "auto_m_l_job_channel",
+    "TimeSeriesForecastingJobConfigView": "auto_m_l_job_channel",
+    "TimeSeriesTransformationsView": "auto_m_l_job_channel",
+    "AutoMLJobStepMetadataView": "auto_m_l_job_step_metadata",
+    "CacheHitResultView": "auto_m_l_job_step_metadata",
+    "CallbackStepMetadataView": "auto_m_l_job_step_metadata",
+    "ClarifyCheckStepMetadataView": "auto_m_l_job_step_metadata",
+    "ConditionStepMetadataView": "auto_m_l_job_step_metadata",
+    "EMRStepMetadataView": "auto_m_l_job_step_metadata",
+    "FailStepMetadataView": "auto_m_l_job_step_metadata",
+    "LambdaStepMetadataView": "auto_m_l_job_step_metadata",
+    "ListPipelineExecutionStepsRequestView": "auto_m_l_job_step_metadata",
+    "ListPipelineExecutionStepsResponseView": "auto_m_l_job_step_metadata",
+    "ModelStepMetadataView": "auto_m_l_job_step_metadata",
+    "PipelineExecutionStepView": "auto_m_l_job_step_metadata",
+    "PipelineExecutionStepMetadataView": "auto_m_l_job_step_metadata",
+    "ProcessingJobStepMetadataView": "auto_m_l_job_step_metadata",
+    "QualityCheckStepMetadataView": "auto_m_l_job_step_metadata",
+    "RegisterModelStepMetadataView": "auto_m_l_job_step_metadata",
+    "SelectiveExecutionResultView": "auto_m_l_job_step_metadata",
+    "TrainingJobStepMetadataView": "auto_m_l_job_step_metadata",
+    "TransformJobStepMetadataView": "auto_m_l_job_step_metadata",
+    "TuningJobStepMetaDataView": "auto_m_l_job_step_metadata",
+    "AutoParameterView": "auto_parameter",
+    "AutotuneView": "auto_parameter",
+    "BestObjectiveNotImprovingView": "auto_parameter",
+    "CategoricalParameterRangeView": "auto_parameter",
+    "ContinuousParameterRangeView": "auto_parameter",
+    "ConvergenceDetectedView": "auto_parameter",
+    "CreateHyperParameterTuningJobRequestView": "auto_parameter",
+    "CreateHyperParameterTuningJobResponseView": "auto_parameter",
+    "DeleteHyperParameterTuningJobRequestView": "auto_parameter",
+    "DescribeHyperParameterTuningJobRequestView": "auto_parameter",
+    "DescribeHyperParameterTuningJobResponseView": "auto_parameter",
+    "FinalHyperParameterTuningJobObjectiveMetricView": "auto_parameter",
+    "HyperParameterAlgorithmSpecificationView": "auto_parameter",
+    "HyperParameterTrainingJobDefinitionView": "auto_parameter",
+    "HyperParameterTrainingJobSummaryView": "auto_parameter",
+    "HyperParameterTuningInstanceConfigView": "auto_parameter",
+    "HyperParameterTuningJobCompletionDetailsView": "auto_parameter",
+    "HyperParameterTuningJobConfigView": "auto_parameter",
+    "HyperParameterTuningJobConsumedResourcesView": "auto_parameter",
+    "HyperParameterTuningJobStrategyConfigView": "auto_parameter",
+    "HyperParameterTuningJobSummaryView": "auto_parameter",
+    "HyperParameterTuningJobWarmStartConfigView": "auto_parameter",
+    "HyperParameterTuningResourceConfigView": "auto_parameter",
+    "HyperbandStrategyConfigView": "auto_parameter",
+    "IntegerParameterRangeView": "auto_parameter",
+    "ListHyperParameterTuningJobsRequestView": "auto_parameter",
+    "ListHyperParameterTuningJobsResponseView": "auto_parameter",
+    "ListTrainingJobsForHyperParameterTuningJobRequestView": "auto_parameter",
+    "ListTrainingJobsForHyperParameterTuningJobResponseView": "auto_parameter",
+    "ObjectiveStatusCountersView": "auto_parameter",
+    "ParameterRangesView": "auto_parameter",
+    "ParentHyperParameterTuningJobView": "auto_parameter",
+    "ResourceLimitsView": "auto_parameter",
+    "StopHyperParameterTuningJobRequestView": "auto_parameter",
+    "TrainingJobStatusCountersView": "auto_parameter",
+    "TuningJobCompletionCriteriaView": "auto_parameter",
+    "BatchDataCaptureConfigView": "batch_data_capture_config",
+    "CreateTransformJobRequestView": "batch_data_capture_config",
+    "CreateTransformJobResponseView": "batch_data_capture_config",
+    "DataProcessingView": "batch_data_capture_config",
+    "DescribeTransformJobRequestView": "batch_data_capture_config",
+    "DescribeTransformJobResponseView": "batch_data_capture_config",
+    "ListTransformJobsRequestView": "batch_data_capture_config",
+    "ListTransformJobsResponseView": "batch_data_capture_config",
+    "ModelClientConfigView": "batch_data_capture_config",
+    "StopTransformJobRequestView": "batch_data_capture_config",
+    "TransformJobSummaryView": "batch_data_capture_config",
+    "BatchTransformInputView": "batch_transform_input",
+    "EndpointInputView": "batch_transform_input",
+    "MonitoringClusterConfigView": "batch_transform_input",
+    "MonitoringConstraintsResourceView": "batch_transform_input",
+    "MonitoringCsvDatasetFormatView": "batch_transform_input",
+    "MonitoringDatasetFormatView": "batch_transform_input",
+    "MonitoringJsonDatasetFormatView": "batch_transform_input",
+    "MonitoringOutputView": "batch_transform_input",
+    "MonitoringOutputConfigView": "batch_transform_input",
+    "MonitoringParquetDatasetFormatView": "batch_transform_input",
+    "MonitoringResourcesView": "batch_transform_input",
+    "MonitoringS3OutputView": "batch_transform_input",
+    "MonitoringStoppingConditionView": "batch_transform_input",
+    "CanvasAppSettingsView": "canvas_app_settings",
+    "CodeEditorAppSettingsView": "canvas_app_settings",
+    "CustomFileSystemConfigView": "canvas_app_settings",
+    "CustomPosixUserConfigView": "canvas_app_settings",
+    "DefaultEbsStorageSettingsView": "canvas_app_settings",
+    "DefaultSpaceStorageSettingsView": "canvas_app_settings",
+    "DirectDeploySettingsView": "canvas_app_settings",
+    "EFSFileSystemConfigView": "canvas_app_settings",
+    "GenerativeAiSettingsView": "canvas_app_settings",
+    "IdentityProviderOAuthSettingView": "canvas_app_settings",
+    "JupyterLabAppSettingsView": "canvas_app_settings",
+    "KendraSettingsView": "canvas_app_settings",
+    "ModelRegisterSettingsView": "canvas_app_settings",
+    "RSessionAppSettingsView": "canvas_app_settings",
+    "RStudioServerProAppSettingsView": "canvas_app_settings",
+    "SharingSettingsView": "canvas_app_settings",
+    "TensorBoardAppSettingsView": "canvas_app_settings",
+    "TimeSeriesForecastingSettingsView": "canvas_app_settings",
+    "UserSettingsView": "canvas_app_settings",
+    "WorkspaceSettingsView": "canvas_app_settings",
+    "CaptureContentTypeHeaderView": "capture_content_type_header",
+    "CaptureOptionView": "capture_option",
+    "CreateEndpointConfigInputView": "capture_option",
+    "CreateEndpointConfigOutputView": "capture_option",
+    "DataCaptureConfigView": "capture_option",
+    "DeleteEndpointConfigInputView": "capture_option",
+    "DescribeEndpointConfigInputView": "capture_option",
+    "DescribeEndpointConfigOutputView": "capture_option",
+    "EndpointConfigSummaryView": "capture_option",
+    "ListEndpointConfigsInputView": "capture_option",
+    "ListEndpointConfigsOutputView": "capture_option",
+    "ProductionVariantView": "capture_option",
+    "ProductionVariantCoreDumpConfigView": "capture_option",
+    "CategoricalParameterView": "categorical_parameter",
+    "CreateInferenceRecommendationsJobRequestView": "categorical_parameter",
+    "CreateInferenceRecommendationsJobResponseView": "categorical_parameter",
+    "DescribeInferenceRecommendationsJobRequestView": "categorical_parameter",
+    "DescribeInferenceRecommendationsJobResponseView": "categorical_parameter",
+    "EndpointInfoView": "categorical_parameter",
+    "EndpointInputConfigurationView": "categorical_parameter",
+    "EndpointOutputConfigurationView": "categorical_parameter",
+    "EndpointPerformanceView": "categorical_parameter",
+    "EnvironmentParameterView": "categorical_parameter",
+    "EnvironmentParameterRangesView": "categorical_parameter",
+    "InferenceMetricsView": "categorical_parameter",
+    "InferenceRecommendationView": "categorical_parameter",
+    "InferenceRecommendationsJobView": "categorical_parameter",
+    "ListInferenceRecommendationsJobsRequestView": "categorical_parameter",
+    "ListInferenceRecommendationsJobsResponseView": "categorical_parameter",
+    "ModelConfigurationView": "categorical_parameter",
+    "ModelLatencyThresholdView": "categorical_parameter",
+    "PhaseView": "categorical_parameter",
+    "RecommendationJobCompiledOutputConfigView": "categorical_parameter",
+    "RecommendationJobContainerConfigView": "categorical_parameter",
+    "RecommendationJobInputConfigView": "categorical_parameter",
+    "RecommendationJobOutputConfigView": "categorical_parameter",
+    "RecommendationJobPayloadConfigView": "categorical_parameter",
+    "RecommendationJobResourceLimitView": "categorical_parameter",
+    "RecommendationJobStoppingConditionsView": "categorical_parameter",
+    "RecommendationJobVpcConfigView": "categorical_parameter",
+    "RecommendationMetricsView": "categorical_parameter",
+    "StairsView": "categorical_parameter",
+    "StopInferenceRecommendationsJobRequestView": "categorical_parameter",
+    "TrafficPatternView": "categorical_parameter",
+    "ChannelView": "channel",
+    "DataSourceView": "channel",
+    "FileSystemDataSourceView": "channel",
+    "InstanceGroupView": "channel",
+    "MetricDefinitionView": "channel",
+    "OutputDataConfigView": "channel",
+    "ResourceConfigView": "channel",
+    "S3DataSourceView": "channel",
+    "ShuffleConfigView": "channel",
+    "CheckpointConfigView": "checkpoint_config",
+    "RetryStrategyView": "checkpoint_config",
+    "ClusterInstanceGroupDetailsView": "cluster_instance_group_details",
+    "ClusterInstanceGroupSpecificationView": "cluster_instance_group_details",
+    "ClusterLifeCycleConfigView": "cluster_instance_group_details",
+    "ClusterSummaryView": "cluster_instance_group_details",
+    "CreateClusterRequestView": "cluster_instance_group_details",
+    "CreateClusterResponseView": "cluster_instance_group_details",
+    "DeleteClusterRequestView": "cluster_instance_group_details",
+    "DeleteClusterResponseView": "cluster_instance_group_details",
+    "DescribeClusterRequestView": "cluster_instance_group_details",
+    "DescribeClusterResponseView": "cluster_instance_group_details",
+    "ListClustersRequestView": "cluster_instance_group_details",
+    "ListClustersResponseView": "cluster_instance_group_details",
+    "UpdateClusterRequestView": "cluster_instance_group_details",
+    "UpdateClusterResponseView": "cluster_instance_group_details",
+    "ClusterInstanceStatusDetailsView": "cluster_instance_status_details",
+    "ClusterNodeDetailsView": "cluster_node_details",
+    "DescribeClusterNodeRequestView": "cluster_node_details",
+    "DescribeClusterNodeResponseView": "cluster_node_details",
+    "ClusterNodeSummaryView": "cluster_node_summary",
+    "ListClusterNodesRequestView": "cluster_node_summary",
+    "ListClusterNodesResponseView": "cluster_node_summary",
+    "CodeRepositoryView": "code_repository",
+    "CustomImageView": "code_repository",
+    "JupyterServerAppSettingsView": "code_repository",
+    "KernelGatewayAppSettingsView": "code_repository",
+    "CodeRepositorySummaryView": "code_repository_summary",
+    "ListCodeRepositoriesInputView": "code_repository_summary",
+    "ListCodeRepositoriesOutputView": "code_repository_summary",
+    "CognitoConfigView": "cognito_config",
+    "CreateWorkforceRequestView": "cognito_config",
+    "CreateWorkforceResponseView": "cognito_config",
+    "DeleteWorkforceRequestView": "cognito_config",
+    "DescribeWorkforceRequestView": "cognito_config",
+    "DescribeWorkforceResponseView": "cognito_config",
+    "ListWorkforcesRequestView": "cognito_config",
+    "ListWorkforcesResponseView": "cognito_config",
+    "OidcConfigView": "cognito_config",
+    "OidcConfigForResponseView": "cognito_config",
+    "SourceIpConfigView": "cognito_config",
+    "UpdateWorkforceRequestView": "cognito_config",
+    "UpdateWorkforceResponseView": "cognito_config",
+    "WorkforceView": "cognito_config",
+    "WorkforceVpcConfigRequestView": "cognito_config",
+    "WorkforceVpcConfigResponseView": "cognito_config",
+    "CognitoMemberDefinitionView": "cognito_member_definition",
+    "CreateWorkteamRequestView": "cognito_member_definition",
+    "CreateWorkteamResponseView": "cognito_member_definition",
+    "DeleteWorkteamRequestView": "cognito_member_definition",
+    "DeleteWorkteamResponseView": "cognito_member_definition",
+    "DescribeSubscribedWorkteamRequestView": "cognito_member_definition",
+    "DescribeSubscribedWorkteamResponseView": "cognito_member_definition",
+    "DescribeWorkteamRequestView": "cognito_member_definition",
+    "DescribeWorkteamResponseView": "cognito_member_definition",
+    "LabelCountersForWorkteamView": "cognito_member_definition",
+    "LabelingJobForWorkteamSummaryView": "cognito_member_definition",
+    "ListLabelingJobsForWorkteamRequestView": "cognito_member_definition",
+    "ListLabelingJobsForWorkteamResponseView": "cognito_member_definition",
+    "ListSubscribedWorkteamsRequestView": "cognito_member_definition",
+    "ListSubscribedWorkteamsResponseView": "cognito_member_definition",
+    "ListWorkteamsRequestView": "cognito_member_definition",
+    "ListWorkteamsResponseView": "cognito_member_definition",
+    "MemberDefinitionView": "cognito_member_definition",
+    "NotificationConfigurationView": "cognito_member_definition",
+    "OidcMemberDefinitionView": "cognito_member_definition",
+    "SubscribedWorkteamView": "cognito_member_definition",
+    "UpdateWorkteamRequestView": "cognito_member_definition",
+    "UpdateWorkteamResponseView": "cognito_member_definition",
+    "WorkteamView": "cognito_member_definition",
+    "CollectionConfigView": "collection_config",
+    "CreateFeatureGroupRequestView": "collection_config",
+    "CreateFeatureGroupResponseView": "collection_config",
+    "DataCatalogConfigView": "collection_config",
+    "DeleteFeatureGroupRequestView": "collection_config",
+    "DescribeFeatureGroupRequestView": "collection_config",
+    "DescribeFeatureGroupResponseView": "collection_config",
+    "FeatureDefinitionView": "collection_config",
+    "FeatureGroupSummaryView": "collection_config",
+    "LastUpdateStatusView": "collection_config",
+    "ListFeatureGroupsRequestView": "collection_config",
+    "ListFeatureGroupsResponseView": "collection_config",
+    "OfflineStoreConfigView": "collection_config",
+    "OfflineStoreStatusView": "collection_config",
+    "OnlineStoreConfigView": "collection_config",
+    "OnlineStoreConfigUpdateView": "collection_config",
+    "OnlineStoreSecurityConfigView": "collection_config",
+    "S3StorageConfigView": "collection_config",
+    "ThroughputConfigView": "collection_config",
+    "ThroughputConfigDescriptionView": "collection_config",
+    "ThroughputConfigUpdateView": "collection_config",
+    "TtlDurationView": "collection_config",
+    "UpdateFeatureGroupRequestView": "collection_config",
+    "UpdateFeatureGroupResponseView": "collection_config",
+    "VectorConfigView": "collection_config",
+    "CompilationJobSummaryView": "compilation_job_summary",
+    "CreateCompilationJobRequestView": "compilation_job_summary",
+    "CreateCompilationJobResponseView": "compilation_job_summary",
+    "DeleteCompilationJobRequestView": "compilation_job_summary",
+    "DerivedInformationView": "compilation_job_summary",
+    "DescribeCompilationJobRequestView": "compilation_job_summary",
+    "DescribeCompilationJobResponseView": "compilation_job_summary",
+    "InputConfigView": "compilation_job_summary",
+    "ListCompilationJobsRequestView": "compilation_job_summary",
+    "ListCompilationJobsResponseView": "compilation_job_summary",
+    "ModelDigestsView": "compilation_job_summary",
+    "NeoVpcConfigView": "compilation_job_summary",
+    "OutputConfigView": "compilation_job_summary",
+    "StopCompilationJobRequestView": "compilation_job_summary",
+    "TargetPlatformView": "compilation_job_summary",
+    "ConflictExceptionView": "conflict_exception",
+    "ContainerDefinitionView": "container_definition",
+    "CreateModelInputView": "container_definition",
+    "CreateModelOutputView": "container_definition",
+    "DeleteModelInputView": "container_definition",
+    "DeploymentRecommendationView": "container_definition",
+    "DescribeModelInputView": "container_definition",
+    "DescribeModelOutputView": "container_definition",
+    "ImageConfigView": "container_definition",
+    "InferenceExecutionConfigView": "container_definition",
+    "ListModelsInputView": "container_definition",
+    "ListModelsOutputView": "container_definition",
+    "ModelSummaryView": "container_definition",
+    "MultiModelConfigView": "container_definition",
+    "RealTimeInferenceRecommendationView": "container_definition",
+    "RepositoryAuthConfigView": "container_definition",
+    "ContextSourceView": "context_source",
+    "ContextSummaryView": "context_source",
+    "CreateContextRequestView": "context_source",
+    "CreateContextResponseView": "context_source",
+    "DeleteContextRequestView": "context_source",
+    "DeleteContextResponseView": "context_source",
+    "DescribeContextRequestView": "context_source",
+    "DescribeContextResponseView": "context_source",
+    "ListContextsRequestView": "context_source",
+    "ListContextsResponseView": "context_source",
+    "UpdateContextRequestView": "context_source",
+    "UpdateContextResponseView": "context_source",
+    "CreateCodeRepositoryInputView": "create_code_repository_input",
+    "CreateCodeRepositoryOutputView": "create_code_repository_input",
+    "DeleteCodeRepositoryInputView": "create_code_repository_input",
+    "DescribeCodeRepositoryInputView": "create_code_repository_input",
+    "DescribeCodeRepositoryOutputView": "create_code_repository_input",
+    "GitConfigView": "create_code_repository_input",
+    "GitConfigForUpdateView": "create_code_repository_input",
+    "UpdateCodeRepositoryInputView": "create_code_repository_input",
+    "UpdateCodeRepositoryOutputView": "create_code_repository_input",
+    "CreateDataQualityJobDefinitionRequestView": "create_data_quality_job_definition_request",
+    "CreateDataQualityJobDefinitionResponseView": "create_data_quality_job_definition_request",
+    "DataQualityAppSpecificationView": "create_data_quality_job_definition_request",
+    "DataQualityBaselineConfigView": "create_data_quality_job_definition_request",
+    "DataQualityJobInputView": "create_data_quality_job_definition_request",
+    "DeleteDataQualityJobDefinitionRequestView": "create_data_quality_job_definition_request",
+    "DescribeDataQualityJobDefinitionRequestView": "create_data_quality_job_definition_request",
+    "DescribeDataQualityJobDefinitionResponseView": "create_data_quality_job_definition_request",
+    "ListDataQualityJobDefinitionsRequestView": "create_data_quality_job_definition_request",
+    "ListDataQualityJobDefinitionsResponseView": "create_data_quality_job_definition_request",
+    "CreateDeviceFleetRequestView": "create_device_fleet_request",
+    "DeleteDeviceFleetRequestView": "create_device_fleet_request",
+    "DescribeDeviceFleetRequestView": "create_device_fleet_request",
+    "DescribeDeviceFleetResponseView": "create_device_fleet_request",
+    "DeviceFleetSummaryView": "create_device_fleet_request",
+    "ListDeviceFleetsRequestView": "create_device_fleet_request",
+    "ListDeviceFleetsResponseView": "create_device_fleet_request",
+    "UpdateDeviceFleetRequestView": "create_device_fleet_request",
+    "CreateDomainRequestView": "create_domain_request",
+    "CreateDomainResponseView": "create_domain_request",
+    "DefaultSpaceSettingsView": "create_domain_request",
+    "DeleteDomainRequestView": "create_domain_request",
+    "DescribeDomainRequestView": "create_domain_request",
+    "DescribeDomainResponseView": "create_domain_request",
+    "DockerSettingsView": "create_domain_request",
+    "DomainDetailsView": "create_domain_request",
+    "DomainSettingsView": "create_domain_request",
+    "DomainSettingsForUpdateView": "create_domain_request",
+    "ListDomainsRequestView": "create_domain_request",
+    "ListDomainsResponseView": "create_domain_request",
+    "RStudioServerProDomainSettingsView": "create_domain_request",
+    "RStudioServerProDomainSettingsForUpdateView": "create_domain_request",
+    "RetentionPolicyView": "create_domain_request",
+    "UpdateDomainRequestView": "create_domain_request",
+    "UpdateDomainResponseView": "create_domain_request",
+    "CreateEdgeDeploymentPlanRequestView": "create_edge_deployment_plan_request",
+    "CreateEdgeDeploymentPlanResponseView": "create_edge_deployment_plan_request",
+    "DeleteEdgeDeploymentPlanRequestView": "create_edge_deployment_plan_request",
+    "DeploymentStageStatusSummaryView": "create_edge_deployment_plan_request",
+    "DescribeEdgeDeploymentPlanRequestView": "create_edge_deployment_plan_request",
+    "DescribeEdgeDeploymentPlanResponseView": "create_edge_deployment_plan_request",
+    "EdgeDeploymentModelConfigView": "create_edge_deployment_plan_request",
+    "EdgeDeploymentPlanSummaryView": "create_edge_deployment_plan_request",
+    "EdgeDeploymentStatusView": "create_edge_deployment_plan_request",
+    "ListEdgeDeploymentPlansRequestView": "create_edge_deployment_plan_request",
+    "ListEdgeDeploymentPlansResponseView": "create_edge_deployment_plan_request",
+    "CreateEdgeDeploymentStageRequestView": "create_edge_deployment_stage_request",
+    "DeleteEdgeDeploymentStageRequestView": "create_edge_deployment_stage_request",
+    "StartEdgeDeploymentStageRequestView": "create_edge_deployment_stage_request",
+    "StopEdgeDeploymentStageRequestView": "create_edge_deployment_stage_request",
+    "CreateEdgePackagingJobRequestView": "create_edge_packaging_job_request",
+    "DescribeEdgePackagingJobRequestView": "create_edge_packaging_job_request",
+    "DescribeEdgePackagingJobResponseView": "create_edge_packaging_job_request",
+    "EdgePackagingJobSummaryView": "create_edge_packaging_job_request",
+    "EdgePresetDeploymentOutputView": "create_edge_packaging_job_request",
+    "ListEdgePackagingJobsRequestView": "create_edge_packaging_job_request",
+    "ListEdgePackagingJobsResponseView": "create_edge_packaging_job_request",
+    "StopEdgePackagingJobRequestView": "create_edge_packaging_job_request",
+    "CreateExperimentRequestView": "create_experiment_request",
+    "CreateExperimentResponseView": "create_experiment_request",
+    "DeleteExperimentRequestView": "create_experiment_request",
+    "DeleteExperimentResponseView": "create_experiment_request",
+    "DescribeExperimentRequestView": "create_experiment_request",
+    "DescribeExperimentResponseView": "create_experiment_request",
+    "ExperimentSourceView": "create_experiment_request",
+    "ExperimentSummaryView": "create_experiment_request",
+    "ListExperimentsRequestView": "create_experiment_request",
+    "ListExperimentsResponseView": "create_experiment_request",
+    "UpdateExperimentRequestView": "create_experiment_request",
+    "UpdateExperimentResponseView": "create_experiment_request",
+    "CreateFlowDefinitionRequestView": "create_flow_definition_request",
+    "CreateFlowDefinitionResponseView": "create_flow_definition_request",
+    "DeleteFlowDefinitionRequestView": "create_flow_definition_request",
+    "DescribeFlowDefinitionRequestView": "create_flow_definition_request",
+    "DescribeFlowDefinitionResponseView": "create_flow_definition_request",
+    "FlowDefinitionOutputConfigView": "create_flow_definition_request",
+    "FlowDefinitionSummaryView": "create_flow_definition_request",
+    "HumanLoopActivationConditionsConfigView": "create_flow_definition_request",
+    "HumanLoopActivationConfigView": "create_flow_definition_request",
+    "HumanLoopConfigView": "create_flow_definition_request",
+    "HumanLoopRequestSourceView": "create_flow_definition_request",
+    "ListFlowDefinitionsRequestView": "create_flow_definition_request",
+    "ListFlowDefinitionsResponseView": "create_flow_definition_request",
+    "CreateHubRequestView": "create_hub_request",
+    "CreateHubResponseView": "create_hub_request",
+    "DeleteHubRequestView": "create_hub_request",
+    "DescribeHubRequestView": "create_hub_request",
+    "DescribeHubResponseView": "create_hub_request",
+    "HubInfoView": "create_hub_request",
+    "HubS3StorageConfigView": "create_hub_request",
+    "ListHubsRequestView": "create_hub_request",
+    "ListHubsResponseView": "create_hub_request",
+    "UpdateHubRequestView": "create_hub_request",
+    "UpdateHubResponseView": "create_hub_request",
+    "CreateHumanTaskUiRequestView": "create_human_task_ui_request",
+    "CreateHumanTaskUiResponseView": "create_human_task_ui_request",
+    "DeleteHumanTaskUiRequestView": "create_human_task_ui_request",
+    "DescribeHumanTaskUiRequestView": "create_human_task_ui_request",
+    "DescribeHumanTaskUiResponseView": "create_human_task_ui_request",
+    "HumanTaskUiSummaryView": "create_human_task_ui_request",
+    "ListHumanTaskUisRequestView": "create_human_task_ui_request",
+    "ListHumanTaskUisResponseView": "create_human_task_ui_request",
+    "UiTemplateView": "create_human_task_ui_request",
+    "UiTemplateInfoView": "create_human_task_ui_request",
+    "CreateImageRequestView": "create_image_request",
+    "CreateImageResponseView": "create_image_request",
+    "DeleteImageRequestView": "create_image_request",
+    "DescribeImageRequestView": "create_image_request",
+    "DescribeImageResponseView": "create_image_request",
+    "ImageView": "create_image_request",
+    "ListImagesRequestView": "create_image_request",
+    "ListImagesResponseView": "create_image_request",
+    "UpdateImageRequestView": "create_image_request",
+    "UpdateImageResponseView": "create_image_request",
+    "CreateImageVersionRequestView": "create_image_version_request",
+    "CreateImageVersionResponseView": "create_image_version_request",
+    "DeleteImageVersionRequestView": "create_image_version_request",
+    "DescribeImageVersionRequestView": "create_image_version_request",
+    "DescribeImageVersionResponseView": "create_image_version_request",
+    "ImageVersionView": "create_image_version_request",
+    "ListImageVersionsRequestView": "create_image_version_request",
+    "ListImageVersionsResponseView": "create_image_version_request",
+    "UpdateImageVersionRequestView": "create_image_version_request",
+    "UpdateImageVersionResponseView": "create_image_version_request",
+    "CreateInferenceComponentInputView": "create_inference_component_input",
+    "CreateInferenceComponentOutputView": "create_inference_component_input",
+    "DeleteInferenceComponentInputView": "create_inference_component_input",
+    "DescribeInferenceComponentInputView": "create_inference_component_input",
+    "DescribeInferenceComponentOutputView": "create_inference_component_input",
+    "InferenceComponentComputeResourceRequirementsView": "create_inference_component_input",
+    "InferenceComponentContainerSpecificationView": "create_inference_component_input",
+    "InferenceComponentContainerSpecificationSummaryView": "create_inference_component_input",
+    "InferenceComponentRuntimeConfigView": "create_inference_component_input",
+    "InferenceComponentRuntimeConfigSummaryView": "create_inference_component_input",
+    "InferenceComponentSpecificationView": "create_inference_component_input",
+    "InferenceComponentSpecificationSummaryView": "create_inference_component_input",
+    "InferenceComponentStartupParametersView": "create_inference_component_input",
+    "InferenceComponentSummaryView": "create_inference_component_input",
+    "ListInferenceComponentsInputView": "create_inference_component_input",
+    "ListInferenceComponentsOutputView": "create_inference_component_input",
+    "UpdateInferenceComponentInputView": "create_inference_component_input",
+    "UpdateInferenceComponentOutputView": "create_inference_component_input",
+    "CreateInferenceExperimentRequestView": "create_inference_experiment_request",
+    "CreateInferenceExperimentResponseView": "create_inference_experiment_request",
+    "DeleteInferenceExperimentRequestView": "create_inference_experiment_request",
+    "DeleteInferenceExperimentResponseView": "create_inference_experiment_request",
+    "DescribeInferenceExperimentRequestView": "create_inference_experiment_request",
+    "DescribeInferenceExperimentResponseView": "create_inference_experiment_request",
+    "EndpointMetadataView": "create_inference_experiment_request",
+    "InferenceExperimentDataStorageConfigView": "create_inference_experiment_request",
+    "InferenceExperimentScheduleView": "create_inference_experiment_request",
+    "InferenceExperimentSummaryView": "create_inference_experiment_request",
+    "ListInferenceExperimentsRequestView": "create_inference_experiment_request",
+    "ListInferenceExperimentsResponseView": "create_inference_experiment_request",
+    "ModelInfrastructureConfigView": "create_inference_experiment_request",
+    "ModelVariantConfigView": "create_inference_experiment_request",
+    "ModelVariantConfigSummaryView": "create_inference_experiment_request",
+    "RealTimeInferenceConfigView": "create_inference_experiment_request",
+    "ShadowModeConfigView": "create_inference_experiment_request",
+    "ShadowModelVariantConfigView": "create_inference_experiment_request",
+    "StartInferenceExperimentRequestView": "create_inference_experiment_request",
+    "StartInferenceExperimentResponseView": "create_inference_experiment_request",
+    "StopInferenceExperimentRequestView": "create_inference_experiment_request",
+    "StopInferenceExperimentResponseView": "create_inference_experiment_request",
+    "UpdateInferenceExperimentRequestView": "create_inference_experiment_request",
+    "UpdateInferenceExperimentResponseView": "create_inference_experiment_request",
+    "CreateModelBiasJobDefinitionRequestView": "create_model_bias_job_definition_request",
+    "CreateModelBiasJobDefinitionResponseView": "create_model_bias_job_definition_request",
+    "DeleteModelBiasJobDefinitionRequestView": "create_model_bias_job_definition_request",
+    "DescribeModelBiasJobDefinitionRequestView": "create_model_bias_job_definition_request",
+    "DescribeModelBiasJobDefinitionResponseView": "create_model_bias_job_definition_request",
+    "ListModelBiasJobDefinitionsRequestView": "create_model_bias_job_definition_request",
+    "ListModelBiasJobDefinitionsResponseView": "create_model_bias_job_definition_request",
+    "ModelBiasAppSpecificationView": "create_model_bias_job_definition_request",
+    "ModelBiasBaselineConfigView": "create_model_bias_job_definition_request",
+    "ModelBiasJobInputView": "create_model_bias_job_definition_request",
+    "CreateModelCardExportJobRequestView": "create_model_card_export_job_request",
+    "CreateModelCardExportJobResponseView": "create_model_card_export_job_request",
+    "DescribeModelCardExportJobRequestView": "create_model_card_export_job_request",
+    "DescribeModelCardExportJobResponseView": "create_model_card_export_job_request",
+    "ListModelCardExportJobsRequestView": "create_model_card_export_job_request",
+    "ListModelCardExportJobsResponseView": "create_model_card_export_job_request",
+    "ModelCardExportArtifactsView": "create_model_card_export_job_request",
+    "ModelCardExportJobSummaryView": "create_model_card_export_job_request",
+    "ModelCardExportOutputConfigView": "create_model_card_export_job_request",
+    "CreateModelCardRequestView": "create_model_card_request",
+    "CreateModelCardResponseView": "create_model_card_request",
+    "DeleteModelCardRequestView": "create_model_card_request",
+    "DescribeModelCardRequestView": "create_model_card_request",
+    "DescribeModelCardResponseView": "create_model_card_request",
+    "ListModelCardsRequestView": "create_model_card_request",
+    "ListModelCardsResponseView": "create_model_card_request",
+    "ModelCardSecurityConfigView": "create_model_card_request",
+    "ModelCardSummaryView": "create_model_card_request",
+    "UpdateModelCardRequestView": "create_model_card_request",
+    "UpdateModelCardResponseView": "create_model_card_request",
+    "CreateModelExplainabilityJobDefinitionRequestView": "create_model_explainability_job_definition_request",
+    "CreateModelExplainabilityJobDefinitionResponseView": "create_model_explainability_job_definition_request",
+    "DeleteModelExplainabilityJobDefinitionRequestView": "create_model_explainability_job_definition_request",
+    "DescribeModelExplainabilityJobDefinitionRequestView": "create_model_explainability_job_definition_request",
+    "DescribeModelExplainabilityJobDefinitionResponseView": "create_model_explainability_job_definition_request",
+    "ListModelExplainabilityJobDefinitionsRequestView": "create_model_explainability_job_definition_request",
+    "ListModelExplainabilityJobDefinitionsResponseView": "create_model_explainability_job_definition_request",
+    "ModelExplainabilityAppSpecificationView": "create_model_explainability_job_definition_request",
+    "ModelExplainabilityBaselineConfigView": "create_model_explainability_job_definition_request",
+    "ModelExplainabilityJobInputView": "create_model_explainability_job_definition_request",
+    "CreateModelPackageGroupInputView": "create_model_package_group_input",
+    "CreateModelPackageGroupOutputView": "create_model_package_group_input",
+    "DeleteModelPackageGroupInputView": "create_model_package_group_input",
+    "DescribeModelPackageGroupInputView": "create_model_package_group_input",
+    "DescribeModelPackageGroupOutputView": "create_model_package_group_input",
+    "ListModelPackageGroupsInputView": "create_model_package_group_input",
+    "ListModelPackageGroupsOutputView": "create_model_package_group_input",
+    "ModelPackageGroupSummaryView": "create_model_package_group_input",
+    "CreateModelQualityJobDefinitionRequestView": "create_model_quality_job_definition_request",
+    "CreateModelQualityJobDefinitionResponseView": "create_model_quality_job_definition_request",
+    "DeleteModelQualityJobDefinitionRequestView": "create_model_quality_job_definition_request",
+    "DescribeModelQualityJobDefinitionRequestView": "create_model_quality_job_definition_request",
+    "DescribeModelQualityJobDefinitionResponseView": "create_model_quality_job_definition_request",
+    "ListModelQualityJobDefinitionsRequestView": "create_model_quality_job_definition_request",
+    "ListModelQualityJobDefinitionsResponseView": "create_model_quality_job_definition_request",
+    "ModelQualityAppSpecificationView": "create_model_quality_job_definition_request",
+    "ModelQualityBaselineConfigView": "create_model_quality_job_definition_request",
+    "ModelQualityJobInputView": "create_model_quality_job_definition_request",
+    "CreateMonitoringScheduleRequestView": "create_monitoring_schedule_request",
+    "CreateMonitoringScheduleResponseView": "create_monitoring_schedule_request",
+    "DeleteMonitoringScheduleRequestView": "create_monitoring_schedule_request",
+    "DescribeMonitoringScheduleRequestView": "create_monitoring_schedule_request",
+    "DescribeMonitoringScheduleResponseView": "create_monitoring_schedule_request",
+    "ListMonitoringSchedulesRequestView": "create_monitoring_schedule_request",
+    "ListMonitoringSchedulesResponseView": "create_monitoring_schedule_request",
+    "MonitoringAppSpecificationView": "create_monitoring_schedule_request",
+    "MonitoringBaselineConfigView": "create_monitoring_schedule_request",
+    "MonitoringExecutionSummaryView": "create_monitoring_schedule_request",
+    "MonitoringInputView": "create_monitoring_schedule_request",
+    "MonitoringJobDefinitionView": "create_monitoring_schedule_request",
+    "MonitoringScheduleConfigView": "create_monitoring_schedule_request",
+    "MonitoringScheduleSummaryView": "create_monitoring_schedule_request",
+    "ScheduleConfigView": "create_monitoring_schedule_request",
+    "StartMonitoringScheduleRequestView": "create_monitoring_schedule_request",
+    "StopMonitoringScheduleRequestView": "create_monitoring_schedule_request",
+    "UpdateMonitoringScheduleRequestView": "create_monitoring_schedule_request",
+    "UpdateMonitoringScheduleResponseView": "create_monitoring_schedule_request",
+    "CreateNotebookInstanceInputView": "create_notebook_instance_input",
+    "CreateNotebookInstanceOutputView": "create_notebook_instance_input",
+    "DeleteNotebookInstanceInputView": "create_notebook_instance_input",
+    "DescribeNotebookInstanceInputView": "create_notebook_instance_input",
+    "DescribeNotebookInstanceOutputView": "create_notebook_instance_input",
+    "InstanceMetadataServiceConfigurationView": "create_notebook_instance_input",
+    "ListNotebookInstancesInputView": "create_notebook_instance_input",
+    "ListNotebookInstancesOutputView": "create_notebook_instance_input",
+    "NotebookInstanceSummaryView": "create_notebook_instance_input",
+    "StartNotebookInstanceInputView": "create_notebook_instance_input",
+    "StopNotebookInstanceInputView": "create_notebook_instance_input",
+    "UpdateNotebookInstanceInputView": "create_notebook_instance_input",
+    "CreateNotebookInstanceLifecycleConfigInputView": "create_notebook_instance_lifecycle_config_input",
+    "CreateNotebookInstanceLifecycleConfigOutputView": "create_notebook_instance_lifecycle_config_input",
+    "DeleteNotebookInstanceLifecycleConfigInputView": "create_notebook_instance_lifecycle_config_input",
+    "DescribeNotebookInstanceLifecycleConfigInputView": "create_notebook_instance_lifecycle_config_input",
+    "DescribeNotebookInstanceLifecycleConfigOutputView": "create_notebook_instance_lifecycle_config_input",
+    "ListNotebookInstanceLifecycleConfigsInputView": "create_notebook_instance_lifecycle_config_input",
+    "ListNotebookInstanceLifecycleConfigsOutputView": "create_notebook_instance_lifecycle_config_input",
+    "NotebookInstanceLifecycleConfigSummaryView": "create_notebook_instance_lifecycle_config_input",
+    "NotebookInstanceLifecycleHookView": "create_notebook_instance_lifecycle_config_input",
+    "UpdateNotebookInstanceLifecycleConfigInputView": "create_notebook_instance_lifecycle_config_input",
+    "CreatePipelineRequestView": "create_pipeline_request",
+    "CreatePipelineResponseView": "create_pipeline_request",
+    "DeletePipelineRequestView": "create_pipeline_request",
+    "DeletePipelineResponseView": "create_pipeline_request",
+    "DescribePipelineRequestView": "create_pipeline_request",
+    "DescribePipelineResponseView": "create_pipeline_request",
+    "ListPipelinesRequestView": "create_pipeline_request",
+    "ListPipelinesResponseView": "create_pipeline_request",
+    "PipelineDefinitionS3LocationView": "create_pipeline_request",
+    "PipelineSummaryView": "create_pipeline_request",
+    "UpdatePipelineRequestView": "create_pipeline_request",
+    "UpdatePipelineResponseView": "create_pipeline_request",
+    "CreatePresignedDomainUrlRequestView": "create_presigned_domain_url_request",
+    "CreatePresignedDomainUrlResponseView": "create_presigned_domain_url_request",
+    "CreatePresignedNotebookInstanceUrlInputView": "create_presigned_notebook_instance_url_input",
+    "CreatePresignedNotebookInstanceUrlOutputView": "create_presigned_notebook_instance_url_input",
+    "CreateProjectInputView": "create_project_input",
+    "CreateProjectOutputView": "create_project_input",
+    "DeleteProjectInputView": "create_project_input",
+    "DescribeProjectInputView": "create_project_input",
+    "DescribeProjectOutputView": "create_project_input",
+    "ListProjectsInputView": "create_project_input",
+    "ListProjectsOutputView": "create_project_input",
+    "ProjectSummaryView": "create_project_input",
+    "ProvisioningParameterView": "create_project_input",
+    "ServiceCatalogProvisionedProductDetailsView": "create_project_input",
+    "ServiceCatalogProvisioningDetailsView": "create_project_input",
+    "ServiceCatalogProvisioningUpdateDetailsView": "create_project_input",
+    "UpdateProjectInputView": "create_project_input",
+    "UpdateProjectOutputView": "create_project_input",
+    "CreateSpaceRequestView": "create_space_request",
+    "CreateSpaceResponseView": "create_space_request",
+    "CustomFileSystemView": "create_space_request",
+    "DeleteSpaceRequestView": "create_space_request",
+    "DescribeSpaceRequestView": "create_space_request",
+    "DescribeSpaceResponseView": "create_space_request",
+    "EFSFileSystemView": "create_space_request",
+    "EbsStorageSettingsView": "create_space_request",
+    "ListSpacesRequestView": "create_space_request",
+    "ListSpacesResponseView": "create_space_request",
+    "OwnershipSettingsView": "create_space_request",
+    "OwnershipSettingsSummaryView": "create_space_request",
+    "SpaceCodeEditorAppSettingsView": "create_space_request",
+    "SpaceDetailsView": "create_space_request",
+    "SpaceJupyterLabAppSettingsView": "create_space_request",
+    "SpaceSettingsView": "create_space_request",
+    "SpaceSettingsSummaryView": "create_space_request",
+    "SpaceSharingSettingsView": "create_space_request",
+    "SpaceSharingSettingsSummaryView": "create_space_request",
+    "SpaceStorageSettingsView": "create_space_request",
+    "UpdateSpaceRequestView": "create_space_request",
+    "UpdateSpaceResponseView": "create_space_request",
+    "CreateStudioLifecycleConfigRequestView": "create_studio_lifecycle_config_request",
+    "CreateStudioLifecycleConfigResponseView": "create_studio_lifecycle_config_request",
+    "DeleteStudioLifecycleConfigRequestView": "create_studio_lifecycle_config_request",
+    "DescribeStudioLifecycleConfigRequestView": "create_studio_lifecycle_config_request",
+    "DescribeStudioLifecycleConfigResponseView": "create_studio_lifecycle_config_request",
+    "ListStudioLifecycleConfigsRequestView": "create_studio_lifecycle_config_request",
+    "ListStudioLifecycleConfigsResponseView": "create_studio_lifecycle_config_request",
+    "StudioLifecycleConfigDetailsView": "create_studio_lifecycle_config_request",
+    "CreateTrialRequestView": "create_trial_request",
+    "CreateTrialResponseView": "create_trial_request",
+    "DeleteTrialRequestView": "create_trial_request",
+    "DeleteTrialResponseView": "create_trial_request",
+    "DescribeTrialRequestView": "create_trial_request",
+    "DescribeTrialResponseView": "create_trial_request",
+    "ListTrialsRequestView": "create_trial_request",
+    "ListTrialsResponseView": "create_trial_request",
+    "TrialSourceView": "create_trial_request",
+    "TrialSummaryView": "create_trial_request",
+    "UpdateTrialRequestView": "create_trial_request",
+    "UpdateTrialResponseView": "create_trial_request",
+    "CreateUserProfileRequestView": "create_user_profile_request",
+    "CreateUserProfileResponseView": "create_user_profile_request",
+    "DeleteUserProfileRequestView": "create_user_profile_request",
+    "DescribeUserProfileRequestView": "create_user_profile_request",
+    "DescribeUserProfileResponseView": "create_user_profile_request",
+    "ListUserProfilesRequestView": "create_user_profile_request",
+    "ListUserProfilesResponseView": "create_user_profile_request",
+    "UpdateUserProfileRequestView": "create_user_profile_request",
+    "UpdateUserProfileResponseView": "create_user_profile_request",
+    "UserProfileDetailsView": "create_user_profile_request",
+    "CustomizedMetricSpecificationView": "customized_metric_specification",
+    "DynamicScalingConfigurationView": "customized_metric_specification",
+    "GetScalingConfigurationRecommendationRequestView": "customized_metric_specification",
+    "GetScalingConfigurationRecommendationResponseView": "customized_metric_specification",
+    "MetricSpecificationView": "customized_metric_specification",
+    "PredefinedMetricSpecificationView": "customized_metric_specification",
+    "ScalingPolicyView": "customized_metric_specification",
+    "ScalingPolicyMetricView": "customized_metric_specification",
+    "ScalingPolicyObjectiveView": "customized_metric_specification",
+    "TargetTrackingScalingPolicyConfigurationView": "customized_metric_specification",
+    "DeleteHubContentRequestView": "delete_hub_content_request",
+    "DescribeHubContentRequestView": "delete_hub_content_request",
+    "DescribeHubContentResponseView": "delete_hub_content_request",
+    "HubContentDependencyView": "delete_hub_content_request",
+    "HubContentInfoView": "delete_hub_content_request",
+    "ImportHubContentRequestView": "delete_hub_content_request",
+    "ImportHubContentResponseView": "delete_hub_content_request",
+    "ListHubContentsRequestView": "delete_hub_content_request",
+    "ListHubContentsResponseView": "delete_hub_content_request",
+    "DeleteModelPackageGroupPolicyInputView": "delete_model_package_group_policy_input",
+    "DeployedImageView": "deployed_image",
+    "DeploymentStageView": "deployment_stage",
+    "DeviceSelectionConfigView": "deployment_stage",
+    "EdgeDeploymentConfigView": "deployment_stage",
+    "DeregisterDevicesRequestView": "deregister_devices_request",
+    "DeviceView": "deregister_devices_request",
+    "DeviceDeploymentSummaryView": "deregister_devices_request",
+    "DeviceSummaryView": "deregister_devices_request",
+    "EdgeModelSummaryView": "deregister_devices_request",
+    "ListDevicesRequestView": "deregister_devices_request",
+    "ListDevicesResponseView": "deregister_devices_request",
+    "ListStageDevicesRequestView": "deregister_devices_request",
+    "ListStageDevicesResponseView": "deregister_devices_request",
+    "RegisterDevicesRequestView": "deregister_devices_request",
+    "UpdateDevicesRequestView": "deregister_devices_request",
+    "DescribeDeviceRequestView": "describe_device_request",
+    "DescribeDeviceResponseView": "describe_device_request",
+    "EdgeModelView": "describe_device_request",
+    "DescribeFeatureMetadataRequestView": "describe_feature_metadata_request",
+    "DescribeFeatureMetadataResponseView": "describe_feature_metadata_request",
+    "DescribeLineageGroupRequestView": "describe_lineage_group_request",
+    "DescribeLineageGroupResponseView": "describe_lineage_group_request",
+    "DescribePipelineDefinitionForExecutionRequestView": "describe_pipeline_definition_for_execution_request",
+    "DescribePipelineDefinitionForExecutionResponseView": "describe_pipeline_definition_for_execution_request",
+    "DescribePipelineExecutionRequestView": "describe_pipeline_execution_request",
+    "DescribePipelineExecutionResponseView": "describe_pipeline_execution_request",
+    "ListPipelineExecutionsRequestView": "describe_pipeline_execution_request",
+    "ListPipelineExecutionsResponseView": "describe_pipeline_execution_request",
+    "ParameterView": "describe_pipeline_execution_request",
+    "PipelineExecutionSummaryView": "describe_pipeline_execution_request",
+    "PipelineExperimentConfigView": "describe_pipeline_execution_request",
+    "RetryPipelineExecutionRequestView": "describe_pipeline_execution_request",
+    "RetryPipelineExecutionResponseView": "describe_pipeline_execution_request",
+    "SelectedStepView": "describe_pipeline_execution_request",
+    "SelectiveExecutionConfigView": "describe_pipeline_execution_request",
+    "StartPipelineExecutionRequestView": "describe_pipeline_execution_request",
+    "StartPipelineExecutionResponseView": "describe_pipeline_execution_request",
+    "StopPipelineExecutionRequestView": "describe_pipeline_execution_request",
+    "StopPipelineExecutionResponseView": "describe_pipeline_execution_request",
+    "UpdatePipelineExecutionRequestView": "describe_pipeline_execution_request",
+    "UpdatePipelineExecutionResponseView": "describe_pipeline_execution_request",
+    "DesiredWeightAndCapacityView": "desired_weight_and_capacity",
+    "ProductionVariantServerlessUpdateConfigView": "desired_weight_and_capacity",
+    "UpdateEndpointWeightsAndCapacitiesInputView": "desired_weight_and_capacity",
+    "UpdateEndpointWeightsAndCapacitiesOutputView": "desired_weight_and_capacity",
+    "EdgeView": "edge",
+    "QueryFiltersView": "edge",
+    "QueryLineageRequestView": "edge",
+    "QueryLineageResponseView": "edge",
+    "VertexView": "edge",
+    "EdgeOutputConfigView": "edge_output_config",
+    "EndpointView": "endpoint",
+    "ExperimentView": "endpoint",
+    "FeatureGroupView": "endpoint",
+    "FeatureMetadataView": "endpoint",
+    "FilterView": "endpoint",
+    "HyperParameterTuningJobSearchEntityView": "endpoint",
+    "ModelView": "endpoint",
+    "ModelCardView": "endpoint",
+    "ModelDashboardEndpointView": "endpoint",
+    "ModelDashboardModelView": "endpoint",
+    "ModelDashboardModelCardView": "endpoint",
+    "ModelDashboardMonitoringScheduleView": "endpoint",
+    "ModelPackageView": "endpoint",
+    "ModelPackageGroupView": "endpoint",
+    "MonitoringScheduleView": "endpoint",
+    "NestedFiltersView": "endpoint",
+    "ParentView": "endpoint",
+    "PipelineView": "endpoint",
+    "PipelineExecutionView": "endpoint",
+    "ProcessingJobView": "endpoint",
+    "ProjectView": "endpoint",
+    "SearchExpressionView": "endpoint",
+    "SearchRecordView": "endpoint",
+    "SearchRequestView": "endpoint",
+    "SearchResponseView": "endpoint",
+    "TrainingJobView": "endpoint",
+    "TransformJobView": "endpoint",
+    "TrialView": "endpoint",
+    "TrialComponentView": "endpoint",
+    "TrialComponentSimpleSummaryView": "endpoint",
+    "TrialComponentSourceDetailView": "endpoint",
+    "VisibilityConditionsView": "endpoint",
+    "ExperimentConfigView": "experiment_config",
+    "FeatureParameterView": "feature_parameter",
+    "GetLineageGroupPolicyRequestView": "get_lineage_group_policy_request",
+    "GetLineageGroupPolicyResponseView": "get_lineage_group_policy_request",
+    "GetModelPackageGroupPolicyInputView": "get_model_package_group_policy_input",
+    "GetModelPackageGroupPolicyOutputView": "get_model_package_group_policy_input",
+    "GetSagemakerServicecatalogPortfolioStatusOutputView": "get_sagemaker_servicecatalog_portfolio_status_output",
+    "GetSearchSuggestionsRequestView": "get_search_suggestions_request",
+    "GetSearchSuggestionsResponseView": "get_search_suggestions_request",
+    "PropertyNameQueryView": "get_search_suggestions_request",
+    "PropertyNameSuggestionView": "get_search_suggestions_request",
+    "SuggestionQueryView": "get_search_suggestions_request",
+    "HyperParameterTuningJobObjectiveView": "hyper_parameter_tuning_job_objective",
+    "IamIdentityView": "iam_identity",
+    "UserContextView": "iam_identity",
+    "InferenceRecommendationsJobStepView": "inference_recommendations_job_step",
+    "ListInferenceRecommendationsJobStepsRequestView": "inference_recommendations_job_step",
+    "ListInferenceRecommendationsJobStepsResponseView": "inference_recommendations_job_step",
+    "RecommendationJobInferenceBenchmarkView": "inference_recommendations_job_step",
+    "InternalDependencyExceptionView": "internal_dependency_exception",
+    "InternalFailureView": "internal_failure",
+    "LineageGroupSummaryView": "lineage_group_summary",
+    "ListLineageGroupsRequestView": "lineage_group_summary",
+    "ListLineageGroupsResponseView": "lineage_group_summary",
+    "ListAliasesRequestView": "list_aliases_request",
+    "ListAliasesResponseView": "list_aliases_request",
+    "ListHubContentVersionsRequestView": "list_hub_content_versions_request",
+    "ListHubContentVersionsResponseView": "list_hub_content_versions_request",
+    "ListModelCardVersionsRequestView": "list_model_card_versions_request",
+    "ListModelCardVersionsResponseView": "list_model_card_versions_request",
+    "ModelCardVersionSummaryView": "list_model_card_versions_request",
+    "ListModelMetadataRequestView": "list_model_metadata_request",
+    "ListModelMetadataResponseView": "list_model_metadata_request",
+    "ModelMetadataFilterView": "list_model_metadata_request",
+    "ModelMetadataSearchExpressionView": "list_model_metadata_request",
+    "ModelMetadataSummaryView": "list_model_metadata_request",
+    "ListMonitoringAlertHistoryRequestView": "list_monitoring_alert_history_request",
+    "ListMonitoringAlertHistoryResponseView": "list_monitoring_alert_history_request",
+    "MonitoringAlertHistorySummaryView": "list_monitoring_alert_history_request",
+    "ListMonitoringAlertsRequestView": "list_monitoring_alerts_request",
+    "ListMonitoringAlertsResponseView": "list_monitoring_alerts_request",
+    "ListMonitoringExecutionsRequestView": "list_monitoring_executions_request",
+    "ListMonitoringExecutionsResponseView": "list_monitoring_executions_request",
+    "ListPipelineParametersForExecutionRequestView": "list_pipeline_parameters_for_execution_request",
+    "ListPipelineParametersForExecutionResponseView": "list_pipeline_parameters_for_execution_request",
+    "ListResourceCatalogsRequestView": "list_resource_catalogs_request",
+    "ListResourceCatalogsResponseView": "list_resource_catalogs_request",
+    "ResourceCatalogView": "list_resource_catalogs_request",
+    "MetadataPropertiesView": "metadata_properties",
+    "ModelAccessConfigView": "model_access_config",
+    "ModelArtifactsView": "model_artifacts",
+    "ModelDashboardIndicatorActionView": "model_dashboard_indicator_action",
+    "MonitoringAlertActionsView": "model_dashboard_indicator_action",
+    "MonitoringAlertSummaryView": "model_dashboard_indicator_action",
+    "ModelDataSourceView": "model_data_source",
+    "S3ModelDataSourceView": "model_data_source",
+    "ModelErrorView": "model_error",
+    "ModelNotReadyExceptionView": "model_not_ready_exception",
+    "MonitoringGroundTruthS3InputView": "monitoring_ground_truth_s3_input",
+    "MonitoringJobDefinitionSummaryView": "monitoring_job_definition_summary",
+    "MonitoringNetworkConfigView": "monitoring_job_definition_summary",
+    "MonitoringStatisticsResourceView": "monitoring_statistics_resource",
+    "NetworkConfigView": "network_config",
+    "OutputParameterView": "output_parameter",
+    "ParallelismConfigurationView": "parallelism_configuration",
+    "ProductionVariantServerlessConfigView": "production_variant_serverless_config",
+    "PublicWorkforceTaskPriceView": "public_workforce_task_price",
+    "USDView": "public_workforce_task_price",
+    "PutModelPackageGroupPolicyInputView": "put_model_package_group_policy_input",
+    "PutModelPackageGroupPolicyOutputView": "put_model_package_group_policy_input",
+    "RenderUiTemplateRequestView": "render_ui_template_request",
+    "RenderUiTemplateResponseView": "render_ui_template_request",
+    "RenderableTaskView": "render_ui_template_request",
+    "RenderingErrorView": "render_ui_template_request",
+    "ResourceInUseView": "resource_in_use",
+    "ResourceLimitExceededView": "resource_limit_exceeded",
+    "ResourceNotFoundView": "resource_not_found",
+    "ResourceSpecView": "resource_spec",
+    "SendPipelineExecutionStepFailureRequestView": "send_pipeline_execution_step_failure_request",
+    "SendPipelineExecutionStepFailureResponseView": "send_pipeline_execution_step_failure_request",
+    "SendPipelineExecutionStepSuccessRequestView": "send_pipeline_execution_step_success_request",
+    "SendPipelineExecutionStepSuccessResponseView": "send_pipeline_execution_step_success_request",
+    "ServiceUnavailableView": "service_unavailable",
+    "StoppingConditionView": "stopping_condition",
+    "TagView": "tag",
+    "TransformDataSourceView": "transform_data_source",
+    "TransformInputView": "transform_data_source",
+    "TransformOutputView": "transform_data_source",
+    "TransformResourcesView": "transform_data_source",
+    "TransformS3DataSourceView": "transform_data_source",
+    "UpdateClusterSoftwareRequestView": "update_cluster_software_request",
+    "UpdateClusterSoftwareResponseView": "update_cluster_software_request",
+    "UpdateFeatureMetadataRequestView": "update_feature_metadata_request",
+    "UpdateInferenceComponentRuntimeConfigInputView": "update_inference_component_runtime_config_input",
+    "UpdateInferenceComponentRuntimeConfigOutputView": "update_inference_component_runtime_config_input",
+    "UpdateMonitoringAlertRequestView": "update_monitoring_alert_request",
+    "UpdateMonitoringAlertResponseView": "update_monitoring_alert_request",
+    "ValidationErrorView": "validation_error",
+    "VpcConfigView": "vpc_config",
+}
+
+__all__ = ["ShapeView", *_VIEW_MODULES]
+
+
+def __getattr__(name):
+    module_name = _VIEW_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VIEW_MODULES))
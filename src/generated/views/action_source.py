@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ActionSourceView(ShapeView):
+    """Read-only view of ActionSource, see ShapeView."""
+
+    __slots__ = (
+        "source_uri",
+        "source_type",
+        "source_id",
+    )
+    _shape = "ActionSource"
+
+
+class ActionSummaryView(ShapeView):
+    """Read-only view of ActionSummary, see ShapeView."""
+
+    __slots__ = (
+        "action_arn",
+        "action_name",
+        "source",
+        "action_type",
+        "status",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "ActionSummary"
+
+
+class CreateActionRequestView(ShapeView):
+    """Read-only view of CreateActionRequest, see ShapeView."""
+
+    __slots__ = (
+        "action_name",
+        "source",
+        "action_type",
+        "description",
+        "status",
+        "properties",
+        "metadata_properties",
+        "tags",
+    )
+    _shape = "CreateActionRequest"
+
+
+class CreateActionResponseView(ShapeView):
+    """Read-only view of CreateActionResponse, see ShapeView."""
+
+    __slots__ = ("action_arn",)
+    _shape = "CreateActionResponse"
+
+
+class DeleteActionRequestView(ShapeView):
+    """Read-only view of DeleteActionRequest, see ShapeView."""
+
+    __slots__ = ("action_name",)
+    _shape = "DeleteActionRequest"
+
+
+class DeleteActionResponseView(ShapeView):
+    """Read-only view of DeleteActionResponse, see ShapeView."""
+
+    __slots__ = ("action_arn",)
+    _shape = "DeleteActionResponse"
+
+
+class DescribeActionRequestView(ShapeView):
+    """Read-only view of DescribeActionRequest, see ShapeView."""
+
+    __slots__ = ("action_name",)
+    _shape = "DescribeActionRequest"
+
+
+class DescribeActionResponseView(ShapeView):
+    """Read-only view of DescribeActionResponse, see ShapeView."""
+
+    __slots__ = (
+        "action_name",
+        "action_arn",
+        "source",
+        "action_type",
+        "description",
+        "status",
+        "properties",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "metadata_properties",
+        "lineage_group_arn",
+    )
+    _shape = "DescribeActionResponse"
+
+
+class ListActionsRequestView(ShapeView):
+    """Read-only view of ListActionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "source_uri",
+        "action_type",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListActionsRequest"
+
+
+class ListActionsResponseView(ShapeView):
+    """Read-only view of ListActionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "action_summaries",
+        "next_token",
+    )
+    _shape = "ListActionsResponse"
+
+
+class UpdateActionRequestView(ShapeView):
+    """Read-only view of UpdateActionRequest, see ShapeView."""
+
+    __slots__ = (
+        "action_name",
+        "description",
+        "status",
+        "properties",
+        "properties_to_remove",
+    )
+    _shape = "UpdateActionRequest"
+
+
+class UpdateActionResponseView(ShapeView):
+    """Read-only view of UpdateActionResponse, see ShapeView."""
+
+    __slots__ = ("action_arn",)
+    _shape = "UpdateActionResponse"
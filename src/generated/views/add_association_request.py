@@ -0,0 +1,100 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AddAssociationRequestView(ShapeView):
+    """Read-only view of AddAssociationRequest, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+        "association_type",
+    )
+    _shape = "AddAssociationRequest"
+
+
+class AddAssociationResponseView(ShapeView):
+    """Read-only view of AddAssociationResponse, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+    )
+    _shape = "AddAssociationResponse"
+
+
+class AssociationSummaryView(ShapeView):
+    """Read-only view of AssociationSummary, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+        "source_type",
+        "destination_type",
+        "association_type",
+        "source_name",
+        "destination_name",
+        "creation_time",
+        "created_by",
+    )
+    _shape = "AssociationSummary"
+
+
+class DeleteAssociationRequestView(ShapeView):
+    """Read-only view of DeleteAssociationRequest, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+    )
+    _shape = "DeleteAssociationRequest"
+
+
+class DeleteAssociationResponseView(ShapeView):
+    """Read-only view of DeleteAssociationResponse, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+    )
+    _shape = "DeleteAssociationResponse"
+
+
+class ListAssociationsRequestView(ShapeView):
+    """Read-only view of ListAssociationsRequest, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+        "source_type",
+        "destination_type",
+        "association_type",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListAssociationsRequest"
+
+
+class ListAssociationsResponseView(ShapeView):
+    """Read-only view of ListAssociationsResponse, see ShapeView."""
+
+    __slots__ = (
+        "association_summaries",
+        "next_token",
+    )
+    _shape = "ListAssociationsResponse"
@@ -0,0 +1,61 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AddTagsInputView(ShapeView):
+    """Read-only view of AddTagsInput, see ShapeView."""
+
+    __slots__ = (
+        "resource_arn",
+        "tags",
+    )
+    _shape = "AddTagsInput"
+
+
+class AddTagsOutputView(ShapeView):
+    """Read-only view of AddTagsOutput, see ShapeView."""
+
+    __slots__ = ("tags",)
+    _shape = "AddTagsOutput"
+
+
+class DeleteTagsInputView(ShapeView):
+    """Read-only view of DeleteTagsInput, see ShapeView."""
+
+    __slots__ = (
+        "resource_arn",
+        "tag_keys",
+    )
+    _shape = "DeleteTagsInput"
+
+
+class ListTagsInputView(ShapeView):
+    """Read-only view of ListTagsInput, see ShapeView."""
+
+    __slots__ = (
+        "resource_arn",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListTagsInput"
+
+
+class ListTagsOutputView(ShapeView):
+    """Read-only view of ListTagsOutput, see ShapeView."""
+
+    __slots__ = (
+        "tags",
+        "next_token",
+    )
+    _shape = "ListTagsOutput"
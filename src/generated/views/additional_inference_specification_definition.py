@@ -0,0 +1,406 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AdditionalInferenceSpecificationDefinitionView(ShapeView):
+    """Read-only view of AdditionalInferenceSpecificationDefinition, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "description",
+        "containers",
+        "supported_transform_instance_types",
+        "supported_realtime_inference_instance_types",
+        "supported_content_types",
+        "supported_response_m_i_m_e_types",
+    )
+    _shape = "AdditionalInferenceSpecificationDefinition"
+
+
+class BatchDescribeModelPackageErrorView(ShapeView):
+    """Read-only view of BatchDescribeModelPackageError, see ShapeView."""
+
+    __slots__ = (
+        "error_code",
+        "error_response",
+    )
+    _shape = "BatchDescribeModelPackageError"
+
+
+class BatchDescribeModelPackageInputView(ShapeView):
+    """Read-only view of BatchDescribeModelPackageInput, see ShapeView."""
+
+    __slots__ = ("model_package_arn_list",)
+    _shape = "BatchDescribeModelPackageInput"
+
+
+class BatchDescribeModelPackageOutputView(ShapeView):
+    """Read-only view of BatchDescribeModelPackageOutput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_summaries",
+        "batch_describe_model_package_error_map",
+    )
+    _shape = "BatchDescribeModelPackageOutput"
+
+
+class BatchDescribeModelPackageSummaryView(ShapeView):
+    """Read-only view of BatchDescribeModelPackageSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_package_group_name",
+        "model_package_version",
+        "model_package_arn",
+        "model_package_description",
+        "creation_time",
+        "inference_specification",
+        "model_package_status",
+        "model_approval_status",
+    )
+    _shape = "BatchDescribeModelPackageSummary"
+
+
+class BiasView(ShapeView):
+    """Read-only view of Bias, see ShapeView."""
+
+    __slots__ = (
+        "report",
+        "pre_training_report",
+        "post_training_report",
+    )
+    _shape = "Bias"
+
+
+class CreateModelPackageInputView(ShapeView):
+    """Read-only view of CreateModelPackageInput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_name",
+        "model_package_group_name",
+        "model_package_description",
+        "inference_specification",
+        "validation_specification",
+        "source_algorithm_specification",
+        "certify_for_marketplace",
+        "tags",
+        "model_approval_status",
+        "metadata_properties",
+        "model_metrics",
+        "client_token",
+        "domain",
+        "task",
+        "sample_payload_url",
+        "customer_metadata_properties",
+        "drift_check_baselines",
+        "additional_inference_specifications",
+        "skip_model_validation",
+        "source_uri",
+    )
+    _shape = "CreateModelPackageInput"
+
+
+class CreateModelPackageOutputView(ShapeView):
+    """Read-only view of CreateModelPackageOutput, see ShapeView."""
+
+    __slots__ = ("model_package_arn",)
+    _shape = "CreateModelPackageOutput"
+
+
+class DeleteModelPackageInputView(ShapeView):
+    """Read-only view of DeleteModelPackageInput, see ShapeView."""
+
+    __slots__ = ("model_package_name",)
+    _shape = "DeleteModelPackageInput"
+
+
+class DescribeModelPackageInputView(ShapeView):
+    """Read-only view of DescribeModelPackageInput, see ShapeView."""
+
+    __slots__ = ("model_package_name",)
+    _shape = "DescribeModelPackageInput"
+
+
+class DescribeModelPackageOutputView(ShapeView):
+    """Read-only view of DescribeModelPackageOutput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_name",
+        "model_package_group_name",
+        "model_package_version",
+        "model_package_arn",
+        "model_package_description",
+        "creation_time",
+        "inference_specification",
+        "source_algorithm_specification",
+        "validation_specification",
+        "model_package_status",
+        "model_package_status_details",
+        "certify_for_marketplace",
+        "model_approval_status",
+        "created_by",
+        "metadata_properties",
+        "model_metrics",
+        "last_modified_time",
+        "last_modified_by",
+        "approval_description",
+        "domain",
+        "task",
+        "sample_payload_url",
+        "customer_metadata_properties",
+        "drift_check_baselines",
+        "additional_inference_specifications",
+        "skip_model_validation",
+        "source_uri",
+    )
+    _shape = "DescribeModelPackageOutput"
+
+
+class DriftCheckBaselinesView(ShapeView):
+    """Read-only view of DriftCheckBaselines, see ShapeView."""
+
+    __slots__ = (
+        "bias",
+        "explainability",
+        "model_quality",
+        "model_data_quality",
+    )
+    _shape = "DriftCheckBaselines"
+
+
+class DriftCheckBiasView(ShapeView):
+    """Read-only view of DriftCheckBias, see ShapeView."""
+
+    __slots__ = (
+        "config_file",
+        "pre_training_constraints",
+        "post_training_constraints",
+    )
+    _shape = "DriftCheckBias"
+
+
+class DriftCheckExplainabilityView(ShapeView):
+    """Read-only view of DriftCheckExplainability, see ShapeView."""
+
+    __slots__ = (
+        "constraints",
+        "config_file",
+    )
+    _shape = "DriftCheckExplainability"
+
+
+class DriftCheckModelDataQualityView(ShapeView):
+    """Read-only view of DriftCheckModelDataQuality, see ShapeView."""
+
+    __slots__ = (
+        "statistics",
+        "constraints",
+    )
+    _shape = "DriftCheckModelDataQuality"
+
+
+class DriftCheckModelQualityView(ShapeView):
+    """Read-only view of DriftCheckModelQuality, see ShapeView."""
+
+    __slots__ = (
+        "statistics",
+        "constraints",
+    )
+    _shape = "DriftCheckModelQuality"
+
+
+class ExplainabilityView(ShapeView):
+    """Read-only view of Explainability, see ShapeView."""
+
+    __slots__ = ("report",)
+    _shape = "Explainability"
+
+
+class FileSourceView(ShapeView):
+    """Read-only view of FileSource, see ShapeView."""
+
+    __slots__ = (
+        "content_type",
+        "content_digest",
+        "s3_uri",
+    )
+    _shape = "FileSource"
+
+
+class ListModelPackagesInputView(ShapeView):
+    """Read-only view of ListModelPackagesInput, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "name_contains",
+        "model_approval_status",
+        "model_package_group_name",
+        "model_package_type",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListModelPackagesInput"
+
+
+class ListModelPackagesOutputView(ShapeView):
+    """Read-only view of ListModelPackagesOutput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_summary_list",
+        "next_token",
+    )
+    _shape = "ListModelPackagesOutput"
+
+
+class MetricsSourceView(ShapeView):
+    """Read-only view of MetricsSource, see ShapeView."""
+
+    __slots__ = (
+        "content_type",
+        "content_digest",
+        "s3_uri",
+    )
+    _shape = "MetricsSource"
+
+
+class ModelDataQualityView(ShapeView):
+    """Read-only view of ModelDataQuality, see ShapeView."""
+
+    __slots__ = (
+        "statistics",
+        "constraints",
+    )
+    _shape = "ModelDataQuality"
+
+
+class ModelMetricsView(ShapeView):
+    """Read-only view of ModelMetrics, see ShapeView."""
+
+    __slots__ = (
+        "model_quality",
+        "model_data_quality",
+        "bias",
+        "explainability",
+    )
+    _shape = "ModelMetrics"
+
+
+class ModelPackageStatusDetailsView(ShapeView):
+    """Read-only view of ModelPackageStatusDetails, see ShapeView."""
+
+    __slots__ = (
+        "validation_statuses",
+        "image_scan_statuses",
+    )
+    _shape = "ModelPackageStatusDetails"
+
+
+class ModelPackageStatusItemView(ShapeView):
+    """Read-only view of ModelPackageStatusItem, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "status",
+        "failure_reason",
+    )
+    _shape = "ModelPackageStatusItem"
+
+
+class ModelPackageSummaryView(ShapeView):
+    """Read-only view of ModelPackageSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_package_name",
+        "model_package_group_name",
+        "model_package_version",
+        "model_package_arn",
+        "model_package_description",
+        "creation_time",
+        "model_package_status",
+        "model_approval_status",
+    )
+    _shape = "ModelPackageSummary"
+
+
+class ModelPackageValidationProfileView(ShapeView):
+    """Read-only view of ModelPackageValidationProfile, see ShapeView."""
+
+    __slots__ = (
+        "profile_name",
+        "transform_job_definition",
+    )
+    _shape = "ModelPackageValidationProfile"
+
+
+class ModelPackageValidationSpecificationView(ShapeView):
+    """Read-only view of ModelPackageValidationSpecification, see ShapeView."""
+
+    __slots__ = (
+        "validation_role",
+        "validation_profiles",
+    )
+    _shape = "ModelPackageValidationSpecification"
+
+
+class ModelQualityView(ShapeView):
+    """Read-only view of ModelQuality, see ShapeView."""
+
+    __slots__ = (
+        "statistics",
+        "constraints",
+    )
+    _shape = "ModelQuality"
+
+
+class SourceAlgorithmView(ShapeView):
+    """Read-only view of SourceAlgorithm, see ShapeView."""
+
+    __slots__ = (
+        "model_data_url",
+        "model_data_source",
+        "algorithm_name",
+    )
+    _shape = "SourceAlgorithm"
+
+
+class SourceAlgorithmSpecificationView(ShapeView):
+    """Read-only view of SourceAlgorithmSpecification, see ShapeView."""
+
+    __slots__ = ("source_algorithms",)
+    _shape = "SourceAlgorithmSpecification"
+
+
+class UpdateModelPackageInputView(ShapeView):
+    """Read-only view of UpdateModelPackageInput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_arn",
+        "model_approval_status",
+        "approval_description",
+        "customer_metadata_properties",
+        "customer_metadata_properties_to_remove",
+        "additional_inference_specifications_to_add",
+        "inference_specification",
+        "source_uri",
+    )
+    _shape = "UpdateModelPackageInput"
+
+
+class UpdateModelPackageOutputView(ShapeView):
+    """Read-only view of UpdateModelPackageOutput, see ShapeView."""
+
+    __slots__ = ("model_package_arn",)
+    _shape = "UpdateModelPackageOutput"
@@ -0,0 +1,79 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AdditionalS3DataSourceView(ShapeView):
+    """Read-only view of AdditionalS3DataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_data_type",
+        "s3_uri",
+        "compression_type",
+    )
+    _shape = "AdditionalS3DataSource"
+
+
+class InferenceSpecificationView(ShapeView):
+    """Read-only view of InferenceSpecification, see ShapeView."""
+
+    __slots__ = (
+        "containers",
+        "supported_transform_instance_types",
+        "supported_realtime_inference_instance_types",
+        "supported_content_types",
+        "supported_response_m_i_m_e_types",
+    )
+    _shape = "InferenceSpecification"
+
+
+class ModelInputView(ShapeView):
+    """Read-only view of ModelInput, see ShapeView."""
+
+    __slots__ = ("data_input_config",)
+    _shape = "ModelInput"
+
+
+class ModelPackageContainerDefinitionView(ShapeView):
+    """Read-only view of ModelPackageContainerDefinition, see ShapeView."""
+
+    __slots__ = (
+        "container_hostname",
+        "image",
+        "image_digest",
+        "model_data_url",
+        "model_data_source",
+        "product_id",
+        "environment",
+        "model_input",
+        "framework",
+        "framework_version",
+        "nearest_model_name",
+        "additional_s3_data_source",
+    )
+    _shape = "ModelPackageContainerDefinition"
+
+
+class TransformJobDefinitionView(ShapeView):
+    """Read-only view of TransformJobDefinition, see ShapeView."""
+
+    __slots__ = (
+        "max_concurrent_transforms",
+        "max_payload_in_m_b",
+        "batch_strategy",
+        "environment",
+        "transform_input",
+        "transform_output",
+        "transform_resources",
+    )
+    _shape = "TransformJobDefinition"
@@ -0,0 +1,70 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AgentVersionView(ShapeView):
+    """Read-only view of AgentVersion, see ShapeView."""
+
+    __slots__ = (
+        "version",
+        "agent_count",
+    )
+    _shape = "AgentVersion"
+
+
+class DeviceStatsView(ShapeView):
+    """Read-only view of DeviceStats, see ShapeView."""
+
+    __slots__ = (
+        "connected_device_count",
+        "registered_device_count",
+    )
+    _shape = "DeviceStats"
+
+
+class EdgeModelStatView(ShapeView):
+    """Read-only view of EdgeModelStat, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "model_version",
+        "offline_device_count",
+        "connected_device_count",
+        "active_device_count",
+        "sampling_device_count",
+    )
+    _shape = "EdgeModelStat"
+
+
+class GetDeviceFleetReportRequestView(ShapeView):
+    """Read-only view of GetDeviceFleetReportRequest, see ShapeView."""
+
+    __slots__ = ("device_fleet_name",)
+    _shape = "GetDeviceFleetReportRequest"
+
+
+class GetDeviceFleetReportResponseView(ShapeView):
+    """Read-only view of GetDeviceFleetReportResponse, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_arn",
+        "device_fleet_name",
+        "output_config",
+        "description",
+        "report_generated",
+        "device_stats",
+        "agent_versions",
+        "model_stats",
+    )
+    _shape = "GetDeviceFleetReportResponse"
@@ -0,0 +1,405 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AlarmView(ShapeView):
+    """Read-only view of Alarm, see ShapeView."""
+
+    __slots__ = ("alarm_name",)
+    _shape = "Alarm"
+
+
+class AutoRollbackConfigView(ShapeView):
+    """Read-only view of AutoRollbackConfig, see ShapeView."""
+
+    __slots__ = ("alarms",)
+    _shape = "AutoRollbackConfig"
+
+
+class BlueGreenUpdatePolicyView(ShapeView):
+    """Read-only view of BlueGreenUpdatePolicy, see ShapeView."""
+
+    __slots__ = (
+        "traffic_routing_configuration",
+        "termination_wait_in_seconds",
+        "maximum_execution_timeout_in_seconds",
+    )
+    _shape = "BlueGreenUpdatePolicy"
+
+
+class CapacitySizeView(ShapeView):
+    """Read-only view of CapacitySize, see ShapeView."""
+
+    __slots__ = (
+        "type",
+        "value",
+    )
+    _shape = "CapacitySize"
+
+
+class CreateEndpointInputView(ShapeView):
+    """Read-only view of CreateEndpointInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_config_name",
+        "deployment_config",
+        "tags",
+    )
+    _shape = "CreateEndpointInput"
+
+
+class CreateEndpointOutputView(ShapeView):
+    """Read-only view of CreateEndpointOutput, see ShapeView."""
+
+    __slots__ = ("endpoint_arn",)
+    _shape = "CreateEndpointOutput"
+
+
+class DataCaptureConfigSummaryView(ShapeView):
+    """Read-only view of DataCaptureConfigSummary, see ShapeView."""
+
+    __slots__ = (
+        "enable_capture",
+        "capture_status",
+        "current_sampling_percentage",
+        "destination_s3_uri",
+        "kms_key_id",
+    )
+    _shape = "DataCaptureConfigSummary"
+
+
+class DeleteEndpointInputView(ShapeView):
+    """Read-only view of DeleteEndpointInput, see ShapeView."""
+
+    __slots__ = ("endpoint_name",)
+    _shape = "DeleteEndpointInput"
+
+
+class DeploymentConfigView(ShapeView):
+    """Read-only view of DeploymentConfig, see ShapeView."""
+
+    __slots__ = (
+        "blue_green_update_policy",
+        "rolling_update_policy",
+        "auto_rollback_configuration",
+    )
+    _shape = "DeploymentConfig"
+
+
+class DescribeEndpointInputView(ShapeView):
+    """Read-only view of DescribeEndpointInput, see ShapeView."""
+
+    __slots__ = ("endpoint_name",)
+    _shape = "DescribeEndpointInput"
+
+
+class DescribeEndpointOutputView(ShapeView):
+    """Read-only view of DescribeEndpointOutput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_arn",
+        "endpoint_config_name",
+        "production_variants",
+        "data_capture_config",
+        "endpoint_status",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "last_deployment_config",
+        "async_inference_config",
+        "pending_deployment_summary",
+        "explainer_config",
+        "shadow_production_variants",
+    )
+    _shape = "DescribeEndpointOutput"
+
+
+class EndpointSummaryView(ShapeView):
+    """Read-only view of EndpointSummary, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_arn",
+        "creation_time",
+        "last_modified_time",
+        "endpoint_status",
+    )
+    _shape = "EndpointSummary"
+
+
+class InternalStreamFailureView(ShapeView):
+    """Read-only view of InternalStreamFailure, see ShapeView."""
+
+    __slots__ = ("message",)
+    _shape = "InternalStreamFailure"
+
+
+class InvokeEndpointAsyncInputView(ShapeView):
+    """Read-only view of InvokeEndpointAsyncInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "content_type",
+        "accept",
+        "custom_attributes",
+        "inference_id",
+        "input_location",
+        "request_t_t_l_seconds",
+        "invocation_timeout_seconds",
+    )
+    _shape = "InvokeEndpointAsyncInput"
+
+
+class InvokeEndpointAsyncOutputView(ShapeView):
+    """Read-only view of InvokeEndpointAsyncOutput, see ShapeView."""
+
+    __slots__ = (
+        "inference_id",
+        "output_location",
+        "failure_location",
+    )
+    _shape = "InvokeEndpointAsyncOutput"
+
+
+class InvokeEndpointInputView(ShapeView):
+    """Read-only view of InvokeEndpointInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "body",
+        "content_type",
+        "accept",
+        "custom_attributes",
+        "target_model",
+        "target_variant",
+        "target_container_hostname",
+        "inference_id",
+        "enable_explanations",
+        "inference_component_name",
+    )
+    _shape = "InvokeEndpointInput"
+
+
+class InvokeEndpointOutputView(ShapeView):
+    """Read-only view of InvokeEndpointOutput, see ShapeView."""
+
+    __slots__ = (
+        "body",
+        "content_type",
+        "invoked_production_variant",
+        "custom_attributes",
+    )
+    _shape = "InvokeEndpointOutput"
+
+
+class InvokeEndpointWithResponseStreamInputView(ShapeView):
+    """Read-only view of InvokeEndpointWithResponseStreamInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "body",
+        "content_type",
+        "accept",
+        "custom_attributes",
+        "target_variant",
+        "target_container_hostname",
+        "inference_id",
+        "inference_component_name",
+    )
+    _shape = "InvokeEndpointWithResponseStreamInput"
+
+
+class InvokeEndpointWithResponseStreamOutputView(ShapeView):
+    """Read-only view of InvokeEndpointWithResponseStreamOutput, see ShapeView."""
+
+    __slots__ = (
+        "body",
+        "content_type",
+        "invoked_production_variant",
+        "custom_attributes",
+    )
+    _shape = "InvokeEndpointWithResponseStreamOutput"
+
+
+class ListEndpointsInputView(ShapeView):
+    """Read-only view of ListEndpointsInput, see ShapeView."""
+
+    __slots__ = (
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+        "status_equals",
+    )
+    _shape = "ListEndpointsInput"
+
+
+class ListEndpointsOutputView(ShapeView):
+    """Read-only view of ListEndpointsOutput, see ShapeView."""
+
+    __slots__ = (
+        "endpoints",
+        "next_token",
+    )
+    _shape = "ListEndpointsOutput"
+
+
+class ModelStreamErrorView(ShapeView):
+    """Read-only view of ModelStreamError, see ShapeView."""
+
+    __slots__ = (
+        "message",
+        "error_code",
+    )
+    _shape = "ModelStreamError"
+
+
+class PayloadPartView(ShapeView):
+    """Read-only view of PayloadPart, see ShapeView."""
+
+    __slots__ = ("bytes",)
+    _shape = "PayloadPart"
+
+
+class PendingDeploymentSummaryView(ShapeView):
+    """Read-only view of PendingDeploymentSummary, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_config_name",
+        "production_variants",
+        "start_time",
+        "shadow_production_variants",
+    )
+    _shape = "PendingDeploymentSummary"
+
+
+class PendingProductionVariantSummaryView(ShapeView):
+    """Read-only view of PendingProductionVariantSummary, see ShapeView."""
+
+    __slots__ = (
+        "variant_name",
+        "deployed_images",
+        "current_weight",
+        "desired_weight",
+        "current_instance_count",
+        "desired_instance_count",
+        "instance_type",
+        "accelerator_type",
+        "variant_status",
+        "current_serverless_config",
+        "desired_serverless_config",
+        "managed_instance_scaling",
+        "routing_config",
+    )
+    _shape = "PendingProductionVariantSummary"
+
+
+class ProductionVariantStatusView(ShapeView):
+    """Read-only view of ProductionVariantStatus, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "status_message",
+        "start_time",
+    )
+    _shape = "ProductionVariantStatus"
+
+
+class ProductionVariantSummaryView(ShapeView):
+    """Read-only view of ProductionVariantSummary, see ShapeView."""
+
+    __slots__ = (
+        "variant_name",
+        "deployed_images",
+        "current_weight",
+        "desired_weight",
+        "current_instance_count",
+        "desired_instance_count",
+        "variant_status",
+        "current_serverless_config",
+        "desired_serverless_config",
+        "managed_instance_scaling",
+        "routing_config",
+    )
+    _shape = "ProductionVariantSummary"
+
+
+class ResponseStreamView(ShapeView):
+    """Read-only view of ResponseStream, see ShapeView."""
+
+    __slots__ = (
+        "payload_part",
+        "model_stream_error",
+        "internal_stream_failure",
+    )
+    _shape = "ResponseStream"
+
+
+class RollingUpdatePolicyView(ShapeView):
+    """Read-only view of RollingUpdatePolicy, see ShapeView."""
+
+    __slots__ = (
+        "maximum_batch_size",
+        "wait_interval_in_seconds",
+        "maximum_execution_timeout_in_seconds",
+        "rollback_maximum_batch_size",
+    )
+    _shape = "RollingUpdatePolicy"
+
+
+class TrafficRoutingConfigView(ShapeView):
+    """Read-only view of TrafficRoutingConfig, see ShapeView."""
+
+    __slots__ = (
+        "type",
+        "wait_interval_in_seconds",
+        "canary_size",
+        "linear_step_size",
+    )
+    _shape = "TrafficRoutingConfig"
+
+
+class UpdateEndpointInputView(ShapeView):
+    """Read-only view of UpdateEndpointInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_config_name",
+        "retain_all_variant_properties",
+        "exclude_retained_variant_properties",
+        "deployment_config",
+        "retain_deployment_config",
+    )
+    _shape = "UpdateEndpointInput"
+
+
+class UpdateEndpointOutputView(ShapeView):
+    """Read-only view of UpdateEndpointOutput, see ShapeView."""
+
+    __slots__ = ("endpoint_arn",)
+    _shape = "UpdateEndpointOutput"
+
+
+class VariantPropertyView(ShapeView):
+    """Read-only view of VariantProperty, see ShapeView."""
+
+    __slots__ = ("variant_property_type",)
+    _shape = "VariantProperty"
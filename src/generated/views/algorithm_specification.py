@@ -0,0 +1,388 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AlgorithmSpecificationView(ShapeView):
+    """Read-only view of AlgorithmSpecification, see ShapeView."""
+
+    __slots__ = (
+        "training_image",
+        "algorithm_name",
+        "training_input_mode",
+        "metric_definitions",
+        "enable_sage_maker_metrics_time_series",
+        "container_entrypoint",
+        "container_arguments",
+        "training_image_config",
+    )
+    _shape = "AlgorithmSpecification"
+
+
+class CollectionConfigurationView(ShapeView):
+    """Read-only view of CollectionConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "collection_name",
+        "collection_parameters",
+    )
+    _shape = "CollectionConfiguration"
+
+
+class CreateTrainingJobRequestView(ShapeView):
+    """Read-only view of CreateTrainingJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "training_job_name",
+        "hyper_parameters",
+        "algorithm_specification",
+        "role_arn",
+        "input_data_config",
+        "output_data_config",
+        "resource_config",
+        "vpc_config",
+        "stopping_condition",
+        "tags",
+        "enable_network_isolation",
+        "enable_inter_container_traffic_encryption",
+        "enable_managed_spot_training",
+        "checkpoint_config",
+        "debug_hook_config",
+        "debug_rule_configurations",
+        "tensor_board_output_config",
+        "experiment_config",
+        "profiler_config",
+        "profiler_rule_configurations",
+        "environment",
+        "retry_strategy",
+        "remote_debug_config",
+        "infra_check_config",
+    )
+    _shape = "CreateTrainingJobRequest"
+
+
+class CreateTrainingJobResponseView(ShapeView):
+    """Read-only view of CreateTrainingJobResponse, see ShapeView."""
+
+    __slots__ = ("training_job_arn",)
+    _shape = "CreateTrainingJobResponse"
+
+
+class DebugHookConfigView(ShapeView):
+    """Read-only view of DebugHookConfig, see ShapeView."""
+
+    __slots__ = (
+        "local_path",
+        "s3_output_path",
+        "hook_parameters",
+        "collection_configurations",
+    )
+    _shape = "DebugHookConfig"
+
+
+class DebugRuleConfigurationView(ShapeView):
+    """Read-only view of DebugRuleConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "rule_configuration_name",
+        "local_path",
+        "s3_output_path",
+        "rule_evaluator_image",
+        "instance_type",
+        "volume_size_in_g_b",
+        "rule_parameters",
+    )
+    _shape = "DebugRuleConfiguration"
+
+
+class DebugRuleEvaluationStatusView(ShapeView):
+    """Read-only view of DebugRuleEvaluationStatus, see ShapeView."""
+
+    __slots__ = (
+        "rule_configuration_name",
+        "rule_evaluation_job_arn",
+        "rule_evaluation_status",
+        "status_details",
+        "last_modified_time",
+    )
+    _shape = "DebugRuleEvaluationStatus"
+
+
+class DescribeTrainingJobRequestView(ShapeView):
+    """Read-only view of DescribeTrainingJobRequest, see ShapeView."""
+
+    __slots__ = ("training_job_name",)
+    _shape = "DescribeTrainingJobRequest"
+
+
+class DescribeTrainingJobResponseView(ShapeView):
+    """Read-only view of DescribeTrainingJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "training_job_name",
+        "training_job_arn",
+        "tuning_job_arn",
+        "labeling_job_arn",
+        "auto_m_l_job_arn",
+        "model_artifacts",
+        "training_job_status",
+        "secondary_status",
+        "failure_reason",
+        "hyper_parameters",
+        "algorithm_specification",
+        "role_arn",
+        "input_data_config",
+        "output_data_config",
+        "resource_config",
+        "warm_pool_status",
+        "vpc_config",
+        "stopping_condition",
+        "creation_time",
+        "training_start_time",
+        "training_end_time",
+        "last_modified_time",
+        "secondary_status_transitions",
+        "final_metric_data_list",
+        "enable_network_isolation",
+        "enable_inter_container_traffic_encryption",
+        "enable_managed_spot_training",
+        "checkpoint_config",
+        "training_time_in_seconds",
+        "billable_time_in_seconds",
+        "debug_hook_config",
+        "experiment_config",
+        "debug_rule_configurations",
+        "tensor_board_output_config",
+        "debug_rule_evaluation_statuses",
+        "profiler_config",
+        "profiler_rule_configurations",
+        "profiler_rule_evaluation_statuses",
+        "profiling_status",
+        "environment",
+        "retry_strategy",
+        "remote_debug_config",
+        "infra_check_config",
+    )
+    _shape = "DescribeTrainingJobResponse"
+
+
+class InfraCheckConfigView(ShapeView):
+    """Read-only view of InfraCheckConfig, see ShapeView."""
+
+    __slots__ = ("enable_infra_check",)
+    _shape = "InfraCheckConfig"
+
+
+class ListTrainingJobsRequestView(ShapeView):
+    """Read-only view of ListTrainingJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+        "warm_pool_status_equals",
+    )
+    _shape = "ListTrainingJobsRequest"
+
+
+class ListTrainingJobsResponseView(ShapeView):
+    """Read-only view of ListTrainingJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "training_job_summaries",
+        "next_token",
+    )
+    _shape = "ListTrainingJobsResponse"
+
+
+class MetricDataView(ShapeView):
+    """Read-only view of MetricData, see ShapeView."""
+
+    __slots__ = (
+        "metric_name",
+        "value",
+        "timestamp",
+    )
+    _shape = "MetricData"
+
+
+class ProfilerConfigView(ShapeView):
+    """Read-only view of ProfilerConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_output_path",
+        "profiling_interval_in_milliseconds",
+        "profiling_parameters",
+        "disable_profiler",
+    )
+    _shape = "ProfilerConfig"
+
+
+class ProfilerConfigForUpdateView(ShapeView):
+    """Read-only view of ProfilerConfigForUpdate, see ShapeView."""
+
+    __slots__ = (
+        "s3_output_path",
+        "profiling_interval_in_milliseconds",
+        "profiling_parameters",
+        "disable_profiler",
+    )
+    _shape = "ProfilerConfigForUpdate"
+
+
+class ProfilerRuleConfigurationView(ShapeView):
+    """Read-only view of ProfilerRuleConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "rule_configuration_name",
+        "local_path",
+        "s3_output_path",
+        "rule_evaluator_image",
+        "instance_type",
+        "volume_size_in_g_b",
+        "rule_parameters",
+    )
+    _shape = "ProfilerRuleConfiguration"
+
+
+class ProfilerRuleEvaluationStatusView(ShapeView):
+    """Read-only view of ProfilerRuleEvaluationStatus, see ShapeView."""
+
+    __slots__ = (
+        "rule_configuration_name",
+        "rule_evaluation_job_arn",
+        "rule_evaluation_status",
+        "status_details",
+        "last_modified_time",
+    )
+    _shape = "ProfilerRuleEvaluationStatus"
+
+
+class RemoteDebugConfigView(ShapeView):
+    """Read-only view of RemoteDebugConfig, see ShapeView."""
+
+    __slots__ = ("enable_remote_debug",)
+    _shape = "RemoteDebugConfig"
+
+
+class RemoteDebugConfigForUpdateView(ShapeView):
+    """Read-only view of RemoteDebugConfigForUpdate, see ShapeView."""
+
+    __slots__ = ("enable_remote_debug",)
+    _shape = "RemoteDebugConfigForUpdate"
+
+
+class ResourceConfigForUpdateView(ShapeView):
+    """Read-only view of ResourceConfigForUpdate, see ShapeView."""
+
+    __slots__ = ("keep_alive_period_in_seconds",)
+    _shape = "ResourceConfigForUpdate"
+
+
+class SecondaryStatusTransitionView(ShapeView):
+    """Read-only view of SecondaryStatusTransition, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "start_time",
+        "end_time",
+        "status_message",
+    )
+    _shape = "SecondaryStatusTransition"
+
+
+class StopTrainingJobRequestView(ShapeView):
+    """Read-only view of StopTrainingJobRequest, see ShapeView."""
+
+    __slots__ = ("training_job_name",)
+    _shape = "StopTrainingJobRequest"
+
+
+class TensorBoardOutputConfigView(ShapeView):
+    """Read-only view of TensorBoardOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "local_path",
+        "s3_output_path",
+    )
+    _shape = "TensorBoardOutputConfig"
+
+
+class TrainingImageConfigView(ShapeView):
+    """Read-only view of TrainingImageConfig, see ShapeView."""
+
+    __slots__ = (
+        "training_repository_access_mode",
+        "training_repository_auth_config",
+    )
+    _shape = "TrainingImageConfig"
+
+
+class TrainingJobSummaryView(ShapeView):
+    """Read-only view of TrainingJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "training_job_name",
+        "training_job_arn",
+        "creation_time",
+        "training_end_time",
+        "last_modified_time",
+        "training_job_status",
+        "warm_pool_status",
+    )
+    _shape = "TrainingJobSummary"
+
+
+class TrainingRepositoryAuthConfigView(ShapeView):
+    """Read-only view of TrainingRepositoryAuthConfig, see ShapeView."""
+
+    __slots__ = ("training_repository_credentials_provider_arn",)
+    _shape = "TrainingRepositoryAuthConfig"
+
+
+class UpdateTrainingJobRequestView(ShapeView):
+    """Read-only view of UpdateTrainingJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "training_job_name",
+        "profiler_config",
+        "profiler_rule_configurations",
+        "resource_config",
+        "remote_debug_config",
+    )
+    _shape = "UpdateTrainingJobRequest"
+
+
+class UpdateTrainingJobResponseView(ShapeView):
+    """Read-only view of UpdateTrainingJobResponse, see ShapeView."""
+
+    __slots__ = ("training_job_arn",)
+    _shape = "UpdateTrainingJobResponse"
+
+
+class WarmPoolStatusView(ShapeView):
+    """Read-only view of WarmPoolStatus, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "resource_retained_billable_time_in_seconds",
+        "reused_by_job",
+    )
+    _shape = "WarmPoolStatus"
@@ -0,0 +1,246 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AlgorithmStatusDetailsView(ShapeView):
+    """Read-only view of AlgorithmStatusDetails, see ShapeView."""
+
+    __slots__ = (
+        "validation_statuses",
+        "image_scan_statuses",
+    )
+    _shape = "AlgorithmStatusDetails"
+
+
+class AlgorithmStatusItemView(ShapeView):
+    """Read-only view of AlgorithmStatusItem, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "status",
+        "failure_reason",
+    )
+    _shape = "AlgorithmStatusItem"
+
+
+class AlgorithmSummaryView(ShapeView):
+    """Read-only view of AlgorithmSummary, see ShapeView."""
+
+    __slots__ = (
+        "algorithm_name",
+        "algorithm_arn",
+        "algorithm_description",
+        "creation_time",
+        "algorithm_status",
+    )
+    _shape = "AlgorithmSummary"
+
+
+class AlgorithmValidationProfileView(ShapeView):
+    """Read-only view of AlgorithmValidationProfile, see ShapeView."""
+
+    __slots__ = (
+        "profile_name",
+        "training_job_definition",
+        "transform_job_definition",
+    )
+    _shape = "AlgorithmValidationProfile"
+
+
+class AlgorithmValidationSpecificationView(ShapeView):
+    """Read-only view of AlgorithmValidationSpecification, see ShapeView."""
+
+    __slots__ = (
+        "validation_role",
+        "validation_profiles",
+    )
+    _shape = "AlgorithmValidationSpecification"
+
+
+class CategoricalParameterRangeSpecificationView(ShapeView):
+    """Read-only view of CategoricalParameterRangeSpecification, see ShapeView."""
+
+    __slots__ = ("values",)
+    _shape = "CategoricalParameterRangeSpecification"
+
+
+class ChannelSpecificationView(ShapeView):
+    """Read-only view of ChannelSpecification, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "description",
+        "is_required",
+        "supported_content_types",
+        "supported_compression_types",
+        "supported_input_modes",
+    )
+    _shape = "ChannelSpecification"
+
+
+class ContinuousParameterRangeSpecificationView(ShapeView):
+    """Read-only view of ContinuousParameterRangeSpecification, see ShapeView."""
+
+    __slots__ = (
+        "min_value",
+        "max_value",
+    )
+    _shape = "ContinuousParameterRangeSpecification"
+
+
+class CreateAlgorithmInputView(ShapeView):
+    """Read-only view of CreateAlgorithmInput, see ShapeView."""
+
+    __slots__ = (
+        "algorithm_name",
+        "algorithm_description",
+        "training_specification",
+        "inference_specification",
+        "validation_specification",
+        "certify_for_marketplace",
+        "tags",
+    )
+    _shape = "CreateAlgorithmInput"
+
+
+class CreateAlgorithmOutputView(ShapeView):
+    """Read-only view of CreateAlgorithmOutput, see ShapeView."""
+
+    __slots__ = ("algorithm_arn",)
+    _shape = "CreateAlgorithmOutput"
+
+
+class DeleteAlgorithmInputView(ShapeView):
+    """Read-only view of DeleteAlgorithmInput, see ShapeView."""
+
+    __slots__ = ("algorithm_name",)
+    _shape = "DeleteAlgorithmInput"
+
+
+class DescribeAlgorithmInputView(ShapeView):
+    """Read-only view of DescribeAlgorithmInput, see ShapeView."""
+
+    __slots__ = ("algorithm_name",)
+    _shape = "DescribeAlgorithmInput"
+
+
+class DescribeAlgorithmOutputView(ShapeView):
+    """Read-only view of DescribeAlgorithmOutput, see ShapeView."""
+
+    __slots__ = (
+        "algorithm_name",
+        "algorithm_arn",
+        "algorithm_description",
+        "creation_time",
+        "training_specification",
+        "inference_specification",
+        "validation_specification",
+        "algorithm_status",
+        "algorithm_status_details",
+        "product_id",
+        "certify_for_marketplace",
+    )
+    _shape = "DescribeAlgorithmOutput"
+
+
+class HyperParameterSpecificationView(ShapeView):
+    """Read-only view of HyperParameterSpecification, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "description",
+        "type",
+        "range",
+        "is_tunable",
+        "is_required",
+        "default_value",
+    )
+    _shape = "HyperParameterSpecification"
+
+
+class IntegerParameterRangeSpecificationView(ShapeView):
+    """Read-only view of IntegerParameterRangeSpecification, see ShapeView."""
+
+    __slots__ = (
+        "min_value",
+        "max_value",
+    )
+    _shape = "IntegerParameterRangeSpecification"
+
+
+class ListAlgorithmsInputView(ShapeView):
+    """Read-only view of ListAlgorithmsInput, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "name_contains",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListAlgorithmsInput"
+
+
+class ListAlgorithmsOutputView(ShapeView):
+    """Read-only view of ListAlgorithmsOutput, see ShapeView."""
+
+    __slots__ = (
+        "algorithm_summary_list",
+        "next_token",
+    )
+    _shape = "ListAlgorithmsOutput"
+
+
+class ParameterRangeView(ShapeView):
+    """Read-only view of ParameterRange, see ShapeView."""
+
+    __slots__ = (
+        "integer_parameter_range_specification",
+        "continuous_parameter_range_specification",
+        "categorical_parameter_range_specification",
+    )
+    _shape = "ParameterRange"
+
+
+class TrainingJobDefinitionView(ShapeView):
+    """Read-only view of TrainingJobDefinition, see ShapeView."""
+
+    __slots__ = (
+        "training_input_mode",
+        "hyper_parameters",
+        "input_data_config",
+        "output_data_config",
+        "resource_config",
+        "stopping_condition",
+    )
+    _shape = "TrainingJobDefinition"
+
+
+class TrainingSpecificationView(ShapeView):
+    """Read-only view of TrainingSpecification, see ShapeView."""
+
+    __slots__ = (
+        "training_image",
+        "training_image_digest",
+        "supported_hyper_parameters",
+        "supported_training_instance_types",
+        "supports_distributed_training",
+        "metric_definitions",
+        "training_channels",
+        "supported_tuning_job_objective_metrics",
+        "additional_s3_data_source",
+    )
+    _shape = "TrainingSpecification"
@@ -0,0 +1,269 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AnnotationConsolidationConfigView(ShapeView):
+    """Read-only view of AnnotationConsolidationConfig, see ShapeView."""
+
+    __slots__ = ("annotation_consolidation_lambda_arn",)
+    _shape = "AnnotationConsolidationConfig"
+
+
+class CreateLabelingJobRequestView(ShapeView):
+    """Read-only view of CreateLabelingJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_name",
+        "label_attribute_name",
+        "input_config",
+        "output_config",
+        "role_arn",
+        "label_category_config_s3_uri",
+        "stopping_conditions",
+        "labeling_job_algorithms_config",
+        "human_task_config",
+        "tags",
+    )
+    _shape = "CreateLabelingJobRequest"
+
+
+class CreateLabelingJobResponseView(ShapeView):
+    """Read-only view of CreateLabelingJobResponse, see ShapeView."""
+
+    __slots__ = ("labeling_job_arn",)
+    _shape = "CreateLabelingJobResponse"
+
+
+class DescribeLabelingJobRequestView(ShapeView):
+    """Read-only view of DescribeLabelingJobRequest, see ShapeView."""
+
+    __slots__ = ("labeling_job_name",)
+    _shape = "DescribeLabelingJobRequest"
+
+
+class DescribeLabelingJobResponseView(ShapeView):
+    """Read-only view of DescribeLabelingJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_status",
+        "label_counters",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "job_reference_code",
+        "labeling_job_name",
+        "labeling_job_arn",
+        "label_attribute_name",
+        "input_config",
+        "output_config",
+        "role_arn",
+        "label_category_config_s3_uri",
+        "stopping_conditions",
+        "labeling_job_algorithms_config",
+        "human_task_config",
+        "tags",
+        "labeling_job_output",
+    )
+    _shape = "DescribeLabelingJobResponse"
+
+
+class HumanTaskConfigView(ShapeView):
+    """Read-only view of HumanTaskConfig, see ShapeView."""
+
+    __slots__ = (
+        "workteam_arn",
+        "ui_config",
+        "pre_human_task_lambda_arn",
+        "task_keywords",
+        "task_title",
+        "task_description",
+        "number_of_human_workers_per_data_object",
+        "task_time_limit_in_seconds",
+        "task_availability_lifetime_in_seconds",
+        "max_concurrent_task_count",
+        "annotation_consolidation_config",
+        "public_workforce_task_price",
+    )
+    _shape = "HumanTaskConfig"
+
+
+class LabelCountersView(ShapeView):
+    """Read-only view of LabelCounters, see ShapeView."""
+
+    __slots__ = (
+        "total_labeled",
+        "human_labeled",
+        "machine_labeled",
+        "failed_non_retryable_error",
+        "unlabeled",
+    )
+    _shape = "LabelCounters"
+
+
+class LabelingJobAlgorithmsConfigView(ShapeView):
+    """Read-only view of LabelingJobAlgorithmsConfig, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_algorithm_specification_arn",
+        "initial_active_learning_model_arn",
+        "labeling_job_resource_config",
+    )
+    _shape = "LabelingJobAlgorithmsConfig"
+
+
+class LabelingJobDataAttributesView(ShapeView):
+    """Read-only view of LabelingJobDataAttributes, see ShapeView."""
+
+    __slots__ = ("content_classifiers",)
+    _shape = "LabelingJobDataAttributes"
+
+
+class LabelingJobDataSourceView(ShapeView):
+    """Read-only view of LabelingJobDataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_data_source",
+        "sns_data_source",
+    )
+    _shape = "LabelingJobDataSource"
+
+
+class LabelingJobInputConfigView(ShapeView):
+    """Read-only view of LabelingJobInputConfig, see ShapeView."""
+
+    __slots__ = (
+        "data_source",
+        "data_attributes",
+    )
+    _shape = "LabelingJobInputConfig"
+
+
+class LabelingJobOutputView(ShapeView):
+    """Read-only view of LabelingJobOutput, see ShapeView."""
+
+    __slots__ = (
+        "output_dataset_s3_uri",
+        "final_active_learning_model_arn",
+    )
+    _shape = "LabelingJobOutput"
+
+
+class LabelingJobOutputConfigView(ShapeView):
+    """Read-only view of LabelingJobOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_output_path",
+        "kms_key_id",
+        "sns_topic_arn",
+    )
+    _shape = "LabelingJobOutputConfig"
+
+
+class LabelingJobResourceConfigView(ShapeView):
+    """Read-only view of LabelingJobResourceConfig, see ShapeView."""
+
+    __slots__ = (
+        "volume_kms_key_id",
+        "vpc_config",
+    )
+    _shape = "LabelingJobResourceConfig"
+
+
+class LabelingJobS3DataSourceView(ShapeView):
+    """Read-only view of LabelingJobS3DataSource, see ShapeView."""
+
+    __slots__ = ("manifest_s3_uri",)
+    _shape = "LabelingJobS3DataSource"
+
+
+class LabelingJobSnsDataSourceView(ShapeView):
+    """Read-only view of LabelingJobSnsDataSource, see ShapeView."""
+
+    __slots__ = ("sns_topic_arn",)
+    _shape = "LabelingJobSnsDataSource"
+
+
+class LabelingJobStoppingConditionsView(ShapeView):
+    """Read-only view of LabelingJobStoppingConditions, see ShapeView."""
+
+    __slots__ = (
+        "max_human_labeled_object_count",
+        "max_percentage_of_input_dataset_labeled",
+    )
+    _shape = "LabelingJobStoppingConditions"
+
+
+class LabelingJobSummaryView(ShapeView):
+    """Read-only view of LabelingJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_name",
+        "labeling_job_arn",
+        "creation_time",
+        "last_modified_time",
+        "labeling_job_status",
+        "label_counters",
+        "workteam_arn",
+        "pre_human_task_lambda_arn",
+        "annotation_consolidation_lambda_arn",
+        "failure_reason",
+        "labeling_job_output",
+        "input_config",
+    )
+    _shape = "LabelingJobSummary"
+
+
+class ListLabelingJobsRequestView(ShapeView):
+    """Read-only view of ListLabelingJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "max_results",
+        "next_token",
+        "name_contains",
+        "sort_by",
+        "sort_order",
+        "status_equals",
+    )
+    _shape = "ListLabelingJobsRequest"
+
+
+class ListLabelingJobsResponseView(ShapeView):
+    """Read-only view of ListLabelingJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_summary_list",
+        "next_token",
+    )
+    _shape = "ListLabelingJobsResponse"
+
+
+class StopLabelingJobRequestView(ShapeView):
+    """Read-only view of StopLabelingJobRequest, see ShapeView."""
+
+    __slots__ = ("labeling_job_name",)
+    _shape = "StopLabelingJobRequest"
+
+
+class UiConfigView(ShapeView):
+    """Read-only view of UiConfig, see ShapeView."""
+
+    __slots__ = (
+        "ui_template_s3_uri",
+        "human_task_ui_arn",
+    )
+    _shape = "UiConfig"
@@ -0,0 +1,122 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AppDetailsView(ShapeView):
+    """Read-only view of AppDetails, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "space_name",
+        "app_type",
+        "app_name",
+        "status",
+        "creation_time",
+        "resource_spec",
+    )
+    _shape = "AppDetails"
+
+
+class CreateAppRequestView(ShapeView):
+    """Read-only view of CreateAppRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "space_name",
+        "app_type",
+        "app_name",
+        "tags",
+        "resource_spec",
+    )
+    _shape = "CreateAppRequest"
+
+
+class CreateAppResponseView(ShapeView):
+    """Read-only view of CreateAppResponse, see ShapeView."""
+
+    __slots__ = ("app_arn",)
+    _shape = "CreateAppResponse"
+
+
+class DeleteAppRequestView(ShapeView):
+    """Read-only view of DeleteAppRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "space_name",
+        "app_type",
+        "app_name",
+    )
+    _shape = "DeleteAppRequest"
+
+
+class DescribeAppRequestView(ShapeView):
+    """Read-only view of DescribeAppRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "space_name",
+        "app_type",
+        "app_name",
+    )
+    _shape = "DescribeAppRequest"
+
+
+class DescribeAppResponseView(ShapeView):
+    """Read-only view of DescribeAppResponse, see ShapeView."""
+
+    __slots__ = (
+        "app_arn",
+        "app_type",
+        "app_name",
+        "domain_id",
+        "user_profile_name",
+        "space_name",
+        "status",
+        "last_health_check_timestamp",
+        "last_user_activity_timestamp",
+        "creation_time",
+        "failure_reason",
+        "resource_spec",
+    )
+    _shape = "DescribeAppResponse"
+
+
+class ListAppsRequestView(ShapeView):
+    """Read-only view of ListAppsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "sort_order",
+        "sort_by",
+        "domain_id_equals",
+        "user_profile_name_equals",
+        "space_name_equals",
+    )
+    _shape = "ListAppsRequest"
+
+
+class ListAppsResponseView(ShapeView):
+    """Read-only view of ListAppsResponse, see ShapeView."""
+
+    __slots__ = (
+        "apps",
+        "next_token",
+    )
+    _shape = "ListAppsResponse"
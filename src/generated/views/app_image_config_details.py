@@ -0,0 +1,171 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AppImageConfigDetailsView(ShapeView):
+    """Read-only view of AppImageConfigDetails, see ShapeView."""
+
+    __slots__ = (
+        "app_image_config_arn",
+        "app_image_config_name",
+        "creation_time",
+        "last_modified_time",
+        "kernel_gateway_image_config",
+        "jupyter_lab_app_image_config",
+    )
+    _shape = "AppImageConfigDetails"
+
+
+class ContainerConfigView(ShapeView):
+    """Read-only view of ContainerConfig, see ShapeView."""
+
+    __slots__ = (
+        "container_arguments",
+        "container_entrypoint",
+        "container_environment_variables",
+    )
+    _shape = "ContainerConfig"
+
+
+class CreateAppImageConfigRequestView(ShapeView):
+    """Read-only view of CreateAppImageConfigRequest, see ShapeView."""
+
+    __slots__ = (
+        "app_image_config_name",
+        "tags",
+        "kernel_gateway_image_config",
+        "jupyter_lab_app_image_config",
+    )
+    _shape = "CreateAppImageConfigRequest"
+
+
+class CreateAppImageConfigResponseView(ShapeView):
+    """Read-only view of CreateAppImageConfigResponse, see ShapeView."""
+
+    __slots__ = ("app_image_config_arn",)
+    _shape = "CreateAppImageConfigResponse"
+
+
+class DeleteAppImageConfigRequestView(ShapeView):
+    """Read-only view of DeleteAppImageConfigRequest, see ShapeView."""
+
+    __slots__ = ("app_image_config_name",)
+    _shape = "DeleteAppImageConfigRequest"
+
+
+class DescribeAppImageConfigRequestView(ShapeView):
+    """Read-only view of DescribeAppImageConfigRequest, see ShapeView."""
+
+    __slots__ = ("app_image_config_name",)
+    _shape = "DescribeAppImageConfigRequest"
+
+
+class DescribeAppImageConfigResponseView(ShapeView):
+    """Read-only view of DescribeAppImageConfigResponse, see ShapeView."""
+
+    __slots__ = (
+        "app_image_config_arn",
+        "app_image_config_name",
+        "creation_time",
+        "last_modified_time",
+        "kernel_gateway_image_config",
+        "jupyter_lab_app_image_config",
+    )
+    _shape = "DescribeAppImageConfigResponse"
+
+
+class FileSystemConfigView(ShapeView):
+    """Read-only view of FileSystemConfig, see ShapeView."""
+
+    __slots__ = (
+        "mount_path",
+        "default_uid",
+        "default_gid",
+    )
+    _shape = "FileSystemConfig"
+
+
+class JupyterLabAppImageConfigView(ShapeView):
+    """Read-only view of JupyterLabAppImageConfig, see ShapeView."""
+
+    __slots__ = (
+        "file_system_config",
+        "container_config",
+    )
+    _shape = "JupyterLabAppImageConfig"
+
+
+class KernelGatewayImageConfigView(ShapeView):
+    """Read-only view of KernelGatewayImageConfig, see ShapeView."""
+
+    __slots__ = (
+        "kernel_specs",
+        "file_system_config",
+    )
+    _shape = "KernelGatewayImageConfig"
+
+
+class KernelSpecView(ShapeView):
+    """Read-only view of KernelSpec, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "display_name",
+    )
+    _shape = "KernelSpec"
+
+
+class ListAppImageConfigsRequestView(ShapeView):
+    """Read-only view of ListAppImageConfigsRequest, see ShapeView."""
+
+    __slots__ = (
+        "max_results",
+        "next_token",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "modified_time_before",
+        "modified_time_after",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListAppImageConfigsRequest"
+
+
+class ListAppImageConfigsResponseView(ShapeView):
+    """Read-only view of ListAppImageConfigsResponse, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "app_image_configs",
+    )
+    _shape = "ListAppImageConfigsResponse"
+
+
+class UpdateAppImageConfigRequestView(ShapeView):
+    """Read-only view of UpdateAppImageConfigRequest, see ShapeView."""
+
+    __slots__ = (
+        "app_image_config_name",
+        "kernel_gateway_image_config",
+        "jupyter_lab_app_image_config",
+    )
+    _shape = "UpdateAppImageConfigRequest"
+
+
+class UpdateAppImageConfigResponseView(ShapeView):
+    """Read-only view of UpdateAppImageConfigResponse, see ShapeView."""
+
+    __slots__ = ("app_image_config_arn",)
+    _shape = "UpdateAppImageConfigResponse"
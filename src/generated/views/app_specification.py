@@ -0,0 +1,275 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AppSpecificationView(ShapeView):
+    """Read-only view of AppSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image_uri",
+        "container_entrypoint",
+        "container_arguments",
+    )
+    _shape = "AppSpecification"
+
+
+class AthenaDatasetDefinitionView(ShapeView):
+    """Read-only view of AthenaDatasetDefinition, see ShapeView."""
+
+    __slots__ = (
+        "catalog",
+        "database",
+        "query_string",
+        "work_group",
+        "output_s3_uri",
+        "kms_key_id",
+        "output_format",
+        "output_compression",
+    )
+    _shape = "AthenaDatasetDefinition"
+
+
+class CreateProcessingJobRequestView(ShapeView):
+    """Read-only view of CreateProcessingJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "processing_inputs",
+        "processing_output_config",
+        "processing_job_name",
+        "processing_resources",
+        "stopping_condition",
+        "app_specification",
+        "environment",
+        "network_config",
+        "role_arn",
+        "tags",
+        "experiment_config",
+    )
+    _shape = "CreateProcessingJobRequest"
+
+
+class CreateProcessingJobResponseView(ShapeView):
+    """Read-only view of CreateProcessingJobResponse, see ShapeView."""
+
+    __slots__ = ("processing_job_arn",)
+    _shape = "CreateProcessingJobResponse"
+
+
+class DatasetDefinitionView(ShapeView):
+    """Read-only view of DatasetDefinition, see ShapeView."""
+
+    __slots__ = (
+        "athena_dataset_definition",
+        "redshift_dataset_definition",
+        "local_path",
+        "data_distribution_type",
+        "input_mode",
+    )
+    _shape = "DatasetDefinition"
+
+
+class DescribeProcessingJobRequestView(ShapeView):
+    """Read-only view of DescribeProcessingJobRequest, see ShapeView."""
+
+    __slots__ = ("processing_job_name",)
+    _shape = "DescribeProcessingJobRequest"
+
+
+class DescribeProcessingJobResponseView(ShapeView):
+    """Read-only view of DescribeProcessingJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "processing_inputs",
+        "processing_output_config",
+        "processing_job_name",
+        "processing_resources",
+        "stopping_condition",
+        "app_specification",
+        "environment",
+        "network_config",
+        "role_arn",
+        "experiment_config",
+        "processing_job_arn",
+        "processing_job_status",
+        "exit_message",
+        "failure_reason",
+        "processing_end_time",
+        "processing_start_time",
+        "last_modified_time",
+        "creation_time",
+        "monitoring_schedule_arn",
+        "auto_m_l_job_arn",
+        "training_job_arn",
+    )
+    _shape = "DescribeProcessingJobResponse"
+
+
+class ListProcessingJobsRequestView(ShapeView):
+    """Read-only view of ListProcessingJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListProcessingJobsRequest"
+
+
+class ListProcessingJobsResponseView(ShapeView):
+    """Read-only view of ListProcessingJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "processing_job_summaries",
+        "next_token",
+    )
+    _shape = "ListProcessingJobsResponse"
+
+
+class ProcessingClusterConfigView(ShapeView):
+    """Read-only view of ProcessingClusterConfig, see ShapeView."""
+
+    __slots__ = (
+        "instance_count",
+        "instance_type",
+        "volume_size_in_g_b",
+        "volume_kms_key_id",
+    )
+    _shape = "ProcessingClusterConfig"
+
+
+class ProcessingFeatureStoreOutputView(ShapeView):
+    """Read-only view of ProcessingFeatureStoreOutput, see ShapeView."""
+
+    __slots__ = ("feature_group_name",)
+    _shape = "ProcessingFeatureStoreOutput"
+
+
+class ProcessingInputView(ShapeView):
+    """Read-only view of ProcessingInput, see ShapeView."""
+
+    __slots__ = (
+        "input_name",
+        "app_managed",
+        "s3_input",
+        "dataset_definition",
+    )
+    _shape = "ProcessingInput"
+
+
+class ProcessingJobSummaryView(ShapeView):
+    """Read-only view of ProcessingJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "processing_job_name",
+        "processing_job_arn",
+        "creation_time",
+        "processing_end_time",
+        "last_modified_time",
+        "processing_job_status",
+        "failure_reason",
+        "exit_message",
+    )
+    _shape = "ProcessingJobSummary"
+
+
+class ProcessingOutputView(ShapeView):
+    """Read-only view of ProcessingOutput, see ShapeView."""
+
+    __slots__ = (
+        "output_name",
+        "s3_output",
+        "feature_store_output",
+        "app_managed",
+    )
+    _shape = "ProcessingOutput"
+
+
+class ProcessingOutputConfigView(ShapeView):
+    """Read-only view of ProcessingOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "outputs",
+        "kms_key_id",
+    )
+    _shape = "ProcessingOutputConfig"
+
+
+class ProcessingResourcesView(ShapeView):
+    """Read-only view of ProcessingResources, see ShapeView."""
+
+    __slots__ = ("cluster_config",)
+    _shape = "ProcessingResources"
+
+
+class ProcessingS3InputView(ShapeView):
+    """Read-only view of ProcessingS3Input, see ShapeView."""
+
+    __slots__ = (
+        "s3_uri",
+        "local_path",
+        "s3_data_type",
+        "s3_input_mode",
+        "s3_data_distribution_type",
+        "s3_compression_type",
+    )
+    _shape = "ProcessingS3Input"
+
+
+class ProcessingS3OutputView(ShapeView):
+    """Read-only view of ProcessingS3Output, see ShapeView."""
+
+    __slots__ = (
+        "s3_uri",
+        "local_path",
+        "s3_upload_mode",
+    )
+    _shape = "ProcessingS3Output"
+
+
+class ProcessingStoppingConditionView(ShapeView):
+    """Read-only view of ProcessingStoppingCondition, see ShapeView."""
+
+    __slots__ = ("max_runtime_in_seconds",)
+    _shape = "ProcessingStoppingCondition"
+
+
+class RedshiftDatasetDefinitionView(ShapeView):
+    """Read-only view of RedshiftDatasetDefinition, see ShapeView."""
+
+    __slots__ = (
+        "cluster_id",
+        "database",
+        "db_user",
+        "query_string",
+        "cluster_role_arn",
+        "output_s3_uri",
+        "kms_key_id",
+        "output_format",
+        "output_compression",
+    )
+    _shape = "RedshiftDatasetDefinition"
+
+
+class StopProcessingJobRequestView(ShapeView):
+    """Read-only view of StopProcessingJobRequest, see ShapeView."""
+
+    __slots__ = ("processing_job_name",)
+    _shape = "StopProcessingJobRequest"
@@ -0,0 +1,156 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ArtifactSourceView(ShapeView):
+    """Read-only view of ArtifactSource, see ShapeView."""
+
+    __slots__ = (
+        "source_uri",
+        "source_types",
+    )
+    _shape = "ArtifactSource"
+
+
+class ArtifactSourceTypeView(ShapeView):
+    """Read-only view of ArtifactSourceType, see ShapeView."""
+
+    __slots__ = (
+        "source_id_type",
+        "value",
+    )
+    _shape = "ArtifactSourceType"
+
+
+class ArtifactSummaryView(ShapeView):
+    """Read-only view of ArtifactSummary, see ShapeView."""
+
+    __slots__ = (
+        "artifact_arn",
+        "artifact_name",
+        "source",
+        "artifact_type",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "ArtifactSummary"
+
+
+class CreateArtifactRequestView(ShapeView):
+    """Read-only view of CreateArtifactRequest, see ShapeView."""
+
+    __slots__ = (
+        "artifact_name",
+        "source",
+        "artifact_type",
+        "properties",
+        "metadata_properties",
+        "tags",
+    )
+    _shape = "CreateArtifactRequest"
+
+
+class CreateArtifactResponseView(ShapeView):
+    """Read-only view of CreateArtifactResponse, see ShapeView."""
+
+    __slots__ = ("artifact_arn",)
+    _shape = "CreateArtifactResponse"
+
+
+class DeleteArtifactRequestView(ShapeView):
+    """Read-only view of DeleteArtifactRequest, see ShapeView."""
+
+    __slots__ = (
+        "artifact_arn",
+        "source",
+    )
+    _shape = "DeleteArtifactRequest"
+
+
+class DeleteArtifactResponseView(ShapeView):
+    """Read-only view of DeleteArtifactResponse, see ShapeView."""
+
+    __slots__ = ("artifact_arn",)
+    _shape = "DeleteArtifactResponse"
+
+
+class DescribeArtifactRequestView(ShapeView):
+    """Read-only view of DescribeArtifactRequest, see ShapeView."""
+
+    __slots__ = ("artifact_arn",)
+    _shape = "DescribeArtifactRequest"
+
+
+class DescribeArtifactResponseView(ShapeView):
+    """Read-only view of DescribeArtifactResponse, see ShapeView."""
+
+    __slots__ = (
+        "artifact_name",
+        "artifact_arn",
+        "source",
+        "artifact_type",
+        "properties",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "metadata_properties",
+        "lineage_group_arn",
+    )
+    _shape = "DescribeArtifactResponse"
+
+
+class ListArtifactsRequestView(ShapeView):
+    """Read-only view of ListArtifactsRequest, see ShapeView."""
+
+    __slots__ = (
+        "source_uri",
+        "artifact_type",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListArtifactsRequest"
+
+
+class ListArtifactsResponseView(ShapeView):
+    """Read-only view of ListArtifactsResponse, see ShapeView."""
+
+    __slots__ = (
+        "artifact_summaries",
+        "next_token",
+    )
+    _shape = "ListArtifactsResponse"
+
+
+class UpdateArtifactRequestView(ShapeView):
+    """Read-only view of UpdateArtifactRequest, see ShapeView."""
+
+    __slots__ = (
+        "artifact_arn",
+        "artifact_name",
+        "properties",
+        "properties_to_remove",
+    )
+    _shape = "UpdateArtifactRequest"
+
+
+class UpdateArtifactResponseView(ShapeView):
+    """Read-only view of UpdateArtifactResponse, see ShapeView."""
+
+    __slots__ = ("artifact_arn",)
+    _shape = "UpdateArtifactResponse"
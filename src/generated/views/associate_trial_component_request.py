@@ -0,0 +1,254 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AssociateTrialComponentRequestView(ShapeView):
+    """Read-only view of AssociateTrialComponentRequest, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "trial_name",
+    )
+    _shape = "AssociateTrialComponentRequest"
+
+
+class AssociateTrialComponentResponseView(ShapeView):
+    """Read-only view of AssociateTrialComponentResponse, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_arn",
+        "trial_arn",
+    )
+    _shape = "AssociateTrialComponentResponse"
+
+
+class CreateTrialComponentRequestView(ShapeView):
+    """Read-only view of CreateTrialComponentRequest, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "display_name",
+        "status",
+        "start_time",
+        "end_time",
+        "parameters",
+        "input_artifacts",
+        "output_artifacts",
+        "metadata_properties",
+        "tags",
+    )
+    _shape = "CreateTrialComponentRequest"
+
+
+class CreateTrialComponentResponseView(ShapeView):
+    """Read-only view of CreateTrialComponentResponse, see ShapeView."""
+
+    __slots__ = ("trial_component_arn",)
+    _shape = "CreateTrialComponentResponse"
+
+
+class DeleteTrialComponentRequestView(ShapeView):
+    """Read-only view of DeleteTrialComponentRequest, see ShapeView."""
+
+    __slots__ = ("trial_component_name",)
+    _shape = "DeleteTrialComponentRequest"
+
+
+class DeleteTrialComponentResponseView(ShapeView):
+    """Read-only view of DeleteTrialComponentResponse, see ShapeView."""
+
+    __slots__ = ("trial_component_arn",)
+    _shape = "DeleteTrialComponentResponse"
+
+
+class DescribeTrialComponentRequestView(ShapeView):
+    """Read-only view of DescribeTrialComponentRequest, see ShapeView."""
+
+    __slots__ = ("trial_component_name",)
+    _shape = "DescribeTrialComponentRequest"
+
+
+class DescribeTrialComponentResponseView(ShapeView):
+    """Read-only view of DescribeTrialComponentResponse, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "trial_component_arn",
+        "display_name",
+        "source",
+        "status",
+        "start_time",
+        "end_time",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "parameters",
+        "input_artifacts",
+        "output_artifacts",
+        "metadata_properties",
+        "metrics",
+        "lineage_group_arn",
+        "sources",
+    )
+    _shape = "DescribeTrialComponentResponse"
+
+
+class DisassociateTrialComponentRequestView(ShapeView):
+    """Read-only view of DisassociateTrialComponentRequest, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "trial_name",
+    )
+    _shape = "DisassociateTrialComponentRequest"
+
+
+class DisassociateTrialComponentResponseView(ShapeView):
+    """Read-only view of DisassociateTrialComponentResponse, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_arn",
+        "trial_arn",
+    )
+    _shape = "DisassociateTrialComponentResponse"
+
+
+class ListTrialComponentsRequestView(ShapeView):
+    """Read-only view of ListTrialComponentsRequest, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "trial_name",
+        "source_arn",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListTrialComponentsRequest"
+
+
+class ListTrialComponentsResponseView(ShapeView):
+    """Read-only view of ListTrialComponentsResponse, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_summaries",
+        "next_token",
+    )
+    _shape = "ListTrialComponentsResponse"
+
+
+class TrialComponentArtifactView(ShapeView):
+    """Read-only view of TrialComponentArtifact, see ShapeView."""
+
+    __slots__ = (
+        "media_type",
+        "value",
+    )
+    _shape = "TrialComponentArtifact"
+
+
+class TrialComponentMetricSummaryView(ShapeView):
+    """Read-only view of TrialComponentMetricSummary, see ShapeView."""
+
+    __slots__ = (
+        "metric_name",
+        "source_arn",
+        "time_stamp",
+        "max",
+        "min",
+        "last",
+        "count",
+        "avg",
+        "std_dev",
+    )
+    _shape = "TrialComponentMetricSummary"
+
+
+class TrialComponentParameterValueView(ShapeView):
+    """Read-only view of TrialComponentParameterValue, see ShapeView."""
+
+    __slots__ = (
+        "string_value",
+        "number_value",
+    )
+    _shape = "TrialComponentParameterValue"
+
+
+class TrialComponentSourceView(ShapeView):
+    """Read-only view of TrialComponentSource, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "source_type",
+    )
+    _shape = "TrialComponentSource"
+
+
+class TrialComponentStatusView(ShapeView):
+    """Read-only view of TrialComponentStatus, see ShapeView."""
+
+    __slots__ = (
+        "primary_status",
+        "message",
+    )
+    _shape = "TrialComponentStatus"
+
+
+class TrialComponentSummaryView(ShapeView):
+    """Read-only view of TrialComponentSummary, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "trial_component_arn",
+        "display_name",
+        "trial_component_source",
+        "status",
+        "start_time",
+        "end_time",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+    )
+    _shape = "TrialComponentSummary"
+
+
+class UpdateTrialComponentRequestView(ShapeView):
+    """Read-only view of UpdateTrialComponentRequest, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "display_name",
+        "status",
+        "start_time",
+        "end_time",
+        "parameters",
+        "parameters_to_remove",
+        "input_artifacts",
+        "input_artifacts_to_remove",
+        "output_artifacts",
+        "output_artifacts_to_remove",
+    )
+    _shape = "UpdateTrialComponentRequest"
+
+
+class UpdateTrialComponentResponseView(ShapeView):
+    """Read-only view of UpdateTrialComponentResponse, see ShapeView."""
+
+    __slots__ = ("trial_component_arn",)
+    _shape = "UpdateTrialComponentResponse"
@@ -0,0 +1,142 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AsyncInferenceClientConfigView(ShapeView):
+    """Read-only view of AsyncInferenceClientConfig, see ShapeView."""
+
+    __slots__ = ("max_concurrent_invocations_per_instance",)
+    _shape = "AsyncInferenceClientConfig"
+
+
+class AsyncInferenceConfigView(ShapeView):
+    """Read-only view of AsyncInferenceConfig, see ShapeView."""
+
+    __slots__ = (
+        "client_config",
+        "output_config",
+    )
+    _shape = "AsyncInferenceConfig"
+
+
+class AsyncInferenceNotificationConfigView(ShapeView):
+    """Read-only view of AsyncInferenceNotificationConfig, see ShapeView."""
+
+    __slots__ = (
+        "success_topic",
+        "error_topic",
+        "include_inference_response_in",
+    )
+    _shape = "AsyncInferenceNotificationConfig"
+
+
+class AsyncInferenceOutputConfigView(ShapeView):
+    """Read-only view of AsyncInferenceOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "kms_key_id",
+        "s3_output_path",
+        "notification_config",
+        "s3_failure_path",
+    )
+    _shape = "AsyncInferenceOutputConfig"
+
+
+class ClarifyExplainerConfigView(ShapeView):
+    """Read-only view of ClarifyExplainerConfig, see ShapeView."""
+
+    __slots__ = (
+        "enable_explanations",
+        "inference_config",
+        "shap_config",
+    )
+    _shape = "ClarifyExplainerConfig"
+
+
+class ClarifyInferenceConfigView(ShapeView):
+    """Read-only view of ClarifyInferenceConfig, see ShapeView."""
+
+    __slots__ = (
+        "features_attribute",
+        "content_template",
+        "max_record_count",
+        "max_payload_in_m_b",
+        "probability_index",
+        "label_index",
+        "probability_attribute",
+        "label_attribute",
+        "label_headers",
+        "feature_headers",
+        "feature_types",
+    )
+    _shape = "ClarifyInferenceConfig"
+
+
+class ClarifyShapBaselineConfigView(ShapeView):
+    """Read-only view of ClarifyShapBaselineConfig, see ShapeView."""
+
+    __slots__ = (
+        "mime_type",
+        "shap_baseline",
+        "shap_baseline_uri",
+    )
+    _shape = "ClarifyShapBaselineConfig"
+
+
+class ClarifyShapConfigView(ShapeView):
+    """Read-only view of ClarifyShapConfig, see ShapeView."""
+
+    __slots__ = (
+        "shap_baseline_config",
+        "number_of_samples",
+        "use_logit",
+        "seed",
+        "text_config",
+    )
+    _shape = "ClarifyShapConfig"
+
+
+class ClarifyTextConfigView(ShapeView):
+    """Read-only view of ClarifyTextConfig, see ShapeView."""
+
+    __slots__ = (
+        "language",
+        "granularity",
+    )
+    _shape = "ClarifyTextConfig"
+
+
+class ExplainerConfigView(ShapeView):
+    """Read-only view of ExplainerConfig, see ShapeView."""
+
+    __slots__ = ("clarify_explainer_config",)
+    _shape = "ExplainerConfig"
+
+
+class ProductionVariantManagedInstanceScalingView(ShapeView):
+    """Read-only view of ProductionVariantManagedInstanceScaling, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "min_instance_count",
+        "max_instance_count",
+    )
+    _shape = "ProductionVariantManagedInstanceScaling"
+
+
+class ProductionVariantRoutingConfigView(ShapeView):
+    """Read-only view of ProductionVariantRoutingConfig, see ShapeView."""
+
+    __slots__ = ("routing_strategy",)
+    _shape = "ProductionVariantRoutingConfig"
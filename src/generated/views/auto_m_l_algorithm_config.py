@@ -0,0 +1,204 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AutoMLAlgorithmConfigView(ShapeView):
+    """Read-only view of AutoMLAlgorithmConfig, see ShapeView."""
+
+    __slots__ = ("auto_m_l_algorithms",)
+    _shape = "AutoMLAlgorithmConfig"
+
+
+class AutoMLCandidateView(ShapeView):
+    """Read-only view of AutoMLCandidate, see ShapeView."""
+
+    __slots__ = (
+        "candidate_name",
+        "final_auto_m_l_job_objective_metric",
+        "objective_status",
+        "candidate_steps",
+        "candidate_status",
+        "inference_containers",
+        "creation_time",
+        "end_time",
+        "last_modified_time",
+        "failure_reason",
+        "candidate_properties",
+        "inference_container_definitions",
+    )
+    _shape = "AutoMLCandidate"
+
+
+class AutoMLCandidateStepView(ShapeView):
+    """Read-only view of AutoMLCandidateStep, see ShapeView."""
+
+    __slots__ = (
+        "candidate_step_type",
+        "candidate_step_arn",
+        "candidate_step_name",
+    )
+    _shape = "AutoMLCandidateStep"
+
+
+class AutoMLContainerDefinitionView(ShapeView):
+    """Read-only view of AutoMLContainerDefinition, see ShapeView."""
+
+    __slots__ = (
+        "image",
+        "model_data_url",
+        "environment",
+    )
+    _shape = "AutoMLContainerDefinition"
+
+
+class AutoMLDataSourceView(ShapeView):
+    """Read-only view of AutoMLDataSource, see ShapeView."""
+
+    __slots__ = ("s3_data_source",)
+    _shape = "AutoMLDataSource"
+
+
+class AutoMLDataSplitConfigView(ShapeView):
+    """Read-only view of AutoMLDataSplitConfig, see ShapeView."""
+
+    __slots__ = ("validation_fraction",)
+    _shape = "AutoMLDataSplitConfig"
+
+
+class AutoMLJobArtifactsView(ShapeView):
+    """Read-only view of AutoMLJobArtifacts, see ShapeView."""
+
+    __slots__ = (
+        "candidate_definition_notebook_location",
+        "data_exploration_notebook_location",
+    )
+    _shape = "AutoMLJobArtifacts"
+
+
+class AutoMLJobCompletionCriteriaView(ShapeView):
+    """Read-only view of AutoMLJobCompletionCriteria, see ShapeView."""
+
+    __slots__ = (
+        "max_candidates",
+        "max_runtime_per_training_job_in_seconds",
+        "max_auto_m_l_job_runtime_in_seconds",
+    )
+    _shape = "AutoMLJobCompletionCriteria"
+
+
+class AutoMLJobObjectiveView(ShapeView):
+    """Read-only view of AutoMLJobObjective, see ShapeView."""
+
+    __slots__ = ("metric_name",)
+    _shape = "AutoMLJobObjective"
+
+
+class AutoMLOutputDataConfigView(ShapeView):
+    """Read-only view of AutoMLOutputDataConfig, see ShapeView."""
+
+    __slots__ = (
+        "kms_key_id",
+        "s3_output_path",
+    )
+    _shape = "AutoMLOutputDataConfig"
+
+
+class AutoMLPartialFailureReasonView(ShapeView):
+    """Read-only view of AutoMLPartialFailureReason, see ShapeView."""
+
+    __slots__ = ("partial_failure_message",)
+    _shape = "AutoMLPartialFailureReason"
+
+
+class AutoMLS3DataSourceView(ShapeView):
+    """Read-only view of AutoMLS3DataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_data_type",
+        "s3_uri",
+    )
+    _shape = "AutoMLS3DataSource"
+
+
+class AutoMLSecurityConfigView(ShapeView):
+    """Read-only view of AutoMLSecurityConfig, see ShapeView."""
+
+    __slots__ = (
+        "volume_kms_key_id",
+        "enable_inter_container_traffic_encryption",
+        "vpc_config",
+    )
+    _shape = "AutoMLSecurityConfig"
+
+
+class CandidateArtifactLocationsView(ShapeView):
+    """Read-only view of CandidateArtifactLocations, see ShapeView."""
+
+    __slots__ = (
+        "explainability",
+        "model_insights",
+        "backtest_results",
+    )
+    _shape = "CandidateArtifactLocations"
+
+
+class CandidatePropertiesView(ShapeView):
+    """Read-only view of CandidateProperties, see ShapeView."""
+
+    __slots__ = (
+        "candidate_artifact_locations",
+        "candidate_metrics",
+    )
+    _shape = "CandidateProperties"
+
+
+class FinalAutoMLJobObjectiveMetricView(ShapeView):
+    """Read-only view of FinalAutoMLJobObjectiveMetric, see ShapeView."""
+
+    __slots__ = (
+        "type",
+        "metric_name",
+        "value",
+        "standard_metric_name",
+    )
+    _shape = "FinalAutoMLJobObjectiveMetric"
+
+
+class MetricDatumView(ShapeView):
+    """Read-only view of MetricDatum, see ShapeView."""
+
+    __slots__ = (
+        "metric_name",
+        "value",
+        "set",
+        "standard_metric_name",
+    )
+    _shape = "MetricDatum"
+
+
+class ModelDeployConfigView(ShapeView):
+    """Read-only view of ModelDeployConfig, see ShapeView."""
+
+    __slots__ = (
+        "auto_generate_endpoint_name",
+        "endpoint_name",
+    )
+    _shape = "ModelDeployConfig"
+
+
+class ModelDeployResultView(ShapeView):
+    """Read-only view of ModelDeployResult, see ShapeView."""
+
+    __slots__ = ("endpoint_name",)
+    _shape = "ModelDeployResult"
@@ -0,0 +1,199 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AutoMLCandidateGenerationConfigView(ShapeView):
+    """Read-only view of AutoMLCandidateGenerationConfig, see ShapeView."""
+
+    __slots__ = (
+        "feature_specification_s3_uri",
+        "algorithms_config",
+    )
+    _shape = "AutoMLCandidateGenerationConfig"
+
+
+class AutoMLChannelView(ShapeView):
+    """Read-only view of AutoMLChannel, see ShapeView."""
+
+    __slots__ = (
+        "data_source",
+        "compression_type",
+        "target_attribute_name",
+        "content_type",
+        "channel_type",
+        "sample_weight_attribute_name",
+    )
+    _shape = "AutoMLChannel"
+
+
+class AutoMLJobConfigView(ShapeView):
+    """Read-only view of AutoMLJobConfig, see ShapeView."""
+
+    __slots__ = (
+        "completion_criteria",
+        "security_config",
+        "candidate_generation_config",
+        "data_split_config",
+        "mode",
+    )
+    _shape = "AutoMLJobConfig"
+
+
+class AutoMLJobSummaryView(ShapeView):
+    """Read-only view of AutoMLJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_name",
+        "auto_m_l_job_arn",
+        "auto_m_l_job_status",
+        "auto_m_l_job_secondary_status",
+        "creation_time",
+        "end_time",
+        "last_modified_time",
+        "failure_reason",
+        "partial_failure_reasons",
+    )
+    _shape = "AutoMLJobSummary"
+
+
+class CreateAutoMLJobRequestView(ShapeView):
+    """Read-only view of CreateAutoMLJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_name",
+        "input_data_config",
+        "output_data_config",
+        "problem_type",
+        "auto_m_l_job_objective",
+        "auto_m_l_job_config",
+        "role_arn",
+        "generate_candidate_definitions_only",
+        "tags",
+        "model_deploy_config",
+    )
+    _shape = "CreateAutoMLJobRequest"
+
+
+class CreateAutoMLJobResponseView(ShapeView):
+    """Read-only view of CreateAutoMLJobResponse, see ShapeView."""
+
+    __slots__ = ("auto_m_l_job_arn",)
+    _shape = "CreateAutoMLJobResponse"
+
+
+class DescribeAutoMLJobRequestView(ShapeView):
+    """Read-only view of DescribeAutoMLJobRequest, see ShapeView."""
+
+    __slots__ = ("auto_m_l_job_name",)
+    _shape = "DescribeAutoMLJobRequest"
+
+
+class DescribeAutoMLJobResponseView(ShapeView):
+    """Read-only view of DescribeAutoMLJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_name",
+        "auto_m_l_job_arn",
+        "input_data_config",
+        "output_data_config",
+        "role_arn",
+        "auto_m_l_job_objective",
+        "problem_type",
+        "auto_m_l_job_config",
+        "creation_time",
+        "end_time",
+        "last_modified_time",
+        "failure_reason",
+        "partial_failure_reasons",
+        "best_candidate",
+        "auto_m_l_job_status",
+        "auto_m_l_job_secondary_status",
+        "generate_candidate_definitions_only",
+        "auto_m_l_job_artifacts",
+        "resolved_attributes",
+        "model_deploy_config",
+        "model_deploy_result",
+    )
+    _shape = "DescribeAutoMLJobResponse"
+
+
+class ListAutoMLJobsRequestView(ShapeView):
+    """Read-only view of ListAutoMLJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "status_equals",
+        "sort_order",
+        "sort_by",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListAutoMLJobsRequest"
+
+
+class ListAutoMLJobsResponseView(ShapeView):
+    """Read-only view of ListAutoMLJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_summaries",
+        "next_token",
+    )
+    _shape = "ListAutoMLJobsResponse"
+
+
+class ListCandidatesForAutoMLJobRequestView(ShapeView):
+    """Read-only view of ListCandidatesForAutoMLJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_name",
+        "status_equals",
+        "candidate_name_equals",
+        "sort_order",
+        "sort_by",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListCandidatesForAutoMLJobRequest"
+
+
+class ListCandidatesForAutoMLJobResponseView(ShapeView):
+    """Read-only view of ListCandidatesForAutoMLJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "candidates",
+        "next_token",
+    )
+    _shape = "ListCandidatesForAutoMLJobResponse"
+
+
+class ResolvedAttributesView(ShapeView):
+    """Read-only view of ResolvedAttributes, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_objective",
+        "problem_type",
+        "completion_criteria",
+    )
+    _shape = "ResolvedAttributes"
+
+
+class StopAutoMLJobRequestView(ShapeView):
+    """Read-only view of StopAutoMLJobRequest, see ShapeView."""
+
+    __slots__ = ("auto_m_l_job_name",)
+    _shape = "StopAutoMLJobRequest"
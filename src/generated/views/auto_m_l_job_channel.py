@@ -0,0 +1,233 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AutoMLJobChannelView(ShapeView):
+    """Read-only view of AutoMLJobChannel, see ShapeView."""
+
+    __slots__ = (
+        "channel_type",
+        "content_type",
+        "compression_type",
+        "data_source",
+    )
+    _shape = "AutoMLJobChannel"
+
+
+class AutoMLProblemTypeConfigView(ShapeView):
+    """Read-only view of AutoMLProblemTypeConfig, see ShapeView."""
+
+    __slots__ = (
+        "image_classification_job_config",
+        "text_classification_job_config",
+        "time_series_forecasting_job_config",
+        "tabular_job_config",
+        "text_generation_job_config",
+    )
+    _shape = "AutoMLProblemTypeConfig"
+
+
+class AutoMLProblemTypeResolvedAttributesView(ShapeView):
+    """Read-only view of AutoMLProblemTypeResolvedAttributes, see ShapeView."""
+
+    __slots__ = (
+        "tabular_resolved_attributes",
+        "text_generation_resolved_attributes",
+    )
+    _shape = "AutoMLProblemTypeResolvedAttributes"
+
+
+class AutoMLResolvedAttributesView(ShapeView):
+    """Read-only view of AutoMLResolvedAttributes, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_objective",
+        "completion_criteria",
+        "auto_m_l_problem_type_resolved_attributes",
+    )
+    _shape = "AutoMLResolvedAttributes"
+
+
+class CandidateGenerationConfigView(ShapeView):
+    """Read-only view of CandidateGenerationConfig, see ShapeView."""
+
+    __slots__ = ("algorithms_config",)
+    _shape = "CandidateGenerationConfig"
+
+
+class CreateAutoMLJobV2RequestView(ShapeView):
+    """Read-only view of CreateAutoMLJobV2Request, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_name",
+        "auto_m_l_job_input_data_config",
+        "output_data_config",
+        "auto_m_l_problem_type_config",
+        "role_arn",
+        "tags",
+        "security_config",
+        "auto_m_l_job_objective",
+        "model_deploy_config",
+        "data_split_config",
+    )
+    _shape = "CreateAutoMLJobV2Request"
+
+
+class CreateAutoMLJobV2ResponseView(ShapeView):
+    """Read-only view of CreateAutoMLJobV2Response, see ShapeView."""
+
+    __slots__ = ("auto_m_l_job_arn",)
+    _shape = "CreateAutoMLJobV2Response"
+
+
+class DescribeAutoMLJobV2RequestView(ShapeView):
+    """Read-only view of DescribeAutoMLJobV2Request, see ShapeView."""
+
+    __slots__ = ("auto_m_l_job_name",)
+    _shape = "DescribeAutoMLJobV2Request"
+
+
+class DescribeAutoMLJobV2ResponseView(ShapeView):
+    """Read-only view of DescribeAutoMLJobV2Response, see ShapeView."""
+
+    __slots__ = (
+        "auto_m_l_job_name",
+        "auto_m_l_job_arn",
+        "auto_m_l_job_input_data_config",
+        "output_data_config",
+        "role_arn",
+        "auto_m_l_job_objective",
+        "auto_m_l_problem_type_config",
+        "auto_m_l_problem_type_config_name",
+        "creation_time",
+        "end_time",
+        "last_modified_time",
+        "failure_reason",
+        "partial_failure_reasons",
+        "best_candidate",
+        "auto_m_l_job_status",
+        "auto_m_l_job_secondary_status",
+        "auto_m_l_job_artifacts",
+        "resolved_attributes",
+        "model_deploy_config",
+        "model_deploy_result",
+        "data_split_config",
+        "security_config",
+    )
+    _shape = "DescribeAutoMLJobV2Response"
+
+
+class HolidayConfigAttributesView(ShapeView):
+    """Read-only view of HolidayConfigAttributes, see ShapeView."""
+
+    __slots__ = ("country_code",)
+    _shape = "HolidayConfigAttributes"
+
+
+class ImageClassificationJobConfigView(ShapeView):
+    """Read-only view of ImageClassificationJobConfig, see ShapeView."""
+
+    __slots__ = ("completion_criteria",)
+    _shape = "ImageClassificationJobConfig"
+
+
+class TabularJobConfigView(ShapeView):
+    """Read-only view of TabularJobConfig, see ShapeView."""
+
+    __slots__ = (
+        "candidate_generation_config",
+        "completion_criteria",
+        "feature_specification_s3_uri",
+        "mode",
+        "generate_candidate_definitions_only",
+        "problem_type",
+        "target_attribute_name",
+        "sample_weight_attribute_name",
+    )
+    _shape = "TabularJobConfig"
+
+
+class TabularResolvedAttributesView(ShapeView):
+    """Read-only view of TabularResolvedAttributes, see ShapeView."""
+
+    __slots__ = ("problem_type",)
+    _shape = "TabularResolvedAttributes"
+
+
+class TextClassificationJobConfigView(ShapeView):
+    """Read-only view of TextClassificationJobConfig, see ShapeView."""
+
+    __slots__ = (
+        "completion_criteria",
+        "content_column",
+        "target_label_column",
+    )
+    _shape = "TextClassificationJobConfig"
+
+
+class TextGenerationJobConfigView(ShapeView):
+    """Read-only view of TextGenerationJobConfig, see ShapeView."""
+
+    __slots__ = (
+        "completion_criteria",
+        "base_model_name",
+        "text_generation_hyper_parameters",
+        "model_access_config",
+    )
+    _shape = "TextGenerationJobConfig"
+
+
+class TextGenerationResolvedAttributesView(ShapeView):
+    """Read-only view of TextGenerationResolvedAttributes, see ShapeView."""
+
+    __slots__ = ("base_model_name",)
+    _shape = "TextGenerationResolvedAttributes"
+
+
+class TimeSeriesConfigView(ShapeView):
+    """Read-only view of TimeSeriesConfig, see ShapeView."""
+
+    __slots__ = (
+        "target_attribute_name",
+        "timestamp_attribute_name",
+        "item_identifier_attribute_name",
+        "grouping_attribute_names",
+    )
+    _shape = "TimeSeriesConfig"
+
+
+class TimeSeriesForecastingJobConfigView(ShapeView):
+    """Read-only view of TimeSeriesForecastingJobConfig, see ShapeView."""
+
+    __slots__ = (
+        "feature_specification_s3_uri",
+        "completion_criteria",
+        "forecast_frequency",
+        "forecast_horizon",
+        "forecast_quantiles",
+        "transformations",
+        "time_series_config",
+        "holiday_config",
+    )
+    _shape = "TimeSeriesForecastingJobConfig"
+
+
+class TimeSeriesTransformationsView(ShapeView):
+    """Read-only view of TimeSeriesTransformations, see ShapeView."""
+
+    __slots__ = (
+        "filling",
+        "aggregation",
+    )
+    _shape = "TimeSeriesTransformations"
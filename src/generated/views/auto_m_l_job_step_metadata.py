@@ -0,0 +1,220 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AutoMLJobStepMetadataView(ShapeView):
+    """Read-only view of AutoMLJobStepMetadata, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "AutoMLJobStepMetadata"
+
+
+class CacheHitResultView(ShapeView):
+    """Read-only view of CacheHitResult, see ShapeView."""
+
+    __slots__ = ("source_pipeline_execution_arn",)
+    _shape = "CacheHitResult"
+
+
+class CallbackStepMetadataView(ShapeView):
+    """Read-only view of CallbackStepMetadata, see ShapeView."""
+
+    __slots__ = (
+        "callback_token",
+        "sqs_queue_url",
+        "output_parameters",
+    )
+    _shape = "CallbackStepMetadata"
+
+
+class ClarifyCheckStepMetadataView(ShapeView):
+    """Read-only view of ClarifyCheckStepMetadata, see ShapeView."""
+
+    __slots__ = (
+        "check_type",
+        "baseline_used_for_drift_check_constraints",
+        "calculated_baseline_constraints",
+        "model_package_group_name",
+        "violation_report",
+        "check_job_arn",
+        "skip_check",
+        "register_new_baseline",
+    )
+    _shape = "ClarifyCheckStepMetadata"
+
+
+class ConditionStepMetadataView(ShapeView):
+    """Read-only view of ConditionStepMetadata, see ShapeView."""
+
+    __slots__ = ("outcome",)
+    _shape = "ConditionStepMetadata"
+
+
+class EMRStepMetadataView(ShapeView):
+    """Read-only view of EMRStepMetadata, see ShapeView."""
+
+    __slots__ = (
+        "cluster_id",
+        "step_id",
+        "step_name",
+        "log_file_path",
+    )
+    _shape = "EMRStepMetadata"
+
+
+class FailStepMetadataView(ShapeView):
+    """Read-only view of FailStepMetadata, see ShapeView."""
+
+    __slots__ = ("error_message",)
+    _shape = "FailStepMetadata"
+
+
+class LambdaStepMetadataView(ShapeView):
+    """Read-only view of LambdaStepMetadata, see ShapeView."""
+
+    __slots__ = (
+        "arn",
+        "output_parameters",
+    )
+    _shape = "LambdaStepMetadata"
+
+
+class ListPipelineExecutionStepsRequestView(ShapeView):
+    """Read-only view of ListPipelineExecutionStepsRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_arn",
+        "next_token",
+        "max_results",
+        "sort_order",
+    )
+    _shape = "ListPipelineExecutionStepsRequest"
+
+
+class ListPipelineExecutionStepsResponseView(ShapeView):
+    """Read-only view of ListPipelineExecutionStepsResponse, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_steps",
+        "next_token",
+    )
+    _shape = "ListPipelineExecutionStepsResponse"
+
+
+class ModelStepMetadataView(ShapeView):
+    """Read-only view of ModelStepMetadata, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "ModelStepMetadata"
+
+
+class PipelineExecutionStepView(ShapeView):
+    """Read-only view of PipelineExecutionStep, see ShapeView."""
+
+    __slots__ = (
+        "step_name",
+        "step_display_name",
+        "step_description",
+        "start_time",
+        "end_time",
+        "step_status",
+        "cache_hit_result",
+        "failure_reason",
+        "metadata",
+        "attempt_count",
+        "selective_execution_result",
+    )
+    _shape = "PipelineExecutionStep"
+
+
+class PipelineExecutionStepMetadataView(ShapeView):
+    """Read-only view of PipelineExecutionStepMetadata, see ShapeView."""
+
+    __slots__ = (
+        "training_job",
+        "processing_job",
+        "transform_job",
+        "tuning_job",
+        "model",
+        "register_model",
+        "condition",
+        "callback",
+        "lambda",
+        "e_m_r",
+        "quality_check",
+        "clarify_check",
+        "fail",
+        "auto_m_l_job",
+    )
+    _shape = "PipelineExecutionStepMetadata"
+
+
+class ProcessingJobStepMetadataView(ShapeView):
+    """Read-only view of ProcessingJobStepMetadata, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "ProcessingJobStepMetadata"
+
+
+class QualityCheckStepMetadataView(ShapeView):
+    """Read-only view of QualityCheckStepMetadata, see ShapeView."""
+
+    __slots__ = (
+        "check_type",
+        "baseline_used_for_drift_check_statistics",
+        "baseline_used_for_drift_check_constraints",
+        "calculated_baseline_statistics",
+        "calculated_baseline_constraints",
+        "model_package_group_name",
+        "violation_report",
+        "check_job_arn",
+        "skip_check",
+        "register_new_baseline",
+    )
+    _shape = "QualityCheckStepMetadata"
+
+
+class RegisterModelStepMetadataView(ShapeView):
+    """Read-only view of RegisterModelStepMetadata, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "RegisterModelStepMetadata"
+
+
+class SelectiveExecutionResultView(ShapeView):
+    """Read-only view of SelectiveExecutionResult, see ShapeView."""
+
+    __slots__ = ("source_pipeline_execution_arn",)
+    _shape = "SelectiveExecutionResult"
+
+
+class TrainingJobStepMetadataView(ShapeView):
+    """Read-only view of TrainingJobStepMetadata, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "TrainingJobStepMetadata"
+
+
+class TransformJobStepMetadataView(ShapeView):
+    """Read-only view of TransformJobStepMetadata, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "TransformJobStepMetadata"
+
+
+class TuningJobStepMetaDataView(ShapeView):
+    """Read-only view of TuningJobStepMetaData, see ShapeView."""
+
+    __slots__ = ("arn",)
+    _shape = "TuningJobStepMetaData"
@@ -0,0 +1,436 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class AutoParameterView(ShapeView):
+    """Read-only view of AutoParameter, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "value_hint",
+    )
+    _shape = "AutoParameter"
+
+
+class AutotuneView(ShapeView):
+    """Read-only view of Autotune, see ShapeView."""
+
+    __slots__ = ("mode",)
+    _shape = "Autotune"
+
+
+class BestObjectiveNotImprovingView(ShapeView):
+    """Read-only view of BestObjectiveNotImproving, see ShapeView."""
+
+    __slots__ = ("max_number_of_training_jobs_not_improving",)
+    _shape = "BestObjectiveNotImproving"
+
+
+class CategoricalParameterRangeView(ShapeView):
+    """Read-only view of CategoricalParameterRange, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "values",
+    )
+    _shape = "CategoricalParameterRange"
+
+
+class ContinuousParameterRangeView(ShapeView):
+    """Read-only view of ContinuousParameterRange, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "min_value",
+        "max_value",
+        "scaling_type",
+    )
+    _shape = "ContinuousParameterRange"
+
+
+class ConvergenceDetectedView(ShapeView):
+    """Read-only view of ConvergenceDetected, see ShapeView."""
+
+    __slots__ = ("complete_on_convergence",)
+    _shape = "ConvergenceDetected"
+
+
+class CreateHyperParameterTuningJobRequestView(ShapeView):
+    """Read-only view of CreateHyperParameterTuningJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "hyper_parameter_tuning_job_name",
+        "hyper_parameter_tuning_job_config",
+        "training_job_definition",
+        "training_job_definitions",
+        "warm_start_config",
+        "tags",
+        "autotune",
+    )
+    _shape = "CreateHyperParameterTuningJobRequest"
+
+
+class CreateHyperParameterTuningJobResponseView(ShapeView):
+    """Read-only view of CreateHyperParameterTuningJobResponse, see ShapeView."""
+
+    __slots__ = ("hyper_parameter_tuning_job_arn",)
+    _shape = "CreateHyperParameterTuningJobResponse"
+
+
+class DeleteHyperParameterTuningJobRequestView(ShapeView):
+    """Read-only view of DeleteHyperParameterTuningJobRequest, see ShapeView."""
+
+    __slots__ = ("hyper_parameter_tuning_job_name",)
+    _shape = "DeleteHyperParameterTuningJobRequest"
+
+
+class DescribeHyperParameterTuningJobRequestView(ShapeView):
+    """Read-only view of DescribeHyperParameterTuningJobRequest, see ShapeView."""
+
+    __slots__ = ("hyper_parameter_tuning_job_name",)
+    _shape = "DescribeHyperParameterTuningJobRequest"
+
+
+class DescribeHyperParameterTuningJobResponseView(ShapeView):
+    """Read-only view of DescribeHyperParameterTuningJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "hyper_parameter_tuning_job_name",
+        "hyper_parameter_tuning_job_arn",
+        "hyper_parameter_tuning_job_config",
+        "training_job_definition",
+        "training_job_definitions",
+        "hyper_parameter_tuning_job_status",
+        "creation_time",
+        "hyper_parameter_tuning_end_time",
+        "last_modified_time",
+        "training_job_status_counters",
+        "objective_status_counters",
+        "best_training_job",
+        "overall_best_training_job",
+        "warm_start_config",
+        "autotune",
+        "failure_reason",
+        "tuning_job_completion_details",
+        "consumed_resources",
+    )
+    _shape = "DescribeHyperParameterTuningJobResponse"
+
+
+class FinalHyperParameterTuningJobObjectiveMetricView(ShapeView):
+    """Read-only view of FinalHyperParameterTuningJobObjectiveMetric, see ShapeView."""
+
+    __slots__ = (
+        "type",
+        "metric_name",
+        "value",
+    )
+    _shape = "FinalHyperParameterTuningJobObjectiveMetric"
+
+
+class HyperParameterAlgorithmSpecificationView(ShapeView):
+    """Read-only view of HyperParameterAlgorithmSpecification, see ShapeView."""
+
+    __slots__ = (
+        "training_image",
+        "training_input_mode",
+        "algorithm_name",
+        "metric_definitions",
+    )
+    _shape = "HyperParameterAlgorithmSpecification"
+
+
+class HyperParameterTrainingJobDefinitionView(ShapeView):
+    """Read-only view of HyperParameterTrainingJobDefinition, see ShapeView."""
+
+    __slots__ = (
+        "definition_name",
+        "tuning_objective",
+        "hyper_parameter_ranges",
+        "static_hyper_parameters",
+        "algorithm_specification",
+        "role_arn",
+        "input_data_config",
+        "vpc_config",
+        "output_data_config",
+        "resource_config",
+        "hyper_parameter_tuning_resource_config",
+        "stopping_condition",
+        "enable_network_isolation",
+        "enable_inter_container_traffic_encryption",
+        "enable_managed_spot_training",
+        "checkpoint_config",
+        "retry_strategy",
+        "environment",
+    )
+    _shape = "HyperParameterTrainingJobDefinition"
+
+
+class HyperParameterTrainingJobSummaryView(ShapeView):
+    """Read-only view of HyperParameterTrainingJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "training_job_definition_name",
+        "training_job_name",
+        "training_job_arn",
+        "tuning_job_name",
+        "creation_time",
+        "training_start_time",
+        "training_end_time",
+        "training_job_status",
+        "tuned_hyper_parameters",
+        "failure_reason",
+        "final_hyper_parameter_tuning_job_objective_metric",
+        "objective_status",
+    )
+    _shape = "HyperParameterTrainingJobSummary"
+
+
+class HyperParameterTuningInstanceConfigView(ShapeView):
+    """Read-only view of HyperParameterTuningInstanceConfig, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "instance_count",
+        "volume_size_in_g_b",
+    )
+    _shape = "HyperParameterTuningInstanceConfig"
+
+
+class HyperParameterTuningJobCompletionDetailsView(ShapeView):
+    """Read-only view of HyperParameterTuningJobCompletionDetails, see ShapeView."""
+
+    __slots__ = (
+        "number_of_training_jobs_objective_not_improving",
+        "convergence_detected_time",
+    )
+    _shape = "HyperParameterTuningJobCompletionDetails"
+
+
+class HyperParameterTuningJobConfigView(ShapeView):
+    """Read-only view of HyperParameterTuningJobConfig, see ShapeView."""
+
+    __slots__ = (
+        "strategy",
+        "strategy_config",
+        "hyper_parameter_tuning_job_objective",
+        "resource_limits",
+        "parameter_ranges",
+        "training_job_early_stopping_type",
+        "tuning_job_completion_criteria",
+        "random_seed",
+    )
+    _shape = "HyperParameterTuningJobConfig"
+
+
+class HyperParameterTuningJobConsumedResourcesView(ShapeView):
+    """Read-only view of HyperParameterTuningJobConsumedResources, see ShapeView."""
+
+    __slots__ = ("runtime_in_seconds",)
+    _shape = "HyperParameterTuningJobConsumedResources"
+
+
+class HyperParameterTuningJobStrategyConfigView(ShapeView):
+    """Read-only view of HyperParameterTuningJobStrategyConfig, see ShapeView."""
+
+    __slots__ = ("hyperband_strategy_config",)
+    _shape = "HyperParameterTuningJobStrategyConfig"
+
+
+class HyperParameterTuningJobSummaryView(ShapeView):
+    """Read-only view of HyperParameterTuningJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "hyper_parameter_tuning_job_name",
+        "hyper_parameter_tuning_job_arn",
+        "hyper_parameter_tuning_job_status",
+        "strategy",
+        "creation_time",
+        "hyper_parameter_tuning_end_time",
+        "last_modified_time",
+        "training_job_status_counters",
+        "objective_status_counters",
+        "resource_limits",
+    )
+    _shape = "HyperParameterTuningJobSummary"
+
+
+class HyperParameterTuningJobWarmStartConfigView(ShapeView):
+    """Read-only view of HyperParameterTuningJobWarmStartConfig, see ShapeView."""
+
+    __slots__ = (
+        "parent_hyper_parameter_tuning_jobs",
+        "warm_start_type",
+    )
+    _shape = "HyperParameterTuningJobWarmStartConfig"
+
+
+class HyperParameterTuningResourceConfigView(ShapeView):
+    """Read-only view of HyperParameterTuningResourceConfig, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "instance_count",
+        "volume_size_in_g_b",
+        "volume_kms_key_id",
+        "allocation_strategy",
+        "instance_configs",
+    )
+    _shape = "HyperParameterTuningResourceConfig"
+
+
+class HyperbandStrategyConfigView(ShapeView):
+    """Read-only view of HyperbandStrategyConfig, see ShapeView."""
+
+    __slots__ = (
+        "min_resource",
+        "max_resource",
+    )
+    _shape = "HyperbandStrategyConfig"
+
+
+class IntegerParameterRangeView(ShapeView):
+    """Read-only view of IntegerParameterRange, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "min_value",
+        "max_value",
+        "scaling_type",
+    )
+    _shape = "IntegerParameterRange"
+
+
+class ListHyperParameterTuningJobsRequestView(ShapeView):
+    """Read-only view of ListHyperParameterTuningJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "sort_by",
+        "sort_order",
+        "name_contains",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "status_equals",
+    )
+    _shape = "ListHyperParameterTuningJobsRequest"
+
+
+class ListHyperParameterTuningJobsResponseView(ShapeView):
+    """Read-only view of ListHyperParameterTuningJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "hyper_parameter_tuning_job_summaries",
+        "next_token",
+    )
+    _shape = "ListHyperParameterTuningJobsResponse"
+
+
+class ListTrainingJobsForHyperParameterTuningJobRequestView(ShapeView):
+    """Read-only view of ListTrainingJobsForHyperParameterTuningJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "hyper_parameter_tuning_job_name",
+        "next_token",
+        "max_results",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListTrainingJobsForHyperParameterTuningJobRequest"
+
+
+class ListTrainingJobsForHyperParameterTuningJobResponseView(ShapeView):
+    """Read-only view of ListTrainingJobsForHyperParameterTuningJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "training_job_summaries",
+        "next_token",
+    )
+    _shape = "ListTrainingJobsForHyperParameterTuningJobResponse"
+
+
+class ObjectiveStatusCountersView(ShapeView):
+    """Read-only view of ObjectiveStatusCounters, see ShapeView."""
+
+    __slots__ = (
+        "succeeded",
+        "pending",
+        "failed",
+    )
+    _shape = "ObjectiveStatusCounters"
+
+
+class ParameterRangesView(ShapeView):
+    """Read-only view of ParameterRanges, see ShapeView."""
+
+    __slots__ = (
+        "integer_parameter_ranges",
+        "continuous_parameter_ranges",
+        "categorical_parameter_ranges",
+        "auto_parameters",
+    )
+    _shape = "ParameterRanges"
+
+
+class ParentHyperParameterTuningJobView(ShapeView):
+    """Read-only view of ParentHyperParameterTuningJob, see ShapeView."""
+
+    __slots__ = ("hyper_parameter_tuning_job_name",)
+    _shape = "ParentHyperParameterTuningJob"
+
+
+class ResourceLimitsView(ShapeView):
+    """Read-only view of ResourceLimits, see ShapeView."""
+
+    __slots__ = (
+        "max_number_of_training_jobs",
+        "max_parallel_training_jobs",
+        "max_runtime_in_seconds",
+    )
+    _shape = "ResourceLimits"
+
+
+class StopHyperParameterTuningJobRequestView(ShapeView):
+    """Read-only view of StopHyperParameterTuningJobRequest, see ShapeView."""
+
+    __slots__ = ("hyper_parameter_tuning_job_name",)
+    _shape = "StopHyperParameterTuningJobRequest"
+
+
+class TrainingJobStatusCountersView(ShapeView):
+    """Read-only view of TrainingJobStatusCounters, see ShapeView."""
+
+    __slots__ = (
+        "completed",
+        "in_progress",
+        "retryable_error",
+        "non_retryable_error",
+        "stopped",
+    )
+    _shape = "TrainingJobStatusCounters"
+
+
+class TuningJobCompletionCriteriaView(ShapeView):
+    """Read-only view of TuningJobCompletionCriteria, see ShapeView."""
+
+    __slots__ = (
+        "target_objective_metric_value",
+        "best_objective_not_improving",
+        "convergence_detected",
+    )
+    _shape = "TuningJobCompletionCriteria"
@@ -0,0 +1,160 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class BatchDataCaptureConfigView(ShapeView):
+    """Read-only view of BatchDataCaptureConfig, see ShapeView."""
+
+    __slots__ = (
+        "destination_s3_uri",
+        "kms_key_id",
+        "generate_inference_id",
+    )
+    _shape = "BatchDataCaptureConfig"
+
+
+class CreateTransformJobRequestView(ShapeView):
+    """Read-only view of CreateTransformJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "transform_job_name",
+        "model_name",
+        "max_concurrent_transforms",
+        "model_client_config",
+        "max_payload_in_m_b",
+        "batch_strategy",
+        "environment",
+        "transform_input",
+        "transform_output",
+        "data_capture_config",
+        "transform_resources",
+        "data_processing",
+        "tags",
+        "experiment_config",
+    )
+    _shape = "CreateTransformJobRequest"
+
+
+class CreateTransformJobResponseView(ShapeView):
+    """Read-only view of CreateTransformJobResponse, see ShapeView."""
+
+    __slots__ = ("transform_job_arn",)
+    _shape = "CreateTransformJobResponse"
+
+
+class DataProcessingView(ShapeView):
+    """Read-only view of DataProcessing, see ShapeView."""
+
+    __slots__ = (
+        "input_filter",
+        "output_filter",
+        "join_source",
+    )
+    _shape = "DataProcessing"
+
+
+class DescribeTransformJobRequestView(ShapeView):
+    """Read-only view of DescribeTransformJobRequest, see ShapeView."""
+
+    __slots__ = ("transform_job_name",)
+    _shape = "DescribeTransformJobRequest"
+
+
+class DescribeTransformJobResponseView(ShapeView):
+    """Read-only view of DescribeTransformJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "transform_job_name",
+        "transform_job_arn",
+        "transform_job_status",
+        "failure_reason",
+        "model_name",
+        "max_concurrent_transforms",
+        "model_client_config",
+        "max_payload_in_m_b",
+        "batch_strategy",
+        "environment",
+        "transform_input",
+        "transform_output",
+        "data_capture_config",
+        "transform_resources",
+        "creation_time",
+        "transform_start_time",
+        "transform_end_time",
+        "labeling_job_arn",
+        "auto_m_l_job_arn",
+        "data_processing",
+        "experiment_config",
+    )
+    _shape = "DescribeTransformJobResponse"
+
+
+class ListTransformJobsRequestView(ShapeView):
+    """Read-only view of ListTransformJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListTransformJobsRequest"
+
+
+class ListTransformJobsResponseView(ShapeView):
+    """Read-only view of ListTransformJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "transform_job_summaries",
+        "next_token",
+    )
+    _shape = "ListTransformJobsResponse"
+
+
+class ModelClientConfigView(ShapeView):
+    """Read-only view of ModelClientConfig, see ShapeView."""
+
+    __slots__ = (
+        "invocations_timeout_in_seconds",
+        "invocations_max_retries",
+    )
+    _shape = "ModelClientConfig"
+
+
+class StopTransformJobRequestView(ShapeView):
+    """Read-only view of StopTransformJobRequest, see ShapeView."""
+
+    __slots__ = ("transform_job_name",)
+    _shape = "StopTransformJobRequest"
+
+
+class TransformJobSummaryView(ShapeView):
+    """Read-only view of TransformJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "transform_job_name",
+        "transform_job_arn",
+        "creation_time",
+        "transform_end_time",
+        "last_modified_time",
+        "transform_job_status",
+        "failure_reason",
+    )
+    _shape = "TransformJobSummary"
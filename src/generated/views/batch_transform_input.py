@@ -0,0 +1,145 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class BatchTransformInputView(ShapeView):
+    """Read-only view of BatchTransformInput, see ShapeView."""
+
+    __slots__ = (
+        "data_captured_destination_s3_uri",
+        "dataset_format",
+        "local_path",
+        "s3_input_mode",
+        "s3_data_distribution_type",
+        "features_attribute",
+        "inference_attribute",
+        "probability_attribute",
+        "probability_threshold_attribute",
+        "start_time_offset",
+        "end_time_offset",
+        "exclude_features_attribute",
+    )
+    _shape = "BatchTransformInput"
+
+
+class EndpointInputView(ShapeView):
+    """Read-only view of EndpointInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "local_path",
+        "s3_input_mode",
+        "s3_data_distribution_type",
+        "features_attribute",
+        "inference_attribute",
+        "probability_attribute",
+        "probability_threshold_attribute",
+        "start_time_offset",
+        "end_time_offset",
+        "exclude_features_attribute",
+    )
+    _shape = "EndpointInput"
+
+
+class MonitoringClusterConfigView(ShapeView):
+    """Read-only view of MonitoringClusterConfig, see ShapeView."""
+
+    __slots__ = (
+        "instance_count",
+        "instance_type",
+        "volume_size_in_g_b",
+        "volume_kms_key_id",
+    )
+    _shape = "MonitoringClusterConfig"
+
+
+class MonitoringConstraintsResourceView(ShapeView):
+    """Read-only view of MonitoringConstraintsResource, see ShapeView."""
+
+    __slots__ = ("s3_uri",)
+    _shape = "MonitoringConstraintsResource"
+
+
+class MonitoringCsvDatasetFormatView(ShapeView):
+    """Read-only view of MonitoringCsvDatasetFormat, see ShapeView."""
+
+    __slots__ = ("header",)
+    _shape = "MonitoringCsvDatasetFormat"
+
+
+class MonitoringDatasetFormatView(ShapeView):
+    """Read-only view of MonitoringDatasetFormat, see ShapeView."""
+
+    __slots__ = (
+        "csv",
+        "json",
+        "parquet",
+    )
+    _shape = "MonitoringDatasetFormat"
+
+
+class MonitoringJsonDatasetFormatView(ShapeView):
+    """Read-only view of MonitoringJsonDatasetFormat, see ShapeView."""
+
+    __slots__ = ("line",)
+    _shape = "MonitoringJsonDatasetFormat"
+
+
+class MonitoringOutputView(ShapeView):
+    """Read-only view of MonitoringOutput, see ShapeView."""
+
+    __slots__ = ("s3_output",)
+    _shape = "MonitoringOutput"
+
+
+class MonitoringOutputConfigView(ShapeView):
+    """Read-only view of MonitoringOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_outputs",
+        "kms_key_id",
+    )
+    _shape = "MonitoringOutputConfig"
+
+
+class MonitoringParquetDatasetFormatView(ShapeView):
+    """Read-only view of MonitoringParquetDatasetFormat, see ShapeView."""
+
+    __slots__ = ()
+    _shape = "MonitoringParquetDatasetFormat"
+
+
+class MonitoringResourcesView(ShapeView):
+    """Read-only view of MonitoringResources, see ShapeView."""
+
+    __slots__ = ("cluster_config",)
+    _shape = "MonitoringResources"
+
+
+class MonitoringS3OutputView(ShapeView):
+    """Read-only view of MonitoringS3Output, see ShapeView."""
+
+    __slots__ = (
+        "s3_uri",
+        "local_path",
+        "s3_upload_mode",
+    )
+    _shape = "MonitoringS3Output"
+
+
+class MonitoringStoppingConditionView(ShapeView):
+    """Read-only view of MonitoringStoppingCondition, see ShapeView."""
+
+    __slots__ = ("max_runtime_in_seconds",)
+    _shape = "MonitoringStoppingCondition"
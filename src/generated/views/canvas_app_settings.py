@@ -0,0 +1,218 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CanvasAppSettingsView(ShapeView):
+    """Read-only view of CanvasAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "time_series_forecasting_settings",
+        "model_register_settings",
+        "workspace_settings",
+        "identity_provider_o_auth_settings",
+        "direct_deploy_settings",
+        "kendra_settings",
+        "generative_ai_settings",
+    )
+    _shape = "CanvasAppSettings"
+
+
+class CodeEditorAppSettingsView(ShapeView):
+    """Read-only view of CodeEditorAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_resource_spec",
+        "lifecycle_config_arns",
+    )
+    _shape = "CodeEditorAppSettings"
+
+
+class CustomFileSystemConfigView(ShapeView):
+    """Read-only view of CustomFileSystemConfig, see ShapeView."""
+
+    __slots__ = ("e_f_s_file_system_config",)
+    _shape = "CustomFileSystemConfig"
+
+
+class CustomPosixUserConfigView(ShapeView):
+    """Read-only view of CustomPosixUserConfig, see ShapeView."""
+
+    __slots__ = (
+        "uid",
+        "gid",
+    )
+    _shape = "CustomPosixUserConfig"
+
+
+class DefaultEbsStorageSettingsView(ShapeView):
+    """Read-only view of DefaultEbsStorageSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_ebs_volume_size_in_gb",
+        "maximum_ebs_volume_size_in_gb",
+    )
+    _shape = "DefaultEbsStorageSettings"
+
+
+class DefaultSpaceStorageSettingsView(ShapeView):
+    """Read-only view of DefaultSpaceStorageSettings, see ShapeView."""
+
+    __slots__ = ("default_ebs_storage_settings",)
+    _shape = "DefaultSpaceStorageSettings"
+
+
+class DirectDeploySettingsView(ShapeView):
+    """Read-only view of DirectDeploySettings, see ShapeView."""
+
+    __slots__ = ("status",)
+    _shape = "DirectDeploySettings"
+
+
+class EFSFileSystemConfigView(ShapeView):
+    """Read-only view of EFSFileSystemConfig, see ShapeView."""
+
+    __slots__ = (
+        "file_system_id",
+        "file_system_path",
+    )
+    _shape = "EFSFileSystemConfig"
+
+
+class GenerativeAiSettingsView(ShapeView):
+    """Read-only view of GenerativeAiSettings, see ShapeView."""
+
+    __slots__ = ("amazon_bedrock_role_arn",)
+    _shape = "GenerativeAiSettings"
+
+
+class IdentityProviderOAuthSettingView(ShapeView):
+    """Read-only view of IdentityProviderOAuthSetting, see ShapeView."""
+
+    __slots__ = (
+        "data_source_name",
+        "status",
+        "secret_arn",
+    )
+    _shape = "IdentityProviderOAuthSetting"
+
+
+class JupyterLabAppSettingsView(ShapeView):
+    """Read-only view of JupyterLabAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_resource_spec",
+        "custom_images",
+        "lifecycle_config_arns",
+        "code_repositories",
+    )
+    _shape = "JupyterLabAppSettings"
+
+
+class KendraSettingsView(ShapeView):
+    """Read-only view of KendraSettings, see ShapeView."""
+
+    __slots__ = ("status",)
+    _shape = "KendraSettings"
+
+
+class ModelRegisterSettingsView(ShapeView):
+    """Read-only view of ModelRegisterSettings, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "cross_account_model_register_role_arn",
+    )
+    _shape = "ModelRegisterSettings"
+
+
+class RSessionAppSettingsView(ShapeView):
+    """Read-only view of RSessionAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_resource_spec",
+        "custom_images",
+    )
+    _shape = "RSessionAppSettings"
+
+
+class RStudioServerProAppSettingsView(ShapeView):
+    """Read-only view of RStudioServerProAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "access_status",
+        "user_group",
+    )
+    _shape = "RStudioServerProAppSettings"
+
+
+class SharingSettingsView(ShapeView):
+    """Read-only view of SharingSettings, see ShapeView."""
+
+    __slots__ = (
+        "notebook_output_option",
+        "s3_output_path",
+        "s3_kms_key_id",
+    )
+    _shape = "SharingSettings"
+
+
+class TensorBoardAppSettingsView(ShapeView):
+    """Read-only view of TensorBoardAppSettings, see ShapeView."""
+
+    __slots__ = ("default_resource_spec",)
+    _shape = "TensorBoardAppSettings"
+
+
+class TimeSeriesForecastingSettingsView(ShapeView):
+    """Read-only view of TimeSeriesForecastingSettings, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "amazon_forecast_role_arn",
+    )
+    _shape = "TimeSeriesForecastingSettings"
+
+
+class UserSettingsView(ShapeView):
+    """Read-only view of UserSettings, see ShapeView."""
+
+    __slots__ = (
+        "execution_role",
+        "security_groups",
+        "sharing_settings",
+        "jupyter_server_app_settings",
+        "kernel_gateway_app_settings",
+        "tensor_board_app_settings",
+        "r_studio_server_pro_app_settings",
+        "r_session_app_settings",
+        "canvas_app_settings",
+        "code_editor_app_settings",
+        "jupyter_lab_app_settings",
+        "space_storage_settings",
+        "default_landing_uri",
+        "studio_web_portal",
+        "custom_posix_user_config",
+        "custom_file_system_configs",
+    )
+    _shape = "UserSettings"
+
+
+class WorkspaceSettingsView(ShapeView):
+    """Read-only view of WorkspaceSettings, see ShapeView."""
+
+    __slots__ = (
+        "s3_artifact_path",
+        "s3_kms_key_id",
+    )
+    _shape = "WorkspaceSettings"
@@ -0,0 +1,162 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CaptureOptionView(ShapeView):
+    """Read-only view of CaptureOption, see ShapeView."""
+
+    __slots__ = ("capture_mode",)
+    _shape = "CaptureOption"
+
+
+class CreateEndpointConfigInputView(ShapeView):
+    """Read-only view of CreateEndpointConfigInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_config_name",
+        "production_variants",
+        "data_capture_config",
+        "tags",
+        "kms_key_id",
+        "async_inference_config",
+        "explainer_config",
+        "shadow_production_variants",
+        "execution_role_arn",
+        "vpc_config",
+        "enable_network_isolation",
+    )
+    _shape = "CreateEndpointConfigInput"
+
+
+class CreateEndpointConfigOutputView(ShapeView):
+    """Read-only view of CreateEndpointConfigOutput, see ShapeView."""
+
+    __slots__ = ("endpoint_config_arn",)
+    _shape = "CreateEndpointConfigOutput"
+
+
+class DataCaptureConfigView(ShapeView):
+    """Read-only view of DataCaptureConfig, see ShapeView."""
+
+    __slots__ = (
+        "enable_capture",
+        "initial_sampling_percentage",
+        "destination_s3_uri",
+        "kms_key_id",
+        "capture_options",
+        "capture_content_type_header",
+    )
+    _shape = "DataCaptureConfig"
+
+
+class DeleteEndpointConfigInputView(ShapeView):
+    """Read-only view of DeleteEndpointConfigInput, see ShapeView."""
+
+    __slots__ = ("endpoint_config_name",)
+    _shape = "DeleteEndpointConfigInput"
+
+
+class DescribeEndpointConfigInputView(ShapeView):
+    """Read-only view of DescribeEndpointConfigInput, see ShapeView."""
+
+    __slots__ = ("endpoint_config_name",)
+    _shape = "DescribeEndpointConfigInput"
+
+
+class DescribeEndpointConfigOutputView(ShapeView):
+    """Read-only view of DescribeEndpointConfigOutput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_config_name",
+        "endpoint_config_arn",
+        "production_variants",
+        "data_capture_config",
+        "kms_key_id",
+        "creation_time",
+        "async_inference_config",
+        "explainer_config",
+        "shadow_production_variants",
+        "execution_role_arn",
+        "vpc_config",
+        "enable_network_isolation",
+    )
+    _shape = "DescribeEndpointConfigOutput"
+
+
+class EndpointConfigSummaryView(ShapeView):
+    """Read-only view of EndpointConfigSummary, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_config_name",
+        "endpoint_config_arn",
+        "creation_time",
+    )
+    _shape = "EndpointConfigSummary"
+
+
+class ListEndpointConfigsInputView(ShapeView):
+    """Read-only view of ListEndpointConfigsInput, see ShapeView."""
+
+    __slots__ = (
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+    )
+    _shape = "ListEndpointConfigsInput"
+
+
+class ListEndpointConfigsOutputView(ShapeView):
+    """Read-only view of ListEndpointConfigsOutput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_configs",
+        "next_token",
+    )
+    _shape = "ListEndpointConfigsOutput"
+
+
+class ProductionVariantView(ShapeView):
+    """Read-only view of ProductionVariant, see ShapeView."""
+
+    __slots__ = (
+        "variant_name",
+        "model_name",
+        "initial_instance_count",
+        "instance_type",
+        "initial_variant_weight",
+        "accelerator_type",
+        "core_dump_config",
+        "serverless_config",
+        "volume_size_in_g_b",
+        "model_data_download_timeout_in_seconds",
+        "container_startup_health_check_timeout_in_seconds",
+        "enable_s_s_m_access",
+        "managed_instance_scaling",
+        "routing_config",
+    )
+    _shape = "ProductionVariant"
+
+
+class ProductionVariantCoreDumpConfigView(ShapeView):
+    """Read-only view of ProductionVariantCoreDumpConfig, see ShapeView."""
+
+    __slots__ = (
+        "destination_s3_uri",
+        "kms_key_id",
+    )
+    _shape = "ProductionVariantCoreDumpConfig"
@@ -0,0 +1,380 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CategoricalParameterView(ShapeView):
+    """Read-only view of CategoricalParameter, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "value",
+    )
+    _shape = "CategoricalParameter"
+
+
+class CreateInferenceRecommendationsJobRequestView(ShapeView):
+    """Read-only view of CreateInferenceRecommendationsJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "job_name",
+        "job_type",
+        "role_arn",
+        "input_config",
+        "job_description",
+        "stopping_conditions",
+        "output_config",
+        "tags",
+    )
+    _shape = "CreateInferenceRecommendationsJobRequest"
+
+
+class CreateInferenceRecommendationsJobResponseView(ShapeView):
+    """Read-only view of CreateInferenceRecommendationsJobResponse, see ShapeView."""
+
+    __slots__ = ("job_arn",)
+    _shape = "CreateInferenceRecommendationsJobResponse"
+
+
+class DescribeInferenceRecommendationsJobRequestView(ShapeView):
+    """Read-only view of DescribeInferenceRecommendationsJobRequest, see ShapeView."""
+
+    __slots__ = ("job_name",)
+    _shape = "DescribeInferenceRecommendationsJobRequest"
+
+
+class DescribeInferenceRecommendationsJobResponseView(ShapeView):
+    """Read-only view of DescribeInferenceRecommendationsJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_name",
+        "job_description",
+        "job_type",
+        "job_arn",
+        "role_arn",
+        "status",
+        "creation_time",
+        "completion_time",
+        "last_modified_time",
+        "failure_reason",
+        "input_config",
+        "stopping_conditions",
+        "inference_recommendations",
+        "endpoint_performances",
+    )
+    _shape = "DescribeInferenceRecommendationsJobResponse"
+
+
+class EndpointInfoView(ShapeView):
+    """Read-only view of EndpointInfo, see ShapeView."""
+
+    __slots__ = ("endpoint_name",)
+    _shape = "EndpointInfo"
+
+
+class EndpointInputConfigurationView(ShapeView):
+    """Read-only view of EndpointInputConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "serverless_config",
+        "inference_specification_name",
+        "environment_parameter_ranges",
+    )
+    _shape = "EndpointInputConfiguration"
+
+
+class EndpointOutputConfigurationView(ShapeView):
+    """Read-only view of EndpointOutputConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "variant_name",
+        "instance_type",
+        "initial_instance_count",
+        "serverless_config",
+    )
+    _shape = "EndpointOutputConfiguration"
+
+
+class EndpointPerformanceView(ShapeView):
+    """Read-only view of EndpointPerformance, see ShapeView."""
+
+    __slots__ = (
+        "metrics",
+        "endpoint_info",
+    )
+    _shape = "EndpointPerformance"
+
+
+class EnvironmentParameterView(ShapeView):
+    """Read-only view of EnvironmentParameter, see ShapeView."""
+
+    __slots__ = (
+        "key",
+        "value_type",
+        "value",
+    )
+    _shape = "EnvironmentParameter"
+
+
+class EnvironmentParameterRangesView(ShapeView):
+    """Read-only view of EnvironmentParameterRanges, see ShapeView."""
+
+    __slots__ = ("categorical_parameter_ranges",)
+    _shape = "EnvironmentParameterRanges"
+
+
+class InferenceMetricsView(ShapeView):
+    """Read-only view of InferenceMetrics, see ShapeView."""
+
+    __slots__ = (
+        "max_invocations",
+        "model_latency",
+    )
+    _shape = "InferenceMetrics"
+
+
+class InferenceRecommendationView(ShapeView):
+    """Read-only view of InferenceRecommendation, see ShapeView."""
+
+    __slots__ = (
+        "recommendation_id",
+        "metrics",
+        "endpoint_configuration",
+        "model_configuration",
+        "invocation_end_time",
+        "invocation_start_time",
+    )
+    _shape = "InferenceRecommendation"
+
+
+class InferenceRecommendationsJobView(ShapeView):
+    """Read-only view of InferenceRecommendationsJob, see ShapeView."""
+
+    __slots__ = (
+        "job_name",
+        "job_description",
+        "job_type",
+        "job_arn",
+        "status",
+        "creation_time",
+        "completion_time",
+        "role_arn",
+        "last_modified_time",
+        "failure_reason",
+        "model_name",
+        "sample_payload_url",
+        "model_package_version_arn",
+    )
+    _shape = "InferenceRecommendationsJob"
+
+
+class ListInferenceRecommendationsJobsRequestView(ShapeView):
+    """Read-only view of ListInferenceRecommendationsJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "model_name_equals",
+        "model_package_version_arn_equals",
+    )
+    _shape = "ListInferenceRecommendationsJobsRequest"
+
+
+class ListInferenceRecommendationsJobsResponseView(ShapeView):
+    """Read-only view of ListInferenceRecommendationsJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "inference_recommendations_jobs",
+        "next_token",
+    )
+    _shape = "ListInferenceRecommendationsJobsResponse"
+
+
+class ModelConfigurationView(ShapeView):
+    """Read-only view of ModelConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "inference_specification_name",
+        "environment_parameters",
+        "compilation_job_name",
+    )
+    _shape = "ModelConfiguration"
+
+
+class ModelLatencyThresholdView(ShapeView):
+    """Read-only view of ModelLatencyThreshold, see ShapeView."""
+
+    __slots__ = (
+        "percentile",
+        "value_in_milliseconds",
+    )
+    _shape = "ModelLatencyThreshold"
+
+
+class PhaseView(ShapeView):
+    """Read-only view of Phase, see ShapeView."""
+
+    __slots__ = (
+        "initial_number_of_users",
+        "spawn_rate",
+        "duration_in_seconds",
+    )
+    _shape = "Phase"
+
+
+class RecommendationJobCompiledOutputConfigView(ShapeView):
+    """Read-only view of RecommendationJobCompiledOutputConfig, see ShapeView."""
+
+    __slots__ = ("s3_output_uri",)
+    _shape = "RecommendationJobCompiledOutputConfig"
+
+
+class RecommendationJobContainerConfigView(ShapeView):
+    """Read-only view of RecommendationJobContainerConfig, see ShapeView."""
+
+    __slots__ = (
+        "domain",
+        "task",
+        "framework",
+        "framework_version",
+        "payload_config",
+        "nearest_model_name",
+        "supported_instance_types",
+        "supported_endpoint_type",
+        "data_input_config",
+        "supported_response_m_i_m_e_types",
+    )
+    _shape = "RecommendationJobContainerConfig"
+
+
+class RecommendationJobInputConfigView(ShapeView):
+    """Read-only view of RecommendationJobInputConfig, see ShapeView."""
+
+    __slots__ = (
+        "model_package_version_arn",
+        "model_name",
+        "job_duration_in_seconds",
+        "traffic_pattern",
+        "resource_limit",
+        "endpoint_configurations",
+        "volume_kms_key_id",
+        "container_config",
+        "endpoints",
+        "vpc_config",
+    )
+    _shape = "RecommendationJobInputConfig"
+
+
+class RecommendationJobOutputConfigView(ShapeView):
+    """Read-only view of RecommendationJobOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "kms_key_id",
+        "compiled_output_config",
+    )
+    _shape = "RecommendationJobOutputConfig"
+
+
+class RecommendationJobPayloadConfigView(ShapeView):
+    """Read-only view of RecommendationJobPayloadConfig, see ShapeView."""
+
+    __slots__ = (
+        "sample_payload_url",
+        "supported_content_types",
+    )
+    _shape = "RecommendationJobPayloadConfig"
+
+
+class RecommendationJobResourceLimitView(ShapeView):
+    """Read-only view of RecommendationJobResourceLimit, see ShapeView."""
+
+    __slots__ = (
+        "max_number_of_tests",
+        "max_parallel_of_tests",
+    )
+    _shape = "RecommendationJobResourceLimit"
+
+
+class RecommendationJobStoppingConditionsView(ShapeView):
+    """Read-only view of RecommendationJobStoppingConditions, see ShapeView."""
+
+    __slots__ = (
+        "max_invocations",
+        "model_latency_thresholds",
+        "flat_invocations",
+    )
+    _shape = "RecommendationJobStoppingConditions"
+
+
+class RecommendationJobVpcConfigView(ShapeView):
+    """Read-only view of RecommendationJobVpcConfig, see ShapeView."""
+
+    __slots__ = (
+        "security_group_ids",
+        "subnets",
+    )
+    _shape = "RecommendationJobVpcConfig"
+
+
+class RecommendationMetricsView(ShapeView):
+    """Read-only view of RecommendationMetrics, see ShapeView."""
+
+    __slots__ = (
+        "cost_per_hour",
+        "cost_per_inference",
+        "max_invocations",
+        "model_latency",
+        "cpu_utilization",
+        "memory_utilization",
+        "model_setup_time",
+    )
+    _shape = "RecommendationMetrics"
+
+
+class StairsView(ShapeView):
+    """Read-only view of Stairs, see ShapeView."""
+
+    __slots__ = (
+        "duration_in_seconds",
+        "number_of_steps",
+        "users_per_step",
+    )
+    _shape = "Stairs"
+
+
+class StopInferenceRecommendationsJobRequestView(ShapeView):
+    """Read-only view of StopInferenceRecommendationsJobRequest, see ShapeView."""
+
+    __slots__ = ("job_name",)
+    _shape = "StopInferenceRecommendationsJobRequest"
+
+
+class TrafficPatternView(ShapeView):
+    """Read-only view of TrafficPattern, see ShapeView."""
+
+    __slots__ = (
+        "traffic_type",
+        "phases",
+        "stairs",
+    )
+    _shape = "TrafficPattern"
@@ -0,0 +1,116 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ChannelView(ShapeView):
+    """Read-only view of Channel, see ShapeView."""
+
+    __slots__ = (
+        "channel_name",
+        "data_source",
+        "content_type",
+        "compression_type",
+        "record_wrapper_type",
+        "input_mode",
+        "shuffle_config",
+    )
+    _shape = "Channel"
+
+
+class DataSourceView(ShapeView):
+    """Read-only view of DataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_data_source",
+        "file_system_data_source",
+    )
+    _shape = "DataSource"
+
+
+class FileSystemDataSourceView(ShapeView):
+    """Read-only view of FileSystemDataSource, see ShapeView."""
+
+    __slots__ = (
+        "file_system_id",
+        "file_system_access_mode",
+        "file_system_type",
+        "directory_path",
+    )
+    _shape = "FileSystemDataSource"
+
+
+class InstanceGroupView(ShapeView):
+    """Read-only view of InstanceGroup, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "instance_count",
+        "instance_group_name",
+    )
+    _shape = "InstanceGroup"
+
+
+class MetricDefinitionView(ShapeView):
+    """Read-only view of MetricDefinition, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "regex",
+    )
+    _shape = "MetricDefinition"
+
+
+class OutputDataConfigView(ShapeView):
+    """Read-only view of OutputDataConfig, see ShapeView."""
+
+    __slots__ = (
+        "kms_key_id",
+        "s3_output_path",
+        "compression_type",
+    )
+    _shape = "OutputDataConfig"
+
+
+class ResourceConfigView(ShapeView):
+    """Read-only view of ResourceConfig, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "instance_count",
+        "volume_size_in_g_b",
+        "volume_kms_key_id",
+        "keep_alive_period_in_seconds",
+        "instance_groups",
+    )
+    _shape = "ResourceConfig"
+
+
+class S3DataSourceView(ShapeView):
+    """Read-only view of S3DataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_data_type",
+        "s3_uri",
+        "s3_data_distribution_type",
+        "attribute_names",
+        "instance_group_names",
+    )
+    _shape = "S3DataSource"
+
+
+class ShuffleConfigView(ShapeView):
+    """Read-only view of ShuffleConfig, see ShapeView."""
+
+    __slots__ = ("seed",)
+    _shape = "ShuffleConfig"
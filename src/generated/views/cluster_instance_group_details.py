@@ -0,0 +1,161 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ClusterInstanceGroupDetailsView(ShapeView):
+    """Read-only view of ClusterInstanceGroupDetails, see ShapeView."""
+
+    __slots__ = (
+        "current_count",
+        "target_count",
+        "instance_group_name",
+        "instance_type",
+        "life_cycle_config",
+        "execution_role",
+        "threads_per_core",
+    )
+    _shape = "ClusterInstanceGroupDetails"
+
+
+class ClusterInstanceGroupSpecificationView(ShapeView):
+    """Read-only view of ClusterInstanceGroupSpecification, see ShapeView."""
+
+    __slots__ = (
+        "instance_count",
+        "instance_group_name",
+        "instance_type",
+        "life_cycle_config",
+        "execution_role",
+        "threads_per_core",
+    )
+    _shape = "ClusterInstanceGroupSpecification"
+
+
+class ClusterLifeCycleConfigView(ShapeView):
+    """Read-only view of ClusterLifeCycleConfig, see ShapeView."""
+
+    __slots__ = (
+        "source_s3_uri",
+        "on_create",
+    )
+    _shape = "ClusterLifeCycleConfig"
+
+
+class ClusterSummaryView(ShapeView):
+    """Read-only view of ClusterSummary, see ShapeView."""
+
+    __slots__ = (
+        "cluster_arn",
+        "cluster_name",
+        "creation_time",
+        "cluster_status",
+    )
+    _shape = "ClusterSummary"
+
+
+class CreateClusterRequestView(ShapeView):
+    """Read-only view of CreateClusterRequest, see ShapeView."""
+
+    __slots__ = (
+        "cluster_name",
+        "instance_groups",
+        "vpc_config",
+        "tags",
+    )
+    _shape = "CreateClusterRequest"
+
+
+class CreateClusterResponseView(ShapeView):
+    """Read-only view of CreateClusterResponse, see ShapeView."""
+
+    __slots__ = ("cluster_arn",)
+    _shape = "CreateClusterResponse"
+
+
+class DeleteClusterRequestView(ShapeView):
+    """Read-only view of DeleteClusterRequest, see ShapeView."""
+
+    __slots__ = ("cluster_name",)
+    _shape = "DeleteClusterRequest"
+
+
+class DeleteClusterResponseView(ShapeView):
+    """Read-only view of DeleteClusterResponse, see ShapeView."""
+
+    __slots__ = ("cluster_arn",)
+    _shape = "DeleteClusterResponse"
+
+
+class DescribeClusterRequestView(ShapeView):
+    """Read-only view of DescribeClusterRequest, see ShapeView."""
+
+    __slots__ = ("cluster_name",)
+    _shape = "DescribeClusterRequest"
+
+
+class DescribeClusterResponseView(ShapeView):
+    """Read-only view of DescribeClusterResponse, see ShapeView."""
+
+    __slots__ = (
+        "cluster_arn",
+        "cluster_name",
+        "cluster_status",
+        "creation_time",
+        "failure_message",
+        "instance_groups",
+        "vpc_config",
+    )
+    _shape = "DescribeClusterResponse"
+
+
+class ListClustersRequestView(ShapeView):
+    """Read-only view of ListClustersRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "name_contains",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListClustersRequest"
+
+
+class ListClustersResponseView(ShapeView):
+    """Read-only view of ListClustersResponse, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "cluster_summaries",
+    )
+    _shape = "ListClustersResponse"
+
+
+class UpdateClusterRequestView(ShapeView):
+    """Read-only view of UpdateClusterRequest, see ShapeView."""
+
+    __slots__ = (
+        "cluster_name",
+        "instance_groups",
+    )
+    _shape = "UpdateClusterRequest"
+
+
+class UpdateClusterResponseView(ShapeView):
+    """Read-only view of UpdateClusterResponse, see ShapeView."""
+
+    __slots__ = ("cluster_arn",)
+    _shape = "UpdateClusterResponse"
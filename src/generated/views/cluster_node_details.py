@@ -0,0 +1,45 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ClusterNodeDetailsView(ShapeView):
+    """Read-only view of ClusterNodeDetails, see ShapeView."""
+
+    __slots__ = (
+        "instance_group_name",
+        "instance_id",
+        "instance_status",
+        "instance_type",
+        "launch_time",
+        "life_cycle_config",
+        "threads_per_core",
+    )
+    _shape = "ClusterNodeDetails"
+
+
+class DescribeClusterNodeRequestView(ShapeView):
+    """Read-only view of DescribeClusterNodeRequest, see ShapeView."""
+
+    __slots__ = (
+        "cluster_name",
+        "node_id",
+    )
+    _shape = "DescribeClusterNodeRequest"
+
+
+class DescribeClusterNodeResponseView(ShapeView):
+    """Read-only view of DescribeClusterNodeResponse, see ShapeView."""
+
+    __slots__ = ("node_details",)
+    _shape = "DescribeClusterNodeResponse"
@@ -0,0 +1,52 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ClusterNodeSummaryView(ShapeView):
+    """Read-only view of ClusterNodeSummary, see ShapeView."""
+
+    __slots__ = (
+        "instance_group_name",
+        "instance_id",
+        "instance_type",
+        "launch_time",
+        "instance_status",
+    )
+    _shape = "ClusterNodeSummary"
+
+
+class ListClusterNodesRequestView(ShapeView):
+    """Read-only view of ListClusterNodesRequest, see ShapeView."""
+
+    __slots__ = (
+        "cluster_name",
+        "creation_time_after",
+        "creation_time_before",
+        "instance_group_name_contains",
+        "max_results",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListClusterNodesRequest"
+
+
+class ListClusterNodesResponseView(ShapeView):
+    """Read-only view of ListClusterNodesResponse, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "cluster_node_summaries",
+    )
+    _shape = "ListClusterNodesResponse"
@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CodeRepositoryView(ShapeView):
+    """Read-only view of CodeRepository, see ShapeView."""
+
+    __slots__ = ("repository_url",)
+    _shape = "CodeRepository"
+
+
+class CustomImageView(ShapeView):
+    """Read-only view of CustomImage, see ShapeView."""
+
+    __slots__ = (
+        "image_name",
+        "image_version_number",
+        "app_image_config_name",
+    )
+    _shape = "CustomImage"
+
+
+class JupyterServerAppSettingsView(ShapeView):
+    """Read-only view of JupyterServerAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_resource_spec",
+        "lifecycle_config_arns",
+        "code_repositories",
+    )
+    _shape = "JupyterServerAppSettings"
+
+
+class KernelGatewayAppSettingsView(ShapeView):
+    """Read-only view of KernelGatewayAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_resource_spec",
+        "custom_images",
+        "lifecycle_config_arns",
+    )
+    _shape = "KernelGatewayAppSettings"
@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CodeRepositorySummaryView(ShapeView):
+    """Read-only view of CodeRepositorySummary, see ShapeView."""
+
+    __slots__ = (
+        "code_repository_name",
+        "code_repository_arn",
+        "creation_time",
+        "last_modified_time",
+        "git_config",
+    )
+    _shape = "CodeRepositorySummary"
+
+
+class ListCodeRepositoriesInputView(ShapeView):
+    """Read-only view of ListCodeRepositoriesInput, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "max_results",
+        "name_contains",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListCodeRepositoriesInput"
+
+
+class ListCodeRepositoriesOutputView(ShapeView):
+    """Read-only view of ListCodeRepositoriesOutput, see ShapeView."""
+
+    __slots__ = (
+        "code_repository_summary_list",
+        "next_token",
+    )
+    _shape = "ListCodeRepositoriesOutput"
@@ -0,0 +1,187 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CognitoConfigView(ShapeView):
+    """Read-only view of CognitoConfig, see ShapeView."""
+
+    __slots__ = (
+        "user_pool",
+        "client_id",
+    )
+    _shape = "CognitoConfig"
+
+
+class CreateWorkforceRequestView(ShapeView):
+    """Read-only view of CreateWorkforceRequest, see ShapeView."""
+
+    __slots__ = (
+        "cognito_config",
+        "oidc_config",
+        "source_ip_config",
+        "workforce_name",
+        "tags",
+        "workforce_vpc_config",
+    )
+    _shape = "CreateWorkforceRequest"
+
+
+class CreateWorkforceResponseView(ShapeView):
+    """Read-only view of CreateWorkforceResponse, see ShapeView."""
+
+    __slots__ = ("workforce_arn",)
+    _shape = "CreateWorkforceResponse"
+
+
+class DeleteWorkforceRequestView(ShapeView):
+    """Read-only view of DeleteWorkforceRequest, see ShapeView."""
+
+    __slots__ = ("workforce_name",)
+    _shape = "DeleteWorkforceRequest"
+
+
+class DescribeWorkforceRequestView(ShapeView):
+    """Read-only view of DescribeWorkforceRequest, see ShapeView."""
+
+    __slots__ = ("workforce_name",)
+    _shape = "DescribeWorkforceRequest"
+
+
+class DescribeWorkforceResponseView(ShapeView):
+    """Read-only view of DescribeWorkforceResponse, see ShapeView."""
+
+    __slots__ = ("workforce",)
+    _shape = "DescribeWorkforceResponse"
+
+
+class ListWorkforcesRequestView(ShapeView):
+    """Read-only view of ListWorkforcesRequest, see ShapeView."""
+
+    __slots__ = (
+        "sort_by",
+        "sort_order",
+        "name_contains",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListWorkforcesRequest"
+
+
+class ListWorkforcesResponseView(ShapeView):
+    """Read-only view of ListWorkforcesResponse, see ShapeView."""
+
+    __slots__ = (
+        "workforces",
+        "next_token",
+    )
+    _shape = "ListWorkforcesResponse"
+
+
+class OidcConfigView(ShapeView):
+    """Read-only view of OidcConfig, see ShapeView."""
+
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "issuer",
+        "authorization_endpoint",
+        "token_endpoint",
+        "user_info_endpoint",
+        "logout_endpoint",
+        "jwks_uri",
+    )
+    _shape = "OidcConfig"
+
+
+class OidcConfigForResponseView(ShapeView):
+    """Read-only view of OidcConfigForResponse, see ShapeView."""
+
+    __slots__ = (
+        "client_id",
+        "issuer",
+        "authorization_endpoint",
+        "token_endpoint",
+        "user_info_endpoint",
+        "logout_endpoint",
+        "jwks_uri",
+    )
+    _shape = "OidcConfigForResponse"
+
+
+class SourceIpConfigView(ShapeView):
+    """Read-only view of SourceIpConfig, see ShapeView."""
+
+    __slots__ = ("cidrs",)
+    _shape = "SourceIpConfig"
+
+
+class UpdateWorkforceRequestView(ShapeView):
+    """Read-only view of UpdateWorkforceRequest, see ShapeView."""
+
+    __slots__ = (
+        "workforce_name",
+        "source_ip_config",
+        "oidc_config",
+        "workforce_vpc_config",
+    )
+    _shape = "UpdateWorkforceRequest"
+
+
+class UpdateWorkforceResponseView(ShapeView):
+    """Read-only view of UpdateWorkforceResponse, see ShapeView."""
+
+    __slots__ = ("workforce",)
+    _shape = "UpdateWorkforceResponse"
+
+
+class WorkforceView(ShapeView):
+    """Read-only view of Workforce, see ShapeView."""
+
+    __slots__ = (
+        "workforce_name",
+        "workforce_arn",
+        "last_updated_date",
+        "source_ip_config",
+        "sub_domain",
+        "cognito_config",
+        "oidc_config",
+        "create_date",
+        "workforce_vpc_config",
+        "status",
+        "failure_reason",
+    )
+    _shape = "Workforce"
+
+
+class WorkforceVpcConfigRequestView(ShapeView):
+    """Read-only view of WorkforceVpcConfigRequest, see ShapeView."""
+
+    __slots__ = (
+        "vpc_id",
+        "security_group_ids",
+        "subnets",
+    )
+    _shape = "WorkforceVpcConfigRequest"
+
+
+class WorkforceVpcConfigResponseView(ShapeView):
+    """Read-only view of WorkforceVpcConfigResponse, see ShapeView."""
+
+    __slots__ = (
+        "vpc_id",
+        "security_group_ids",
+        "subnets",
+        "vpc_endpoint_id",
+    )
+    _shape = "WorkforceVpcConfigResponse"
@@ -0,0 +1,256 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CognitoMemberDefinitionView(ShapeView):
+    """Read-only view of CognitoMemberDefinition, see ShapeView."""
+
+    __slots__ = (
+        "user_pool",
+        "user_group",
+        "client_id",
+    )
+    _shape = "CognitoMemberDefinition"
+
+
+class CreateWorkteamRequestView(ShapeView):
+    """Read-only view of CreateWorkteamRequest, see ShapeView."""
+
+    __slots__ = (
+        "workteam_name",
+        "workforce_name",
+        "member_definitions",
+        "description",
+        "notification_configuration",
+        "tags",
+    )
+    _shape = "CreateWorkteamRequest"
+
+
+class CreateWorkteamResponseView(ShapeView):
+    """Read-only view of CreateWorkteamResponse, see ShapeView."""
+
+    __slots__ = ("workteam_arn",)
+    _shape = "CreateWorkteamResponse"
+
+
+class DeleteWorkteamRequestView(ShapeView):
+    """Read-only view of DeleteWorkteamRequest, see ShapeView."""
+
+    __slots__ = ("workteam_name",)
+    _shape = "DeleteWorkteamRequest"
+
+
+class DeleteWorkteamResponseView(ShapeView):
+    """Read-only view of DeleteWorkteamResponse, see ShapeView."""
+
+    __slots__ = ("success",)
+    _shape = "DeleteWorkteamResponse"
+
+
+class DescribeSubscribedWorkteamRequestView(ShapeView):
+    """Read-only view of DescribeSubscribedWorkteamRequest, see ShapeView."""
+
+    __slots__ = ("workteam_arn",)
+    _shape = "DescribeSubscribedWorkteamRequest"
+
+
+class DescribeSubscribedWorkteamResponseView(ShapeView):
+    """Read-only view of DescribeSubscribedWorkteamResponse, see ShapeView."""
+
+    __slots__ = ("subscribed_workteam",)
+    _shape = "DescribeSubscribedWorkteamResponse"
+
+
+class DescribeWorkteamRequestView(ShapeView):
+    """Read-only view of DescribeWorkteamRequest, see ShapeView."""
+
+    __slots__ = ("workteam_name",)
+    _shape = "DescribeWorkteamRequest"
+
+
+class DescribeWorkteamResponseView(ShapeView):
+    """Read-only view of DescribeWorkteamResponse, see ShapeView."""
+
+    __slots__ = ("workteam",)
+    _shape = "DescribeWorkteamResponse"
+
+
+class LabelCountersForWorkteamView(ShapeView):
+    """Read-only view of LabelCountersForWorkteam, see ShapeView."""
+
+    __slots__ = (
+        "human_labeled",
+        "pending_human",
+        "total",
+    )
+    _shape = "LabelCountersForWorkteam"
+
+
+class LabelingJobForWorkteamSummaryView(ShapeView):
+    """Read-only view of LabelingJobForWorkteamSummary, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_name",
+        "job_reference_code",
+        "work_requester_account_id",
+        "creation_time",
+        "label_counters",
+        "number_of_human_workers_per_data_object",
+    )
+    _shape = "LabelingJobForWorkteamSummary"
+
+
+class ListLabelingJobsForWorkteamRequestView(ShapeView):
+    """Read-only view of ListLabelingJobsForWorkteamRequest, see ShapeView."""
+
+    __slots__ = (
+        "workteam_arn",
+        "max_results",
+        "next_token",
+        "creation_time_after",
+        "creation_time_before",
+        "job_reference_code_contains",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListLabelingJobsForWorkteamRequest"
+
+
+class ListLabelingJobsForWorkteamResponseView(ShapeView):
+    """Read-only view of ListLabelingJobsForWorkteamResponse, see ShapeView."""
+
+    __slots__ = (
+        "labeling_job_summary_list",
+        "next_token",
+    )
+    _shape = "ListLabelingJobsForWorkteamResponse"
+
+
+class ListSubscribedWorkteamsRequestView(ShapeView):
+    """Read-only view of ListSubscribedWorkteamsRequest, see ShapeView."""
+
+    __slots__ = (
+        "name_contains",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListSubscribedWorkteamsRequest"
+
+
+class ListSubscribedWorkteamsResponseView(ShapeView):
+    """Read-only view of ListSubscribedWorkteamsResponse, see ShapeView."""
+
+    __slots__ = (
+        "subscribed_workteams",
+        "next_token",
+    )
+    _shape = "ListSubscribedWorkteamsResponse"
+
+
+class ListWorkteamsRequestView(ShapeView):
+    """Read-only view of ListWorkteamsRequest, see ShapeView."""
+
+    __slots__ = (
+        "sort_by",
+        "sort_order",
+        "name_contains",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListWorkteamsRequest"
+
+
+class ListWorkteamsResponseView(ShapeView):
+    """Read-only view of ListWorkteamsResponse, see ShapeView."""
+
+    __slots__ = (
+        "workteams",
+        "next_token",
+    )
+    _shape = "ListWorkteamsResponse"
+
+
+class MemberDefinitionView(ShapeView):
+    """Read-only view of MemberDefinition, see ShapeView."""
+
+    __slots__ = (
+        "cognito_member_definition",
+        "oidc_member_definition",
+    )
+    _shape = "MemberDefinition"
+
+
+class NotificationConfigurationView(ShapeView):
+    """Read-only view of NotificationConfiguration, see ShapeView."""
+
+    __slots__ = ("notification_topic_arn",)
+    _shape = "NotificationConfiguration"
+
+
+class OidcMemberDefinitionView(ShapeView):
+    """Read-only view of OidcMemberDefinition, see ShapeView."""
+
+    __slots__ = ("groups",)
+    _shape = "OidcMemberDefinition"
+
+
+class SubscribedWorkteamView(ShapeView):
+    """Read-only view of SubscribedWorkteam, see ShapeView."""
+
+    __slots__ = (
+        "workteam_arn",
+        "marketplace_title",
+        "seller_name",
+        "marketplace_description",
+        "listing_id",
+    )
+    _shape = "SubscribedWorkteam"
+
+
+class UpdateWorkteamRequestView(ShapeView):
+    """Read-only view of UpdateWorkteamRequest, see ShapeView."""
+
+    __slots__ = (
+        "workteam_name",
+        "member_definitions",
+        "description",
+        "notification_configuration",
+    )
+    _shape = "UpdateWorkteamRequest"
+
+
+class UpdateWorkteamResponseView(ShapeView):
+    """Read-only view of UpdateWorkteamResponse, see ShapeView."""
+
+    __slots__ = ("workteam",)
+    _shape = "UpdateWorkteamResponse"
+
+
+class WorkteamView(ShapeView):
+    """Read-only view of Workteam, see ShapeView."""
+
+    __slots__ = (
+        "workteam_name",
+        "member_definitions",
+        "workteam_arn",
+        "workforce_arn",
+        "product_listing_ids",
+        "description",
+        "sub_domain",
+        "create_date",
+        "last_updated_date",
+        "notification_configuration",
+    )
+    _shape = "Workteam"
@@ -0,0 +1,289 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CollectionConfigView(ShapeView):
+    """Read-only view of CollectionConfig, see ShapeView."""
+
+    __slots__ = ("vector_config",)
+    _shape = "CollectionConfig"
+
+
+class CreateFeatureGroupRequestView(ShapeView):
+    """Read-only view of CreateFeatureGroupRequest, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_name",
+        "record_identifier_feature_name",
+        "event_time_feature_name",
+        "feature_definitions",
+        "online_store_config",
+        "offline_store_config",
+        "throughput_config",
+        "role_arn",
+        "description",
+        "tags",
+    )
+    _shape = "CreateFeatureGroupRequest"
+
+
+class CreateFeatureGroupResponseView(ShapeView):
+    """Read-only view of CreateFeatureGroupResponse, see ShapeView."""
+
+    __slots__ = ("feature_group_arn",)
+    _shape = "CreateFeatureGroupResponse"
+
+
+class DataCatalogConfigView(ShapeView):
+    """Read-only view of DataCatalogConfig, see ShapeView."""
+
+    __slots__ = (
+        "table_name",
+        "catalog",
+        "database",
+    )
+    _shape = "DataCatalogConfig"
+
+
+class DeleteFeatureGroupRequestView(ShapeView):
+    """Read-only view of DeleteFeatureGroupRequest, see ShapeView."""
+
+    __slots__ = ("feature_group_name",)
+    _shape = "DeleteFeatureGroupRequest"
+
+
+class DescribeFeatureGroupRequestView(ShapeView):
+    """Read-only view of DescribeFeatureGroupRequest, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_name",
+        "next_token",
+    )
+    _shape = "DescribeFeatureGroupRequest"
+
+
+class DescribeFeatureGroupResponseView(ShapeView):
+    """Read-only view of DescribeFeatureGroupResponse, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_arn",
+        "feature_group_name",
+        "record_identifier_feature_name",
+        "event_time_feature_name",
+        "feature_definitions",
+        "creation_time",
+        "last_modified_time",
+        "online_store_config",
+        "offline_store_config",
+        "throughput_config",
+        "role_arn",
+        "feature_group_status",
+        "offline_store_status",
+        "last_update_status",
+        "failure_reason",
+        "description",
+        "next_token",
+        "online_store_total_size_bytes",
+    )
+    _shape = "DescribeFeatureGroupResponse"
+
+
+class FeatureDefinitionView(ShapeView):
+    """Read-only view of FeatureDefinition, see ShapeView."""
+
+    __slots__ = (
+        "feature_name",
+        "feature_type",
+        "collection_type",
+        "collection_config",
+    )
+    _shape = "FeatureDefinition"
+
+
+class FeatureGroupSummaryView(ShapeView):
+    """Read-only view of FeatureGroupSummary, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_name",
+        "feature_group_arn",
+        "creation_time",
+        "feature_group_status",
+        "offline_store_status",
+    )
+    _shape = "FeatureGroupSummary"
+
+
+class LastUpdateStatusView(ShapeView):
+    """Read-only view of LastUpdateStatus, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "failure_reason",
+    )
+    _shape = "LastUpdateStatus"
+
+
+class ListFeatureGroupsRequestView(ShapeView):
+    """Read-only view of ListFeatureGroupsRequest, see ShapeView."""
+
+    __slots__ = (
+        "name_contains",
+        "feature_group_status_equals",
+        "offline_store_status_equals",
+        "creation_time_after",
+        "creation_time_before",
+        "sort_order",
+        "sort_by",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListFeatureGroupsRequest"
+
+
+class ListFeatureGroupsResponseView(ShapeView):
+    """Read-only view of ListFeatureGroupsResponse, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_summaries",
+        "next_token",
+    )
+    _shape = "ListFeatureGroupsResponse"
+
+
+class OfflineStoreConfigView(ShapeView):
+    """Read-only view of OfflineStoreConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_storage_config",
+        "disable_glue_table_creation",
+        "data_catalog_config",
+        "table_format",
+    )
+    _shape = "OfflineStoreConfig"
+
+
+class OfflineStoreStatusView(ShapeView):
+    """Read-only view of OfflineStoreStatus, see ShapeView."""
+
+    __slots__ = (
+        "status",
+        "blocked_reason",
+    )
+    _shape = "OfflineStoreStatus"
+
+
+class OnlineStoreConfigView(ShapeView):
+    """Read-only view of OnlineStoreConfig, see ShapeView."""
+
+    __slots__ = (
+        "security_config",
+        "enable_online_store",
+        "ttl_duration",
+        "storage_type",
+    )
+    _shape = "OnlineStoreConfig"
+
+
+class OnlineStoreConfigUpdateView(ShapeView):
+    """Read-only view of OnlineStoreConfigUpdate, see ShapeView."""
+
+    __slots__ = ("ttl_duration",)
+    _shape = "OnlineStoreConfigUpdate"
+
+
+class OnlineStoreSecurityConfigView(ShapeView):
+    """Read-only view of OnlineStoreSecurityConfig, see ShapeView."""
+
+    __slots__ = ("kms_key_id",)
+    _shape = "OnlineStoreSecurityConfig"
+
+
+class S3StorageConfigView(ShapeView):
+    """Read-only view of S3StorageConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_uri",
+        "kms_key_id",
+        "resolved_output_s3_uri",
+    )
+    _shape = "S3StorageConfig"
+
+
+class ThroughputConfigView(ShapeView):
+    """Read-only view of ThroughputConfig, see ShapeView."""
+
+    __slots__ = (
+        "throughput_mode",
+        "provisioned_read_capacity_units",
+        "provisioned_write_capacity_units",
+    )
+    _shape = "ThroughputConfig"
+
+
+class ThroughputConfigDescriptionView(ShapeView):
+    """Read-only view of ThroughputConfigDescription, see ShapeView."""
+
+    __slots__ = (
+        "throughput_mode",
+        "provisioned_read_capacity_units",
+        "provisioned_write_capacity_units",
+    )
+    _shape = "ThroughputConfigDescription"
+
+
+class ThroughputConfigUpdateView(ShapeView):
+    """Read-only view of ThroughputConfigUpdate, see ShapeView."""
+
+    __slots__ = (
+        "throughput_mode",
+        "provisioned_read_capacity_units",
+        "provisioned_write_capacity_units",
+    )
+    _shape = "ThroughputConfigUpdate"
+
+
+class TtlDurationView(ShapeView):
+    """Read-only view of TtlDuration, see ShapeView."""
+
+    __slots__ = (
+        "unit",
+        "value",
+    )
+    _shape = "TtlDuration"
+
+
+class UpdateFeatureGroupRequestView(ShapeView):
+    """Read-only view of UpdateFeatureGroupRequest, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_name",
+        "feature_additions",
+        "online_store_config",
+        "throughput_config",
+    )
+    _shape = "UpdateFeatureGroupRequest"
+
+
+class UpdateFeatureGroupResponseView(ShapeView):
+    """Read-only view of UpdateFeatureGroupResponse, see ShapeView."""
+
+    __slots__ = ("feature_group_arn",)
+    _shape = "UpdateFeatureGroupResponse"
+
+
+class VectorConfigView(ShapeView):
+    """Read-only view of VectorConfig, see ShapeView."""
+
+    __slots__ = ("dimension",)
+    _shape = "VectorConfig"
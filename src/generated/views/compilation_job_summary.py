@@ -0,0 +1,190 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CompilationJobSummaryView(ShapeView):
+    """Read-only view of CompilationJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "compilation_job_name",
+        "compilation_job_arn",
+        "creation_time",
+        "compilation_start_time",
+        "compilation_end_time",
+        "compilation_target_device",
+        "compilation_target_platform_os",
+        "compilation_target_platform_arch",
+        "compilation_target_platform_accelerator",
+        "last_modified_time",
+        "compilation_job_status",
+    )
+    _shape = "CompilationJobSummary"
+
+
+class CreateCompilationJobRequestView(ShapeView):
+    """Read-only view of CreateCompilationJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "compilation_job_name",
+        "role_arn",
+        "model_package_version_arn",
+        "input_config",
+        "output_config",
+        "vpc_config",
+        "stopping_condition",
+        "tags",
+    )
+    _shape = "CreateCompilationJobRequest"
+
+
+class CreateCompilationJobResponseView(ShapeView):
+    """Read-only view of CreateCompilationJobResponse, see ShapeView."""
+
+    __slots__ = ("compilation_job_arn",)
+    _shape = "CreateCompilationJobResponse"
+
+
+class DeleteCompilationJobRequestView(ShapeView):
+    """Read-only view of DeleteCompilationJobRequest, see ShapeView."""
+
+    __slots__ = ("compilation_job_name",)
+    _shape = "DeleteCompilationJobRequest"
+
+
+class DerivedInformationView(ShapeView):
+    """Read-only view of DerivedInformation, see ShapeView."""
+
+    __slots__ = ("derived_data_input_config",)
+    _shape = "DerivedInformation"
+
+
+class DescribeCompilationJobRequestView(ShapeView):
+    """Read-only view of DescribeCompilationJobRequest, see ShapeView."""
+
+    __slots__ = ("compilation_job_name",)
+    _shape = "DescribeCompilationJobRequest"
+
+
+class DescribeCompilationJobResponseView(ShapeView):
+    """Read-only view of DescribeCompilationJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "compilation_job_name",
+        "compilation_job_arn",
+        "compilation_job_status",
+        "compilation_start_time",
+        "compilation_end_time",
+        "stopping_condition",
+        "inference_image",
+        "model_package_version_arn",
+        "creation_time",
+        "last_modified_time",
+        "failure_reason",
+        "model_artifacts",
+        "model_digests",
+        "role_arn",
+        "input_config",
+        "output_config",
+        "vpc_config",
+        "derived_information",
+    )
+    _shape = "DescribeCompilationJobResponse"
+
+
+class InputConfigView(ShapeView):
+    """Read-only view of InputConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_uri",
+        "data_input_config",
+        "framework",
+        "framework_version",
+    )
+    _shape = "InputConfig"
+
+
+class ListCompilationJobsRequestView(ShapeView):
+    """Read-only view of ListCompilationJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListCompilationJobsRequest"
+
+
+class ListCompilationJobsResponseView(ShapeView):
+    """Read-only view of ListCompilationJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "compilation_job_summaries",
+        "next_token",
+    )
+    _shape = "ListCompilationJobsResponse"
+
+
+class ModelDigestsView(ShapeView):
+    """Read-only view of ModelDigests, see ShapeView."""
+
+    __slots__ = ("artifact_digest",)
+    _shape = "ModelDigests"
+
+
+class NeoVpcConfigView(ShapeView):
+    """Read-only view of NeoVpcConfig, see ShapeView."""
+
+    __slots__ = (
+        "security_group_ids",
+        "subnets",
+    )
+    _shape = "NeoVpcConfig"
+
+
+class OutputConfigView(ShapeView):
+    """Read-only view of OutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_output_location",
+        "target_device",
+        "target_platform",
+        "compiler_options",
+        "kms_key_id",
+    )
+    _shape = "OutputConfig"
+
+
+class StopCompilationJobRequestView(ShapeView):
+    """Read-only view of StopCompilationJobRequest, see ShapeView."""
+
+    __slots__ = ("compilation_job_name",)
+    _shape = "StopCompilationJobRequest"
+
+
+class TargetPlatformView(ShapeView):
+    """Read-only view of TargetPlatform, see ShapeView."""
+
+    __slots__ = (
+        "os",
+        "arch",
+        "accelerator",
+    )
+    _shape = "TargetPlatform"
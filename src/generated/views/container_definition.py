@@ -0,0 +1,174 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ContainerDefinitionView(ShapeView):
+    """Read-only view of ContainerDefinition, see ShapeView."""
+
+    __slots__ = (
+        "container_hostname",
+        "image",
+        "image_config",
+        "mode",
+        "model_data_url",
+        "model_data_source",
+        "environment",
+        "model_package_name",
+        "inference_specification_name",
+        "multi_model_config",
+    )
+    _shape = "ContainerDefinition"
+
+
+class CreateModelInputView(ShapeView):
+    """Read-only view of CreateModelInput, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "primary_container",
+        "containers",
+        "inference_execution_config",
+        "execution_role_arn",
+        "tags",
+        "vpc_config",
+        "enable_network_isolation",
+    )
+    _shape = "CreateModelInput"
+
+
+class CreateModelOutputView(ShapeView):
+    """Read-only view of CreateModelOutput, see ShapeView."""
+
+    __slots__ = ("model_arn",)
+    _shape = "CreateModelOutput"
+
+
+class DeleteModelInputView(ShapeView):
+    """Read-only view of DeleteModelInput, see ShapeView."""
+
+    __slots__ = ("model_name",)
+    _shape = "DeleteModelInput"
+
+
+class DeploymentRecommendationView(ShapeView):
+    """Read-only view of DeploymentRecommendation, see ShapeView."""
+
+    __slots__ = (
+        "recommendation_status",
+        "real_time_inference_recommendations",
+    )
+    _shape = "DeploymentRecommendation"
+
+
+class DescribeModelInputView(ShapeView):
+    """Read-only view of DescribeModelInput, see ShapeView."""
+
+    __slots__ = ("model_name",)
+    _shape = "DescribeModelInput"
+
+
+class DescribeModelOutputView(ShapeView):
+    """Read-only view of DescribeModelOutput, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "primary_container",
+        "containers",
+        "inference_execution_config",
+        "execution_role_arn",
+        "vpc_config",
+        "creation_time",
+        "model_arn",
+        "enable_network_isolation",
+        "deployment_recommendation",
+    )
+    _shape = "DescribeModelOutput"
+
+
+class ImageConfigView(ShapeView):
+    """Read-only view of ImageConfig, see ShapeView."""
+
+    __slots__ = (
+        "repository_access_mode",
+        "repository_auth_config",
+    )
+    _shape = "ImageConfig"
+
+
+class InferenceExecutionConfigView(ShapeView):
+    """Read-only view of InferenceExecutionConfig, see ShapeView."""
+
+    __slots__ = ("mode",)
+    _shape = "InferenceExecutionConfig"
+
+
+class ListModelsInputView(ShapeView):
+    """Read-only view of ListModelsInput, see ShapeView."""
+
+    __slots__ = (
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+    )
+    _shape = "ListModelsInput"
+
+
+class ListModelsOutputView(ShapeView):
+    """Read-only view of ListModelsOutput, see ShapeView."""
+
+    __slots__ = (
+        "models",
+        "next_token",
+    )
+    _shape = "ListModelsOutput"
+
+
+class ModelSummaryView(ShapeView):
+    """Read-only view of ModelSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "model_arn",
+        "creation_time",
+    )
+    _shape = "ModelSummary"
+
+
+class MultiModelConfigView(ShapeView):
+    """Read-only view of MultiModelConfig, see ShapeView."""
+
+    __slots__ = ("model_cache_setting",)
+    _shape = "MultiModelConfig"
+
+
+class RealTimeInferenceRecommendationView(ShapeView):
+    """Read-only view of RealTimeInferenceRecommendation, see ShapeView."""
+
+    __slots__ = (
+        "recommendation_id",
+        "instance_type",
+        "environment",
+    )
+    _shape = "RealTimeInferenceRecommendation"
+
+
+class RepositoryAuthConfigView(ShapeView):
+    """Read-only view of RepositoryAuthConfig, see ShapeView."""
+
+    __slots__ = ("repository_credentials_provider_arn",)
+    _shape = "RepositoryAuthConfig"
@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ContextSourceView(ShapeView):
+    """Read-only view of ContextSource, see ShapeView."""
+
+    __slots__ = (
+        "source_uri",
+        "source_type",
+        "source_id",
+    )
+    _shape = "ContextSource"
+
+
+class ContextSummaryView(ShapeView):
+    """Read-only view of ContextSummary, see ShapeView."""
+
+    __slots__ = (
+        "context_arn",
+        "context_name",
+        "source",
+        "context_type",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "ContextSummary"
+
+
+class CreateContextRequestView(ShapeView):
+    """Read-only view of CreateContextRequest, see ShapeView."""
+
+    __slots__ = (
+        "context_name",
+        "source",
+        "context_type",
+        "description",
+        "properties",
+        "tags",
+    )
+    _shape = "CreateContextRequest"
+
+
+class CreateContextResponseView(ShapeView):
+    """Read-only view of CreateContextResponse, see ShapeView."""
+
+    __slots__ = ("context_arn",)
+    _shape = "CreateContextResponse"
+
+
+class DeleteContextRequestView(ShapeView):
+    """Read-only view of DeleteContextRequest, see ShapeView."""
+
+    __slots__ = ("context_name",)
+    _shape = "DeleteContextRequest"
+
+
+class DeleteContextResponseView(ShapeView):
+    """Read-only view of DeleteContextResponse, see ShapeView."""
+
+    __slots__ = ("context_arn",)
+    _shape = "DeleteContextResponse"
+
+
+class DescribeContextRequestView(ShapeView):
+    """Read-only view of DescribeContextRequest, see ShapeView."""
+
+    __slots__ = ("context_name",)
+    _shape = "DescribeContextRequest"
+
+
+class DescribeContextResponseView(ShapeView):
+    """Read-only view of DescribeContextResponse, see ShapeView."""
+
+    __slots__ = (
+        "context_name",
+        "context_arn",
+        "source",
+        "context_type",
+        "description",
+        "properties",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "lineage_group_arn",
+    )
+    _shape = "DescribeContextResponse"
+
+
+class ListContextsRequestView(ShapeView):
+    """Read-only view of ListContextsRequest, see ShapeView."""
+
+    __slots__ = (
+        "source_uri",
+        "context_type",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListContextsRequest"
+
+
+class ListContextsResponseView(ShapeView):
+    """Read-only view of ListContextsResponse, see ShapeView."""
+
+    __slots__ = (
+        "context_summaries",
+        "next_token",
+    )
+    _shape = "ListContextsResponse"
+
+
+class UpdateContextRequestView(ShapeView):
+    """Read-only view of UpdateContextRequest, see ShapeView."""
+
+    __slots__ = (
+        "context_name",
+        "description",
+        "properties",
+        "properties_to_remove",
+    )
+    _shape = "UpdateContextRequest"
+
+
+class UpdateContextResponseView(ShapeView):
+    """Read-only view of UpdateContextResponse, see ShapeView."""
+
+    __slots__ = ("context_arn",)
+    _shape = "UpdateContextResponse"
@@ -0,0 +1,93 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateCodeRepositoryInputView(ShapeView):
+    """Read-only view of CreateCodeRepositoryInput, see ShapeView."""
+
+    __slots__ = (
+        "code_repository_name",
+        "git_config",
+        "tags",
+    )
+    _shape = "CreateCodeRepositoryInput"
+
+
+class CreateCodeRepositoryOutputView(ShapeView):
+    """Read-only view of CreateCodeRepositoryOutput, see ShapeView."""
+
+    __slots__ = ("code_repository_arn",)
+    _shape = "CreateCodeRepositoryOutput"
+
+
+class DeleteCodeRepositoryInputView(ShapeView):
+    """Read-only view of DeleteCodeRepositoryInput, see ShapeView."""
+
+    __slots__ = ("code_repository_name",)
+    _shape = "DeleteCodeRepositoryInput"
+
+
+class DescribeCodeRepositoryInputView(ShapeView):
+    """Read-only view of DescribeCodeRepositoryInput, see ShapeView."""
+
+    __slots__ = ("code_repository_name",)
+    _shape = "DescribeCodeRepositoryInput"
+
+
+class DescribeCodeRepositoryOutputView(ShapeView):
+    """Read-only view of DescribeCodeRepositoryOutput, see ShapeView."""
+
+    __slots__ = (
+        "code_repository_name",
+        "code_repository_arn",
+        "creation_time",
+        "last_modified_time",
+        "git_config",
+    )
+    _shape = "DescribeCodeRepositoryOutput"
+
+
+class GitConfigView(ShapeView):
+    """Read-only view of GitConfig, see ShapeView."""
+
+    __slots__ = (
+        "repository_url",
+        "branch",
+        "secret_arn",
+    )
+    _shape = "GitConfig"
+
+
+class GitConfigForUpdateView(ShapeView):
+    """Read-only view of GitConfigForUpdate, see ShapeView."""
+
+    __slots__ = ("secret_arn",)
+    _shape = "GitConfigForUpdate"
+
+
+class UpdateCodeRepositoryInputView(ShapeView):
+    """Read-only view of UpdateCodeRepositoryInput, see ShapeView."""
+
+    __slots__ = (
+        "code_repository_name",
+        "git_config",
+    )
+    _shape = "UpdateCodeRepositoryInput"
+
+
+class UpdateCodeRepositoryOutputView(ShapeView):
+    """Read-only view of UpdateCodeRepositoryOutput, see ShapeView."""
+
+    __slots__ = ("code_repository_arn",)
+    _shape = "UpdateCodeRepositoryOutput"
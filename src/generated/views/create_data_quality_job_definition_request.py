@@ -0,0 +1,132 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateDataQualityJobDefinitionRequestView(ShapeView):
+    """Read-only view of CreateDataQualityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_name",
+        "data_quality_baseline_config",
+        "data_quality_app_specification",
+        "data_quality_job_input",
+        "data_quality_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+        "tags",
+    )
+    _shape = "CreateDataQualityJobDefinitionRequest"
+
+
+class CreateDataQualityJobDefinitionResponseView(ShapeView):
+    """Read-only view of CreateDataQualityJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = ("job_definition_arn",)
+    _shape = "CreateDataQualityJobDefinitionResponse"
+
+
+class DataQualityAppSpecificationView(ShapeView):
+    """Read-only view of DataQualityAppSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image_uri",
+        "container_entrypoint",
+        "container_arguments",
+        "record_preprocessor_source_uri",
+        "post_analytics_processor_source_uri",
+        "environment",
+    )
+    _shape = "DataQualityAppSpecification"
+
+
+class DataQualityBaselineConfigView(ShapeView):
+    """Read-only view of DataQualityBaselineConfig, see ShapeView."""
+
+    __slots__ = (
+        "baselining_job_name",
+        "constraints_resource",
+        "statistics_resource",
+    )
+    _shape = "DataQualityBaselineConfig"
+
+
+class DataQualityJobInputView(ShapeView):
+    """Read-only view of DataQualityJobInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_input",
+        "batch_transform_input",
+    )
+    _shape = "DataQualityJobInput"
+
+
+class DeleteDataQualityJobDefinitionRequestView(ShapeView):
+    """Read-only view of DeleteDataQualityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DeleteDataQualityJobDefinitionRequest"
+
+
+class DescribeDataQualityJobDefinitionRequestView(ShapeView):
+    """Read-only view of DescribeDataQualityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DescribeDataQualityJobDefinitionRequest"
+
+
+class DescribeDataQualityJobDefinitionResponseView(ShapeView):
+    """Read-only view of DescribeDataQualityJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_arn",
+        "job_definition_name",
+        "creation_time",
+        "data_quality_baseline_config",
+        "data_quality_app_specification",
+        "data_quality_job_input",
+        "data_quality_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+    )
+    _shape = "DescribeDataQualityJobDefinitionResponse"
+
+
+class ListDataQualityJobDefinitionsRequestView(ShapeView):
+    """Read-only view of ListDataQualityJobDefinitionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+    )
+    _shape = "ListDataQualityJobDefinitionsRequest"
+
+
+class ListDataQualityJobDefinitionsResponseView(ShapeView):
+    """Read-only view of ListDataQualityJobDefinitionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_summaries",
+        "next_token",
+    )
+    _shape = "ListDataQualityJobDefinitionsResponse"
@@ -0,0 +1,109 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateDeviceFleetRequestView(ShapeView):
+    """Read-only view of CreateDeviceFleetRequest, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_name",
+        "role_arn",
+        "description",
+        "output_config",
+        "tags",
+        "enable_iot_role_alias",
+    )
+    _shape = "CreateDeviceFleetRequest"
+
+
+class DeleteDeviceFleetRequestView(ShapeView):
+    """Read-only view of DeleteDeviceFleetRequest, see ShapeView."""
+
+    __slots__ = ("device_fleet_name",)
+    _shape = "DeleteDeviceFleetRequest"
+
+
+class DescribeDeviceFleetRequestView(ShapeView):
+    """Read-only view of DescribeDeviceFleetRequest, see ShapeView."""
+
+    __slots__ = ("device_fleet_name",)
+    _shape = "DescribeDeviceFleetRequest"
+
+
+class DescribeDeviceFleetResponseView(ShapeView):
+    """Read-only view of DescribeDeviceFleetResponse, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_name",
+        "device_fleet_arn",
+        "output_config",
+        "description",
+        "creation_time",
+        "last_modified_time",
+        "role_arn",
+        "iot_role_alias",
+    )
+    _shape = "DescribeDeviceFleetResponse"
+
+
+class DeviceFleetSummaryView(ShapeView):
+    """Read-only view of DeviceFleetSummary, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_arn",
+        "device_fleet_name",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "DeviceFleetSummary"
+
+
+class ListDeviceFleetsRequestView(ShapeView):
+    """Read-only view of ListDeviceFleetsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListDeviceFleetsRequest"
+
+
+class ListDeviceFleetsResponseView(ShapeView):
+    """Read-only view of ListDeviceFleetsResponse, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_summaries",
+        "next_token",
+    )
+    _shape = "ListDeviceFleetsResponse"
+
+
+class UpdateDeviceFleetRequestView(ShapeView):
+    """Read-only view of UpdateDeviceFleetRequest, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_name",
+        "role_arn",
+        "description",
+        "output_config",
+        "enable_iot_role_alias",
+    )
+    _shape = "UpdateDeviceFleetRequest"
@@ -0,0 +1,224 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateDomainRequestView(ShapeView):
+    """Read-only view of CreateDomainRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_name",
+        "auth_mode",
+        "default_user_settings",
+        "domain_settings",
+        "subnet_ids",
+        "vpc_id",
+        "tags",
+        "app_network_access_type",
+        "home_efs_file_system_kms_key_id",
+        "kms_key_id",
+        "app_security_group_management",
+        "default_space_settings",
+    )
+    _shape = "CreateDomainRequest"
+
+
+class CreateDomainResponseView(ShapeView):
+    """Read-only view of CreateDomainResponse, see ShapeView."""
+
+    __slots__ = (
+        "domain_arn",
+        "url",
+    )
+    _shape = "CreateDomainResponse"
+
+
+class DefaultSpaceSettingsView(ShapeView):
+    """Read-only view of DefaultSpaceSettings, see ShapeView."""
+
+    __slots__ = (
+        "execution_role",
+        "security_groups",
+        "jupyter_server_app_settings",
+        "kernel_gateway_app_settings",
+    )
+    _shape = "DefaultSpaceSettings"
+
+
+class DeleteDomainRequestView(ShapeView):
+    """Read-only view of DeleteDomainRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "retention_policy",
+    )
+    _shape = "DeleteDomainRequest"
+
+
+class DescribeDomainRequestView(ShapeView):
+    """Read-only view of DescribeDomainRequest, see ShapeView."""
+
+    __slots__ = ("domain_id",)
+    _shape = "DescribeDomainRequest"
+
+
+class DescribeDomainResponseView(ShapeView):
+    """Read-only view of DescribeDomainResponse, see ShapeView."""
+
+    __slots__ = (
+        "domain_arn",
+        "domain_id",
+        "domain_name",
+        "home_efs_file_system_id",
+        "single_sign_on_managed_application_instance_id",
+        "single_sign_on_application_arn",
+        "status",
+        "creation_time",
+        "last_modified_time",
+        "failure_reason",
+        "security_group_id_for_domain_boundary",
+        "auth_mode",
+        "default_user_settings",
+        "domain_settings",
+        "app_network_access_type",
+        "home_efs_file_system_kms_key_id",
+        "subnet_ids",
+        "url",
+        "vpc_id",
+        "kms_key_id",
+        "app_security_group_management",
+        "default_space_settings",
+    )
+    _shape = "DescribeDomainResponse"
+
+
+class DockerSettingsView(ShapeView):
+    """Read-only view of DockerSettings, see ShapeView."""
+
+    __slots__ = (
+        "enable_docker_access",
+        "vpc_only_trusted_accounts",
+    )
+    _shape = "DockerSettings"
+
+
+class DomainDetailsView(ShapeView):
+    """Read-only view of DomainDetails, see ShapeView."""
+
+    __slots__ = (
+        "domain_arn",
+        "domain_id",
+        "domain_name",
+        "status",
+        "creation_time",
+        "last_modified_time",
+        "url",
+    )
+    _shape = "DomainDetails"
+
+
+class DomainSettingsView(ShapeView):
+    """Read-only view of DomainSettings, see ShapeView."""
+
+    __slots__ = (
+        "security_group_ids",
+        "r_studio_server_pro_domain_settings",
+        "execution_role_identity_config",
+        "docker_settings",
+    )
+    _shape = "DomainSettings"
+
+
+class DomainSettingsForUpdateView(ShapeView):
+    """Read-only view of DomainSettingsForUpdate, see ShapeView."""
+
+    __slots__ = (
+        "r_studio_server_pro_domain_settings_for_update",
+        "execution_role_identity_config",
+        "security_group_ids",
+        "docker_settings",
+    )
+    _shape = "DomainSettingsForUpdate"
+
+
+class ListDomainsRequestView(ShapeView):
+    """Read-only view of ListDomainsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListDomainsRequest"
+
+
+class ListDomainsResponseView(ShapeView):
+    """Read-only view of ListDomainsResponse, see ShapeView."""
+
+    __slots__ = (
+        "domains",
+        "next_token",
+    )
+    _shape = "ListDomainsResponse"
+
+
+class RStudioServerProDomainSettingsView(ShapeView):
+    """Read-only view of RStudioServerProDomainSettings, see ShapeView."""
+
+    __slots__ = (
+        "domain_execution_role_arn",
+        "r_studio_connect_url",
+        "r_studio_package_manager_url",
+        "default_resource_spec",
+    )
+    _shape = "RStudioServerProDomainSettings"
+
+
+class RStudioServerProDomainSettingsForUpdateView(ShapeView):
+    """Read-only view of RStudioServerProDomainSettingsForUpdate, see ShapeView."""
+
+    __slots__ = (
+        "domain_execution_role_arn",
+        "default_resource_spec",
+        "r_studio_connect_url",
+        "r_studio_package_manager_url",
+    )
+    _shape = "RStudioServerProDomainSettingsForUpdate"
+
+
+class RetentionPolicyView(ShapeView):
+    """Read-only view of RetentionPolicy, see ShapeView."""
+
+    __slots__ = ("home_efs_file_system",)
+    _shape = "RetentionPolicy"
+
+
+class UpdateDomainRequestView(ShapeView):
+    """Read-only view of UpdateDomainRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "default_user_settings",
+        "domain_settings_for_update",
+        "app_security_group_management",
+        "default_space_settings",
+        "subnet_ids",
+        "app_network_access_type",
+    )
+    _shape = "UpdateDomainRequest"
+
+
+class UpdateDomainResponseView(ShapeView):
+    """Read-only view of UpdateDomainResponse, see ShapeView."""
+
+    __slots__ = ("domain_arn",)
+    _shape = "UpdateDomainResponse"
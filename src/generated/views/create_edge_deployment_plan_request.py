@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateEdgeDeploymentPlanRequestView(ShapeView):
+    """Read-only view of CreateEdgeDeploymentPlanRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_name",
+        "model_configs",
+        "device_fleet_name",
+        "stages",
+        "tags",
+    )
+    _shape = "CreateEdgeDeploymentPlanRequest"
+
+
+class CreateEdgeDeploymentPlanResponseView(ShapeView):
+    """Read-only view of CreateEdgeDeploymentPlanResponse, see ShapeView."""
+
+    __slots__ = ("edge_deployment_plan_arn",)
+    _shape = "CreateEdgeDeploymentPlanResponse"
+
+
+class DeleteEdgeDeploymentPlanRequestView(ShapeView):
+    """Read-only view of DeleteEdgeDeploymentPlanRequest, see ShapeView."""
+
+    __slots__ = ("edge_deployment_plan_name",)
+    _shape = "DeleteEdgeDeploymentPlanRequest"
+
+
+class DeploymentStageStatusSummaryView(ShapeView):
+    """Read-only view of DeploymentStageStatusSummary, see ShapeView."""
+
+    __slots__ = (
+        "stage_name",
+        "device_selection_config",
+        "deployment_config",
+        "deployment_status",
+    )
+    _shape = "DeploymentStageStatusSummary"
+
+
+class DescribeEdgeDeploymentPlanRequestView(ShapeView):
+    """Read-only view of DescribeEdgeDeploymentPlanRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_name",
+        "next_token",
+        "max_results",
+    )
+    _shape = "DescribeEdgeDeploymentPlanRequest"
+
+
+class DescribeEdgeDeploymentPlanResponseView(ShapeView):
+    """Read-only view of DescribeEdgeDeploymentPlanResponse, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_arn",
+        "edge_deployment_plan_name",
+        "model_configs",
+        "device_fleet_name",
+        "edge_deployment_success",
+        "edge_deployment_pending",
+        "edge_deployment_failed",
+        "stages",
+        "next_token",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "DescribeEdgeDeploymentPlanResponse"
+
+
+class EdgeDeploymentModelConfigView(ShapeView):
+    """Read-only view of EdgeDeploymentModelConfig, see ShapeView."""
+
+    __slots__ = (
+        "model_handle",
+        "edge_packaging_job_name",
+    )
+    _shape = "EdgeDeploymentModelConfig"
+
+
+class EdgeDeploymentPlanSummaryView(ShapeView):
+    """Read-only view of EdgeDeploymentPlanSummary, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_arn",
+        "edge_deployment_plan_name",
+        "device_fleet_name",
+        "edge_deployment_success",
+        "edge_deployment_pending",
+        "edge_deployment_failed",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "EdgeDeploymentPlanSummary"
+
+
+class EdgeDeploymentStatusView(ShapeView):
+    """Read-only view of EdgeDeploymentStatus, see ShapeView."""
+
+    __slots__ = (
+        "stage_status",
+        "edge_deployment_success_in_stage",
+        "edge_deployment_pending_in_stage",
+        "edge_deployment_failed_in_stage",
+        "edge_deployment_status_message",
+        "edge_deployment_stage_start_time",
+    )
+    _shape = "EdgeDeploymentStatus"
+
+
+class ListEdgeDeploymentPlansRequestView(ShapeView):
+    """Read-only view of ListEdgeDeploymentPlansRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "device_fleet_name_contains",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListEdgeDeploymentPlansRequest"
+
+
+class ListEdgeDeploymentPlansResponseView(ShapeView):
+    """Read-only view of ListEdgeDeploymentPlansResponse, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_summaries",
+        "next_token",
+    )
+    _shape = "ListEdgeDeploymentPlansResponse"
@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateEdgeDeploymentStageRequestView(ShapeView):
+    """Read-only view of CreateEdgeDeploymentStageRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_name",
+        "stages",
+    )
+    _shape = "CreateEdgeDeploymentStageRequest"
+
+
+class DeleteEdgeDeploymentStageRequestView(ShapeView):
+    """Read-only view of DeleteEdgeDeploymentStageRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_name",
+        "stage_name",
+    )
+    _shape = "DeleteEdgeDeploymentStageRequest"
+
+
+class StartEdgeDeploymentStageRequestView(ShapeView):
+    """Read-only view of StartEdgeDeploymentStageRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_name",
+        "stage_name",
+    )
+    _shape = "StartEdgeDeploymentStageRequest"
+
+
+class StopEdgeDeploymentStageRequestView(ShapeView):
+    """Read-only view of StopEdgeDeploymentStageRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_name",
+        "stage_name",
+    )
+    _shape = "StopEdgeDeploymentStageRequest"
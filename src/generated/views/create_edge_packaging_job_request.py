@@ -0,0 +1,123 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateEdgePackagingJobRequestView(ShapeView):
+    """Read-only view of CreateEdgePackagingJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "edge_packaging_job_name",
+        "compilation_job_name",
+        "model_name",
+        "model_version",
+        "role_arn",
+        "output_config",
+        "resource_key",
+        "tags",
+    )
+    _shape = "CreateEdgePackagingJobRequest"
+
+
+class DescribeEdgePackagingJobRequestView(ShapeView):
+    """Read-only view of DescribeEdgePackagingJobRequest, see ShapeView."""
+
+    __slots__ = ("edge_packaging_job_name",)
+    _shape = "DescribeEdgePackagingJobRequest"
+
+
+class DescribeEdgePackagingJobResponseView(ShapeView):
+    """Read-only view of DescribeEdgePackagingJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "edge_packaging_job_arn",
+        "edge_packaging_job_name",
+        "compilation_job_name",
+        "model_name",
+        "model_version",
+        "role_arn",
+        "output_config",
+        "resource_key",
+        "edge_packaging_job_status",
+        "edge_packaging_job_status_message",
+        "creation_time",
+        "last_modified_time",
+        "model_artifact",
+        "model_signature",
+        "preset_deployment_output",
+    )
+    _shape = "DescribeEdgePackagingJobResponse"
+
+
+class EdgePackagingJobSummaryView(ShapeView):
+    """Read-only view of EdgePackagingJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "edge_packaging_job_arn",
+        "edge_packaging_job_name",
+        "edge_packaging_job_status",
+        "compilation_job_name",
+        "model_name",
+        "model_version",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "EdgePackagingJobSummary"
+
+
+class EdgePresetDeploymentOutputView(ShapeView):
+    """Read-only view of EdgePresetDeploymentOutput, see ShapeView."""
+
+    __slots__ = (
+        "type",
+        "artifact",
+        "status",
+        "status_message",
+    )
+    _shape = "EdgePresetDeploymentOutput"
+
+
+class ListEdgePackagingJobsRequestView(ShapeView):
+    """Read-only view of ListEdgePackagingJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "name_contains",
+        "model_name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListEdgePackagingJobsRequest"
+
+
+class ListEdgePackagingJobsResponseView(ShapeView):
+    """Read-only view of ListEdgePackagingJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "edge_packaging_job_summaries",
+        "next_token",
+    )
+    _shape = "ListEdgePackagingJobsResponse"
+
+
+class StopEdgePackagingJobRequestView(ShapeView):
+    """Read-only view of StopEdgePackagingJobRequest, see ShapeView."""
+
+    __slots__ = ("edge_packaging_job_name",)
+    _shape = "StopEdgePackagingJobRequest"
@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateExperimentRequestView(ShapeView):
+    """Read-only view of CreateExperimentRequest, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "display_name",
+        "description",
+        "tags",
+    )
+    _shape = "CreateExperimentRequest"
+
+
+class CreateExperimentResponseView(ShapeView):
+    """Read-only view of CreateExperimentResponse, see ShapeView."""
+
+    __slots__ = ("experiment_arn",)
+    _shape = "CreateExperimentResponse"
+
+
+class DeleteExperimentRequestView(ShapeView):
+    """Read-only view of DeleteExperimentRequest, see ShapeView."""
+
+    __slots__ = ("experiment_name",)
+    _shape = "DeleteExperimentRequest"
+
+
+class DeleteExperimentResponseView(ShapeView):
+    """Read-only view of DeleteExperimentResponse, see ShapeView."""
+
+    __slots__ = ("experiment_arn",)
+    _shape = "DeleteExperimentResponse"
+
+
+class DescribeExperimentRequestView(ShapeView):
+    """Read-only view of DescribeExperimentRequest, see ShapeView."""
+
+    __slots__ = ("experiment_name",)
+    _shape = "DescribeExperimentRequest"
+
+
+class DescribeExperimentResponseView(ShapeView):
+    """Read-only view of DescribeExperimentResponse, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "experiment_arn",
+        "display_name",
+        "source",
+        "description",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+    )
+    _shape = "DescribeExperimentResponse"
+
+
+class ExperimentSourceView(ShapeView):
+    """Read-only view of ExperimentSource, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "source_type",
+    )
+    _shape = "ExperimentSource"
+
+
+class ExperimentSummaryView(ShapeView):
+    """Read-only view of ExperimentSummary, see ShapeView."""
+
+    __slots__ = (
+        "experiment_arn",
+        "experiment_name",
+        "display_name",
+        "experiment_source",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "ExperimentSummary"
+
+
+class ListExperimentsRequestView(ShapeView):
+    """Read-only view of ListExperimentsRequest, see ShapeView."""
+
+    __slots__ = (
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListExperimentsRequest"
+
+
+class ListExperimentsResponseView(ShapeView):
+    """Read-only view of ListExperimentsResponse, see ShapeView."""
+
+    __slots__ = (
+        "experiment_summaries",
+        "next_token",
+    )
+    _shape = "ListExperimentsResponse"
+
+
+class UpdateExperimentRequestView(ShapeView):
+    """Read-only view of UpdateExperimentRequest, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "display_name",
+        "description",
+    )
+    _shape = "UpdateExperimentRequest"
+
+
+class UpdateExperimentResponseView(ShapeView):
+    """Read-only view of UpdateExperimentResponse, see ShapeView."""
+
+    __slots__ = ("experiment_arn",)
+    _shape = "UpdateExperimentResponse"
@@ -0,0 +1,151 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateFlowDefinitionRequestView(ShapeView):
+    """Read-only view of CreateFlowDefinitionRequest, see ShapeView."""
+
+    __slots__ = (
+        "flow_definition_name",
+        "human_loop_request_source",
+        "human_loop_activation_config",
+        "human_loop_config",
+        "output_config",
+        "role_arn",
+        "tags",
+    )
+    _shape = "CreateFlowDefinitionRequest"
+
+
+class CreateFlowDefinitionResponseView(ShapeView):
+    """Read-only view of CreateFlowDefinitionResponse, see ShapeView."""
+
+    __slots__ = ("flow_definition_arn",)
+    _shape = "CreateFlowDefinitionResponse"
+
+
+class DeleteFlowDefinitionRequestView(ShapeView):
+    """Read-only view of DeleteFlowDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("flow_definition_name",)
+    _shape = "DeleteFlowDefinitionRequest"
+
+
+class DescribeFlowDefinitionRequestView(ShapeView):
+    """Read-only view of DescribeFlowDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("flow_definition_name",)
+    _shape = "DescribeFlowDefinitionRequest"
+
+
+class DescribeFlowDefinitionResponseView(ShapeView):
+    """Read-only view of DescribeFlowDefinitionResponse, see ShapeView."""
+
+    __slots__ = (
+        "flow_definition_arn",
+        "flow_definition_name",
+        "flow_definition_status",
+        "creation_time",
+        "human_loop_request_source",
+        "human_loop_activation_config",
+        "human_loop_config",
+        "output_config",
+        "role_arn",
+        "failure_reason",
+    )
+    _shape = "DescribeFlowDefinitionResponse"
+
+
+class FlowDefinitionOutputConfigView(ShapeView):
+    """Read-only view of FlowDefinitionOutputConfig, see ShapeView."""
+
+    __slots__ = (
+        "s3_output_path",
+        "kms_key_id",
+    )
+    _shape = "FlowDefinitionOutputConfig"
+
+
+class FlowDefinitionSummaryView(ShapeView):
+    """Read-only view of FlowDefinitionSummary, see ShapeView."""
+
+    __slots__ = (
+        "flow_definition_name",
+        "flow_definition_arn",
+        "flow_definition_status",
+        "creation_time",
+        "failure_reason",
+    )
+    _shape = "FlowDefinitionSummary"
+
+
+class HumanLoopActivationConditionsConfigView(ShapeView):
+    """Read-only view of HumanLoopActivationConditionsConfig, see ShapeView."""
+
+    __slots__ = ("human_loop_activation_conditions",)
+    _shape = "HumanLoopActivationConditionsConfig"
+
+
+class HumanLoopActivationConfigView(ShapeView):
+    """Read-only view of HumanLoopActivationConfig, see ShapeView."""
+
+    __slots__ = ("human_loop_activation_conditions_config",)
+    _shape = "HumanLoopActivationConfig"
+
+
+class HumanLoopConfigView(ShapeView):
+    """Read-only view of HumanLoopConfig, see ShapeView."""
+
+    __slots__ = (
+        "workteam_arn",
+        "human_task_ui_arn",
+        "task_title",
+        "task_description",
+        "task_count",
+        "task_availability_lifetime_in_seconds",
+        "task_time_limit_in_seconds",
+        "task_keywords",
+        "public_workforce_task_price",
+    )
+    _shape = "HumanLoopConfig"
+
+
+class HumanLoopRequestSourceView(ShapeView):
+    """Read-only view of HumanLoopRequestSource, see ShapeView."""
+
+    __slots__ = ("aws_managed_human_loop_request_source",)
+    _shape = "HumanLoopRequestSource"
+
+
+class ListFlowDefinitionsRequestView(ShapeView):
+    """Read-only view of ListFlowDefinitionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListFlowDefinitionsRequest"
+
+
+class ListFlowDefinitionsResponseView(ShapeView):
+    """Read-only view of ListFlowDefinitionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "flow_definition_summaries",
+        "next_token",
+    )
+    _shape = "ListFlowDefinitionsResponse"
@@ -0,0 +1,135 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateHubRequestView(ShapeView):
+    """Read-only view of CreateHubRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_description",
+        "hub_display_name",
+        "hub_search_keywords",
+        "s3_storage_config",
+        "tags",
+    )
+    _shape = "CreateHubRequest"
+
+
+class CreateHubResponseView(ShapeView):
+    """Read-only view of CreateHubResponse, see ShapeView."""
+
+    __slots__ = ("hub_arn",)
+    _shape = "CreateHubResponse"
+
+
+class DeleteHubRequestView(ShapeView):
+    """Read-only view of DeleteHubRequest, see ShapeView."""
+
+    __slots__ = ("hub_name",)
+    _shape = "DeleteHubRequest"
+
+
+class DescribeHubRequestView(ShapeView):
+    """Read-only view of DescribeHubRequest, see ShapeView."""
+
+    __slots__ = ("hub_name",)
+    _shape = "DescribeHubRequest"
+
+
+class DescribeHubResponseView(ShapeView):
+    """Read-only view of DescribeHubResponse, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_arn",
+        "hub_display_name",
+        "hub_description",
+        "hub_search_keywords",
+        "s3_storage_config",
+        "hub_status",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "DescribeHubResponse"
+
+
+class HubInfoView(ShapeView):
+    """Read-only view of HubInfo, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_arn",
+        "hub_display_name",
+        "hub_description",
+        "hub_search_keywords",
+        "hub_status",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "HubInfo"
+
+
+class HubS3StorageConfigView(ShapeView):
+    """Read-only view of HubS3StorageConfig, see ShapeView."""
+
+    __slots__ = ("s3_output_path",)
+    _shape = "HubS3StorageConfig"
+
+
+class ListHubsRequestView(ShapeView):
+    """Read-only view of ListHubsRequest, see ShapeView."""
+
+    __slots__ = (
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+        "sort_by",
+        "sort_order",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListHubsRequest"
+
+
+class ListHubsResponseView(ShapeView):
+    """Read-only view of ListHubsResponse, see ShapeView."""
+
+    __slots__ = (
+        "hub_summaries",
+        "next_token",
+    )
+    _shape = "ListHubsResponse"
+
+
+class UpdateHubRequestView(ShapeView):
+    """Read-only view of UpdateHubRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_description",
+        "hub_display_name",
+        "hub_search_keywords",
+    )
+    _shape = "UpdateHubRequest"
+
+
+class UpdateHubResponseView(ShapeView):
+    """Read-only view of UpdateHubResponse, see ShapeView."""
+
+    __slots__ = ("hub_arn",)
+    _shape = "UpdateHubResponse"
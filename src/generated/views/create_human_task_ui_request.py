@@ -0,0 +1,109 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateHumanTaskUiRequestView(ShapeView):
+    """Read-only view of CreateHumanTaskUiRequest, see ShapeView."""
+
+    __slots__ = (
+        "human_task_ui_name",
+        "ui_template",
+        "tags",
+    )
+    _shape = "CreateHumanTaskUiRequest"
+
+
+class CreateHumanTaskUiResponseView(ShapeView):
+    """Read-only view of CreateHumanTaskUiResponse, see ShapeView."""
+
+    __slots__ = ("human_task_ui_arn",)
+    _shape = "CreateHumanTaskUiResponse"
+
+
+class DeleteHumanTaskUiRequestView(ShapeView):
+    """Read-only view of DeleteHumanTaskUiRequest, see ShapeView."""
+
+    __slots__ = ("human_task_ui_name",)
+    _shape = "DeleteHumanTaskUiRequest"
+
+
+class DescribeHumanTaskUiRequestView(ShapeView):
+    """Read-only view of DescribeHumanTaskUiRequest, see ShapeView."""
+
+    __slots__ = ("human_task_ui_name",)
+    _shape = "DescribeHumanTaskUiRequest"
+
+
+class DescribeHumanTaskUiResponseView(ShapeView):
+    """Read-only view of DescribeHumanTaskUiResponse, see ShapeView."""
+
+    __slots__ = (
+        "human_task_ui_arn",
+        "human_task_ui_name",
+        "human_task_ui_status",
+        "creation_time",
+        "ui_template",
+    )
+    _shape = "DescribeHumanTaskUiResponse"
+
+
+class HumanTaskUiSummaryView(ShapeView):
+    """Read-only view of HumanTaskUiSummary, see ShapeView."""
+
+    __slots__ = (
+        "human_task_ui_name",
+        "human_task_ui_arn",
+        "creation_time",
+    )
+    _shape = "HumanTaskUiSummary"
+
+
+class ListHumanTaskUisRequestView(ShapeView):
+    """Read-only view of ListHumanTaskUisRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListHumanTaskUisRequest"
+
+
+class ListHumanTaskUisResponseView(ShapeView):
+    """Read-only view of ListHumanTaskUisResponse, see ShapeView."""
+
+    __slots__ = (
+        "human_task_ui_summaries",
+        "next_token",
+    )
+    _shape = "ListHumanTaskUisResponse"
+
+
+class UiTemplateView(ShapeView):
+    """Read-only view of UiTemplate, see ShapeView."""
+
+    __slots__ = ("content",)
+    _shape = "UiTemplate"
+
+
+class UiTemplateInfoView(ShapeView):
+    """Read-only view of UiTemplateInfo, see ShapeView."""
+
+    __slots__ = (
+        "url",
+        "content_sha256",
+    )
+    _shape = "UiTemplateInfo"
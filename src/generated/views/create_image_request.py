@@ -0,0 +1,127 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateImageRequestView(ShapeView):
+    """Read-only view of CreateImageRequest, see ShapeView."""
+
+    __slots__ = (
+        "description",
+        "display_name",
+        "image_name",
+        "role_arn",
+        "tags",
+    )
+    _shape = "CreateImageRequest"
+
+
+class CreateImageResponseView(ShapeView):
+    """Read-only view of CreateImageResponse, see ShapeView."""
+
+    __slots__ = ("image_arn",)
+    _shape = "CreateImageResponse"
+
+
+class DeleteImageRequestView(ShapeView):
+    """Read-only view of DeleteImageRequest, see ShapeView."""
+
+    __slots__ = ("image_name",)
+    _shape = "DeleteImageRequest"
+
+
+class DescribeImageRequestView(ShapeView):
+    """Read-only view of DescribeImageRequest, see ShapeView."""
+
+    __slots__ = ("image_name",)
+    _shape = "DescribeImageRequest"
+
+
+class DescribeImageResponseView(ShapeView):
+    """Read-only view of DescribeImageResponse, see ShapeView."""
+
+    __slots__ = (
+        "creation_time",
+        "description",
+        "display_name",
+        "failure_reason",
+        "image_arn",
+        "image_name",
+        "image_status",
+        "last_modified_time",
+        "role_arn",
+    )
+    _shape = "DescribeImageResponse"
+
+
+class ImageView(ShapeView):
+    """Read-only view of Image, see ShapeView."""
+
+    __slots__ = (
+        "creation_time",
+        "description",
+        "display_name",
+        "failure_reason",
+        "image_arn",
+        "image_name",
+        "image_status",
+        "last_modified_time",
+    )
+    _shape = "Image"
+
+
+class ListImagesRequestView(ShapeView):
+    """Read-only view of ListImagesRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "max_results",
+        "name_contains",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListImagesRequest"
+
+
+class ListImagesResponseView(ShapeView):
+    """Read-only view of ListImagesResponse, see ShapeView."""
+
+    __slots__ = (
+        "images",
+        "next_token",
+    )
+    _shape = "ListImagesResponse"
+
+
+class UpdateImageRequestView(ShapeView):
+    """Read-only view of UpdateImageRequest, see ShapeView."""
+
+    __slots__ = (
+        "delete_properties",
+        "description",
+        "display_name",
+        "image_name",
+        "role_arn",
+    )
+    _shape = "UpdateImageRequest"
+
+
+class UpdateImageResponseView(ShapeView):
+    """Read-only view of UpdateImageResponse, see ShapeView."""
+
+    __slots__ = ("image_arn",)
+    _shape = "UpdateImageResponse"
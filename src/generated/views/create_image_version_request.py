@@ -0,0 +1,154 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateImageVersionRequestView(ShapeView):
+    """Read-only view of CreateImageVersionRequest, see ShapeView."""
+
+    __slots__ = (
+        "base_image",
+        "client_token",
+        "image_name",
+        "aliases",
+        "vendor_guidance",
+        "job_type",
+        "m_l_framework",
+        "programming_lang",
+        "processor",
+        "horovod",
+        "release_notes",
+    )
+    _shape = "CreateImageVersionRequest"
+
+
+class CreateImageVersionResponseView(ShapeView):
+    """Read-only view of CreateImageVersionResponse, see ShapeView."""
+
+    __slots__ = ("image_version_arn",)
+    _shape = "CreateImageVersionResponse"
+
+
+class DeleteImageVersionRequestView(ShapeView):
+    """Read-only view of DeleteImageVersionRequest, see ShapeView."""
+
+    __slots__ = (
+        "image_name",
+        "version",
+        "alias",
+    )
+    _shape = "DeleteImageVersionRequest"
+
+
+class DescribeImageVersionRequestView(ShapeView):
+    """Read-only view of DescribeImageVersionRequest, see ShapeView."""
+
+    __slots__ = (
+        "image_name",
+        "version",
+        "alias",
+    )
+    _shape = "DescribeImageVersionRequest"
+
+
+class DescribeImageVersionResponseView(ShapeView):
+    """Read-only view of DescribeImageVersionResponse, see ShapeView."""
+
+    __slots__ = (
+        "base_image",
+        "container_image",
+        "creation_time",
+        "failure_reason",
+        "image_arn",
+        "image_version_arn",
+        "image_version_status",
+        "last_modified_time",
+        "version",
+        "vendor_guidance",
+        "job_type",
+        "m_l_framework",
+        "programming_lang",
+        "processor",
+        "horovod",
+        "release_notes",
+    )
+    _shape = "DescribeImageVersionResponse"
+
+
+class ImageVersionView(ShapeView):
+    """Read-only view of ImageVersion, see ShapeView."""
+
+    __slots__ = (
+        "creation_time",
+        "failure_reason",
+        "image_arn",
+        "image_version_arn",
+        "image_version_status",
+        "last_modified_time",
+        "version",
+    )
+    _shape = "ImageVersion"
+
+
+class ListImageVersionsRequestView(ShapeView):
+    """Read-only view of ListImageVersionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "image_name",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "max_results",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListImageVersionsRequest"
+
+
+class ListImageVersionsResponseView(ShapeView):
+    """Read-only view of ListImageVersionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "image_versions",
+        "next_token",
+    )
+    _shape = "ListImageVersionsResponse"
+
+
+class UpdateImageVersionRequestView(ShapeView):
+    """Read-only view of UpdateImageVersionRequest, see ShapeView."""
+
+    __slots__ = (
+        "image_name",
+        "alias",
+        "version",
+        "aliases_to_add",
+        "aliases_to_delete",
+        "vendor_guidance",
+        "job_type",
+        "m_l_framework",
+        "programming_lang",
+        "processor",
+        "horovod",
+        "release_notes",
+    )
+    _shape = "UpdateImageVersionRequest"
+
+
+class UpdateImageVersionResponseView(ShapeView):
+    """Read-only view of UpdateImageVersionResponse, see ShapeView."""
+
+    __slots__ = ("image_version_arn",)
+    _shape = "UpdateImageVersionResponse"
@@ -0,0 +1,216 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateInferenceComponentInputView(ShapeView):
+    """Read-only view of CreateInferenceComponentInput, see ShapeView."""
+
+    __slots__ = (
+        "inference_component_name",
+        "endpoint_name",
+        "variant_name",
+        "specification",
+        "runtime_config",
+        "tags",
+    )
+    _shape = "CreateInferenceComponentInput"
+
+
+class CreateInferenceComponentOutputView(ShapeView):
+    """Read-only view of CreateInferenceComponentOutput, see ShapeView."""
+
+    __slots__ = ("inference_component_arn",)
+    _shape = "CreateInferenceComponentOutput"
+
+
+class DeleteInferenceComponentInputView(ShapeView):
+    """Read-only view of DeleteInferenceComponentInput, see ShapeView."""
+
+    __slots__ = ("inference_component_name",)
+    _shape = "DeleteInferenceComponentInput"
+
+
+class DescribeInferenceComponentInputView(ShapeView):
+    """Read-only view of DescribeInferenceComponentInput, see ShapeView."""
+
+    __slots__ = ("inference_component_name",)
+    _shape = "DescribeInferenceComponentInput"
+
+
+class DescribeInferenceComponentOutputView(ShapeView):
+    """Read-only view of DescribeInferenceComponentOutput, see ShapeView."""
+
+    __slots__ = (
+        "inference_component_name",
+        "inference_component_arn",
+        "endpoint_name",
+        "endpoint_arn",
+        "variant_name",
+        "failure_reason",
+        "specification",
+        "runtime_config",
+        "creation_time",
+        "last_modified_time",
+        "inference_component_status",
+    )
+    _shape = "DescribeInferenceComponentOutput"
+
+
+class InferenceComponentComputeResourceRequirementsView(ShapeView):
+    """Read-only view of InferenceComponentComputeResourceRequirements, see ShapeView."""
+
+    __slots__ = (
+        "number_of_cpu_cores_required",
+        "number_of_accelerator_devices_required",
+        "min_memory_required_in_mb",
+        "max_memory_required_in_mb",
+    )
+    _shape = "InferenceComponentComputeResourceRequirements"
+
+
+class InferenceComponentContainerSpecificationView(ShapeView):
+    """Read-only view of InferenceComponentContainerSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image",
+        "artifact_url",
+        "environment",
+    )
+    _shape = "InferenceComponentContainerSpecification"
+
+
+class InferenceComponentContainerSpecificationSummaryView(ShapeView):
+    """Read-only view of InferenceComponentContainerSpecificationSummary, see ShapeView."""
+
+    __slots__ = (
+        "deployed_image",
+        "artifact_url",
+        "environment",
+    )
+    _shape = "InferenceComponentContainerSpecificationSummary"
+
+
+class InferenceComponentRuntimeConfigView(ShapeView):
+    """Read-only view of InferenceComponentRuntimeConfig, see ShapeView."""
+
+    __slots__ = ("copy_count",)
+    _shape = "InferenceComponentRuntimeConfig"
+
+
+class InferenceComponentRuntimeConfigSummaryView(ShapeView):
+    """Read-only view of InferenceComponentRuntimeConfigSummary, see ShapeView."""
+
+    __slots__ = (
+        "desired_copy_count",
+        "current_copy_count",
+    )
+    _shape = "InferenceComponentRuntimeConfigSummary"
+
+
+class InferenceComponentSpecificationView(ShapeView):
+    """Read-only view of InferenceComponentSpecification, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "container",
+        "startup_parameters",
+        "compute_resource_requirements",
+    )
+    _shape = "InferenceComponentSpecification"
+
+
+class InferenceComponentSpecificationSummaryView(ShapeView):
+    """Read-only view of InferenceComponentSpecificationSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "container",
+        "startup_parameters",
+        "compute_resource_requirements",
+    )
+    _shape = "InferenceComponentSpecificationSummary"
+
+
+class InferenceComponentStartupParametersView(ShapeView):
+    """Read-only view of InferenceComponentStartupParameters, see ShapeView."""
+
+    __slots__ = (
+        "model_data_download_timeout_in_seconds",
+        "container_startup_health_check_timeout_in_seconds",
+    )
+    _shape = "InferenceComponentStartupParameters"
+
+
+class InferenceComponentSummaryView(ShapeView):
+    """Read-only view of InferenceComponentSummary, see ShapeView."""
+
+    __slots__ = (
+        "creation_time",
+        "inference_component_arn",
+        "inference_component_name",
+        "endpoint_arn",
+        "endpoint_name",
+        "variant_name",
+        "inference_component_status",
+        "last_modified_time",
+    )
+    _shape = "InferenceComponentSummary"
+
+
+class ListInferenceComponentsInputView(ShapeView):
+    """Read-only view of ListInferenceComponentsInput, see ShapeView."""
+
+    __slots__ = (
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+        "status_equals",
+        "endpoint_name_equals",
+        "variant_name_equals",
+    )
+    _shape = "ListInferenceComponentsInput"
+
+
+class ListInferenceComponentsOutputView(ShapeView):
+    """Read-only view of ListInferenceComponentsOutput, see ShapeView."""
+
+    __slots__ = (
+        "inference_components",
+        "next_token",
+    )
+    _shape = "ListInferenceComponentsOutput"
+
+
+class UpdateInferenceComponentInputView(ShapeView):
+    """Read-only view of UpdateInferenceComponentInput, see ShapeView."""
+
+    __slots__ = (
+        "inference_component_name",
+        "specification",
+        "runtime_config",
+    )
+    _shape = "UpdateInferenceComponentInput"
+
+
+class UpdateInferenceComponentOutputView(ShapeView):
+    """Read-only view of UpdateInferenceComponentOutput, see ShapeView."""
+
+    __slots__ = ("inference_component_arn",)
+    _shape = "UpdateInferenceComponentOutput"
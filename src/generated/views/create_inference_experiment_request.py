@@ -0,0 +1,282 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateInferenceExperimentRequestView(ShapeView):
+    """Read-only view of CreateInferenceExperimentRequest, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "type",
+        "schedule",
+        "description",
+        "role_arn",
+        "endpoint_name",
+        "model_variants",
+        "data_storage_config",
+        "shadow_mode_config",
+        "kms_key",
+        "tags",
+    )
+    _shape = "CreateInferenceExperimentRequest"
+
+
+class CreateInferenceExperimentResponseView(ShapeView):
+    """Read-only view of CreateInferenceExperimentResponse, see ShapeView."""
+
+    __slots__ = ("inference_experiment_arn",)
+    _shape = "CreateInferenceExperimentResponse"
+
+
+class DeleteInferenceExperimentRequestView(ShapeView):
+    """Read-only view of DeleteInferenceExperimentRequest, see ShapeView."""
+
+    __slots__ = ("name",)
+    _shape = "DeleteInferenceExperimentRequest"
+
+
+class DeleteInferenceExperimentResponseView(ShapeView):
+    """Read-only view of DeleteInferenceExperimentResponse, see ShapeView."""
+
+    __slots__ = ("inference_experiment_arn",)
+    _shape = "DeleteInferenceExperimentResponse"
+
+
+class DescribeInferenceExperimentRequestView(ShapeView):
+    """Read-only view of DescribeInferenceExperimentRequest, see ShapeView."""
+
+    __slots__ = ("name",)
+    _shape = "DescribeInferenceExperimentRequest"
+
+
+class DescribeInferenceExperimentResponseView(ShapeView):
+    """Read-only view of DescribeInferenceExperimentResponse, see ShapeView."""
+
+    __slots__ = (
+        "arn",
+        "name",
+        "type",
+        "schedule",
+        "status",
+        "status_reason",
+        "description",
+        "creation_time",
+        "completion_time",
+        "last_modified_time",
+        "role_arn",
+        "endpoint_metadata",
+        "model_variants",
+        "data_storage_config",
+        "shadow_mode_config",
+        "kms_key",
+    )
+    _shape = "DescribeInferenceExperimentResponse"
+
+
+class EndpointMetadataView(ShapeView):
+    """Read-only view of EndpointMetadata, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_config_name",
+        "endpoint_status",
+        "failure_reason",
+    )
+    _shape = "EndpointMetadata"
+
+
+class InferenceExperimentDataStorageConfigView(ShapeView):
+    """Read-only view of InferenceExperimentDataStorageConfig, see ShapeView."""
+
+    __slots__ = (
+        "destination",
+        "kms_key",
+        "content_type",
+    )
+    _shape = "InferenceExperimentDataStorageConfig"
+
+
+class InferenceExperimentScheduleView(ShapeView):
+    """Read-only view of InferenceExperimentSchedule, see ShapeView."""
+
+    __slots__ = (
+        "start_time",
+        "end_time",
+    )
+    _shape = "InferenceExperimentSchedule"
+
+
+class InferenceExperimentSummaryView(ShapeView):
+    """Read-only view of InferenceExperimentSummary, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "type",
+        "schedule",
+        "status",
+        "status_reason",
+        "description",
+        "creation_time",
+        "completion_time",
+        "last_modified_time",
+        "role_arn",
+    )
+    _shape = "InferenceExperimentSummary"
+
+
+class ListInferenceExperimentsRequestView(ShapeView):
+    """Read-only view of ListInferenceExperimentsRequest, see ShapeView."""
+
+    __slots__ = (
+        "name_contains",
+        "type",
+        "status_equals",
+        "creation_time_after",
+        "creation_time_before",
+        "last_modified_time_after",
+        "last_modified_time_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListInferenceExperimentsRequest"
+
+
+class ListInferenceExperimentsResponseView(ShapeView):
+    """Read-only view of ListInferenceExperimentsResponse, see ShapeView."""
+
+    __slots__ = (
+        "inference_experiments",
+        "next_token",
+    )
+    _shape = "ListInferenceExperimentsResponse"
+
+
+class ModelInfrastructureConfigView(ShapeView):
+    """Read-only view of ModelInfrastructureConfig, see ShapeView."""
+
+    __slots__ = (
+        "infrastructure_type",
+        "real_time_inference_config",
+    )
+    _shape = "ModelInfrastructureConfig"
+
+
+class ModelVariantConfigView(ShapeView):
+    """Read-only view of ModelVariantConfig, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "variant_name",
+        "infrastructure_config",
+    )
+    _shape = "ModelVariantConfig"
+
+
+class ModelVariantConfigSummaryView(ShapeView):
+    """Read-only view of ModelVariantConfigSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "variant_name",
+        "infrastructure_config",
+        "status",
+    )
+    _shape = "ModelVariantConfigSummary"
+
+
+class RealTimeInferenceConfigView(ShapeView):
+    """Read-only view of RealTimeInferenceConfig, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "instance_count",
+    )
+    _shape = "RealTimeInferenceConfig"
+
+
+class ShadowModeConfigView(ShapeView):
+    """Read-only view of ShadowModeConfig, see ShapeView."""
+
+    __slots__ = (
+        "source_model_variant_name",
+        "shadow_model_variants",
+    )
+    _shape = "ShadowModeConfig"
+
+
+class ShadowModelVariantConfigView(ShapeView):
+    """Read-only view of ShadowModelVariantConfig, see ShapeView."""
+
+    __slots__ = (
+        "shadow_model_variant_name",
+        "sampling_percentage",
+    )
+    _shape = "ShadowModelVariantConfig"
+
+
+class StartInferenceExperimentRequestView(ShapeView):
+    """Read-only view of StartInferenceExperimentRequest, see ShapeView."""
+
+    __slots__ = ("name",)
+    _shape = "StartInferenceExperimentRequest"
+
+
+class StartInferenceExperimentResponseView(ShapeView):
+    """Read-only view of StartInferenceExperimentResponse, see ShapeView."""
+
+    __slots__ = ("inference_experiment_arn",)
+    _shape = "StartInferenceExperimentResponse"
+
+
+class StopInferenceExperimentRequestView(ShapeView):
+    """Read-only view of StopInferenceExperimentRequest, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "model_variant_actions",
+        "desired_model_variants",
+        "desired_state",
+        "reason",
+    )
+    _shape = "StopInferenceExperimentRequest"
+
+
+class StopInferenceExperimentResponseView(ShapeView):
+    """Read-only view of StopInferenceExperimentResponse, see ShapeView."""
+
+    __slots__ = ("inference_experiment_arn",)
+    _shape = "StopInferenceExperimentResponse"
+
+
+class UpdateInferenceExperimentRequestView(ShapeView):
+    """Read-only view of UpdateInferenceExperimentRequest, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "schedule",
+        "description",
+        "model_variants",
+        "data_storage_config",
+        "shadow_mode_config",
+    )
+    _shape = "UpdateInferenceExperimentRequest"
+
+
+class UpdateInferenceExperimentResponseView(ShapeView):
+    """Read-only view of UpdateInferenceExperimentResponse, see ShapeView."""
+
+    __slots__ = ("inference_experiment_arn",)
+    _shape = "UpdateInferenceExperimentResponse"
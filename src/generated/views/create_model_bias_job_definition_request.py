@@ -0,0 +1,129 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateModelBiasJobDefinitionRequestView(ShapeView):
+    """Read-only view of CreateModelBiasJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_name",
+        "model_bias_baseline_config",
+        "model_bias_app_specification",
+        "model_bias_job_input",
+        "model_bias_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+        "tags",
+    )
+    _shape = "CreateModelBiasJobDefinitionRequest"
+
+
+class CreateModelBiasJobDefinitionResponseView(ShapeView):
+    """Read-only view of CreateModelBiasJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = ("job_definition_arn",)
+    _shape = "CreateModelBiasJobDefinitionResponse"
+
+
+class DeleteModelBiasJobDefinitionRequestView(ShapeView):
+    """Read-only view of DeleteModelBiasJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DeleteModelBiasJobDefinitionRequest"
+
+
+class DescribeModelBiasJobDefinitionRequestView(ShapeView):
+    """Read-only view of DescribeModelBiasJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DescribeModelBiasJobDefinitionRequest"
+
+
+class DescribeModelBiasJobDefinitionResponseView(ShapeView):
+    """Read-only view of DescribeModelBiasJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_arn",
+        "job_definition_name",
+        "creation_time",
+        "model_bias_baseline_config",
+        "model_bias_app_specification",
+        "model_bias_job_input",
+        "model_bias_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+    )
+    _shape = "DescribeModelBiasJobDefinitionResponse"
+
+
+class ListModelBiasJobDefinitionsRequestView(ShapeView):
+    """Read-only view of ListModelBiasJobDefinitionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+    )
+    _shape = "ListModelBiasJobDefinitionsRequest"
+
+
+class ListModelBiasJobDefinitionsResponseView(ShapeView):
+    """Read-only view of ListModelBiasJobDefinitionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_summaries",
+        "next_token",
+    )
+    _shape = "ListModelBiasJobDefinitionsResponse"
+
+
+class ModelBiasAppSpecificationView(ShapeView):
+    """Read-only view of ModelBiasAppSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image_uri",
+        "config_uri",
+        "environment",
+    )
+    _shape = "ModelBiasAppSpecification"
+
+
+class ModelBiasBaselineConfigView(ShapeView):
+    """Read-only view of ModelBiasBaselineConfig, see ShapeView."""
+
+    __slots__ = (
+        "baselining_job_name",
+        "constraints_resource",
+    )
+    _shape = "ModelBiasBaselineConfig"
+
+
+class ModelBiasJobInputView(ShapeView):
+    """Read-only view of ModelBiasJobInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_input",
+        "batch_transform_input",
+        "ground_truth_s3_input",
+    )
+    _shape = "ModelBiasJobInput"
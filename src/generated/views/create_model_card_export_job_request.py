@@ -0,0 +1,114 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateModelCardExportJobRequestView(ShapeView):
+    """Read-only view of CreateModelCardExportJobRequest, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "model_card_version",
+        "model_card_export_job_name",
+        "output_config",
+    )
+    _shape = "CreateModelCardExportJobRequest"
+
+
+class CreateModelCardExportJobResponseView(ShapeView):
+    """Read-only view of CreateModelCardExportJobResponse, see ShapeView."""
+
+    __slots__ = ("model_card_export_job_arn",)
+    _shape = "CreateModelCardExportJobResponse"
+
+
+class DescribeModelCardExportJobRequestView(ShapeView):
+    """Read-only view of DescribeModelCardExportJobRequest, see ShapeView."""
+
+    __slots__ = ("model_card_export_job_arn",)
+    _shape = "DescribeModelCardExportJobRequest"
+
+
+class DescribeModelCardExportJobResponseView(ShapeView):
+    """Read-only view of DescribeModelCardExportJobResponse, see ShapeView."""
+
+    __slots__ = (
+        "model_card_export_job_name",
+        "model_card_export_job_arn",
+        "status",
+        "model_card_name",
+        "model_card_version",
+        "output_config",
+        "created_at",
+        "last_modified_at",
+        "failure_reason",
+        "export_artifacts",
+    )
+    _shape = "DescribeModelCardExportJobResponse"
+
+
+class ListModelCardExportJobsRequestView(ShapeView):
+    """Read-only view of ListModelCardExportJobsRequest, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "model_card_version",
+        "creation_time_after",
+        "creation_time_before",
+        "model_card_export_job_name_contains",
+        "status_equals",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListModelCardExportJobsRequest"
+
+
+class ListModelCardExportJobsResponseView(ShapeView):
+    """Read-only view of ListModelCardExportJobsResponse, see ShapeView."""
+
+    __slots__ = (
+        "model_card_export_job_summaries",
+        "next_token",
+    )
+    _shape = "ListModelCardExportJobsResponse"
+
+
+class ModelCardExportArtifactsView(ShapeView):
+    """Read-only view of ModelCardExportArtifacts, see ShapeView."""
+
+    __slots__ = ("s3_export_artifacts",)
+    _shape = "ModelCardExportArtifacts"
+
+
+class ModelCardExportJobSummaryView(ShapeView):
+    """Read-only view of ModelCardExportJobSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_card_export_job_name",
+        "model_card_export_job_arn",
+        "status",
+        "model_card_name",
+        "model_card_version",
+        "created_at",
+        "last_modified_at",
+    )
+    _shape = "ModelCardExportJobSummary"
+
+
+class ModelCardExportOutputConfigView(ShapeView):
+    """Read-only view of ModelCardExportOutputConfig, see ShapeView."""
+
+    __slots__ = ("s3_output_path",)
+    _shape = "ModelCardExportOutputConfig"
@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateModelCardRequestView(ShapeView):
+    """Read-only view of CreateModelCardRequest, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "security_config",
+        "content",
+        "model_card_status",
+        "tags",
+    )
+    _shape = "CreateModelCardRequest"
+
+
+class CreateModelCardResponseView(ShapeView):
+    """Read-only view of CreateModelCardResponse, see ShapeView."""
+
+    __slots__ = ("model_card_arn",)
+    _shape = "CreateModelCardResponse"
+
+
+class DeleteModelCardRequestView(ShapeView):
+    """Read-only view of DeleteModelCardRequest, see ShapeView."""
+
+    __slots__ = ("model_card_name",)
+    _shape = "DeleteModelCardRequest"
+
+
+class DescribeModelCardRequestView(ShapeView):
+    """Read-only view of DescribeModelCardRequest, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "model_card_version",
+    )
+    _shape = "DescribeModelCardRequest"
+
+
+class DescribeModelCardResponseView(ShapeView):
+    """Read-only view of DescribeModelCardResponse, see ShapeView."""
+
+    __slots__ = (
+        "model_card_arn",
+        "model_card_name",
+        "model_card_version",
+        "content",
+        "model_card_status",
+        "security_config",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "model_card_processing_status",
+    )
+    _shape = "DescribeModelCardResponse"
+
+
+class ListModelCardsRequestView(ShapeView):
+    """Read-only view of ListModelCardsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "name_contains",
+        "model_card_status",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListModelCardsRequest"
+
+
+class ListModelCardsResponseView(ShapeView):
+    """Read-only view of ListModelCardsResponse, see ShapeView."""
+
+    __slots__ = (
+        "model_card_summaries",
+        "next_token",
+    )
+    _shape = "ListModelCardsResponse"
+
+
+class ModelCardSecurityConfigView(ShapeView):
+    """Read-only view of ModelCardSecurityConfig, see ShapeView."""
+
+    __slots__ = ("kms_key_id",)
+    _shape = "ModelCardSecurityConfig"
+
+
+class ModelCardSummaryView(ShapeView):
+    """Read-only view of ModelCardSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "model_card_arn",
+        "model_card_status",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "ModelCardSummary"
+
+
+class UpdateModelCardRequestView(ShapeView):
+    """Read-only view of UpdateModelCardRequest, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "content",
+        "model_card_status",
+    )
+    _shape = "UpdateModelCardRequest"
+
+
+class UpdateModelCardResponseView(ShapeView):
+    """Read-only view of UpdateModelCardResponse, see ShapeView."""
+
+    __slots__ = ("model_card_arn",)
+    _shape = "UpdateModelCardResponse"
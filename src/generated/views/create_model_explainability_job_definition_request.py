@@ -0,0 +1,128 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateModelExplainabilityJobDefinitionRequestView(ShapeView):
+    """Read-only view of CreateModelExplainabilityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_name",
+        "model_explainability_baseline_config",
+        "model_explainability_app_specification",
+        "model_explainability_job_input",
+        "model_explainability_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+        "tags",
+    )
+    _shape = "CreateModelExplainabilityJobDefinitionRequest"
+
+
+class CreateModelExplainabilityJobDefinitionResponseView(ShapeView):
+    """Read-only view of CreateModelExplainabilityJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = ("job_definition_arn",)
+    _shape = "CreateModelExplainabilityJobDefinitionResponse"
+
+
+class DeleteModelExplainabilityJobDefinitionRequestView(ShapeView):
+    """Read-only view of DeleteModelExplainabilityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DeleteModelExplainabilityJobDefinitionRequest"
+
+
+class DescribeModelExplainabilityJobDefinitionRequestView(ShapeView):
+    """Read-only view of DescribeModelExplainabilityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DescribeModelExplainabilityJobDefinitionRequest"
+
+
+class DescribeModelExplainabilityJobDefinitionResponseView(ShapeView):
+    """Read-only view of DescribeModelExplainabilityJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_arn",
+        "job_definition_name",
+        "creation_time",
+        "model_explainability_baseline_config",
+        "model_explainability_app_specification",
+        "model_explainability_job_input",
+        "model_explainability_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+    )
+    _shape = "DescribeModelExplainabilityJobDefinitionResponse"
+
+
+class ListModelExplainabilityJobDefinitionsRequestView(ShapeView):
+    """Read-only view of ListModelExplainabilityJobDefinitionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+    )
+    _shape = "ListModelExplainabilityJobDefinitionsRequest"
+
+
+class ListModelExplainabilityJobDefinitionsResponseView(ShapeView):
+    """Read-only view of ListModelExplainabilityJobDefinitionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_summaries",
+        "next_token",
+    )
+    _shape = "ListModelExplainabilityJobDefinitionsResponse"
+
+
+class ModelExplainabilityAppSpecificationView(ShapeView):
+    """Read-only view of ModelExplainabilityAppSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image_uri",
+        "config_uri",
+        "environment",
+    )
+    _shape = "ModelExplainabilityAppSpecification"
+
+
+class ModelExplainabilityBaselineConfigView(ShapeView):
+    """Read-only view of ModelExplainabilityBaselineConfig, see ShapeView."""
+
+    __slots__ = (
+        "baselining_job_name",
+        "constraints_resource",
+    )
+    _shape = "ModelExplainabilityBaselineConfig"
+
+
+class ModelExplainabilityJobInputView(ShapeView):
+    """Read-only view of ModelExplainabilityJobInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_input",
+        "batch_transform_input",
+    )
+    _shape = "ModelExplainabilityJobInput"
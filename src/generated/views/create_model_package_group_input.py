@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateModelPackageGroupInputView(ShapeView):
+    """Read-only view of CreateModelPackageGroupInput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_group_name",
+        "model_package_group_description",
+        "tags",
+    )
+    _shape = "CreateModelPackageGroupInput"
+
+
+class CreateModelPackageGroupOutputView(ShapeView):
+    """Read-only view of CreateModelPackageGroupOutput, see ShapeView."""
+
+    __slots__ = ("model_package_group_arn",)
+    _shape = "CreateModelPackageGroupOutput"
+
+
+class DeleteModelPackageGroupInputView(ShapeView):
+    """Read-only view of DeleteModelPackageGroupInput, see ShapeView."""
+
+    __slots__ = ("model_package_group_name",)
+    _shape = "DeleteModelPackageGroupInput"
+
+
+class DescribeModelPackageGroupInputView(ShapeView):
+    """Read-only view of DescribeModelPackageGroupInput, see ShapeView."""
+
+    __slots__ = ("model_package_group_name",)
+    _shape = "DescribeModelPackageGroupInput"
+
+
+class DescribeModelPackageGroupOutputView(ShapeView):
+    """Read-only view of DescribeModelPackageGroupOutput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_group_name",
+        "model_package_group_arn",
+        "model_package_group_description",
+        "creation_time",
+        "created_by",
+        "model_package_group_status",
+    )
+    _shape = "DescribeModelPackageGroupOutput"
+
+
+class ListModelPackageGroupsInputView(ShapeView):
+    """Read-only view of ListModelPackageGroupsInput, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "name_contains",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListModelPackageGroupsInput"
+
+
+class ListModelPackageGroupsOutputView(ShapeView):
+    """Read-only view of ListModelPackageGroupsOutput, see ShapeView."""
+
+    __slots__ = (
+        "model_package_group_summary_list",
+        "next_token",
+    )
+    _shape = "ListModelPackageGroupsOutput"
+
+
+class ModelPackageGroupSummaryView(ShapeView):
+    """Read-only view of ModelPackageGroupSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_package_group_name",
+        "model_package_group_arn",
+        "model_package_group_description",
+        "creation_time",
+        "model_package_group_status",
+    )
+    _shape = "ModelPackageGroupSummary"
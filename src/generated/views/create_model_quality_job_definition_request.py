@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateModelQualityJobDefinitionRequestView(ShapeView):
+    """Read-only view of CreateModelQualityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_name",
+        "model_quality_baseline_config",
+        "model_quality_app_specification",
+        "model_quality_job_input",
+        "model_quality_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+        "tags",
+    )
+    _shape = "CreateModelQualityJobDefinitionRequest"
+
+
+class CreateModelQualityJobDefinitionResponseView(ShapeView):
+    """Read-only view of CreateModelQualityJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = ("job_definition_arn",)
+    _shape = "CreateModelQualityJobDefinitionResponse"
+
+
+class DeleteModelQualityJobDefinitionRequestView(ShapeView):
+    """Read-only view of DeleteModelQualityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DeleteModelQualityJobDefinitionRequest"
+
+
+class DescribeModelQualityJobDefinitionRequestView(ShapeView):
+    """Read-only view of DescribeModelQualityJobDefinitionRequest, see ShapeView."""
+
+    __slots__ = ("job_definition_name",)
+    _shape = "DescribeModelQualityJobDefinitionRequest"
+
+
+class DescribeModelQualityJobDefinitionResponseView(ShapeView):
+    """Read-only view of DescribeModelQualityJobDefinitionResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_arn",
+        "job_definition_name",
+        "creation_time",
+        "model_quality_baseline_config",
+        "model_quality_app_specification",
+        "model_quality_job_input",
+        "model_quality_job_output_config",
+        "job_resources",
+        "network_config",
+        "role_arn",
+        "stopping_condition",
+    )
+    _shape = "DescribeModelQualityJobDefinitionResponse"
+
+
+class ListModelQualityJobDefinitionsRequestView(ShapeView):
+    """Read-only view of ListModelQualityJobDefinitionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+    )
+    _shape = "ListModelQualityJobDefinitionsRequest"
+
+
+class ListModelQualityJobDefinitionsResponseView(ShapeView):
+    """Read-only view of ListModelQualityJobDefinitionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "job_definition_summaries",
+        "next_token",
+    )
+    _shape = "ListModelQualityJobDefinitionsResponse"
+
+
+class ModelQualityAppSpecificationView(ShapeView):
+    """Read-only view of ModelQualityAppSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image_uri",
+        "container_entrypoint",
+        "container_arguments",
+        "record_preprocessor_source_uri",
+        "post_analytics_processor_source_uri",
+        "problem_type",
+        "environment",
+    )
+    _shape = "ModelQualityAppSpecification"
+
+
+class ModelQualityBaselineConfigView(ShapeView):
+    """Read-only view of ModelQualityBaselineConfig, see ShapeView."""
+
+    __slots__ = (
+        "baselining_job_name",
+        "constraints_resource",
+    )
+    _shape = "ModelQualityBaselineConfig"
+
+
+class ModelQualityJobInputView(ShapeView):
+    """Read-only view of ModelQualityJobInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_input",
+        "batch_transform_input",
+        "ground_truth_s3_input",
+    )
+    _shape = "ModelQualityJobInput"
@@ -0,0 +1,233 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateMonitoringScheduleRequestView(ShapeView):
+    """Read-only view of CreateMonitoringScheduleRequest, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "monitoring_schedule_config",
+        "tags",
+    )
+    _shape = "CreateMonitoringScheduleRequest"
+
+
+class CreateMonitoringScheduleResponseView(ShapeView):
+    """Read-only view of CreateMonitoringScheduleResponse, see ShapeView."""
+
+    __slots__ = ("monitoring_schedule_arn",)
+    _shape = "CreateMonitoringScheduleResponse"
+
+
+class DeleteMonitoringScheduleRequestView(ShapeView):
+    """Read-only view of DeleteMonitoringScheduleRequest, see ShapeView."""
+
+    __slots__ = ("monitoring_schedule_name",)
+    _shape = "DeleteMonitoringScheduleRequest"
+
+
+class DescribeMonitoringScheduleRequestView(ShapeView):
+    """Read-only view of DescribeMonitoringScheduleRequest, see ShapeView."""
+
+    __slots__ = ("monitoring_schedule_name",)
+    _shape = "DescribeMonitoringScheduleRequest"
+
+
+class DescribeMonitoringScheduleResponseView(ShapeView):
+    """Read-only view of DescribeMonitoringScheduleResponse, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_arn",
+        "monitoring_schedule_name",
+        "monitoring_schedule_status",
+        "monitoring_type",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "monitoring_schedule_config",
+        "endpoint_name",
+        "last_monitoring_execution_summary",
+    )
+    _shape = "DescribeMonitoringScheduleResponse"
+
+
+class ListMonitoringSchedulesRequestView(ShapeView):
+    """Read-only view of ListMonitoringSchedulesRequest, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+        "status_equals",
+        "monitoring_job_definition_name",
+        "monitoring_type_equals",
+    )
+    _shape = "ListMonitoringSchedulesRequest"
+
+
+class ListMonitoringSchedulesResponseView(ShapeView):
+    """Read-only view of ListMonitoringSchedulesResponse, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_summaries",
+        "next_token",
+    )
+    _shape = "ListMonitoringSchedulesResponse"
+
+
+class MonitoringAppSpecificationView(ShapeView):
+    """Read-only view of MonitoringAppSpecification, see ShapeView."""
+
+    __slots__ = (
+        "image_uri",
+        "container_entrypoint",
+        "container_arguments",
+        "record_preprocessor_source_uri",
+        "post_analytics_processor_source_uri",
+    )
+    _shape = "MonitoringAppSpecification"
+
+
+class MonitoringBaselineConfigView(ShapeView):
+    """Read-only view of MonitoringBaselineConfig, see ShapeView."""
+
+    __slots__ = (
+        "baselining_job_name",
+        "constraints_resource",
+        "statistics_resource",
+    )
+    _shape = "MonitoringBaselineConfig"
+
+
+class MonitoringExecutionSummaryView(ShapeView):
+    """Read-only view of MonitoringExecutionSummary, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "scheduled_time",
+        "creation_time",
+        "last_modified_time",
+        "monitoring_execution_status",
+        "processing_job_arn",
+        "endpoint_name",
+        "failure_reason",
+        "monitoring_job_definition_name",
+        "monitoring_type",
+    )
+    _shape = "MonitoringExecutionSummary"
+
+
+class MonitoringInputView(ShapeView):
+    """Read-only view of MonitoringInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_input",
+        "batch_transform_input",
+    )
+    _shape = "MonitoringInput"
+
+
+class MonitoringJobDefinitionView(ShapeView):
+    """Read-only view of MonitoringJobDefinition, see ShapeView."""
+
+    __slots__ = (
+        "baseline_config",
+        "monitoring_inputs",
+        "monitoring_output_config",
+        "monitoring_resources",
+        "monitoring_app_specification",
+        "stopping_condition",
+        "environment",
+        "network_config",
+        "role_arn",
+    )
+    _shape = "MonitoringJobDefinition"
+
+
+class MonitoringScheduleConfigView(ShapeView):
+    """Read-only view of MonitoringScheduleConfig, see ShapeView."""
+
+    __slots__ = (
+        "schedule_config",
+        "monitoring_job_definition",
+        "monitoring_job_definition_name",
+        "monitoring_type",
+    )
+    _shape = "MonitoringScheduleConfig"
+
+
+class MonitoringScheduleSummaryView(ShapeView):
+    """Read-only view of MonitoringScheduleSummary, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "monitoring_schedule_arn",
+        "creation_time",
+        "last_modified_time",
+        "monitoring_schedule_status",
+        "endpoint_name",
+        "monitoring_job_definition_name",
+        "monitoring_type",
+    )
+    _shape = "MonitoringScheduleSummary"
+
+
+class ScheduleConfigView(ShapeView):
+    """Read-only view of ScheduleConfig, see ShapeView."""
+
+    __slots__ = (
+        "schedule_expression",
+        "data_analysis_start_time",
+        "data_analysis_end_time",
+    )
+    _shape = "ScheduleConfig"
+
+
+class StartMonitoringScheduleRequestView(ShapeView):
+    """Read-only view of StartMonitoringScheduleRequest, see ShapeView."""
+
+    __slots__ = ("monitoring_schedule_name",)
+    _shape = "StartMonitoringScheduleRequest"
+
+
+class StopMonitoringScheduleRequestView(ShapeView):
+    """Read-only view of StopMonitoringScheduleRequest, see ShapeView."""
+
+    __slots__ = ("monitoring_schedule_name",)
+    _shape = "StopMonitoringScheduleRequest"
+
+
+class UpdateMonitoringScheduleRequestView(ShapeView):
+    """Read-only view of UpdateMonitoringScheduleRequest, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "monitoring_schedule_config",
+    )
+    _shape = "UpdateMonitoringScheduleRequest"
+
+
+class UpdateMonitoringScheduleResponseView(ShapeView):
+    """Read-only view of UpdateMonitoringScheduleResponse, see ShapeView."""
+
+    __slots__ = ("monitoring_schedule_arn",)
+    _shape = "UpdateMonitoringScheduleResponse"
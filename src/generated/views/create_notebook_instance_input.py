@@ -0,0 +1,180 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateNotebookInstanceInputView(ShapeView):
+    """Read-only view of CreateNotebookInstanceInput, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_name",
+        "instance_type",
+        "subnet_id",
+        "security_group_ids",
+        "role_arn",
+        "kms_key_id",
+        "tags",
+        "lifecycle_config_name",
+        "direct_internet_access",
+        "volume_size_in_g_b",
+        "accelerator_types",
+        "default_code_repository",
+        "additional_code_repositories",
+        "root_access",
+        "platform_identifier",
+        "instance_metadata_service_configuration",
+    )
+    _shape = "CreateNotebookInstanceInput"
+
+
+class CreateNotebookInstanceOutputView(ShapeView):
+    """Read-only view of CreateNotebookInstanceOutput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_arn",)
+    _shape = "CreateNotebookInstanceOutput"
+
+
+class DeleteNotebookInstanceInputView(ShapeView):
+    """Read-only view of DeleteNotebookInstanceInput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_name",)
+    _shape = "DeleteNotebookInstanceInput"
+
+
+class DescribeNotebookInstanceInputView(ShapeView):
+    """Read-only view of DescribeNotebookInstanceInput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_name",)
+    _shape = "DescribeNotebookInstanceInput"
+
+
+class DescribeNotebookInstanceOutputView(ShapeView):
+    """Read-only view of DescribeNotebookInstanceOutput, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_arn",
+        "notebook_instance_name",
+        "notebook_instance_status",
+        "failure_reason",
+        "url",
+        "instance_type",
+        "subnet_id",
+        "security_groups",
+        "role_arn",
+        "kms_key_id",
+        "network_interface_id",
+        "last_modified_time",
+        "creation_time",
+        "notebook_instance_lifecycle_config_name",
+        "direct_internet_access",
+        "volume_size_in_g_b",
+        "accelerator_types",
+        "default_code_repository",
+        "additional_code_repositories",
+        "root_access",
+        "platform_identifier",
+        "instance_metadata_service_configuration",
+    )
+    _shape = "DescribeNotebookInstanceOutput"
+
+
+class InstanceMetadataServiceConfigurationView(ShapeView):
+    """Read-only view of InstanceMetadataServiceConfiguration, see ShapeView."""
+
+    __slots__ = ("minimum_instance_metadata_service_version",)
+    _shape = "InstanceMetadataServiceConfiguration"
+
+
+class ListNotebookInstancesInputView(ShapeView):
+    """Read-only view of ListNotebookInstancesInput, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "sort_by",
+        "sort_order",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+        "status_equals",
+        "notebook_instance_lifecycle_config_name_contains",
+        "default_code_repository_contains",
+        "additional_code_repository_equals",
+    )
+    _shape = "ListNotebookInstancesInput"
+
+
+class ListNotebookInstancesOutputView(ShapeView):
+    """Read-only view of ListNotebookInstancesOutput, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "notebook_instances",
+    )
+    _shape = "ListNotebookInstancesOutput"
+
+
+class NotebookInstanceSummaryView(ShapeView):
+    """Read-only view of NotebookInstanceSummary, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_name",
+        "notebook_instance_arn",
+        "notebook_instance_status",
+        "url",
+        "instance_type",
+        "creation_time",
+        "last_modified_time",
+        "notebook_instance_lifecycle_config_name",
+        "default_code_repository",
+        "additional_code_repositories",
+    )
+    _shape = "NotebookInstanceSummary"
+
+
+class StartNotebookInstanceInputView(ShapeView):
+    """Read-only view of StartNotebookInstanceInput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_name",)
+    _shape = "StartNotebookInstanceInput"
+
+
+class StopNotebookInstanceInputView(ShapeView):
+    """Read-only view of StopNotebookInstanceInput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_name",)
+    _shape = "StopNotebookInstanceInput"
+
+
+class UpdateNotebookInstanceInputView(ShapeView):
+    """Read-only view of UpdateNotebookInstanceInput, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_name",
+        "instance_type",
+        "role_arn",
+        "lifecycle_config_name",
+        "disassociate_lifecycle_config",
+        "volume_size_in_g_b",
+        "default_code_repository",
+        "additional_code_repositories",
+        "accelerator_types",
+        "disassociate_accelerator_types",
+        "disassociate_default_code_repository",
+        "disassociate_additional_code_repositories",
+        "root_access",
+        "instance_metadata_service_configuration",
+    )
+    _shape = "UpdateNotebookInstanceInput"
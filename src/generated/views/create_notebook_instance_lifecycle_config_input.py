@@ -0,0 +1,116 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateNotebookInstanceLifecycleConfigInputView(ShapeView):
+    """Read-only view of CreateNotebookInstanceLifecycleConfigInput, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_lifecycle_config_name",
+        "on_create",
+        "on_start",
+    )
+    _shape = "CreateNotebookInstanceLifecycleConfigInput"
+
+
+class CreateNotebookInstanceLifecycleConfigOutputView(ShapeView):
+    """Read-only view of CreateNotebookInstanceLifecycleConfigOutput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_lifecycle_config_arn",)
+    _shape = "CreateNotebookInstanceLifecycleConfigOutput"
+
+
+class DeleteNotebookInstanceLifecycleConfigInputView(ShapeView):
+    """Read-only view of DeleteNotebookInstanceLifecycleConfigInput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_lifecycle_config_name",)
+    _shape = "DeleteNotebookInstanceLifecycleConfigInput"
+
+
+class DescribeNotebookInstanceLifecycleConfigInputView(ShapeView):
+    """Read-only view of DescribeNotebookInstanceLifecycleConfigInput, see ShapeView."""
+
+    __slots__ = ("notebook_instance_lifecycle_config_name",)
+    _shape = "DescribeNotebookInstanceLifecycleConfigInput"
+
+
+class DescribeNotebookInstanceLifecycleConfigOutputView(ShapeView):
+    """Read-only view of DescribeNotebookInstanceLifecycleConfigOutput, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_lifecycle_config_arn",
+        "notebook_instance_lifecycle_config_name",
+        "on_create",
+        "on_start",
+        "last_modified_time",
+        "creation_time",
+    )
+    _shape = "DescribeNotebookInstanceLifecycleConfigOutput"
+
+
+class ListNotebookInstanceLifecycleConfigsInputView(ShapeView):
+    """Read-only view of ListNotebookInstanceLifecycleConfigsInput, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "sort_by",
+        "sort_order",
+        "name_contains",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+    )
+    _shape = "ListNotebookInstanceLifecycleConfigsInput"
+
+
+class ListNotebookInstanceLifecycleConfigsOutputView(ShapeView):
+    """Read-only view of ListNotebookInstanceLifecycleConfigsOutput, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "notebook_instance_lifecycle_configs",
+    )
+    _shape = "ListNotebookInstanceLifecycleConfigsOutput"
+
+
+class NotebookInstanceLifecycleConfigSummaryView(ShapeView):
+    """Read-only view of NotebookInstanceLifecycleConfigSummary, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_lifecycle_config_name",
+        "notebook_instance_lifecycle_config_arn",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "NotebookInstanceLifecycleConfigSummary"
+
+
+class NotebookInstanceLifecycleHookView(ShapeView):
+    """Read-only view of NotebookInstanceLifecycleHook, see ShapeView."""
+
+    __slots__ = ("content",)
+    _shape = "NotebookInstanceLifecycleHook"
+
+
+class UpdateNotebookInstanceLifecycleConfigInputView(ShapeView):
+    """Read-only view of UpdateNotebookInstanceLifecycleConfigInput, see ShapeView."""
+
+    __slots__ = (
+        "notebook_instance_lifecycle_config_name",
+        "on_create",
+        "on_start",
+    )
+    _shape = "UpdateNotebookInstanceLifecycleConfigInput"
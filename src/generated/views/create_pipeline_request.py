@@ -0,0 +1,156 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreatePipelineRequestView(ShapeView):
+    """Read-only view of CreatePipelineRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_name",
+        "pipeline_display_name",
+        "pipeline_definition",
+        "pipeline_definition_s3_location",
+        "pipeline_description",
+        "client_request_token",
+        "role_arn",
+        "tags",
+        "parallelism_configuration",
+    )
+    _shape = "CreatePipelineRequest"
+
+
+class CreatePipelineResponseView(ShapeView):
+    """Read-only view of CreatePipelineResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_arn",)
+    _shape = "CreatePipelineResponse"
+
+
+class DeletePipelineRequestView(ShapeView):
+    """Read-only view of DeletePipelineRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_name",
+        "client_request_token",
+    )
+    _shape = "DeletePipelineRequest"
+
+
+class DeletePipelineResponseView(ShapeView):
+    """Read-only view of DeletePipelineResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_arn",)
+    _shape = "DeletePipelineResponse"
+
+
+class DescribePipelineRequestView(ShapeView):
+    """Read-only view of DescribePipelineRequest, see ShapeView."""
+
+    __slots__ = ("pipeline_name",)
+    _shape = "DescribePipelineRequest"
+
+
+class DescribePipelineResponseView(ShapeView):
+    """Read-only view of DescribePipelineResponse, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_arn",
+        "pipeline_name",
+        "pipeline_display_name",
+        "pipeline_definition",
+        "pipeline_description",
+        "role_arn",
+        "pipeline_status",
+        "creation_time",
+        "last_modified_time",
+        "last_run_time",
+        "created_by",
+        "last_modified_by",
+        "parallelism_configuration",
+    )
+    _shape = "DescribePipelineResponse"
+
+
+class ListPipelinesRequestView(ShapeView):
+    """Read-only view of ListPipelinesRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_name_prefix",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListPipelinesRequest"
+
+
+class ListPipelinesResponseView(ShapeView):
+    """Read-only view of ListPipelinesResponse, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_summaries",
+        "next_token",
+    )
+    _shape = "ListPipelinesResponse"
+
+
+class PipelineDefinitionS3LocationView(ShapeView):
+    """Read-only view of PipelineDefinitionS3Location, see ShapeView."""
+
+    __slots__ = (
+        "bucket",
+        "object_key",
+        "version_id",
+    )
+    _shape = "PipelineDefinitionS3Location"
+
+
+class PipelineSummaryView(ShapeView):
+    """Read-only view of PipelineSummary, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_arn",
+        "pipeline_name",
+        "pipeline_display_name",
+        "pipeline_description",
+        "role_arn",
+        "creation_time",
+        "last_modified_time",
+        "last_execution_time",
+    )
+    _shape = "PipelineSummary"
+
+
+class UpdatePipelineRequestView(ShapeView):
+    """Read-only view of UpdatePipelineRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_name",
+        "pipeline_display_name",
+        "pipeline_definition",
+        "pipeline_definition_s3_location",
+        "pipeline_description",
+        "role_arn",
+        "parallelism_configuration",
+    )
+    _shape = "UpdatePipelineRequest"
+
+
+class UpdatePipelineResponseView(ShapeView):
+    """Read-only view of UpdatePipelineResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_arn",)
+    _shape = "UpdatePipelineResponse"
@@ -0,0 +1,34 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreatePresignedDomainUrlRequestView(ShapeView):
+    """Read-only view of CreatePresignedDomainUrlRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "session_expiration_duration_in_seconds",
+        "expires_in_seconds",
+        "space_name",
+        "landing_uri",
+    )
+    _shape = "CreatePresignedDomainUrlRequest"
+
+
+class CreatePresignedDomainUrlResponseView(ShapeView):
+    """Read-only view of CreatePresignedDomainUrlResponse, see ShapeView."""
+
+    __slots__ = ("authorized_url",)
+    _shape = "CreatePresignedDomainUrlResponse"
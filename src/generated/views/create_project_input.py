@@ -0,0 +1,168 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateProjectInputView(ShapeView):
+    """Read-only view of CreateProjectInput, see ShapeView."""
+
+    __slots__ = (
+        "project_name",
+        "project_description",
+        "service_catalog_provisioning_details",
+        "tags",
+    )
+    _shape = "CreateProjectInput"
+
+
+class CreateProjectOutputView(ShapeView):
+    """Read-only view of CreateProjectOutput, see ShapeView."""
+
+    __slots__ = (
+        "project_arn",
+        "project_id",
+    )
+    _shape = "CreateProjectOutput"
+
+
+class DeleteProjectInputView(ShapeView):
+    """Read-only view of DeleteProjectInput, see ShapeView."""
+
+    __slots__ = ("project_name",)
+    _shape = "DeleteProjectInput"
+
+
+class DescribeProjectInputView(ShapeView):
+    """Read-only view of DescribeProjectInput, see ShapeView."""
+
+    __slots__ = ("project_name",)
+    _shape = "DescribeProjectInput"
+
+
+class DescribeProjectOutputView(ShapeView):
+    """Read-only view of DescribeProjectOutput, see ShapeView."""
+
+    __slots__ = (
+        "project_arn",
+        "project_name",
+        "project_id",
+        "project_description",
+        "service_catalog_provisioning_details",
+        "service_catalog_provisioned_product_details",
+        "project_status",
+        "created_by",
+        "creation_time",
+        "last_modified_time",
+        "last_modified_by",
+    )
+    _shape = "DescribeProjectOutput"
+
+
+class ListProjectsInputView(ShapeView):
+    """Read-only view of ListProjectsInput, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "name_contains",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListProjectsInput"
+
+
+class ListProjectsOutputView(ShapeView):
+    """Read-only view of ListProjectsOutput, see ShapeView."""
+
+    __slots__ = (
+        "project_summary_list",
+        "next_token",
+    )
+    _shape = "ListProjectsOutput"
+
+
+class ProjectSummaryView(ShapeView):
+    """Read-only view of ProjectSummary, see ShapeView."""
+
+    __slots__ = (
+        "project_name",
+        "project_description",
+        "project_arn",
+        "project_id",
+        "creation_time",
+        "project_status",
+    )
+    _shape = "ProjectSummary"
+
+
+class ProvisioningParameterView(ShapeView):
+    """Read-only view of ProvisioningParameter, see ShapeView."""
+
+    __slots__ = (
+        "key",
+        "value",
+    )
+    _shape = "ProvisioningParameter"
+
+
+class ServiceCatalogProvisionedProductDetailsView(ShapeView):
+    """Read-only view of ServiceCatalogProvisionedProductDetails, see ShapeView."""
+
+    __slots__ = (
+        "provisioned_product_id",
+        "provisioned_product_status_message",
+    )
+    _shape = "ServiceCatalogProvisionedProductDetails"
+
+
+class ServiceCatalogProvisioningDetailsView(ShapeView):
+    """Read-only view of ServiceCatalogProvisioningDetails, see ShapeView."""
+
+    __slots__ = (
+        "product_id",
+        "provisioning_artifact_id",
+        "path_id",
+        "provisioning_parameters",
+    )
+    _shape = "ServiceCatalogProvisioningDetails"
+
+
+class ServiceCatalogProvisioningUpdateDetailsView(ShapeView):
+    """Read-only view of ServiceCatalogProvisioningUpdateDetails, see ShapeView."""
+
+    __slots__ = (
+        "provisioning_artifact_id",
+        "provisioning_parameters",
+    )
+    _shape = "ServiceCatalogProvisioningUpdateDetails"
+
+
+class UpdateProjectInputView(ShapeView):
+    """Read-only view of UpdateProjectInput, see ShapeView."""
+
+    __slots__ = (
+        "project_name",
+        "project_description",
+        "service_catalog_provisioning_update_details",
+        "tags",
+    )
+    _shape = "UpdateProjectInput"
+
+
+class UpdateProjectOutputView(ShapeView):
+    """Read-only view of UpdateProjectOutput, see ShapeView."""
+
+    __slots__ = ("project_arn",)
+    _shape = "UpdateProjectOutput"
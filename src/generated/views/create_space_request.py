@@ -0,0 +1,234 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateSpaceRequestView(ShapeView):
+    """Read-only view of CreateSpaceRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "space_name",
+        "tags",
+        "space_settings",
+        "ownership_settings",
+        "space_sharing_settings",
+        "space_display_name",
+    )
+    _shape = "CreateSpaceRequest"
+
+
+class CreateSpaceResponseView(ShapeView):
+    """Read-only view of CreateSpaceResponse, see ShapeView."""
+
+    __slots__ = ("space_arn",)
+    _shape = "CreateSpaceResponse"
+
+
+class CustomFileSystemView(ShapeView):
+    """Read-only view of CustomFileSystem, see ShapeView."""
+
+    __slots__ = ("e_f_s_file_system",)
+    _shape = "CustomFileSystem"
+
+
+class DeleteSpaceRequestView(ShapeView):
+    """Read-only view of DeleteSpaceRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "space_name",
+    )
+    _shape = "DeleteSpaceRequest"
+
+
+class DescribeSpaceRequestView(ShapeView):
+    """Read-only view of DescribeSpaceRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "space_name",
+    )
+    _shape = "DescribeSpaceRequest"
+
+
+class DescribeSpaceResponseView(ShapeView):
+    """Read-only view of DescribeSpaceResponse, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "space_arn",
+        "space_name",
+        "home_efs_file_system_uid",
+        "status",
+        "last_modified_time",
+        "creation_time",
+        "failure_reason",
+        "space_settings",
+        "ownership_settings",
+        "space_sharing_settings",
+        "space_display_name",
+        "url",
+    )
+    _shape = "DescribeSpaceResponse"
+
+
+class EFSFileSystemView(ShapeView):
+    """Read-only view of EFSFileSystem, see ShapeView."""
+
+    __slots__ = ("file_system_id",)
+    _shape = "EFSFileSystem"
+
+
+class EbsStorageSettingsView(ShapeView):
+    """Read-only view of EbsStorageSettings, see ShapeView."""
+
+    __slots__ = ("ebs_volume_size_in_gb",)
+    _shape = "EbsStorageSettings"
+
+
+class ListSpacesRequestView(ShapeView):
+    """Read-only view of ListSpacesRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "sort_order",
+        "sort_by",
+        "domain_id_equals",
+        "space_name_contains",
+    )
+    _shape = "ListSpacesRequest"
+
+
+class ListSpacesResponseView(ShapeView):
+    """Read-only view of ListSpacesResponse, see ShapeView."""
+
+    __slots__ = (
+        "spaces",
+        "next_token",
+    )
+    _shape = "ListSpacesResponse"
+
+
+class OwnershipSettingsView(ShapeView):
+    """Read-only view of OwnershipSettings, see ShapeView."""
+
+    __slots__ = ("owner_user_profile_name",)
+    _shape = "OwnershipSettings"
+
+
+class OwnershipSettingsSummaryView(ShapeView):
+    """Read-only view of OwnershipSettingsSummary, see ShapeView."""
+
+    __slots__ = ("owner_user_profile_name",)
+    _shape = "OwnershipSettingsSummary"
+
+
+class SpaceCodeEditorAppSettingsView(ShapeView):
+    """Read-only view of SpaceCodeEditorAppSettings, see ShapeView."""
+
+    __slots__ = ("default_resource_spec",)
+    _shape = "SpaceCodeEditorAppSettings"
+
+
+class SpaceDetailsView(ShapeView):
+    """Read-only view of SpaceDetails, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "space_name",
+        "status",
+        "creation_time",
+        "last_modified_time",
+        "space_settings_summary",
+        "space_sharing_settings_summary",
+        "ownership_settings_summary",
+        "space_display_name",
+    )
+    _shape = "SpaceDetails"
+
+
+class SpaceJupyterLabAppSettingsView(ShapeView):
+    """Read-only view of SpaceJupyterLabAppSettings, see ShapeView."""
+
+    __slots__ = (
+        "default_resource_spec",
+        "code_repositories",
+    )
+    _shape = "SpaceJupyterLabAppSettings"
+
+
+class SpaceSettingsView(ShapeView):
+    """Read-only view of SpaceSettings, see ShapeView."""
+
+    __slots__ = (
+        "jupyter_server_app_settings",
+        "kernel_gateway_app_settings",
+        "code_editor_app_settings",
+        "jupyter_lab_app_settings",
+        "app_type",
+        "space_storage_settings",
+        "custom_file_systems",
+    )
+    _shape = "SpaceSettings"
+
+
+class SpaceSettingsSummaryView(ShapeView):
+    """Read-only view of SpaceSettingsSummary, see ShapeView."""
+
+    __slots__ = (
+        "app_type",
+        "space_storage_settings",
+    )
+    _shape = "SpaceSettingsSummary"
+
+
+class SpaceSharingSettingsView(ShapeView):
+    """Read-only view of SpaceSharingSettings, see ShapeView."""
+
+    __slots__ = ("sharing_type",)
+    _shape = "SpaceSharingSettings"
+
+
+class SpaceSharingSettingsSummaryView(ShapeView):
+    """Read-only view of SpaceSharingSettingsSummary, see ShapeView."""
+
+    __slots__ = ("sharing_type",)
+    _shape = "SpaceSharingSettingsSummary"
+
+
+class SpaceStorageSettingsView(ShapeView):
+    """Read-only view of SpaceStorageSettings, see ShapeView."""
+
+    __slots__ = ("ebs_storage_settings",)
+    _shape = "SpaceStorageSettings"
+
+
+class UpdateSpaceRequestView(ShapeView):
+    """Read-only view of UpdateSpaceRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "space_name",
+        "space_settings",
+        "space_display_name",
+    )
+    _shape = "UpdateSpaceRequest"
+
+
+class UpdateSpaceResponseView(ShapeView):
+    """Read-only view of UpdateSpaceResponse, see ShapeView."""
+
+    __slots__ = ("space_arn",)
+    _shape = "UpdateSpaceResponse"
@@ -0,0 +1,101 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateStudioLifecycleConfigRequestView(ShapeView):
+    """Read-only view of CreateStudioLifecycleConfigRequest, see ShapeView."""
+
+    __slots__ = (
+        "studio_lifecycle_config_name",
+        "studio_lifecycle_config_content",
+        "studio_lifecycle_config_app_type",
+        "tags",
+    )
+    _shape = "CreateStudioLifecycleConfigRequest"
+
+
+class CreateStudioLifecycleConfigResponseView(ShapeView):
+    """Read-only view of CreateStudioLifecycleConfigResponse, see ShapeView."""
+
+    __slots__ = ("studio_lifecycle_config_arn",)
+    _shape = "CreateStudioLifecycleConfigResponse"
+
+
+class DeleteStudioLifecycleConfigRequestView(ShapeView):
+    """Read-only view of DeleteStudioLifecycleConfigRequest, see ShapeView."""
+
+    __slots__ = ("studio_lifecycle_config_name",)
+    _shape = "DeleteStudioLifecycleConfigRequest"
+
+
+class DescribeStudioLifecycleConfigRequestView(ShapeView):
+    """Read-only view of DescribeStudioLifecycleConfigRequest, see ShapeView."""
+
+    __slots__ = ("studio_lifecycle_config_name",)
+    _shape = "DescribeStudioLifecycleConfigRequest"
+
+
+class DescribeStudioLifecycleConfigResponseView(ShapeView):
+    """Read-only view of DescribeStudioLifecycleConfigResponse, see ShapeView."""
+
+    __slots__ = (
+        "studio_lifecycle_config_arn",
+        "studio_lifecycle_config_name",
+        "creation_time",
+        "last_modified_time",
+        "studio_lifecycle_config_content",
+        "studio_lifecycle_config_app_type",
+    )
+    _shape = "DescribeStudioLifecycleConfigResponse"
+
+
+class ListStudioLifecycleConfigsRequestView(ShapeView):
+    """Read-only view of ListStudioLifecycleConfigsRequest, see ShapeView."""
+
+    __slots__ = (
+        "max_results",
+        "next_token",
+        "name_contains",
+        "app_type_equals",
+        "creation_time_before",
+        "creation_time_after",
+        "modified_time_before",
+        "modified_time_after",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListStudioLifecycleConfigsRequest"
+
+
+class ListStudioLifecycleConfigsResponseView(ShapeView):
+    """Read-only view of ListStudioLifecycleConfigsResponse, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "studio_lifecycle_configs",
+    )
+    _shape = "ListStudioLifecycleConfigsResponse"
+
+
+class StudioLifecycleConfigDetailsView(ShapeView):
+    """Read-only view of StudioLifecycleConfigDetails, see ShapeView."""
+
+    __slots__ = (
+        "studio_lifecycle_config_arn",
+        "studio_lifecycle_config_name",
+        "creation_time",
+        "last_modified_time",
+        "studio_lifecycle_config_app_type",
+    )
+    _shape = "StudioLifecycleConfigDetails"
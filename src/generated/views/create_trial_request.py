@@ -0,0 +1,139 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateTrialRequestView(ShapeView):
+    """Read-only view of CreateTrialRequest, see ShapeView."""
+
+    __slots__ = (
+        "trial_name",
+        "display_name",
+        "experiment_name",
+        "metadata_properties",
+        "tags",
+    )
+    _shape = "CreateTrialRequest"
+
+
+class CreateTrialResponseView(ShapeView):
+    """Read-only view of CreateTrialResponse, see ShapeView."""
+
+    __slots__ = ("trial_arn",)
+    _shape = "CreateTrialResponse"
+
+
+class DeleteTrialRequestView(ShapeView):
+    """Read-only view of DeleteTrialRequest, see ShapeView."""
+
+    __slots__ = ("trial_name",)
+    _shape = "DeleteTrialRequest"
+
+
+class DeleteTrialResponseView(ShapeView):
+    """Read-only view of DeleteTrialResponse, see ShapeView."""
+
+    __slots__ = ("trial_arn",)
+    _shape = "DeleteTrialResponse"
+
+
+class DescribeTrialRequestView(ShapeView):
+    """Read-only view of DescribeTrialRequest, see ShapeView."""
+
+    __slots__ = ("trial_name",)
+    _shape = "DescribeTrialRequest"
+
+
+class DescribeTrialResponseView(ShapeView):
+    """Read-only view of DescribeTrialResponse, see ShapeView."""
+
+    __slots__ = (
+        "trial_name",
+        "trial_arn",
+        "display_name",
+        "experiment_name",
+        "source",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "metadata_properties",
+    )
+    _shape = "DescribeTrialResponse"
+
+
+class ListTrialsRequestView(ShapeView):
+    """Read-only view of ListTrialsRequest, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "trial_component_name",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListTrialsRequest"
+
+
+class ListTrialsResponseView(ShapeView):
+    """Read-only view of ListTrialsResponse, see ShapeView."""
+
+    __slots__ = (
+        "trial_summaries",
+        "next_token",
+    )
+    _shape = "ListTrialsResponse"
+
+
+class TrialSourceView(ShapeView):
+    """Read-only view of TrialSource, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "source_type",
+    )
+    _shape = "TrialSource"
+
+
+class TrialSummaryView(ShapeView):
+    """Read-only view of TrialSummary, see ShapeView."""
+
+    __slots__ = (
+        "trial_arn",
+        "trial_name",
+        "display_name",
+        "trial_source",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "TrialSummary"
+
+
+class UpdateTrialRequestView(ShapeView):
+    """Read-only view of UpdateTrialRequest, see ShapeView."""
+
+    __slots__ = (
+        "trial_name",
+        "display_name",
+    )
+    _shape = "UpdateTrialRequest"
+
+
+class UpdateTrialResponseView(ShapeView):
+    """Read-only view of UpdateTrialResponse, see ShapeView."""
+
+    __slots__ = ("trial_arn",)
+    _shape = "UpdateTrialResponse"
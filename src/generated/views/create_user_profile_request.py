@@ -0,0 +1,128 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CreateUserProfileRequestView(ShapeView):
+    """Read-only view of CreateUserProfileRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "single_sign_on_user_identifier",
+        "single_sign_on_user_value",
+        "tags",
+        "user_settings",
+    )
+    _shape = "CreateUserProfileRequest"
+
+
+class CreateUserProfileResponseView(ShapeView):
+    """Read-only view of CreateUserProfileResponse, see ShapeView."""
+
+    __slots__ = ("user_profile_arn",)
+    _shape = "CreateUserProfileResponse"
+
+
+class DeleteUserProfileRequestView(ShapeView):
+    """Read-only view of DeleteUserProfileRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+    )
+    _shape = "DeleteUserProfileRequest"
+
+
+class DescribeUserProfileRequestView(ShapeView):
+    """Read-only view of DescribeUserProfileRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+    )
+    _shape = "DescribeUserProfileRequest"
+
+
+class DescribeUserProfileResponseView(ShapeView):
+    """Read-only view of DescribeUserProfileResponse, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_arn",
+        "user_profile_name",
+        "home_efs_file_system_uid",
+        "status",
+        "last_modified_time",
+        "creation_time",
+        "failure_reason",
+        "single_sign_on_user_identifier",
+        "single_sign_on_user_value",
+        "user_settings",
+    )
+    _shape = "DescribeUserProfileResponse"
+
+
+class ListUserProfilesRequestView(ShapeView):
+    """Read-only view of ListUserProfilesRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "sort_order",
+        "sort_by",
+        "domain_id_equals",
+        "user_profile_name_contains",
+    )
+    _shape = "ListUserProfilesRequest"
+
+
+class ListUserProfilesResponseView(ShapeView):
+    """Read-only view of ListUserProfilesResponse, see ShapeView."""
+
+    __slots__ = (
+        "user_profiles",
+        "next_token",
+    )
+    _shape = "ListUserProfilesResponse"
+
+
+class UpdateUserProfileRequestView(ShapeView):
+    """Read-only view of UpdateUserProfileRequest, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "user_settings",
+    )
+    _shape = "UpdateUserProfileRequest"
+
+
+class UpdateUserProfileResponseView(ShapeView):
+    """Read-only view of UpdateUserProfileResponse, see ShapeView."""
+
+    __slots__ = ("user_profile_arn",)
+    _shape = "UpdateUserProfileResponse"
+
+
+class UserProfileDetailsView(ShapeView):
+    """Read-only view of UserProfileDetails, see ShapeView."""
+
+    __slots__ = (
+        "domain_id",
+        "user_profile_name",
+        "status",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "UserProfileDetails"
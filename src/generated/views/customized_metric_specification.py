@@ -0,0 +1,119 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class CustomizedMetricSpecificationView(ShapeView):
+    """Read-only view of CustomizedMetricSpecification, see ShapeView."""
+
+    __slots__ = (
+        "metric_name",
+        "namespace",
+        "statistic",
+    )
+    _shape = "CustomizedMetricSpecification"
+
+
+class DynamicScalingConfigurationView(ShapeView):
+    """Read-only view of DynamicScalingConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "min_capacity",
+        "max_capacity",
+        "scale_in_cooldown",
+        "scale_out_cooldown",
+        "scaling_policies",
+    )
+    _shape = "DynamicScalingConfiguration"
+
+
+class GetScalingConfigurationRecommendationRequestView(ShapeView):
+    """Read-only view of GetScalingConfigurationRecommendationRequest, see ShapeView."""
+
+    __slots__ = (
+        "inference_recommendations_job_name",
+        "recommendation_id",
+        "endpoint_name",
+        "target_cpu_utilization_per_core",
+        "scaling_policy_objective",
+    )
+    _shape = "GetScalingConfigurationRecommendationRequest"
+
+
+class GetScalingConfigurationRecommendationResponseView(ShapeView):
+    """Read-only view of GetScalingConfigurationRecommendationResponse, see ShapeView."""
+
+    __slots__ = (
+        "inference_recommendations_job_name",
+        "recommendation_id",
+        "endpoint_name",
+        "target_cpu_utilization_per_core",
+        "scaling_policy_objective",
+        "metric",
+        "dynamic_scaling_configuration",
+    )
+    _shape = "GetScalingConfigurationRecommendationResponse"
+
+
+class MetricSpecificationView(ShapeView):
+    """Read-only view of MetricSpecification, see ShapeView."""
+
+    __slots__ = (
+        "predefined",
+        "customized",
+    )
+    _shape = "MetricSpecification"
+
+
+class PredefinedMetricSpecificationView(ShapeView):
+    """Read-only view of PredefinedMetricSpecification, see ShapeView."""
+
+    __slots__ = ("predefined_metric_type",)
+    _shape = "PredefinedMetricSpecification"
+
+
+class ScalingPolicyView(ShapeView):
+    """Read-only view of ScalingPolicy, see ShapeView."""
+
+    __slots__ = ("target_tracking",)
+    _shape = "ScalingPolicy"
+
+
+class ScalingPolicyMetricView(ShapeView):
+    """Read-only view of ScalingPolicyMetric, see ShapeView."""
+
+    __slots__ = (
+        "invocations_per_instance",
+        "model_latency",
+    )
+    _shape = "ScalingPolicyMetric"
+
+
+class ScalingPolicyObjectiveView(ShapeView):
+    """Read-only view of ScalingPolicyObjective, see ShapeView."""
+
+    __slots__ = (
+        "min_invocations_per_minute",
+        "max_invocations_per_minute",
+    )
+    _shape = "ScalingPolicyObjective"
+
+
+class TargetTrackingScalingPolicyConfigurationView(ShapeView):
+    """Read-only view of TargetTrackingScalingPolicyConfiguration, see ShapeView."""
+
+    __slots__ = (
+        "metric_specification",
+        "target_value",
+    )
+    _shape = "TargetTrackingScalingPolicyConfiguration"
@@ -0,0 +1,146 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class DeleteHubContentRequestView(ShapeView):
+    """Read-only view of DeleteHubContentRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_content_type",
+        "hub_content_name",
+        "hub_content_version",
+    )
+    _shape = "DeleteHubContentRequest"
+
+
+class DescribeHubContentRequestView(ShapeView):
+    """Read-only view of DescribeHubContentRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_content_type",
+        "hub_content_name",
+        "hub_content_version",
+    )
+    _shape = "DescribeHubContentRequest"
+
+
+class DescribeHubContentResponseView(ShapeView):
+    """Read-only view of DescribeHubContentResponse, see ShapeView."""
+
+    __slots__ = (
+        "hub_content_name",
+        "hub_content_arn",
+        "hub_content_version",
+        "hub_content_type",
+        "document_schema_version",
+        "hub_name",
+        "hub_arn",
+        "hub_content_display_name",
+        "hub_content_description",
+        "hub_content_markdown",
+        "hub_content_document",
+        "hub_content_search_keywords",
+        "hub_content_dependencies",
+        "hub_content_status",
+        "failure_reason",
+        "creation_time",
+    )
+    _shape = "DescribeHubContentResponse"
+
+
+class HubContentDependencyView(ShapeView):
+    """Read-only view of HubContentDependency, see ShapeView."""
+
+    __slots__ = (
+        "dependency_origin_path",
+        "dependency_copy_path",
+    )
+    _shape = "HubContentDependency"
+
+
+class HubContentInfoView(ShapeView):
+    """Read-only view of HubContentInfo, see ShapeView."""
+
+    __slots__ = (
+        "hub_content_name",
+        "hub_content_arn",
+        "hub_content_version",
+        "hub_content_type",
+        "document_schema_version",
+        "hub_content_display_name",
+        "hub_content_description",
+        "hub_content_search_keywords",
+        "hub_content_status",
+        "creation_time",
+    )
+    _shape = "HubContentInfo"
+
+
+class ImportHubContentRequestView(ShapeView):
+    """Read-only view of ImportHubContentRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_content_name",
+        "hub_content_version",
+        "hub_content_type",
+        "document_schema_version",
+        "hub_name",
+        "hub_content_display_name",
+        "hub_content_description",
+        "hub_content_markdown",
+        "hub_content_document",
+        "hub_content_search_keywords",
+        "tags",
+    )
+    _shape = "ImportHubContentRequest"
+
+
+class ImportHubContentResponseView(ShapeView):
+    """Read-only view of ImportHubContentResponse, see ShapeView."""
+
+    __slots__ = (
+        "hub_arn",
+        "hub_content_arn",
+    )
+    _shape = "ImportHubContentResponse"
+
+
+class ListHubContentsRequestView(ShapeView):
+    """Read-only view of ListHubContentsRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_content_type",
+        "name_contains",
+        "max_schema_version",
+        "creation_time_before",
+        "creation_time_after",
+        "sort_by",
+        "sort_order",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListHubContentsRequest"
+
+
+class ListHubContentsResponseView(ShapeView):
+    """Read-only view of ListHubContentsResponse, see ShapeView."""
+
+    __slots__ = (
+        "hub_content_summaries",
+        "next_token",
+    )
+    _shape = "ListHubContentsResponse"
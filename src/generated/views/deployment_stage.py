@@ -0,0 +1,43 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class DeploymentStageView(ShapeView):
+    """Read-only view of DeploymentStage, see ShapeView."""
+
+    __slots__ = (
+        "stage_name",
+        "device_selection_config",
+        "deployment_config",
+    )
+    _shape = "DeploymentStage"
+
+
+class DeviceSelectionConfigView(ShapeView):
+    """Read-only view of DeviceSelectionConfig, see ShapeView."""
+
+    __slots__ = (
+        "device_subset_type",
+        "percentage",
+        "device_names",
+        "device_name_contains",
+    )
+    _shape = "DeviceSelectionConfig"
+
+
+class EdgeDeploymentConfigView(ShapeView):
+    """Read-only view of EdgeDeploymentConfig, see ShapeView."""
+
+    __slots__ = ("failure_handling_policy",)
+    _shape = "EdgeDeploymentConfig"
@@ -0,0 +1,147 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class DeregisterDevicesRequestView(ShapeView):
+    """Read-only view of DeregisterDevicesRequest, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_name",
+        "device_names",
+    )
+    _shape = "DeregisterDevicesRequest"
+
+
+class DeviceView(ShapeView):
+    """Read-only view of Device, see ShapeView."""
+
+    __slots__ = (
+        "device_name",
+        "description",
+        "iot_thing_name",
+    )
+    _shape = "Device"
+
+
+class DeviceDeploymentSummaryView(ShapeView):
+    """Read-only view of DeviceDeploymentSummary, see ShapeView."""
+
+    __slots__ = (
+        "edge_deployment_plan_arn",
+        "edge_deployment_plan_name",
+        "stage_name",
+        "deployed_stage_name",
+        "device_fleet_name",
+        "device_name",
+        "device_arn",
+        "device_deployment_status",
+        "device_deployment_status_message",
+        "description",
+        "deployment_start_time",
+    )
+    _shape = "DeviceDeploymentSummary"
+
+
+class DeviceSummaryView(ShapeView):
+    """Read-only view of DeviceSummary, see ShapeView."""
+
+    __slots__ = (
+        "device_name",
+        "device_arn",
+        "description",
+        "device_fleet_name",
+        "iot_thing_name",
+        "registration_time",
+        "latest_heartbeat",
+        "models",
+        "agent_version",
+    )
+    _shape = "DeviceSummary"
+
+
+class EdgeModelSummaryView(ShapeView):
+    """Read-only view of EdgeModelSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "model_version",
+    )
+    _shape = "EdgeModelSummary"
+
+
+class ListDevicesRequestView(ShapeView):
+    """Read-only view of ListDevicesRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "latest_heartbeat_after",
+        "model_name",
+        "device_fleet_name",
+    )
+    _shape = "ListDevicesRequest"
+
+
+class ListDevicesResponseView(ShapeView):
+    """Read-only view of ListDevicesResponse, see ShapeView."""
+
+    __slots__ = (
+        "device_summaries",
+        "next_token",
+    )
+    _shape = "ListDevicesResponse"
+
+
+class ListStageDevicesRequestView(ShapeView):
+    """Read-only view of ListStageDevicesRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "max_results",
+        "edge_deployment_plan_name",
+        "exclude_devices_deployed_in_other_stage",
+        "stage_name",
+    )
+    _shape = "ListStageDevicesRequest"
+
+
+class ListStageDevicesResponseView(ShapeView):
+    """Read-only view of ListStageDevicesResponse, see ShapeView."""
+
+    __slots__ = (
+        "device_deployment_summaries",
+        "next_token",
+    )
+    _shape = "ListStageDevicesResponse"
+
+
+class RegisterDevicesRequestView(ShapeView):
+    """Read-only view of RegisterDevicesRequest, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_name",
+        "devices",
+        "tags",
+    )
+    _shape = "RegisterDevicesRequest"
+
+
+class UpdateDevicesRequestView(ShapeView):
+    """Read-only view of UpdateDevicesRequest, see ShapeView."""
+
+    __slots__ = (
+        "device_fleet_name",
+        "devices",
+    )
+    _shape = "UpdateDevicesRequest"
@@ -0,0 +1,55 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class DescribeDeviceRequestView(ShapeView):
+    """Read-only view of DescribeDeviceRequest, see ShapeView."""
+
+    __slots__ = (
+        "next_token",
+        "device_name",
+        "device_fleet_name",
+    )
+    _shape = "DescribeDeviceRequest"
+
+
+class DescribeDeviceResponseView(ShapeView):
+    """Read-only view of DescribeDeviceResponse, see ShapeView."""
+
+    __slots__ = (
+        "device_arn",
+        "device_name",
+        "description",
+        "device_fleet_name",
+        "iot_thing_name",
+        "registration_time",
+        "latest_heartbeat",
+        "models",
+        "max_models",
+        "next_token",
+        "agent_version",
+    )
+    _shape = "DescribeDeviceResponse"
+
+
+class EdgeModelView(ShapeView):
+    """Read-only view of EdgeModel, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "model_version",
+        "latest_sample_time",
+        "latest_inference",
+    )
+    _shape = "EdgeModel"
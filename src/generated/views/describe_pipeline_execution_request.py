@@ -0,0 +1,193 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class DescribePipelineExecutionRequestView(ShapeView):
+    """Read-only view of DescribePipelineExecutionRequest, see ShapeView."""
+
+    __slots__ = ("pipeline_execution_arn",)
+    _shape = "DescribePipelineExecutionRequest"
+
+
+class DescribePipelineExecutionResponseView(ShapeView):
+    """Read-only view of DescribePipelineExecutionResponse, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_arn",
+        "pipeline_execution_arn",
+        "pipeline_execution_display_name",
+        "pipeline_execution_status",
+        "pipeline_execution_description",
+        "pipeline_experiment_config",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "created_by",
+        "last_modified_by",
+        "parallelism_configuration",
+        "selective_execution_config",
+    )
+    _shape = "DescribePipelineExecutionResponse"
+
+
+class ListPipelineExecutionsRequestView(ShapeView):
+    """Read-only view of ListPipelineExecutionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_name",
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListPipelineExecutionsRequest"
+
+
+class ListPipelineExecutionsResponseView(ShapeView):
+    """Read-only view of ListPipelineExecutionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_summaries",
+        "next_token",
+    )
+    _shape = "ListPipelineExecutionsResponse"
+
+
+class ParameterView(ShapeView):
+    """Read-only view of Parameter, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "value",
+    )
+    _shape = "Parameter"
+
+
+class PipelineExecutionSummaryView(ShapeView):
+    """Read-only view of PipelineExecutionSummary, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_arn",
+        "start_time",
+        "pipeline_execution_status",
+        "pipeline_execution_description",
+        "pipeline_execution_display_name",
+        "pipeline_execution_failure_reason",
+    )
+    _shape = "PipelineExecutionSummary"
+
+
+class PipelineExperimentConfigView(ShapeView):
+    """Read-only view of PipelineExperimentConfig, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "trial_name",
+    )
+    _shape = "PipelineExperimentConfig"
+
+
+class RetryPipelineExecutionRequestView(ShapeView):
+    """Read-only view of RetryPipelineExecutionRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_arn",
+        "client_request_token",
+        "parallelism_configuration",
+    )
+    _shape = "RetryPipelineExecutionRequest"
+
+
+class RetryPipelineExecutionResponseView(ShapeView):
+    """Read-only view of RetryPipelineExecutionResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_execution_arn",)
+    _shape = "RetryPipelineExecutionResponse"
+
+
+class SelectedStepView(ShapeView):
+    """Read-only view of SelectedStep, see ShapeView."""
+
+    __slots__ = ("step_name",)
+    _shape = "SelectedStep"
+
+
+class SelectiveExecutionConfigView(ShapeView):
+    """Read-only view of SelectiveExecutionConfig, see ShapeView."""
+
+    __slots__ = (
+        "source_pipeline_execution_arn",
+        "selected_steps",
+    )
+    _shape = "SelectiveExecutionConfig"
+
+
+class StartPipelineExecutionRequestView(ShapeView):
+    """Read-only view of StartPipelineExecutionRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_name",
+        "pipeline_execution_display_name",
+        "pipeline_parameters",
+        "pipeline_execution_description",
+        "client_request_token",
+        "parallelism_configuration",
+        "selective_execution_config",
+    )
+    _shape = "StartPipelineExecutionRequest"
+
+
+class StartPipelineExecutionResponseView(ShapeView):
+    """Read-only view of StartPipelineExecutionResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_execution_arn",)
+    _shape = "StartPipelineExecutionResponse"
+
+
+class StopPipelineExecutionRequestView(ShapeView):
+    """Read-only view of StopPipelineExecutionRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_arn",
+        "client_request_token",
+    )
+    _shape = "StopPipelineExecutionRequest"
+
+
+class StopPipelineExecutionResponseView(ShapeView):
+    """Read-only view of StopPipelineExecutionResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_execution_arn",)
+    _shape = "StopPipelineExecutionResponse"
+
+
+class UpdatePipelineExecutionRequestView(ShapeView):
+    """Read-only view of UpdatePipelineExecutionRequest, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_execution_arn",
+        "pipeline_execution_description",
+        "pipeline_execution_display_name",
+        "parallelism_configuration",
+    )
+    _shape = "UpdatePipelineExecutionRequest"
+
+
+class UpdatePipelineExecutionResponseView(ShapeView):
+    """Read-only view of UpdatePipelineExecutionResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_execution_arn",)
+    _shape = "UpdatePipelineExecutionResponse"
@@ -0,0 +1,52 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class DesiredWeightAndCapacityView(ShapeView):
+    """Read-only view of DesiredWeightAndCapacity, see ShapeView."""
+
+    __slots__ = (
+        "variant_name",
+        "desired_weight",
+        "desired_instance_count",
+        "serverless_update_config",
+    )
+    _shape = "DesiredWeightAndCapacity"
+
+
+class ProductionVariantServerlessUpdateConfigView(ShapeView):
+    """Read-only view of ProductionVariantServerlessUpdateConfig, see ShapeView."""
+
+    __slots__ = (
+        "max_concurrency",
+        "provisioned_concurrency",
+    )
+    _shape = "ProductionVariantServerlessUpdateConfig"
+
+
+class UpdateEndpointWeightsAndCapacitiesInputView(ShapeView):
+    """Read-only view of UpdateEndpointWeightsAndCapacitiesInput, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "desired_weights_and_capacities",
+    )
+    _shape = "UpdateEndpointWeightsAndCapacitiesInput"
+
+
+class UpdateEndpointWeightsAndCapacitiesOutputView(ShapeView):
+    """Read-only view of UpdateEndpointWeightsAndCapacitiesOutput, see ShapeView."""
+
+    __slots__ = ("endpoint_arn",)
+    _shape = "UpdateEndpointWeightsAndCapacitiesOutput"
@@ -0,0 +1,76 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class EdgeView(ShapeView):
+    """Read-only view of Edge, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "destination_arn",
+        "association_type",
+    )
+    _shape = "Edge"
+
+
+class QueryFiltersView(ShapeView):
+    """Read-only view of QueryFilters, see ShapeView."""
+
+    __slots__ = (
+        "types",
+        "lineage_types",
+        "created_before",
+        "created_after",
+        "modified_before",
+        "modified_after",
+        "properties",
+    )
+    _shape = "QueryFilters"
+
+
+class QueryLineageRequestView(ShapeView):
+    """Read-only view of QueryLineageRequest, see ShapeView."""
+
+    __slots__ = (
+        "start_arns",
+        "direction",
+        "include_edges",
+        "filters",
+        "max_depth",
+        "max_results",
+        "next_token",
+    )
+    _shape = "QueryLineageRequest"
+
+
+class QueryLineageResponseView(ShapeView):
+    """Read-only view of QueryLineageResponse, see ShapeView."""
+
+    __slots__ = (
+        "vertices",
+        "edges",
+        "next_token",
+    )
+    _shape = "QueryLineageResponse"
+
+
+class VertexView(ShapeView):
+    """Read-only view of Vertex, see ShapeView."""
+
+    __slots__ = (
+        "arn",
+        "type",
+        "lineage_type",
+    )
+    _shape = "Vertex"
@@ -0,0 +1,639 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class EndpointView(ShapeView):
+    """Read-only view of Endpoint, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_arn",
+        "endpoint_config_name",
+        "production_variants",
+        "data_capture_config",
+        "endpoint_status",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "monitoring_schedules",
+        "tags",
+        "shadow_production_variants",
+    )
+    _shape = "Endpoint"
+
+
+class ExperimentView(ShapeView):
+    """Read-only view of Experiment, see ShapeView."""
+
+    __slots__ = (
+        "experiment_name",
+        "experiment_arn",
+        "display_name",
+        "source",
+        "description",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "tags",
+    )
+    _shape = "Experiment"
+
+
+class FeatureGroupView(ShapeView):
+    """Read-only view of FeatureGroup, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_arn",
+        "feature_group_name",
+        "record_identifier_feature_name",
+        "event_time_feature_name",
+        "feature_definitions",
+        "creation_time",
+        "last_modified_time",
+        "online_store_config",
+        "offline_store_config",
+        "role_arn",
+        "feature_group_status",
+        "offline_store_status",
+        "last_update_status",
+        "failure_reason",
+        "description",
+        "tags",
+    )
+    _shape = "FeatureGroup"
+
+
+class FeatureMetadataView(ShapeView):
+    """Read-only view of FeatureMetadata, see ShapeView."""
+
+    __slots__ = (
+        "feature_group_arn",
+        "feature_group_name",
+        "feature_name",
+        "feature_type",
+        "creation_time",
+        "last_modified_time",
+        "description",
+        "parameters",
+    )
+    _shape = "FeatureMetadata"
+
+
+class FilterView(ShapeView):
+    """Read-only view of Filter, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "operator",
+        "value",
+    )
+    _shape = "Filter"
+
+
+class HyperParameterTuningJobSearchEntityView(ShapeView):
+    """Read-only view of HyperParameterTuningJobSearchEntity, see ShapeView."""
+
+    __slots__ = (
+        "hyper_parameter_tuning_job_name",
+        "hyper_parameter_tuning_job_arn",
+        "hyper_parameter_tuning_job_config",
+        "training_job_definition",
+        "training_job_definitions",
+        "hyper_parameter_tuning_job_status",
+        "creation_time",
+        "hyper_parameter_tuning_end_time",
+        "last_modified_time",
+        "training_job_status_counters",
+        "objective_status_counters",
+        "best_training_job",
+        "overall_best_training_job",
+        "warm_start_config",
+        "failure_reason",
+        "tuning_job_completion_details",
+        "consumed_resources",
+        "tags",
+    )
+    _shape = "HyperParameterTuningJobSearchEntity"
+
+
+class ModelView(ShapeView):
+    """Read-only view of Model, see ShapeView."""
+
+    __slots__ = (
+        "model_name",
+        "primary_container",
+        "containers",
+        "inference_execution_config",
+        "execution_role_arn",
+        "vpc_config",
+        "creation_time",
+        "model_arn",
+        "enable_network_isolation",
+        "tags",
+        "deployment_recommendation",
+    )
+    _shape = "Model"
+
+
+class ModelCardView(ShapeView):
+    """Read-only view of ModelCard, see ShapeView."""
+
+    __slots__ = (
+        "model_card_arn",
+        "model_card_name",
+        "model_card_version",
+        "content",
+        "model_card_status",
+        "security_config",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "tags",
+        "model_id",
+        "risk_rating",
+        "model_package_group_name",
+    )
+    _shape = "ModelCard"
+
+
+class ModelDashboardEndpointView(ShapeView):
+    """Read-only view of ModelDashboardEndpoint, see ShapeView."""
+
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_arn",
+        "creation_time",
+        "last_modified_time",
+        "endpoint_status",
+    )
+    _shape = "ModelDashboardEndpoint"
+
+
+class ModelDashboardModelView(ShapeView):
+    """Read-only view of ModelDashboardModel, see ShapeView."""
+
+    __slots__ = (
+        "model",
+        "endpoints",
+        "last_batch_transform_job",
+        "monitoring_schedules",
+        "model_card",
+    )
+    _shape = "ModelDashboardModel"
+
+
+class ModelDashboardModelCardView(ShapeView):
+    """Read-only view of ModelDashboardModelCard, see ShapeView."""
+
+    __slots__ = (
+        "model_card_arn",
+        "model_card_name",
+        "model_card_version",
+        "model_card_status",
+        "security_config",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "tags",
+        "model_id",
+        "risk_rating",
+    )
+    _shape = "ModelDashboardModelCard"
+
+
+class ModelDashboardMonitoringScheduleView(ShapeView):
+    """Read-only view of ModelDashboardMonitoringSchedule, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_arn",
+        "monitoring_schedule_name",
+        "monitoring_schedule_status",
+        "monitoring_type",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "monitoring_schedule_config",
+        "endpoint_name",
+        "monitoring_alert_summaries",
+        "last_monitoring_execution_summary",
+        "batch_transform_input",
+    )
+    _shape = "ModelDashboardMonitoringSchedule"
+
+
+class ModelPackageView(ShapeView):
+    """Read-only view of ModelPackage, see ShapeView."""
+
+    __slots__ = (
+        "model_package_name",
+        "model_package_group_name",
+        "model_package_version",
+        "model_package_arn",
+        "model_package_description",
+        "creation_time",
+        "inference_specification",
+        "source_algorithm_specification",
+        "validation_specification",
+        "model_package_status",
+        "model_package_status_details",
+        "certify_for_marketplace",
+        "model_approval_status",
+        "created_by",
+        "metadata_properties",
+        "model_metrics",
+        "last_modified_time",
+        "last_modified_by",
+        "approval_description",
+        "domain",
+        "task",
+        "sample_payload_url",
+        "additional_inference_specifications",
+        "source_uri",
+        "tags",
+        "customer_metadata_properties",
+        "drift_check_baselines",
+        "skip_model_validation",
+    )
+    _shape = "ModelPackage"
+
+
+class ModelPackageGroupView(ShapeView):
+    """Read-only view of ModelPackageGroup, see ShapeView."""
+
+    __slots__ = (
+        "model_package_group_name",
+        "model_package_group_arn",
+        "model_package_group_description",
+        "creation_time",
+        "created_by",
+        "model_package_group_status",
+        "tags",
+    )
+    _shape = "ModelPackageGroup"
+
+
+class MonitoringScheduleView(ShapeView):
+    """Read-only view of MonitoringSchedule, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_arn",
+        "monitoring_schedule_name",
+        "monitoring_schedule_status",
+        "monitoring_type",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "monitoring_schedule_config",
+        "endpoint_name",
+        "last_monitoring_execution_summary",
+        "tags",
+    )
+    _shape = "MonitoringSchedule"
+
+
+class NestedFiltersView(ShapeView):
+    """Read-only view of NestedFilters, see ShapeView."""
+
+    __slots__ = (
+        "nested_property_name",
+        "filters",
+    )
+    _shape = "NestedFilters"
+
+
+class ParentView(ShapeView):
+    """Read-only view of Parent, see ShapeView."""
+
+    __slots__ = (
+        "trial_name",
+        "experiment_name",
+    )
+    _shape = "Parent"
+
+
+class PipelineView(ShapeView):
+    """Read-only view of Pipeline, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_arn",
+        "pipeline_name",
+        "pipeline_display_name",
+        "pipeline_description",
+        "role_arn",
+        "pipeline_status",
+        "creation_time",
+        "last_modified_time",
+        "last_run_time",
+        "created_by",
+        "last_modified_by",
+        "parallelism_configuration",
+        "tags",
+    )
+    _shape = "Pipeline"
+
+
+class PipelineExecutionView(ShapeView):
+    """Read-only view of PipelineExecution, see ShapeView."""
+
+    __slots__ = (
+        "pipeline_arn",
+        "pipeline_execution_arn",
+        "pipeline_execution_display_name",
+        "pipeline_execution_status",
+        "pipeline_execution_description",
+        "pipeline_experiment_config",
+        "failure_reason",
+        "creation_time",
+        "last_modified_time",
+        "created_by",
+        "last_modified_by",
+        "parallelism_configuration",
+        "selective_execution_config",
+        "pipeline_parameters",
+    )
+    _shape = "PipelineExecution"
+
+
+class ProcessingJobView(ShapeView):
+    """Read-only view of ProcessingJob, see ShapeView."""
+
+    __slots__ = (
+        "processing_inputs",
+        "processing_output_config",
+        "processing_job_name",
+        "processing_resources",
+        "stopping_condition",
+        "app_specification",
+        "environment",
+        "network_config",
+        "role_arn",
+        "experiment_config",
+        "processing_job_arn",
+        "processing_job_status",
+        "exit_message",
+        "failure_reason",
+        "processing_end_time",
+        "processing_start_time",
+        "last_modified_time",
+        "creation_time",
+        "monitoring_schedule_arn",
+        "auto_m_l_job_arn",
+        "training_job_arn",
+        "tags",
+    )
+    _shape = "ProcessingJob"
+
+
+class ProjectView(ShapeView):
+    """Read-only view of Project, see ShapeView."""
+
+    __slots__ = (
+        "project_arn",
+        "project_name",
+        "project_id",
+        "project_description",
+        "service_catalog_provisioning_details",
+        "service_catalog_provisioned_product_details",
+        "project_status",
+        "created_by",
+        "creation_time",
+        "tags",
+        "last_modified_time",
+        "last_modified_by",
+    )
+    _shape = "Project"
+
+
+class SearchExpressionView(ShapeView):
+    """Read-only view of SearchExpression, see ShapeView."""
+
+    __slots__ = (
+        "filters",
+        "nested_filters",
+        "sub_expressions",
+        "operator",
+    )
+    _shape = "SearchExpression"
+
+
+class SearchRecordView(ShapeView):
+    """Read-only view of SearchRecord, see ShapeView."""
+
+    __slots__ = (
+        "training_job",
+        "experiment",
+        "trial",
+        "trial_component",
+        "endpoint",
+        "model_package",
+        "model_package_group",
+        "pipeline",
+        "pipeline_execution",
+        "feature_group",
+        "feature_metadata",
+        "project",
+        "hyper_parameter_tuning_job",
+        "model_card",
+        "model",
+    )
+    _shape = "SearchRecord"
+
+
+class SearchRequestView(ShapeView):
+    """Read-only view of SearchRequest, see ShapeView."""
+
+    __slots__ = (
+        "resource",
+        "search_expression",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "cross_account_filter_option",
+        "visibility_conditions",
+    )
+    _shape = "SearchRequest"
+
+
+class SearchResponseView(ShapeView):
+    """Read-only view of SearchResponse, see ShapeView."""
+
+    __slots__ = (
+        "results",
+        "next_token",
+    )
+    _shape = "SearchResponse"
+
+
+class TrainingJobView(ShapeView):
+    """Read-only view of TrainingJob, see ShapeView."""
+
+    __slots__ = (
+        "training_job_name",
+        "training_job_arn",
+        "tuning_job_arn",
+        "labeling_job_arn",
+        "auto_m_l_job_arn",
+        "model_artifacts",
+        "training_job_status",
+        "secondary_status",
+        "failure_reason",
+        "hyper_parameters",
+        "algorithm_specification",
+        "role_arn",
+        "input_data_config",
+        "output_data_config",
+        "resource_config",
+        "vpc_config",
+        "stopping_condition",
+        "creation_time",
+        "training_start_time",
+        "training_end_time",
+        "last_modified_time",
+        "secondary_status_transitions",
+        "final_metric_data_list",
+        "enable_network_isolation",
+        "enable_inter_container_traffic_encryption",
+        "enable_managed_spot_training",
+        "checkpoint_config",
+        "training_time_in_seconds",
+        "billable_time_in_seconds",
+        "debug_hook_config",
+        "experiment_config",
+        "debug_rule_configurations",
+        "tensor_board_output_config",
+        "debug_rule_evaluation_statuses",
+        "profiler_config",
+        "environment",
+        "retry_strategy",
+        "tags",
+    )
+    _shape = "TrainingJob"
+
+
+class TransformJobView(ShapeView):
+    """Read-only view of TransformJob, see ShapeView."""
+
+    __slots__ = (
+        "transform_job_name",
+        "transform_job_arn",
+        "transform_job_status",
+        "failure_reason",
+        "model_name",
+        "max_concurrent_transforms",
+        "model_client_config",
+        "max_payload_in_m_b",
+        "batch_strategy",
+        "environment",
+        "transform_input",
+        "transform_output",
+        "data_capture_config",
+        "transform_resources",
+        "creation_time",
+        "transform_start_time",
+        "transform_end_time",
+        "labeling_job_arn",
+        "auto_m_l_job_arn",
+        "data_processing",
+        "experiment_config",
+        "tags",
+    )
+    _shape = "TransformJob"
+
+
+class TrialView(ShapeView):
+    """Read-only view of Trial, see ShapeView."""
+
+    __slots__ = (
+        "trial_name",
+        "trial_arn",
+        "display_name",
+        "experiment_name",
+        "source",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "metadata_properties",
+        "tags",
+        "trial_component_summaries",
+    )
+    _shape = "Trial"
+
+
+class TrialComponentView(ShapeView):
+    """Read-only view of TrialComponent, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "display_name",
+        "trial_component_arn",
+        "source",
+        "status",
+        "start_time",
+        "end_time",
+        "creation_time",
+        "created_by",
+        "last_modified_time",
+        "last_modified_by",
+        "parameters",
+        "input_artifacts",
+        "output_artifacts",
+        "metrics",
+        "metadata_properties",
+        "source_detail",
+        "lineage_group_arn",
+        "tags",
+        "parents",
+        "run_name",
+    )
+    _shape = "TrialComponent"
+
+
+class TrialComponentSimpleSummaryView(ShapeView):
+    """Read-only view of TrialComponentSimpleSummary, see ShapeView."""
+
+    __slots__ = (
+        "trial_component_name",
+        "trial_component_arn",
+        "trial_component_source",
+        "creation_time",
+        "created_by",
+    )
+    _shape = "TrialComponentSimpleSummary"
+
+
+class TrialComponentSourceDetailView(ShapeView):
+    """Read-only view of TrialComponentSourceDetail, see ShapeView."""
+
+    __slots__ = (
+        "source_arn",
+        "training_job",
+        "processing_job",
+        "transform_job",
+    )
+    _shape = "TrialComponentSourceDetail"
+
+
+class VisibilityConditionsView(ShapeView):
+    """Read-only view of VisibilityConditions, see ShapeView."""
+
+    __slots__ = (
+        "key",
+        "value",
+    )
+    _shape = "VisibilityConditions"
@@ -0,0 +1,51 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class GetSearchSuggestionsRequestView(ShapeView):
+    """Read-only view of GetSearchSuggestionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "resource",
+        "suggestion_query",
+    )
+    _shape = "GetSearchSuggestionsRequest"
+
+
+class GetSearchSuggestionsResponseView(ShapeView):
+    """Read-only view of GetSearchSuggestionsResponse, see ShapeView."""
+
+    __slots__ = ("property_name_suggestions",)
+    _shape = "GetSearchSuggestionsResponse"
+
+
+class PropertyNameQueryView(ShapeView):
+    """Read-only view of PropertyNameQuery, see ShapeView."""
+
+    __slots__ = ("property_name_hint",)
+    _shape = "PropertyNameQuery"
+
+
+class PropertyNameSuggestionView(ShapeView):
+    """Read-only view of PropertyNameSuggestion, see ShapeView."""
+
+    __slots__ = ("property_name",)
+    _shape = "PropertyNameSuggestion"
+
+
+class SuggestionQueryView(ShapeView):
+    """Read-only view of SuggestionQuery, see ShapeView."""
+
+    __slots__ = ("property_name_query",)
+    _shape = "SuggestionQuery"
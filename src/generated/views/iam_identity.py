@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class IamIdentityView(ShapeView):
+    """Read-only view of IamIdentity, see ShapeView."""
+
+    __slots__ = (
+        "arn",
+        "principal_id",
+        "source_identity",
+    )
+    _shape = "IamIdentity"
+
+
+class UserContextView(ShapeView):
+    """Read-only view of UserContext, see ShapeView."""
+
+    __slots__ = (
+        "user_profile_arn",
+        "user_profile_name",
+        "domain_id",
+        "iam_identity",
+    )
+    _shape = "UserContext"
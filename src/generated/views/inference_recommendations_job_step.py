@@ -0,0 +1,63 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class InferenceRecommendationsJobStepView(ShapeView):
+    """Read-only view of InferenceRecommendationsJobStep, see ShapeView."""
+
+    __slots__ = (
+        "step_type",
+        "job_name",
+        "status",
+        "inference_benchmark",
+    )
+    _shape = "InferenceRecommendationsJobStep"
+
+
+class ListInferenceRecommendationsJobStepsRequestView(ShapeView):
+    """Read-only view of ListInferenceRecommendationsJobStepsRequest, see ShapeView."""
+
+    __slots__ = (
+        "job_name",
+        "status",
+        "step_type",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListInferenceRecommendationsJobStepsRequest"
+
+
+class ListInferenceRecommendationsJobStepsResponseView(ShapeView):
+    """Read-only view of ListInferenceRecommendationsJobStepsResponse, see ShapeView."""
+
+    __slots__ = (
+        "steps",
+        "next_token",
+    )
+    _shape = "ListInferenceRecommendationsJobStepsResponse"
+
+
+class RecommendationJobInferenceBenchmarkView(ShapeView):
+    """Read-only view of RecommendationJobInferenceBenchmark, see ShapeView."""
+
+    __slots__ = (
+        "metrics",
+        "endpoint_metrics",
+        "endpoint_configuration",
+        "model_configuration",
+        "failure_reason",
+        "invocation_end_time",
+        "invocation_start_time",
+    )
+    _shape = "RecommendationJobInferenceBenchmark"
@@ -0,0 +1,50 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class LineageGroupSummaryView(ShapeView):
+    """Read-only view of LineageGroupSummary, see ShapeView."""
+
+    __slots__ = (
+        "lineage_group_arn",
+        "lineage_group_name",
+        "display_name",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "LineageGroupSummary"
+
+
+class ListLineageGroupsRequestView(ShapeView):
+    """Read-only view of ListLineageGroupsRequest, see ShapeView."""
+
+    __slots__ = (
+        "created_after",
+        "created_before",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListLineageGroupsRequest"
+
+
+class ListLineageGroupsResponseView(ShapeView):
+    """Read-only view of ListLineageGroupsResponse, see ShapeView."""
+
+    __slots__ = (
+        "lineage_group_summaries",
+        "next_token",
+    )
+    _shape = "ListLineageGroupsResponse"
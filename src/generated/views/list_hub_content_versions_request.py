@@ -0,0 +1,42 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ListHubContentVersionsRequestView(ShapeView):
+    """Read-only view of ListHubContentVersionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "hub_name",
+        "hub_content_type",
+        "hub_content_name",
+        "min_version",
+        "max_schema_version",
+        "creation_time_before",
+        "creation_time_after",
+        "sort_by",
+        "sort_order",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListHubContentVersionsRequest"
+
+
+class ListHubContentVersionsResponseView(ShapeView):
+    """Read-only view of ListHubContentVersionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "hub_content_summaries",
+        "next_token",
+    )
+    _shape = "ListHubContentVersionsResponse"
@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ListModelCardVersionsRequestView(ShapeView):
+    """Read-only view of ListModelCardVersionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "creation_time_after",
+        "creation_time_before",
+        "max_results",
+        "model_card_name",
+        "model_card_status",
+        "next_token",
+        "sort_by",
+        "sort_order",
+    )
+    _shape = "ListModelCardVersionsRequest"
+
+
+class ListModelCardVersionsResponseView(ShapeView):
+    """Read-only view of ListModelCardVersionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "model_card_version_summary_list",
+        "next_token",
+    )
+    _shape = "ListModelCardVersionsResponse"
+
+
+class ModelCardVersionSummaryView(ShapeView):
+    """Read-only view of ModelCardVersionSummary, see ShapeView."""
+
+    __slots__ = (
+        "model_card_name",
+        "model_card_arn",
+        "model_card_status",
+        "model_card_version",
+        "creation_time",
+        "last_modified_time",
+    )
+    _shape = "ModelCardVersionSummary"
@@ -0,0 +1,64 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ListModelMetadataRequestView(ShapeView):
+    """Read-only view of ListModelMetadataRequest, see ShapeView."""
+
+    __slots__ = (
+        "search_expression",
+        "next_token",
+        "max_results",
+    )
+    _shape = "ListModelMetadataRequest"
+
+
+class ListModelMetadataResponseView(ShapeView):
+    """Read-only view of ListModelMetadataResponse, see ShapeView."""
+
+    __slots__ = (
+        "model_metadata_summaries",
+        "next_token",
+    )
+    _shape = "ListModelMetadataResponse"
+
+
+class ModelMetadataFilterView(ShapeView):
+    """Read-only view of ModelMetadataFilter, see ShapeView."""
+
+    __slots__ = (
+        "name",
+        "value",
+    )
+    _shape = "ModelMetadataFilter"
+
+
+class ModelMetadataSearchExpressionView(ShapeView):
+    """Read-only view of ModelMetadataSearchExpression, see ShapeView."""
+
+    __slots__ = ("filters",)
+    _shape = "ModelMetadataSearchExpression"
+
+
+class ModelMetadataSummaryView(ShapeView):
+    """Read-only view of ModelMetadataSummary, see ShapeView."""
+
+    __slots__ = (
+        "domain",
+        "framework",
+        "task",
+        "model",
+        "framework_version",
+    )
+    _shape = "ModelMetadataSummary"
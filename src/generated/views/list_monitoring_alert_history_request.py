@@ -0,0 +1,52 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ListMonitoringAlertHistoryRequestView(ShapeView):
+    """Read-only view of ListMonitoringAlertHistoryRequest, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "monitoring_alert_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "creation_time_before",
+        "creation_time_after",
+        "status_equals",
+    )
+    _shape = "ListMonitoringAlertHistoryRequest"
+
+
+class ListMonitoringAlertHistoryResponseView(ShapeView):
+    """Read-only view of ListMonitoringAlertHistoryResponse, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_alert_history",
+        "next_token",
+    )
+    _shape = "ListMonitoringAlertHistoryResponse"
+
+
+class MonitoringAlertHistorySummaryView(ShapeView):
+    """Read-only view of MonitoringAlertHistorySummary, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "monitoring_alert_name",
+        "creation_time",
+        "alert_status",
+    )
+    _shape = "MonitoringAlertHistorySummary"
@@ -0,0 +1,46 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ListMonitoringExecutionsRequestView(ShapeView):
+    """Read-only view of ListMonitoringExecutionsRequest, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "endpoint_name",
+        "sort_by",
+        "sort_order",
+        "next_token",
+        "max_results",
+        "scheduled_time_before",
+        "scheduled_time_after",
+        "creation_time_before",
+        "creation_time_after",
+        "last_modified_time_before",
+        "last_modified_time_after",
+        "status_equals",
+        "monitoring_job_definition_name",
+        "monitoring_type_equals",
+    )
+    _shape = "ListMonitoringExecutionsRequest"
+
+
+class ListMonitoringExecutionsResponseView(ShapeView):
+    """Read-only view of ListMonitoringExecutionsResponse, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_execution_summaries",
+        "next_token",
+    )
+    _shape = "ListMonitoringExecutionsResponse"
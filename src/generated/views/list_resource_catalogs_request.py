@@ -0,0 +1,50 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ListResourceCatalogsRequestView(ShapeView):
+    """Read-only view of ListResourceCatalogsRequest, see ShapeView."""
+
+    __slots__ = (
+        "name_contains",
+        "creation_time_after",
+        "creation_time_before",
+        "sort_order",
+        "sort_by",
+        "max_results",
+        "next_token",
+    )
+    _shape = "ListResourceCatalogsRequest"
+
+
+class ListResourceCatalogsResponseView(ShapeView):
+    """Read-only view of ListResourceCatalogsResponse, see ShapeView."""
+
+    __slots__ = (
+        "resource_catalogs",
+        "next_token",
+    )
+    _shape = "ListResourceCatalogsResponse"
+
+
+class ResourceCatalogView(ShapeView):
+    """Read-only view of ResourceCatalog, see ShapeView."""
+
+    __slots__ = (
+        "resource_catalog_arn",
+        "resource_catalog_name",
+        "description",
+        "creation_time",
+    )
+    _shape = "ResourceCatalog"
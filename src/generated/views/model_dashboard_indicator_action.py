@@ -0,0 +1,42 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ModelDashboardIndicatorActionView(ShapeView):
+    """Read-only view of ModelDashboardIndicatorAction, see ShapeView."""
+
+    __slots__ = ("enabled",)
+    _shape = "ModelDashboardIndicatorAction"
+
+
+class MonitoringAlertActionsView(ShapeView):
+    """Read-only view of MonitoringAlertActions, see ShapeView."""
+
+    __slots__ = ("model_dashboard_indicator",)
+    _shape = "MonitoringAlertActions"
+
+
+class MonitoringAlertSummaryView(ShapeView):
+    """Read-only view of MonitoringAlertSummary, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_alert_name",
+        "creation_time",
+        "last_modified_time",
+        "alert_status",
+        "datapoints_to_alert",
+        "evaluation_period",
+        "actions",
+    )
+    _shape = "MonitoringAlertSummary"
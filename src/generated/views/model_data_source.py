@@ -0,0 +1,32 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class ModelDataSourceView(ShapeView):
+    """Read-only view of ModelDataSource, see ShapeView."""
+
+    __slots__ = ("s3_data_source",)
+    _shape = "ModelDataSource"
+
+
+class S3ModelDataSourceView(ShapeView):
+    """Read-only view of S3ModelDataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_uri",
+        "s3_data_type",
+        "compression_type",
+        "model_access_config",
+    )
+    _shape = "S3ModelDataSource"
@@ -0,0 +1,36 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class MonitoringJobDefinitionSummaryView(ShapeView):
+    """Read-only view of MonitoringJobDefinitionSummary, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_job_definition_name",
+        "monitoring_job_definition_arn",
+        "creation_time",
+        "endpoint_name",
+    )
+    _shape = "MonitoringJobDefinitionSummary"
+
+
+class MonitoringNetworkConfigView(ShapeView):
+    """Read-only view of MonitoringNetworkConfig, see ShapeView."""
+
+    __slots__ = (
+        "enable_inter_container_traffic_encryption",
+        "enable_network_isolation",
+        "vpc_config",
+    )
+    _shape = "MonitoringNetworkConfig"
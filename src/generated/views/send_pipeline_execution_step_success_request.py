@@ -0,0 +1,31 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class SendPipelineExecutionStepSuccessRequestView(ShapeView):
+    """Read-only view of SendPipelineExecutionStepSuccessRequest, see ShapeView."""
+
+    __slots__ = (
+        "callback_token",
+        "output_parameters",
+        "client_request_token",
+    )
+    _shape = "SendPipelineExecutionStepSuccessRequest"
+
+
+class SendPipelineExecutionStepSuccessResponseView(ShapeView):
+    """Read-only view of SendPipelineExecutionStepSuccessResponse, see ShapeView."""
+
+    __slots__ = ("pipeline_execution_arn",)
+    _shape = "SendPipelineExecutionStepSuccessResponse"
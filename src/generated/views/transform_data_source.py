@@ -0,0 +1,65 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class TransformDataSourceView(ShapeView):
+    """Read-only view of TransformDataSource, see ShapeView."""
+
+    __slots__ = ("s3_data_source",)
+    _shape = "TransformDataSource"
+
+
+class TransformInputView(ShapeView):
+    """Read-only view of TransformInput, see ShapeView."""
+
+    __slots__ = (
+        "data_source",
+        "content_type",
+        "compression_type",
+        "split_type",
+    )
+    _shape = "TransformInput"
+
+
+class TransformOutputView(ShapeView):
+    """Read-only view of TransformOutput, see ShapeView."""
+
+    __slots__ = (
+        "s3_output_path",
+        "accept",
+        "assemble_with",
+        "kms_key_id",
+    )
+    _shape = "TransformOutput"
+
+
+class TransformResourcesView(ShapeView):
+    """Read-only view of TransformResources, see ShapeView."""
+
+    __slots__ = (
+        "instance_type",
+        "instance_count",
+        "volume_kms_key_id",
+    )
+    _shape = "TransformResources"
+
+
+class TransformS3DataSourceView(ShapeView):
+    """Read-only view of TransformS3DataSource, see ShapeView."""
+
+    __slots__ = (
+        "s3_data_type",
+        "s3_uri",
+    )
+    _shape = "TransformS3DataSource"
@@ -0,0 +1,35 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from src.code_injection.views import ShapeView
+
+
+class UpdateMonitoringAlertRequestView(ShapeView):
+    """Read-only view of UpdateMonitoringAlertRequest, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_name",
+        "monitoring_alert_name",
+        "datapoints_to_alert",
+        "evaluation_period",
+    )
+    _shape = "UpdateMonitoringAlertRequest"
+
+
+class UpdateMonitoringAlertResponseView(ShapeView):
+    """Read-only view of UpdateMonitoringAlertResponse, see ShapeView."""
+
+    __slots__ = (
+        "monitoring_schedule_arn",
+        "monitoring_alert_name",
+    )
+    _shape = "UpdateMonitoringAlertResponse"
@@ -55,7 +55,9 @@ def generate_code(
     )
 
     shapes_code_gen.generate_shapes()
+    shapes_code_gen.generate_views()
     resources_code_gen.generate_resources()
+    resources_code_gen.generate_aio_resources()
     intelligent_defaults_helper_code_gen.generate_helper_functions()
 
 
@@ -45,6 +45,7 @@ BASIC_JSON_TYPES_TO_PYTHON_TYPES = {
 }
 
 SHAPE_DAG_FILE_PATH = os.getcwd() + "/src/code_injection/shape_dag.py"
+NAME_MAP_FILE_PATH = os.getcwd() + "/src/code_injection/name_map.py"
 PYTHON_TYPES_TO_BASIC_JSON_TYPES = {
     "str": "string",
     "int": "integer",
@@ -83,13 +84,24 @@ SERVICE_JSON_FILE_PATH = os.getcwd() + "/sample/sagemaker/2017-07-24/service-2.j
 RUNTIME_SERVICE_JSON_FILE_PATH = (
     os.getcwd() + "/sample/sagemaker-runtime/2017-05-13/service-2.json"
 )
+PAGINATORS_JSON_FILE_PATH = (
+    os.getcwd() + "/sample/sagemaker/2017-07-24/paginators-1.json"
+)
+WAITERS_JSON_FILE_PATH = os.getcwd() + "/sample/sagemaker/2017-07-24/waiters-2.json"
+RUNTIME_PAGINATORS_JSON_FILE_PATH = (
+    os.getcwd() + "/sample/sagemaker-runtime/2017-05-13/paginators-1.json"
+)
 
 GENERATED_CLASSES_LOCATION = os.getcwd() + "/src/generated"
 UTILS_CODEGEN_FILE_NAME = "utils.py"
 INTELLIGENT_DEFAULTS_HELPER_CODEGEN_FILE_NAME = "intelligent_defaults_helper.py"
 
-RESOURCES_CODEGEN_FILE_NAME = "resources.py"
+RESOURCES_CODEGEN_PACKAGE_NAME = "resources"
+
+AIO_RESOURCES_CODEGEN_FILE_NAME = "aio.py"
+
+SHAPES_CODEGEN_PACKAGE_NAME = "shapes"
 
-SHAPES_CODEGEN_FILE_NAME = "shapes.py"
+VIEWS_CODEGEN_PACKAGE_NAME = "views"
 
 CONFIG_SCHEMA_FILE_NAME = "config_schema.py"
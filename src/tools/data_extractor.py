@@ -3,7 +3,13 @@ from functools import lru_cache
 
 from pydantic import BaseModel
 
-from src.tools.constants import SERVICE_JSON_FILE_PATH, RUNTIME_SERVICE_JSON_FILE_PATH
+from src.tools.constants import (
+    SERVICE_JSON_FILE_PATH,
+    RUNTIME_SERVICE_JSON_FILE_PATH,
+    PAGINATORS_JSON_FILE_PATH,
+    RUNTIME_PAGINATORS_JSON_FILE_PATH,
+    WAITERS_JSON_FILE_PATH,
+)
 
 
 class ServiceJsonData(BaseModel):
@@ -38,3 +44,18 @@ def load_combined_operations_data() -> dict:
         **service_json_data.sagemaker["operations"],
         **service_json_data.sagemaker_runtime["operations"],
     }
+
+
+@lru_cache(maxsize=1)
+def load_combined_paginators_data() -> dict:
+    combined_paginators = {}
+    for file_path in (PAGINATORS_JSON_FILE_PATH, RUNTIME_PAGINATORS_JSON_FILE_PATH):
+        with open(file_path, "r") as file:
+            combined_paginators.update(json.load(file)["pagination"])
+    return combined_paginators
+
+
+@lru_cache(maxsize=1)
+def load_waiters_data() -> dict:
+    with open(WAITERS_JSON_FILE_PATH, "r") as file:
+        return json.load(file)["waiters"]
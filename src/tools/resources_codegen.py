@@ -16,11 +16,14 @@ from functools import lru_cache
 
 import os
 import json
+import shutil
+from typing import List, Optional
 
 from src.generated.config_schema import SAGEMAKER_PYTHON_SDK_CONFIG_SCHEMA
 from src.tools.constants import (
     GENERATED_CLASSES_LOCATION,
-    RESOURCES_CODEGEN_FILE_NAME,
+    RESOURCES_CODEGEN_PACKAGE_NAME,
+    AIO_RESOURCES_CODEGEN_FILE_NAME,
     LICENCES_STRING,
     TERMINAL_STATES,
     BASIC_IMPORTS_STRING,
@@ -29,7 +32,13 @@ from src.tools.constants import (
     PYTHON_TYPES_TO_BASIC_JSON_TYPES,
     CONFIGURABLE_ATTRIBUTE_SUBSTRINGS,
 )
-from src.util.util import add_indent, convert_to_snake_case, snake_to_pascal
+from src.code_injection.waiter import DEFAULT_MAX_DELAY
+from src.util.util import (
+    add_indent,
+    convert_to_snake_case,
+    get_referenced_names,
+    snake_to_pascal,
+)
 from src.tools.resources_extractor import ResourcesExtractor
 from src.tools.shapes_extractor import ShapesExtractor
 from src.tools.templates import (
@@ -37,6 +46,7 @@ from src.tools.templates import (
     GET_METHOD_TEMPLATE,
     REFRESH_METHOD_TEMPLATE,
     RESOURCE_BASE_CLASS_TEMPLATE,
+    ASYNC_RESOURCE_BASE_CLASS_TEMPLATE,
     STOP_METHOD_TEMPLATE,
     DELETE_METHOD_TEMPLATE,
     WAIT_METHOD_TEMPLATE,
@@ -46,12 +56,35 @@ from src.tools.templates import (
     CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS,
     INVOKE_METHOD_TEMPLATE,
     INVOKE_ASYNC_METHOD_TEMPLATE,
+    INVOKE_MANY_METHOD_TEMPLATE,
+    INVOKE_STREAM_METHOD_TEMPLATE,
+    MICRO_BATCHER_METHOD_TEMPLATE,
+    LAZY_PACKAGE_TEMPLATE,
+    LAZY_PACKAGE_WARM_UP_TEMPLATE,
     INVOKE_WITH_RESPONSE_STREAM_METHOD_TEMPLATE,
     IMPORT_METHOD_TEMPLATE,
+    LIST_METHOD_TEMPLATE,
+    WAITER_CONFIG_TEMPLATE,
+    ASYNC_CREATE_METHOD_TEMPLATE,
+    ASYNC_CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS,
+    ASYNC_IMPORT_METHOD_TEMPLATE,
+    ASYNC_UPDATE_METHOD_TEMPLATE,
+    ASYNC_INVOKE_METHOD_TEMPLATE,
+    ASYNC_INVOKE_MANY_METHOD_TEMPLATE,
+    ASYNC_INVOKE_STREAM_METHOD_TEMPLATE,
+    ASYNC_GET_METHOD_TEMPLATE,
+    ASYNC_LIST_METHOD_TEMPLATE,
+    ASYNC_REFRESH_METHOD_TEMPLATE,
+    ASYNC_WAIT_METHOD_TEMPLATE,
+    ASYNC_WAIT_FOR_STATUS_METHOD_TEMPLATE,
+    ASYNC_DELETE_METHOD_TEMPLATE,
+    ASYNC_STOP_METHOD_TEMPLATE,
 )
 from src.tools.data_extractor import (
     load_combined_shapes_data,
     load_combined_operations_data,
+    load_combined_paginators_data,
+    load_waiters_data,
 )
 
 logging.basicConfig(level=logging.INFO)
@@ -117,6 +150,8 @@ class ResourcesCodeGen:
         # Extract the operations and shapes
         self.operations = load_combined_operations_data()
         self.shapes = load_combined_shapes_data()
+        self.paginators = load_combined_paginators_data()
+        self.waiters = load_waiters_data()
 
         # Initialize the resources and shapes extractors
         self.resources_extractor = ResourcesExtractor()
@@ -130,6 +165,7 @@ class ResourcesCodeGen:
         self.generate_config_schema()
         # Generate the resources
         self.generate_resources()
+        self.generate_aio_resources()
 
     def generate_license(self) -> str:
         """
@@ -141,9 +177,13 @@ class ResourcesCodeGen:
         """
         return LICENCES_STRING
 
-    def generate_imports(self) -> str:
+    def generate_imports(self, shape_names: Optional[List[str]] = None) -> str:
         """
-        Generate the import statements for the generated resources file.
+        Generate the import statements of the resources package or of one of its resource modules.
+
+        Args:
+            shape_names (List[str], optional): The shape classes used by the resource
+                module. Defaults to None for the __init__ module of the package.
 
         Returns:
             str: The import statements.
@@ -154,15 +194,32 @@ class ResourcesCodeGen:
             "import datetime",
             "import time",
             "import os",
-            "from pprint import pprint",
-            "from pydantic import validate_call",
-            "from typing import Dict, List, Literal, Optional\n"
+            "import inspect",
+            "from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, validate_call",
+            "from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Literal, Optional, Union\n"
             "from boto3.session import Session",
-            "from .utils import SageMakerClient, SageMakerRuntimeClient, Unassigned, snake_to_pascal, pascal_to_snake",
-            "from .intelligent_defaults_helper import load_default_configs_for_resource_name, get_config_value",
-            "from src.code_injection.codec import transform",
-            "from .shapes import *",
+            "from botocore.config import Config",
+            "from ..utils import SageMakerClient, SageMakerRuntimeClient, ResourceIterator, snake_to_pascal, pascal_to_snake, cached_describe, invalidate_describe_cache",
+            "from ..intelligent_defaults_helper import load_default_configs_for_resource_name, get_config_value",
+            "from src.code_injection.codec import serialize_request, transform, transform_fields, transform_lazily, transform_view",
+            "from src.code_injection.batch import BatchResult, is_throttling_error, run_batch, stream_batch",
+            "from src.code_injection.micro_batch import JsonLinesCodec, MicroBatcher, PayloadCodec",
+            "from src.code_injection.response_stream import ResponseStreamReader, StreamFraming",
+            "from src.code_injection.waiter import Waiter, WaiterConfig",
         ]
+        if shape_names is None:
+            imports.insert(1, "import importlib")
+            imports += [
+                "from threading import Thread",
+                "from src.code_injection.warm_up import build_models",
+                "from .. import shapes",
+                "from ..shapes import Unassigned",
+            ]
+        else:
+            # only the shape clusters used by the resource are imported
+            imports.append("from . import Base")
+            if shape_names:
+                imports.append(f"from ..shapes import {', '.join(shape_names)}")
 
         formated_imports = "\n".join(imports)
         formated_imports += "\n\n"
@@ -170,6 +227,38 @@ class ResourcesCodeGen:
         # Join the import statements with a newline character and return
         return formated_imports
 
+    def generate_aio_imports(self, shape_names: Optional[List[str]] = None) -> str:
+        """
+        Generate the import statements for the generated asyncio resources file.
+
+        Args:
+            shape_names (List[str], optional): The shape classes used by the asyncio resources.
+
+        Returns:
+            str: The import statements.
+        """
+        imports = [
+            BASIC_IMPORTS_STRING,
+            "import datetime",
+            "import time",
+            "from pydantic import validate_call",
+            "from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Literal, Optional, Union\n"
+            "from boto3.session import Session",
+            "from botocore.config import Config",
+            "from . import resources",
+            "from .resources import Base",
+            "from .utils import AsyncResourceIterator, get_async_transport, async_cached_describe, invalidate_describe_cache",
+            "from .intelligent_defaults_helper import get_config_value",
+            "from src.code_injection.codec import serialize_request, transform, transform_view",
+            "from src.code_injection.batch import BatchResult, async_stream_batch, is_throttling_error",
+            "from src.code_injection.response_stream import ResponseStreamReader, StreamFraming",
+            "from src.code_injection.waiter import Waiter",
+        ]
+        if shape_names:
+            imports.append(f"from .shapes import {', '.join(shape_names)}")
+
+        return "\n".join(imports) + "\n\n"
+
     def generate_base_class(self) -> str:
         """
         Generate the base class for the resources.
@@ -180,6 +269,16 @@ class ResourcesCodeGen:
         """
         return RESOURCE_BASE_CLASS_TEMPLATE
 
+    def generate_async_base_class(self) -> str:
+        """
+        Generate the base class of the asyncio resources, with their bulk methods.
+
+        Returns:
+            str: The base class.
+
+        """
+        return ASYNC_RESOURCE_BASE_CLASS_TEMPLATE
+
     def generate_logging(self) -> str:
         """
         Generate the logging statements for the generated resources file.
@@ -206,23 +305,40 @@ class ResourcesCodeGen:
     def generate_resources(
         self,
         output_folder: str = GENERATED_CLASSES_LOCATION,
-        file_name: str = RESOURCES_CODEGEN_FILE_NAME,
+        package_name: str = RESOURCES_CODEGEN_PACKAGE_NAME,
     ) -> None:
         """
-        Generate the resources file.
+        Generate the resources package.
+
+        Every resource class is a module of the package, imported on first access of
+        the class, which only imports the shape clusters the resource uses.
 
         Args:
             output_folder (str, optional): The output folder path. Defaults to "GENERATED_CLASSES_LOCATION".
-            file_name (str, optional): The output file name. Defaults to "RESOURCES_CODEGEN_FILE_NAME".
+            package_name (str, optional): The package name. Defaults to "RESOURCES_CODEGEN_PACKAGE_NAME".
         """
-        # Check if the output folder exists, if not, create it
-        os.makedirs(output_folder, exist_ok=True)
-
-        # Create the full path for the output file
-        output_file = os.path.join(output_folder, file_name)
+        package_folder = os.path.join(output_folder, package_name)
+        # Remove the modules of a previous generation
+        shutil.rmtree(package_folder, ignore_errors=True)
+        os.makedirs(package_folder)
+
+        resource_modules = {}
+        for resource_name, resource_class in self._generate_resource_classes():
+            module_name = convert_to_snake_case(resource_name)
+            resource_modules[resource_name] = module_name
+            # a shape sharing the name of the resource is shadowed by the resource
+            # class, it is only imported if the class body uses it as an attribute type
+            class_body = resource_class.split("\n", 1)[1]
+            shape_names = get_referenced_names(
+                class_body, self._get_shape_class_names()
+            )
+            with open(os.path.join(package_folder, f"{module_name}.py"), "w") as file:
+                file.write(self.generate_license())
+                file.write(self.generate_imports(shape_names))
+                file.write(self.generate_logging())
+                file.write(f"{resource_class}\n")
 
-        # Open the output file
-        with open(output_file, "w") as file:
+        with open(os.path.join(package_folder, "__init__.py"), "w") as file:
             # Generate and write the license to the file
             file.write(self.generate_license())
 
@@ -235,31 +351,108 @@ class ResourcesCodeGen:
             # Generate and write the base class to the file
             file.write(self.generate_base_class())
 
-            # Iterate over the rows in the resources plan
-            for _, row in self.resources_plan.iterrows():
-                # Extract the necessary data from the row
-                resource_name = row["resource_name"]
-                class_methods = row["class_methods"]
-                object_methods = row["object_methods"]
-                additional_methods = row["additional_methods"]
-                raw_actions = row["raw_actions"]
-                resource_status_chain = row["resource_status_chain"]
-                resource_states = row["resource_states"]
-
-                # Generate the resource class
-                resource_class = self.generate_resource_class(
-                    resource_name,
-                    class_methods,
-                    object_methods,
-                    additional_methods,
-                    raw_actions,
-                    resource_status_chain,
-                    resource_states,
+            # Generate and write the lazy imports of the resource modules to the file
+            file.write(
+                LAZY_PACKAGE_TEMPLATE.format(
+                    modules_name="_RESOURCE_MODULES",
+                    modules="\n".join(
+                        f'    "{resource_name}": "{module_name}",'
+                        for resource_name, module_name in resource_modules.items()
+                    ),
+                    exported_names='"Base", ',
+                    missing_name="        # shape classes used to be importable from the resources module\n"
+                    "        if name in shapes.__all__:\n"
+                    "            return getattr(shapes, name)\n"
+                    '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
                 )
+            )
+            file.write(
+                LAZY_PACKAGE_WARM_UP_TEMPLATE.format(modules_name="_RESOURCE_MODULES")
+            )
+
+    def generate_aio_resources(
+        self,
+        output_folder: str = GENERATED_CLASSES_LOCATION,
+        file_name: str = AIO_RESOURCES_CODEGEN_FILE_NAME,
+    ) -> None:
+        """
+        Generate the asyncio resources file.
+
+        Every resource class of the resources package gets an asyncio counterpart with
+        the same name, whose methods are coroutines calling the service through the
+        configured AsyncTransport.
+
+        Args:
+            output_folder (str, optional): The output folder path. Defaults to "GENERATED_CLASSES_LOCATION".
+            file_name (str, optional): The output file name. Defaults to "AIO_RESOURCES_CODEGEN_FILE_NAME".
+        """
+        os.makedirs(output_folder, exist_ok=True)
+        output_file = os.path.join(output_folder, file_name)
+
+        resource_classes = dict(self._generate_resource_classes(is_async=True))
+        # the shapes sharing the name of a resource are shadowed by its asyncio class
+        shape_names = get_referenced_names(
+            "\n".join(resource_classes.values()),
+            self._get_shape_class_names() - set(resource_classes),
+        )
+        with open(output_file, "w") as file:
+            file.write(self.generate_license())
+            file.write(self.generate_aio_imports(shape_names))
+            file.write(self.generate_logging())
+            file.write(self.generate_async_base_class())
 
-                # If the resource class was successfully generated, write it to the file
-                if resource_class:
-                    file.write(f"{resource_class}\n\n")
+            for resource_class in resource_classes.values():
+                file.write(f"{resource_class}\n\n")
+
+    @lru_cache(maxsize=None)
+    def _get_shape_class_names(self) -> frozenset:
+        """
+        Get the names importable from the shapes package.
+
+        Returns:
+            frozenset: The generated shape classes and Unassigned.
+        """
+        operation_shapes = set()
+        for operation in self.operations.values():
+            for io_key in ("input", "output"):
+                if io_key in operation:
+                    operation_shapes.add(operation[io_key]["shape"])
+        return frozenset(
+            [
+                shape_name
+                for shape_name, shape in self.shapes.items()
+                if shape["type"] == "structure" and shape_name not in operation_shapes
+            ]
+            + ["Unassigned"]
+        )
+
+    def _generate_resource_classes(self, is_async: bool = False):
+        """
+        Lazily generate the resource classes of the resources plan.
+
+        Args:
+            is_async (bool): Whether to generate the asyncio variant of the classes.
+
+        Yields:
+            tuple: The resource name and the formatted resource class of every resource that has one.
+        """
+        # Iterate over the rows in the resources plan
+        for _, row in self.resources_plan.iterrows():
+            # Generate the resource class
+            resource_class = self.generate_resource_class(
+                row["resource_name"],
+                row["class_methods"],
+                row["object_methods"],
+                row["additional_methods"],
+                row["raw_actions"],
+                row["resource_status_chain"],
+                row["resource_states"],
+                is_async=is_async,
+            )
+
+            # Only yield the successfully generated resource classes
+            if resource_class:
+                yield row["resource_name"], resource_class
 
     def _evaluate_method(
         self, resource_name: str, method_name: str, methods: list, **kwargs
@@ -293,6 +486,7 @@ class ResourcesCodeGen:
         raw_actions: list,
         resource_status_chain: list,
         resource_states: list,
+        is_async: bool = False,
     ) -> str:
         """
         Generate the resource class for a resource.
@@ -303,6 +497,8 @@ class ResourcesCodeGen:
             object_methods (list): The object methods.
             additional_methods (list): The additional methods.
             raw_actions (list): The raw actions.
+            is_async (bool): Whether to generate the asyncio variant of the class, which
+                subclasses the resource class and overrides its methods with coroutines.
 
         Returns:
             str: The formatted resource class.
@@ -314,7 +510,12 @@ class ResourcesCodeGen:
         # Check if 'get' is in the class methods
         if self._is_get_in_class_methods(class_methods):
             # Start defining the class
-            resource_class = f"class {resource_name}(Base):\n"
+            if is_async:
+                resource_class = (
+                    f"class {resource_name}(AsyncBase, resources.{resource_name}):\n"
+                )
+            else:
+                resource_class = f"class {resource_name}(Base):\n"
 
             # Get the operation and shape for the 'get' method
             get_operation = self.operations["Describe" + resource_name]
@@ -350,10 +551,16 @@ class ResourcesCodeGen:
             needs_defaults_decorator = defaults_decorator_method != ""
 
             # Generate the 'get' method
-            get_method = self.generate_get_method(resource_name)
+            get_method = self.generate_get_method(resource_name, is_async=is_async)
 
             # Add the class attributes and methods to the class definition
-            resource_class += add_indent(class_attributes_string, 4)
+            # The asyncio variant inherits the attributes of the resource class
+            if not is_async:
+                resource_class += add_indent(class_attributes_string, 4)
+                if "wait" in object_methods:
+                    resource_class += add_indent(
+                        self.generate_waiter_config(resource_name), 4
+                    )
 
             if defaults_decorator_method:
                 resource_class += "\n"
@@ -364,13 +571,19 @@ class ResourcesCodeGen:
                 "create",
                 class_methods,
                 needs_defaults_decorator=needs_defaults_decorator,
+                is_async=is_async,
             ):
                 resource_class += add_indent(create_method, 4)
 
             resource_class += add_indent(get_method, 4)
 
+            if list_method := self._evaluate_method(
+                resource_name, "list", class_methods, is_async=is_async
+            ):
+                resource_class += add_indent(list_method, 4)
+
             if refresh_method := self._evaluate_method(
-                resource_name, "refresh", object_methods
+                resource_name, "refresh", object_methods, is_async=is_async
             ):
                 resource_class += add_indent(refresh_method, 4)
 
@@ -379,26 +592,27 @@ class ResourcesCodeGen:
                 "update",
                 object_methods,
                 resource_attributes=resource_attributes,
+                is_async=is_async,
             ):
                 resource_class += add_indent(update_method, 4)
 
             if delete_method := self._evaluate_method(
-                resource_name, "delete", object_methods
+                resource_name, "delete", object_methods, is_async=is_async
             ):
                 resource_class += add_indent(delete_method, 4)
 
             if stop_method := self._evaluate_method(
-                resource_name, "stop", object_methods
+                resource_name, "stop", object_methods, is_async=is_async
             ):
                 resource_class += add_indent(stop_method, 4)
 
             if wait_method := self._evaluate_method(
-                resource_name, "wait", object_methods
+                resource_name, "wait", object_methods, is_async=is_async
             ):
                 resource_class += add_indent(wait_method, 4)
 
             if wait_for_status_method := self._evaluate_method(
-                resource_name, "wait_for_status", object_methods
+                resource_name, "wait_for_status", object_methods, is_async=is_async
             ):
                 resource_class += add_indent(wait_for_status_method, 4)
 
@@ -407,14 +621,31 @@ class ResourcesCodeGen:
                 "invoke",
                 object_methods,
                 resource_attributes=resource_attributes,
+                is_async=is_async,
             ):
                 resource_class += add_indent(invoke_method, 4)
+                resource_class += add_indent(
+                    self.generate_invoke_many_method(
+                        resource_name,
+                        resource_attributes=resource_attributes,
+                        is_async=is_async,
+                    ),
+                    4,
+                )
+                if not is_async:
+                    resource_class += add_indent(
+                        self.generate_micro_batcher_method(
+                            resource_name, resource_attributes=resource_attributes
+                        ),
+                        4,
+                    )
 
             if invoke_async_method := self._evaluate_method(
                 resource_name,
                 "invoke_async",
                 object_methods,
                 resource_attributes=resource_attributes,
+                is_async=is_async,
             ):
                 resource_class += add_indent(invoke_async_method, 4)
 
@@ -423,11 +654,20 @@ class ResourcesCodeGen:
                 "invoke_with_response_stream",
                 object_methods,
                 resource_attributes=resource_attributes,
+                is_async=is_async,
             ):
                 resource_class += add_indent(invoke_with_response_stream_method, 4)
+                resource_class += add_indent(
+                    self.generate_invoke_stream_method(
+                        resource_name,
+                        resource_attributes=resource_attributes,
+                        is_async=is_async,
+                    ),
+                    4,
+                )
 
             if import_method := self._evaluate_method(
-                resource_name, "import", class_methods
+                resource_name, "import", class_methods, is_async=is_async
             ):
                 resource_class += add_indent(import_method, 4)
         else:
@@ -467,13 +707,18 @@ class ResourcesCodeGen:
             )
 
         operation_input_args = ",\n".join(args)
+        if not operation_input_args:
+            return ""
         operation_input_args += ","
         operation_input_args = add_indent(operation_input_args, 8)
 
         return operation_input_args
 
     def _generate_operation_input_necessary_args(
-        self, resource_operation: dict, resource_attributes: list
+        self,
+        resource_operation: dict,
+        resource_attributes: list,
+        exclude_list: list = [],
     ) -> str:
         """
         Generate the operation input arguments string.
@@ -490,6 +735,8 @@ class ResourcesCodeGen:
 
         args = list()
         for member in input_shape_members:
+            if convert_to_snake_case(member) in exclude_list:
+                continue
             if convert_to_snake_case(member) in resource_attributes:
                 args.append(f"'{member}': self.{convert_to_snake_case(member)}")
             else:
@@ -522,6 +769,8 @@ class ResourcesCodeGen:
             if attr not in exclude_list
         )
         method_args = ",\n".join(args)
+        if not method_args:
+            return ""
         method_args += ","
         method_args = add_indent(method_args)
         return method_args
@@ -620,30 +869,43 @@ class ResourcesCodeGen:
 
         get_args = self._generate_get_args(resource_name, operation_input_shape_name)
 
-        # Format the method using the CREATE_METHOD_TEMPLATE
-        if kwargs["needs_defaults_decorator"]:
-            formatted_method = CREATE_METHOD_TEMPLATE.format(
-                create_args=create_args,
-                resource_lower=resource_lower,
-                service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
-                operation_input_args=operation_input_args,
-                operation=operation,
-                get_args=get_args,
+        if kwargs.get("is_async"):
+            template = (
+                ASYNC_CREATE_METHOD_TEMPLATE
+                if kwargs["needs_defaults_decorator"]
+                else ASYNC_CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS
             )
         else:
-            formatted_method = CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS.format(
-                create_args=create_args,
-                resource_lower=resource_lower,
-                service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
-                operation_input_args=operation_input_args,
-                operation=operation,
-                get_args=get_args,
+            template = (
+                CREATE_METHOD_TEMPLATE
+                if kwargs["needs_defaults_decorator"]
+                else CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS
             )
 
+        # Without skipping the describe call, the create response is only logged
+        if output_shape_name := operation_metadata.get("output", {}).get("shape"):
+            create_output = f"transform(response, '{output_shape_name}')"
+        else:
+            create_output = "{}"
+
+        # Format the method using the CREATE_METHOD_TEMPLATE
+        formatted_method = template.format(
+            create_args=create_args,
+            resource_name=resource_name,
+            resource_lower=resource_lower,
+            service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
+            operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
+            operation=operation,
+            get_args=get_args,
+            create_input_shape=operation_input_shape_name,
+            create_output=create_output,
+        )
+
         # Return the formatted method
         return formatted_method
 
-    def generate_import_method(self, resource_name: str) -> str:
+    def generate_import_method(self, resource_name: str, is_async: bool = False) -> str:
         """
         Auto-generate the CREATE method for a resource.
 
@@ -675,11 +937,14 @@ class ResourcesCodeGen:
         get_args = self._generate_get_args(resource_name, operation_input_shape_name)
 
         # Format the method using the CREATE_METHOD_TEMPLATE
-        formatted_method = IMPORT_METHOD_TEMPLATE.format(
+        template = ASYNC_IMPORT_METHOD_TEMPLATE if is_async else IMPORT_METHOD_TEMPLATE
+        formatted_method = template.format(
             import_args=import_args,
+            resource_name=resource_name,
             resource_lower=resource_lower,
             service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
             operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
             operation=operation,
             get_args=get_args,
         )
@@ -719,12 +984,18 @@ class ResourcesCodeGen:
         operation = convert_to_snake_case(operation_name)
 
         # Format the method using the CREATE_METHOD_TEMPLATE
-        formatted_method = UPDATE_METHOD_TEMPLATE.format(
+        template = (
+            ASYNC_UPDATE_METHOD_TEMPLATE
+            if kwargs.get("is_async")
+            else UPDATE_METHOD_TEMPLATE
+        )
+        formatted_method = template.format(
             service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
             resource_name=resource_name,
             resource_lower=resource_lower,
             update_args=update_args,
             operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
             operation=operation,
         )
 
@@ -763,18 +1034,112 @@ class ResourcesCodeGen:
         operation = convert_to_snake_case(operation_name)
 
         # Format the method using the CREATE_METHOD_TEMPLATE
+        if kwargs.get("is_async"):
+            return ASYNC_INVOKE_METHOD_TEMPLATE.format(
+                method_name="invoke",
+                service_name="sagemaker-runtime",
+                invoke_args=invoke_args,
+                resource_name=resource_name,
+                resource_lower=resource_lower,
+                operation_input_args=operation_input_args,
+                operation_input_shape=operation_input_shape_name,
+                operation=operation,
+            )
+
         formatted_method = INVOKE_METHOD_TEMPLATE.format(
             service_name="sagemaker-runtime",
             invoke_args=invoke_args,
             resource_name=resource_name,
             resource_lower=resource_lower,
             operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
             operation=operation,
         )
 
         # Return the formatted method
         return formatted_method
 
+    def generate_invoke_many_method(self, resource_name: str, **kwargs) -> str:
+        """
+        Auto-generate the INVOKE MANY method for a resource, invoking it once per body.
+
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted Invoke Many Method template, empty if the invoke
+                operation has no Body member.
+
+        """
+        operation_name = "Invoke" + resource_name
+        operation_metadata = self.operations[operation_name]
+        operation_input_shape_name = operation_metadata["input"]["shape"]
+        if "Body" not in self.shapes[operation_input_shape_name]["members"]:
+            return ""
+
+        # The body is the only argument that differs between the requests
+        invoke_args = self._generate_method_args_excluding_resource_class_attributes(
+            operation_input_shape_name, kwargs["resource_attributes"] + ["body"]
+        )
+
+        operation_input_args = self._generate_operation_input_necessary_args(
+            operation_metadata, kwargs["resource_attributes"], exclude_list=["body"]
+        )
+
+        template = (
+            ASYNC_INVOKE_MANY_METHOD_TEMPLATE
+            if kwargs.get("is_async")
+            else INVOKE_MANY_METHOD_TEMPLATE
+        )
+        return template.format(
+            service_name="sagemaker-runtime",
+            invoke_args=invoke_args,
+            resource_lower=convert_to_snake_case(resource_name),
+            operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
+            operation=convert_to_snake_case(operation_name),
+        )
+
+    def generate_micro_batcher_method(self, resource_name: str, **kwargs) -> str:
+        """
+        Auto-generate the MICRO BATCHER method for a resource.
+
+        The body, content type and accept members of the invoke operation come from the
+        payload codec of the batcher.
+
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted Micro Batcher Method template, empty if the invoke
+                operation has no Body member.
+
+        """
+        operation_name = "Invoke" + resource_name
+        operation_metadata = self.operations[operation_name]
+        operation_input_shape_name = operation_metadata["input"]["shape"]
+        members = self.shapes[operation_input_shape_name]["members"]
+        if not {"Body", "ContentType", "Accept"}.issubset(members):
+            return ""
+
+        invoke_args = self._generate_method_args_excluding_resource_class_attributes(
+            operation_input_shape_name,
+            kwargs["resource_attributes"] + ["body", "content_type", "accept"],
+        )
+
+        operation_input_args = self._generate_operation_input_necessary_args(
+            operation_metadata, kwargs["resource_attributes"], exclude_list=["body"]
+        )
+
+        return MICRO_BATCHER_METHOD_TEMPLATE.format(
+            service_name="sagemaker-runtime",
+            invoke_args=invoke_args,
+            resource_lower=convert_to_snake_case(resource_name),
+            operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
+            operation=convert_to_snake_case(operation_name),
+        )
+
     def generate_invoke_async_method(self, resource_name: str, **kwargs) -> str:
         """
         Auto-generate the INVOKE method for a resource.
@@ -807,12 +1172,25 @@ class ResourcesCodeGen:
         operation = convert_to_snake_case(operation_name)
 
         # Format the method using the CREATE_METHOD_TEMPLATE
+        if kwargs.get("is_async"):
+            return ASYNC_INVOKE_METHOD_TEMPLATE.format(
+                method_name="invoke_async",
+                service_name="sagemaker-runtime",
+                invoke_args=invoke_args,
+                resource_name=resource_name,
+                resource_lower=resource_lower,
+                operation_input_args=operation_input_args,
+                operation_input_shape=operation_input_shape_name,
+                operation=operation,
+            )
+
         formatted_method = INVOKE_ASYNC_METHOD_TEMPLATE.format(
             service_name="sagemaker-runtime",
             create_args=invoke_args,
             resource_name=resource_name,
             resource_lower=resource_lower,
             operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
             operation=operation,
         )
 
@@ -853,19 +1231,69 @@ class ResourcesCodeGen:
         operation = convert_to_snake_case(operation_name)
 
         # Format the method using the CREATE_METHOD_TEMPLATE
+        if kwargs.get("is_async"):
+            return ASYNC_INVOKE_METHOD_TEMPLATE.format(
+                method_name="invoke_with_response_stream",
+                service_name="sagemaker-runtime",
+                invoke_args=invoke_args,
+                resource_name=resource_name,
+                resource_lower=resource_lower,
+                operation_input_args=operation_input_args,
+                operation_input_shape=operation_input_shape_name,
+                operation=operation,
+            )
+
         formatted_method = INVOKE_WITH_RESPONSE_STREAM_METHOD_TEMPLATE.format(
             service_name="sagemaker-runtime",
             create_args=invoke_args,
             resource_name=resource_name,
             resource_lower=resource_lower,
             operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
             operation=operation,
         )
 
         # Return the formatted method
         return formatted_method
 
-    def generate_get_method(self, resource_name: str) -> str:
+    def generate_invoke_stream_method(self, resource_name: str, **kwargs) -> str:
+        """
+        Auto-generate the INVOKE STREAM method for a resource, decoding the response stream.
+
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted Invoke Stream Method template.
+
+        """
+        operation_name = "Invoke" + resource_name + "WithResponseStream"
+        operation_metadata = self.operations[operation_name]
+        operation_input_shape_name = operation_metadata["input"]["shape"]
+
+        invoke_args = self._generate_method_args_excluding_resource_class_attributes(
+            operation_input_shape_name, kwargs["resource_attributes"]
+        )
+
+        operation_input_args = self._generate_operation_input_necessary_args(
+            operation_metadata, kwargs["resource_attributes"]
+        )
+
+        template = (
+            ASYNC_INVOKE_STREAM_METHOD_TEMPLATE
+            if kwargs.get("is_async")
+            else INVOKE_STREAM_METHOD_TEMPLATE
+        )
+        return template.format(
+            service_name="sagemaker-runtime",
+            invoke_args=invoke_args,
+            resource_lower=convert_to_snake_case(resource_name),
+            operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
+            operation=convert_to_snake_case(operation_name),
+        )
+
+    def generate_get_method(self, resource_name: str, is_async: bool = False) -> str:
         """
         Auto-generate the GET method (describe API) for a resource.
 
@@ -892,9 +1320,11 @@ class ResourcesCodeGen:
 
         operation = convert_to_snake_case(operation_name)
 
-        formatted_method = GET_METHOD_TEMPLATE.format(
+        template = ASYNC_GET_METHOD_TEMPLATE if is_async else GET_METHOD_TEMPLATE
+        formatted_method = template.format(
             service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
             describe_args=describe_args,
+            resource_name=resource_name,
             resource_lower=resource_lower,
             operation_input_args=operation_input_args,
             operation=operation,
@@ -902,7 +1332,117 @@ class ResourcesCodeGen:
         )
         return formatted_method
 
-    def generate_refresh_method(self, resource_name: str) -> str:
+    def _get_list_summaries_key(self, operation_name: str) -> Optional[str]:
+        """
+        Finds the response member holding the list of summaries for a List operation.
+
+        The paginator definition is used when present, otherwise the operation must take
+        and return a NextToken and have a single list member in its output.
+
+        Args:
+            operation_name (str): The name of the List operation.
+
+        Returns:
+            str: The response member name, or None if the operation is not paginated.
+        """
+        if paginator := self.paginators.get(operation_name):
+            return paginator["result_key"]
+
+        operation_metadata = self.operations[operation_name]
+        input_members = self.shapes[operation_metadata["input"]["shape"]]["members"]
+        output_members = self.shapes[operation_metadata["output"]["shape"]]["members"]
+        if "NextToken" not in input_members or "NextToken" not in output_members:
+            return None
+        list_members = [
+            member
+            for member, member_attrs in output_members.items()
+            if self.shapes[member_attrs["shape"]]["type"] == "list"
+        ]
+        return list_members[0] if len(list_members) == 1 else None
+
+    def generate_list_method(self, resource_name: str, is_async: bool = False) -> str:
+        """
+        Auto-Generate 'list' class Method [List API] for a resource.
+
+        The generated method returns a lazy ResourceIterator. Resources whose summaries
+        cannot identify the resource are skipped.
+
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted list Method template, or an empty string if the
+                resource cannot be listed.
+        """
+        operation_name = "List" + resource_name + "s"
+        if operation_name not in self.operations:
+            log.warning(
+                f"Resource {resource_name} does not have a {operation_name} API"
+            )
+            return ""
+
+        summaries_key = self._get_list_summaries_key(operation_name)
+        if summaries_key is None:
+            log.warning(f"{operation_name} is not a paginated API")
+            return ""
+
+        operation_metadata = self.operations[operation_name]
+        operation_input_shape_name = operation_metadata["input"]["shape"]
+        operation_input_shape = self.shapes[operation_input_shape_name]
+        operation_output_shape = self.shapes[operation_metadata["output"]["shape"]]
+        summaries_shape_name = operation_output_shape["members"][summaries_key]["shape"]
+        summary_name = self.shapes[summaries_shape_name]["member"]["shape"]
+        summary_shape = self.shapes[summary_name]
+
+        describe_operation = self.operations["Describe" + resource_name]
+        describe_output_members = self.shapes[describe_operation["output"]["shape"]][
+            "members"
+        ]
+        if summary_shape["type"] != "structure" or len(describe_output_members) == 1:
+            log.warning(f"{operation_name} summaries do not map to {resource_name}")
+            return ""
+
+        # Identifiers missing from the summaries must be inputs of the List API
+        resource_kwargs = []
+        describe_input_shape = self.shapes[describe_operation["input"]["shape"]]
+        for identifier in describe_input_shape.get("required", []):
+            if identifier in summary_shape["members"]:
+                continue
+            if identifier not in operation_input_shape.get("required", []):
+                log.warning(
+                    f"{operation_name} summaries do not identify {resource_name}"
+                )
+                return ""
+            snake_identifier = convert_to_snake_case(identifier)
+            resource_kwargs.append(f"'{snake_identifier}': {snake_identifier}")
+
+        exclude_list = ["next_token", "max_results"]
+        list_args = self._generate_method_args(operation_input_shape_name, exclude_list)
+        operation_input_args = self._generate_operation_input_args(
+            operation_metadata, is_class_method=True, exclude_list=exclude_list
+        )
+
+        template = ASYNC_LIST_METHOD_TEMPLATE if is_async else LIST_METHOD_TEMPLATE
+        formatted_method = template.format(
+            service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
+            resource_name=resource_name,
+            list_args=list_args,
+            operation_input_args=operation_input_args,
+            operation_input_shape=operation_input_shape_name,
+            operation=convert_to_snake_case(operation_name),
+            summaries_key=summaries_key,
+            summary_name=summary_name,
+            resource_kwargs=(
+                f"\n        resource_kwargs={{{', '.join(resource_kwargs)}}},"
+                if resource_kwargs
+                else ""
+            ),
+        )
+        return formatted_method
+
+    def generate_refresh_method(
+        self, resource_name: str, is_async: bool = False
+    ) -> str:
         """Auto-Generate 'refresh' object Method [describe API] for a resource.
 
         Args:
@@ -921,14 +1461,19 @@ class ResourcesCodeGen:
 
         operation = convert_to_snake_case(operation_name)
 
-        formatted_method = REFRESH_METHOD_TEMPLATE.format(
+        template = (
+            ASYNC_REFRESH_METHOD_TEMPLATE if is_async else REFRESH_METHOD_TEMPLATE
+        )
+        formatted_method = template.format(
+            service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
+            resource_name=resource_name,
             operation_input_args=operation_input_args,
             operation=operation,
             describe_operation_output_shape=resource_operation_output_shape_name,
         )
         return formatted_method
 
-    def generate_delete_method(self, resource_name: str) -> str:
+    def generate_delete_method(self, resource_name: str, is_async: bool = False) -> str:
         """Auto-Generate 'delete' object Method [delete API] for a resource.
 
         Args:
@@ -946,13 +1491,16 @@ class ResourcesCodeGen:
 
         operation = convert_to_snake_case(operation_name)
 
-        formatted_method = DELETE_METHOD_TEMPLATE.format(
+        template = ASYNC_DELETE_METHOD_TEMPLATE if is_async else DELETE_METHOD_TEMPLATE
+        formatted_method = template.format(
+            service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
+            resource_name=resource_name,
             operation_input_args=operation_input_args,
             operation=operation,
         )
         return formatted_method
 
-    def generate_stop_method(self, resource_name: str) -> str:
+    def generate_stop_method(self, resource_name: str, is_async: bool = False) -> str:
         """Auto-Generate 'stop' object Method [delete API] for a resource.
 
         Args:
@@ -970,26 +1518,70 @@ class ResourcesCodeGen:
 
         operation = convert_to_snake_case(operation_name)
 
-        formatted_method = STOP_METHOD_TEMPLATE.format(
+        template = ASYNC_STOP_METHOD_TEMPLATE if is_async else STOP_METHOD_TEMPLATE
+        formatted_method = template.format(
+            service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
+            resource_name=resource_name,
             operation_input_args=operation_input_args,
             operation=operation,
         )
         return formatted_method
 
-    def generate_wait_method(self, resource_name: str) -> str:
-        """Auto-Generate WAIT Method for a waitable resource.
+    def _get_waiter_format_args(self, resource_name: str) -> dict:
+        """
+        Collects the format arguments shared by the WAIT and WAIT_FOR_STATUS templates.
+
+        The failure states and the maximum delay between two polls come from the
+        waiters of the describe operation in waiters-2.json when there are any.
 
         Args:
             resource_name (str): The resource name.
 
         Returns:
-            str: The formatted Wait Method template.
+            dict: The format arguments.
         """
         resource_status_chain, resource_states = (
             self.resources_extractor.get_status_chain_and_states(resource_name)
         )
 
-        # Get terminal states for resource
+        operation_name = "Describe" + resource_name
+        operation_metadata = self.operations[operation_name]
+
+        failure_states = []
+        waiter_delays = []
+        for waiter in self.waiters.values():
+            if waiter["operation"] != operation_name:
+                continue
+            waiter_delays.append(waiter["delay"])
+            for acceptor in waiter["acceptors"]:
+                if (
+                    acceptor["state"] == "failure"
+                    and acceptor["matcher"] == "path"
+                    and acceptor["expected"] not in failure_states
+                ):
+                    failure_states.append(acceptor["expected"])
+        if not waiter_delays:
+            failure_states = [
+                state for state in resource_states if "failed" in state.lower()
+            ]
+
+        return dict(
+            resource_name=resource_name,
+            service_name="sagemaker",  # TODO: change service name based on the service - runtime, sagemaker, etc.
+            operation_input_args=self._generate_operation_input_args(
+                operation_metadata, is_class_method=False
+            ),
+            operation=convert_to_snake_case(operation_name),
+            describe_operation_output_shape=operation_metadata["output"]["shape"],
+            status_path=tuple(member["name"] for member in resource_status_chain),
+            resource_states=resource_states,
+            failure_states=failure_states,
+            max_delay=min(waiter_delays) if waiter_delays else DEFAULT_MAX_DELAY,
+        )
+
+    @staticmethod
+    def _get_terminal_states(resource_states: list) -> list:
+        """Returns the resource states matching one of the TERMINAL_STATES."""
         terminal_resource_states = []
         for state in resource_states:
             # Handles when a resource has terminal states like UpdateCompleted, CreateFailed, etc.
@@ -999,19 +1591,96 @@ class ResourcesCodeGen:
                 for terminal_state in TERMINAL_STATES
             ):
                 terminal_resource_states.append(state)
+        return terminal_resource_states
+
+    def generate_waiter_config(self, resource_name: str) -> str:
+        """
+        Auto-Generate the WaiterConfig class variable used by wait_all and wait_any.
 
-        # Get resource status key path
-        status_key_path = ""
-        for member in resource_status_chain:
-            status_key_path += f'.{convert_to_snake_case(member["name"])}'
+        The List API is only configured when it can be filtered by status and its
+        summaries carry the single identifier of the resource.
 
-        formatted_method = WAIT_METHOD_TEMPLATE.format(
-            terminal_resource_states=terminal_resource_states,
-            status_key_path=status_key_path,
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted WaiterConfig template.
+        """
+        format_args = self._get_waiter_format_args(resource_name)
+        describe_input_shape = self.shapes[
+            self.operations["Describe" + resource_name]["input"]["shape"]
+        ]
+        identifiers = tuple(
+            (member, convert_to_snake_case(member))
+            for member in describe_input_shape.get("required", [])
+        )
+
+        list_config = ""
+        list_operation_name = "List" + resource_name + "s"
+        if (
+            list_operation_name in self.operations
+            and len(identifiers) == 1
+            and (summaries_key := self._get_list_summaries_key(list_operation_name))
+        ):
+            list_operation = self.operations[list_operation_name]
+            list_input_members = self.shapes[list_operation["input"]["shape"]][
+                "members"
+            ]
+            summaries_shape_name = self.shapes[list_operation["output"]["shape"]][
+                "members"
+            ][summaries_key]["shape"]
+            summary_name = self.shapes[summaries_shape_name]["member"]["shape"]
+            summary_members = self.shapes[summary_name].get("members", {})
+            if "StatusEquals" in list_input_members and identifiers[0][0] in (
+                summary_members
+            ):
+                list_filters = tuple(
+                    list_filter
+                    for list_filter in ("NameContains", "CreationTimeAfter")
+                    if list_filter in list_input_members
+                )
+                list_config = (
+                    f"\n    list_method='{convert_to_snake_case(list_operation_name)}',"
+                    f"\n    summaries_key='{summaries_key}',"
+                    f"\n    summary_name='{summary_name}',"
+                    f"\n    list_filters={list_filters},"
+                )
+
+        return WAITER_CONFIG_TEMPLATE.format(
+            resource_name=resource_name,
+            status_path=format_args["status_path"],
+            terminal_states=tuple(
+                self._get_terminal_states(format_args["resource_states"])
+            ),
+            describe_method=format_args["operation"],
+            identifiers=identifiers,
+            describe_output_shape=format_args["describe_operation_output_shape"],
+            list_config=list_config,
+        )
+
+    def generate_wait_method(self, resource_name: str, is_async: bool = False) -> str:
+        """Auto-Generate WAIT Method for a waitable resource.
+
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted Wait Method template.
+        """
+        format_args = self._get_waiter_format_args(resource_name)
+        terminal_resource_states = self._get_terminal_states(
+            format_args["resource_states"]
+        )
+
+        template = ASYNC_WAIT_METHOD_TEMPLATE if is_async else WAIT_METHOD_TEMPLATE
+        formatted_method = template.format(
+            terminal_resource_states=terminal_resource_states, **format_args
         )
         return formatted_method
 
-    def generate_wait_for_status_method(self, resource_name: str) -> str:
+    def generate_wait_for_status_method(
+        self, resource_name: str, is_async: bool = False
+    ) -> str:
         """Auto-Generate WAIT_FOR_STATUS Method for a waitable resource.
 
         Args:
@@ -1020,18 +1689,14 @@ class ResourcesCodeGen:
         Returns:
             str: The formatted wait_for_status Method template.
         """
-        resource_status_chain, resource_states = (
-            self.resources_extractor.get_status_chain_and_states(resource_name)
-        )
-
-        # Get resource status key path
-        status_key_path = ""
-        for member in resource_status_chain:
-            status_key_path += f'.{convert_to_snake_case(member["name"])}'
+        format_args = self._get_waiter_format_args(resource_name)
 
-        formatted_method = WAIT_FOR_STATUS_METHOD_TEMPLATE.format(
-            resource_states=resource_states, status_key_path=status_key_path
+        template = (
+            ASYNC_WAIT_FOR_STATUS_METHOD_TEMPLATE
+            if is_async
+            else WAIT_FOR_STATUS_METHOD_TEMPLATE
         )
+        formatted_method = template.format(**format_args)
         return formatted_method
 
     def generate_config_schema(self):
@@ -16,16 +16,25 @@ To run the script be sure to set the PYTHONPATH
 export PYTHONPATH=<sagemaker-code-gen repo directory>:$PYTHONPATH
 """
 import os
+import shutil
 import textwrap
 
 from src.tools.constants import (
     LICENCES_STRING,
     GENERATED_CLASSES_LOCATION,
-    SHAPES_CODEGEN_FILE_NAME,
+    SHAPES_CODEGEN_PACKAGE_NAME,
+    VIEWS_CODEGEN_PACKAGE_NAME,
 )
+from src.tools.resources_extractor import ResourcesExtractor
 from src.tools.shapes_extractor import ShapesExtractor
-from src.util.util import add_indent, convert_to_snake_case
-from src.tools.templates import SHAPE_CLASS_TEMPLATE, SHAPE_BASE_CLASS_TEMPLATE
+from src.util.util import add_indent, convert_to_snake_case, get_referenced_names
+from src.tools.templates import (
+    LAZY_PACKAGE_TEMPLATE,
+    LAZY_PACKAGE_WARM_UP_TEMPLATE,
+    SHAPE_CLASS_TEMPLATE,
+    SHAPE_BASE_CLASS_TEMPLATE,
+    SHAPE_VIEW_CLASS_TEMPLATE,
+)
 from src.tools.data_extractor import (
     load_combined_shapes_data,
     load_combined_operations_data,
@@ -52,7 +61,9 @@ class ShapesCodeGen:
         generate_imports(): Generates the import statements for the generated shape classes.
         generate_base_class(): Generates the base class for the shape classes.
         _filter_input_output_shapes(shape): Filters out shapes that are used as input or output for operations.
-        generate_shapes(output_folder): Generates the shape classes and writes them to the specified output folder.
+        get_shape_clusters(): Groups the generated shape classes into the modules of the shapes package.
+        generate_shapes(output_folder): Generates the shapes package and writes it to the specified output folder.
+        generate_views(output_folder): Generates the views package and writes it to the specified output folder.
     """
 
     def __init__(self):
@@ -115,18 +126,23 @@ class ShapesCodeGen:
         visited = set()
         stack = []
 
-        def dfs(node):
-            visited.add(node)
-            # unless leaf node is reached do dfs
-            if graph.get(node) is not None:
-                for neighbor in graph.get(node, []):
+        for root in graph:
+            if root in visited:
+                continue
+            # depth first search with an explicit stack of (node, neighbors left to visit)
+            visited.add(root)
+            pending = [(root, iter(graph.get(root) or []))]
+            while pending:
+                node, neighbors = pending[-1]
+                for neighbor in neighbors:
                     if neighbor not in visited:
-                        dfs(neighbor)
-            stack.append(node)
-
-        for node in graph:
-            if node not in visited:
-                dfs(node)
+                        visited.add(neighbor)
+                        pending.append((neighbor, iter(graph.get(neighbor) or [])))
+                        break
+                else:
+                    # every neighbor is visited, the node comes after them
+                    pending.pop()
+                    stack.append(node)
 
         return stack
 
@@ -191,8 +207,12 @@ class ShapesCodeGen:
         """
         imports = "import datetime\n"
         imports += "\n"
-        imports += "from pydantic import BaseModel\n"
-        imports += "from typing import List, Dict, Optional, Any\n"
+        imports += "from pydantic import BaseModel, ConfigDict\n"
+        imports += "from threading import Thread\n"
+        imports += "from typing import List, Dict, Iterable, Optional, Any\n"
+        imports += "\n"
+        imports += "from src.code_injection.codec import serialize_shape\n"
+        imports += "from src.code_injection.warm_up import build_models\n"
         imports += "\n"
         return imports
 
@@ -225,39 +245,124 @@ class ShapesCodeGen:
             return False
         return True
 
-    def generate_shapes(
-        self,
-        output_folder=GENERATED_CLASSES_LOCATION,
-        file_name=SHAPES_CODEGEN_FILE_NAME,
-    ) -> None:
+    def get_shape_clusters(self, with_operation_shapes: bool = False) -> dict:
         """
-        Generates the shape classes and writes them to the specified output folder.
-
-        :param output_folder: The path to the output folder.
+        Groups the generated shape classes into the modules of the shapes package.
+
+        The shapes reachable from the operations of exactly the same resources form a
+        cluster, so importing the shapes of a resource never imports the shapes of
+        unrelated resources. The shapes of no resource are clustered alike by the
+        operations reaching them, and the shapes of no operation by the shapes without
+        referrers reaching them. A cluster only depends on clusters reachable from a
+        superset of its resources, operations or shapes, so the modules do not import
+        each other circularly. A module is named after the first shape of its cluster in
+        alphabetical order.
+
+        :param with_operation_shapes: Whether to also cluster the input and output shapes
+            of the operations, which have a view class but no shape class.
+        :return: A dict of module name to the shapes of the module, in topological order.
         """
-        # Check if the output folder exists, if not, create it
-        os.makedirs(output_folder, exist_ok=True)
-
-        # Create the full path for the output file
-        output_file = os.path.join(output_folder, file_name)
-
-        # Open the output file
-        with open(output_file, "w") as file:
-            # Generate and write the license to the file
-            license = self.generate_license()
-            file.write(license)
+        graph = self.build_graph()
+        shapes = [
+            shape
+            for shape in self.topological_sort()
+            if (with_operation_shapes or self._filter_input_output_shapes(shape))
+            and self.combined_shapes[shape]["type"] == "structure"
+        ]
+
+        reachable_shapes = {}
+        for shape in self.topological_sort():
+            # dependencies come first in the topological order
+            reachable = {shape}
+            for dependency in graph.get(shape) or []:
+                reachable |= reachable_shapes.get(dependency, set())
+            reachable_shapes[shape] = reachable
+
+        def get_operation_shapes(operation_name: str) -> set:
+            operation = self.combined_operations[operation_name]
+            operation_shapes = set()
+            for io_key in ("input", "output"):
+                if io_key in operation:
+                    operation_shapes |= reachable_shapes.get(
+                        operation[io_key]["shape"], set()
+                    )
+            return operation_shapes
+
+        shape_resources = {shape: set() for shape in shapes}
+        resources_plan = ResourcesExtractor(
+            self.combined_shapes, self.combined_operations
+        ).get_resource_plan()
+        for _, row in resources_plan.iterrows():
+            for action in row["raw_actions"]:
+                for shape in get_operation_shapes(action) & shape_resources.keys():
+                    shape_resources[shape].add(row["resource_name"])
+
+        shape_operations = {shape: set() for shape in shapes}
+        for operation_name in self.combined_operations:
+            for shape in get_operation_shapes(operation_name) & shape_operations.keys():
+                shape_operations[shape].add(operation_name)
+
+        referenced_shapes = set().union(*(graph.get(shape) or [] for shape in graph))
+        shape_roots = {shape: set() for shape in shapes}
+        for root in reachable_shapes.keys() - referenced_shapes:
+            for shape in reachable_shapes[root] & shape_roots.keys():
+                shape_roots[shape].add(root)
+
+        clusters = {}
+        for shape in shapes:
+            if shape_resources[shape]:
+                key = ("resources", frozenset(shape_resources[shape]))
+            elif shape_operations[shape]:
+                key = ("operations", frozenset(shape_operations[shape]))
+            else:
+                key = ("shapes", frozenset(shape_roots[shape]))
+            clusters.setdefault(key, []).append(shape)
+        return {
+            convert_to_snake_case(min(cluster)): cluster
+            for cluster in sorted(clusters.values(), key=min)
+        }
+
+    def generate_shape_module(self, shapes: list, shape_modules: dict) -> str:
+        """
+        Generates the module of a cluster of shape classes.
 
-            # Generate and write the imports to the file
-            imports = self.generate_imports()
-            file.write(imports)
+        :param shapes: The shapes of the cluster, in topological order.
+        :param shape_modules: The module name of every shape class.
+        :return: The generated module as a string.
+        """
+        shape_classes = "".join(
+            self.generate_data_class_for_shape(shape) for shape in shapes
+        )
+        imported_shapes = {}
+        for name in get_referenced_names(shape_classes, shape_modules.keys()):
+            if name not in shapes:
+                imported_shapes.setdefault(shape_modules[name], []).append(name)
+
+        module = self.generate_license()
+        module += "import datetime\n\n"
+        module += "from typing import List, Dict, Optional, Any\n\n"
+        module += "from . import Base, Unassigned\n"
+        for module_name, names in sorted(imported_shapes.items()):
+            module += f"from .{module_name} import {', '.join(names)}\n"
+        return module + shape_classes
+
+    def generate_package_init(self, shape_modules: dict) -> str:
+        """
+        Generates the __init__ module of the shapes package.
 
-            # Generate and write Base Class
-            base_class = self.generate_base_class()
-            file.write(base_class)
-            file.write("\n\n")
+        It defines the Base and Unassigned classes and imports the module of a shape
+        class on first access of the class.
 
-            # Write Unassigned Class
-            class_definition_string = '''\
+        :param shape_modules: The module name of every shape class.
+        :return: The generated module as a string.
+        """
+        package_init = self.generate_license()
+        package_init += "import importlib\n"
+        package_init += self.generate_imports()
+        package_init += self.generate_base_class()
+        package_init += "\n\n"
+        package_init += textwrap.dedent(
+            '''\
             class Unassigned:
                 """A custom type used to signify an undefined optional argument."""
                 _instance = None
@@ -267,22 +372,117 @@ class ShapesCodeGen:
                         cls._instance = super().__new__(cls)
                     return cls._instance
             '''
-            wrapped_class_definition = textwrap.indent(
-                textwrap.dedent(class_definition_string), prefix=""
+        )
+        package_init += LAZY_PACKAGE_TEMPLATE.format(
+            modules_name="_SHAPE_MODULES",
+            modules="\n".join(
+                f'    "{shape}": "{module_name}",'
+                for shape, module_name in shape_modules.items()
+            ),
+            exported_names='"Base", "Unassigned", ',
+            missing_name='        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        )
+        package_init += LAZY_PACKAGE_WARM_UP_TEMPLATE.format(
+            modules_name="_SHAPE_MODULES"
+        )
+        return package_init
+
+    def generate_view_class_for_shape(self, shape):
+        """
+        Generates the read-only view class of a given shape.
+
+        :param shape: The name of the shape.
+        :return: The generated view class as a string.
+        """
+        slots = "".join(
+            f'"{convert_to_snake_case(member)}", '
+            for member in self.combined_shapes[shape].get("members", {})
+        )
+        return SHAPE_VIEW_CLASS_TEMPLATE.format(class_name=shape, slots=slots)
+
+    def generate_views(
+        self,
+        output_folder=GENERATED_CLASSES_LOCATION,
+        package_name=VIEWS_CODEGEN_PACKAGE_NAME,
+    ) -> None:
+        """
+        Generates the views package and writes it to the specified output folder.
+
+        Every structure shape, operation input and output shapes included, has a view
+        class named <Shape>View. The views are clustered like the shape classes, every
+        cluster is a module of the package imported on first access of one of its views.
+
+        :param output_folder: The path to the output folder.
+        :param package_name: The name of the views package.
+        """
+        package_folder = os.path.join(output_folder, package_name)
+        # Remove the modules of a previous generation, clusters change with the service model
+        shutil.rmtree(package_folder, ignore_errors=True)
+        os.makedirs(package_folder)
+
+        view_clusters = self.get_shape_clusters(with_operation_shapes=True)
+        view_modules = {
+            f"{shape}View": module_name
+            for module_name, shapes in view_clusters.items()
+            for shape in sorted(shapes)
+        }
+
+        with open(os.path.join(package_folder, "__init__.py"), "w") as file:
+            file.write(self.generate_license())
+            file.write("import importlib\n\n")
+            file.write("from src.code_injection.views import ShapeView\n")
+            file.write(
+                LAZY_PACKAGE_TEMPLATE.format(
+                    modules_name="_VIEW_MODULES",
+                    modules="\n".join(
+                        f'    "{view_name}": "{module_name}",'
+                        for view_name, module_name in view_modules.items()
+                    ),
+                    exported_names='"ShapeView", ',
+                    missing_name='        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+                )
             )
-            file.write(wrapped_class_definition)
-            file.write("\n")
-
-            # Iterate through shapes in topological order and generate classes
-            topological_order = self.topological_sort()
-            for shape in topological_order:
-
-                # Extract the necessary data for the shape
-                if self._filter_input_output_shapes(shape):
-                    shape_dict = self.combined_shapes[shape]
-                    shape_type = shape_dict["type"]
-                    if shape_type == "structure":
-
-                        # Generate and write data class for shape
-                        shape_class = self.generate_data_class_for_shape(shape)
-                        file.write(shape_class)
+
+        for module_name, shapes in view_clusters.items():
+            with open(os.path.join(package_folder, f"{module_name}.py"), "w") as file:
+                file.write(self.generate_license())
+                file.write("from src.code_injection.views import ShapeView\n\n")
+                file.write(
+                    "".join(
+                        self.generate_view_class_for_shape(shape)
+                        for shape in sorted(shapes)
+                    )
+                )
+
+    def generate_shapes(
+        self,
+        output_folder=GENERATED_CLASSES_LOCATION,
+        package_name=SHAPES_CODEGEN_PACKAGE_NAME,
+    ) -> None:
+        """
+        Generates the shapes package and writes it to the specified output folder.
+
+        Every cluster of shape classes is a module of the package, imported on first
+        access of one of its classes.
+
+        :param output_folder: The path to the output folder.
+        :param package_name: The name of the shapes package.
+        """
+        package_folder = os.path.join(output_folder, package_name)
+        # Remove the modules of a previous generation, clusters change with the service model
+        shutil.rmtree(package_folder, ignore_errors=True)
+        os.makedirs(package_folder)
+
+        shape_clusters = self.get_shape_clusters()
+        shape_modules = {
+            shape: module_name
+            for module_name, shapes in shape_clusters.items()
+            for shape in shapes
+        }
+
+        with open(os.path.join(package_folder, "__init__.py"), "w") as file:
+            file.write(self.generate_package_init(shape_modules))
+
+        for module_name, shapes in shape_clusters.items():
+            with open(os.path.join(package_folder, f"{module_name}.py"), "w") as file:
+                file.write(self.generate_shape_module(shapes, shape_modules))
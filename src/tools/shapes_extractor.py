@@ -11,12 +11,16 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Extracts the shapes to DAG structure."""
-import textwrap
 import pprint
 from functools import lru_cache
 from typing import Optional
 
-from src.tools.constants import BASIC_JSON_TYPES_TO_PYTHON_TYPES, SHAPE_DAG_FILE_PATH
+from src.tools.constants import (
+    BASIC_JSON_TYPES_TO_PYTHON_TYPES,
+    SHAPE_DAG_FILE_PATH,
+    NAME_MAP_FILE_PATH,
+)
+from src.code_injection.compact_shape_dag import encode_shape_dag
 from src.util.util import reformat_file_with_black, convert_to_snake_case
 from src.tools.data_extractor import load_combined_shapes_data
 
@@ -33,10 +37,73 @@ class ShapesExtractor:
         self.combined_shapes = combined_shapes or load_combined_shapes_data()
 
         self.shape_dag = self.get_shapes_dag()
-        with open(SHAPE_DAG_FILE_PATH, "w") as f:
-            f.write("SHAPE_DAG=")
-            f.write(textwrap.indent(pprint.pformat(self.shape_dag, width=1), "") + "\n")
-        reformat_file_with_black(SHAPE_DAG_FILE_PATH)
+        self.write_compact_shape_dag(SHAPE_DAG_FILE_PATH)
+
+        self.name_map = self.get_member_name_map()
+        with open(NAME_MAP_FILE_PATH, "w") as f:
+            f.write('"""Generated PascalCase <-> snake_case member name tables."""\n')
+            f.write("from types import MappingProxyType\n\n")
+            f.write("PASCAL_TO_SNAKE = MappingProxyType(")
+            f.write(pprint.pformat(self.name_map, width=1) + ")\n")
+            f.write("SNAKE_TO_PASCAL = MappingProxyType(")
+            f.write("{snake: pascal for pascal, snake in PASCAL_TO_SNAKE.items()})\n")
+        reformat_file_with_black(NAME_MAP_FILE_PATH)
+
+    def write_compact_shape_dag(self, file_path: str):
+        """
+        Writes the shape DAG module in the compact encoding of CompactShapeDag.
+
+        The string table and the records are tuple literals, which are compiled to
+        constants and loaded with marshal from the .pyc on import.
+
+        :param file_path: The path of the generated module.
+        """
+        strings, records = encode_shape_dag(self.shape_dag)
+        with open(file_path, "w") as f:
+            f.write('"""Generated compact shape DAG, see CompactShapeDag."""\n\n')
+            f.write(
+                "from src.code_injection.compact_shape_dag import CompactShapeDag\n\n"
+            )
+            f.write("# fmt: off\n")
+            f.write("_STRINGS = (\n")
+            for string in strings:
+                f.write(f"    {string!r},\n")
+            f.write(")\n")
+            f.write("_RECORDS = (\n")
+            for record in records:
+                f.write(f"    {record!r},\n")
+            f.write(")\n")
+            f.write("# The values of the enum shapes of string members\n")
+            f.write("ENUM_VALUES = {\n")
+            for shape_name, values in self.get_enum_values().items():
+                f.write(f"    {shape_name!r}: {values!r},\n")
+            f.write("}\n")
+            f.write("# fmt: on\n\n")
+            f.write("SHAPE_DAG = CompactShapeDag(_STRINGS, _RECORDS)\n")
+
+    def get_enum_values(self) -> dict:
+        """
+        Collects the enum values of the string shapes used by the members of the DAG.
+
+        :return: A dict of enum shape name to the tuple of its values, sorted by name.
+        """
+        string_shapes = set()
+        for shape in self.shape_dag.values():
+            if shape["type"] == "structure":
+                string_shapes.update(
+                    member["shape"]
+                    for member in shape["members"]
+                    if member["type"] == "string"
+                )
+            elif shape["type"] == "list" and shape["member_type"] == "string":
+                string_shapes.add(shape["member_shape"])
+            elif shape["type"] == "map" and shape["value_type"] == "string":
+                string_shapes.add(shape["value_shape"])
+        return {
+            shape_name: tuple(self.combined_shapes[shape_name]["enum"])
+            for shape_name in sorted(string_shapes)
+            if "enum" in self.combined_shapes.get(shape_name, {})
+        }
 
     # @property
     def get_shapes_dag(self):
@@ -113,6 +180,24 @@ class ShapesExtractor:
                 _dag[shape]["value_type"] = _all_shapes[_map_value_shape]["type"]
         return _dag
 
+    def get_member_name_map(self):
+        """
+        Builds the PascalCase to snake_case table of every member name in the Service Jsons.
+
+        The generated runtime code looks attribute names up in this table instead of
+        converting them character by character on every request and response.
+
+        :return: The member names mapped to their snake_case attribute names.
+        :rtype: dict
+        """
+        member_names = set()
+        for shape_data in self.combined_shapes.values():
+            member_names.update(shape_data.get("members", {}))
+        return {
+            member_name: convert_to_snake_case(member_name)
+            for member_name in sorted(member_names)
+        }
+
     def _evaluate_list_type(self, member_shape):
         list_shape_name = member_shape["member"]["shape"]
         list_shape_type = self.combined_shapes[list_shape_name]["type"]
@@ -39,6 +39,7 @@ def create(
 {create_args}
     session: Optional[Session] = None,
     region: Optional[str] = None,
+    skip_describe: bool = False,
 ) -> Optional[object]:
     logger.debug("Creating {resource_lower} resource.")
     client = SageMakerClient(session=session, region_name=region, service_name='{service_name}').client
@@ -49,12 +50,17 @@ def create(
         
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = cls._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
     response = client.{operation}(**operation_input_args)
     logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
+
+    if skip_describe:
+        # the other attributes are described on first access
+        return cls._from_create(transform(operation_input_args, '{create_input_shape}'), {create_output}, session=session, region=region)
 
     return cls.get({get_args}, session=session, region=region)
 """
@@ -66,6 +72,7 @@ def create(
 {create_args}
     session: Optional[Session] = None,
     region: Optional[str] = None,
+    skip_describe: bool = False,
 ) -> Optional[object]:
     logger.debug("Creating {resource_lower} resource.")
     client = SageMakerClient(session=session, region_name=region, service_name='{service_name}').client
@@ -76,12 +83,17 @@ def create(
         
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = cls._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
     response = client.{operation}(**operation_input_args)
     logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
+
+    if skip_describe:
+        # the other attributes are described on first access
+        return cls._from_create(transform(operation_input_args, '{create_input_shape}'), {create_output}, session=session, region=region)
 
     return cls.get({get_args}, session=session, region=region)
 """
@@ -103,12 +115,13 @@ def load(
 
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = cls._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # import the resource
     response = client.{operation}(**operation_input_args)
     logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
 
     return cls.get({get_args}, session=session, region=region)
 """
@@ -118,19 +131,20 @@ def update(self,
  {update_args}
  ) -> Optional[object]:
     logger.debug("Creating {resource_lower} resource.")
-    client = SageMakerClient().client
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='{service_name}').client
 
     operation_input_args = {{
 {operation_input_args}
     }}
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = {resource_name}._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
     response = client.{operation}(**operation_input_args)
     logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=self._session, region=self._region)
     self.refresh()
 
     return self
@@ -141,13 +155,13 @@ def invoke(self,
 {invoke_args}
 ) -> Optional[object]:
     logger.debug(f"Invoking {resource_lower} resource.")
-    client = SageMakerRuntimeClient(service_name="{service_name}").client
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='{service_name}').client
     operation_input_args = {{
 {operation_input_args}
     }}
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = {resource_name}._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
@@ -157,19 +171,78 @@ def invoke(self,
     return response
 """
 
+INVOKE_MANY_METHOD_TEMPLATE = """
+def invoke_many(self,
+    bodies: Iterable[Any],
+{invoke_args}
+    concurrency: int = 8,
+    ordered: bool = True,
+    max_attempts: int = 5,
+) -> Iterator[BatchResult]:
+    '''Invokes the {resource_lower} once per body, concurrently. Results are yielded in the order of the bodies, or as completed if not ordered.'''
+    logger.debug(f"Invoking {resource_lower} resource with {{concurrency}} concurrent requests.")
+    # one client for all the requests, with a connection per concurrent request
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='{service_name}', config=Config(max_pool_connections=concurrency)).client
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    # serialize the arguments shared by all the requests once
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    return stream_batch(lambda body: client.{operation}(**operation_input_args, Body=body), bodies, max_workers=concurrency, max_attempts=max_attempts, ordered=ordered)
+"""
+
+MICRO_BATCHER_METHOD_TEMPLATE = """
+def micro_batcher(self,
+{invoke_args}
+    codec: Optional[PayloadCodec] = None,
+    max_batch_size: int = 64,
+    max_wait: float = 0.005,
+    max_concurrency: int = 4,
+) -> MicroBatcher:
+    '''Returns a MicroBatcher packing the records of concurrent callers into batched invocations of the {resource_lower}, JSON lines by default.'''
+    codec = codec or JsonLinesCodec()
+    content_type, accept = codec.content_type, codec.accept
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='{service_name}', config=Config(max_pool_connections=max_concurrency)).client
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    # serialize the arguments shared by all the batches once
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    return MicroBatcher(lambda body: client.{operation}(**operation_input_args, Body=body)['Body'].read(), codec, max_batch_size=max_batch_size, max_wait=max_wait, max_concurrency=max_concurrency)
+"""
+
+INVOKE_STREAM_METHOD_TEMPLATE = """
+def invoke_stream(self,
+{invoke_args}
+    framing: Union[str, StreamFraming] = 'jsonlines',
+) -> ResponseStreamReader:
+    '''Invokes the {resource_lower} with a response stream, returning a reader yielding the decoded records as soon as they complete, see ResponseStreamReader.'''
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='{service_name}').client
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    started_at = time.perf_counter()
+    response = client.{operation}(**operation_input_args)
+    return ResponseStreamReader(response['Body'], framing, started_at=started_at)
+"""
+
 INVOKE_ASYNC_METHOD_TEMPLATE = """
 def invoke_async(self, 
 {create_args}
 ) -> Optional[object]:
     logger.debug(f"Invoking {resource_lower} resource Async.")
-    client = SageMakerRuntimeClient(service_name="{service_name}").client
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='{service_name}').client
     
     operation_input_args = {{
 {operation_input_args}
     }}
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = {resource_name}._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
@@ -184,14 +257,14 @@ def invoke_with_response_stream(self,
 {create_args}
 ) -> Optional[object]:
     logger.debug(f"Invoking {resource_lower} resource with Response Stream.")
-    client = SageMakerRuntimeClient(service_name="{service_name}").client
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='{service_name}').client
 
     operation_input_args = {{
 {operation_input_args}
     }}
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = {resource_name}._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
@@ -202,6 +275,314 @@ def invoke_with_response_stream(self,
 """
 
 
+ASYNC_CREATE_METHOD_TEMPLATE = """
+@classmethod
+@populate_inputs_decorator
+async def create(
+    cls,
+{create_args}
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+    skip_describe: bool = False,
+) -> Optional[object]:
+    logger.debug("Creating {resource_lower} resource.")
+    operation_input_args = {{
+{operation_input_args}
+    }}
+
+    logger.debug(f"Input request: {{operation_input_args}}")
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+    logger.debug(f"Serialized input request: {{operation_input_args}}")
+
+    # create the resource
+    response = await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=session, region=region)
+    logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
+
+    if skip_describe:
+        # the other attributes must be described with refresh()
+        return cls._from_create(transform(operation_input_args, '{create_input_shape}'), {create_output}, session=session, region=region)
+
+    return await cls.get({get_args}, session=session, region=region)
+"""
+
+ASYNC_CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS = """
+@classmethod
+async def create(
+    cls,
+{create_args}
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+    skip_describe: bool = False,
+) -> Optional[object]:
+    logger.debug("Creating {resource_lower} resource.")
+    operation_input_args = {{
+{operation_input_args}
+    }}
+
+    logger.debug(f"Input request: {{operation_input_args}}")
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+    logger.debug(f"Serialized input request: {{operation_input_args}}")
+
+    # create the resource
+    response = await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=session, region=region)
+    logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
+
+    if skip_describe:
+        # the other attributes must be described with refresh()
+        return cls._from_create(transform(operation_input_args, '{create_input_shape}'), {create_output}, session=session, region=region)
+
+    return await cls.get({get_args}, session=session, region=region)
+"""
+
+ASYNC_IMPORT_METHOD_TEMPLATE = """
+@classmethod
+async def load(
+    cls,
+{import_args}
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> Optional[object]:
+    logger.debug(f"Importing {resource_lower} resource.")
+    operation_input_args = {{
+{operation_input_args}
+    }}
+
+    logger.debug(f"Input request: {{operation_input_args}}")
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+    logger.debug(f"Serialized input request: {{operation_input_args}}")
+
+    # import the resource
+    response = await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=session, region=region)
+    logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
+
+    return await cls.get({get_args}, session=session, region=region)
+"""
+
+ASYNC_UPDATE_METHOD_TEMPLATE = """
+async def update(self,
+ {update_args}
+ ) -> Optional[object]:
+    logger.debug("Updating {resource_lower} resource.")
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    logger.debug(f"Input request: {{operation_input_args}}")
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+    logger.debug(f"Serialized input request: {{operation_input_args}}")
+
+    # update the resource
+    response = await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region)
+    logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=self._session, region=self._region)
+    await self.refresh()
+
+    return self
+"""
+
+ASYNC_INVOKE_METHOD_TEMPLATE = """
+async def {method_name}(self, 
+{invoke_args}
+) -> Optional[object]:
+    logger.debug(f"Invoking {resource_lower} resource.")
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    logger.debug(f"Input request: {{operation_input_args}}")
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+    logger.debug(f"Serialized input request: {{operation_input_args}}")
+
+    response = await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region)
+    logger.debug(f"Response: {{response}}")
+
+    return response
+"""
+
+ASYNC_INVOKE_MANY_METHOD_TEMPLATE = """
+def invoke_many(self,
+    bodies: Union[Iterable[Any], AsyncIterable[Any]],
+{invoke_args}
+    concurrency: int = 8,
+    ordered: bool = True,
+    max_attempts: int = 5,
+) -> AsyncIterator[BatchResult]:
+    '''Invokes the {resource_lower} once per body, concurrently. Results are yielded in the order of the bodies, or as completed if not ordered.'''
+    logger.debug(f"Invoking {resource_lower} resource with {{concurrency}} concurrent requests.")
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    # serialize the arguments shared by all the requests once
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    # a connection per concurrent request
+    config = Config(max_pool_connections=concurrency)
+    return async_stream_batch(lambda body: get_async_transport().call('{service_name}', '{operation}', {{**operation_input_args, 'Body': body}}, session=self._session, region=self._region, config=config), bodies, max_concurrency=concurrency, max_attempts=max_attempts, ordered=ordered)
+"""
+
+ASYNC_INVOKE_STREAM_METHOD_TEMPLATE = """
+async def invoke_stream(self,
+{invoke_args}
+    framing: Union[str, StreamFraming] = 'jsonlines',
+) -> ResponseStreamReader:
+    '''Invokes the {resource_lower} with a response stream, returning a reader yielding the decoded records as soon as they complete, see ResponseStreamReader.'''
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    started_at = time.perf_counter()
+    response = await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region)
+    return ResponseStreamReader(response['Body'], framing, started_at=started_at)
+"""
+
+ASYNC_GET_METHOD_TEMPLATE = """
+@classmethod
+async def get(
+    cls,
+{describe_args}
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+    lazy: bool = False,
+    fields: Optional[List[str]] = None,
+    view: bool = False,
+) -> Optional[object]:
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    response = await async_cached_describe('{resource_name}', operation_input_args, lambda: get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=session, region=region), session=session, region=region)
+
+    if view:
+        # a read-only view of the response, see ShapeView.to_model
+        return transform_view(response, '{describe_operation_output_shape}')
+
+    # deserialize the response
+    {resource_lower} = cls._from_describe(response, '{describe_operation_output_shape}', session=session, region=region, lazy=lazy, fields=fields)
+    return {resource_lower}
+"""
+
+ASYNC_LIST_METHOD_TEMPLATE = """
+@classmethod
+def list(
+    cls,
+{list_args}
+    max_results: Optional[int] = None,
+    page_size: Optional[int] = None,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> AsyncResourceIterator["{resource_name}"]:
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    return AsyncResourceIterator(
+        service_name='{service_name}',
+        session=session,
+        region=region,
+        list_method='{operation}',
+        list_method_kwargs=operation_input_args,
+        summaries_key='{summaries_key}',
+        summary_name='{summary_name}',
+        resource_cls=cls,{resource_kwargs}
+        max_results=max_results,
+        page_size=page_size,
+    )
+"""
+
+ASYNC_REFRESH_METHOD_TEMPLATE = """
+async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    response = await async_cached_describe('{resource_name}', operation_input_args, lambda: get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region), session=self._session, region=self._region)
+
+    # deserialize response and update self
+    self._update_from_describe(response, '{describe_operation_output_shape}', fields=fields)
+    return self
+"""
+
+ASYNC_WAIT_METHOD_TEMPLATE = """
+@validate_call
+async def wait(
+    self,
+    poll: int = 5,
+    timeout: Optional[int] = None
+) -> Optional[object]:
+    terminal_states = {terminal_resource_states}
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    waiter = Waiter(
+        resource_type='{resource_name}',
+        status_path={status_path},
+        success_states=terminal_states,
+        poll=poll,
+        max_delay={max_delay},
+        timeout=timeout,
+    )
+    response = await waiter.async_wait(lambda: get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region))
+
+    # deserialize the final response and update self
+    self._update_from_describe(response, '{describe_operation_output_shape}')
+    return self
+"""
+
+ASYNC_WAIT_FOR_STATUS_METHOD_TEMPLATE = """
+@validate_call
+async def wait_for_status(
+    self,
+    status: Literal{resource_states},
+    poll: int = 5,
+    timeout: Optional[int] = None
+) -> Optional[object]:
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    waiter = Waiter(
+        resource_type='{resource_name}',
+        status_path={status_path},
+        success_states=[status],
+        failure_states={failure_states},
+        poll=poll,
+        max_delay={max_delay},
+        timeout=timeout,
+    )
+    response = await waiter.async_wait(lambda: get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region))
+
+    # deserialize the final response and update self
+    self._update_from_describe(response, '{describe_operation_output_shape}')
+    return self
+"""
+
+ASYNC_DELETE_METHOD_TEMPLATE = """
+async def delete(self) -> None:
+
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region)
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=self._session, region=self._region)
+"""
+
+ASYNC_STOP_METHOD_TEMPLATE = """
+async def stop(self) -> None:
+
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    await get_async_transport().call('{service_name}', '{operation}', operation_input_args, session=self._session, region=self._region)
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=self._session, region=self._region)
+"""
+
 GET_CONFIG_VALUE_TEMPLATE = """
 def get_config_value(attribute, resource_defaults, global_defaults):
    if resource_defaults and attribute in resource_defaults:
@@ -237,12 +618,13 @@ def create(
     }}
     logger.debug(f"Input request: {{operation_input_args}}")
     # serialize the input request
-    operation_input_args = cls._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
     # create the resource
     response = client.{operation}(**operation_input_args)
     logger.debug(f"Response: {{response}}")
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=session, region=region)
 
     return cls.get({resource_identifier}, session=session, region=region)
 """
@@ -254,35 +636,82 @@ def get(
 {describe_args}
     session: Optional[Session] = None,
     region: Optional[str] = None,
+    lazy: bool = False,
+    fields: Optional[List[str]] = None,
+    view: bool = False,
 ) -> Optional[object]:
     operation_input_args = {{
 {operation_input_args}
     }}
     client = SageMakerClient(session=session, region_name=region, service_name='{service_name}').client
-    response = client.{operation}(**operation_input_args)
+    response = cached_describe('{resource_name}', operation_input_args, lambda: client.{operation}(**operation_input_args), session=session, region=region)
 
-    pprint(response)
+    if view:
+        # a read-only view of the response, see ShapeView.to_model
+        return transform_view(response, '{describe_operation_output_shape}')
 
     # deserialize the response
-    transformed_response = transform(response, '{describe_operation_output_shape}')
-    {resource_lower} = cls(**transformed_response)
+    {resource_lower} = cls._from_describe(response, '{describe_operation_output_shape}', session=session, region=region, lazy=lazy, fields=fields)
     return {resource_lower}
 """
 
+LIST_METHOD_TEMPLATE = """
+@classmethod
+def list(
+    cls,
+{list_args}
+    max_results: Optional[int] = None,
+    page_size: Optional[int] = None,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> ResourceIterator["{resource_name}"]:
+    client = SageMakerClient(session=session, region_name=region, service_name='{service_name}').client
+
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, '{operation_input_shape}')
+
+    return ResourceIterator(
+        client=client,
+        list_method='{operation}',
+        list_method_kwargs=operation_input_args,
+        summaries_key='{summaries_key}',
+        summary_name='{summary_name}',
+        resource_cls=cls,{resource_kwargs}
+        max_results=max_results,
+        page_size=page_size,
+        session=session,
+        region=region,
+    )
+"""
+
 REFRESH_METHOD_TEMPLATE = """
-def refresh(self) -> Optional[object]:
+def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
 
     operation_input_args = {{
 {operation_input_args}
     }}
-    client = SageMakerClient().client
-    response = client.{operation}(**operation_input_args)
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='{service_name}').client
+    response = cached_describe('{resource_name}', operation_input_args, lambda: client.{operation}(**operation_input_args), session=self._session, region=self._region)
 
     # deserialize response and update self
-    transform(response, '{describe_operation_output_shape}', self)
+    self._update_from_describe(response, '{describe_operation_output_shape}', fields=fields)
     return self
 """
 
+WAITER_CONFIG_TEMPLATE = """
+_waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+    resource_type='{resource_name}',
+    status_path={status_path},
+    terminal_states={terminal_states},
+    describe_method='{describe_method}',
+    identifiers={identifiers},
+    describe_output_shape='{describe_output_shape}',{list_config}
+)
+"""
+
 WAIT_METHOD_TEMPLATE = """
 @validate_call
 def wait(
@@ -291,20 +720,23 @@ def wait(
     timeout: Optional[int] = None
 ) -> Optional[object]:
     terminal_states = {terminal_resource_states}
-    start_time = time.time()
-
-    while True:
-        self.refresh()
-        current_status = self{status_key_path}
-
-        if current_status in terminal_states:
-            return
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='{service_name}').client
+    waiter = Waiter(
+        resource_type='{resource_name}',
+        status_path={status_path},
+        success_states=terminal_states,
+        poll=poll,
+        max_delay={max_delay},
+        timeout=timeout,
+    )
+    response = waiter.wait(lambda: client.{operation}(**operation_input_args))
 
-        # TODO: Raise some generated TimeOutError
-        if timeout is not None and time.time() - start_time >= timeout:
-            raise Exception("Timeout exceeded. Final resource state - " + current_status)
-        print("-", end="")
-        time.sleep(poll)
+    # deserialize the final response and update self
+    self._update_from_describe(response, '{describe_operation_output_shape}')
+    return self
 """
 
 WAIT_FOR_STATUS_METHOD_TEMPLATE = """
@@ -315,20 +747,24 @@ def wait_for_status(
     poll: int = 5,
     timeout: Optional[int] = None
 ) -> Optional[object]:
-    start_time = time.time()
-
-    while True:
-        self.refresh()
-        current_status = self{status_key_path}
-
-        if status == current_status:
-            return
+    operation_input_args = {{
+{operation_input_args}
+    }}
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='{service_name}').client
+    waiter = Waiter(
+        resource_type='{resource_name}',
+        status_path={status_path},
+        success_states=[status],
+        failure_states={failure_states},
+        poll=poll,
+        max_delay={max_delay},
+        timeout=timeout,
+    )
+    response = waiter.wait(lambda: client.{operation}(**operation_input_args))
 
-        # TODO: Raise some generated TimeOutError
-        if timeout is not None and time.time() - start_time >= timeout:
-            raise Exception("Timeout exceeded. Final resource state - " + current_status)
-        print("-", end="")
-        time.sleep(poll)
+    # deserialize the final response and update self
+    self._update_from_describe(response, '{describe_operation_output_shape}')
+    return self
 """
 
 DELETE_METHOD_TEMPLATE = """
@@ -337,7 +773,9 @@ def delete(self) -> None:
     operation_input_args = {{
 {operation_input_args}
     }}
-    self.client.{operation}(**operation_input_args)
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='{service_name}').client
+    client.{operation}(**operation_input_args)
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=self._session, region=self._region)
 """
 
 STOP_METHOD_TEMPLATE = """
@@ -346,35 +784,161 @@ def stop(self) -> None:
     operation_input_args = {{
 {operation_input_args}
     }}
-    self.client.{operation}(**operation_input_args)
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='{service_name}').client
+    client.{operation}(**operation_input_args)
+    invalidate_describe_cache('{resource_name}', operation_input_args, session=self._session, region=self._region)
+"""
+
+ASYNC_RESOURCE_BASE_CLASS_TEMPLATE = """
+class AsyncBase:
+    # the bulk methods of the resources, awaiting the coroutines of the asyncio classes on the running loop
+
+    @classmethod
+    async def create_many(cls, inputs: List[Dict], max_concurrency: int = 8, max_attempts: int = 5, session: Optional[Session] = None, region: Optional[str] = None) -> List[BatchResult]:
+        '''Creates a resource per dict of create arguments, concurrently. Results keep the order of the inputs.'''
+        # Create is not idempotent, it is only retried when throttled, and without the describe
+        results = [result async for result in async_stream_batch(lambda kwargs: cls.create(**kwargs, session=session, region=region, skip_describe=True), inputs, max_concurrency=max_concurrency, max_attempts=max_attempts, retryable=is_throttling_error)]
+        described = [result async for result in async_stream_batch(lambda resource: resource.refresh(), [result.result for result in results if result.ok], max_concurrency=max_concurrency, max_attempts=max_attempts)]
+        # asyncio resources are not described on first access, a resource whose describe
+        # failed is kept in the result along with the error, await its refresh() to describe it
+        described = iter(described)
+        for index, result in enumerate(results):
+            if result.ok:
+                describe = next(described)
+                results[index] = result._replace(latency=result.latency + describe.latency, error=describe.error)
+        return results
+
+    @classmethod
+    async def get_many(cls, identifiers: List, max_concurrency: int = 8, max_attempts: int = 5, session: Optional[Session] = None, region: Optional[str] = None) -> List[BatchResult]:
+        '''Gets a resource per name or dict of get arguments, concurrently. Results keep the order of the identifiers.'''
+        def get(identifier):
+            if isinstance(identifier, Dict):
+                return cls.get(**identifier, session=session, region=region)
+            return cls.get(identifier, session=session, region=region)
+        return [result async for result in async_stream_batch(get, identifiers, max_concurrency=max_concurrency, max_attempts=max_attempts)]
+
+    @classmethod
+    async def delete_many(cls, resources: List["AsyncBase"], max_concurrency: int = 8, max_attempts: int = 5) -> List[BatchResult]:
+        '''Deletes the resources concurrently. Results keep the order of the resources.'''
+        return [result async for result in async_stream_batch(lambda resource: resource.delete(), resources, max_concurrency=max_concurrency, max_attempts=max_attempts)]
 """
 
 RESOURCE_BASE_CLASS_TEMPLATE = """
 class Base(BaseModel):
+    # the validator is built on first instantiation, see warm_up
+    model_config = ConfigDict(defer_build=True)
+
+    _session: Optional[Session] = PrivateAttr(default=None)
+    _region: Optional[str] = PrivateAttr(default=None)
+    _hydrate_pending: bool = PrivateAttr(default=False)
+    _raw_members: Optional[Dict] = PrivateAttr(default=None)
+    _raw_shape: Optional[str] = PrivateAttr(default=None)
+
+    def __getattribute__(self, name: str):
+        value = super().__getattribute__(name)
+        if isinstance(value, Unassigned) and not name.startswith("_"):
+            value = self._hydrate_attribute(name, value)
+        return value
+
+    def _hydrate_attribute(self, name: str, value):
+        raw_members = self._raw_members
+        if raw_members and name in raw_members:
+            # convert a raw member of a lazily deserialized response
+            member_name, raw_value = raw_members.pop(name)
+            value = transform({member_name: raw_value}, self._raw_shape, trusted=True)[name]
+            setattr(self, name, value)
+        elif self._hydrate_pending:
+            self._hydrate_pending = False
+            self._hydrate()
+            value = super().__getattribute__(name)
+        return value
+
     @classmethod
-    def _serialize(cls, data: Dict) -> Dict:
-        result = {}
-        for attr, value in data.items():
-            if isinstance(value, Unassigned):
-                continue
-            
-            if isinstance(value, List):
-                result[attr] = cls._serialize_list(value)
-            elif isinstance(value, Dict):
-                result[attr] = cls._serialize_dict(value)
-            elif hasattr(value, 'serialize'):
-                result[attr] = value.serialize()
-            else:
-                result[attr] = value
-        return result
-    
+    def _from_describe(cls, response: Dict, shape: str, session: Optional[Session] = None, region: Optional[str] = None, lazy: bool = False, fields: Optional[List[str]] = None) -> "Base":
+        if fields:
+            # only the given fields are deserialized, the others are converted on first access
+            transformed_response, raw_members = transform_fields(response, shape, fields, trusted=True)
+        elif lazy:
+            # only the basic members are deserialized, the others are converted on first access
+            transformed_response, raw_members = transform_lazily(response, shape)
+        else:
+            # the response was parsed by botocore against the service model, skip validation
+            transformed_response, raw_members = transform(response, shape, trusted=True), None
+        resource = cls.model_construct(**transformed_response)
+        if raw_members is not None:
+            resource._set_raw_members(raw_members, shape)
+        resource._session = session
+        resource._region = region
+        return resource
+
+    def _update_from_describe(self, response: Dict, shape: str, fields: Optional[List[str]] = None) -> None:
+        self._raw_members = None
+        self._hydrate_pending = False
+        if not fields:
+            transform(response, shape, self, trusted=True)
+            return
+        transformed_response, raw_members = transform_fields(response, shape, fields, trusted=True)
+        for attr, value in transformed_response.items():
+            setattr(self, attr, value)
+        self._set_raw_members(raw_members, shape)
+
+    def _set_raw_members(self, raw_members: Dict, shape: str) -> None:
+        self._raw_members = {
+            attr: raw_member for attr, raw_member in raw_members.items()
+            if attr in type(self).model_fields
+        }
+        self._raw_shape = shape
+        # unset the attributes, required ones included, so they are converted on access
+        for attr in self._raw_members:
+            setattr(self, attr, Unassigned())
+
+    def _hydrate(self) -> None:
+        refresh = getattr(self, "refresh", None)
+        if refresh is None:
+            return
+        if inspect.isawaitable(refreshed := refresh()):
+            refreshed.close()
+            logger.warning("Attributes of asyncio resources are not described on access, await refresh() instead.")
+
     @classmethod
-    def _serialize_list(cls, value: List):
-        return [v.serialize() if hasattr(v, 'serialize') else v for v in value]
-    
+    def _from_create(cls, create_input: Dict, create_output: Dict, session: Optional[Session] = None, region: Optional[str] = None) -> "Base":
+        attributes = {
+            attr: value for attr, value in {**create_input, **create_output}.items()
+            if attr in cls.model_fields
+        }
+        try:
+            resource = cls(**attributes)
+        except ValidationError:
+            # A create member may not have the type of the described attribute, keep the identifiers
+            resource = cls(**{attr: value for attr, value in attributes.items() if cls.model_fields[attr].is_required()})
+        resource._session = session
+        resource._region = region
+        resource._hydrate_pending = True
+        return resource
+
+    @classmethod
+    def create_many(cls, inputs: List[Dict], max_workers: int = 8, max_attempts: int = 5, session: Optional[Session] = None, region: Optional[str] = None) -> List[BatchResult]:
+        '''Creates a resource per dict of create arguments, concurrently. Results keep the order of the inputs.'''
+        # Create is not idempotent, it is only retried when throttled, and without the describe
+        results = run_batch(lambda kwargs: cls.create(**kwargs, session=session, region=region, skip_describe=True), inputs, max_workers=max_workers, max_attempts=max_attempts, retryable=is_throttling_error)
+        described = run_batch(lambda resource: resource.refresh(), [result.result for result in results if result.ok], max_workers=max_workers, max_attempts=max_attempts)
+        # a resource whose describe failed is described on first access
+        described = iter(described)
+        return [result._replace(latency=result.latency + next(described).latency) if result.ok else result for result in results]
+
+    @classmethod
+    def get_many(cls, identifiers: List, max_workers: int = 8, max_attempts: int = 5, session: Optional[Session] = None, region: Optional[str] = None) -> List[BatchResult]:
+        '''Gets a resource per name or dict of get arguments, concurrently. Results keep the order of the identifiers.'''
+        def get(identifier):
+            if isinstance(identifier, Dict):
+                return cls.get(**identifier, session=session, region=region)
+            return cls.get(identifier, session=session, region=region)
+        return run_batch(get, identifiers, max_workers=max_workers, max_attempts=max_attempts)
+
     @classmethod
-    def _serialize_dict(cls, value: Dict):
-        return {k: v.serialize() if hasattr(v, 'serialize') else v for k, v in value.items()}
+    def delete_many(cls, resources: List["Base"], max_workers: int = 8, max_attempts: int = 5) -> List[BatchResult]:
+        '''Deletes the resources concurrently. Results keep the order of the resources.'''
+        return run_batch(lambda resource: resource.delete(), resources, max_workers=max_workers, max_attempts=max_attempts)
     
     @staticmethod
     def get_updated_kwargs_with_configured_attributes(config_schema_for_resource: dict, resource_name: str, **kwargs):
@@ -537,31 +1101,60 @@ def load_default_configs_for_resource_name(resource_name: str):
 
 SHAPE_BASE_CLASS_TEMPLATE = """
 class {class_name}:
+    # the validator is built on first instantiation, see warm_up
+    model_config = ConfigDict(defer_build=True)
+
     def serialize(self):
-        result = {{}}
-        for attr, value in self.__dict__.items():
-            if isinstance(value, Unassigned):
-                continue
-            
-            components = attr.split('_')
-            pascal_attr = ''.join(x.title() for x in components[0:])
-            if isinstance(value, List):
-                result[pascal_attr] = self._serialize_list(value)
-            elif isinstance(value, Dict):
-                result[pascal_attr] = self._serialize_dict(value)
-            elif hasattr(value, 'serialize'):
-                result[pascal_attr] = value.serialize()
-            else:
-                result[pascal_attr] = value
-        return result
-
-    def _serialize_list(self, value: List):
-        return [v.serialize() if hasattr(v, 'serialize') else v for v in value]
-    
-    def _serialize_dict(self, value: Dict):
-        return {{k: v.serialize() if hasattr(v, 'serialize') else v for k, v in value.items()}}
+        return serialize_shape(self)
 """
 
+LAZY_PACKAGE_TEMPLATE = """
+# The module of each class, imported on first access of one of its classes
+{modules_name} = {{
+{modules}
+}}
+
+__all__ = [{exported_names}*{modules_name}]
+
+
+def __getattr__(name):
+    module_name = {modules_name}.get(name)
+    if module_name is None:
+{missing_name}
+    value = getattr(importlib.import_module(f".{{module_name}}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set({modules_name}))
+"""
+
+LAZY_PACKAGE_WARM_UP_TEMPLATE = '''
+
+def warm_up(names: Optional[Iterable[str]] = None, background: bool = True) -> Optional[Thread]:
+    """
+    Imports classes and builds their deferred validators ahead of their first use.
+
+    Args:
+        names (Iterable[str]): The names of the classes, defaults to all the classes.
+        background (bool): Whether to build them on a daemon thread.
+
+    Returns:
+        Optional[Thread]: The started thread if background, None otherwise.
+    """
+    names = list({modules_name} if names is None else names)
+    return build_models(lambda: (__getattr__(name) for name in names), background)
+'''
+
+SHAPE_VIEW_CLASS_TEMPLATE = '''
+class {class_name}View(ShapeView):
+    """Read-only view of {class_name}, see ShapeView."""
+
+    __slots__ = ({slots})
+    _shape = "{class_name}"
+'''
+
 SHAPE_CLASS_TEMPLATE = '''
 class {class_name}:
     """
@@ -11,8 +11,11 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Utility module for common utility methods."""
+import io
 import re
 import subprocess
+import tokenize
+from functools import lru_cache
 
 
 def add_indent(text, num_spaces=4):
@@ -38,6 +41,7 @@ def clean_documentaion(documentation):
     return documentation
 
 
+@lru_cache(maxsize=None)
 def convert_to_snake_case(entity_name):
     """
     Convert a string to snake_case.
@@ -52,6 +56,7 @@ def convert_to_snake_case(entity_name):
     return snake_case_string
 
 
+@lru_cache(maxsize=None)
 def snake_to_pascal(snake_str):
     """
     Convert a snake_case string to PascalCase.
@@ -74,3 +79,23 @@ def reformat_file_with_black(filename):
         print(f"File '{filename}' reformatted successfully.")
     except subprocess.CalledProcessError as e:
         print(f"An error occurred while reformatting '{filename}': {e}")
+
+
+def get_referenced_names(source, names):
+    """
+    Get the names of a set that are referenced as identifiers in python source.
+
+    Names only appearing in strings, docstrings or comments are not referenced.
+
+    Args:
+        source (str): The python source.
+        names (set): The names to look for.
+
+    Returns:
+        list: The referenced names, sorted.
+    """
+    referenced_names = set()
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.NAME and token.string in names:
+            referenced_names.add(token.string)
+    return sorted(referenced_names)
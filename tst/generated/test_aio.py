@@ -0,0 +1,158 @@
+import asyncio
+
+from botocore.exceptions import ClientError
+
+from src.generated import aio
+from src.generated.utils import (
+    AsyncTransport,
+    get_async_transport,
+    set_async_transport,
+)
+
+
+class FakeAsyncTransport(AsyncTransport):
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.configs = []
+
+    async def call(
+        self,
+        service_name,
+        operation_name,
+        operation_input_args,
+        session=None,
+        region=None,
+        config=None,
+    ):
+        self.calls.append((service_name, operation_name, operation_input_args))
+        self.configs.append(config)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _run_with_transport(transport, coroutine_function):
+    previous_transport = get_async_transport()
+    set_async_transport(transport)
+    try:
+        return asyncio.run(coroutine_function())
+    finally:
+        set_async_transport(previous_transport)
+
+
+def test_get_and_wait_use_async_transport():
+    transport = FakeAsyncTransport(
+        [
+            {"TrainingJobName": "job", "TrainingJobStatus": "InProgress"},
+            {"TrainingJobName": "job", "TrainingJobStatus": "Completed"},
+        ]
+    )
+
+    async def get_and_wait():
+        training_job = await aio.TrainingJob.get(training_job_name="job")
+        assert training_job.training_job_status == "InProgress"
+        await training_job.wait(poll=0)
+        return training_job
+
+    training_job = _run_with_transport(transport, get_and_wait)
+
+    assert isinstance(training_job, aio.TrainingJob)
+    assert training_job.training_job_status == "Completed"
+    assert transport.calls == [
+        ("sagemaker", "describe_training_job", {"TrainingJobName": "job"}),
+        ("sagemaker", "describe_training_job", {"TrainingJobName": "job"}),
+    ]
+
+
+def test_list_iterates_asynchronously():
+    transport = FakeAsyncTransport(
+        [
+            {"TrainingJobSummaries": [{"TrainingJobName": "a"}], "NextToken": "t"},
+            {"TrainingJobSummaries": [{"TrainingJobName": "b"}]},
+        ]
+    )
+
+    async def list_training_jobs():
+        return [job async for job in aio.TrainingJob.list()]
+
+    training_jobs = _run_with_transport(transport, list_training_jobs)
+
+    assert [job.training_job_name for job in training_jobs] == ["a", "b"]
+    assert transport.calls[1] == (
+        "sagemaker",
+        "list_training_jobs",
+        {"NextToken": "t"},
+    )
+
+
+def test_invoke_many_sizes_the_client_connection_pool():
+    transport = FakeAsyncTransport([{"Body": "A"}, {"Body": "B"}])
+
+    async def invoke_many():
+        endpoint = aio.Endpoint.model_construct(endpoint_name="endpoint")
+        return [
+            result
+            async for result in endpoint.invoke_many(
+                ["a", "b"], content_type="text/csv", concurrency=16
+            )
+        ]
+
+    results = _run_with_transport(transport, invoke_many)
+
+    assert all(result.error is None for result in results)
+    assert sorted(call[2]["Body"] for call in transport.calls) == ["a", "b"]
+    assert [config.max_pool_connections for config in transport.configs] == [16, 16]
+
+
+def test_get_many_and_delete_many_await_on_the_running_loop():
+    transport = FakeAsyncTransport(
+        [
+            {"TrainingJobName": "a", "TrainingJobStatus": "Completed"},
+            {"TrainingJobName": "b", "TrainingJobStatus": "Completed"},
+        ]
+    )
+
+    async def get_many_and_delete_many():
+        results = await aio.TrainingJob.get_many(["a", "b"], max_concurrency=1)
+        endpoints = [
+            aio.Endpoint.model_construct(endpoint_name=name) for name in ["c", "d"]
+        ]
+        transport.responses.extend([{}, {}])
+        return results, await aio.Endpoint.delete_many(endpoints)
+
+    results, deleted = _run_with_transport(transport, get_many_and_delete_many)
+
+    assert [result.result.training_job_name for result in results] == ["a", "b"]
+    assert all(isinstance(result.result, aio.TrainingJob) for result in results)
+    assert [result.ok for result in deleted] == [True, True]
+    assert transport.calls[2:] == [
+        ("sagemaker", "delete_endpoint", {"EndpointName": "c"}),
+        ("sagemaker", "delete_endpoint", {"EndpointName": "d"}),
+    ]
+
+
+def test_create_many_keeps_created_resources_whose_describe_failed():
+    transport = FakeAsyncTransport(
+        [
+            {"EndpointArn": "arn:endpoint"},
+            ClientError({"Error": {"Code": "ValidationException"}}, "DescribeEndpoint"),
+        ]
+    )
+
+    async def create_many():
+        return await aio.Endpoint.create_many(
+            [{"endpoint_name": "endpoint", "endpoint_config_name": "config"}]
+        )
+
+    (result,) = _run_with_transport(transport, create_many)
+
+    assert not result.ok
+    assert isinstance(result.error, ClientError)
+    assert isinstance(result.result, aio.Endpoint)
+    assert result.result.endpoint_name == "endpoint"
+    assert [call[1] for call in transport.calls] == [
+        "create_endpoint",
+        "describe_endpoint",
+    ]
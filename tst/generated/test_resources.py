@@ -0,0 +1,360 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from src.generated.resources import endpoint as endpoint_module
+from src.generated.resources import training_job as training_job_module
+from src.generated.resources import Endpoint, TrainingJob
+from src.generated.shapes import ProductionVariantSummary
+from src.generated.utils import (
+    configure_describe_cache,
+    configure_single_flight,
+    get_single_flight,
+)
+
+
+def test_create_skip_describe_hydrates_on_first_access(monkeypatch):
+    client = MagicMock()
+    client.create_endpoint.return_value = {"EndpointArn": "arn:endpoint"}
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointArn": "arn:endpoint",
+        "EndpointConfigName": "config",
+        "EndpointStatus": "Creating",
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+
+    endpoint = Endpoint.create(
+        endpoint_name="endpoint", endpoint_config_name="config", skip_describe=True
+    )
+
+    assert endpoint.endpoint_name == "endpoint"
+    assert endpoint.endpoint_arn == "arn:endpoint"
+    assert endpoint.endpoint_config_name == "config"
+    client.describe_endpoint.assert_not_called()
+
+    assert endpoint.endpoint_status == "Creating"
+    assert endpoint.creation_time is not None
+    client.describe_endpoint.assert_called_once_with(EndpointName="endpoint")
+
+
+def test_get_lazy_converts_nested_members_on_access(monkeypatch):
+    client = MagicMock()
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "InService",
+        "ProductionVariants": [{"VariantName": "variant", "CurrentWeight": 1.0}],
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+
+    endpoint = Endpoint.get("endpoint", lazy=True)
+
+    assert endpoint.endpoint_status == "InService"
+    assert "production_variants" in endpoint._raw_members
+    production_variants = endpoint.production_variants
+    assert production_variants[0].variant_name == "variant"
+    assert production_variants[0].current_weight == 1.0
+    assert not endpoint._raw_members
+    client.describe_endpoint.assert_called_once()
+
+
+def test_get_builds_nested_shapes_without_validation(monkeypatch):
+    client = MagicMock()
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "InService",
+        "ProductionVariants": [{"VariantName": "variant"}],
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+    # validating construction goes through __init__, model_construct does not
+    monkeypatch.setattr(
+        Endpoint,
+        "__init__",
+        MagicMock(side_effect=AssertionError("responses are not validated")),
+    )
+
+    endpoint = Endpoint.get("endpoint")
+
+    assert isinstance(endpoint.production_variants[0], ProductionVariantSummary)
+    assert endpoint.production_variants[0].variant_name == "variant"
+    endpoint.refresh()
+    assert isinstance(endpoint.production_variants[0], ProductionVariantSummary)
+
+
+def test_get_fields_converts_other_members_on_access(monkeypatch):
+    client = MagicMock()
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "Failed",
+        "FailureReason": "reason",
+        "ProductionVariants": [{"VariantName": "variant"}],
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+
+    endpoint = Endpoint.get("endpoint", fields=["endpoint_status", "failure_reason"])
+
+    assert endpoint.endpoint_status == "Failed"
+    assert endpoint.failure_reason == "reason"
+    assert set(endpoint._raw_members) == {"endpoint_name", "production_variants"}
+    assert endpoint.production_variants[0].variant_name == "variant"
+    assert endpoint.endpoint_name == "endpoint"
+    assert not endpoint._raw_members
+    client.describe_endpoint.assert_called_once()
+
+
+def test_refresh_fields_replaces_stale_members(monkeypatch):
+    client = MagicMock()
+    client.describe_endpoint.side_effect = [
+        {
+            "EndpointName": "endpoint",
+            "EndpointStatus": "Creating",
+            "ProductionVariants": [{"VariantName": "old"}],
+        },
+        {
+            "EndpointName": "endpoint",
+            "EndpointStatus": "InService",
+            "ProductionVariants": [{"VariantName": "new"}],
+        },
+    ]
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+    endpoint = Endpoint.get("endpoint")
+    assert endpoint.production_variants[0].variant_name == "old"
+
+    endpoint.refresh(fields=["endpoint_status"])
+
+    assert endpoint.endpoint_status == "InService"
+    assert "production_variants" in endpoint._raw_members
+    assert endpoint.production_variants[0].variant_name == "new"
+
+
+def test_get_view_returns_read_only_view(monkeypatch):
+    client = MagicMock()
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "InService",
+        "ProductionVariants": [{"VariantName": "variant"}],
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+
+    view = Endpoint.get("endpoint", view=True)
+
+    assert type(view).__name__ == "DescribeEndpointOutputView"
+    assert view.production_variants[0].variant_name == "variant"
+    endpoint = view.to_model(Endpoint)
+    assert isinstance(endpoint, Endpoint)
+    assert endpoint.endpoint_status == "InService"
+    assert isinstance(endpoint.production_variants[0], ProductionVariantSummary)
+
+
+def test_get_uses_describe_cache_until_delete(monkeypatch):
+    client = MagicMock()
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "InService",
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+    describe_cache = configure_describe_cache(ttl=60)
+    try:
+        endpoint = Endpoint.get("endpoint")
+        assert Endpoint.get("endpoint") is not endpoint
+        endpoint.refresh()
+        client.describe_endpoint.assert_called_once_with(EndpointName="endpoint")
+
+        endpoint.delete()
+        Endpoint.get("endpoint")
+
+        assert client.describe_endpoint.call_count == 2
+        stats = describe_cache.stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (2, 2, 1)
+    finally:
+        configure_describe_cache(enabled=False)
+
+
+def test_changing_a_cached_resource_does_not_change_the_cache(monkeypatch):
+    client = MagicMock()
+    client.describe_training_job.return_value = {
+        "TrainingJobName": "job",
+        "HyperParameters": {"lr": "0.1"},
+        "SecondaryStatusTransitions": [],
+    }
+    monkeypatch.setattr(
+        training_job_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+    configure_describe_cache(ttl=60)
+    try:
+        training_job = TrainingJob.get("job")
+        training_job.hyper_parameters["lr"] = "changed"
+        training_job.secondary_status_transitions.append(None)
+
+        training_job = TrainingJob.get("job")
+    finally:
+        configure_describe_cache(enabled=False)
+
+    client.describe_training_job.assert_called_once()
+    assert training_job.hyper_parameters == {"lr": "0.1"}
+    assert training_job.secondary_status_transitions == []
+
+
+def test_concurrent_gets_share_one_describe_call(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def describe_endpoint(**kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return {
+            "EndpointName": "endpoint",
+            "EndpointStatus": "InService",
+            "ProductionVariants": [{"VariantName": "variant"}],
+            "ExplainerConfig": {
+                "ClarifyExplainerConfig": {
+                    "InferenceConfig": {"FeatureHeaders": ["feature"]},
+                    "ShapConfig": {"ShapBaselineConfig": {}},
+                }
+            },
+        }
+
+    client = MagicMock()
+    client.describe_endpoint.side_effect = describe_endpoint
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+    # coalescing is opt-in
+    assert get_single_flight() is None
+    single_flight = configure_single_flight()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(Endpoint.get, "endpoint")]
+            started.wait(timeout=5)
+            futures += [executor.submit(Endpoint.get, "endpoint") for _ in range(7)]
+            while single_flight.stats().coalesced < 7:
+                time.sleep(0.001)
+            release.set()
+            endpoints = [future.result() for future in futures]
+    finally:
+        configure_single_flight(enabled=False)
+
+    client.describe_endpoint.assert_called_once_with(EndpointName="endpoint")
+    assert len({id(endpoint) for endpoint in endpoints}) == 8
+    assert all(endpoint.endpoint_status == "InService" for endpoint in endpoints)
+    # the instances share the describe response, not their nested members
+    first, second = endpoints[:2]
+    assert second.production_variants is not first.production_variants
+    assert second.production_variants[0] is not first.production_variants[0]
+    first_config = first.explainer_config.clarify_explainer_config
+    second_config = second.explainer_config.clarify_explainer_config
+    assert (
+        second_config.inference_config.feature_headers
+        is not first_config.inference_config.feature_headers
+    )
+
+
+def test_invoke_many_shares_one_client_and_serializes_arguments_once(monkeypatch):
+    runtime_client = MagicMock()
+    runtime_client.invoke_endpoint.side_effect = lambda **kwargs: {
+        "Body": kwargs["Body"].upper()
+    }
+    runtime_client_class = MagicMock(return_value=MagicMock(client=runtime_client))
+    monkeypatch.setattr(endpoint_module, "SageMakerRuntimeClient", runtime_client_class)
+    endpoint = Endpoint.model_construct(endpoint_name="endpoint")
+
+    results = list(
+        endpoint.invoke_many(
+            (body for body in ["a", "b", "c"]),
+            content_type="text/csv",
+            concurrency=16,
+        )
+    )
+
+    assert [result.result["Body"] for result in results] == ["A", "B", "C"]
+    runtime_client_class.assert_called_once()
+    config = runtime_client_class.call_args.kwargs["config"]
+    assert config.max_pool_connections == 16
+    calls = runtime_client.invoke_endpoint.call_args_list
+    assert sorted(call.kwargs.pop("Body") for call in calls) == ["a", "b", "c"]
+    assert all(
+        call.kwargs == {"EndpointName": "endpoint", "ContentType": "text/csv"}
+        for call in calls
+    )
+
+
+def test_micro_batcher_invokes_endpoint_with_batched_records(monkeypatch):
+    runtime_client = MagicMock()
+    runtime_client.invoke_endpoint.return_value = {
+        "Body": MagicMock(read=MagicMock(return_value=b'{"score": 1}\n{"score": 2}'))
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerRuntimeClient",
+        MagicMock(return_value=MagicMock(client=runtime_client)),
+    )
+    endpoint = Endpoint.model_construct(endpoint_name="endpoint")
+
+    with endpoint.micro_batcher(max_batch_size=2, max_wait=1) as batcher:
+        futures = [batcher.submit({"x": 1}), batcher.submit({"x": 2})]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == [{"score": 1}, {"score": 2}]
+    runtime_client.invoke_endpoint.assert_called_once_with(
+        EndpointName="endpoint",
+        ContentType="application/jsonlines",
+        Accept="application/jsonlines",
+        Body=b'{"x": 1}\n{"x": 2}',
+    )
+
+
+def test_invoke_stream_decodes_payload_parts(monkeypatch):
+    runtime_client = MagicMock()
+    runtime_client.invoke_endpoint_with_response_stream.return_value = {
+        "Body": [
+            {"PayloadPart": {"Bytes": b'{"token": "a"}\n{"to'}},
+            {"PayloadPart": {"Bytes": b'ken": "b"}\n'}},
+        ]
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerRuntimeClient",
+        MagicMock(return_value=MagicMock(client=runtime_client)),
+    )
+    endpoint = Endpoint.model_construct(endpoint_name="endpoint")
+
+    reader = endpoint.invoke_stream(body=b"{}", content_type="application/json")
+
+    assert [record["token"] for record in reader] == ["a", "b"]
+    assert reader.metrics.records == 2
+    runtime_client.invoke_endpoint_with_response_stream.assert_called_once_with(
+        EndpointName="endpoint", Body=b"{}", ContentType="application/json"
+    )
@@ -1,12 +1,16 @@
 import ast
+import os
+import subprocess
+import sys
 import unittest
 
 from pydantic import BaseModel, ValidationError
 
+from src.generated import shapes
 from src.generated.shapes import Base, AdditionalS3DataSource, Unassigned
-from src.tools.constants import GENERATED_CLASSES_LOCATION, SHAPES_CODEGEN_FILE_NAME
+from src.tools.constants import GENERATED_CLASSES_LOCATION, SHAPES_CODEGEN_PACKAGE_NAME
 
-FILE_NAME = GENERATED_CLASSES_LOCATION + "/" + SHAPES_CODEGEN_FILE_NAME
+PACKAGE_FOLDER = os.path.join(GENERATED_CLASSES_LOCATION, SHAPES_CODEGEN_PACKAGE_NAME)
 
 
 class TestGeneratedShape(unittest.TestCase):
@@ -15,10 +19,18 @@ class TestGeneratedShape(unittest.TestCase):
         assert issubclass(Base, BaseModel)
         assert (
             self._fetch_number_of_classes_in_file_not_inheriting_a_class(
-                FILE_NAME, "Base"
+                os.path.join(PACKAGE_FOLDER, "__init__.py"), "Base"
             )
             == 2
         )  # 2 Because Base class itself does not inherit and Unassigned does not need to inherit
+        for file_name in os.listdir(PACKAGE_FOLDER):
+            if file_name.endswith(".py") and file_name != "__init__.py":
+                assert (
+                    self._fetch_number_of_classes_in_file_not_inheriting_a_class(
+                        os.path.join(PACKAGE_FOLDER, file_name), "Base"
+                    )
+                    == 0
+                )
 
     def test_pydantic_validation_for_generated_class_success(self):
         additional_s3_data_source = AdditionalS3DataSource(
@@ -72,3 +84,48 @@ class TestGeneratedShape(unittest.TestCase):
         serialized_data = additional_s3_data_source.serialize()
         assert serialized_data["S3DataType"] == "filestring"
         assert serialized_data["S3Uri"] == "s3/uri"
+
+    def test_shape_classes_are_imported_on_first_access(self):
+        assert "AdditionalS3DataSource" in shapes.__all__
+        assert shapes.__getattr__("AdditionalS3DataSource") is AdditionalS3DataSource
+        with self.assertRaises(AttributeError):
+            shapes.__getattr__("NotAShape")
+
+
+def test_importing_a_resource_only_imports_its_shape_clusters():
+    code = (
+        "import sys, typing\n"
+        "from src.generated.resources import Endpoint, endpoint\n"
+        "from src.generated.shapes import Base\n"
+        "shapes = [v for v in vars(endpoint).values()\n"
+        "          if isinstance(v, type) and issubclass(v, Base) and v is not Base]\n"
+        "reachable = set()\n"
+        "while shapes:\n"
+        "    shape = shapes.pop()\n"
+        "    if shape in reachable:\n"
+        "        continue\n"
+        "    reachable.add(shape)\n"
+        "    annotations = [f.annotation for f in shape.model_fields.values()]\n"
+        "    while annotations:\n"
+        "        annotation = annotations.pop()\n"
+        "        annotations.extend(typing.get_args(annotation))\n"
+        "        if isinstance(annotation, type) and issubclass(annotation, Base):\n"
+        "            shapes.append(annotation)\n"
+        "expected = {shape.__module__ for shape in reachable}\n"
+        "modules = {m for m in sys.modules if m.startswith('src.generated.shapes.')}\n"
+        "assert 'src.generated.resources.training_job' not in sys.modules\n"
+        "assert expected and modules == expected, modules ^ expected\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_shape_validators_are_built_on_first_use_or_warm_up():
+    assert Base.model_config["defer_build"]
+
+    thread = shapes.warm_up(["AdditionalS3DataSource", "Channel"])
+    thread.join()
+
+    assert shapes.AdditionalS3DataSource.__pydantic_complete__
+    assert shapes.Channel.__pydantic_complete__
+    assert shapes.warm_up(["Tag"], background=False) is None
+    assert shapes.Tag.__pydantic_complete__
@@ -0,0 +1,332 @@
+import asyncio
+
+from unittest.mock import MagicMock
+
+from botocore.config import Config
+from botocore.credentials import ReadOnlyCredentials
+
+from src.generated.resources import TrainingJob
+from src.generated.utils import (
+    AiobotocoreAsyncTransport,
+    ClientPool,
+    DescribeCache,
+    ResourceIterator,
+    SingleFlight,
+)
+
+
+def _training_job_summaries(*names):
+    return [
+        {"TrainingJobName": name, "TrainingJobStatus": "Completed"} for name in names
+    ]
+
+
+def _resource_iterator(client, **kwargs):
+    return ResourceIterator(
+        client=client,
+        list_method="list_training_jobs",
+        list_method_kwargs={"StatusEquals": "Completed"},
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        **kwargs,
+    )
+
+
+def test_resource_iterator_follows_next_token():
+    client = MagicMock()
+    client.list_training_jobs.side_effect = [
+        {"TrainingJobSummaries": _training_job_summaries("a", "b"), "NextToken": "t"},
+        {"TrainingJobSummaries": _training_job_summaries("c")},
+    ]
+
+    training_jobs = list(_resource_iterator(client))
+
+    assert [job.training_job_name for job in training_jobs] == ["a", "b", "c"]
+    assert all(isinstance(job, TrainingJob) for job in training_jobs)
+    assert training_jobs[0].training_job_status == "Completed"
+    assert client.list_training_jobs.call_args_list[1].kwargs == {
+        "StatusEquals": "Completed",
+        "NextToken": "t",
+    }
+
+
+def test_resource_iterator_is_lazy():
+    client = MagicMock()
+    client.list_training_jobs.return_value = {
+        "TrainingJobSummaries": _training_job_summaries("a", "b"),
+        "NextToken": "t",
+    }
+
+    resource_iterator = _resource_iterator(client)
+    client.list_training_jobs.assert_not_called()
+
+    for _ in resource_iterator:
+        break
+    assert client.list_training_jobs.call_count == 1
+
+
+def test_resource_iterator_max_results_and_page_size():
+    client = MagicMock()
+    client.list_training_jobs.side_effect = [
+        {"TrainingJobSummaries": _training_job_summaries("a", "b"), "NextToken": "t"},
+        {"TrainingJobSummaries": _training_job_summaries("c"), "NextToken": "u"},
+    ]
+
+    training_jobs = list(_resource_iterator(client, max_results=3, page_size=2))
+
+    assert [job.training_job_name for job in training_jobs] == ["a", "b", "c"]
+    assert client.list_training_jobs.call_count == 2
+    assert client.list_training_jobs.call_args_list[0].kwargs["MaxResults"] == 2
+    assert client.list_training_jobs.call_args_list[1].kwargs["MaxResults"] == 1
+
+
+def _session(access_key="key"):
+    session = MagicMock()
+    session.region_name = "us-west-2"
+    session.get_credentials.return_value.get_frozen_credentials.return_value = (
+        access_key,
+        "secret",
+        None,
+    )
+    return session
+
+
+def test_client_pool_reuses_clients_per_region():
+    client_pool = ClientPool()
+    session = _session()
+
+    us_west_2_client = client_pool.get_client(session=session)
+    assert client_pool.get_client(session=session, region_name="us-west-2") is (
+        us_west_2_client
+    )
+    client_pool.get_client(session=session, region_name="eu-west-1")
+
+    assert session.client.call_count == 2
+    assert session.client.call_args_list[1].args == ("sagemaker", "eu-west-1")
+    assert session.client.call_args.kwargs["config"].max_pool_connections == 10
+
+
+def test_client_pool_keys_clients_by_credentials():
+    client_pool = ClientPool()
+    session, other_session = _session(), _session("other-key")
+
+    client_pool.get_client(session=session)
+    client_pool.get_client(session=other_session)
+    client_pool.get_client(session=_session())
+
+    assert session.client.call_count == 1
+    assert other_session.client.call_count == 1
+    assert len(client_pool) == 2
+
+
+def test_client_pool_keys_clients_by_config():
+    client_pool = ClientPool()
+    session = _session()
+
+    client_pool.get_client(session=session, config=Config(max_pool_connections=20))
+    client_pool.get_client(session=session, config=Config(max_pool_connections=20))
+    client_pool.get_client(session=session, config=Config(max_pool_connections=30))
+    client_pool.get_client(session=session, config=Config(read_timeout=5))
+
+    assert session.client.call_count == 3
+
+
+def test_client_pool_evicts_least_recently_used_client():
+    client_pool = ClientPool(max_size=2, max_pool_connections=50)
+    session = _session()
+
+    client_pool.get_client(session=session, region_name="us-east-1")
+    client_pool.get_client(session=session, region_name="us-east-2")
+    client_pool.get_client(session=session, region_name="us-east-1")
+    client_pool.get_client(session=session, region_name="us-west-1")
+    client_pool.get_client(session=session, region_name="us-east-1")
+
+    assert len(client_pool) == 2
+    assert session.client.call_count == 3
+    assert session.client.call_args.kwargs["config"].max_pool_connections == 50
+
+
+class FakeAioClient:
+    def __init__(self):
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def describe_training_job(self, **kwargs):
+        return {"TrainingJobName": kwargs["TrainingJobName"]}
+
+
+def test_aiobotocore_transport_closes_clients_of_rotated_credentials():
+    aiobotocore_session = MagicMock()
+    aiobotocore_session.create_client.side_effect = lambda *args, **kwargs: (
+        FakeAioClient()
+    )
+    transport = AiobotocoreAsyncTransport(aiobotocore_session, max_size=1)
+    session = _session()
+    frozen_credentials = session.get_credentials.return_value.get_frozen_credentials
+
+    async def call():
+        return await transport.call(
+            "sagemaker", "describe_training_job", {"TrainingJobName": "a"}, session
+        )
+
+    async def rotate_credentials():
+        frozen_credentials.return_value = ReadOnlyCredentials("key", "secret", None)
+        assert await call() == {"TrainingJobName": "a"}
+        await call()
+        (client,) = transport._clients.values()
+        frozen_credentials.return_value = ReadOnlyCredentials("key", "secret", "new")
+        await call()
+        (rotated_client,) = transport._clients.values()
+        assert client.closed and not rotated_client.closed
+        await transport.close()
+        assert rotated_client.closed and not transport._clients
+
+    asyncio.run(rotate_credentials())
+    assert aiobotocore_session.create_client.call_count == 2
+    assert (
+        aiobotocore_session.create_client.call_args.kwargs["aws_session_token"] == "new"
+    )
+
+
+def test_resource_iterator_to_columns_stops_at_max_results():
+    client = MagicMock()
+    client.list_training_jobs.side_effect = [
+        {"TrainingJobSummaries": _training_job_summaries("a", "b"), "NextToken": "t"},
+        {"TrainingJobSummaries": _training_job_summaries("c", "d"), "NextToken": "u"},
+    ]
+
+    columns = _resource_iterator(client, max_results=3).to_columns(
+        fields=["training_job_name"]
+    )
+
+    assert list(columns) == ["training_job_name"]
+    assert columns["training_job_name"].tolist() == ["a", "b", "c"]
+    assert client.list_training_jobs.call_count == 2
+
+
+def test_resource_iterator_iter_views():
+    client = MagicMock()
+    client.list_training_jobs.side_effect = [
+        {"TrainingJobSummaries": _training_job_summaries("a", "b"), "NextToken": "t"},
+        {"TrainingJobSummaries": _training_job_summaries("c")},
+    ]
+
+    summaries = list(_resource_iterator(client, max_results=2).iter_views())
+
+    assert [summary.training_job_name for summary in summaries] == ["a", "b"]
+    assert type(summaries[0]).__name__ == "TrainingJobSummaryView"
+
+
+def test_describe_cache_counts_hits_and_evicts_least_recently_used():
+    describe_cache = DescribeCache(max_size=2)
+    session = _session()
+    keys = [
+        describe_cache.key("Endpoint", {"EndpointName": name}, session)
+        for name in ("a", "b", "c")
+    ]
+
+    assert describe_cache.get(keys[0]) is None
+    describe_cache.put(keys[0], {"EndpointName": "a"}, {"EndpointName": "a"})
+    describe_cache.put(keys[1], {"EndpointName": "b"}, {"EndpointName": "b"})
+    assert describe_cache.get(keys[0]) == {"EndpointName": "a"}
+    describe_cache.put(keys[2], {"EndpointName": "c"}, {"EndpointName": "c"})
+
+    assert describe_cache.get(keys[1]) is None
+    assert len(describe_cache) == 2
+    stats = describe_cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 2, 1)
+    assert stats.hit_rate == 1 / 3
+
+
+def test_describe_cache_expires_responses():
+    describe_cache = DescribeCache(ttl=0)
+    key = describe_cache.key("Endpoint", {"EndpointName": "a"}, _session())
+    describe_cache.put(key, {"EndpointName": "a"}, {"EndpointName": "a"})
+
+    assert describe_cache.get(key) is None
+    assert describe_cache.stats().expirations == 1
+    assert len(describe_cache) == 0
+
+
+def test_describe_cache_invalidates_matching_responses():
+    describe_cache = DescribeCache()
+    session = _session()
+    for resource_type, name in [("Endpoint", "a"), ("Endpoint", "b"), ("Model", "a")]:
+        args = {f"{resource_type}Name": name}
+        describe_cache.put(describe_cache.key(resource_type, args, session), {}, args)
+    other_credentials_key = describe_cache.key(
+        "Endpoint", {"EndpointName": "a"}, _session("other-key")
+    )
+    describe_cache.put(other_credentials_key, {}, {"EndpointName": "a"})
+
+    # the responses of the endpoint, whatever the credentials
+    assert (
+        describe_cache.invalidate(
+            "Endpoint", {"EndpointName": "a", "EndpointConfigName": "c"}, session
+        )
+        == 2
+    )
+    assert describe_cache.invalidate("Endpoint", {"EndpointName": "a"}, session) == 0
+    # other regions are kept
+    assert (
+        describe_cache.invalidate("Model", {"ModelName": "a"}, session, "eu-west-1")
+        == 0
+    )
+    # without shared arguments, all the responses of the resource type
+    assert describe_cache.invalidate("Model", {"Tags": []}, session) == 1
+    assert len(describe_cache) == 1
+    assert describe_cache.stats().invalidations == 3
+
+
+def test_single_flight_async_call_shares_in_flight_call():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def describe():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"EndpointStatus": "InService"}
+
+    async def describe_concurrently():
+        return await asyncio.gather(
+            *(single_flight.async_call(("Endpoint",), describe, {}) for _ in range(10))
+        )
+
+    responses = asyncio.run(describe_concurrently())
+
+    assert len(calls) == 1
+    assert all(response is responses[0] for response in responses)
+    assert single_flight.stats() == (1, 9)
+    assert len(single_flight) == 0
+
+
+def test_single_flight_forget_stops_sharing_changed_calls():
+    single_flight = SingleFlight()
+    key = ("Endpoint", (("EndpointName", "a"),), None, "us-west-2")
+
+    async def describe_around_write():
+        started = asyncio.Event()
+
+        async def describe():
+            started.set()
+            await asyncio.sleep(0.01)
+            return {}
+
+        first_call = asyncio.ensure_future(
+            single_flight.async_call(key, describe, {"EndpointName": "a"})
+        )
+        await started.wait()
+        assert single_flight.forget("Endpoint", {"EndpointName": "b"}, "us-west-2") == 0
+        assert single_flight.forget("Endpoint", {"EndpointName": "a"}, "us-west-2") == 1
+        await single_flight.async_call(key, describe, {"EndpointName": "a"})
+        await first_call
+
+    asyncio.run(describe_around_write())
+
+    assert single_flight.stats() == (2, 0)
@@ -0,0 +1,56 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from src.code_injection.codec import transform_view
+from src.generated import views
+from src.generated.shapes import TrainingJobSummary, WarmPoolStatus
+from src.generated.views import ShapeView, TrainingJobSummaryView, WarmPoolStatusView
+
+SUMMARY = {
+    "TrainingJobName": "job",
+    "TrainingJobStatus": "Completed",
+    "WarmPoolStatus": {"Status": "Available"},
+}
+
+
+def test_views_are_imported_on_first_access():
+    assert "DescribeEndpointOutputView" in views.__all__
+    assert issubclass(views.DescribeEndpointOutputView, ShapeView)
+    with pytest.raises(AttributeError):
+        views.__getattr__("NotAView")
+
+
+def test_transform_view_builds_frozen_views_with_slots():
+    view = transform_view(SUMMARY, "TrainingJobSummary")
+
+    assert isinstance(view, TrainingJobSummaryView)
+    assert not hasattr(view, "__dict__")
+    assert view.training_job_name == "job"
+    assert view.training_end_time is None
+    assert view.warm_pool_status == WarmPoolStatusView(status="Available")
+    with pytest.raises(AttributeError):
+        view.training_job_name = "other"
+    with pytest.raises(AttributeError):
+        view.not_an_attribute
+    assert pickle.loads(pickle.dumps(view)) == view
+
+
+def test_view_converts_to_model():
+    view = transform_view(SUMMARY, "TrainingJobSummary")
+
+    model = view.to_model()
+
+    assert isinstance(model, TrainingJobSummary)
+    assert model.training_job_name == "job"
+    assert model.warm_pool_status == WarmPoolStatus(status="Available")
+    assert view.to_dict() == {
+        "training_job_name": "job",
+        "training_job_status": "Completed",
+        "warm_pool_status": {"status": "Available"},
+    }
+    with pytest.raises(ValidationError):
+        transform_view({"TrainingJobName": "job"}, "TrainingJobSummary").to_model(
+            validate=True
+        )
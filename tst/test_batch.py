@@ -0,0 +1,260 @@
+import asyncio
+import itertools
+import time
+
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from src.code_injection import batch as batch_module
+from src.code_injection.batch import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyLimiter,
+    async_stream_batch,
+    is_retryable_error,
+    run_batch,
+    stream_batch,
+)
+from src.generated.resources import Endpoint
+from src.generated.resources import endpoint as endpoint_module
+
+
+def _client_error(code, status_code=400):
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status_code}},
+        "Operation",
+    )
+
+
+def test_run_batch_keeps_order_and_per_item_errors():
+    def square(item):
+        if item == 3:
+            raise ValueError("bad item")
+        return item * item
+
+    results = run_batch(square, range(5), max_workers=3)
+
+    assert [result.item for result in results] == [0, 1, 2, 3, 4]
+    assert [result.result for result in results] == [0, 1, 4, None, 16]
+    assert [result.ok for result in results] == [True, True, True, False, True]
+    assert isinstance(results[3].error, ValueError)
+
+
+def test_run_batch_retries_throttled_calls(monkeypatch):
+    monkeypatch.setattr(batch_module.time, "sleep", MagicMock())
+    function = MagicMock(
+        side_effect=[_client_error("ThrottlingException"), _client_error("", 503), "ok"]
+    )
+
+    results = run_batch(function, ["item"], max_attempts=3)
+
+    assert results[0].result == "ok"
+    assert function.call_count == 3
+
+
+def test_run_batch_does_not_retry_client_errors():
+    function = MagicMock(side_effect=_client_error("ValidationException"))
+
+    results = run_batch(function, ["item"])
+
+    assert results[0].error.response["Error"]["Code"] == "ValidationException"
+    assert function.call_count == 1
+    assert not is_retryable_error(results[0].error)
+
+
+def test_adaptive_concurrency_limiter_backs_off_on_throttling():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 5
+
+
+def test_async_adaptive_concurrency_limiter_backs_off_on_throttling():
+    async def throttle_and_recover():
+        limiter = AsyncAdaptiveConcurrencyLimiter(max_concurrency=8)
+        await limiter.acquire()
+        await limiter.release(throttled=True)
+        throttled_limit = limiter.limit
+
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.release()
+        return throttled_limit, limiter.limit
+
+    assert asyncio.run(throttle_and_recover()) == (4, 5)
+
+
+def test_async_stream_batch_lowers_concurrency_when_throttled(monkeypatch):
+    in_flight, max_in_flight, attempts = 0, 0, set()
+
+    async def call(item):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        if item in attempts:
+            max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if item not in attempts:
+            attempts.add(item)
+            raise _client_error("ThrottlingException")
+        return item
+
+    async def no_delay(delay):
+        await asyncio_sleep(0)
+
+    asyncio_sleep = asyncio.sleep
+    monkeypatch.setattr(batch_module.asyncio, "sleep", no_delay)
+
+    async def collect():
+        return [
+            result
+            async for result in async_stream_batch(call, range(8), max_concurrency=8)
+        ]
+
+    results = asyncio.run(collect())
+
+    assert all(result.ok for result in results)
+    # the throttled calls bring the limit down to 1, it grows back with the successful
+    # retries, instead of all 8 retries running at once
+    assert max_in_flight <= 4
+
+
+def test_delete_many_deletes_every_resource():
+    endpoints = [MagicMock(), MagicMock()]
+    endpoints[1].delete.side_effect = _client_error("ValidationException")
+
+    results = Endpoint.delete_many(endpoints)
+
+    assert [result.ok for result in results] == [True, False]
+    assert all(endpoint.delete.call_count == 1 for endpoint in endpoints)
+
+
+def test_create_many_retries_a_throttled_describe_without_creating_again(
+    monkeypatch,
+):
+    monkeypatch.setattr(batch_module.time, "sleep", MagicMock())
+    client = MagicMock()
+    client.create_endpoint.return_value = {"EndpointArn": "arn:endpoint"}
+    client.describe_endpoint.side_effect = [
+        _client_error("ThrottlingException"),
+        {
+            "EndpointName": "endpoint",
+            "EndpointArn": "arn:endpoint",
+            "EndpointConfigName": "config",
+            "EndpointStatus": "Creating",
+        },
+    ]
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+
+    results = Endpoint.create_many(
+        [{"endpoint_name": "endpoint", "endpoint_config_name": "config"}]
+    )
+
+    assert results[0].ok
+    assert results[0].result.endpoint_status == "Creating"
+    client.create_endpoint.assert_called_once()
+    assert client.describe_endpoint.call_count == 2
+
+
+def test_create_many_only_retries_throttled_creates(monkeypatch):
+    monkeypatch.setattr(batch_module.time, "sleep", MagicMock())
+    client = MagicMock()
+    client.create_endpoint.side_effect = [
+        _client_error("ThrottlingException"),
+        {"EndpointArn": "arn:endpoint"},
+        _client_error("InternalFailure", 500),
+    ]
+    client.describe_endpoint.return_value = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "Creating",
+    }
+    monkeypatch.setattr(
+        endpoint_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+
+    results = Endpoint.create_many(
+        [
+            {"endpoint_name": "endpoint", "endpoint_config_name": "config"},
+            {"endpoint_name": "other", "endpoint_config_name": "config"},
+        ],
+        max_workers=1,
+    )
+
+    assert [result.ok for result in results] == [True, False]
+    # the Create of the failed item may have succeeded, it is not sent again
+    assert client.create_endpoint.call_count == 3
+
+
+def test_stream_batch_pulls_items_as_results_are_consumed():
+    pulled = []
+
+    def items():
+        for item in itertools.count():
+            pulled.append(item)
+            yield item
+
+    results = stream_batch(lambda item: item * item, items(), max_workers=2)
+    first_results = list(itertools.islice(results, 3))
+    results.close()
+
+    assert [result.result for result in first_results] == [0, 1, 4]
+    assert all(result.latency >= 0 for result in first_results)
+    # the results consumed plus a window of twice max_workers items
+    assert len(pulled) <= 3 + 2 * 2
+
+
+def test_stream_batch_yields_as_completed_when_not_ordered():
+    def wait(delay):
+        time.sleep(delay)
+        return delay
+
+    results = list(stream_batch(wait, [0.2, 0.0, 0.1], max_workers=3, ordered=False))
+
+    assert [result.result for result in results] == [0.0, 0.1, 0.2]
+
+
+def test_async_stream_batch_bounds_concurrency_and_keeps_order():
+    in_flight, max_in_flight = 0, 0
+
+    async def call(item):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (5 - item))
+        in_flight -= 1
+        if item == 3:
+            raise ValueError("bad item")
+        return item
+
+    async def collect():
+        return [
+            result
+            async for result in async_stream_batch(call, range(5), max_concurrency=2)
+        ]
+
+    results = asyncio.run(collect())
+
+    assert [result.item for result in results] == [0, 1, 2, 3, 4]
+    assert [result.ok for result in results] == [True, True, True, False, True]
+    assert max_in_flight == 2
+
+
+def test_run_batch_rejects_coroutine_functions():
+    async def call(item):
+        return item
+
+    results = run_batch(call, ["item"])
+
+    assert isinstance(results[0].error, TypeError)
@@ -2,8 +2,11 @@ import datetime
 from dateutil.tz import tzlocal
 from pprint import pprint
 import unittest
-from src.code_injection.codec import pascal_to_snake
-from src.code_injection.codec import transform
+
+import pytest
+from src.code_injection.codec import pascal_to_snake, snake_to_pascal
+from src.code_injection.name_map import PASCAL_TO_SNAKE, SNAKE_TO_PASCAL
+from src.code_injection.codec import transform, transform_lazily, _DESERIALIZERS
 from src.generated.resources import Model, TrialComponent, AutoMLJobV2
 
 
@@ -13,6 +16,17 @@ class TestConversion(unittest.TestCase):
         self.assertEqual(pascal_to_snake("AnotherExample"), "another_example")
         self.assertEqual(pascal_to_snake("test"), "test")
 
+    def test_snake_to_pascal(self):
+        self.assertEqual(snake_to_pascal("pascal_case"), "PascalCase")
+        self.assertEqual(snake_to_pascal("auto_m_l_job_name"), "AutoMLJobName")
+
+    def test_name_tables_cover_service_member_names(self):
+        self.assertEqual(PASCAL_TO_SNAKE["S3Uri"], "s3_uri")
+        self.assertEqual(SNAKE_TO_PASCAL["s3_uri"], "S3Uri")
+        self.assertEqual(len(PASCAL_TO_SNAKE), len(SNAKE_TO_PASCAL))
+        with self.assertRaises(TypeError):
+            PASCAL_TO_SNAKE["NewMember"] = "new_member"
+
 
 class DummyResourceClass:
     pass
@@ -258,5 +272,282 @@ def test_deserializer_for_map_type():
     )
 
 
+def test_transform_compiles_and_caches_shape_deserializer():
+    """Validate transform() - reuses the compiled deserializer of a shape"""
+    _DESERIALIZERS.pop("DescribeModelOutput", None)
+    transform({"ModelName": "model-name"}, "DescribeModelOutput")
+    deserializer = _DESERIALIZERS["DescribeModelOutput"]
+    transformed_data = transform(
+        {"ModelName": "model-name", "ModelArn": None}, "DescribeModelOutput"
+    )
+    assert _DESERIALIZERS["DescribeModelOutput"] is deserializer
+    assert transformed_data == {"model_name": "model-name"}
+
+
+def test_transform_sets_attributes_on_object_instance():
+    """Validate transform() - sets the evaluated members on the given object"""
+    instance = DummyResourceClass()
+    transformed_data = transform(
+        {"ModelName": "model-name", "PrimaryContainer": {"Image": "image-uri"}},
+        "DescribeModelOutput",
+        instance,
+    )
+    assert instance.model_name == "model-name"
+    assert instance.primary_container == {"image": "image-uri"}
+    assert transformed_data["primary_container"] == {"image": "image-uri"}
+
+
+def test_transform_raises_for_non_structure_shape():
+    """Validate transform() - only structure shapes can be transformed"""
+    with pytest.raises(ValueError):
+        transform({}, "TagList")
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+def test_transform_lazily_keeps_nested_members_raw():
+    data = {
+        "EndpointName": "endpoint",
+        "ProductionVariants": [{"VariantName": "variant"}],
+    }
+
+    transformed_data, raw_members = transform_lazily(data, "DescribeEndpointOutput")
+
+    assert transformed_data == {"endpoint_name": "endpoint"}
+    assert raw_members == {
+        "production_variants": ("ProductionVariants", [{"VariantName": "variant"}])
+    }
+
+
+def test_transform_trusted_constructs_nested_shapes():
+    from src.generated.shapes import ProductionVariantSummary
+
+    data = {
+        "EndpointName": "endpoint",
+        "ProductionVariants": [{"VariantName": "variant", "CurrentWeight": 1.0}],
+    }
+
+    transformed_data = transform(data, "DescribeEndpointOutput", trusted=True)
+
+    assert transformed_data["endpoint_name"] == "endpoint"
+    production_variant = transformed_data["production_variants"][0]
+    assert isinstance(production_variant, ProductionVariantSummary)
+    assert production_variant.variant_name == "variant"
+    assert production_variant.current_weight == 1.0
+
+
+def test_serialize_request_skips_unassigned_members_and_serializes_nested_shapes():
+    from src.generated.shapes import (
+        AlgorithmSpecification,
+        Channel,
+        DataSource,
+        S3DataSource,
+        Unassigned,
+    )
+    from src.code_injection.codec import serialize_request
+
+    data = {
+        "TrainingJobName": "job",
+        "AlgorithmSpecification": AlgorithmSpecification(
+            training_input_mode="File", training_image="image"
+        ),
+        "InputDataConfig": [
+            Channel(
+                channel_name="train",
+                data_source=DataSource(
+                    s3_data_source=S3DataSource(
+                        s3_data_type="S3Prefix", s3_uri="s3://uri"
+                    )
+                ),
+            )
+        ],
+        "HyperParameters": {"epochs": "1"},
+        "RoleArn": Unassigned(),
+        "VpcConfig": None,
+    }
+
+    assert serialize_request(data, "CreateTrainingJobRequest") == {
+        "TrainingJobName": "job",
+        "AlgorithmSpecification": {
+            "TrainingInputMode": "File",
+            "TrainingImage": "image",
+        },
+        "InputDataConfig": [
+            {
+                "ChannelName": "train",
+                "DataSource": {
+                    "S3DataSource": {"S3DataType": "S3Prefix", "S3Uri": "s3://uri"}
+                },
+            }
+        ],
+        "HyperParameters": {"epochs": "1"},
+    }
+
+
+def test_serialize_request_keeps_serialized_dicts():
+    from src.code_injection.codec import serialize_request
+
+    data = {"AlgorithmSpecification": {"TrainingInputMode": "File"}}
+
+    assert serialize_request(data, "CreateTrainingJobRequest") == data
+
+
+def _synthetic_shapes(monkeypatch, shapes):
+    from collections import ChainMap
+    from src.code_injection import codec
+
+    monkeypatch.setattr(codec, "SHAPE_DAG", ChainMap(shapes, codec.SHAPE_DAG))
+
+
+def test_transform_map_of_list_of_map(monkeypatch):
+    _synthetic_shapes(
+        monkeypatch,
+        {
+            "TestNestedRequest": {
+                "type": "structure",
+                "members": [
+                    {"name": "Groups", "shape": "TestGroupsMap", "type": "map"},
+                ],
+            },
+            "TestGroupsMap": {
+                "type": "map",
+                "key_shape": "String",
+                "key_type": "string",
+                "value_shape": "TestRowList",
+                "value_type": "list",
+            },
+            "TestRowList": {
+                "type": "list",
+                "member_shape": "TestRowMap",
+                "member_type": "map",
+            },
+            "TestRowMap": {
+                "type": "map",
+                "key_shape": "String",
+                "key_type": "string",
+                "value_shape": "Channel",
+                "value_type": "structure",
+            },
+        },
+    )
+    data = {"Groups": {"a": [{"train": {"ChannelName": "train"}}, {}], "b": []}}
+
+    assert transform(data, "TestNestedRequest") == {
+        "groups": {"a": [{"train": {"channel_name": "train"}}, {}], "b": []}
+    }
+
+
+def _deep_search_expression(depth):
+    expression = {"Filters": [{"Name": "Status", "Operator": "Equals", "Value": "x"}]}
+    for _ in range(depth):
+        expression = {"SubExpressions": [expression], "Operator": "And"}
+    return expression
+
+
+def test_transform_deeply_nested_recursive_shape():
+    result = transform(
+        {"SearchExpression": _deep_search_expression(5000)}, "SearchRequest"
+    )
+
+    expression, depth = result["search_expression"], 0
+    while "sub_expressions" in expression:
+        assert expression["operator"] == "And"
+        expression, depth = expression["sub_expressions"][0], depth + 1
+    assert depth == 5000
+    assert expression == {
+        "filters": [{"name": "Status", "operator": "Equals", "value": "x"}]
+    }
+
+
+def test_transform_trusted_deeply_nested_recursive_shape():
+    from src.generated.shapes import Filter, SearchExpression
+
+    result = transform(
+        {"SearchExpression": _deep_search_expression(5000)},
+        "SearchRequest",
+        trusted=True,
+    )
+
+    expression, depth = result["search_expression"], 0
+    while isinstance(expression.sub_expressions, list):
+        assert isinstance(expression, SearchExpression)
+        expression, depth = expression.sub_expressions[0], depth + 1
+    assert depth == 5000
+    assert expression.filters == [Filter(name="Status", operator="Equals", value="x")]
+
+
+def test_transform_fields_keeps_other_members_raw():
+    from src.code_injection.codec import transform_fields
+
+    data = {
+        "EndpointName": "endpoint",
+        "EndpointStatus": "InService",
+        "ProductionVariants": [{"VariantName": "variant"}],
+    }
+
+    result, raw_members = transform_fields(
+        data, "DescribeEndpointOutput", ["production_variants"]
+    )
+
+    assert result == {"production_variants": [{"variant_name": "variant"}]}
+    assert raw_members == {
+        "endpoint_name": ("EndpointName", "endpoint"),
+        "endpoint_status": ("EndpointStatus", "InService"),
+    }
+    with pytest.raises(ValueError):
+        transform_fields(data, "DescribeEndpointOutput", ["unknown_field"])
+
+
+def _copy(string):
+    # a new str object equal to the given one
+    return "".join(list(string))
+
+
+def test_transform_interns_enum_and_configured_members():
+    from src.code_injection.codec import configure_interning
+
+    def describe():
+        return {
+            "TrainingJobStatus": _copy("Completed"),
+            "RoleArn": _copy("arn:aws:iam::123456789012:role/role"),
+            "ResourceConfig": {"InstanceType": _copy("ml.m5.large")},
+            "VpcConfig": {"Subnets": [_copy("subnet")]},
+            "TrainingJobName": _copy("job"),
+        }
+
+    first = transform(describe(), "DescribeTrainingJobResponse")
+    second = transform(describe(), "DescribeTrainingJobResponse", trusted=True)
+
+    assert first["training_job_status"] is second["training_job_status"]
+    assert first["role_arn"] is second["role_arn"]
+    assert (
+        first["resource_config"]["instance_type"]
+        is second["resource_config"].instance_type
+    )
+    assert first["vpc_config"]["subnets"][0] is second["vpc_config"].subnets[0]
+    assert first["training_job_name"] is not second["training_job_name"]
+
+    try:
+        configure_interning(members=["training_job_name"])
+        first = transform(describe(), "DescribeTrainingJobResponse")
+        second = transform(describe(), "DescribeTrainingJobResponse")
+        assert first["training_job_name"] is second["training_job_name"]
+        assert first["role_arn"] is not second["role_arn"]
+        assert first["training_job_status"] is second["training_job_status"]
+    finally:
+        configure_interning()
+
+
+def test_intern_pool_is_bounded():
+    from src.code_injection.codec import InternPool
+
+    pool = InternPool(max_size=2)
+    first = pool(_copy("image"))
+
+    assert pool(_copy("image")) is first
+    pool("role")
+    pool("subnet")
+    assert len(pool) == 1
+    assert pool(_copy("image")) is not first
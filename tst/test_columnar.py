@@ -0,0 +1,74 @@
+import datetime
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.code_injection.columnar import ColumnTable
+
+
+def test_column_table_decodes_members_into_typed_columns():
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    table = ColumnTable("TrainingJobSummary")
+    table.append_page(
+        [
+            {
+                "TrainingJobName": "a",
+                "TrainingJobStatus": "Completed",
+                "CreationTime": created,
+                "WarmPoolStatus": {"Status": "Available"},
+            },
+        ]
+    )
+    table.append_page([{"TrainingJobName": "b", "TrainingJobStatus": "Completed"}])
+
+    columns = table.to_columns()
+    masks = table.masks()
+
+    assert len(table) == 2
+    assert columns["training_job_name"].tolist() == ["a", "b"]
+    # the strings of the enum members are interned
+    assert columns["training_job_status"][0] is columns["training_job_status"][1]
+    assert columns["creation_time"].dtype == np.dtype("datetime64[us]")
+    assert columns["creation_time"][0] == np.datetime64("2024-01-01T00:00:00")
+    assert np.isnat(columns["creation_time"][1])
+    assert masks["creation_time"].tolist() == [True, False]
+    assert columns["warm_pool_status"].tolist() == [{"Status": "Available"}, None]
+
+
+def test_column_table_numeric_columns_and_fields():
+    table = ColumnTable(
+        "HyperParameterTrainingJobSummary",
+        fields=[
+            "training_job_name",
+            "final_hyper_parameter_tuning_job_objective_metric",
+        ],
+    )
+    assert set(table.to_columns()) == {
+        "training_job_name",
+        "final_hyper_parameter_tuning_job_objective_metric",
+    }
+
+    table = ColumnTable("ResourceLimits")
+    table.append_page([{"MaxParallelTrainingJobs": 2}, {}])
+    columns, masks = table.to_columns(), table.masks()
+    assert columns["max_parallel_training_jobs"].dtype == np.int64
+    assert columns["max_parallel_training_jobs"].tolist() == [2, 0]
+    assert masks["max_parallel_training_jobs"].tolist() == [True, False]
+
+    dataframe = table.to_pandas()
+    assert str(dataframe["max_parallel_training_jobs"].dtype) == "Int64"
+    assert dataframe["max_parallel_training_jobs"].isna().tolist() == [False, True]
+
+    with pytest.raises(ValueError):
+        ColumnTable("TrainingJobSummary", fields=["unknown_field"])
+
+
+def test_importing_resources_does_not_import_numpy():
+    code = (
+        "import sys\n"
+        "import src.generated.resources.training_job\n"
+        "assert 'numpy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,50 @@
+import pytest
+
+from src.code_injection.compact_shape_dag import CompactShapeDag, encode_shape_dag
+from src.code_injection.shape_dag import SHAPE_DAG
+
+DAG = {
+    "Container": {
+        "members": [
+            {"name": "Image", "shape": "ImageUri", "type": "string"},
+            {"name": "Environment", "shape": "EnvironmentMap", "type": "map"},
+            {"name": "Ports", "shape": "Ports", "type": "list"},
+        ],
+        "type": "structure",
+    },
+    "EnvironmentMap": {
+        "key_shape": "EnvironmentKey",
+        "key_type": "string",
+        "type": "map",
+        "value_shape": "EnvironmentValue",
+        "value_type": "string",
+    },
+    "Ports": {"member_shape": "Port", "member_type": "integer", "type": "list"},
+}
+
+
+def test_compact_shape_dag_materializes_the_encoded_nodes():
+    strings, records = encode_shape_dag(DAG)
+    shape_dag = CompactShapeDag(strings, records)
+
+    assert dict(shape_dag) == DAG
+    assert list(shape_dag) == ["Container", "EnvironmentMap", "Ports"]
+    assert shape_dag["Container"] is shape_dag["Container"]
+    assert "Port" not in shape_dag
+    with pytest.raises(KeyError):
+        shape_dag["Port"]
+
+
+def test_compact_shape_dag_interns_repeated_strings():
+    strings, records = encode_shape_dag(DAG)
+
+    assert len(strings) == len(set(strings))
+    assert all(isinstance(value, int) for record in records for value in record)
+
+
+def test_generated_shape_dag_is_compact():
+    assert isinstance(SHAPE_DAG, CompactShapeDag)
+    assert SHAPE_DAG["ProductionVariantSummary"]["type"] == "structure"
+    assert {"name": "VariantName", "shape": "VariantName", "type": "string"} in (
+        SHAPE_DAG["ProductionVariantSummary"]["members"]
+    )
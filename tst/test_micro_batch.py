@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from src.code_injection.micro_batch import (
+    CsvCodec,
+    JsonLinesCodec,
+    MicroBatcher,
+    NpyCodec,
+)
+
+
+def _echo_doubles(body):
+    records = JsonLinesCodec().decode(body, 0)
+    return JsonLinesCodec().encode([record * 2 for record in records])
+
+
+def test_micro_batcher_packs_concurrent_records_into_one_invocation():
+    bodies = []
+
+    def invoke(body):
+        bodies.append(body)
+        return _echo_doubles(body)
+
+    with MicroBatcher(invoke, max_batch_size=8, max_wait=1) as batcher:
+        futures = [batcher.submit(record) for record in range(8)]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == [0, 2, 4, 6, 8, 10, 12, 14]
+    assert bodies == [b"0\n1\n2\n3\n4\n5\n6\n7"]
+    assert batcher.stats() == (8, 1)
+
+
+def test_micro_batcher_sends_partial_batch_after_max_wait():
+    with MicroBatcher(_echo_doubles, max_batch_size=64, max_wait=0.001) as batcher:
+        assert batcher.invoke(21, timeout=5) == 42
+        assert asyncio.run(batcher.async_invoke(1)) == 2
+
+    assert batcher.stats().batches == 2
+
+
+def test_micro_batcher_waits_for_free_slot_to_fill_batches():
+    started, release = threading.Event(), threading.Event()
+    bodies = []
+
+    def invoke(body):
+        bodies.append(body)
+        started.set()
+        release.wait(timeout=5)
+        return _echo_doubles(body)
+
+    with MicroBatcher(
+        invoke, max_batch_size=64, max_wait=0, max_concurrency=1
+    ) as batcher:
+        first = batcher.submit(0)
+        started.wait(timeout=5)
+        futures = [batcher.submit(record) for record in range(1, 6)]
+        release.set()
+        assert first.result(timeout=5) == 0
+        assert [future.result(timeout=5) for future in futures] == [2, 4, 6, 8, 10]
+
+    assert bodies == [b"0", b"1\n2\n3\n4\n5"]
+
+
+def test_micro_batcher_fails_every_record_of_a_failed_batch():
+    def invoke(body):
+        return b'"only one result"'
+
+    with MicroBatcher(invoke, max_batch_size=2, max_wait=1) as batcher:
+        futures = [batcher.submit(record) for record in range(2)]
+        for future in futures:
+            with pytest.raises(ValueError, match="1 results for 2 records"):
+                future.result(timeout=5)
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(3)
+
+
+def test_payload_codecs_round_trip():
+    csv_codec = CsvCodec()
+    assert csv_codec.encode([[1, "a"], [2, "b"]]) == b"1,a\n2,b\n"
+    assert csv_codec.decode(b"0.5\n0.25\n", 2) == [["0.5"], ["0.25"]]
+
+    npy_codec = NpyCodec()
+    records = [np.arange(3), np.arange(3, 6)]
+    results = npy_codec.decode(npy_codec.encode(records), 2)
+    assert [result.tolist() for result in results] == [[0, 1, 2], [3, 4, 5]]
+
+    assert json.loads(JsonLinesCodec().encode([{"a": 1}]).decode()) == {"a": 1}
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.code_injection.response_stream import (
+    JsonLinesFraming,
+    RawFraming,
+    ResponseStreamError,
+    ResponseStreamReader,
+    SseFraming,
+)
+
+
+def _events(*payloads):
+    return [{"PayloadPart": {"Bytes": payload}} for payload in payloads]
+
+
+def test_json_lines_records_are_yielded_once_complete():
+    decoded = []
+    reader = ResponseStreamReader(
+        iter(_events(b'{"token": "He', b'llo"}\n{"tok', b'en": " world"}\n', b"{}"))
+    )
+
+    for record in reader:
+        decoded.append((record, reader.metrics.records))
+
+    assert decoded == [
+        ({"token": "Hello"}, 1),
+        ({"token": " world"}, 2),
+        ({}, 3),
+    ]
+    assert reader.metrics.bytes == 41
+    assert reader.metrics.time_to_first_byte >= 0
+    assert len(reader.metrics.inter_token_latencies) == 2
+
+
+def test_json_lines_framing_does_not_rescan_partial_lines():
+    framing = JsonLinesFraming()
+    buffer = bytearray(b'{"a": ')
+
+    assert framing.decode(buffer) == []
+    assert framing._scanned == len(buffer)
+    buffer += b'1}\n{"b"'
+    assert framing.decode(buffer) == [{"a": 1}]
+    assert buffer == bytearray(b'{"b"')
+
+
+def test_sse_framing_splits_events_across_payloads():
+    reader = ResponseStreamReader(
+        _events(
+            b'data: {"token": "a"}\r\n',
+            b'\r\n: keep-alive\n\ndata: {"tok',
+            b'en": "b"}\n\ndata: [DONE]\n\n',
+        ),
+        framing="sse",
+    )
+
+    assert list(reader) == [{"token": "a"}, {"token": "b"}]
+
+
+def test_raw_framing_decodes_split_characters():
+    snowman = "☃".encode("utf-8")
+    reader = ResponseStreamReader(
+        _events(b"a" + snowman[:1], snowman[1:] + b"b"), framing=RawFraming()
+    )
+
+    assert "".join(reader) == "a☃b"
+
+
+def test_error_event_raises():
+    reader = ResponseStreamReader(
+        _events(b"{}\n")
+        + [{"ModelStreamError": {"Message": "boom", "ErrorCode": "ModelError"}}]
+    )
+
+    with pytest.raises(ResponseStreamError, match="boom") as error:
+        list(reader)
+    assert error.value.error_code == "ModelError"
+
+
+def test_async_iteration_of_blocking_and_async_event_streams():
+    async def async_events():
+        for event in _events(b'{"a": 1}\n', b'{"a": 2}\n'):
+            yield event
+
+    async def collect(event_stream):
+        return [
+            record async for record in ResponseStreamReader(event_stream, SseFraming())
+        ]
+
+    sse_events = _events(b"data: 1\n\n", b"data:2\n\n")
+    assert asyncio.run(collect(iter(sse_events))) == [1, 2]
+
+    async def collect_json_lines():
+        return [record async for record in ResponseStreamReader(async_events())]
+
+    assert asyncio.run(collect_json_lines()) == [{"a": 1}, {"a": 2}]
@@ -0,0 +1,270 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.code_injection import waiter as waiter_module
+from src.code_injection.waiter import (
+    FailedStatusError,
+    PollingFailedError,
+    RateLimiter,
+    TimeoutExceededError,
+    Waiter,
+    backoff_delays,
+    get_status,
+    wait_all,
+    wait_any,
+)
+from src.generated.resources import TrainingJob
+from src.generated.shapes import AlgorithmSpecification
+
+
+def _responses(*statuses):
+    return [{"TrainingJobStatus": status} for status in statuses]
+
+
+def _waiter(**kwargs):
+    return Waiter(
+        resource_type="TrainingJob",
+        status_path=("TrainingJobStatus",),
+        success_states=["Completed"],
+        **kwargs,
+    )
+
+
+def test_get_status_follows_status_path():
+    response = {"Workforce": {"Status": "Active"}}
+    assert get_status(response, ("Workforce", "Status")) == "Active"
+    assert get_status({}, ("Workforce", "Status")) is None
+
+
+def test_backoff_delays_grow_exponentially_up_to_max_delay():
+    delays = backoff_delays(poll=1, max_delay=8)
+    bounds = [1, 2, 4, 8, 8]
+    for bound in bounds:
+        assert bound / 2 <= next(delays) <= bound
+
+
+def test_wait_returns_final_response(monkeypatch):
+    sleep = MagicMock()
+    monkeypatch.setattr(waiter_module.time, "sleep", sleep)
+    describe = MagicMock(
+        side_effect=_responses("InProgress", "InProgress", "Completed")
+    )
+
+    response = _waiter(poll=1, max_delay=2).wait(describe)
+
+    assert response == {"TrainingJobStatus": "Completed"}
+    assert describe.call_count == 3
+    assert sleep.call_count == 2
+    assert all(call.args[0] <= 2 for call in sleep.call_args_list)
+
+
+def test_wait_raises_on_failure_status(monkeypatch):
+    monkeypatch.setattr(waiter_module.time, "sleep", MagicMock())
+    describe = MagicMock(side_effect=_responses("InProgress", "Failed"))
+
+    with pytest.raises(FailedStatusError) as error:
+        _waiter(failure_states=["Failed"]).wait(describe)
+    assert error.value.status == "Failed"
+
+
+def test_wait_raises_on_timeout():
+    describe = MagicMock(return_value={"TrainingJobStatus": "InProgress"})
+
+    with pytest.raises(TimeoutExceededError) as error:
+        _waiter(poll=0.01, timeout=0.05).wait(describe)
+    assert error.value.resource_type == "TrainingJob"
+    assert error.value.status == "InProgress"
+
+
+def test_async_wait_returns_final_response():
+    responses = iter(_responses("InProgress", "Completed"))
+
+    async def describe():
+        return next(responses)
+
+    response = asyncio.run(_waiter(poll=0.01).async_wait(describe))
+
+    assert response == {"TrainingJobStatus": "Completed"}
+
+
+def _training_jobs(*names):
+    return [TrainingJob(training_job_name=name) for name in names]
+
+
+def _mock_client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(
+        waiter_module,
+        "SageMakerClient",
+        MagicMock(return_value=MagicMock(client=client)),
+    )
+    monkeypatch.setattr(waiter_module.time, "sleep", MagicMock())
+    return client
+
+
+def test_wait_all_yields_resources_as_they_terminate(monkeypatch):
+    client = _mock_client(monkeypatch)
+    statuses = {"a": iter(["InProgress", "Completed"]), "b": iter(["Failed"])}
+    client.describe_training_job.side_effect = lambda TrainingJobName: {
+        "TrainingJobName": TrainingJobName,
+        "TrainingJobStatus": next(statuses[TrainingJobName]),
+    }
+
+    training_jobs = list(wait_all(_training_jobs("a", "b"), poll=0))
+
+    assert [job.training_job_name for job in training_jobs] == ["b", "a"]
+    assert [job.training_job_status for job in training_jobs] == ["Failed", "Completed"]
+    assert client.describe_training_job.call_count == 3
+
+
+def test_wait_all_deserializes_nested_members_of_describe_responses(monkeypatch):
+    client = _mock_client(monkeypatch)
+    client.describe_training_job.return_value = {
+        "TrainingJobName": "a",
+        "TrainingJobStatus": "Completed",
+        "AlgorithmSpecification": {
+            "TrainingImage": "image",
+            "TrainingInputMode": "File",
+        },
+    }
+
+    (training_job,) = wait_all(_training_jobs("a"), poll=0)
+
+    assert isinstance(training_job.algorithm_specification, AlgorithmSpecification)
+    assert training_job.algorithm_specification.training_image == "image"
+
+
+def test_wait_all_prefers_list_calls_filtered_by_status(monkeypatch):
+    client = _mock_client(monkeypatch)
+
+    def list_training_jobs(StatusEquals, NameContains):
+        assert NameContains == "sweep-"
+        if StatusEquals != "Completed":
+            return {"TrainingJobSummaries": []}
+        return {
+            "TrainingJobSummaries": [
+                {"TrainingJobName": "sweep-1", "TrainingJobStatus": "Completed"},
+                {"TrainingJobName": "other", "TrainingJobStatus": "Completed"},
+            ]
+        }
+
+    client.list_training_jobs.side_effect = list_training_jobs
+
+    training_job = wait_any(_training_jobs("sweep-1", "sweep-2"), list_threshold=2)
+
+    assert training_job.training_job_name == "sweep-1"
+    assert training_job.training_job_status == "Completed"
+    client.describe_training_job.assert_not_called()
+
+
+def test_wait_all_does_not_describe_resources_to_read_their_creation_time(
+    monkeypatch,
+):
+    client = _mock_client(monkeypatch)
+    client.list_training_jobs.return_value = {
+        "TrainingJobSummaries": [
+            {"TrainingJobName": "sweep-1", "TrainingJobStatus": "Completed"},
+            {"TrainingJobName": "sweep-2", "TrainingJobStatus": "Completed"},
+        ]
+    }
+    training_jobs = [
+        TrainingJob._from_create({"training_job_name": name}, {})
+        for name in ["sweep-1", "sweep-2"]
+    ]
+    monkeypatch.setattr(TrainingJob, "refresh", MagicMock())
+
+    assert list(wait_all(training_jobs, list_threshold=2)) == training_jobs
+    TrainingJob.refresh.assert_not_called()
+    client.describe_training_job.assert_not_called()
+    assert "CreationTimeAfter" not in client.list_training_jobs.call_args.kwargs
+
+
+def test_wait_all_describes_resources_when_list_calls_cannot_be_narrowed(
+    monkeypatch,
+):
+    client = _mock_client(monkeypatch)
+    client.describe_training_job.side_effect = lambda TrainingJobName: {
+        "TrainingJobName": TrainingJobName,
+        "TrainingJobStatus": "Completed",
+    }
+
+    training_jobs = list(wait_all(_training_jobs("a", "b"), list_threshold=2))
+
+    assert [job.training_job_name for job in training_jobs] == ["a", "b"]
+    assert client.describe_training_job.call_count == 2
+    client.list_training_jobs.assert_not_called()
+
+
+def _client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "Describe")
+
+
+def test_wait_all_describes_throttled_resources_again_next_round(monkeypatch):
+    client = _mock_client(monkeypatch)
+    responses = iter(
+        [
+            _client_error("ThrottlingException"),
+            {"TrainingJobName": "a", "TrainingJobStatus": "Completed"},
+        ]
+    )
+
+    def describe_training_job(TrainingJobName):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client.describe_training_job.side_effect = describe_training_job
+
+    (training_job,) = wait_all(_training_jobs("a"), poll=0)
+
+    assert training_job.training_job_status == "Completed"
+    assert client.describe_training_job.call_count == 2
+
+
+def test_wait_all_keeps_waiting_when_a_resource_cannot_be_described(monkeypatch):
+    client = _mock_client(monkeypatch)
+    error = _client_error("ValidationException")
+    statuses = {"b": iter(["InProgress", "Completed"])}
+
+    def describe_training_job(TrainingJobName):
+        if TrainingJobName == "a":
+            raise error
+        return {
+            "TrainingJobName": TrainingJobName,
+            "TrainingJobStatus": next(statuses[TrainingJobName]),
+        }
+
+    client.describe_training_job.side_effect = describe_training_job
+    training_jobs = _training_jobs("a", "b")
+    waited = []
+
+    with pytest.raises(PollingFailedError) as exc_info:
+        for training_job in wait_all(training_jobs, poll=0):
+            waited.append(training_job)
+
+    assert waited == [training_jobs[1]]
+    assert exc_info.value.failures == [(training_jobs[0], error)]
+    assert client.describe_training_job.call_count == 3
+
+
+def test_wait_all_raises_on_timeout(monkeypatch):
+    client = _mock_client(monkeypatch)
+    client.describe_training_job.return_value = {"TrainingJobStatus": "InProgress"}
+
+    with pytest.raises(TimeoutExceededError):
+        list(wait_all(_training_jobs("a"), timeout=0))
+
+
+def test_rate_limiter_bounds_request_rate(monkeypatch):
+    sleep = MagicMock()
+    monkeypatch.setattr(waiter_module.time, "sleep", sleep)
+    rate_limiter = RateLimiter(max_requests_per_second=2)
+
+    for _ in range(4):
+        rate_limiter.acquire()
+
+    assert sleep.call_count == 2
@@ -29,6 +29,7 @@ def create(
     tags: Optional[List[Tag]] = Unassigned(),
     session: Optional[Session] = None,
     region: Optional[str] = None,
+    skip_describe: bool = False,
 ) -> Optional[object]:
     logger.debug("Creating compilation_job resource.")
     client = SageMakerClient(session=session, region_name=region, service_name='sagemaker').client
@@ -46,12 +47,17 @@ def create(
         
     logger.debug(f"Input request: {operation_input_args}")
     # serialize the input request
-    operation_input_args = cls._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, 'CreateCompilationJobRequest')
     logger.debug(f"Serialized input request: {operation_input_args}")
 
     # create the resource
     response = client.create_compilation_job(**operation_input_args)
     logger.debug(f"Response: {response}")
+    invalidate_describe_cache('CompilationJob', operation_input_args, session=session, region=region)
+
+    if skip_describe:
+        # the other attributes are described on first access
+        return cls._from_create(transform(operation_input_args, 'CreateCompilationJobRequest'), transform(response, 'CreateCompilationJobResponse'), session=session, region=region)
 
     return cls.get(compilation_job_name=compilation_job_name, session=session, region=region)
 """
@@ -100,12 +106,13 @@ def load(
 
     logger.debug(f"Input request: {operation_input_args}")
     # serialize the input request
-    operation_input_args = cls._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, 'ImportHubContentRequest')
     logger.debug(f"Serialized input request: {operation_input_args}")
 
     # import the resource
     response = client.import_hub_content(**operation_input_args)
     logger.debug(f"Response: {response}")
+    invalidate_describe_cache('HubContent', operation_input_args, session=session, region=region)
 
     return cls.get(hub_name=hub_name, hub_content_type=hub_content_type, hub_content_name=hub_content_name, session=session, region=region)
 """
@@ -118,7 +125,7 @@ def load(
         expected_output = """
 def update(self) -> Optional[object]:
     logger.debug("Creating endpoint resource.")
-    client = SageMakerClient().client
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='sagemaker').client
 
     operation_input_args = {
         'EndpointName': self.endpoint_name,
@@ -130,12 +137,13 @@ def update(self) -> Optional[object]:
     }
     logger.debug(f"Input request: {operation_input_args}")
     # serialize the input request
-    operation_input_args = Endpoint._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, 'UpdateEndpointInput')
     logger.debug(f"Serialized input request: {operation_input_args}")
 
     # create the resource
     response = client.update_endpoint(**operation_input_args)
     logger.debug(f"Response: {response}")
+    invalidate_describe_cache('Endpoint', operation_input_args, session=self._session, region=self._region)
     self.refresh()
 
     return self
@@ -157,6 +165,9 @@ def get(
     space_name: Optional[str] = Unassigned(),
     session: Optional[Session] = None,
     region: Optional[str] = None,
+    lazy: bool = False,
+    fields: Optional[List[str]] = None,
+    view: bool = False,
 ) -> Optional[object]:
     operation_input_args = {
         'DomainId': domain_id,
@@ -166,20 +177,74 @@ def get(
         'AppName': app_name,
     }
     client = SageMakerClient(session=session, region_name=region, service_name='sagemaker').client
-    response = client.describe_app(**operation_input_args)
+    response = cached_describe('App', operation_input_args, lambda: client.describe_app(**operation_input_args), session=session, region=region)
 
-    pprint(response)
+    if view:
+        # a read-only view of the response, see ShapeView.to_model
+        return transform_view(response, 'DescribeAppResponse')
 
     # deserialize the response
-    transformed_response = transform(response, 'DescribeAppResponse')
-    app = cls(**transformed_response)
+    app = cls._from_describe(response, 'DescribeAppResponse', session=session, region=region, lazy=lazy, fields=fields)
     return app
 """
         assert self.resource_generator.generate_get_method("App") == expected_output
 
+    def test_generate_list_method(self):
+        expected_output = """
+@classmethod
+def list(
+    cls,
+    image_name: str,
+    creation_time_after: Optional[datetime.datetime] = Unassigned(),
+    creation_time_before: Optional[datetime.datetime] = Unassigned(),
+    last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+    last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+    sort_by: Optional[str] = Unassigned(),
+    sort_order: Optional[str] = Unassigned(),
+    max_results: Optional[int] = None,
+    page_size: Optional[int] = None,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> ResourceIterator["ImageVersion"]:
+    client = SageMakerClient(session=session, region_name=region, service_name='sagemaker').client
+
+    operation_input_args = {
+        'CreationTimeAfter': creation_time_after,
+        'CreationTimeBefore': creation_time_before,
+        'ImageName': image_name,
+        'LastModifiedTimeAfter': last_modified_time_after,
+        'LastModifiedTimeBefore': last_modified_time_before,
+        'SortBy': sort_by,
+        'SortOrder': sort_order,
+    }
+    # serialize the input request
+    operation_input_args = serialize_request(operation_input_args, 'ListImageVersionsRequest')
+
+    return ResourceIterator(
+        client=client,
+        list_method='list_image_versions',
+        list_method_kwargs=operation_input_args,
+        summaries_key='ImageVersions',
+        summary_name='ImageVersion',
+        resource_cls=cls,
+        resource_kwargs={'image_name': image_name},
+        max_results=max_results,
+        page_size=page_size,
+        session=session,
+        region=region,
+    )
+"""
+        assert (
+            self.resource_generator.generate_list_method("ImageVersion")
+            == expected_output
+        )
+
+    def test_generate_list_method_skips_wrapped_describe_output(self):
+        assert self.resource_generator.generate_list_method("Workforce") == ""
+
     def test_generate_refresh_method(self):
         expected_output = """
-def refresh(self) -> Optional[object]:
+def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
 
     operation_input_args = {
         'DomainId': self.domain_id,
@@ -188,15 +253,37 @@ def refresh(self) -> Optional[object]:
         'AppType': self.app_type,
         'AppName': self.app_name,
     }
-    client = SageMakerClient().client
-    response = client.describe_app(**operation_input_args)
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='sagemaker').client
+    response = cached_describe('App', operation_input_args, lambda: client.describe_app(**operation_input_args), session=self._session, region=self._region)
 
     # deserialize response and update self
-    transform(response, 'DescribeAppResponse', self)
+    self._update_from_describe(response, 'DescribeAppResponse', fields=fields)
     return self
 """
         assert self.resource_generator.generate_refresh_method("App") == expected_output
 
+    def test_generate_async_refresh_method(self):
+        expected_output = """
+async def refresh(self, fields: Optional[List[str]] = None) -> Optional[object]:
+
+    operation_input_args = {
+        'DomainId': self.domain_id,
+        'UserProfileName': self.user_profile_name,
+        'SpaceName': self.space_name,
+        'AppType': self.app_type,
+        'AppName': self.app_name,
+    }
+    response = await async_cached_describe('App', operation_input_args, lambda: get_async_transport().call('sagemaker', 'describe_app', operation_input_args, session=self._session, region=self._region), session=self._session, region=self._region)
+
+    # deserialize response and update self
+    self._update_from_describe(response, 'DescribeAppResponse', fields=fields)
+    return self
+"""
+        assert (
+            self.resource_generator.generate_refresh_method("App", is_async=True)
+            == expected_output
+        )
+
     def test_generate_delete_method(self):
         expected_output = """
 def delete(self) -> None:
@@ -204,7 +291,9 @@ def delete(self) -> None:
     operation_input_args = {
         'CompilationJobName': self.compilation_job_name,
     }
-    self.client.delete_compilation_job(**operation_input_args)
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='sagemaker').client
+    client.delete_compilation_job(**operation_input_args)
+    invalidate_describe_cache('CompilationJob', operation_input_args, session=self._session, region=self._region)
 """
         assert (
             self.resource_generator.generate_delete_method("CompilationJob")
@@ -219,7 +308,9 @@ def stop(self) -> None:
     operation_input_args = {
         'CompilationJobName': self.compilation_job_name,
     }
-    self.client.stop_compilation_job(**operation_input_args)
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='sagemaker').client
+    client.stop_compilation_job(**operation_input_args)
+    invalidate_describe_cache('CompilationJob', operation_input_args, session=self._session, region=self._region)
 """
         assert (
             self.resource_generator.generate_stop_method("CompilationJob")
@@ -235,26 +326,49 @@ def wait(
     timeout: Optional[int] = None
 ) -> Optional[object]:
     terminal_states = ['Completed', 'Failed', 'Stopped']
-    start_time = time.time()
-
-    while True:
-        self.refresh()
-        current_status = self.training_job_status
-
-        if current_status in terminal_states:
-            return
-
-        # TODO: Raise some generated TimeOutError
-        if timeout is not None and time.time() - start_time >= timeout:
-            raise Exception("Timeout exceeded. Final resource state - " + current_status)
-        print("-", end="")
-        time.sleep(poll)
+    operation_input_args = {
+        'TrainingJobName': self.training_job_name,
+    }
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='sagemaker').client
+    waiter = Waiter(
+        resource_type='TrainingJob',
+        status_path=('TrainingJobStatus',),
+        success_states=terminal_states,
+        poll=poll,
+        max_delay=120,
+        timeout=timeout,
+    )
+    response = waiter.wait(lambda: client.describe_training_job(**operation_input_args))
+
+    # deserialize the final response and update self
+    self._update_from_describe(response, 'DescribeTrainingJobResponse')
+    return self
 """
         assert (
             self.resource_generator.generate_wait_method("TrainingJob")
             == expected_output
         )
 
+    def test_generate_waiter_config(self):
+        expected_output = """
+_waiter_config: ClassVar[WaiterConfig] = WaiterConfig(
+    resource_type='TrainingJob',
+    status_path=('TrainingJobStatus',),
+    terminal_states=('Completed', 'Failed', 'Stopped'),
+    describe_method='describe_training_job',
+    identifiers=(('TrainingJobName', 'training_job_name'),),
+    describe_output_shape='DescribeTrainingJobResponse',
+    list_method='list_training_jobs',
+    summaries_key='TrainingJobSummaries',
+    summary_name='TrainingJobSummary',
+    list_filters=('NameContains', 'CreationTimeAfter'),
+)
+"""
+        assert (
+            self.resource_generator.generate_waiter_config("TrainingJob")
+            == expected_output
+        )
+
     def test_generate_wait_for_status_method(self):
         expected_output = """
 @validate_call
@@ -264,20 +378,24 @@ def wait_for_status(
     poll: int = 5,
     timeout: Optional[int] = None
 ) -> Optional[object]:
-    start_time = time.time()
-
-    while True:
-        self.refresh()
-        current_status = self.inference_component_status
-
-        if status == current_status:
-            return
-
-        # TODO: Raise some generated TimeOutError
-        if timeout is not None and time.time() - start_time >= timeout:
-            raise Exception("Timeout exceeded. Final resource state - " + current_status)
-        print("-", end="")
-        time.sleep(poll)
+    operation_input_args = {
+        'InferenceComponentName': self.inference_component_name,
+    }
+    client = SageMakerClient(session=self._session, region_name=self._region, service_name='sagemaker').client
+    waiter = Waiter(
+        resource_type='InferenceComponent',
+        status_path=('InferenceComponentStatus',),
+        success_states=[status],
+        failure_states=['Failed'],
+        poll=poll,
+        max_delay=60,
+        timeout=timeout,
+    )
+    response = waiter.wait(lambda: client.describe_inference_component(**operation_input_args))
+
+    # deserialize the final response and update self
+    self._update_from_describe(response, 'DescribeInferenceComponentOutput')
+    return self
 """
         assert (
             self.resource_generator.generate_wait_for_status_method(
@@ -301,7 +419,7 @@ def invoke(self,
     inference_component_name: Optional[str] = Unassigned(),
 ) -> Optional[object]:
     logger.debug(f"Invoking endpoint resource.")
-    client = SageMakerClient(service_name="sagemaker-runtime").client
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='sagemaker-runtime').client
 
     operation_input_args = {
         'EndpointName': self.endpoint_name,
@@ -318,7 +436,7 @@ def invoke(self,
     }
     logger.debug(f"Input request: {operation_input_args}")
     # serialize the input request
-    operation_input_args = Endpoint._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, 'InvokeEndpointInput')
     logger.debug(f"Serialized input request: {operation_input_args}")
 
     # create the resource
@@ -346,7 +464,7 @@ def invoke_async(self,
     invocation_timeout_seconds: Optional[int] = Unassigned(),
 ) -> Optional[object]:
     logger.debug(f"Invoking endpoint resource Async.")
-    client = SageMakerClient(service_name="sagemaker-runtime").client
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='sagemaker-runtime').client
 
     operation_input_args = {
         'EndpointName': self.endpoint_name,
@@ -360,7 +478,7 @@ def invoke_async(self,
     }
     logger.debug(f"Input request: {operation_input_args}")
     # serialize the input request
-    operation_input_args = Endpoint._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, 'InvokeEndpointAsyncInput')
     logger.debug(f"Serialized input request: {operation_input_args}")
 
     # create the resource
@@ -389,7 +507,7 @@ def invoke_with_response_stream(self,
     inference_component_name: Optional[str] = Unassigned(),
 ) -> Optional[object]:
     logger.debug(f"Invoking endpoint resource with Response Stream.")
-    client = SageMakerClient(service_name="sagemaker-runtime").client
+    client = SageMakerRuntimeClient(session=self._session, region_name=self._region, service_name='sagemaker-runtime').client
 
     operation_input_args = {
         'EndpointName': self.endpoint_name,
@@ -404,7 +522,7 @@ def invoke_with_response_stream(self,
     }
     logger.debug(f"Input request: {operation_input_args}")
     # serialize the input request
-    operation_input_args = Endpoint._serialize(operation_input_args)
+    operation_input_args = serialize_request(operation_input_args, 'InvokeEndpointWithResponseStreamInput')
     logger.debug(f"Serialized input request: {operation_input_args}")
 
     # create the resource